@@ -1,19 +1,32 @@
-from time import sleep
+import os
+from enum import Enum, auto
 
 from loguru import logger as log
-from PySide6.QtCore import QSize, QTimer
-from PySide6.QtGui import Qt, QIcon, QPixmap
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QFileSystemWatcher,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import Qt, QColor, QIcon
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
     QHBoxLayout,
     QLabel,
+    QListView,
     QMainWindow,
+    QStackedWidget,
     QVBoxLayout,
     QWidget,
-    QScrollArea,
-    QFrame,
+    QStyledItemDelegate,
 )
+from history import HistoryStore
 from wuthering import (
     AUTHOR,
     POOLTYPE,
@@ -23,24 +36,134 @@ from wuthering import (
     PoolData,
     WutheringData,
 )
-import rc_irons
 
 
 def spin(index):
     return "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"[index]
 
 
+class WorkerSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class Worker(QRunnable):
+    """Runs a blocking backend call on the thread pool.
+
+    The outcome comes back through signals, which Qt queues onto the UI
+    thread, so slots can touch widgets directly.
+    """
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            log.exception("Worker {func} failed", func=self.func)
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+class HistoryModel(QAbstractListModel):
+    """Every pull of one quality in a pool, newest first.
+
+    Rows are read straight from the PoolData columns as they are asked
+    for, so nothing is kept per pull. The pull count is taken when the
+    model is built, the view is rebuilt once the pool changes anyway.
+    """
+
+    def __init__(
+        self, data: PoolData, quality: int, highlight: bool, parent=None
+    ):
+        super().__init__(parent)
+        self.columns = data.columns
+        self.rows = self.columns.rows(quality)
+        self.count = len(self.rows)
+        self.highlight = highlight  # losing a 50/50 shows in orangered
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.count
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[self.count - 1 - index.row()]
+        name = self.columns.names[self.columns.name[row]]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{name:　<5}{self.columns.pity[row]:>2}抽"
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if self.highlight and name in STANDARD_POOL:
+                return MISSED
+            return FEATURED
+        return None
+
+
+class HistoryDelegate(QStyledItemDelegate):
+    # plain coloured text, cheaper than the full item style per row
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setPen(index.data(Qt.ItemDataRole.ForegroundRole))
+        painter.drawText(
+            option.rect.adjusted(HISTORY_MARGIN, 0, -HISTORY_MARGIN, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            index.data(),
+        )
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(
+            option.rect.width(),
+            option.fontMetrics.height() + 2 * HISTORY_MARGIN,
+        )
+
+
+class Stage(Enum):
+    DETECT = auto()
+    PAYLOAD = auto()
+    FETCH = auto()
+    DONE = auto()
+
+
+STAGE_TEXT = {
+    Stage.DETECT: "正在等待鳴潮啟動",
+    Stage.PAYLOAD: "缺少資料，請開啟遊戲內抽卡紀錄",
+    Stage.FETCH: "正在整理數據",
+}
+SPIN_INTERVAL = 100  # ms per spinner frame
+DETECT_RETRY = 1000  # ms between process scans, there is no spawn event
+PAYLOAD_RETRY = 5000  # ms, backs up the watcher should it miss a write
+FEATURED = QColor("cornflowerblue")
+MISSED = QColor("orangered")
+HISTORY_MARGIN = 4  # px around each history row
+ICON = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "icons", "icon_64.png"
+)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         log.debug("Created QMainWindow")
         self.setWindowTitle("鳴潮卡池紀錄")
         self.setFixedSize(QSize(300, 100))
-        pixmap = QPixmap(":icons/icon.png")
-        self.setWindowIcon(QIcon(pixmap))
 
-        self.backend = WutheringData()
-        self.tick_count = 0
+        self.backend = WutheringData(store=HistoryStore())
+        self.threadpool = QThreadPool.globalInstance()
+        self.busy = False  # one backend call in flight at a time
+        self.dirty = False  # an event arrived while busy, run again
+        self.restore = True  # first discovery may reuse a saved path
+        self.stage = Stage.DETECT
+        self.frame = 0
+        # built once, then each pool's view is cached in the stack
+        self.dropdown: QComboBox | None = None
+        self.stack: QStackedWidget | None = None
+        self.views: dict[str, tuple[PoolData, int, QWidget]] = {}
 
         layout = QVBoxLayout()
         widget = QWidget()
@@ -56,71 +179,161 @@ class MainWindow(QMainWindow):
             f"{TITLE} v{VERSION} | 這我: {AUTHOR}"
         )
         self.show()
+        # the icon is not needed for the first frame, load it once idle
+        QTimer.singleShot(0, self.load_icon)
 
-        log.debug("Starting QTimer")
-        self.tick = QTimer()
-        self.tick.setInterval(42)
-        self.tick.timeout.connect(self.detect_game)
-        self.tick.start()
-
-    def detect_game(self):
-        if self.tick_count % 29 == 0 and self.backend.locate_executable():
-            log.debug("Game detected")
-            self.center_text.setText(f"鳴潮，啟動！")
-            sleep(1)  # for memes
-            self.tick.timeout.disconnect(self.detect_game)
-            self.tick.timeout.connect(self.fetch_payload)
-        else:
-            self.center_text.setText(
-                f"{spin(self.tick_count%10)} 正在等待鳴潮啟動"
-            )
-        self.tick_count += 1
+        # the spinner only animates, stages advance on events
+        self.spinner = QTimer(self)
+        self.spinner.setInterval(SPIN_INTERVAL)
+        self.spinner.timeout.connect(self.animate)
+        self.retry = QTimer(self)
+        self.retry.setSingleShot(True)
+        self.retry.timeout.connect(self.run_stage)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.log_changed)
+        self.enter(Stage.DETECT)
 
-    def fetch_payload(self):
-        if self.tick_count % 29 == 0 and self.backend.fetch_payload():
-            log.debug("Created Payload for API request")
-            self.tick.timeout.disconnect(self.fetch_payload)
-            self.tick.timeout.connect(self.populate_data)
-        else:
-            self.center_text.setText(
-                f"{spin(self.tick_count%10)} 缺少資料，請開啟遊戲內抽卡紀錄"
-            )
-        self.tick_count += 1
+    def load_icon(self):
+        log.debug("Loading window icon {path}", path=ICON)
+        self.setWindowIcon(QIcon(ICON))
 
-    def populate_data(self):
-        log.debug("Populating data from pool")
-        if self.tick_count % 18 == 0:
+    def animate(self):
+        self.center_text.setText(
+            f"{spin(self.frame % 10)} {STAGE_TEXT[self.stage]}"
+        )
+        self.frame += 1
+
+    def enter(self, stage: Stage):
+        log.debug("Entering stage {stage}", stage=stage.name)
+        self.stage = stage
+        self.retry.stop()
+        if stage == Stage.DONE:
+            self.spinner.stop()
+            if files := self.watcher.files():
+                self.watcher.removePaths(files)
             self.center_text.setText("完成")
-            self.repaint()
-            self.backend.populate_data()
-            self.tick.timeout.disconnect(self.populate_data)
-            self.tick.stop()
             self.dropdown_update()
-        else:
-            self.center_text.setText(
-                f"{spin(self.tick_count%10)} 正在整理數據"
+            return
+        if stage == Stage.PAYLOAD:
+            self.watcher.addPath(self.backend.logfile)
+        if not self.spinner.isActive():
+            self.spinner.start()
+        self.animate()
+        self.run_stage()
+
+    def run_stage(self):
+        if self.busy:
+            self.dirty = True
+            return
+        self.dirty = False
+        if self.stage == Stage.DETECT:
+            self.run_in_background(
+                self.locate_game, self.game_detected, self.restore
             )
-        self.tick_count += 1
+            self.restore = False
+        elif self.stage == Stage.PAYLOAD:
+            self.run_in_background(
+                self.backend.poll_payload, self.payload_fetched
+            )
+        elif self.stage == Stage.FETCH:
+            self.run_in_background(
+                self.backend.populate_data, self.data_populated, True
+            )
+
+    def run_in_background(self, func, on_finished, *args):
+        self.busy = True
+        worker = Worker(func, *args)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(self.worker_failed)
+        self.threadpool.start(worker)
+
+    def settle(self, delay: int):
+        # a backend call returned without advancing the stage
+        self.busy = False
+        if self.dirty:
+            self.run_stage()
+        else:
+            self.retry.start(delay)
+
+    def worker_failed(self, error: Exception):
+        log.warning("Background task failed: {error!r}", error=error)
+        self.settle(DETECT_RETRY)
+
+    def locate_game(self, restore: bool) -> bool:
+        # a log path saved by an earlier run skips waiting for the game
+        if restore and self.backend.restore_logfile():
+            return True
+        return self.backend.locate_executable()
+
+    def log_changed(self, path: str):
+        # editors and loggers may replace the file, watch the new one
+        if path not in self.watcher.files() and os.path.exists(path):
+            self.watcher.addPath(path)
+        if self.stage == Stage.PAYLOAD:
+            self.run_stage()
+
+    def game_detected(self, found: bool):
+        if not found:
+            return self.settle(DETECT_RETRY)
+        log.debug("Game detected")
+        self.busy = False
+        self.enter(Stage.PAYLOAD)
+
+    def payload_fetched(self, found: bool):
+        if not found:
+            if self.backend.logfile not in self.watcher.files():
+                self.watcher.addPath(self.backend.logfile)
+            return self.settle(PAYLOAD_RETRY)
+        log.debug("Created Payload for API request")
+        self.busy = False
+        self.enter(Stage.FETCH)
+
+    def data_populated(self, _):
+        self.busy = False
+        self.enter(Stage.DONE)
 
     def dropdown_update(self, selection: str = POOLTYPE[1]):
         log.debug("Refreshed center Dropdown Widget")
-        self.setFixedSize(QSize(300, 420))
+        if self.stack is None:
+            self.setFixedSize(QSize(300, 420))
+            widget = QWidget()
+            layout = QVBoxLayout()
+            self.dropdown = QComboBox()
+            self.dropdown.currentTextChanged.connect(self.show_pool)
+            self.stack = QStackedWidget()
+            layout.addWidget(self.dropdown)
+            layout.addWidget(self.stack)
+            widget.setLayout(layout)
+            self.setCentralWidget(widget)
 
-        widget = QWidget()
-        layout = QVBoxLayout()
-        dropdown = QComboBox()
-
-        dropdown.addItems(
+        self.dropdown.blockSignals(True)
+        self.dropdown.clear()
+        self.dropdown.addItems(
             [k for k, v in self.backend.data.items() if v and v.attempt]
         )
-        dropdown.setCurrentText(selection)
-        dropdown.currentTextChanged.connect(self.dropdown_update)
+        self.dropdown.setCurrentText(selection)
+        self.dropdown.blockSignals(False)
+        self.show_pool(self.dropdown.currentText())
 
-        layout.addWidget(dropdown)
-        content_layout = self.result_content(selection)
-        layout.addLayout(content_layout)
-        widget.setLayout(layout)
-        self.setCentralWidget(widget)
+    def show_pool(self, pool: str):
+        if not (data := self.backend.data.get(pool)):
+            return
+        cached = self.views.get(pool)
+        # a view is only stale once its pool's PoolData has changed
+        if (
+            cached is None
+            or cached[0] is not data
+            or cached[1] != data.revision
+        ):
+            log.debug("Building view for {pool}", pool=pool)
+            view = QWidget()
+            view.setLayout(self.result_content(pool))
+            if cached is not None:
+                self.stack.removeWidget(cached[2])
+                cached[2].deleteLater()
+            self.stack.addWidget(view)
+            self.views[pool] = (data, data.revision, view)
+        self.stack.setCurrentWidget(self.views[pool][2])
 
     def result_content(self, pool: str) -> None:
         log.debug("Content created")
@@ -129,24 +342,23 @@ class MainWindow(QMainWindow):
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         five_ratio = f"{data.get_ratio(5)*100:.2f}%"
         five_avg = f"{data.get_average(5)}抽"
-        five_pool = data.entry.get(5, [])
+        columns = data.columns
+        five_pool = columns.rows(5)
         four_ratio = f"{data.get_ratio(4)*100:.2f}%"
         four_avg = f"{data.get_average(4)}抽"
-        four_pool = data.entry.get(4, [])
-        four_char = [
-            _ for _ in data.entry.get(4, []) if _.resourcetype == "角色"
-        ]
-        four_weap = [
-            _ for _ in data.entry.get(4, []) if _.resourcetype == "武器"
+        four_pool = columns.rows(4)
+        four_types = [
+            columns.resourcetypes[columns.resourcetype[_]] for _ in four_pool
         ]
+        four_char = [_ for _ in four_types if _ == "角色"]
+        four_weap = [_ for _ in four_types if _ == "武器"]
         optional = ""
-        cum = data.get_history(5)
-        if cum and pool == "角色活動":
-            hit_miss = (
-                len([_ for _ in cum if _.name not in STANDARD_POOL])
-                / len(cum)
-                * 100
+        if five_pool and pool == "角色活動":
+            hits = sum(
+                columns.names[columns.name[_]] not in STANDARD_POOL
+                for _ in five_pool
             )
+            hit_miss = hits / len(five_pool) * 100
             optional = f"保底命中:  　{hit_miss:.2f}%"
 
         desc = QLabel(
@@ -180,28 +392,23 @@ class MainWindow(QMainWindow):
         )
         right_col.addWidget(QLabel("最近紀錄"))
 
-        log.debug("Pool cum data: {}", cum)
-        scroll = QScrollArea()
-        scroll.setVerticalScrollBarPolicy(
+        history = QListView()
+        history.setModel(
+            HistoryModel(data, 5, pool == "角色活動", history)
+        )
+        history.setItemDelegate(HistoryDelegate(history))
+        # equal rows let the view lay out only what is on screen
+        history.setUniformItemSizes(True)
+        history.setSelectionMode(QListView.SelectionMode.NoSelection)
+        history.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        history.setVerticalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOn
         )
-        scroll.setHorizontalScrollBarPolicy(
+        history.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
-        scroll.setWidgetResizable(True)
-        inner = QFrame(scroll)
-        inner.setLayout(QVBoxLayout())
-        inner.layout().setAlignment(Qt.AlignmentFlag.AlignTop)
-        scroll.setWidget(inner)
-        for item in cum:
-            label = QLabel(f"{item.name:　<5}{item.pity:>2}抽")
-            label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-            label.setStyleSheet("color: cornflowerblue")
-            if pool == "角色活動" and item.name in STANDARD_POOL:
-                label.setStyleSheet("color: orangered")
-            inner.layout().addWidget(label)
-
-        right_col.addWidget(scroll)
+
+        right_col.addWidget(history)
         layout.addLayout(right_col)
         return layout
 
@@ -0,0 +1,91 @@
+"""Timings for PoolData ingestion and statistics.
+
+    python benchmarks/bench_pooldata.py [--sizes 100 10000 ...] [--seed 0]
+
+Every size is loaded from the same seeded synthetic history, so numbers
+are comparable between runs and commits. Peak memory is taken in a
+separate traced run, tracemalloc would otherwise skew the timings.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger as log
+
+from synthetic import generate
+from wuthering import PoolData, decode_records
+
+SIZES = [100, 10_000, 100_000, 1_000_000]
+
+
+def cases(data: list[dict]) -> dict:
+    pool = PoolData().load(data)
+    body = json.dumps({"data": data}, ensure_ascii=False).encode()
+    return {
+        "load": lambda: PoolData().load(data),
+        # from a response body, decoded whole or streamed record by record
+        "json_load": lambda: PoolData().load(json.loads(body)["data"]),
+        "stream_load": lambda: PoolData().load(decode_records(body)),
+        "get_ratio": lambda: (pool.get_ratio(4), pool.get_ratio(5)),
+        "get_average": lambda: (pool.get_average(4), pool.get_average(5)),
+        "get_history": lambda: (pool.get_history(4), pool.get_history(5)),
+        "get_pity": lambda: pool.get_pity,
+    }
+
+
+def timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def traced(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    log.remove()
+
+    print(
+        f"{'records':>9} {'case':<12} {'best ms':>10} "
+        f"{'records/s':>16} {'peak MiB':>9}"
+    )
+    for size in args.sizes:
+        data = list(generate(1, size, seed=args.seed))
+        for name, func in cases(data).items():
+            # the full loads run once at the largest sizes
+            repeat = (
+                1
+                if name.endswith("load") and size >= 100_000
+                else args.repeat
+            )
+            best = timed(func, repeat)
+            peak = traced(func)
+            print(
+                f"{size:>9} {name:<12} {best * 1000:>10.3f} "
+                f"{size / best if best else float('inf'):>16,.0f} "
+                f"{peak / 2**20:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
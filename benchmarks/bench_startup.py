@@ -0,0 +1,127 @@
+"""Startup cost of the window icon, embedded resource against lazy file.
+
+    python benchmarks/bench_startup.py [--repeat 5] [--platform offscreen]
+
+Each case runs in a fresh interpreter. The embedded case rebuilds the
+old generated resource module from the full-size icon with pyside6-rcc,
+its first run also pays for compiling that module. The lazy case loads
+the small icon from disk the way the window does now. Import time covers
+the imports a case adds on top of Qt, icon time covers turning the icon
+into a pixmap, memory is the resident set once both are done.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+QRC = """<RCC><qresource prefix="/">
+<file alias="icons/icon.png">{path}</file>
+</qresource></RCC>
+"""
+
+# imports shared by every case, not part of the measured import time
+PRELUDE = """
+import json, sys
+from time import perf_counter
+import psutil
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QIcon, QPixmap
+app = QApplication([])
+"""
+
+REPORT = """
+start = perf_counter()
+{imports}
+imported = perf_counter()
+{icon}
+QIcon(icon).pixmap(64, 64)
+done = perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "icon": done - imported,
+    "rss": psutil.Process().memory_info().rss,
+}}))
+"""
+
+ICON = os.path.join(ROOT, "icons", "icon_64.png")
+
+CASES = {
+    "qt": ("", "icon = QIcon()"),
+    "embedded": ("import icons_rc", 'icon = QPixmap(":icons/icon.png")'),
+    "lazy": ("", f"icon = {ICON!r}"),
+    # the whole app module, backend included, for scale
+    "app": ("import app", "icon = app.ICON"),
+}
+
+
+def build_resources(directory: str) -> bool:
+    if (rcc := shutil.which("pyside6-rcc")) is None:
+        return False
+    qrc = os.path.join(directory, "icons.qrc")
+    with open(qrc, "w") as file:
+        file.write(QRC.format(path=os.path.join(ROOT, "icons", "icon.png")))
+    subprocess.run(
+        [rcc, qrc, "-o", os.path.join(directory, "icons_rc.py")], check=True
+    )
+    return True
+
+
+def run(case: str, directory: str, platform: str) -> dict:
+    imports, icon = CASES[case]
+    env = dict(
+        os.environ,
+        QT_QPA_PLATFORM=platform,
+        PYTHONPATH=os.pathsep.join([directory, ROOT]),
+    )
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            PRELUDE + REPORT.format(imports=imports, icon=icon),
+        ],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--platform", default="offscreen")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cases = list(CASES)
+        if not build_resources(directory):
+            print("pyside6-rcc not found, skipping the embedded case")
+            cases.remove("embedded")
+
+        print(
+            f"{'case':<9} {'cold ms':>8} {'import ms':>10} "
+            f"{'icon ms':>8} {'RSS MiB':>8}"
+        )
+        for case in cases:
+            cold = run(case, directory, args.platform)
+            warm = [
+                run(case, directory, args.platform)
+                for _ in range(args.repeat)
+            ]
+            print(
+                f"{case:<9} {cold['import'] * 1000:>8.2f} "
+                f"{min(_['import'] for _ in warm) * 1000:>10.2f} "
+                f"{min(_['icon'] for _ in warm) * 1000:>8.2f} "
+                f"{min(_['rss'] for _ in warm) / 2**20:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
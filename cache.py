@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from time import time
+
+from wuthering import config_path, log
+
+CACHE_DIR = "responses"
+CACHE_TTL = 3600.0  # seconds
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_directory() -> str:
+    return os.path.join(os.path.dirname(config_path()), CACHE_DIR)
+
+
+class ResponseCache:
+    """Raw API response bodies on disk, keyed by a hash of the payload.
+
+    Entries older than ttl are ignored unless offline is set, then every
+    request is answered from disk and a miss raises instead of fetching.
+    Once the directory outgrows max_bytes the least recently read entries
+    are evicted, recency is kept in each file's access time.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        ttl: float | None = CACHE_TTL,
+        max_bytes: int = CACHE_MAX_BYTES,
+        offline: bool = False,
+    ):
+        self.directory = directory or default_directory()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(payload: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+
+    def _path(self, payload: dict) -> str:
+        return os.path.join(self.directory, f"{self.key(payload)}.json")
+
+    def get(self, payload: dict) -> bytes | None:
+        path = self._path(payload)
+        try:
+            stat = os.stat(path)
+            if (
+                not self.offline
+                and self.ttl is not None
+                and time() - stat.st_mtime > self.ttl
+            ):
+                log.debug("Cached response {path} expired", path=path)
+                return None
+            with open(path, "rb") as file:
+                body = file.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path, (time(), stat.st_mtime))
+        except OSError as e:
+            # recency only steers eviction, the body is still good
+            log.debug("Unable to touch {path}: {error!r}", path=path, error=e)
+        log.debug("Cache hit {path}", path=path)
+        return body
+
+    def put(self, payload: dict, body: bytes) -> None:
+        path = self._path(payload)
+        try:
+            with open(f"{path}.tmp", "wb") as file:
+                file.write(body)
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            log.warning("Unable to cache response: {error!r}", error=e)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    # concurrent puts evict too, it may be gone already
+                    continue
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            log.debug("Evicting cached response {path}", path=path)
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        continue
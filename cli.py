@@ -0,0 +1,245 @@
+"""Gacha statistics on the command line, without the Qt window.
+
+    wutheringacha [--json] [--pool 1 ...] [--history 20] [--log PATH]
+
+Pity, rates and the latest 5★ pulls of every pool, as a table or as
+JSON for scripts. Qt is never imported, rich only when it is installed
+and the output is a table.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from wuthering import (
+    POOLTYPE,
+    STANDARD_POOL,
+    TIME_FORMAT,
+    TITLE,
+    VERSION,
+    PoolData,
+    WutheringData,
+    log,
+)
+
+FEATURED_POOL = 1  # the only pool with a 50/50 on its 5★
+LOG_LEVELS = ("WARNING", "INFO", "DEBUG")  # by count of -v
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="wutheringacha", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print JSON instead of tables"
+    )
+    parser.add_argument(
+        "--pool",
+        type=int,
+        action="append",
+        choices=list(POOLTYPE),
+        help="pool type to show, repeatable, all pools by default",
+    )
+    parser.add_argument(
+        "--history",
+        type=int,
+        default=20,
+        metavar="N",
+        help="latest 5★ pulls to list per pool, -1 for all",
+    )
+    parser.add_argument("--log", help="Client.log to read the record URL from")
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="search the disks for the log when the game is not running",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="only use what the API returns, skip the history store",
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="cache API responses on disk"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="answer from cached responses only, implies --cache",
+    )
+    parser.add_argument("-v", "--verbose", action="count", default=0)
+    parser.add_argument(
+        "--version", action="version", version=f"{TITLE} v{VERSION}"
+    )
+    return parser.parse_args(argv)
+
+
+def open_backend(args: argparse.Namespace) -> WutheringData:
+    store = cache = None
+    if not args.no_store:
+        from history import HistoryStore
+
+        store = HistoryStore()
+    if args.cache or args.offline:
+        from cache import ResponseCache
+
+        cache = ResponseCache(offline=args.offline)
+    return WutheringData(store=store, cache=cache)
+
+
+def locate(backend: WutheringData, args: argparse.Namespace) -> bool:
+    if args.log:
+        backend.logfile = args.log
+        return os.path.isfile(args.log)
+    return (
+        backend.restore_logfile()
+        or backend.locate_executable()
+        or (args.discover and backend.discover_logfile())
+    )
+
+
+def summary(pool: int, data: PoolData, history: int) -> dict:
+    fives = data.get_history(5, None)
+    result = {
+        "pool": pool,
+        "name": POOLTYPE[pool],
+        "attempt": data.attempt,
+        "pity": data.get_pity,
+    }
+    for quality in (5, 4):
+        result[f"{quality}star"] = {
+            "count": len(data.columns.rows(quality)),
+            "ratio": data.get_ratio(quality),
+            "average": data.get_average(quality),
+        }
+    if pool == FEATURED_POOL and fives:
+        result["featured_ratio"] = round(
+            sum(_.name not in STANDARD_POOL for _ in fives) / len(fives), 6
+        )
+    result["history"] = [
+        {
+            "name": node.name,
+            "pity": node.pity,
+            "attempt": node.attempt,
+            "time": datetime.fromtimestamp(node.time).strftime(TIME_FORMAT),
+            "standard": pool == FEATURED_POOL and node.name in STANDARD_POOL,
+        }
+        for node in (fives if history < 0 else fives[:history])
+    ]
+    return result
+
+
+def render_plain(summaries: list[dict]) -> None:
+    for pool in summaries:
+        print(
+            f"{pool['name']}  抽取次數 {pool['attempt']}"
+            f"  目前保底 {pool['pity']}"
+        )
+        for quality in (5, 4):
+            stats = pool[f"{quality}star"]
+            print(
+                f"  {quality}星  總計 {stats['count']:>5}"
+                f"  概率 {stats['ratio'] * 100:>6.2f}%"
+                f"  平均 {stats['average']:>6.2f}抽"
+            )
+        if "featured_ratio" in pool:
+            print(f"  保底命中 {pool['featured_ratio'] * 100:.2f}%")
+        for item in pool["history"]:
+            mark = " *" if item["standard"] else ""
+            print(
+                f"    {item['time']}  {item['name']:　<5}"
+                f"{item['pity']:>3}抽{mark}"
+            )
+        print()
+
+
+def render_rich(summaries: list[dict]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    for pool in summaries:
+        stats = Table(
+            title=pool["name"],
+            title_justify="left",
+            caption=f"抽取次數 {pool['attempt']}  目前保底 {pool['pity']}",
+            caption_justify="left",
+        )
+        for column in ("", "總計", "概率", "平均"):
+            stats.add_column(column, justify="right")
+        for quality in (5, 4):
+            quality_stats = pool[f"{quality}star"]
+            stats.add_row(
+                f"{quality}星",
+                str(quality_stats["count"]),
+                f"{quality_stats['ratio'] * 100:.2f}%",
+                f"{quality_stats['average']:.2f}抽",
+            )
+        if "featured_ratio" in pool:
+            stats.caption += f"\n保底命中 {pool['featured_ratio'] * 100:.2f}%"
+        console.print(stats)
+        if not pool["history"]:
+            continue
+        history = Table("時間", "名稱", "抽數")
+        for item in pool["history"]:
+            history.add_row(
+                item["time"],
+                item["name"],
+                str(item["pity"]),
+                style="orange_red1" if item["standard"] else "cornflower_blue",
+            )
+        console.print(history)
+
+
+def render(summaries: list[dict]) -> None:
+    # tables for a terminal, plain lines for pipes or without rich
+    if sys.stdout.isatty():
+        try:
+            return render_rich(summaries)
+        except ImportError:
+            pass
+    render_plain(summaries)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    log.setup(sys.stderr, LOG_LEVELS[min(args.verbose, 2)])
+
+    backend = open_backend(args)
+    try:
+        if not locate(backend, args):
+            log.error("Game log not found, start the game or pass --log")
+            return 1
+        if not backend.fetch_payload():
+            log.error("No record URL in the log, open the in-game history")
+            return 1
+        backend.populate_data(concurrent=True)
+    finally:
+        backend.close()
+        if backend.store is not None:
+            backend.store.close()
+
+    summaries = [
+        summary(pool, data, args.history)
+        for pool in args.pool or list(POOLTYPE)
+        if (data := backend.data.get(POOLTYPE[pool])) and data.attempt
+    ]
+    if not summaries:
+        log.error("No pool data could be loaded")
+        return 1
+    if args.json:
+        json.dump(
+            {"player": backend.payload.get("playerId"), "pools": summaries},
+            sys.stdout,
+            ensure_ascii=False,
+            indent=2,
+        )
+        print()
+    else:
+        render(summaries)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+import os
+import sqlite3
+from threading import Lock
+
+from wuthering import RecordBuilder, config_path, log
+
+DB_FILE = "history.sqlite3"
+
+# polynomial rolling hash over per-record hashes, modulo a Mersenne prime
+HASH_MOD = (1 << 61) - 1
+HASH_BASE = 1_000_003
+
+TIME = 3  # position of the time in a record key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    playerId TEXT NOT NULL,
+    cardPoolType INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    resourceType TEXT NOT NULL,
+    qualityLevel INTEGER NOT NULL,
+    time TEXT NOT NULL,
+    PRIMARY KEY (playerId, cardPoolType, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS records_time
+    ON records (playerId, cardPoolType, time);
+"""
+
+
+def default_path() -> str:
+    return os.path.join(os.path.dirname(config_path()), DB_FILE)
+
+
+def _key(item: dict) -> tuple:
+    # pulls of one 10-pull can share every field, the order tells them apart
+    return (
+        item["name"],
+        item["resourceType"],
+        item["qualityLevel"],
+        item["time"],
+    )
+
+
+def _keys(data: "list | RecordBuilder") -> list[tuple]:
+    # newest first, a RecordBuilder is read from its arrays without dicts
+    if isinstance(data, RecordBuilder):
+        return list(data.record_keys())
+    return [_key(_) for _ in data]
+
+
+def _record(pool: int, key: tuple) -> dict:
+    # in the shape the API answers with
+    name, resourcetype, quality, time = key
+    return {
+        "name": name,
+        "resourceType": resourcetype,
+        "qualityLevel": quality,
+        "cardPoolType": pool,
+        "time": time,
+    }
+
+
+def _hashes(keys: list) -> list[int]:
+    return [hash(_) % HASH_MOD for _ in keys]
+
+
+def occurrence(older: list, newer: list) -> int:
+    """End of the last whole occurrence of older inside newer, else 0."""
+    a, b = _hashes(older), _hashes(newer)
+    n = len(a)
+    if not 0 < n <= len(b):
+        return 0
+    target = 0
+    for value in a:
+        target = (target * HASH_BASE + value) % HASH_MOD
+    power = pow(HASH_BASE, n, HASH_MOD)
+    window = 0
+    ends = []
+    for index, value in enumerate(b):
+        window = (window * HASH_BASE + value) % HASH_MOD
+        if index >= n:
+            window = (window - b[index - n] * power) % HASH_MOD
+        if index >= n - 1 and window == target:
+            ends.append(index + 1)
+    for end in reversed(ends):
+        if older == newer[end - n : end]:
+            return end
+    return 0
+
+
+def overlap(older: list, newer: list) -> int:
+    """Length of the longest suffix of older that is a prefix of newer."""
+    a, b = _hashes(older), _hashes(newer)
+    n = len(a)
+    prefix = suffix = 0
+    scale = 1
+    lengths = []
+    for k in range(1, min(n, len(b)) + 1):
+        prefix = (prefix * HASH_BASE + b[k - 1]) % HASH_MOD
+        suffix = (suffix + a[n - k] * scale) % HASH_MOD
+        scale = scale * HASH_BASE % HASH_MOD
+        if prefix == suffix:
+            lengths.append(k)
+    for k in reversed(lengths):
+        if older[n - k :] == newer[:k]:
+            return k
+    return 0
+
+
+def align(older: list, newer: list) -> int:
+    """How many leading records of newer are already the tail of older.
+
+    Both are lists of record keys, oldest first. newer may start inside
+    older, then the longest suffix of older equal to a prefix of newer
+    wins, or before it, then the last whole occurrence of older inside
+    newer does. The largest alignment is taken so that no pull is ever
+    counted twice.
+    """
+    return occurrence(older, newer) or overlap(older, newer)
+
+
+class HistoryStore:
+    """Every pull ever fetched, beyond the window the API still returns.
+
+    Rows are keyed by player, pool type and their 1-based pull sequence,
+    so a pool's history reads back in order straight from the key.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or default_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        log.info("Opening history store {path}", path=self.path)
+        # shared by the concurrent pool fetches, the lock serializes them
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def count(self, player: str, pool: int) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM records"
+                " WHERE playerId = ? AND cardPoolType = ?",
+                (player, pool),
+            ).fetchone()[0]
+
+    def _select(
+        self, player: str, pool: int, limit: int = -1, since: str = ""
+    ) -> list[tuple]:
+        # record keys, newest first
+        return self._conn.execute(
+            "SELECT name, resourceType, qualityLevel, time FROM records"
+            " WHERE playerId = ? AND cardPoolType = ? AND time >= ?"
+            " ORDER BY seq DESC LIMIT ?",
+            (player, pool, since, limit),
+        ).fetchall()
+
+    def _insert(self, player: str, pool: int, seq: int, keys: list) -> None:
+        # record keys oldest first, numbered on from seq
+        self._conn.executemany(
+            "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (player, pool, seq + index, *key)
+                for index, key in enumerate(keys, 1)
+            ),
+        )
+
+    def records(self, player: str, pool: int) -> list[dict]:
+        with self._lock:
+            keys = self._select(player, pool)
+        return [_record(pool, key) for key in keys]
+
+    def merge(
+        self, player: str, pool: int, data: "list | RecordBuilder | None"
+    ) -> list:
+        """Store the records of data that are not stored yet.
+
+        data is an API response, newest first, which may overlap the
+        stored tail. A window that ends before the stored tail, like a
+        cached or replayed one, adds nothing. Returns just the new
+        records, newest first as well.
+        """
+        keys = _keys(data or [])
+        with self._lock, self._conn:
+            seq, latest = self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0), MAX(time) FROM records"
+                " WHERE playerId = ? AND cardPoolType = ?",
+                (player, pool),
+            ).fetchone()
+            if not keys or (latest is not None and keys[0][TIME] < latest):
+                added = []
+            else:
+                # only stored pulls as old as the response can overlap it
+                stored = self._select(player, pool, since=keys[-1][TIME])
+                newer = keys[::-1]
+                added = newer[align(stored[::-1], newer) :]
+                self._insert(player, pool, seq, added)
+        log.info(
+            "Stored {count} new records for pool {pool}",
+            count=len(added),
+            pool=pool,
+        )
+        # dicts only for the pulls that were new
+        return [_record(pool, key) for key in reversed(added)]
+
+    def import_records(self, player: str, pool: int, data: list) -> int:
+        """Merge an export that may be older or newer than the store.
+
+        data is newest first like an API response. The pool is
+        renumbered, so loaded PoolData should be reloaded afterwards.
+        Returns the count of pulls that were added.
+        """
+        if not data:
+            return 0
+        with self._lock, self._conn:
+            stored = self._select(player, pool)[::-1]
+            imported = _keys(data)[::-1]
+            after = overlap(stored, imported)
+            before = overlap(imported, stored)
+            if occurrence(imported, stored):
+                merged = stored  # the export holds nothing new
+            elif occurrence(stored, imported):
+                merged = imported
+            elif after or before:
+                merged = (
+                    stored + imported[after:]
+                    if after >= before
+                    else imported + stored[before:]
+                )
+            elif not stored or stored[-1][TIME] <= imported[0][TIME]:
+                merged = stored + imported
+            elif imported[-1][TIME] <= stored[0][TIME]:
+                merged = imported + stored
+            else:
+                raise ValueError("Import does not line up with history.")
+            if len(merged) < len(stored):
+                raise ValueError("Import would drop stored pulls.")
+            if len(merged) > len(stored):
+                self._conn.execute(
+                    "DELETE FROM records"
+                    " WHERE playerId = ? AND cardPoolType = ?",
+                    (player, pool),
+                )
+                self._insert(player, pool, 0, merged)
+        added = len(merged) - len(stored)
+        log.info(
+            "Imported {count} records for pool {pool}", count=added, pool=pool
+        )
+        return added
@@ -1,14014 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.7.0
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x03il\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x03\x84\x00\x00\x03\x84\x08\x02\x00\x00\x00v,hl\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\xff\xa5IDATx^\xec\xfd\xf7\x97\
-\x14G\xd6\xe7\x8f\x7fw\x04\xed-\xed\xa0\xa1\xbb\xf1\xde\
-\xca\x80\x0c\x03B\x1a\xcdh\xbc\x1e\xcd<\xb3\xbb\xcf\xb3\
-\xe6\xec\x0f{\xf6\xbf\xda\x1f\xf6s\xce\x9e\xf1\xde\x1b\x8d\
-\x90\x05\x84\x15\xc2#\xbc\xa7\x81\xa6\x0d\xa6A\xda\xef+\
-\xe3\x1du\x89\xce\xac\xaa\xae\xee.L7\xf1\x92\x94\xba\
-q\xe3FdfD\xdc\x88\x1bYY\xd5\xff\xbfH$\
-\x12\x89D\x22\x91H$\x12\x89D\x22\x91H$\x12\x89\
-D\x22\x91H$\x12\x89D\x22\x91H$\x12\x89D\x22\
-\x91H$\x12\x89D\x22\x91H$\x12\x89D\x22\x91H\
-$\x12\x89D\x22\x91H$\x12\x89D\x22\x91H$\x12\
-\x89D\x22\x91H$\x12\x89D\x22\x91H$\x12\x89D\
-\x22\x91H$\x12\x89D\x22\x91H$\x12\x89D\x22\x91\
-H$\x12\x89D\x22\x91H$\x12\x89D\x22\x91H$\
-\x12\x89D\x22\x91H$\x12\x89D\x22\x91H$\x12\x89\
-D\x22\x91H$\x12\x89D\x22\x91H$\x12\x89D\x22\
-\x91H$\x12\x89D\x22\x91\xc8\xd3\xcb\x7f\xf0\xff\x8fD\
-\x9e\x0c*++\x17-Z\xf4\x9d\xef|\xe7\xcd7\xdf\
-\x5c\xbatiCC\xc3\x7f\xc8\xf1\xff\x1c_\xf9\xcaW\
-0\x93\xac\x22\xc2\x0c\xbe\xf8\xe2\x8b[\xb7n]\xbbv\
-\xad\xb7\xb7\xf7\xd8\xb1c\xef\xbc\xf3\xce\xc7\x1f\x7f|\xfe\
-\xfc\xf9\xbbw\xefz\xd3H$2Ea\x1e\xe8\xec\xec\
-\xfc\xda\xd7\xbe\xf6\xaf\xff\xfa\xaf\xcf>\xfb,\x13\xc83\
-\xcf<\xc3\xa4\xa1\xc9\xc1\x1b\x05`\xcf\xf1\xcb/\xbf$\
-W\xb2\x94\x92\x99L\x06\x07\x07\xcf\x9d;\xb7}\xfb\xf6\
-?\xfc\xe1\x0f;w\xeedVA)\xb3H$R.\
-\x9e\xf1\xff\x8fD\x9e\x0cX\x12\xee\xdd\xbb\xc7\xfa1c\
-\xc6\x8cY\xb3f\xd5\xd6\xd6\x22\x83\xd6\x06\x1de&\xc1\
-\xad\x1a^\x09\xc8,<\xd3\xa6M\xab\xa9\xa9ir \
-`<00044t\xff\xfe}o\x17\x89D\xa6\
-\x22\xcc\x00L\x1a]]]\x8b\x17/\xee\xe8\xe8\xa8\xaa\
-\xaab\xf6\xb0\xe9\x22\x8c8\x85\x92\xe1|\x22\x01\x90)\
-[QQQ\xed\x98>}:S\x13\xb1){]\x82\
-Wo\x14\x89D\xcaA\x0cF#O\x16\xac\x0a_|\
-\xf1\x05s}{{\xfb\xc2\x85\x0b\x09I\x89,\xb5B\
-\xa0\xd4\x1a`+\x07\xd8\xe2\x91R\xb2\x8a\xb0x\xb0,\
-544\xb0 \xdd\xb9s\xa7\xaf\xaf\x8fU$>\xd5\
-\x88D\xa668>^\xcf\x04\xd2\xda\xdaZ__O\
-\xd2g8\xc2p\x13\xc2\xa4\xc9\x12,I\x0d\xeci\xa9\
-\x93\xb9\x889\xe4\xe6\xcd\x9b\xcc'\x9a\x8b\x22\x91HY\
-\x88\xc1h\xe4\x89\xe3+_\xf9\x0a\xb3\xff\xbcy\xf3\x96\
-/_\xcer\xa2`\x94X\xd3f\x7f\x92\x06\xc90\x0c\
-5\xc8R=\xac\x22\x84\xa4\x15\x15\x15\xf7\xee\xdd\x1b\x18\
-\x18`\x15\x89\xcfG#\x91)\x0c\x13\x05{N|\xbf\
-\xb9\xb9\xb9\xa5\xa5\xa5\xba\xba\x1a\xa5M\x17:\x8a\x94l\
-\x98\xc6\x04\xcd$uuu\xecr\x99C\x06\x07\x07\xef\
-\xde\xbd\x1bw\xb6\x91H\xb9\x88\xc1h\xe4\x89\x83 \x92\
-\xf5c\xc1\x82\x05k\xd6\xacioo'\x8et\x0bD\
-\x82\xb7p\x84\xc9T<\x1a\x1a\x13\xcbR\x1b\xabHU\
-U\xd5\xf0\xf0\xb0>e\x8b\xf1h$2U!FT\
-\xa4\xd8\xd0\xd00s\xe6\xcc\xc6\xc6F\xbd\xe7\xc3\xc4\xa2\
-\x99\xc1\xf0\x05\xf2\xe1-\x1c\xda\x09+\x1e\xd5\xa3\xd6\xdb\
-\xb7okg\x1b\x9f\x8fF\x22e!\x06\xa3\x91'\x11\
-\x02\xd0\xee\xee\xee%K\x96\x10\x8c\x86o}ia\x90\
-\x0d\xb2\x84,di\xe1AF \x1e\xa5\x12\xc5\xa3\x84\
-\xa1CCC\xac%\xf7\xee\xdd\x93q$\x12\x99b(\
-F$\x18\xed\xe8\xe8hnnf;\xca$\xa0\x904\
-/\x18{)\x874\xd4\x03\xd2\x00a(U\x01U\x11\
-\xef\xf6\xf7\xf7\xc7\xe7\xa3\x91HY\x88\xc1h\xe4\x89\x83\
-p\x93\x08\xb2\xb1\xb1\xb1\xad\xadM\xdf@b!\xd1\xc3\
-\x09\xbf&\xe4\xf0\x05\x0a@%`\x02K\x88j#\x1e\
-e\x15\x89\xcfG#\x91\xa9\x0a\xd3\x05\x102\xd6\xd6\xd6\
-\x12\x8c\xe2\xf8lD5\x0fx\x8b\x91\xf8\x09e$\xe8\
-\xa9D\x06&\xd8\xe7\xf5\x08\xcc!\x03\x03\x031\x1e\x8d\
-D&N\x0cF#O\x22L\xfd\xf7\xee\xddc\x8ag\
-\xc6ohh\xd0w\xea\xb5<\x84H\x93\xd5\xa7\xa06\
-l***XB\xa8\x0d!~^\x1f\x89Lmp\
-\xed;w\xee\xe0\xf8D\xa2\xed\xed\xed\xf5\xf5\xf58>\
-\xc1(\x1a\xe1\xed\x0a\x83\x8d\xec\x15\x89\xbaB\x89\x86z\
-\x98\x91\x80$\x91h\xfc\xbc>\x12\x9981\x18\x8d<\
-\x890\xb3\xdf\xbe}\xfb\xe6\xcd\x9bD\x8dUUUD\
-\x90555\xc4\xa3\xd9\x07\x1b\xac\x07&\x98\x0c\xc8\xf6\
-0\xc3\x1e\xa9R\x9c\xdaX\x96\xf4|\x94\xfa\x89G\xe3\
-S\x8dHdJ\xc2\xec\x81\xef\xb7\xb4\xb4\xf4\xf4\xf4\xb4\
-\xb5\xb5Y0J\x96M\x0e\x86\xf4Fh\x96\xcc\x1d\x0e\
-\xa6 \x92TRYY\xc9\x1c\xa2x\x94i\xe4\xc6\x8d\
-\x1b\xc4\xa3I\xb1H$2.b0\x1ayBa\x15\
-a~\xd7\x8f\x832\xef\xcf\x981C\xf1\xa8BR\x90\
-\x19\x8b\x81\x1dm\x81!\x89\x01\xc7\x10eQ\x9cz\x88\
-GYN\xee\xde\xbd\xab\xf7G9\x85\x19D\x22\x91\xa9\
-\x01N\xcd\xe6s\xd6\xacY\x8b\x17/\xee\xec\xec\xc4\xe5\
-q\xff\x22\x9e\x1eN v4\x81\x5c\x04A=\x84\xb6\
-T\x8e\xfe\xfa\xf5\xeb\x97.]\x1a\x18\x18\x88\xdb\xdaH\
-d\xdc\xc4`4\xf2\xe4\xc2\xe4N<J\xc8H\xec\xd8\
-\xdd\xdd\xdd\xda\xda\xca\x02\xe0W\x03\x87\xccBY\xa4\x92\
-B+\x0dA\xaa\x16\x92\xda\xda\xda\xea\xeaj=\x82\x1d\
-\x1e\x1e\x96\x0dI\x09\x91Hd\xb2\xc3<\x80\x9b3u\
-\xacX\xb1b\xf6\xec\xd9\xc4\x8e\xf6;q\xde\x22@\xca\
-l<*\x90\xb5\xbf\xb5]\xaer\x99:\xae]\xbbv\
-\xf9\xf2e\x8e\xccTI\xc9H$2vb0\x1ay\
-\xa2\xd1\xd3\x08\xc2\xd0y\xf3\xe6utt\x10>j9\
-Q\x96l Y\x1cF.\x1e\x86\x94\xce\xcaCR\xcf\
-GY\xa88N\x9f>\x9d\xd8Ta\xee\xfd\xfb\xf7\xe3\
-\xe3\x8dHdj\x80G\xe3\xe3L\x1d\x04\xa3cz2\
-*\xb04c\xc9\x10\xca\xd83]\xb0\x9b\xed\xeb\xeb#\
-\x18\x8d\x0fG#\x91q\x13\x83\xd1\xc8\x13\x0d3\xfeW\
-\xbe\xf2\x95\xba\xba:\xe2Q\xfd~5\xb1\xa3V\x02o\
-\xe1PRzaJa\x1a\x13\x08jY\xa8\x9a\x9a\x9a\
-\x88qg\xce\x9cI\xe5\xd4|\xf7\xee\xdd;\xf1W\xf1\
-#\x91)\x01n\x8e\x8f\xf7\xf4\xf4\x10\x8c\xce\x993G\
-?\xc9\xa4\x19`T\x92\x99\x223\x8d\x84\xe8S\x14\xfd\
-b\x141\xe8\xe0\xe0`\x7f\x7f?\x81i\xfct%\x12\
-\x19\x071\x18\x8d<\xd1\xfc?\xf7\x8bND\x87\x08\x95\
-\x95\x95\xfaf}\xdexTH\x19\xe6\x86\x02|%\x09\
-n\x93\xf7M\x91\xa9\x87\xf5i\xc6\x8c\x19\xc4\xa3mm\
-m\xf5\xf5\xf5d\x11\x8f\xb2\xa2\xc4_!\x8dD&;\
-\xf8xMMMWW\xd7\xb2e\xcb\xf41\xbd>d\
-\xf7\xd9%\x90L\x19\xf9\xec\xf5\x0c\x95,\x82\xd1\x8a\x8a\
-\x0af\x124\xcc\x1bCCC\xecf\xe3\xf3\xd1Hd\
-\xac\xc4`4\xf2\xa4C0\xaao\x1a\x11\x92\xb2\x9c\xd4\
-\xd5\xd5\xd9\x87\xf5\x02\x1b\xad\x0dB\x9a\xf0(\x01\x12\xb3\
-\xff\x90\xc8Z\x93\x9eq\xb0\x96\xb0b555\x11\x95\
-\x12\x8fb<00\xa0\xd3\xa9l$\x12\x99\xa4\xb0\x83\
-e\x9f\xd9\xd3\xd33k\xd6,\xa6\x0e\xfc]{\xd1\x10\
-\xa6\x02/\x8d$\x992\x1c>\x1d`z\x8e\xd4\xc9\xbc\
-\xa4M2\x91h|>\x1a\x89\x8c\x83\x18\x8cF&\x01\
-_\xb8o2\x0d\x0e\x0e\x0e\x0f\x0f3\xf5\xb3\xa8\x10>\
-j]\xd1\x92\x90\xc2\x94\xc9\x8a\x11\x18\x841+(\x8b\
-#\xab\x88\xc2\xdc\xc6\xc6F\xe4{\xf7\xee\x11\x8c\xc6x\
-4\x12\x99\xec\xe0\xddl\x5cq\xed\x993g\xb6\xb6\xb6\
-\x12\x9b&3\xc2\xc8I#\xab\x11\xd2\x83O\x17\x00\x03\
-6\xb4\x04\xa3LJ\xcc0leo\xdc\xb8A<\xea\
-\xb3#\x91H\x09\xc4`429 .d~W<\
-\xca\x8a\xc2\xd4\xaf\xaf#@v\xb5P\xd0)}\xb2\x98\
-\xe40eV\xe0\xc8\xa2\xa5\x9a\x09L9]\xfcU\xfc\
-Hd\xb2\xc3>\xf6K\xf7g\xe5;;;\xbb\xba\xba\
-\xf0n<].o\x84\xc9\x94,|:\x80\x19Fz\
-\x190\x0b\xe9\xf3z\x04\xb6\xcd\x97/_\xee\xeb\xeb\x8b\
-\x0fG#\x91\xd2\x89\xc1hd\xd2@\x5c\xc8D?4\
-4\xa4\xe7\xa3\xd5\xd5\xd5\xc4\x8e\xfa\xbc\xde[8,\x12\
-\x15R\x0a\xd3\x98^\x1a\x8a\xa8\x94\xaa\xad\xab\xab\xa3f\
-\x85\xbfp\xef\xde=\xe5F\x22\x91I\x07\x0eN\x0c\xba\
-p\xe1\xc2\x05\x0b\x16\xd4\xd7\xd7\xa7\xb6\xaf\x92S\x1aa\
-\xb2\xf4!(mN\x90\x0d\xe8\x05\x80\x81\x81\x813g\
-\xce\x5c\xb9r\xc5~0.\x12\x89\x8cJ\x0cF#\x93\
-\x89/\xdc\x0f\xa9\xe8\xad,\x92\xcc\xfe,\x09\x1cY`\
-\xf4\x91=\xc8\xd2\x84\x103\xc8\xe6\x9a\x9e\xaa\xf4\x91=\
-\x0b\x18u\x12\xfe\xb2\xa8h\xe1\x89\x8f:\x22\x91\xc9\x05\
-\x1e\xcd\xf6\xb2\xb3\xb3s\xd5\xaaU\x8b\x16-jhh\
-\xc8\x1b\x8c\x16\x82\x5c\xe1\xd3\x85\xc1Fo\xb7_\xbcx\
-\xf1\xe8\xd1\xa3\xe7\xcf\x9fg\xea\xf0y\x91Hd4b\
-0\x1a\x99d\xe8\x81%\xf1\xe8\xcd\x9b7\xfb\xfa\xfa\x86\
-\x86\x86\x08\x19\xedS{\xd9\x84\xeb\x87\x09\x10\xcaY\x94\
-\xab\xd0\x96\x05\x8cu\x8b\xa8t\xfa\xf4\xe9\xd4L\x12%\
-\xa7\x06\x19G\x22\x91'\x1f\x9c\xb7\xad\xadm\xe5\xca\x95\
-\xcf=\xf7\xdc\xbcy\xf3\x98(\x14\x8c\x1a\xde.GJ\
-#\x9b\x14\xe8\xf3~T\xc2V\xf9\xd6\xad[g\xcf\x9e\
-=x\xf0 \xc7\x18\x8cF\x22\xa5\x13\x83\xd1\xc8\xe4C\
-\x93\xfe\x8d\x1b7\xae\x5c\xb9BHJ\xbc\xa8/\xc2O\
-\x9b6\x8d\x5c\xd6\x09-\x18Z9,i(\x99R\x8a\
-\xa4\x80C1h]]]KKKgg\xe7\xacY\
-\xb3\x88G\x87\x87\x87\xe3\xb7\x9a\x22\x91\xc9\x02\x8e\x8c\x0b\
-/\x5c\xb8\xf0\x95W^Y\xb7n\xdd\xcc\x993\xd9^\
-\xea#\x14r\xc3\x80R\x9a,\xc9\x5c\xe0\xf0\xe9\xc2P\
-\x1b\xf3\xd2\xe0\xe0\xa0\x82\xd1s\xe7\xce\xc5`4\x12)\
-\x9d\x18\x8cF&%\xcc\xfb\xcc\xf5\xfa>SMMM\
-{{{sss\xf8dTG[EL\x00\xd3\x87\
-\x82\xcb\xf1H\xaf\xe7\xa3\x84\xb9D\xa2\xd0\xd8\xd8\xf8\xe5\
-\x97_\xc6o5E\x22\x93\x05\xbc\x98`t\xf1\xe2\xc5\
-/\xbe\xf8\xe2\x92%K\x1a\x1a\x1a\xd8d\xa2\xf4\xd9#\
-\xc9\xabO&\x82\x02\xf6)\x14\x8c\xb2Y\x8d\xc1h$\
-2\x0eb0\x1a\x99\xach\xf6\x07\x16\x18}\xfav\xef\
-\xde=\x92\x08\xf6\xf0C\x82%E\xb2\xbc\x8cLzi\
-$\xe8\xf5\x0dY*g\x19#\x18%\xea\xa5~\xfd\x0a\
-i\xfcU\xfcH\xe4\x09\x07\x17f?\xc9Nr\xe1\xc2\
-\x85\xb3g\xcf&0\x1dG0jG#|\xa4j\xc4\
-`4\x12\x99\x081\x18\x8dLb\xb4\x00\x0c\x0f\x0f\x0f\
-\x0e\x0e^\xb9r\xe5\xe2\xc5\x8b\xb7o\xdfV\xf8\xc8\xaa\
-C\x0c*XK\xc0\x96\x10[Z\xa4Q\xd2\x94FR\
-\xc6\x05\xb2\xf6\x93O\xf5\xf5\xf5T\xae\xd3\xe9[\xf6\xde\
-4\x12\x89<y\xc8\x85\x99\x0a\xf0\xdc\x193f47\
-7\xe3\xc8\x9a\x10\xbcE\x8e\xacFH\x9f\xcd\xcd\x1b\x8f\
-\xde\xbf\x7f?\x06\xa3\x91\xc8\xf8\x88\xc1hdrC0\
-\xca\xa4\x7f\xfd\xfauf\xff\xd3\xa7O\xf7\xf5\xf5\x11/\
-\xd6\xb9_\xc5G`\x15a\xd9\x10\x18\x93\xb4u\xc5\x94\
-:\x82rC\x5c(\xeb\x9f\xad>\xf3\xcc3\xacdU\
-\x8e/\xbf\xfc2\xfe\x95\xa6H\xe4\xc9G\x9bU\x1c\xb6\
-\xa9\xa9i\xe6\xcc\x99\xfai'\xf4rpC\xc6Y\x94\
-U\xc4\xc0`\x1a\x89OF#\x91q\x13\x83\xd1\xc8\xa4\
-G\xf1(\xd1!\x91h\x7f\x7f\xff\xdd\xbbw\xa7M\x9b\
-V]]m\xcfG\xddr\x93\x7fQIE\xa2\x92E\
-\x12\xab:\xa4\xd7\x91j\x1b\x1a\x1a\x88J9\x0bg\x8c\
-\xef\x8fF\x22O2\xf8\xaf>\xc1\xd0\x1f\x05mii\
-\xb1\xcfL\xc8Bo^\xaf\xa4\x8eF\xe8\xfb\x85\xb0\x82\
-LDL\x08\x84\xa1\x04\xa3\x84\xa41\x18\x8dDJ'\
-\x06\xa3\x91)\x02\x8b\x01q!\x8b\x01!)\xcb@M\
-MMcc#\xb1\xe33\xc1\xcf\x0ab\x83\xccQ\x82\
-d\xf4\x08v\x04)\x85\xb3J\x90\x5cQQ\xa10\x97\
-\xa3\x9e\x8f\x0e\x0e\x0e\xc6x4\x12y\x92\xa9\xaa\xaa\x9a\
-3g\xce\xa2E\x8b\x08I\xd9I\xea\xb5\xf2\xd0\xcdC\
-9\xc4\x1c_I#\xab\xa1\x06\xed\x8a/^\xbcx\xe4\
-\xc8\x913g\xce\xe8\xb7\x90#\x91H)\xc4`42\
-\xa5`=`\x0d\xd0\xb7\xecY0\x08IY{\x88\x1a\
-Y*H\xea\x89Hj!\x91F\xca\xec\x9a$\xbd\x1d\
-a\xda\xb4i\x04\xa3\xfa>\xd3\xdd\xbbw\xe3\xf7\xeb#\
-\x91'\x19|\x96\xadcww\xf7\xd2\xa5K;;;\
-q\xdbp\x83\x8aP(\x12\x85\xc4\xe1GN\x17FJ\
-O%p\xef\xde\xbd\x9b7o^p\xb0Se\xe6\xf1\
-\xd9\x91H\xa4(1\x18\x8dL5\xf4\xe6\xd6\x8d\x1b7\
-8\x128N\x9f>]\x8b\x0d2 (6\x952\x5c\
-Q\xa4\x11\xa1\xec\xd6\xa3\x07K\x17\xc1+\x8bYUU\
-U}}}CC\x03I\xe2Q\xa0\x08\xb9a\xc1H\
-$\xf2\xd8\xc1+\xf1\xd6Y\xb3f-X\xb0`\xe6\xcc\
-\x99\x04\xa6\xcc\x03\xf2\xe8\xe2\x0ek6J\x86X\xa9\xd4\
-D!\x81\x90TS\x10\xdb\xd48!D\x22\xa5\x10\x83\
-\xd1\xc8\x14\x84p\x93e```\xa0\xbf\xbf_\xdf\xb2\
-G&\x82\xac\xa9\xa9\xd1:D\x04\x89\x19\xeb\x84(\xbe\
-&\x19\x98\x81dj\xa8\xad\xadmjjbm\xa3\xec\
-\xfd\xfb\xf7\xf5\x84\x95P\x18d\x13\x89D\x9e\x04\xf0\xcd\
-\xca\xca\xca\xc6\xc6\xc6\x96\x96\x16|\x16Y\xbe\x0c\xde\x22\
-\x1f\xca-b\x13N\x1a2\xe3Dn\xcf;\xed\xce\x9d\
-;W\xaf^\xbd~\xfdz\xfc\xcd\x8dH\xa4\x14b0\
-\x1a\x99\x9a(\x1ee=8u\xea\xd4\xd1\xa3G{{\
-{+**\x1a\x1a\x1a\x88G\xa7O\x9f.\x1b\x85\xa4\
-YR\x81i\xb2d\x05\xa0\xa1\xa0^;\xab\xaa\xaa\x22\
-\x18e\x91\xeb\xe8\xe8\xe8\xea\xeaB\xb8{\xf7n\xfc\xd4\
->\x12y\xa2\xc0\x1fqLv\x89\xf5\xf5\xf5\xed\xed\xed\
-\x1c\xf55&\x9f]\x009\xbb\x8eF\xf1]+ub\
-O\x00z\xed\xda\xb5\x93'O\xb2\x0d\xe6\xbc>/\x12\
-\x89\x14&\x06\xa3\x91)\x0b\xcb\xc6\xb0\xfb\x03\x9e\xd7\xaf\
-_\xbfq\xe3\x06\xab\x82~\xf5)\xfb-\xfb\x90\xecb\
-cf\xa1\xb1dBR*lmm\xed\xee\xee^\xbc\
-xq[[\x1b\xcb^\x7f\x7f\x7f\x8cG#\x91'\x07\
-M\x05\x1cg\xcc\x98\x81\xabr\xd4\xef\xbe)7q\xef\
-\xcc<\x00y\x95@=\xe0\x13\x01\xd8\xa3'\xe4\xbd}\
-\xfb\xb6\xbe\xc6t\xfe\xfc\xf9\x18\x8cF\x22\xa5\x10\x83\xd1\
-\xc8\x14\xe7\xcb/\xbfdy :$$%0\xad\xaa\
-\xaa\xd2\xf3\xd1i\xd3\xa6\xb1r\xe8\xfdQ\xcc\xb4\x90\xa8\
-\x88\x91\xacQnA\xd21\x14\x88e\x01\x81R,l\
-T\xa8WH9\xa2\xd4[\xa41\x1e\x8dD\x9e\x1c\xf0\
-\xd3\xce\xce\xce\x85\x0b\x17vtt0\x0f\x84_c\x82\
-\xc4\xd53\xa0\xcfN\x0bE\xc0\x98\xd9F\xdf\xa9?t\
-\xe8P\xfc\x81\xa7H\xa4Db0\x1ay* \xe8\xbc\
-}\xfb\xf6\xc0\xc0\xc0\xbd{\xf7\xa6O\x9fN\xec\xc8j\
-\xc4\xe2\xa4\xe7\xa3\x18\x84\x0b\x8f\xe4P\x10$\x0d\x8bb\
-\xa9A\xab\x1a\xd5\xd6\xd5\xd5555Q9g\xe9\xeb\
-\xeb#\xf6\x8d\xf1h$\xf2$\x80\x87\xea;\xf5\xcb\x97\
-/\x9f={vee%\xdbQ\xed'\x05\x06^\x1a\
-\x8d\xbc\xe1\xa9)\x09F\x99gN\x9f>}\xe0\xc0\x81\
-\x18\x8cF\x22%\x12\x83\xd1\xc8\xd3\x02\xab\x05\xf1\xa8b\
-D\xc2P}\xf7\xc8\x9e\x8e\x84KQ\xf2\xcc\xd3\xfd\x0c\
-\xa1-0\xd9\x85*\xd4 \x03U\x01u\x0a\xf4\x9c\x08\
-\xe27\x18\x22\x91\xc7\x0e\x1e\xca.\xb1\xa7\xa7G\xc1(\
-\xb2|\x1fOw\xee[0\x12-\x92\x05\xa9\xb2\xcc\x18\
-\xec?\x07\x07\x07\xcf\x9c9s\xe8\xd0\xa1\xf8w\x98\x22\
-\x91\x12\x89\xc1h\xe4)\xe2\xcb/\xbfdm`\xa9 \
-@\xact\x7fn\xbe\xaa\xaa*\xf5\x80\x04XQ\xf4\xe0\
-3\x5ci\xc2%G\xb2\xcbL@N\xe2V\x07I\x22\
-\xd1\xfa\xfaz*\xe7,z\x7f4\xc6\xa3\x91\xc8\xe3\x05\
-\xc7$\x00\x9d;w\xee\x8a\x15+\x14\x8c\xda\x86\x13d\
- \xcb\x10)9\x0aS\x1a\xd2\x18T\xf5E\xee\x8f\x82\
-\x1e>|8\x06\xa3\x91H\x89\xc4`4\xf2t\xa1x\
-T\xcfG\x89D\xf5\xdb\xf5\xcf<\xf3\x8c\x16$=&\
-\x91%\xe4]o\xf2*\x05zj\x00\xe2Q\xaa\xe5\xc8\
-\xe9\x08F\xe3\xf3\xd1H\xe4\xf1\x82oZ0\xda\xd9\xd9\
-\x89o\xca\xd9\xe5\xb3\x1c\xb1\xd1$`H9&\xa8\x01\
-\x97\xc7\xdf\x09C\xe3\x93\xd1H\xa4tb0\x1ay\xea\
-\xd0\xd7]\xfb\xfb\xfb\x87\x87\x87\xa7M\x9b\xc6\x12\x05\xd3\
-\xa7O\xd7\xda\x93\xacN\x01*\x92%\x95e\xcb\x98\x8b\
-E\x13\x88t\xf5|\xf4\xfe\xfd\xfb\x03\x03\x03\xacO\xf1\
-\xfd\xd1H\xe4q\x81\xc3Z0:g\xce\x1cd}L\
-ox\xbb\x80\xbc\xcaBX%\xfa\xba\xe4\xf9\xf3\xe7\xe3\
-\x93\xd1H\xa4tb0\x1ay\x1a\xf9\xf2\xcb/\xef\xde\
-\xbdK\x8cHTJ<J\xd4\xc8\xe2\x84\xe0\xb3\x8bb\
-\xab\x8eA\xd2\x82Q{\xc2\xcaRG\x9d\xd5\xd5\xd5\x84\
-\xb9z\x8d,\xfe\xdeS$\xf2\xb8\xc0I\xf1G\xbd3\
-J0\xca.1\xf5~N\xea\xb1\xa8Hyz\x0a\xcb\
-5AOF\xf1t\xc2\xd0\x83\x07\x0f\xc6/0E\x22\
-%\x12\x83\xd1\xc8S\x8a\x9e\x8f\x0e\x0d\x0d\x0d\x0f\x0f\xb3\
-&UTT\x105\xb2>\x01K\x0b+\x0a6\xe1\x1a\
-#\xc1\x08W)d\x83$\xc6\x08\xd4I\x85z3\x95\
-\xe3\xbd{\xf7b<\x1a\x89<.pIv\x86\x16\x8c\
-\x22\xeb\xc9\xa8\xcf.@\x11\x03\xb2\xc2i\x81\xa4\x8c\xc3\
-\x8f\xe9c0\x1a\x89\x94H\x0cF#O/\xc4\xa3,\
-\x15\xfa\x0c\x1d\x81\xb5\xa4\xc6a\xab\x94\x8e\xa9H4Y\
-srK\x94\x09BY\xf6\xb8\x85\x82\x84\xb6UUU\
-\x8aG\xf5\xc8\x04\xe2\xfb\xa3\x91\xc8\xa3\x87\x00t\xf6\xec\
-\xd9\x8b\x16-\x9a5k\x96\xde\x19\xf5\x19\x85I9x\
-H\xa1,}LO\x18\x1a\x9f\x8cF\x22\xa5\x13\x83\xd1\
-\xc8S\x8d\xe2\xd1\x9b7o\x0e\x0e\x0e\x12;\xd6\xd7\xd7\
-766\x128\xb2P\x15Y\x87 \xccM\xc9\xd4\x03\
-\x08\xd2O\x9f>\x9d\x95\x8f\x9a9\xda\xe7\xf51\x1e\x8d\
-D\x1e%8#\x9e\x88\x1b\xb6\xb7\xb7\xb7\xb4\xb4 \xb0\
-Kd\xdbI\x16\xde*\x03g8\x82\xbcJQ(\x8b\
-=\xe7\xed\xdb\xb7c0\x1a\x89\x8c\x89\x18\x8cF\x9ev\
-\x14\x8f\x12 \x22\xd4\xd6\xd6677\xd7\xd5\xd5\xb1n\
-\x85\x0fNXxl\xed\x09\xe5,Z\xd8\x14\x8c\x22p\
-\xd4\xe7\xf5D\xa2555\x15\x15\x15zp2\x14\xbf\
-_\x1f\x89<Z\xf0J\xbc\x0f\x7fd\xc3\xd9\xd6\xd6\x86\
-\x9bOs\xaf\x89;\x87\xf6\x1e-\xff\x15\xa1>K\xde\
-,\x8a\xebcz\xc2\xd0\xf81}$R:1\x18\x8d\
-D\x92\x87\x19\xc3\xc3\xc3Z6\x08\x19\x09I\x158\xda\
-z\xe3V\xa5\x07\xc1\xa5\xe4B8[o\x0c\x0aL\xf5\
-y=\xeb\x9f\x9e\x8f\x0e\x0c\x0c\xc4\xe7\xa3\x91\xc8\xa3\x84\
-H\xf4\xee\xdd\xbbx\x1f\x1b\xce9s\xe6455\xe1\
-\xe3\xf6\x9dz\x0c\xc2H\x14LoH#,\xa9,a\
-\xc1\xa8~\xf4>\x06\xa3\x91H\x89\xc4`4\x12I\xd0\
-BE\x80\xc8\xe21}\xfa\xf4\x86\x86\x06\xa2F}\x99\
-\xc9[\xb8\xb5'\xf5:\xa9A2K\x98\xa5\xe7\xa3\xc4\
-\xb8\xc4\xa3,\x81\xac\x88\xacX1\x1e\x8dD\x1e%D\
-\x8a8\xf5\xcc\x993\xe7\xcf\x9f\xdf\xd1\xd1\x81\x8f\x87\x9f\
-\xd4\x87\x82\xdc\x16\x94,\x11\x05\xa3\xf8\xb5}\x81\xe9\xf6\
-\xed\xdb>/\x12\x89\x14&\x06\xa3\x91\x88G\x1f\xa0\x0f\
-\xb8\xbf_O\xbcH\xe0\xc8Z\x85\xc0\xea\xa5\xa7\xa1:\
-\xda\xfa$Y\xa4\x92Fh\x89@\x0d\xd4I\xa4K\xe5\
-\xc4\xa3\xfd\xfd\xfd\x83\x83\x83\x082\x8bD\x22\x0f\x15\xdc\
-\x10\x07\x9c3g\xce\xd2\xa5Kg\xcf\x9e\x8d\x8cK\xa2\
-W\x0cj\x91(\xc8g\xc1\xa7KC\xc1(\x1b\xda\x8b\
-\x17/\x1e9r\xe4\xf4\xe9\xd31\x18\x8dDJ!\x06\
-\xa3\x91\xc8\x03\x88GY<\x08\x10\xf5|\xb4\xde\xfdj\
-}\xea\xfdQ\xd0\x12\xa5\xb5\xca\x08\xb3BX\x9f\x042\
-\xb9\xcf\xb8\xbf_O\xb5\x08\x9c\xab\xb7\xb7W\xdf\x9d\x92\
-q$\x12yx\xe0\x80x_WW\x97\x82Q\xf6\x84\
-\xfa\xacC\x1e\x0af&$K\x99\xc2\x0cRP\xc9\xdd\
-\xbbw/_\xbe|\xf4\xe8\xd13g\xce\x0c\x0d\x0dY\
-\xb5\x91H\xa4\x101\x18\x8dDF`\xf1(BEE\
-\x05K\x17\xd8\xc3\xd1\xbc\xcb\x0fh\xbdI\xe5*\xa9c\
-\xb8 \xb1\xfeQ3\xdc\xbf\x7f\xff\xe2\xc5\x8b\xc4\xa3\xc3\
-\xc3\xc3>/\x12\x89<4pF\x02P\xfb;L\xec\
-\x09\xed\xc9h\xe8\xa1`\xce\x1b\x0a!\xce*!%\x03\
-SG\x7f\x7f\xff\x85\x0b\x17.]\xba400\x10?\
-\xfa\x88DF%\x06\xa3\x91H\x1a\xd6\x92;\xee\xf7G\
-\x89\x11\xf5\xf7\xeb\xb3\xdf\xaf/N\xb8>\x01I[\xea\
-,\xa8\x85!\xf7\xe3\xd8,Z\x84\xbf\xa9\xb50\x12\x89\
-\x94\x1d\x9cN\xc1\xe8\xca\x95+\xbb\xba\xba\xf4\x01E!\
-\xd7\x93\x93\x0a\xaf\xca\xa0,\xd9\x84\xa0$\x06\xc5\xaf\x89\
-Jq\xf3\x18\x8fF\x22\xc5\x89\xc1h$\x92\x07-$\
-w\xef\xde\xad\xae\xaenooonn\xd6\xaf\x12*\
-\x94\x94Mj\x0d\xcb\xfbd\x05\xa4w+\x94_\xb78\
-\x12\xef~\xf9\xe5\x97\xc4\xbb\xe7\xcf\x9f\xbfr\xe5\x0aQ\
-/I,S\x95D\x22\x912\x82\xf7\x11\x8c\xf6\xf4\xf4\
-,[\xb6\xcc\xde\x19E)\xbf3\xefK|u$\xd2\
-\x1b\xb2\x94^\x06\xe0r\x12\xa8\xb3\xc2\xbdt\x8e\xb2\xaf\
-\xaf\x0f\x07gs\x1b];\x12)B\x0cF#\x91\xfc\
-(^\xac\xad\xad\xed\xe8\xe8hkkC`\x81!\x1e\
-\xf5\xd9#a\xa5\xb1\xc5F+\x13()RIA\xc8\
-\x0b\xd3\xa7Ooll\xac\xaf\xaf\xc7\x86\xa8\x14\x8d\xcf\
-\x8eD\x22e\x05\x17#F\xec\xee\xee&\x18\x9d3g\
-\x8e\xe2E\x9f\xe7 \x19b\x1a\xe5\x0ayz\xe8\xef\xa1\
-\xe0\xcc\x93W\xc3\x99.\x98C.\x5c\xb8p\xfa\xf4\xe9\
-\xc1\xc1A&\x13\x99E\x22\x91,1\x18\x8dD\x0a\xc2\
-\xa2RYY\xd9\xdc\xdcL<\xda\xd2\xd2\xa2\xe7(\xd2\
-\x83l\xb2(\x17|\xda\xa1\xa4\xf4\x06ahCCC\
-gg\xe7\xbcy\xf3f\xcd\x9a\xc5\xd2u\xe3\xc6\x8d;\
-w\xee\xc4u+\x12y\x18\xe0tx\xb1\x82Q\xfb\x98\
-\xde\xe7\x8dt\xcf0\xa9\x5c\x03Mj\xe7)\xd9\x90\x06\
-\x1bb\xd0\xe3\x8e\x9b7o\xe2\xdd\xca\x8dD\x22YJ\
-}\x07.\x12y\x0a\x19\x1e\x1e\xbe|\xf9\xf2\xb1c\xc7\
-N\x9f>\xdd\xdf\xdf\x7f\xef\xde=}\x98\xae\x5c\xadC\
-`ISJ#L#\xc1\x986mZ]]\x1d+\
-\xe2\xea\xd5\xab_z\xe9\xa5\x0d\x1b6,]\xba\xb4\xb5\
-\xb5\x95\x08U\x05#\x91\xc8\xc3\x00/&4\xbc\x7f\xff\
->\x82\xf7\xc6\x91`\xa3c!\x8a\xe7\x0a6\xae@\xb0\
-\xeb\xaa\x1c\xdd>\x12y\x9a\x89\xc1h$R\x10\x96\xab\
-\x9b7o\x9eq\xf4\xf5\xf5\x91\xb4H4\xc4\x16\x9bP\
-\xc02\xc4\x19>@\x96\xc4\x9d555MMM-\
---\xed\xed\xed\x9d\x9d\x9dmmmUUUdy\
-\xbbH$RV\xf0b6\x96W\xaf^\xc5\xa3\xef\xde\
-\xbd\xab\x07\x96\xf2G\x08ep%\xc6\x8fj\x98x=\
-\x91\xc8\x94'\x06\xa3\x91H1\x86\x87\x87Y\xb4l\xe9\
-\xb2\x0f\xd0\xb3\xcb\x0c\xb2\xe1UE\x91\xe53\xcf<C\
-HZYYIH:g\xce\x9c\x9e\x9e\x9e\x193f\
-\xc4\x87\xa3\x91\xc8\xc3\x80m\xe1\xed\xdb\xb7\xcf\x9e=\xbb\
-o\xdf\xbe#G\x8e\xdc\xb8q#|E[.)!\
-L\xe6\xa5xn$\x12\x19\x13\xf1\x9d\xd1Hd\x14\xf4\
-y:1\x22\xf1bMM\x0d\x91\xe2W\x82\xdf\x1c\xcd\
-+$\xc5F2\xaa\x920\xf7\xde\xbd{\x84\xbc\x97.\
-]\xba~\xfd:\x81\xaf\xcf\x88D\x22\xe5\x03G\xd3\x03\
-Q\xdcy\xd6\xacY\xfa\x0b\xf5\xf2h\x19\x84^\xccQ\
-B\x0a\xe9\xc1\xa73\x10\xf5r\x0a\x1c\xf9\xd0\xa1C\x87\
-\x0f\x1f\xd6\xe7*>/\x12\x89d\x88\xc1h$2\x0a\
-\x0a\x13Y]\xaa\xab\xab\x9b\x9b\x9b\x09L\xed=0\x90\
-\x8dO8L#A\xa4\x92\xc9'\xf7\xc1g\xf7\x929\
-\x91\xde\x0a \x1e\xbdu\xeb\x96\xb2\x22\x91Hy!L\
-$\xfalkk\xeb\xe9\xe9ioo\xaf\xac\xac,\x14\
-\x8c\x86B\x96\xd0\x85S\x90\x15\x83\xd1H\xa4t\xe2\xc7\
-\xf4\x91\xc8(\xdc\xbd{\xf7\xc2\x85\x0b{\xf7\xee\xdd\xbd\
-{\xf7\xd9\xb3g\x09\x13\xed\xc3z`\xad\xca.WE\
-\x16\xb0B\xb0\x1c\xd6\xd4\xd4\x10\xec644L\x9b6\
-\xcdk#\x91H\xb9\xd1\xc3\xd1\xa1\xa1\xa1;w\xee\xd8\
-;\xa3\xca\x02\x85\x98\x16hf#N\xe7\xf1\xa5:x\
-\xe9\x96\x91\xc8\xd3L\x0cF#\x91\xd1a\xd1\xbar\xe5\
-\xca\x993g._\xbeL0\xca\x02\xc6z\xc6*e\
-x\xbb\x1c\xd2h\xd1\x12\xd2\x87\x84J\xd9\x13\x83VW\
-W\xebM\x80\xbcE\x22\x91HY\xc0\x7f\xe5\xc5\xc8c\
-\xf55\xe7\xf1i\x977\xc8\xb2\xcd*5\xdb+= \
-e$\x12\xc9\x12\x83\xd1H\xa4$\xee\xde\xbd{\xed\xda\
-\xb5K\x97.\xdd\xb8q\x03\xd9V#\xb70\x15\x5c\x99\
-\x8ac\xeb\xd33\xcf<C$\x0auuu---\
-\x8d\x8d\x8d\xf1;L\x91\xc8C\x85`\xd4v\x95^\xe5\
-\x08\xa3Fy7\xf8t\xc9\xa8\x08\x91hUU\x15;\
-\xcc\xf0\xd7L#\x91H\x96\xe8!\x91H\xa9\xb0\xb4\xd4\
-\xd7\xd7\xb7\xb5\xb5\xb5\xb6\xb6\xea\x07\xf0\xb5n\x15y\xe6\
-\x91]\xc6\xb2\xc6\xb2A\xaf,\xfd=\xeb\x9b7o\x22\
-\xb0X:\x93H$RN\x88\x11\xbb\xba\xba\xf4w\x98\
-\xf4\x16\xb8=\xc2$\xd7\x04#\x95\x142\x13\xd2\x98/\
-s$\xcc\xbds\xe7\x0e{\xd7\xabW\xaf\xf6\xf6\xf6\xa6\
-^\xef\x89D\x22!1\x18\x8dDJ\x82\x85\xe4\xfe\xfd\
-\xfb\xacXD\xa2,`\x8d\x8d\x8d,9\x16\x8f\x1aa\
-\xf4)\xd94\xb2\x0c\x8f\x12l\x01\xa3\xb6\xe9\xd3\xa7\xb3\
-L\xc2\xf0\xf00\xf1h\xfc+\x82\x91\xc8\xc3\xa0\xb2\xb2\
-\xb2\xbd\xbd}\xee\xdc\xb9\xb3g\xcfnhhH\xbd\x18\
-\x13\xca!\x85lR\x9e\x0e\xe4\x02\x1e\x8dL\x18J<\
-JTz\xef\xde=\xe5F\x22\x91\x141\x18\x8dDJ\
-\x85\xc5\xa6\xa2\xa2\xa2\xb3\xb3s\xf1\xe2\xc5\x84\xa4\xd3\xa6\
-M\xd3\x92\xa3,\xd9\x08K\xa6\xd6';\xa6\x90R\xc1\
-h]]]}}='\x1a\x1a\x1a\xd2\xf3\xd1\x18\x8f\
-F\x22\xe5\x05\x8f\xc3\x7fq\xb4\x96\x96\x96\xe6\xe6f\xb6\
-\x7f\xd9\x8de^\xcc\xc6\x04\xf9xj\x06P.G`\
-Ky\xfa\xf4\xe9\x8b\x17/\xe2\xcb\xca\x8dD\x22)b\
-0\x1a\x89\x94\x0a\xcbUMM\xcd\xdc\xb9s\x97-[\
-\xd6\xd1\xd1A\xe0\xa8\x05\xac\xc4`\x11K;\x86$\xeb\
-\x95\x83\xf5\x8c#k$K#!)\xdc\xbau\xab\xb7\
-\xb7\x97\xa8\xd4\x9bF\x22\x91rp\xff\xfe\xfd\xe1\xe1a\
-\xdc\x8d`t\xf6\xec\xd9\x8d\x8d\x8d\xda[\xa6bJ\x83\
-,/\x8d\x94\xf3F\xa2\x02\xe5\x17_|A\x00z\xf9\
-\xf2\xe5\xc3\x87\x0f\x9f9s\x06\xb9P\xfd\x91\xc8SN\
-\xfc\x02S$2\x06\x88;A+\x8a\xd6\xa4\x12#\xd1\
-\x22P\x8f-o\xd4\x8cL\xc8\xdb\xdd\xdd\xbdn\xdd\xba\
-U\xabV\xb1X\xc6o?D\x22e\x87`\xb4\xbf\xbf\
-\x7f``\x80\xc04\xf4k\x8e)doxm\x80\xcf\
-p\x84\x1a|\xb9\xc4\x07\xae\x91\xc8SN\x0cF#\x91\
-\xb1\xa1\xc5\x06\x92\x10r\xe43\x12\xb0UM\xc8F\x84\
-f\x08Y\x0d\xeb\x16 \x905m\xda4B\xd2\xba\xba\
-\xba\xf8U\xdcH\xe4a\x80\xaf\xe1e\xe1\xdb\xa2\xb8a\
-\xe8\xbc\xc2\xb2$\x00\xb2\xdc\x1c\x9c\x89GYfC\xb5\
-\x9cB_\x8d\x02;K$\x12\xc9\x12\x83\xd1Hdl\
-\xb0\xa8h]\xb1\x85\x07Xl\xbc\xe4H\x96\xa6\x1c\xa9\
-$\x98FU\x81+\xf4 <\x05*\xac\xaa\xaa\xaa\xaf\
-\xaf'$e\xc9\xf4\xdaH$RV\xf4\xebN\xa9\xb0\
-Rx\x8b\x91\x9e^\x1c\xb93 \xabZP\xf1\xd2+\
-\x89D\x9eBb0\x1a\x89\x8c\x07\xad7,0Z{\
-Xr\xa4)\x05[\x96\x10\x84\x92\xb6n\xa9N\xe2\xd1\
-\xea\xea\xea\x86\x86\x06\x8e2\x88D\x22\xe5B/t\xea\
-\xef\xd4Kc\x9e(\x94L)A\xee\x09>=\x12\x9f\
-\x97C\xcal%\x91H$$\x06\xa3\x91\xc8xH\xad\
-.\xb6\xea\x94\x08\xc5\x0d\xaf\xca!\x0d\x91heee\
-ss\xf3\xacY\xb3\x1a\x1b\x1b\xe3'\xf5\x91Hy\x91\
-\xf7\x81O\x8f\x86Y\x9a0\xaa\xd7\xbb\xeaK\xad?\x12\
-y\x9a\x89\xc1h$2N\xc2\x95\xa6\xc8\x92\xa3,g\
-\x9b\x87BY\xe8\xa7M\x9b\xd6\xd6\xd66w\xee\xdc\xce\
-\xce\xce\xda\xda\xda\xa4\xaeH$R&\xd8\xef\xe1bl\
-\xf3\x8a\xc4\x94\xf2\xc4,rRH\x1e~\x8e\xc4[\x04\
-\xc8\xd2'\x22\x91H>b0\x1a\x89\x8c\x87\xbc\xabN\
-)he\x12JJo\xa0\xf9\xd2}C\x9fe\xb2\xb9\
-\xb9\xb9\xbb\xbb\xbb\xa3\xa3\xa3\xaa\xaaJ\xb9\x91H\xa4\xec\
-\x94\xee\xceY\x87\x15\xaa\xa1P0\xea\xa5H$R\x80\
-\x18\x8cF\x22c\x83\xf5&\xef\x92\x03\xca\x0aa\x1d\x12\
-\xdeb,|\xc5\xfd\xac)\xf1hCCC\xfc\x0eS\
-$R^\xd8\xf2\xdd\xbbw\xef\x8b/\xbe\x90{\xcaa\
-\x95U\x08Yf\xddY\x059\x8e\xcf\xd3#\x91H\x0c\
-F#\x911\xe0\x16\xac\x04\x9f\x0e\x902oVH)\
-\x06\xe2\x99g\x9e\xa9\xa8\xa8\xa8\xaa\xaa\xaa\xac\xac\x8c\xef\
-\x8cF\x22\xe5\x85\xc0\x91HT?2*\x8d\xfcNr\
-!\x0aE\xa2P(\x12\x1d\xb5\xceH$\x12\x83\xd1H\
-\xa4TXT\xf4\xc3\x84\x84\x86_\x19\xf9\xc3\x81\x92\xed\
-(A\xb0D\x09d3p9\xf9q\xa5\x13\x94\xe4\x8c\
-\xc0\xe9\x94\x8cD\x22e\x04\xc7\xd4\xafXx\xafs\xf8\
-\xbc\x0c\xf2b\xe1M\x8b\xfa\xb2(\xc5&\x12y\xca\x89\
-+\x5c$R*\x15\x15\x15\xad\xad\xadmmm55\
-5\x0aF\xb5\xccd\x17\x1b-Z\xe1\xd2e\xa8\x94P\
-R\xfa\x14\x94\x05r9)\xc4'\xa3\x91\xc8\xc3\x00\x17\
-\xc3\x97\xc3\xcd^\xe2\x99\xf9<\x1a|\x22G\xd6,\x8b\
-lJ\xb1\x8cD\x9efb0\x1a\x89\x94Juuu\
-wwwOOOCC\x03\xd1!\x0b\x8cBR-\
-T`\x9f\xf7\x01I/\x8d\xc4\x16'!e^\xc8\xd5\
-'\xf5uuu\xb5\xb5\xb5\xd3\xe2k\xa3\x91\xc8\xc3A\
-\xfek\xb2\x04#\xcc\x15\xc5\x9d\xd7\x8c\x110S\xb0[\
-\xc4>\x12\x89\xc4`4\x12)\x15\x96\x93\xe9\xd3\xa7\x13\
-\x1d\xb2\xb4H\xe3\x16\xa9\x07\x7f\x1b\xd04\x08\xb6\xf6 \
-\xe4E\xb9E\xe0,\x04\xa0\xf5\xf5\xf5s\xe6\xcc!\x02\
-\x8e\x7f\xa4>\x12ydx/\xcd\xe7\xa7y\x95y\xc1\
-\x12/\xc6m\xe3\x9b6\x91Hq\xa2{D\x22\xa52\
-<<|\xf5\xea\xd5+W\xae\xdc\xbau\x8b\xd0\xf3\x0b\
-\x87BO\xb00\x14\xdc*\xf6\x80P#9e\x93\x94\
-\x19\x09JV/b\xdf\xc6\xc6\xc6E\x8b\x16=\xfb\xec\
-\xb3\x0b\x16,\x88\xbf6\x1a\x89<l\xf2\xfa\xa3Q$\
-7\xf1d\x97kS\x81\x22\xd1\xea\xeaj\xb6\x94UU\
-U1\x1e\x8dD\x0a\x11}#\x12)\x09-3\xc4\xa3\
-\xfa\xfb\x81z\x14j\xd1'\xc8\xc0 \xc9\xda\x93\xacN\
-\x81 \x94[\x08+\x0e\xd3\xa6M\xab\xa9\xa9\x993g\
-\xce\xca\x95+\x17.\x5c\xc8\x92f\x06\x91H\xe4!\x91\
-\xf52i\xec(!\x85\xc5\xa0\x02\x1b\x1c\xbf\xb2\xb2\xb2\
-\xa5\xa5\xa5\xbb\xbb\xbb\xab\xab\xab\xa1\xa1!\xc6\xa3\x91H\
-^\xa2cD\x22%A\x5c\xd8\xd4\xd4\xc4\xa2BhX\
-WW\xf7L\xf0\x85z-B K\xb7T\xf9\xb5J\
-\xb2aJ\x09 \xbd\x085&p\xde\xda\xda\xda\xd6\xd6\
-V\xce^QQ\xa1\xacH$\xf200\xffr\xce\xf7\
-@\xce\x1e%\xa4\xd0<\xa0\x5c`\x8a\xc0g\xdb\xdb\xdb\
-W\xaf^\xbd~\xfd\xfa\xf9\xf3\xe7\xc7\x0f7\x22\x91\xbc\
-\xc4`4\x12)\x89\xe9\xd3\xa7\x13\x11.\x5c\xb8p\xde\
-\xbcy\xf5\xf5\xf5\x8aD\xed9\x07\xb2\x1dE\xb2\x16\x8d\
-\x04\xa5\xd6*\x90\x0dX\xd2\x1b\xe5P\x96\xf4\x04\xbeB\
-\xfaH$\xf2\xf0p\xfe\x97\x10\xca\xa0\x5c!\xdf\x1c\x15\
-J1o477/_\xbe\xfc\xc5\x17_\x5c\xb6l\
-\x19S\x07\x8e\xec\xb3#\x91H\x8e\x18\x8cF\x22%A\
-\xdcY]]\xdd\xd4\xd4\xd4\xd0\xd0PQQ\x11\xaeF\
-d\x09\xe4\xec\xba%\x92\x90s\xe4\x02&\x8dP\xd2\xca\
-\x22\x7f\x19\xfc\x107\xab\x97*\x8fD\x22e\xc49\x9f\
-\xc7\xab\x02\xe4\x8f\xb8\x9e\x04\xe1\xf3\x5cY/\x15\x85\x22\
-\x8aG\xbb\xbb\xbbg\xcd\x9aU[[\x1b\x83\xd1H\x89\
-0x\x92\x87\x10\x194&\xbd\xd1T!\xaep\x91H\
-\xa90\x05L\x9b6Ms\x81\xa6\x03\x16$\xa2F\x04\
-M\x0d:\x86\x82[\xe6\x12\x94,\x847\xcaD\xab\xee\
-\xc5\xd4\x84TV$\x12\x99 \xf2\xaf\xfb\xf7\xef\xdf\xbb\
-w\x0f\xc1ks8\x9fN0Y\xfa1a\xa5\x984\
-*\x1d\x04\xa6L\x1dRF\x22E`\xcc\xe8\xf1GK\
-KK[\x8e\xd6\xd6V\x92(\xc9\x9ab\x03)zE\
-$R\x12Z\x90\x84W\xe5\x94\x8a\x14\x11\x5c\x8c:Q\
-\x9f\xa2\x1e;\x82\x96L\xc9\x91H\xa4\x5c\xe0Y\x84\xa1\
-\x03\x03\x03\xfd\xfd\xfdw\xef\xde\xd5\x96Ox\x8b\x9c\x83\
-\xfbD\x09\x98\xb1\x0a\x0a\xd3hr0M$\x12\xa2\x11\
-\x22\xa6M\x9b\xd6\xd8\xd8\xb8x\xf1\xe2\x97^z\xe9\xb5\
-\xd7^\xfbZ\x00I\x94d\x11\x92b\x86\xf1\xd4\x18Q\
-\xf1\xf3\x82H\xa4$\xaa\xaa\xaa\xe6\xcc\x99\xb3j\xd5\xaa\
-\xf9\xf3\xe7\xeb\xc5/\xa6\x80\x14\xb24!/\xb2\x04\xc9\
-R\x86\xb0\x16\x86\x8fB\x11X2\xaf]\xbbv\xf8\xf0\
-\xe1#G\x8e\xf4\xf5\xf5\x85\x8be$\x12\x197,\xe4\
-\xd5\xd5\xd5\xcd\xcd\xcd3f\xcc\xa8\xa9\xa9I=\xb6\x0c\
-e\xc8\xeb\xad\xc2\x9c\x95\xff\x9cs{pU\xf1\xc5\x17\
-_\xdc\xb8q\x03\x17>x\xf0 .|\xff\xfe}\x15\
-\x88D\x84\x86bmm-\xe3\xb0\xae\xae\x8e1\xb9p\
-\xe1\xc2\x8d\x1b7n\xde\xbcy\xfd\xfa\xf5k\xd6\xaca\
-\xe9Y\xedX\xbe|\xf9\xbcy\xf3\xb0q?-\xf8\x85\
-Fi\xb8dLRb0\x1a\x89\x8c\x0e\xeb\x0a\xd3\x04\
-a(\x93BOO\x8f^\xfc\xd2,\xa0UGf\xa3\
-\x12ZJv\xa5\x1f`Y&3\xc5\x0c\x0f\x0f\xf7\xf6\
-\xf6\xb2\x8c\x1d=z4\x06\xa3\x91H\xb9`-\xc7\xb9\
-p\xe4\xc6\xc6\xc6\xb6\xb66\x16\xf8i\xee\xef\x9c\xc9\xc5\
-B7,B\xd6\x1fU\xd0\xf4\x04\x0aD\x9f\x04\xa3\xb8\
-p\x0cF\x9ff40B\x18{\x1cYM\xd8\x0e-\
-Z\xb4\x88@s\xc9\x92%\x84\xa1\x08\xcf=\xf7\xdc\x86\
-\x0d\x1bXq\x08=;;;g\xcd\x9a53\x07c\
-U\xdf^\xa0\x14\xb0\x89\xba{\xf7\xee\xbd{\xf7t\x8a\
-\xbc'J\xe1.\xe7\xc9\x22\x06\xa3\x91\xc8\xe8TUU\
-1\x17\xac\x5c\xb9r\xed\xda\xb5]]]\xf6\xb7\xe9\xc9\
-*\xdd\xb1\xb3\x96)\x8d\xad^\xe8\x95\xc5\x11\xa5\x9e\x8c\
-\x1eq\xc4`4\x12)\x17\x84\x898\x17\xbe\xdc\xd1\xd1\
-1w\xee\x5c\xd6\xf5\x8a\x8a\x0a\xf4r1s\xc3B\x14\
-\xf2D+\x88\x01X0z\xc8\x11\x83\xd1\xa7\x13\x22N\
-\xd6\x11\xd6\x8e\xea\xeaj\x04\xa1\xa7\xa1\xad\xad\xadD\x9f\
-\x9b6mz\xf5\xd5W\x09@\xd7\xad[\xc7B\xb3b\
-\xc5\x0a\xc2\xd0\xf6\xf6v\x0c\xb0\xd4\x0b\xc7\x80@%\x04\
-\xa3D\xa8\x18\xf4\xf4\xf4\xb0\x89bD\xb1\xb3b+E\
-\xaej\xceK\xf2\xdare%\x03\x1e\xe3B\xa3\xf7q\
-Q\xcc\xd3\x22\x91\x08\xe0\xc3s\xe6\xccy\xf6\xd9g\x99\
-)^z\xe9\xa5\xee\xeen4\x0aF\xb5\xe4\xe8X\x08\
-\xf3\xf9\x22f\xb2\x09\x8fV3+\xd9\xe0\xe0 k\xd8\
-/\x7f\xf9\xcb\xdf\xfc\xe67\xa7O\x9fFCV$\x12\
-\x998\xac\xee\xac\xe8\xdf\xfb\xde\xf7\xdez\xeb\xade\xcb\
-\x96\xb1\xcc\xe3t\xe6\x83\xb8\xb9\xcc\x84\xf9\xb2H%E\
-\xe8\xe6\x18\x80\x9e\xbf\x9e<y\xf2\xd7\xbf\xfe\xf5\xcf\x7f\
-\xfe\xf3S\xa7N\xdd\xbe}\xdb[D\xa6(\xe10\x00\
-69---\xb3g\xcf&\xee\xb4\xe5\x83\xb1\xc1\x91\
-\x11\xd8\xd8\xd8\xb8`\xc1\x82\xd5\xabW\xebc7}M\
-\x16=\x02G\xd5\x80\xa5f~\x8dI\x0d\xaa;w\xee\
-\xdc\xbcy\x93\xa1\xb5w\xef^\x8e\xfd\xfd\xfdD\xa52\
-\xa3r\x95\xe2(\xd0\xa3d\xf7\xd5\xdb\xdb\xcb \xbcv\
-\xed\xda\x13\x15\x92\x16\x5c\x1d#\x91\x08\xe0\xccL\x22/\
-\xbc\xf0\xc27\xbe\xf1\x8d\x97_~\x99HT\x9f\xd1\xcb\
-\xc99J\xc8K\xa1,\xf3\x7f3\x90\x86\xa3\x04\xd3#\
-X0\xfa\x8b_\xfc\xe2\xb7\xbf\xfdm\x0cF#\x912\
-\xc2z?\x7f\xfe\xfc\xef~\xf7\xbb\xff\xf2/\xff\xb2t\
-\xe9R\x05\xa3\xa1\x03\x9a\x0crO#\x95\x14f\xaf\x5c\
-\x8e8,q\x03\xcb?\xc1\xe8\xcf~\xf63\x82\x86\x18\
-\x8cNa,\x8eT\xd4\xc8\x11\xb9\xb9\xb9y\xf1\xe2\xc5\
-k\xd7\xae]\xb8paCC\x83\xad \xb2g\xd4\xb1\
-\xca\x00\x02e\x15\xaa\x82j\x00%\x11\x18N\x92\x11\x80\
-h\x92\xe0r``\xe0\xca\x95+7n\xdc 6%\
-\x18U\x96\x0a\x0a\x92\x16\x892\xf6\x18\x81;v\xec8\
-|\xf8p__\xdf\xdd\xbbw\x19\x9cO\xc2\x9a\xf2\xc0\
-\xcd\x22\x91H\x16\xe6\x919s\xe6\xbc\xfe\xfa\xebo\xbd\
-\xf5\xd6\xbau\xeb\xd8\xc2j\x82\xd0\xd4 A(\x19\x92\
-W\x99\x9a&d#%G\xcb\x95@.\xd3\x0d\xfb]\
-=\x19\xfd\xfd\xef\x7f\x7f\xf6\xec\xd9\x18\x8cF\x22\xe5\x02\
-\x07\xd7\x93\xd10\x18E\xcfQ\x82d\x09\xe6\x9eFV\
-#c\xe99\x02\x0eK\x10\xc06\xf27\xbf\xf9\xcdO\
-\x7f\xfa\xd3\x13'N\xc4`t\xaaB(IL9{\
-\xf6l\x8e\xfa@\x1c\x10Z[[\x17-Z\xb4l\xd9\
-2\xfb\x03~n|\xf9\x91F\x12\x1b\xcaZ\x90\xaa\xf1\
-#\xd9\x04\x0d'\x04\xea\x0c5\x04\xa0\x04\x94\x8c1F\
-\x1a\xc8FG\x09(\xf5\x10\x94\xd0\x93\xc8\xf5\xdc\xb9s\
-\x07\x0f\x1e\xfc\xfc\xf3\xcf\x09a/_\xbe|\xe6\xcc\x99\
-\xeb\xd7\xafS\x5c\xf6\x8f\x8b\xf8\xceh$R\x0c}F\
-\xbfz\xf5\xea\x95+Wvtt\xa4\xfe g(\x87\
-\xa4&\x11\xc3&\x88\x14\x0f\xec\xdd\xfePf\xcc8\x1c\
-\x99>\xae^\xbdz\xe4\xc8\x91\xbd{\xf7\xb2\x8c\x0d\x0e\
-\x0e&v\x91H\xa4\x1c\xe0ezjE$J\xc4 \
-\x077?\x95c\xa6\xbc8\x84\xac07\xaf\xa5\xa2\x01\
-\x82\x80\xc3\x87\x0f\x1f8p\xe0\xc6\x8d\x1b\xf1\x9d\xd1)\
-\x00\xdb\x98\xe4\x05\xcc\xcaJ\xc6\x8c\x04v2mmm\
-\xabV\xad\xda\xb4i\xd3\xc6\x8d\x1b\x9f\x7f\xfe\xf9\xb5\x8e\
-5\x8e\xe5\xcb\x97\xf7\xf4\xf40\xd8jkk\xab\x1d\xd8\
-s\xd4\xab\x9c\xd4\x06\x1a?nL=\xf8!0p'\
-\xf4\xb2 \xa9Q\x8aL\x08KY.\x83\xaaTax\
-\x14\xca\xe5H\x11\xa2^\xd62\xf6`\x0b\x17.$h\
-\xa6\x1evG\x04\xa3\x8f\xf7S\xfb\x18\x8cF\x22\x05\x91\
-\xd3\x12\x892\xad,Y\xb2D\xbf\xeb\xe6\xf3\x1c\x9a\x14\
-\xc0\xe6\x05%M\x08\xc9\xab\x14\x0f\xb2\xfe\x83\xdf\xf5\xaa\
-Bf\x87\x9b7o\xb2\x80m\xdd\xbau\xe7\xce\x9d\x97\
-.]z\xec\xfb\xd7Hd*\x81\xbb566\xe2\xdd\
-+V\xachoo\xc7\xe5\xa5\xc7\x07-\x1a\x90\xa6\x08\
-\xa1M\xd6\x1e_\x86\xfe\xfe~\xb6\x94\x07\x0f\x1e\xbc~\
-\xfdz\x0cF';\xc4\x91\x9d\x9d\x9d\xeca\x88\xe7\xe6\
-\xe7@&\xe8|\xf9\xe5\x97_z\xe9\xa5\x95+W\xa2\
-!\xfa\xec\xee\xee\xee\xea\xea\xc2\x98\xb0\xaf\xbe\xbe\x9e\xb8\
-SO@YJ8J`\xa4\x01#G\x83G\x02\x84\
-r\x8aT\x96j\x10\xaa\xd0*\x0f\x05\xe9\xb9\x06b\xe2\
-Y\x0e6`\x8c\x7f4T\xc8\xe2\xf2\x18?\xb2O\xbb\
-M$\x121\xea\xea\xea\x98S\xbe\xfe\xf5\xafo\xd9\xb2\
-E?2\x8c3+L\xcc\xe2g\x85\xccRdXV\
-\xaa\x06\xe9C%r\xf2q\x8b\xfb\x12\xee\xb9s\xe7\xfe\
-\xf2\x97\xbf\xfc\xeaW\xbf\xda\xb7o\xdf\xe0\xe0`\xa1\xb3\
-G\x22\x91q\xc0\x22=w\xee\xdc\xef}\xef{o\xbf\
-\xfd\xf6\xf2\xe5\xcb\x092P\xe2e\xce\x95\xfd\x92\xef\x0c\
-\xf3 g,\xe4\x92\x96\x8b#\xb3\xab\xbc|\xf9\xf2\x9f\
-\xfe\xf4\xa7_\xfc\xe2\x17\x87\x0f\x1f\xbeu\xeb\x96\x19@\
-\x91SdI\x9d\xce\xcaf/\x03\x0d\xe7\xd5\xa7\xb7^\
-\x15)\x0dF\x050\xdb\xa7\xba\x86$JB\xb7\x8e\x8e\
-\x8e\xb5k\xd7\xae[\xb7\x0e\xc1\x8c\x81p\x93-\x0dq\
-gmm\xad\x82N+\xa8\xb2\x1c\xa51\xd0d\xfbn\
-\x22\xa4*4Y\xe3\x81p\xd3\x9e\x80r\xbc{\xf7\xee\
-\xa5K\x97\xf4\xc9\xdb\xee\xdd\xbb\x8f\x1f?\xde\xd7\xd7w\
-\xe7\xce\x1d\xf4\x98\xa9\xe0\xa3a\x0c>\x10\x89<m0\
-\xa7\xb0\xc7e\xa1\xe28s\xe6\xcc\xea\xeajM%\xd9\
-\x09\x05P\x0a\xc9\xe1t \x94\x05\xd9\xac\x14\x18\xb8X\
-\xf4K\x16\xad\x13'N\x10\x89\xfe\xfa\xd7\xbf>v\xec\
-X\x5cT\x22\x91\xf2B\x18\x91\xfa6=\x11\x83\xb2\xcc\
-aM\x08\xb1\xe5<LB\xca\xcd9\x02\x9e\xcb\x1a\xbf\
-c\xc7\x8e\x7f\xfc\xe3\x1f\x9f\x7f\xfe9\x9b\xcc0.\xc9\
-[\x7f!T\xad\x91:\x9dp\xe7L\x22\x8f\x9b7o\
-^\xb8p\xe1\xda\xb5k\xf1\x13\x95\x12\xa1=\x19\x03\x04\
-\x94\x80\xa0\xa7\x89\x96\x05\x0c\x18\x02\xcd\xae\xae\xaeU\xab\
-V\xadX\xb1\xa2\xb5\xb5\x95\xa0SY@nEE\x05\
-\x1a\x85\xa7*h\xc8\xc6'\x1e\x1560$0\x14\x19\
-\x18ZJ\xdc0I\xe2\xd1\xde\xde\xde\x93'O\x1e:\
-t\xe8\xe8\xd1\xa3\xec\x9a\x18\xabh\x08Ro\xdc\xb8\xf1\
-\xc8F\xce\xa3n\x97Hd\xb2\xc0\x9c\xc2\x8c\xb3e\xcb\
-\x96\xef|\xe7;\xabW\xafnnn\xd6\xa4C\x16\xb3\
-\x8c\x1c\xdb\x90><f1}\xaal\x0a7?$\x06\
-L\x19CCC\xecY\x7f\xf9\xcb_\x12\x8c\x9e:u\
-J\x06\x91Hd\x22(\xc2\xd0\x83\x9f\xaa\xaa\xaa\xc5\x8b\
-\x17\xe3\xe3\xdf\xfa\xd6\xb7\x16-Z\xa4`\x14W\x0d\xbd\
-8\x94\x0d9\xa9\x8e&d-\xa5g\xed\xbf}\xfb\xf6\
-\x993gX\xef\x09\x10\x89T\xd8\xd9rT\x963\x9c\
-\x10\x9c7\xbc\x1e\x8e\xa0\xcfUv\xee\xdc\xb9o\xdf>\
-b\x0b\x92\xf1)i^\xe8\x08\xa0\xdf\xa1\xb2\xb2\xb2\xb3\
-\xb3s\xdd\xbau\x0a4Y\x05\x18-\xeaV\x1d\xedc\
-\xee\x8e\x8e\x8e\x96\x96\x16\xfa\x91R\xb46\xb9f\x86\xc6\
-\x92)\xf2*\x1f6\x5c\x9e\x97rcC!\xa9d\x94\
-\x0c\x8c\xc1\xc1A6-W\xaf^%\x12e\x88\xb2\xdc\
-\xec\xd9\xb3\x87\x91\xf3\xc8\xde\x0d{\x0c\xed\x12\x89<\xf9\
-0\x07\xb13&\x06}\xfd\xf5\xd77n\xdc8w\xee\
-\x5c\xfb\xeb,\xc5g\xf3p\xae\x19\xdf\xbcc\x13\x04\x93\
-E\xf8\xa3N\xacd2\x88D\x22\xe3\x83\xd0\xb3\xa9\xa9\
-\x09_\xc67\x07\x06\x06XeI\xaeY\xb3\xe6\xeb_\
-\xff:n>{\xf6l\xe2\x0c\xb2\x80x\xc2\x97)\x0d\
-\xf9,\x05\x95\x0c1w\xe6\x8c\xac\xf7L L/\x04\
-1\xca-;n\xfeH\xceH\xf4I$\xb1\xcbq\xfa\
-\xf4i\xe2QB\x8d\x1b7n\x0c\x0f\x0f\xcb2B/\
-3\x18\x08:g\xcc\x98A\x8f\xd0/\xf5\xf5\xf5\xcc\xf6\
-\xcf>\xfb\xec\xf2\xe5\xcb\x895\xed\xa9\xa7\xec\x11\x14h\
-\xb2\x16`\x0c\xfa ^\x0d\x8e\xde\x04H\x0a\x8c$\xaf\
-\xf2\x11\xe0FDra\x06I\x06\xa4\xd62]-2\
-\x03\xe3\xce\x9d;8\x05\xc7\x8b\x17/\xb2\x8dy\xf7\xdd\
-w\xf7\xee\xdd\x8b\xfc\x08\xc6\xcc\xe3i\x9aH\xe4I\x86\
-\x09\x88\xe9i\xe5\xca\x95\x9b6mz\xe9\xa5\x97\x16-\
-Zd\x8fE!\xf4\xea\x94\x87\x03\x06^r\xa4\x92\xa5\
-@\x9d:\x0b\x93\xc2\xd0\xd0\xd0\xc1\x83\x07\xf5s\xf7g\
-\xcf\x9e\xf5\x16\x91H$\x80\xc8@\x8f\xafXP\x01!\
-\xf5hJ\xb2^\xf5[\xb2dIww7+\xf1\xf9\
-\xf3\xe7\xd9\xec\xe1\xe9\xeb\xd6\xad\xdb\xb0a\x83\xdc\x5c1\
-(\xc6\xaaA\xc5\xcb\x05'e\x99\xe7\x0a\xf5\x1c\x0eM\
-v\x02\x19\x07\xaa\x84\xabE\xa0r)%(\xaa`\x1f\
-KT\xca\x91\xc0b\xff\xfe\xfd\x97/_\x9e\xf2\xf1(\
-\xad\xc1\x8cm\xbd\xc9Q\xf3\xaa\xcbL@\xa6\x17\xf4\x81\
-;\xbb\x11F\x05\xf1(#\xa4\xc6\xfd\xe4\xe7\xacY\xb3\
-8*\xd6\xb4R\xd4\xa0Q\xa1\xaa\x14\x86\x96\x02\xc6\xe0\
-\x13\x8f\x03.\x18$p\xe4.\x10\x18!N\xedG\xa0\
-dE\xa8p\xeb\xd6-V\x1c\xe2\xd1\x7f\xfe\xf3\x9f\xbb\
-w\xeff\x1b\xc3\x98aI\x22K\xf6e\xe7q6P\
-$\xf2\x04\xc2\x14\xc3\x9a\xb4l\xd92\x22\xd1\xaf~\xf5\
-\xab\xfa\xde\x12\xd3\x16\xb3\x89f\x22C\xf6\xa13K0\
-\xcc,\x9b\x05VC\x96dVp\xf3\xc2\xc0\xc0\xc0\x81\
-\x03\x07~\xfe\xf3\x9f\xff\xe1\x0f\x7f\x88\xc1h$\x92\x02\
-'\xaa\xab\xab#\x8c\xd0\x0f\x00\x13\x5c\xb2\x88\xe2\xc2\x0d\
-\x0d\x0d\xd5\xd5\xd5\x8a$\xe4}\xb80\x8e<o\xde\xbc\
-\x15+V\xcc\x9d;\x975\x95`\x14\xffB9\x7f\xfe\
-|\xf4\x0a>\xb4N'~\x1b\xa0sM\x04\xe7\xd0\x09\
-\x92\xa5\x84P\x1e+\x85\xeaI\xc9w\xef\xdeeOK\
-\xb3\x10\x83\xee\xda\xb5k\xeb\xd6\xad{\xf6\xec!BE\
-\xef\x8d\xa6\x1c\xf4;\xa3\xa2\xad\xad\xad\xbe\xbe\x9e\x90\x14\
-M\xd8\x89\x92\xe9\xe8\xaa\xaa*\xb6\x22\x84\xa1k\xd7\xae\
-e\x9eg\x14Q\x10(BT\xca\x80\x91\xb1\x95U\xc3\
-Z\x12\x90C\xa5\xc9a\x17@\xaa\x88\x97\x1e\x15\xa9\x8b\
-1\xd0\xe3\x05:\x82\x94vy\xe8\x193\xa7O\x9f\xde\
-\xb1c\xc7\xf6\xed\xdbO\x9c8\xa1'\xeb7o\xde|\
-H;\x99G\xdd.\x91\xc8\x13\x0e;\xe3\x05\x0b\x16\xbc\
-\xfa\xea\xab[\xb6lY\xb9r%K\x14\x13\x133\x97\
-r\xe5\xab\x1cC\xa7M\x09\x86\x99e\xb3\xc0j0\xc1\
-\xcc4G\xe0\xf3\xac\x1f\xecJ\x7f\xf3\x9b\xdf\xbc\xfb\xee\
-\xbb\x97.]Rn$2\x85\xc1\x1d\xf4L\xcb\xfc\x22\
-/\xe4\x127\x10O\x10J\xaeZ\xb5\x8a#\xd1\xc3\x85\
-\x0b\x17\x081q\xd8\x9e\x9e\x9e\xf6\xf6v\x04\xccp%\
-\x8ez\x0cF\xc01s\xe6L\x8eh\x08\xd1p1\xce\
-E\xe4J\x96\xdc\xdcN\x8a \xd94\x13\x81k\x00[\
-\xf2\x0d\x94^\x1a;aYW}\x92\xe4j\x11t\xcd\
-&p\x9b\xf7\xef\xdf\xbfs\xe7\x0e\x8d\xa3g]D\x18\
-\xb4\xd5C\x8a*\xca\x08]\xcc-p\xf1>\xed\xa0\x9b\
-\xe8\xcd\xd4\x08A\x96\x86#\xfb\x90\x85\x0b\x17>\xfb\xec\
-\xb3\x0c\x03d\x8cCK\x90%]O\xcc\xca8\xe9\xec\
-\xecdH\xb0\x15\xb1\x5c\x81\xac6\x84\xa4}s\x0dN\
-\xd2\x04)MH\xc9`\xc6\x22\x95|\x04$\xd7\x9d\xb9\
-r)!Lj\xdd\x91\x06K=\x0da\xdfr\xee\xdc\
-9\x8e\x04\xa6z\xb2\xfe\x90\xde\x22}\xd4\xed\x12\x89<\
-\xc9\xe0\x81\xcd\xcd\xcd\xeb\xd7\xaf\xff\xeew\xbf\xfb\xca+\
-\xaf0I\xb1\xdae\xe72%C\xc7\xb6\xa3\x11\xda\xa4\
-\xb2\x84\x15\x0fm8*\xc9\xfc\xcb\x1e\x14\xe7g\xe5 \
-\x12=t\xe8\xd0`\xfc\xb9\xfb\xc8T\x87\xe0\xa3\xbe\xbe\
-\x1e\x1f$J0\xbf\xe3\x98u.b\x05}\xeby\xe9\
-\xd2\xa5\xeb\xd6\xad\x9b;w.\xb1\x05\xcb$1\x16\xc2\
-\x9c9sf\xcd\x9a\x85\xf3RP>\x05\xc9S\xafg\
-\x9e!\xe6P\xb0K=Z}Q*\xb8Q\xcd\xee\x0c\
-\x09\x92C\xcd\xb8\xd1e\xa4\x16{\xe9M\xb6\xa4\x91J\
-B\xeabB\x03E\xba\xba\x0ba\x95\x03\xf3\x09\x06\xfa\
-\x12\xd5\xb6m\xdb\x98Uv\xed\xda\xa5\xe7\xa3\xd9\xb3<\
-v\xb8`E\x8a\x1a\x06\xfd\xfd\xfd\xcc~\xbaT\x92\x1a\
-!\xec\x1f\xe88,e\x8f^=\x0bMMM\xcb\x96\
--c\x1a'\x18\xc5\xd8\xda\x043j\xe0\x08$\xd1\xab\
-\x94=\x075l0X\xe3\xa8H\xb6\xad\xa4\xc9Z\x16\
-\xa2x\xee\xc3\x80\x0b\xcb^\x9bF\x8b\x81\x01\x1aA\x12\
-3Y~\xf9\xc5\x97w\x87i\xf8\xe4\xe1:\x9e\xc5N\
-FO\xd6q\xb4\xb2\xefd\x1eu\xbbD\x22O2\xcc\
-J,c[\xb6l\xf9\xde\xf7\xbe\xb7v\xed\xda\xc6\xc6\
-F&\xa9p~7\xcc]\x85y\xbbQ<W\xc8F\
-G\xd9\xe8\xa8w\xcb\xce\x9f?\xff\x97\xbf\xfc\xe5\xb7\xbf\
-\xfd\xed\xa7\x9f~J`\x8a>\x12\x992(\x04\xe4\xe8\
-\xd3\xb9OW\x17.\x5c\xb8z\xf5j\x82KB\xc9\xc4\
-\xc7\x1c\xde\x22\x07\x1a\xbc\x92\xb0\xa3\xa1\xa1a\xe6\xcc\x99\
-\x1d\x1d\x1drUVM\x1c\x87\xac\xea\xeaj=\x16\x85\
-\xd0\xfb\xc8\xd2\x19\xe5\xd4,\xbd\xe4J)cp\x86\x09\
-\xa1<q8\x91-\xf6!:Kx\x91`\xc9Po\
-\xd7cB\xaaTH\xde\x1a8\xfb\xad[\xb7\xf4\xf2\xe8\
-G\x1f}Dlq\xee\xdc9\x22T=:\xf5F\x8f\
-\x15:\x11\x08\x10g\xcc\x98\xb1|\xf9rbJz\xf9\
-\xf4\xe9\xd3\xcc\x81\x04CL\x8ct\xf4\xe2\xc5\x8bW\xad\
-Z\xa5\xcd\x06M\x01\xeaA\x0ar\xa4,\xa3\x88!\xa1\
-?\xbcI\x92\x5c5\x82\xb5\x9b\x09@\xae\xf0\xe9\x09\x90\
-:\xcb\x93\x0c\x97\x9a\x87/\x93\x7fd\x904k\xeeF\
-h\xf6{\xf7\xee1rX\x92\xd8\xc3\xfc\xe3\x1f\xff\xd8\
-\xb1cG\xd9\xe3\xd1I\xd0j\x91\xc8\xa3\x81i\x8b)\
-\x8c\x18\xf4\xf5\xd7_\xdf\xb4i\x13\xbbj&;&)\
-|\x12?\xf5F\x8e\xd0QE\xca\x00\xcc@Y\xd9\x1a\
-\xec\x18\x223\x9c\x9c\xe8\xf3\xd0\xa1C\xbf\xfa\xd5\xaf\xfe\
-\xf4\xa7?1\x17g\xeb\x8fD&/\xc4\x0d\xc4\x91-\
-\xee\xb7\xc1\x15\x07p$|\xd4OX<\xff\xfc\xf3\xf3\
-\xe7\xcf\xafq\x7f&^#\x1fA\xce\x92JR\x0a\xb7\
-\xc5O\x09YH\x02\xf1\x166\xe4\xaaZ\x04\x92*\xa5\
-\xa4\xf4)P\x82\xea\xd4\xb1\xecp\x0d.\x16M\x07\xa3\
-y\x09\xaf\xd9\x84\xd4\xe5\x85\xd7\x9956\xb2\x1aE\x15\
-\xfb\xf7\xef\xdf\xbd{\xf7\xd1\xa3G\x91/^\xbcx\xfd\
-\xfauByo\xf18\xe0v\xe8\xca\xe6\xe6\xe6\xd6\xd6\
-V\x8e]]]\xeb\xd7\xaf_\xb3f\x0d\xca\xcf?\xff\
-\x9c\xb8\xf9\xd8\xb1c\xec4\x98\xa2\xd7\xad[\xf7\xec\xb3\
-\xcf\x12\x8c\x92E)A\x18\xaa\x1e\xe4\xc8\xe8b,\x81\
-)\xc3F \xe9\xa5\x1c\xd8x\xe9\xa9\x81\x06)\x84\xb7\
-\x08\xc6\x1bJ\xb9\x15\xed\xcfb\xf4\xfe\xfb\xef\xff\xedo\
-\x7f\xfb\xe4\x93Oz{{K\x1c\xcf\xa5\x90\xee\x95H\
-\xe4\xe9\x84y\x8d\x85\x90i\xee\xd5W_}\xf1\xc5\x17\
-Y\x0b\xeb\xeb\xeb\x99\xd4|v\x06\x5cT\xbe*B\x1f\
-\x0e\x91>on\xaa\x06\xe3\xfe\xfd\xfb\x03\x03\x03\xf8<\
-\xde\xfe\xfb\xdf\xff~\xdb\xb6m}}}>/\x12y\
-\x82a\xed\xb7\xe5\xdf\xab\xf2\x81\x0d\xce\xa5/\x8etv\
-v\x124`O)|\x90\x08u\xb6C\xdf\x1aT\x94\
-P\xc4\xb9TPx\xad\xc3. \xeb\x80y\xafM5\
-(+\xaf\xc1\xc4\xe1\x1a\x5c,:\x86`\x14|:G\
-\xea\x0aM\x90e\xd6^\xa8q\xc8\xe5\xecI\xa5.\xaa\
-\xb8|\xf9\xf29\x07S\xcd>\xc7\xe3\xfa\xd4\x9e\xbb`\
-/\xc10 \xd0$\xfa\x5c\xb9r%\xa3b\xe6\xcc\x99\
-===\x1c\x19-L\x80\x5c'\x17|\xef\xde=\x8d\
-\x10\xf4\xb6\x8d\xa1x\x8846\x0e\xa5\x91RB\x044\
-\x0cRH/\x03Cm\x08\xc8_\xb8?\xa3p\xfc\xf8\
-\xf1w\xdey\xe7\xd7\xbf\xfe\xf5\xc1\x83\x07\x19H2\x9b\
-8\xb1{\x22\x91\xe49\x0d\xdb\xf1U\xabV\xe9WE\
-\x17.\x5c\xc8b\xc9t&\x0f\x84\x94\x8b\x9as\x1a\xce\
-\x97\xf3O\xe2\x85\xf4\x90\xaa\x84$\xc6\xc3\xc3\xc3\x17.\
-\x5c\xd8\xb1c\x07\xbb\xcf\xf7\xde{\xef\xec\xd9\xb3%.\
-`\x91\xc8\xe3\x82\xa1K(\x89\xd7\x10+\xd4\xb8\xbf[\
-\x93xH\xc6}\xa4$\xec \x98x\xfe\xf9\xe7\xd9\xf5\
-\xe9\xf9\x16\xf6\xca%(\xa9rX\x9c\xc1Q\xc5%\x1b\
-(\x05zsU\x92\xca\xfd\xca\x7f\xf8\x0a\x8b\x9b\x92\xa6\
-4R\x1a\xcar:\xc5.JJ_^8\xa9\x8bE\
-'\x14\x8cBx\x91\xe1\xa5\x16\xb27\xcc\x80R\x5c\x06\
-\xf3\xcc\xed\xdb\xb7\x87\x86\x86\xf4-\xc9\xad[\xb7\xee\xdd\
-\xbb\x97\x99\x07\xa5\xec\x1f\x19\x0c\x1b\xc2P\x86\xc4\xa2E\
-\x8b^~\xf9\xe5\xd5\xabW#k\x18\xe8\xd9\xa7^[\
-\xd2\xef\x0a1W\xa3d\x9c\xd8\x08\x11&\xbb*\xbdl\
-\x0d\x22\xbd\x8e\x11\xd0`0\xa4\xb1,\x09\x8655\xed\
-OG\x5c\xbdz\xf5\xe3\x8f?\xfe\xf9\xcf\x7f\xfe\xe1\x87\
-\x1f^\xbbv-k?>b\xdfD\x9ev\xf01f\
-\xc3\x15+V\xbc\xf1\xc6\x1b\xaf\xbe\xfa\xea\xe2\xc5\x8b\x9b\
-\x9b\x9b\x8b<\x135ljK\xbc9p\xc8q8\xa7\
-\xcd\x95x\xfb\xad[\xb7\x8e\x1e=\xfa\x87?\xfc\xe1w\
-\xbf\xfb\xdd\x81\x03\x07\x9e\x90w\xb9\x22O9\x0cNb\
->E\x8d!\xe8\x81\xe0\xa0\xad\xad\x8d]\xdc\x82\x05\x0b\
-\x88$\xf4\xb0Sx;\x87\x0b\xf9\x92w=q\xb1y\
-\xf3\xe6\x85o\xc2\xc8\x00AgA\xc0\x8f\xec\xa8,\xd9\
-\x188K\xca\xd7\xccRXn\xca,[J\x17\x86\xa0\
-\xa4\xf4\xe5\x85\x93r\xc1\xe0\xd3E\xc1X\xf8t@x\
-\x91v\xa9\xb2\xcck\x9f\x82\x22\xc0e\x10\xe1\xe9H\xf4\
-y\xee\xdc\xb9]\xbbv\xb1\xf5e\x0f\x8c\x5c\xc6\xc7]\
-\xa3\xc2P!\xfa\xdc\xb0a\x03\x83\x87!1\x7f\xfe|\
-\xc6\x8f\xbe\x02\xafa\xa0\xab\xe5\xd6t$i\x9d%\x0d\
-\x958+\xdf \x12\xc2\x06IeE\x80\x961L\x13\
-\x0aj\xabP\xe6H\x92-\xc1\x8d\x1b7\xb6o\xdf\xfe\
-\xe3\x1f\xff\x98\x0dL\x19?\xa9\x8f}\x13y\xdaa^\
-c\x1d\xdd\xb8q\xe3\xdbo\xbf\xbd~\xfd\xfa\xd6\xd6V\
--\x90\xca\x95\x07J.\x026\xa1Y\xb6H\xf1y\x90\
-\x5c\xd0\xda000\xb0\x7f\xff\xfe_\xfe\xf2\x97\x7f\xfe\
-\xf3\x9f\xe3\x9f\x00\x8d<\x0908\x89\x0f\x88 \xd9\xb6\
-\x11J\x92\xf4\x19\x0e4\x0d\x0d\x0d\xdd\xdd\xdd\xec\xe8\x96\
--[\xd6\xd9\xd9\x891z7\xa8\xfd2\x16\x1e\x092\
-***jjjd&%\xc8\x89L6\xbdl\xb2\
-\xe0/\xe1B\xa8R*\x22\xffU%B\xb9\x92C=\
-\xc8\x1e\x10\x94\x94\xbe\xbcp\xd2\xd4\x05\x17\x01c]\xa4\
-\x8eF\xea\x0aM(b,\x81,\x9d\xdaZ\x86\xa4\xd9\
-\x13\x8f\x9e={\x96H\xf4\x9f\xff\xfc\xe7\xce\x9d;\xcf\
-\x9f?\xff\xc8\x9e\x8fvttl\xd9\xb2\xe5\xdb\xdf\xfe\
-\xf6\xca\x95+\xdb\xdb\xdb\x19`\x8c\x0d\xf5\x85]\xaa\xae\
-\xdf\xae\x96$(+L\x86(+[Dd\xed\x9f6\
-\xd42\x1a\x12\xd6J&\x08Z)\xd5\x8c\x08\x04\xa3}\
-}}\x04\xa3?\xfd\xe9O\x09F\xaf^\xbdZ\xe2\x90\
-\x1e\x95\xa7\xbdK\x22\x11\xb6\xe6]]]o\xbc\xf1\xc6\
-\xf7\xbf\xff}\xf6\xe8\xcc\x86\xf6\xb2Z8ge=6\
-\xcc5\x87Ly\xaf\xc0R\xc6\x1cSY\xa0\x5c\xf4T\
-r\xf7\xee]\xdc{\xd7\xae]\xbf\xf9\xcdop\xf5\x8b\
-\x17/z\xa3H\xe4Q\xc1h\xc4\x058J\x06\xb6g\
-\xf8\x08\xe1BOOO]]\x9db\x05\x90=\xc6\xb5\
-\xb5\xb5D\x12\xb3g\xcf\xd6/\x8d\xeb\x83\x05\x19pL\
-y\x13\x82{\xfa\xe9\x1f\xb2\x9aG \x80\x95\x92\xd2\xc8\
-jd\xef\x13#\x0d\x90\xc3,P\xae\x94\xae\x9c\xcfE\
-\xcf\xe5\x85w\xa4c\xd9\xe1\x8c8\xb8M\x14E\xe0\x02\
-d\xacdx\xa9&H\xb6,\x11&\xcd\x18\xd0\x1b\xba\
-S\x94V\x83\xaejhh\xe8\xcc\x993{\xf6\xecy\
-\xf7\xddw\x095\x88G\x1f\xcd\xf3Q\xc6\xcc\x9bo\xbe\
-\xf9\xf6\xdbo\xafZ\xb5jF\xf3\x8c\x8aJ\xff\xce\x86\
-\xe0\xf2\xbc\xe4H\xddTx#Y\xc2\xb2)\x9bBE\
-\x9e*h\x1f!9u\x04Z\x09\x12\x8b\x9c\x86qb\
-OF\x7f\xf6\xb3\x9f\x95\xf7\xc9h\xfa3\x97H\xe4\xa9\
-Bo\xcd/_\xbe|\xfd\xfa\xf5+V\xachmm\
-\xd5\x83\x1f\x9b\xb2\x0d\xe7\x98\xa5Nafin\x5c\x08\
-[\x05q\xe9/\xdc\x1f\xa3?~\xfc\xf8\x8e\x1d;X\
-\x15.\x5c\xb8\xf0x\xbf\xdf\x1ay\xda`\x1c\xe2\x11M\
-MM8\x05a%\xee\x00\xc8\x0b\x16,x\xf6\xd9g\
-7m\xda\xb4a\xc3\x06B\xd2e\xcb\x96-\x09X\xbc\
-x\xf1\xa2E\x8b\xf4u\x13=\xd9\x22\x18\xc5\x8f\x88*\
-\x10\x84dF;\x02G\x0d{\xce(\x07\xe1H\xd2\x94\
- \x81\xa3!}\xca\xa1B\xbd\xb2L\x93Bz\x1d\xc3\
-J\xd0\x84H\xa3\xac\xb2c\x17\x99\xba\x00/\xe5.\xc6\
-'rH\x09\x96\x94P\x88\xd0XXR\x82\xce\xee\xac\
-\x92\xa4\x04\xfa\xab\xa6\xa6\x86M\x05\xddD\x18\xcaDt\
-\xfb\xf6\xedG\xf0\x8ePCC\x03\xe3\x87\xb9\xd7>\x9d\
-G\xc9HP\xae\xae\xcd\x90\x12\xec\x16\x94\x0c\xb3\x9ca\
-BJ\x0e\xc9j\x9e@R\x83$L\x1av#\x85F\
-\xd4\xa8\xe4\xadAd\xeb\xc1\x86uJ\xefu\x1c<x\
-\x90\xdd\xcb\xad[\xb7\xf2^\xd88\x88\xc1h\xe4\xe9\x85\
-uw\xd6\xacYk\xd7\xaee\x95}\xfe\xf9\xe7\xbb\xbb\
-\xbb\xf5\xdd\x0b\xb2\xe4\x87YoLi\xf2:\xb0\xf0\xe9\
-\x1cX\x9a\xb1rI\x86\x968\xf9\xb0\xfb\x93Kl:\
-\xd9q\x1e:t\xe8\xe6\xcd\x9bV$\x12y\xd80\x14\
-\x19\xff]]]\xeb\xd6\xad{\xe1\x85\x178\xae^\xbd\
-\x9a\xd0s\xd5\xaaU\xc8\xcf=\xf7\x1c{\xb69s\xe6\
-\xb4\xb4\xb44\xe6 \x92 \xfa\x84\xba\xba:}\xddD\
-q\xa7\xc2\xcaTH!\xc1\xb2L#!\x94C\x8d\x84\
-\xb1\x92*\x98M\x16B\xb92+;y\xdd\xd9N\x97\
-=orA\x19e2\x8f\xe4\x90&ecIW:\
-!\x954P\xaa\x12dz\x84\xbe\xa3\x13\x89G\xe9G\
-\xe6\xa2\x81\x81\x81G\x10\x8f2x\x16.\x5c\xb8t\xe9\
-R\xf6<\x04\xa3\x0c\x1e]\x98\xe0\xf2,\x99\x5cq\x01\
-d ,\xa9,CJ\x91J>\xf9\x84\x17l\xfd^\
-\x88\xd2\xef.\xaf\xa5)\xb3\x02\xa7f\x9d\x22\x00\xbdp\
-\xe1\x02\xc1\xe8\xe9\xd3\xa7c0\x1a\x89L\x14\x22\xd1\xce\
-\xceN=\xefy\xf1\xc5\x17\x99\x10YY\x99\x8eC\x0f\
-49EV/cC\x1ae\x85(\x17|:\xb7\xb4\
-\xe8\xb1\xa8\xde\xdc\xda\xb6m\xdb\xae]\xbb.]\xba\x14\
-\xbf\xba\x14y\x94\x10\x82\xf4\xf4\xf4\xac_\xbf~\xf3\xe6\
-\xcdx\xc4\x9a5k\xf4\x0e\xe8\xe2\xc5\x8b\x17,X\xc0\
-V\xad\xb5\xb5\x95h\x15\xb3\xe9\xd3\xa7+\xe8\x14\xc8\x84\
-2\xc2\xc6\xb6\x047\xd8G\xb8\x83\x09!y\x95)J\
-\xb1\x81\xd4\xe9B,+\x85\x94\xbax%\x1f*\xa9\xc5\
-['\x05\x9f\xce\xe1\xb5#\xafYY\xaaAIS\x1a\
-\xa6\x09\xbb#\x85\xf4\xe1\x95\xa0\x01\xba\x92`\x94\xad\x05\
-\xc2\xbd{\xf7\x86\x86\x86\x1ev<\xca\xe9\x18Z\xf3\xe6\
-\xcdkkkcN\xd6\x07S\xa0kK\xddi)$\
-\x95\xe6\xc3g;\xbc\xea\x09 5\x18\x0a\x91\xbal+\
-\x85 \x94\x84\x94e\x11\x8a\x98\x85\x95H0\x0d\xeb\x14\
-\x1b\x95\x8b\x17/\x1e:t\x88`\x94\x11\x12\x9e}\x22\
-\xc4`4\xf24\xc2\x82\xcaF|\xdd\xbau[\xb6l\
-a\xf5e*d\x83\xce\xb2j.\xa7\xe3\xa8\xc8\x1e|\
-:G\xa81\xd9\x19&X\x92\xd5B\x9e\xcc\x91\xa9\x7f\
-``\xe0\xf8\xf1\xe3D\xa2\xc7\x8e\x1d\x8b\x7fr)\xf2\
-(a4655m\xd8\xb0\x01\x8fx\xe1\x85\x17\xf0\
-\x88\xf6\xf6\xf6\x19\x0e\xf4\xfa\xc1&=\xf8\x0c\x836\x09\
-hB\xa5P\xd20\xa5\x04\xa3\xf4\x95Le]e#\
-\xb0\x5c\xa1d\x8aP\x9f\xd7\xc6\x15M\xf0\xe9\x87\x8f?\
-\x9f;\xa3\x8e%\x92\xb7\xc5\xc2\x1aL.Rm6\x0b\
-\x8d\xa0\x97\xab\xab\xab\xf5\xa8[\x93\x12\x01\x07!\x88\xb7\
-+7\xcc\xba\xcd\xcd\xcd3g\xced\x98\x11\x98rR\
-\x9b\x87A6\x12B\xcdS\x02}]\xe8\x96\xc9\x0a\x91\
-RM\x04J\x8e\x89QK\xf93\xb9\xa5\xea\xca\x95+\
-G\x8e\x1c9u\xea\xd4\xe0\xe0 \x1ao11b0\
-\x1ay\xea`\xb6e\x17\xber\xe5J=\x13\x9d;w\
-\xae\x22Q\xb2\xe4\x90r9g[\xd0E\xf3\xeaQ\x0a\
-K\x9a \xd9\x04\xd0)X\xc5\x95\xbc{\xf7\xee\xf9\xf3\
-\xe7\xf7\xed\xdb\xb7{\xf7\xee\xb3g\xcf\xc6\xb7E#\x8f\
-\x92\xe9\xd3\xa7wvv\xbe\xf2\xca+/\xbd\xf4\x12\x1e\
-A\xf4\xa9\xd0S\x0fAA!\x02\x96\xe1\x18\x16\xa9\xa4\
-(I9\x96U,o\x85\x82,\xc3\xabF#e\xa9\
-\xb2\xe0\xd3\x0f\x81\x22\x95\x97~^\x9b\x97\x8cT\xd9\xe4\
-\x1er\x9a0+\x94A\xc9\xc44\x87\xe9\x81\xee\xd6\xfb\
-\xa3\xccN\xb7n\xddbc\x5c\xc6\x98#\x05a.C\
-\x8bs\xe9\x05e\x04\xce\xae,\xbb*\xd0\x85\x81OO\
-\x15\x8a\xdcQ\xb2\x08\x15 \x95\xab\x96\x09Q\x0d\xa5\x10\
-\x1a\x17*\xcb)\xbc\xe4\xb8\x7f\xff>C\x82E\xea\xcc\
-\x993\x08\xe5\xda\xa8\xc4`4\xf2t\xc1\xe2J$\xba\
-f\xcd\x9a\xcd\x9b7\xbf\xfc\xf2\xcb\x0b\x16,ht\x7f\
-\xd5Z~\x08\xd8\x98{\xabH\x16eemL\x13\xea\
-\xa5L\x81\xde<\x1c\x01\x7f\x1e\x18\x18`\xaf\xb9}\xfb\
-\xf6\xfd\xfb\xf7\xf7\xf6\xf6>\xbcG\x11\x91H\x16\x5c`\
-\xe6\xcc\x99\xeb\xd6\xadc\x93\xd6\xd2\xd2RYY\x99}\
-\xd8\x19\x22}q\x83,>o\x5cP<\xb5(f\x19\
-\xd5\x00\xc2\xcb\x90\xcc\xb1\xf8\xcd\x96\x8bB\xf5\x97~\xde\
-\xec\x0d\xa6\xca&\xf7\x90\xd3\xa4\x04\x97S\x90\xb0fZ\
-\x83y\x92\xdd\x08\xc3\x80\x89\xe8\xfa\xf5\xebW\xaf^\x1d\
-.\xeb\x1f\x227\xbet_\xd0F\xa8\xaf\xaf\x9f1c\
-F]]]8\xf6@f>1\xf2f\xa7\x00\xc5G\
-,\x8d\x83\x81\x8e\xb2\xd4Q\x82\xc9\xe0['\x87\xd7\x8e\
-\x86,\x8b\xd8\xa7\xb2\x92\xaa\xddwm\xd9\xa2\x5c\xbe|\
-\xf9\xfc\xf9\xf3\xd7\xae]+\xd7\xc0\xf0Oe\x22\x91\xa7\
-\x01E\xa2,\xb7\x1b7n|\xf9\xe5W\xf4\x9e(\xfb\
-r\x9b\xfb\xe4\xdeJ\xaa\xc8\xa8\x14\xb7t\xb5\x8e\xc0g\
-\x04\x059){\xcd\xfe\xfe\xfes\xe7\xce\x9d:u\xaa\
-\xaf\xafO\xb3s$\xf2\xc8\xd0\xe0d\xe4\x834\xa1\x0c\
-n\xed\xf3H\xa3\x22\xa0\xe4x\x18KQ\x9dW\x17\x10\
-\xa2\x5c\xe1U#\x95O2c\xbd\xd4\xb16\xb8\xd5\xaf\
-\x82\x86\x94 9u\x19(\xe9\xfa\xda\xda\xda\xd9\xb3g\
-/^\xbcx\xee\xdc\xb9\xec\xd8\xc3R\xe5E?!\xb2\
-m\xdb\xb6\x8f?\xfe\x18\x81\x99\x90\x088u\xe5\x92'\
-/\xdcN^\x94Ex\x97\x17e\x99\x01\xcd\xa2$\xa8\
-Z1\x91\xf6QY\xd7\xc6\x09\xa1\x0c\xce\xc4c\xe7e\
-\xc5d\xc3P]]\xcd\xd1\x1ecO\x9c\x18\x8cF\x9e\
-\x16p\x1b{&\xfa\xe2\x8b/.X0_\x91(Y\
-\xf219\x9b\x90\xf3#\xb8\xa2y\xf0\xce\x9a\xf3^)\
-AE\x5c\x1d#\x043\x0eAC.'\x1a\x1a\x1ab\
-\x97y\xf2\xe4\xc9\x8b\x17/\x96\xf1\xfb\x89\x91\xc8\x98 \
-\x04\x09\xf7f)\xbc\x91\xc3\x8dk\x8fW\x8d\x05\xabM\
-5\x97\x02\xc6\xfe|#\xddS\xc7P(N\x89f\xe5\
-\x85\x93\x0a\x9fv\xa4\x92\xa5\xe3[\xc4\xe1UcD\x17\
-\x13\xe23r\x953\x06\x980\x098\x98$\xeb\xeb\xeb\
-\xab\xaa\xaa\xc6}\xaeQ\xd1\xc3\xd7\xfd\xfb\xf7\xbf\xfb\xee\
-\xbb\x1f}\xf4\x11\xf1\xa8>\xfc\xd5U\xa5.o\x8a\xa1\
-\xbb\xd3xN\xa1,\xe1\xadGb=%\xc1k\xc7\x8e\
-\xca\x16\xaf\xc4\xae\xc1\x84\xe1\xe1a\x96*\xbaI\xc9\x89\
-\x13\x83\xd1\xc8S\x81\x9e\x89\xaeX\xb1b\xd3\xa6M\x1b\
-7n\x5c\xb2d\x89>\x9dW\xae9Xq\x87\x1c+\
-\xa9I$U\xb9dlp\xe9\xb3g\xcf~\xfa\xe9\xa7\
-\x07\x0f\x1e\xbcz\xf5j|[4\xf2\xb8`L\xb2\xb6\
-\xf9\x84#\x1c\xb1E`\x18\x87xm\xc9\x0e\xe5\x8be\
-\x0a\x82\x92a\x96\xc9\xaeD\x22\x9b\x10beA\x06!\
->\xc3\xe1U\x0e\xafz8\xf8s\xe4\x08\x95\xd9\xdc\xbc\
-\xa8H\x89\xa4\xec\xd5\x9e\xe0\xd3\x0e\xd9\x9824\x90<\
-\xf1X\xa7\x14\xee\xdf\xbf\xcf\xd4G<\xbau\xeb\xd6\x0f\
->\xf8 |>\xaa\xb3\x837}\xdc$\xddP\x02y\
-\x8d}\x98\x19 \xa5r\x85\xf4\x80L\x0dEn<l\
-\x96P\x1e\x07a=\x12\x84\xae!\xc4]cr\x91\xac\
-S\xfa\xa5\x85\xac\xcd\xf8\x88\xc1hd\xea\xa3g\xa2k\
-\xd7\xae}\xed\xb5\xd7\xdc3\xd1\x05MMM\x84\xa7\xce\
-\x7f\x1f\xf8^*Y\x88Rl@\xb5\x81O;\xcco\
--\x8b\x09w``\xe0\xe8\xd1\xa3\x9f|\xf2\xc9\x91#\
-G\xfa\xfa\xfa\xca\xb8\xd7\x8cD\xc6\x84[h\x92!*\
-\x01\x90\x19\xa8\x92m\xd0\x86(\x0b|\xda\x11&SY\
-\xc2\x94I\xc9\x91\xc6arT\x8a\xd8\x8f\xa9\x1ec|\
-\xa5J\xc7]\xef\x08L\x9f7\x17d`\xa8\x17\xc0\xa7\
-3d\x8bd\xc9\x16\xcf\xd6I\xc0A\xa8q\xe7\xce\x1d\
-\xc2\x0e\x04\xaf}hp\x8a\xde\xde\xde\xbd{\xf7\x12\x8f\
-\xee\xd9\xb3\x87\xd8\xf4\xde\xbd{\xba\x17]X\xea\xf2\x9e\
-L\x5c\x8f\xa5q\xb1\xa5\xff\x90\xdd\xb0,_2\x03\xb9\
-v\xe3Yd`\xa8BWnB\xe4\xad\x1c\x94+0\
-x&\xf7\xf7,d\x5c\x16b0\x1a\x99\xe2\xe00\xad\
-\xad\xad+W\xae\xdc\xbcy\xf3\xc6\x8d\x1b\x17-Zd\
-\xdfX\x92\x9b%\xce\x97\xf1\xa8\xacR\x1a\xc3ks\xa4\
-\x94\x92\xa5\xb4G\x0b\xa1KK\x83\xc0$\xd2\xdf\xdf\x7f\
-\xe6\xcc\x99\x13'N\x5c\xbf~=\xbe-\x1ay,0\
-8\x19\x8a\x0c?@`pj\xdc*K6\xe0\x86m\
-z\xf0\xcb\x80\xa3H)uLa\xca\xc44\x1f\xca\x05\
-\x9f\x0e\x08\xaf!u1\xca\x02\x9f\xce\x91\xd5\xa4\xf0'\
-+|=\x13d\xd4\x0b\xc8\xe2/\xc8\xe1U#q7\
-\x9aFYa\x11\x9f\x11\x5c\x80d\xd3\xd0\xdd@\x11g\
-\x95(\x91\xd1\x0c\x0f\x0f3#\x9d;w\xee\xd2\xa5K\
-\xb7o\xdf.t\x19eD\xf1({r6\xe7\x08\x0c\
-EN\x1a\xe2\xed\x1e!\xfe\xc4\x0e\xaf\x1a\x0d,\xd5\xa4\
-\x10\xca\x10V\x12\xca\xd6\xf2)J<i\x89f\xa3\x92\
-\xf7\x1aR`\xc3\xccPYY\xd9\xd2\xd2\xd2\xd1\xd1Q\
-[[\xabW\xdd&N\x0cF#S\x19\x82N\x1c\xe6\
-\xd9g\x9f}\xfd\xf5\xd7_y%\xf9\xc6RSS\x13\
-J\xb2p`!\xcb\xbc\x94\xe2\x9c\x85Hf\x97\x80P\
-\xa9e\x9eS\xb3W\x1e\x1c\x1c\xbcr\xe5\x0a\xd3}_\
-_\x1f\xb3\x7f\xf1\xeb\x89D\x1e\x1e\x84\x02\xb7\x1cz\x84\
-\xc3P\xd4(\xd5\x98d\xd0\xca,/\xb2\x11&\xbb\xa2\
-\x09\xd9\xa4\x8e\xa3\x22{\xf0\xe9\xc0%\x13Gr\xb2i\
-R\x98\x81P\xd2\x90FY)\xc2\xd3=\x16R\xb7\x0c\
-aR\xb9\x85\xf0F\x01>\xc3\xe1U\xb9\xd6\xb0>U\
-\xae\x02&`\x000\x18\xf478\xf6\xef\xdf\xff\xf9\xe7\
-\x9f\xb3a\x0e\x8b?<8/S\x22A\xf0\xd0\xd0\x10\
-\xc1(W\xf2h\xce[\x0a\xae\x91F\xbf\x18\x99\xf9\xa6\
-\x0c\x90\xde\x1b\x95\x80\xec\x0d\xaf}\xdc0l\x88>\xf5\
-w\xb3V\xaf^=g\xce\x9c\xea\xeaj\x9f71b\
-0\x1a\x99\xb2\xe8=Q\x1cf\xcb\x96-\x1b7n\x5c\
-\xb0`\x01\xdb8|iT\xc7v\x13uBJ\x1e\x1f\
-6\x95X=$\x99\x9b\x98v\x99\xe2\x99\xe8w\xed\xda\
-u\xe4\xc8\x91\x9b7o\xa2q%\x22\x91\xc7\x00\xc3R\
-Q\x88\x22\x00\x0bI\xc1[d\x16H\xf0\x19\xa3\x11Z\
-\x8eZ\xcaU\x9c`\xb2\xf4B~dd5\x22\xafq\
-\x88\x0c\x84\x9d\x22u\xaeGI\xf1S\x8f\xf5\xc2\xb0\xcf\
-\x161\x8dr\xd5\xbf\xa1F2((<\x7f\xfe<\x13\
-\xd4\xe5\xcb\x97\x1f\xe5\x8b\xec\x0c<N\xa7w\x03\xc2K\
-z\xbc\xa8} \x89+sxU\x09\xa8\x92\xd4\xa8\x1b\
-\x13V\xc9\x93@EE\xc5\xacY\xb3\x88G9\x96\xeb\
-\xcbm1\x18\x8dLM\xa6\xb9\xf7D\xf57\x96^|\
-\xf1E\xfd\x8d%\x94_q\xb8\xc5\xe8\x81\xffh\xbe\x00\
-de\x192\x08\x91\xd9\xa8\xa8B\xf0i\x07\xf3\x97\xd6\
-\xfb\xe1\xe1a\xa2\xcf\x93'On\xdb\xb6\xed\xbd\xf7\xde\
-;t\xe8\x90^\xd8\xf7v\x91\xc8\xa3\x85\x81\xca\xe0T\
-$\x8a`J\x09\x90\x1a\xc9F2\xc43YR\x82O\
-\x8f\x8b\xb0\x06\xc9\xde'\x1d\xd2\x87r\x88\xf4\xc2\xabr\
-H\x93\xcd\xd2)|\xe2\x11\x92:o\x91kHY\xe6\
-%e\xa0\x22\x864\x96%\x01\x9055I\x89|\xfb\
-\xf6\xed\xde\xde\xde\x8b\x17/^\xbbv\x0d\xd9\x86\xc4#\
-\x80s\xdd\xb9s\xe7\xd6\xad[\x8cF\x92\xea)!\x83\
-\xb2\xc3]\x17\x22e\xc0\xb5\x01\x0d%7\xc9\x8b\x8a\x84\
-\xf8\xab\x9f\xf0\xf5\xfb\x8b\x08:\xeeQ\xe2\xcf\xed \xc9\
-bJH:}\xfat{\xbe>Ab0\x1a\x99\x82\
-\xe0'---+W\xae|\xf5\xd5W\xf5\xe9|C\
-C\x83\xdcFh^\xe0\x88\xac\x22\xc2<\xcdpsH\
-\x82OO\x00\xab\x84S\x0c\x0d\x0d\x11\x89n\xdf\xbe\xfd\
-\x83\x0f>8p\xe0\x00\xf3~\xb9~:8\x12\x19\x07\
-,\xa2\xfa}\xb13g\xce\x0c\x0c\x0c\xc8\x0b4\xf2\x81\
-$\x06)\xd7HAnq\x83\x89\x13\xd6\xaf\x0b3!\
-\x85lD*\xa9\xeb\x14^\x15\xe03\x1e\xf2\x8dd\xd1\
-\x19\x0b\x9d\xd7]\x91\xc7\xab\x0aS\xc4Lz\xcbUP\
-E\xccw\xef\xde=\xe6\x1fP\x14\xc8>\xf9\xdc\xb9s\
-\x9f}\xf6\x19S\xd3#~,\x0a\x5c\xc6\xf5\xeb\xd7\x19\
-\x8az\x87\xbe\xd0\xbd<\x1a8\xbbF\xbe\x04\x93!\x95\
-\x14*\xa5A\x08\xa1\x0c\xca}\x08<\xbc\x9aG`\xf7\
-\xc8\x8d3H\xae^\xbd\xca\x91>R\xee\x04\x89\x7f\x81\
-)2\xd5 \x12moo_\xb7n\xddk\xaf\xbd\xf6\
-\xf2\xcb/\x13\x89\xd6\xd7\xd7\xa7\x82NQd\x82P\x16\
-\xf8\xf4H\x0a\xe9\x0ds\xda\x10J\xa1d\xf6g\xb1?\
-q\xe2\xc4G\x1f}\xf4\xce;\xef|\xfa\xe9\xa7\x0f\xef\
-\xaf\x9bD\x22%\xc2\xc8dQ!.\xa9\xa8\xa8\xe8\xe8\
-\xe8hnnFH}5\xc19D\xfe\x91\x9f\x1a\xed\
-\xb2\x14^5\x92Bz#\xf1\x9fL\x9dv\x94 \x94\
-,\x84U\x92\xaaMd\x8b\xabN\xe1U\x0f\x9f\xe2\xe7\
-\xca^\xb9./\xc4g\x04\x98\xde\x8a+\xa9\xa3 \x8b\
-\x99gppP\x7f\x80\x9e0\x94#\xe1\x05\x81\xe0\xae\
-]\xbb\xde}\xf7\xdd\xdd\xbbw_\xbcx\xf1\x11\x07\xa3\
-\xcc\x90\x5cdCC\xc3\xacY\xb3\xda\xda\xda\xf4)\xb0\
-\xf0\x16\x0f\x87\xbc#\x04\xa5\x05\x9d^\x150\xeaU\xc9\
- \xc4g8R\xc9RP%\xe0\xd3\x1e\xaf4\xbc\xba\
-\xdc\xa8f:\xa8\xbf\xbf\xff\xe8\xd1\xa3\xdb\xb7og\xfd\
-\xbar\xe5\x0a\x1a\x19L\x84\x18\x8cF\xa6\x14\xd3\xa7O\
-oiiY\xb5j\xd5\x96-[^y\xe5\x95\xf9\xf3\
-\xe7\x13\x89\x86\x1f%\xe0N\xf6d\x94\xf9%\xef\x14\x03\
-\x89C\x17v\xe9BY\xd2[\x9d\xd9\xcaY\xefqc\
-\x22\xd1\x1d;v\xbc\xf7\xde{\xfb\xf6\xed\xbb|\xf9r\
-\x8cD#O\x02D\xa2\x84\x1dx\x07\x1e\xd4\xda\xdaZ\
-SS\xa3`\xd4\xb9B\xb2\x8f\xd2\xf0\x96FBq\xf7\
-\x11\xa1F2\x842(i\xb5\xa5r\x85\x94\xe1\xd1 \
-ix\x95#{y\xd2\xc8,k/\x8d\xe1\xb5\x0f\x9f\
-\xf0\x5c\x5c\xa1]dJ/AzP\xb2\x10El\xa4\
-'\x80 \x0c={\xf6\xec\xc1\x83\x07?\xfb\xec3\x8e\
-\xfa\x1a;G\x22\x8cO>\xf9\x84\xd9\xe9\xc2\x85\x0bw\
-\xee\xdcQ\xa9G\x06w\xca\xc0#\x18\xed\xe9\xe9\xe9\xee\
-\xee\xd6\xa3\x84\x22\xb73n\xacI!i\xf4\xcch\x01\
-\x94\x8aD\x85\x94\xba\x18\x90,\xa5af\x85\xb0\x22\xd9\
-\xb2!\xc9\x09F\x1a(\x99G\xefu\x0f\xf0\x19c$\
-u\xe5J\x86G\x81\xcc*v\xec\xd8\xb1\xbd{\xf7\x96\
-\xf1\xcbm1\x18\x8dL\x1d\xf4\x8d\xa5u\xeb\xd6m\xde\
-\xbcy\xc3\x86\x0d\xfa\x15\xa7\x8a\x8a\x8a\xd0?\x8b8\xaa\
-\xcc\x84W\xe5\x085\xd9\x5c0\x8fu\xa5\xfdw\xa4\xc2\
-\xc7\xb1h\x88D\x99\xfdO\x9f>\xfd\xf1\xc7\x1f\xbf\xf3\
-\xce;\xcc\xf5\xec)c$\x1ayr`\xdd\xe5XW\
-W\xd7\xdc\xdc\xdc\xd4\xd4TUU5-\xf8s\x7f\xb6\
-\xe4\x98`\x84N!\x17\x00\xc9R\x0a\xe9\x019\xac$\
-[a\x16\x95\x0a\x8f\xa0\x82:\x9arTR\x95\x18h\
-\x0c%\xa5/;\x5c\xb0\xaeY\xe8D\xa6\x91\xa0\xa3\xc5\
-a@\xd2K\x8e\xa4\x8a\xdc\x8d\x83\xcd6\xa1R2G\
-\xf7t/\xc1\x99$\x91\xe8\xd0\xd0\x10\x91(A\xe7\xdf\
-\xff\xfe\xf7w\xdf}w\xe7\xce\x9d\xc4\x16LJ\x82P\
-\xa3\xb7\xb7\x97HT5<b*++\x99\xc9\x97-\
-[6\x7f~\xf2w\xf2\xb85\xbb\xbbr\xc1}\x09\xda\
-\xc4\x8e\xa1 \x94\xf4er=eG\x09\x19\xf2(\xc3\
-JByTt\x16!\x0dM!\xf9A=.\x1aU\
-\x139\xc3\xbcWU\xf0\xbc\xa1=\xf7+\xcc\x18!,\
-\xa8\xdc\xdb\xb7o\x9f;w\x8e\xad\x0bC\x88E-4\
-\x1871\x18\x8dL\x11\xec=Q\x22Q}:\xcfj\
-J$\xea\xb3\x1d\xa1\xd7\xa5\xfcGY\x89\x1f;\xa44\
-\xbc\xd6\x11&\x95k8\xb7M@6\x03i\xf4\x1c\xe2\
-\xd4\xa9S\xdb\xb6mw\xcfD\xf7\xc6g\xa2\x91'\x0d\
-\x96\x99\xfb\xf7\xef3n\xeb\xeb\xebg\xce\x9cIH\x8a\
-[\xb1\xc8\xa1\xf7\x16\x81\xa7\xd8Q \x8b\x94\x9cBJ\
-\xf9Hq\xc2\xe2&\xe7\xad\xd3\x08s\xc3S\x98\x8c\x81\
-lBK\xa1,C\x1ae\x95\x85\xb0\xb6\xf0\xda\xdc\xd9\
-|\x16\xfa\xf0R\xf3j\xc04\xe0J\x8f\xd0?\xe3\xfe\
-\xa0+]F\x92\x0d0$U\xe4\xe2Q)\xfb\xfb\xfb\
-\x99\x8b\x08@\xb7n\xdd\xbam\xdb\xb6\x13'N0\x1d\
-]\xcb\xd1\xd7\xd7G\xa8\xaa\xef\x0f=\x16\x98\xb7\x19~\
-\x04\xa3\x8b\x16-R0\x1a\xdef\xd9\xa1MRG\x91\
-=\xa34\xeeZ\xf2\x5c\x8cS&\x07\x97?\xca\xd5\xca\
- kV\xa4`R\xa9\xcb\xb5\x8b$\x196\x8e\x04P\
-n\x89`O\x85\x82\xa4\x8e\x22\x94C\x18B7o\xde\
-\xbcx\xf1\xe2\xa5K\x97\x06\x06\x06\xca2Tb0\x1a\
-\x99\x0aL\x9f>\xbd\xbd\xbd}\xed\xda\xb5\xfa\xc6\x92\xa6\
-\xb0\xf0\xa1\x0e\x98\x8b\x16r\xb0\x22>\x9c\xcd\xca\xab\x81\
-\xc4\xa1s\xf53\xf5\x13\x83\xea\xc8\xe4\xce\xec\xff\xd1G\
-\x1f\xfd\xf3\x9f\xff\xdc\xbbwO|&\x1ay2a\xac\
-\xb2\xb4\xd4\xd4\xd4\xcc\x9a5\xab\xb5\xb5\xb5\xba\xbaZO\
-\x5c\x0c\x8d\xfc\xf0\x98\xa2H\xd6X\xa1\x12a2B^\
-\xff-\x94\x9b\xd78\x8b\xad\xe8@2<\x96\x11U\x98\
-L\x10\x99\xab\xcaj\xccXG\x812\xac\xc4d\xba\x8c\
-#}G\x12\x98s8\x121$?\x1b{\xeb\xd6\xed\
-\xdb\xb7\xef\xba?\xde\xa8$a\xc4\xd9\xb3g\x89D\xdf\
-y\xe7\x9d]\xbbv]\xb8p\x01%\xc6T\x22T\xfc\
-1B0\xca\xd8K\x05\xa3\xe8u,;4]J\xc8\
-K\xf1k\xc8\xea\xd1\x142\x86BY\x85.F\xf6:\
-\x92e\xa8\xb3h\x22\x90\x81l\xb2\x14\xd2\x83\xeaQ\x85\
-^U\x00*\x9110\x90\x18<\xbd\xbd\xbdey\xab\
-8\x06\xa3\x91I\x0c\xeeWYYYWW\xc76z\
-\xf5\xea\xd5\xaf\xbf\xfe\xfa\xc6\x8d\x1b\xe7\xcf\x9f\x8f\xe6\x99\
-g\x9e\xc1m\xe4\x9fB\xaeX\xdc\xd9\xc6\xe4\xc6y\x95\
-nN\xf0S\xa7\x928-{\xc7\xe3\xc7\x8f\x7f\xfc\xf1\
-\xc7[\xb7n\xdd\xbbw/\x91(S\xbf\x0c\x22\x91'\
-\x0a\x1c\x84\xc1\xc9\xa0%\x0c\xc5\x8fjkk\x11\xe4M\
-Bf\xa1\x9cBz\xcb\xcdz\x5c\xa8)TI\x16,\
-\xc3\x82\xa9JR\xf5dOZ\x1c\x8a\x9b\xdb\xa6\xaa\x82\
-\xacf\x22pm\xd9\xcb\x93&\xa5\xb7\xab\x92^I\xb0\
-\x5ci8\x92\xc4\xc6E\x08\x09\xfaZ\x12\x11\xe7\xa7\x9f\
-~\xfa\xd9g\x9f\x1d:t\xe8\xf0\xe1\xc3G\x1d\x08\xc0\
-,\xb4m\xdb6\x8e\x8f\xfe\xfbI\xa50}\xfa\xf4\x19\
-3f,]\xba\x94`\xb4\xa9\xa9I\xf7(\xbcEY\
-\xc9\xdb\xf8\x86?q\xe1S\x87YE\xccRd-\xb3\
-\x17\x90\xd2\xa4\x8a\x90\x84\xb0q@z\x19\x88\xb0\x12\xd9\
-\x84\xa0\xc4\x801\x932\xf3\x92#\x95\x14\xd8\xb3\xae\x9d\
-<y\xf2\xdc\xb9slf\xbcv\x02\xe49G$2\
-)\x986mZss\xf3\x1cGWW\xd7\xf2\xe5\xcb\
-\x9f}\xf6YE\xa2\x9a\xaf\xe5\xa5\xe6c\xa1<*y\
-\xdd/\xc4\x0cT'\xce\xac\xc7\x12Z\xb6Q\x82<|\
-hh\xe8\xc4\x89\x13\xef\xbf\xff\xfe\xbb\xef\xbe\xab\xef\x1e\
-\xc6H4\xf2\x84C\x0c\xbax\xf1\xe2\xcd\x9b7\xb3\xc1\
-[\xb9r\xa5\xbe\x5c\x9fr\x0a%\x19\xe1v\x04\xb3I\
-9H!Ru\x1ay\xf5aU\xa1\x8c\xb1\xec\x8b\x9f\
-\xab\x10\x94e\xae\xd0\xa4\xa1z8\xa6\xea\xf7\xd2\x84\xa1\
-Z\xcd\x15\xaa\xdf\xce\x12\x9e\xced]\x18I\xc3\xae\x04\
-\x01T\x95dbJbP4\x80|\xfe\xfc\xf9\xed\xdb\
-\xb7\x13q\x12n\xa2\xa7\xac\x0a\x22P\x84I\xe9\xc6\x8d\
-\x1b\x04\xacO\xe6\xe73\xec\x7f\x16,X\xf0\xa3\x1f\xfd\
-\xe8\x07?\xf8\xc1\xbcy\xf3\x88M\x99W\xd1s\x9b2\
-\x988\xae9=\xb4\x18G\x9f\x91\x0f;o!\xb3Q\
-/,[0[$eC2\xd4\xc8\x9ecJ\x0f\x1a\
-\xbd\xb6c\xf4\xda\x1c\xd9J\xc0\x94\xae\xb2<-`\xc9\
-PPq\x04\x96\xb0\xfe\xfe\xfe\xdd\xbbw\xff\xf4\xa7?\
-}\xe7\x9dw.]\xba\x94*>\x0e\xe2\x93\xd1\xc8\xa4\
-\x04\xc7c\x81d\xeb\xfc\xd5\xaf~\xf5\xd5W_\xdd\xb0\
-a\xc3\x8a\x15+f\xcf\x9eM$J\x90\xea\x5c\xd2\xbb\
-\x8dP\xd2@\xe3%G*\x17\x8a\xdb\x1bf\xa6S(\
-i\x8e}\xdf\xfd\x8d%\xfd\xb2=\x91\xe8\xde\xbd{\xaf\
-^\xbd\x1a#\xd1\xc8\x93\x0f\xa3T?\xf7\xc3\x22WS\
-SClZUUe\xab\x1dJ\x09\x80q(\x84\xc9\
-R(d\x99W_DY\xca\x19\xb1\xc9\x8b\xb2d\x03\
-\x854\xe5\x82\xc9A\xf3\x83\x08e\xc1\xe9ha\xc9a\
-\x94\xe0\xca%\xb2\xda\x1f\x99\x5c\x22K\x02J\x22\xcbS\
-\xa7N\xe9\x09( \xec\xd9\xb3\x87\x0d\xf0\xae]\xbb\xce\
-\x9e={\xf9\xf2ef\x1e\xd1\xeb\xb8~\xfd\xfa-\xf7\
-w_U\xf3\x93\x06sxCC\x03\xd3\xfb\xb2e\xcb\
-\xf4\xe2r\xb6S\xca\x08-Y\xa8f\xf4\xa5\x9c4\xb4\
-Q\x1f\x19\xcar\xd5\x8c@\xb9\xa5cE\x92A\x90C\
-\xbb\x1a\xb2\x18\x12\x1a\x15f\x96\x17rU\x104\xb4\x0c\
-o\xe1\x08\x93\xaaS\x98\x86\xf3\xde\xb9s\x87}\xce\x81\
-\x03\x07\x18x\xecj\x945\x11b0\x1a\x99|(\x12\
-]\xb4h\xd1\xfa\xf5\xeb_y\xe5\x95\xd5\xabW\xcf\x9d\
-;7|\xbfM\xde\x15\xce\xe3\xd2\x0bS\x1a\xe6fF\
-V\x93%eCRP?\xcb\x83\xde\xcd:q\xe2\x84\
->\x9d\xdf\xb7o\x1f+A\x8cD#\x93\x05\xc6*\xc1\
-(\xe0nMMMx\x5cee\xa5\x16<o\xe1\xd0\
-\x98\x07\x93S\xca\x22x\xa3|fRfsM#\x01\
-$\xbb\xcc\xfc\xc8\x0cR\xc9\x10e\x19\xd2(\x0b\xa4,\
-\x17\xc9\xdc\x94\x99\x82B\xec\x8c2cO\xab7>9\
-2\xa7\x91\xab]\x01\x01\x01J:\x88\xe0\xf2\xd8\xb1c\
-\x84\x9e\xef\xbc\xf3\xce\x87\x1f~\xb8s\xe7N\x22Q\xfd\
-M\xf9\xbe\xbe>\x82\x06\xf7\x22\xe8\x03\x14\xc1\xe8\x14O\
-&\x0aFW\xae\x5cI0:c\xc6\x0cn\xb6\x94H\
-k\xdc\xa85\xb2\x95\x97~\xba\x22\x96y\xb3P\x1a^\
-\x95S\xfa\x84C\x1a\xf0\xe9\x1c\x5c0\xee\xc9x\xa0s\
-Yk\xe8Sl\x18\x15Y\xf7,\x045\x18^U2\
-\x14a\x1cr\xf6\x0b\x17.\x1c<x0\x06\xa3\x91\xa7\
-\x14\xe6\xa9\x96\x96\x16E\xa2/\xbf\xfc\xf2\xaaU\xabf\
-\xcd\x9aE\x18j?&\x8a\x9fpt.\xfc\x00W4\
-?ysG-%\xb0I93\xf3\xc2\xc0\xc0\x80~\
-\xf6\x02GeU\xd8\xb6m\x1b\x91h\xfct>2\xe9\
-`\xbdQ0\xda\xde\xde\xde\xd1\xd1a\xafb\x0bo\xe4\
-PRz0M(\x18\xce\xc4\xe3U\x19\x8ad\x81\xca\
-\x1a^\x9b!\xcc\x95\x5c\x88\xac\x8d\x92\xd2\x97\x11M\x17\
-\xe1QH\xb6SK\xa3%\xff\xda\xb5k\xeci\x99O\
-N\x9f>\x8d\xcc4\xc2DGn\x7f\x7f\xff\xd9\xb3g\
-\x0f\x1d:\xf4\xd9g\x9f\x11\x80\xb2\xe9e\x9e!2\xb8\
-t\xe9\xd2\xe5\xcb\x97o\xdc\xb8A\xdf=\xb1\xcf>\x8b\
-\xc3$\xdf\xd8\xd8H0\x0a\x08\xd90\x0b9l\xbd0\
-k\x1cXU\xa9Sx)\x00e^|v\x8eT\x85\
-v4\x5c\xe6\x08L\x19\x0a&3\x12\xe8J\x1dYb\
-\xd8\x84\x5c\xbf~\x9d\xbef\x13r\xe6\xcc\x99\x9b7o\
-b\xc9^\x91E\xd0\x8a\x18\xe1\xc5H\xe6\x08Z(\x8d\
-l\xc1,fCqF&#\x8d5\xee\xe4\xc9\x931\
-\x18\x8d<u\xe0l,\x8a\xccP\x84\xa1/\xbe\xf8\xe2\
-\x8a\x15+f\xce\x9cY[[k\x9f\xe3\x08d\xb0\xcd\
-\xb4\x82\xd4\xbc\xc8\xc0'rH\x13\xeaSr\x98\x148\
-'G\xdc\x9b\xad\xea\xf9\xf3\xe7w\xec\xd8\xb1u\xeb\xd6\
-\x8f>\xfah\xef\xde\xbd\xc7\x8f\x1f\xef\xed\xed\x8d\x91h\
-d2\xc2\xca\xc7\x22\x87\x97AMM\x0d#\x1fo2\
-\x87\xd2\xb0\xcf\xba\x038/y\xe0GJ\x86P\x89\x97\
-\x023#\x95L\xe1\x0a=\xc0k\x03R\xfa\x94\xac\xcb\
-6\x9c\xad\xc7\x92\x12\x5c~y\xb0\x93J\xe0h\x1a\x08\
-e\xceK\xcc\xc1b\xcf\x1aO\xccq\xf8\xf0\xe1\x0f\x1c\
-\xbbw\xeff\xe1'\xc4\xa4\xe9\x86\x87\x87\xf5\x8b\xc5\xef\
-\xbe\xfb\xee\xf6\xed\xdb\xf7\xef\xdfOh\x821\xf3\x0fS\
-\xcd\xa4x\xfcY\x04\x0bF\x99\xe1\xf5\x05&\xf0yA\
-\x07\x19\xa9\xe4DP\xe5\xe0\xd3%\xa3\x22\xaeWG4\
-\xbbj\x03%\xc959\x85\xb2\x5c\x05#\x06\x06}M\
-\xf4\x09t.GF\x05\x9b\x8d\x03\x07\x0e0$>\xfc\
-\xf0C\x96\x18V\x1c\x0a\xd2b\xfaC\x15\xaa!\x8bU\
-(\x944\xc2+\x94\x90EY\xaetrU\xfa\x98>\
-\x06\xa3\x91\xa7\x8e\x8a\x8a\x8a\xb6\xb6\xb6U\xabV\xbd\xfa\
-\xea\xab\x1b7n\x5c\xb6lY{{{uu\xb5\xbc\
-\x88@P\xae\x02\xd2\x98w!\x98\x1cbz\x09\x864\
-Y=\xa0\x0c\xcf\x22\x8d@\xcf\x1a\x80[\xb2x\xb0B\
-0S \xe0\xae\xfd\xfd\xfd\xe8\xbdQ$2\xa9H\x96\
-\x9d\xff\xf7\xffX\xe4\x88\x0f\x14\xe2 \x80\x06?Y\xb2\
-\xe1\x18\xfa\x02(\xe9\xac\xf2#\xb3\x10\x9f\xe1\xf0\xaa\x00\
-\x9f\xe1\xf0\xaa\x0c>{4\x03\x9f\xc8!\x8d\xb2\x08z\
-$\x80r\xcb\x85k\xc8\x07\xcd\xc5Q\xed\x09\xcc]`\
-\x02a\xe8\x8d\x1b7\xce\x9c9\xc3\x04r\xf0\xe0\xc1\x9d\
-;w\x12s\xec\xd9\xb3\xe7\xf3\xcf?g>\xe9\xeb\xeb\
-c\x92\xb9r\xe5\x0a\x01\xe8\xb6m\xdb\xc8%\x1a`\xbb\
-K\x90JYw\xaaI\x0f\x03\x8c\x18\x94H\x14\x88\xb1\
-\xd4)\xe8\xd5/B\x96\x22\x95,\x84Z~\xdc\xe8\xbc\
-\x86\xd7\x16\xc0\x0c\xf2\x1a'C!\x18\x0c\xdc }\xa7\
-\xc1\x00\xc8\xe8\x11\x88>o\xde\xbcI_\x9f;w\x8e\
-\xcd\x06\xdb\x0f\xa0\xbb\x19\x18\x9f|\xf2\x89>sC\xcf\
-ha\x1d\xec\xec\xec\xb4\xf7k]\xf5\x1ew\xc2\x04\x9f\
-v\x1a\x1b*vm\xd9\x8b\xcc\x8b\x8asd\x94^\xb8\
-p!\xbe3\x1ay\xea \x12%\xf4d\xafL\x18\xfa\
-\xf2\xcb//]\xba\xb4\xb5\xb5U_\xaa W\xde+\
-?\x81\xc4\xfb3>f\x82\xe1\xac\xf2{`!}H\
-\xaa8gg\xb3x\xfd\xfau\xfcs\xfb\xf6\xedG\x8f\
-\x1ee\x1e\xb9\xe7~q\xda[D\x22\x93\x10VD\x16\
-\x1b\xc2\x9dK\x97.!\xb0p\xea\xad\x18\x06\xbf=\xaf\
-2G\x90\x908F\x09\x1ed\xae\x11z\xae\x84,\xa5\
-T8*\xee\xba\xd2\xf5H\xa3,0\xcd\x04)\xe4\xf8\
-\xe8\x99\xaf\xf4\xb8\xeb\xd6\xad[,\xea\xb40\xa0\xe1\x88\
-ROC\xdf\x7f\xff}6\xb4\xc4\x1c\x9f~\xfa)\xeb\
-\xfd\xb5k\xd70\xa6\xfd\x89<\x08\x02\x8e\x1f?~\xe8\
-\xd0\xa1\x13'N\xd0/\xd4@\xe0\xe2k\x9f\x120\xab\
-[0\x8a\xa0\x8f\xe9\xd1\xab\x83 \x94\xc1\x15\x1a'\xe3\
-(N\x91B\x9d\xeb.\xc7W(\x19\x90\xb1\x17\xc8\xf4\
->\xeb\x02h\xd9\x92\xc6\x1e\x7f\x82\x86\x84\xde\x06&\xfa\
-d\x00\xb0\xe5\x80\xdd\xbbw\xb3'\xd9\xbbw/\x1a\xbd\
-\xac\xa9g\xe1\xd4\xc0\xe28\x7f\xfe\xfc\x8e\x8e\x0e\xd6D\
-\xc5\xee\xaa9DW\x02\xa9,\xe9-7/\xe4\x86\x06\
-\xd4\xc0E\xb25*\xe3\xc7\xf4\xc5N\x1f\x89<!\xe8\
-7\x90\xd7\xacY\xa3\xbf\xf3\xb9`\xc1\x02\xb6\x80\xf6[\
-38\x06\xce,\xcb,\xe6E\x98\x81\x94 e(\x84\
-\xe4U\x025\xa4j\xe3\xa8\xbd,G\xa2Ob\xd0\x7f\
-\xfc\xe3\x1f\x7f\xfd\xeb_YN\x98V\x5c\xa1Hdr\
-\xc3\x98\xaf\xa9\xa9iiiY\xb2d\xc9K\x8e\xc5\x8b\
-\x17\x93\xc4\x07\xb5\x1b\x94/\x08\x8c\xe5#\x92%\x84\x98\
-\xe3\xd81$o\x91\x22`\x9f\xad\xa4\x10\xc9\x95e\xec\
-\xd1\xe8(L3\x0eR5\x87I\xc9\xd4\xcc\x5c\xc1\xe2\
-Mpy\xfe\xfcyf\x0c\x82\x093C`\x1a!\x97\
-\xd9c\xc7\x8e\x1d\xc4\x9a\xc8\x84)\x0a\x5cd\x03D\x1b\
-\xd3\xdc\x83\xea\x22\xf3\xde\xa4\x86q\xd5\xdd\xdd\xfd\xaf\xff\
-\xfa\xaf?\xfc\xe1\x0f\x89\xb1\xec\x9bs\x86\xc5\xa6\xb2/\
-\x91T\xef\x804\x1c\xa1\xf4\xc6\xe4\xbc*\x98%\xaf^\
-\xf6\xd4\x0f\x08D\x99z\xa3\x97\xc0\x91\x85\x8c#]|\
-\xf5\xeaU\x86\xc4\xc0\xc0\x00}M\x11\x86\x01\xd1\x1e\xc3\
-\x83A\xc2\xc6\x83\x80\xef\xca\x95+\xecF\xc8\xd5\x03u\
-\x1du\xba\x193f\xb02\xfe\xe8G?z\xf1\xc5\x17\
-Y(\xf5\xf5\x89\xec\x95\xe82\xa4\x0fs\xd5\x8c\xd6\x98\
-a\x96\xa1\x5ceq\x17Z\xecv\xed\xdaU\xc6\x9fv\
-\x1a\xa7\xcbE\x22\x8f\x0c\x5c\x8bm\xdf\xea\xd5\xab\xf5w\
->\x89D\xf5\xd7\x95p\x0f0\xd7\x02K\x22\xb8\xa2#\
-\xdcLYY\xcc8$\xaf\x12\xa8\x04W$\x17$3\
-)\xe8\xa9\x06s\x07\xbb\xd8\x0f?\xfc\xf0\x9f\xff\xfc\xe7\
-g\x9f}\xc6\x9e\x95,_,\x12\x99\xfc\x10w\xb2v\
-.]\xba\x147|\xe5\x95WV\xacX\xd1\xd6\xd6F\
-\xa0 g1\xffR\xd2\x04K\x1a\xb2\xcc\x1e\x0b\xd9\x97\
-\x11*\x07\xbbT\xa13*\x0bL3V\xc2{1\xc2\
-$23\x86\x1e)\xed\xdb\xb7o\xe7\xce\x9d\xa7N\x9d\
-\xd2\xc7\xebd\xe9\xa4\xc8\xcc'\xbd\xbd\xbd\x17.\x5c\xe8\
-\xef\xefg\xd5W\xd9\xa7\x0aF\xda\x9c9s\xbe\xff\xfd\
-\xef\xff\xe0\x07?`\xbc\xe9\xa7\xa3]\xe7x\x94\xc4R\
-\xc7\x12Iu\x0de\xa5Q\xbf\x80\xf4!V\xa4\x94\x13\
-\x991\x02\xf6\xaa_J\x05\x97z\xfcI|y\xe8\xd0\
-!\x02\xb8\xc6\xc6F\xee\xae\xa3\xa3\x83\x18t\xff\xfe\xfd\
-\xac\x1a\xfa\x1b\xd1\x14\xe1b(\x8211\x1fA*\xab\
-\x09\x91\xa8*\xcfB0\xfa\xd5\xaf~\x95\xd8\x9d]\x22\
-.I(_\xde`\xd4\xb2\x04\xd7\xc6\xd2V\xf6`4\
-~L\x1fy\xa2!\x12\xc5\xbb\xd6\xacY\xf3\xdak\xaf\
-\xb1\xfe\xb1K\xc6\x81\xb5\xf3\xc3C\x04fE\xfc\xc7l\
-$\x08e\x89TR\xe4U\x0a\xce\xc5\xd9\x11\xf0I&\
-\x0e\x16\x0c&\x17\xc2\xd0\xcf?\xff|\xcf\x9e=\x1f|\
-\xf0\x01\xd3\x0a\x1b\xdf\x18\x89F\xa6\x18\x8c|\xe2$\x06\
-<\xeb\x22\x0eR]]]SSC0\xaa\x87\xa3\x02\
-\x1b\xa1d\x11?\xca\x0b\xf6c-\x92\xc5\xce^\x22:\
-\xa3N\x0d\xa6)D\x91\xfa\x95e\x06\xa1%u\x92$\
-\x22a\xe5f\x8a\xd8\xea\xd8\xbbw\xef\x89\x13'\xce\x04\
-\x9c={\x960\xf4\xea\xd5\xab4r\xde\xf0\xe8)A\
-\xaf\x8d\xb6\xb4\xb4pd\xa4\xe9\xe9\x03z\xda\xd0z\xa7\
-\x94\xce*\x02\x05\xad,\xd5\x82\xe4B\x94r\x22U\xc2\
-Q\x11\x9b \xac\x1c\x1c\x1cd\x07r\xf2\xe4\xc9\xa3G\
-\x8f\xb2L|\xf4\xd1GDr\xe7\xce\x9dC\xdf\xd7\xd7\
-w\xe4\xc8\x91\x8f?\xfex\xdb\xb6m\x07\x0f\x1ed<\
-\xb0\x9ah0h$\x10\xf6\xb1\xd0\xa8\xfe\xbcTUU\
-uww/_\xbe\x9c\x08\xbe\xb6\xb6\x16\x7f\xcc{\xa9\
-Rf\xb3\x0a\xe9\x01\xa5\xe9M\xd6\xddiO\x15\xbf\xc0\
-\x14\x99\xe2h\xdc\xb3\xc3koo_\xb5j\x15\xdb\xbe\
-\x97_~y\xe1\xc2\x85\xfa;\xc5\xa1MJ6\x0d\x84\
-\x9aP/\xc2\xa9'\x9b\x9b\xd5\x18\xcab~\xb9\xe7~\
-\x88\x91\xb9C\xdf\x9dg6a\x969v\xec\x98~~\
-E\xc6\x91\xc8T\x02\xafa]d\xd8\x032QB]\
-]\x9d}\x8a*\x03Y\x02\x1a)Kg\x1cE\xc6\x84\
-\xea\x0f/RH/\x94\x94~L\xa8\xda\xbcGPt\
-\xd2\xdb\xdbK\x00\xfa\xcf\x7f\xfe\x93\xe9\xe2\xf8\xf1\xe3\x04\
-\x22z`\x16\xc2\xec\xf1t>\x10\x0d\xa1\xb9h\x07\xda\
-\x8d\xe8\x8ax\x94c8\xc6\xac\x9bLH\xca\x8c\x11J\
-Q\x95\xe4\xa4\x87rr\x11\xb2'\xca\x96\xe2\xca\xf5\x1c\
-\xf4v\xee\xfb\xefD\x93\xa7N\x9d\xfa\xe4\x93O\xde\x7f\
-\xff\xfd\xed\xdb\xb7\xb3L\x1c>|\x98H\x94@\x93p\
-\x93\x15\x84\x90\x8ex\x94\xd8\x8e\xa8.\x1c\x0f\xfaP~\
-\xd4\x0bcO\xd8\xd3\xd3c\xc1\xa8}l\x08\xde\x22w\
-\xe5v\x0c\xeb\x0c\xb3$\x18\xd2@(s\x83\xc0\xe5q\
-\xf1\xf1\xa7\x9d\x22S\x19|\x89\xad\x1eN\xa5\xf7D_\
-{\xed\xb5\x97^zi\xfe\xfc\xf9\xf5\xf5\xf5z\x06c\
-\xb3\x12d\x9d\xca\xb0\xa4\x84T\xae\x81\x1e\x0a\xd5\x93\xca\
-B\xd6\x5c\x83+\xea/\xf32\xc5\xbc\xf3\xce;,-\
-ly\x99M\xe2w\xe7#S\x1b\x5c\x80\xf5\x92\xe5G\
-\xcfGY\x08\x09I\xf5|4t\x96\xd0I\x0di\xb2\
-z\x83,\xcb\x0d\xfdN\xe4\xcd\x0a\x95&\x8bT\x0dI\
-\xd5\xee\x0aA\x0b*(\xa9,\x90\x99\xec\x8b@\x11/\
-\x8dDzW\xa570\x0d\x93\x06q\xc9\xd9\xb3g?\
-\xf8\xe0\x03\xf6\xae\xecZ\x99@\xcc,\x92\x82Y\x94\xe6\
-b\x9amhh\x98={\xf6\x8c\x193\xf4\x9d\xb9\xb0\
-w$\xa7\x94\xa0VM)A\x96\x86\xd7:(\x12\xf6\
-E(\x83\x92*\x92\xb7\xa0\x0d$z\x99+\xc75.\
-]\xbaD_\x9f?\x7f\x9e\xa0\x93e\x82\x1d\x08\xfd\xbe\
-c\xc7\x0e\xc2Pb8\xfd1\x02\xcc\xae]\xbbv\xf9\
-\xf2e\x16\x0e\x02\xd6q/\x1c8`ww\xf7\x8a\x15\
-+\xc2`TY\xc9}:\x94\x04\xc9\x5c\xaa\x92 M\
-h\x93%\xcc\xa5,\xf7\x1b\x83\xd1\xc8\x14\x87\x19\xa7\xb9\
-\xb9y\xee\xdc\xb9\x0b\x17.\xd4\xef\x89\x12\x89\x22\xb39\
-\xd6\xab0x\x85\x81\xbd\x9b\x01\x12T\xdc\x04\x90A\x11\
-\xc1\x8e\x12ReIJ\x0f\xca\xe2('d\x1ea6\
-\xf9\xfc\xf3\xcf\x99\x5c\xde{\xef=&\x1a\xa6\x1e\xa6N\
-f\x13\x0cT$\x12\x99\xaa\xe0\x08x\xc1\xd0\xd0\x10\xab\
-)2k!\x11\x03G\xf3\x97\xc4\xa3\x1c2\x0e\x95\x92\
-\x0dSJ0c\x11&e&\xb2u\xa2\x09\x8d%K\
-)\xa4\xc7=\xb5\x93\xc4\x85\x09\xa9A\x8f\xdf\xa8\xc4\xe6\
-\x16YJPY\x902\xa4\x882\x9b\x85\x86Ss\xd2\
-3g\xcel\xdf\xbe}\xdf\xbe}\xbd\xbd\xbdyk\x88\
-\x18\xf4\x14\xbd\xd0\xda\xda\xba`\xc1\x82\x8e\x8e\x0e\x9b\xff\
-}\xb6#\xe90\xa71}\xd8\xaa\xa6\x1c\x15J\xa9\xa0\
-\x15G\x08\x8bK\x9f\x9c,7J92x\x00/\xd0\
-p\xe2\x08,\x0d\xc4g\xdb\xb6m{\xff\xfd\xf7Y \
-\xf4\xe5wz\xfc\xc8\x91#,\x13\xc4m\x14\xb1e\x82\
-J&\xbejTUU\xf5\xf4\xf4\x10\x8cvuu\x11\
-\x8c\x86\x1f\xd3\x9b\xa0k\x96 \x94\x14\xee\xb6\x0a\xb6U\
-6\x8b\x0b\xc6\x89\xe2\xc7\xf4\x91)\x0b\x91(S\xcf\xea\
-\xd5\xab_}\xf5\xd5\xaf~\xf5\xab\xcf?\xff\xfc\xaaU\
-\xabp\xb0\xfa\xfaz\xdb\x16\x0b\x8c\xcd\x9d\xbc\xca\x11&\
-\x95\x0b&Kp\x99\x09&g\x9d\x13\xcc\x80,|\x0f\
-\xb4\xe5\xbdz\xf5*+\xca\xd1\xa3Gw\xee\xdc\xc9t\
-\xc3,\x13\xff\xbaR\xe4i\x03\xa7`\xf5e\x11\x22$\
-e\xf1\xc3CY\x05\xede\xee\x22A\x83H\xb9[*\
-7DY\xa0\x22\x1c\x81\xa4d\x19Hi\x1a\x90\xc3\x02\
-\x01\x0d\xc8\x80$+(\xb1\xc2\x85\x0b\x17p\xe1s\xe7\
-\xce\xb1\x9a\x12\x14\xb2\x8d\xe4\x82\xa7M\x9b\xc6Q\xc5\x85\
-J\x09%\xa5\x07)\xb3\xf8\xec\x0c\xca\xa5\xc5\xce\x9e=\
-Ktr\xfc\xf8\xf1\xb2\xac\xdfS\x1e\xc2\xac\xd9\xb3g\
-/]\xba\x94#2#M}d\xe3!\x19\x19\x0e\xc9\
-I\x99\x80\xac\xa6\x10\xea \xe1U\xb9\xe2:J\x8f\x8c\
-\xa0A\xc5\x9c\x7f\xd3}\xdb]c\x89A\xc5p\x22y\
-\xea\xd4\xa9\xdd\xbbwo\xdd\xba\x95x\xf4\xf0\xe1\xc3'\
-N\x9c@\xa3\x0f\xcd\x18~I\xbd\xe5F\x1f\xd3+\x18\
-E\xd6\xe7\x87\xc0\xd5\xea\xe2\x85\xbb9\x8fW\xe5HY\
-\xa6He\xa98\xf7Bl\xad\xdf\x17\x8b\xc1hdJ\
-\xc1J\xa6_\x12\xdd\xbcy\xf3\xa6M\x9b\x08C\xe7\xce\
-\x9d\x8b\xc6\x16\xb9\x94\x0b\xc9C\x9c\x13y\xa4\x0fI\xe9\
-%\x9b\xc6e\xe6)\x05\xa9,\xe7\xbf\xc9\xd3 f\x1c\
-\xbd~\xceD\xa3W\x7fX\xccb$\x1ay\x0a\xc1#\
-\xf4X\x88`\x0e\x99X\x81\x85P!\x9d\xb9\x0fG%\
--\xce\xc3RY)\x92\x02\x8e\xc4\xd3\x9c\x8d\xf0\xd9\xae\
- \xd1\xa4r\xbd\xca\x95\x92^Ie\x11(\xe0\xaaw\
-\xdco\x5c\x00!\xa0\x8e\x5c*\xde\x8a\xcf~\xf8\xe1\x87\
-\xfa\x06\xc9\xa7\x9f~z\xec\xd81\x94\x5c6\xf1\xb4^\
-~U=\xaaV\x02X\xe5\xe1\xb1t\x92*\x5c0J\
-\xd4\xc2IO\xba?\xa4\xe4\xf3\x22\x05\xa0s\x19T\x04\
-X\x0a\xb3\x90mh\x81\x0c\x84\xc9\xa1 YB\x89\xa8\
-[9\xaa\xa0\x8eR&\x95\xba\xc1\xc6\x98g81\x96\
-\xd8\xd5\x1c=z\xf4\xe3\x8f?\xfe\xe0\x83\x0fv\xee\xdc\
-I\xb7\xee\xdf\xbf\x9f#\x9b\x0d=\x07\xbd|\xf92\xbd\
-\xacqH)\x1b\xa5e\xa7\xba\xba\x9a`\x94\xa5\xd3\x9e\
-\x8c\xaa\xa1\xc8\xd2\xb18\xee\xce<^5\x92\x94\x9eF\
-P;\x5c\xbbv\x8d\xdb$\x18-\xcb\x0b'1\x18\x8d\
-<\x11\x10n\xb6\xb4\xb4\xacY\xb3f\xcb\x96-/\xbe\
-\xf8\xe2\xfc\xf9\xf3\x9b\x9a\x9aX\xdbX\x1e\xb4\xbce\xc7\
-z\xe8<y=!\xe5B\x22,\x15\x12\xeaMH|\
-.7=\x013\x0bK\xd7\xfb\x8e\xcf>\xfb\x8cue\
-\x22/\xfaD\x22\x93\x1d\x9c\x82\x85\x96\xa5\x88\xb5\x19'\
-%\x5c\xc0a\xf1\xe5TH*K\xc9\xa6)\x84,\x05\
-IE\x84\x1c%dAO\xf4)\x19\x81\x80O?\x0b\
-\xaf\x87U\x97.]\xbax\xf1\xa2\x8eg\xce\x9c9t\
-\xe8\xd0\xf6\xed\xdb\x89\x1ev\xef\xdeM$APx\xfa\
-\xf4i\xbc\xb8\xae\xae\xce\xfe\xf8\xbe.CuJ6t\
-\x16\x9f(\x8c\xae<\x84R\x5c'\xd7v\xfe\xfcy\xa6\
-\x0e\xfd\xa2\x93\xcf\x8b\x14\x80f\xb4\xb7!\xf5\xcc/\x15\
-\x8c\x86!\x97\x09I\xc9@3\x0e\xc2\xb2\x08\x1a`\x1c\
-\x99\xea\x89\xc0\xfa\xfb\xfb\x19N\x8c%\xd6\x02\xbd\xa6\xf5\
-\xc9'\x9f0\x96>\xff\xfcs\xc22\x8d(\x0c\x18T\
-\x18k\xc0\x80j{H\xe0w\xd6J\xe1\xc7\xf4v\x17\
-E0KCz#\xd4\xd8\xbd\xa0\xa4Mh\x8a\xb3g\
-\xcf\xd2\x14\xc4\xe5$e3nb0\x1ay\xfc\x84\xdf\
-\x9a\x7f\xe5\x95W\xf4\xady}%\x82\xe9\x06\xcc\x07@\
-\xbe\xa1\xa3\x94\xd9#\x98\x0b\x85\xbe\x04V\xdc,!4\
-6\x19$3\x0d1\xad\xb0\xc1e\x91;|\xf80\x8b\
-\xd9\xc1\x83\x07{\xa7\xe2\x1f>\x89D\xc6\x0a~\xa4\x07\
-E\x80;\xe0\xcb\x84tzD*o2d\xacRy\
-I\xe5*i\x05\x09\x05\xf08=d\xd2QB(s\
-\x0dW\xaf^\xdd\xbf\x7f\xbf~(\x87\x88S?\xdf\xc8\
-\x11>u\x90$h\xb8v\xed\xda\xa0\xfb\x0e\x160\xc3\
-\xcc\x9c9s\xee\xdc\xb9\xcd\xcd\xcdD\xd2\xa9KUR\
-G\x11\xca%Bm1\x18\x1d+\xb43aVgg\
-\xe7\xd2\xa5K\xb3\xcf\xfc\xb2d{jL\xd0A\xd6\xe9\
-\x08B\x93\xbf\x86\xd9m\xf7\xc7\xb1\x8e\x1c9\xc2\x12\xf0\
-\xd1G\x1f\xed\xdc\xb9s\xcf\x9e=\x84\xa1\x0c9z\x93\
-\x5c\xa1G\xa1\x14TU\x8f\x00\xdcM?\xed\xa4V2\
-\xd7#KGn\xc4\x19z\x94+\x0aiD*\x09\xb2\
-\x01d\x5c\x92\x8d(m\xc2j8\xf1\xf1\x1c\x83\xd1\xc8\
-cF\x9f\xce\xeb\x99\xe8K/\xbd\xb4`\xc1\x82\xfa\xfa\
-z\xdc\x09\x98w0\xd0\xa4 c\xef\x07\x81\x83Yn\
-x\x94\x81\x09\x96\x14\xa9\xa4\x08\x95\xc8JR\x1b\xfe\xc6\
-\xfe\xef\xe2\xc5\x8bl\x01\x8f\x1f?\xae%\xed\xc2\x85\x0b\
-\xcc8:W$\xf2\x94\x83#\x10f\x11\xdb\xe9\xd51\
-\x96F\xe2Q\xa2\xd2\xd0\xa7 \xf4\xcd\xbc\xbe\x83\xd2\xf4\
-\xac\xe5\x02\x0d>\xc8\x1a\xcf\x82\xa7\xef&\xebI' \
-H\xber\xe5\x8ad\x0c\xf4)\xfc\xfb\xef\xbf\xbfw\xef\
-\xdec\xc7\x8e\x11w\xeay\x15\x10\x02R\x9c\xd0\x81\xeb\
-\xa4N\x9d\x8e\xeb\xe1j\xe7\xcd\x9b\xb7h\xd1\xa2\xd6\xd6\
-V\xf6\xc0\xe1e+\xf4\x095\xa1\x5c:\x9c\x88{\x89\
-\xc1\xe8\x98\xa0\xa9\x19E---===\x84\xa4\xac\
-\x0b\xfa\x0e\x13Y\xea;\x90\xa5\xa1\xde\x19_\x1f\x09\x95\
-\xb5\x81\xa7\xa7\xec\xf6\xbdxF\x14\x91(\xa3\x8b}\x0e\
-\xcb\x01C\x8eh\xcc\xc6\x92\xa1\xaa\x1e\x19\x84\xec\xa3\xfe\
-\xb4\x93]\x95\xcf(@\xcaFI\xa1\x1a\xa4G\xd6\x91\
-!M0J\xcb\xb0\xbb\x9b\xe0\x8d\x8f\xbf\xcf\x22\x91\x89\
-\xc3\xe4\xd2\xd1\xd1\xb1j\xd5\xaaM\x9b6Y$\xaaO\
-\x19\xb4\x0c\xa4\xc6\xb7f\x22A\x96rM\x90,!\xf1\
-\x18\xe7K\xe1Q\x84r!T\xe7\x17\xee\x8f\x9e}\xfe\
-\xf9\xe7\xfb\xf6\xed\xd3\xd4s\xfa\xf4iV\xb5\xf8\xd7\x95\
-\x22\x91\x14\xb8mcc#!\xdd\xcb/\xbf\xbcq\xe3\
-\xc6e\xcb\x96\xcd\x981C\x9f\xda\x93\xc5\xea.\x1b\xc0\
-\xb3\x94L\x81\x12\x8f\x13\x8a\x06\x04\x91(\x11'Q\xa6\
-\x9eBe\x1f;1-\xc8\x9e\x82}}}g\xce\x9c\
-!t \xdaC\xe3-r\xb8\xfa\x12|\xda\xfd\x90\x5c\
-WW\xd77\xbf\xf9\xcd\xef\x7f\xff\xfb+V\xac\xd0N\
-XY\xc9\x0c\x92C\x9aQ\x09k\x06+\xc8\xe51c\
-0\x99\xec\xd8\xb1\xe3'?\xf9\xc9\xbb\xef\xbeK\x00\x9d\
-2\x8ed!\xccb\x9f\xf0\xc6\x1bo\xbc\xf9\xe6\x9b\xab\
-W\xafnnnf\xfc\xa8U]7&\x0d\xe8\xfa\xe7\
-\x01\xb6F K(\x82jPU\xf4\x11(\x89p\xcf\
-\xbd\x13\xc9\xa8\xfb\xf4\xd3O\x09F\xd9\xc0\xa0\xe1H\xe0\
-E\x92\xae\x94=\xc6\xae\xa6\xc7\x09\xcd\xf2\xca+\xaf\xfc\
-\xe0\x07?`\x0d\x9d9s&\x8d\x16.\x94\xe0\xee\xcf\
-_\xa7\x09\xa9\xf6q\x8d\x97\xbf\xc5\xc2\xb2\xb2A\xe0\xde\
-Y\x07\xf7\xec\xd9\xf3\xc7?\xfe\xf1\xef\x7f\xff;\xab$\
-\x1a\x99\x8d\x8f\xf8d4\xf2\xd8`\xd2'\x12]\xb7n\
-\x1d\x91\xe8\x86\x0d\x1b\xf4\xd7\x95\xb4\xf7\xb5\xd1\x9f\x02O\
-He\x91\x94&\xa5\x17\xf2\x9c\xd0\xc7\x90\xc3d\x88\xe9\
-\xa9\x8aU\x8d\xa9\xa7\xbf\xbf\x1f\x1f\xdb\xb6m\x1b\x8b\x87\
-^\x0cb\x97\xac\xad\xb0,#\x91\x88\xc0k\x08\x13\x09\
-\x01o\xb9\xcf\xeb\xe1\x8e\x03\xb7\xc2\xa3S\xabc\x0a9\
-/\x8b\x19\xc5\x89\xd2\x08%q4\xf6~z\xfcIp\
-I@\xf0\xe1\x87\x1f\xe2\x89\x07\x0e\x1c`[\xa8'\x9d\
-\x86=\xfb\x04b\x85\xde\xde^]\x03\xd5f\xd1\x19\x0d\
-.L\x7f\xe3t\xe5\xca\x95\xed\xed\xed\xf6d\xd4\x8e)\
-\x5c\xa1\x04\x9f\x0e\xf0\x19\x01\xa6\xe4\xbc\x5c\x8f\x9e\x8cr\
-\x0b\xf1\xc9h\x89\xa8\xbfjkkg9\xea\xdc\xdf\x05\
-E\xa3\x06w\xfd\x99`\xed\x0c\x92\xc3c)P\x09\xc3\
-Oc\x86\xe9\x9d\x9eb\xdbs\xe8\xd0!F\xdd\xd6\xad\
-[w\xef\xde\xad\xa7\xec\x84\xa1\x97/_\xb6\xa7\xa1\xbe\
-\xf0\xe3\x86E\xb3\xad\xadm\xee\xdc\xb9z~\xacWM\
-\x0a\xdd\xbb\xb2 \x94AIg2\x82\xecmb\xa6\xe6\
-\x22\x22\xdf\xef^\x89\xa1e\xf08\x9f=^b0\x1a\
-y<\xd83Q\xb6tz&\xaa\xbf\xf3\xa9\x8d\xaf\x1c\
-@\xbea\xce\x90\xd7U\x8a {\x8e\xa9\x82a\x85\xd9\
-\xca\xf11&\x1a\x16Q<\x8deO_\x96\xc4\xe5X\
-E\xf4\xdb\x1cLX\xb2\x8cD\x22!x\x13\xab8a\
-V__\x1fq$A$+:\x0e%\xbf&\x17\xdf\
-\x01\xe7\x91\x09*%\x01=\x05O\x9f>\xbdk\xd7.\
-\x9cN_O\x0e_\xf7$\x86#\x14\xb8~\xfd\xfa\xa0\
-\xfb=\xa9\xbc\xb0\x22\xde\xbe}\x9bm\xa4\xf9\xf5\xa8X\
-0\xba|\xf9r\x82Q\xfb XW\xe5.\xd3\xe3\xcc\
-\xf3\xa3\xdc\xac\x8dih\x04\xb0\x8f\xe9\xb9M\xaeVY\
-\x91\xe2\xd0\x1d\xd5\xd5\xd5]]]zZa\x9fA+\
-\xb7HG\xcb&\xb4\x14J\x82e\x09\xb2\x14\x862\xc0\
-\x888\x19oD\xa2\x0c\xc5\xc3\x87\x0f3\x8c\x99\xfc\x19\
-]\xf0\x88\xdf\x07-\x05n\x84q\xdb\xd4\xd4\xc4\x00n\
-ii\xb1'\xa3\xa9\x1bLa\xedcH_\x043S\
-K\xe2\xe6\xf8&\xae\xca\xd6\x91f\x91\xcd\xb8\x89\xc1h\
-\xe41\xa0Ht\xdd\xbau_\xfd\xeaW\xd7\xaf_O\
-$\x8a#1\xcb\xe0B\x1a\xeb:\x02#^\x02\x14\xc9\
-\xca\x0b\x96\xa9\x22y\xa1\x1eY\x22\xe8\x83\x18\xa6\x1e\xbc\
-\x8bH\xf4\x93O>a>b\xf1\xb8r\xe5\x0a\x93\x14\
-s\xd0\xa8'\x8dD\x9efp\x10\x96%Vn\x96s\
-bGBR\xf6u\xac\xf1\xc4^\xc4\x917n\xdc`\
-9\xc7\x86\xd8\x14gG\x00Ei\x14!D\xdb\xbd{\
-\xf7\xbb\xef\xbekO@?w\xe8y\xe7\xb5k\xd7\x08\
-4\xe5\x83\xc5\xf1\x97R\x1a\x5c\x06\x93\xcf\x92%K\x96\
--[\xd6\xd6\xd6\xc6\xd4\xe43\x5c\x96\xa6\x0e\xcd\x0fR\
-\x16\x02\x83\x22\xa7&K\xb7\xc9\x8dpk1\x18-\x1d\
-\x86J]]\x1d\x91\xe8\xe2\xc5\x8b\x89\xb4\xf4\xd8\x0f\xbd\
-\xebj\xffLt\xac\xbd\x93*\xa5\x5c&\xff\x9b7o\
-^\xbcx\xf1\xd4\xa9S\x07\x0f\x1e\xdc\xbe};\xe3\xf0\
-\xd8\xb1c\x0cZmo\x84\x8a<Q0\xb4\x18\xab\xf5\
-\xf5\xf5\x9d\x0e\x9aK\xcft\xec\x06!\x94\xa1HV\x0a\
-\xe5r\x14R\xaa)\x08Fi(\xe2QVL|\x5c\
-Y\xe3&\x06\xa3\x91G\x8d\x22\xd1\xd5\xabW\x13\x89\xea\
-\xaf+544\xd8~\x17\xbc\x9d\x1b\xf1^r(K\
-\xc7T\x16\xb8\xa2#\xc8\xab4T\x0a$s\xc4\x9d\xb4\
-\x22~\xfa\xe9\xa7\xec\xf6\x84\xb6\xc5\xac\x222\x8eD\x22\
-\xc5\xc17q%\x02\xc7\x81\x81\x01VwV,\xf6r\
-\x04\x94\xb8\x12K;\x8b=\xb9\x95\xee'\xdb\x10\x88\x5c\
-\x09O1 \xe8d\xef\xf7\xc1\x07\x1f\xec\xd9\xb3\xe7\xcc\
-\x993D\xae\x14gg\x08\xc4mD\xb4\x04\x04\xfe\x04\
-eE\xc1(\x81\x8e\x82Qb\x1d\x9f\x91\x9b=BA\
-\xb2\x84\x14E\x0c\x92u\xdb\xc14\xc2.7>\x19\x1d\
-\x13\x8c\x13\xc2,:h\xf9\xf2\xe5\x04\xa3Z)|\x9e\
-\xa3\xf4\xae1\xa4\xe1(\x81\xaea(\xea\xa3\xb0\x1d;\
-v\x10\x832\xf3\xb3\x0a\x10\x95\xa2$\xcb\x15zr!\
-\xf4lll$^_\xbatiww\xb7}\xefB\
-x\xa3\xdc\xfd\x0anY\x1a;\x16!kFq\x22`\
-\x96\xcb#G\x8e0\x9e\xd9(N\xbc\x95b0\x1ay\
-\xa40\xd7\x13\x89\xae]\xbbv\xd3\xa6M\xeb\xd7\xaf\xd7\
-\xef\x89\xda\x02P\xdc7,W\x8ed\xe4\xb5Gi\xa4\
-\x92z\xe0\x11\x82\x01K\x9d\x22Q\xd6\xc2\xf7\xdf\x7f\x9f\
-m\xf1\x81\x03\x07X\x14\xd9\x16O\xfc\x03\x88H\xe4i\
-C\xcb\x15\xbeCLy\xf9\xf2e\xd6u=\xe9<\x7f\
-\xfe<q*\x06\x1c\x15\xa7\x9e;w\xee\xe8\xd1\xa3\xfa\
-t\x9e\x08\xe0\xd2\xa5K\x84\xa7\xd9'\xa0\xaa\xb6\xec0\
-\x1b\xb0\x90\xdb\x93Q=x\x132\x90`\xc9B\xe45\
-\xb0\xcbFPk\x10\x8c2\xb1\xc4wFK\x87\xb8\xaa\
-\xa1\xa1\x810k\xc5\x8a\x15\x16\x8c\xba\x11\x91gH\x90\
-%\x90C\x03\xaf\xcd!\x0dG\xd9pd\xfeg(\x12\
-\x83\xfe\xe3\x1f\xff \x1ee\xd7\xc48\xa4\x8f\xbe\x98\x0c\
-/eUWW\xcf\x9d;\xf7\xf9\xe7\x9f_\xb3fM\
-ggg\x8d\xfb#Lv\x9b)!E!}\x96\xd0\
-\x8c\x16c<\x13\xa9\xb3\xc3d<\x97%\x18-\xf6R\
-y$R^***Z[[\x99S^y\xe5\x95\
-\x0d\x1b6,X\xb0\x80Y\x86\xc5\xc0f\x0d\x84\x10)\
-SH/\x03\x902\xe5NJ\x9a2\x95\x1b\x16\x148\
-\x12\xeb\x22+\xe2G\x1f}\xf4\xce;\xef\xb0(\xee\xdf\
-\xbf\x9fH\x14\xe5Cz\x1e\x13\x89<\x0d\xb0b\xb1\xa2\
-\xf7\xf6\xf6^\xcc\xfd\xa5\xc4\xcf>\xfbl\xeb\xd6\xad\xbf\
-\xfb\xdd\xef~\xfe\xf3\x9f\xff\xcc\xf1\xcb_\xfe\x92$~\
-\xb7o\xdf>\xcc\x08RS\xee\xf9\xb0I\xcd\x0f!6\
-W\xd8%\x99P:\xae\x8e\x11\x95D\xc6D\xa1\x0eR\
-\xc3\x0a\xafrx\x95\x0b\x98@\xb2\xcf\xcbaJ\x09\x04\
-\x9d\x0c<vM'O\x9e\xd4\xbb\xce\xec\x88&E$\
-\x0a\x04\xe8\xcd\xcd\xcd\x84\xa1,\xafza\x94\x16\x13\xba\
-G\x04Y>\xc9\xc4`4\xf2\x88\x98\xee\xfe\xc6\x92~\
-\xd9^\xcfD\xf5\x8d%<\xc7[\x04\x93\x88O\x17\xc0\
-\x1b9\xbc\xca\xf9\x9b\xa1\xa4\x1d%H\xa6\x08\xd3\x13\xb3\
-\x8c\xe6)\x84\xe1\xe1\xe1A\xf7\x83\x1d\xbbw\xef\xfe\xe7\
-?\xff\xc9\xb6\x98\xc9\x08\x0da(\x06\x94b\x97\xc9u\
-\x12I\xe3\xe7\x02\x19\xcdD\xb0\x9dk$2\xe5\x91\xa3\
-\x01\xbb\xbe\x81\x81\x81\xe3\xc7\x8f\xbf\xff\xfe\xfb\x7f\xfc\xe3\
-\x1f\x7f\xfb\xdb\xdf\xfe\xe1\x0f\x7f\xf8\xcb_\xfe\xf2\xc1\x07\
-\x1f\x1c8p@of\x87N\xfdh0Ot3J\
-\x82\x92)\x8ad\x95\x82\x8a\x0b\xaf\x8a\x8c\x8b\xbc\x0dX\
-\xa8U]{{RI`dz\xc9\xc9\xcc\xf9\x8c@\
-\x8e\x8cU4\xaaaRP\xfcj\xcb\xbe\xd6<\x8c\xc6\
-\x89\xc1h\xe4Q@\xf4\xd6\xd6\xd6\xb6r\xe5\xcaM\x9b\
-6\xbd\xfc\xf2\xcb\x8b\x16-\x0a\xbf\x17\x19\xc6\xa3EH\
-&\x0c\x87O;,\xa9\xaa$\x1b\x96\xeb\xca=\xb0\xb4\
-\xbd#J6\xc4D\x9f;w\xee\xd4w\x95\xf4\x95\x0b\
-Y\x122\xd6\xd4\xd4\xb0\xdd\x9c={\xf6\x82\x05\x0b\xf4\
-Q\x11G\xae\x9f\xe4\xbc\x1c\x04\xd6^*\x81\xb9s\xe7\
-vww\xcf\x9c9S\xaf\x99\xebD\x91\xc8S\x82<\
-\xee\xea\xd5\xab\xe7\xcf\x9f?\xeb\xb8p\xe1\x82\xfe\x82\x0b\
-\x11\x807z\xe4hB@p\xf3D\x82\xf4\xe3CU\
-\xe5e\x825GD\x91>\xca\xea\xd1\x10h\x0aWn\
-\x04\xa6\x0c\x0d|\xc9I\xc2\xf0\xf00\x1b\xb9\x13'N\
-\x5c\xbcxQ\x0ft\xed\x164\x14\xb9/%'\x8e\x8d\
-\xed\xb2\xb7RA\x9f\x89D\xca\x05!W\x8b\xfb\xbb\xf3\
-\xaf\xbe\xfa\xea\x8b/\xbe\xb8x\xf1b\x22Q\x94\x16\x83\
-:\xf7\x7f0\xb2\x8bL\xe5\x22\xeb\x06\x14Q\xa9l=\
-\x96%$k\xde\xc1i\xd9\x04\xeb\x97{\xff\xfc\xe7?\
-\x7f\xfc\xf1\xc7z\xa1M\x95py\xb5\xb5\xb5\x0aCg\
-\xcd\x9a\xd5\xdc\xdc\x5c]]\xad\xf0\xf1\xfe\xfd\xfbc\xdd\
-:c,{\xce\xcb\xdc\xc1\xea{\xf4\xe8\xd1\xe3\xc7\x8f\
-\xf7\xf7\xf7\x97\xb8\x06S\x5c\x97\xed\xd3\x91Hd\xc2\xb0\
-Ofo\xf9\xbd\xef}\xef\xbb\xdf\xfd.BUU\x95\
-\xa6\x087mx\x81\xe3\xa8\x1bf\x99\x09sv;\xe2\
-\xb6L\x1a8\xbb~\xf4\xfe\xbd\xf7\xde#zPn\xa4\
-8\x95\x95\x95\xec\xde\xdfz\xeb\xad\x7f\xfd\xd7\x7fe\xed\
-\xd0\x0f\xc1&\xed\xeb\xc0\xc0Z\xde\xfaKH\x09f&\
-\xa5\x8eR\xba:\x92\xde\xb9s\xe7\xce\xe7\x9f\x7f\xfe\xeb\
-_\xff\xfaW\xbf\xfa\xd5\xb1c\xc7\x98\xa2\xc9\x9d,0\
-8Ya\x9f{\xee9\xc60\x8blWW\x17\xa3\x9a\
-\xa5\x8a;\xd5mfW\x0d\xe9\xc1\xb5\xca\x83\xb6*\x82\
-\xcc\x5c\x83%o50\x9e\xd9I\xfe\xe67\xbf\xf9\xe9\
-O\x7fz\xe4\xc8\x11\xd6M\x99\x8d\x9b\x92.\x22\x12\x19\
-7\x8c`\x1cc\xee\xdc\xb9\xdft,[\xb6\x8c\xa8n\
-z\xee\x1bK\x1a\xd9\x12\xa4\x81\x94o\x84Y@nJ\
-\x03(U*\xa9.\xe3f\xa1\xc0\x11\xcf$\x06\xc5y\
-\x06\xdd_\x05d\xde!.|\xe7\x9dw\xf6\xee\xddK\
-\x8c\xa8i\x08K=\xcd]\xbe|9a\xf4\xfc\xf9\xf3\
-\xb9l\xe6A\xadI:\x8bj\xd3\xe9\x92\x13\xe4\xbb\xb0\
-\x10r95n|\xf7\xee\xddK\x97.\x11\x01\xef\xdc\
-\xb9\xf3\xdc\xb9s\x5cIv\xb2\x08IN\x96\xfb\x0b\xe0\
-CCC\x5c\xb3\xcf\x88D\x22\x13\xa3\xa9\xa9i\xed\xda\
-\xb5\xdf\xfe\xf6\xb7\xbf\xf6\xb5\xaf\x11\xf4\xe0\xf5\xf2ky\
-\xb4\x04;\x86\xa44a\x12o\xd5Q\x02h\xf1\xee\xeb\
-\xeb#\x18e\xf1&\x18\xbdz\xf5\xaa\xe5F\x8a\xc0\xf6\
-\x80\xe8J\xc1\xa8v\x0b\xd2[\xf3Z\xcb[O\x09)\
-!l\xe70K5\x08\x05\xa3\x84V\x0aF\x99\xa2e\
-3YhhhX\xbdz\xf5w\xbe\xf3\x9d7\xdf|\
-s\xde\xbcy\x0a\xd9\x05w\xa7\xf5\x05Y\xc6%\xa2\xb2\
-&\xebHU(5\x9eY\xbc~\xfb\xdb\xdf2\x9e\x0f\
-\x1f>\x1c\x83\xd1\xc8\x93\x0e\xc3\xb7\xb6\xb6\x96\x18\xf4_\
-\xfe\xe5_\xbe\xf5\xado\x11\x95\xda\xb3\x079\x89\x0dw\
-C\xb9F\xca\xc0r\xa5W\xd2\x94\xa9\xa8\xcer\x05\xa1\
-$\xa5\x80\xb9\xe6\xca\x95+g\xce\x9c\xc1\xa3X\x8d\xd0\
-\xb0\xc9;}\xfa\xf4\xcd\x9b7\x89SIbY]]\
-=c\xc6\x0c\xe6Ahmm%\x89\x12\xa8\x07\x03\xd5\
-?&\x92\x13\xe7\x9e\x91\xe8-Uf=.\x037\xd6\
-\xc3Q\x19\xc88\x05W\xc5J\xc6\x152c^\xbe|\
-\x99\x1aR\x96*\x9b\xba\xfd\xc8\xc3\x80\x01\xc01\xd5\xfe\
-\x91IJOO\x8f\xfe\xda${N\xfc}\xda\xb4i\
-z\xa4DV2e\xe4&\x16\x13BBe(\xcb\x19\
-\xc1\xa7s\x1b\xe0k\xd7\xae}\xfc\xf1\xc7?\xff\xf9\xcf\
-?\xfc\xf0C\xf6\xbd\xa1A\xa4\x10z2\xfa\xfd\xef\x7f\
-_OF\xc3`\xb4P\xfbK6\x8d\xda\xd9Z\x1b}\
-6\x8bI\xd8\x9e\x8c\x1e?~|r\x05\xa3\xacJ\xac\
-P\xeb\xd7\xaf'\x18\xdd\xb4i\xd3\x9c9sh4\xb5\
-\x8f\xee\x14YI\xd9\x03I/9\xc2\xa4\x99\x85\xf6&\
-c\xc9j\xc5x\xe6x\xe1\xc2\x85?\xfe\xf1\x8f\x04\xa3\
-\x9f}\xf6\xd9\xc4\x7f\x1d\xe2\xc1\xc9\x22\x91\x87\xc1t\xf7\
-[N\xf8\xc9w\xbf\xfb\xdd\x8d\x1b7\xce\x9c9\xb3\x22\
-\xf7\xb3\xd2\x0c\xe8\xc4EFzE\xe8\x00F!\x9b\x94\
-\xb7`\x16Fc\xca\xe5\x08\xb8+\xb9:\x02S\xcf\xd5\
-\xabW\x09F\xb1\x9f5k\x16\x8b\x10K\xc5\xad\xdc_\
-\xd7\xc0\x80\x22\xacI\x04\xa0uuu\x1c\xb9\x0b\xca\xaa\
-\xda\xbc`O)\x9fp\x84Ir%$\xe7v\x17\x89\
-'\xb3\x17\xe7\x8c\x1c9ih,\x9bT\x85D\x9f\xac\
-^\x87\x0e\x1d\xda\xb3g\x0f!,\xab\x1a\xd3\xa5\x0cd\
-\xc9\xf5S\x15\xf7\x85\xa0\x22\x91\xb2\xc3\x18`$0\xd1\
-#\xd3\xda4u\xd8G\x91\xc9\x08\x81\xce7\xbe\xf1\x0d\
-\x82\xd1\xb5k\xd7\xb6\xb4\xb4\xd0\xc58\x14H\xf0F\x81\
-\x0b\x87\xe4U\x02\xa3\x22\x1c\x18\xc8\xf8;n\xae`\xf4\
-\x17\xbf\xf8\xc5G\x1f}\x84\x1c\xdaD\x0aa\xc1\xe8\x8f\
-~\xf4\xa3%K\x96\x10\x8c\xba\xd6}\xd0t\xea\x85l\
-_\x84\x9a\xb0\x08\xfa\x941\x1323\xe7\xd1\xa3G\x09\
-F\x81\xa8T\x9f\x8fM\x16h\x93y\xf3\xe6\xbd\xfa\xea\
-\xab\x8c\xe4u\xeb\xd6\x11\x98\xdag\x8fF\xd8bak\
-d\xb1\xc6I\xb5\x92\xd0\xfa\x08\x08\xac\xa1\x1f|\xf0\x01\
-\xe1\xfb\xb6m\xdb._\xbe\x8c\xc6\x1b\x8d\x8b\xf8\xfd\x89\
-\xc8C\x84x\x8e8O\xdf[\xc2I\x88D\xf5X\x14\
-\x0a9\x83rC|F\x80\xcfpY^r\x15\xaaN\
-\x1d\xd1\xb0\x9c\x84\xa01{.l\xda\xb4i555\
-MMM\x0d\x0d\x0d\x08D\x9c\x1c\x91\x1b\x1d\xe8\x95\xc5\
-\x05\xe3\xd8*E%zj\x92\x17\x9d\x05|:\xc0\x94\
-\x12\x9cU\x12\xd6pF\x82];]ss3\xcd\xc5\
-Q K\x09\x12\xda\xda\xda\xda\xdb\xdb\xd9\xf8\xda\xb7\xa9\
-V\xadZE\xf3.[\xb6\xac\xab\xab\xab\xbe\xbe\x9e{\
-W<\xad\x13\x19\xdcxd\xdc\xd0\x80\xf4;\xfdE/\
-,^\xbcX\xafm\xd0q4\xb5B\x7f5\xb2\x06^\
-dr\x81\xa7\xd0\x95LM\xfa\xd3\xe7\xf6\xadJa\x93\
-\x89\x1d\x85\xcb\xcc\xefV\x14\xc9;\x12\x88G\x87\x86\x86\
-\xce\x9e={\xf0\xe0A\xbd\x9c\xe33\x22E\xa1G\x98\
-\x87\x17-Z\xc4,\xc7n\x01O\xf4\x19\x0e\xeb\x05\xf5\
-H\x88\xf4\x86\xd7f\xba\x12\xe8/z\xa7\xaf\xaf\xef\xc8\
-\x91#l\xf8o\xdc\xb8A\xd2\xe7M\x06X\xa4zz\
-z\xd8M-_\xbe\x9c\x91\xccZF+1\xb0\xc9\xd2\
-P\x94,\xf2\x0e\xce\x10\xb5\x12\xf8t>\x94\xcb\x91\xda\
-n\xdd\xba\xd5\xdb\xdbK\xebM0\x82\x8f\xc1h\xe4a\
-\xc1H\xad\xa8\xa8\xe8\xec\xec\xdc\xb8q\xe3\xe6\xcd\x9b\x17\
-.\x5cH\xb4\xa4 \xc9[d K\xf8t\x8e\x94F\
-\xc9\xf0\x88K\x84>\x86\x92\x13\x81|\x12\xc2\x1adi\
-\xb1 \xae\xcbu*\xcad\xe2C\x16\x18\xa0\x94^\xc5\
-u\xccK)\x06f#ty\xc0ICLc\x17\x80\
-\xc0\xf5TVV\x12\xb6vtt\xcc\x9d;\x970t\
-\xf5\xea\xd5DE\x1c\x81$;c\x82W\xcc\xa8\x96\xb2\
-\x18\xd7\xd6\xd6*\xc8f\xaaBI\x84:\xc1\x9d\xeb\xd3\
-\x09\xedO\x1b\xb2\x1c\xb2\x13`\x03\xc0`fgE\x83\
-\xb37P\xef\xd0\xd4\xb40-O\x9f\xb2\x86\x85\xe30\
-\xf2\xe4C\xe7\xb2\xc1cw\xc1r\x8e\x7f\xe1;8\x0b\
-z9\xa9lL\x00\xc9\xe1\xd1P\xd7g\x07\x80\xcc\xee\
-\xde\xbdK$\xbag\xcf\x9eO?\xfd\xf4\xe2\xc5\x8b\x93\
-\xee\xad\xc4\xc7\x05=\xa2\xbf\xc0D0\xda\xda\xdaJ\xd2\
-\x9a\xddzA\x98fTRft\x19\xbbJbP\x82\
-Q\xb8~\xfd\xfa\xe4\x0aFi\x13&(\x96Z\xbdQ\
-\xa6\x09\x9f{\xe4\xbeR\xa3Q\xc9\xac^$\x8d\xe8\x90\
-,e\xd6\x92,)\xb5\xd6\x10\x83\x9e?\x7f\x9e!=\
-88(\x83\xf1\x11\x83\xd1\xc8\xc3\x82\x91\xca:={\
-\xf6l\xfde\x086\xb5\x04U6\xd1\xcb&\xc4| \
-\xc4\xf4F*\x99\x85S\x18\xae\x0e_\x09\xa1\x18.\x84\
-\x80\x1e\x8ddW\xc2\x9f\x14=\xb1\x85\x952\xc1P)\
-P)\xc3r\x8dB6B\xc9\x94R\x982uv]\
-\x9b\x05\xd0MMM,\x9cL@\x80\x0c\xc4F\xb40\
-\xa1\xea\x9c9sXV5w\x03\x02]\xc0l~\xff\
-\xfe\xfd\xf0\x93}\x8e\x91Qa\xaa\xa5Ui\xc6\xf5\x8e\
-\x0d\x1b60\x98\x17-Z4k\xd6,&}\xc2S\
-f\x7fvY\xa0\xf7\xb4ha\x88A\xffd\x81e\x9b\
-\xad\x1d\xdd\xfa\xc2\x0b/\xe05\xec\xdf\xcc5\x10\xf0\xb8\
-\xbc\x9e\x82R\xfaln\xd6\xf1\x81\xf1@pC\xac\xb3\
-o\xdf\xbe\xad[\xb7\x1e8p\xe0\xe6\xcd\x9bq\x90\x94\
-\x0e\x1b\x06\xfc\x8b\xfd6N\x87\xac\xb9\x11\xbd\xb5\x7f\xd2\
-\x1f\x0e\x93\xa5/D\xca\x80^cz$\x06%\x12=\
-|\xf8\xf0\xa4{2\xca\xd5r\xfd\xac\x0el\xab\xf4\x80\
-\x9f\xa1\xab\xac\xec\x84\x8fF\xf8t\xbef\x04idf\
-\xc6\xae\x9c\xafPp\xde+W\xae\xd0n'O\x9e\x9c\
-\xe0k\xa31\x18\x8d<,\xf0\x07\x22\xa4%K\x96<\
-\xfb\xec\xb3\x0b\x16,0\x0fa\x04\xeb(!\x94\xc3#\
-\x98\x0f\x98\xde\xb2\x0c\xcb\xd2Q\x84\x91\x9c\xf4\x9a\xfa\xad\
-B@if){\x99q\xa4\x94\x08\x0b\x86r\xe9\xa8\
-f\x09B\xb2\x9dZ\xb9 \xd9\x8e\x86Y\xd2\x8c\xc8\x1c\
-\x09\x95\x98\x80\x88\x81***\x08R\x09I\x09FY\
-S\xf5\x09>\x1b\x00@\xa0\xf1\xf5\xf1\x16W\xce\x91\x05\
-\x98\x22\x94\xd5\x0d\xbasF\xf2@#\xcf\x981\x83\x06\
-|\xfd\xf5\xd7\xdfx\xe3\x8d\x97^z\x09\x99\xe8\x93Q\
-M\xd4Bkwvv\x12\x86\xaa\xb5\xe7\xcf\x9fO\xc4\
-\xafU\x81\x82\x14\x9f\x5c\xeb\xd9\xd3\x09\xbe\xd0\xdd\xdd\xbd\
-n\xdd:z\x90\x85\x1c\xbf@i\x8e\x062\x03\xf3z\
-\x9f\xe1\x90\x06\xc2\x5c\x09)0\xb8u\xeb\xd6\xa9S\xa7\
-\xf4\x19\xfd\x04\x9f!=\x850\xc5\xd1Y\xf8\x1d\xeb\x08\
-\xdd\xa4>\xf2y%\xe0\xba\xeb\x01^\x9b\x83\xde\xd1n\
-\x81H\x14&\xdd\x93Q\xcd\xe4\xac\x05\xccH\x84\xecL\
-PL\xef\xca\xca{\xbfy)\xd1\x0c\xcc\x92\x93\xb2\xf7\
-\xbet\xe9\x12\xa3\x9a\xb1=00 \xfd\xf8\x88\xc1h\
-\xe4\xa1@\xd0\x83K,[\xb6\xec\x95W^!\x18\x9d\
-={\xb6>; KC9{\x14\xc8J\xda\xfc.\
-\xa47\xb2J*\xcf\x82^\x8e*c\xc9\xa0\xca\xed\x14\
-\xe1\xb9\xc2\xaa\x92z\x03\xc8\xc5R\xc6J\x0a\xcb5R\
-I\xc8j\x8cBeS'\x22\x89\xac\xa0T\xf1\xa8p\
-\xca\x04d=:mll$\x8a\x12\x84\xa1\x1c\xdb\x1c\
-l\x9a\x09L\x17/^<w\xee\x5c\xf4\x14\xb9s\xe7\
-\x0e\xd3.\x82N$t\xba\x08k\x1em\xb5e\xcb\x16\
-\xc60\x11'\x81~C\xee\x1db\xe6zrij4\
-z&\xad\xd6nmm\xa5\x91\xf5\xda\x96\xbeR\xe6\xeb\
-\x8a<\x91\x10\xe2\xd0k\xc4\xa3\xc0\xeeB\xefZ\x00\xfe\
-\xc5\xd1\xf9z\xfa\xab\x84.\xdf\xe3U#\xc9\xea\xe5\xa4\
-\x08lT\x88x._\xbe\xdc\xdf\xdf\x1f\xbfhX:\
-\xb4\xdb\xd0\xd0\x10q\x0fn\x85\xaf\xb1\xeb\x0b\x83\xadP\
-\xe0\x98\xea,/\x15F\xf6\x9c\xa2\xaf\xaf\xef\xf8\xf1\xe3\
-G\x8f\x1e\x9dt\xc1(0\xc6h\x16\xb6\xc4K\x96,\
-a\x16b$\xa3Ao-\x90\x0ce\x87\x92Y\xac\x01\
-M\xc8\x1a\xa3\xb4\x15G\xb5)\x18=t\xe8\xd0\x89\x13\
-'b0\x1ay\x12a\xa9fU^\xbf~\xfd\xc6\x8d\
-\x1b\x17\xba\xb7E\x99>\x18\xc1d\x85\xc7P\x10a2\
-\xe5\x0cd\x09\xc9x\x85\x1cCB\x88\xb3J\xccT\x83\
-\xf3\x9a\x04\xe9A6I\xa59\xa4\x07o\xea@\xaf#\
-zg\xf5\xe0\x92L\x03\xae\xdc\x83\xd3\xa5\xb0\xdcB\xa4\
-rS\xf6\x92\xed2\x00\xd9\x92\x89EN\x0f\xdc\x17\xed\
-\xccL\xa4\x80\x89#21\x13+\xae\x22\xd1\xe5\xcb\x97\
-\xafX\xb1B\x9f\xdd\xeb9\x10fL\xf1\xd8\x00\x1a=\
-@U\xf8\xfe4CK\xb6\xb7\xb7\xb3\x8f\xda\xbcy\xf3\
-\xca\x95+\xf5&\x96\xc6p2\xc2\x1c\xda\x12p\xa4\x9d\
-iC=\x99f=\x00\x22T\xda\x90%M\xddA\x85\
-\xb6\x05\x8a<90\xe0\xe9\xb2E\x8b\x16\xd1eD9\
-$\xe9_\xf4\xce\x99\x1e8\x97\x04\xa1,\xf0\xe9\x9co\
-Z\xe7\xfa\xec\x00\xcbe\xa8\xdc\xbau\xeb\xfc\xf9\xf3\xc4\
-\xa3q\xa3R:\xb4\x1eA\xcf\xf0\xf00\xdb\xec\xae\xae\
-.z\xca\xb6\x0d \x1b\x09\x96\x14\xa9d\x0a\xeb2\x04\
-\xdc\xf3\xf6\xed\xdbW\xae\x5c9w\xee\x5coo\xef\xa4\
-\xfbz\x19\x13\x11\xf3\x0f\x91\xe82\xf7f\xad\xda\x07}\
-\xf1\x16\x10\xd8\xa4\xccR\x9a\xacl\x1a\xfa\x85\xf1|\xe0\
-\xc0\x01\x82\xd1\xf8\xceh\xe4\x89\x83\x91\xaaY~\xdd\xba\
-uk\xd6\xac!\x0cb!g\x22V\x96\x90\xec\xccG\
- \xa5M\x13!\xae\x9c/\xe8\x82\x01\x8f%]\xbe\x07\
-3*\xb1zr\xca\xe4_H\xe9A\xb2\x94!a\xb5\
-\xd2\x842\xa4\x92Y\x8a\xe7\x82\x19\xb8\x9a\x1e\xc8\xa1F\
-\x02\xb8\xcc\x84P\x06\x97\xa4\x1d\x92\xa6@\xb6#X\xb4\
-TWWG\x90\x04mmmL\xe8@\xbc\xc5\xe4\xce\
-J\xac\xf5x\xce\x9c9\xcch\x14\xb9w\xef\xde\xfd\xa7\
-\xfb\xa7\xf5i\x04\xda\x87\xc0\x9d1\xdc\xdd\xddM\xeb\xd1\
-\x8c@\xab\x1a\xaeu}HJ\x92\x05\xa0\xb6\xb6\xd6\xbd\
-\xc7\x9b\xfc&\x03\x1b\x00\x5c\x80\xe6\xa5\x91\xc9\x220e\
-\xe2\xb6\x81\x17y\xec\xd0k\x8cv\xb6g\x1b6l`\
-{\x86_\xb0sHu1`\xa9\xa3\x04\x93\x8dT\x9f\
-\x16\xb2\x01\xc6\xc0\xd5\xabW\x8f\x1c9r\xf6\xecY\xa2\
-R\x9f\x17)\x0d\xbaF;\x07\x16\x14v\xcer:k\
-j\x09\x96\x14\xa9d\x16\xeb;\x04\xe2Q\xe6\xbd\x81\x81\
-\x81k\xd7\xae\xdd\xbcysrM\x804\x0e\x03X\xc1\
-(\xd3\xbb6\xc0`7\x08\xa9&B\x10J\x0a%\xa5\
-\x07)\xc1\xa7sP-G\xc63\xc3\x98\xc1\xfc\xd9g\
-\x9f\xc5\x8f\xe9#O\x22\x0cS\x82\xd1\x993g\x12\x89\
-\xe2\x1b\xcc\xf8\x04C(5}\xc8\x00\x18\xd0\xe6*\xd2\
-\x87h\xb8\xfbD\xc6\x19\xf2\xe2MGz`\x08&\x99\
-\xf3$\x84\xc5%\x1b\xa6\xb4c\x883I\xf0\xe9|(\
-\xb7\x88\x8d\x19\x846\xa6\xb4dJN\xe1\xf4\xca\xf7\xf8\
-\x8c\x00&,=\xa8\xa3w\x08L\x09\xb6\x88>\x99\xbf\
-X\x8fW\xadZE\xe0\xb5`\xc1\x02&2r\xd5\xf8\
-\x18S\xcf\xd3\xf9HO\x91\x0a+\xdf\xca\x95+Y\x02\
-i4[\xfc \x94A\xf6\x92id\xb6^\x04\xa3\xb4\
-\xe4\xbcy\xf3\xa8a\xee\xdc\xb9\xf5\xf5\xf5d\xd1\x8cL\
-\xdf,r4\xa9\xce\x12y\x8c\xd0S\xad\xad\xad\xabW\
-\xaf^\xbf~=\xfb\x0d\xe2\x1b4t\x93u\xa5\xb7s\
-H\x03>]\x18o\x97CJ\xba^\xb1\xce\x85\x0b\x17\
-\x0e\x1c8p\xfa\xf4\xe9\x89\xffH\xf8S\x05-\xc9\xbc\
-\xd4\xd9\xd9\xb9t\xe9R6x\xec\xfa\xe8,z\xcag\
-\xe7\x9a\xdd'\x1c\xa9d!lrS\xef\x13]\xd1G\
-\x93\xee\xd15\x17\x1f\x06\xa3,\xb8(\xd5\x02v\x83I\
-\x039\x8d\x8e\x22;\xb7\x9b\x99!\x0d(I\x11\xc1\xee\
-\x9a\xb6\xfa\xf4\xd3O\xf7\xee\xddKH:\xc1\x16{\xd0\
-\x97\x91Hya\xa6`\x09\x07}\xb8iCY0\x94\
-M\x10\xa1\x0c\xca\x05\x0aR\x15\xa8\x92P\x06\x19\x80\x8a\
-X\xd9P\xe08VT\x5c()\xbd\xce\x15\xca\xa0d\
-q\xac\x06p\xb5& \xa7\x8a\xabB\xf0\xe9\x91\xf8<\
-\x87W\x95\x0cEh7\xe6,PH\xca\xe4E0\xaa\
-\xcf\xee\x15\x8f>\xff\xfc\xf3\xaf\xbe\xfa\xea\xb7\xbf\xfd\xed\
-\xef}\xef{\xdf\xfc\xe677n\xdc\xb8x\xf1bb\
-2\xf5\xa0\xaf\xe8iBw\xad\x9e\x0a\xc9j\x04-L\
-[\xb1j644\xb0\x19[\xb8p!\xb1\x0e\xad\xba\
-e\xcb\x967\xdf|\xf3\x8d7\xde\xd0\xaf\xed\xd2\xf8\x1a\
-\xc3\xbeX\xe4q@\xfb\xe3\x0b\xd5\xd5\xd5D6\xa9\x1e\
-\x91\xc01\x85\xf3\xda4\xe8U\x0aBY\xb9>\xe1H\
-%#c\x85\x06\xcc\xee\x8d]\xcf$\xcd\x9e4w\x90\
-\x952\x0b\x09-U\x96#\x83\x81\x0d\x09\xdbHE\xba\
-\xca\x9d\xbcp\x83\xb4\x95\x9a\xcbn\xb6DT\x04|:\
-\x87k\xe9\x04dro\xdf\xbe}\xea\xd4)\x82Q\x8e\
-\x13\xdf\x5c\xc5`4\xf2\x10a\xd4\xda\x14\x1f\x8el\xc9\
-\xd9\xb1\x9e\xc5\x8d|\x0fU\xa5\xf0\x19A$\xaa\xa3p\
-\x15\x94\x13\xabS'\x95<&\xf2^\x98j\x13^U\
-\x02\xbe\xc0\xb8.\x83R\xc4L\xec\x9e\x09\x9b\xaa\x1c\xcc\
-\xc2\xf5\xf5\xf5\xad\xad\xad\xf3\xe7\xcf_\xbf~=\xf1\xe8\
-\x8f~\xf4\xa3\x1f\xfc\xe0\x07_\xfb\xda\xd7\x08Rg\xcf\
-\x9eM\xe4\xca\xb2M\x9b\xfb*\x9e\x0e\xac\xb3\xb2\xbd\x96\
-E\xdd!X\xcch[\x05:m\xee\x07J7m\xda\
-\xf4\x9d\xef|\x87\x10\x9f\xe6\xd5\x13\xe8\xba\xba:=\xc0\
-\x88<^X\xb09\xfa\x9e\xcb9T(\x8f\x8a\x8c\x0d\
-\xe7\xe5\x05\x07\x0c\x06^\x8a\x8c\x9dT\xeb\xb9\xf6N\xf0\
-\xe9\xd1\xc8\xdb5*.\xbdj\x03\x973Y\xc9\xdec\
-\xe9\x14*\xab6Q\xae\x16\x82\xfb\xf7\xef\xdf\xb9s\x87\
-0\x94\xa8t\xe2o5\xc4`4\xf2P`\xb0\xb2\xd0\
-\xb2$\x87^\xcd8\x16>=\x1a\x94MB\xce\x91\x98\
-\x12A\xa8B;\x0aWAA\xbf\x1a\x07\xaa\xca*\xf4\
-\xe7\x1e9g\xa5\x92\x10j\xcax1!\xd9\x93\x86p\
-\xd2BP\x90>\x02\x02S\x8bM\x09\x9e\x08I\xe7\xcd\
-\x9b\xb7z\xf5\xea\x17_|\xf1\xb5\xd7^{\xf3\xcd7\
-\x09I\x09\xa1\x88S\x1b\x1a\x1a\xa6\xc03\x83\xf1\xe1[\
-\xcd\xe1U9hI\x81\xec-\xdc\xafh\xd1\xaa\x15\x15\
-\x15\x84\xa4MMMs\xe6\xccY\xb1b\xc5\xc6\x8d\x1b\
-\xdfx\xe3\x8do|\xe3\x1b\x9b7o&\xcaooo\
-g'`\xe3Y\xb5E\x1e1a\xcb\xbbn|\xd0\x8f\
-RBh\x93\x17\x15\x04\x9f\xce\x87\xea\x04\x9f\x8eL\x18\
-\xdf\xa0\xaeI\xbd\x94C\x06!R*WH\x0ft\x1c\
->\xe8\x13\x91\x12\xa0\xc5\x98\xd9:;;\xd9Zsd\
-\xe1(>\xf8G%\xb6~\xa4\xfc\xb0\x0c3L\x8b|\
-\xde\xa1Y@c\x97c\x16\xe6\x05\x0aj\x85N\x16j\
-\x87\xb2T\x5cXUJ\xea#\x09\x92\xa6\x91<qT\
-\x9b\xe1\xb5\x0e\xaf\x9a\xc0\xb9|y\x87W\x95\x80\xd9\x8f\
-\xa9T\x165)\xb8\x8ft\x92GD\x84Pt_]\
-]]GG\x07\x01\x13\xc1\xd3\xdbo\xbf\xfd\xd6[o\
-m\xda\xb4i\xd1\xa2Et\xebS\x15\x8f\xe6m^\xd7\
-\xf6\x09>]\x00\xb5-C\x97&%\xe8\xa4\xe9\x88\xf2\
-_y\xe5\x95\xef\x7f\xff\xfb?\xfc\xe1\x0f\xbf\xfd\xedo\
-\xbf\xf0\xc2\x0bs\xe7\xce%$\x9d1c\x06\x81>6\
-OU\xdb>v\xe8 z\x876\x87dr\xc9\xac\xa6\
-a/\xe75\x08I\xe5\xaa, +\xcb\xa7\x1d\xce$\
-R\x06\xd4\x9e\x9a\xfc\x8d0\xcb\x90\xb2\x08\xc5\xfbw\x8a\
-\xa1\x9b\xe5\x18\xa2\xac\xbc\xd0\x80\xde(\x07\xcbDOO\
-\xcfs\xcf=\xc76\x9b\x19l\x82sW\x0cF#e\
-\x86\xc9\xbd\xa6\xa6F\xbf\x07>3\xf7\xc7\xe8}^\x06\
-\x0b1\x85-\x0c\x86\x0cd\x8c\x90wBq\xf3LB\
-\x98\x94<n\xdc\xe5x\xc2\x9a%\x80\xe4\xec\xd1\x97\xc9\
-\x81F\x84eCRz\x92\x85,A\xb9\xc24\x12\x8a\
-\xa3\x22B\x1a\xbb\xb6\xac\xc6]x\xd2\x17z\xaft\xfe\
-\xfc\xf9\xeb\xd6\xad#\x84z\xed\xb5\xd7\x88G\x97.]\
-\x8ar\xba\xfbcZV$R\x08\x9aW\xcb$\xcd\xa5\
-wI\xf5\x88t\xc3\x86\x0d\x9b7o\xfe\xfa\xd7\xbfN\
-\xac\xff\xea\xab\xaf\xd2\xbc\xcf?\xff\xfc\xe2\xc5\x8b[[\
-[1\xf3\x85#\x8f\x04\x1b\xc6\x89{\x04H\x09&;\
-\xcf\x181\xe6\x95L)!oq\x04\xb7\xe3\x8b__\
-+\x1b4i\x16\x9f\x97\x0f\xe5\xca\xcc0\x8d\xeb\xdeI\
-?\xa7\xe9\x8eB\x0a\xdd\x94\xee\x17|\xda\xe1U\x0e\xaf\
-rP\xadF\xaf\xea'\x97=vSSSwww\
-WWW\xbd\xfb[\xdf\xb2\x1c\x1f1\x18\x8d\x94\x19\x0d\
-P\x96\xd5\xd5\xabW3F\xd9<\x15\x8fZ\xc2,,\
-\xc1\xc2P\x91\xf8D\x81\xe2)\xaf#\x99\xd2\x18\xca2\
-\xbc\xb6d\xacHX\xd6\xd5\x94\xe0\xd3cGeU\x89\
-\x08\xf5\xc5\x91}\x0a\x9f\x97C\x9a\x94\xde\x94\x02Y\xcd\
-\xabv\x06\xcbE\xd0SRB\xa8\xd9\xb3g\x13\x92n\
-\xd9\xb2\x85\xc8i\xe5\xca\x95l6\xf4\x16)=\x85\xd9\
-\x94G\xad!\xc1d\x08\x93\xa1\x1e\xc2\x964\x99\xf1L\
-\xac\xc9n\x8d\xd6c\xb7Fp\xff\xf6\xdbo\xff\xfb\xbf\
-\xff\xfb\xbf\xfd\xdb\xbf\xfd\xf0\x87?\xfc\xc67\xbe\xb1f\
-\xcd\x1a\xfdf\xbe\x8aD\x1e*\x9aa|\xa2d\x12'\
-\xc9\xe1U\x0e\xf5\xb5O\x8c\xc4\xf4Z\xcb\x0b\x99EF\
-EMgGa\x11R!d\x06\x92\xa5\xccK\xb6[\
-')\xba\x11\xa1\xa4\xf4),7\xc4\xb2\x84\x92\xa06\
-\x14\xd2\xb0@\xd4:*r\xbfl:nb0\x1a)\
-3\x0aF\xe7\xcf\x9f\xcfZ\xdb\xe6~\xf0,;FM\
-\x93\x8ct\xf7m\x0f\xa1\xb5\x01P\xea\x18\xa2\x22!\xde\
--rx\xed\xb8\xf0U8\xbcj\x8c\xe4\xbd\xc2QI\
-\x9d\xce. \xa5\x1f\x07c\xaa\x81\x8b\x0f\xedI\x86\x1d\
-A\x9fVUU\xd1\x9b+V\xac\xd8\xbcy\xb3\xde\x22\
-}\xf1\xc5\x17\xf5]\xfb\xf8\x94\xd4=/H\x7fJ\xe8\
-\xa5\x5c\xab\xaa\x85A\xed\x89_\x10\xe2www\xafZ\
-\xb5j\xfd\xfa\xf5/\xbd\xf4\x12\x81\xe9\xeb\xaf\xbfN\xc3\
-n\xd8\xb0a\xde\xbcyu\xee\xcf\xe7b\xac\xe2\x91\xb2\
-C\xf3\xb21\x00\xba#;z\xa51}\xd8\x8f\xa6\x84\
-TR]\x0c>\x1d\xc0\x08\x19\x1e\x1e\xbe{\xf7\xee\xfd\
-\xfb\xf7\xf3\x1aDFEm\x0b\xa1\x0c\x96+Ad\x93\
-!^\x1bt1H\x1fj\xa6\x06\xe1\x1dee\x8e!\
-\xa6q&\x0f@\xc3t\x04\xca\xb2\xb6\xc2}`\xe23\
-U\x9c\xe9\x22\xe5D\xe3\xb5\xba\xba\xba\xd9\xa1w\xe0P\
-\x1an0?\x882U\x04Pj\xe9U\x12Ta\x0a\
-\x9f\xe7\x90\xc6M,\x09J\x8e\x0f\x15W=\x86\xb2\x84\
-?\xa5\xbbN\x8e^\x1b\x90W\x09\xae\xd0\x83\xdbL!\
-\x9b,:\xbb7\xca\x9d\x14\x94;&R7\x22\xb2J\
-\xd5/\xbc*\x07\xc6(\xe9\x1d\xe2\xa7\x193f,[\
-\xb6\xec\x8d7\xde\xf8\xa1\x03\x81Xj\xe6\xcc\x99\x84\xa4\
-z\x04\xee\xcbL\x15\xac\xa1\xc2\x961Y\xb9\x1cC\x9c\
-I\x82\xd9\x0b\x92\xe1\xf0\x06\x92\xc4\xf1\xb4\x9b\x1e\x94v\
-vv*\xd6\xff\xfa\xd7\xbf\xae?@:k\xd6,\x02\
-Vl|\x15\x91\xf2A\xfb\xd3\xf2\x8cg\x86\xae6\xcc\
-\x06\xfdb=%K\x09B\xc9\xd0 Ej\x0c\x80\x06\
-\x06\x91\xe8\xf5\xeb\xd7/_\xbe\xac\x1fT\x0f\xcd\x22\xa5\
-\xa0f\xd4\xc6\x0f\xf26\xa0)\x0b\xe5\x86z\xbaF\xfd\
-(Y\xca\x94\xcd\xd4 uG\xc9\xa0t\xf8t\x00\xca\
-Bc;\xd4\xa8\x95\x00Y\xc6B\xb9\xe3#\x06\xa3\x91\
-2\xc3\x88d43\xbf\x836L6\xb8\xc1\x1b\xe5\xf0\
-Z\x87%\x95U\x1c\xb9A\xe9\xa8\xe6,\xca5\xbf\x12\
-\x92Mcf*\x02J\x86\x84\xc5\xb3X\x91\xe449\
-\xa4O\xd5&\x0d\xf8\xf4\xc4\xd0Y$\x08%!\x94u\
-\xbaB'\x95^\xf6\x04F\xac\xdf\xf3\xe7\xcf_\xbbv\
-\xedK/\xbd\xf4\xdak\xaf\x11\x8fn\xd9\xb2\xe5\x85\x17\
-^X\xb8p!\xeb:1\xab+4\x15 b \x80\
-\xb8s\xe7\xce\xbd{\xf7\x5c\xe3%(\xcbd\xd3\x8c\x15\
-+H\xf3\xe2 \xb4\x1b;7\xb5\xad~\xed\x95\x86\xdd\
-\xb4i\xd3\xea\xd5\xab\x09I+\xe3[\xa4\xe5\x86\x91\xdc\
-\xd2\xd2Bkwuu\xe9!4J\xfaB\xa3]\xb2\
-\x04\xa1d\xa8L\x19\x18\xe8\x05\xb2\xc5L\x1co\xdf\xbe\
-}\xfa\xf4\xe9\xcf>\xfb\xec\xdc\xb9s\x93\xee\xafM>\
-!\xd0\x9exe*\x12E6L#\xa1D\xd4YS\
-\x86\x12o'l17`\x13R\xfaB\x98q\x19\x89\
-\xc1h\xa4\xfc0L\x15\x83\x82F\xad\xf0\xd99\xbc\xd6\
-\xa1\xa4\xf4\xa3\x22W\x09\x8f\x13!o\x0d)\xa5.\x12\
-\x90\xc7t\xc6\xd08U0L\xfa\xdaG\xb6\x00\x06\xb2\
-\x91\x00\xd2\x8f\x95\xb0`\xaa\x9e\xecIAJ\x03\x8d\x15\
-!\xa9\xb0\xa9\xbe\xbe\xbe\xa3\xa3c\xf9\xf2\xe5\xc4L?\
-r|\xfd\xeb_'\xd9\xdc\xdc<5\xe2Q\x16\xbc\xc1\
-\xc1\xc1\x8b\x17/\x12:\x5c\xbbv\xed\xee\xdd\xbba`\
-a\x82\xb3\x1d\x1baq\x09\xd6\xce4]mm\xed\xec\
-\xd9\xb3\x9f}\xf6Y\xda\xf3\xad\xb7\xde\xfa\xe67\xbf\xf9\
-\xdcs\xcfuvv\xd2\xe6I\xe1H\x99 \xbe'\xca\
-_\xb4hQOOO\x83\xfb\xc12u\x81\x11v\x8d\
-a\x1a30\xa4\x17\xd2\xb8\xee\xf56\x0c\x9e\xa1\xa1\xa1\
-3g\xce\x1c;v\xac\xb7\xb7\x97M\x8e\xf4\x91\x12\xa1\
-%iC\xdc\x10\xaf\xbcu\xeb\xd6\x17_|am\x1b\
-\xe2\x9a\xfc\x81^IP\xd2wO\xf0\xf0O(\x17\xd0\
-O\xcb\xfdIX\xaf\x9a\x9c\x94~\xfd\xd68\x10\x96\x0a\
-\xf5!I{\x05\xa0)d9Vb0\x1a)?\x1a\
-\xa3\x90L\x03\x0e%C4\x94\x85\x92\xd2\x8f\x89\xbc5\
-\x17A\xa73\xbc\xb60V\x7f)\xc6\xe3@\xf5?\xa4\
-\xcaK\xa1\xc4\x06t\xad5b\x06Gf9oii\
-Y\xb8p!\xd1\xd2\xc6\x8d\x1b_\x7f\xfdu\xfdvf\
-kk\xeb\x14\x98\xcdi\x99\x81\x81\x81\xe3\xc7\x8f\xef\xda\
-\xb5\xeb\xf0\xe1\xc3\x8aGY\x02}\xf6H\xd4&!>\
-#\xc8\xf2\xe9\x1c\xd4o\x904\x1b\x1a\xb6\xa6\xa6f\xe6\
-\xcc\x99K\x96,Q\xc3\xd2\xaa\x16\x8ff\xeb\x89\x8c\x0f\
-b\x8e\xba\xba\xba\x19\xee\x17\xb5\xf4\xd2\xb3\xcf\x08P\xa7\
-\x08K*\xab8\xa1\x99\xba\x98\x91C\x00\xda\xdf\xdf\x7f\
-\xf3\xe6M\x04uzdL\xd0\x86\xb4\x9e\xfeV\xe78\
-\x1e-\xab\xfbR\x84Y\x08\x0c\x83\x8a\x8a\x0a\x1c\x8d!\
-a\xb9\x93\x91\x12\x07\x98\x1b\x9b\x09\xc8c\xbd_\xd7f\
-\xe5l\xa2\xa7\xe2\x9b\xb0\x91G\x06\xa3\x13gnoo\
-'(!La\xba\xd7,\xafQ\xebFo\x02J\x81\
-l\xb9c\xc2\xfb\x90\xf3\x22\x1d\x1f\x06\xeebG\x5c[\
-\x91K-\x92\x05\x85.R\xa5\x8a\x97\xcd\x9b\x9bU\xa2\
-\x09\xf1\xda|(7\xb4A\x0e\x1b\xd3\xb2\x10\x04\x9dE\
-\xd2r\x01\x01%q'=^]]]__\xcf\xba\
-N\x84\xcaZK\xdc\xa6\xceM}\xa06\xb9\xe0\xca\xb9\
-\x17\x96=n\x84\xf5\xa9\xb6\xb6v\xd4U*i\x97\x1c\
-aR\xb9\x86i\x94\x0b\xc8\x9c\xce\x9a\x0b\x0d'\xe2t\
-jU\x84{\xf7\xee\xe9\x81\x10Y\xd8\xc8,2n\x18\
-\xb1]]]\xcb\x97/\xef\xee\xee\xa6\x91\xb3\xdb'%\
-9\x1a\xd2\x835~\xaa\x17\xccLz\x1dq\x04zm\
-pp\xf0\xdc\xb9s{\xf7\xee=t\xe8\x10\x11U\xa1\
-]M\xa4\x08\xb4'\xcdK\xc7\xb1\x07f\x89\xa1\xd7\xd8\
-Q\xa8\xc1C\x5c'x\xbc*\x87\xd7\xe6\xf0\xda\xa0\xbf\
-p@z\x8ax\xf7\xe2\xc5\x8b\xec\x1c&\xfeW\x85\x1e\
-\x19\x0c\xe0\xe6\xdc\xdf\xa6omm\xcdNS\xa9d\x88\
-k\x8c\x04\x9f.\x80\x0c\xd4VJ\x22\xc3\xd0\xd0\xd0\xd1\
-\xa3G?\xfb\xec\xb3+W\xaeL\xa4\xc5b0\x1a)\
-'\x0cP}\xfe\x15\x06\xa3\x22\x19\xec#\x91\xbd\x0a\x8a\
-T\xf2ac~\x95\x97\x22\xd7\x96\xbdNi\x0a]\x7f\
-\x91\x13\x15*\x12R\xe8t)\x0aU\x85>\x85\xcf\xc8\
-`\xd7)\x1b;\x02Y\xcc\xd4\xe0\xf2\x13\xa4\x07:\x97\
-U\x81\x80\x89\xeef\x85\xd0_\x16\xd5\xf7B\x14\x98\x16\
-o\xe7'\x19\xe6VB@f[n\x9c\xbb\xb3\xefi\
-\xe9\xc6\xbdQ\x0ei\x94\x15\xa2\x5cC\x1a;J\xa0\x89\
-\x844\xcec\x92V\xc5\x9b\x08\x8295\xe7\x05d4\
-\x5c\x0c\x0d\x1b\xf6Ed\xac\xd0\x98\x04\xa3K\x97.\xd5\
-;\xa34\xb5\xcf\x08P_H\x90\x06\xe8#\x1d%\xa4\
-\x90\xa5\xb2\x5c\xe9\xc4q\xe8\xac\xcb\x97/\xb3Z\xef\xda\
-\xb5\xeb\xc4\x89\x13\x1aN\xce<2\x06h4\xb6d\x08\
-\xb8\xe1\xec\xd9\xb3g\xcc\x98\xc1\x0c\xa3\x06\x0fQ\xb3\x0b\
-\xaf\xca!\x0d\xc7B}'\x03\xce\xc2\x16t``\x80\
-\x9e\x9a,\xf1(\xc1(\xcd\xb2x\xf1b\x86t[[\
-\x9b\x05\xa3\xba)\x90Y^,W\x96\x86\x94FV\x03\
-\xb4$\xadt\xec\xd8\xb1\x03\x07\x0e0\xc8c0\x1ay\
-R`\x05ef\x9f;w\xee\xbau\xeb\x08FY;\
-q\x12\x94\x1a\xdc!\x18\xeb\x18\x92\xd5\x8cJ\xdei%\
-K\x89fy\xb1\xab\x0a/\x9b\xa3\x84P\xa3d\x8aR\
-NmeC\xe3\xb0\xc2T\xe5y\xcfU\xba\x12t\xa2\
-B\xb9\xe8SY\xd8\x83\xba2,\xeb\x0c\x13\x14<\xd1\
-\xe3\xec\xcbY\xe0\x19\x03\x0d\x0d\x0dz\xc7\x8b\xc5XE\
-&\x1d\x5c\xb6V\xa6/\xbe\xf8\x82\xb9\x9e]Vcc\
-#\x13=7+\x03n\xdc\x04\xa1d\x88\x94\x96\xe5\xac\
-\xbc\x9c\xb4\xa9\xc3\xf4`2g\x01<\x88\xc8\xa9\xb9\xb9\
-y\xe6\xcc\x99\xac\xc1\x04\xfa\x5cO__\xdf\xe4m\xd5\
-'\x01\x0bF\xc3'\xa3y\xdb\x13\xbd\x97r\xb8\x1eK\
-\xf0i\x87\xeb\xb1\xc4RYJ\x02\xf2\x9d;w.]\
-\xba\xc4j\xbd\x7f\xff\xfe\x0b\x17.\x90D\xa9R\x911\
-\xa1'\xca---\xf3\xe6\xcd\xeb\xe8\xe8`\x03\xac\x8e\
-S\xaeP\xb3\x0b\x92\xd6\xd4^U4\x12\x05}LO\
-\xb57o\xde\xec\xed\xede/:):\x8b\x0bf\x82\
-\xb2'\xa3\x16\xa6\xebX\x9c\xd0\xa6\x14\xfbT\x830\x1d\
-\x9d={\x96x\x94`\x94\x09\xdfk\xc7N|g4\
-R6\x18\xc7555\xed\xed\xed\xcc\xefl\xce\xe4\xd2\
-\xac\xa66\xbe\x11\x84d)\xc7\x07\xfe0&|\xb1|\
-\xe4\xbd\x92P\xe9\xab\xc8}\x8a\x0a(\xed.L\x90%\
-G!K\xf0\xe9\x0c*\x02\xd8P\xb3*\x97fT\x5c\
-\xc5\xa5\x1a\x83\xec\xc1d\xe9\x0b\x81\x81.\x09d\x0f\xee\
-^\x13\xbc\x91\xc3\x92\x08Di\xc4j\x84\xa1k\xd7\xae\
-}\xf9\xe5\x97_{\xed\xb5W_}u\xf5\xea\xd5,\
-\x1e\x8c\x04\x99M:h\x01\xe2i\x82\x89\xf3\xe7\xcf\xdf\
-\xb8q\x83\xd9\x16\x8d\xcfsp\xe3\x0cr\x9fp$m\
-\x94A\xfa\xd0\x1d\x84\xcbL\x90,\xa5\x81F!\xfe\x9c\
-9shIZ\x15\x16/^\xfc\xb4\xfdQ\xd6\x87\x01\
-m\x9b\xed\x8e,\x1a\xfc\xce\x15\x12\x90\xa5Tn\x16g\
-\xee\xd1)\xe8)&C\xe6F=\x7fE/\xcb\xc8X\
-\xa1\xe9\xd8\x83\x0d\x0d\x0d\x11#\xde\xcf\xfd<\x16\x8d,\
-d#\xc8\xb2\xce\x02\xcb-\xde\xf8t\x16=\xc5\xaeO\
-\xdfl\xd3\x9b\x00>oR\xa1\xfb\xb5\xa3\x84\x12\x91\xb1\
-5\x14B^\xc8R\xcd\xfa,\x94\xed\x01\xf3\xbc\x8a\x8c\
-\x8f\x18\x8cF\xca\x03\x83\x92%s\xf6\xec\xd9+V\xac\
-`\xd5D(\xbem\x95,\xe5c\xc7.I\x14\xb90\
-9\xa1P)\xe1U\xa5\x81\xbdV\xc1TA\xab<\x9b\
-U\x0aZ,\x05U\xa9\x06\x9b5\xb4(\xba\x8a\x1f\xd4\
-L\xae\x0c$\x08e\xc9\xd2\xaeS\x84Y\x12,\x09\xd4\
-O<Z]]M\xa8\xc4\x9ed\xf9\xf2\xe5[\xb6l\
-y\xfd\xf5\xd7W\xae\x5c9c\xc2\x7f\xb9\xf81\xa2w\
-\xfe\x14\x8f\xda#\xc9TC\x81\x92Yd\xe9\x8d\x1c\xd2\
-\xfb\xc4Hhpks3cE\xc4\x9bh\xd5\x8e\x8e\
-\x0e\xd6H=\x16b\x0d\x90Ad\x1c\xd0\xaa\xb43c\
-\x12\xd4\xe0RZ\xae\x84,\xea\xfaB\x06\xeaka6\
-\x9c\xa2\xce}Y\x8a#\xb2\x94\x91\xf1A\x0b\xe3\x8f\x10\
-65\xd0\xda\xc2\xa7\x1d\xb2\x912\x95\x95\x02K\x81\x5c\
-QQA\x18\xaa7\xe0mlL\x22\xec~E\xa8L\
-\x11\x1a\x8c\x15+\xcb\xecD[1#1A)k|\
-\xc4`4R\x06\x18\x94\x0c\xc4\xc5\x8b\x17\xbf\xfc\xf2\xcb\
-\x9b7o^\xbbv-C\x13\x97\xb6eU\x98\xb1\x08\
-e!\x83\x87G\xa1\xb3H\xa9\x5c\x08\x95\xe5E\xf5C\
-\xded^F5\x08\xb1\xf9\xd4\x04\x15\x07S\x82d\xcd\
-\xe9\x8a\x5cS\xb9\xbeLP\xca\x92\xa9\x5c/9\x94\xa4\
-\xd3\x15<\xb1Q^\xbat\xe9+\xaf\xbc\xc2\x90`\x7f\
-\xd2\xda\xda:I\x1f3p\xfb\x03\x03\x03'O\x9e\xfc\
-\xec\xb3\xcfN\x9c8a_\x886hCoZ\x00\x99\
-I\x90F-\x96\xa2\x90\x1ehU\x02}\xb5\xea\xa2E\
-\x8bh\xd8\xc9\xdb\x9eO\x0e4\xac\x97r\xa8\xb5}\xa2\
-(\xb24\xbc\xd6Ag\x81\xe99j\x93\x96\xf7\x1d\xc7\
-\xc8\xc4q-\xfd\x00\xaf\x0d\xc8\xab\x14y\xb3\xdc&e\
-\xc4\xc7z\x93\x85\xe4\xfe\x1d>\x1d\x90R\x86\xc9P\xb6\
-9J\xa4\xcc\x0ci0\xbew\xef^\x7f\x7f\xff\xf5\xeb\
-\xd7o\xdd\xba%\xe5\xf8\x88\xc1hd\xa20\xcf67\
-7\xb3@n\xdc\xb8Q\x7f<f\xfe\xfc\xf9l\x95X\
-)\xfd\xb0\x1d\xe9\x03e\xc1\xd7\xeb\xf0\xaa\x00\x9f\x91\x81\
-,\xf34\x84\x10)\xc1\xa7\x1d^U2:\x85\xb03\
-\x96\x82\x8cA\xe7U\x80hx\xa3\xa2P\x96\xa9S\x13\
-(IJ)BR\xb5\xd2\xa8*Y\x1a\xca-\x84\x8a\
-\x18)\xe3\x22e\xa9\x99\x01\xc0\x16e\xa1\xfb\x0b\xec\xaf\
-\xbd\xf6\xda\xe4}>J#\xdc\xbe}\xfb\xcc\x993\x9f\
-~\xfa\xe9\xd1\xa3G\x99v\x99\x7f\xed\xd9L\xaa\x89\xf2\
-\x82\x8d\x90L\xbb\x85\xa0\xf4\xd2H\x19\x92\xc2\x0e%i\
-\xbd\xfa\xfaz|m\xcd\x9a5===\xc4\xa6>;\
-\xf2pP\x97\x8d\x8az'\x94\x854r4\xc9\xa6\x8c\
-\x94\x0bk\xd2\x89\xb4-e\xd5M\x08\xc2\xf4\x12&\x1d\
-\xbar7\xeb<@Y0\xea}%M\x104\x82P\
-\x0d\x92\x11Xb\xe0\xee\xdd\xbb\x97/_f\xaf\xde\xdb\
-\xdb\xeb\xcc\xc7I\x0cF#\xe3\x87\x11\xc9\xd2\xd8\xdd\xdd\
-\xbdv\xedZ\x22Q\xc2P\x04\xd6HbS=\x16\xf5\
-v\xc1h\xf6\xe9\xb2\xe2\xab\x0e\xf0\x19\x05H\xb9e\x16\
-\x19\x80O\x8fD\xfaB\x06\xa3\x9e=D5\x84\xd7\xac\
-j\x854\x86\xcc\x0c4\xden\xe4\x0bm\x96\x1b\x1a(\
-)\xc8E\x83\xb1d\x8ef\xe3\x8az\x8dj3\xa5\xc8\
-&\x0b\xa1\xb2\xb6Qy\xe9\xa5\x97\xbe\xfa\xd5\xaf\x12\x8f\
-N\xd2\xe7y\xb4\xc6\xc0\xc0\xc09\xc7M\xf7\xe7\x1cQ\
-\x86-\x90j\xc0\xbc`#3\x1dA\xc6v\x14\xc8\xb2\
-\x84\xa4Ss;\x13\xd9TVV\xb6\xb7\xb7\xcf\x9b7\
-/\xfee\xa6\x09\x92jm)C\xf2*A\x05C|\
-F\x80:\x0eT9\xe8\x83\x08\x04o\x11y\x08\xf8\xfe\
-\x08\xf0\x19\x85\xb1\x1e\x91@\x91lH:)\xf0W\xec\
-\x90Fw\xc4QB\x16o]\xf86\xc3\x5c\xd5\x13\x22\
-\x03&\xc3\xa1\xa1\xa1\xbe\xbe>v\xec\xb2\x1c\x1f1\x18\
-\x8d\x8c\x1f\x9cv\xce\x9c9\x1b6l\xf8\xe67\xbf\xf9\
-\xb5\xaf}m\xcd\x9a5,\x93\xd5\xd5\xd5D\x1b\x8aD\
-m\xc8\x1a6\xb2\x1f\x0bv1\xba\xb0\x10\xe9S\x8c\xaa\
-\x0f\x0d\x92Z\x1c)\xb9\x14\x9c\xcb\x17l\x19\xd5\xa3\x0a\
-\x85\xf4\xa0\xa4\x95E\xd6\xfa\x87,\xa5\xcbOp\xf9I\
-\x92\x15\x91\xe9\x03\xb4:J\x0f\xee\x12\x12|:W6\
-%\x87\x06\xc5a\x0c\x00\x83\xa1\xa9\xa9\x89xt\xb2?\
-\x1f\xa5\xad4\xe7\xea\x07_\xd4V\xc2[\x94\x865\xa9\
-\x0a\xaa\x06\x90\xd2P\x83\xa7@O\x93\x12\x83\x12\xd3w\
-vv\x12\xe8\x13\xee\xcb>2A|\x13\xe7\xf0\xda\xa0\
-\xbfJG5X$\xcah\xe9\xef\xef\xbfv\xed\xda\xe0\
-\xe0`\xe8q\x91r\xe1]\xa8\x00\xde\xa8(t\x93\x04\
-_\xc6!\xcd\x14\x80\xbb\x0b\xf7E\xc2\xe7\xe5(t\xbf\
-)K\x95\x15\xa6\xd1jb\x9a\xf1\x11\x83\xd1\xc8\xf8!\
-\xee$\x18}\xf6\xd9g_|\xf1E\xfd\x11\xed\x9a\x9a\
-\x1a\xc64\x832\xef\xc8.\xaf{'\xdeP\x00o\x91\
-\x8fB\xb9)\xbd\xab\xe6\x81\xa6\xf4+\x0f\x0bJ\x16\xd2\
-\x14\xc2\x0c\x8a\xcc\x08F*)(\x18\x96\x95,%\xb9\
-\xc9#\x1a7\x191e\xdc\xbd{\x97-\xac\x11~=\
-\xdc\xd5\xf4\xe0J\x84\x92\xca\x12\xd2\x14\xc2\x8a\x08\xe2N\
-\xe2Q\xc2\xa6%K\x96\xe8\xf9\xe8\xf2\xe5\xcb'c<\
-\xca\x8d\xab\xf5\x86\x87\x87\x99|i4\xb5\x8f\xe1\xedJ\
-@\xcd\x08c-(\xfb\x8a\x8a$\x18]\xb6l\xd9\xaa\
-U\xab:::b<\xfa0\xa0w\xbc\x94A}\x17\
-\xe2328\xb7K\xfe\x10\xe8\xc9\x93'\x0f\x1e<x\
-\xfe\xfc\xf9\xf8\xbbN\x8f\x12\xf9\x0b\xf8t>\x8d\xf0Z\
-G\x98T\xee\x14\x80Q\xc7Pt\xa35\xc1k\x8b2\
-\xaa\xa5\x19H\x00\xe9\xc7G\x0cF#\xe3\x87x\xa2\xca\
-\xfd\xd4ycc#\xc7\xca\xcaJs\xe0\xbc\xe3r\x82\
-\x835\xa4xU\x89[d\xf0y\xb9\xb2R\x1a\xca*\
-\x9dl\x91\xb0\x9eP\x1e+jC\xf0i\x07\xb51\x95\
-\x10\x0c\x11\x06\xdd\xbbwO;Q\x8e\xa0\xdf:\xe9\xef\
-\xef\xe7\x88\x8c\xde,A\xc6\xd2\xdc\xbau\xeb\xca\x95+\
-\x9f\x7f\xfe9\xeb\xe2~\xc7\x91#G\xce\x9d;GY\
-\xbd\x04\xa9\x22\x02\x0d\x81\x17E\xc8\xd5o\x85\xda\x5c\xe6\
-\xaf)C\xea\x9ae\x8f\x80^\xef\x8f.Z\xb4\xe8\x95\
-W^\xd9\xb8q\xe3\x82\x05\x0b\xd8\xc9\xa4\xec\x9f|h\
-\x16\x9a\xa2\xaf\xaf\x8ffQ;'\xfdT\xa6\xbbP\xdb\
-\x0a\xaf\xca\x07NWYY\xd1\xd6\xd6\xb6f\xcd\x9a\xcd\
-\x9b7\xafX\xb1\xa2\xbe\xbe\xfe+#\x7f[*\xf2\x88\
-\xb1^\xd3x0\xd0h\xcc\x10\x8c\x1e:t\xe8\xf2\xe5\
-\xcb\x04\xa3\xaeD\xe4\xa1\xe0\xdb=\x87\xd7\x96\x86\xec\xd5\
-\x8f\xfa\xfc\xa1\xa2\xa2b2\xee\x99u\x0b`-`\x1a\
-\xe5\x1aR\xba\xa6\x1a\xd1Va\xaedP\xd2,\x11L\
-\x9f*>>\xe2\xcfLD\xc6\x0f\xeb1\x0bakk\
-\xeb\xec\xd9\xb3[ZZ\xe4\xba\xc9\xb8v\xaf\xdd` \
-Y\xc6\x22\x95\x1c7r\x03\xe1U9\xc6q\x0aw\x99\
-\x09>\xedP2<\xa6(\x92\x15\x92\xbdB\xb0R\xa9\
-\x5c\xf4\xc2dw\x8bI$\xca\xaaFD\x08\x84\x89 \
-\x99xq``\x80E\xee\xea\xd5\xabDH26K\
-\x901\xdc\xbe}\xfb\xe2\xc5\x8b\xfb\xf6\xed\xfb\xe0\x83\x0f\
-v\xec\xd8\x81p\xe0\xc0\x01\x02SB+\xce\xa2\xef\xf9\
-\xd2\xa12\xa6ZV\xd0k\xd7\xae]\xb8p\x81h\x15\
-\x1b\x17\x03%?t\xa2\x0b\xb3#pF\x09\x06Y\x02\
-Y\xb9\xc8\x94\x9d\xee\xbe\x0f\xceY\xb8\x92\xf3\xe7\xcf\xeb\
-\x82]\x89\xc9\x01wAC555\xb5\xb7\xb7\xeb\xc5\
-h\xdd\xa3\x08\xe5\x89Cm\xa9\x0a\xa5\x01d\xbaC\xef\
-\xc3\xb0\xbb8{\xf6,\x1b\x06F\x88\xcc\x22\xa5@\xeb\
-uww\x13\xca\xeb/0i\xe2\xf2y9\xa4\xc9\xea\
-\xa1\xf8\xb8\xb51\xcf\x11g\xc4\x8f\xf6\xee\xdd\xbb{\xf7\
-n:\x0b\xe7r&\x91q\xc2\x042g\xce\x9c\xe5\xcb\
-\x97\xf7\xf4\xf4d;\xce\xba,T\x16\xc2:\x11cd\
-K\xe2JL\x80\x97.]:}\xfa4\xf3\xea\xa4x\
-\x98M;\xe8\xd3\xa7e\xcb\x96\xb1SMMMY\x94\
-\x1b\x1eE)\xa5Bh+V\x0a\xfbs\xa0\xcc\xed>\
-c\xec\xc4`42~pQ\xc2\x1dV\xc4\x0eGM\
-M\x8d\xa6\x06\xc2\x0e\x18\xeb@\x1f\x13n\xea\xc8?A\
-\x8cz\x16\xbb\xb0\x14\xca\x05\xc9\x1cu\x17J\xa6\x902\
-o\x16\xb8BI\x96]\xa7\x04\xe9\x85\xe9\xf5\x8c\x0d\x9c\
-\x89GY\xd2\xb3\x80\x11J\xf6\xf6\xf6\x12t\xe2\xf0\x0a\
-=%0c\x9e<y\x92\xb0\xf2\xf0\xe1\xc3(1#\
-.\xc1\x12\x99\xa3\x81%\xf1\xdf\xa1C\x87\xb6n\xdd\xfa\
-\xee\xbb\xef\xb24\x1e9r\x84\x19\x84`\x94zX/\
-9\xcb\xd0\xd0\x10\xab\xa6\xec)N\x0cJ.5k\x96\
-a\xf1&\x08c\x8e\xb36\x09\xaf\x93c\x08\xb9^\xca\
-!\x0de92y\x9d9s\x86\x89\x9e0\x9a\xf3\xba\
-\xfc\xc9\x01=E[\x11Rw:\xf4\x07\xc6\x94\xe5\x9a\
-\xc4\xf7\xa9n\xd60}\x883O\xcct\xccb\xb9)\
-\x94\x9b8\xd8W\xbe\xc2\xc5\xa8\x9b\xe8\xb8\x89,\x03O\
-!LVD3\x04\xa3D66q\xf9\xbc\x1c\xd2d\
-\xf5\x22\xdb\xa7 \xe30\x8b~\xb9q\xe3\x06\xaew\xf0\
-\xe0A\x04\xba\xccgD\xc6\x05\xc1(\xaeG\xc8e\xc1\
-\xa8\xcfp\xd0\xfe\xd6_&dI\xf5\x9dJ\x09i\x98\
-ro\xde\xbc\xc9\xbc\xc7L\xc8|\xf5\xe4\xf7\x9a\x05\xa3\
-\x84\xe9\xe1\x9f\x03\x05\x09\xee\xe6F\x08&\x87H\x1f\x92\
-W\x19\xc24\xceR\xc2J\xa1\xa5\xc4k\xc7N\x0cF\
-#\x13\x82`\xb4\xb2\xb2\x92Ht\xf6\xec\xd9\x8d\x8d\x8d\
-\x04\xa6\x0a8\x18\xc1\x08\x1a\xc7\xc9\x18w\xb8\x12\xe5\x81\
-\xd9$5\xa1\x18\xfed\xc1\xe9\xcc\xd2\xf4\x12B\xa4\xcc\
-\x1e%\x98lHczg\xe25\x9c\x8e\x18\xcb]`\
-r^\x19\x803\xf16\x22\x894\xdd#\xcf\xe4i\xa4\
-\x03Y\x11\x0f2\xbbs\x1d\x89\x0e\x895?\xf9\xe4\x93\
-m\xdb\xb6\xed\xd8\xb1c\x8f\x83\x80r\x9f\x03\x01X\xea\
-\x08J\x8e\x1f?\x8e`J\xcc$sD\xde\xb9s'\
-\xc2\xa9S\xa7X\x14\x09=\x81\xc8\xb5\xaf\xaf\x8fP\xe6\
-\xec\xd9\xb3\x9c\xe2\xd3O?\xc5\x00T\x1cA\xbf\xacy\
-\xe7\xce\x9d\xd6\xd6\xd6Y\xb3fY\xf8ew\x97\x97\xf0\
-\x1e\x0d))\xc5\x1dqRf.\x8e\xc8E\xeay\x02\
-\xe1j\x89\xcb\xbb\xba\xbaX\x0b5\xe0i\x10\x8dy\xbb\
-\x91\xf0\xf6\xed\xae\x954\xd0+KG\xd3\x08i\xb2P\
-\x8fU\xa5`TK&#\x84}H\xf6,\x91\xbc\xd0\
-\xc2\xc41\x8b\x16-b\xe5f\xe2\x1a_0\x9a\x023\
-\xb3\x94\xc0\x91\x1eQ0\x8as\x11\x8f\x22\xe0\xd1\xb2\x89\
-\x8c\x0f\xf6\xc3LDD]\xdd\xdd\xdd\x9a\x8e\xe4}\xc2\
-uBI\xfd\x15\xa2\x22\xce\xb7\xbc\x07\xc9\xb3\xce\x9f?\
-\xcf\xb6\x99^c\x99\x93\xfe\x89\xc5\x82Q=\x19\xd5{\
-\xe4\xd6\x1a\x12 TJ\x0e[\xaf\x10*\x02y\x93\xe1\
-\x93Q\xdaM\xcaq\x10\x83\xd1\xc8\x84\xc0{Y\x9b\x19\
-\xfd\xecVg\xcc\x98\x81\xac=\x99\xf0F\x0f\x01\x9b5\
-\xc0\x9f,\x8742\x08\xcd\x84lRHo\xb9)\x81\
-c!d\xc6Y\x88)\xbd*(\x8b\x9f\x83%\xedb\
-,\x89\xeb\x12\x112\xd9\xe9A\xa6\x8e\x84\x86\xd7\xaf_\
-\x97\x00z\xa2I\x18\xfa\xde{\xef}\xfc\xf1\xc7\xc4\x8b\
-,lG\x1cL\x01\xc7\x8e\x1d#X$\x94\xbct\xe9\
-\xd2\x85\x0b\x17\x084\xd1(+\x04\x0dz&V*\xd4\
-\xa7N\x06A\x0c\xa7\xa3\x06\x99\xe9\x08\xc4\xb5\xa7O\x9f\
-\xa6NBF\xfa\x94\xa9\x9f\xf0\xcb~>\x96\xfb\xca\x06\
-aE\xd0-'\x0d\xe1\xa0\x087\xce=\xda\xcf$M\
-\x22\xaa\xaa\xaa\xd8}\xb1\x22\xeaQ\xb1\xe2\x18\xd7\x96I\
-;\xe8\x06e\x09\xa1\x1c\x223\xf0\xe9\xb1\xa3\xe2t\x01\
-\x01=\xddJ'\x22\xf8\xbcHQ\x18\xcfLY+V\
-\xacX\xb5j\x15\xfdH\x87\x16\x0aF\xb3JC\xb9!\
-)\xa5\xcc\xec\xc9(n\x8b0\xe9F\xfb\x93\x06}\xc7\
-B\xc3\x5c\xc4.B\x7f$\xc9\x9a\x1a\xc2\x96/\x1d\x15\
-\xb1#\x8e,\x9f:y\xf2$\xb3+\x9e5\x19\x83\xd1\
-\xb0\x1d45\x85\x90\x1b\x1a\x84\xf2X!\x18eq\x89\
-\xc1h\xe4\x89\x80%\x99\x09\xa2\xbd\xbd\x9d\xe5Yo\x16\
-\xa6\xc6z\xd9\xc9z\x97\x91=\xaf\x19++\xef\x85\x85\
-Y\x1c\x0d\x97Y\x103\xe0\x14:\x8b\xee]J@\xb6\
-,%9\xb2>\xdds\x9f\xbc3\xdf\x11\xf3\xed\xda\xb5\
-k\xfb\xf6\xed;w\xee\xdc\xb3g\x0f\xb1\xa6\x1eOr\
-\xdc\xbbw\xaf\x8e\xe8w\xef\xdeM\x80Hh\x88\xe7\xdf\
-\xbau\x8b\xb2\x06\xc1\xa5\xde\x0d\xe5\x88\xec\xb5\x19d\xc6\
-\xa9u%!\xcc L\xbe\xa9\xb2$\x81j\x89\xb3\xeb\
-\xeb\xeb\x17/^\xbch\xd1\x22\xe6;=\xfc\xe6Ft\
-k\xbe\x8a|dsu\xfb*\xae\x9f\xed$\x86\x9e\x5c\
-!\x94\xeb\xcc\xe4u\x0b\x22\x98\xc6\xc6F\x96C\xe6}\
-\xee\xc8g\xe7\x06\x8fO\x04#\x04\x94\x15RHY\x04\
-\x9d\xcb,9;\xdd\xa4W{\x19\x1b\xce$R\x0c\x96\
-m&\xab\xa5K\x97\xbe\xf0\xc2\x0b\xac\xdc\xad\xad\xad6\
-ey\x8b\x1c\xd6\xc8Y\x94\x15\x22\xa5\xe5\xda\xe0\xb7'\
-\xa31\x18-\x0b\xb4-SP]]\x1d!\x17}W\
-]]\x1d\xf6\x1d\x82\xc9\xa5\x93*N\xdf1U2A\
-\xe1Vl\xc8\x89\xb1\x9e\xfc9*\x15\x8c\xea\x91\x81\xcf\
-\x1b\x0b*\xe5\x9a!\x0f\xb2\x11J\xd2Vz2z\xe0\
-\xc0\x81\xcb\x97/\xc7`4\xf28Q$\xc4\x84\xde\xd9\
-\xd9\xd9\xd1\xd1\xc1\xec\xa0\xc7\x0c\xa9\xb1[^l\xae/\
-D^\x03]\x92]X\xca\xc6r\xcd KX\xc4\xec\
--\x092 \x80C\x80\xe4c\xf8\xdc\x97\xcaA\x1a\xa2\
-\xc9\xde\xde^\xe206\x94;v\xec\xd8\xbau\xebG\
-\x1f}D\xd0\xc9\xe6\xf2\xe0\xc1\x83\x87\x1c&\x10\x83\xb2\
-;\xc7\xcf\x99\x1c\xad\x9eG\x06g\xa47\xd9c(\x18\
-EP0\x0a\xba\x17oW\x80\xf0\xc6\xc1\x9a\x88\x01\xc3\
-\xc2|\xe6\xcc\x19\xa6\xfbI\xf75&.~hh\x08\
-\x81\xb5\x901O\xa4n\x03^\xc8L\x84I\xdd\xa6i\
-R\x96)Fm\x93\xe4L\xb9_\x9c>{\xf6\xec\xa9\
-S\xa7n\xde\xbc9\xb9Z\xf2\xd1C\x8b\xd5\xd6\xd62\
-\x927n\xdc\xb8~\xfd\xfa\xee\xee\xee\x22\xdf^2\xa5\
-\x04KZ#\x9b^ +\x8b#\xc8\xf1\xe9 <\x97\
-='\x0b\xf6\xf5\xeb\xd7c0:A\x08\xeeiC\xf6\
-`\xac5s\xe6\xcc\xd1\x8c\xa4\xc6\x07\xeb\x881A\x11\
-z\x0a\xc1\xf5\x9b\x17\xd8\xe31\xeb\x9e<y\xf2\xe2\xc5\
-\x8bl\xce\x9d\xe1\x93\x8b\x05\xa3\xfaC\xc1\xe1\x93Q\xdd\
-\x91a7\x18\xeaC\x19\x8a\xb7a\xd2\xc4\x0eU\xc2\xf0\
-f\xa3\xb5\x7f\xff\xfe\x09\x06\xa3\xa3\xbf.\x10\x89\x14\x87\
-9\x97U\x10\x8f\xd5\xc7\x19a\xec\xf5\xb8H]\x80w\
-\x9d\x1c^\x9bA\xa5\x12\xf7\x9a\xf0\xf5+\x5c\x03NG\
-\x83\xe8\xb1%\xdbk\xe2\x06\xc2\xaf\xdd\xbbw\xff\xe9O\
-\x7f\xfa\xc9O~\xf2\xf3\x9f\xff\xfc\xcf\x7f\xfe\xf3\xb6m\
-\xdbX\xa8\xd0\xeb\xe5?q-\x80\xe6ef\x9c\xf8U\
-\x8d\x1bN\xcd,\x03\xea\x5c\x8e\x80\x9e\x1b\x94A\x8aB\
-\x8d\xac[`\xde$  \x8cc\xea\x9c7o^C\
-CC\xa1z\x9eL\xb8\xf7\xc1\xc1A\xf6\x12\xfad\x9c\
-fa\x81,\xde;a.\xb2\x92\xa12\xa4\x90^\xa8\
-m]\x1d\x89\x19\x9b@\xd6\x9e\x85\x8e\x96\x96\x96\xc9\xd5\
-\x92\x8f\x05\xd6\xe9\xb6\xb6\xb6\xf9\xf3\xe7\x13\xcad\x1fl\
-\x1bjaP2\xef\x90\xb6\x5c!{\x03\x8d\xdc\xa4\xa2\
-\xa2\x82>joo\xaf\x8a\x7f\xbe\xb5\x1c\xd0\x17\x04\xa0\
-\xda\x15{\xd5\x84\xa1NA\xc7\xe1\xceL\xd7\xcc\xba8\
-8\x91\x16\x0e\xee\x8d&\x156\x08CR\x9a\xd0&\x95\
-\x95\x17\xdfF\x0ei\xc2\xe2\xa5\xd4P\x848sE\xca\
-\x00\xde\xdb\xdf\xdf\xcf\xf2|\xd5}\xa1{\xd4\xb5\xb9,\
-h\xf4\xe7\xc5[\x14\xc0\x1b93/9\x94t&\x9e\
-P/L\x1f\x1eC\x5c~\xe2\xb4\xc8D\x907n\xdc\
- L?{\xf6\xec\xe9\xd3\xa7O\x9d:u\xfc\xf8\xf1\
-\xbd{\xf7\xfe\xf3\x9f\xff\xfc\xf5\xaf\x7f\xfd\xcb_\xfe\xf2\
-\xaf\x7f\xfd\xeb\xbe}\xfb\x087\x89V\xd5hEP\xcd\
-\x8f\x1e\x16T=\xca%V&\x08SH\xcaQ\xd7\x8c\
-A\xdek\xb3\x09K\x17o\xa0Q0\xda\xd3\xd3\xf3\xe2\
-\x8b/n\xdc\xb8q\xd1\xa2E$]\xa1I\x037b\
--\xa0\xfb\xa2M$x\x8b\x0c\xa9,%\xb3\xca\xbcz\
-\x11\xe6\x02gd1&\x18%\xcaY\xbdz\xf5K/\
-\xbdDK\xd6\xd5\xd5\xc98R\x08\x86%q\x0c\x01\x22\
-(\xa0)4Pu\x14\xa1\x9c\x97\xbc\x06\xd4\xcch'\
-\x06\xa5\x8f\xba\xba\xba\xe2/\xc2\x96\x85\x9a\x9a\x1a\xfb\x14\
-N}WF\xe8G\x9c\x9a\x19\xef\xf2\xe5\xcb\xcc\xdb\x1c\
-'\xddG7!\xd9+G\x93R\x86\xc9T\xd6\xa8\xb8\
-\xca\xca\xd38\xd11\x22e\x80}$\x91h\xf25\xec\
-}\xfb\x88\xbd\xee\xba\xafH\xa7\xf0\xa6\x13\xc3\xaa\x0a+\
-\x94\x12R\xc9\x10e\x81d)AJ\xa1\xa4\xe9\xc3d\
-\x8a\x94\x9ed\xa8!J\xd0\xc6\x9a\x00t\xf7\xee\xdd\xef\
-\xbc\xf3\xceo\x7f\xfb\xdb\x9f\xfc\xe4'\xff\xf7\xff\xfe\xdf\
-\x1f\xff\xf8\xc7\x84\xa1\x04\xa3\xfb\xf7\xef?w\xee\x1c\xa1\
-*\xb1;\xf6\xaa\xe1\xc9\x84\xa8\xab\xaf\xaf\xef\xf0\xe1\xc3\
-\x84\xd1\xc4\xd3\xfa\x84ZK8p\xbf2\x13J\x9a2\
-\xb5T\xa8q\x10\x08\x02\xf4\xa1\xd2\xf3\xcf?O\x08\xa5\
-O\xbae3)\xe0.\x88D\xd9l\x80\x82\xc2lS\
-\x08\x94y\xf5 \xbd\x0c\x84%]~\x1e\xc8\xd2\x06\x80\
-\xd3qRA\xac3{\xf6\xec\xc5\x8b\x17s\x8c\xcf\xde\
-J\xc1Z\x0f\x99\xee\x03\xe9\x0b\xa1\x1e)\xd4/I\x87\
-\xe53\xd0\x90\x00\x09\xea\xb8\xc8\xc4\xa11\xe925,\
-\x9d\xc8\xd1g\x94\x06\x05\xbd\x14\x80Rh0P-3\
-\x125\x8f\xb5\xf2'\x07\xee%%\x94\x8ek\x89\xfc\xad\
-\xe4\xa5\x80\xbc\xcaq\x10\x83\xd1H\x19`\x9e\xbdv\xed\
-\xda\xa7\x9f~\xbac\xc7\x8e\x13'N\x10\xaf\xe8\x89\x91\
-\xcf.7\x89\xa3\xb8YCS\x92\xd7\x8e\x06\xd3J\x11\
-\xe3TVr\x82\x1cv\x22\xf0\xd99\x03\x09zX(\
-\x90\x09Ph\x0d\xe26\x22\xd1\xbf\xfd\xedo\xbf\xfa\xd5\
-\xaf~\xf6\xb3\x9f\xfd\xdc\x81\xfc\x8f\x7f\xfc\xe3\xe0\xc1\x83\
-\x84w\xf6d\xf1\x09\x87\x1b\x1c\x18\x188r\xe4\xc8\xb6\
-m\xdb\x08I\x09\xb2\x09\xb5\xd5\xbf\xdc/\x06\xa9\xf9:\
-i\x17\x87\x92n>\x7f`\x80\x9eR\x1c\x99\xee\xab\xab\
-\xab[[[[ZZ\xf4-\x04o\xf1\xc4\xc3\xc5\xd3\
-\xcb\xec\x22\xae_\xbfNG\x0f\xba?O\x852\xbcS\
-\x92\x864a#\x80\x92\xa1\x01\x84r\x16W\xbd\x87\xa4\
-\x95\xb5db\x14)\x99\xb0\x01\x81\x11h\xa8IC\x1b\
-\x13dl8\xab\x07\xb9 \xa5\x1d\xd13T\xce\x9f?\
-?\x19\x7fX\xf7\xc9\x04\x8f\xa31\xcf\xba\xbf\xf5\xc0,\
-J\x0b'=\xe1\xf0\x169\xbc\xd6\xe1U\x85q}\x98\
-\xbc\x22\x0fl\xea:;;\x17.\x5c\xa8_\xfe*\xa5\
-\xf8\x93\x83n$%\xb8\x9c\x84\xd4\xbd\xb8\xb6\xf1cU\
-\x9aQI\xd5\x86\xbf\xf8\xc4\xc4\x88\xc1h\xa4<0)\
-\xb003A\x5c\xbdz\x15\x19M8d\x1f\x06\x89\x9f\
-9|\xba0\xe6fY\xa1\x08V9\xce6\xcd\xfd\x9c\
-$\xc8\xf7\x10\xa4!\xc9\xeaBdv\xd7\xfd\xc1\xf7[\
-\xb7n\xb1\xde\x5c\xbati\xcf\x9e=\x7f\xf9\xcb_\xfe\
-\xf4\xa7?m\xdd\xbaU_\x84?s\xe6\x0c\x0b\x12Y\
-\xb4\x12f\x93\x22\x0c5\xb8G\xeeK\xd7\x8f\xa0\x05\xc0\
-\xe79\xb2\xed)\x03\xf4!\xca\x02rIN\x9f>\xbd\
-\xa1\xa1\xa1\xa3\xa3\xa3\xad\xad\xad\xb2\xb2\xd2\xe7M\x06h\
-\x10\xb6\x13\x07\x0e\x1c\xd8\xbe}\xfb\xd1\xa3G\x09\xd0\x09\
-O\x93\xe1\xe2\xf0F\x8eP\xa3F\x10\xd2\x14'ef\
-\xf5 \xa8\x12Ww\xf234\x17/^d\x13\xc8\x91\
-\x8d\x90l\x22\x85\xa0\xdd\xc2p3\x0bM\xea\xa5\x1c)\
-\x8dk\xfb\x04d\xd7\x03I\xae\x04\x06\x06#\xc1\xb6\xe2\
-\xb2a\xafB\xd8t\xe3\xc6\x0dz\x8add\x82\xd0\x9e\
-\xda\x072\xe5\xaa\x9d\x85Z;/\xa1Y\x16r]\x7f\
-&\x90\xe4\xc8t4c\xc6\x0c\x22Q\xb6\xca\xc8\xd2O\
-\x01\xec\x06SI\xd3\x00\xadQ\xbc\xb90\xc6\x80\xa1\xce\
-Q2\xf8\xbc\x09\x10\x83\xd1H\xd9`\x0af-$R\
-a\x98\x92t#\xfc\x01\x1a\xb2B\xf6\xe3\xc6\xd7\xe2\xf0\
-*\x874\x9c\xcb\xa7\x1dJ\xa6\x94\x90\x5c\xd3H\xa4W\
-%\x08\xb6b\x91\x94\xe3q\x04n\x13\xb4\xe4p\xb3@\
-\x5cB\x94\xa6_H&& \xfa\xfc\xfb\xdf\xffN$\
-\xfa\xc1\x07\x1f\x1c?~\x5c\x8b\x10\x13(E\xc2\x85j\
-\x12\xa1{\xd7\xf5#\x13\x85\xd38\xe0\xb3\x8b\xa2\xb6\x05\
-%)n\x10\xd0\xd7\xd6\xd6\xce\x9a5k\xd2=~\xe0\
-\xe2\x09@\x0f\x1e<\xa8_B8v\xec\x98z\x99V\
-R\xae\x99I(\x82\xee\xda\xb5P\x82\x94\x22,\x9e\xad\
-J\xc6\xe89\xef\x85\x0b\x17\x88\x8c\xed%\x8aH\x11\x18\
-\xbd\x15\xc1\x1f.\x06\x9f\xe1\x1a3\xdb\xceYMX\x04\
-TJ\x90E\xcd\xaa\x5cY\x9a14Q\x90T\x91\xc8\
-D\xa0\x19iL\xcd\xa84o\xf1V%7k \xa5\
-!e2\x14r=\x8b\xc0V\xb9\xaa\xaa\x8aH\x94\xde\
-\x94r2bwdH\x93\xdcjNp\xea\xb1\x11\xb6\
-\x1b\x0b\x01m\xa57\xb0\xa5\x19\x1f1\x18\x8d\x94\x07\x1b\
-\x9a\xcc\xbc\xa3N\x10e'\xe5Q\xce\xd1F\xe03\x0a\
-\xf8\x9el\xc0.;q5\x87\x92\x02\x03\xad4\xc8\xdc\
-#\xb3\xe1\xe0\xe0\xe0\xc5\x8b\x17\x89>\xff\xf8\xc7?\xfe\
-\xf2\x97\xbf\xfc\xc5/~\xc1\xf1\xf7\xbf\xff\xfd\xfb\xef\xbf\
-\x7f\xe4\xc8\x91^\xf7wq\x14\xa0Lv\xac5\xd4P\
-B!\xa9O\x14\x98\xdaLoYV\x8f\x92\x22\x95|\
-\xf2a\x9c_\xbf~\xfd\xd0\xa1C\xef\xbd\xf7\xde\x87\x1f\
-~x\xf4\xe8\xd1\xfe\xfe~\x05\xeb20!\xc45\xc3\
-\x08\xa4T.\x84\xb2\x91\xb7*S\xbaj\x92/\xe50\
-2\xf3\x16\x8f\x18\xac\x9a\x8d\x8d\x8d\xad\xad\xad\x1cY>\
-\xd5t\x8ca\x9f=^\xd4\x17\x1cqvPR\x95K\
-/\x8d\x09\x91\x09\xa2\x86UkK\x93\x97\x12[;\xd5\
-/\xaa|\xf2\xa2\xebO\x06\xdfH\xc1\x90&\xc4g\x8c\
-\x11\x15\xc4\xa7\xda\xda\xda\xf43[\x13q\xa5\x18\x8cF\
-\xca\x86\x5c\xda\x06\xb7\x92\xa0\xdc\xb2\xa3\x13\x09%\xa5\x17\
-\xd2\x83d)\x85\xf4!>#\x80\xcb\xd64\xa7`K\
-\x1a)\x098\xee\xe4\xbe&\xaf\x17C\xff\xf2\x97\xbf\x10\
-\x86\xfe\xf4\xa7?\xfd\xf9\xcf\x7f\xfe\x9b\xdf\xfcf\xeb\xd6\
-\xad\xc7\x8f\x1f\xb7\xf7\x99\x5c}S\x0a\xbb\xa9T\xd3)\
-\x99mO4F\x12\xbd\xe6\xfez\x13\xf5\xd0\x92\xfa\xc4\
-m2~\x82I<\xca\x95\xef\xdf\xbf\x9fx\x94ap\
-\xf9\xf2e=\x1cM\x06\xcax\xfb]\x05U\x83\x90>\
-\x85\xce\xa2&%\xa8\xea\xee\xee^\xb3f\xcd\x92%K\
-X\x0f\xd0x\xa3\xc8H\x18u---\xb4\x12\xcc\x9c\
-9S\x7f\x05\xd4\xe7\xe5C\xcd\x0by\x93\x85P\xaf\x81\
-,\x11\x18'L\x1a\x1c\x91e\x13\x99 j^\xe1U\
-\x13#\xe90\xd7;\x9a\xa0\x80\x9a9N\xba\x0d\x9e\xae\
-\xd6\xae\xb9\xc8\xc5\x93U$7/*\x02\xd6DP]\
-]\xdd\xd3\xd3\xb3j\xd5\xaa\xb9s\xe7\xe2S\xdet\xec\
-\xc4`4Rf\xe4\xd5\xa0\xf5\xd2k\xcb\x8a|@\xfe\
-\x00J\x9a^6vj4\xe3\xb8\x0cJ\xa9f\x9fv\
-\xcb?+\x8a^\xff:s\xe6\xcc\xce\x9d;\xff\xfa\xd7\
-\xbf\xfe\xeew\xbf\xfb\xc3\x1f\xfe\xf0\xe1\x87\x1f\xeao\xb8\
-\x13\x9b\x92\xa5\xdf\xb7\xc2\xde\x97\x9c*\xa85\xac\xcd\x91\
-\xc3\x86\x95\x86#\x98Ax\x04\x95\x05)\x01\x99\x8d5\
-L\xd2\xa7z\x0c\x09\xe2\xd1\xcf?\xff\x9c\xde\x1f\xeb\xef\
-\x9a\xd9\xfd\xca\xdeJ!\x18\xa1>\x85\x0c\xa8\x84\xc5\xa0\
-\xab\xabk\xed\xda\xb5\xcb\x97/\x9f1cF\xf1\x00\xeb\
-\xa9E\x0d5{\xf6\xec\x15+V,^\xbc\xb8\xad\xad\
-\xad\xca\xfd\x15P\x1b\x8d23\xd0dQV\xb6G\x94\
-%\x1bP\xd7h\x02\xe4\xe8>\xa2O^^\x22)\xfb\
-\xc8\xc4\xa11\xe9;Z\xdb\xa7\xf3Q<7\xc4,\x93\
-\x9es S\xffd\x9c\x97t\xc1\x1cMpj\x8f%\
-\xfd}:\xa4)\x1d*\x91\xe3\x00\xb3w{{\xfb\xc2\
-\x85\x0b\xe7\xcc\x993\x91_\xf3\x88\xc1h\xa4\xcc0\xb2\
-Y\xa15\xf3\x1a>\xaf|\xc8\x194S\x84\x90\x95:\
-\xe3D\xceNY[Q\x08C\xfb\xfa\xfa\xce\x9d;w\
-\xf4\xe8\xd1\x1d;v\xfc\xf9\xcf\x7f\xfe\xc5/~\xf1\xeb\
-_\xff\xfa\xfd\xf7\xdf'\x10\x19\x18\x18\xd0\x8b\xa1\xac:\
-\xdc\xfeDN\xfa\x84\xc3\xad\x19^\x95\xc3\xf7A\x80\x94\
-\xa9\x5c%)>m\xda\xb4\xa6\xa6&\xf6\xd3LdL\
-g\x15\x15\x15\xca\x9a\x5c\xd0\xdd\x83\x83\x837n\xdc\xd0\
-\xb3p\x05\xa3\x82\xdc\xf0\x96CRJ\x19\xeb(\x5c\x05\
-\x1e\x92a=&\x90\xc5\xc8\xd4\xab\xb7\x1d\x1d\x1d\x9d\x9d\
-\x9d\xb4'k\x83\x19DB\x18`\xad\xad\xad\xdd\xdd\xdd\
-\xf6XT\xd1L\xa1\xe6R\x96!\xa5\xba#\xc4g\xe7\
-\x90R]\xc3x\x18\x1a\x1a\xba~\xfd:c\x83\xf9\x81\
-\xb1\xa1\xdc\xc8\xc4QS\x87m\x9e\x97\xbc\x06Rf\xf1\
-\xd99\xefC\xb0A\x22\xfdd\xc1.XBro9\
-t_\xe3\xc3\x9aEBX!\x0d\xc5Dd\x11\xea8\
-\x88\xc1h\xa4\xfch\x80\xa6\xf0ye\x82A\xaf9\x02\
-\xa41\xa18\xfej\x82\xeb\xf1i\xa7\xb1J\xb4\x90\xb0\
-~\xdcq\x7f\xb1\x9d\xb5\xe4\xec\xd9\xb3\xbbw\xef\xfe\xc7\
-?\xfe\xf1\xa7?\xfd\xe9o\x7f\xfb\xdb\x07\x1f|\xb0o\
-\xdf\xbe\xe3\xc7\x8f_\xbcx\x91XD\xc5\xa70a\xf3\
-ZsI\x96 \x92\xfe\x18I^\xbd\x94\xf4`]]\
-\x1d\xc1\xc1\xa4\x0eF\x81\xa1\xc2n\x84\xbd\x0a\x91\x87\xb6\
-\x22a\xfb\x18\xd2\x88\xbc\x1a/e\x901\xf8t\xae=\
-\xa5\xe1\xa8\x96\x9c5kVWWWss3\x0b\x83\
-\xcc\x22\x06\xcdE\xb3TWW744\xa4\x22Qk\
-X%\x8dP#\x03#\xe9\x0cW\xcar%\x88dn\
-\xfa\xcaW\x98C\x18\x15'O\x9e\xd4\xc7&\x8c\x0d4\
-\xaetd\xa2\xd0\xc8^\xca`\xbd\x09f\xe6\xba%\x91\
-\xc3\x5c\xc3r%\xd3w\x0c\x0f\x8d\x10)'#vS\
-\x12@z\xc3\x0d\xe1\x11\xf8\x0cW\x84\xa3\xd7\x8eD\x06\
-!\xccx\xbd\xbd\xbd\xa7O\x9f\xd6{J^;vb\
-0\x1a)3\xe1\xa0\xf7\xe37\xc0gL\x0c\xe7Y\x0f\
-\xbcEJ\x93-7D\xb9\xe0\xd3\x01\x18\xfb<\xf70\
-\x03\x88-n\xdd\xbau\xe3\xc6\x0d\xbc\xeb\xfc\xf9\xf3\x84\
-\xa1\xc7\x8e\x1d\xdb\xb9s\xe7_\xfe\xf2\x97_\xff\xfa\xd7\
-\x7f\xf8\xc3\x1f>\xfe\xf8\xe3S\xa7N\xe9i\x07\xae\xe8\
-+\x9a\xd2\xd08^rd[\xb8\x14T*\xe9\x1e7\
-\xe3sd3Md@|\xa0\x9f\x1aE#\xcb\xc9\xc5\
-\xf0\xf0\xf05\xf7\xbbf\xfa{-\xf6\x00L\x83J\x82\
-4\x85H\x19d\x93\x86\x92\xd2\x0bF,\xedF3\xce\
-\x9b7o\xdd\xbauK\x96,ill\x9c\xa4-\xf9\
-P\xa1M\x880\xf4M\xafl\x9cA\xae1\xd6\xa1\xa8\
-R\x06\x1a:\x85Qq\xf5\xeaU\xb6\xac\x1f}\xf4\xd1\
-\x91#G\x08LQ\xca>2A\xcc\x11B_\xb0\xa4\
-\x09`=R\x880W\xc6\x821@%\xf6A\x87\xb7\
-\x98$p\xfd^\x0a\x90\xd2\xdd\x9c\x17tk\xe0\xf2\xd3\
-\x13K^R\xf6\xb4\xcf\x9d;w\xce\x9d;\xc7\x8e\x8b\
-}\x17\xb3\x9f\xb2\xc6A\x0cF#\x0f\x1d\x0d_\xf0\xe9\
-\x91\x03zL\x98#Y\x0d\x12\x843I03\x83\x5c\
-V\x02\x8e\xe8\xb3+\x8d\x92\x0aCo\xbb\x1f3?q\
-\xe2\x04\xd1\xe7?\xff\xf9\xcf\xbf\xfd\xedo\x7fv\xfc\xfd\
-\xef\x7f\xff\xf0\xc3\x0f\xf7\xec\xd9\xa3\xbf#?44\x14\
-\x9e\xf1\xe9\x81\xb6\xd2Z\xaefT\xd3\x15Gf\xe0\xd3\
-\xb9\x06\x97\x92zT\xa1\x94\x93\x11\xa6c\x86\xc4\xe1\xc3\
-\x87?\xff\xfcs\xfd9\x83d8:tS\xc5o\x0d\
-3/\xe5H\xda%\x874)\x1bW\xf7\x88\x01_\xe5\
-\xfe\x0e\xd3\xb3\xcf>\xbbz\xf5\xea\xd6\xd6VB.\x9f\
-\x17\xc9\xa0\xd6\xc3\xdfmN\xf0\x19\x0e\xd7\xea\x1e\xaf\x1a\
-\x09E\xbc4\x12_\xc6\x95\xa2fF\x05\xc1(\xd3\x05\
-\x03\x03a\x22\x0f\x8d\x22Y\xac\x17\x92\xbe\xcc\x90\xcaR\
-2\x8b:K\xa8\xef \xb4\xd7 \xf1\x89I\x85\xbf\x99\
-\x1cY\xa5\x92\xd2\x8f\x095)(\xc9tw\xe3\xc6\x0d\
-&@6\xe4\xc8R\x8e\x83\x18\x8cF\x1e\x0a6\xca\xfd\
-\xb0u\xc8\xb1}\x22@\x96\xe3`LeuI:c\
-\xe2\x8b\xc1\xbe\x10\xb80}\xb3\xfb\xec\xd9\xb3\x07\x0f\x1e\
-|\xff\xfd\xf7\x7f\xf3\x9b\xdf\xfc\xecg?\xfb\xc9O~\
-\xf2\xd3\x9f\xfe\xf4w\xbf\xfb\xdd\x07\x1f|\xa0P#\xbe\
-\xfb\x05jL\xf0\xcd\x97\xe9\x08\xb5\xb0\xf0\x16\x0e\x9f\xed\
-0\x8d\xcc\xa4\x9c\x8c0\x1e\xae\x5c\xb9B\xcc\xa1\xb0\x83\
-\x81\xc4p\xb2\x9b*=j7d\x0faR\xb25Z\
-\x0a\x02\xfa\xfa\xfa\xfa9s\xe6\xf4\xf4\xf4\xcc\x981#\
-\xbe9\x9a\x17\xb5$\xa8\x19\x85\xf42\x08\xf1\xd9\x19\xf2\
-\xe6J\xc3Q\xf5#\xdc\xbf\x7f\x7f``\x80u\x9a\xe3\
-D\x16\xe9H\x11\xd4\xf8\xc2\xab\x1cY\x8d\xb0\x8e\xb6n\
-\x92,{!\xa5H%'/\xe1\xfd\x0aiRH/\
-\x83\x14f\xe0\x96q\x1f\xa0K\xc9\xe4\x03\xca\x1d71\
-\x18\x8d<\x5c\xe4\xde\x8c]\x13L\x16\xden\xec\x8c\xa9\
-\xac|\x06\x90)\xc85\x10@\xb0B\x10Y\xc2\xed\xdb\
-\xb7o\xde\xbcy\xe6\xcc\x99={\xf6\xbc\xfb\xee\xbb\x7f\
-\xf9\xcb_\xf4V\xe8'\x9f|\xb2w\xef\xde\xcf>\xfb\
-\xec\xc8\x91#\xe7\xcf\x9f\x7f\x1a\xde\x0d-B\xd2[\xb9\
-\x1e\x04%}^@!\xfd\xd4\x86QD<\xca !\
-\xf8\xd0\x93Q\x06\xdb\xf8\x1e\xf7\xbaq\xea\xf1\xaa\xd2`\
-=\xa8\xad\xadmoo\xef\xec\xeclll\xe4\xec>\
-#\xe2\xa0A\x92\x1fn\x98>}\xd4\x96I\x8da%\
-\x0d\xaf-\x80\x0c8\xe2#\x9aa\xf4Q\xafr#\xe5\
-\x02\xefH:\xa3h\xc3\xca\x00\x94\x94C9\xc7\xf2\x9e\
-%\xd9\x0cB\xc2\x82S\x86\xf0\xc6MH!\xfd\xa8X\
-\xe3TTT4773\xe7L\xf0m\xf58[E\
-\x1e\x22\x1a\xaf\xce\xa9}\xfcgGaf \xf9!\x91\
-:\x05\xd7p\xeb\xd6\xad\xbe\xbe\xbe\xabW\xaf^\xbcx\
-\xf1\xdc\xb9s\xc7\x8f\x1f\xdf\xbe}\xfb\x1f\xff\xf8\xc7_\
-\xfd\xeaW\x04\xa3D\xa5\x04\x16\x03\x03\x03w\xee\xdca\
-9\x19v\x7f\x8d\xdd\x17~\xea\x09[2\xd5\xb0\x92S\
-\xca\xa7\x04\x06\x09[\x1a`\xcc\x14\x1a-\x85ZFz\
-\xf0\xe9\x80Q\x97\x07-!\x04X\xac\x04555]\
-]]+W\xae\xec\xe9\xe9\xa9\xae\xae\xf6\x16\x11\x17\xa9\
-WUU\xd5\xd7\xd7\xd3,\xf6\xdah\xde\xb6M\xf5\x82\
-\x92\xaes\x12Lv\x99\x0f0\x8d\xea$\xe9\xe78\xb7\
-mSV\xa4\x8cX\xdb\xaay\x9d\x13$(\x17,K\
-\xb2\x04o\xe4\x90\xde\xb2BL\x997w\xd2\xe1\xee\xd2\
-cIe\x81\x9aB\xc7Q\xc1\x0c\xc7\x01d*!\x89\
-Ci\xceY\xb0`A]]\x9d\xcc\xc6A\x0cF#\
-\x0f\x11\x1b\xf4)\xc1&\x11\x90\xac\xac\xa4L\xc9\x94\xe8\
-<B.\x84\xc0\xe9\xee\xdd\xbb788\xa8o\xc7\xbf\
-\xfb\xee\xbb\x7fs\x10\x80\xfe\xfd\xef\x7f\xff\xe0\x83\x0f\xf6\
-\xee\xdd{\xe2\xc4\x89\xde\xde^B\x8a\xb1^\xd2\x14&\
-\xd5\xdaI\xcf\x05}\x17\xa2,\xe1U#\xb1\xaaB\x9b\
-1\xf5\xe6\x93\x89\xbe\xb0\xc2\xe0a\x1b\xc3V\x87\xc6\x91\
->\xdb\x0eY\x8d\x11f\x95\xd28d\x19\x04X,\x0c\
-\xb3f\xcdZ\xb6l\xd9\xbcy\xf3\x08\xbc4\xe6#\xb4\
-\x03\xcbdgg\xe7\x9c9s\x9a\x9b\x9b+++\xd1\
-\xd0b:b@S\x1b*\x12\xe23rxm>,\
-W5\xabr\x1d#\xe5\x82F\xc6\xb9\xee\xbb\xbf#`\
-^&\xac\xcd\x8d\xbc\xfd\x95\xf4b\xa0\xcf&\xbd4\xe5\
-\xb0;\x95`(\xb7\x14dl\x8d\xcc8g\xce\xc1\xb3\
-\x96/_\xbet\xe9\xd2\x193fH?\x0e\xe2T\x15\
-y(\x84C\xdc\x84\x10\x190\x95\x88\xbc6\xa3\x92\x9a\
-w\x8a\xc3)\x98\xbf\x88\x18\x88D\x09\x17>\xf9\xe4\x93\
-\xdf\xfd\xeew?\xfe\xf1\x8f\xff\xef\xff\xfd\xbf?\xf9\xc9\
-O~\xfb\xdb\xdf~\xfc\xf1\xc7\xa7O\x9f\x8e\xbf\x08\x98\
-\xc5\xcd\xf0\xfe\x0fN\x92\x0c;+\xd5\x05I\xa7f\xba\
-R\xc5\x0d\xafu\x90d:S\xcd\xa9\xacI\x07\xc3\xe6\
-\xdc\xb9s{\xf6\xec\xf9\xec\xb3\xcf\x88J\x19i(\xb9\
-\xa9\xbc\xc3[\x9a\x22\xb7\x1c\x16\xc1,e)\x0dXR\
-\xc7\xe9\xd3\xa7\x13\x83\xea7Gc0jTUU\xd1\
- \xabW\xaff\xbdlii\xa9\xa8\xa8\xb0`\x11\xbc\
-Q>\x92\xd1<\xb2\xef\xb2\x9a\x14\x96\xab\x9a\x8b\xd7\x1f\
-\x19\x078\x94\xa6q}\x0a\xc1\xacnm\xee:\xc7#\
-\x0d\x842X\xd2Y%X\xd2\x8e\xc6\x14\xe8>\xbb/\
-\xbb5\xd3\x84I(\xfdf\xc3\x22L\xddz;\x88i\
-\xa7&\xfe\x05\xa6\xc8\x13Hj\xc4\x0b\xc6\xae\x8dx\xe6\
-\x14b>\x81\x8c\x06c#L:\xf3\x11X%y\xf1\
-\xc5\x1c$\xa9\x1c\x98\xbf\x98\xb9\xfa\xfa\xfaN\x9e<I\
-$\xbau\xeb\xd6\xf7\xdf\x7f\x1fa\xdf\xbe}\xfb\xf7\xef\
-?z\xf4\xe8\xa5K\x97n\xdd\xba\xa5\x22\x91\x10Z\x9b\
-\xe5\xbc\xb9\xb9\xb9\xa9\xa9\xa9\xb2\xb2\x92\xa4z\xcdZ\xb8\
-\x10Er-\x8bH\x94\xca\x99\xc5&\xef\xef\x8c\x0a\x1a\
-\xe4\xfa\xf5\xebG\x8e\x1c9t\xe8\x10cI\x7f\x8d\x89\
-\x81W|\xac\x96\x02mE%!\xd2\xfb\x84C\xd1\x15\
-G\x1as\xc6\x8c\x19\xb3g\xcf\x8e\xf1\xa8\xa0Yh\x13\
-\xfd\xed\xa5\x05\x0b\x16466\xda\x9eJ\x83P\xc71\
-\xa1\xb2Y\x94\xa5\x09\x07L\x19)#4)\x13\xf5\xf9\
-\xf3\xe7\x99\xb4\xcf\x9e=KT\xaaxTM\xadc(\
-\x8c\x8a+\x9a.\xcb\xb0a\x9c0;MR\x0f\xb2{\
-\x81\x22\xb2\x92&\x94\x0e\xcd\xa2\x96\xa1 \x0d\xc5\x04^\
-WW7\x919<\x06\xa3\x912SdL\xe3\xde\x1c\
-1\x08gj@I\xd2\x857\xfeuR\xd3\x8bTR\
-P\x9b\xf4\xe0U\xb9\xe5\x19\x01%\xf5 \xb8\xda\xfc\xfb\
-|\x17/^$P \x06\xfd\xdb\xdf\xfe\xb6}\xfb\xf6\
-3g\xce\xf4\xf7\xf7\x134\xc0\xdd\xa7\xe6\x17C\xc7\x01\
-\x01\xa8>\xfc\xed\xe9\xe9a\x13\xcc\x1cd\x8d,\x831\
-\xe1z,)H%\xccb\xd3\xa7Oohhhk\
-k#\xd8\x9d\xec\xf1(C\x88aF$\xaa\xd7<4\
-\x02\xdd\x90\xcc\x1f\x8fZ\x03\x9aA\x11\xcbBY`\xed\
-\x09\xb4\xa7\xfe\x02\xfb\xda\xb5k\xe7\xcd\x9b\xc7\x22Q\xa4\
-\xe0\xd3\x00\xb7OHA\x5c\xde\xda\xdaJ$J\xfb\xa0\
-\xa1\xc5\xe8\x1d\x9bs\xb2\x1daH\xc3\xd1\x90>\x8b\xea\
-\xe4h\xf8\x8cH\xb9\x19\x1a\x1a:v\xec\x18s\xf8\x9e\
-={\x98\xd5\x99\xbd\xe5k\xa2\xc4\x96WW\x9a\xb1\xeb\
-\xb1\x04d\xb2\x98\xe5\x98\xf7\xaa\xab\xab5`d\xf3$\
-\xa3+\x17\x92\xdd\xdd\xf8\xdbq\xea4\xe8\xc3,\xd9\x0b\
-\xaf*\x8a\x95E\x98x\xe0\x1e\x83\xd1Hy`8\xa6\
-b\x14\xc9\x1c\x85\xe5\xa6\x90\x92\x22\x9a\xc7K\x9c\xcd1\
-\x93%\xb2UkI\x9dK\x8e\x81\xee\xd6\xad\xa1S\xa7\
-N}\xf2\xc9'\xfa\xddP\x8e;w\xeedK\xad\xb7\
-BU*R\x08Z\x92Iy\xce\x9c9\xcb\x97/\xd7\
-\x9b\x88z\xb0\xa4,\x09\x06\x1aaI\x09F\xd8\xda\xe4\
-\xd2G\x04\xa0MMM\xed\xed\xed3f\xcc\x98\xec\xc1\
-(0\xa8\x08F\x19o\xfa\x01|\x0d\xb0\x10\x99\x85-\
-#\x99\xa3\x09vL\x91W\x09Tk\x8eC\x93\xb2a\
-\x98;w\xee\xea\xd5\xab\xe9\xaf\xba\xba\xbaB\xa5\x9e\x1e\
-h\x01[,AJ5Z\xb8\x01\x96\x1e\x5cC\xfa\xc9\
-DP\xcaKAc\xca\xcc\x8a\x83\xf4f#%(\x19\
-)\x17\xec\xfa\xae^\xbdz\xd0A0\x8a\xa3\xd1\x8fa\
-\xd7\x80\x92I\x87e\xf4\xc2\xa7\xf3Awk\x93\xdc\xd9\
-\xd99s\xe6\xcc)\xe0Dv\xcb)\xc1@S|\xa0\
-*\xd7[\x07\xf6>\xedH\xec\xc6K\x0cF#\xe5!\
-\x99q\x1d\xc8\x85\x06\xa5\xc6\xab\xf0\xaa\x1c\xd2\xa8\xb8\x04\
-\xc9\xa6\x11\xd2\x03\xb2\xeaAvO7\xfc\x8a\x82\xc0<\
-\xc5Q6hn\xdf\xbeu\xee\xdc\xb9\x8f>\xfa\xe8\xb7\
-\xbf\xfd\xed/~\xf1\x8b\xbf\xfe\xf5\xafl\xa6\x09\x17\x14\
-\x89\xbaZ#\xa3\xc0*\xcet\xdc\xd2\xd2\xd2\xd8\xd8\x18\
-~\xf9Cx\xa3|$]\xe5\xc8&\xd5}\x14\xa7\xf2\
-*\xf75gB(d\x942\x9e\xa4\xdc\xbe}\xfb\xcc\
-\x993\xbbw\xef>t\xe8P\x7f\x7f\xbf\xbf\xe1\x5c\xb0\
-\x88\x81\x8e)\xd4\x1a\x22\x954d\x99Bz\x19\x08\x92\
-\xb4*\xfd\xa5\xf8^\xafU8\xdb\xa7\x1a\x1a\xc1\x8d\xd6\
-\x07[b\xd7-\x1e\xf5N\x88ld\xcc\xd14\x10\xb6\
-\xa7\x15\xcc\xd6\xc0Dt\xef\xde=\x9b\x8b\x22\xe5ex\
-x\xb8\xaf\xaf\x8f-\xdf\xf5\xeb\xd7\xf5)\x84\xb53\x1d\
-\xa4>\x0a{\xaaD\xa8\x07\x10\xd8\x18\xb7\xb5\xb5\xb1\x03\
-\x7f\xee\xb9\xe7&\xc5\xa6n\x22\x97\xe7\x06l\x9eQ*\
-}q0K\x9a{\xc2\x8d\x13\x83\xd1\xc8C\xc4\x06h\
-\xe9\x83\xd5\x0fp\x87\xe6\x17Cs\x84\xa064L\xf7\
-LIw\xef\xde\x0d'}\xb2\xb0$\x0b\xfd\x8d\x1b7\
-\x8e\x1f?\xfe\xf1\xc7\x1f\xbf\xfb\xee\xbb\xef\xbf\xff\xfe\xbe\
-}\xfbN\x9c8q\xed\xda5&/\xd5\x13)\x05\x9a\
-\xd4\x16r\xc3\xf5I\x02\xb2\xb7+\x8c,}\x22\x18\x0f\
-*.\x945\xd9a\x1c2\xea\x8e9n\xde\xbc\xc9\xc8\
-D9\xbe\xbbK5\x8b\x92`I\x13B\xa4|\xe6\x99\
-gXM'\xcb'\x8c\x8f\x06\x9a\x821,A\x1a\x0d\
-K\x91\xc4 \xb9\x09GY\xb2\x11\xd2\x0b\x92ICg\
-*\xb1$c`hh\x888\x89m0\x01\x13s\x91\
-\xb2\x22\xe5\x85\x86\xd5KV\x9a\xfcA=\xe8\xb3Gv\
-bJ\xb6\xa4\xfa1\xd4\x00J<\xa8\xa9\xa9i\xd9\xb2\
-e/\xbf\xfc\xf2\xca\x95+\x915x\x9e\x1e\xd4 j\
-\x99B\xc8\xb2,\xc4`4R\x1e\xdc\xe4\x9c\xe0\xd39\
-\x8a(\x854~h\xe7F\xbfi\x98\x5c\x98h@\xb3\
-\x8c\xcd5\x08\x84\xa1\xcc\xf8\xcc\xf5\xac\xfd\xc0\xc2?8\
-8\xc8\xc4\xc4\xf2O.\x91(\x9aS\xa7N}\xf8\xe1\
-\x87\x7f\xfd\xeb_w\xec\xd8q\xfe\xfcy4\x18\xc4\xb5\
-a\x1c\xa8\xa7\x5c\x9f\xf8e[za\xfd\x08\xa1<*\
-V!\xdb\x03-*>c2\xc3\x08\xd43\x9b\xde\xde\
-^\xbb\xa9d\xac\xbb\x96\x19k\xfbx)\x87\xea\x01\xc9\
-R\x0a\x19\xb3dN\x9b6\x8d0\x14\x10XSSf\
-O'\x16I\xb8\xc6\xf3\xad'\xa4\x17y\x1b\xdcK#\
-I\x06\xae\xc3\xa7\x03\x98a\xe8\xfa\xfd\xfb\xf7\xef\xdc\xb9\
-\xf3\xf4\xe9\xd3\xf1C\x98\x87\x04\xad\xea\x16\x87duP\
-2\xc4lR2(\x99\x17\x1b\x12\x1c+++\xdb\xda\
-\xda\xe6\xcf\x9f\xdf\xdd\xdd\xdd\xd0\xd0\x807\xc9fj\xe0\
-\xdb\x22\xc0g8R\xc9G@\x0cF#\xe5\x01\xd7\xad\
-\xae\xaef\xfbXWW\xa7\x0f[Az\x81\x1c\x8eo\
-\xafuxU\x06\xe7 >\x00M\xc2\x9f\xdcs\x0b`\
-\xba\x1f\x18\x18 \xd6\xdc\xb5k\xd7{\xef\xbd\xf7O\xc7\
-G\x1f}t\xf0\xe0\xc1s\xe7\xce]\xb8p\xe1\xf8\xf1\
-\xe3dm\xdd\xba\x15\xfd\xee\xdd\xbb\xedsy\xf0\xb5G\
-\xc6\x08=E\xeb\xd1\x0b\x92A\xcfJI\xaaa\x0d\xe5\
-\xbaB\xa3\x83=\xbdy\xeb\xd6-\xb6\x16\xac+$}\
-\xc6\xa4\x85&b_\xc4\xe0<p\xe0\xc0\x993g\xb8\
-/4j\x13\xf0F%\x90j\x0aK\xfa\x8a\x82\xaa\x90\
-\xad/,\xc9RZ[[\x1b?\xa6\x075\x88\xe2r\
-\xb5\x86\x84,\xb2\x1f\x15\xfa\x22\xd5;V\x1c=;\x10\
-\xb6\x22G\x1cD\xa5z:\x1e);a/\xa8\xfd\xc1\
-\xf4\xa0,H\xc9\x86W\xb9\xe2\x12\xe4G\x96dG\x87\
-\x13AEE\xc5\x13\xbe\xaf\x0bo\xa7D\xd4\x08`I\
-\x09\x8f\x85\x18\x8cF\xca\x03\x01\xe8\xacY\xb3\x96,Y\
-2{\xf6\xec\xaa\xaa*)m\xa0\x9bP:VPI\
-@N\x02R\xf7\xactxx\x98\xe9\x9ep\xf3\xf7\xbf\
-\xff\xfd\x8f\x7f\xfc\xe3\xff\xef\xff\xfb\xff\xfe\xcf\xff\xf9?\
-?\xf9\xc9O\xfe\xf2\x97\xbf|\xf2\xc9'\xdb\xb6m\xfb\
-\xd3\x9f\xfe\xf4\xf3\x9f\xff\x9c\x5c\x22Q,\xe3\xe7\xf2e\
-!\x9c\x8b\xd5\x1dc\xedV7\xcf\xfbJL\xa6C\xef\
-\xde\xbdK\x1f!(kRC\xb3\xb0S:t\xe8\x10\
-\x1b\xa1\x0f>\xf8\x80x\x94P\x9b\x80\x9b\xbb\x035\x9a\
-\x90\xbd\xda!D\xfa\x22x\xbb\x1cT\x958FP3\
-\x0bg}}}gg'\xfe\xd8\xd0\xd0\xc0\x12\xebK\
->\x950;1)\x11O\xa8\x1dh1\xe9\xd5z\x16\
-\x7f@\xb6\xa1hL/\xe5P\x0bK\xb6R\x1c\xa5\xa1\
-\x8b\xf5\xb1\x0cah__\x1f3U\xb6\x86H\xb9P\
-\xfb\x83:\xc5'J\xf0\xa0\x10\xd9[A\x09\xe02\xfd\
-\x97\x99\x18B\xd9\xb11eH\x0dQ5\xa6\xb0vx\
-\xd8\xc4`4R\x1e\x18\xb2,~mmm\x8d\x8d\x8d\
-\xfa8\x83q\xac,\x13\x84s\xf3\x82x\xa3\x0c\xce/\
-\x12Xq\x99\xee\x09\x5c\xae^\xbdz\xe4\xc8\x11\xe2Q\
-\xa2O\x1d\xdf{\xef\xbd\xbf\xe7\xf8\xc7?\xfe\xf1\xfe\xfb\
-\xef\x1f8p\xe0\xca\x95+1\x12-\x17\xea\x02\x9f\xc8\
-\xf4l!|\xd7\xe6\x08\x95\xcc\xef@\x9f\xde\xbbw\x8f\
-p\x0dA\xb9\x93\x1d\xee\x85\xf1\xc9Fh\xeb\xd6\xad\xfa\
-\xacvhhH/\x90\xa8\x0d\xc1\x9b\xe6C\xad\xa4&\
-2\x8d\xc9\x90*N\x16\x1a\x8ejO\x22Q|\x90\x18\
-t\xde\xbcy+V\xac\xe8\xee\xee\xae\xad\xad\x0d\x8b?\
-=p\xd7\xd5\xd5\xd5---3g\xce\xa4A\x88*\
-\xd4\x0e\x1c\x05\xcd\xa5\xa3\x90R\x06\x1c\xad\x9d\xa5\x17\xd2\
-+\xcb4&\xa0\xd7xf\xdaa\x18\xc8,\xf20P\
-\x83\x0b\xeb\x0e\x06\xbf\xfaQzC\x06v\x0cA\x13\xf6\
->H#A\x06\x8f\xeb\xb1\xa8\xf6Q555z@\
-\x0b\xc8h\xb4\xc8\x96\x11\xddf\x16\xf4\xaeI\xf2c6\
-\x12&B\x0cF#\xe5\x81\xf9\xf7\xc6\x8d\x1bD~\xfa\
-\xd2F\xb8\xe8\x0aoW\x1af\x1f\x8e\xf8\x10\x0c\x86\xdd\
-O\x87\xeam\xd1\xfe\xfe~\x8e\x9c\xfd\xd0\xa1C\xef\xbe\
-\xfb.Q\xa9~\xf2\x03}\xfc\x8c\xac\x5c\xa8S\xac;\
-\x0au\x8dP\xae\xf0\xaa\x91X\x17#\x18\xd2L\x0d\x18\
-x\x0c\xc8={\xf6\xbc\xf3\xce;\xec\x94\x18\x8d\x8cX\
-=\x19\xf5\x16\xee\xde\xc3\xf6Q#\x08k\xbaP0\x1b\
-\x09\x1cAz[;9\x22\x13u)\x18]\xbbv-\
-\xf1(\xd1X\xd9W\xaf'\x1f\x9a\x82\x95\xbb\xab\xabk\
-\xdd\xbau\xcb\x97/ooo\x0f?l\xe5(\xac\xe9\
-B\xa5\x92FJi\xb2\xf4\x86\x94@/\xd3\xd7\xd6G\
-\x91\x87\x0d\x9d\xa8~\x0c\xf1yEI\x99\x85IWG\
-\x92\xa47C\xb7}d\xe0\xc2===\xabW\xaf\xde\
-\xb0a\xc3K/\xbd\xf4\xb2\x03\x19\x0d\xa3\x9a\xb1\xed\xed\
-\xdc\xa5Z\x0bxU\x0e7a\xa4\xc7a^%Ho\
-x\xad\xc35F\x1e\x94\x9b2\x1e\x071\x18\x8d\x94\x07\
-|u``\xe0\xf2\xe5\xcb\x0aF\xbdv\xc2c\xd4\xc6\
-\xba\x09\x82j9c\xe2.\x01\xcc\xfe\x9c\xfd\xdc\xb9s\
-g\xcf\x9e%H\xe52P\xfa\x02\x912\xe1\xe6\x9ft\
-\xa7HiH9*\xea5\xc3k\xa7\x10\x8c@b\xd0\
-]\xbbv\x11\x92^\xb8p\x81`Tz\xe2!@(\
-\xd2Vj\x10\xb5\xa7\x90^\xa4\x9a+\x95\x0b,K\x95\
-\x95\x95\x84_K\x96,Y\xb8pass3\xc1h\
-\xd6lj\xc3\xfd666\xae\x5c\xb9r\xe3\xc6\x8d\xac\
-\xdf3f\xcc F\xb7,\x1dC\xd0\xd0\xb0>Q\xb8\
-\xad|\xf6H\x03%ut\xa1\xcb\x14y\xc6?\x89H\
-&\x11\x07\xb2\xf5N\xd2O#\xc9\x9bk\xb2\xe99R\
-\x95\x04z3\xb5\x8d4\xe4h\xd5\x01\xc4\x88\xe3C?\
-\x9f\xa7_6\xd5\xb3|\x9cw\xd3\xa6Mo\xbd\xf5\xd6\
-\x7f\xf9/\xff\xe5\xbf\xff\xf7\xff\xfe\xdf\x1c\xc8o\xbf\xfd\
-6Cz\xc1\x82\x05\xf85\x05kkk\xeb\xeb\xeb\x91\
-\x09^\xf5\x8e\xb8\xb5\x83\x8e&\xd8}\x99\xde \xcbr\
-\xa5\x09QV\x8a\xbc\xcaq\xe3\x7f\xbc:\x12\x99 ,\
-u\xb3f\xcdZ\xb1b\xc5\xf2\xe5\xcbq\xa7\xaa\xaa*\
-7\xb6\x93\xc1\x1a\x1eE!O\x10^\xe5\xf0\xaa\x5c\x0d\
-\x82\xe2w\xef\xde\xbdt\xe9\xd2\xa1C\x87N\x9c8A\
-\x10\x9c\xaa0\xaf;E\xc6\x07\x0d\xce|7w\xee\xdc\
-e\xcb\x96\xcd\x993\x07Y\xcf\x96\x98\x85\xcd $\xa5\
-T2$\xd4\xd3SDl\xbd\xbd\xbdt\xe5\xd1\xa3G\
-\xd9K0\xe9+kj\xc0\x02\xc6\x0d\xb2N\x10\x11v\
-uu\xb1V\xe1)4\x9d\x86h\xd8\x14Y\x8ad\x81\
-\x95\xcdkf\xca\xfb\xf7\xef\x13\x10\x1f;v\xec\xea\xd5\
-\xabO\xdb\xf6\x8c\xd0\x93p|\xfd\xfa\xf5\xac\xdc\x0c`\
-\xd6\xec\xf0\xd1Q\xd2|\x0e%C\xf2*!\xb4\x0fm\
-LO\xf32\x80\x87\x86\x86\xd8\x123\xa4\xf5\x975d\
-\x13);\x04^\xac5\xfa\xcbp\xa9/\xce\x82\xc9\x12\
-\xc0\x9c.\x9b\x8b\x90\x05{\xfc\x97\xf5\x85\xa9\xe9\xe0\xc1\
-\x83\xd9\xef\xa2UTT\x105\xe2\xd7\x8c.\xfd\x01\xde\
-\x89\xd0\xdd\xdd\xbdx\xf1\xe2\xa5K\x97r;$\x895\
-\x9f{\xee9F\xef\x0b/\xbc\xc0\xaa:\x7f\xfe|\xce\
-\x02\x98\x11\xa72\xa50\x99p\xd7mmm\x9c\x9a\xdc\
-U\xabV\xad]\xbb\x16\x81\x90T{\xdd\xf0~\x0d\x94\
-\xd2\x87\x14j\x04)\x8b\xe7\x02\xad488\xf8\xf9\xe7\
-\x9f\xeb\x0fbI9V\xf2\x9c \x12\x19\x07\xcc\x0b\xb8\
-\xcd\xf7\xbe\xf7=vr\xf8\x03!K\x18\xac\xd8\x11\xe4\
-\x0c\xa0d2\xccsHcY`J0=\x02\x13\xc4\
-\xfe\xfd\xfb\x7f\xf3\x9b\xdf\xfc\xf9\xcf\x7f>y\xf2\xa4=\
-s\x8a\x94\x1d\xba\x80\xf9n\xcb\x96-?\xf8\xc1\x0f\x9e\
-\x7f\xfey=^B\x99]\xd7%\xab\x9bL\x13\xf6f\
-\x88\xf4\xccb\xb7o\xdff\xd9\xfe\xc5/~\xf1\xdb\xdf\
-\xfe\xf6\xf4\xe9\xd3S\xaf+Y3h\xb7\x7f\xff\xf7\x7f\
-\x7f\xed\xb5\xd7\xf4I\xb1\xb5\x15\x82\xb9\x09\xa4\xda\xca\xcc\
-\x8cQ\x0d\x84\xf4\x8a\x83/_\xbe\xfc\x8f\x7f\xfc\xe3\xc7\
-?\xfe\xf1\xee\xdd\xbb\xfb\xfb\xfbQ\xca\xe6i\x80\x96g\
-Eg\xdc\xbe\xf5\xd6[\xf3\xe6\xcd\xd3C#\x9f\x97\x03\
-\x0d\xad\x9ajXQ\xa8yCc\x93\xad\xcd\xd9'\x13\
-\xf7\x7f\xfc\xf1\xc7\x0c\xe9\x0f?\xfc\xf0\xc6\x8d\x1by+\
-\x8fL\x1c\xa2.<\xeb\xed\xb7\xdf\xde\xbcy\xb3\xbe8\
-\x1bNJ\x86i\xc6\xda\x11\xd8\xe3A\xec(~\xff\xfb\
-\xdf\xd3\x9b\xc4\xa3l-t\x0a`\x1aljj\x22L\
-|\xf6\xd9g\xd9\xa5\xe3\xd7z\x13f\xdc\xddM\x9d\x0c\
-Q`?\x03\x08L\xbc\xcc\x18\x9cE\xb7\xa6\x9a92\
-I2\xae\xd8\xf00\xd2\x98?Qb\xdc\xda\xda\xcae\
-`\xcf\xa6\x8b\xaa\x18\x8aX\xba+}\xd0 \xe6\xfe\xe1\
-E\xca\x06\x90\xd1\xa7\xb2\xbc\x94#\xd4 \xcb\x98\xab%\
-\x06e-\xfe\xdf\xff\xfb\x7f\xef\xda\xb5K\xb9c%>\
-\x19\x8d\x94\x07\xb6b\xec\xd5p\x06\xf6m\xfa\xbb\x8e\xc9\
-\xe8v\x90\x1b\x1eK\xa4\x901z\x1c\x00\xa7\xc2\x09\xaf\
-_\xbf\xceZ\x8bC\xb2\x00\xf8\xecH\xb9a\x86e\xd2\
-_\xb8p!;\xefY\xb3f\xe9\xddy\x85P\xd6G\
-\x08&\x97\x82\x8cud\xba\xd7\x93\xd1#G\x8eL\xbd\
-'\xa3\x80k\xb0\xa8,]\xba\x94MZ]]]\x18\
-\xca\xab\x19\x0b1j\x93\xca \xb5x\x84\xa5\xc8\xbau\
-\xeb\xd6\x993g\xf4\x0a5n\x12\x1aOy\x98\x85X\
-\xa1W\xacX\xb1l\xd9\xb2\xc6\xc6F\x0b#|\xf6H\
-\xf2\xb6L^cUb. \x94E%\x0c`\xda<\
->\x19}\x04\x10\x81uvv\xe2Ys\xe7\xcee\x8e\
-\x92gY_d\xb1..bc`\x83=\xe8\x99\xdf\
-\xb1c\xc7\x86\x86\x868\xcb\xcc\x993\x99\x06\x81\x95n\
-\xe5\xca\x95\x9b6mz\xf5\xd5W\xd7\xae]\xbbd\xc9\
-\x12v>\xf88\xc7\xf1A\xd9\xae\xae.\xee\x88e\x94\
-;\xea\xe9\xe9\xe1,\xac\xaaL\xb9\xcc!\xcc\xba:r\
-\x9b\x0c\xec\x9a\x9a\x1a\xd6Y,\xd9e\x01\xf6\xc8h\x14\
-\xb6\xda\xe0\x94\x9c\xbd_4!\xd2d\xf5\xc2\x95\xf0\xa4\
-\x92B\xadt\xfc\xf8\xf1\x89<\x19-6\x15F\x22\xa5\
-s\xff\xfe\xfd\x0b\x17.\x1c>|\xf8\xfc\xf9\xf3z\xb8\
-\xc5\x00U\x96a\x9al\x16\xa04\x94L)A\x1a\xfc\
-\x01\xb7d]\xc7o\xd9\x10\xe3\x96I\xf9H\xf9\xa0y\
-\x99\xe8\xf5\xfe\x13\xed\xcc\x8a\xde\xd1\xd1Q__\xaf\xdd\
-\xbff7\xb0N)\x05\x15\x11^\xf5t@\x131S\
-\xb3eb\xefd\x1f\xf3\xa9\xe9@\xc9\x12\xf1\xcd\x97\xc3\
-kG\xe2\xebu5cC\x97\xd1\x83,i\xf6~\x85\
-\xcc\xa6<\xdc)\xcb6w\x0d\x086h}v\x0ek\
-+\x93\x854E\x90MXa\x89\x05#\xe5B\x0dn\
-\xd8c\xbflG\xcb\xc0'r}\x07)3a\xc59\
-\xe22L\x83L\x80\x84\x9e\xcb\x97/\xdf\xb2e\xcb\xbf\
-\xfd\xdb\xbf\xfd\xcf\xff\xf9?\xff\xd7\xff\xfa_\x1c\x91\x89\
-D\x17-ZD\x14H\x9c\xda\xe4`\xdb\xc3\x11\x8f\x0b\
-QV!(Bq\xf0\xd6\xcd\xcdhp[&a]\
-\x0c\x97\xa1\x01\xcc\x95k\xbb\xce\x90\xc6\x80\x22:\x1dB\
-m\xee\xc7Pe\x89\xa0\xf8\xd5U0\x02w\x97\xfe6\
-AI\xd7B\xf9G\xaf\xd9\x08Y\x86\xf8\x8c\x89\x11\x83\
-\xd1H\xd9\xc0I\x08CYnS\x1f\x10\x84G\xe1r\
-\x1e\x80Fc\x1ad\xe0\x13\x01\xa6\xd7\x91Sp\xae\x9b\
-\x0e[\xe0#\x13\x87\xee`o\xdd\xd2\xd2\xc2n{\xe9\
-\xd2\xa5\xabV\xad\xd2{K+V\xac\x989s\xa6\xd6\
-u{2\x1a)\x05\xf6i\xbd\xbd\xbd\x07\x0f\x1e\xd4\xa3\
-\xdfG\xf0s?\x89\xc38\xe8M\x96R\xd6\xd15k\
-\xd6,Y\xb2\x84E\x8b\xc5\xc9\x1bMuX\x98\x19\xc6\
-\x0b\x17.\xd4~\xd5\x82Q\x03\x1b\x9aH\xc6cBm\
-\x0b\x92\xa5\x8c<\x16\xac#\xacOM\x09J\x96\x8eU\
-\x22\x01g\x01\x06\xcf\x82\x05\x0b6n\xdc\xf8\xf5\xaf\x7f\
-\xfd\xdb\xdf\xfe\xf67\xbf\xf9\xcdo8\x08L\x9f\x7f\xfe\
-y\xe6Iv\xe9D\x8dL\x8c!L\x92!YM\x88\
-\x8a\x84\xa0d\xc4\xea\x02\xb8\x1e\xdd\x8b\xae\xcd\x92d\xc9\
-REHj\x90\xcb\x06\xdcMx\xc8J\x81\x81k\xa4\
-\x07H\xe3\x8a&P\xcaK#e\x90\xbdPR\xfa\x89\
-\x10W\x94H\xd9`\xf6g\xe5\xc3+l\x8c\x86\x98\xc6\
-\xb9\x86G\x1a\xd9\x83d)\x0b\x81\x81\x22Q\x16\xf8\xe3\
-\xc7\x8f\x9f8qbpp\xd0\xe7E\xc6\x05\xd3\x19\x01\
-\xa8\x9e\x83\xb2\xc3f\xf1~\xe1\x85\x17\xbe\xf7\xbd\xef\xfd\
-\xd7\xff\xfa_\xff\xc7\xff\xf8\x1f\xff\xed\xbf\xfd\xb7\xb7\xde\
-z\x0b\x0d\xc1\xa8>\x03\xa2\x88\xef?\x87*\x11E\xba\
-/\xe9\xe0\x91\xb9J\xaa\x12\xaaMU5e`\xb8\xde\
-\xb8q\x83`\x14\xae]\xbbF0\xaa[\x16\xde(\x1f\
-a\x8bI\x0e1\xbd\x84\xbcP?\xdd:w\xee\x5c\xfd\
-\x22\x0c=\xabg->{\xea\xc2=\xd6\xd6\xd6\xce\x9f\
-?\x9f\xad\xd4\xe2\xc5\x8b\x09\x17X\xaau\xe3\x1c%L\
-\x9cl/\x94\xb1\xf2\xc8\xa8\xe0Y\xb7o\xdff\x837\
-00\xc0\x8a\xa0\xc6\xa7/\xd0\x837\xca\x81\xdePR\
-\xfa\x14\xaaD\x90d^b -Z\xb4\x88\xd0\xf3\xcd\
-7\xdf$\xfa\xec\xea\xea\xd2sP\xa8\xab\xabc\xd5\xc3\
-2\x89\x19s\xdb<\x95M!}\x12\x03f\x08s\x13\
-S'P\x1bG\xbbH\x04\xdd\x91ND\x16rx\x9b\
-*\x08J\x1aV\x83r)(\x94T\x166\x86\x92\xa6\
-\x97 \xc2\x22!)\xb3q\x13\x83\xd1H\xd9H\xc6\xb2\
-#;j}F\x0e\xe5\xfaD\x0ei\x9c\xf9\xe8`\xa9\
-?s\xd2\xdf\xdf\xcf\xea\xee\xb5\x911BG\xe8C(\
-\x96\xed\xa5K\x97._\xbe|\xed\xda\xb5/\xbd\xf4\xd2\
-\xeb\xaf\xbf\xae\xdd\xff\xd7\xbf\xfe\xf5\xd7^{\x8d)\xd8\
-\xbe\xafj\x13\x99\x09@U\xae\x0fG\xef>\x99\x81%\
-9R\x95&YU5\xf5\xf8\xe2\x8b/\x88G/]\
-\xba\xc4\x91U\x93\xbb\xd6Bb\xed\x90%i\xa3\xa2\xed\
-Y<\xd7\xa0IYM\x09C\xe9A\x16Q\xf6\x8aS\
-\xb5\x91C\xb8G\xa2\x04\x0667\xde\xd2\xd2\xc2]K\
-\xa9{/\xb1\xe9J\xc1\xf5RR[x\xd4Y\x22\x0f\
-\x1b\x5c\x89\xdd\xdd\xe9\xd3\xa7\xcf\x9d;\xc7B \xcf\x02\
-\xf3,\x1d\x85\xcby\x804\x1c5*@\x13\x9a4\xa6\
-G\xc9@jjj\xea\xee\xeef\x92\xd4\xdbJ\xec\xc9\
-\x19Q\xb2\xb7R\xaa\x16\x90\x0b\xe1-F\xda\xa8\x12\xd5\
-#Pj~@\xb0,)\x99I\xecH=\xe8\xc9%\
-K\xd5\x02r!\x5c\xdd\xfe\x5c\x86\xcfsX\x0da=\
-*%\xbc\xea\xe1\x10\x83\xd1H\xd9 ($@\xcc~\
-\x0ai\xe3\xdb\xf4&@V\xe9\x07~0#\x80\xb2\x0c\
-4\x04F\x95\x95\x95\xda\x98zm\xa4\x04\xf4\x1c\x14j\
-jj\x98X\x99d\xbf\xfa\xd5\xaf\xbe\xfd\xf6\xdb\xff\xf5\
-\xbf\xfe\xd7\xff\xfe\xdf\xff;\xc7\x1f\xfe\xf0\x87\x9b7o\
-^\xbcxqgg'\xcb\xb9\xbd\xbd\x14F\xa2\x80\x8c\
-F\xdbt\x92\xaa<\xe9\xe3\xa0s\xf3\x22\x1b\xb0\xa4\xaa\
-\xd2\xfc.\xe5\x14\x83\x95\x03\xd7\xb8r\xe5\xca\x993g\
-z{{\xf5E\x22k4\xc3\xb5k\x82O\x8f\x91\xbc\
-eu\x22\xdc\x84\x90\x14\x9e\x1e\x7f\xd1\xa0\xe2~5\xae\
-4\xb4\x92a\x17\xcc3\xd2\x83\xc9\x08\xa5c\x15\x1a\xaa\
-9\xf2h\xb8w\xef\xde\xd5\xabW\x8f\x1d;v\xf2\xe4\
-\xc9\x9b7o\x12\x8c\x12\xa5\xd1\x0b\xd6;!Y\x8d@\
-O\xbfk3,\xb2#A\x1a\xa1R\x981\xba@J\
-\xd9\xc8\x18d\xe3\x139\xd0\x94>H\xb0W\xcd\x92U\
-\x1cT\x834 M\x98\x85\xe0\xf3\x5c\xae\x972\xa8r\
-P\xd2U\x90`\x95\x14G\xa5BL/a\x1c\xc4`\
-4R64(!5\xa0\xc3\xa4dP\xd2\x17\xc8!\
-\xa5\xe1\xb5\xf9`\x81a\xb7:g\xce\x1c\x02&B%\
-\x9c\xca\x97\x89\x14\x86v\xab\xae\xaefs?o\xde<\
-b\xcd%K\x96\xac[\xb7n\xe3\xc6\x8do\xbc\xf1\xc6\
-\xb7\x1co\xbe\xf9\xe6k\xaf\xbd\xb6~\xfd\xfa\x05\x0b\x16\
-\xb4\xb4\xb4\xe8\x01\x80`\xf2U\xcb\x87\xf8zsX\xb7\
-\xaa\x8bA\xc9Q!V\x13\xa5\x17\x99\x5cp_\xb7o\
-\xdff\xc9\xdc\xb1c\xc7g\x9f}v\xfd\xfa\xf5Qo\
-6\xd5\xc2\xd9\xd6\xce\x0bu\xaa X\x12\xef`/\xd1\
-\xdc\xdc\xac/\xe7\xd2\x9b2~\x1a\xe0\xf6i\x04\xf0\xe9\
-\xd1p-\x97\xa0\xa4\x0aZ\xb2\x10V?\x96n\x89O\
-\xd6xi\x22\x0f\x15\xf6u\xd7\xae]c\x9b788\
-\xa8\xe7\x85I\xe7e\x1a\x9f\x1eqq\xa6G}\x042\
-\x16\x98y) \xecY\xa1\xa4\x0d\x0c\xd3@*\x89\x8d\
-\x15\x17)\x83\xe2\xc8\xd2j(\xbd\xa0p\xa7z\x80\xd7\
-:,\x89\x90j\x04P\xd6\xf8H\xdd\xef\x98\x88Kx\
-\xa4<0\x88Y\xf0\xf4\x08\x8d\xf1\xed\xb5\xb9\xd1\x998\
-e\x804\x1a\xfa)\x5c\xa1Q\xc0\x8c\x05\xb5\xad\xadm\
-\xe5\xca\x95\xabV\xad\x22\xbaz\xaa\xd6\xd7\xd2QC\xd1\
-#@dY__?w\xee\x5c=\x07\xfd\xf7\x7f\xff\
-w=\x07}\xeb\xad\xb76l\xd80\x7f\xfe\xfc\x993\
-g\xb6\xb7\xb7\x13\x836\xb8?\xe3a\x93\x94\x04_c\
-\x09X\x17\xe7\xc5\xb2Ru\xb2\x90<\x82o\xf6<F\
-\xee\xdd\xbbw\xfe\xfc\xf9O>\xf9d\xef\xde\xbd\x97/\
-_&Y\xa4a\x93v\xcf\xe1U\x99\x16\x83Ts%\
-\xed\xee\xc8ZN\x9b6\x0d\x7fa\x8f\xd1\xd5\xd5\xc50\
-\x08=t\xaaB#X\xd8A\xd27M\x01T\xa4\x10\
-\xa1A\xd6X\x9a\xa4\x16\xf7Mg\x861GeE\x1e\
-6\xb4\xf6\xad[\xb7\x86\x86\x86\x86\x87\x87m\x83\x97\xb8\
-\x8ds\x01\x09\x1a\x03\xa0H4\x05z\x99\x81\xab2\x8d\
-\xea\x1c7c-\x9e\x0c\xa3\x00i\x94\x05\xfeB\x83K\
-\x95\x99\xf0\xaa\x12\xb0J\xd42 \x8d@\x9f\xad\xd0\x92\
-20R\xc9q\x13\x83\xd1Hy\xa8\x18\xf9\x86\x96\x1b\
-\xd2~\x8c\xa6\xc64\x84\xc3:\x8b\xb2\x84We\xc0y\
-\xaa\xab\xabY_\x09\xa1\x08\x9eH\xfa\x02\x91\x1c\xb4I\
-mm-\xed\xa3\xe7\xa0\xcb\x96-[\xbbv-\x91\xe8\
-7\xbe\xf1\x0d=\x07\x85\xd7^{\xed\x85\x17^\xe8\xe9\
-\xe9\xa1\x0d\x89V\xf5\x99\xa6M\xd0\xbe\xa2|=h\xa8\
-;\x84W\x8d\x11*g\x15\xd1S\x8d\x22'\x9a\x02\x10\
-\x80\xf6\xf6\xf6^\xb9r\xe5\xf6\xed\xdb\xba_\x9fQ\x14\
-\xda\xc4\xf0\xaa\x12\xf0]\x92\xeb\x14\x0d\x06\xfc\xc5~\x89\
-P\xfa)\x0c\xf17{*\xc6sj0\x8f\x9bR\xba\
-@m\x0e>\x1dy\xc8\xd0#z=\x0c\xe7R\x07\x01\
-\xedO\xa7k\x1e+\x84\xba\xc9\xf0\xd5\x15\xc5\x9b:c\
-\xce\x22e)\xa4\x8cU\x83\x8e)\xcc2\xb9\x8d\xa0\x94\
-\x15\xc9[\xca\x08\x8b\x94\x82\xda\xc1\x1a\xc4kG\xa2:\
-S5\xbb\x0b\xf1\x90T.2\xf5\xb8\xfc\xf1\x10\x97\xf0\
-H\x19`\x08\x12\xcdtuu-X\xb0\xa0\xbd\xbd}\
-L\xab\x9d\x0d\xe8,\x85\xf4\xc0\xe8g9g\x02b&\
-*qQ\x9f\xc2\xd0P,\xbd\x84\x92\xee\x19h\xf2\x10\
-\xb4\xa6\xa6\x86]\xc1\x92%K^}\xf5\xd5\xb7\xdf~\
-\xfb?\xff\xe7\xff\xfco\xff\xf6o\xff\xf1?\xfe\xc7o\
-\x7f\xfb\xdb\xcf?\xff\xbc\xfe4eGG\x07\xd1\x89\x9e\
-\x832q\xab\xaadZr\xdf\xe2\xb4\xe8\x90\xcaK\xec\
-\xcd\x22\xfd5*\x9c\x82\xe2\x13\xa9\xe1\xc9\x87\xc6d\xb8\
-\x0e;J\x19\xb4\xd8\x83\x09\x22\x95\x14\xce|\x04R\xaa\
-Ii\xdb\xe4\x11\x90\xa3\xc4\xae\x9c\xec\xe0\x0b\xf5\xf5\xf5\
-M\xb9?]S\xe2\xb8\xcak\xa6\x96\xcc\xdb\xc8\xe0\x1a\
-8)%A$]\xe2\x90M\xe4aC\x9b\xdb\xf0V\
-wK\x10$\xbd]\x8e\xa4\x93\x9c\xd2\xf7S\x0e\xe5\xe6\
-%UI\x98t\x95\xa5OQ\x0a\xa9R\xba\x80\xf0J\
-L6\x0d\xe8t\xe0\xd3\xe3E5\xa8*!}H\xf6\
-\xecYTP6t\x81\xd3\x8d\x87\x18\x8cF\xca\x00\xc3\
-\xb1\xba\xba\x9a0\xb4\xb3\xb3\x93\x05\x80\xc0HJ\xe5\x16\
-'q\x82\x91\xf8\x8c\xa2\x10*\xf5\xf7\xf7\x9f>}\xfa\
-\xe4\xc9\x93\xd7\xaf_g\x8d\xf7\x19O\x1f\xf8?\xeb.\
--\xcfN@o\x82.[\xb6l\xf5\xea\xd5\x1b6l\
-x\xfd\xf5\xd7\xbf\xf5\xado}\xd7\x81\xf0\xc6\x1bo<\
-\xf7\xdcss\xe6\xcc\xd1\x17Y\xc0\x9ea\xdbt\x83@\
-\x9cd\xa1\x92r%H\x93E6`S?\xf8\xbc\x0c\
-\x96egDC)\xc6\x8c.F\xca)\x09\xb7\xcc\xb8\
-\xbd{\xf7\xee\x9d;w\xd8G\xd1\xc8h\x0aaEB\
-\xa4QV^\xd4\x80fi\x02G\x9a\x17'%8\x93\
-{Na\x18\xd8l\xb4p\x046]\xad\xad\xad$\x19\
-`>o4h@\xc3\xab\x0a#\x9b\xd0\x98\xa6\x96\xfb\
-\xb8\xb6/\xd6S\x912\xa2.\x007\x03%\xf8t\xa6\
-\x83\xc6MXIX[^\xa5\xa1a \xbc\xca\x91\xd7\
-8\xa4\x94\x22\xd2\x84\x17`r\x89\x84\xf6\xe3+\x9e*\
-\x92\xba\xe61\x11\x83\xd1Hy $\xaat\x7f\xb3G\
-S\xbf\xc6\xa8\x06+\xc8\xc6(E\x93\x17\xb9(\x10}\
-\xf6\xf5\xf5\x11\x89~\xfe\xf9\xe7\xfa\xedFo\xf1\x14@\
-[)t\xa3\xa9\x89-\x9a\x9b\x9b\x97.]\xbae\xcb\
-\x96\x7f\xf9\x97\x7f\xf9\x8f\xff\xf1?\xfe\xa7\xff\xf4\x9f\xfe\
-\xf3\x7f\xfe\xcf\x1c\x7f\xf8\xc3\x1f~\xe3\x1b\xdf \xfad\
-I\xd67\xbdX\xa1\x1b\x1b\x1b)b\x8f\x10\x04u\xaa\
-U\xa9\x99\xa4\x8e\xd8p\x960\xd7\x9d<?V0\x14\
-\xc0g\x8f\x06\x96\x9c\x0eJ/2\x19!F\xd1\xf7-\
-\xce\x9e=k\x1f\xd6\x17jXk\xf3\xd0 T\x1a\xca\
-\x82\xb0\xf5Lo6\x0c\x98\xe4\xeb\xf4\xb5\xb5t\xeb\xd4\
-ng\xeeq\xde\xbcy\xcf?\xff\xfc\xf2\xe5\xcbg\xcc\
-\x98\xc1\xfdZk\x94\x17\x9aQ-)\x01\x90\x87\x87\x87\
-\xd9'\xb3C\x1e\x18\x18\xd0g\xc7\xce6\xf2P`\xb6\
-q\x9f\x06%\xef\xb8\xd3\xd4\xbe\x1b\x1c\xde\xa20%\xda\
-d\x91^\x06!)\xa5\xba\x9e\xa3A2oAC6\
-:\x1a\x96\x0c\xcb\xdae\x18\xd2O\x9c\xe4BsxU\
-i`\xcf\x14\xe7\x13c'\x06\xa3\x91\xb2\xa1\xb1\xa8\x11\
-,\xdf\xb0\xd1\x5c\xc4Udc\x96\x80<*\x981\xfb\
-\x10\x8d)\xf6U\xc1\xa7\x01\x22\xb6\xba\xba\xba\x993g\
-\xce\x9f?\x7f\xf1\xe2\xc5,\xb7/\xbc\xf0\xc2\xab\xaf\xbe\
-\xfa\xe6\x9bo~'\xc7\xb7\xbe\xf5-\xc2\xd0\xaf~\xf5\
-\xab\xe4\x12\x80\xd6\xd4\xd40Y\x13\x83r$\x22\xa1\xb9\
-\x04\xb5\xa9%\xddT\xe6\xfb\xcb\x1e\xea\x88\xe4\x94E\xbb\
-/D\xf5\x18^\x9b!oVx\xba)\x0c\x91\xca\xe9\
-\xd3\xa7w\xec\xd8\xa1?\xe2\xac\xdfx\xf2y#)\xa4\
-/\xd4zv\xccB\x11\xba\x9b\x98L\xfe\xc2\x10\xf2\x19\
-S\x11n\x96\xa1>k\xd6\xac\x05\x0b\x16pd\xcc\xfb\
-\x8c\x87\x80\x1a\x9c3\x0a\x92\xec\x8ao\xdc\xb8q\xf4\xe8\
-\xd1\x03\x07\x0e\x9c;w\x8e\xfd\x86,#\x0f\x89\xea\xea\
-j&\xc3\xd9\xb3g755\x85c\x9b\xbeP\xef\x18\
-\xbe\x93\x1c^\x95S\xfaD>\xc2J\xf2\x1a\x87\x06\x92\
-\xf3\x9a\x19\xa9\xab2\x0a\xe9\x05\xb9\xc2\xa7\x1dv\x22\x09\
-BY\xe3\xa3x\xf1\xec\x05H\x03\xc8\x94E\x88\xc1h\
-\xe4\xf1\xa3A\x09\x96\x94\x00\x1a\xe2c\xf5\x13j\xb0\xd0\
-V$\xb5\xe7`qe\xf6a\xbdY\xb4hQ[[\
-\x1b1\x967\x9a\xa2\xd0z\x04\x13\xac\xac\xcd\xcd\xcd\xc4\
-\xa0\x9b7o\xfe\xeew\xbf\xfb\x83\x1f\xfc\xe0G?\xfa\
-\xd1\xbf\xfc\xcb\xbf\xbc\xfe\xfa\xebk\xd7\xae\x9d7o^\
-WWWww7G\xfdDhCC\x83&hp\
-\xf1g\x02U\xe5\xed\x8b\x94\xd27tn\xa2\x11\xca*\
-\x84\xd9\x8f\x8a\xd5&\x81R\xac\xe2\xfa\xe4Z\x06S\x15\
-\xee\xf1\xc2\x85\x0b;w\xee$\x1e=y\xf2\xa4\xfd\xc9\
-\x06\xb5\x06\xd0\x144Bj\xe4\xa7\xc0\xd8\xfa\x11\xa4,\
-b\xaf,\xc6\x00\x83A\xbb\x11+5%!\x18mt\
-\x10\xa9\xe8\xe9~\xd8P)Ji\x8aT\xdb\x92\x14&\
-K`\xa7q\xfd\xfa\xf5\xe3\xc7\x8f\xd3\xbfl6\xae^\
-\xbd\xfaT}b\xf3X`\xa7\xcd\x5c\xc7\xaeC\x7f\x92\
-\xa3HG\x17A\xa5\xc0\xa73\xf8\xec\xc0@\xfd.L\
-\x93\x12\x84/\xe9\x90\xc6\x15\x1aaS\x0a*\x95\x02\xbd\
-\xaf:@\xf6\xa5\xe3\x8b9\x92\x15\xa2\xb4\x87;\xfe\x0a\
-\x1cJJ?nb0\x1a)'\x1a\xd0>\x11 \xbd\
-\xe1\xb59\xb2\xe3\xd84\xc9H\xcf\x11jXY\xdd\x8b\
-\x92\xb3\x09\xbc\x88JI*wJ\xc2\xdd\x11V\xce\x99\
-3G\xbf\x0c\xbai\xd3\xa67\xdf|\x93`\xf4{\xdf\
-\xfb\xde\xb7\xbe\xf5-\x02\xd3\x15+Vttt0\x1d\
-\xb3\xfa\x12\xb0B\xf2\x04\xcc\x85\xa1\x9a\x5c\xf26{H\
-*wT{!3\xe1U\x01>cd\x96\xbaOx\
-\x95S~\xe1\xf0\xe9\xa9\x0bwz\xfb\xf6m\xe2\xd1c\
-\xc7\x8e\x9d>}\xba\xaf\xaf\x8f\x08FM\x91m+\xf1\
-\xffg\xef\xbd\xbb\xe48\xae<\xed\xb334p\x84o\
-\xd8\x86\xf7\xde{oH\x82\x04E/ZQ\xda\xd9\xfd\
-:\xfb\xc7~\x84wv\xa4\x91\x1b\x19R\x94D\x81$\
-\x08\xc2\x1b\xc2\xdb\x06\x1a\xde{o\xa9=\xfb>\x19\xbf\
-\xa8\x8b\xe8\xc8\xac\xea\xaa\xb6\xd5\x8dz\x0e\x99\xb8q\xe3\
-Fd\x98\x1b\x117\xb3\xab\xab\xa57\xd0$c\x97Z\
-2\x11\xb2\x94 \x197\xc0%\x08\xd4tf+\xb7\xfd\
-\xc1\x12\xe0\xe9\x94\xe8\xc4\x9e\xc4\xf2\xf9\xbf)%\x08e\
-\xd5\x8b\xa6@\xcf\x0c\x82\xb8\x93G\x8b\xe3\xc7\x8f\xef\xd8\
-\xb1c\xe7\xce\x9dL\xee\xfd\xfb\xf7\xbdu\x85f\x83M\
-C\x1f\xc2f\x1d!3\x11>#\xb7\x04\x8a\x9f\xd3\xc2\
-d\xd6\xa3\xdb\xb9\xf9\xaf\xb3\x1e\x95\xac\xf7\xd6Q)\xb0\
-6\x0b)\x0b\x90\xae\x01\x8a,+d\xa9\x22F\xe1#\
-#\x9f\xbe\x91T\x82\xd1\x0aM\x00K\x82\xbd\x98S\x96\
-\xfdW?y\xcc\xf4W\xe7\xdeOA\x83\xa5!\x03)\
-\x13\xeb\x1c\x96k\xa88gj\xa7N\xc9\x9fS\xe7\xc8\
-a\xf1\xf8\xbcv\x01\xbd\xe3\x10}\xdeAd\xd9\xb3g\
-\xcfq\xe3\xc6\xadX\xb1\x82\xe8\x13\x10f\xce\x9cI`\
-:|\xf8\xf0!C\x86p\xee\x12\x8es\x06\xeb\xa5\x97\
-\xb03\xd8\xd7X\x1c\xa1}2\xc4\xa5\x17W\x11\x13 \
-\x9c\xbbh\x1e\xc1\xcdm\x82\x9d\xeb>\xa3\xfdB\x1f9\
-;\xaf^\xbdz\xee\xdc\xb9k\xd7\xae!\xeb\x10U\xdf\
-\xf3\x0d\x1dDY\x11\x96k6BY\xf8\x03\xe0$\xdd\
-\xbauS\x94\x16\x99\xb5\x0fX\x02\x03\x06\x0c\x18;v\
-\xec\x88\x11#X5\x0aF\x8b\xef)c\xe5\xa5\xac\x11\
-6\xbcE`\x83\xf7\xb2\x01\xf2h\xc13\xc6\xee\xdd\xbb\
-kkk\x09LQz\xbb\x0a\xcd\xc6\xbd{\xf7N\x9e\
-<\xc9\xb0_\xbat\x89\x03\xa8\xc9\xb7\x11\x9cG\xf8t\
-\x8a\xf0^\xbau\x88\xcf\xa8\x8bj\x8br\xed\x16\xeen\
-%\xac\xcd\x027*\x8c\x0a\x82\x92\xba/\xe8\x04\xf1\x89\
-\xe0\xab!|\xban;\x854\x8d\xa4\x12\x8cVh\x02\
-\xf0T\xc2\xd0\xf3\xe7\xcf\x9f>}\xda~\x9d(\x9f\x9b\
-J\x0f>]\x1c\xdcB\x82/\x9c{z\xd3UY\xed\
-\x03\x82l\x22\x06\xfd1q}0t\xea\xd4\xa9K\x97\
-.]\xbdz\xf5O~\xf2\x13\x22\xd1)S\xa6p\xe2\
-\x12R\xe8=(\x07p\xf4\xb3H\xb7u\xc4{G\x91\
-\xf82\x0d\x1d\xd2\xe2\xcb\xaa\x91&KxF \xfa\xbc\
-q\xe3\xc6\xa9S\xa7\xce\x9e={\xfb\xf6m\xfb\xcdz\
-\xbbJ\xf0\xd6\x8epT\xc9\x8a\x90R\xb9\x90\x9e\x024\
-8I\x97.]\xaa\xab\xabG\x8e\x1c\xd9\xaf_\xbf\x0e\
-\x1d:\x149Sm\x88\xce\x9d;\xb3j&M\x9a4\
-l\xd80\x9e\xd0\xf4x\xe6\xf3R\xc3\xa2\xa1\x0b\x09\xf5\
-\x92\x8b\x81j\xb1gN\x09\x86._\xbe\xcc6\xc8\x9c\
-V~@\xdf2<~\xfc\x980\x94\xa5\xc4\xc8s\x06\
-E/G[\x92\xc6\xdf\x17G2\x17\x95\x0cJf\x92\
-\xb8\xa9C\xb2\x94\x0dC7\xe2j\xe7H\xe6\xc1\x9a\xd6\
-\x88F\xde]T\x82\xd1\x0aM\x00\xbe\xc8\x13\xea\x993\
-g\x8e\x1e=\xca\xd6\xf0\xe4\xc9\x13\x9fQ\x22\xf2\xe9|\
-\x1e\x0f\x96%\x81\x05\x93\xb9f\xda\x22\xf4\x82p\xe1\x85\
-\x17^\xd0{P\xa2\xcf7\xdex\xe3\xad\xb7\xdez\xfb\
-\xed\xb7\x89AIN\x9e<\x99\xd8\x940\xb4G\x8f\x1e\
-z\x19L\x91\x08_W\x83\xf0U8\xbc\xaah\xc2\xcd\
-\xc8W\xe1\x90\x86\x5c\xa1d\x88\xcfpx\xd53\x80\xde\
-\xa2\xd9\x17\x93q\xa0\x12}*+s(l$\x0b\xa3\
-\x82Q\x0d\x94U\xf2_\xdd'[p\xa1\x993g\xe2\
-K\xbd{\xf7F#\x9bv\x03\x11v\xdf\xbe}\x89G\
-\xb9Z\xb4\x1d\x8eF\xbd\x14i\x9c8w\xddwH(\
-\x89\x84\x1e9\x10dV\x86\xd0`\xe6\x9d\xad\xc6@\xe3\
-\xf3\xda ,\x1c\x06\xfc\xee\xdd\xbb\x1c@\xf6P\xe7\xf3\
-\x8a^8-I\xd8$\x9a\x9a\xc6yS\x827\xca\x03\
-\x96^\xca\xc9\xa1\xa6\x01\xd8M\xb9:\xbf.\xf6`m\
-\x92\xbbC%\x18\xad\xd04\xb0\xffr\xc4\xb2\x1d\xd8\xb3\
-)\xd7\x92\x1c4\xb4\x8f\x96A\xb2Jr\x1a\x092\x06\
-)\xdb:\xcf?\xff|\xb7n\xdd\xf4;\xf2S\xa7N\
-]\xb6l\x19\x91\xe8\xbb\x0e\xe2\xd1\x95+WN\x9a4\
-\xa9\xaa\xaaJ\xbf\x17o1\x84F\xc0\x06'\xdfh\xc8\
- \xc4\xf4\x12\x9a\x9c\xf0.\x152!\x00\xbdr\xe5\xca\
-\xf9\xf3\xe7\x09F\xedc\xa3\xba\xe6;\x09\x8a\x19\xd2\xc4\
-!\xea\xa2\xe3\x19\xa8\xb3c\xc7\x8e\x03\x07\x0e\x9c2e\
-\x0a\xee\x84\xb3\xf1H\xe3\x8b\xb5\x17X\x1a\x9d;w&\
-\xe6f\xa5\x10f1bt\xdc\xe79\xc21\xd4\xb0\x84\
-\xf8\x8c\x22\xa0\x9e\x08\xe9\xb9i\xf4:\xb6\xac\xa0m\x0c\
-\x0eS_]]=\xc8\x81?hci\xbbO&L\
-\x1c\xe7\x0e\xa7O\x18\x89\xda\x8c4-\x05\xaa\xad\xf7\x8e\
-\x89\x97d\xd98\xd7K\x08\x93\x92\xf3!\x03Y\x82i\
-\x1aIT\x89\x1a\x0c>\x1d\xdc1\xd27\x09\x95`\xb4\
-B\xd3\xc0\xfe\xdb\xb3gO\xf6\xb8z\xbf\xd8/3\xcb\
-y\xb8_TrtC\x07\xb3\x90\xb1\xd1\x04\xeb\xaf\xf5\
-\xa0;\x0c\x14\x01\x01'\x01\xc7\x031(A\xa7^\x85\
-._\xbe|\xfa\xf4\xe9c\xc7\x8e\x1d5j\x14\xe1)\
-\xa3\xaa/.\x09\x87\x02|En\xd0l#\xb6\xacd\
-@\xf3\xcc\x82\xd9H\x00\xe9E\x94\x84|\xf5\xe4#]\
-\x83\xe1\xee\x96\xf7\xd6\xcf\x0e<\xb3\xdd\xbe}\x9b`\xf4\
-\xdc\xb9s7o\xde$6\xd5S\x9c\x86\xda\x0fMn\
-\xa0t\xadw\x16\xac\xb8\xc9x\x85\x90^\xb1Z\x9f>\
-}\xf0\xb7\xae]\xbb\x12\x9a\xa8\xf2v\x03\x0bD\xe1 \
-=\x8d\xba\xa6\x01\xf1\x89<\xe43\xa0\xaa\x88H\x8f\xac\
-\xb2\xdc\xba\x83\xfb\x1e_\x97\xdf\xfah@4&\xec3\
-L=\x8f\x22\xec3o\xbe\xf9&\xfb\x0cW\x1ez\xd9\
-m\xf4\xa6\x1c\x1b_\xacM\xe1&6\xf9\x98\x84\x04\xf0\
-\x19M\x8d&Z3\x1e\xa2\x5c\x08eC6\xe0\xd39\
-3\xb53l\xadk\xbbO\x86\xfaLB\x83z\x8d\x8b\
-A\x95p\x15\xc8j\xb6\xe1\xac<20\x94\x8c\x94\xa5\
-R\x09F+4\x0d\xf2Wva\xb6?\xaf\xaa\x0f\x15\
-\x01\x9f\xae\xeb\xcd>/\xc0g\x84Y\xb9\xa4\xfb\xb7-\
-\xc1\xbe\xff\xd2K/UUU\x0d\x1a4h\xcc\x981\
-\xb3f\xcdz\xe5\x95W8\x1e`\xd9\xb2e\x13&L\
- \x8b\xb8\x81\x83\x0d\x08C\xd3\xc7\x9b\x0d\x00\x83\x16\x8e\
-[f\xd2\xf0Z\x87\xd5`\xb2\x90FX2,.9\
-Dz#\xad\x89\x88\xee\xf2\x0cB\x80x\xff\xfe\xfdS\
-\xa7N\xed\xdd\xbb\xb7\xa6\xa6\xe6F\xee\xaf\x88\xb9\x19H\
-\x06G\x028\xf3\xa7C\x1a*EZ\x13b\x05\x110\
-\xc3\x91p'}\xd4\xb8\xf8\xa5\xdaV\xa0St\x8d\xd8\
-\x8b\x9e\xd2;uP\x83C\xf7\x853l\x1aT\xa1\xc2\
-}\xa6O?\xa3\xff\xb1l\xbe\xe8\x9e\xd1\xe0!V\xef\
-A\x07\x0f\x1e<r\xe4\xc8\x193f\xbc\xfc\xf2\xcb\xef\
-\xbc\xf3\xce\x07\x8e\x8f>\xfa\x88\xeb\xbb\xef\xbe\x8br\xd2\
-\xa4Im7\x1e\x15\x9a\x0e\x90,es\xa0\xbb\x80O\
-\x97B\xe6R\xf5\xd5\xa5Z.\xa5\xe1\xb5-\x82\xda\x99\
-\xd9\xda|4\xb2\x85\x95`\xb4B\xd3\xc0\x83\xe9\xb5k\
-\xd78\x5c\xaf^\xbd\xcav\xec\xb5YD\xfeM2\xc4\
-k\x03\xbdO;L#\x01\x90[x\x956\x18ZK\
-(\xc0v\xafW\x14D\x9c\x8b\x17/^\xbdz\xf5[\
-o\xbd\xf5\xfa\xeb\xaf/X\xb0\x80\xf3`\xc4\x88\x11\xfa\
-\xe5$\x05\xa0\x1c\xab\x5c\xd5M\xd7\xdd\xa7\xa3\xa1^G\
-\xca\x06\xa0\x1a\x844M2\x9eVIX\x9b\xdd\x02t\
-G\xe1U\xcf\x18\x8f\x1f?>w\xee\xdc.\xc7\x85\x0b\
-\x17\xec\x87\xf5@\x14UxX\xa2\xdc\xcc)sC\xeb\
-1\x0d5\xcb\xaf@\xb1Z\xbb\x81%\xc3\xc2!\xfcb\
-}\xd1\xb5\xd0\x03\xd3\xe3\x93\xd6\xa4\xd1\xb8\xe9\xaaJ\xc0\
-\xe5\xf8\xb1E \x0cE\xc9\xee\xc7l\xde\xb9s\x87\xdd\
-O\x1f\x02\x96Y\x0b\xa3\xc9\x05\x05\xe5}\xfb\xf6\x9d>\
-}:\x81\xa6\xbe\x06\x8e}\xe6\x8d7\xdeX\xb2d\xc9\
-\xd4\xa9S\xc7\x8e\x1d\xcb30\x8c\x1b7n\xda\xb4i\
-\x8b\x16-\xd2\xa7\xd2\xdbt<\x1aM\x90\x84fB7\
-\xb2\xdb\x15 \xb2I\x17\x095a\xb5\x5c\x0d\x97Y\x87\
-\xb0\x83&gZ\xe6#\xf1\xe0\x1c^\x15(}\xban\
-\xe5\x85\xeb\x0fK5\x80J0Z\xa1i`S\xbew\
-\xef\x1e\xf1\xa8}\x8f78\xaf\x8e\x89\xb2\xd2f2\x10\
-Z\x00\xc2\xab\x1a\xed\xf4\xad\x02[\xbc^\x85\x0e\x1c8\
-p\xd4\xa8Q3g\xce\x5c\xb1b\x05\xc7\xc3\xbb\xef\xbe\
-\xcbQ\xc1a\xc0\xf1@n\xc7\x8e\x1d9K\x14\x8b\x18\
-\xbe\x8a\x00)-\xcbY%(Y\x80p\x18#\x0ad\
-\x95\x8a\xaaJ\xe6\xac\xee\x87.\x94+\xa2\x5ci\x94\xf5\
-\x8c@\x7f\x1f<xp\xf1\xe2\xc5\xb3g\xcf\xde\xbcy\
-S\x8fp\xc5\x8f\x86,\xc1\xa7\x83\xb2\x92u\x0d}I\
-Yh\x88T\x88\xd8\xf4\xc1\x0f)\xdb:\xac\x1a\x96\xcf\
-\xc8\x91#\x07\x0d\x1a\xc4B#\xd4FYx\x0c\xc95\
-\xbc*@\xc3e\x83f\xc8\xd8\x8a`\x80\xcc\xee\xc7\xb3\
-\x04[\x1f\xf3\xa8\xdf\xe9VnK\xc2\x0e\xd3\xad[7\
-\x9er\x89Aa\xd8\xb0a\xf6\x1e\xf4\xa7\x0e\xe2Q\x9e\
-~\x09@\x898\xf5E\x1c8\x80>\xb61~\xfc\xf8\
-\x85\x0b\x17\x92\xcb\x13r\xaf^\xbd4zm\x8ep\x1e\
-3\xe7\xb4i1O\x08QVa\x8a4+\x809\xa7\
-\x90\xb2\x91\xf8\xbarxmN\xef\x139\x22\x8d\x92i\
-\xb3\x92\xa8\x04\xa3\x15\x9a\x0c=\x97\xe3\x91,6vg\
-\xaf\xcd\x11y\xaa[\xb9O\xd7dI~\xac\xb2\x86\xd7\
-\x96\x1ft*yM\xe1\xbe\xdf\x91\xe3a\xca\x94)\x04\
-\xa0\x84\x9e\xc4\xa0\xabW\xaf^\xbat\xe9\xf4\xe9\xd3\xc7\
-\x8d\x1b\xc7\xb1\xa1\xef\xe8\xd6O\x18\x8b\x8c\x0f\x1a\xbc\xf2\
-\xfd\xa8\xe5\x1f7j\xce\xc4gg\x19\xf8\x8c\xbaS\xe3\
-Uu\xf1y\xb9\x5c\x04\x5cEH\xf3LA\xf7\x1f?\
-~L\xf8\xf2\xe8\xd1#F@#\x89\xa0\x0f\xc0\xc9&\
-M4\xe6\xf90\x9b\xc8\x9e\x10\xa4{\xf7\xee8d\x8f\
-\x1e=\xdah\xd8\x91\x86\x1e\x11Q\xcd\x9e={\xf4\xe8\
-\xd1\xc4d\xf4\x8b.k\x0c\x0b\x8c$Y\x86W\xe5\x08\
-5Q\xae3O\xfcV\x02\xf0\xf8\xfd\xf0\xe1\xc3\xbbw\
-\xef2\x95\x85\x7f.\xd4$h\xa75\xe8,;Lu\
-u5\x8f\xb8z\x0f\xfa\xf6\xdbo\xbf\xf7\xde{z\xca\
-\x9d<y\xb2\xde\x83\x12\xa9\x0f\x180\x80H\x9d\xb0\x95\
-\x22\x14D\x00\xb6\x1d\xfd]\xb7\x05\x0b\x16,[\xb6L\
-\xefG\xdb\xa8c\xf8\xf9\xc8\xcdW(7\x07\xaa?\x8d\
-\xcf\x0e\xf0\x19\x01>\xa3\x08\xb4x\xc3%\x0c\xe9\xa4\xf0\
-\xe9F`\xcd\xa36<M\xd5\x82rC2\x95\x0d\xa6\
-\x12\x8cVh2pM|\x17\xb42\xbc\xb6 \xe1\x9a\
-\x0c\x8b\x14Y\xbc\x9ca7\xef\xdc\xb93\xbb\xbc\xdeR\
-\x10w\xbe\xfa\xea\xab\xef;\xdex\xe3\x0d\xbd\x0a\xed\xd3\
-\xa7\x8f^Pq0\xb81{\x8a\xaf\xa5\x14|\xc9\x14\
->;E8\xf8\x99\xf8\xf2\x0ei\xdc6\x15\xa3,\xf0\
-\xe9<s\xea\xf3\x1c$U-2\x81\x17g9W\x9d\
-\xee2~FP\xf7\x89D\x09b\x88f\xa2\x8f\x8d6\
-\x09\xaaM(I\xfc\xd1\xabW/|r\xe0\xc0\x81\x84\
-&\xc9\x82m\xe3\xd0\x85\x9e={N\x9c8q\xda\xb4\
-iC\x86\x0c\xe9\xd2\xa5\x0b\x0b\x0a}\xe2j9dY\
-\x12*\x95Y\xd6U\x99\x80\xcc\x0c2}\x17.\x5c8\
-}\xfat\xbd\x1fRj$L\x1f\xdb\x05\xb3F\x7f\x09\
-\x19\xab\xaa\xaa\xd8^\x081G\x8d\x1aE \xfe\xfa\xeb\
-\xaf\x7f\xf0\xc1\x07\x1f;\xde}\xf7\xdd\xc5\x8b\x17\x8f\x18\
-1\x820]\xefA\xedYW\xcd\xb6y\xa7N\xf4\x98\
-\x11\x8f\xea\xfd(a=\xf5k\x0c\xdb\x16\x9a\x94\x10)\
-\xc3,g\xd8\xa2D7\x8d\x9a\xa1\x85)\x22Y\xf8\xb4\
-#L*WxU3\xe0o\x90\xc3k\x032\x95\x0d\
-\xa0\xad~\x9bC\x852\x84]\x92\xe8\x8a\x1dm\xd8\xd0\
-\xa1\xc4alv\xa1\x9b\x16pYeE+\xb6\xb0\x8b\
-c\xcc\xc9}\xe7\xce\x9d\x93'O\x1e>|\xf8\xe2\xc5\
-\x8b-\xf0B\xa2Hh\xb9\x0d\xc5\xa4I\x93\xa6L\x99\
-2u\xea\xd4Y\xb3f\xcd\x9c9\x93\x00\xb4\x7f\xff\xfe\
-\x84\x02l\xfd\x0c\x11\xc7\x03\x91\x81\x06\xca\xfa\x1b\x0a\x91\
-\x1c\x22}H\xa6\xb2^\xacTT<\xb9G\x0e\xaf\xca\
-\x8f\xe6.\x9a\xc1L\xc2\x0am\x12O\x9d:\xb5\x7f\xff\
-\xfec\xc7\x8e!\x17SI{\x82#\x9f'\x16\xe2\x09\
-\xa2\x0a\xa2(\xfc\xc1\x9eL\xbcE@\xa8\x94\x8d!\x8d\
-\xb2\x0ce\x19h\x14\x82\x10\xf7?x\xf0\xe0\xca\x95+\
-,\x1c\xc6\x9c\xa43o\xab\x10K\x0d\x1a4h\xfe\xfc\
-\xf9<\xf2\xb1\xb8X}\xea&\xbe\x14\xba\x93\x1f\x85<\
-\x03\x9b\xa9/\x8cJ\x11\x8c2\x92?\xfc\xf0\xc3\xa6M\
-\x9bjjj\xee\xdd\xbb\xd7\xb4>\xcc-l\x8b \xac\
-d\x03\x197n\x1c\x1b\x0b!#\x02[\x0a\x02Q8\
-\xc1(W\xa2O\x0c\x88S\xd9a\xba\xb9\xbf\xce\xcfh\
-\xb8\x18\xf4_\xa9#\xdc\x93\xc3\xc1A\x0fX\xf2lL\
-\x11d\x1e\x90\xee\xde\xbd\xcb\xb5i\xfb\xd2\x1c\xd0l\x8d\
-\x09\xcfW]\xbbvU\xc0\xadn\x86\xd7\x90\xb4\xa6H\
-\x8a\x1c\x8d\x02\xf5\x875\x98\x19\x82\xb0\xa4\x09\x86\xe9u\
-\x8dp&O\xf1\xda\xe6!]?\x1b\x08n\x7f\xfc\xf8\
-\xf1={\xf6\xb0\xa5xm\x89T\x82\xd1\x0aM\x03\x0e\
-\xca.\xc0&8\xc6\xfd\x99J\xbdq\x09\xbdV\xb2-\
-\xc5z\x17\x0c\x06\x05V>\xdeO\x1c\xc3vYn\xc1\
-(\x91\x04\x1b\x22G\xe3\xe4\xc9\x939\x1d\x17/^<\
-w\xee\x5c\xfd\xc6\x80\xbe\xa1I\x01\xa8\x05\x1c\x05\xfa(\
-\x03\x9f\x08\xc8TB>=d\xde\xc5\xec\xd3\x05\xa5\xe1\
-*\xa4\x04\xd5\xc35\x22\xcc\xcd$3\x8b\x19\xbcy\xf3\
-&1(\x07\xf9\xee\xdd\xbb\xcf\x9c9\xc3\xe1\xe7\xf3\x9e\
-%X)x\x05\xa1\x03Q\xa9\xbd\xd5\x83p\xe4\xebE\
-3U\x183c:\xee\xdf\xbf\x7f\xee\xdc9\x1e\x03n\
-\xdc\xb8\xd1\xd6\x83Q\xc2\x11\xfd\x90\x9a\x88\x84g<\x1b\
-\xc0\xc8\xeb\xd4w\xb0\xa4\x040}X\xc4\x0c\x0a\xd7\xc3\
-\xce\xc3\xfe\xb3c\xc7\x0e\xdc\xf8\xd2\xa5KM\xbb\x11\xb1\
-W\x10\x1d\x12#\xd2/6\xd5\x81\x03\x07\x12p/]\
-\xbat\xd1\xa2ED\x9fl,\xec3@l\xaa\x9f\xc2\
-\xb3\xf9\xe8=(\x05\x15\x96\xa9\x1e\xba \x94\x14\xca5\
-==\xa2 w\xd1\xeeMx\xc1\x06\xfb\xd8\xfdyg\
-g^\xa6\xa4\x83Qs\x00\x08g\xcaHk\x8a\xa4\xc8\
-\xa1H\xdf\xb4@A\x19\x87\xf8\x8c\xba\x98>_U*\
-+\xbc\xaa9\xe1.j\x09\xd7&\x09F\xbd\xa7V\xa8\
-\xd0H\xe4\x91\xff\xb7\xe8\xbf\xc6\x16\x99\x91L\x93O\x0f\
-a)\xc9\xad\x88\xd6?p\x00\xf4\xeb\xd7o\xc6\x8c\x19\
-\xaf\xbc\xf2\xcak\xaf\xbdF$\xca\xc91a\xc2\x04\x9d\
-\x13\xc4\x19\xde\xae\xee\xb6\x12j$\x0bi\x22\xa4\xcf\x97\
-\xdbH\xdcm\x13\x22Y\xa8\xb5n\xc8\xb3\x91Y>d\
-\x83\x93\x80\x04BOv\xae\x9d;w6\xd3+\xa56\
-\x01\xb1\xcb\xe5\xcb\x97\xd9\xc4\xb7n\xdd\xcac\xd5\xb5k\
-\xd7J\xfd\x03f\xd14e\x22\x03]\x19dB\x0dB\
-\x96\x0e\x1d:pr\xd7[\xb6\xfc\xb1Wza\x14\x22\
-\x12\x9fs\xf8t\x0e\x1b\x10!ed\x96Y\xd0P.\
-n\xcc\xa6\xc7\x94\xe1\xcc\xc4m\xc8>\xbbD|;\x02\
-4G\x83\x07\x0f\x9e3g\xce\xab\xaf\xbe\xfa\xc6\x1bo\
-\xbc\xf9\xe6\x9b?\xf9\xc9O^~\xf9\xe5y\xf3\xe6\x11\
-\x86\x8e\x1f?\x9e'\xff\xd1\xa3G\x8f\x1a5J\x7ft\
-\x8a\x80U\x0f\xba\x94ULF=\xfe\x06\xb9[\xf8D\
-\x80\xf4\x14\xc1\x9eR<\x14Q!\x0f\xd2\xcb\x97/\x9f\
-2eJ\xaf^\xbd\xc8\xf2\xa6m\x8d\x02\xd3\xd7|d\
-\x0e2\xc8a\x22|^~4;\xa0\xa4\x15QqC\
-\xca\xe6\xc37\x22\xe8\x9an\xaa\xbb\x83\x94\x8d\xa1\x12\x8c\
-Vh2\xccY3\xbd3Sc\xe4K:\xc3\xf2\x85\
-\xed\x9bS\x90\xc7\xf1\xee\xdd\xbb\xb3k\x0f\x1a4\x88\xe8\
-\x93Ht\xf5\xea\xd5\x8b\x16-\x22\x0c\xd5o\x0cp\xea\
-\xbf\xe8~wU\xef*4J\x1a.PU\xa1\x9c\x0f\
-\x19d\x9a\x15(\x1b\x0e\xa3FUxU\x00JE\x8a\
-\xe9\xdad\x9f\x14\xcb\x91\x04\x959\xbc\xaa.*\x18A\
-\xcd@\xee?\xff\xf9\xcf\xfb\xf7\xef\x13\x8c\x12\x86\x1e=\
-z\x94 \x0c\x8d7z\x96`(\x1e<xp\xf6\xec\
-Y\xfd\x9cw\xdf\xbe}\xc4\xa6\xd1w\x03\xb9\xe1L\xf0\
-\xe9\xd2\x89\xca2\x05\xf8!\x81K\xdb\x8d3\x0c\xba\xc0\
-c^\x8f\x1e=\xf4N\x94\xae\xa1\xd4p\x81l\x84\xb2\
-\x0c%\xb9\x0a)\xd3D\x95\x18*\xc5\xdd1 \x06\xd5\
-*\xf0y\xa5\xc0\xb6\xc0\x16A\x08\xc8\x1eB/D\xcf\
-\x9e=\xfb\xf4\xe93b\xc4\x88\xb9s\xe7\x12\x83~\xf4\
-\xd1G?s\xbc\xfb\xee\xbbl,\x04\x8b\xec6\xee\x0d\
-\xe6Kl>\xfa\xc0\x8f\xbd\x11\x8c\xd6\xa3\xee\xa2\xd6B\
-\xa8\x94 \xa5\xb5\x9fzh\xc9\xb8q\xe3\x96,Y\xb2\
-t\xe9R61\xdaS\xe6~b=R\x1f%\x0b\xb2\
-,\xb7\x1cP{\x84W\x95N\xba\xac*\x04\x9fn\x04\
-\xd1\x00\x824\xa6\xf7w\xca!e\xe3\x89\x9f#+T\
-h0\xfaq\xc9\xc4\x89\x13\xd9C\xd9%\xf3\xf9tH\
->WN[\x86(\x97\xd8\xe5\xf6\xed\xdb\xad\xf8cz\
-\xf5w\xd2\xa4I\x93'O\xd6\xe7\xb7\x88D\xe7\xcd\x9b\
-7c\xc6\x0cN\x8b\xde\xbd{\x13\xa7\xea\xbcW\x83\xad\
-\xb3$\x85\xe4P#\x9cU\x02r4Dan\x84+\
-\x1a\xdfHr\xa8Q{@\x1a\xb2\x0c\x0e$\xbd\xdb\xc6\
-\x06,74\x93\x9c\x94\x0c\xb0\xdaB\x22\xa5\x92\xa6\xd4\
-\xa7,jkkw\xee\xdcy\xec\xd8\xb1{\xf7\xeeI\
-\xffl\x82\xf72\x1aw\xee\xdca\xfc\x09\xad\x880\x08\
-/\x14Z\x85cn\xc9\x90h\x9cC\x94\x15\x15!\xc9\
-]\xb8\xdd\xe9\xd3\xa7\x8f\x1f?N\xec\xdb\xa6\x1f\x03X\
-e\xc3\x86\x0d\xd3\xcf\xac\xfb\xf6\xed\xcb\xb8\xc9u!\x1c\
-\x19\x93\xd3\x03\x88F\x14\x18\xc9\x103C\xa0\x94^\xf0\
-\x1f8p\x00gfGB\xa3\xdcz\xa18s=t\
-\xe8P\xf6\x10\xd0\xef\xbc\xebe'2\x1b\xe9\xcc\x993\
-\xd9O\xa6M\x9b\xc6~2p\xe0@\xc2SbP|\
-\x83\x87[m,\x82zt\x15V\xb9]%D\xb2\xa0\
-`Z\x89\xe3\xb1\xb9\xd16\xbdj\xe5\xd1\x08oy\xf8\
-\xf0a\xf1]kIh!#\xc3\x10\x0d\x1e<\x98\x98\
-\x9e\xa4zA\x96\x04!c\x11%\x0b\x10vY2\xd7\
-P\xa9\xcaC|F}\xc8\xb2\xde\x22a\xae5@\xc9\
-\x88\xa8\xaaP.\x95\xa8*a\x8f+\xe9,\xf4l\xe0\
-'N\x9c\xd8\xb3g\xcf\x85\x0b\x17\xbc\xb6D*\xc1h\
-\x85&\xc3\x82\xd1\x91#G\xb2c\xa6\x1d:\xed\xc4\xf9\
-\xa8\xd7\x92\xd3T\xe7\xf7\xa9S\xa7\x8e\x1c9\xd2\x92\xc1\
-(;5\x87\x01\x1d\xe4\xe4\xe3\xfc[\xb1b\xc5\xd2\xa5\
-Kg\xcd\x9a\xa5\xcfoq\x96TWW\x93\xab\x17\x15\
-:$T\xd0Vr\xd8;\x93#!1\x0a\xcc\x8cH\
-\x19&]\x89\xec\xdc0\xcb\xde\xe2\xe8\x1cR\xf2\xc9\x93\
-'\xf7\xef\xdf\xbf~\xfd\xfa\x95+W\x18U\x8c\x99M\
-\x19\xd8\x1e\xa4k\x1a\xab9\x22\xd4K\x0e\xaf\xdc\x97\xfd\
-\x8bg\x89}\xfb\xf6=\xb3\x9f\x165\x18[\x1c\x98)\
-x\xf0\xe0\x01\xc9\x8e\x1d;\x12\x07\xe8\xe7\xce\x0c\x17W\
-\x94\x99\x87\x81\xc9\xe9\xd9\x09\xcd\xd20\xfeDN\x97.\
-]\xbav\xed\x1a\xf7\xcd7\xb9e\x0e}$\xfe\x980\
-a\xc2\x9c9sx\x1aDf\xdd\xf9<\x07\x06B\xb2\
-\x94\x05(\xd5\x86\x85s\xf5\xea\xd5\x9a\x9a\x9a\xbd{\xf7\
-\xe2\xccE\x8e$\x01\x1314\xad\x1d2d\xc8\xc2\x85\
-\x0b_y\xe5\x15\xae\x04\x9d\xec!0%\x07\x11*\x81\
-i\xbf~\xfd\x88\x0b\xf5\xa3\x15\xd0OW\xa8$\xe9\x95\
-\xc3\xe4\xb42\xcc\x12aRB\x94\xa4\xfd\xea\x02\x8d\xe4\
-\xbe/\xe5>?\xca\x93Ry.R\xc6D\xbf-J\
-X\xdf\xdd\xfd\xd9d\xad\x9a\x10\xcct\x15\xa1\x5c<6\
-2!\xa5V\x95\xb4\xc6!\xd9\xae\x10V^ +\x1f\
-\x18\x1bJJ\xdf`\xc2\x1a\x5c\xd7\x936D\xd5*\xc9\
-\xd6\x84\x87\x1c=zt\xf7\xee\xdd\x9c\xc5\xca*\x95J\
-0Z\xa1\xc9`\x17\xb0`ToF\xd3\x8e+|\xba\
- \xf9\xcc\xa4ga\xe8\xd5\x1a\xc1hK\xbe\x19%\x0c\
-\x1d0`\xc0\xf8\xf1\xe393f\xcc\x98\xb1`\xc1\x82\
-\xd9\xb3g\x13\x80\xd2q6\xc4\xaa\xaa*\x0e\x18{\xa7\
-\x15F\xa2\x06\x1aa\xc9H\x08I+3\xcd\x04Y\xca\
-\x95`(\x17\x94\xd4I\x06\xda_\x08J\x08\x808D\
-y\xa2\xdd\xbf\x7f\xff\xf6\xed\xdb\x09\x0di?3\xc8\xb1\
-\x87=6\xb2/\x00f^\x0a\x88\x94J\xea\xa6l^\
-L\x1f\xfb\x17\xf7:t\xe8\xd0\xd9\xb3g\xa3\x1fL?\
-\x830,\xf80cB\x8c\xc8\xa4\xe8\xfd\xa8NV\x19\
-\x98;\xd9\xc0\x22P\x0aA\xd7L\xa2Y\x004\xaa\x0a\
-\x88\xa5\xb8\x1d<|\xf8\xd0g\xb7)\xe8B\xef\xde\xbd\
-\xf5\xbb\xe4\x83\x07\x0ffy2\x5c\x1a\x0d\xb2d\x13\x12\
-*m\xd0\xc2\xd1\x8bJ\x91\x8c4`\x1a\xa6\xe9\xe6\xcd\
-\x9b<\x0c\xef\xd8\xb1\x83`\x94\xc8\xbe\x98_\xf7\xe9\xd1\
-\xa3\xc7\x88\x11#\xd8'\x097\x89\xa1\x81\x9dd\xd8\xb0\
-al,\xc4\x9d<\xe2re3A\xd0{\xd0p?\
-\x91@%a\xab\x90\x0d\xaf\xca\x19H)\xa2$Df\
-\x08\xa1\x86{\xe1~z?J\x92H\x94x\xb4\x0c\xfd\
-\x84\xf1a\xc4\xc6\x8e\x1d\xcb\xa82\xb6\xf6j<\xe9R\
-\xd0)\xc9&4\x00\xcdl\x01o)<\xf5\xa1\xb1k\
-\x85o\x0f\xd7\xcc\x82\xca\x8a(p\x0bW\xa5GI\xe9\
-\x1b\x83*\xb1\x8eg\xde\x1d\x1b\xf4l\x5c\xb5\xb5\xb5\x95\
-\xdf\xa6\xafP\x16\xb0\x0b\x10\x93\xe9\xf7u\xd8\xc2\xec\xec\
-4,\x19\x0a\x864\x99\xa4s\xd1\x10\xd0\xb096\xf7\
-\x8f\xe9\xd9\x91\xe9\x97>\xf4\xc9\xa6L\x079\xf9\xf46\
-T/c\xaa\xab\xab\x89\xdb0`\xe3V\xf4F\xc7\xd5\
-wP%Z\xc3\xa6\xb1\xab\x04\x11\xca\x05(`\xe6\xea\
-K\xb0\xa4\xdb=\xeal\x1f\x1c\x9fR2z\x8c\x18a\
-\xe8\xf9\xf3\xe79M\x09Cy\xa8\xdd\xb6m\x1b\xd7\x1b\
-7np\x0ar4v\xea\xd4\xc9\x17s\x845K0\
-\xd2\x1a\xc8\xa7\x04\x1a@K\x88\x80O\x9f>M0z\
-\xee\xdc\xb9J0\x0a\x0c\x8b\xe2QF\x86$N\xc5\x14\
-\xe0x8a\xb4\x9al\x18\x91\x93\xe9\x0c\x90AHX\
-P\xa0\xa1B\xfd@\xf3\xd6\xad[<\x87\x10\x8f\xe2\x12\
->\xbb\xed@/\x06\x0d\x1a4s\xe6\xcc\xc9\x93'\xf7\
-\xec\xd9SkPY\xe9^\x83)m\xa02GL`\
-\x9c\xaf\x12J1\x5cz-\xbak\xd7\xae-[\xb6\xb0\
-\x88\x18C\xbcZ\x06\xb4D\x9b\x86\xd1\xb1cGvE\
-\xa2L6\x8dE\x8b\x16\xb1\x87\xf0(K<\xcan\x89\
-R\x13\xcd\x8c\xd0~\xcaJ\x80d+\xa9\xbb\x99\x14I\
-\x91\xf6i3\x0d\x88\xdd\x946\xd06\xb6>\x9c\x90\xfd\
-\x96>\x96\xdbRe\xb8\x08F\xc7\x8f\x1fO0\xda\xbd\
-{w\xda\x89\xd2\xfae\x02H\x0e5\x0d\x86J\xac\x9e\
-\xb4/\xe5\xbb\x85J\x81%\x0b\xbb\x9f\x84\x026!\xae\
-b\x8f\x92\xd27\x18\xdd\x97k\x88\xb2\x22\xd0\xb3k\xe9\
-\xc7\xf4\x95`\xb4B+\x83\xeb\xb3)(\x18eS`\
-\xdb\x0d\x17Czy \x87H\xc35\xed\xee\xd2\x1b$\
-\xdd\xa2\xf0oF\x89f\x14\x8cr0x\x8b\xa6\x83\xe3\
-\x84\x1e\xe9#\x5c\x5c\xc7\x8c\x19C$:\x7f\xfe\xfcY\
-\xb3f\xe9\xc7g<\x88s\xc6\xb0_'}\xc8\xbd\xba\
-\xd0>Nq]\xf3Q8WX=\x86\xf4!>\xc3\
-\x11j$\xe8J\x93\x5cN2\xbc\x8aA\x1f>|\xc8\
-\x95(\x90s\xf4\xeb\xaf\xbf^\xbf~=gjMM\
-\xcd\xb5k\xd78\x08\x87\x0d\x1b\xa6\xd7\xdbVP\xa8B\
-\x09!R\xe6\xc3\x0cd\x0c\xc8L\x1fg\xdb\xa9S\xa7\
-\x08F\x09\x88+\xc1\xa8\xd0\x04\x11\x8c28D6\x04\
-\x01z?\xaaA\x03\x84pR\xdcRH\xf0\xe9`\xb4\
-\xd3\xa4\xb3\x18v|\xe0\xf8\xf1\xe3\xd7\xaf_W \xd5\
-\x86\xa0;\x84q\x93&M\x9a={\xb6>\x1a\x84\xeb\
-F\x1e\x1b\xa1\x11\xd0pE\xe3\x16\xa1q\x96=\xd7\x10\
-i(\xcb\xe8\xb1\xf3p\x00\x03\x01\xbd|\x98\x1d\xa0[\
-\xb7nC\x87\x0e\xd5\xa6\xc1f\xc8j\x82\xe1\xc3\x87\x93\
-$h&t\xa6\xc14{\xc8\x90!UUUj\xb6\
-\xf6\x10\x8asSa;I\x885\x18YB>\xea5\
-\x10\x99fn`\xfc\x8dh\x06Q2\xfb9\x9b!I\
-\xbd\x1f-\xab\x9f\xd73z\x0c\xe3\xa8Q\xa3\x18s}\
-N\x83qC\xaf\xaeY_\xc2\x9e\x1698\x80\xa5\xe1\
-U\xc1\xa2\x13^\x9b\xf3+Y\x86\xf6!\xae&\x8fW\
-5\x11\xbeR\x87\x92\xd27\x0c\xf5\xc5\xf5/\x81G/\
-\xae\xca\x0a\xd1\xed\xc8%\x18e\x1b\xa9\xfc\x98\xbeB\xeb\
-\x83G\x86\xc1\xa8\xe2\x18\x94>;\xe7\xb5>\x91\x22\xcc\
-\x0a\x9d^\xfa0W2\xde\xaf\x9f\xf3*\x18\xe5$h\
-\xaa`\x94\xbd\x8c\xcd\xb7S\xa7Nta\xe0\xc0\x81\x9c\
-\x1c\xfaV?\xfd4\x8d`\x943F\x7f\xba\x86\xfeb\
-\xccf\xedVk\x02\xc5\xa3>\xda Dz@\x13*\
-U<D\x06\xe0\xd3\xf5\x11Z\xaa6\xaeD\x18\x8c\x15\
- \x10\x80\xde\xbe}[\xc1\x07q\xe7\xb1c\xc7\xd8;\
-6o\xde\xbc}\xfbv\xfd\x22\x0b\xe3Iw\xe8]\xf8\
-Y\x0b;\x11U3\x84r\xba\xd9F\xba\x88ih\x0f\
-!\x97=KT\x82\xd1\x08{?\xca\xe0\xe3\x8a\x84\x02\
-\xf8\xa4E'\xde(\x0ff\xc0\xd4 +\x19^\x05\xb9\
-\xdc\xe5\xd6\xad[L\xfd\x91#G\xae^\xbd\xda\xb6\x82\
-Q\xfa\xc2\xb0\x8c\x1b7N\xdfs4h\xd0 \xbd\xbd\
-+\xe0\x90`#P\xd8\x0c\xb04\xbc\xaa.\xe8\x19\xc0\
-\x9b7o\xf2@u\xe6\xcc\x19&\x8b\xbb\xf3h\xca\x03\
-*\x81\xd1\xc2\x85\x0b\x97-[\xc6\x83+\x1b\x88\xfb \
-\xe8T\xb6\x8e\xe9\xd3\xa7O\x992\x856\x136\xf5\xea\
-\xd5\x8b\x99e\x0fQ\x00m\xed\xa1ZM\x9c\x92\x864\
-\x5c\x85\x94\x05(\xc6\x06\xd2f\xf21\xda\xa0&!\xa3\
-\xa1\x9d\x0c/\xbdc\x9be\xa3\xc0mX\xc2\xb2ou\
-\x18v\xda\xc6c\xc9\x80\x01\x03z\xf6\xec\x19\xbe\x1dP\
-\x17\x04I]\x85\x94\xc5\x10V\x02n`<$\xd3U\
-I\x93\xef\x16\x91\xbe@K\x0adE`\x19!\xa5r\
-KE\xfd\x92 \x98k\x09(\xa3j\x95$\x8b\xfd\xaa\
-\xb6\xb6\xb6\x12\x8cV(\x0b8/\xfb\xf5\xeb\x17\xbe\x19\
-\x0d\x1d7J\x86\xe4\xd3\x83\xb2B\x03\x939;9\x00\
-\x88c\x08\xaa\x9a$\x9a\xd1\xc1\xdf\xb7o_\x8e\x0aB\
-\xb1\xd1\xa3G\xeb=\xe8\xec\xd9\xb3\x09@\x07\x0f\x1e\xcc\
-f\xc7\x96\xd7\xbd{w\xcc\xd8\x01\xc1N\x11k'\xa0\
-\xe7*}\xb2\x82\x03\x03\xc9J\x0a%3Qn\xbdf\
-!X\xea\x16\x5c\x09\xd6\x19\x13}\x1e\x94+\x5c\xbbv\
-\x8d\xc8o\xcb\x96-\x1b6l\xd8\xbau\xab>\xe8F\
-T\xca\xe9B.\xf6z\x9c\x98<y2a7\xfd\xa5\
-\x9b\xd1\xdd%\x87\x9a\xc2\x98eT\x84\xe6q\x90\x13\x19\
-\x9f<y\xb2\xf2f4\x8d\xc6\x87Ia\x8bG\xd6\xfb\
-\xd1\x0e\xee\x03\x91f \x01lR@\x91\x84\xf4\x864\
-.\xffi\x96\x9e\x07\x98\x02\x8e\x10|\xa0\xcd\x05\xa3\xf4\
-\x94\xc8\x83\xd8\x8e`\x94\xa5\xaa\x0f\x0b\xd2A\x8d\x8c:\
-\x9bFe\x85,\xd3#)d\x0f\x92\xa5\x8c\xd0\xf2g\
-\x18\x89~\xbau\xeb\xc6\xfe0d\xc8\x10\xf6\x0av\x8c\
-\x05\x0b\x16\x10z\xb2\x13V\x07D\xbf\x11Oq\xd5\xa3\
-\xfa\xad\xe5N\xe7\x05\xae6\xa7\xf9\x9a\x9aI\xbd\x06\x22\
-\x9f\x99\xddW\x06\x5c\x157\xe30zpe\xbb\x90e\
-\xab\xc3\xb0\xe0\xcc\xb4\x0d\x1f`\xf7\xe6\xe8\xd1\x0e\xec\xb3\
-\x1d\xae\x1fu\xf0\x19\xf5\xa11\x0fG^\xb73MX\
-\x95j\x16^U\x97L}\xa9\xc6i\xd2zi\x5c\x89\
-\xc6BO\x8d\xa8f\x09\xe8u\x16\xb3\x99\xebG\x04\xca\
--\x95J0Z\xa1\xc9`\xb7\xb2`4\xdf\x9bQ\x1c\
-\xd7\xa7\x1d\xa1A&\x91\x81%\xdd\xd2\xf0\xafv\xce\x9d\
-;\xa7p\xaa\x01\x0f\xebT\xc8.\xc6\xc34\xe7\xbd~\
-\xb9\x95#\x84\x83d\xe1\xc2\x85s\xe6\xcc\xd1{P\xce\
-\x18\xba\xc3Q\xa7\xed\x18\xe8\x9a\xf0\xb5\xe4\x1a\x86&j\
-\xb0\xfa\x8b2\xd2\x87\x1a\xd9d\x12\x96\xca4\x0b\x0d\x04\
-f\x8c\x03\xb1\x1dq\xcc\xa5K\x97N8N\x9f>}\
-\xea\xd4)b\x8e\x9d;wn\xde\xbcY\xdf\xa6t\xf6\
-\xecY\xc6\xed\xee\xdd\xbb\x0c#\x05\xa9\x8a3r\xcc\x98\
-1\xc4\xdfS\xa7N\xad\xaa\xaa\xa2\xbfQ\x8fLN\xdf\
-7\x93\xb4\xbdz\xc1\xe6u\xe7\xce\x9d3g\xce\x1ct\
-\x5c\xb9rEm\xa8\x10\xc2\x980;z\xe5\xa6\xf7R\
-r9\x9d\x85\x10\x0e\xaffJH\x19\xe23\x5c\x96\xa6\
-\x00\x88'\x14\x8c\xf2\x88\xd22\xc1(A\x1bA\x18\x1d\
-\xd1j\x22\x89\xb2\x01\xcb\x16\xe8/Q\x1d\xc1(\x0fN\
-\x83\x06\x0d\xd2\xe0\xf8N\x06\xc3\x92FY\x99\x84\xb92\
-\x06\x9f\x0e\xf0\x19n\xcc\xe9\x08O\xa7l\x11\x04\xc4\x93\
-r\x7f\xfb\x97\xc79\x9ef{\xf7\xeeM\xab\xe8&`\
-&\xb4\x81\xa8\xe3B\xf5 h^HJ@\x09\xee>\
-ufMHY\x18\xb3\xb1\xb2\xf9*1\xbd\xdd+\xbc\
-)W\xcd\x11\xd7\x9b7o\x12s\x5c\xbcx\xf1Q\xd9\
-\xfc\xa5P\x9a\xa1\xc8\x98\x87\x93\xa1C\x872\xec\xda\xa2\
-\xa3!R\x92k\xa4\x87\xb4\xa6\x00\xdcN(\xa9\xb2\xae\
-\xd6:k0\x13\xb3\x8f\xb0\x5c#\x9f\x99\x09iB\xbd\
-dg\xfb\x14k\xb3\x91\xb6\x11\xa1%\xb26\x1c%]\
-\xf5O\x9b!\x81\xad\x83\xf3\x970\xf4\xe8\xd1\xa3\x1c7\
-R\x96J%\x18\xad\xd0d\xb0\xe7\xd6\x1b\x8cJ\x8eV\
-\x05\xfa\xf4:\x11V\xc40\x8d\x04\x96\x81~\xfa\x0cE\
-\xee\x8f\x14\x14\xb4\xb0S\xa7N\xb4y\xf8\xf0\xe1\x1c\x1e\
-\xe3\xc7\x8f\x9f9s\xe6\xdc\xb9sg\xcd\x9a5q\xe2\
-D\x94\xfd\xfb\xf7\xb7\x9f\xfb\xe8\x08\xd1\xdbP\xcaRO\
-x/\xc9\x5c!s\xe9\x86W\x09\x92\xcd\xb2^BK\
-d\xab*\x84\xd1x\xe2\xbe\xa4Ig\xc6\x8e\x1d;\xd6\
-\xaf_\xbfi\xd3&\xfd\xbd\xcd}\xfb\xf6\x1d8p\x80\
-\xcd\xe2\xda\xb5k\xec\x1d\xc4:\xd8[\xb5\xf4\x8bp\x5c\
-\xefu\x98A\xa2\x1f\xbd`\xb0\x1b\x85w\xccT\xa6\x89\
-\x8ap/\xd0\x94\xf1\x08A\xab\xb6n\xdd\xca\xfe\xc5\xdc\
-5,\x22i\xdf0V\xcc&3\xc5\x84\xea\xbd50\
-P<i\xa0g\x18\x19\xd2h\x84M\xa0\xac\xcb\xf4\x84\
-\xb9\x02\x03\xea\xe4Y\x8e\xc7\x92\x16\x08F\xb9;\xeb\x88\
-'\x1c\x96\xd5\xb0a\xc3\xaa\xab\xabY\x5c\xfau\x13\x9a\
-\xd1\x80[\xe3\xae\x84\x1d\x84},\xd5>}\xfa02\
-\xa6\x97\x00Q\x97#lX\x0c\xe9\x85W\xe5\x94Z\xf5\
-\x10\x0a\xc0\xb6@\xbf\xd8%\xe8\x0e1\xf1\xe0\xc1\x83\xe9\
-\x1a\xed\xe9\xd2\xa5\x0bY\xf4N\x9b\x06\xc8^0\xf8\xe9\
-[\x80\xc9\x12d\x16\xed'v-\x86\xc2\x96T+\x94\
-L\x1b\xdb\xad\xad=L\x16\x8f\x91l \xec0M\xf5\
-\xc9\xa8\xc6C\xf3p\x80\x81\x03\x07\xea\xdd\x01A?\x1a\
-\xb59\xc2\x94an\xa6e\x01lLTP\x02\xd3*\
-\xc1\x99\xe4\xa5\x80\x81\x8a\x83O\xd7\xc5\xf4\x12\x9c\xe1S\
-,KH\x962\x22\x9c\xd0P07\x10$E\xb43\
-'\xb5\xe7\xf0\xaa\x9c1;\xd5\x8d\x1b7\xb6o\xdf\xee\
-\xb5%R\x09F+4\x19l\x07\xec\xc8\x9c\x0d\xa3F\
-\x8db/\xb6\xc5\x09\x92\xbd]]d\xe0\x13\x0ei\x84\
-W\x05\x98\x12\x81j\xd9\xe5\x118\xad\xaf\x5c\xb9\xc2\xc9\
-\xaaG\xe4|`I#9<\xa0C\x87\x0eD\xcc\xec\
-_\xc4^\xcb\x96-[\xb0`\xc1\x8c\x193\xa6L\x99\
-2f\xcc\x18\x94\xfa9\x1a\xc6\x9c%\xdc\xa5@\xfbY\
-\x84^r`\x96If\x96\x8a\xe4#\xb4\xb1\xbb\x98\x06\
-\x81m\xc2\xe08\xd7\x8b\xb4\xf3\xe7\xcf\xd7\xd6\xd6\x1e9\
-rd\xd7\xae]\x1b6l\xd8\xb2e\x0b\xa1\x86>\xd6\
-F\x96\xbeT2\xf3\xec\xa7B\x82Q\xe6\x8eA\xd0\xab\
-&\x9d\xa0\xca\x02\x13 \x94\xd3\x84E\x0c\xd3pw\xce\
-\xb3\x9a\x9a\x9a\x8d\x1b7n\xdb\xb6\xed\xe2\xc5\x8b\x85g\
-\xed\x19\x87\xd0\x93`\x9d\x99\xd5\x87.\xf0s\xe6\x91\xd8\
-QoL\xd3\xaf\xd9\xa2k(\x80\xc9\xf8\x0c\x0e\xa3`\
-\x14o\xa1\xdaf\x0aFq!\x82\x03\x5c\x8b\xa7>\x96\
-\x98~\x8b\x1ca\xd2\xa4I\xb8\x19O\x83r`-1\
-\x84hA\xe5\x83\x8e\x13v\xe0\xab\xe3\xc6\x8d\xeb\xd1\xa3\
-\x07C\x81\x92\x1a@5 8C\xaf\x14\xa6\xb7k\x88\
-i\x92\x05\x1f,y\xd3hEh\xcfQ\x16 \xa3a\
-\xaf0\x14\x86b)\xb3\xb0\x1e\x13L6\xa4\x8c\x88\xf4\
-f)!M\x94U\xc02$s\xcc\x93\xfb\x05\xd0\x1d\
-\x94\xc9(\xfc\xcb\xbf\x10\x89^\xb8pA\x9f!\x91q\
-\xebB\xf3xx\x1e:t(\xa7\x0f^\xc1\xf8\xab\xcd\
->\xbb\xee8(\x0b|\xba\xe0(\xc9\xd2@C\x97M\
-\x96\xa01q\xe6\x09R\xfaDq\xa8\x08\xf8t\x16a\
-n>\x99f$\xb58\xbc*\x0ff\x80`\x93\x18\x0a\
-Z\x89\x02\x8d\xab\xd2\x13&\x9d\xb9\xaf\x84+[\xca\x17\
-_|!e\xa9T\x82\xd1\x0aM\x06\xbb0\xc1h\xfa\
-\xcdh\xe2\xb3u\xd7\x864\xc2\x92\xe9,\x90\xd2\x085\
-Z'\xdc\x85C\x94\xb3\xf9\xe4\xc9\x93\x05~\xdaKA\
-,9\xf9\xaa\xaa\xaa\x06\x0f\x1e<d\xc8\x10\xae\xb4s\
-\xea\xd4\xa9\x1c\x8ds\xe7\xce\xd5o\x15\xd0~\x0e6}\
-$\x14{\x88\xdaP\xb8I\x906\xc8\x87,3\xed\xb5\
-\xb0uwd)\x91\xc1\x04\xf4t\x9c\x00\xe5\xa1\x830\
-\x85\x13\xe2\xc4\x89\x13\x84w\xdf\x7f\xff=1\xa8>\x0f\
-z\xe9\xd2%\xb2\x9e<y\xc2\xc8\x00E\xac\xc2\x08n\
-\xa7`\x94(Ao\x17\xec\xd0\xd5\x1dA\x96\x22J\xd6\
-\x0b\xf6\xdc\x1a\xf4B\x8e\xb6\xed\xd8\xb1\x83H\x88\xa0\xca\
-[T\xc8\x03\xd3\xc7\xc1\x8f\x93\xeb\xf7\xbd\x0e\x1e<\xc8\
-\xe8]\xbf~\x9d\x15\xc7S\x9f}\xfa\xd0M\xd1\xd3I\
-\x09\x93\x9at%\xa5\xe7\xb0\xc1\x1f\xf0\x99f\xfd\x05&\
-n\xc4\x82be\x8d\x1d;\x96\xb5\xb6p\xe1\xc2y\xf3\
-\xe6\x111\xb0\xf4\x88D\xfb\xf6\xed\x8b\xcb\x11F\xd0\x0b\
-=\xfc\xd0*\xdcC\xad-\x00\xfd\xe5q\x11_\x9d9\
-s\xa6~\x8f^\xbe\xaa%\x13\xe1\xcb\x04H\xa9\xdc4\
-T\xa2z\xac6\x13\xacl\x84+\xe1\x8b\x88\xb4Yf\
-\xc1\x86Q\xa0\xaa(\xab\x98\x9bf\x8e\xb6\x0aZ\xf1\xb0\
-\x1e\xbc\xf1\xdc\xb9s\xac\x5c\x9c\xa7\xde\x99j\x19\x18p\
-\x5ch\xd8\xb0a\x0aF\xd9\xbb\xd0(+\xeaB\xd8\x11\
-\xe40\x09Q2\x93\xb0\xcb\xaa\x01\x94l\xf0hX\x0d\
-\xf9\xc840e(\x08%3\x09\x0d\x10\xd4fky\
-\x94\x04\xd9\x1b\xd2\xd8\xd5\xa0\x08\x1b\x08\x1b\xfbo\x7f\xfb\
-[\xaf*\x91J0Z\xa1\xc9(>\x18\xcd\x87,\x8d\
-L\x8d\x90\xac\x05\xc09\xcd!\xad\xc0+\xfd\x93#,\
-\xd9\x9b8\xea\xd8\xad\xd8\xa7\xa6O\x9f\xce\x89\xa8\x9f\xc5\
-\xcf\x08~;\x9e\x5c\xccx\xa4V\xb3u\x05_K\x80\
-)\xd3BD>\xbd\x08\x8b\x87H\x09\xa1\x0c$\xe9/\
-\xa7\xb5\xc2\x08\x05(\x17.\x5c\xa0\xefg\x1cD\xa2{\
-\xf6\xec\xd9\xb8q\xe3\xf6\xed\xdb\x8f\x1e=J\x96\xbe\x1e\
-\xc8\x97\xaf\x8f\xe7\x9e{\x8eH\x9d\xe9\x83>}\xfa\x10\
-\xe2\xb8\xe6$m\xd05\x22SY/\xb4\xe7\xd1\xa3G\
-\x04R\xcc\xd7\x81\x03\x078\xd5\x88\xa7}^\x85\xfc0\
-\xdd\x9c\xfd\x97/_>\x7f\xfe<s}\xf6\xecY\x1e\
-\xbd\xf0\x07\x1c\x9bg'\x96^\xdac\xa5\x09\xcf\x15\x90\
-\x0d\xc8\x8b8<p\x9b\xe6{3\xca\x9a\x1a3f\xcc\
-2\xc7\x9c9sp\xad\xea\xeaj\x05\xd0\xb4\x9c]\xa2\
-w\xef\xde\xfd\xfa\xf5c\x01\x12\x98*\xa6T3\xd4\xc2\
-\xa8\xf1\x82,\xbaL\xe4A$\xcar&\xd2U8\x8e\
-\x9e\xab7rf\x99\xc5\x85\x8c\xb9\x86\xa0\xa1\x01\x80\x10\
-\xe6\x86\xb2\x15\x97`\xa0Q)\x9f\xce\x22]*\x22=\
-Y^r\x90\x14>\x9dE\xbd\xb9\xc2\xa7\x0b\x223\xbb\
-J\xe0Q\xe1\xf6\xed\xdbD\xa2\x87\x0e\x1d\xbaq\xe3F\
-\x81\x11nI\x18v\x9cj\xf8\xf0\xe1<H\xe3Kx\
-\x9dZkX\xfb\x8d\xb4\x06\xd2\x9a4\xd6e\xd5\x00J\
-6r(\xac\x9e4\x05\xb2@\xb9v\x15.'\xc6\xe7\
-\xe5\xf0\xda\x5c\xcb\xa3\xab\x844V0\xaaA\xaf\x18x\
-\xb2\xfd\xfc\xf3\xcf\xbd\xb6D*\xc1h\x85&\xa3\xde`\
-4\x9f\x7f\xe7C\x05\xd3\x90\xe5\x16K\x02G\x17!\x97\
-~;\xe7b\xddo\x1b\xc5R\x9b\x141('\xd6\xa8\
-Q\xa3\x08=\xf5\x9bI\xfa,\x01\xe7\x19\x0d\xee\xd5\xab\
-\x17\x87\x99N U\x1e^\xb9ER\x97#\xd4G\xa0\
-\x14>\x9d#\xad1B{\xbbK\xa4\x84\xc8\x86\x13\xfa\
-\xf1\xe3'\x0f\x1f&\xefAkkk7o\xde\xbca\
-\xc3\x06\xa2\xcf\xdd\xbbw\x13\x89\xee\xdb\xb7\x8fs\xc2~\
-;^E\x8a\x81\xbb0P\x8c\x12C4~\xfcx\xfb\
-%\x00\xcb\x95\x10\x92\xa9,\x0c\xed\xa1\xfdw\xdd\xdf\xcd\
-\xa2\xb5\x9cgW\xaf^%$\xf2\xd9\x15\xea\x839\xc5\
-\xc3\xf5:\x9ca\x044\xcc\x94N_y\x0b\xb3f\x13\
-\x97\xcf\x014wz3\xaa\x1f\xd37\xd3\x9b\xd1n\xdd\
-\xba\xb1\xd6\x96,Y\xc2\xb3\x1f\xdb\x02k\x8d\x18T\xcd\
-c\xc5\xd1l\xc2\xca\x1e=z\xf0\x14DHJ.\xf6\
-l\x1d\x85\xdf\x92\x92E\x11\xaa\x9d7o\x1e\xbb\x8d|\
-\x95\x1e\x09o\x94\x07o\x14@c\xbc\xe4d*\xf7\x89\
-,TI\xbaI>\xbb\x88\xbb{)G\xa8)<Y\
-\xa1P\x80bl@f\x85\x8dC\x1b\xb3\xd4\x03L\xd9\
-\x06\xa3z3\xcaI\xe43\x1c4^\xf8t\xaaSF\
-Z\x93F]N\xaa\xcba\xcaP0dP/\xa1\x99\
-\xab\xf5)^\xeb\x88\xea7\x03\xbb\x0a\x97\x99\x97tk\
-\x11$\x9b\xa0JT\x9bH\xec\x1c\x92C\x0d[\xc7}\
-\xf7\xdb\xf4[\xb6l\xe1H\xf2\xda\x12\xa9\x04\xa3\x15\x9a\
-\x8c(\x18\xb5m\xddg;\xe4\xe8 }\xda\xa0$\xa8\
-\x8d\x13\xeb\x9e\xfb\xab\x92\x1c\xa8\x16\x8cR'\x8d!\xc4\
-\xa4\x19D\x9c\x1cZK\x97.\xe5\xaa\xdfL\xd2GB\
-9\x051\xe0\x18\xa3\x9d*\x82\xa0\x93I5K\x19\xc9\
-\x5c%\x08%\x85W\xd5%\x9f\x1e\x0a\x14\x09\xb3\xe8 \
-\xb0\xda\xf56\xf4\xf6\xed\xdbt\x93`\x8e\xf3\xe0\x87\x1f\
-~\xf8\xfe\xfb\xef\x89D\xe9;\x1b\xc1\xe9\xd3\xa7\xc9\x22\
-4\xe7\x08\xf7\x85\x8b\x86\xe3\x9fa!\x12\xd5\xcf=\x89\
-\x09\x9e\xcb}\x0b7\x84\xed12\x95\x22\xe9@\x0e\xaf\
-\xcams\x04R\xc4\xca{\xf7\xee\xdd\xb1c\x07\xc1t\
-\xe5W\x97\x1a\x0c\xce@0\x8a\xf3\xe3\x18\x8c!\x8f\x1f\
-\x8f\x1e=\xc2\x81qi\x19\xa4\xfdV\xb8\xcc\x04\x9c\x8a\
-`\xf4\xe8\xd1\xa3\xcd\xf7\x0bL\x84\x08\xfa\x8a4\x02\x05\
-\x16\x9d\x82f-4\xdb\x1f\x10\xb4T\xf5k@\xfa\xdd\
-&\x8c\xb1\xa1k83\xbdS_\x04\xf6\x04\xa0\xd3\xa7\
-O\x9f={\xf6\x90!C\xb8\x85U\xe5-\xf2#3\
-C\xeb]\xd7L|\xb1\x94\xb7[{\xc2\x86\x89\xc82\
-$\x9d\x95\xdc\xa3\xb8f\xdb\x15\xd27\x85\xc8&\x13r\
-\x85d\xbbf\x926c\x22\xf0:|\x86\x0d\xe7\xe0\xc1\
-\x83\xe5\x1c\x8c\x86\xfd29TB\xd85\x11\x19d\x12\
-M}1EdS`\xac\x8a\xa9\x04\xd25\xa8\xa0]\
-\x0d\x97\x99\x0d\x95X=\xa1 \xd94\x10V\x15\xea!\
-\xcc\x02r\xd9|\xd8I\x08Fq\x0c\xaf-\x91J0\
-Z\xa1\xc9P0\xcav@4c\xc1\xa8\xcf\xcb\xf2f\
-]\xd3\xde\x1f\x9e\x0d\xa6\x04\xd9\x08Kr\x82r\x0c\xeb\
-\xb7v\xf4\xb7\xa1\xc9bc\xd2\xdbP\x0eB\x02P}\
-e\xfd\x981c\x06\x0d\x1a\xd4\xa3G\x0fN>\x22-\
-P\x0b\xa3\xa3H\x95\x0b\xdd\xc2\xf0\xda\x94\xbe\x00\x05\x8c\
-\xa3,\x1b\x07\x04p\xf7\xf1?Ke\x9ds\x06p\xd5\
-{\xac\xad[\xb7n\xd8\xb0\x81`n\xf7\xee\xdd$\x09\
-#x*\xa5\xe3\xd8d\xbeI\xaa\x17F\x80a\xe1)\
-\x82x}\xca\x94)L\xa2\x82\x06\xf0\x16Y\x1dIk\
-\xea\x85\xe6\x11?1S\xdb\xb6m\xdb\xb9s\xe7\x85\xdc\
-\x1f\xad\xa9\xd00\xf0\x0d\xa6\x1e\xaf\xe0!\x84G\x91+\
-W\xae0\xc2z\x8a`]\x08\xf3\x87h\xbe\xc8b\xf0\
-\xaf_\xbf\xae`\xf4\xda\xb5k\xcd\xf1T\xc0S\x0d\xeb\
-\x0e\xa7\xe2Q\x87\xc7?<\xcdy\xb7\x7f\xdf\xaf\xb6\xa1\
-\xa4\xcd\xec\x1e,\xdb\xee\xdd\xbb\xf7u\x10\x98\x92\xc4\x0f\
-1\xd0c\x985\x8fe[UUE\x9d\x93'O\xee\
-\xd3\xa7\x0f6\xb6\x84e 9\x0df\xb24{\x08e\
-P\x0di\x94\x15\x1a\xa8\xf1\x11\x05j\x80tna{\
-#\xbc{\xe6}\x05\x06\xb2\xc9\x87\xe5\x166\x13\xae\xb2\
-\xa7f\xdcW\xc1(\xaer\xc8\x81\xe3\x15hLK\xc2\
-$v\xee\xdcy\xd8\xb0a\xfa\xbc\xbb\x9e\xc7\xc2\xc6\xab\
-/\xe0\xd3u1}>\x83\x10u9\xeax\xe1\x82\xe4\
-\xd6;P\xf5\xde:_\x0d*\xc85DYi\xa8D\
-\xf5\x98 L\xa9\xa4P=\x99\xb5\xb9\x9b<\xd5\xeb\x9c\
-\xba\xe5\xbef\xb1\xf2\xdb\xf4\x15Z\x1f\x0bFG\x8c\x18\
-\xa1\x17\x1b\x99~,\x94e\x06\x08\xd8\x0b\xe4\x10\x19@\
-(\x0b-\x1e-\x03\xfd\xaa8G\xacv%\xe2\xaa\xc5\
-\x8b\x17\x13\x83\xce\x9c9\x93\x90\x94C\x0b=\xe7\x16'\
-\x19\xf8;\x05\xf7Rm\xaaPW\x94\xa61d\xa9\xab\
-H\x0a\xd7UZ\x11\xcb2\xf2e\xb9\xfb$\xd0~\x16\
-\xb6\x13X\xdeO\xe8\x97>\x15\xca\x22?{\xf6,a\
-\x1c1\xdc\xfa\xf5\xeb\xf5\xab?\x84 \xfaA\xad\xaf\xa5\
-\xa1t\xec\xd8\x910}\xfe\xfc\xf9\x0c\x1asG\x10\xc0\
-\xc8\xa0W#i\x8c\x04\x19\x1bi\x8dA\x11\x09\xb2Q\
-\x92+M\xbd}\xfb6\xd1\x0f\xc1(\x87\x19\xb2\xb3\xaa\
-\xd0p\x08\x0e\xee\xdd\xbbw\xf9\xf2e<\x84\xeb\xc3\x87\
-\x0f\x15\xf1\xb3\x16n\xdc\xb8\xc1s\x1a\xc3\xae\xd9\xb4I\
-A\xc0\xcd\xb4jN\x9d:\xb5o\xdf\xbe\x83\x07\x0f2\
-\x17f\xd0T\xb0\xdc\xd8\x10\x88\x1a\x09\x11\xfa\xf5\xeb\xc7\
-\xfe\x10\xae8\xc0\x86k\xb2\x0e\x9d\x9e+k\x93H\x82\
-\xa5J\x14\xdb\xdb\x81LS\xe9#\xa1\xb3Z\x88\x0d\xfa\
-\xf1\xe3\xc7\x13\xe6\xf6\xea\xd5+\x0cFe YX\x16\
-\xd8]\x94LC\xd9|\x83\x90\x99K2\xd2X=\x99\
-X\x96J\xe5\xb3\xb4:\xcd@B\x81\x9aE\x83\x0d\xd0\
-g\xa2\x5c\xd7K\xef3\xfaL\xd4\xde\xbd{\x0f\x1c8\
-\x80\x9b\xc9\xa0\xd5aN\xb5\xed\xeb\xcd(\xcf6h\x94\
-\xa5^\xa8; eH\xa8\xcf4\x88\xb0\xd91\xa2R\
-fPLm\x11\xf9\x8aX\x9d\xe1\xddelW\xc3e\
-&\x84rX\x10Y\xf8\xb4#J\xaa*\xf0\xe9\x9c\x81\
-4\xe9,\x8e-\x16&\x8b\xf4\xcb/\xbf\xf4\xda\x12\xa9\
-\x04\xa3\x15\x9a\x0c\x05\xa3\x13&L\xd0\x9bQm\xfa>\
-/\x85\xb2\xcc\x00c\xd9\x83\x09\xe8\xc3\x05`\x82\xcb\xac\
-#p\x00s*S\xb0G\x8f\x1e\xc3\x87\x0f\x9f>}\
-\xfa\xa2E\x8bf\xcf\x9e\xcdqU]]moCU\
-sRQ\x0eKJH\xaa\xcb\x09N\x9dA>\x035\
-\x95+\xa4mL\x96Y\x98\xa5\x22\xa0^\xb0\x9e\x81\xa8\
-\x82`\xe2\xc8\x91#\x9b6m\xda\xbcy\xf3\x0f?\xfc\
-\xb0g\xcf\x1e\xce\x00}*\xf4\xea\xd5\xab\x18p6\xd8\
-\xeb\xa2\x06\xc3Y\xce\x10\x11\xb23b\x04\x0d\x9c\xeeD\
-\x03\xe1\x14\x88P\x16iM\x08\xdd\xe1\xea\xea\xf01=\
-M\xe5<\xe30;~\xfc8}!\xc2\xa6\x9b2\xae\
-\xd0\x18\x18U\xdc\x86\xb8\x93\xb1\xd5[R\x1eZ\x88\xf5\
-\xf1\x13\xc2S\xb28$0\x93w\x81\xbcKQ\x05\x13\
-\xa1\xbf\x80\xf0\xa8\xa9\xff\xda8^\xd4\xb7o_\x22Q\
-\x9ep\x08\x1c{\xf6\xec\xc9\x02D/\xb7\xd15\xc4\x1c\
-\x06\xdf\xc3\x92\x07$\xe2QJ\xe9\xb1\x966\xd3A\x1a\
-\x8f\x195\x13\xda\x12v\xb0\xbaY\xdal;\x89\x93\x05\
-\xd0_/9\xcc\x99\x85\xeeb\xb8\x9b\xd7\x0f\x96j\xa1\
-\xae\x12LN\x93\xae\xd94*\xa8d\x81\x1a\xc0\x8aH\
-H\xd7)TI>\x9b\xf4-\xf2\xd5\x03V\x95lH\
-\x82\xc2P|\x86\xa7\x17\x16\xef\xd6\xad[y\x98D@\
-\xef\x0a\xb5>Lq\x18\x8c\x9aK\x90eW\x13\xd4G\
-@\x90\xde4@\xd2K\x8etV\xa8\x09QnX<\
-\xaa*\x93\x02\xb7\x16\x85+!W\x84rf\x0bM\x89\
-\xa0\xf7\x1d\x92%D\xa8\x1e\x9f\xc8jdd\xa0$\xf0\
-\xd0\xf8\xeb_\xff\xdakK\xa4\x12\x8cVh\x1apD\
-\xc2\x1a\x0e\x890\x18\xd51\xe0-r8\xa7\xf5\x0e\xad\
-\xab\xcc\xcc\x98kZ\xe0\x0a\xd1\xcaA\xcf\xc1\x03\xdc\x9a\
-;\xb2\x0dq>\xe9\xcf@\x8f\x1d;\x96\xc6p\x92\x85\
-ah\x84jPU\x10*%H\x96 \x94t\xf9u\
-\xf4nQ\xfb\xb6)\xd7\xee(\x8d\xb2\xd2P\x8a=\x1d\
-8h\x89>/\x5c\xb8p\xe6\xcc\x99s\xe7\xce\x9d?\
-\x7f\x9e\xed\x9eM\x7f\xdd\xbauD\xa2G\x8f\x1e=y\
-\xf2$Y\x84\x17z\x1bj\xb7k$\x9c\xf7D\x0c\xcb\
-\x96-#\x82g\xc4\x18.5\xbb^|\xf9,\xdc`\
-$ \xcbR2\xcdV0z\xf0\xe0A:H\x97\x13\
-\xeb\x0aM\x01#L\xc4\x80o\xe0!\xf8\x89}\x86\x98\
-\xe3\x81@\x13\xfd\x95+W.]\xba\x84\x06p0}\
-\xf7\x82^Q\x13\xc26\xfe\xa9&\xa2K\x97.\xacA\
-=\x13\xda\xcf\xe8\x95\x95v\x1e\xb9\x078\xcfJ\xb0u\
-M=,m\xc2\x0b\xbc\x85x\x88,\x165\x0f\x9c\xac\
-\xf1Q\xa3Fu\xef\xde=Z\xdd\xc8a\xb20\xba\xa9\
-!\x8d\xb2\xd2\xc8\x06\x12\xcfv\xf8t\x0a\xb3\x97 \x94\
-t\xf9OQ%\x91\xde\x99'X2\x14\xc2\xa4\xc9B\
-\x1a\xf0\xe9``\x85\xb2\xb8\x9a>\xe9FVGP\xb2\
-)\xe1\x15z\x1b\x8a\xcf\xe0N\xecB<\xbal\xdc\xb8\
-\xf1\xf0\xe1\xc3\xf8\x957-\x03\x98\xf10\x18\x0d_\x96\
-\x93\x1b^E\xd8ed3\x10\xd2\xa7)\x90%d\xe0\
-\xea\xc8@6 9s\xd8\x81\x5c\xcb\x0aK\x81\xf4\xd6\
-`@\x08mL\xb6\x1a\x10D\x98T0\x0aR\x82\xea\
-\x81p\xdc 4\x0b\xf5\x92\xc3\x5c\x04\xb6\xf7k\xd7\xae\
-\xfd\xf2\x97\xbf\x94\xa6T\x9ev\xa3B\x85\xc6\x80kr\
-l\x10\xd0|\xf0\xc1\x07/\xbf\xfcr\xff\xfe\xfduH\
-\x90%\x7f\xd5\x153\xbb\x1a\x89_\xbbe \xd9\xaeV\
-P\x84KH\x06&\xb0\x0c\xee;\xd8@9\xb7\x88\xa8\
-:\xba?\x9b$\x03-0\x15,\x09\xbb\x9d\x95\xd5\xed\
-\xec\xee\x86\x19\x80\xd9\x84\xa5\x92\x8arH)hp\xf2\
-\x22\xf4\xf1c\x22\xd1\x9a\x9a\x1a\x22\x03\x02\x85\x07\xeew\
-\xe1\xe9\x0e2g\x00\x87\x81\x154\xa1I\xa0aC\x87\
-\x0e]\xb5j\xd5\xdbo\xbf=y\xf2d\x9d\xfaa\xef\
-B\xb90a\xab\xd4H\xe6\x8b\xe2\x1a|d\xa0\x9bg\
-\xcf\x9e\xfd\xee\xbb\xef\xfe\xf4\xa7?\xed\xd8\xb1\xa3\xac\xce\
-\xb3v\x03\xa3\x0d\x08\x8c<! +\xb1\xba\xbaZA\
-\x9be1\x17\xf8\x18a\xab>\xdc\xc2\xbc\xb8\xa2MI\
-\xaf^\xbd\x88D\xdfy\xe7\x9d\xf9\xf3\xe7WUU\x11\
-\x1f\xe8\xd6\xba\x86\xc8st\x05\x0c\x9c\xfb$\xfe\x03,\
-\x84\xdb\xb7o\x13:\xe30\xfb\xf6\xed\xa3\xb5tj\xfc\
-\xf8\xf1K\x97.%\xf2\xd0\xdfp\x92\x8f\xa9\xacPU\
-\x8d\xc4\x9a\x04\xd4\xa9V!s\xa5a\x923)\xdc\x00\
-WM\x82d\xd7\xdel\xfb\xc2\xf5(W\xf5\x08i\xc2\
-Rv\x17%\xcd\xc0\xf4\xd6\x91\xb0\x140\xec\x84\xa18\
-\x06\x8b\xf4\xd4\xa9S\xfb\xf7\xef\xd7\x8bv\x1c\x86\xe7\x9c\
-\xeb\xd7\xaf\xb3qy\xd32\x00\x1f\xe8\xd3\xa7\xcf\xf2\xe5\
-\xcb?\xfa\xe8\xa3\x993g\xa6\x7f.\x17\xf5\x0e\xac\xd7\
- c\xae\xd2\xb8|\x8f\x0d\x1d\x90E\xd2\xf0\xda\xba6\
-!\xf9\xf4\xe0*H\xf0\xe9\xe0\xbe\xba\x8bd5\x09\xa4\
-q%2\x8a\xa0D\xc6XH\xa9\x99\x0d\xed\x85\x94\xa0\
-$\x05U\x8f\x09!\xa1\xa5\x043v:\xaf\xe4\x8a\xc3\
-\xe0*{\xf7\xee\xe54QV\xa9\xc4\xf7\xaeP\xa1a\
-\xe0\x9d={\xf6d#\xf8\xe9O\x7f\xbal\xd9\xb2\xbe\
-}\xfb\xea\xf0#\xcb\xbcY\x98\x1f\x9b\x00\xc8\xc2d\xe9\
-\xcd\xd7!9\x9a\x823\x80U\x87\x99\xae\xe8Y\x0c@\
-n\xa8'\xc9\x15T\xc4\x84\x22\xd1\xbd\xec\x8e\x85\xb1\x1b\
-a/\xa4\xb4,\xb5_$\x05ro\x0a9_\xd9\xdc\
-\x89\xd2\xf4\xf5Ll\xf7\x8f\x1e=\xc2\x86\xed\xfe\xe1\xc3\
-\x87\x92e\xdf\xe4p\xaeO\x980\xe1\xcd7\xdf|\xed\
-\xb5\xd7F\x8e\x1cI\x10\xafq\xf3\xd9\xa5\x8c\x98\xfak\
-h\x04\xc0u=\x99\x08\xbas\xf7\xee\xdd\xe3\xc7\x8f\x7f\
-\xf3\xcd7\x7f\xfd\xeb_9\xde\x88\x87\xbcu\x85\xe6\x81\
-\x91\xe7\xe9\x82\x07\xb3\xe7\x83\xbfI\xc3\x5cp%\xd4\xc0\
-\xb5\xb8\xe2\x84\xce\xb6\x89!\x00e\x1fx\xff\xfd\xf7g\
-\xcd\x9aE`\x1a\x86\xc2\x05P\xdb$\x98L\x0b\x89G\
-Y\x17\x80\x0b\xd1\x97\x01\x03\x06\x0c\x1b6\xccb\xdc\xb0\
-\xda(\xd9H\xac\x0d\xc2Z\xc5\x92\x8c\xb22\xc9\xd7\x12\
-\xabGrhV\xb8\xf1V\x0ad\xc9\xd5\x94\xc8\xa6\x94\
-\x06\xc2\x22v/)\xd5\x0b\x81^\x02J\x06\x9cqf\
-S\xe2\x09\xf9\xca\x95+<!\xeb\xbb/P\xb2f\xd9\
-\x94\xca*\x12\x05\x0bF?\xfe\xf8c\xce }\xea\x1d\
-\xe8\x0e\xb9a\x97-i\x90\x04\xd9GY`\xa5\x80\xdc\
-d\x80rHi\x02\x84rH\xa8\xb7J\x90#\xbd\x09\
-a.I!\x8daJM\x22r\xf2\xa3\x84\xe0\x97\x86\
-\x99#\xcb\x22\xc9\x15YY`2z3\x90\x00\x96\x9b\
-\x16\xcc8\xca\xd2\xfb\x94m\xdb\xb61\x05\xd2\x97J\xe5\
-\xc7\xf4\x15\x9a\x06\x0e\x1b\xfd\x8c~\xea\xd4\xa9C\x86\x0c\
-)\xf0S\xb9\xc4\xe5\x1d>]\xd7@Y`I\xbbJ\
-0\x0dh\xfb\x00iX\x8a4C\x0b\xd2\xb2\x80\x5c-\
-\x18\xc9\xa5\xa2J\x84W\xa5\xa0~\xdd\xc2\xc08\xbd\xbb\
-\xb1\xcb+\x08\x00\xf6t\xc2\xd0\x83\x07\x0fn\xd9\xb2e\
-\xeb\xd6\xad?\xfc\xf0\xc3\xbe}\xfbN\x9c8\xc1\x19\xc0\
-#&\xb9\x80qTm\x13B\x8c2t\xe8\xd0\x193\
-f\x10.\x8c\x1a5\xaak\xd7\xae\x0aY|v\x16\x85\
-s\x0d\x8d\x06 S\x04\x90\xe9\xcb\xd5\xabW\xe9\xa3\xbe\
-\x8b\xea\xd6\xad[\xec\x95\xb2\xaf\xd0|p&=q_\
-\xc5\x80;\x11I(\x98\x004\xccH\xf3M\x01;\x00\
-\xde5n\xdc\xb8\xea\xeajd{45\xe4\x1e`z\
-\xe72O\xbd\xdd9\x8e_\xd4<&\xe1\x9f<\xe2\xea\
-\xcf\xa7\x0d\x1c8\xb0G\x8f\x1e\xfail\xb8\xd2A\x05\
-UC\xe3Q\x9d\x80lm\x8b\xdaY\x18\x95M\xa3j\
-\xc1\xa7sH\xa3,!}\x01\xbc\x9d#L\x86##\
-\xbd3\xf70\xf5@G\xd8\x94\xf0\x90\x90\x9b\xee\x0b\xbf\
-\x08,\xb4/\xf1\x90L\xf2\xd2\xa5K\xf7\xef\xdf'\xb7\
-\xf9|\xa6\xc1\xd0S\xfd\x98^\xbfM\xcf\x03\x98\xf3\x8b\
-\x8c7\x9d\x10i\x92\xd1\xc9i$X2\x222\x03\xb9\
-A\x01gHg\x15\xae<\x9d+\x0d\xf5\x08\xc9.'\
-\x11X\xddL\x9f\xd0\xbc\xc8\x1e\x99,\xb3,\x00\xf6*\
-\xa2\xab(P043\xb8\x1d\xc1\xe8\xa9S\xa7p\x98\
-\xf5\xeb\xd7{m\x89T\x82\xd1\x0aM\x03\x07\xc6\xa0A\
-\x83&O\x9eL<\xda\xbf\x7f\x7f\xfb\xe8\xa1rC\x0f\
-\x0e\xf5\xa2p\xd2p\xe5\x12\xb4\xd1\xf8Dp\x0b\xe9\x95\
-\xd4r\x0as\x85\x92\x99\x14^\xba\xc5,l\xc0L\x96\
-\xdcK2\xb0V\xd9,8\xfe\xf5\xfb%\xe7\xdc\xaf\xc6\
-CMM\x0d;\xfe\xc6\x8d\x1b\xf7\xec\xd9s\xf2\xe4\xc9\
-\xcb\x97/\xb3\xddc\xe9\x8b\x15w\xc7\x86\xc1@\xf1\xf0\
-0g\xce\x9c\xa5K\x97N\x992\x05YG\xbb\xcf\xce\
-C\xe1\x014\xd4r\x8c\xa9PE\xd0\xb0[\x9d9s\
-f\xf3\xe6\xcdt\x19\xa19~4\x5c!\x13\xe7J\x19\
-\xf8\xec\xe6\x01w\xea\xd3\xa7\x0f\xf1(\xc1\xc1K/\xbd\
-\xc4\xfe \xbd\xf9\x83\x92\x22\xd3\xaf\xcc\x7f\x92\x17>\xee\
-\x8f\xbf\xf3\xf8D\x5c\xdb\xc5\xfd\x01'\x92(U\x90k\
-\x88\x8a7!6\x5c\x5c\x0b\x84b\xb2\x09Qc\xd2M\
-r\xcdL\xf0\xe9\x80|zk\x80\x92B\xc6\x86i\x22\
-!\x9d\x04\xaa\xe2i\x84\xe7^\xfd\xf0\x9d}\x89p\x13\
-.\x5c\xb8p\xfc\xf8\xf1\x1d;vl\xd8\xb0a\xd7\xae\
-]\xb5\xb5\xb5d\xdd\xb9s\xa7Y\x1f\x8c\x1b\x09~b\
-\xc1(\x0f*\xda\xca\xd4e\xf0F9\x22M\xa6\x0d\xa4\
-\x95\xd2d\x1ag\x929\x5c\xc9\xcd\xea\xab\xd9\x92\xa6\xc1\
-\xeb\xa8M\x98\x86\x93\xe2\xee\xdd\xbb\x9a\xb2k\xd7\xae\xf1\
-\x9c\x89^O}fi5\x98\x10R87\xa4\xb0%\
-\xf7\xe2\xee<\xb1l\xd9\xb2e\xdf\xbe}^[\x22\x95\
-`\xb4B\xd3\x80\x8fr\xe4\xb0\x11\x0c\x1e<\x98C\xc8\
-~\xe0\x1b\xf9n\xbdI\xe1\xd3\x01>#G\xa8\x91\x01\
-h\xf9\x09\x9fW\x17\x9f\x97\x85\xca\x865\x88\xb0\x94\xe5\
-\xa6\xabr\xd5'\xc8\x06\x81+\xcf\xa6\xec\xe0D]O\
-\xdc/;\xb3k\x1c<x\x90Pl\xfb\xf6\xed{\xf7\
-\xee\xdd\xbf\x7f?\xeb\x16\xd8\xfa\xaf_\xbf\xde\xc2o\x1d\
-\x9e\x7f\xfeyfj\xf1\xe2\xc5\xf3\xe7\xcf\xd7\x9bl\x8e\
-v\xf4\xea\x85l\xd2\x14\xc8\x8a\xc0\xd2\x22Q\xa0_t\
-\x90\x80\x9b\xbe\x1f8p\xa09~c\xa6B\xb9\x81\x8f\
-u\xed\xda\x95\xe7\x9c\x9e={\xea\xb3\xc8B\xb9\xd1j\
-\xb2,\x09\x80\xff\x08K\xe2\xa2\x9c\xb5\x80@2,\xd5\
-|X;\x11\x0ci\xd2\xb7\x8e\xb2\xcc\x00\xc1\xb2\x222\
-\xdb\x9f\xa9\x14a=\x98\x81\x0d\x91\x90\xder#\xc1\xae\
-,@\x22Q}\x18\x97\x18\x82\xb8S\xdb\x11\xcb\x93\xdd\
-\x09\xf4!Ql\xd8\xc1\xd8\xca(R\xb60\x02<\xa2\
-\x0cw\x7f\x0eT\xbf\xc0\xe4z\x9ct3\x8d\xb2\x0c\xaf\
-\xad;\xb0\xc2[\xe4\x90\xc6\xae\xf9&\xb40Q=\x12\
-L\x93\x86\x88\x93s\x81sD\x90\x04\x04&E_n\
-\xc0\x8e\x0a\x87\x0e\x1d\x22\x1eei\x10\x94\xdbZ\xa3x\
-(\xb8\xfa20\x1b\x88\xbc\xcbK\x0e\x99\x09\xafr(\
-I{h\x00\xed\xd9\xb9s\xa7\xf4\xa5R\x09F+4\
-\x0drbb\xd0\xfe\xfd\xfb\xb3\x1d\xb05\xd8{\x0b\xe1\
-|\xb8\x8e\x13G\xc8@xU]\xa4\x0fsC\x0d\x0d\
-\x10$AgU\x03\xa0\x06/\x05\xf5\x87J\x90>\xc4\
-\xdd\xd9\xff6\x80\x04{\x0f*\xce\x9d;w\xe4\xc8\x11\
-6}\xbd\x07e\xa3\xe7\x188\xeb\xfe\xc2\xb8\xbd\x0d\xf5\
-u\xb5\x08D\x9f\xec\xdd\xfa\xda\x9d\xee\xdd\xbb\x137\xa0\
-L\x06.\xd5\xb5\x90\xc2\xb9\x11\x18k48\xc9\x88\xc5\
-y|\xe7\x9c\xe3\xcc;u\xea\xd4\xc3\x87\x0f[\xb8\xbf\
-\x15Z\x18&\x1d8\x17\xd9\x0dxF\xe5\x8cdC\x90\
-?\xc81\xbc]\xce\xa9\xec\x0a,\xde\x10)3q\x15\
-4;jv\x08\xcaz\x1b\xa0\xdc\xf0j\xa8\x06\x91\xd4\
-R77\xad\xc9\x07f\xd1\x10I\xa9kx\x17C\xb9\
-\xc0\xec\xdc\xbe}\xfb\xf0\xe1\xc3\x1b6l\xd0\x1f\xce9\
-z\xf4(\xc1\x04\xfb\xd2\xe9\xd3\xa7yr&\x97\xa0'\
-\xb3\x92r\x83\x11\xe0\xc4\xb1\x1f\xd3\xdb\x9bQ\xe5\x9a \
-H\x86\x1a\xc9Q7\xcdF\xd7\x10ea\xaf\x22QA\
-#\x9f^\x15\xda5L\x0a\xc9\x14\xe7\x10a\xfc\xef\xdc\
-\xb9\xc3\x19\xc1\xe6\xc9\x83\x81~\xbb\x00\xa4\xd1\x83\x84}\
-\xed4\xb1)\x83\xd0\xb7o\xdf\x97\x82\xbf8c5[\
-\xb5JJ0\x9b(WHi\x98Y&\x94\x05\x1e]\
-\xbe\xfa\xea+\xaf*\x91J0Z\xa1\xc9`w#\x18\
-e/\x182dH\x8f\x1e=xJ\x0b\xdd\xd7\x1c\x1d\
-\x8d\xc9\x10&\x9dy\x82\x92!RZ\x96\xb3zj\xa6\
-\x1a\xd2\xb7\xe0\x0af)eX0D\xc6&K\x88\xca\
-\x0a\x94\x02Yz\xae\x04\x94\xf6\x08K\xb0\xc5n\xbe\x7f\
-\xff~\x9eY\xf5a\xd0\xf0=\xe8\xd5\xabW\xef\xde\xbd\
-K\x0cJ\x88\x86q\xcb\xbf#$D\xe0\x99a\xca\x94\
-)3g\xce\x8c>\xe0k\x84#\x10\xf6\xbd\x00\x91\x99\
-\x0a\x02\x0f\xcd\xe7\xcf\x9f'\x0c\xe5\xccc\x1c\xd8R\xe9\
-\xb57\xaa\xd0\xae\xe9\xda\xb5\xeb\xc8\x91#\xf5W08\
- \xbd\xb6.ZG\xc9rr$\xb1\x95\xc3\xa7\x1d\xb2\
-42\x95\xcd\x8d\x9c\x19\x94\x0c\xdb`\xca\x10\xe5\x86\xd7\
-L\xd2Yh \xac\xd3\xdd\xd6?f{U\xce\xcc0\
-\x8dr\xf3\xa1\xaa\x80m\x87m\x8a\x10\x87\x98\x86\xe7C\
-\xf6+\x1e\x9e\xd9\x97\x88'\xd8\x9aX\xb3-\xbf/5\
-\x18\xbc%\xfa\xcchz\x1c48 Y\xca|\x98Y\
-\xda\x92\xa13A\xb2i@\xf6\x96\x15\xa2,\xab0\xa9\
-\xda\xa1\xa4AANR\xc6_\xaf3\xf4uZ\x1c\x22\
-\xec\x9c555'O\x9e$\xee\xe4\xa9^\xa7\xc9\x9e\
-={\x8e\xb8\xbf\x83M\xccJU\xec\xea\xc3\x87\x0f\xd7\
-\x0f\x22\xb4\x82Tg\xfa.B\xfa\xf0\x1a\x12j\xa2\xdc\
-\xcc$W<\xea7\xbf\xf9\x8d\x94\xa5R\x09F+4\
-\x19\xf8\x22Of\x047\x1c?\xbd{\xf7\xce\xdc\x11\xd2\
-\xd8\xa2\xc58DJ\x88\x92 \x8d\xe1\xb5\x8e\xb4&M\
-\xba\x88\x97\xea\xe2j\x8a\xb3\xc2-\x86\x5c\xf6k`\xef\
-`\xe3\xe0\xc1\x94M\x81@\xf3\xea\xd5k<\xb6\x1e:\
-th\xd3\xa6M\x1b6l\xd0~A\x0c\xca\x8e\xaf\x1f\
-{a\x9f\xecU\x0e_W\x0bB\xb3\xbbu\xeb6a\
-\xc2\x84\x85\x0b\x17r\xad\xaa\xaa\xd2L\x81\xb7\xa8K\x01\
-}\x81\xf6+W\x83C\x97\xd9R\xbf\xff\xfe{\x82\xd1\
-\xb3g\xcf\xea\xb3M\x15\xda=\x1d;v\xac\xae\xae\x9e\
-4y2\xd1\xa8\xde\xd6\xf8\x8c\xc0\xa9$p\x0d5a\
-$j\xca\x10i\x94\xd5b\xc8\xdb\xcd\xe7\xad%\x22\xd2\
-G(\xab\x18d\xacR\xaaS\x1aS\x9a,!\x22S\
-o-O\x83^+\x94\xed\x8bH\x82\x05\x8b\x92\xab+\
-\xd7f\x08\x83Q\x02\xb2(\x14\x83d\xe0\xea&\xbd\x94\
-\x87b\x8c5\x80B\x9a\xe4\x1e)c\xd3\x84Y&\xab\
-lr\x8a\xb8\x91g.xP'\xb2\xe4\xa4\xe04\xa9\
-\xad\xad\xd5\xaf\x04\xed\xd8\xb1\xe3\xf0\xe1\xc3zoM0\
-JT\x0a$y\xc8\xbf}\xfb\xf6\x13\xf7\xc7 Xb\
-\xa3F\x8d\x1a=ztzK\xcf\x14\x22e\xa8\x11\x96\
-\x8c\xf4\xc2\x99'z\xeb\x02\x8d\xbf\xd6\x88\xef\x19\xad\x04\
-\xa3\x15\x9a\x0c\xd6?Q\x0e;\xc2\xd8\xb1c\xfb\xb8\xbf\
-\x19m\xfe\x9a\x89\xadaC\xf6\x11>/GZcd\
-\x1ag*\xbd\x94\x83\x96D\x8d\xb1\x82\xa1>\x94\xc9%\
-\xc9\xc6\xc1F@$z\xe9\xd2%\x82N\x82-\x9eb\
-\xf5\x12t\xd7\xae]h\xd8;\xae\x5c\xb9\xc2\xe6\xa2o\
-E\xd1\xae\xe1\xabh%hy\xdf\xbe}g\xcf\x9e=\
-w\xee\x5c&\xcb}Z\xf49\x0d\x89\xba\x1c\x91\xa9\x84\
-\xf4\xf8\xa4-\xc9e\x87\xd2O\x03\x09\xcd\xb92\x14\xad\
->\x02\x15Z\x06\x9eHy\xda\x99>m\xda\xd0\xa1C\
-\xf5c\xfa\xd0C\x90C\xbc6\xa5\xcf\x87\xb7nf\xcc\
-W\xd3B\xbefH\x0f\x92\xa3\xab0\x99\xda\x84\x92 \
-\x19\x83\xd0F\x1a\x93\x85\x8e\x7f\x17\xc6$\xb1\xa3E\xf0\
-\xb2\xe1*\xc8\x95\x10*\x91\xb1dF:t\xe8\xc0\x0e\
-\xf0\xdcs\xcf\xa1DC%\x08\xaa\x16\x9b\xb6\x82\x82Q\
-\xfb\xcch\xfa\xbd\xa0d\x09 }\x84\x86Ex\xbb\xa0\
-\x06\x09!\xc98\x06E@E\x22\xa5\xa1,\x88\xcc\x18\
-m}\x0c\x94\xd3\x81\xe7\x81\xeb\xd7\xaf\x13hr\x8e\x10\
-\x80\xc2\x0f?\xfc\xc0\xb6y\xe1\xc2\x85\x9b\x8e\x1b7n\
-`\xc0\x95M\x95G\x88\xc7\xb9\x8f\xf32\x95\xdd\xbbw\
-\x1f3f\xcc\xb8q\xe3\xf4&\x88\x11@\xaf{\xb9\xfb\
-x\xa4\x091}\x94+}>\x22\x03\x1c\x86\xf6s\x0e\
-\xfe\xeaW\xbf\xf2\xaa\x12i\xe0\xe7\xea*T\xc8D\x8b\
-\x0d|:?\xc5\xd8\x14\x89V\x0e(Y|\x03\x0c\xaf\
-\xaa\x0bz\xed\xe3>\x1dh\xb8\xb2wh\xe38s\xe6\
-\x0c{\xc7\xf6\xed\xdb\xd7\xacY\xf3\x85\xe3\xf3\xcf?\xff\
-\xdb\xdf\xfe\xb6y\xf3f\x22Qb/6\x1a\xf6\x0b(\
-\x87\xfd\x9dQ\xe2\xf8\xe9\xd5\xab\xd7\xc0\x81\x03\xfb\xf5\xeb\
-\xd7\xa5K\x17\xf7i\x8a$\x8b~\x81\xb3*\x0d+\xa8\
-\xab&B\x03\x85\xac\xb1\x22\x16g(\xd8:eS\xe1\
-Y\x00\xef\xea\xdf\xbf\xbf~h\xa8\x0f\xedp@\xea\x8c\
-\x14r\x15]\xcb\x10\xf3\xea\xd0ii\xad\xf0\xe9\xfc\xc8\
-&\xbc\x16\xc0\xee\xa5$ '\xb7q\x90d\x1di\x0f\
-A\xcf\x95]\x85g`\x82\x12}\x9a\x90\xc5\xc5*S\
-\xae\x0c\x84\x8a\x80\x94\x5c\xa9\xcaW\xfa\xdf\xfe\x9b~\xdf\
-e\xd0\xa0As\xe6\xccY\xbdz\xf5\x1bo\xbc\xb1h\
-\xd1\xa2\xb1c\xc72e\xfa\x10y\x1b\xc2z\xad>\x0a\
-u3\x14\x8a!\x1c@\xe4\x08o\xe4P\xb5\x86\xd7\xe6\
-\xa0\xb8\xdb\xf8\xfd\xac\xa1\xc1\x06\xff7K\xb2\xf4\xb3x\
-\xfdE\xb4c\xc7\x8e\x1d9r\x840\xf4\xbb\xef\xbe\xfb\
-\xd2\x81@$\xca)C\x9c\xa7\x80\x95-\x14\x10\xc2j\
-[\x0c7\x00\x09\x92\xa5Twh\x0c}\xb9\x7f\xff\xbe\
-\x94\x0d\xa0\xf2f\xb4B\x93\xc12\xeb\xd6\xad\xdb\xc8\x91\
-#y8\xeb\xdb\xb7o\x817\xa3\xe6\xc7!26\xbc\
-\xb68d\xcf5\xb3\xe6\x88L3\xab!\xc4\x1d\x9d\x09\
-\xc8\x14a\xfd\xb3\x0b\xb0/\xb0\x1d\xb0\xeax\x0a\xdc\xbb\
-w\xef\xb6m\xdb\xf4\x14\xbbk\xd7.6\x146\x0e\xbd\
-\x07%T\xc5\xb8\x98\xf6\xb4$\x1d;v\x1c0`\xc0\
-\xd4\xa9Sg\xcd\x9a\xa5\xbf\xda\xca\xa9C\x07\x95\xab^\
-K6\xd2\x1a\x83\xde\x85\x1d\x8c,I\xb2C1\x5c\xec\
-\xb6l\xb2\xfb\xf7\xef\xbfr\xe5\x0ac\xe2\xb3+\xb4w\
-\xbav\xedZ]]=t\xe8P\x1e{p<s3\
-H\xfc\xac.>#\x95\xe5\xb5\xad\x84<\x5cH\xe3\x9b\
-\xe5\x90Fx\x95S\xa6\xaf\xc5\xa3\xdd\xc6J!pk\
-\xed<z\xac\xd5\x16\xa4\xfd\xe7\x90\xe3\xda\xb5k\xff\xfa\
-\xaf\xff\xca\x08[\x04\xa9\xd6Z\x9b\x85%\x11\x84nD\
-)\x1e\x1bx@e\x9az\xf7\xeeM=\x0a\x92\xd8\xe5\
-\x10T\xa4\xcca\xd0:u\xea4x\xf0\xe0\xf1\xe3\xc7\
-\xf3\x98\x1d~\x97\x8b\xf0v\xb9A0M\x98\x95Id\
-\x10%U[\x9aPO\x11\x1a\x03>\xed4\xc0\xd8r\
-F\x9c?\x7f\x9e\x8dQo@9M\x90\xf7\xec\xd9\xb3\
-{\xf7nb\xd0\x8b\x17/r\x8e0\xd7\xec\xa2\xbed\
-~\xec\xcd(\xcf\x12\xc5\x7fF.\xa4\x01\xf6\x06-\xa4\
-/4\x98\x96\x7f\xfd\xf5\xd7\xde\xa2D*\xc1h\x85&\
-\x83\xf5Vd0\x1ab\xbbC\x84r\x8bA\xc6\xba\xe6\
-\xdb\x1d\xd2\xa4-\xa3\x9b*\xc92\x036\x0e\xb6\xe6\xdb\
-\xb7o\x13N]\xbe|\x99+\x0b\x8fc`\x9d\x83M\
-\xe4\xf8\xf1\xe3(\xd9\xc11\xa6f\xa1z\xca\x87\xe7\x9e\
-{\x8ey\xd1w\x8b\x12\x8f\xda\x1c\xa9\xcd\xd1\x8eiD\
-\xc3\x12a\xdd\x94\x19\xd7\x10\x0eN\xfbN+\xb6WN\
-M\x0eT\xd9Wh\xf7\xb0j\xf0(E9\xf6\x1b\xbe\
-r\x18\xf4\xf2\x10 \x19.\x16\xaf\xcd\xe1\xb5\xad\x07m\
-\x13J\xfaf\xe50\xa5\x04\x11\xe9\xb9Z\xf14\xb2\xd1\
--\x04\xe3\x06&\xb3\xab\xb0\xf3\xd8oR\xf3h\xc7U\
-\xfb\xcf\xa6M\x9bx\x12&I\xdc\xaf\xbfGeK8\
-j\x92\xa0B\xbbJ\xc0\x9eyag \x80c\x8ez\
-\xf4\xe8\xd1\xb3gO\x02;\xd6\xe9\xbd{\xf7X\xbf\xd6\
-<\x15)[\x08\xbf\x08\xc2\x06\x0d\x1a\xd4\xbf\x7f\x7f:\
-B\xbf\xc0\x06\x81\xf6G]\x08\xc7'\x9d\x0b\xd1\x00\x9a\
-AT\xd0K99\xa9\xc8\x81lm \xc9<\xda\xd1\
-\xa0\x03\x85ie\x12\xf7\xed\xdb\xb7~\xfd\xfa\xef\xbf\xff\
-\x9e`\x94MR\xbf]p\xe1\xc2\x85;w\xee\xc8\x07\
-\x5c\xdd\xf5\xd3Z\xc1\xa8dz\xc4>_[[\xbby\
-\xf3\xe6]\xbbvIY*\x95`\xb4B\x93\xc1\xc2\xab\
-7\x18\x8dVW\x98\x94\xb1\xe1\xb5E\x10\xda\x17\xb9z\
-eV\xf8\xee\xe4\xb2\x1d\x00\xfb\xf2\xfd\xfb\xf7y\x84e\
-\xe3`\xcb`\xb1\xf1\xfcz\xe0\xc0\x01\x9e\x02\xe1\xc4\x89\
-\x13\x1c\x0f\xfa\xbdxUU\x9e\xd0)v\xa8\xe1\xc3\x87\
-\xaf\x5c\xb9r\xc1\x82\x05\x83\x07\x0f\xe6\xf8a\x0b\xa3\x9b\
-\xda%1\xd0\xd6\xe9\x0b\xe4H\x86#\xc0ks\xd8\x18\
-*K6\xa0\xd1c\xe88D\xf5\xe8\x7f\xec\xd81\x1e\
-\xf4Q\xca\xbeB\xbbG\xa1\x0c[\xc1\xd0\xa1C\x09I\
-\xf3\xbd\x83\x97\x0b\xe9*}\x883i5h\x95\xf0\xe9\
-\x9c\x9f\x8bH/|\xbat\xa8Ma\x8a`\xed0\x80\
-D\x84\x84&\xdayx\xe8e\xdb!\x06%j\xd1\xb7\
-\xa4\xed\xd9\xb3\xe7\xcc\x993\x94\x1a0`\x00+:\xf7\
-\xa9\x9b\xa2\x9a\xa1\xc6\x9b%S\xc3\xfe\xa0x\x94\xd0\x16\
-Y\xdb\x82\xa6\x8c\xf6\x90\x94eyBS\xe9\x0b{\x1a\
-1\x19]\xd0\xe6\x16\x8e\x83\xfa\xab\xabPn\xa8\x09Q\
-\xae\xd5\x80`H\x13\x16D\x0e\x93\xd8()=C\xa7\
-\xd9\xd4\xcc\x22\xe8\x11\x9d\x09\xdd\xb0a\xc3\xd6\xad[\x8f\
-\x1e=z\xe5\xca\x15\x1e9\xd8!\xf5U\x06*^<\
-t\x96\xc3w\xf4\xe8\xd1\xf6\x99Qkg\x914\xc0\x1e\
-\xd4N\xae\xb4\x99.\xd0\x11\x1cU\x06\xa5R\x09F\x9b\
-\x17f\x0b/\x89VE{\xa5\x98`4$Zo2\
-6\xbc\xb6\x080\xb6\xaa\x8a_\xc3\x99wG@/\xd8\
-A\x9e<y\xc2\x13*\xe1\xd4\xd9\xb3g\xd9\xfa\xd7\xae\
-]\xcb#,\x02\xe7\x01\xab\xee\xe4\xc9\x93\xe1\xdbP\xd5\
-S\xb60;\x1d;vdv\xe6\xce\x9d\xcb\xd3\xb3\xde\
-TY\x96u_\xd7\x90\xb4&\xc4:n\xc5%\xa0g\
-\xffe\x00\x19:m\xb8D\xf3\x8c\x95\xb3\xad\xf0\xac\xc0\
-&@\x90\xa4\xdfh$>\xb0P\x09\xc8\xd5\x15B/\
-\x8a\x90\xbe\xb5\xa0aj\x9b\xae\xd6\xa4|\x0d3{3\
-\xc8\xb4\xd7\x8e!$s\xd5\xcf^n\xdc\xb8\xc1\xc3-\
-\xc2\xad[\xb7\xf4\x91P\x22Qv\x9e\xef\xbe\xfb\x8ec\
-\x1e\x99H\x94\xfd\xe7\xf0\xe1\xc3<\x06\x13\xd0<|\xf8\
-\x90\xb5\xcc\xba\xe69S_\x18\xcc\xbdt;\xaa\xd5\xed\
-\x22\xcc\x80+k\x1f\x901&\xc9\x9e\xc0\x94u\xee\xdc\
-\x99\xaa\xaa\xaa\xaa\xf4\x83{\xea\xa4m@#]\x05\xe5\
-\x08\xbb\x0d-d\xc3a4\x08\xcdi\xbf\x8e]HF\
-97\x89\x12B\xd2\x1aAA\xbbJ0\xa4\xb1\xdaB\
-AC$\x8d\xd0\x13\xc5u\xf7[G\xcc,\x07\x8a~\
-\xc2v\xe4\xc8\x91\xcd\x9b7o\xd9\xb2\x85sDO\xe9\
-\xbe@\x9e\xf6\x14\x86\xce\x12\x827w0\xeaz\xefQ\
-\x92\xab\x1a\xcc\x95)\xa0wk\xd6\xacILK\xa7\x12\
-\x8c6\x17\xacp}\x16\x87\xf8\x8c\xb5\xcd\x0aG\xa9}\
-G\x06\xed\x0f\xbaLgG\x8c\x181~\xfc\xf8(\x18\
-MVX\xdd\x8e+iJY\x82d\xbbf\xe2\x0c\x9f\
-\xe2\xb59\xa2\x1b\xa5m\x22\x03!3\xb2\x80}\x81M\
-\x8d\x1d\x84@j\xff\xfe\xfd;\xdd\xd7\xbcm\xdf\xbe}\
-\x8f\xfb\xa3\x9d\xec),9r\x09\xad\xd8h|\xf9\xb2\
-\x07odR\xa6M\x9b6g\xce\x1c\xe2\x03\x02S\xf6\
-/\x0d\x85;\x8f\x92\x03I\x83\x80 }\x91X)C\
-I\xbc\x9d\xa7|Fl\xd3\xa6M\x9c\xa0l\xb8\xe5|\
-\x98Uh\x0ep\xb3\xa1C\x87\x12\x8c\xea\x93|\xf6\xfc\
-\x03r\x9b\xc8\xd3\xa44\xbc6\xe7Q\x8d$}//\
-\xa5\x90%W!%\xb8F%\x84\xca\x02\xc8\xd8'r\
-\xb0\xbdpl\x0b\x85 \x08\x0f\x1e<`\xb7!\xd6\xdc\
-\xbd{7W{\x03\x8a\xac7\xa0\xac#\x02\x1av\x1e\
-\xc1j\xd2\xa7\xd2\xa9\x9f(\x84\x11&\x1eE\x08\x83Q\
-\x88\xda\xa9,\x03\x0dKRm\xf0*\x07[wW\xf7\
-\xa7\xb3\xaa\xab\xab\xfb\xf7\xef\xcf)\xa6\x97y\xdc\xb1\x9c\
-\x97\xb0:K(6j\xd4(\xf6:\x0b\xc8\xc2A\x90\
-\xacn\x82\x94\xc2\xabrx\xad\xc3\xabrP\x89`4\
-\x00AJ%\x19+\xd0,\xb3\x01\xf28\xc1<j\x12\
-\x11\xf4S5M+s}\xea\xd4)\x8e\x12J\xf9;\
-5\x14VV\xf8c\xfab\x9eI\x84lB\xc1p\x15\
-\x14\xc2\xdb9K\xba@\x1b87+\xdf3Z^(\
-,cI\xcc\x981\x83\xe3\x9f\xe0l\xd0\xa0A\x9d:\
-ub\xaaxz+\xec\x1cm\x17z\xcd\x16\xc6\x9e\x18\
-\x05\xa3\xc5\xf7W\x96*\x05R\xd6\x8bJq\x95\x10\xa2\
-J\xd0\xb3T\xc2\xdc\xc8R\x06\x82}\x84\x8d\x9eGX\
-\xce\x06\xc2\xd0o\xbe\xf9f\xdd\xbaul\x1c\xb5\xb5\xb5\
-W\xaf^%\x00\xd5\xde-|\xf9\xb2'\xfc\xb4(\xb3\
-\xc3\xa1\x15\x8d0}\x91\x86\x11P\xd7\x84r\xd1\x87\xb2\
-\x84\xd0@X\x12\x81z\xf0vF\xec\xf0\xe1\xc3\x0c\xe3\
-\xe9\xd3\xa7\xdb\xb1\xe7W\xc8\x87\x82Q\xfdZ\x09\xcf\xe4\
-\xf6\xcc\xa3\xab\xf9\x92!\xa5\xe1\xb5\x8e(Y*\xf9|\
-/\xaaVf\x5c\x85\x96\x03\x1a\xcch\xbc\x8c\xa51,\
-i\x06\x10\xda\x84\xf5\xb0{\xb0\x87\x10\x7f\xdc\xbau\x8b\
-}\x06\x88,o\xdf\xbe\xad\xbf\x0a\xb1f\xcd\x9a\xb5k\
-\xd7\xea\x0d\xa8\xa2\x16B\xd2\xe3\xee\xcfd\x10\x08R\x96\
-z\x04\xb5\xa9B\x22\x00\xce\x9aa\xc3\x86E\xdfv\xae\
-\x5ca\xb2\x09\x9a\x88\xd0\x86\x22j\xbc\x04\xaa\xe5\xe1A\
-/S\xa8V\x9f\xc2$\xb4\xa2\xe5\xb2/Ch!\x87\
-\x0e\xfe6q\xe2D}\xdb\xa8z\x14v\x13\xd4A\x09\
-d\xa5\x07A(\x0b4\xdahd\x83\xcc\x95\xb9`\x7f\
-\xb3\xb8SfD\x9fL\x13s\xca(q\xe5\x10!\x12\
-e\x1e9A\xbe\xfb\xee\xbb\xed\xdb\xb7\xeb1\x03\x88J\
-\xd9\x18/]\xba\xa4\x1f\xac\xa9\xe6\xc6\xc0|\xe9\xcdh\
-\x18\x8c\xfa\xbc\x220\xe3\xb0T\xf15\xa8\xfb\x8c\x03\xcf\
-K\x95\xef\x19-#X\x12\xc4dD\xa2\x0b\x16,X\
-\xbe|\xf9\xbcy\xf3\xa6L\x99\xc2N\x81\x92\x09\x03m\
-\x04\xf2`\x15i\x1f\xd0/v.\x82Q\xd6\x03O\xd5\
-\xe1\x9b\xd1b0c\xea1\xb9a\xa88\x84#L\xb5\
-\x80\x80^\x1a\x90\x19\x02\xd3\xc1\xbe\xc0\x0eB\xd8\xc4\xf6\
-\xc1\xc1\xb0c\xc7\x0e\xb6\x0f=\xbc\xea\x1b\xa1\xd9wT\
-\xaamA\x079WF\x8c\x18\x817\xe2\x93C\x86\x0c\
-\xd1\x89\xe5\xb3s\x03\xa2k1>\x89\xa5\x99i\x0f\xe2\
-\x8aR\xa0$\x97\xb1b#f\xdb\xdd\xb4i\xd3\xde\xbd\
-{\xafU\xfe\xea\xd23\x09\x01\xa8~TB0\xaa\x97\
-\xf1\xf2\x90\xf0*A\x84J\xc8'\x17O\xa9{,\xf6\
-!^\x9b;nA\xfa\xa4\xad\x0e%M/\x01=E\
-\x90Y\x1a\x0aV$\x13\xbe\x10z\x9e<yr\xcf\x9e\
-=\xec0\x84&\x04%@\xc4\xc9\x1a\xd9\xb6m\x1bJ\
-\xed6\xee\xedg\xf2\xfa\x93\xb0\xa6\xf0\xce\xc3\xbdx\xd4\
-$j$d$\x1cA\xd0F\xa76\xa41=\xed\x94\
-\x80FJ\x09\x06\x95\xb0Q0\x83Tk\xbf\xd5\x04@\
-\xb5\x91\xf4\x00\x00\xff\xf4IDAT\x9aD\x9ad5\
-\x94\x094\x98Fr\xd4N\x9e<Y\xc1(\x1a\x9f\x97\
-C]\x13JJ\x0fR\x02r\xd4\xb5P\x8f\xc0l\x12\
-\x97\xb3\xa7\x9d9s\x86]\xee\xc6\x8d\x1b\x0c\x0b\x03\x82\
-\xe6\xe8\xd1\xa3L.\xa7\x06\x87\x083\xcb\xb4r\x8e\xe8\
-W\x0bx\xa2\x88\xa6\x95RM5\x86LJ\xfa\xcd\xa8\
-\xcf+\x0e\xd9\xdb\x15\xc2\xb6I\x1fb\x1aY2&t\
-\xe7\xca\x95+\x95`\xb4\x5c\xc0\xfb\xf1\x09\x9e\xcc\x96.\
-]\xbah\xd1\xa2I\x93&\x0d\x1a4\xa8\xaa\xaa\xaaW\
-\xaf^\xb8H\x9f>}\xaa\xab\xab\xd9\x97\xf5\x96\x14w\
-T\xa9\xf4L\xb7E\xe8\xbb\x82Q}f4\xfa\x81Q\
-\x84\xf4a\xae\xb3}\x8a4\xca*\x95\xcc\x15\x8eR\xa7\
-\x02\x98\x81V\x11s\xc1\x06\xc1Bb\xcb \x00\xfd\xfa\
-\xeb\xafy\x96e\x07\xa9\xad\xade\x7f\xb1\xb7\xa1*\xd2\
-\xe6`\x9f\xc2\xdf\x88\x09\x88D\x09\x0b\xf4\x92CY6\
-\xd4\x92\xe9c\xd4M\x92\xa1A$\x00U\x85I`<\
-\xd9\x97/_\xbe\xccF\xccHn\xde\xbc\x99-\x9b1\
-\xf4\xd9\x15\x9e%\x88\x8d\xd8\x10\xd8\x0f\x07\x0c\x18@0\
-*o10\xd05DY\x86\xd7fY\x16\xc6<9\
-r\xe9\x02\xf5$\xde_\x17\x9f!\x5c{\x04)m#\
-\xd6#4fO\x92\x5c|\x9e\x90E\xf1\x87^\x95\xdd\
-\xbe}\x9bXs\xcb\x96-k\xd6\xac\xf9\xfe\xfb\xef\x15\
-\xa6\x10\xbb\xb0R\x88]\xd8|\xae\xbbo\x94\xa4lH\
-\xdc\x8c\xba`\xc0r\xe3^\xfa\xe9\x07\x07\x0dO\x9ej\
-UfA5UW\x09F\xa8\x09\xcb\xb2\x93\xb3\x810\
-\x95T\xce<\x12\xe7\x91\xe4\x8e\x9c_\xdc\xdd\x1b\x95\x01\
-\xf4Z\xfeF0J;\xf5f\x14|v\xdd\xce\x0a)\
-3\xaf\x86%5&$\x19\xf0K\x97.\xf1,\xb1q\
-\xe3F\x1e!\x988\xe6\x97Y>r\xe4\xc8\x86\x0d\x1b\
-\xf4\xa7\xe6x\xae`Zy\x1a\xd7\x8b\xed\x07\x0f\x1e\xd8\
-\xe9#TgS\x91\x0eF}F\x8e\xa8Si2\xfb\
-\x1eR \x8b\x91\xa1G\xb8n%\x18-\x17\x98-6\
-\xdc!C\x86,\x5c\xb8p\xc9\x92%\xfa[\x8b\xac[\
-v\x07\xc0WX\xc6\xc4\x04\xc3\x86\x0dCf\xfe\xf0N\
-v\x10\xb2\xf0\xa46\x1d\xee\x08\xf6\x02\x82Q:\xc8z\
-H\x07\xa3\x92\x0diB\xbd\xb3\x8a\xc9\xa7\xcf\x07c(\
-|:\x05\x15\xd2N\x04\x16\x0ff\x8f\x1f?\xe6\x908\
-{\xf6,\xa7\x02a(\xb0\xb9p<\x10?\xdd\xbcy\
-S\x0f\xaf*\xd8vaS\xee\xd7\xaf\x1f\x1b\xf4\xb4i\
-\xd3x\x10z\xd1}\xff\x8b\x1b\xf2\xa7c\x8b\xacA+\
-0t\x96\x15\x0a\x864\x8c*#\xa6\x9dz\xed\xda\xb5\
-l\xd6\x9c\xbe\x0c\xa3\x19Tx\xa6\xe8\xec\xfe.\x0e\x8f\
-@\x16\x8c\xa2\xd4\xd5\x88\xfc\xd0\xaeF\xa62\x1f\x91\xa7\
-9\xdf\x8c1\xbdlT\xb34\x112\x10\xac\x19k\xb9\
-e\xc9\x8c\xdd[\xef\xc6\x14p\xb0\xab\xb0{\xe0\xf9\xec\
-*z\x03J\xac\x09\x84&;w\xee\xd4\x0es\xee\xdc\
-9l\x08O\x15\xad\xb2\x0b\xe9\xa1W\xd5\x96\x04\xb7\xa6\
-,\xfb\xed\xa0A\x83\xaa\xab\xab9q\xf4\xf2Rm\xc3\
-\x00\xd9P\x11\x09\x96\x0c\x91R\x05A{\x05{\x08\xd5\
-\xb2\xabsx\xb1\xc3\xf7\xe8\xd1\x83\xce\xd2lb\xac&\
-\x8f\xab\x1a\x8cmt\x93&M\xea\xd3\xa7O\x81\x03H\
-\x1a\xb0\xa4\x09!\x91Fc\xc2\x95^\xd7\xd6\xd6*\xee\
-dZO\x9f>}\xf1\xe2\xc5\x93'O\x223\xe3\x87\
-\x0f\x1f&&\xd3\xebm\x82T\xa6\x86\xb1R\x0d\xcdG\
-1oF\xd3\x9a\x08\x19\xd4k\x06\x89c9\x90\xb1G\
-\xc0\x0d\xe8f%\x18-\x17p\x08\x9e\x1d'N\x9c8\
-w\xee\x5c\xae\xfa\x93\x98(Y\xcf\x04\x9d\xf8\x07q\xa7\
-\xfd<\x05KV\x0ek\x9b\xe0U\x96\xcc%\x94\xcf\xda\
-.\x15\xba\xa9`ToF\xf5S\x12<U\xce-\xc7\
-\x05%\xc14\x99XA\xc9\x12\xea%Y\x1fY\xd5J\
-\xc9\x95\xe1\xd5\x81\xc1c\x1c;\x85>\xad\xb5c\xc7\x8e\
-5k\xd6\xac_\xbf\x9ec\x83\x9d\x85C\x82\xe3\x04\x9b\
-\xcc\xaa\xda\x16\xf8\x15q\xc0\xacY\xb3\x16/^\xcc\x1e\
-\xcd\xd3\x11\xaehg\xaa\x06\x19\x94\xa4\xbf&\x1bf`\
-Y\x0862rW\xcb\x22\xc9\xb1z\xe4\xc8\x11\x8dg\
-%\x12}\xc6\xd1gF\xd9\x10\xf4czm\x08\xbaz\
-\x0b\x07Ia\xc9\xf0*\x5cN\xc3\x91\x13r\x8d\xbc1\
-\xaa\xdcr\xa5\xcc\xcc\xb5\x17\x07\x5cqx\xc5\x82\xf89\
-1\x0a\xe0\xffl \x84&<\x89\xb1\x0a\x08Y\xf4\x92\
-\x8c\xbd\x05\x88T\xd8a\xd8v\xb4\xd5\x1bT\xa5:\x1b\
-\x06\x8d\xd4O\xa58P\xec\x8b2Ta\xd8~!M\
-x5\xa2\xa4m\xe0\x08\xec\x1b\x0aI\xb9Q\xd7\xae]\
-\x11\x18\x07:{\xff\xfe}\xda\xef\x0b\xb4*\x9c\xad\x13\
-&L\x983g\x0e1\x19',mV\xfb\x95kB\
-\x9atV\xe6\x5cHIg\xe92\xf3\xc8\xfc2\xa1\x97\
-/_\xbeq\xe3\x06A\x18{\x9d~\x92\x86\x0f\xe8\x88\
-\x81dR\x1b1\xad\xc5\x93\x0eF\xc3\xbe\x8b(\x195\
-L\xb9\xe15M\xbe\xbe`O\x97q\xe9J0Z\x16\
-0\x1f\x9d;w&\xb2\x9c={\xf6\x8c\x193\x06\x0f\
-\x1eL\x12\x17\xb1yE\x00\x5c\x84%\xcd\xb2!\x00\xd5\
-O\xb4\xb9\xf2D\xabO\x94\xb2\xa3)\x0cR\x91\xb6\x05\
-]\xcb\x0cF}v\x1e\xd2KBE\xd2B1d\x0e\
-]\xb2\x1f\xb8\xbb\xe8\x8a\x0da\xa8\xfe\xf4\xc5N\xf7\xc7\
-\x93\xb6n\xdd\xca\x13-\x87\x04\xcf\xb2L\x01\xeb\xca\x95\
-k\xf3\x10\x892\x11\xd3\xa6M[\xb1b\x05nY]\
-]\xcd\xe3\x10\x93\xa2q\xd0\xechl\xa5\x91,\xa5\x11\
-\xea\xb9\x86\x02\xa5\x90\xf5\xb8\x85@\x92\xb1\xbdu\xeb\x16\
-\x03\xbbn\xdd:\xf6k\xf6e\xd5\x5c\xe1\xd9\x84\x00\x94\
-\xf0\x88\x10!\x0aF\xc92/*\x006\x86W5\x02\
-\xf9g>\x87D/|:\xb8{\xa8D\xa6\x12\xb6\x08\
-bP`\xbb \xfe8q\xe2\xc4\x01\xf7+\xd2x\xfe\
-\xa1C\x87\xf4\x86l\xdb\xb6m\x08\xfaL!\xd1\xa7`\
-\xe7a\x87o\xf2\x1d\x86!%\xfc\x22\x10\xe14!(\
-!\x16\x91\x9e\xc6\x9b`H\x03\x96\x94\x00\xa6\xb7\xab\x1b\
-\x92\x04\x97\x93\xfc\xc8\x1e8\xda\xd8\xea\xd9^X\xe0t\
-\x8aA\xc8\xdcx[\x18=\xf9\xf0\xc8\xad\xdf\xd0\xd0 \
-X\xa7\x0a`6\xd6\xcd\xc2\x10\x82\x1f=z\x94\xf9\xe5\
-\x91C/>\xf5\xa1\xbb\x06\xbf\xdbn<\x16\x8cr\xf8\
-VUUq\xf8\x86\x93(\x0a\x0fEh_\xc02s\
-\x88\xb0\xc7\x01X\x0e\x84\xe6\x95`\xb4\xf5a; \xc4\
-\x1c5j\xd4\xacY\xb3&N\x9c\x88C\xb0V\xb5\xf9\
-\x92\xcb\x14\x22\x90\xd4\xc9\xcd\x95\xb0\x80GX\x1c\x88\xe7\
-\x98\x9e={\xf6\xea\xd5\x8b\xe5\x8d\x1e\x87f\x85\x97\xc3\
-\xda.\x15\xfa\x95/\x18\x0d=8\xd4\xa4=[\xb9\x12\
-T\x5cHY/Q\x85\x1av\xae\xc2\xde\x86\x9e={\
-\x96\xadDo\xef\xf6\xec\xd9s\xfc\xf8qN\x94v\xf3\
-6T\xe0~\xfd\xfb\xf7\xe7\xb9h\xc9\x92%3g\xce\
-\xd4\xf79\xe0`\x1aO\xf0vuA\x1f\x0e\xbb\xf0y\
-\x0eK\xda@!0n\x1a:\xbcW?\xa3\xff\xe1\x87\
-\x1f.^\xbc\xd8n\xc2\xfa\x0a\x0d\x03\x97\xb3`4t\
-?\xe5\x9a\x90\x89,\x0d\xaf-\x11+\x88s\x82\xe4\xa8\
-6\xcb2A\xb8\xdb\xfa\xef\x97\x90\x06\x81\x98\x83X\x84\
-mD/A\xf1v\xa2\xcf-[\xb6\xb0\x93p\xc5\xed\
-\xf5\x01P\x9e\xc4\xce\x9c9\xc3V\xa3\xd0S\xd82Q\
-mM\x08\x03\xcb!2~\xfc\xf8\xd1\xa3G\x13\x95*\
-\x16I/\xe4L(\xee\xa5\x1c\xd2pUS\x91\xc3\xaa\
-\x90\xa9\x9fx\x94\xe0\x8f\x80\x8f\x10D\xa3A\x071n\
-Eh\x18\xa7*G\xcf\xe0\xc1\x839X#g3\xa2\
-\xf1\xcf\xb4\xc9\x043n\xc1\x0c2\xef\x1c\x19L\xf4\xb9\
-s\xe7\x88D\xc9\xa2N\xf42k\x15\xe8l:\x18\x8d\
-\xfa\x15%#\x94k6I\xe1\x1c\xd2\x84\x84c(\x1b\
-4\x0c\xc5\xd5\xabW\xff\xe3?\xfe\xc3g\x94H\x9d\xcf\
-\xeeTh$\xcf\xb9\xdfjd/`\xdb\xc5k\xd10\
-C\xc0T\xe1+\xa6\xe1J\x92e\xcc\xcaa=\xf3\x0c\
-G\xa00m\xda\xb4\xe5\xcb\x97\xbf\xf2\xca+s\xe7\xce\
-\xc5\xa5\xd8\xbb\x09Rq/E\xb4I\xed\xcf\x18\x1a:\
-\xf0\xe9\x1c^\x1b \xa5r#\xd0\xb3G\xb0K\x12\x86\
-\xde\xbau\x8b\x1dd\xeb\xd6\xad_}\xf5\xd5\x97_~\
-\xf9\xcd7\xdfpx\x1c<x\xf0\xf4\xe9\xd37n\xdc\
-\xc0\xc0\x97i\x17\xe06lI\x93&M\x22\x12\x9d?\
-\x7f\xfe\xd0\xa1C\xf5\x9e\xdeg\xe7\x1f1\xed,i|\
-v~\xa8\x901d3:z\xf4hMM\x0dC\x9a\
-\xef\x16\x15\x9e)\xe4<\xf2\x22!\xbd\x0858\x8cP\
-2\xc4g\xa4\xf0\xd9Y\xa4su/\x90\x8c\x816\x07\
-\xae&\x84\xa5\xd0\xb8\xb7\x9f\xc9\xb7\x81\x02\x0fZ\xd7\xaf\
-_\xaf\xad\xad%\xe2\x5c\xbbv\xed\xdf\xfe\xf6\xb7\xbf\xfc\
-\xe5/\x7f\xfd\xeb_\xd9OH\xb2\xb1\xf0\x0c\x86\xf3c\
-p\xe2\xc4\x89\xf3\xe7\xcf\x13\x89*Ri\x19\x14{I\
-\xe6\xc8\x00\xd7W\xdfY]\x05\xb2\xba\xe9\xd3\xf9\xc1F\
-\xc6\x8cK88\xdc\x8b\xc3\x8bck\xf6\xec\xd9\xcb\x96\
--\x9b>}z\xbf~\xfd\x08\x80\x94\xdbZ0\xda\xd7\
-\xae]\xe3\xf1\x80\xe0\x98\xd6F]0\xa4i\x00V\x1b\
-4\xb2\xaa\xe6\xc3\x1a\xe9z_\x07\xe9E\xbd\x8d\x8f\xec\
-\xebE\xb7\x00\x9f.\x9dJ0\xda\x94h\x825\x1f\xa1\
-\x9c\x06=\xeb\x19\x88_\x81\xd0\xe1\xa5\x97^\xe2yn\
-\xc6\x8c\x19\xabV\xadz\xeb\xad\xb7^\x7f\xfd\xf5\x95+\
-W\xce\x9b7\x8f\x07\x1d\xa2\xd2V_\xe7%\x91\xb8\xa4\
-\xc3\xa7\xb3\xc8\x97\xabq\xe3\x0al(&\x0bg\x12\x13\
-\xeam\x17V\x92\xac\x87\x0f\x1fr*\x5c\xb9r\xe5\xd8\
-\xb1c\xeb\xd6\xad\xfb\xaf\xff\xfa\xaf\xff\xfc\xcf\xff\xfc\xe2\
-\x8b/\xb6o\xdf~\xf1\xe2\xc5\xfb\xf7\xef\x13Bq\xd2\
-\xc8\xbe}\x80G\xf1D4a\xc2\x84\x05\x0b\x16pN\
-TWW\xe3]<\xfc\xe0o\xd1\xe0H@#}\x01\
-d)\x94\x94^\x90\xe4\xcc\xbey\xf3\xa6\xfe\xac\xc8\xee\
-\xdd\xbb9\xb6\xdb\xd9\xa8Vh0x\x88\x9cM\xae\x92\
-&SO\x11v\x00\xe1U%BA\x9cP5X\x03\
-t/s~A\x120\xf3iW\x16\x97\xbe{\xf7.\
-\x9e|\xf9\xf2eB\x9cs\xe7\xce\x1d:th\xc3\x86\
-\x0d\xec\x1e\xbf\xfb\xdd\xef\xd8F~\xfd\xeb_\xff\xf1\x8f\
-\x7f\xd4'R\xd8a\xd8L\x08X\x1f\xbb\xbf\x03D`\
-\x14\xd6\xd6\xdc\xd0)\x168\x0b\x1fY}1A\xfd\xd5\
-U\xcaH\xc8$\x19\xa6\x00\xafuz\xb7\xc5&\x1f!\
-\xe5\xf9\x96xt\xe6\xcc\x99\xcb\x97/\x9f5k\x96~\
-\x1a\xe6\xedZ\x89\xe4\xa1!\xcf\xaf\x02'c\x91\xc3\xab\
-\x82a\x09\xfb\x18\x92O\x1f\xd5\xd3\xea\xd8\xbc \xa8\xcd\
-ja\xa4\x07\xd9+W2Ho\xb9&\x88(\x99&\
-\xaa\xadaT~L\xdf\x94\xb0\x14\xbbu\xeb\xc63\x22\
-\xcb\x92\xe3_[C8\xfd\x12\x0c\xf3\x00e\x11+t\
-\xec\xd8\xb1W\xaf^\xac\xf01c\xc6\x8c\x1a5\x0a\x81\
-\x0a\xc9b\x8f+\xff\x98\x09\x8f\xd7\x8f\xe9\xc7\xba\xef\x19\
-e4\xb4\x06\xc8\x0a\xbd\x19Yd&A\xb2i\x104\
->\x89QNi\x1a%\x85%u\x90p\x1e\xdc\xb9s\
-\xe7\xd4\xa9S\x1c!\x07\xdc\x9fr\xde\xe6\xbe\xc9\xef\xe4\
-\xc9\x93<@sr`#\xfbv\x06#\x8f\xe7\xcc\x9d\
-;\x97\x87\x19\xa6\x83I\xe1\xa0bpl:\x8c0\x89\
-\xac\xa4]\x8dHiI\x13pN\x0e\xe3\x83\x07\x0fn\
-\xdc\xb8q\xd3\xa6M\xc7\x8f\x1f\xaf|Z\xb4\x02tr\
-\xdf\xfb\x18~\xcf\xa8\xcf(\x88\x9c\x0a\xff\xb1e.\x5c\
-fL\xa6\xde|/,h\x82U\xab\xa4\xc1\xbe\x01l\
-\xb3\xf83\x0e|\xf5\xeaU\x9e`\xf1j\x1e\xb1jj\
-j\x888y\xca\xe2!v\xe7\xce\x9d'N\x9c\xe0Q\
-\x16\x03BU\x02\xd6V\xff\xa0?\x03\xcb\xa1\xc38\xeb\
-3\xa3\x1c=\xf4.\x1c=\x99\xa5Ig\x85\xf6\x12\xec\
-\x0aI\x5c\x13l#:\xb3\xbat\xe9\xc2\xbd\x18\x8a\x1b\
-7n0\x146\xf8-\x0c\x8d\xe1\xd8e\xc7\x9b8q\
-\xa2E\xc6\xd6\xd4\x10S&]\xca2\x08\x91\x0d(\xc9\
-Dsv\xe0\x00\xfb\xf7\xef\xc7\x07\xca\xe4\x10\xa1\xef\xfa\
-\xd00\x84\xbfMo\xcd\x8e6\xff\xd07\x84\x0c\x84\xb2\
-\x9c\xe1\xd3\xa5$B\x03\x81\x8c\x0d\xc3\xc2\x81\xcbc[\
-K\xff\x98\x9e\x168\x9f\x8cQ\xcb\x9eM\x98\x0f|\xf4\
-\xf4\xe9\xd3\xc4=\x5c\xc3\xcf}\x92\x15\x81\xd2\xcdc\x82\
-\xc9\xf8\x13\xcf\x9a}\xfa\xf4\xd1r\xe2\x89\x93`b\xd9\
-\xb2e+W\xae\x9c3g\xce\x90!C\xf4\x93V\x15\
-)s|?\x03?V\x1f\xc1\xa7s\x1a\x9fH\xa1\xe2\
-:\x1b$K\x19\x16\x912\xd2\xb0$\x1e>|H\x18\
-\xca\xc2\xa8\xad\xad%<\xfa\xd3\x9f\xfe\xf4\xbb\xdf\xfd\xee\
-\xaf\x7f\xfd+\xa7\xc8\xa5K\x97\xda\xe5\xdb\xd0\x10va\
-6&\x8e\xff\xfe\xeeO\xf9\xc9g \x19\xc4\xdc\x8cH\
-#\xb9^\xb0\xf4+<\xb5\xa31Al\xc7\x0c)\x01\
-\xe8z\x07\x02I\xbbQ\x85\x0aFa\xafp.\x99\x80\
-l\x96\x08!hd`H\x99IX\x1b\xe0\xabf,\
-\x0d\xa0\x04v\x03\xa2(\xc2J\xc2)\xf6\x8d\x0b\x17.\
-\xe0\xc6\xc4\x9dl\x1a\xbf\xfd\xedo\x7f\xf5\xab_\xfd\xfa\
-\xd7\xbf\xfe\xfd\xef\x7f\xff\x8f\x7f\xfc\x83\xa7\xd9s\xe7\xce\
-\xdd\xbau\x8b\x1d^\xef\x08\xf0\x7fjP\xb5\xad\x08]\
-\xa0\x19\xf4HI\x132\x09GF\x9a42\x90\xa5\xa1\
-,\xc1n@\xd0C\xfc\xc7VC\x0c4f\xcc\x18}\
--\x8c\xcfnq\xe8\x0b\x83\xc0t\xd8\xden\x0dV\xe3\
-\x0d\xd3X\xae\x84\xb6Nz6#\x8dz\x9d\x89re\
-f\xe4s\x0f\x15\x01\x9fv\x96\xd0\x98\x85Pr0\x8a\
-\xffq\xd4q\xc2\xf5\xec\xd9\x93\x00<\xa4W\xaf^\xfa\
-\xb8$\x87\x9f\xb7~\xc6`\x19\x5c\xbbv\x8d]\xec\xfc\
-\xf9\xf3\xecShl\xb64UB\x1a\xf0i\x07I\x8c\
-\x19:\x96\xb7\x9e5y\xc0e\x91O\x9e<\x99x\xf4\
-\xd5W_]\xb8p!\x0b\x9e\xf0\xa2[\xb7nz\xe6\
-+s\xd4\xa9\xc28\x7f\xf6C$\x19\x94\x04jH\x0e\
-\x0a\x87\x1b\xa4\xa4B]\x0d\xe9\x0d\x22\xd1\x9b7o2\
-\x05;v\xecX\xb7n\xdd\xd7_\x7f\xfd\xed\xb7\xdfn\
-\xd8\xb0\x810\xf4\xe8\xd1\xa3W\xaf^\xe5\xc8\xf1%\xdb\
-#\x8c^\x87\x0e\x1dX\x89\xfa\xa3\xd2\x9c\x13\xb8\x0ak\
-\x96,\x8d\x8f\x99\x19\xd2\x14F\x96Q$*%S\xc3\
-\x98\xdf\xbe}\xfb\xc4\x89\x13\xfb\xf6\xed;v\xec\x18\xb2\
-\xdd\xa8B\x85\x88b|C6f\xa9\x1d\x00\x94\xac\xb7\
-\x86\xc8\x80d\x84\xdc\x98\x90\x05\xd7\x05\xf6\x84{\xf7\xee\
-]\xbcx\xf1\x80\xfb\x83a\xdf}\xf7\xdd7\xdf|\xb3\
-f\xcd\x1av\x0fd}\x81\xf9\xee\xdd\xbb\xc9\xc5\xc9\xd9\
-\xe1\xcb\xe4eX\x08\x9d\xb2 L\x0b\x13\x94\xd50|\
-\x15\x8et\x92\xdbI\xc9\x9e\xa0\x9f\xd7+\x1e\x1d1b\
-\x84\xde\xcb&U\xb4\x068I\x14\x94\xab\xcdi\xc2,\
-3\x06d\x81\xac\x5c\xe9\x0di\xa2\xcd\xb0\xd5\xf1\x8d\xce\
-\xe1\xb5\x01\xa6t}\xaa\xf3\x1e\xd4\xb0\x5c@N\xd7\xe3\
-\xf3\x1c^\x95\xc3\xdd6\xc1\xa7K\xa7\xb4\xa8\x91PI\
-\x8fA#\xdd\x9f|\x1c>|\xf8\xd0\xa1C\x87\x0d\x1b\
-\xc6u\xb0#\xfc\xbeL_\xe6\x19\x83P\x920}\xf4\
-\xe8\xd1,K\xc6*\xd3e3\xe7RX\x16W\x964\
-\x10\x98R\x0f\x01h\xd7\xae]\xb9*\xdcg\xbd\xb1\x81\
-\xda\xf3_\x99@g\xf5c\xfa\xcc\xafv27u]\
-\xf4}\xb4k&\xa1g\xbbB\xb1eh\x80\xccv|\
-\xe7\xce\x1d\x0e\x8c\xcd\x9b7\x13\x83r\xdd\xbbw/\xe1\
-\x111\xe8C\xf7\x85M\x8dY*m\x02\xc6\x9c\x91\x9f\
-2e\xca\xfc\xf9\xf3'M\x9a\xd4\xcf\xfdQ\xd6p\x16\
-\xd2B\x1ae\x1560\xd8\xf7\x1f<x\xa0\xbf\xac\x0d\
-\x17.\x5c\xb0\xa0\xa1B\x05\xfd\x98>\xfaj'\xf0\xd9\
-Yh\x91FK\x95\xa4\x154\xc1\x88\x92\x11\xca\x0d+\
-\xc4E9\xa1\xf0\xdb\xbb\x0e\xfd\x14\x85X\x93\xa7\xd6\xf5\
-\xeb\xd7\xf3\x1c\xbbg\xcf\x9e\x83\x07\x0f\xd6\xd4\xd4\xe0\xd8\
-\xe4b\xcc\xdeb\xd1^\x19\xc2\xd1l\xbfM\x8f`\x8f\
-\xa0\x99;p\x1a\xcb\x921W\x13,)\x12\xa3\x9c\xbd\
-\xae\xd2\xeb\xc7/l\xb3\x04\xeb<\x8e2V\x05n\xd7\
-L\xd0Y|\x8c\x80D\x7f\x81\x89\xadOm\xf3\xd99\
-\xa4\x04\x9fv\x84\xadE6\x03\x09\xc2ryt9y\
-\xf2$\xcf\xdelw\xf4T\xfa\xd6\x85\xf1'6\xd0o\
-\xd3\xf7\xee\xdd\x9b\xc8\xc1\x1al\x02H\x8e4\xa1\xb2\xc0\
-\xac\x85YQ)`M=y\xf2\xe4\xd2\xa5K\xbf\xfa\
-\xd5\xaf\xa4)\x95\x12\x82QzK<D\xdc\xa9/\xd0\
-\xe6\xb4\x9b>}:\xb3.8\xf9\xd8q\x08R\xb1a\
-zh\x19\xf6\x94B(\xd0\xbdv\x06\x8b\x81\xc0\x91\xcd\
-\x97h@\xc1\xa8\xf9\x84\x0d\x82\x9bD?\x7fi,7\
-\xb4'\xc0\xed\xe0\xfe\x80\x13\x0bl\xd0\xa0A\xec5\xe8\
-\xd9I\x15`\xc9\xac\x1c\xa0\xfb\x99\xc1\xa8\xfa\xa2\xab\xeb\
-_\x1d'\x16\xd2\x0bi\xd2#fY&\x840\x14\xec\
-\x11\xa7N\x9d\xd2;\xd1\xed\xdb\xb7\x1f?~\x9c3\x86\
-\xc3\xa6l\x8f\x90\xa6\x85\xd1f\xf5\xb1\x1f-Y\xb2d\
-\xc1\x82\x05l\xca\xe1\xcf\xe81\xb0qC\x08\x87W\x82\
-\x11\x19G\xa0W\x165\xc0\xa3G\x8f\x18\xe4C\x87\x0e\
-\xe9\xdd3'\xb7\xd5\x5c\xa1B\x14\x8c\xeaP\xa8\x97|\
-.$\xdf\x83\xcc\xa4a\x1a\xeaAN\xdc\xd4=\xa9\x02\
-[\x81\xc2\xd0+W\xae\xb0?\x10n\xf2\xb0Z[[\
-+\x07f\xd3\xd0\xd7k\xe8\xf3\xa0\x04U\xfa\x01W\xf9\
-\xc3\xc0\xf6\xea\xd5\x8bq\xce\xfcj'\x0c\x18\x01Y\xd6\
-\x8b\x15\xb1\xabp\x99\x1e\x0d\xa9A\xae{s\xf2\xdc\xfd\
-\xfb\xf7\xcf\x9d;GD\xc2\xb8\xa1\xf7\xd6-\x05\xfd\xc5\
-\xc7\xf07\x02\x12\x0bF}\x9eCMEH\xebu5\
-\xa4\xc7,\xb4T\x92\x90\x86n\xea\x07Ae\x1b\x8c\xca\
-\x01\xd0\xeb\xaa\x1e\x85\x1a\x09B\xb2\xf5:\x93(\xd7J\
-\xd9U+\x8b\xb3\xa0\xc1\xc1h\xb1?\xa6\xe7~\x1cl\
-\x8aD9\xea\x16-Z4o\xde\xbc\xb9\x8e\xd9\xb3g\
-\xa3\xe4\x8a\x86#P\xdfO\xb4b\xc5\x8a9s\xe6\xe8\
-)\x8dXJ\xab\xc2\xd7\xd5~\xa1\x8fD\x03C\x86\x0c\
-\xe9\xd7\xaf\x9fv^\xeb5\x02\xd8\xee\x00\xa1^\xb2 \
-\x89\x19 \xcb\x9e+{z\x9f>}F\x8d\x1a\xc5\x03\
-\x00\x83\xbfl\xd92\xc6|\xf0\xe0\xc1\x04\xa9Q\xf1\xf2\
-A\x0d\x93\x13\x9b+#D\x1a\xc0\xd2\xf0\xaa\x1c\xa6\xc1\
-\x9e]@\xcf6\xbaJ/\xd0\xb0\x12x(g\x83\xd8\
-\xb8q\xe3\x9e={8N\x08C\x1f\xb7\xd9\xbf \x90\
-\x09\xa3\xe1\x5c#\x03\x9c\x8d\xcd\x97\xe5F\x0c:v\xec\
-X\x9c\x90\xa7\x17\xb6$\xf4 \x1b7\xc0\x09\xbe\xba\x1c\
-^\x9b\xc3k\xf3 \x03\xcd\x02G\xce\xf5\xeb\xd7\x8f\x1c\
-9\xc2)\xceq~\xf3\xe6\xcdh^*T\x08\xa9\xd7\
-=0(`C\x96\xd6~\x01\x1b!/\xe5\xaa\x22O\
-\x9e<!\x80\xc0?\x0919/\x097w\xed\xda\xf5\
-\xf7\xbf\xff\xfdw\xbf\xfb\xddo~\xf3\x1b\xae\x9f\x7f\xfe\
-\xf9\xfa\xf5\xeb\x09L\xf1g,ql\xb6\x8e2\x893\
-JE]\xf6\x89\xfcc\x9e,\xf5`\xb1'c\x1a\x10\
-jd\x00>\x9d{q\x08>\xc3\x05C\xfa\xf0^\xf4\
-\x15r\xadB\xd46\xf0\xedvDI\x90\xc6\x19z\xc1\
-\xa9\x9fv\xbcm\xa1\xbeg\x0e\x82]\x95\x0b\x92\xc3\xac\
-t\xc7M\x83`\xa8\xb8a\xe7\x8b,\x1b@\xb1\xc1(\
-\xeeE\xb8=e\xca\x14\x22N\xe2!\xa2R\xc2\xf0\x97\
-^z\x09\xff\xc3\xf9\x00\x998\xaco\xdf\xbe<\x9c\xbd\
-\xfc\xf2\xcb\xef9\x10&N\x9c\xd8\xbf\x7f\x7f\xce\xc5\xe2\
-\x1f\x8b\xdb.\xcc\x04\x01\x01\xe3`\x91\xa8\xa6MY\xd1\
-lI\x06\x17'$Y\xd2\x0beI\xd6\xfe\xcbs'\
-\xd52\xec\x0c>\xa1?A\xff\xcc\x993\xf57u\xa2\
-\xb2\xe5\x86F\xc0pC\xe2\x9d\xdeP\x96z\x0dJ\x0a\
-K2\x0e\xc2\x97\xa9\xbbB\x08Fo\xdc\xb8\xc1q\xa2\
-\xafY\xe1\xf8Qn\xfb\x80A\xe0\xa1\x8e\x85\x86w\xb1\
-\x9a\x0c\xfcA\xb0<q\x86\x91#G\xf2\xc42`\xc0\
-\x00,\xf1@!\x07\x13\xd1\xd8\x1a\xf9\xf4\x11\xa1\x19#\
-\xcc\xc9M\x0c\xbae\xcb\x16\xfd1\x92\xca\xef-U(\
-\x06-X\xf0\xe9\xfa\xc0\xeb\xe4x*\xc5\x0e \xbd\x92\
-\x92CB=\x02a%\x8f\xa9555<2\xf1\xa4\
-J\xd0\xb9n\xdd\xbao\xbf\xfdv\xed\xda\xb5\x1b6l\
-\xd8\xbau\xeb\x8e\x1d;x\x88=s\xe6\x0c\x8f\xafV\
-y[D\xbdv{\xe4\xd3M\x12\x94\x9bI\xb8\xa2\x85\
-/\x93\xc34\xca\x15\x9a\x11\xe1U\xee\xd5\x89\xed6^\
-\xd5J\xa8\xc1\xe0\xd3\x8et2\xc44\xca-@\xd8\xe5\
-\xb2%_#\xc3\x9e\x8aP\x996@\xceD\xf5'\xd3\
-\x9fB\x06\x0d\xa0X\xa7!\x0c\xe2\x84#\xb2\x1c?~\
-<\x02'\x22Q\x97\x8e:\x82$\x8eI\xf7\x92\xfe9\
-\xfd\xf2\x84~N=\x7f\xfe|\x02&\xe2\xd1e\xcb\x96\
-\x11<\xe9\xc7\x07\xd8\xe0\xa9\x8diq9\xc3\x16\xc0v\
-v\xf6\xec\xd9\x8b\x17/\xde\xbbw\x8f\x07\xeb\xf4tf\
-N\x98\x94`I\x09\xe6\x10hl\xa8y\x00\x18\xe4\xbe\
-$\x7f\xd1\xa2E\xb3f\xcdB.\xb7x4\xe9\x89\xc3\
-\xa7\xb3\x88F&JB\xbe\x1a\xdc\x90$\x07R\x1a\xc2\
-\xa3;w\xee0\x05m\xf4\x95F\x88\xba\xaf\x9d\x9d\xa9\
-g\x8a\xfb\xf4\xe93f\xcc\x18}\xc7\xc2\x82\x1c\xac2\
-X\xb8p\xe1\x92%KV\xacX\xc1\x8a\xe3Y\x91\x15\
-\x8a=\xa5\xac\x06auJ\x00\x7f37\xaa\x91&\x8d\
-\x0d;\xc2\xffu\x7f\x96\x9a\xd0\x9f\xd3}\xf3\xe6\xcd'\
-N\x9c \x89\xde\x9bV\xa8\x90\x87R\x9dD>)\xe7\
-\x04)\xa9DH\x962\x04\xa59*[1\x8e\xfa\xf5\
-\xd7_\xff\xfe\xf7\xbf\xff\xb5\xe3O\x7f\xfa\x13a\xe8\xf1\
-\xe3\xc7y|%W\xbf\x17\xcf\xd3lfUm\x88\x92\
-\xda_\xd8\xd8r3\xcd\xa4\xd4\x8ch?\x912L\xb6\
-\x164C\xf8t\x8e\xb0U\xca\x95\x19H\x19\x11\xd9\x87\
-\x98F\xb9\xe5\x03m\x0e\x9b\x9d\xc6r\xad\xfd\xd15$\
-\xb1\xcb\x83ref\xa0)|\xf7\xc2\x14\x15\x8cr\x03\
-\xfd\x98\x98C\x8e\xab\x85>\x5c\xf1\xbc$ u\xc8\x0b\
-\x110 Z\xc5\x92\xc8u\xe5\xca\x95\xf6\x96T\xbfQ\
-\xa1\x17\x87\x18\xab\xf2\xf6\x04\xdb\xdf\xf5\xeb\xd7\x0f\x1f>\
-|\xf4\xe8Q\x9e\xc5\xedg\xc4\x0cK\x1a\x15\xd1,J\
-\xc3\x98h\x0c\xad\x88\x09`\x93MH\xda\xd9}\xdb0\
-\x91(\x81\xbe\xbd\x1fM\xaa+3h\xad\x97\x02\x5co\
-\x12|:\x85z\x9a\x89\x1b-\x7f\xccp\x05\x0e\x1b)\
-C\xbcu\xdb\x84\x91y\xc1\xfd\xb5=V\x0atw\x7f\
-0v\xc8\x90!D\x99\xaf\xbc\xf2\xca\x07\x1f|\xf0\xb3\
-\x80O?\xfdT\xc2'\x9f|\xf2\xfe\xfb\xefk\x95\xf1\
-@\xc8C\x0bU\xd9hh\xc0A>\x06\xacSi\xdc\
-=\x9f\x22%\xf8t\xdd1W\x921\xc7\xb7q\xf5\x9a\
-\x9a\x9a]\xbbv\xe1\xed\xb7n\xdd\xc2@\xf6\x15*\xe4\
-C.\x14\x12z\x1aD\xc9L\x12w\xcc9$\x98F\
-\xc8F\x90\xc4W\xef\xbbo\xdc\xd3k\xd1-[\xb6 \
-\xec\xdd\xbb\x17M[\x7f\x0f\x9aF\xa3\xc7\xeaN\x0f#\
-\x1a\xe1\xd3\x01\xd2\xab\x94\xf0\x19)|v`\xe0\xd3\x0e\
-i\xac\x1e%[\x1e&]\xd3*gPc\xd4\xaap\
-d\x22WqVu\xf0\x199\xb0\x17&K_&\xd0\
-`\x8b\xc1\xbc*\x00}f\xdf\xc3^\xb8>\xd5\xe9T\
-Z#T\x8f\x9d\x08\x22\xd3\xb2$\x8a\x8d\x08\xe9\xc9\x8b\
-/\xbe\xc8\x01I\xd0C0Dk\x5c;\xb3o\x8f1\
-\xe3\x82=\xe7\xe8\xf0\xe1\xc39D\x17,X@\xd8\xc4\
-I\xb9t\xe9\xd2\xd9\xb3g\x8f\x193\x86\xf3R\xc7\xa1\
-/\xd3^\xe0\x90\xbey\xf3\xe6\x95+Wn\xdf\xbe\xfd\
-\xe4\xc9\x13\x1b\x22\xf54\xb3\xbf\xf9\x06\x01\xbd\xb2$8\
-wJ`\xdc\x98\x82.]\xba\x10\xa0\xcc\x981S\x7f\
-y\x9c\xe7\x04\x06\x5c\x05[\x115\xd5'r\x0e*\xa5\
-\xa1\xac\x02D6\x99n\x968\x9fC2W\x95*\xa6\
-\xfe\xb2\x22\x19\x91\x00\xe6\x97\x99\x1d<x\xf0\x94)S\
-\xe6\xcc\x99\xa3/\xae_\xbcx1k\x07\x96/_\xbe\
-h\xd1\x22\xbd\x10u/F\x13\xf4r\x94e\xa5_\x9b\
-\xab\xaa\xaab\x91R\x8f\xbfA\x80\xbfGq\x07O\x88\
-\x86\xda\xf8\xa7\xfbbQ\x9c\xfc\xcc\x993\xfaln%\
-\x12\xadP\x12\xe6{\xb8\x93\xae\xc2e\xd6\x8f\xb7\xae[\
-6\x02\x9f\x14?\xba?~\xc1\xb6\xcc#S{z\x0f\
-\x9a\xc6\x96\xb3\x0do\x83Q\x0d\x22\xd4 \xe4\x1b7r\
-mc\xf1\xaa\xd6\xc0\x1a\x90\xaf\x19\xe9\xf6'\xee\xe2\x94\
-*[\x18+nB9\xc0\xc8?\xef\xd0\x14\xa0Qk\
-\x95\x0b\x96T\xb3\x93\x0e\x07\x84\x06Fh\x1f\x09&7\
-!\xc5\x06\xa34Kq72\xcb\x9b\xa6D\xed\xb6\xc6\
-\xb9v&\xb2F\x87s\x91\xc3\x95\x03r\xdc\xb8q\x1c\
-\xa5?\xfd\xe9O?\xf8\xe0\x83U\xabVM\x9e<\xb9\
-_\xbf~/\xbd\xf4R\xbe\x83\xb3\xed\xc26\xc7fG\
-$\xaa\x97v^[\x22\x1a^\xae\xf2\xad4\xe8;u\
-\xea4hP5\x91(\x01\x0a\xc3\xcb`\xa2W\xf1V\
-$\xea\xb2Z[\x0c\x18\x17?\x5c\x89\x93\xe5\x90\xc6*\
-i+\xd0\xda\x17^x\x81Id\x810w\xc0\xc3[\
-\x9f>}F\x8f\x1eM\xf4\xf9\xce;\xef|\xfa\xe9\xa7\
-?\xff\xf9\xcf\x7f\xf6\xb3\x9f}\xf4\xd1Go\xbd\xf5\x16\
-J\x9e\xe2X5=\x1d=z\xf40A\xefP\xa9\x8a\
-\x0a\xe50\xaa_\xe8vi|v\x0e\xaf\xcd\x22\xcce\
-\xc0\xf5i\xd1S\xa7N\x9d>}\x9a\x87.\xfc\xdc\xe7\
-U\xa8P\x0a\xf2+[\xc2\x10\xca!\xc9:\xcfB\x87\
-Q\x1a\x17\x85&H\xc6Ey\x82RR\xf8z\xdb#\
-n5\xd7\xc1g4\x14\xab\xa4\xc0\xb8a\xa07P\xec\
-c\xad\xfb\xfb!\xd6\xda\x02\x14\xee\x08[\xa8\xed\xa2\xce\
-Y\x12\xe3z\xebl]h0c\x0e\xd6N\xb5\x1c\x94\
-4\xe7W\xb2\x18doxm@\xa8\xe4\xbe\x8d\x1c\xa2\
-\x12\xa2@5(Y\xdf\xb9`\x14\xa4\x04o\x94k\x93\
-\xd0\xa4>\xe7\xfe\xf6:G\xe6\x88\x11#\xa6M\x9b\xb6\
-p\xe1\xc2\x15+V\xbc\xf2\xca+\xc4\xa6s\xe7\xce\x1d\
-[\xf7\xafW\xb5\x03\x18\x0d\x86H\x91\xa8FF]\xb3\
-\x0e\x9aR\x98&\x8drC\xb3\xb0,cK\xfc1`\
-\xc0\x00b\x94\xa1C\x87\xb2\x0b0\xd4I\xb1V\x82\xb6\
-\xa9\xe3\x84\xe3\xda\xfa\xa5T\xe3A\xcd\x06%\x8b$m\
-\xef\x86\xc1#M\xa9u\xb6\x22n\x00\x92\xb9\xd3g\x7f\
-y*\x9b3g\xce\xbcy\xf3\xf4\xb2s\xe9\xd2\xa5/\
-\xbf\xfc2\x0b\x84\xd0S/>Y/,\x93I\x93&\
-\x0d\x192\x84E\xc4\xc3\x1b\x8bE\xfb\x0e\x95H`\xde\
-\x01\xc1\xc6Aw\x01\xc9R\x86(W\x90\xf4\xa3\xe9\x90\
-\x81!\x03\xee\x85\xc0\x9c2\xb9\xb7n\xdd:z\xf4\xe8\
-\xae]\xbb\x8e\x1d;V\xf9.\xa7\x0a\xa5\x22\x8f\xd25\
-\x0d\xfa\x10\xaf\x0d\x90\x97\x02\xdeX\x00\x19\xfb\x84;\xb3\
-\xa4i\xc7D}\xf4#\x98g\x9c\x8b\xa1\xa4\xe2lA\
-lP\x9cD\xecT<\x1b\xb3c\xf8\x8c\xb6\x80\x0d\x9d\
-\xba\x0cJ\x16\xa0\xac:\x88\x87s\xf2Z\xd4!\xe4\xf6\
-\x12B\xd0\xa8\x94\xbai\xc94\xaet^\xbcQ\x13Q\
-\xc2hj\x86\x0c\xafu\xf8\xa69\xc8\xd2\xb9\x85L\xb7\
-\x118#\xd1\xe0\xa9\x9c\xa3\xdd\xbbw\xef\xdb\xb7/\x01\
-(\x91\xe8\x07\x1f|\xf0\xf1\xc7\x1f\xbf\xf1\xc6\x1bD\xa8\
-\xfa\xa5\xa8\xf6\xf4\x964\x19\xa3\xdcP()=\xc3\x22\
-!\x8d\x1b\xbf\xa7Hi\x05%(K5\xbb8\xc4?\
-\x8c\xea\xc5\x18\x83,\xe3\xd6B\xbfBt\xe3\xc6\x8d\xfb\
-\xf7\xefka\xf8\x8c\x12\xb1^\xe7#\x1c\x16\xc9&\x94\
--4\xef\x85\x17^\xe8\xe8\xfe\xbcV\xaf^\xbdF\x8e\
-\x1cI\xc4\xf9\xee\xbb\xef~\xf2\xc9'?\xfb\xec3\xfe\
-C\xf8\xf0\xc3\x0f_\x7f\xfd\xf5\x993g\xb2\xa1\xeb\xad\
-'t\xeb\xd6\x8d\xc9e\xa2\x99\xdfp\x81\xa8\xbf\x5c\xe5\
-fBY\xe0\xd3\x05\xc7\x84\x5c\xca\xaa\xb8WeA.\
-S\xc9\x84>\xca}\xab\xe8\xf6\xed\xdbw\xef\xde}\xf6\
-\xec\xd9\x07\x95\xbfA_\xa1D\x8aw\x18,\x05r\xda\
-E\xd1s\xc4\xb8#\xb8\x0e:n\x95\xe5J\xc7?\xc7\
-k\x97\xa8\xa7\x12\xa4i<V\xa7\xe4\xf0\x1a\x82\x86\x11\
-\xe60b\xb3\x1a=z\xf4\x981c\xaa\xaa\xaaxf\
-N\x8a\x95%\x05\xfc\xc1z$\x94\x04\x9f\xceQn\x1e\
-\x85\xb7s\xf8\xfe\xf8\xe3\x8fr\xfe\xb0\xc1hB,\x97\
-.\x98,\xd0\x94\xda/+\xae\x82\xa5\x16\x0f)6\xf2\
-s\x8dLH\x9f[ag\x80\xa4\xf5YI\xb0\xb2\xc0\
-\x99JH:l\xd80b\xd0\x05\xee{I_\x0e>\
-K\xaa\xb7\xa4\xaa\xaa\xad\xa3\xbe\x83O\x97H\xba\xac\x86\
-\x11\xa5\xb9\x140\xa4\x8c\x18Q\x0eWdo\xda\x1a\xd0\
-\xaa{\xf7\xee\x9d;w\xee\xd4\xa9S\xd7\xaf_\xd7\xaf\
-\xb4\xab\x912(\x80\xcc\x00\x99>J)|F\x80\xf4\
-\x1a\x0d\x93#\xa1\xdc`\xa7&\xa6\x1c<x\xf0\x84\x09\
-\x13\x885\xf5\xf3\x81\x95+W\xe2\xf9\x84\xa4\x8bH\xbb\
-\xf7\xa0\xb3f\xcd\x1a7n\x9c\xfe\xa6<+\x8595\
-\xdc\xea\xf9\x97p\x04\xc0\x8dAv\x97e\x09>\x1d\x10\
-\xeaU\x83\x90&\x8d\xec\x99P\xa6\xf5\xc0\x81\x03\xeb\xd6\
-\xad\xdb\xb4i\xd3\xf1\xe3\xc7y\xf0`\xd2\xbdQ\x85\x0a\
-\xa5\x10z\xa0\x04a\xfa\x10\xe7\x80%\xc4\x94f\xa9\xda\
-\xc2k;\x86\x0e\x86G\x83\xe1\xb3\x1bJTI\xbe\x0a\
-\xd9\xe2xf&\x0c\xed\xdb\xb7/\xdb\x17I\x9f\xd1\xe2\
-\x14\xf6\x13\xe5\x16\xb0I\xf7W\xf8\xb4+K\xef\x0a\xdf\
-\xa5\x85\xa1yL\xbdf\x9f$m\x13\x96+\x03]%\
-\x80r\x85\x19\x87\xa4+\x89P\x96\xd9\x98\xd0\x00\x8a\x8d\
-]\xfc\x9dS\xbe\xee\xb3\xeb\x22\xbd\xceNK\xbaN\xf9\
-x\xf49\xf7\x95\x99]\xbbv%\xf4\xe4Aj\xd9\xb2\
-e\xef\xbd\xf7\xde\xfb\xef\xbf\xff\xca+\xafL\x9a4\x09\
-e\xab\xbf\xe1k$nl\xfc\xd6\xa9k\x88rAI\
-\x19XRXRBb\xed@\xb6\x0aI\xca\xb1@Y\
-\x90\xbe]\x8bA\x1b\x1e=zt\xeb\xd6\xadk\xd7\xae\
-\xe9\xfb\x95\x92\x16;h\x95\x1aV|\xf3\x8a\xb4t\x15\
-?\xc5k\xcb\x06\x82H\xb9:\xf1\xe5\xf8\xf1\xe3\x899\
-W\xaf^\xadON\xbf\xfe\xfa\xeb3f\xcc\x182d\
-\x08\xdbw\xcf\x9e={9xNcCW\xe8\x19\xee\
-wQ\xef\xa2dH>}\x84\xe6\xc5'|)W\xa9\
-+\xae\x5cP.\x02\xcf\xdc\xfa\x1a\xd7m\xdb\xb6m\xd9\
-\xb2E\xbfA\xff\x7f+\x9f\x16\xad\xd0 \xe4] \x7f\
-\xd3\xb5\x18\x9c\x87\xd6oL\xcd\x12\xd8\x85\xd8\x94@\xcf\
-\xc6\xed\x1b\x1d\x04\xc2\xab\x1a\x8a\xaf\xc5\xe1U\xf9\xf1v\
-\xff\xef\xff\xb1e\xf1\x08\xad\x8f\x12\xb1\x83\xf9\xec\xd6\xa0\
-\xb0\x93(\xd7\xb9\xd2S\x94\xe5{\x92\x85\x0c\x80\xae\xd1\
-Am\xd4^U\x06\xf8V\xba5E\x0b\xd5)\x88r\
-E\x146d\xe2\xcb;\xa4QYP2\xc4l\x1aL\
-\x09\xc1(\x8b\x19\xd4\x81\xa8q\x92\x0d\xd7\xf8\xb8e2\
-\x93\x9e+^\xcbD\xe2\xb8\xdd\xbau\xd3o\xdc\xeb]\
-\xd1\xd2\xa5K\xa7N\x9d\xda\xaf_\xbf\xb2\x9a\xe6\x06c\
-\xfdU2M\x98\xa5\xc1\x14\xa6\x91`f\x08\x22L2\
-)\xfa\xe1\x94\x94\xad\x05-aB_r\x7fI_\x9f\
-aW\xf3|v\x8e\xb4\xc6\xba\x99\xa6@\x16\xeb\x0d\x10\
-\x92\xf1r\xa4knEh\x0c\xe30l\xd80\xfcy\
-\xde\xbcy8\xf6\xca\x95+\xf5y\xd0%K\x96\xcc\x99\
-3G\x7f4\xb5s\xe7\xcez\xab-x\x0cc\xdcT\
-\x5cWu\xcdU\x99\xe1\x0f\x11\x18h\x85\x0a\xafM\xf4\
-OG\x09\xbc\xb6.l_\x5c\xcd\x80+U\x19\x0f\x1e\
-<8y\xf2$a(\xd4\xd6\xd6\xea\xcfO\xbbr\x15\
-*\x14K\xa6\xdf\xa24\xbc*\x0by& gZZ\
-\x0d\xde.\xf7\xb5\x0f\x97/_\xbez\xf5\xea\xc3\x87\x0f\
-\xd1\xc8\xb2]\xc2\x11@\x7f\xed\x07\xb5Z\xb6n\x18\xea\
-\xe0\xad\x1d^\x15(}:\xc0g\xe4\xb2|\x22\x85\xe5\
-j[\x06\xe9[\x1e\xf3\x0d\xb5\xc7\x5c\xc2\xe9\x9e\xe2\x9c\
-\xa5\x8e\x17\xb9\x1exl\xf4\xd0Gf$\xd9\xb1{\xf5\
-\xeaU]]\xcd\x95M\xdbg\x94\x07\xd6\xda\xa4{N\
-\xe6\xcat()d\x10\xa1\xceF\x84\xc6\x99\x06\xd1X\
-e\xda\x14I\xb1\x1e\x83\x8b\xdf\xb9s\xe7\xfa\xf5\xeb\xf7\
-\xee\xddS\xdc\xa3\xdb\x17\xb8\xb7\xb2\xd4y0\x8d+\xe4\
-K\xa1\xe7\xe8ej\x89`\x08@9\x9e\x09I9\xb6\
-'O\x9e\x5cUU\xd5>\xde\x8f\xfaD\x0e\x8d\x86\xf0\
-\xaa\xfa\x90eX\xc4d-{\xd6\x03\xc1\x9f\xe2?\x19\
-\xb4\x0a4\xa9K\x97.\x03\x07\x0e$\x02\xeb\xd3\xa7\x0f\
-\xd3\xaa5@V\x03\x9c\xd5\x0d^\xb6\xb1\xe9U9\x98\
-\x86\x11\xe0\xa6\x92[\x12ZB \xaeY\x00BL\xbd\
-\xf5\xd7\xa7B?\xfc\xf0\xc3w\xdey\x87`t\xc6\x8c\
-\x19\xfa\x0bI\xecb\xfaA\xbc\x1al\x03%A2d\
-\x8e\x80\xe5fB\x91hy\xbak\x5cOx\x17P\xd2\
-\x9aa\x1a\xa08\x87\x1c\x0b\x9f`t\xef\xde\xbdD\xa2\
-\xb7n\xdd\xaaD\xa2\x15\x8aDN\x18\xe1}+p6\
-\xf9^\xe8\x81\x90X\x14\xf4\xf6|\xa8\xd4\xe3\xc7\x8f/\
-]\xbaTSSc\x1f)\xc9lL;\x80~\xe9\xab\
-\x7f\xaf\x5c\xb9\x12\x85\xdd\xc8a\xb2x\xf2\x95\xca\x9c\x11\
-S6\xec^ME\xe2.\x0e\x9fvX\xd2\x8dD\x9d\
-\xe6\xc9\x18\x94\x94AHh\x03$qQ\x8e6\xe2\x93\
-\xe1\xc3\x87\xb3\x93\xb3\xdb\xbb\xa2\xad\x0cm\xd3Qb\xed\
-T\xe3\x95\x85\xde\x90\x01X\xaeP\x12|:W\x89\xa1\
-\x5cPV\x84\x0cB\xb3R)\xea\xd8\xe6\x06\x0f\x1e<\
-8s\xe6\xcc\x81\x03\x07N\x9f>\xfd\xe8\xd1#;\xed\
-\xbcE]\xd4\x13\x08eA\x11\xae\xe8UV2\x10w\
-v\xe8\xd0\xa1[\xb7n#F\x8c\x983g\xce\xa2E\
-\x8b\xa6L\x99\xd2\xb7o\xdfr{\xech0\xd6SH\
-\x06\x22\x87W\xd5\x87\xb7vxU\xaeN\x5c\x90\xb0f\
-\xd0\xa0A\x84\x80\xdd\xbbwo\xc5\x08\x9e\xf6\xb0J\x99\
-D\x22-\x9e.\x98\xbb\xc4\xf5s\xa1!3.\x9f\xd1\
-\xd47\x80\xb0\xefTe/\x83\x93A\xc9\x0d\x057\x85\
-\xd0\xb2\xb9\xa1\x8f]\xbbve\xf0'M\x9a4}\xfa\
-t\xc2\xcd\x993g\xce\x9e=[\x8fU+V\xacX\
-\xb6l\x192JbS}\x9d\x19\xfb\x17a\xa8\xc6\xc7\
-\xd7\x12\xf4\xc2\x04\x11&#Y\x82\x08\x93\x1ad\x91,\
-\xd4\xdc\xb0\x83\xb7p\xb8\xca\x92R&\x80v+\x04\x8c\
-Mf\xa8\xef\xde\xbd\xcb9w\xf9\xf2e\x04\x92\xce\xb6\
-B\x85\xa20\xdfs\x8e\x96\x81\xcc$\x84\x9a\x86\xa1\x1a\
-\xb8#\xc7\xd6\xb9s\xe7\x0e\x1d:\xa4\xbf\x10\xd6\x8e\xfd\
-\x96\xae\xe9;.8\xa3\xe92\xf1\xa8\xf6F\x0d{\x84\
-\x86\xd7\xcd\x89G\xfa\xe2Q\x0d\x11R&C\xdf\xb8\xe9\
-k\x0c\xd6\x1d\xb5A\xb2\xae\xc2\xe5{\xa4\x91\xa5ku\
-\x82\x94\x86,\xc3,\x04\x0eY\xb6\xf1\xfe\xfd\xfb\xf7\xee\
-\xdd\x9b#O\xfa\xd6\x85\xb3\x8f\x96\x806m5\x1b\x5c\
-\xc3\xebt0\x04=6v\x05\xd3\x0bW\x87G\x1a\xe5\
-\x866ME\xb1\xef\x90\x08@/^\xbc\xc8\xaa>u\
-\xea\x94\xfe\x02\xb5k\xb3\x07\x03/9T\x04$\xdbU\
-\x98\xc6z(=\x83\xc8\x1c\xeb\x5c\x9f7o\x1eG\xf8\
-\xb4i\xd38\xbc\xdb\xd3\xaf\xd87\x1e\x8d\x98\xa1qc\
-a\x8c\x1a5\x8a`h\xe0\xc0\x81D9>\xaf\xc5\x09\
-\xe7QK\x22!7\xdd2\x88\x844\xe6\x15\x90\x14w\
-\x96\xa1`WY\xba\x1c_\x1b\xf7\xed\xe4`eJ\xd3\
-\xdc\xd0M<v\xcc\x981\xfa\xdbH\x1f}\xf4\xd1'\
-\x9f|\xf2\xe9\xa7\x9fr\xfd\xe9O\x7f\xfa\xea\xab\xaf\x12\
-\x9b\x0e\x1d:\x94\xc7\xaa\x9e={2M\xcc\x8e\x9cY\
-\xcd\x16\xaa*\xc2\xe7\x05\xfd-\x15\x8dO\x1a\x9f\x9d#\
-\xac\x5c\xb2\xcd\x1d2G\xda\x93'On\xdc\xb8\xc1S\
-(\x8f\xa37o\xde\xfc\xb1=~[x\x85\xb2\xc2\x1c\
-\xcc9lQ\xce&w5\x81R\xb8\xee\xe3\xc7\x8fy\
-\x82\xe2\xcc\xe2\xca\x11VdUm\x11\xbav\xcf\xfd\xd5\
-\xd3\xbd{\xf7\x12y\x13\x986l\x9d\xbau\xfftC\
-\x10\xaa'\xad7\xacT\x01\x9b\x96\x81\xa6\xea%\x05\x82\
-\x1a\x83\xac\xa4\x0c\xc0d\x09f)2\xbb K\xb2\x80\
-\xed\x91\xf3\x85\xb0\x84\xfd\xbcs\xe7\xce-v\xd6\x14\x86\
-0\xb4{\xf7\xee\xdd\xbau\xe3\x88Q\x17\xc26\x9b\x00\
-\xda\xde\xc3,\x81\xbd\xe1U\x01f\xa9R\x22\xd47\x9e\
-b\x83<\xa6\x93\x87\xad\xeb\xd7\xaf\xcb\xcb\xd1\xd0%\xf5\
-J\xa0\xf1R@>e\x88\xef\xbd\xeb?\x15\x12O0\
-\xa6#F\x8c\x98;w\xeeR\xf7+\xf6\x84Y\x1c\xe4\
-\xe8e\xdf>\xf0}vxUj\x9a#Bc\xc9\xa0\
-$\xfe\xc7#Zuu5\x03\xf5|\xeb\xbdK\xa6=\
-\xf8\x09\xee\xc1\x19\xf0\xcf\xe0\xe3\xc5\x10z\x8b\xb7\x0e\x90\
-\x1e\x90]\xb7\x12\xbc\xca!3\xa1\xa4jC\xc0RJ\
-6\x85\x8e\x1d;2\x02\xc0\xcaLL\x9b\x19\xee\xc8\xbd\
-\xc6\x8e\x1d\xbbp\xe1B\xe2\xceU\xabV\x11\x92\xaet\
-\xf0(5\x7f\xfe\xfc\x89\x13'\xeaS\xa1z\x0f\x8a}\
-\xd2\x19\xf7\xd8\x9al\x90u\xb7\xc8\xc6\xa3\xca\x854\xc9\
-8\x06\x98R\x82!\xfb\xe8\x0a\xb4P\x91\xe8\xc1\x83\x07\
-7o\xde\xbco\xdf>v\x80J0Z\xa1$\x22o\
-\x91\x83\x89\xc4)\xeb\xe23rY>Q4a\xe5@\
-\x5c\xc2\xb1u\xf7\xee\xdd\xf6\x1d\x89\x0a:\xcbR={\
-\xf6\xec\xa5K\x97\x1e<x@R]vK\xb9\xce\xb0\
-\xa4\x87\x22\xb2\x94\x00.3\xc1\x0c\xc2\xa40eZh\
-\x15h\x9b\xb6V\xc3g\x04d*\x0b\xa3\xaa\xd45N\
-\x1f\xb6\xf4N\x9d:\x11\x92\x96CdB\xab\xbat\xe9\
-B\x00\xd0\xbf\x7f\x7fZ\x85\xc6:(\x01\x834\xa6w\
-=+4 \xa1q\xbed\xe3)\xe1\x8dcxK\xd7\
-\x8c\xa7\x0d\x12J\xba|?s\xa6q\xf9>\xcb4\x96\
-\x14\x929\xb09\xb6\x89GG\x8e\x1c\xb9h\xd1\xa2\x9f\
-\xfc\xe4'/\xbf\xfc\xf2\xe4\xc9\x93\x09\xb6\xca\xe4\x11\xa4\
-x\xac_\x85)\xec\x07\x22\xb4\x89\xecu\x17\x06\x87\x08\
-\x8c\x85\xa1\xa4\xcfkq\xd8\x05\x08V\x88`\xb4\x15\x86\
-MU\xc3\x84\x92\xd2\x17\x89\x0a\x82\xc9\x16\x8fJ\xa3\x11\
-\xe0\xd1\x104\x0e\xcaj\x12\xb8\x17nI\xfd\xecA@\
-\xd4\xcbcq\x9f>}\xf0L\xfd \x1ea\xd0\xa0A\
-\xec\x05\xfd\xfa\xf5CO\x0c\x8a\xc7\x86\xcf\xa9\xd6\x81@\
-\xcc\xdbB\x9f\x9dC\x1ae\x81\xc9\xa12D#\x1f\x12\
-\xee\xce2\xb0\xab\xb0\xbb\x08dr\x99\xc7\x9b7o\x1e\
-;vl\xeb\xd6\xad\x1b7n\xac\xa9\xa9\xa9\xfc\xbd\xa5\
-\x0a\xa5\x22w\x12\x92CM\x1asK\x84\x10)C\x12\
-O\xcd\xa1d\xa8\xa7\x08n\xcfS\xb1\x1e\x8c\x95\xd5\xbe\
-am\xde\xbf\x7f\x9fH\x94\x95\xab%\xef3R\xa4\xb3\
-Lc\xc3\x08\xa1\x8c\x81l$\x84\xc8\xa0\xd5\xa1%\xf4\
-\x9a\x07\x0f\x06\xe1\xf1\xe3\xc7\xda\xa9\xac\x85\x12\xc0\xd9z\
-\x94\x8c\x94\xce}\x12$K\x19\x82\x92#\x86H\x94\x13\
-\x81\xa3\xc1k[\x15\x8e$\xce\x9d\x9e={r\xe2\xe8\
-dT\xcb\xe9\x9a<A\x9a\x08\x95\x15\xd8\x08\x9f\xce!\
-3\xd9\x8bP\xc95]\xa4a\x14;\x8e\xdc\x95\xd1\xd7\
-\xaf\x5c \xd3=\xf0y\x0e\x94 9l\x1c\xb2\xe9\xcd\
-F\x82\xc1\xd8\xe9\xa5\x91\xb2H2\xc7\x8aG\xe7\xcf\x9f\
-\xcfa?g\xce\x9c\xa1C\x87*\xe4o\xaf\xa8\xfb\x0d\
-@\xa3\xcd\xa0A\x83+ir\xcc\x07B\xc1dAk\
-\x0b7X\x06B\xc9H)P\xaarv\x1fv\x22\x88\
-\x9c\xb3\x91\xe8\xe9h\xc8\x90!c\xc7\x8e\x1d?~\xfc\
-\xc4\x89\x13\x09=g\xcc\x98\xb1x\xf1\xe2\xe5\xcb\x97+\
-\x12%\xfa\xd4'A\x05\x0e\x0c\xe6\xd5!hl\xb2\xd2\
-\xb9\x05\x90=\xf8t\xe9h\x94\x0ci\x94%L\x0f<\
-T\xe8\x9d\xe8\xbau\xeb6l\xd8p\xf4\xe8Q\x02S\
-\xceu\xe5V\xa8P<rZy/H)\xe4r\xc2\
-\xabRnY\x12\xfe\x1en\x95E\xd5>\x0bX\xf0\x1d\
-v\x5c\x03\xe2\x13\xf9\xb1\xe1\x92=H\x1f\x22\x1b#\x9f\
-\xc6\xd9\xb64\xf4Z\xbf\xc5u\xf6\xecY}0C\xef\
-D\xc8rM\xcbnU>=\xf8QpxU\x0e\xbc\
-\x8b\xed\xbd\xc9\xdfz4\x18\xb6\xeb{\xf7\xee=|\xf8\
-0\x9c}\xebZ\xd2y'\xab\xb5\xf5\xb692 \x19\
-!\xa5\xd5\xdf$\x94\x10\xd4\xebQ\x80+\x13\x0c\x91\xbb\
-G\xb8\xbe'H\x96R\x84\x9d\x01&\x15Y6\xc9\x11\
-\x9d\x0bL\x11\x88>{\xf7\xee=b\xc4\x88I\x93&\
-\x11\x98\xf6\xe8\xd1\x83\xbb'U\xb4;\xe8\xaf]\x0b\x13\
-\x0d\xa6\xb0a\x94,\xa1U\xc0+\xf0\x0d\x16\x86\x96\x84\
-\xd7\xa6\x08\x1b\x195\x98\xa4@\xb6\xce\x9aF\xd7L\xb8\
-\x1d\xf7\xbd{\xf7\xee\x9d;w\xb8\xbb\xd76\x02\xeeE\
-\x18\x8a\x13\xf2\xc49e\xca\x94U\xabV}\xf4\xd1G\
-\x9f9>\xfd\xf4S\xe4\xb7\xdf~{\xc9\x92%x&\
-\xcf\xa38-S\xe0\x9a\xe9[H\xe3\x81d\xe2\xd3\x96\
-\xe7P\xae\xcc21\xb3|\x98\x81\x04\x90\xbe\x18tk\
-k@\xd4\x12\x92\x8c${:\x91(\x01\xe8\xe6\xcd\x9b\
-\xd7\xaf_\x7f\xe8\xd0!\x22Qf\xd6\x1bU\xa8P4\
-rNs\xd1\x02\xbe\x1a\xba\xa2y\xa9\x90\xb2\x00\x99\xd5\
-\xb2\xec822\x9f\x09\xdb+\x8c\x95Ng%\xd5\xf1\
-\xf4\x00\xa27\xbc*G1\xa3\x9dLI\x0e\xaf\xca\x91\
-\xa9l\x19\xb8/;\xff\xad[\xb7\xce\x9f?\x7f\xf5\xea\
-U\xbd\x95\xb0\x0e\xaaaJF\xbdV\x16 [\x16\x82\
-d\x09\x80lf\xa6\x97\xdc\xba\xd0$\x0e\xbe3g\xce\
-\x5c\xb8p\xe1A\xc1?\x89\x97/+\xadW\xef\xd2X\
-\xae\x8ap5\x94\xd5`\x8a\x0dF\xb9\x13\xe7\x13\x1d\xbe\
-}\xfb6sL\xd2\x9ae\xb8\xf6x\xbc*\xc0g\xe4\
-p\xfdJ\xf0\xd9\xae{\x5c\xc9\xc2\x81\xb4\x96\xd8D\x08\
-\x05\xaa\xaa\xaa\x88G'L\x980|\xf8\xf0n\xdd\xba\
-\xb1\xbf8\xf36\x06\xfd\xd2UBI\x14SD\x83\xd6\
-\xb0\xfa\x9b\x0a\x1ap\xff\xfe}\xd6\xc3\xe9\xd3\xa7y<\
-\xb5\x88\xb0@\x93\xac\xc1&\x84.\x01\x96\x1b&%\x98\
-\x0c\xce\x95\x92\x97\xf7]\xbbv\xed\xde\xbd{\xe3\x7f\xe9\
-MU\x0d\x180`\xec\xd8\xb1s\xe7\xce]\xb9r\xe5\
-k\xaf\xbd\xb6z\xf5\xea\x9f8\x10^~\xf9\xe5\xf9\xf3\
-\xe7\x8f\x1e=Z_5\xc7\xdd5\x05\x94E\xe6J\xf3\
-H&\xcfm\xee\xfb\xff\x80\xa4\x9a\x1d\xe2\xee\x16\x13\xea\
-efxmC\xf1\xb5\xd4\xc55\xdc?[\xd2x\x9a\
-J$J\x00\xbaa\xc3\x86M\x9b6\xd5\xd4\xd4\xb0\xbf\
-\xd3\x0b\xd5P\xa1B\xc3\x90\xb3\x81O7\x0f\xd4o\xfe\
-\xac`\x94\xe5\xd9FO\x8d\x06\xc0\xfa\xa5\xb3\xf6l\xec\
-\xc6;\x19p\xbb\x86\xb8\x12\xf5\xe3\xad\x03|F]\x0a\
-d\xb5\x184\xe0\xc9\x93'\xc4*\xfa\xa8\x98\xd7\xa6P\
-S\x0d\xaf\xcd\xc1\xb8\x81\xc9v\x15\xd8\xdbnY>\x10\
-\x95\x11\x7f_\xbbv-\xfa\x22\x85\xb0\xe5F\xd2\xe7\x00\
-\xaf\xcd\x22\x19\x88\xbaH\xefK:\xa4i<%,Q\
-\x22\xeeK\x97.]\xbe|\x99x\xf4G\xf7K\x0ca\
-\xe3B\xa4\x07%\xb1\xd4\xe4\x81i\xb8z#\xb7x\xbc\
-\xe4P\x96\xcc\x10^|\xf1\xc5~\xfd\xfaM\x9c8q\
-\xda\xb4i\xd5\xd5\xd5\xc4\x19I\x15m\x0d\xd7\xfb:\xdd\
-\xaf\x17\x99\x15c\x5cd\x85\xcd\x0d\xcd \x18={\xf6\
-,\xe1\xcb\xc5\x8b\x17\xd9\x11|\x86Cs\x1a\x0aF\xd4\
-\xfe\xb4\x01`cfi{\xe0\xd4\xe9\xd9\xb3\xe7\x981\
-cp\x95\xfe\xfd\xfb\xbfP\xe2\xef0\xa9\x06}0T\
-\xbf\x085n\xdc8b\xd0\xf7\xdf\x7f\xff\xed\xb7\xdf^\
-\xbcx\xf1\xf8\xf1\xe3\x07\x0e\x1c\xd8\xa7O\x1f\x9e\x8e\x08\
-@\x81\xa8\xb7s\xe7\xce\x91\xf7\xe2\xeal\x82\xb6[I\
-\x89\x0d\xe8FBz\xf0\xe9\x14\xae\xbb\x09>]\x0a\xe9\
-j#\x0d\xcd\x13I\xa4\xecZk2\x9b\x1a\x0f\x12\xfa\
-KK\xeb\xd7\xaf\xdf\xbf\x7f?\x81)z_\xb2B\x85\
-\x12\xc1y\xe4`\xde\xa1\x1d>/?\xf2\xd8d\x85\xe4\
-\x90>\x13\xe5\x866&\x13\x96\xb1\xa2Y\xdaJ>\x0b\
-D\xa3\xed\xb5\xb9mSJCY\xc5\x10\xda'\xf3\xe1\
-P2\xa4\xa4:\x9b\x03\xf6p6p`\xd2\xc3F\xaa\
-\xfdi\x94\x0b\x05\xbacf\xa1}R\xb8\xb5;k\xb0\
-\xca\x88\xbf\xe1\x9fu\xff\xf0\xa1\xcf\x0eP\x969\x894\
-\x5c\xddP%\x98\x0d$\x05\xea\x12\xd9H\xd9$\x94\x10\
-\x8crc\x0e\xaa[\xb7n\xe9{\xef\xad\x1d\xd68\xa1\
-\xa4\xe1\xb5\x01*\xe8\xb3\x1dJFW`\xb0\xb8\x11\xc9\
-.]\xba\x0c\x192d\xe4\xc8\x91\x84\x02\xec,fP\
-\xe6\x14\x98*\xba\x10R\xfc\xa4b\xec\xa5<\xd4k\xd0\
-\xdc\xb0\x050G\xec\x08\xc8\xf2\x135\x89\xab\xe26g\
-U\x02\xd4\x10\xe13\x1cV!\x02\x0f*<\xb7\x0c\x1a\
-4\x880\xb1\xa4\xe3\x87\x13\x0b\x1f\xc3\xbb(;t\xe8\
-\xd0Q\xa3F\xcd\x981c\xc5\x8a\x15\xabW\xaf^\xb5\
-j\xd5\xc2\x85\x0b\x89q{\xf7\xee\xdd\xa9S'uM\
-\xc7\x9bBL\xa0\x06\xeen-\x890}(\xa4\xb1,\
-\x09\xc5\xa0\x82!>#\x95e\x1a\xe5\x0aE\x09\x1aO\
-\x0d,\x0b\x9cg\xeb\x03\x07\x0el\xd8\xb0\xe1\xfb\xef\xbf\
-?t\xe8P%\x12\xad\xd0\x18p\x9e\x87\x0f\x1frd\
-\xe8\xd14\xf2@\x90[\x0a\x92\xf2F\x13\x9cWf\xef\
-\x8d\xbe\x8cCI\xe9\xc1d\x8a\xe2\xe3\xfa\xa1\x844\xcf\
-\x02\xecH6nnx\xe21\x17\xf9\xf4\xf5\xa2:\x0d\
-4\xba\x9d\x90\x8d\x09-\x0f\xddg\x8b\xb6\xcff\xd0\x12\
-\x09\x85\x91M\xd2\x9f\x00e\x09\xd7\xb9V\xebT\xbd\xd0\
-_\xfd\xaeB\x18\x82\xab\xc1QG2Q\x11\xe1U\xf5\
-\x11Y\x16_0\x1f\xa5\xfd\xf0\x82%\xfdc\xee\xaf\x8d\
-\x91,~n\x5c\x1f\x13|\xba\xee\xd4\xfa\xbcTg\xd0\
-\xe0X\xca\x22\xcex\xe9\xa5\x97\x88\x06\x18t\x9f]\xc6\
-X\xef\xc2k>\x0a\xe7\xe6#\xb9\x81\xc3\xa7\xcb\x03f\
-\x87\xa0m\xf8\xf0\xe1\x04v\xfaY\xb9\xa6\x8fvZ\xe8\
-SL\x9b)\xe2\xa5\xfc\xc8F\x15\x02I\xee\xaeH\x91\
-k15\xd0<\x96.k\xb8W\xaf^\x93'O~\
-\xed\xb5\xd7>\xfa\xe8\xa3\x9f\xfd\xecg\x9f}\xf6\x19\xc2\
-\xcb/\xbf<e\xca\x14bSzD\xa8\xaau\xce-\
-\x042w\xb1\x0e\xfa\x1a\x1d\xd2\x08\xd3\x98%H\x99\x0f\
-o\x94\x07o\xd4\x08\x18+\xaeT\x85\xc0\x8c0/\x9c\
-\xd6\x5cy\xaa\xbe}\xfbvmm\xed\xe6\xcd\x9b\xbf\xfe\
-\xfa\xeb\xdd\xbbw_\xbf~\xfd\x99:\xc5+49\xb8\
-\xd6\xad[\xb7._\xbe\xcc\x15\x07\xc3\x9d@\x1e\x18\x91\
-\xaca\x87\x0c$\x18$\xcdF\xf6Z\x0e\x86\x94\x11\xd4\
-\xa1\xcf\xc8P\x83W\xb5w\xe8)k\x99Q2\x01\xa5\
-\x86H[\x10W!\xa5J\x15\x83\xec\xd3\xf8\xecr\x82\
-V\xb1E#\x84\xde\xa2^K)\x94\xe5\x13\xb9d\x9a\
-\xc2\xb9e\x02\xe7Qg\x07\xe7\x94&\x97\x11\x90\xe0\xfa\
-]g\xba%\x83%%\x08e\x01\xa5\xa4\xd1\x08@\xb2\
-\x14\x1d2\xd3-\x04I\x197\x98\xd2\x82Q\xe0\x96\xd6\
-,\xae^\x9b\x07\xb5/\xdd\xcaz\x0bFPCSu\
-\xb8\xe5)\xdc\xd9(\x97\x0e\x86xm\x9b\x82\xc7\x15\xd0\
->h\xbd@\x8ez*d\x90FY\xb2\xc9\x87\xea\x8c\
-@o5\x14\x86\x85D\x88\xd9\xaf_\xbf\x11#F\xcc\
-\x981c\xe5\xca\x95o\xbf\xfd\xf6O\x7f\xfa\xd3\x0f?\
-\xfc\xf0\xbd\xf7\xde#9i\xd2$BjBU\xc5\xa0\
-\xb8\x1f\xa5\xa2\xbb\x08W_\xd3\xd3|\x95\xd3\x05\xd6/\
-=\xa2_\xc0]8\xb0\xedw\xe7\xbf\xff\xfe\xfb#G\
-\x8e\x10\x98j\xd3\xa9P\xa1\xc1\x10\x80\x12\x89\x1e;v\
-\xec\xfc\xf9\xf3\x8f\x1e=\xc2\xe5XMZJ\x99hq\
-\xe9p\x91\x5c\x12Z2\x06\x9a$\x14}\xc6\x82\xd1\xe4\
-\x87\xb5.\xee\xf7*\x87FC\xc3b(\xab\x914a\
-UM\x02nC\xdf!\xdd\xaa\x02\x1e\xd5\x00g++\
-l\x16\xe8\x88d!\x8d3\xf1H\xa9\x5c\x88\x94J\x82\
-\xc9\x99#c\xca\xb0H#)9\x18\xa5\x11L3\xcb\
-;\xb3\x89!\xc5\xb4\x92J\x0c\xaf\xca\xa2\x09;\xdc\x92\
-\xd4\xdb\xaf\x10\x19\x1b^\x9b\x87z\x0dZ\x0b\x1c\xe3\xd2\
-\xa5K\x87\x0e\x1d:{\xf6\xec\xc3\xdc\x9fHf\xfa,\
-\x98\xcb\x04\x03\xc34v-\x0c\xb7\xc0!M\x96\x90\x89\
-\x0eBx\xfe\xf9\xe7;t\xe8@\xa0I\x0c\xfa\xe6\x9b\
-o~\xfa\xe9\xa7\x1f|\xf0\xc1\x8a\x15+&N\x9cX\
-]]\x8d\x1ez\xf4\xe8\xd1\xa9S'\x1d\x9c\xae]\x85\
->J\x11\xb63\x94\x85\x0ar\xcdD6\x99\xd4k\xd0\
-`\x5c\x87\x12t\x0bf\xed\xce\x9d;\xb5\xb5\xb5\x9b6\
-mZ\xbbv\xed\xfe\xfd\xfbo\xde\xbci\xa3Z\xa1B\
-\x83!*\xbav\xed\xda\x89\x13'\xce\x9c9c\x9f\xef\
-\x02\xb2\xbc\x0b\xd6\x05\xbdrC\x03%C\x22\xa5\xea\x14\
-*\x22\x94\x85's\x95e\xfb\x86n2\xe0,^\xfd\
-^\x07#\xa0GM\xe5\x9a\xd0H\x92\x91\x0d\xf0\xda\x9c\
-\xde'Z\x15\x9aa\xfb6\xc9\xc4-r\x0e`\x82!\
-\x9b\xb6\x0e{8\x07\xee\xe3\xdc\x9f\x9b\xf1Z\x87\xba\x0f\
-\xc8\xealf\x97-KHY\x0c%\x19\x17\xa0\xe4`\
-\x14\xb8\xb7b\x8bb\x1a!\x1b]\xfd\x90\x14\xb7/P\
-\x04\xc2\xbbH#\xb9\x1d\x10\x0eE\xe11\x91%\xf8t\
-\x8eLe\xeb\xc22x\xf0\xe0\xc1\xd5\xabWo\xe5\xfe\
-R\x17\xa8\x9d\xb4\xd4\xffS_\x7fC4\xe9\x99x\x0b\
-G\xbd5\x13Vv\xed\xda\xb5_\xbf~\x84\x9b\x83\x06\
-\x0d\x1a9r$\x91\xe8+\xaf\xbc\xf2\xb6c\xf9\xf2\xe5\
-\x13&L\xa8\xaa\xaa\x22\x00%N\xd5O\xf9\xe9\x0bP\
-\xa1\xee\xa5\x9a\xcd!\x93\xfb9M\xd4\x12@\x93V\x82\
-\x8a\x84H\xa9\x5cCY\x10%\x85\x94\x8dD\xf5\xa8B\
-\x9d^\x87\x0f\x1f\xfe\xfe\xfb\xef\xd7\xaf_\xaf\xdf\x9d\xa7\
-\xe3\xb2\xacP\xa1\x91\xe8\x13 \x1c\x93\xeeG&\x09>\
-\xa3hl\xd1\xe5[YiJ\xb5o7\x10\xf1\x9f<\
-y\x92U\xcc3\x80\x85\xfe\x867j\x1c\xbe\xae\x1cR\
-F\xe3\xdc\x8a\xc3Np\xc2\x06\xae\xf7\x08$\xad\x85&\
-\x844\xac\x9de\xe8T\xcc\xf5#\x87\xbd(L\xe6&\
-@f\x86u\x01\xa1pw\xf2\xe5\x86\xd5\x16\xae\xa1H\
-\x1a\x18\x8c2\xcd\xb6A4!\xea\x9b\xf5\x10t(\xca\
-\xbd^p +\xab\xccq3\x95\xe0\xd3u\xc9\xa7\x17\
-\xc5\x0c\xac\xd5P\xb8\xaaV\xc1Eq\xc9\xc4\xd16\xc9\
-\x82\xa4\x90Ya\x18\x84\xc2\xe3 \x03\x08\xbdQ72\
-\x03\xf4\xecJ\xfaB\x86Y\xb3f\xbd\xf1\xc6\x1b\x1f~\
-\xf8\xe1'\x8ew\xdeyg\xd1\xa2Ec\xc6\x8c!\xab\
-G\x8f\x1e\x1d;v\xc4\xc7@\xef\x12TP\x1ad\xd5\
-F\xcb\xad\x17\xba\x85PV\xa4\x0c\x09s%;2\xe6\
-.\xd48\x9b\xec:\xf3\xe9\xd3X%&H\xd6\x034\
-[\xd8\x9d;w\x8e\x1e=J\x18\xfa\xcd7\xdf\x1c8\
-p\xa0\xf2N\xb4B\xd3\xc2:b\xdf\xe6\x8a\xd7\xb1\x94\
-2_d\x98g\x0a\xcb\xd5J\xe4*L)!\x1f\x89\
-\xa3\xe7\xf0\xaag\x03V\xae\x82\xd1#G\x8e\x5c\xbe|\
-\x99\x07\x00\xc5\xa3>\xbb\xd9\xd0\xec\x18^\xdb\x1apw\
-\x1cL\xa1\x02\x9e\x03>\xc3\x11\x0e\x855U\x02H\xdf\
-F\xa1k\xcc\xb5M7Wm\xef\xe1f\x8eR\xb9\xa2\
-@\xafe\x09J\xa6\xcd\x94K\xe5 \xd9g4\x82\xd2\
-\x82Qk=\xf7\x8e\xfa\x19\xa2\x96\x95\xda\xbe\xb0\x14W\
-\x09\xba\x1dWb\x82\xce\x9d;\xd7\xf9\xfb\x8aeOf\
-;\xd55\xc3k\x8b\xc3\x97\xa9\x8b\xb2\xb8Wz\xed\xb5\
-\x0aj\x12W<\x84\x88\x07\x10\xd0p\xa6\xd0<\x8d\x89\
-kxBR\xa0 \xd8\x17Fu\x82\x8c\xd9\x898\xf6\
-te?\xc2a\x06\x0c\x180j\xd4\xa89s\xe6\xbc\
-\xfa\xea\xab\xef\xbd\xf7\x1e\xc1\xe8\x07\x1f|\xf0\xee\xbb\xef\
-._\xbe|\xec\xd8\xb1\xf6;\xf2\x1a:\x9a\x0arl\
-\xd5I\x92.\xf8\xe6\xe6@\x1f\x92\xd6\x14\x87/\xa5:\
-!\x94A\xb9\xf9\xf0F\xc5\xdd\xda\x9b:H&\x8e\xf2\
-/\xffB\xbfn\xdc\xb8\xa1\xdf\x9d\x87\x9a\x9a\x9a\xca7\
-\xdbWhrp\xb3\x87\x0f\x1f\xf2\xccC\x9c\xf4\xe4\xc9\
-\x134\xde\x11s\xae+\xc1\x92\xc2\xad\xe9\xa7\x84\x1a\x19\
-\x80\xab#\xc1\xa7\x03\xa4\xc4\x18?\x8fJ\xb5o\xd8\xbb\
-X\xc5\x17/^d\xc0\x19\x04u\xdf\xe7=3d>\
-\xf0d\x12\xd98o*\x84\xb7s$^U6c\xcb\
-\xbc\xdbQ\x0b4Ua\xa2\xe442\x13^\x95SJ\
-\x90F\x90TO\xd3\xfd5\x83\xc6\xd3\x90\xd8\x85\x06%\
-GYj\xb2I\x9a\xc6\xda\x17*%\x8bH\xa3\xa4J\
-YYFS\x03\xca\xbd\x08F_z\xe9\xa5\xaa\xaa\xaa\
-\x8e\x1d;\x9a}9\xa3~i\x94\x84\xcf\x08\xa6\xd9\xa7\
-K\xc1\x97\xac\x0bz\xea\xd7\x9b<\xee(\xcb\xd6\x82\xf6\
-(\x9eS\xdb\x04\x1aSz;G\x94,L8\x86\x11\
-\xd4C.}g\x10x\x5c\xc1Uz\xf4\xe81p\xe0\
-\xc0\x193f\xbc\xf6\xdak\xc4\xa0o\xbe\xf9\xe6\xa2E\
-\x8b\x88>\x87\x0c\x192x\xf0\xe0\xfe\xfd\xfb+\x0c\xb5\
-mK\x95#+\xa9j\x01\x19\x0dB\xd8T3@)\
-\x94\x0cIj\xacKZO2,\x1b\xd5#\x83\x06\xe3\
-\xda\x95`s!\x81+\xdb\x16ph\x1d=zt\xe3\
-\xc6\x8d\xfa\x9ch\xe5\xa7\xf3\x15\x9a\x83\xfb\xf7\xef_\xb9\
-r\xe5\xd2\xa5Kw\xef\xde\xcd\xfcL\x9b\x81sj]\
-D\x90\xa5k\xbd`F%\x12\x04\x0b\xbc\x1cv\xc5\x16\
-\xc3\x168\xfbm8\x14\xca-\x12\x15\x14\xa1\x9c\x89*\
-\xd7\xb5^\xe3\x16\x80\x8e\xe3f\x10v_\x0e Y8\
-\xdb\x84(I\xa9\x08\x9f\xe1\xf0\xaa2\xe8f\x84z\x01\
-\xc8j^r\x92\xe5\xce\xb2b\xda,\x1b\x08eP.\
-\xa8\xaaL\xccL\xe3\xdc0\x1a^\xd2u<\xa3q\xd2\
-\x83\x92agB\xa4\xcf\x97k`\x00.\x92\xa9\xf3\xbe\
-\xaa\x9c\x09\xdb\x8c`\x1a\xe56\x06\xd5\x03>\xed\x90\x86\
- \xacK\x97.\xfaqsc\x1c\xa2\xf1\xa8=\x82\xa4\
-[\x11\xf1sK\x887uxU\x1e\xcc@\xc6\x11\xe8\
-\xb9\xd1\x0b/\xbc\xc0\x13\xcb\xc8\x91#'L\x980{\
-\xf6\xec\x95+W\xea\x0f&\xcd\x9b7O\x7f\xc1K\x9f\
-\x0a\xc5\x8c\x11+\xa6a\x89+\x17t9\x99\xf9D\x0a\
-\x15\x87P6d#\xa2$\xa4\xabM\x97*\x8cj\xb0\
-R\xac\xa0\x1f\x7f\xfc\x91m\x9a\xf8\xe0\xf2\xe5\xcb\x87\x0e\
-\x1dZ\xb7n\x1d\xc1\xe8\xe1\xc3\x87+\xefD+4\x13\
-8\xe1\x83\x07\x0fx\xd4!\x18\xb5-\xb1\x00rWa\
-\x1a\x09\x85\x09\xcd\xb8\x0bI}k\xdb\x80\x01\x03x:\
-\xf5\x19\xcf\x06t\xdf\xc6\xb9\xc8\xd1+\x1e*\x0c\xd1\x8d\
-t%\xe9LZ\x0d\x9aA \x8e\xbf\xb1\xcb\x85\x1b\x1a\
-z\xb5V\xc9P6l\xc4\xda(\xea\x14\xf8t\x8e\xb4\
-\xa6\xc1\xe4\xab\xbcIn\xd1\xf0\xa8\x85\x99\xcb\x9c\xbcb\
-fT6v\x95\x10!\xa5\xc2\x05\xe4'O\x9e\xdc\xb9\
-s\x87'\xec\xc2\x7fz\xb5\xd5\xa1m\x1c\xf9\xb4\xd6~\
-\xb5M\xfb\xaf\x90\x0d=2L#\xa1\x00aq]\x05\
-C\xa4\x9fJ\xeb\xcfW\xf6\xeb\xd7\x8fxT\x96\xad\x8b\
-5\xcf\xf0\x19\x01\x1a\x16\xe1U%\x12\x16\xe4\x16\x9d;\
-w\x1e2d\xc8\x82\x05\x0b\xdep,Y\xb2d\xd2\xa4\
-I\x84\xa1}\xfb\xf6%\x8b\xc3)z\x15Z/\xaa?\
-\xb2O\xb7\xb6\xc8\xf6c\x16\x82&j\x86\xcfpxU\
-#P\xe5T\x85\x13\x02\x9e\xa9\xd7T\xe7\xcf\x9f?x\
-\xf0\xe0w\xdf}\xb7v\xedZ}N\x94\x5c\x15\xa9P\
-\xa1\xc9a\x1bdK\x94\x8fe\xee\x03\x0d\xc3-\xca\xa7\
-D\xab\x06\x0d\x8f\x9d\xfd\xfb\xf7\x1f6l\x18!)I\
-\x9f\xf1\xac\xa2\xf1\x11JJ_\x98\xc2\xe3\x16V\x92\xcc\
-\x81\xdb\xf0\x0b\x17iVh\x0f'\xef\xf5\xeb\xd7o\xdc\
-\xb8\xc1\xf9\xeb\xb59\xc2\xe6%m\xcdm\x8f\xd6\x0b\x13\
-\xda\x22\xd6\x11\xf5\xcb Y\xcc\xa4\x84\x06\xc8\x06I\xd5\
-,\xa4Q\x96\xaa\xd5\x15\x5c\xd1\x86\xd3\xc0}\x816y\
-\xa9\x14\xd4\x19\x90l\xd7\x02\x98\x01\xe7(Nv\xfb\xf6\
-m{\xfd^\xb6\xd0\xc2\xcb\x97/\x9f>}\x9aS\xff\
-\xd1\xa3G\xb4\x9c\x06\xd7\xdbf\x9b\xcb\xc2\x93\xaa\xdcd\
-\xe6s\xe0\x0a@\x8cE\x0c\xfa\xd2K/\x11r\x11\x98\
-\xca\xb8U\xd0\xcf\xc5\xb8\xaay^\xeb\x88\x92\xe91\xd1\
-@E\xf8\xbc\x80\xa8\x1e@\xc3 \xe8g\xf4}\xfa\xf4\
-\x99:u\xea\xd2\xa5K\x09IG\x8c\x18\xd1\xad[7\
-\xfd\x82\xbc\x9a\x84q\xbaN\xdd(\xc2\xe7\x05\xa4\xef\x1b\
-\x92Y$\x8d*\x17^U_\xcd\xe4\x0a\x9f\xae\x8b\xaf\
-\xcb\xe1U\x0e_\xc6\x81\x13\x12\x10\xb0A\xd7\xd4\xd4l\
-\xda\xb4\xe9\xef\x7f\xff\xfb_\xff\xfaW}\x9f(\x91(\
-Y\xbeL\x85\x0a\xcd\x86\xf9g\xe4\xa8\x86|\xd5'\x1c\
-Q\xb2\x18\xdc:x\xfa\x1aL{#W\xe5V(\x06\
-\x8d\x9e\x91\x1c0\xb9\x80\x03\xbcQ\x16\xca-l\xd3\xac\
-\xf0\xc0s\xef\xde\xbd\x8b\x17/\xf2\xbc}\xf7\xee]\xf6\
-=\x94\xe6\x0f@\xd2\x04!\x87\x01\x9fn\x9b\xa8\x0b\x0a\
-6\xa2\x0e\x824\x11>\xcf\x11%A6\xe0\xd3\x01>\
-#\x874\xcaj\x0c\xa5-Q\xfa\xe9\xa5\xbar\xbdX\
-\xa3\xd3\xe4\xab'\xb4g\x88q2\x8e\xcc\x1f\xdd\xdf\x7f\
-\xf2\xda\xb2\x84\xee\x104\x9f;w\xee\xd0\xa1C\xc4\xa3\
-\xfaj\xbd\xb0\xcd\x1a\x0a\xa1\xa4\xf4`\xca\xc2\xc8\xcc\x90\
-R\xfb\x05\xf7z\x92\xfa\xba\xe3\x96\x84\xf6(\x18\xb5\x80\
-\x98\x01\xc97\xc5\x11\xb24\xbc6\x0b\xee\xa2\xfe\xa6y\
-\xe1\x85\x17\x08\xc7{\xf6\xec\xd9\xaf_\xbf\xaa\xaa\xaa.\
-]\xba\x10\xa3\xeb'\xf2\xbe\xb0\xc3\x8d\x9c\x7f\xa4\xf3\xaa\
-\xba\x0dPR\xfa\x10\x15\x04\x9fn\x10v\x0b\xc9vm\
-\x0e\xa8Y\xcb\xc7>!\xfa\xe5\x97_~\xfe\xf9\xe7k\
-\xd7\xae=|\xf80Owdy\xd3\x0a\x15\x9a\x0dy\
-8\xaeh\xaen\x8bHB\x984\xa4i\x00r\xfb\xc7\
-\x8f\x1f_\xb9r\x85}\x98\xc7\xb0\xe6[bm\x14\x1b\
-\xe1h\x9c\xa5\x07\xb7\xa1\xc6\xf8\xbc\xac\xa9\xc9T\xb60\
-\xecf\xf7\xef\xdf\xbf\xe4@ f`\xde\xc3\x86\xb9\xb6\
-'\xf8t}\x14o\xd9\xba05\x1c\xbb\xee7q\xfd\
-\xd7\x0dY7\x19\x81L\xe7\x97\x81\xf0\xaa\x9c1\xf8t\
-\x16\xbe\x8c+\x15\x09\xe0L\x1aB\xc9\xcf\x8b\xbe\xa5\xae\
-\xad^\xaa\x8b\xcc\xa01\xcd\x12\xd67\xaa\xd5\x81\x1a\xee\
-ee\x0b\xed\xbcu\xeb\x16Of\xd7\xae]\xd3{\x5c\
-\xebH&\x05\xb2\xeaE\xa3\xa1\xfa\x19\x9cG\x8f\x1e=\
-x\xf0\xa0\xd5\xc3\x0b\xedY\x084O-\x0c\x91\x12|\
-:\x0f\xf9\x0cT\xb3\xebq\xb2]\xea\xb5\x87d\x81F\
-\x01\xb1\x04)UV\xa8,X\x92kt7\xdd=l\
-\x83\x8a\x80O7\x8e\xa4\xff\x0e\xc9v\xf5\xf7p$v\
-\x0eg\x98\xe0\xd3E\x10\xd6\xc0\xf3\x09\x87\xf1\x91#G\
-6m\xda\xb4~\xfd\xfa\xad[\xb7\x1e<x\xf0\xcc\x99\
-3w\xee\xdc\xa9D\xa2\x15Z\x12\xb9\xa5\xf0\xaa\x80L\
-e\xa9\xa8\x12\xad\x17<\xff\xea\xd5\xab\xe7\xce\x9d\xc3\xd5\
-\x95\xfb,\xe3F\xddcIm\x8f!\xd2\x0b\xaf\xaa\x8b\
-\xcf\xab;Y\x96d\xd8[\xfd\x98V#\x9d\x0b$H\
-\x1958\x93\xccNq\x8d\xf4Vg\x99@\x7f;u\
-\xea\xd4\xbbw\xef\x1e=zv\xe8\xe0\xbfn(js\
-1\x84\xfd\xaa\xb7\x8fnTJ\xbeE\x01\x1a\xf8\xc3\x8b\
-d\x86K\x9f\x8f\xb0\xe9&\xd7\xdb\x9f\xa4\xc7\x0e\x9fn\
-\x0bp\xc6\x13\x86\x82\x0e{\xdf\x81,d\xdf\x184\x17\
-T\x85G\x22\xb4\xeeF\xa0\x06\xfc\x98\xfbs\xa0h\xd4\
-M!\x03\xe1\xccc|\x9eCI\xe9#T[\xb8-\
-\x82\xb2T\x84\xac\xe7\xdc\x17<\x91\xa4=`Y\x06I\
-ir\xfa\xe4_\xa7\xcb{S\x13\x84\x92\x0dF\xf7\x02\
-\xc9\x5c\x9b\xa4ZA\x85\xea8\xe71\x8fF555\
-\x84\xa1k\xd7\xae\xdd\xbbw\xef\xe5\xcb\x97\xf5%;\xba\
-i\x85\x0a-\x809v\xe8\xe1\xce\xdf\x93\xa4\x04\xa1\xac\
-bH\x16O\x80\x15\x97\x80\xe6\x9f\xff\xfc'\x9b\xb0\xbe\
-\x09\x5cE\x9eA\x18\x07/\xe5`p\xb4y\xda\x16\x1a\
-\xee\xa5\xa1\xec\x0b\x04\x13Dnh\x10\x82\x99\x9b\x87\x04\
-\x95j\x15\x9e\x7f\xfe\xf9\xbe}\xfb\x0e\x180\xa0K\x97\
-.j\xaa\x9ad\x8d\x84\xb0\x85\xa1\x1e\x94\x0c\xf1\x19e\
-\xcc\x0b/\xbc\xd0\xaf_\xbf\xb1c\xc7\x8e\x18\x91\xfc\x92\
-\xae~,\xa9^\xcb\xa0\x98^\x84c\x12\x92\xafld\
-\xef\x86*\xc1\xa7K\xa7\x81\xc1\xa8p\x9d\xcd\xebv\xca\
-5\xa4\x8c\x9a[o\xd3\xad\xac\x04\x90\xbe\xad\xa0\xfe\x1a\
-^[\x97\xe2;U`\x04Xu/\xbe\xf8bOG\
-\x87\x0e\x1dH\xfa\x8c\x16\x870\x94@\xc7v\x7f\xdfs\
-\x874i\x94\xa5\xde\x09\xe9\x85\xcaf\x92\xee\xa6\xe9\xb9\
-J\xa3\xda\xa4\x97\xc6 Kqj.\xab\xd0DD\xad\
-\x82\xa8\xc20\x99\xf4\xa1.>\xa3.>/\xd5_/\
-e\xd5\x93\xc6\x9b\x06\xa0\xd4,\xe8\xd7\x95\xec\x9bD\x0f\
-\x1e<x\xf5\xea\xd5g\xf9`\xae\xd0\xba\xc83\x9d\xdb\
->\xc5\xb2L.\x9e\xb0\x94\x84h\xf9\xb0\xc0\x9dI\xc9\
-5\xb7Q\xd4}\xae\xe18\x18\xd2\x0bm\x92\xbaJ\x10\
-J\xfa\x02\x01\xa6\x8f\xae\x22\xb1(\x1b8\x0a;u\xea\
-DT\xaa\xee\xa01\x070g\x90\x00\xd2\xab\x17\x99\xc8\
-Xf\xe5\x89\x82\xd11c\xc6\x0c\x192\xa4k\xd7\xae\
-\x04\xa34;\xec\x9a\x84|\xb8a(\xd4A7\x0cO\
-\xf1\xda\xa6\xa6!!\x8b\x9a\x0e>]\x10o\xea\xf0\xaa\
-\x80Le\x1a\xcc\xb4\xa7\xf8t\xd9\xc3\x84\xd9\xaa\x06\xaf\
-\xcdB\x9d\xe2\x9aF\x06\xe0\xd39\x8d\x04_\xb5\xc3\xed\
-!\xff\xc2\x83\xe0\xd0\xa1Cy<\xaa\xaa\xaa\xc2;e\
-\xdc\xf2\xd0<\x9b,\xda&eNp\xcdu\xb8d=\
-\xe8\xe7\xec\x18\xab\x83F\x81\xe2\xae\xee$7l@x\
-\x156\x98!II\x87O\xd7-\x92\x89\x19\xe4\xb3\xe4\
-FB\xc9\xa4\xf6\x00\xf5\x05\x94\xebMs\xe4\xf3y\xcb\
-\xb2\x5ci\x04\xb1\xe6\xa3G\x8fn\xdd\xbaE\x18z\xe6\
-\xcc\x99}\xfb\xf6}\xef8r\xe4H\xe5\x13\xa2\x15\xca\
-\x04s\xdd\x10\xe7\xd1%\xe8\x8d\xc2\xb9\xed\x15v\x0f\xed\
-\x90!\x04\x22l\xfeDc\x5c\xb5\xb7\xb8-\x13\x92\x5c\
-/\x06gS\x01\xfcm\xea\x22}x\x85h\xfc\xf3\x95\
-m\x19x\x08\xbfp\xe1\x02[\x9f\xfd\x02\x13\xed\x01\x1a\
-I2\xf1$\x87\x8c\xdb\x07Lh\xc7\x8e\x1d\xbbw\xef\
-N\x0c\xa0\xd7\xa2\xa0^\x83\xefp\xaa\xcbRjL\xbc\
-\xaaUi\xb2\xf7g\xf4\xd9K\x05\xd1\xe8\x80O\xa7\xd0\
-\xb8\xb8QJ\x90\x12{\xad\x1f%\xdb\x04\xd6x\x88Z\
-\xae\xae\x09\xaf\xaa\x8fL\xcbd\x1c\x03:t\xe80p\
-\xe0\xc0\xd1\xa3G\xf3\x90\xc4f\xe4\x8dZ\x0f\x9a$\xc1\
-z\x8aBM\x8dpYu`\xba\xc3\xad3\xc4[\xe4\
-*\xf7\x89\x1cRr;[c\x141\xa5\x04#,\x22\
-9DzHZ\x9f\xc2\x1b\xe5\xf6z\x04o\x9d\x07\x8a\
-x)\xeb^\xe0\xf3\xf2[\x92tw\xf6\x9d\xb2\x9b\xd2\
-SBL}\x81\xe8\x83\x07\x0fn\xde\xbcy\xf6\xec\xd9\
-\xfd\xfb\xf7\xaf_\xbf~\x8dC\xdf$z\xe3\xc6\x8d\xca\
-;\xd1\x0a\xad\x82\x1cU\x84\xb20\xaf.\x8c\xccB|\
-F]\xa4\x97\x01H\xd9\xce`\x0c\xd9\xe1\xbbv\xed\xda\
-\xbbw\xef\xbe\x01\xec\xfc\xfd\xfb\xf7\x1f<xpuu\
-\xb5~\x5c\xab\x8d\x02\xc2\xdd\x94\xe2\xe1,(Y\x18o\
-\xeaPRz\x90\xd2F[\x1a\xd3\xb7<\xec\x84\x17/\
-^d\x0f\xbcs\xe7N\xf8\x03:\xae\x05\xfc!\xe9I\
-\xaa\xcd\xd6\xa9\x88\xb4e\xebB{\x98V\x9d\x98\xd6\xb6\
-\x02\x9d5\x22\x9b\xb0_\xc8i|^\x0e7<\xbe\x06\
-\xc9\xa0d\x03h`0\x9a\xd9\xb2L\x8a4\x0bQ\x7f\
-\xd41@\xd6\xed\xc2\x81.sh6\xf1\x01+\x01A\
-m\xb6\x96\xabG\x8d!\xdf 0>\xfa\xcbC\x9d;\
-wF\xf6\xda\xd6C=\xe5\x1a\xa2\xac4t\x8a\xb5\xa4\
-_\xc3\x87\xe4)>\xf7\xe5P\xe0\x8d\x1aD\xe6M}\
-\xbd)\x94kM\xcd,+d\x03>\x9d\xab3\x94\x01\
-\xd9\xcc\xf4\x8f\x94\x96\xabk&\x96\xe5*\xc8h\x89\xc2\
-\xd0'O\x9e\xdc\xbbw\x8fXS_ Z[[\xbb\
-}\xfb\xf6\xaf\xbe\xfa\xea\x0f\x8eo\xbf\xfd\xf6\xc8\x91#\
-\xb7n\xdd\xaa\xbc\x13\xad\xd0\x8a\x84\xce\x1c&E\xe4\xe1\
-Jf\xe2-rP\x8fPR\x06\xb2\x04)\xdb.\x8a\
-0\x22\xd8\x1e\xd9\xe1\x07\x0c\x180e\xca\x94\xc5\x8b\x17\
-\xafX\xb1b\xe5\xca\x95/\xbf\xfc\xf2+9^}\xf5\
-\xd5y\xf3\xe6\x0d\x1c8P\xaf$\x9aj\x1c4\xa4\xc2\
-\x0fz\x807rD\xc9\x16\x86\xe6\xf1X\xfe\xf0\xe1C\
-\xa2R\xb5\xd6g\xe4i\x98l\x84W\xb5M\xac\xfd\xea\
-\xa6z\x04\xc9\xf48\x94\x9b\x0f\x19\xc8\x12\xa4L\xe3+\
-uD\x9a\xc2\x05\xeb\xa5Q!K\x91\xf7.\xb2}t\
-FW!%(Yd%e\x02Q\x02\x91(\xc7\x7f\
-\xd8\x91&$\x1c\x8dd\x0e\x1c\xc8\xdcT\xbf<\xa4\xac\
-VGs\xe7\x139|s\xeb\x12m\xbbz\xf0\x80|\
-\xf6B\x156\x09\xaa-\xac\xb3\xc8\xb9\x8b\xcc\x5c\xbb2\
-\x1a\xe6\xcd\xdcU6\x22Q:\x92\x91r\xf8t\xae1\
-\xa6!\xa9g\x0cy\x17\x1b\xae>\x15z\xf5\xea\xd5\x9a\
-\x9a\x1a\x02\xd0u\xeb\xd6}\xed \x00E\xde\xb6m\xdb\
-\xfe\xfd\xfbO\x9f>]\xf9\xe9|\x85V\xc7\xdcX\x82\
-\xf3\xfd\x8ceb$+!E\xa8\x97Y\x88\xcf\x08n\
-dr\x9b\x83\xc1\xd1\xbb\xcf^\xbdz\xf5vT9\xfa\
-\xf4\xe9C\x949r\xe4\xc8\xb9s\xe7\xae^\xbd\xfa\xc3\
-\x0f?\xfc\xe4\x93O>u \xc0G\x1f}\xf4\xf6\xdb\
-o\x13\x8c\x12\xadRC\xe1An0\xaa6\x99\xc2\xd4\
-\x8f\x86\xa4\x94\xdc\x8a\xe8A\x9d\xab\x92\xe6\x08\xf9\x9a\xd7\
-v]\x05h\xbcN\x04N\x7f\xbal}\x09\x854\xe8\
-5\x1aBIg^,\xaaD\x82d\xceni\x1a@\
-\x03\x83QkD\x1a5\x0b|\xda\xa1\xde\x82O\x07x\
-kg\xafk>\xf2\xd5P\x9e\xc8'\x0a\xf7\xa8x\xd4\
-wC\x1aUnw\xe1\x8ew\xef\xde\xbdv\xed\x9a\xbe\
-\xdc4)Vf\xd0f\xed\x5c\x11\x16}\xcaF\xa8H\
-\xf3\xa1q\x13\xd2\x14yS_\xc6a\x1a\x09\xc5 \xe3\
-\x02}\xc4 t\x1e\x99)\xc9\x8e\x03\xec8z\x15\xaa\
-\xaf\xad9p\xe0\x00\xa1\xe7\x9f\xff\xfc\xe7\xdf\xfd\xeew\
-\xbf\xff\xfd\xef\xff\xf2\x97\xbfl\xdc\xb8\xb1\xb6\xb6\x16\x83\
-\x87\x0f\x1f\x12\xb0\xda\x8e\x5c\xa1Bk\x81\xf7\xca\xab\x0b\
-x~\x84syO\xa81Y\x82P\xd2\xe5{H\x16\
-y\xa3\xd6\x85Fj\x1b4\xd8\x0f;u\xea4h\xd0\
-\xa0\xe9\xd3\xa7/^\xbcx\xf9\xf2\xe5+r\xe8%\xe8\
-k\xaf\xbd\xf6\xca+\xaf\x905k\xd6\xaci\xd3\xa6M\
-\x9d:u\xca\x94)\x93'O\x9e4i\xd2\xc4\x89\x13\
-\xc7\x8c\x19C$\xaa_c\x85f\x1a\x84d\x16sX\
-\x12\xc1\x06\xbf\x15Q\x1b\xe4o.\x99\x5c\xf8\xdf\x1a\xd9\
-\xce\xa0\xa7\x8f\x1e=\xbas\xe7\xce\xfd\xfb\xf7\x15\x8f\xa2\
-\xb4\x9ej\x10\xea%=2n\x14\xeb\xe03\xb2pC\
-\x9b<A\xf9t\xe9\x94\x16\x8c\xfa\x169\xbc*?\xc5\
-\xd8\x08U(\xbc\xaa.>\xaf\xe8\x0a[\x9d\xe6k\xaa\
-<FW\x83\xdb\xe1\x7f\x04\xa0\x04\x1f\x84)\xfa\xb3O\
->\xaflp\xbe\x9a\x1d\x8cF\xddi<\xba\x97Od\
-\xa1\x09J\x5c\xca\xa1m\x0b\x94\x1b\x22}\x1dP\xfa\xcc\
-\x8c\x89\xce\x99\x14E\xbev\xa2\xa4\x12k\x15 \xb3\xcb\
-\xe8U\xe8\xa5K\x97\x0e\x1f>\xbcu\xeb\xd6\xef\xbe\xfb\
-\xee\xeb\xaf\xbf^\xb3f\xcd\xb7\xdf~\xbba\xc3\x86\xed\
-\xdb\xb7\xef\xdd\xbb\xb7\xa6\xa6\xe6\xc2\x85\x0b\xfa;\xe0\xbe\
-\xba\x0a\x15Z\x15\xef\xc4A$\x8a\xac\xac\xc2\xa8T\x88\
-\x94\xca\x8d\x90\x81\xb0\x1b\x9594\xf2\x85\x17^\xd0\xc7\
-\xabD\xcf\x9e=\xfb\xf6\xed;b\xc4\x889s\xe6\xac\
-^\xbd\xfa\x83\x0f>\xd0+O\xbd\xfe\xfc\xf8\xe3\x8f\xd1\
-\xbc\xf1\xc6\x1bs\xe7\xce\x1d>|8\xc6\x94\xed\x12\xd0\
-\xb9sg\x02Y\xeal\xcc;\xaa\x22a\x9c\xbd\x94\x03\
-\x0d;\x95\xf0\xaa\x16G\xadJ\x9c \xd7\xbc\xc8\x11\xda\
-\x8ao\x14\x0f=\xd5K\x0a@`\xf0\xd1X7\xddH\
-$\xc8\xd8\x08\x95\x92A\xc9R\xd1\xbd\x9e\x7f\xfey\xbc\
-\xd1\xabJ\xa7\xe47\xa34W\xaeVL\xbb\xd36\x1a\
-\x9d4\xc90\xe4\x8c\xd36d\xe9\x8ef\xd3&\xc8l\
-m\xbe\x11(\x9e\xcc\x1a48\x04v\xfa\xc0e\xe3\xef\
-\xd2\xb4\xd0\x1e\x11\xca\x11\xb2lB|\xbd\x01\xd2k^\
-4b!\xca\xf5\xa6\x0eiB\x123\xf7\x9f\xd9\xd7\x8b\
-\xaf+\xa8\xcd\x95.T\x5c\x06\x06\xfb\xcb\x83\x07\x0fn\
-\xdc\xb8q\xf9\xf2\xe5\x13'N\xec\xd8\xb1\x83\x00\xf4\x0f\
-\x7f\xf8\xc3\xaf\x7f\xfd\xeb\xff\xfa\xaf\xff\x22\x1e\xdd\xb7o\
-\xdf\xc5\x8b\x17y2\xc6\x8cG\x11\xb6$J\xf9\xba*\
-T(3\xe4\x9c\xa1\x8b\xfa\x15\xe2\x90&\xf1\xfb\xc0\xc0\
-\xe4PY\x18_]3l,\x0d\xc67(\x07\xdb5\
-\xb1\xe3\x90!Cf\xcd\x9a\xb5d\xc9\x12\xbd\x01\xd5\xbb\
-\xcfU\xabV!\xcc\x9f?\x9f\xac\x193fL\x9f>\
-}\xda\xb4i\xbaN\x9e<y\xf4\xe8\xd1\x03\x06\x0c\xe0\
-\xe0'\xe8d\xc3'\x08\x10\xda\xfc\xf5x/\xfc\x8d\x9b\
-\x01MD2Iug\x84d\x91\xe1As\x13v?\
-=\x14nx\xea\xe03\xda \xcc8\x9e\xd0\xb1cG\
-{\x08q\xd3\x92\xc4\xa32(\x80,}\xa2\x084V\
-\x86\xd7:=\xee\xc7\xd3\x94O\x97N\xc9\xc1(~\xa6\
-\x8fb\xa8\x0f\xe03\xf2\x10\x1a\x84M/\x8c\xeb\xa6\x87\
-\xa4n\x04\xcamCX\xb3\xc3\xc6\xfb\x8e\xe5FC6\
-!\xd2\xa7\x09KE\xa0\xc7\x0b;t\xe8\xc0\xc3\xf1\x8b\
-/\xbe\x88w\xfa\x8c\xb2A\x8d\x87P6d\x93\xa6@\
-VaTm\x04z\x0d\xaf\x8d\xb3\x04\x91\x14C\xa3\x7f\
-\x8a@E\x9e\x16t\x842(Y\x18\xb3\x94\xc0\xfa\xb2\
-g\x5c\xae\xf7\xef\xdf\xbfp\xe1\x02\xe1\xe6\x86\x0d\x1b\xbe\
-\xf9\xe6\x9b\x7f8\x106n\xdc\xf8\xc3\x0f?\x1c8p\
-\xe0\xf4\xe9\xd3\xb7n\xdd\xc2R\x95T\xa8P\x9ehS\
-J\xbfV\xd0\xc2\xccD\x96\x86\xd7:\xbd\x97\xf2\x10\xad\
-\xf7V\x87\xc6\xb09\x13>v\xeb\xd6\xad\xbbCo@\
-G\x8d\x1a\xb5h\xd1\xa2\xb7\xdf~[/>\xf5\x06\xf4\
-\xe3\x8f?~\xeb\xad\xb7\x88DG\x8c\x18\xd1\xabW\xaf\
-\xae]\xbbR\x8a+{\xbb\xde\x83*\xecP\xd0\xe9o\
-\x10\xecx\xea\xb2de5+\xe1\xed\x90\xd9\xbe\x00A\
-\xfa\xd6\xc5\x8d\x80\x1f\x04\xdf\x1e7&jm\x91$\xa5\
-\xca\x1b\x1a\xc9\xa1\xaf\x97\xe2D\x84j\xb3\xa6\xc0\xf5\xa0\
-\xa8.h|T\xaa0\xb2\x17V?\xde\x084@\xfa\
-\x06PB\xc8B#p2\xfd \xf8\xf1\xe3\xc7\xec)\
->\xc3aMT\xe3\x844\x86\xebH\xb1\x0e\x1a\xd6 \
-\x19\x94lCd\xb6YJ\x8d\x06\xb093\x98\x86\xd3\
-\xd4\xd9\xaf\xc3J\xa4\x17\xd2\x90+?\xc0\x0b\xd9\xa7x\
-4\xc1!H*\xb7\xac(0\x83\x05\x06\xaa$(b\
-H\xe3\x07\xcba\x9aH\x00\xb3G\xeb.O\x91\x1aB\
-\xb9^\xd2e\xc3$DI&\x9d\xf5\xc5U\xefA\x89\
-/\xaf_\xbf~\xf5\xeaUbM\x82\xce/\xbe\xf8\xe2\
-?\x1d\x7f\xfa\xd3\x9f\xd6\xaf_\x7f\xe4\xc8\x91\xcb\x97/\
-\xdf\xbd{\x97\xf5\x98^\x8c\x15*\x94\x1b\xac/9\xbc\
-\xb9}\xb2\x1eR\x0b\xc4\xf0\xda\xbad\xeaQj\xc3\xf4\
-\xe9\xba\x9b\x00xm\x0b\xe2o\x9c\x83\xdd\x98hr\xe4\
-\xc8\x91\xf3\xe6\xcd\x0b\x7f\xf3\xfd\xf5\xd7__\xbdz\xf5\
-\xab\xaf\xbe\xbap\xe1\xc2\x993g\xea%\xa8\xbd\xfb\xec\
-\xdf\xbf\xbf\xbd\xfb\xd4\xfbN\xbb\x02\xd5\xfa\x9b\x15=,\
-\x8dD}\x11^\xe5\xb0\xa4\xee\xe8b\xd1\xa7\xbf9\xd4\
-*\xb8^[;\xfd\x08\xa0L\x1a\x16\xfc\xcd\x05\xe9!\
-1-\xe8'\xf5\x1a\xb4.\xb4\x0d\x97x\xde\xfd\x05l\
-5UX\xaeP2\xc4\x0fD*\xe4(\x80\xaf+G\
-\xa4\xc4W\xa5i\x00\xa5\x85,?\xfe\xf8\xe3\xcd\x9b7\
-/]\xba\x94\xf9&\xc67'\x85r\xd5UC\xca\x00\
-\xcc\xbc\xbd\x91h\xeb\x22\xd3\xb6E\xd4\xec(\xe9\x86\xa2\
-\xcehD\x83#\xfb\xa4\xf3Y\xdd\x97\x9e\x1dJ\x9b\x14\
-\x8fGzh\xce4.\x07\x0a4,\xcajL\x17(\
-+|:\x87\x8d\xad\x04o\xe4\x90>\x8d\xb2\x22\x03W\
-\x22\xc1\xa7\x1d^\xe5\x94\xe1\x8d\x0c\x16\xbc\xd6\xbc\xb7\xcb\
-!3\xb2\xd8+\xef\xdf\xbf\x7f\xfe\xfc\xf9\xfd\xfb\xf7o\
-\xda\xb4\xe9\xbb\xef\xbe[\xbbv\xed7\x0e\xfdv\xfc\xbe\
-}\xfb\xf4\x91P\xfd\x8e\x9a\xab\xb5\x8e\xb7T\xa8P\xb6\
-\x94\xe4\xaeZ\x17\xf5\x12U\xa8\x05\x05>\xdd\xe2\xb0\x0f\
-\xeb\xc7S]st\xef\xde\xbdo\xdf\xbec\xc7\x8e]\
-\xb2d\xc9;\xef\xbc\xf3\xf1\xc7\x1f\xdbK\xd0\x8f>\xfa\
-\xe8\x8d7\xde \x00\x1d8p`\x8f\x1e=\xf4\xd2\x94\
-\x22\xc4\xa0\x9d\x82? \xa4\xeeDW\x09!R\x8a\x92\
-\x86\xbaap\x17]\x052w|\xf4\xe8\xd1\x8d\x1b7\
-\xae]\xbb\xc6>\xc6\x06\xe5\x0c[\x87\xd4\xf0<%\x1a\
-\x195^\x82\xc9\x86\x94i|v\xd9@\x93\xe4->\
-]\xb7;N\x88\xfe\xcb\xc0y\x8d\xc7)\xa2\x22\xaa\x12\
-!\x06{\x9d_O\x9e<\xf1\xaa\xd2)\xed\xcd\xe8\xc3\
-\x87\x0f\x89Dkkk9/\xa3\xdf\x92\xb1&\xaa\xb9\
-\x10*\xeb\x05C\xd9\xaa,8\xf5S\xa4I\xeb\xdb\x0a\
-\xaeO\x09>]\x0a\xbe\xa4\xc3\xabR\x90\x85/\xda3\
-\xb4\xd7\x96\x01j\xb6!\x8d\xb2\xd2\xc8FxU\x83\xc8\
-\xad\xa5\xbcD\xf5g\xdc.\xd0(7iSN\xb0\xa4\
-H\x8c\xea\x12*\xb5P\xc3&\x91\x14\xac^@`\x0d\
-?x\xf0\xe0\xee\xdd\xbb\xac\xac\x9d;w\xfe\xe5/\x7f\
-\xf9\xf5\xaf\x7f\xfd\x1f\xff\xf1\x1f\xff\xe7\xff\xfc\x9f\xff\xfa\
-\xaf\xff\x22\x12=~\xfc8\xcf\x81\xc4\xa0\xacA\x9e\x03\
-)\xe2\xeb\xaaP\xa1M\x11\xad\x17\xd6E\xb84\x84l\
-\x92\xa5\x95\xb5\xb8\x0c+hfa\x11\xe5\xa6+o>\
-\xd8~\x89&G\x8d\x1a5w\xee\xdc\xa5K\x97\xdao\
-\xc1\xbf\xe2\xbe\xfbs\xd9\xb2e\xe8\xf5\x01P@\x988\
-q\xe2\x88\x11#z\xf7\xeeM\xfc\xaaO|&\xd4\xfd\
-\xe8\xa7\xaf\xda\x91$\xf5_\x80\xebq\xa2QO%[\
-R\x98\xb2iqwNj\xd6\x95M\xe9\xce\x9d;'\
-O\x9ed\xb3\x22\x1ee\x9brVeA48\x05p\
-}zJZ\x03\xb2,[\xe8\xac@\xb6\xd6\xf2o\xf8\
-\x9f\xd3<\xedH\xbaS\xae\xb8\xff/,%T\xbf\x81\
-&\x19\x97\xff\xf6\xdf\x1a3\xe9\xa5E-\xff\xfc\xe7?\
-\xf1\xb6\x8b\x17/\xe2j\x16\x02\xab\x11&KP\xfb\xec\
-*!\x93\x02Y\x86U\xdb\xe6(\xdc\xf7L\xdcp&\
-\xf8t\x11p\x0b6\x02\xdd\xab\xa4\x82\xcd\x8d5\xc6u\
-\xa8%\x1a\xc6\x08\x98 \x22\xd9\x08\xdb\x96\x91tB\xa4\
-4\xc1\x92\x90\x18\xa5\xccB\xcc\x80+m \xfad\xc5\
-\xb2|\xc4\xc3\x87\x8f\x88A\xcf\x9d;\xb7w\xef\xde\xf5\
-\xeb\xd7\x7f\xfb\xed\xb7z\x0f\xbau\xeb\xd6]\xbbv\xa1\
-<t\xe8\xd0\x85\x0b\x17\xee\xdf\xbf\xaf)V\x9d\x15*\
-\xb49\xd2\xd1\x95[\x94\x1e\xafJ-\xa2d\xf18|\
-\xba.\xbep\xf0\xd98\x13\x9a\x15n\xa1O\xe9\xe9s\
-\x9c\xa07\xa0\xe3\xc6\x8d#\x06\xfd\xe9O\x7f\xfa\xe9\xa7\
-\x9f~\xf6\xd9g?s|\xf8\xe1\x87\x04\xa3S\xa6L\
-\x190`@\xf2\x0b\xf3\x8en\xdd\xbaQ\xaac\xc7\x8e\
-\x0aC\xf5\x06A\x8d7t\xaf\x10T\xa1V}\xf7\x09\
-G\x98T\xae\xf0\xaaf l'\x1b\x1a\x11\xc2\xad[\
-\xb7xff\xa3\xf3\xda\xd6\xa6p\xf7\x8b\x1f\x1c\x9b\x94\
-\xb0\xcbeN\xbe\xdeYG\x84\x94\x90\xf8J\x80\xd7\x06\
-\xf8\x8c\xba(\x8bz\x08\x11%7\x80\xd2\x82Q\xee\xaa\
-\xa3\x14\xe4j\xd6\x0d\xd7\xa3f\x9c\xa1\xe6\xae\xbf\x15Q\
-\xd7\x22|^\x110)\x16\x89\x0a\x9f\xd1\xda\xa8\x17\xa5\
-v\xa7\xf1\xf8Q\x08\xf0\x199\xac=\xd66\xd3\x88(\
-i\x84\xfa\xa4\xa4\xc3\xa7\x83\x89P\xd2g\xe7@C.\
-\xb0v\x1e\xbb\xbf\xdbI|I\x18z\xfb\xf6-\x22\xd1\
-\x1d;v|\xf1\xc5\x17\xfa\xed\xf8\x0d\x1b6\x9c:u\
-\xea\xc6\x8d\x1b\xe4\xde\xbbw\x0fK\xec\xd3\xbd\xa8P\xa1\
--\xa2\xb5P\x0c\xb6p\xf2\x91oi\xa37\xa4oZ\
-\x08\x1c{\xf6\xec9z\xf4\xe89s\xe6,Z\xb4h\
-\xf1\xe2\xc5K\x96,Y\xbat\xe9\xca\x95+_y\xe5\
-\x95e\xcb\x96\xcd\x9f?\x7f\xf6\xec\xd93\x1d3f\xcc\
- \x0c\x1d5jT\x9f>}\x08^_x\xe1\x05\xfb\
-\xb5w]\xad\x9b\xfe\xean\x01\xc5\xb7\xbf\x99\xbaY\x12\
-\x8c\x09}\xe9\xd4\xa9\x13\x119\x10\xa3\xd3;\x9fW\x1e\
-h\x9c\x85\x92\xd2\x83\x06PY\xf9\x90%\x84rY\x91\
-\xcf\x0d\x127\xca\xc2g;\xa2>fb6QYP\
-\x85\xc0\x01\xe7U\xa5\xd3\xf0\x9f\xe7Z\xcb$\xf8\xb6\xe4\
-@\x1f^%\x18\xd2\x14\x8fn\xd4.Q\xd7\xdc\x10f\
- \x9bz1K+e\x9a\xd6\xa5u\x9b\x11z\x9a\x1c\
-\xcfp\xe3\xf4\x14o\x14\xe03\x1c^\xe5Hk\x0c_\
-\xb5\x83\xa4\xcc\x90yl\x13zmp\xe1\xc2\x85\xc3\x87\
-\x0fo\xdb\xb6m\xfd\xfa\xf5\xdf;\xf4\xc1P\xbd\x0d=\
-x\xf0\xe0\xf9\xf3\xe7\x89AY\xd5\xaa\x0a\x5c\xf5\x15*\
-\xb4ml\xe1 x\xcf\xce\xc2l\x22\x01B\xd9,3\
-)\x9c[\x0cDW\x04\x8eDWD\x90!]\xbbv\
-\xed\xdf\xbf\xff\xa4I\x93V\xadZ\xf5\xd1G\x1f}\xf6\
-\xd9g?\xff\xf9\xcf\x7f\xf1\x8b_p\xfd\xf8\xe3\x8f\xf5\
-\x06t\xe0\xc0\x81D\xab=\xdc\x97\x86\xeac\xa0\xd4\x13\
-~\x94\xdfu4\x01M\xd8)%\x85W\xe5\x81\xb2^\
-rD\xc9\x16F\x0d&\x18\xa5\xcb#F\x8c \xf2\xae\
-\xaa\xaa\x22\xe6\xf6\xd9\xe5\x84\x9a\x8a\xe0\x86\xdf\xa3\xac\xf6\
-\x87uM\xddL\xa3\x5c\x0d\x88\xa7\xa0\xe3Y\x914\x1a\
-\xd8\xc6<\x81\x94\x1c\x8cr\xa6F\xbf\xc0\x1b\xf6J\xb2\
-\x90&\x1f\xea\x7f\xbdf K]\xdb\x16\xc5\xf4\x0e\x92\
-9\xacK\xa8\x94M\x01\xbc]0J\xba\xb6\x22Q\x03\
-\x9c;$XRB\xb3\xa2;\x1a\xa6Qn\xe3Qm\
-\xe0\xd3yz\xadW\xa1,\x19\xe2\xcb\xeb\xd7\xaf\x9f<\
-y\x920\xf4\xcb/\xbf\xfc\xcdo~\xf3\xef\xff\xfe\xef\
-\xff\xdf\xff\xf7\xff\xe9S\xa1\x1b7n$\x0b\x83\xbbw\
-\xef\x12\xb3\x86\xd5V\xa8\xd0\x9e\xd02\xd1\xea\x88\x90\x01\
-\xd8R\x92\xc0UH\x99FY\xbaZU&4\x00\x02\
-\xa9\xde\xbd{\x8f\x1b7n\xce\x9c9\xf3\xe6\xcd\x9b\x1f\
-\xb0p\xe1\xc2\xe5\xcb\x97\xbf\xfc\xf2\xcb\x5c\x91\xd1\xcc\x9d\
-;\x17\xb3\xd9\xb3gO\x9d:\x958\xacW\xaf^/\
-\xbe\xf8\x22\xa1'p6\x83~\x04Oc\xd4\xc2\xe89\
-3\xe9X\x10\x9d'\xb7w\xc6\x12\x84l\xc0\xa7\x1d\x91\
-M\x94\x04_&\xff\xb85\x09I\xa3\x1d\xdc\xa8C\x87\
-\x0e\x04\xdf\x84\xe0\xe5\xf0\x8d.Q\x03\xea\x1d\x0a\xdf\x8d\
-<D6J\x96'\xbe\x89\x0dj$\x03\xa4\x81\x02\xaf\
-\xcaQ\xa0B\x86ZE\x1a\xf3\x04\xd2\xc0`\xf4\xd1\xa3\
-G\x08^\xe5(\xdc\xf9\x02Y\x15\x0cM\xa7\xf0\xaa\xe2\
-0\xfb\xf2\x19gy\xa7O8\x9c\x83$\xf8t3P\
-L\xe5\xa1\x8d\x1b\xe9\x04\x9f\x0e\xf0\x199L\xa3\xdc\x10\
-\xd7\xa7\x04\xce\x18\xf8g\x0e\xfd8^\x9f\xb1>r\xe4\
-\xc8\x8e\x1d;\x888\xed\xb7\xe3\xbf\xff\xfe\xfb-[\xb6\
-l\xdd\xbau\xfb\xf6\xed\x07\x0e\x1c8\x7f\xfe\xbc>\x15\
-\xea+\xadP\xe1\xd9\x83EdW\xc8\x5cn\x91\xd2-\
-J\xbf<\xa5i\x0c\xff\xea\xbe\xaa\xf9\xa5\x97^\xea\xdb\
-\xb7\xef\x94)S^\x7f\xfd\xf5O>\xf9D\xef>\xff\
-\xed\xdf\xfe\xed\xbf;~\xf1\x8b_|\xf8\xe1\x87\x04\xa3\
-\xe3\xc7\x8f\xef\xd7\xaf\x9f\xde\x80\x12\x81u\xeb\xd6-\xfd\
-\x0d\xa0\xaeu\xfe\xdbN@w\x11\xca\x92l]\x86P\
-\xae\x97\xb4\xb1\xd5i\x02\x84r\xb3B\x1f]\xf8\xed\xbf\
-c\xc8k[\x83\xcc\xbb\xa3lp\xab\x18\xea\x92\xa6\xa6\
-\xdcP\xfb\xd3(K6\xe1\xf8\x84rad&{\x90\
-\xb2\x01\x94\x1c\x8c\xd2n\x0eZ\x22Q\xd7\x91\x86\xccM\
-I\xcd\xd5]\x84W\xb5\x1dln\xa2.7a_4\
-2\x0a\x83\x9a\xb0\xda\xc6\xc0~\xc4N\xa4\x9dW\x1d\xb7\
-\x16\x823\xf1\xcd\x96\xdc\xb4\xa8f\xe1UYx\x8b<\
-66_\xde(h\xbfO\x07c.X\x11@\xf4\xc9\
-\xa3\xda]\xc7\xbd{\xf7n\xdf\xbe}\xe6\xcc\x19\x82\xce\
-?\xfc\xe1\x0f\xbf\xfc\xe5/\x7f\xfd\xeb_\x7f\xf9\xe5\x97\
-\x9b7o\xae\xa9\xa9!B\xbdy\xf3&\xa1*\x96\x84\
-\xa1D\xaeT\xa2\x9bV\xa8\xd0.\x91\x87\xeb\x1am\x89\
-\x11\xe1Z\xc0\xd2\x8c\xf3\x95\x92\x9eRa\xc1Ry\xf1\
-\xc5\x17\xfb\xf4\xe93f\xcc\x98\x993g.Z\xb4H\
-\xbf\x08\xbf\xd4\xb1d\xc9\x92\xc5\x0e\x04\xb2f\xcd\x9a\xa5\
-7\xa0\xfa\xf5#\xb0\x97\xa0\xda\xfa\x84Z\xc5\x15% \
-H#\xa5\xb0\xa4\x84|\xa8k\xe1\x86\xe33Rdf\
-\x15\xb0oB\xd4#\xa0\xeb^\xd5z\xd0e\x86\xcb'\
-\x1c4\x8ck2v\xa9\xd1\x902\xc2m\xf0\x1e\x92\xde\
-\xb4M\xa1\x8e\x88\xb4\xc6P\x96\xa1I4\x01\xa4/\x8c\
-\x06\x8aC\xd0\xa7K\xa7\xe4`\xb40\xbe\xed9\xa4Q\
-\x96\xc8T\x8a\xa4@\xcaX\x1a?fm\xc7!\xc2\x8e\
-\x84\xb2\xa1\xbe\xe4\xcb*\xd0\xd3t\x11\xd9\xa3\x17^\xdb\
-z\xd0\x06\xed\xc8\x08j\x1bJ\x09\xf2W\x90\xb2\xf9\xc8\
-\xac\xdf\x0dO\x82O;3kOf\x91|XA\xc9\
-\x84\x92\x84\x9e\xc4\x9d\xfb\xf7\xef\xdf\xb9s\xe7\xee\xdd\xbb\
-\x7f\xf8\xe1\x07b\xd0\x8d\x1b7~\xf7\xddw_9\xbe\
-\xf9\xe6\x9bM\x9b6\xed\xdb\xb7\xef\xec\xd9\xb3D\x9f%\
-\xdd\xae\x9d\xc1\xe1\xdd\xa1C\x07\x0er\x8e\x7f\xfc\xc4k\
-+\xb4wXzZ8r~-\xc6\x10\x99\x85\x98\xde\
-\x04#\xd4P\xa1\xea4\x81,\x5cK!\xa03\x89!\
-\x97\x08\x12'\xec\xd4\xa9S\x97.]z\xf6\xec9l\
-\xd8\xb0\x05\x0b\x16\xbc\xff\xfe\xfb\xff\xf6o\xff\xf6\xb3\x9f\
-\xfdl\xe5\xca\x95\xe3\xc6\x8d#<\xad\xaa\xaa\xea\xd5\xbb\
-\xb7>\x00j\xbf\x05\x8f\x03\x13z\xfa\xba\xdc}]s\
-\x9e\x22}(\x83\x92\x80\xac\xa6B\x98%A\x9a\x08o\
-\xed\xf0\xaa\xfc\xc6\xe0M\x1d^\xd5<\x84m\xd0\xed\x92\
-\x9e\xe4oX\xcb\xa0\x96\x00\xb25\xc64iB\xbd\xcc\
-\x22|^\x19c\xdd\x0c\x07\xbf\x98\x96'\xb3\xe5@V\
-gAY\x99x\xeb\x1c^\xebx\xfc\xf8\xb1\x97J\xa7\
-\xc9N\x02kV\xd4\xb8\xa8cJ\x0a\x92*\x95\x0f\x19\
-\x84fI\x15m\x0a\xdf\xd5\xfcS\xdb\x80NEC\x81\
-\xcc\xc6\x0aR\x86Y\xad\x02\x9dU\xa0f\xbd\xce\xd7}\
-\xe9\xb9\x1a\xd27\x12\x0d\x08W\xe1\xb5\x0d\xc5\x1a\x96Y\
-\x1b\xdd\xfc\xe7?\xffI$z\xea\xd4)\xe2\xce\xdf\xfd\
-\xeew\xbfu\xe8[B\xe1\xcf\x7f\xfe\xf3\xb6m\xdb\xc8\
-\xbdy\xf3&1h\xfa\xf3-\xcf\x14\xccK\xd7\xae]\
-\xab\xab\xab\xc7\x8f\x1f?i\xd2\xa4\x09\x13&\x10\x01t\
-\xef\xde\x9d\xa0\xc1[Th\xd7\xd8\x0a\xd2j\x0a\x09s\
-#\x0a\xe8\x85Og\xd5\x1f\xbd\x92\x14<\x05\x11b\x0e\
-\x1f>\x1c\x0f\x9c:u\xea\x8c\x193\xe6\xcf\x9f\xbfl\
-\xd9\xb2\x15\xeeO\xc3/Y\xb2\x04\xcd\xc8\x91#\x09=\
-\xb1$\xe8\xcc}\x05\xe8S\xf0d_W\x80\xf6\x0a\xc3\
-kK!jg\x94\xcc$\xb4i\xd8M\x9f\x05\x18\xa5\
-F\x0e\x8e\x9b\xd2\xa7xm\xd9@\x07#|F\x8e|\
-\xcd\xce\xa7\x87\x02Yi\xb4\x228\x10\x95l\x00\x8d\x0a\
-F\xd3\x1d6\xe8\x83\xc2\x11#\x09OrH\xe3M\xf3\
-c\xf5#\xb0\xa7\x80\x85\x5ce\x8e\xfa\xab\xcf3\xa8\xbf\
-\xba*7\xec\x02\xb2\xe1U\xc5\x11\x16IF\xd3!Y\
-\xca\xd6\x82\x06$s\x9c#jO\xd2\xca\xba\xf8\x8c\xa6\
-@c\x02\xf8\x89\xbc\xc5g8\xd0{)\x0f\xd6\x18\x04\
-k\xbc\xc1T\xfe\xe8\xe0\xe1\x8f+I\xfdv\xfc\xb9s\
-\xe7\x0e\x1c8\xb0q\xe3\xc6\x7f\xfc\xe3\x1f_}\xf5\xd5\
-\x9a5k\xbe\xf9\xe6\x9b\xb5k\xd7\xae[\xb7\x0e\xe5\x9e\
-={0 \x06U\xcd\xcf,\xcf?\xff|\xa7N\x9d\
-z\xf6\xec9f\xcc\x98\x97_~\xf9\x93O>\xf9\x1f\
-\xff\xe3\x7f\xfc\xe2\x17\xbfx\xf7\xddwg\xce\x9cId\
-\xc0\x01\xefM+\xb4;X>\xac\x1a\x1e\xc6\x1e>|\
-\xc8\xb2\xf2\xda\xbah\xe5\x0a\xaf\x0a\xf0\x19\x01>\xc3\xe1\
-U\xb9\xc7r\x90\x1e\xa1c\xc7\x8e<\xfft\xe9\xd2\x05\
-\xf7\x83\xce\x9d;\xeb%\xe8\xdc\xb9s\xdfz\xeb\xad\xcf\
->\xfb\x0c?\x84\x9f\xff\xfc\xe7\xef\xbc\xf3\xce\x82\x05\x0b\
-\x86\x0e\x1d\xaaO\x7f\xea\xb5=u\x86\xf5\x8b\xb4\x06\xdc\
-\x0d3\xf67#*\xe5\x9a\x99\xa0\x82\xe0\xedrH\xa3\
-,\xf0\xc5\x1c\xa6\xe1\x1a\xdaTH\xe3\xc6\xf2)^\x1b\
-\x8c\xa7\x9f\x86\xdc\xfb\x0be\x85\x06\xe0J\xb4\x01h\xaa\
-\xefL}\xafcB=\xc3\xa2\xc3\x0eYE@Y`\
-\x83\xe63R\x15Jc\xc5\x9d\xae!4*\x18\xad\x17\
-\xdag=\x09\x09\x95\xaew\x09>\x9d\xc3\xca\xfal\xf7\
-\x8bZl\x10\x04\x192([\xd4r\xc5.\xc4+\xb6\
-\xf9J\x0f\xc8t\xc7\x94\x12B,\xd7PA\xf0\xe9\x1c\
-n`\xbc+\x08\xe9[\x11\xda\x90\xc4q\xa9\xcf\xebX\
-;u\x95\xd0\xe4\xe8F\xa0\xa4\xdd%T\x16\x89\x1a\x09\
-\xc8*\xcb\x9c\x12V>x\xf0\xe0\xde\xbd{w\xef\xde\
-\xbdr\xe5\xca\xa1C\x87\x88;\xff\xfc\xe7?\x7f\xf9\xe5\
-\x97;w\xee<}\xfa\xf4y\xc7\xa5K\x97\xf4\x07\x93\
-\x9e\xf1W\xa1\xc0\xb6\xa8\xb7\xa1\xfa\xdd\xe4e\xcb\x96\xb9\
-\xbf\xcb\xfd\xca\xaaU\xab^s,_\xbe|\xea\xd4\xa9\
-}\xfa\xf4\xa9\xc4\xa3\xed\x15v\xc2\x1b7n\xf0T\xa6\
-?\xccS\xe4J\xf4\xcb/k\xa3p\xab9\xbb\x12e\
-\x01\x8eG\xf4Ip\xe9\xbe\xees\xe6\xa4I\x93&N\
-\x9c8y\xf2d\x9c\x10\x97\xc3\xfd\xe0\xd5W_\xc5\x15\
-W\xacX\xb1p\xe1\xc2i\xd3\xa6a\xdc\xbd{\xf7\x17\
-^xA\x8f\xb2\xa0:3\xdb\x90\x8f\x02\xc6d\xf9\xc6\
-\x05\xf8\xbc\x14\xe9z|\x81\x1c\xd2(\x0b\xe3\xb4}\x85\
-Ll\xf4$K0\xa4q&qV\x9b@-7\xa4\
-\xc9\xd4\x97\x84\x15I\xbb\x994\x5c9\xf4\xff\xd9b_\
-z\xdf\xe4\x14\x1e\x14u\x0f\x81\xad\x81H\x94\x87Zv\
-\x8a\x97^z\x09Y\x06e\x0b\xf1\xc7\xfd\xfb\xf7\x89H\
-\x88K\x08J\x08IQ\x86\x9d\x0d\xa7V(\x89>4\
-Kc\x96\x99\xa8*\xf0\xe9V\x22j\x80\xf5HB\x98\
-\xdb\x1cMM\xfa\x9f\xab6\x1c\xccz\xef\x959\xf2x\
-\xa0\xde\x86\x12}^\xbcx\xf1\xc4\x89\x13\xc7\x8e\x1d#\
-\x06\xdd\xb7o\xdf\x0f?\xfc@$\xfa\xb7\xbf\xfdm\xcd\
-\x9a5D\xa2\x97/_\xc6\xd2\x17{\x86a\x18\xedS\
-\xa1z\x115v\xecXN\xfdO>\xf9\xe4\xd3O?\
-}\xfd\xf5\xd7\x09\x08\x06\x0c\x18\x80\x9e\x00t\xf4\xe8\xd1\
-\x8b\x16-Z\xb9r%\xa1\x00\xc9\xf2_\xda\x15\x1a\x00\
-\xcb\x87\xd5QSSC<\x8a\x1c\xae\xd0b0c\x5c\
-+D\xca4dqd\xbc\xf8\xe2\x8b\xf8\x181\xe8\xea\
-\xd5\xab?\xfb\xec\xb3\xff\xf9?\xff\xe7\xbf\xfd\xdb\xbf\xfd\
-\xe2\x17\xbf\xc0\x0f\xdf|\xf3\xcdy\xf3\xe6\x8d\x1c9\x12\
-\x97\xb3_\x84w\xafB\x93\x9f\xe9\x13\x83r\xe5\xa6\xac\
-}\xd7\xd2\xbcM\x8d\xda`\xc6\x12\xd2\x846i\xd2=\
-\x921\x90\x15a\x06v\xad\x90&\xdf\xc8\xd8\x18&\x83\
-\x9bCY`\xc3kfm\x85\xb0\xb5\x92u\x95K\x87\
-8\x93\xa7\xa45F:\xcb\x8fW\x0ei\x94\xd5\x18J\
-{\xcbH\xb38-z\xf4\xe81\xde\x81\xc0\x9a\x8f\xda\
-\x9a\xafW\xe8C\xf4\xd0\x89\xa0\xdcLd\x09\x92\xf5\xe1\
-<\x9e\xb0y\xbc.\xf3\x9f{27\xc4\xa3\xece\x0c\
-\x17\x9b\x9d>{d\xcf\xd9\x22\x9a?\xebi1D\x96\
-Jr\xbb\x87\x0f\x1f\xb2\xdd\x1f<x\xf0\xcc\x993\xc8\
-\xcamIh\xc9\x0b/\xbc\xd0\xb7o_\xce\x00\xf6z\
-\x9e\x1c\xe85$}\xcb\xea\x9d\x94\x96\x95iS\x12\xb6\
-6LHn\x9c\xbfZ\xe5\x0a\x92*%\x5c\x1d\xc9<\
-\xf2,A$z\xea\xd4\xa9\xdd\xbbwo\xde\xbcy\xfb\
-\xf6\xed\x84\x9e{\xf6\xec\xd9\xb5k\x17W\x8e\xd8\x0b\x17\
-.\x14\xf8\xf9\xe33\x05\x1bB'\xf7\xe3x\x8ey\xdc\
-\xa0\x7f\xff\xfe\xa3F\x8d\x9a={\xf6\x92%Kf\xcd\
-\x9a5z\xf4\x98\x81\x03\x07\xb2\x22\x08UY\x1a\xcf=\
-\xf7\x1c\xeb\x02'\x91\x9f\xe8\x8b\x08X\xda\x95\x91lg\
-(\xaac\xae\xab\xab\xab\x87\x0c\x19\xa2\xe9\xd6\x8a+\x12\
-[\xa1&\xa4Q\x96\xdbo\xfcN\x8b7\xe2ix\xe3\
-\xe0\xc1\x83\xd9\x8epE\x181b\x04\xcd\xe8\xdd\xbb7\
-\x01\xa8\x9c\x103\x8ap\xe5_U\xa2\xdaP*\x09\xaa\
-0DJ\xcb\xa2\x83\x12 \xd3^XVZ\x00d\xe1\
-\xd3\x01ie\xbd\x9a\xa4\xa2\x00\xafm6\x18\x01\xce\xe8\
-\xdb\xb7o\x9f<y\x92\xc7u\x1e\xdd\xf5\x16\xa6\x85a\
-\xd6x\x0c\x1e6l\x18\x0f\xbd\xec6\xfa\xa6-\xe9s\
-\xe3\x90\x5c4_6kN\xfft\x00\x13;G(\x1b\
-\x94\xfa\xf1\xc7\x1f\xaf_\xbfN7\xd9\xff\xe9\xb2J\xb5\
-\x16\xf4\x97e5a\xc2\x84A\x83\x06\xf1\xfc\xaf\x9e\xa2\
-\xb7\xab09\x9d\x15\xbaz\x84\x19\x03\x1dOp\x924\
-f \x81\xdd\xfb\x7f\xff\xef\xff\xedrJ\xa6QoF\
-\xd5\xaa\x08)\xd5\xb2\x08\xb5X(\xc9\xd5u.\x03W\
-\xe2\xa9\x0d\xbb\x06\xdb\x876\x14\x1ed\xe5^\xe5\xcc\x83\
-\x07\x0fX\x93\x84/rV\x9d\xaf\xea\x0eX\x07C\xd0\
-\xb9\xaeg\xe0-r\x84J\x04\xed\xf5\xc0\xb0\xb8-5\
-\xef\xef\x90\xb6$\xc5\xb4\x816\xdb\xd5p]\xf1xU\
-)\xa8\xa0\xc6\x846\x14\xd3\x0c\xd9\xa8 P\x96]\xf5\
-\xf1\xe3\xc7L\x1c\xc1\xfd\xb1c\xc7\x08:7m\xda\xf4\
-\xf7\xbf\xff\xfd/\x7f\xf9\xcb\x17_|\xf1\xd7\xbf\xfe\xf5\
-\xab\xaf\xbeZ\xbf~=\x9b\xd1\x95+W\x1a\xf3\xb3\x89\
-\xf6\x01\x8e\xa7\xdfMfmr\x0c,\x5c\xb8\xf0\xed\xb7\
-\xdf\xfe\xec\xb3\xcf\xfe\xfb\x7f\xff\xefz\x1b\xca\xc3\x09\x81\
-i\xd7\xae\xc9\xaf!\xb3\x96\xb5\xf7\xe1\xa8\xc8\x84&C\
-\x87\x0e\x9d?\x7f\xfe\xcb/\xbf<}\xfa\xf4\xca\xe7G\
-\xdb%\xac\xa6\x9b\x0e\x04m\x86\x8d\xc7-n\x0f\x1e%\
-|:\xb7\xea\xf11\x9e\x8e\xf0\xb1\xae]\xbb\xea\xbd\x00\
-.\xca\x81\xad\x18%\xb0GHd\xed\x00\x14\xd4> \
-9\x8d\xb3z\x9a\x95\xcf\xac\x00\xaa\x01\x90\xb9\xaf\x94\xf5\
-\xe2\x9a\xea\x91F5\x18\xaa\x13|:\x87\xd7\xd6m\xb3\
-\xe1U\xf5Q\x92q9\xa0\xd6Fm\xb6\xc1\x0e\xf5\x91\
-\x0dI\xe1\xd3uG\x1e\xbc\xb6\xcc\xb06K\x00\xe9}\
-\xa3\x1dJ(\xcb\x89\x092\x0b\x09\xf5\xaa\x0a\x94$\xed\
-\x05\x97e\xd7F\xd2,!\x9dkv\xdc8u\xccz\
-\xa8ka\xa8\xc4B\x0a\x92\xc8<i\xb1\x97\xb5\x95\x0f\
-\xe1\x11\x8f\x12\xa9\xdc\xb8q\xa3\xe8\x97=~^3\x91\
-E\x88\xe9\xa9\x1c\x90\xd9y\xf5\xb3Q\x8e\xf3bF\xb8\
-YQ\xdb\x92\xf9N\xb5\xc45<A\xb2]\xd3\xe4\xd3\
-gb\xc6\x85\xeb\xcc\x04c\xc6\x90\xe7]f\x0d\xee\xb9\
-?\x98t\xe4\xc8\x91u\xeb\xd6\xfd\xf1\x8f\x7f\xfc\xfd\xef\
-\x7fO$\xbac\xc7\x8e\xda\xda\xda\xcb\x97/3\xa7\x1c\
-\xabw\xee\xdc\xa9\xbc\x10\x05\x9cM\x9f\x0a\x1d;v,\
-\xd1\xe4\x92%KV\xadZ\xb5z\xf5j}&\x8f$\
-\x8f\xec\xfd\xfa\xf5\xc3-_|\xf1E\xa2O{X\xd2\
-\x04!\x13+\x8c\x181b\xde\xbcy\x8b\x17/\x9e<\
-yr%\x1em\x7f\xb0L\xd8\xba\x9bd\xf7v;J\
-\xe2?\x5c\x15P\x82\x94`\xb2\xf48\x1b\xe0N`\xef\
-A\xc9\xb5\xcdA\xc6ND\xf7t\xc7\x08\xf4\x9e$\xfb\
-)>\xe9\xf3\x1aGI\xf5\xe8\xbe\xe0\xd3q\xc3\x12|\
-F\x805\x18\x5c\xd2_\xc3da\xcc\xc6\x15\xaa\x83\xe9\
-M0\xb9\x15\xc9\xd7\x86\x02\xcd\x93\xde\xae\x86%\x13\xa3\
-\xf2#\xf2U5\xd5\xf0Zg\x96\xfc\x93S\xba\x7f\x9f\
-~\x02$\xc9\xaa\x8b\xcc\x04\x92\xec}:\x85\xce\xc1\x0e\
-\x1d:(\xd9\x00\x1a\x1e\x8cZ\xcb|W\x1c\xca\x82\xcc\
-\x5c\xdb&@f\x85\x91\x99\xaa\xb2Oa\x9e>}\xba\
-\xad|M#\x8dd\x86\xb4\xf9\xaa\xd7\x22J\x82\x8c\x8d\
-\xa4pq\x84\xf6\xd4\xc3VKX\xd0\xa7o\xdf\x1e=\
-z K_\x0e\xa8\x8f\xba\x0a\x9a\xcd\xe0@\xd8\x85\xc6\
-\x13\xd5\x14VnB2\xe2u\xdbC\x16a\xe8\xed\xdb\
-\xb7\xcf\x9f?O\xb8y\xd8\xb1w\xef\xde\x0d\x1b6\xfc\
-\xedo\x7f\xfb\xe2\x8b/\xd6\xacYC$J\xae\x9e+\
-\x5c\xad\x1e\xd5\xf0\x0c\xc2r\xd6\xdb\xd0^\xbdzM\x9c\
-8\x91\xd0\xf3\xe3\x8f?\xd6\x07\xf2\xe6\xcc\x993j\xd4\
-\xa8\x01\x03\x06\x90\x85Cv\xea\xd4\xc9\xe2\x00JQ\xd6\
-F\x1e\xd0\x90\xd5\xa5K\x97!C\x86\xcc\x9f?\x7f\xc5\
-\x8a\x15S\xa6L\xa9\xc4\xa3\xed\x12\xd6\x0eWf?Z\
-;\xc9\x82tX\xd2\x94\xd2\xc8\xd8\x92`\xa7\x09\x82P\
-R\xb9&\x002\xb9\xf2\xbd$2\xcd\xc5\xa6\xaePR\
-\xca\xd9\xf8\xdbeb\xad\x95\x00\x88\xae\xeeD\xe3\x8d\x02\
-\xd0{)\x85J\x85\xb8\xda\x9e\xd6\x0c$\xbdu\x80\xb3\
-\x8d\xb1,\x0a1\xb6\x9c5*\xaek]b\x8d\x99d\
-\x19\xd7O\xd2\xd0\x14\xc9\x86\xee\xf0F\xad\x8a\x0d\x8e\x09\
-\x11\xd2\x1b^\x9b\x05]\xf3R\xae\x14\x9e\x83\x0b\xc9\x9d\
-|F\xb9\xa2\xa9\x91 \x0d\x84r\xa9h\x04B|\x86\
-\xfbA\x84\x97J\xa7\xa5\x7f\xd8\xed\xdb^p\xe2C\x98\
-r\xcd\xb7\xdb7\x92\xe9\xe7T+\xbex\x99\xe0\x9c!\
-\xc1\xa7\x1d\xea\x85\xcfph\x19\xfbD\x0e\x19G\xf8\xbc\
-\x9c\x87\xd9\xc8\x10\x1c\xf4\xec\xd9s\xc4\xf0\xe1\xa3G\x8f\
-\xee\xde\xbd\xbb\x8c[\x1e5,D\x8a,\xbd\xc7\xa7\x1d\
-\xceA\x9e\xe2\xb5E`\xe6N\xa8\xbf\xa0\x06\x9c\x1d\xfc\
-\xb1\xfb\x19\xe2\x91#G\xbe\xf9\xe6\x9b\xdf\xff\xfe\xf7\xbf\
-\xfc\xe5/\xff\xe3?\xfe\xe3\xb7\xbf\xfd\xed?\xfe\xf1\x8f\
-]\xbbv\xf1\xfcs\xfd\xfau\x1e\x81*?\x8e7p\
-6\x1cl\xd0\xa0A\xe3\xc7\x8f\xd7\xaf'\xbf\xfe\xfa\xeb\
-\xabW\xafF\x986m\x1az\xfdF\x08\x0e\x89\xa5\x16\
-\xaf\x0a\xfa\xf9\x0ef\x9c\x99\x92\x03w\xeb\xd6\x0d\xbf]\
-\xb0`\x81\xde\x8fV~\x9f\xa9=\xc1\x1e.\x7f`\xba\
-Yt^\xeb\x08\x97j\xb4lC?\x112\xb0k\x84\
-3\xa9\x07o\xea0W\xf4\xe9\x00\xb3\xb56\xc88D\
-\xfa4\xb9\xe2\xf5#\xcb\xa8*U\x9eF\xb9I\x9b\x1c\
-^\xeb\xdb\xef\xcfJ\xae\xca5c\x09i\xc8\x91%\x90\
-\xf4u\xe5G\xa5\x84W\xd5\x85\x8d\x14\xb4\xa9\x92\xf4\xa6\
-\xad\x8dz\xd7\x00\xf2\x15Tg\x81\xd1\xe61\x1b\xafn\
-\xf0-Z\x12\x1a\xac\xab0\xd9ef\x10e\xd1\xc3\xc4\
-Q\xb2Hr\x03\x17r\xe6\x0d\xa1\xa5\x83\xd1t[\xd5\
-\x8d|\xa8{87f\xfa(zUUUc^\x05\
-\xb7<\xe9.G\xc8\xc0u\xd4\x13.f\x13\x0ci\x12\
-;\x87)\x81\xc3[?0\xd5o\x09(\xabUP{\
-\x0cS\xf8\xec\x1c6\xfb\xca\xca\xb4)\x09*\x0c\xf1Z\
-\x87i\xc2\xbb0\xd4?\xfe\xf8\xe3\xad[\xb7jkk\
-7o\xde\xfc\xb7\xbf\xfd\xed\xf3\xcf?\xff\xf2\xcb/\x11\
-\xd6\xae]\xbbo\xdf\xbe\xabW\xaf\xeag\x8b\x8dlX\
-;\x80s\x0e\x07c\xf3e\x0b&R$^\xd4\xdbP\
-\xfd\xa9n}*\x94\x15J.\x91%$\x0f\x91\xb9\xc7\
-H_E~\x98\x1a\xcc\xf4I\xfcE\x8b\x16\xd9\xe7G\
-+\xf1h\xfb\x80y\xe4a\x83\xdd\x09\xc7\xf0\xaa\xfa\x08\
-W\x9c\x16\xafa\x0a\x04oQ\x0an\x03H\x08eP\
-\xaea\xfb\x07\x19f \x01\x94\x05\xa1\x9c\x0f\x15\x11^\
-\xe5\xfa\xe0\xa5RP)_\x97\xab\xcd4\xb6M%C\
-\x13\x98\x99\x8d\xe1\x92u4 \xe3$\x96\xcc!\x8da\
-6\x02\x03\x17\x7f&\x01\xa8j@`;\x0d\xbf\xd0\xb0\
-\x15qc\x10\xf7\xb1I\xa0Z\xdc\x988\xa4\x87\xfb\xbb\
-\x5cl\x89>\xa3\xbca\xca\xbcTWnB8+\xbd\
-T:\xcd\x12\x8c\xca\x09\xc0\xa7\xeb\xc3[\xe7\x01\x03\xf9\
-}Y9zI$\x0b7\xb7\x92\xa5\x89\x90\x81\x11*\
-%GDzKJ`\x88\x1e<xP\x9e\xaf\xf1\xd4\
-B?\xb5\xc1\xc3}\x84\x8cK\xc5\xcaR\xb3\xae\x12\x00\
-\xbd6M\x19\x00\xc9G\x8f\x1e\xdd\xbbw\x8fp\xf3\xf0\
-\xe1\xc3\xeb\xd7\xaf_\xb7n\xdd\xde\xbd{\xcf\x9c9s\
-\xf9\xf2e\x947n\xdc\xa8\xbc\x0d5\x14L\x0c\x180\
-`\xe4\xc8\x91\x13'N\x9c={\xf6\xf2\xe5\xcb_{\
-\xed5\xe2\xd1\x85\x0b\x17\x8e\x1d;V_\x19A\xf4)\
-\xfbp\xf0%X2\x224\xa38\xf1\x0a\xb7\x98;w\
-.\xd5V>?\xdan\xe8\xdc\xb93\x0f\xc9\xf8\x0f\xcf\
-*\xc5<\x9cD\xe0\x1bu1\xa7R\xfeS\xdc\x1e\x90\
-\xe0\xd3),\xab\xb0\x19\xf5?5\x08\x8aHh\x15t\
-w\xd7\xa8\x04)\x85\x1b\x93\x04\xf4\xecr\xb6\xd7\x85f\
-2\xf0\x097t\xa1F\xc6\x11T\x22,)\xc1\x88\x0a\
-r@\xb3g\xb2\xa9\x12\x94`\xac\x9a\xdb\x10\x1a\x0d\x1b\
-\x93\xb4\x00t\x93+\x9b\x12;\xd5\xa0A\x83\x86\x0f\x1f\
-\xce\x93yh\xd0\xea\xd0\x98\xe2\xdb\xa3\xee@\x81\x22\xaa\
-\xb0\x00\xb2\x91\x03\xa8H\x03hx0j\x8d\xc8\x87\x0c\
-\x0c4\xd6\xedb\xc0X k\xf3\xd2\xcfR\x89\x12\x88\
-!\x9cI\xdb\xc0z\xa1k\x91X)\xc9\x12 \x94\x0d\
-\x0d/\x90K$J\x14u\xf1\xe2E\xe2Q)[\x0b\
-\xcd;(\x99\xf4'\xabG\xa0\xa4\xcb\x7f\x8a\xb2\x1aL\
-\xee\xbeI\x03Ta\xf2\x08\xef\xf6h\xae\x8c\x92\xfex\
-\x92~S~\xc3\x86\x0d\xdf\x7f\xff\xfd\xbe}\xfb\xae\x5c\
-\xb9\x82\x9b\x11\x80\xca\xb2\xf1\xcdhs\xb0\xd6\xd8g\x09\
-=_\xc8A\x88\xd9\xa5K\x97~\xfd\xfaM\x980a\
-\xd9\xb2eo\xbf\xfd\xf6\x07\x1f|\xf0\xce;\xef,]\
-\xba\x94\xa8t\xe0\xc0\x81={\xf6\xd4\xef\xccQ\xd6\xbd\
-\x0cMH\xc6=\x07\xd5\xeaZ\x00\x0cT\x9c[\xbf\xf4\
-\xd2K\xc3\x86\x0d\x9b7o\x1e\xb7\x187n\x1cAp\
-\x03\xc2\x97\x0aeE\x87\x0e\x1d8\xb3q\x15\x04f9\
-\x9cP-O\xc3k\xb3|&q\xa6\x1cJJ_\x18\
-_o\x0a\x9f\x1d\xe03r\xdb\x91i\x5cf\xb1d\xb6\
-\xca\x94i\xa1$\xf2\xb5\x87\xda\xb4|\x90\xb5\xc5\xb1\x89\
-i\x1fC\x13\x15Q%\x99PV\xc5\x85\x92\x10\xca\x02\
-c\xd5\xc6\xad\x91e\xa0`\x14\xdah0j\x84\xd3d\
-2\xb8AJ>%\xccP\xf3X\xc5\xa32\x8fX\xbd\
-z\xf5\xf2\xd9\xe5\x84Z.\xbc*\x87\xd7\x16\xad\xaf\x97\
-\x06\x14I\xd3\x5c[\xbc\x1a\xd7$Md\xee\xb9\xb2\xd2\
-8\xed\xf4\xab\xe2\x9c\x8em\xeepR/t-\x09+\
-\x82\x90\xaf\xb8\xf4\x89\x13\xb9/\x82e\x94\x800\xa2\x15\
-GI\x8d1\xbc\xd6\xa1\xd6F}q\xfb[B\xd2\xc9\
-\x1c>\xaf\xa1\xb8\xfb\xfa\xf7\x04\xec\xcbl\x94l\x91z\
-\x1bz\xf9\xf2\xe5\x83\x07\x0f\xea\x8f'}\xfe\xf9\xe7\xdf\
-}\xf7\xdd\xa1C\x87\xae_\xbf\x8e\x99/\xfcL\x82\xcf\
-\x10.\x84_\xca8z\xf4h\xc2\xc1\xa9S\xa7\x12\x1a\
-\x12\x89\xbe\xfa\xea\xabo\xbc\xf1\xc6k\xaf\xbd\xb6h\xd1\
-\xa2\xb1c\xc7\xb2\x0b\x13[\xe0rx\x9afY\xb3\xe6\
-\xe6\xfc\xe9\xa4\x87r\x1a\x15q\x13\xee\xcb\xb2\xd1\xeb\xfd\
-\xe8\xcc\x993\x89\x80\xd9\xf1i\x98\xb3\xad\xd0Va\x0d\
->t\xd8\x12\x93Wh\xdeC\x94+\x127r\xf8\xb4\
-\xc3\xab\x0a:\x15\xa8\xaa\xa8\xc2()\x92\xbb\xe6\x884\
-J\x1a\x997M7F\x9a\x10S\xca\xa0H|#r\
-xm\xae\x17R\x1a\x8c\xb0\xb68\x83\xbdN0\xe6\xb6\
-\xb5j?\x84d\xb7uH)d\xa3\xbb@\x98\x94,\
-\xa4\x09{$\x19B\x83V'_K|[S\xf8\xec\
-\xfa\xb0>2bO\x1c\xd2\x97\x0f\x99\xdd)F#B\
-}(\xab\xe3\x99\xc8\x80\xb3@B\x03h\xc6`E}\
-\xc8\xd7\xdbz\xa1\xa0A\x92\xd3N?\xe8\xe1\x80\xec\xdb\
-\xb7/\xf1\xa8\xf4m\x02M\x95MX>\xacGnr\
-\x0b\x15\xc9\xec{2R\xee\x93\xb56J\xc8>\xafe\
-\x89\x9a\x17&\xc3~E\xbd#)|\xbat\xa2\x1b\x81\
-6h6\x8b[\xb7n]\xb8p\xe1\xc4\x89\x13G\x8f\
-\x1e=r\xe4\xc8\xee\xdd\xbb\xbf\xff\xfe\xfb\xbf\xfd\xedo\
-\x7f\xfd\xeb_\x09I\x0f\x1c8\xf0,G\xa2z\xd2\xe3\
-A\x7f\xc0\x80\x01\xd3\xa7O_\xb5j\xd5\xdbo\xbf\xfd\
-\xee\xbb\xef\xbe\xe7x\xff\xfd\xf7\x91\x89A\x97/_N\
-\xee\xf0\xe1\xc3\x07\x0e\x1c\xd8\xbbwo\xd6#[\x8f\xc6\
-\x9c\xab\xe2QCJ\xe1nR,*\xa2\xf5\x8e\x0f\x0f\
-\x1d:\xb4\x7f\xff\xfe\xad\xe5\xc9\x15\x9a\x8a;w\xee\xd4\
-\xd6\xd6\xb2\x00o\xdc\xb8\xc1z\x0c\x97\xb9\x96\xaa\xb0$\
-\x82<\xc1\x994\x10\xd5\x13\xa1\xfa\x0d\xaf\xcd\xe1\xb5Y\
-\x05\xd5\x9e\xc8\xcf\xc1r%\x14Cd\x9cY6\xb3\x0d\
-\xa0\xe6)pt\x01d\x12\x5c2\xa4\x04\x9d7o\xde\
-\xd4.w\xec\xd8\xb1\x9a\x9a\x1a\xae'O\x9e\xbct\xe9\
-\xd2\xfd\xfb\xf7\xd9\x06e\x09VJ\x02\xa8N\xe1oS\
-\x04i{\x1e#9\x9aA?'\xf1\xdaV\x22__\
-\x0a\xcfT\x91\x13J\xe5\x9c\x17\x1c+\xe7\xce\x9d\xe3\xec\
-\xf0\xda\xb2\x87N\xa9_&\x80\x9b\xc6x\xacd\x00>\
-]\x10\xd5\x801\xf3\xeeU\xa5S\xda\xef\xe1s3\x8e\
-\x9f\x1e\xb9\xbf\xc0\xd4\xbd{w\xfd\x5c@\x14\xd3\xee\xa4\
-su\xcdl\x14\x0a\x14'\x0b3\xd6\x0c\xeb\x87\xe9?\
-s\xe6\xcc\x95+WX{>\xbb,\xa1\xcd\x0cNO\
-\xf7\xb7\x10\x19\xab^\xbdz\xd9<Y\x97\x85z\xa7\xee\
-\x87\x83`\x1a\x11\x96\xf2*\x87%\x114J,\x12v\
-\xfc\xd3\xa7O_\xbe|\x99\xe7cW\xa2\x85\xa0\x19/\
-\xa4\xfe\x02\x93\x9ag\xedG\x8e\x84\x88P\x9fi\x13\x0d\
-\x85\x97\xea\xa2qx\xcc\x1e\xfd\xf0!\xa3A\x0c\xfa\xc3\
-\x0f?\xec\xdc\xb9s\xdf\xbe}\xfb\xf7\xef\xe7J<z\
-\xf8\xf0\xe1\x8b\x17/>\xe3\x7f\xf5\x87\x93\x03/e\xca\
-\x06\x0f\x1e<a\xc2\x84\x05\x8ei\xd3\xa6\xe1\xb4c\xc6\
-\x8c\xc1{G\x8f\x1e\xcdT\x0e\x1b6\x8c\x87\x1c\xd6~\
-\xc7\x8e\x1d\xf1d|\x1b4\xf8LG\xe6\x8c\xa4\xa7\x06\
-\x8d\xe1U9\xa4QU %\x93\xc29\xaa\x0f\xe70\
-M\xcf\xec\x1c\xb5\x03\x08\x86\xb8\xb2\x0d\xf2t\xc1\x93\x0c\
-\xbbD\xe4\x06\x9at\xcd>H\x09\xa1\x99m&\xc8f\
-c\xb9FX\x1cp\x9b\x02\xc6\xc5\xe3\xee\x9c\x14\x97\x00\
-\xa1\x0cJ\xda5\xc4\xe5'\xf8\xb4\xd3\xa8\xc3Jf\xa2\
-f\xfbR\xee\x1f4\x1c\x82\xecl\xba\x0a\xc6\x96e\xa2\
-?\xb8\xaa\xbf\x0c\xb7w\xef^\x1e\xb0I\x9e:u\x8a\
-,\x9e\xe5\xb4l\xa9\x86\xd1\xb0uDm\x864\x11I\
-\x8bS}\x89PYUBcX\xa7\xc4g\x04\xc4\xac\
-YMz\x0b\x83\x93\xd0Y\xfb\x0bL\xeco\xea\x85\xf0\
-FY\x98Aa3Ag\x1f<x\xc0\xb1\xb2u\xeb\
-V\x22\xfe\xd6}9J\x7f\xd9\xbd\xd9\xb1\xf5\x17\x98\xb4\
-3kJi\xa73I\xc8\xecW\xd2\xe7\x1c^U\x97\
-\xb0\x864\xca5\x1b\xc6\xe1\x7f\xfd\xaf\xff%\xb9T\x1a\
-\xf5\xecb\xad/\xdc\xdc|\x9d\x8c\xa0\x92\xb0\x9et)\
-\x19@\x91\x15\x96\x1bj|\xb83B\xae/q\x8f\xd0\
-\x87\x84E\x0a\x80%W\xb6\x00bPv+)\xcb\x01\
-\xda\xaf\x8e\x80W\xe5'\x19\xa6\x00\xaf\xad\x0f3f\x84\
-\xb5S\xdf\xb9s\xe7\xc2\xf9\xf3l\x8bl\xcd\xdf}\xf7\
-\xdd_\xfe\xf2\x97\xcf?\xff\x5c\x7f?\x89$\x9b\xf5\xb5\
-k\xd7\x18(,\x8b\xbfK\x9b\x86\xc1g\x9f\xe2L\x02\
-\x9e*\x09\x08\xbat\xe9\xc2\xfe5s\xe6\xccW_}\
-\xf5\xed\xb7\xdf^\xbdz5\x91(!)\xd1\xe7\xf0\xe1\
-\xc3\xd9\xd0\x09\x1d\x86\x0c\x19B\x18\xda\xa7O\x1f\x1e-\
-\xf4\xce\x83J\x14\x16\xa8\xce\x08\xdd\x0b\x0a\x8fjd\x19\
-\x1a\x93E\xfd\xdc\x85\x8d\x956\x10\x19\x8f\x1b7\x8e\x08\
-\x06\x8d\xb7\xa8\xd0\xd6`U\x12\xa6\xb0\xe2X\x95\xe1\x8a\
-s.\xe3=\x01e\x12(\x058\xbfxj)!\xc2\
-\x0c\x22\xa4\xcf\x97\x1b\xa26\x08\xaf\xca\xf9\xa4!\x0dW\
-o\x97\xd5\x18\x9f\x91\x95\xa5J\x84W\xd5%*\xe5M\
-s\x03\x22\x89q#\x00b\x0c\x89\xf6\x8e\x1f?~\xcc\
-Q[[KHt\xf0\xe0A\xa2\xa2o\xbe\xf9\x86\xfd\
-\x0d\xd8\xeb\xbe\xfc\xf2K}\x06\xe9\xeb\xaf\xbff\xaf\xbb\
-u\xeb\x16{\x9d\xaa\xa2\xfe\xccF\x86\xb8~x\xbc*\
-?V'+\xd4\x02\xdfb\x0a6+\xae\xedI\x1b\xa2\
-\x96$\x83Y\xd7\xd3\xd4~#JFP\x9b\xed~\xcc\
-\x08\xe1W\xab\x1f\xb5\xd6\xe0\xa4c9\xea\xa6\x12\x03\x13\
-\x8a$\x9f}2\xac\xc1\x90\x9a\x0dBc\x86\xa2Q\xc1\
-\xa8k\xea\xd3v\x98 \xd94\x105=\xc4kS\x84\
-Y\xc8t\xf2\xd1\xa3G\xfa\xd2{Vc\xeb>\x884\
-\x00\xd7W\x8f%\x95\x05\xe1b\x09g:\x1c\xb7\x083\
-\x8bl\xcav\x94\xd4e\xe1Uy\xf0Fi|~\x8c\
-eJ\x00\xf6\x88\xdb\xb7o\xb3Mo\xdc\xb8\xf1o\x8e\
-\xef\xbf\xff~\xcf\x9e=\xec\xdd\xa7N\x9d:s\xe6\x0c\
-C\xa4CQ5\xb4{p\x12\xa2\xcfn\xdd\xba\xf5\xeb\
-\xd7\x8fghBL \xe2\x9c4i\xd2\xbcy\xf3V\
-\xae\x5c\xf9\xc6\x1bo\xacZ\xb5\x8aH\x14eO\xf7\xf5\
-L\x1c*\x90\xfc\xc8\xcdA\xe4\xca\x16LU~\x88\x1d\
-V\xb9vgCz0\x9b\x90\xd0 $\xacPp\xdf\
-\xfe\xfd\xfb\xd3\xc8\xd9\xb3g\x8f\x193\xa6k\xd7\xae2\
-\xa8\xd0\x16\xd1\x1e\xae\x90H\x1a\xa6XW\x09\xe0\xdc\xaa\
-\x04\x9f)@\x03\x8a@\xa9\xa52[k\xa8;!I\
-\xfd\xfc\xef\xee\xa2;\xf9\x0cWO(\xb0;\xe9\xb5\x02\
-\x83\xf6\xf0\xe1C\xc2P\xb6\xac\xb3g\xcf\xee\xdc\xb9s\
-\xcd\x9a5D\x99\x7f\xcaA\xd0I\xf4\xa9?PL.\
-\xb1)\xbb\x1cG\x00\xd7\x9a\x9a\x1a\xe2T\xfbt\x04#\
-\xcfR\xe59\xcf5!oO}\xf3\xea\x1a\xa8m\xc2\
-\xab\x9c\x92\xabYR\xb7=\xacJ\xd3\xeaX_\xac\x91\
-&\xa4\x89zW\xc0\xd2\xb2\xa2\x22\xadN\xbe\xc64a\
-#]\x8f\xb3kk\xcc\xbc\x97VR\x8d\x00|\x9a\x9d\
-\x05A\xcad\x9e\xeb\xbe\xbd\x0b\xe5\x10\xf4\xc2\xa7\xeb\x03\
-K\xdd\x8b\x95\xc9R<y\xf2\xa4~\xb4\xca\x12-\xbe\
-\x922Gn\xad1\x94\xc6P\x1f\xa3\x9e\x9a\x99\xe5\x0a\
-\xc9\xf7\xef\xdfg\x1bb\x0fj\xf9\x9f\xd1G\xa8G\xe0\
-\xd3\xb9\xa6\xfaDA0c\xde\x0d_P\xd7\xa0f0\
-{\x811\xde\xc2&\xce\xe6\xbbo\xdf>vm\xb6\xe9\
-\xef\xbe\xfb\x0e\xb7A\xc3\x80\x90\x85/\x01\x96*\xdb\x8e\
-\xd1\xd9@\x1cIp\xd9\xb7o\xdf\x89\x13'.Y\xb2\
-d\xf5\xea\xd5o\xbf\xfd\xf6;9\xf4\xdbHd\x11\x9e\
-\xea\xf5'\xf6\x94\xa2l\x88\x0d\xb5\xe1G<pB\xe9\
-#\x94\x05>\xed4v\xad\x83f4w#nJ3\
-h\xcf\xa0A\x83\xa6M\x9bF<Z]]]y9\
-\xdava\xc6uj\x84So\xd3\xad\xa9\x97\xb3\x81\x92\
-\xca2T\x16|:\x0fV\xd6\x04\xa1$\xf8t\x16V\
-yhVo\x91\xcc&I\x99\xce%\xe9v\xb5\x04d\
-U\xee\xac\xfc\x8f\xe0\xd9\xa3\xd8\xc6\xaf\x5c\xb9\xc2c\xb3\
->\x00\x0az\xfd\xb9m\xdb\xb6\x7f\xfc\xe3\x1f>\x08\xcd\
-A`\xfa\xf7\xbf\xff}\xeb\xd6\xad\x98\xdd\xbcy\x93\xc8\
-\x95\xb8\x93J\x00\x99\xc7\xf2[\xb7n!p;n\xa4\
-\xc1\xd5\x1d\x93\xd64\x82|5$C\x5cp\xc4Z\x00\
-\x1a /\xf2\xe9\x1c\x99\x1a)\xdd\x0c$H_\x00\xec\
-\xbdi.\xf8\xf1\x19\xad\x87oMqs\x1a\xb59J\
-\x0aU\xa5:E\x94\x14(\xad,\x03\xfeb#\xber\
-\xb5\xe40\x16\x87f\xb5\xe8PG\x0e\xbb\xa1\x96E\xa8\
-\xc5\x90);\x93:H\x1f\xa1,nz\xf5\xea\xd5\x0b\
-\x17.\xdc\xbd{\x97E+e[\xc1z\x91\x89\x8d\xa1\
-\x09\x85\xc9g\xc6\x8c0J\xd7\xae]\xbbt\xe9\xd2\xbd\
-{\xf7\xb4\xfb\xb4<j^\xd8e4\xf9\xda,B\x03\
-7\xe7\x09\xb4?\x12\x92\xdc,'\x89J\xb1\x17\xb3\x05\
-\xf3\xe8r\xe8\xd0\xa1\xda\xda\xdas\xe7\xce\xf1$\xd3\xe6\
-|\xa610\x98\x1d\xdcw2\x0f\x180\x80(s\xec\
-\xd8\xb13g\xce\x5c\xbe|\xf9O~\xf2\x13\x22\xd1\xf7\
-\x1d\x08\xabV\xad\x9a3g\xce\xf0\xe1\xc3\xf5\x9d;\x05\
-\xdej\xf8\xc1\xcd\xcd\xa9\x04i\x84\xf4`\xf3X\x80\xd0\
-\x1e\x92\x22\x1c\x1e\xb9X\x84\xa4\xeaD\xa0I\xdd\xbau\
-\xd3/\xf8\x0f\x1c8\x90\xa8\xda\x97\xa9\xd0f\xd1\xfc\xfa\
-\x84\x03M\x1a\xe9e \x7f\x08\x91\x8d\x90\x8d0\x8d\xe9\
-\xa5\x11\xa6\x91 \xa8\xcd\x84\x10\x15\x01\xe5\x9a\x90\x09\xf6\
-^r(iJ\x84\xa7\x9b\x98\xfeqYa\x9d\x18p\
-\xaa>z\xf4\x88\xbd\xeb\xd4\xa9S\xc4\x9d_}\xf5\x15\
-\x81\xe6\x9f\xff\xfcg\x05\x9d\x08\x04\x9d\x1b7n\xe41\
-\xbb\xa6\xa6\xe6x\x0e\x02V};rz\xcfW\x9d\x1c\
-\x0a\x9c\xda\xba\xe9\xd3f4\x0fn\xc0\x0a\x0dT\xcb\xa0\
-f\x18^\x1b\xe03\xb2\xb2\xc2\xc1\xc94\x10\xca*`\
-\xd0\x92\xe4\x9b\xd3t\xf3L\x83\x90\xce-\x12\xddNx\
-\x95Sf\x9e\x1dERrINt\x9e\xb1n\xdc\xb8\
-A\xc4\x83\xeb\xe3\xe2(\xe9\x925+\xec\x9e4\xca\x02\
-)\xc1\x92\xa12M\xdaL\x1aP\xb2\xad\x13\xf6\xc59\
-F2t\x12@\xfa\x88t\x964\xa0\xda y\x22v\
-\x8f\x0a\xde\xa2e!\x9ay\xc1\x11\xf9\xa5\x1a\xe9\x13E\
-\xa0\xbe\xd8\xd6\xf9\x14\xd7//\xe7\x08wX\xae\xb8%\
-^\xcaC\xcb\xfd\xfb\xf7\x09L\xb5\x11\xbbZ\xdb3\x0c\
-/\x83\xafW\xa1/\xbd\xf4\x12a\xe8\x94)S\x96-\
-[\xf6\xc6\x1bo\x10w\x12\x86\xea\xd7\xe1\xc7\x8f\x1f\xaf\
-\xdfI\x1a1b\x04A^\x9f>}\x08C)\x08\x0a\
-\x04}u\x0e7i\x09J\xba1N\x08\xe5\x90H\xef\
-\x0ay\xbc\xca\xe1U\x01vW\xbbW\x08E\xf4,\xd1\
-\x98\xcd\xaeB9 \x070\xd0\x843\xee|-I\x9a\
-`\xf8\x02\x0e%\xa5\xcf\xc4\xcaJp\x95y\x8d\xd5\x10\
-\x91O/\xac8\xc8\x12|:\x87i\xf2e%e\x1c\
-\xc8T\x88`\xafB\x1f<xp\xf5\xea\xd5\xf3\xe7\xcf\
-\x13\x86\x1e>|x\xeb\xd6\xadz\x03J\x00\x0a\xfa\xb0\
-;\xb1)z\x0c\x88V\xf5\xee\x93\xb2F\xbe\x0d_G\
-6\xf57\xeb\xd3x8>\xe5O\xe2\x0d\x01^[\x1c\
-\xb2g#\x82\xe7\x1d\xec\x9c\xcaj-\xf2\xf5BJ\xe5\
-\x82\x94\x10%\x85<\x13|\xda\x916K\x13\x16)\xc6\
->\x1f\x0d\x09F9\xe3\x8f\x1d;\xb6{\xf7n\x9e\xc9\
-\xf4\x92\x92\xd6\xb8\xdee\xb4C\x0dM\xbaX\x17\xe5B\
-(\x83r\x85W\xe5z\xf8\xa2\xfb\xb5\xdf\xaa\xaa\xaaN\
-\x0d\xfa\x1b\x1e\xadK\xe6\xe0\x18\xcaMF0\x85\x0cD\
-Z#\xa4\xb4\xdc\xcc\xa8\xa2e\xe0\xbe]\xbat\xe9\xdd\
-\xbbw\xb7n\xddX\xa5^\x9b\xc3Z\x98\x8f\xcc\x5c9\
-\x83\xc2M\x7fu\x1a\xc8\x08Usn\xe3\x13u\xbd\xab\
-\x1d\xc3\xc8\xebUh\xff\xfe\xfd\x87\x0d\x1bF\xc49g\
-\xce\x9c\x95+W\xbe\xf5\xd6[\xef\xbe\xfb\xee\xea\xd5\xab\
-\x97,Y2a\xc2\x84~\xfd\xfau\xed\xda\xb5c\x0e\
-\xd6\x14\xd3\xa4\xd5\xc4\xe0Gn\x93\xcc\x96\x03\xd9\x06\xd3\
-\xae\x91 \xd2I/\x15D\xa5\x80\x09\x054vSm\
-8g\xcf\x9ee\xb7\xb9t\xe9\x12g\xaa+Q\xa1M\
-\xa2\xf9%r\xd2t\x1b>;\x0ff\x13\x0a.\xa7d\
-TC\x88\xe9M\x10J\x82-\x814\xa1\x99\x88\xca\x1a\
-\xac,-.3`\x1c\xf0mbJ\x22\xc5\xeb\xd7\xaf\
-\x1f9rd\xe3\xc6\x8d\x04\xa0\x7fq|\xfd\xf5\xd7[\
-\xb6l9p\xe0\xc0\xd1\xa3G\xdd\xdb\xcf\xe4\xf5\xe7\xe9\
-\xd3\xa7\xaf\x5c\xb9\xc2\x12\xc8\xbcE&X*\xcc\xbdx\
-\xf1\x22!,wTw\xc0[4\x11\xd6\xa4\xa4{E\
-7\xaf\xf9hd{TJxU]O@\xe0\x9ce\
-/\xe5a\x9e\xab\xe9[\x8bp\xeb\x0e\x9b\x9d\xafa2\
-\x90\xa5\x90\x1e$\x87=\x15J\x16@N\xee\x13\xa5S\
-rI\x1az\xef\xde=V\xc8\xe6\xcd\x9b\xed/\xd6\xb0\
-\xae\xc8\xb2\xe6F\xedv=\xad\x83\xe9%d\x12Z\xd2\
-C\x8eL\xa6|\xf8\xf0\xe1\xe3\xc6\x8d\xe3@}\xa1\xdd\
-}\x09\xb6\x06-\x99s\x87\x94!\xa6\x8cr5P\xe0\
-\xca%+\x84 \x83x\xbdU\x1e\xd7\xb8)ahu\
-u5\x8f\x0d\xcc\x915U-DP#\xa5\xcc$m\
-`eq3\x84\xe4\x9a\x13\x84\xcbO0c\x9a\x81\xc3\
-\xe8\x83\x8f\xae\x8e\xf6\x09\xbd\xa3\x8f@gy\x06\x182\
-d\xc8\xec\xd9\xb3_}\xf5\xd57\xdf|S\xbf\x1aO\
-\x00:m\xda\xb4\xd1\xa3G\xeb\xf3\xa0\x9d;w\xd6\x1b\
-k\x0d2\x82d]\xa9PW\x91X\x04\xd3\x17\x09\xc2\
-\x0dv\x1dB\xbd\xc9\x12\xeaE\xa5lN\xb9\x12\xb5\xdc\
-\xb9s\xe7\xcc\x993\xfa\xc2\x9as\xe7\xce\xfd\xd8\x1a_\
-\x16S\xa1I\xd0\x9c2\x83z\x7f\x01>#p\x98P\
-p9O1MZH\x13\xd9p\xcd\xc4\x0c\xccFr\
-\xf1\x14_$\x5c\x5c\x8c\xc3\xa3G\x8f\x88A\xf5-H\
-\xfa\xba\x8f/\xbe\xf8\xe2\x8f\x7f\xfc\xe3\x9f\xfe\xf4\xa7\xbf\
-\xff\xfd\xef\xdb\xb6m\xe3\x01\x8c\xa3\xd6>\xfd\x09\x05^\
-\x7f\x16\x80Jx\x8a\xa3\xb6k\xee\xcbC\xb4\xb8\xd0\x87\
-\x0b\xbcad\x16w\xa3\x98\xe0\xd3\xad\x04\x0d\xa0\xa7\x99\
-\xc3\xa5\x8e\x87\xf8\x8c\x14aGB3\x95b/\xed\xdb\
-\xb7\xef\xc8\x91#\x09H|F+Acl3\xf7\xaa\
-\x00\xd7\xd8\xa7xm\xe0\xba\xea\xa6aY\xa1\xb1\xa3N\
-\xf1LT\xb0a4\xe4\xa8fU\xe0\xd6\xc4\xa3\xc7\x8e\
-\x1d\xe3\x91\x8bE\xc5\xe6\x82>lh\xe1F\xbb.g\
-4Z\xca(7\x19\x007\xd6\xc4X\x03\x07\x0ed\xee\
-\xf1\x80\x17\xdb\xce\x97\xde\xcbEB|F\x0a\x9f\xed\x0c\
-\xbc\x94\x85\x8c\xd3h\x97a\x85\xf4\xee\xdd\xbb\x7f\xff\xfe\
-\xc4\xa3\x05\x8c\x9b\x0fnj\xab\xc2\x1a\x10\xcd\xa9\x90\x12\
-B\x19\x94KY+\x0e\xa6\x07duV\xb2)\x052\
-\x05\x89Gm\xe4e\xd0\x9e\xa0S\x1d:t\xe8\xde\xbd\
-{UU\x15[!\xd1\xff\x981c\xe6\xce\x9d\xfb\xfa\
-\xeb\xaf\xbf\xeb@\x98?\x7f>a\xa8\xfdj\xbc=\x1b\
-\xb8!\xf1s\xe4\x87\xcc\xe1\xb6n?\xaa!\xca\xf5\x89\
-,\xc2\x5c\x19G\xa8\xda\x02\xa8,\xedQ\x0d\xec'l\
-2l,7o\xde\xac\xad\xad\xe5`\xde\xbau+\x1b\
-\xce\xad[\xb7dY\xa1\x8d\xc2\xe4f\xfa\x980=\x82\
-!\x8d\xf0\xaa\x1c\xd2(\xcb\x08\xb3$\x98\x0cJ\x96D\
-TPrZ#!\x02\xa5[m\x89c\xe3\xd5@@\
-ID(\xc7\xde\xb2e\xcb\x9a5k\xfe\xfa\xd7\xbf\x12\
-}\xae]\xbb\x16?'*\xc5\xcfO\x9d:\xc5\x09\x8b\
-\xff\xab\x86F\xc2\x1d\x89h\x01\xc1\xabr\xa8~\xd7\xd2\
-\xa7\x98>B\x1d\x09\x91R\xb9!VO+B\xc3\x0a\
-\xb4A-\x14$]o\x12\x94+\x94\x15\x0a\x86+\x97\
-\xbc\xfda_\xed\xda\xb5k\xab\x7f\x90]\x8d\x07\x9f\xae\
-\xaf\x83R\xe6#\xc9\xcd\x19\xbb\x7f\x0d\x9f\x94\xde\xd9\xd6\
-\xc1\xdd\xadP\xcd\x85i\xe0{#\xdc\x9a\xe7\xad\x1b7\
-n\xdc\xbd{\x97c\xc3\xf6\x97t\x13\xa3\xf6)\x09>\
-\x9d\x223\xcb\x8d@\xf2\xdd4]\xbat\xe1\x00\xd6k\
-\xbf\xf4\xbdZ\x0bZB{\xd2<\xe7>\xbd\xc7UM\
-M\xfa\x90\x13\x08\x05\x04f^\x0aPq\xc9*\x05\xee\
-V\x19\xf3\xad,\xd9`\xcf\x10\x0d\x1b6l\xc2\x84\x09\
-\x04(,\x15\xd9\xb4\x18\xec\xb6<\xee\x1f?~\x9c\x07\
-q|\xc3\xb6?5Or\x1auJHS\xc08\x8d\
-/\x99\x03\x8dn\x072h\x07\xd0\x17&W\x8e\x81G\
-u\xee\xdcy\xf0\xe0\xc1s\xe6\xccy\xe5\x95WV\xaf\
-^\xfd\xd6[o\xbd\xf9\xe6\x9b\xc8\xf3\xe6\xcd\x9b<y\
-21(\xb9\xc4\xa9z\x15\x8a=\xa54 B\x15\xaa\
-f#\xad\x11\xaeD\x86\xb1\xb5\x07\xe4\xa8>\xcf\xc1D\
-h[\xe0\x0a8\x86\x04MP2O9\xa4\x17\x98\xb1\
-\x9f<x\xf0\x80\xbd\xe5\xe2\xc5\x8b555\x1b7n\
-\xfc\xf6\xdbo\xf7\xec\xd9s\xe5\xca\x95\xf4iZ\xa1\x0d\
-!\x9f\xc1\x1b\xc1\xbc\xc5;A\xd6\xb6\xef3r\x14P\
-\xe6\x83\xbb`\x83_e\x1a\xab\x0d\xa1\xdf\x22\x1b^\x95\
-\xbb\xa3O8\xd2U\x192\x86P\x06\x1c[\x0fW\x97\
-/_>\x7f\xfe\xfc\xb1c\xc76o\xde\xfc\xf9\xe7\x9f\
-\xff\xeew\xbf\xfb\xc3\x1f\xfe@HJ\x18\x8a\xc3s\xaa\
-\x12\xaa\xb2\x04\xb0W\x85\x8d\x87\xbep(\xf4\xea\xd5K\
-\x7f\x82\xc4\x94\x12\xd2\xd0Z/\xe5(`\x0c\xc9`\xe5\
-F2\xbd\x0f\xb4\x16ac\xb8J\xc8$\xdd\xdfL\x22\
-3\x92lG\xf7\xef\xdf\xe7\x09\x99\xab\xd7\xb6\x124F\
-NnI]\xd3\x1a%\xf3\xa1\x81J\x08\x92N\xf4\xb5\
-A\xa8LC3\xbcT:\x0d\xff!\xa6\x8e\x0d\xe6#\
-\xf3\xf6\xbe\xe1\xf5u\x1e\xe8\x987\xcdc\xac\x9e\xbb\x11\
-Hb>BR\xaeR\x96\x03x|\xc7\x8e\x1d\xbbu\
-\xeb\xc6j\xef\xdd\xbb7\x11\x801`\xc0\x80A\x83\x06\
-!\x10\x14j\x17P/\x04\x9a\x02\xc8\xc0\xae\xa0\xdb\x85\
-H\xcf\xb8\xe9\x14\x97\x86\xc6\x10\x86\xda\x1fM\x95e\x8b\
-A3\xf4'\xb2\xce\x9d;\x87`\x0f*j\xaa\xf0\xa6\
-uq\xf3_\x07\xd3K\x88\xf0u9\xbc*\x874i\
-}\xdb\x85\xbe\x10S\xca\xc7\xe4W\xcc\xef\xdc\xb9s_\
-{\xed\xb5\xf7\xde{\xef\xc3\x0f?|\xff\xfd\xf7\xdfx\
-\xe3\x0d\x22\xd1\xa1C\x87\xf2\xb4\xa6\xf7\xa0Z)\xe6?\
-\x86*\xcc\x0d2\xc9\xe4\xbf\x10\xddT()\xbd\x90^\
-\x90L\x9c\xd5o\xfaO\xb3l\xd6\x10d\x13\x05\xac\x92\
-\x01\x03\xed$O\x9e<\xe1\x18\xd6\x81\xcdQ\xbdi\xd3\
-\xa6\x7f\xfc\xe3\x1f_}\xf5\xd5\xbau\xeb8\xa79\xc2\
-1P\xd9\x0am\x17\xdb\xc0\x954?\x91c\xc8%\xa4\
-1\xcc\xc6@\x13*\xd3\x06\x22\xac*\xb4\xd1]\x0c\xaf\
-\xcd\xe9\xe5\xab\x22\xd4 P\x89\xb6Y\xe5\x86\xfeL\x96\
-E\x03v/4\x9c\x8fx5\xc1\x0a\x0e|\xe4\xc8\x91\
-\xad\xee{\xe9\xf5\xcd\xc7\x08$\xf7\xed\xdb\x87\xb7\xf3\xe8\
-\xcen\xd9|\x1eNK\x042\xcd\x03\xc9\xc2z!\xa2\
-\xa4@\x19\x82\xc6\xba\x09\x92u%7\x1c\x99V\xc4\xb5\
-\xd4\xe3U\xf9I\x06%\xe8Q\x84\xb2\xd2\x06hp\x09\
-yE+B3\x98\xd0\xcc\xf6\xa3\xcc\xd4\x83\x1f\x9a\xdc\
-\xe0\xf8\x84C\x1aPq\xf0\xe9\xdc x\xbb\x00e5\
-f(\x1a\x1e\x8crc\xe7\xdeA<\x9ek\xa8i \
-\xd7\xd0\xfa\xbdA\xa8W\x86%U\xa7\x92\x91M\x13B\
-\xcd,\xa4\x22a?bc\xed\xd1\xa3\xc7\x981c\x16\
-/^\xbcj\xd5\xaa\xd5\xabW\x13\x13\x887\x1d/\xbf\
-\xfc\xf2\x84\x09\x13\xb0y.\xf7\xf9En!$\x87\x1a\
-#\x9f\x92A\x08\xc7V\xa8%\x5c\x95\x8b@<\xcaC\
-pk}l\x94\xc0\x82\xe7{\xf6\xd6\x87\x0f\x1f\xda\xb3\
-\x8a\xefC\xd6\xc4\xa5\x95\xea\x08\xc8\xbb\x84\xcf\xab\x0f\xdd\
-\xc5\x86Z\xca6\x87\xba \x98D\xbd\xed^\xb0`\x01\
->&\xd7z\xeb\xad\xb7\x90\xe7\xcf\x9f?e\xca\x94\xf1\
-\xe3\xc7\x8f\x1d;\x960\x94g!\xa6\x9e\x22n\x0c\xea\
-`\xd5\x0a%\x1d\x0cl\xf2_\x81\x11\x96}X\xd0M\
-\x88\xc74\xae\x1e\x0f\x96j<2Yn\x9fH\x9e\x97\
-\x00\x97\x00=\xc7\x0a\x02\xd0;w\xee\xe8\x0b:.^\
-\xbc\xc8\xd9\xbc~\xfd\xfa?\xfe\xf1\x8f\xbf\xfd\xedo\xbf\
-\xfc\xf2\xcb]\xbbv]\xbdz\xb5\x12\x89\xb6\x1b\xccg\
-\x84%C\x07K\x13e\x99SE\xb5\xa5\xc9\x5c\x0e\x99\
-\xc8>rW\xc9x\xa9d\xd9H\x09\xba\xbb\xca\xaa\xa0\
-4\x18S\x840\xf4\xee\xdd\xbb\xfa`\xe8\xfe\xfd\xfb\xbf\
-\xfd\xf6[\xbc\xfa\xd7\x8e\xcf?\xff|\xfb\xf6\xed\xe7\xcf\
-\x9f\x7f\xf0\xe0A\x93\xbf\x0a\x8d\xa0U\x97.]bY\
-]\xb8p\x81\xdbq#52l\xbc\x1b\x80:$%\
-\x03\x22\xa5\xca\xa6\xe1^\xd4o\xb7(\x07\xd4\xec\xb0\xf1\
-i\x8ai-6BI*\xe4\xf4\xe7\x9c\xed\xdb\xb7/\
-\xcf\xffR\xb6\x16\xd6*\x11v\x169L\x1a\xd2\x1b^\
-\x1b\xe8\x91\xad\xbf\x12B\x9cm\x0cz6s\x9f(\x9d\
-\x86\x07\xa3\x11j\xa2\xf0\xaa\xdc\xa0p\xd5\x86 eH\
-\xd8g#1\xcda6\x86m.>\xddt\xe0[\xfa\
-\x18\x00\xb1c7\x07\xb2\xdewr\x95\x10RUU5\
-h\xd0\xa0\xc9\x93'\xaf\x5c\xb9\xf2\xbd\xf7\xde\xfb\xe4\x93\
-O~\xf6\xb3\x9f}\x96\xe3\xd3O?\xfd\xe9O\x7fJ\
-\x16\x81\x02UQ\xb9;\x9d\x9f6>\xbcF8\x13O\
-\x94\x04\xd9D\x84Y\x92u/iZ\x18m\xc4\x04\x10\
-\xda\x9d\x85\xcf\xcbB\x0d\xf6\x89\x9c?\xd8\xce\x9e\xbbz\
-\xbd3\xf1\x84\x1aU\x02\x96\x94\xd0\xe6`\xe2^|\xf1\
-E|F.7`\xc0\x00\x9ev\x96,Y\xf2\xce;\
-\xef\xe0c\xb8\xd6G\x1f}\xf4\x93\x9f\xfcd\xee\xdc\xb9\
-\x04\xa0\xf8j\xe7\xce\x9d\xf5*\x94\xb0\x95^;/K\
-\xa6\x9e\x91\xb11\xcc$\xca*`\x99\x0c\xab\x1bOl\
-2\x91\x99!c\x09B2\x0d\xb3\xa72\x9cD\xbfG\
-\xac\x9f\xc5\xff\xfd\xef\x7fw\x7f\xc80\xf9K\x86zi\
-t\xf0\xe0\xc1S\xa7N\xdd\xbcy\xb3\x12\x89\xb6'\xe4\
-\x9c>\xe1\x90\xffD\xca\xc2\xc8\xeb\xc0\xa7s\xa45\x90\
-\xf8_@\xb2<\x1c>\x1d {U\xe2\x8dr\x0fT\
-\xda\xd0pZ\xa1x\x8b\xf5e/\xf5\xb9J\xe6<\xd6\
-W\xd6\x1f>|\x18\xc7\xfe\xea\xab\xaf\xf0j\x1e\xab\xf0\
-\xeaM\x9b6\xed\xde\xbd\xfb\xc8\x91#86\x9e\xdf2\
-\x8eM#y\xd2;}\xfa4w\xa4\xd9\xea&Jd\
-\xae 3\xa1\x5c7\x18\xf1td\x8e\xad\x81=U\xb1\
-\xa2o9\x10\xa2\x9a[\x11Z^\xb8\xf1i\xcc^e\
-\x85%\x11l|H\xa6\xc7\xaa\xd5I\xe6\xcfaI\x09\
-\xf9\x901\xf8t\xd0S\xbb\x86hrC{\xc98\x95\
-\x92\x0d\xa0\x9e&\xe6\x83%\xca1\xc9\x01I\xbc5{\
-\xf6lNM\x9d1\xb4R\x06\xb4\xccd\xa1\x0e\x98\x12\
-\xe3\xa4\xeb\xae\x03\x91\xa5\x94\x86\x92\x94e\xa9\xb3\xa88\
-\xa5~\xf7\xbb\xdfm\xd8\xb0\x81\xa5\xd5xwW\xe5\x5c\
-9\xcb\xfb\xf4\xe93l\xd8\xb0~\xfd\xfa\xd1\x17m.\
-D\x90\x1c\xf3\x8a#1\xd3\x15h0EHv\xea\xd4\
-\x89xt\xfc\xf8\xf1\x84\x05<$\xd9A\xab\x1e!S\
-V\x1f\xdaC\xd6\xbd\x94e\xf7\xb5k\x1aY\xda\xe0 \
-D\xb2 I\x0d\xa0$\xdep\xfb\xf6\xedm\xdb\xb6\xfd\
-\xe7\x7f\xfe\xe7\xbau\xeb\xae]\xbb\xa6\x22-\x06\x9de\
-LV\xadZE\xf04i\xd2$\xe2\xfbt\xf7#\xc8\
-\x0a\xa7R\x1d\x01d\x95\x92`\x90T\xae\x11&\x919\
-\x0f\x08q~\xf3\x9b\xdf|\xfe\xf9\xe7\x17.\x5c`6\
-}^\xb9\xa2N\xa9w8\x12\x03\x88G\xf5\xec\xd9\x93\
-\xa8\x14\x0f\xc4'\xc7\x8d\x1b7z\xf4h\xbdb\xc7\x06\
-\xbfB\xd0\x1bq\xd5\x006\x08\x18X\xd2U\xe9\xc70\
-\x22\xbd|B\xcbh\x84\xc9t\xba\x04\xaf\xc8_\xb9\xd9\
-\xc8\x80\xa4\xd6>\x90\xc4Euf\xeb7\xe5w:\x98\
-&\xbdJ\xd7y\xa6\x0f\x1cc\xafz\xda\x1f\x8c\x83\x97\
-\x8a\xa6\xad\x8f\x06\xcfW<A\xf1\x94\xbex\xf1b|\
-;\xf2^\x0d\x88\xfa\x18\xf54\xf1\xa1\xac\xe1B\xa9\x07\
-0\xe5r\x8d\x0a\x92\x04|\x0f\xcc\xc6\xae\x86l$p\
-U\xaeJ)\x0bw}\xf0\xe0\x01\x0eI\x16mf\xe9\
-\xb1\xab\x03z9mr\x9b\x1c\xb87J\xfc\x99\xb8s\
-\xef\xde\xbd\xe7\xcf\x9f\xc7\x99\x09O\xd9\x96\xb9r\x8aa\
-\x93\xdc\xb5\x05\xe1yu\xfa\xf4\xe9\x1f\x7f\xfc\xf1\xab\xaf\
-\xbeZUUe\x83`\xdbr\x8e$\xc5\xffu\x951\
-a\xfb%'\xdd\xfe\x7f\xff\x8f\xd1\xa0\xb3\xdb\xb7o\xff\
-\xf6\xdbo7o\xde|\xee\xdc942kIp\x09\
-\xf6\xc9\x15+V\xfc\xfc\xe7?\x9f9s\xa6\xbew\x09\
-\xd4\xd4L\x8a\xcfRU\x80W0\xad;v\xec\xe0\x88\
-\xa1\xbf'N\x9c(PIs\xc3jZ\xb4h\xd1\xfb\
-\xef\xbf\xcf\xfab~-b\x01\x9a*!$\xb3S\x12\
-\xc2,dK\x86z\xa1R\x91\x0dQ\xd9\xe0\xc1\x83\x95\
-,\x95B>W\x00\xba\x1a\x06\xa3\x8c\x85\x02\x0ek\x96\
-5TIH\x9a\x9c[\xf3\xa0e\x00\xca\x92RHi\
-(I\xc1&\x0fFi\xb3\xbeg\x91m\x05\xf7\x9d0\
-a\xc2\x9c9sF\x8d\x1aE\x92]\x83\x08\x86,\x5c\
-9\xfc\xc4'Wu\x04\x0dNO\x0d\x04[t\x9f\xd5\
-\x9e\xb9\xb7r\xd5v\x89\xac.\x87\x9d%\xa9\xac|\x84\
-\xc6&'\xb7w\xd0}\xae\xd4\xa0\xfb\x22\xb3\x0f\x02g\
-<;\xc2\xaf~\xf5\xab\xd6\x0aF\xab\xab\xab\x09F\xdf\
-}\xf7\xdd\x22\x83\xd1\x08\xf5\x0b\xc1\x8c\xdd8=EY\
-\x96\x1bAq\xe6\xee\xc8\x91#\xbf\xfd\xedo\xdbD0\
-J\x8fp9\xb9\x22\xceF$\xca\x1e\xca\xe11p\xe0\
-\xc0\x8e\x1d;\xa2\xc4\xbb\xf0O=\xedh\x04\x04e5\
-\x08\x5c\x95\x04\xcb2\xa2\xa4\x91^>\xa1e\xe6\xf0&\
-\x83\x1e\xe8\xdd\xad\xb2+\x17\xe4\xaa\x08n\xc9\x95;\xb2\
-\x8a\x8959\xb48\xab.]\xbat\xfa\xf4\xe9\xfd\xfb\
-\xf7\xeb7\xe55\xef\x5c9\xdd\xd3mk7\xb0!0\
-\xddL\xabv\x06\xba\x8c2\x1aF%\x95%\x81\x01Q\
-\xdc\xd3vG\x86\xbd\x94\xc3\xf2\x93O>\xe1\xe0\xd0\xfb\
-\x8b\xb0\xd7&\xab\xd7\xd6w +\xb44P\xda\xc6\xe2\
-L\xea\xd8PC\x08\x1a\xb3t\xf9\x09\xd2K\x00\x8d-\
-\x06\xd2\xe3\xabl\x1dl\xa7g\xcf\x9e\xc5c\x19\x7f\x99\
-\xb1\x1e\xfb\xf4\xe9\xd3\xbd{\xf7{\xf7\xee]\xbcx\x11\
-\x03\xa2.\x95%\x17W\xc7\x12\xdf>t\xe8\xd0\xb1c\
-\xc7\x88A5knon\x9d\x0f\x17v\xea\xd4i\xea\
-\xd4\xa9\x04\xa3l\xcb\x04+\x0c\x9a\xf0\xd99\x92\x11\xcc\
-3\x98!\xf4\xd1K\xc1 \xd35F\x83.\xafY\xb3\
-\xe6\xbb\xef\xbe\xab\xa9\xa9aX\xd0{\xbb\x16\x84e\x15\
-\x06\xa3l\x9b\xf4\x94\xee\x84\x0b'\xea]\xe1v\x86\xb9\
-n`\x92\xb2\xd4F4\xb2v\xed\xda_\xfe\xf2\x97\xc4\
-$tV\x06\xad\x02\x11\xc8\xd2\xa5K\xed\xcd {K\
-8\xb9Qg3\x09m\xc2\xfe\x9a\x9c\x1e\x22+bY\
-\xf8\x00\xdb8\xe7\x97\x92\xa5R\x7f+3\xa1\xaba0\
-\xaa\x176Q\xff\xa3\xb6r5H\xca?\x22\x1b0\x8d\
-\x09\x82\xb9o\xaa`\xd4\xdd6\xf9R\x86~\xfd\xfaq\
-\xde\xb38yd\xe7:b\xc4\x08\xe2\xd1\x01\x03\x060\
-\x97\xecA\xec/t\x8ah\x80\x93\xc3\x97t\xcd\xf6R\
-\xae\x1el@2\xf8\xbc\x1c\xa6T\x7f\xa5\x09;+e\
-\xbdX\x11\x91\x0c\xa2\xdb:AY\xa1\x86M\x81`T\
-oF\xaf^\xbd\xaa\x22-\x06\xa3\xa1`\xf4\xbd\xf7\xde\
-\x9b8qbf0\xaak>\x5cW\x12|\xdaa\x0e\
-\x03$\xd3\x06\x02%#\xc0\xf4\xb1\x1b\xb6\x89`\x94\xad\
-\x93C\xba\x7f\xff\xfe\xb8\x22\xfb\x08K\x89'K\xfcp\
-\xf4\xe8\xd1\xb8%\xbd\x06\x06\x10\x9f\xb4\xbeK\x00\xd5\x90\
-\x16\x80A\xd0\xf88\xc3\xa7\xfa\x107\x84\xe1\x18\xd61\
-\xac\x9b\xe5q:\xaf\xc7 \xb3ri\xb8\xd2\x06i\xb0\
-D\xd6\x8f/\xd9\xadN\x9c8\xb1s\xe7N\xbd4\x22\
-\xc9\xa2\xc6cY\xdd2n\xc70&L%'\x07\x0b\
-\x84h\x86c\x92i\xd58'\xe3\x98\x1bI\xc9\x1a4\
-\xf2\xf8\x87h\x86\xf8\x86\x07K\x22xVt\x99?\x5c\
-\xe5\x83\xfe\xf2\xb4\xff\xe1\x87\x1f.^\xbc\x98\xfdV\x0f\
-\xf9\xe6f\xd6}az\x11\xe5\x1a\xe8\xa9$\x19/\x87\
-\xd7\xba\xe2\x86W\xe5\xc0\xcc\x94\xb6LD\xa8g\xc0\xf5\
-\xf2\xfe\xf8\xf1\xe3\x9b6m:p\xe0\x00^*\x03:\
-2|\xf8p\xd6,\xae\xcbs\x94\xbel[YTN\
-Y\xe6\xeb\xc1\x83\x07\x84\xa1e\xf2\x82\x9f`t\xda\xb4\
-i\x1f}\xf4\xd1\xeb\xaf\xbf\xce\xa9\xa7\x11S\xab\xc2\xb6\
-%#\xe809jyf\x92+Q\x08\xdd\xc4?9\
-\x9d\xff\xfc\xe7?3\x5cx)\x1a\x99\xb50\xe9`4\
-\xb3/h$\xa0\x8f\xb2\xc0r\xc1r\xa5\xd4\x95\xde\x11\
-\x81|\xfd\xf5\xd7\xff\xe7\xff\xfc\x9f\x1d;v\xe0-\xce\
-\xa4\x15\xa0=l&\xf4\xf7\x9dw\xde\x99>}\xba\x82\
-Qk\x7f\xd8\xe6\x02\xc8 =\x0e\x22\xd2\x93\xc4>T\
-J\xd6&\xcf\xd2\x96\xb2T\xeaib>\xf0f\x0bF\
-g\xcd\x9a\x15\xbd\x19\x95\xaf\xcb2j\xb1@\x8e\xc6\xc8\
-\x04\xa1\xa4,\x95D&:d\xfa\xb7m\xdbVd0\
-\xca\x94\x80^?\x90\xe4\x0a$_|\xf1E\x22$\xe6\
-\x8f\xe8s\xdc\xb8ql+\xcc\x1f.\x8b\x07\xf3\xb0K\
-.\xed\xa7f=\xc5RC\xd8/\xae\xd6*\x04\xd5,\
-=\x90T.\x82\xda\x96\xdc2\xd8.C\x1b\xcb\x95,\
-,KXn\xa4\x074\xdc\x82\xab!%\xcdf\x03m\
-\xf57\xa3\xaf\xbd\xf6\xda\xbb\xef\xbe\x9b\x0eFA\xad\x05\
-%\xd3(+2\xa0x8\x8c\xae\x82\x04\xe5\x0a\xb2\xd0\
-0\x02\x16\x8c~\xf1\xc5\x17e\x18\x8c\xd2N\xbd\x1b\xe3\
-\x8a\xe3\x0d\x192d\xd2\xa4I\x04\xa0\x84\xa1\x04\xa6\xc4\
-\xa0,(\xf4\x8c\x9b\xeb\xae\xef\xb8\xa6[2\x82\xae\xaa\
-\x0d\xa5j\x96FW\x03\x03/\xd5%2\x8e\xccL/\
-!]I\xa8O\x97\x05&B6l\xdc\x9c\xca\x04R\
-\xa7O\x9f&\x00\xe5t\xdf\xb7o_mm-\xa7;\
-Y\x84\xa1\x85\x17r[\x87\x89V\xe0\xc5\xe6\xc3\xe4\x8e\
-\x1c9\x92\xc8`\xcc\x981l;\xf6\xa0\xcb\x00\x82&\
-W\x1a\x1b\x13\x04\x86\x88E}\xea\xd4)\x82x\x86\x8e\
-1d\xd3Wn\x1b\x82\x90h\xec\xd8\xb1?\xf9\xc9O\
-^}\xf5U\x06A?M\xa2\xbfr\x12\xeb8H\x13\
-a\x96!(A\xe3\x06^\x9b\xf3@\xa1\xa4\xf4 3\
-\xad&]\xb5\xd5\x83\xd6\x11c\xab\x97\xf7p\xe9\xd2%\
-\x1c\x95h\x83'({^b\xd6\x08\xe98\x01\xf1j\
-lp\xe3\xc8\x81U3\xbe\x1d\xe9[\x0b\x86z\xea\xd4\
-\xa9\x04\xa3l\xcb\xc4\xd0\x0c;\xcapL\x84F\xc6\x0d\
-\xa4\x17\x22\x9b0i2\x82\xb6\x5c\xc6j\xed\xda\xb5\x7f\
-\xf8\xc3\x1fv\xed\xda\xd5\x8ao\x0a\xe9]1\xc1(\x98\
-23\xcbKA\xae\x94\xba\xd2e\x1eE\xfe\xf1\x8f\x7f\
-\xfc\xfb\xbf\xff;\xee\xd1\x8a\xeb\x91\xbd\x85\x18f\xd5\xaa\
-U<i\x10\xcf\xd0_-+\x9f\xed\x1a\x1c&\x0bS\
-x(\x046\xc2\xa7\x1dJ\xb2F\x18|iJ\xa5\xd8\
-&F\xb0h\xd9I\x17.\x5c\xf8\xfe\xfb\xef\xf3\xb0\xcb\
-\xb2\x0c\x0fN\x0c\xac\x03a\x8b]\xfb\x13\x90\xcd\x00$\
-'\x85\x03\xa5\xcc\x04u\xb2\xaa\x09Fo\xde\xbcI0\
-J\x90\xb1~\xfd\xfa\xc2\xc1h\xc7\x8e\x1d\x07\x0c\x18\xc0\
-1O|\xa9\xb6Q!\xf50OL\x1eG>\xbb\x09\
-g\xff\xd0\xa1C\xfb\xf6\xed\xcb.\xa9\xc8 \x0c\x9b\x5c\
-K\xfd\xbb\x1f\x04U\x0b\x92]\xa6\x0fFAf\x92\xa5\
-\xb7\xb6!\xabN\x03\x03\xe9\xedj(\xcb\xb0\xdcPo\
-5\xd8\x15\xb8\x9d\xae,\x126\x82r\xf8\xcchf0\
-\xaa\xd6\x1ah\xa2\x110\x94k`f\x95h\x04\x84r\
-\x85\xf4\x8c\x00\xcf\xa9G\x8e\x1c\xe1\xa1\xe5\xcb/\xbf,\
-\xb7`\x14\x0f\xc4\xfd\x06\x0e\x1c\x88\x7f\xea7\xe4pB\
-B\x13\xae\xac#\x9cSOP@w\x80\x22\xea\x97\x90\
-\x92~\x93CRu\xa2\xb1\xab)A\x9a|\xa86\x93\
-%\xb8\xca\x13\x94\x04\xc9f\x99\xbe\x0bX\xae\xdc\x9e\x5c\
-\xc6\x1c\x98\x0b4\x0f\x1e< \x90\xda\xbau\xeb\xee\xdd\
-\xbb\x09IY\xb9\xec\xe3\xf7\xef\xdfo\xadw'-\x06\
-O\xb6<\xf4\xea\xe3\xbfl/$\x99n\x9e\x81G\x8f\
-\x1e\xcd\x1a\xc1\x0d\x98e\xcc\x18=\x1b@\x03\x8d\x0d&\
-\x03\x85K_\xbe|\xf9\xf0\xe1\xc3[\xb6l\xe1\xf0c\
-<\x19@Y\xb6\x15\xe8,\xe30{\xf6\xec7\xdf|\
-s\xf9\xf2\xe5\x8a\x8a\xac\xe3n\x0c\x9e\xbaV\xe4``\
-\x96Q\x16\xdb\x82v\x063\x00l\x00\xf7C\x96^\x1a\
-\x97\xf94\x17\x17\xe5\xf8T\xd4(3\xe4\xdb\xb7o\xb3\
-{\xfc\xf0\xc3\x0f\x07\x0f\x1e\xbcr\xe5\x0a\xbe\xca.\x8a\
-\x0fk:\x00K\xa6\x92\x09U\x0d\xe5\xef\xc6\x16\x8c\xb2\
--\x87\xc1h2d\xc1\xa0\x81\x92v\xc5\xc6\xa9=a\
-\xd2d\x8d$\xa73K{\xcd\x9a5\x7f\xfc\xe3\x1f\xf7\
-\xee\xdd\xdb\x8a\xceI\xef\x8a\x0cF\x01e\xa2\xcdea\
-\x16\x09FT\x03\x93N4B0\xaa7\xa3\xad\x15\x8c\
-\xd2\xaa\xaa\xaa\xaa\xb9s\xe72\xb3\xc4c\xd5\xd5\xd5\xb8\
-%J\xf0\x16\xb9\xbe\x84\x8d\x97A\xa4\x91\x90\x0cH\x96\
-\xde\x04!3\xf0\xe9\x5c\xfd\x0c\x0b\x87\x9a4\xa5\xd2\xf0\
-\xaf\xfe\xe1\xc8\xe4)\x1f\xcf\x06\xe6\x9bd\xd2?\xd7b\
-\x13$K\x80L%\xa4m\xc2N\xa2\x014Z\xf9\x17\
-/^<t\xe8\xd0\xe9\xd3\xa7\xd9\x1dB3A\xdc\xc3\
-6A{8\xe9\xf5\xb7\xb9\x17-Z4k\xd6\xac\xe9\
-\x8ei\xd3\xa6M\x992e\xf2\xe4\xc9\x93&M\xe2\x19\
-\xdd\xfd!\xaf\xa4\xf1D\x00L!]\xb0p\x07t_\
-\x88d#LJ\x0e\xaf\x86)#,\xab\x00f\x10Z\
-&\x85\x83:\xa5\x14\x0c\x08;&\xa3\xc4\xf3\xfa\xfe\xfd\
-\xfb9\xb1\x18%\x9f\xd7R0\x86z\xfd\xc3S\x1a'\
-1\x03\x9b>*\x222\xb3Be$[2\xd4\x83\x92\
-\x0c\x02K\x82\xf3\x83\xb3\xe4\xe8\xd1\xa3w\xef\xde\xd5\x99\
-\xd4\xba\xd06\x86\x82g$6J\x06g\xc1\x82\x05\xcb\
-\x96-\x9b?\x7f\xfe\x8c\x193\xf0F\x02\x14\xf6\x14=\
-\x141\x5ca\x8c\x02\xaa\x01$\x9b.\xca\x0a\x93\x22\xad\
-1\x94\xe5\x0a%\x98\xec2\x0b\xc1\xf0\x82\x8cC\xa4g\
-\xe4\x19m\xc6\xbc\xb6\xb6\x96u\xca\xa1\x8e@\x08\xb5s\
-\xe7\xceM\x9b6qJqb\xdd*\xb3_\xb6m&\
-\x98n\x1et9\x0e_}\xf5\xd5%K\x96 h\xff\
-\xd1\xef;\xb2e3\xddlV\x0ak\x80\xa9\x17\xc8\x91\
-\x92\x0d\xea\xc5\x17;\xd8+s\x06\x99u\xcd8k\xd8\
-\xdb\xcaH\xd2T\xda\xcc\x95\xcdY\xbf\x8d\x97\xdeo%\
-\x87`\xcf5\xcc\x0de!\x0d\xf8t\x0a*Q=\x82\
-f\x10-\x11h\x9e8q\xa2\xc6q\xec\xd81\x1c\x15\
-\xd81\xd87\xfe\x7f\xf6\xfe\x83\xcf\xae\xe2\xda\xf3\xc6\x9f\
-\x19\x13\x94S+\xe7\xd4\xcaYB\x19!D\x10\xc1\xd8\
-\xbe$c\x1b\xfb\x86\x99\xf9\xbf\x92\x99\xb9\xf3*\xe6^\
-\xff\xaf\x01\x03&\x18L\x14B\x12B9\xe7\x1cZ\xb1\
-\x95\xd5\xca\x80g\x9e\xe7\xbb\xebWgu\x9d\xda\xfb\x9c\
->\x9dN\x1f\xc1\xf9~\xc4f\xd5\xaaU\xb5+\xac]\
-\xb5j\xf7\xe9\xd3\x84\x17\x04\xfd80\xdb\x0d\xb1)+\
-jX\x1c\x98\x02\x05\xb2\xf7\xc5\xe0\xe3H\x03\x07\x0e\x9c\
-2eJmm-\x81\xa9\x0dT\xd6\xa0%\x8a\x94\xd2\
-\xe3\xcc\xe3\xb2\x5c\x19\x1c\x86\xf4\xc6\x8d\x1b\x0c#\x83\xc6\
-\xa9\xc9\xde\x22\x97\x1f\x9c\x8aev\xf4\xe8\xd1<kx\
-\x1a\x8f\x9255\x9b\xfc`\xc3KYrR\x8b\x13\x9c\
-7\xfd\xbf\xf4\x91\x9e\x1e;v\xac\xbe\xbe\xbe\xfc\xfb\xac\
-\xa0=<G,)D5#F\x8c`r\xa3\xddV\
-\x02\xadURX\xae\xe1J\xc4J0e:W\x9a\xa4\
-\x98C27\xfa_\xff\xeb\x7f\xb9\xfcf\xd3\xf2`\x14\
-\xe7\x03\x16J\xd6\xc7\xbe}\xfbj\x1f\xd5IW-\xcb\
-DY\xb2\x116v`\x06\x99h\xfa/]\xba\x84\xc7\
-\x13\x8c\xb2\x9aD\x0b\x01m\x182d\xc8\xa4I\x93\xd9\
-\xddY\xfa9(\x10\x86\xf2\xf8\xa1\xe4Q$h\xe6\x0a\
-\xec\x104\x98fw\xeb\xd6\xadS\xa7\xce\x0f>\x98\xbc\
-\xb7S3\x9a\x9c\xb3L\xac\xa0\xaeV\x0aA\xb2\x844\
-2\x0b\xf1\x199\xbc\xd6\xe1U\xf9\x95\x03\xb25\x1b\x01\
-\xee\x97`TJ\x08\xe5\x90\xb4^\x9a\xa4\xb0\xc3:\x1e\
-\x82\x12\xcf\xbcr\xe5\x0a1P\x85\x04\xa3<\x17\x04\x1f\
-\x84 \x93'Of\xd5\xe0\x98\xb4`\xc1\x02B\x13}\
-\xf2\xac\xa6\xa6\x86E\x84E\x133\xe7\x89\xc9p\xe9\xaa\
-\xe2Q7\x93\x81p\xf8tQ\xbci\x0aeE\xd7\xc4\
-{RC\xaa\xac\x104\x98\xd9\xd3G\x92\xd6\xa2\xc1\xf1\
-\xf07\xf6$v\xf7U\xabV\xadX\xb1\xe2\xdbo\xbf\
-%\x0c\xdd\xb1c\x87\xbc\xf1\xda\xb5k\xd8\xfc\xe8\xc3P\
-`1\xc4\xf99ip\xe4`\xae9\xfa\x0e\x1b6\x8c\
-\xc5\x87\x95\x87\xcd\x83\xe9\xc6\xc0Mu\x82\xc6\xd3\x95K\
-FRn\xa0Q\x05\x0e\xd8h\x14\x97*<%6%\
-$\xe5\xf4\x82S\x91\xa5\xa8\xc8\x15\xaft\xe8\x0e\x8dg\
-q`\x89f\x1c\xe8\x9a\xba\xc9\x15dc\x82\x08\xb32\
-I\xdb\xa7}\x18\xb8\x0b\xeb\xc0\xbd{\xf7\xe4\xa2\xec \
-x\xe67\xdf|\xb3v\xed\xda\x8d\x1b7\xcaK\x05G\
-&\x0eQ,\xa1\x98\xdd/\xe1fq\xc2`\x14\xcf\xd1\
-\x80\xa3O\x0f\xac\x14\xd1\xf8\x99q(\x80e\x01c\xcb\
-p\xe9\xe4Yi\xc1h\xd8\xdf\x10\xd9\x9b\x00\x85\xe40\
-e\x12\x8e\xc1\x99\x84\xfd\x85\xbd\x86\x03v\x87t\x99\xc6\
-\xd0AV\x95\xe1\xc3\x87\xd3Y\x16\x16\xfd\x1cRY\xd6\
-\xf1\x10\xd3\x14Y\xea\x11\x84\xc9\xd2GET\xbfru\
-\xc5\xe0_\xff\xf5_]f\xb3iy0\xca]\xf1?\
-\x96B\x86\x80\x90\x9c\xf8C+\x8b\xb2$d\x92\xb4=\
-\x87u\xc6\xf0F\xf9\x98\x9e\xe9'\x06\xc5\xd7\xf5)~\
-\xee\xc8c\xc6d\xb0\xc0\xf5\xe8\xd1c\xe8\xd0\xa1\xac\xfb\
-O>\xf9\xe4\x92%K\xd8\xe9\xd9\x00x\x02y\xf60\
-\xc0L \x0b\xd6tM\x9b\xddWW\x1bn%E$\
-+)\x01\xa4\x0f\xf1\x19925m\x8b\x9a\xcd\x95!\
-\xba_\x82Q\xa3P\x96J\x81%\xedZ\x08F\x00\xf0\
-\xcc\xabW\xafrF'*\xea\xc0`\x94\xa6\xe2i\x9c\
-\x91\xd8w\xc7\x8d\x1b\x87[>\xf1\xc4\x13\xfa\xa6\xfa1\
-c\xc6DG8\xd9\x97\xf2D\x14\xd1{) S)\
-\x94U\xc4 \x84Q\x95\x10\xd9\x93\x04}\x84\x86\xad\x88\
-\x01\xdf\xbbw\xef\xe6\xcd\x9b\xd9\xe6w\xee\xdcy\xea\xd4\
-\xa9\xf3\xe7\xcf\xf3\xc02\x1dw\xef\xde\xed\xa8\x89(?\
-\xcc,\x8f\xc0c\x8f=\xc6t\x8f\x1a5\x8as/\x9e\
-\xa0\xf5\x87\x19\x0fg\x19c\x9eY\xf9-\xc3\x9c\xf9\xb0\
-\x90\xd4\xf8\xb3\xf9Q\x9c\xe7\x8b\x83\x0d\x1e\xc5\x0e\xc4\x8d\
-\xc8R\xc0dB\xc5\x82\xab3\x14\xac\xcc\x04\xa3\xf8\xbf\
-\xad\xc0>;\xc0\x8dAI\x9e)3\xfa.\xc1\x92\x90\
-d\xbb8\x89q\xc3\xfd\xf4\x22\x83h\x09pNb\xd0\
--[\xb6 \x9b\x97\xd6\xd7\xd7s\xbd|\xf92q\x15\
-\xf6*\xfe#\x00\x9f\xe1\xd0K0\x8aO*\x18Ei\
-\xc3k\x03\x15\x0e\xa0\x085\xa1>\x82\x1a\x18\xe4\xca\x0c\
-F\x89\x0dhy&\xbe\x80\xeb\x9a\xf0iG\x91$\xb2\
-\xfc\x96+O\x1c\x0e\xa3\x8f\x0e\xfb\xec2\xa2V\xb1\xaa\
-\x10\xfc\xd0e\x0b\xc3\x84lB2\x95 {\x91N\x86\
-dz\x8b\x99\x91\xdb\xe2`4q\xca\x16\x83\xc3\xb1\xd3\
-\xe3\x82lE\xf8\x22\xb3\xc23_\xca~\x93t1\xc0\
-k\x03\x22=2\xb3\xceB\x86c\x11_\x12h>\xee\
-x\xf4\xd1G\x17/^\xcc\x15\x96.]\xba|\xf9r\
-\xfd\x5c~\xce\x9c9\x93&M\xc2\x92\x85OA' \
-\x08d\xaa\x02\xf9\x93a\xa3,H\x9a\xc6\x04Y\x9a \
-\x94\x15Q$\xab\x9d\xb0FV26,\x12\x22\xd0\xbb\
-QOp\xe6\x1e\xcb\xd5\xb58*kE:\x0a\x1c\x8c\
-\x18\x94\xd5\xff\x91G\x1e\xc19\x9fz\xea)\xbd$\x9b\
-1c\x06J\xfb\xa1<fj\xa7zmq\x09\xa8\x9e\
-\x88\xa8S\xae\x97\x1e\xaf\xca\xa7P=\xcd\xc2\xea\xa76\
-\xb5\xd0\x94\xc8\x1c~\x885\x89A\xbf\xfc\xf2\xcb7\xdf\
-|\xf3\xad\xb7\xde\xfa\xec\xb3\xcf\xf6\xed\xdb\xc7\x1a\xcd\xd1\
-\x91M\xfd\xde\xbd{?\x8e7L\xa5\xc3\xf6\xc0\x14s\
-Jg;\xd4*\xc4Dk\xf1\xd1\xa0\x85\xa0\xd1\xfaf\
-\xce\x00&\x80\xcc\x10\x08g\xa9m\x98\xfbn\xe3\xd9\xb3\
-g\xe3N\x1coX\xf7\x96-[\xc6\xa2Gl\x1a\xfe\
-\x10\xb6\x92Q\xaf\x85i\xd4\xc7\xe6\x11t\xd6\x9e\x1dd\
-\xd5\x8c\x8cs\xe2\x84\x9c\x94\x8889#}\xfc\xf1\xc7\
-\xb8\xe8\x1bo\xbc\xf1\xd7\xbf\xfe\x95`\xf4\xf8\xf1\xe3x\
-)\xbb\x18\x87v\x90\xaf\xdeGo\x9aKG\xc3\x12\x0a\
-\x85H\x1bH\xd3d\xc1\x8a\xc5|\xacm\xe1\x99e\x0d\
-\xaf\xa9\xa9\xe9\xe3\xbe\x10\xba\x9d\xeeR\x1c&\x05_\xc5\
-\xc3\xf1\xde\x22N\xeb\x9e\x86\x04\x9f.0\x9bRF\x96\
-\x85H\xd7PJ\xa9\x22\xb4<\x18\xa5)<\xfc<\xba\
-\xd7\xaf_\xbfr\xe5\x0a\xc3\xc1X\xa0,\xb1'2\x03\
-\x9f.\x8c\x99qe-\xee\xdf\xbf?\xcb\xeeK/\xbd\
-\xf4\xcf\xff\xfc\xcf\xff\xf5\xbf\xfe\xd7\xff\xf6\xdf\xfe\xdb\xff\
-\xcf\xf1/\xff\xf2//\xbf\xfc2\xab\xb3~%\x99\xb0\
-\x15c\x8a\xa8\x9d\x5c\x81J$\x80*Ln\x10 \xbd\
-\x0c\xc04\xa1\x00I\x83\x1c>]\x80\xb0H;\x91\xb4\
-2\x85\xcf\xab`\xc2\xa1sr\xc1\xc1L2\x0a\x8fs\
-\x91,\xe8\x90\xa1`\x85\xe2\x5c\xde\xabW/\xbd\x8ax\
-\xf6\xd9g_\x7f\xfd\xf5?\xfc\xe1\x0f\xcf?\xff<'\
-u\xbc\x97\xf5Ko\x8b\xc3\xc9\xb2n\xa2\xb1h\xcf\xe5\
-'B\xba\x9b\x96\xd5\xe6\xa4\xef\x05\xaeu\x89\x9e\xa3&\
-\x8f\xb9\xc1)\x94\x07\xbf\xbe\xbe~\xcf\x9e=k\xd6\xac\
-\xf9\xea\xab\xafV\xaf^\xbdi\xd3\xa6#G\x8e\xb0,\
-\xfc\xa4\xa2\xcf\x10\x1c\x80-j\xe8\xd0\xa1\xf8\x00\xd1\xa1\
-BL\x1d}\xbd\x85\xc3&\xd1\x22Q0\xb3d\xc4\xf3\
-!\x8bX\x16\xff!\x1e\x15\x9c\xb7\xa7N\x9d\xfa\xf4\xd3\
-O\xff\xfa\xd7\xbf~\xf5\xd5W\x09L\xc7\x8f\x1f\xaf\x1f\
-\xdf\xf7\xec\xd9\x13\x03\xad\x81\xeen\x95\x02]\x0e\x1dC\
-\x83\x00>\x9d#S\x99&\xea\x1bEl\xb5\x07\x82\xcb\
-\x0b\x17.p.Z\xbf~=\xce\xf9\xc5\x17_p^\
-\xc2Q\x89J\xf7\xef\xdf\x7f\xee\xdc9\xbc\xf7\xa7\xe3\xa5\
-\x0c\x88\x09\xcd\xf5\x0a\x95\xb5\x1a\xee#h\xb35[\xb2\
-\x81\xc6=XyC!\x0d\x842(7M\xfa\xb9.\
-?\xf8\xb0\xde\x06\x22[k}'K\x98\xb2\xb0\xfd\xbe\
-Ln\xba%\x94\x08\xc6aU\xcd\xa5UoF\xe9?\
-\x0f3'\xce\x83\x07\x0fre\xfbas*\xd4z\xd7\
-\xafFLiB\x8e$\xe9\xc63Y|5\xd3\x02\x99\
-\xc5\x9a(s\xc0\x80\x01\xe3\xc6\x8d#$]\xb8p\xe1\
-\xa2E\x8b\x08@\x81\xa4~.\xcf\x12\xac7\x10\xd4\xa3\
-\xe9\xb1z\x92\xaa\x03t3U.\x0d\xf8\x16\x04\xa45\
-\xa0\x22a\xc1\x88\xccR\xed\x04\xf72\xbc\xaa\xe2q\xa3\
-\x9e\xe0\xe4x\x16B\x94%,)!\xca\x0dIJ\x96\
-\x17n\x8a\xd7qJ\xae\xad\xad\xd5\xdbP\xa2\x04\xe2\x83\
-\xc5\x8b\x17\xcf\x9a5k\xec\xd8\xb1\xfa\xb9<gh\xcc\
-pH+%\xff\x0cA\x19\xcdf\xd2%\x87O\xa7\xf0\
-\xd9Yx\x8b\x12\xf0\x05\x1c^\xe5\xa0%<J\x7fw\
-\x7fG\xfe\xd6\xad[\x0d\x0d\x0d\xd7\x1c\x9cB\xcf\x9e=\
-\xbb{\xf7\xee\xaf\xbf\xfez\xd5\xaaUl\xf0\x97\xdd\xef\
-\x1d\x17Y\x07~\xf4\x10\x89\x0e\x192d\xa6\x03\x81$\
-\x13\xca\xc2eC\x8a\xa0)\xd6\x15L)B%H\xe9\
-\x22\xd5\xe4\xaflp%\x89\xc0*\x87;\x11z\xe2o\
-\xb3g\xcf~\xf4\xd1G\xf17\xc0\xf1X\x18\xf1@\xe2\
-\xd4\x11#FtO}\xd5K\x87c\x8d\xc9t\x92P\
-\x89lI7\x181\xca20\xd6\xc6\x0c\xf8*\xde\xb8\
-k\xd7\xaeO?\xfd\xf4\xed\xb7\xdf\xfe\xe0\x83\x0f\xbe\xf9\
-\xe6\x9b\xe3\xc7\x8f\xe3\xb7l[\xe4\xe2\xcfV\xf9O\x84\
-\xc6\xfe\x06\xa3\xe7\xc4\x04K\x9aR\x1a\x91\xcc\xc4};\
-\x5cj|\x88\xcfp\xa8\xb3\x22L\x9a\xec\xac2*\xc1\
-\xd9t,G\x96M%\xa0\xb6\x19h\xac\x0bBJ\xa1\
-\xac\xb4\x81\xd9\x84rH\x91:[F\xab\x82Qf\x82\
-\xa7\xba\xae\xaen\xef\xde\xbd\x87\x0f\x1f\xbet\xe9\x12'\
-Q\x9ep\xf4\xd6\xb2\xb0\x85\xaeSq\x8b3\x95@W\
-\xb5\x0a\x83\x92\xd2\x93d!fG\x0f\xdf\x10@W\xf7\
-\x17\xba\xc9\xb2\x82V\x04\xc1n\x81,\x0a\xdd7\xa4\x88\
-\x01YT\xe2\x13A\xf3\x5c\xddy\x93\xd4\xe6\xb8\x86{\
-\xc2\xa4rE\x19\x9a\xd1\x1e\x94\xd8f\xeb\xac\xba\x09J\
-\x82O;HF\xc3\xd2N\xe0lxc\x8f\x1e=8\
-&M\x9e<y\xf9\xf2\xe5\xbf\xfe\xf5\xaf\xf5E*$\
-\x09\x17\xf0O<V>\xa9&!8'm\x8c<\x0c\
-\xb2\xc3f\xcb@xU\x8a\x22YTU\x04\x19\xc8R\
-\xb7\x10Jr%\x97}\x9d\xd5\x96\x10\x93\x07\x9c\xbd\x9c\
-\xdd}\xf3\xe6\xcd\x1b7n\x5c\xe7`\x83'\x0c]\xbb\
-v\xed\x81\x03\x07\xd8\xe6\xad\xb6\x9f&,A\x83\x07\x0f\
-\xe6`\xbcl\xd92\xc2A\xfc\x81\x90\x91\x91d\xa2\xc9\
-MF\xdc\xa1\x15\x12P\xba\xf1\xce\x9b>i\x0cY\x0a\
-\x92\xf2\x19\xcc\x081\x15\x8f\xb2\xf4\x11q\x0e\x1a4\x88\
-\x90\xf4\x17\xbf\xf8\xc5\xeb\xaf\xbf\xfe\x8f\xff\xf8\x8f\xbf\xff\
-\xfd\xef_~\xf9\xe5\xc7\x1f\x7f|\xe2\xc4\x894\xa3\xa2\
-^\x94\xe2Q\x0a\x19\x91\xe9\x14\xd7\xa4\x9f\x0e\x97\x9f\x81\
-\xb2d\x03R\x8a0I]\x1a(\xb6\xa1\xef\xbe\xfb\xee\
-\xe2\xc5\x8b{\xf6\xec\xd1o)\xed\xdc\xb9\xf3\xf4\xe9\xd3\
-lX\xba\xe3O\x99x\x04S\x90\xafa\xcc\xc3gf\
-S\x82I\x87\xa1\x86\xd95\x04M2\x1a\xf9$er\
-z\x93%\xf8b\x0e\x1c\xf8\xe6\xcd\x9b\xf5\xf5\xf5\x9cy\
-p6\x19t\x08j\xaa\xdbO|D\xe7\x9b\x98\x9b\x11\
-\x13\xd2\xa8\xacO8d\xecJ7\x962Y\xf6\xa0d\
-\x1b\xd2\xaa`\x94\xf61\x07L\x06\x91\xa8>|c\xc1\
-\xa8r\xad\x03E\x88:\x86(MH.\xabQH\xde\
-\x12\xe4~\xf5\xd8\x90F6 3\xaej\x89Ze\xa0\
-\x07\x04\xe5JY\x1cY\x86H\xafz\xac\xc2vE7\
-\xd5\xdd\x81N\x09d\x19\x00\xcdp\xc3\x937\x1a\xe5D\
-m\x03\x9fN\xa1\xb1\x0a\xf1\x19\xb9\xc1,D\xf1\x5c!\
-\x9bR,[\x09\xb7\x00\xce?\xbdz\xf5\x1a5j\xd4\
-\xacY\xb3\x1e}\xf4\xd1'\x9f|\x92@d\xc9\x92%\
-D\x06c\xc6\x8c\xa9\xa9\xa9\xe9\xdc\xb9\xb3M\x07c\xc2\
-d\xb1\x8a\x81M\x5cDX\xb9d#\xad)\x05\xea\xb4\
-\x1b))\x01Ta\xa81\x01\x90y\x9c\x09C\xaf\xbb\
-\xef\x00'\x0c\xfd\xf2\xcb/\xff\xf2\x97\xbf\xbc\xf1\xc6\x1b\
-\xff\xf1\x1f\xff\xf1\xa7?\xfd\xe9\xcd7\xdf|\xf7\xddw\
-W\xae\x5c\xc9\x0a\xd0\xd0\xd0\x10\x96\xfd\x09\xc2D\x13\x89\
-\xe2\x06\xcc>\x91\xa8\xbei\xc5Mc\xf2\x8d\xa1\x12d\
-\x19\xca\xe9A\x0bs#06\xb0\xd1\x8bR\xae\xc0\xdd\
-\xfb\xf7\xef?i\xd2\xa4y\xf3\xe6\xe1\x87\x8f=\xf6\xd8\
-\x13O<\xf1\xf4\xd3O?\xf5\xd4S\xc8\xb4g\xfc\xf8\
-\xf1\x03\x07\x0e\xd4\xc7\x06|ue\x87f\xcb\xa3n\xdd\
-\xba\xf5}\xeeOh\x1a\xea\x97O\x04\x98>\xbc\x1a$\
-\xd3#\x86\x92\xbd\xe9\xc6\x8d\x1b\xfa\xb5$\x8eI\xdc\x94\
-[\xfb\xec\x9f*\xd1@E\x83\x06iM#Y\x83o\
-\xa0/\x94U9\xa4[(\x8dk{\x1e\xa6tVy\
-\x05\xa5g\xfd\xc6\xc1\xf0.\x0e\xe1\x04?D\xa5\xa1M\
-9a[\x09?\x8c\xee\xb5\xf9\xb8&'\xf8t\x8e\x22\
-\xd3MV\x91\x5c\x88\x0c\x12\xb9\xa8}\x93\xb46X\xe1\
-\xf1f\x13:y\xf2$Sr\xf4\xe8Q\xe6\x86\xa3'\
-\xca\xa0\xe7&$0p\xd6\x07\xae\x96D0\xa41\xd0\
-h#WR\xf5\xb8\xea\x93j-W\x06\x96e\xa0A\
-\x1f\x1a\x14!\xb9A\xca\xa6P)\xd5\xaf\x22\xaa_H\
-#\xbci\xab\xd1\xbd@\xb2\xae,\xe5\x8ai\x9cI\x02\
-w\xa4\x01\x0c\xc8\xc3\xee\xcbV\xb9\xfa\x8c\x0eB\x83 \
-\x5c\xf3\x13|:\xc0\x8c5\x80\xb4?\x9aSC5\x84\
-B\x04J\x06\x04\x10T\xa1\xcfhkh!\xdb\x7f\x8f\
-\x1e=\x88\x00\xa6L\x99\xf2\xdcs\xcf\xfd\xdaA0J\
-@\xd0\xb7o_\xbd\x88b\x8d\x88z\xe1\xba\xe55\x5c\
-\x05\x1a\xeb2y\xee\xe2Q)\xc3k\xf3\xf1y\xf9\xb8\
-\x11\xca\x1b\xa2\xd0R\xb9\xe0\xd3\x0e\xafrc\xf8\xc3\x0f\
-?p\xb6\xbct\xe9\x12\xcf\xf5\xf6\xed\xdb7l\xd8\xb0\
-z\xf5j\x82\xd1\xaf\xbe\xfaj\xcd\x9a5z\xdb\x04\x9b\
-7o>t\xe8\x10\xd1*\xa5|-?Ix\xd6\x06\
-\x0c\x180s\xe6LB\xc0\xb9s\xe7\x0e\x1d:\xb4K\
-\x97.\x9aOrmp2'+\xccM\x1bH\x99\x86\
-,\x15D\xe6.\xf8\x0f\xceF3p<\x9e}\x0eH\
-D\xc63f\xccx\xf6\xd9g_{\xed\xb5\xdf\xfe\xf6\
-\xb7\xbf\xfc\xe5/\x17.\x5c8v\xecX\x1d\x90\xd4\xb0\
-2\x83_\xdd\xbbw\xef\xfc\xf9\xf3'N\x9c\xd07\xa2\
-\xa8\x0b\x5c\x85\xcc\x0c\xf5\x14|\xba\x00V\x16;\xb3g\
-m\xc4\x81\x89A\xb9\x0b\xf7u\x86?Q4&\xc2\xab\
-rxm\x0e)\xd3\x13\x91\x89/\xe3J\xe9Z9\xc8\
-%\x84W\x15\x18\x87\xd0\xc0\xb0\x82\xa1\xe0r<\xac\x91\
-8\x18\x87\x1cN\xe9\x84=\xb8\x99\xcf(/t\x84G\
-\xbeg\xcf\x9e\xecD\xe1\xcf=\x10\xdc\xda\x13o\xa0B\
-z\xe1U\x01>\xa3@\x96\xaa\x85\xc8 \xc9r\xb9>\
-\xdd|\xda`=b\xd3\xba|\xf9\xf2\x9e={\xd6\xaf\
-_\xbf{\xf7n&F\xbf\x5c\xef\xb3s\xd0\xca\xc6\xed\
-6\x18\x8b(\x89\xa5\x97R]\x8d4\xc2|%\x92#\
-\x0a\x15\x0f1\x83B\x96\xaa\x1f|\xba\xbc\xf8{\xe7\x1e\
-\x0c\xa1,\xa0\xcd\x1aF\xae\xecI\xbd{\xf7\x1e1b\
-\x84vDoQF\xc2\x01L\x0ff\xd8\xec4\xd8\xa7\
-\x8bDX\x0dn\x0c\x12\xd9\x8aH\x03\x8c\x83\x9d\x17\x95\
-\xd5&\xb8\xd6\xfd'j\xee\xd3\xa7\xcf\xe8\xd1\xa3\xd9\xec\
-\x17/^L\x00J\x08\xf2\xf8\xe3\x8f\x13\x85\x8c\x1b7\
-\x8e\xcd\x9ea\xe7\xd68<Eh\x8c\xae\xa0\xe2\x86\xab\
-\xd2#\xb3\xb6Eur#=z\xba\xa3\xbb\xb3_5\
-\x92\xb0\xdd\x05\xee\x5cu\xb0A\xd6\x0f\xe5\x89/\xcf\x9c\
-9\xb3s\xe7\xce\xcf?\xff\xfc\xddw\xdf}\xef\xbd\xf7\
-\xbe\xfe\xfa\xeb}\xfb\xf6\x9d;w\xee\xea\xd5\xab7n\
-\xdc\xb8y\xf3\xe6\xad[\xb7\x88-\xda\xa3\xe5\xf7\x17\xec\
-\x07\xfd\xfa\xf5\x9b<y\xf2\xfc\xf9\xf3\x89G\x87\x0f\x1f\
-ND\xc8\x08k<5\xe0\x98\x85W\x09\x864-\xc6\
-\xd7\xe2\xa6\x95\xb9f[\xea\xd4\xa9S\xd7\xae]i\xd5\
-\xf8\xf1\xe3q\xcb\xc7\x1e{\xec\xa9\xa7\x9ez\xfa\xe9\xa7\
-\xf1\xd2\xd9\xb3g\xab\x85XR\xc4WQ\x16\x18\x90\xdb\
-\xb7o\x1f9r\x84\xb3\xcd\xc1\x83\x07q!4@3\
-\x9a\xf4\xa2\x12\xdd\x0c3\xa0\xce\xbf\xff\xfd\xef\xecDz\
-\xffZb\xd9\x9f\x16m=\xf5\xf2\xa5\xca\x19j\xb5$\
-\xbc\x16\x82\xdc4\xa6\x97M\x84\x9e5\xd6yN}<\
-h^[v\xd8e\xd8\x89F\x8d\x1a\xa5\x8f\xa7\xa3\xb1\
-\x06[\xe3M\x03&\xd3~\xcd\x97\x04\x90\xde\x08K\x95\
-N\xcbJ\x89\xb69\x1cs\x00=u\xea\xd4\xd6\xad[\
-7n\xdcx\xe0\xc0\x81\x8b\x17/\xda\x91W\xd0Uf\
-N\x0b%HF\xa7Q\x00i\x844\xbed\x09p#\
-\xe1\xd3\xadC\xb7V\x1b@\xca\x88\xf0f\xee\xcems\
-\xebR\xd0\xed\x04\xc9\xa8\x91\x1a[\xf6\xa1\xbe}\xfbN\
-\x9a4\x89Pi\xd0\xa0A>\xaf\xbcD\x0dSs\xc3\
-A\xf3R\x8e\xc4\xc0\xa1\xa4\x8a\x83\x92i\xbc\xb5\xb3\xd7\
-U\xc6*\xc58\x10\x1fpX\xd4\xf7\xae%\x05\xda\x02\
-\xaael\xbbw\xef>`\xc0\x80i\xd3\xa6=\xfb\xec\
-\xb3\xbf\xf9\xcdo~\xfd\xeb_\x13\x89N\x980\xc1\xde\
-\x86\xca\x875\x17\xb4\xcd\xed\xb6\xfe\xc5\x8c\x9aj`\xe6\
-\xa5\xb6\xc0u\xbd\x91\xe4Y\xca\x9dO\xc8\xa5\x0d\x16n\
-\xba\x16\xf9\x1f\x1c\x93D\xcf\xce\x0d\xf6\xd9P\xfd\xf9\xf8\
-M\x9b6\x11\x80~\xf1\xc5\x17+W\xae\xd4\xef\xc87\
-44\xa4\xcf\x99?q\x18^\x5c\x82C\x081\xdf\xac\
-Y\xb3\x86\x0d\x1b\xc6\xe6\x84\xd2\xdcR\xc8XDI0\
-\x9btVsQU4\x00\xcf\xe7)`\x8b\xc2-9\
- qv\x22V~\xee\xb9\xe7~\xfe\xf3\x9f/Y\xb2\
-\xc4NMe\xfe )>V__\x8fw\x1d:t\
-\x08w\xc2\xebP\xaa\xc1\xfcO6E\x08\x9f \xa4\xf4\
-?\xc0\xb7\x89A9/]\xbe|\x99[pG\xa7\xae\
-\x92\x07c\xed<%\xc1\xabZ\x0a\x93\x02\x0c{8;\
-\x95\x80\xda\x93nU)]N\xbaT\xa0\xb8`\x85\xef\
-\xdd\xbb7\xcf{\xff\xfe\xfd\xbd\xaa\xbc\xd0\x0b}H\x9d\
-\xddg\xc4\x88\x11:\x00\xfb\xbc\x1cQ\xe3\xddl'}\
-\x97\x00\xd2C\x98,\xd4\xe5v\xa5m\x82Q\xb8w\xef\
-\xde\xd9\xb3g\xb7o\xdf\xce\xa6u\xf4\xe8\xd1[\xb7n\
-\xe1\x9a\xe8\xe9\x1e\x03\xa4~\x9a \x94\x92M\x84\xab\xb2\
-\x18%\x9a5\x17U\x1b\xe1\xf3\x22\x12Gm\x9c\xb0\xf2\
-L\x9e\xee\xe2\xee\x9cq;5U\x9b\x10q\x18\xdeY\
-[[K0\xcaf#\x83\xf2\xa0\xe6\x01r\xde\xe8\xa1\
-\xf19\xc5z\x11*3\x0d\x22\x22\x1b%\x19\x04\x9eR\
-\x0e\x8b\xac\x14\xec\xc7\xcaj1\xce\x0b\x92\xaf\x15\xb3\xb7\
-\xa1\x8b\x16-\xd2\x07\xf2\x96.]:o\xde\xbc\xf1\xe3\
-\xc7\xebG\x9fz\x1b\x0a*BY\xda\x13\xa2\x0a\xc1\x0c\
-\xda\x0f\xbb\x9d\x13\x92\xdb1, Aw\xe7!e\xab\
-\xe6\xe1\xbd}\xfb6\x9b\xf7\xd5\xabWO\x9f>\xcdS\
-\xfc\xc9'\x9f\xbc\xfd\xf6\xdb\xef\xbf\xff\xfe\xea\xd5\xab\x0f\
-\x1e<\xc8\xf1\xf2\xe6\xcd\x9b\xd5\x1fwf\xf2\xe0\x83\x0f\
-2\xfb\xf8\x80~{]\x9f\x13E\xcfU\x9e 3A\
-2\xd2\x804\x9a/\xaeJ\xa6\xcd 3\xcb\x92\xe1\x8c\
-Kf\xa2\xe5\x904\x92\x88\x99'b\xca\x94)\x8b\x17\
-/~\xea\xa9\xa7p`b\xd3\xc9\x93'\x0f\x1d:4\
-s\x1bk?8\xcfp\xe6\x01|O\x11\x8co-=\
-I\xf5Z\xb9\x86\xd7\x0a\x92\xa9\x7fXP\xe7\xdd\xbbw\
-\xcf\x9c9C\xbc\xcb\x15\xd9\xdbWik4#n\xde\
-\x92\x89\x8b'\xa8\xe3H|\xa5-\x1a\xa3J\xc2\xaa\xcc\
-EQr\xe6a\xe5\xec@\x07c\xc7\xe1\xb9\xee\xd7\xaf\
-\x1fa1;\x9d-\xec\xc5q\xd3\x95\x81\xb2dS~\
-\xdar\x01bq!\x1e=|\xf80WM\x0f\x1d\xd3\
-j\x18\xaet\xae\xd7\x09Q\xb2\x1023\xa4\xb1\xab\x88\
-\xe4Bx\x8b\x1ch\x12\x87M!c\xe1U\x0e\xaf\x0a\
-\x08\x95\x99\x06m\x8bkE\x82O\x17F\xc3\xaeW#\
-\x84e^[.|+\x1d^\x95\x8f\xe93\x0d\x5c\xb9\
-\xe6\x0d\xa6\x8a\x002}\x07z\xcd#:`\xc0\x80\x16\
-\xbf\xf8a\xf4\xa8\xa4\x8b\x83\x07~\xe0\xc0\x81\xd3\xa7O\
-\x7f\xf6\xd9\xe7^{\xed5\xfd\x9e\xb2\xbe\xd3\x91,\x85\
-\xa1\x1as\xa0\x19l\x87\xec\xb8\x08jL\x91\x06\xb8V\
-\xc7\xf8\xbc\xb6\xc0\xd7\xf8\xff&Ad\xf2?\xf7\xe3K\
-\xa0yZI/\x5c\xb8p\xe4\xc8\x91\xdd\xbbw\x13\x83\
-n\xd9\xb2\xe5\xdbo\xbf]\xb1b\xc5g\x9f}\xc6u\
-\xc3\x86\x0d\x1c,\x09R\xd5\x17UX%\x84\x99\xc5=\
-8\xf2\x8d\x1c9\x92\x93O\xaf^\xbd\x08\xfb\x98q\xb2\
-l\xde\xc3xK\x1a\xae\x02\x19\x94+\x94\x94>\xc2\xec\
-#\xa2RI-\x01\x94\xa2%\xb6\x1a\x10w\xea\x9b\xa7\
-\x9e}\xf6\xd9W\x7f\xfd\xeb\x97^z\xe9\xb1\xc7\x1e\xe3\
-\x88\xa5\xb7\xb9\xaa\xa1\xbd\xa1I4F\x8f\x8c\x92\xb4S\
-YM\xd2\xb4\xa5\xeb5\xbe}\xe9\xd2\xa5\x13'N\xe0\
-\xde\x9c\xb5|\xd6O\x1e\x86\xda\xf0\xaa\x007r\x1e\xaf\
-\xca\xc2[8,\x19fI\xfe\xd1\x90\xee\x11\xa3\x87\x92\
-UT_0R__\xef3:\x02{\xbam\xc1)\
-\x84\x9b\xf6\x04\x9f\x0e\xf0\x19A\x96\x9b\xc9F\xbc6\x7f\
-4B\xfb\xd6\xd3\x96\xab\x0f#\xc2\xba\xdc\xa3G\x0f\xd6\
-5\x86\x06\x8d\xbag\xc8\xac\xf5\xf8\xea\x9aYa!{\
-\x8du\x08\xca\x16\xd4_\x1e|\x13\x03PZkIj\
-\xe7c-\xe6\x099v\xec\x18WdW\xb4\xac\xa8%\
-\xe16\x1c\x91\xa9\x14*be\xd3x;\x87u\x5c \
-\xeb\xbe\xdf}\xf7\xdd\xb5k\xd7\xae^\xbd\xca\x92\xe1\x0c\
-\x9b\x01u\x12\x86\xf6\xef\xdf\xbf\xb6\xb6v\xda\xb4i\xb3\
-f\xcd\x9a;w\xee\xe2\xc5\x8b\x9fH\xfe\xdaM\xf2\xd5\
-\xa1\x0b\x17.\x1c7n\x5c\xdf\xbe}qu6x<\
-\x9fRj\xb0\x8a[\xab\x92\xearHY\x1e\xec\xd6\xba\
-\xa9\xc6\x04~p\xbf\x96D|\xd9\xe0\xbe+T\x7f\x96\
-\xe6\xa3\x8f>z\xeb\xad\xb7\xf4\xdb\xf1\x1f|\xf0\xc1\x9a\
-5k\x0e\x1d:\xc4.\x8eY\xf5mh\x11\x18[\xce\
-!\xc4v\x13'N\xd4/\x06\xe9\xe4\x938\xa2\xfb\xf0\
-\x03Cg\x13a\x98\x1b\xa4\xb3\x5c\xb9F%\x96!\xa6\
-\x94\x10\x12\x16\x8c\x0c\x94\xa5Id\xbb\xa2\x858-\x87\
-\xb4I\x93&-^\xb4H_\xfe\xa0\xdf\xfd/\xe7\xfb\
-Q\xb5\x0a\x5c\xcf\x92p\xd9\x942\x08\x91^xU\x0e\
-\xaf\x0d\x90\x9eG\x92n\xf6\xec\xd9\x93\xfe\x9a\xb2JH\
-\xe4'\xad\x81\x11\xc6\xc1\xdc!\xb7R\xbe\xbaU~e\
-xm\x8e\xa8\x91\xde\xa8\x84\x01\x09m\xe8,\xab\xa8\xd6\
-\xc9\x8e\xeau\xd8l\xc9\xa0$\xf8t>\xa6\x97M\xe9\
-X\x1f\x11\x0cUe\xc8\xa0e\xb4\xe5\xd2\xc3\xfe=x\
-\xf0`\xd68\xfd-\xe6B\xeb\x9a\xfa\xe0\x13\xf9\x1d\x13\
->\xa3(Q\xcf[<\x0a\xfe\x96\x01\x91^\xc9\x22\x14\
-\xb1)\xa5x!\xdc\xcd\x1bIk\x84\x8c\x81\x11\x90F\
-\xfb\x1f\x01(\x0f\x09\xa1\x86~e\xd5\x1b\x95\x11k\x09\
-xU\x8at\x96\xec#|^~.I\xe7\x02\x8d\xf3\
-.%W\xeeK\xc8u\xf3\xe6M\xce\xacG\x8f\x1e%\
-\xf6RV\x11\xd8\xba\x88)\x09,8M\xe1\xba\xbd{\
-\xf7\x1e9r\xe4\xfc\xf9\xf3_x\xe1\x85\xd7^{\xed\
-\xf5\xd7_\xff\xdd\xef~\xf7\xd2K/-]\xbaT\xdf\
-\x8f\x83\x01[\x1d\xa5\x00?\x0f\xa1I\xba\xaam\x99M\
-\x85\xb0I\xc8!^\xeb\x08\x93\xca\x05\x9f\xce\xc7\xd5\xef\
-\xffa\xc2?\xc6\x81xH;\x84\xb6\x8a;w\xeep\
-8!\xd0\xdc\xb5k\xd7\xf6\xed\xdb\xb7m\xdb\xb6n\xdd\
-\xba\x15+V|\xf2\xc9'z\x15\xbaz\xf5jb\xd3\
-\x13'N\xe8m\xa8f\xd0\xdf\xa0J\x0a\x02\x1d\xbd/\
-'\x98#\x18\xed\x9e\xffW\xbf5Y\x86+\x11\xe3\xf3\
-R\xf8\xecfBA\xe7hy8\xaf\xf4\xafLT3\
-IZ\x8e\xab\xe3\xc6\xc3\x87\x0f\xe7\xb8\x85\xab\xcf\x9e=\
-\xbbl\xf1(\xb7\xd0/\x17\xea^\xb8\x19W\xd7\xef\xbc\
-\x8e\xa75!\x85r\xa5\xa4rz\xc7\xec\xf4\xe8\xd1C\
-\xfa*\xadGc\x1e!\xfd\xbd{\xf7\xae\x5c\xb9\xc2\xe1\
-\x9fEF\x13\xda\xe1\xc8\xe7\x85{\x14\x1a\x93!aV\
-(\x87\xa8\x9b\xc2\x0c\xd4\xeb\xdb\xb7ow\xc8\xeb\x1eA\
-c\xd8\x83\xecQ*\x84\xebVc\x1f\xb9\x86=2\xcc\
-&\x8d\xd9#\x18\xd2\xb4\x15m\xb9\xee0(\x9cDy\
-\xfekjj\xd8\xda\xad\xcf\xb8&\xa8\xf5 c\x9f(\
-\xd0\x1f\x9f\x17\xe03\xf2\x0bf\x8e\x9d\xcf\xce\xe1\xb5N\
-\xef\xa5\xa2\xa4K\x19^\x95\xba\x85\xf0y9\xbc\xd6\xe1\
-U9\xbc6\xc0g\xe4\x90FY\x1a=\x90\xb2\x102\
-\x00\x8d\x09\xae\xc9\xbe\xa2_\xf4c^dS6h\x06\
-\xa1\x0f\x11\xa1\xc2 iBd&\xbc\xca\xe1UY(\
-Wfid\x03t\x9f\xbe\xa3a\x81\xb8~\xfd\xfa\xb5\
-k\xd7h\x86\xcf\xcb\x02{\x0eQ}\xfb\xf6\x1d=z\
-\xf4\xe4\xc9\x93\x09,f\xcd\x9a\xb5p\xe1\xc2\xc7\x1f\x7f\
-\xfc\xc9'\x9f|\xea\xa9\xa7\xf4\xea\x880t\xee\xdc\xb9\
-\xb5\xb5\xb5}\xfa\xf4a#gH5\xcenf\x12T\
-\x1b +\x8c\xf3\xe9\xa2\x84-O\xe3z\x96\x8d\xb7\x08\
-pJ\xff\x0f\xaf\xf9\xe1\x87\xef\x89\xc2o\x050\x14u\
-uu\x1b7n\xfc\xeb_\xff\xfa\xe7?\xff\xf9M\xc7\
-G\x1f}\xb4~\xfd\xfac\xc7\x8e]\xbcx\x11\x03F\
-\x0c\xcb\xe8\xb7\x0f\xabd\x82\x1b\xb0\xd0\x8d\x1b7n\xc6\
-\x8c\x19\x9c\xc0Y\xf78\xcc\xc81\x00'\x94\x87\xe8\xda\
-\xb6\x84\xb3\x83\x9c5Y\x8d7U.\xcd\x90g\x9as\
-\xd2T\xba\xc0\xfa0h\xd0 \xba\xb0d\xc9\x92E\x8b\
-\x16q\xd6b\x0do\x8f6\x87\x10\x89r\xd3\x01\x03\x06\
-\x10\x10\xebi\xa5I\xae\x1fqG\xa4\x14^\xe5\xf0\xaa\
-\x00\x9f\x91\x1bp\xba\xc9q\x14\x7f\xae\xfe\x8c\xbe\xc5\xf8\
-\x91\xcd\xe1\xb5\xf9\xa0g\xa8Y\xe7\x09C\x8f\x1c9\xc2\
-\xe1\xbfe?\x8cj\x0f\xf0\x04\xb0'Q\x1a\x09!\xea\
-\x9a\xb3-\xd5\xede\xac\xe7H\xae+}G\xa1\xf6\x08\
-\xafr\xcad\xdarxm\x0e\xafu(i\xd7P(\
-\x91\xf0\xbe-\xa6-\x83Q\x1a\xc4*C\x18\xaaOM\
-\xa9}I_s\xc8\xacM0\x0fh\xf2.iM\x08\
-\xc5UC\xa5\xa1\xbe\xd0M\xc3:\xa26\x0bid\x0c\
-\xc8\x1ay\x02\xac\x11#F\x10]\x0d\x1f>\x9c\x15_\
-fe\x83\x96h\x85\xa2\xd9^\x95E\xd8~\x09\x85\x90\
-AdF\xd2 i\xb5\x01\x83\xc0\x15}\xa1\x06h'\
-&z`\xeb\x1d6l\x18\x01\xe8\xf2\xe5\xcb_y\xe5\
-\x95\xdf\xfc\xe67\xbf\xfd\xedo\x11\x9e\x7f\xfe\xf9\xf9\xf3\
-\xe7\x8f\x1d;\x96]\xb3_\xbf~\x84\x1dz\x1bj\x9f\
-\x08\x8cP\x1bt5\xc2&\x89\xb4&\x93\xa4K\x0e\xd9\
-s\x8d\x0a\x92\xe5\x9c\x22o\x1d$\xc9\x98\x13\x85\xb3\x0d\
-_\xb8p\x81\x8da\xdf\xbe}\xbb\x1cz\x0f\xbaa\xc3\
-\x86\x15+V|\xfe\xf9\xe7_9V\xadZ\xb5e\xcb\
-\x96S\xa7Nq\xb8W\x8c\x22\xc2:\xabd\xc2*\x87\
-W\x10\x83\xce\x993\x87\xa7l\xf0\xe0\xc1\xf8F\xf8\xb1\
--M\x19D2\xb4`x}y\x87W\xa5\xb0\x5c\xfd\
-\xdf]\x1b\xef\xeeL\x1ae\xb5\x01\x99\x06\xd3r\xd6\x8a\
-y\xf3\xe6=\xfd\xf4\xd3\x84\xa4\xc8\xf4\xce\x99\xb7\x17<\
-D\xc4\xee\x0c 7\xb2s\x1d-\xd1\xe8)i\xa4\x87\
-\xab\xd0\x00\xaa, s\x12\xd3\xb7\x99\x12\x1b)\xb7\x8a\
-\x0d\x8e\x91N\x1a^U\x80\xd0\x86\x15\x83\xe3\xeb\xa5K\
-\x97\x0e\x1f>\xcc\x9ac\xdf\x90P\x09\xa8\x9d\xe0\xd3\x85\
-\x09m\x22Y\xe0uE\xf0\xd6\x1d\x0a\x8d\xf4R\x0ak\
-\xa4\x09&\x83\xd6|]\x85\x0c\x8a\x93y\xbb\x22mh\
-\x926\x0eF\xed\x0a\xbe[A\xcf#!\x82\x82B\xb2\
-\x94\x11\x91\xdeU\x1f\x8f\xac\x92\x99x\x8b\x00\xe9\x0b\xdd\
-.\x221+\xda\xbc6\xc7\xb72\x80[\x87\x98\x19W\
-%\xe5R,\xf7\xc4OC\x86\x0c\xe9\xdb\xb7/Q\x97\
-\xb3*\x1f\xb4\x84=&\xbd7\x9b \x94L\x0a4\x13\
-7\x12\x1e\xd3\x84\x02\xd5jo\xa3\x19\xd2\x87(\x92\x18\
-3f\xcc\xb4i\xd3\xe6\xce\x9d\xfb\xe8\xa3\x8f.[\xb6\
-L\xefA\xf5[\xc6h\xa6O\x9fN\x90J\xa8J\xc0\
-\xaa\xf3U\xd8\x9d\x22$\x1dsDI\x11*%\x17A\
-f\xe0\xd3\x0e\x92\xae\xdf\x09$\xbd\xe4\xa2\x7f\xc2P\xf6\
-\xe0\xeb\xd7\xaf\xeb{\xd6\xbe\xf8\xe2\x8b\xf7\xde{\xef\xad\
-\xb7\xde\xd2K\xd0\xb7\xdf~\xfb\xa3\x8f>\xda\xb8q\xa3\
->I|\xf9\xf2\xe5+W\xae\xb0s\xdc\xbbw\x0f\x9f\
-Q\xe5U\x9a\x84\xf1\xc7%\x88>g\xce\x9cI\xe8F\
-\x0c7z\xf4\xe8\xee\xee\xef\xbf\x93\xcbD\xc8F\xd7\x10\
-\xd3\x97\x8e\x0a\x82\xc9\xd2\x17\xa2t\x03\xf9\x8c486\
-\xed\x1f:t(Q\xf5\x8c\x193x.z\xf5\xea\x95\
-\xf9\xe0\xb4\x15z\x91\x86\xfbq\x0aB\xb6V\xa5\xdb\xaf\
-F\x96\x8ej\xa0\xd4\x0f?\xfcp\xe3\xc6\x8dk\xd7\xae\
-\xf1D(\xabJ\x1a\x0doz\x90\x19F\xc34\xa1^\
-JA\x92\x1a\x18g\xad'\x1d\xf83\xebLh[\x18\
-fE\x8d/\x84\xebe\x02\xb2\x0aJo(73\xab\
-CPS\x0d%#e\xe9\x84\x05\x91\x8d0)\xd9\xae\
-\xad\xa7-\x83Q`b\x98\xf8p\xee\xa5\x0cs\xed\x0a\
-\xd2\x8b(Y\xa4\x87*\x0b\x91\xdc$\xde4\x87\xd7:\
-\x92\xd1\xcd\xe1UYm -\xa53\xccC\x06!>\
-\xa3pG2\xb1\x86\xa9\x91!\xd2GHowal\
--\xd9\xdc[\xb7\x15\xdc\x97\x1dN\x01\x1c\xb25\x1e9\
-B\xf6\xadA5\x0b\xd5i!\xa3\x0bG\x1b=\x9c\xfd\
-U?\x97$\x92\x985k\xd6\xb3\xcf>\xfb\x92\xe3\x85\
-\x17^ \xfa\x9c2e\xca\xf0\xe1\xc3\x07\x0e\x1c\xd8\xbf\
-\x7f\x7f\x22x\xf6\xe3.]\xba\xe8=\xa8A\xb5\xe1\xed\
- J\xb6-\xba]\xf28\xb9\xe7E\x9d\xd2\xfc*W\
-I\xb6\xf3\xef\xdc_><{\xf6\xec\xa1C\x87v\xee\
-\xdc\xb9~\xfd\xfa\x15+V|\xfa\xe9\xa7\x9f\x7f\xfe9\
-\x02\xe8=(\x11\xea\xe9\xd3\xa7\xef\xb8\xbf\x8bh\xafB\
-\xdb\xb5\x0b?>8\x99\x0c\x1a4h\xce\x9c9\x9c^\
-\x1e]\xb2d\x92\xfbk[\xf8\x89\xcf.\x8a\x0du\x89\
-c\x1e\x9a\x852S\xaf\xd9o+\xa8\x8d.\xf4v_\
-\x9aX[[\xcb\x03\xd2\xae/G\x09\x5cp\xd4}\xfb\
-\xf6q(\xb2\xcf\x84\x84\x83cH\xd3\x5c\xe8\x0e+\x8f\
-\xce\x90\xed\x1aU\xdf\xd7hx\x0b\x0d\xb2s\xb1F\xa4\
-QV\x1a\xd6F\xeaaI\x01\xaf\xeah\xac=\xd1\x12\
-W\xa8\xbf\x22\xddG\xd9s5\xa4\x07\xdb\x14|\xba2\
-Hf+\x98/]\x8d0\xd9(g\xd9p\x15\xa12\
-D\x9a\xf0\xdaJ\xda8\x18\xb56\x85sfh.\xe5\
-\x1c\xe1U\x98\x01\xc8\x9e\xda\x0ci,KD\xc9B\xb8\
-*c|\x1e\x14\x1dG\x7f{\x87\x92\x91\x12L\x93\x14\
-h\x11\xbeMYx\x8b\xa2\xe8\xee\xa0$\xa58\x9er\
-N=w\xee\x5c\x93\x1f\x9al\x0fh\x09O\xa9^%\
-J\xa3\x8e\xa8\x91\xe4\xe9\xff\xcaj[\xc2j%\xeb\xca\
-\xceD\x949n\xdc\xb8\x993g.\x5c\xb8p\xd9\xb2\
-e\xf6g\xbbg\xcf\x9e=v\xec\xd8~\xfd\xfa\x11\xa7\
-v\xea\xd4\x89\x80Ua4\xdb\x98\xad5\xa5\xb7\xb6\xc4\
-)+B2\xeb9\xbc\xca\x86.\x80\x5c\x85\xa1\x04\x97\
-\xd7\xaf_?~\xfc81\xe8\xdf\xfe\xf6\xb7\xf7\xdf\x7f\
-\xff\x93O>Y\xb7n\x1d\x9b}]]\xdd\xf9\xf3\xe7\
-\xd9\xf2/^\xbcx\xf9\xf2e\xcc\xaa\x9f\x07m\x0d\xb8\
-\x07\x91\xe8\xf4\xe9\xd3\x17/^<o\xde\xbc\xda\xdc\x9f\
-\xd6\xc4U4)\xde\xae0\xd1\xe0\xabT\x88\xf4\xc9\xdc\
-;K\x13$s5\x9bV\x12\xdd\x8b.\xd0;=#\
-\xa3F\x8d\xea\xd1\xa3G\xfb\x85q\xacN8$\xe7\xa2\
-\xabW\xaf\x22\x179\x11Y#\xc3^K\xe6\x1a\xa2,\
-\xd5C\x92\xbe\x0c\x180\x80\xd8\xba\xfa\x0bLE(4\
-\xec!\xe1\xd8\xa6\xed\xdd\xd8\xe7\x0d~\x85@\x18\xaa_\
-Z@\xf0\xaa\x1c\xd6`\xa1\xa45>\xca\x85\xa8_\x96\
-\xc4o\x93\xce;\xa4\xe9p\xac%\x12\x5c\xd3\x1aQ\x96\
-PR\xfa(\xc3]b\xd2Jitm\x93\xa9o\xfb\
-`T\xfb7W\x09!\xde(7\x9dj?\xb2h\x0c\
-Ks$\xd9\x01^\xeb\xf0\xaa\xe6\x10\x95\xb2$\xcd\xf2\
-\xed\x0bP\x16\xf8\xb4\xc34\x12\x8cH\xe3\x1a\xd8\x8c\x16\
-\xca^X\x8c.\xc1[\x14\xc6\xb5+!LRV\xdf\
-\xf9z\xe4\xc8\x11b\x11\xe2\x0f\xe5\x96\x075F-\x91\
-&\xea\x88\x0d\x96\x19\x98 \xa2\xa4\x11\xda\x17\xb2\x01\xdd\
-\x8eh\x92(\xa1K\x97.lK\xdd\xbauc[\x22\
-zx\xe1\x85\x17^~\xf9e\xae\x04\x13\x93&M\x1a\
-1b\x04\xb1\x85>\x0c\xaa\xd0Y5#(\xbcP\x85\
-@\x9d\x82\x9b{\x95#\xb41\x9cY\x1b@=x\x81\
-d\xe6\xd4N\xf9\x08\xf7\xee\xdd\xbbq\xe3\x06\x87\x8dc\
-\xc7\x8e\x1d<xp\xd7\xae]D\xa2_}\xf5\xd5g\
-\x9f}\xc6u\xcb\x96-\xfa\x8dxvz-\xc7\xa2D\
-\xa7\xaa\x92\x89\xce3D\xa2\x8f>\xfa\xe8\xacY\xb3\x86\
-\x0f\x1f\xde\xbd{w\xbd{\x0b\xd7:o]\x18MA\
-\xa1\x89\xc8\xac\xc1\x8c\x11\xdc\x1c&H\xd32\xec.V\
-\x15\x1a:B\xe8\xc6\x93\xc2sa\xdf\x0c\xd0\x1epG\
-<S\xdf\x16.\xffT\x1b\x94e\xb2\x1a\xc9\xd5\x04\xa7\
-N\x08ep&\x8d\x1aZ\xce\x91\x92\xc9\xa2#<\xdd\
-^[%E4\x8cF8\x0bi\xacT\xbax\x91R\
-\xe5\x84f\xb0\xd6E\xae\x15\x92\xb8K\x0e\xaf\x0a(\xa4\
-\x8f\xc0\x86\xbb\xf8D\x05\xa06\xbb\xb6{\xc1\xa9c\x8d\
-\xae!\xc9d\xe7 \xe1\xcc3\xf0\xd6\x8eP\x93\x94j\
-\x0b\xdar\xb9\xa1q\xda\xc5mu\xe6*\x5c\xcb\x13r\
-\x86y\x1d\xd3(\xd8*\xdb\xa8qDIp\x85\x9a \
-\xba\x85\xf0\xe5\x1dJJ\xdf\x864\xb7Nk\x09n\x1d\
-\x82FYM\x92\x8cfj<\x09@\xeb\xeb\xeb\xeb\xea\
-\xea:\xe4\xab\x9d\xacIa\xc3\xd4#\xc3ks6\xae\
-D\x8c\x0c\xc0\x92\x5c\xcd\x9d\xe4Z\xa0\xa4\x81\x06\x0fd\
-7\xd5_K\x829s\xe6\x10@,_\xbe\xfc\x99g\
-\x9ey\xea\xa9\xa7\xe6\xcf\x9f?f\xcc\x18\xbd\xd3b\xd3\
-\x22\x0c\xa5\x14\x95[\xab\xac\x85\x12\x0c4\x18\xea.\xce\
-0!\x94\x0d\x19\xb7\x0c*T\xa7\x5c%\xc9}\xf1\x07\
-6ovn\xce\x18p\xf3\xe6\xcd\x8b\x17/\xee\xdb\xb7\
-o\xf5\xea\xd5\x7f\xfd\xeb_\xdf~\xfb\xedw\xdey\x87\
-0t\xf3\xe6\xcd\x1c?8\x84\x5c\xbdz\x95h\xb55\
-m\xa8\x12\x81G\xf5\xea\xd5k\xe2\xc4\x89\x0b\x17.\x9c\
-;w.\xfeC\xdcF$\xaai\x0a\x1f\xd8\xb4?(\
-\x0b|:\x0bJ\x09\x9f.\x0cw\xf3\xd59\xbc\xb6\x04\
-T\xb9\xee\x02\xc8*\x8e\xcc\xff\x91\x11\x08\xb8\xfb8x\
-4d\xd3Np;{q\xe5\x16\xbc\xbc\x15\xcf\x84\xa4\
-\xa19\x94\x94\x1e\xa4\x14^\xe5P=T\xc8#\xc0\xc3\
-R\xfe\x9f\x0b\xdd/D\xe3V\x08\x8d\xb0`]Bc\
-\xb3#\xd0{\xa9\xc2P\x9b}\x22\x1fe\x01\xb2\x1cF\
-(\xb7IdL\xf1\xcc\x01\xa9|\xd4\xf1\x12Qg\x0d\
-\xafm\x07\xda2\x18e\xbdf-\xd3\xee\x9e\x04\xa4\xf9\
-/\x0c\x80\xa4\xc3'5 \xfa\x9f\xefh\x80\x94\xe1U\
- \xb7\x09\xe9\xaa|\x83\x02\x5c#\xf3@\x99.h\x9a\
-\x965\x8fRB+r\xb4.7Id,\x99+1\
-\xe8\xed\xdb\xb7;\xf6\xc7\xb2~\xd4r\x03\x9b4\xd4a\
-\xb2\xb2dS\x9c\xd0,\xf4!\xc3\x0c\xc8\xd5\x07\xe0\xa6\
-M\x9b\xf6\xfc\xf3\xcf\xbf\xea@\x987o\xde\xb8q\xe3\
-\x86\x0c\x19B\x18\xda\xad[7lTO\xe2\x92\xc9\x9a\
-\xe2\xab\xa5\x1eH\xb6\xc7\xa2\xa7^w+o,A=\
-\x92\xa6\xf5\xa8N\xda\xc0\x86M\xf4y\xee\xdc9\x02\xcd\
-\xfd\xfb\xf7\x13\x83\xee\xde\xbd{\xcb\x96-D\xa2\x04\xa0\
-\x7f\xfb\xdb\xdf>\xfd\xf4\xd3\x95+Wn\xdf\xbe\xfd\xcc\
-\x993\xb7n\xdd\xc2\xbex\xcb\xab4\x17\xe6\xa2\x93\xfb\
-\xeb\xb2\xd3\xa7O\xd7\xdf\xfc\xd4\xb7\xa9\x9b\xc3p\xb5\xd9\
-/\xc5\x07\x22\x1b\xabD\xc9L\xac\xf2\x08\xe56\x09\x95\
-\x87x\xad#\xa7I\xae\xf4\x88~\xb1\x8c\xbb'\xa2}\
-\xa1\xf1\xa5\xbf\xadwm\x8cG\xc9\x94\x11TH$\xca\
-\xa9\xec\xf8\xf1\xe3\xd7\xae]\xf3\xda*Yd\x0e\xa0H\
-\x067X!!\xd1\x14\xb6\xaf\x1ch$A\x88\xe2\x10\
-\x9a\xed\xb5\xcd\xa7\xb8gR3\xcb\x02\xc76n\xe4U\
-\x1d\x0a\xad5\x94\x0c\x95\xce$~|\xbcT\x18+\x18\
-\xa1:C|F+h\xcb\x15\x87\x89\xe9\xd5\xabW\xf7\
-\xee\xddm\x99N\x93xt>\xd2\xab\x06\xba\x94\x84\x00\
-\x01vn\x06\xf5\xd9\x93\x1b&+\x1b\xa1\x5c\x09\x864\
-\x85(\xc5@6\x12\x22d\x93\xc6g\x8b\x9c\xc6\xba\x13\
-\x19\xa0w&\x19\xa8\xa7\xde.\x87\xb2BdF\xa4\xd5\
-\xa7O\x9f\xfe\xfd\xfb\x13u\xf1@*\xab\xcc\xd0\x92\xa8\
-\x85\xe1DK\x88\xc0@6v\x05\xd7Qo/\xbd\x84\
-4\x96\x85_\xe1\x87\xa3F\x8d\x9a?\x7f\xfe\x93O>\
-\xf9\xc4\x13O\xcc\x993\x87\x18\xa2G\x8f\x1el\xb4\xac\
-\x1d\x18\xc8\xd2V+\x95v\xd5$$\x89\xc2\xed\x04\xd9\
-\xc8\xd8@cE\x5c\xab\xe3\xe2R\x86\xb3/\xa44=\
-\x021%\xb0\xa7^\xb9r\x850T/A\xdf}\xf7\
-\xdd\xb7\xdf~\x9b+2\x01\xe8\xd6\xad[\x0f\x1d:t\
-\xea\xd4\xa9\xfa\xfaz6\xdd\xea\xdb\xd0v\x82\x99\xe59\
-\x1a:t(\x87\x19\xfd%w=S\x9at\xa1\xa5L\
-\xf6\x9aDC\xcavEm\xf0\x89\x1c\xe9\xbbg\x9a9\
-0\xf3n\xa9t\x01\xb36\xc6\xd6\x7f Y\xca\xdd]\
-\x9f\x12|:\x0br\xbf\xff\xfe\xfb\x1b7n\xe8\x17\xf6\
-\xbd\xf6\xa7\x8d\x0d2\xd8\xe8I\xa3,\x83I\xb1y\xe1\
-\x7fJ\x0a)\x81Rn\x12\x92z\xac\xb6\x8a\x82\xd6\xda\
-:\x0f\xd6\xda4\xeaN\x84\xecE\xa6\x01J\xea\xef\xdd\
-\xbb7gT\xae\x996\xe5\xc4\xb75\x85\xcf.L\xda\
-F\x1aW\xbaQ\x08qV\x1e\xaf\x0a\xf0\x19\xcd\xa7\xed\
-\x83Q\xfb\xf8\x9d\x94LRqd#G\xa7',\x88\
-\x0a@\xb9\x0a\xb6d\xaeh@\xbdM\xc8_7)\xae\
-\x1a\xa4\x89P\x09!\x0d\x96\x85\x8c\x0b\x919\xc8\xbe\xd2\
-\x5c$\x81F\xd5zm\xae\x0c\x82o|\xceLJ]\
-C\x94\x95I\xf1\x5c\x90\x01\xe3\xc0N\xc9q\x8dPl\
-\xca\x94)D`\xc82(\x0f\xae\x1f\x1ei4\xda\x86\
-\x94\x96\x9b&g\xe3GRW\xe1\x86\xd1\x0c\x12\x5c\x95\
-\xde\x01\xe88H\xc0\x09q\xc5~\xfd\xfa\x0d\x1e<x\
-\xd0\xa0A555\xf8\xa7<\x13|\xe1\x5c\xcd>\xe1\
-P\xe5\xa1M\x88\x19K\x901\xa8ZK\x1a2K\xee\
-\x91_\xd0\xb0,\xaerx`+\xbdu\xeb\xd6\xf9\xf3\
-\xe7\x8f\x1d;\xb6w\xef\xdeo\xbf\xfd\xf6\xf3\xcf?\xff\
-\xe8\xa3\x8f>\xfe\xf8\xe3\xbf\xfd\xedo\x9f}\xf6\xd9\x9a\
-5k\xd0\x13\x83\xdeq\xbf\x1a/\xefR\x85U\xda\x1c\
-f\x96\x87\x88\xa3\x1d\xd8o\xf6$n\x97\x8f\x8c\xc1M\
-i#^\x9b\x9a\xfa4a%\xa1\x1c\xe2ne\xf8\xf8\
-\xc0\xe7e\x91\xbe\xa9\x8a\x08\xaf\xca\xdd\x0e\xe3\x1f\x1cM\
-6\xb5\xf5\xd8\xdd\xed\xd6\xbai\xd2,\x87)\x0b\x91\x14\
-\xce\xb7\x17\xca\xf5\xda@\xff\xa3\x07\xcf|\xf0\xc1\x07\x1f\
-\xca\x87\xe37K_\x97.]\x10d\x16\x8e\x89\x16\xae\
-d\xdd\xcc\x82,\x8d\xa1!{@\xa6\xb8\x86Z\xa8\xc2\
-\x0eG\x8d\xd4\x95d\xd465\xdb\x04K\x16\x07\xb3\x08\
-\x06Go|\xd8g\x07\x0e\x1c\xe8\xed:\x085)\xec\
-f(\x87H\x9f\x8cH\x0e\xe9#2\xf5\x85\xec\xa5\x17\
-^\xd5\x22\xda2\x18\xa5)\xb6)6\xabY\x1aJp\
-N\x9e\xb8Q\xd2\xad\x1426\x01\xb3\xb4\x0026\x94\
-e\x02\xc8\x0c\x90e\x93\x89\x8c\x85KJ\x9d\xe0\xb5\xf9\
-(+\x096s\xf8\x8c\x1c\xca\x95\x99i$\x9b\xd0\x5c\
-TPxU\xd2\xbf\xe4gm<'\xc3\x87\x0f'\x1a\
-C\xf69\x1d\x84\x8dv\xd4\xfd4a\x96\xad\x12\xf9J\
-\xd5\x947\x89\x12\xe49\xe6B\xa0\xf5\x82%\x18\x10H\
-&%\x83\xf6\x14B\xb9\x91\x99\xc9\xae\x07\x09\x92M\xc9\
-5*\x02\x96\xa4\xefD\x99\x5c\xcd\x86\x22$\xc1\x04\xc2\
-J\xc2P\xe2\xcb\xabW\xaf\x1e<x\xf0\x9bo\xbe!\
-\x00\xfd\xf0\xc3\x0f\xbf\xfc\xf2\xcb\xad[\xb7\x1e>|\xf8\
-\xd4\xa9Sg\xce\x9c9w\xee\xdc\xc5\x8b\x17o\xdc\xb8\
-Q\xfd<\x5c\x19`\xb2\xd8\xcbu\xaa\xe1\x99B\x96\x83\
-Yn\xa6\x5c\x08s\x98B\xa8\x12\xf0\xe9\x00\xca\xfa\xbc\
-F\x1a\x1dL\x90\x0co\x81\x9c&\xcc\x92l\x95\xe0~\
-\x0d\x0d\x0d\xfa\xc3E\x96\xdbN\xa8\x01\x80\xac\xc7\x16\x94\
-\xd5\x1c\x92Q0\xbc\xce\xfd}\xac\x9e={2_\x9c\
-H[T\xed}\x06}\xc739r\xeb\xf7\xcf\x8c\x91\
-#G\x8e\x193f\xc2\x84\x09\xb5\xb5\xb5\x1c\xa5\x08I\
-9\x90\xb3\x12j\xb8\x18\x19\x09-\xc6\xdf\xde\xcd\xa6\x96\
-2\x9f\xee8h\x95V~\xeb\xa6\xf32\x8f\x0c\xb8J\
-\xd6\xb5ITO\x88\xab,\xe9\xb2\xb7\xe8P\xd4\x185\
-\xcc\xab\x02\x22\xbd\x8cA\xf3e\xf8\xec\xa2\xa8\x9e\xd2\xed\
-\x9bE[>\xa5l\xa2W\xae\x5c\xd1\xef\xf0\xb2\xef\xaa\
-\xb9M6Z\xdd\xe3\xea\xd6\xa2\x84d\xe4\xf2\xc7\xd4\xaa\
-\xb2\xdad`f\xca\x12\xd2d\x12U\xdb$\xbe\xc6\x92\
-;\x22\xac\x17\x14\x91\xb3\x22\xb8\x17^\x8dc\x82>t\
-\x85\xb0xRW3\xf1\xb5\xf8z\x92\x7f\x16\x87q\xa5\
-12+\x1b\xb4\x84\xde\xd1_\xaeJJ\x1f\x12\xf5\xd4\
-5\xdf\xb0\x5c7\x229K\x9fph\x90\x8542\x88\
-,%\x876-\xc3\xca\xfa\x06\xe6\xe6\xd1P.\xa4\xef\
-\xe2\xee\x9c\x80,\xe3pp\x00A\xafB/_\xbeL\
-\xacy\xfc\xf8\xf1}\xfb\xf6\xad]\xbb\xf6\xe3\x8f?~\
-\xff\xfd\xf7\xbf\xf8\xe2\x8b\x1d;v\xd4\xd7\xd7\xeb\xb1\x12\
-\x14\x09oZ\xa5\xfd\xe0!\x1a2d\xc8\xd4\xa9S'\
-N\x9c\xc8v\xae\xf7\xeb6\xa1-@\x13\xe7\x1c!A\
-\xca\x12\xf1e\x0a\x97\xb2\x1c\xb3A\xc0[\xe40R\xea\
-*\xa4\x14\xd8\xb0zs\xe0\x01\x044\xde\xa8\xdd\xe0\xc1\
-\xe4j\xcd\x932D\xe3\x0c>\x9d#\xad\x01Y\xc2\xcf\
-~\xf6\x00Q\x17\xb36v\xec\xd8\x01\x03\x060\x83\xde\
-\xe2\xbe\xc5u*\xf9i\x0f\xeby\x1a\x22obnB\
-\xcf\x85\x0b\x17\xfe\xe2\x17\xbfx\xf9\xe5\x97_y\xe5\x95\
-_;\xf4\x89y4O>\xf9$\xf1h\x14\x9ak\xb8\
-\xc0\xa7\x0b\x0c\xac\xb0\x09R\x91d\xe5uX\x11\xe9%\
-w,\x1a\x135O\x9a\xc4\xbfS\x98\xd7\xa9\xe5 c\
-\xe1U\x8e(\x09hX\x879\xb6\xe9\xb7\x84]\x89\x8e\
-D\x1d\x01\xdf\xbe\xa2\x13\xe1z\xdf\x88)%DXU\
-\x12\xac\x88\xd9\x17\xbfW\xe9\xb4e\x98\xf2\xddw\xdfq\
-\xaa\xd6\x1f\xd5P\x8b#\xbc]\x8ad\xe4\x5c\x7f\xb8\xca\
-\x81L\x93\x89\xaf.\x87\x5c\xca-h\x05wh\xab\xb0\
-H\xb5\x85p7)\xd8x\x83\xbb+P\x00d)\xb9\
-\x1deI2&?\xfc\xf0\x83\xb2T!\x98Y&\xae\
-\xc9\x09>]2\x14\xd1\x18r\x0b\xaf*/t\x167\
-`?\xbb\x17\xfcu\x1f\xd7\x95\xb8/j\xa1]\x85D\
-\x9b+\xfe\x17zE(\x1b2K\xac\x03\x5ce\x1e\xaf\
-j\x11\xe9\x9a\xc1\xd7\xeb\xb0\xa4\xb5\xc4P\x16:5\x1b\
-\x92\xc2\xb9:\xf5*\xf4\xee\xdd\xbb,g\x07\x0e\x1c\xf8\
-\xf6\xdbo?\xf9\xe4\x93\x0f\x1c_}\xf5\xd5\xd6\xad[\
-\x8f\x1e=z\xee\xdc\xb9\x8a\xfa\x0b{?)\x88\x00z\
-\xf5\xea\xc5.>}\xfa\xf4\xd1\xa3G#\xb3\xcf\xd9\xcc\
-\x96\x8e\xdc\xc3'\xf2Ig\xa55i\xcc&e\x99\xa9\
-L\x88\xec\xad\x0bh\x80\xa5\x89\xa7U\x7f\xd4\xf1\xd8\xb1\
-c\xd7\xae]ko\x97\xa3\x01\xdc\xd7\x1e\x8apH\xd1\
-{) \x19\xf4\x1cJ:ul\x89\x9e\xe5\x81\x00\x94\
-0t\xcc\x981?\x82`\x94\xf1\xe9\xdc\xb9s\x9f>\
-}\x06\x0d\x1aD\x84\x0dC\xf3!\x0c\xe5\xa4\xb4`\xc1\
-\x82\xe7\x9f\x7f\xfe\xc5\x17_$\x12%\x00\xe5J\x0c\x0a\
-/\xbd\xf4\x12\xfa\xb9s\xe7R\x90\xa1\xd0\x80\x0b7\x96\
-yp;/\x05\xd3\x91\x86\x5c\x15\xd7\xd5\x94\x12:\x16\
-\xb5\xca^\x8bzm>\xce\xe5\xbd\xe7\x98 {\x90\x9c\
-VF\xf0\x80\xf0\x98\x9c={\x96\xabU\xd2!$s\
-\x19\x9c1\x8c\xa8\xe5\x85\x1a\x99\x8c\x85\xcb*d\xa0z\
-\xc0\xa7s\x96\x5c}F\xd6\xf84\x97\xb6\x0cFi\x19\
-\xd3\x03\x0a\xb9\x04J]e \xcb\x10\x94BIz%\
-O\xd2\xf8\xaa\x93\xe9\xae\xaa\x88j\x8e\xf0\x16Y\x14\xaa\
-\xad\x08MV(h\xaa\xfb\xf1G\xde'\xa6\xb92\x14\
-\x8a6\xf0\xd7\xabW\xaf\xda__\xa4\x08\xa5e\x09.\
-\xe9;%M\xe9\xb8\xfb{HR\x83F\x85\xa4\x0d`\
-9\xe1\xd6\x84\xdd\xd7\xaf7\xe8\xb7\x07r\x9dU\xc3\xbc\
-'()Q\xffs\xc9F\xd0\xa8\xe1I\xafr$\x0e\
-\x91\xb5\x80\x8a\xc4:\xc0W\x94\xc3k\x9b\x83\xaf\xb79\
-\x03\xc8\x8d|\x19\x87\xfa\xe0\xee\x9f\xd7q\xc6\x01\xaf\xb8\
-y\xf3&{\xff\x993g\xd8\xfbw\xed\xda\xb5j\xd5\
-\xaa\x8f>\xfa\xe8/\x8e\xcf?\xff|\xc7\x8e\x1d\x17.\
-\x5c\xd0\xdbP\xecU\xb6J\x99!\xf4\xac\xa9\xa9!\xa6\
-\x197n\xdc\xc0\x81\x03\xd9\xcb\x93iu\x93(\x83R\
-\x08\xa7>\x12B\xa4,n\xd3,\xa8!\xaa$J\xaa\
-/ \x87\xe4\x81=q\xe2\xc4\xc1\x83\x07\xf1\xc9\xf6\xfe\
-\x04\x08-\xe1\xa6\xc2=+\x8dO\x99ku\x82O\xe7\
-\x884fcz\xab\x87+\x0b\xc5C\x0f=D\x0c\xd7\
-\xa9S'v\x13\x19T2\xb4Y\xef>#\xf0\xc0\xee\
-\xdd\xbb\x8f\x1d;\xf6\xb1\xc7\x1e\xfb\xc5/~AdI\
-\x94)\x14q\x0a\xe4\xe7\x9e{n\xce\x9c9\x1c\x9c\x88\
-M\x87\x0f\x1f>l\xd80\xae\xc8D\xab\xb8n\xef\xde\
-\xbd\xed\x13&\x86\xee\x1b\xa1\xf6\x14Gf\xb2\x07U\xab\
-\xacJ\x00\xa7b\xd9D0\xdfh\x92\xb0\xfd&\x87B\
-\x04J*\xff\xee\xbb\xef\xd8\xd0\x89yd\xd6!$\x9b\
-b\x81m\xd1[da\xcf\x8e0Mq\xc2:\xcd^\
-\xf7\x02%[L[\x06\xa3@\xfbp\x02m\x9fI\x17\
-s\xf1\x87\x90\x81,\x8b\xa0\x8eY<*AJrU\
-U\x1a\x95\xcdDeA\xb2\x94\x10\xca-\xc0U\xe9!\
-\xe9Z\x91t\x96.\xb3\x94\x13\x80\xdep\x10\x86\x12m\
-l\xdb\xb6m\xe3\xc6\x8d\x87\x0e\x1db\xc5\x97\xfb\x86m\
-ve}2\x94\x9bD\xb7V\x1b@J\xea\xe0?\x8d\
-^\xbe\xbeL\xd0|\xed5\xea\x8b@O{r\x06\xd2\
-\xe8\x9a\xd7e\xc9\x80\xac\xc6\xab#B\x1a\xcb\x8ap\x15\
-\xe4aU\xb5\x09\xa5Te6\xc9\xff\xf2\xed\xc9bL\
-x:\xd8\xf8\xf1\x8a\xc3\x87\x0f\x7f\xf3\xcd7\xfaY<\
-a\xe8\xca\x95+7m\xda\xb4\x7f\xff\xfe\x93'O\x9e\
-?\x7f\x1e\xcf\xe9\xd85\xae\x0a+\x8f\x22\xd1\x09\x13&\
-\xb0\xafk;'`\xc0\xfb\xbcE\xf3)\xe4B\xd2G\
-\xb9$\xf2\xfe\xa5\xca\x9aF\x06\xa2\xd0-\x0a\x81=\xeb\
-\xd5\xe5\xcb\x97\x0f\x1c8\xb0e\xcb\x16\x82Q\x8e\xcde\
-\xf0=\x1eX55Y)\x1c$\x9bDe\x0d\xafu\
-z]%\xd0~\x9e \x0e{\xd7\xaf_o\xef\xc0\xba\
-\xf50\x14\xb8V\xaf^\xbd\xfa\xf5\xeb7 \x80 \x92\
-Pr\xe2\xc4\x89\x8f>\xfa(\x91(A\xe7o\x1c\xbf\
-\xfe\xf5\xaf%\xbc\x96\xe3\x85\x17^X\xb0`\x81^\xde\
-w\xe9\xd2EQ\xb8A\x5cN\x5c\xab\xf5\x93\xc1\xf1\xc3\
-\x1d\xbc\x1a\x00d\xc3\xab\x9a\x22Yss\xebs\xe5D\
-\xfc\xea\x02\xbd\xf3\xe9\xd4f\xe1\xb59L\x13e9\xdb\
-\x84(\x19\x82>\xbaW9\xa1\x01\x9cU8!s\xd5\
-\xfc\x82\x1a\x16\xe2\xadS\xd0r/\x05r\xa8,\x91\x16\
-\x14\xc9\xa4\x8d\xdf\x8cr\xb5\xce\x93\x14rz\xa1\xac\x22\
-\xa8\xb8\x1b\xc3\xc6(D\xb2\x94\x86\xec\xc1\xa7sxm\
-\x16\xca\x0dm\x5c\x89l\xbcE\x0a\x9f\x9d3@\xa0_\
-\xf4\x91 C1(q\xc6\xb9s\xe7\xea\xea\xea\x8e\x1e\
-=J\xc0\xb1g\xcf\x9e\xb5k\xd7~\xf8\xe1\x87\x1f|\
-\xf0\x01\xc1\x07zl(\x92\xbe\x83\x1b\xa1\x04\x9f\xceo\
-j&E\x8cqP\x96!\xaeMV\xd2\xb6p;\x1e\
-\x0dN\xf3={\xf6\xa4\x01\x1a\x9f\xb0\x9dJF\xf8\xbc\
-|(\x9bFz\x19\xb4\x1f\xe9[\x14j\xa4P/\x8c\
-H\xa5G\x80\x0d\xf2\xf6\xed\xdbl\x90\xf8\xc0\xde\xbd{\
-\xbf\xfe\xfa\xebw\xdey\xe7\x8d7\xdex\xf7\xddwW\
-\xacX\x81\x9f\x5c\xbcx\x11\xdf\xc0L\xc79Wq\x95\
-\x0e\x83\xfd\x95h`\xda\xb4i\xe3\xc7\x8f\xef\xd3\xa7\x0f\
-K\x10\xf3\xc2d\xe2\x1aL0\x13\xea\xed\xda\x0fn\x11\
-\xfe+@\xd2\x12\xf7/lR\xbay\xee\xe9\xf1^\xed\
-l\x13\x90\xe9TCC\x03\x8b\xd5\xfa\xf5\xeb90s\
-\x16\xe2\xb0$\xb3\xf6\x83[\x7f\xf7\xddw\xb7n\xdd\xd2\
-\xd7A\xa0\xd1\x0ao\xad\x92 \x5c\x89\x04\x9f.\x807\
-r=\xe2A\xe3)\xe3hw\xfa\xf4i\xee\xe23*\
-\x00\xfa\x88_\x85\x10F\xb0T\x12q>\xfd\xf4\xd3/\
-\xbf\xfc2\x81&\xc1\xa5\xfb\xc0g\x12q\xfe\xeew\xbf\
-#\xf9\xcc3\xcf\xcc\x9e=\x1b?\x1c\xe5 \xe8\xe4:\
-r\xe4H\x09\x9c\x94\xa2w\x9f\x5cU9\x82\xb0\xa9\x07\
-dC\x9ap\xf4 \x1aO\xe1\x0b8\x944%\xc6\xdc\
-B!\xaf\xb3\xed`X<\x05\xb2Zh\xc8\xc0'\xf2\
-\x91>\xd3@\xca\x88\xf4\x10\xb5\x09\xdcNsW\x1c\x86\
-\x9aS\x07\xa7e\x0e0\xdd\xbauS0\xaa\xe2\xaa\xc7\
-p=\xf0x\x95#J\x82\xf5(\x99\xfe\x00)#\xd2\
-\xc5\xd1\x142.\x85\xb6<\xcdp\x1a\x1b6l\xd8\x84\
-\x09\x13\xb8v\xed\xda\x95\xf1Rs\xad\xd1\x08BI\xe1\
-U9L\x13\x09\x89i\xfe\xf4+\xb7YXA\x09\x86\
-r\xd3(K7\xb5dh\x8f\x9c\xccU\xee\xaf\x84_\
-\xbdz\xf5\xd8\xb1c\xbbw\xef\xde\xbe}\xfb\xce\x9d;\
-\x11\x889\x082\xb6n\xdd\x8a@\xa8\xc1b1d\xc8\
-\x10\x8e\xbc\x8a\xd2\xa25\xc2pu{\xbc\xca\x11%\x85\
-\x9a\x97\x86\x1d\xe5\xfc\xf9\xf3\xfb\xf6\xed;~\xfc8K\
-\xb3\xd7\xb6?t\x8a\xd39\xeb&\xbb8\xc7z<A\
-+\x94\x06J6\xd6\x11\x84Po$=Oa\xfaL\
-{]\x85\x94\x90\xb6\x84\xd0@d\x9a\x854i\x10\xa2\
-\xfa)b\xb0;\xde\xbbw\x8fS\x0a[\xfe\x8e\x1d;\
-\xb6l\xd9\xb2y\xf3\xe6M\x9b6\xe1\x15\x9c[\xae_\
-\xbf\xce\x04\xe9'\xf2\xaa\xa1J%\x80\xdf\xb2\x94M\x9d\
-:\xb5\xb6\xb6\xb6o\xdf\xbe\xe1\xcf\xe8\xf9\x1f2\x02\xc9\
-\xb4;\x95\x82\xca\x1aT\x12\xd6c\xb9\xad\xac\x5c\xd5\x0a\
-K*\x0b\xd8\xadq9\xc2\xc13g\xce\xb0d}\xfb\
-\xed\xb7,Y\xb8b\xd4\xb6v\x82\xd8\xa5G\x8f\x1e\x84\
-P\x04\xfal\xab\xdaJE\xa1\x06\x84\xed\x97\x8d\x92\xa6\
-\xd7\x95N]\xb9r\x85\x85\x97G\x8c\x90\x94G\x0fe\
-%@\x1f\xe9)\x07u:\xce\xc2\x08\x84\x11\x8c\xc0\xd8\
-\xb1c\x1f}\xf4Q\x22N\xae3f\xcc\x98>}\xfa\
-\xcc\x993\xb9\xb2\x84\xe2~\x93'O&\xe2\xc4\x03\xb1\
-\x7f\xd0\xfd\x92\xb8b\x11@\xd0[1\x04*\x07F\x80\
-\x91\xe1*\x99\x9b\xdaU c L\x8f\x90\xa6\x90^\
-\x05\x0dy\x11\x11?KY}}=\x07\x9b\x8e}\x15\
-\xcdP0P\x84\xe9\x0c\xdd\xa0A\x83\xf41\xd9\xa8\x9b\
-\x92\xb9\x92%\x0d\x84rDXV\xd0k\x1e\x1c}\xc2\
-\x8a\x8e\xeb@\xd5z\x98J\x1a\x8f{\xe0\x18\x80\x8c\xc3\
-H0\xe4B\xb8\x0d\xdb+\xbe1k\xd6,\x82.\xdc\
-\x83\xb2\xd6S\xf05\x16@\x0e\x00J\xca^\x05\x01Y\
-Y\x92E(\x833\x8c\xef\xc2\xb0\xfc\xcf\xff\xf9?}\
-\xa2\x99\xc4u\xb5\x06Fg\xe1\xc2\x85/\xbe\xf8\xe2\xa2\
-E\x8b\x88\xd6uJS\x97\x10p\x11\xb5\x1e\xd0\xe8j\
-c\x11An\x98%\x99+]\xe5*\x94\xe5\xeaS/\
-\xb8&\x0f!\x92\xe5\x86f\xa1`za\xb9!\xb2\xe1\
-\x0a\x18\x98\x0dm\x90\x80\x1e\x19/d\xb1\xd3\x0b\xd1\x93\
-'O\x12j\xb0\xa0s\x1c\xbf\xe1\xbeU@\x06\xe4b\
-\x83\x87-X\xb0\x80\xb3/\xe3\xd3\xbf\x7f\x7f\xb9\x8eU\
-\x05\x12\xec^vGe\x81iB\x94\xab,\xab\x84\xd5\
-\x81\x06\x10\x04\xbf\xfd\xf6\xdb+V\xac \x0eNL\xcb\
-\x02\x13\xcd\x16\xbe|\xf9r<\x81\xc5\x94\xc7\x86\x9e\xd2\
-<Z%\xb0\x89:\x22%\xa0\x07\x0d\x8bd\xb0Q2\
-\xcc\xde\xc0\xccK9\xe4*6Y\x10\xdeE\x82\x90\x9e\
-\xab\x19\x18\xee\xfe\x8d\x03\x9b\x89\xb2\xa2:\x01\xbdf\x1f\
-7`\x83\xd7\xef]2#\x84\xa1\xa7N\x9db\xc9\xbe\
-y\xf3&\xcbY5\x00\xadX\xf0[\x82\x80\xc7\x1f\x7f\
-\xfc\xb9\xe7\x9ec\xc5g}\xb3u,\xf2\x87h\xf6\x9b\
-\xf4\x96P\x80\xc4\xc9\x1cJ*KWS\x9a\x90&\xb4\
-7B{\xb2\x00M\xf8(\xe1\x9cx&K\x13\x01\x04\
-\x1b\xea\xea\xd5\xab\x09FY\xc1\xca\x16I\xb0\xc5rd\
-%\x02cx\xc7\x8d\x1bG\x92\x16\xea\xb1\x05o\x94C\
-\xdd\x09\xaf\xb2A\x0e\x95\x80\x9e~\xd1\x91O>\xf9\xe4\
-\x9dw\xde\xd9\xbf\x7f\xffwe\xff{\xc8\xc2\x9a\x04\xae\
-\x99\xff\x09\x17\xa2\xa7\xc4I={\xf6\x94/\x01\x1b\xe5\
-\xc0\x81\x03\xf5\xd6\x93c<\x1a\xec\xe9\x85\x8a\x00\x96\x16\
-g\xa86\x08\x87\xc8\xf4\x12\xa2\x911Ki@I\x90\
-\xcc5\xac\xcd\x08-C\x22c\xa6\x8c\x11\xbep\xe1\x02\
-\xe7\x99\xaf\xbe\xfaj\xed\xda\xb5\xc7\x8f\x1f\xc7\xaf|v\
-\xd9a\xac\x88\xcc\x9e|\xf2\xc9\xd7_\x7f\x9d\xc7\x16\xbf\
-\x92\xdb[7\xb9\x22\x0bW\xa2q\xc4L\x96\x10\xea\xcd\
-X\xb0\xb0s\xe0\xf9\xe2\x8b/\xfe\xf8\xc7?\xb2\xaa\xb7\
-\xec\xc0\x13\xd6\x89\xcc\xd4\x0f\x1e<\x98\xa3\xaf^\xe7\xa1\
-al\xd5x]\x05J\xb2p\x1b\xbce\x88\xfb\xca\x08\
-y\x8e\xfd\x14TW5\x9e\xab\x9e\xa9\xa4\xa4\x83\x5c)\
-\x91\x11\xc2,\xf9\x98\x0cB\xbd@oWa\xb2\xd93\
-,\xec\xf8R6\x97\xc6z[\x8f\x82\xd1\x97^zi\
-\xf1\xe2\xc5\xfaz\xcb\xa4[\xb9\x0eX?-\x89\x90\xee\
-\xb0\xc0 \xccR\x124\xac\xe03\x1c\xaaS\x82\xb2\xc2\
-\xabaf!\xa6\xc4X\xd3#T6\xaaYN@\xf4\
-\x80\x0c\x08<r\xc4y,|\x9c\x8dx\x1a\x896\x8e\
-\x1c9r\xe2\xc4\x09\x22\x0ff\x05\x1b\xcarU\xb35\
->\xaf\xbc\xf2\x0a\xe3\xc3\xd3\xc2\xf8h\xdd\x91\x8d]!\
-\xb3\xa9i\x0a\xd9\xa3W0\xca\xea\xf0\xe7?\xff\x99`\
-\x94\xb6\xf9\xbc\xf6\x87\xb5\x80\x13\x1b{\x8c\x82Q\xd6\x02\
-\x05\xa3\xca\x8dz*4\xbc\x12\x80a\xe1\xaa\xa4]K\
-!\xac\x16\x19\xc29\xcdDEd,M\x84\xeen\x06\
-$\xad=h\x90\x95\x05R\x027\xd5\x8cse\x16\xce\
-\x9c9\x83K\x10\x80\xe2'l\x8d\x87\x0f\x1f&\x12e\
-\x82d\xe3\xcbT\xa9<X\xa3jjj\xd8\xcf~\xf9\
-\xcb_.[\xb6\x8c\x88!\x5c\xee%H\x96`\x14\x99\
-\xd60\xcb\xe4\xb0\xb6B\x84\x06\x92\xadxZ\x00W\xa5\
-3\xe3_\xee)\x08W]\x16\xa8\xcb\x97/\x1f;v\
-\x8c\xf33\xc1(G\xe8\xa3G\x8f\x96\xf3G(4\x8f\
-ep\xe9\xd2\xa5\xaf\xbe\xfa\xea#\x8f<\xc2n\xfa\xc0\
-\x83\x0f\xb2I\xa8ya_@}q}\x8a\x07\xca\x94\
-\x5c)\x05\x04\xa3<q\x1f\x7f\xfc1\xc1\xe8\xc1\x83\x07\
-I\xca\xb2l\xb0\x82=\x9c\xfb\xcb\xd8j\x1b#\xdf\xa5\
-K\x17\xc2\xd0E\x8b\x16\xe1Qz\x19\xa1,\x04\x22\x0f\
-\xba\xcf\xd5\x95\xf6=\x02%\x85\xe6\xce(4>J\x0a\
-%\xdd\x90(\xe9+I\xaa\xce\xb7l\x0d\xd4\xae#\xf7\
-\xd9\xb3g\xb7l\xd9\xf2\xe5\x97_n\xd8\xb0\x81\xe5\xae\
-\xa3\xce\x00\x8c'~\xf5\xc4\x13O(\x18%6\xa2\xd7\
-42\xdd\xeb\xf4 h\xa4\xfcx\xe5\x13\x19[0\xfa\
-\xef\xff\xfe\xef\xdb\xb6mkA0J;\xe5$x\x8b\
-\x1c\x86\x08a\xe2\xc4\x89\xf3\xe6\xcd\x9b0a\x82\x8e\xbe\
-jI4\xf5\x82\x22\x94\xc5g\xe8 Ws\xa7\xf0J\
-q\xed2\xaa\xc7\x90\xc6\xf0\xda\xdc\x8d\xac\xa7a\x16\xa4\
-\xeb7\xac\x9e\xd6\x04\xa3m\xf9czFs\xd0\xa0A\
-\xc4\xe9\xc4\x22z\x1f\x96\xe9\xfaaRr\x1a\xe5\x1a\x99\
-\x1a\xc3\xab\x1c\x1a\x11]#\x22\xcbLT!\x98,=\
-0\xa9t\x87\x07\xec\xa6\xe3\xd6\xad[D\x9c<r8\
-\xe2\xea\xd5\xab\xbf\xf9\xe6\x1b\x8eG\x07\x0e\x1c \xf2 \
-\xd4\xe0\xc9\xc4^Xc:w\xee<|\xf8\xf0I\x93\
-&qea\xc2\x99B'\xcbl\xb3\x08\x9b!\x8a\x18\
-\x0b\x0ch\xea\xf9\xf3\xe7\xf7\xee\xdd[\xfe\x1f\xd3s\xee\
-\xc7\x0dx\xae\x06\x0c\x18\x10\x9eI\x0a!\x03Aq\x0d\
-\x0b\xb2][\x0c\xe3\x10\x8eUT\x9b\xb2B\x83LB\
-\x03\xda\xa6\x89K\xeauH\xa9\x9aIr>a\xb4\xc5\
-\xd5\xabW\xf5[J\x9f\x7f\xfe\xf9\xb7\xdf~\xcb\x5c\xe8\
-\x1b\x1c\xed\xa0R\xa5\x92a\x8e\x98Y\x1e\xd5\xe4\xdbt\
-\x86\x0c\xb1w\x0f\x1126\xa1\x053\x1b\xd6#\x8a$\
-%\xdb]\xc2\xdbEfJJeIA\xa9;w\xee\
-\x10}\xaeY\xb3\xe6\xab\xaf\xbe\x22\x1ee\xe1B\xe3\xb3\
-\xcb\x05\x8fR\xbf~\xfd\xc6\x8d\x1b\xa7WA\x0f\xe4N\
-\xa1\xa0\x06\xa7Q\x96l \xd4\x98\x9e\x93\x1e\x8b\xf3\xa1\
-C\x87\xf6\xed\xdbG\xc4@R\xfa\xf6\x83[\x1b8\x09\
-\x91\xc4\x981c\xa6;\xf4sv\x981c\xc6\xdc\xb9\
-s\xe7\xcc\x993~\xfcx6J\x02&\x8e:}\xfa\
-\xf4\xc1\xafz\xb8?S\x1c\xd6\xa3%EW\xa1\x1b\x15\
-B\x06\xa1Y\xbe\xac\x7f\x1e\xa7i\xa2\xc2f\xa1j;\
-\xe5\xfe\xce\x13\xbb\x9e\x16@\x16:oQF\x08<\x18\
-O6\xa0i\xd3\xa6q\x80\xd4\xc0\xa6Q\x9b%\x87\x0f\
-Q\x89\xcf/f\x04\xa0\x9c\xe5v\xee\xdc\xc9>\x1b\xf6\
-\xd4\xaa\x15\xbaQ\x08\xd3\xcaX\xe1\x03\x04\x9dx\x05L\
-\x992\x85\xd6\xe2\x1bD\xa23g\xce\xc4y8\xae\xe0\
-\x1b8\x12W\xfcD\xae\x12j\x10\xd8g\xbbu\xebF\
-\x5c\x81\xcb\xf1(\xe9^v\x8dpwN\xf0\xe9\x02\x14\
-\xb1\x91>\xbc\x1a\x96dXZ\xfcc\xfa\xb6\x0cF\x19\
-\x0e\xbd:\xe61\xe3\x8al\xcf\x12\xb9\xd6\x5c#\xd2\xa4\
-\x0d\x8c\xa4\x8a\x5c%B\xfa\x1cyJ9\x93\xb9\x94\xe9\
-MH\x83\xb1\xab\xc0?\xfc$\x1d\x14\xf1Y\x0a+\xb5\
-\xc0\xed\xde\xbd{\xd7\xae]\xfa0(\x8b\xf8\xa6M\x9b\
-\x88GqJV=\x22TB\xc0Bk\x9f>S\xcb\
-\xaaD0\xaa`\x9d\x9a}^\x8e\xe4\xae\x01f\x90\xb6\
-,\x0e\xf5tl0Z[[K\xd8\xad`T\xa3\xea\
-\xb3\x1d\xe9$`&\xcb\x10o\xd1R2\xc73RB\
-Z#\xa2\x06\xb8\x165\xd6`W|\x83\xc5\xe8\x87\x1f\
-~\xd0\xef\xc8\xb3<\x99\x87\xe8\xe3\xa1\xfb\xf7\xef\xaf\xaf\
-\xaf\x97{`\x9c\xd4U\xe5~@S\xccZ\xcf\xc3\xcb\
-F\x0b\xc8\xe6\xa5\xb21\xd94\x91;\x99\xbe\x10\xae\x82\
-\xd8FJ\xe1U)\xa2\x1b\x81/\x90k\x8f\x0c\xa4\x01\
-g\x92\x80\x9eS\x13+\xc3\xfa\xf5\xeb\xb7o\xdf~\xe1\
-\xc2\x85\x96\xfd\x9c\xb1\x95\xb08\x10.\xb0P\x8c\x181\
-\x82\xb1eI\x94>l\xaa\xb0\xf6\xeb\xca\x14\x98\xack\
-H\x99\x83Q6>\x1aOX\x00,\xec\x84\xd7\x84\x9b\
-\x8b\x16-z\xfc\xf1\xc7\x17,X0k\xd6,}\xfa\
-\x138\x9f\xb3\xf8\xb39\xd2q:\x0br'\x9do\x93\
-\x1e:\xa8\xd3&\xce\xdd\xa1\x91\xb4FHo\xb9\xa1Y\
-\xa84\xa4i=\xa1\x07\x22\x13\xf91\x02l\xfd\xdf\xbb\
-\xaf\xae\xeb\x90x\x946\x0c\x1e<\x98\xd1\xe6\x18`?\
-\xa1U\x16-T\x83m\x10\xb8J\xa3k(\xc8\xa0\x10\
-,\xe3<A\xfa\x15\x11\xfb\xcc(\x93\xc8\xedX+\x90\
-U\x0fS\xcc)\x0b\xc7\xe0\x0a\x0c\x0eA$>?j\
-\xd4(\xbc\x02\xf7X\xbcx\xf1\xfc\xf9\xf3\x09@\x89G\
-\x89M\xf5\xcd\xb8Zg\xe4\x1eT(\x19'I<&\
-\xf8|0\x98\xec:\xe4\xe1\xbe&\x18\xd2\x80Og\xe1\
--\x0a\xd8H_(\x17\xc8bX*\x22\x18\xe5\x99\xc7\
-\x05\x99\x15F\x9cx\x94\xd3\x09\xe3\xc80)W}\xb0\
-\x99\x8e\x88z\x98\x99\xe4\x9a\xd6;|RD\xb7\xb0\xec\
-\xd8.\x1fJ\xa9 \xa3i\xb2\x04@\xe6\xb9:y\xf2\
-\xe4\xea\xd5\xabW\xacX\xb1n\xdd:VpB\x0d\x82\
-\x0c\x16\xf4K\x97.\xe1\x97t_e\x93\xea\xb2P0\
-\xaa\x95\x17\xef\xc4\x8d\xa2&\xa5\xcb\x96\xd8\xf84TU\
-\x09oF9\xde\x85>\x00a\x8f\x0c%\xd3OT\xeb\
-\x89\x86\x94jMSd\xa6D\xd8\x0c\x045OI\xca\
-\x0ai\xee\xdc\xb9C\xa0\xa9\xbf\xe1\xb9f\xcd\x9a/\xbf\
-\xfcR{<\x1e\x82F\x9f\x10\xd5\xcbr\x8a\xa8\x86*\
-\xf7\x05L\x19\xcf\x91N\x11lr\x84\x11\xec(\xec\x0d\
-\x89g\x98\x8b6J\x8d\x84\x13\x9d\x95\x9fG\xe8ZF\
-\x93\xa5\xd2\xbeD\x91\x90t\x1b\xa4\xe7\x7f8\x22k\xc2\
-\x89\x13'\xf0R\xfdt\xbeC<\x93\xc5a\xd0\xa0A\
-l\xc3#G\x8ed\x03\x0e\x97D5\xd50M\xa6\x10\
-\xd1\xae\xc1\xa8n*\x988\x85>\xacu\xc4\x16t\x84\
-\xe5\x1da\xde\xbcys\xe7\xce\xd5\x0f\xc1X\x03\xf5\x12\
-To@\xf5\x1e\xcb\x97w\xd8\xec3\x05\xd2\x847\x92\
-\xdc$\xb2\x8c\xec-\x99T\x94#\xd4\xb7\x094[\xce\
-\xa3\xf63 \xf4\x91+\xc3\xae\x1f!\xb6\xed\xf8\x17\x87\
-X\x8d\xa1f\x0a\x88\xf08\x12\x10\xf9\xb9N'\x90\xab\
-vZR\xd7\x10\x19\x88tn\x08\x9db\xd3\xaf\xab\xab\
-c\x91g\x9fe\xa1 \x04\xc7\x13\x08(kkki\
-\x036L4\xee=y\xf2d\x22c\x9c\x81,\xc0U\
-\xf0\x93\x193f\xcc\x9e=\x9bv\xd2\xc8!C\x86\xe0\
-$z\xf7I\xec\xc4\xd0Y\xf4\x09\xd1\xb6\x08h\x94\x15\
-\x06\xa6\xdc\xceg;\x5c\x1b\x1b\xbb %(\x09\x9a,\
-\x9f\xc87\xd05M\xf1\x5c\xc18TD0J\xf7\xd8\
-q\x99$\x9e\xba\xa1C\x872\xb8\x0c+\x83\xa5\x5c\xfa\
-\x80\x81\x90\x06\xa2\xa4H\xf7\xb9\x88lI\xab'\xaa0\
-\xb4\x8fHgiRU\x03WF\x96\xee\xdc\xbbw\x8f\
-\xa5\xed\xc8\x91#\xc4\xa0\xabV\xad\xd2\x8f\xb4X\xe3\xf4\
-%\xf6\x04\x22%\x1e\xfexD\xf5cz\x82Q\xb64\
-\xb9\x91\xda\x90\x1e\x04a-\x8c\x9aZ\xa4S\x82\x0a+\
-'\x18\xa5\xb5M68y\x9er\xa3\x81 e\xeb)\
-\xe4\x0c\x85\xf4F\xd2bG(\x83y\x05\x02W\x06Y\
-?\x8b\xe7|\x8ccl\xde\xbcy\xc3\x86\x0dl\x81\x9c\
-\x95\xf1\x90k\xd7\xae\xddp\x7f\x86\x0aKU[\xe5\xbe\
-C+\x80\xc25\x1ea\xc5\x13l\x03\xf2\x07o\xd4\x14\
-\x99\x96\xaa\xc1\xf0\xda\x1c\xa1\xa6Iw\x15i\xbd\x0aF\
-z\x94\xf8-\xce\xc9\x9a\xa6\xdf\xb6\xec\x90\xd7\xa2\xc0\xe2\
-\xc0N\xac`TK\xa2\x9aj\x0d\xb6\x8e\xa3\x09\x095\
-2\x08\xe1\x09\xa5wm\x1e\x8c\xd2<\x1a\xa9\xb7\x5c\xc9\
-[\xd0n\xdd\x88\x1eX\xd2\x09,\x1eu<\xf2\xc8#\
-3g\xceT\xe4\x81\x9eH\x88\x00\x85>\x1a\xb8M\xb4\
-\xb8\xd1~Z[\xa4\x9b\x99\xa4\xb3\x8a\x18\x83r\x93\x1a\
-\x1dR\xb6!\xd6\x05*\xa7\x8fzOL\x92\xc1\xd7\x9b\
-\x1agU\x0e\xb8;\x9b\x0e32k\xd6,\xa6\x80\x96\
-h\xc0\xd5kk\xa4\x92\xba\x16\xa2I\x1b\xf6}\x16\x7f\
-\x82\x01\x02n&\x9a\xb8\x93\xd9\x7f\xec\xb1\xc78\x87\x10\
-\xff\x10P\xb2\x0fN\x9d:u\xc9\x92%\x8b\x17/\x9e\
-3g\x0e\xad\xd2\x89\x85\xf0\x94\xa8\x94-\x12\xe7\xc7\x86\
-F\xca=(b\x9b 8\x81\x7fI\x9b\xcdCB0\
-\x80\xb0\x83\xa1 \x94L\xec\x1c&K\x88n'\x94L\
-\xa3\xac\x22\x06\x80'TD0\x0a\x0c\x19O\xec\xc0\x81\
-\x03\xc7\x8c\x19\xc3\xdc\xd8aWCi\x03\x9a\xf48\xd7\
-%S\x86\xc3-\x03\xe1U\xf9H\x9f\x99\x1b\xd6\x03\xae\
-\x8e\xecJ\xc2V\x99\x19\x1eF|I\x0c\xa1S\x1d\xf0\
-D\x1d;v\x8cHt\xf5\xea\xd5\xac\xdd,s,\xe5\
-\x98\xb1\xc6\x85\xebH\x93\xb0\x87\x15z3J%\x99\xf5\
-\xc8@W30e!\xc8\xc5\x98F\xd6\xd7\xd7wl\
-0\x9a\xf9c\xfaP\x16hdc\xa0\x8c\xfa[\x0a\xa1\
-%r2\xa6\xb9\x97\x0dBYVs\x88\xb7\x08Pu\
-^v0\xdd\x1c\xb7\x18L\xbc\x22\xf9\xe0\xb0\xfb\x13J\
-\xecy\xdf|\xf3\xcd\xd7_\x7fM$\xca\xe6\xa7O\x85\
-\xeaT\xd6\x5c\x0f\xa9R\x99\xf0\xb0\x13\xae\xb1,\xe0\x09\
-\xfa\xcc\x96>\x83\xa4\x5cs\x8fB8\x0f*fS\xc8\
-@J\xf3\x1f\x09\x99\x96\xc2U\xd3Dc\xa8\xe4\x87\x1f\
-~\xc0\x81\xcf\x9e=\xcb\xe2\x00\x1c\x9cpW\x9f]^\
-X\x1c\x06\x0f\x1e\xac\xd0\xcd6\x0bu\x81k\xf8\xe0\x98\
-2\x122\xe1\xa1k\xab7\xa3\xba\x11sM\xa0\xc0j\
-6~\xfcxZ\xcbu\x9cC/D\x15\x83\xea\x15W\
-\xbf~\xfd\xfa\xf6\xed\xcb\x02\xa87\xe8\x14\x14\xbe\xba\xfc\
-\x8e\x80\xc92\x93&$\xad\x81Bf\xb1\x87\xe4$\xfe\
-/$\xa7\x07\xb6MpwH:\xc2<\x021(\xe7\
-\x1c\xc0\xd9\xc2;\xb6+\xdc\x97\xe3\x22\xeeD\x04B\x1c\
-\xc2\x9e\x8b&\xec\xa3\x1a\x19\x0a!\xa1F\x06E\x90\x19\
->\xcc\x8c\x8f\x1e=\x9aXs\xde\xbcy\xb3g\xcf\xae\
-\xad\xad\xe5\xd65554\x03\xf7\x004\xf8\x06\xfeC\
-\xa0,\x0f\xd1KP\x96\x91\xf0|b\xd5J\x00\xa6\x94\
-$\xa3g\x03\xe8\x941RffARQ\x0e%M\
-\xe9\xf2\xf3\x0c@\xca4\xca*b\x00\x15\x14\x8c\xc2\xc3\
-\x0f?\xcc\xb1\x80\xc0\x9f\xc0\x8b\xf5\xc5\xbdB`\xac\xfd\
-\x98r\x0d;cCl$\x83\xe1\xf0\xe9\xc2`\xe3\xe6\
-(A\x1a\x09\x96\x14V\x95\xf4J\x22\x9b`J\xc6\x91\
-\xfd\x86\xf0B\x7f\x13\x0fX\xce@\x9f\x02\xd4_\xc7!\
-\x12-\xf1=h\x1a\x05\xa3\xfa\xcch:\x18\x95\x10!\
-\x0333L\x9f\x09\xb5\x01\x1b\xcc\x85\x0b\x17\x0e\x1c8\
-@0\xcar\xa0\x82e\x80G\xab\x05\xc1(\x98\x99\xae\
-F\x94,NR\x91#sHM\x19\xe6b\xec%\x87\
-\x8aK\xe0*K\xf63\xb6p\x22\x92\xcb\x97/\x1f=\
-z\x94MN\x8e\xc1\xf0n\xdf\xbe\x1d\xdf\xd8\xb3g\x0f\
-\x9b:[ 68RRQ\x95\x1f\x11\xcc)\x0f>\
-\xcf,\xdb\x0c\xeb\x1b\x1b^\xb4\xc9\x19i\xc7s\x0eU\
-\xcc\x87\xcd\xa0\x90[J\xcfUJ\xaefif\x08&\
-\xa7\xc1^h\x95;s\xe6\x0c\x1e\xbbm\xdb6|\xf8\
-\xea\xd5\xab\x1d\xe5\xb1,\x0e\xfa1\xbd\x96D\xb7Y\xf8\
-\x0e\xa6\xfbb\x9a0W\x9d\x92l\xd0\x9d6y3J\
-\xf3\xd8\xc2h\x18\xd3\xcdR6u\xea\xd4\xa5K\x97\xea\
-\x0d\xa8\x82\x0c\xfdr\x92B\x0d\xfd\x80\x95\x22\xf4\x22\xf1\
-\x8d`5\x8b\x84\x88P\xaf\xee\x84f\xa1\x5c\x84BE\
-$+\xdcA\x0e\xb3DZS\x88p\x9c)eI\xd5\
-\xc0\x98[\xcb\xb9\x92d\xd39\x7f\xfe\xbcV\xc5\xb2}\
-_\x18#\x1f\x05\xa3\x1c\x09\x94\xa5\xe6\xa9\x85\x10\xca\x10\
-\xe9C\x18\xbdL\xb8\x17\xd1$\x91\xe5\xc8\x91#\xf5\xc3\
-w\x1dH\xd8\xfez\xf5\xea\x85\xc3\xa0\x07\x02P\x5c\xc8\
-~\xf8\x8e\x87H\xa08P\xbf\xee\x0b\xba\x9d\x04\xfe\xa3\
-\xc5J\x86\x98A\x94\x95\xd6\x18\xa1>4\x0b\xf5`Y\
-\x91\xde\xc8\xd4GJ\x06\xb9\x82\x82Q\xa6\x87\x90\x8b\xb9\
-\xc1!x>\x19n\x9f\x91\xc3:\x1c:72X\xc7\
-,+\xb3\xff\xc2l\x22\xac~!\xa5\xab>\xb1Gc\
-\xb2A\xf2\xfb\xef\x7f\xb8u\xeb\xe6\xf9\xfa\xfa\xbd{\xf6\
-\xac_\xbf\xfe\xdbo\xbf\xdd\xb0a\x03\x8b\xb5\xbe\xbb\x1e\
-\xea\xea\xea\x1a\x1a\x1aZ\x1c\x89\x02\x0f\x06c\xa2\xd7\x00\
-\xe1\xcf\xa4\xa2\xc6\x08\xb2\xe4\xf1J\xa6mT\x96k\x88\
-\xb2\x92\xee\xb9\xaf\xdb`E&\x12\x05Z\xae\xac2@\
-\x9b\xc3`\x94\x870\xec\x88\x1a\xa9\xd6\x1a\xa1\xc6l\x8c\
-(Y\x0a6\x5c&\x18\xb6\xef*\xcb\xee\x18&\x05\x1a\
-\xc0^oC\x19C\x82{\xb6\xf05k\xd6\xacZ\xb5\
-\x8a\x00t\x87\xfbNY\x8e(\xf2\x0d\xbd\x0dU=U\
-~\x94\xb0\xb8\x0d\x1e<\x98\xf5\x0d\x0f\xd7{/\xf3\x1c\
-a\xfe\x83 \x9fG0%DI\x88\x92V[\xe2|\
-9\xa4\x11\x85\x8a'\xf5\xe67\x06\xa4D\xb0z\xf4\x03\
-\x93]\xbbv\xb1\xc4q\x8e:{\xf6,\x1ag\xdb\x01\
-\xb01\xb3y\xb3\x8b\x8f\x1a5\x8a\xcd\x82\x1dZC\xaa\
-6GD\xca0\x19\xf6\x1a=\xcfl\xb3\xde\x8c&\xf7\
-\xcb\x1d\x86\x052a(\x81\xf2\xb8q\xe3X\xb1\x898\
-\xf5\xdek\xee\xdc\xb9,kD\x18\xb8\x01\xb9\x84;\xc4\
-\x22D\x1e\x0az\x5ct\x91|\xf8\xca\xd7\xeb\xf05\x06\
-\xfe =H/Y]\xd0Uz\xe12\x9b&\xb4\x8c\
-dCI\xbb\x8aPn\x12\x1bg\x95\x22)\x18pP\
-\x16I\x09\x0c\xfb\xdd\xbbw\x99\x08\xa6\x80\xf5\xd3\x0c\xda\
-\x15\x5cH\xc7\x06@\xe0\x81eF\x94E\x9b\x0d\xe6B\
-\xf8\xb4\xc3\xab\x02\xa4\xb4\x5c\x09\x0653\xe9l\xe5\xbd\
-{\xf7&\xe2\xd4\x1bq<\x01\xaff\xd7CO\x92+\
-2\x96V$\xa9\x97\xabKF\xad\x02\xd3\xb8&\xfbq\
-\xb6\xab\x04\xd0\xb0\x9b\xd2\xda\xa6\xdc\x88\xb4^\x1a\xd3\xdb\
-\x94\x19f\x10\x82&\xb2\x94R\x98A\x8b\x83\xd1\xbc\xc7\
-\xa6MH\x06)\xc6{\xa1\xebQc\xeb\xd3\xc8\xa7\xc1\
-\x97\xcb\xe1\xb3\x1dQ\x0d$5\x13>\xed\x08\x93\xc8Q\
-.\xf5\x13\xa8\x11:\xb0\x0as\xbdw\xef\xde\xcd\x9b7\
-/\x5c\xa8?p\xe0\xc0z\xf7\xa9P}\xff3\x91(\
-\xa1\x06\xcb\x19z\xa2\x8d\xd6\xbc\x135\xd2\xdd\xb1\xa4\xda\
-iH\x09\xa1\x1cb\x05\xa3\x0a!qw\xf7s%\x1e\
-\x06\x16MVLNf\x85\xeaiW\xb8izv\x00\
-M\x84\xf4a_|F\xf3\x9b\xadJ\xb8\x86\x82\xe1+\
-\xcd5\xcck\xb1\xe4F\xee^\xb8\x07\xe7x\x1c\xc3|\
-\x83\x0d\x9b\x18\x14\x97X\xe9 \x18\xdd\xbcy3\x91(\
-J|\xe3\xf4\xe9\xd3\xd8P*\xb9w\x95\x1f)x\x88\
-NwG\x8f\x1e\xe5\xf8\x81K\xdcq\x7f\xb0@\xf3.\
-w\x92G\xe9\x0a\xa6W2\x8d\xab8!\x94\x8b\x93i\
-\xe9*K\xf0\xe9\x14d\xb9\xd6\xfdg\x1c\xfb\xd2\xa5K\
-\xaci80\xc7l\x5cW\x9f\x85\xf5ve\x87[k\
-\xb5WR\xbd\x08\x91\xbeYP\x9b\xf0\xe9\xa2p\x0bB\
-\x07\x96G\xe2\x89\x9a\x9a\x1a\xe2\x09 \xb0\x18:t(\
-a(\xa1\xe73\xcf<\xf3\xea\xab\xaf\xbe\xf6\xdak\xbf\
-\xfa\xd5\xaf\x96,Y2~\xfcx\xcc\xf4\xba\x14\x085\
-\x90\xf56T\x13m\xd5\x9al\x8d\xb1&)\x17\x94\x0c\
-1\xbd\x197\x0b+.L\x96\x1e\x94\x04\x9f\xcejC\
-\xe9\x845H6\x88\xba8]\x0c\x1f>|\xf4\xe8\xd1\
-\x0c)\x9b\x91\xcc\xda\x1bnM\x00\xda\xc7}a\x16\x02\
-\x93\xa2\x91t\xee\x9f\xa0\xe6\x81\x92>:\xccA\xd2\x90\
-F\xc6\xaa<DJ\xcc\x98}\x02P \xe8\x94\x1b(\
-7\xf3\xdd'D\xd5%\xce\x91\x8f\xf4\xd8\xc8\xd0\xae\xc2\
-ezd\xec3\x0a#\xe3\x88P\x1f\x9a\x99,A#\
-\xa0,k\x9b\x91\xd6\xb4\x86\xb6\x0fF\xd5\x07\xa0\xa1Z\
-h|\xba\x00\x14\xc1\x06T\xdc\x90FY\x86\xe9\x81\xb2\
-\x9axe\xe9^ \x8d3I0\xa5\xeeE\x00\xca\xfa\
-\xcb\xa6r\xd1Q__\x7f\xfe\xfcy\x16e\x16hb\
-\xd0O?\xfd\x94P\x83\x08\xe3\xc2\x85\x0bD\x18\x1c\xec\
-\x08G(\xd2V\xa1\x865F\x82\x11\xe6\x82\x92!n\
-\xa8\x12|:\xd7\x9d\xc8\xd8\x0c\x10xHx&9\xc7\
-O\x9f>}\xd8\xb0a<*\xca*?\xd6T\xb56\
-\xecEH\xd4\x97\xb6\xc5\xeenDI5\x91\x89f\xba\
-\x99\xfa\xabW\xaf\xca=N\xba\xbf\xaa\xf5\xf9\xe7\x9f\xff\
-\xe5/\x7fy\xff\xfd\xf7q\x8f\xc3\x87\x0fs\xd67\xdf\
-`\x83\x8f\xaa\xaa\xf2\xa3\x84`\xf4\xfa\xf5\xeb{\xf7\xee\
-]\xbbv\xed\xf6\xed\xdb\xcf\x9d;\xa7x4\x9c\xfd\xc4\
-\xc9\x02\xa4\x0c\x1d^2W#\xd4G\xc8\xa08f)\
-!$\xcc\x05|\x1b\xc7>r\xe4\xc8\x86\x0d\x1b\x08F\
-q\xecr~\x98\xaf\x10\x0c\xa0\x1e\x22\xad\xb1j\xaa\xb2\
-\x9a$\x1caC\xfa&\xfb\x85%\x81\x021\xc4\x80\x01\
-\x03X$\xe7\xcd\x9b\xf7\xe8\xa3\x8f>\xe6X\xbat\xe9\
-\xb2e\xcb\x96/_\xfe\xd4SO\x11\x80\x12\x92\xea#\
-\xa1\x1c\xec\x09\xb0(b/A\x85\xb6!\xd5)!M\
-\xd8\x1e5O\x98&\xd2\x0b\xe5V\x0e\xd6Ak\x9b4\
-\x5c%\x84z\x86E\x81\x1a\xc3\xa5\xdc2\xa0\x9brB\
-P$\xea\xda\x95G\xa8T\x11\x9fpH\xd3,\xa8\xd0\
-\xfbA\xce\x13\xdc\xd4%\xa4\x1b\xa0\x22!\xde4\x874\
-\xca2\xc2\x82\x92]e\x09R\xb6\x06_Q@\xa8L\
-7\xa6\x10\x85\x1a_:\xed\xf2cz\xfba4\x8f.\
-\x8e\xa8)\xf1\xd9\x0e%\xedj\x1d\x08\xcd\xa2\x22\x10\x96\
-2(\x0b\x8aDM\xc3\x95\x9b\x82\x92\x80\x81V=\xc2\
-\x88\x13'N\xb0\x22\xc3\xf1\xe3\xc7Y\x91I\x12^\x10\
-plr\x7f+\x9c\xd8\xb4\x9d~\xa6\xc0\xc8p\xe0\xd6\
-gFyZ\xd2\xc3\x12B\x96\xf0\xe9\x1c^\x1b\xe8%\
-\x9b\xc6e\xfac\x1fp>c\xa1'\xae\x22\xbc.\xcf\
-o5r\xd3\xf0\xc7\xf4,\x0dj\x92\xc0\xc0K\xf9\x98\
-^BRQ\xeb\x90\x1b\x08\xf9\x80\xaa5\xbd4\xb4V\
-\xfa\xff\xf3\x7f\xfe\xef\xdf\xff\xfe\x03\xe1\x05\x03\x85c\xe0\
-\x12\xc7\x1c\x87\x0e\x1d\xda\xbau\xeb\xc6\x8d\x1b9\xae\x9c\
-:u\x8a \xb5<\xc3X\xa5\x02\xd1O\x1e\xf56\x91\
-\xd3\x9d\xde\x8a\x85\xeej\xde\x85R(ix\xad\xc3\x92\
-\xca\x82P\x09R\x02\xb2\x1c5\x13o\x94\x85\x0ch\x15\
-\x0b\xda\xf7\xdf\x7f\xcf:@\x18M0}\xf0\xe0\xc1\x86\
-\x86\x86\xf6X\xe5\x9a\x05\xfbw\x8f\x1e=\x08\xf2\xa0W\
-\xaf^\x0c\xa9\x1a\xec\xb3\x83\xa1\x80P#\xb9\x10L\x13\
-\xc7\x06\x1e\xe1\xfd\xfb\xf7_\xbe|\x99\xa4\xcfp0\x92\
-\xdc\xa8[\xb7n,S\xfa\xc4\xea\xc2\x85\x0b\x17,X\
-\xa0\xdfC\xd2\x87A\xf5-\x95\x0a@i\xa1^z)\
-\x06\xe5\xee6\x17\xbeF\x87\x92\x91R\x84Y\xe6!F\
-\x11}\x11\xbcQ\x8e\xb4\x06\xa4t\xe6\x09R\xb6\x18\xd5\
-\x90Y\x15\x8d\x0f\xdb\x8f\xac\x93\x1b{+[\xea\x81\x03\
-\x07\x98\x8528\x1b\x0d\xeb\xda\xb5\xeb\x981cf\xcc\
-\x981z\xf4h}JPS\x06\xcc\x9aM\x5c\xe6\x0c\
-\x82\x94\x99x\x8b,\xc2\xbeG\xf8\xc2\x01>\xc3\x91Y\
-P6\x91\xa5+\x9a YJ\x90\xd2\xf0\xda\x92\xb1R\
-&Dr\x11\xd2f$\x99\xe5\xca\xfa\x05\xa6a\xeew\
-\xc6\xb9\xf2\xc0+\x18\xf5y\x0eu \xbc\xda\x94\x98\xd2\
-\x04\xa7.\x86\xd9X%\x0c\x87\xfc^Y\xc8\xac\xc2\x04\
-\x197\xdd\xef>\xb3\x0a\x7f\xfb\xed\xb7\xdf|\xf3\xcd\x96\
--[v\xef\xde\xbd\xc7\xc1\x03\xc3\xb2E`J\xa8A\
-\xe8\xe6\xaai{\x18\x19\x96\xb6\xda\xdaZ\x85\xe9\xacn\
-E\xba\x892\xad\xcf\xb4\x84B\x96Z\x14\xe8\x14A\x15\
-\x81\x14\x9b\xa8r\xdb\x15n\xcd\xf2\x1d\x05\xa3z\xf8\x0b\
--\x01B\xfa\xf0\xda\x1a\xd2\xcfy\xe8f\x06Iy\x88\
-\xde\x97\x9f;w\x0eg\xc0C\xd6\xad[G\x0c*\x0f\
-\xd1\xcf\xe2\xd9\xbc\xed\xfdM\x95\x9f,<P\xf7\xee\xdd\
-\xbb\xe5\xbey\x94G\x18\xf7\x96\x1e_\xc2\xbd\xcd\xc3\x01\
-Yz\x19\x88(i\x98>)\xd9\x14\xb2,\x11\xdc\x1e\
-\xa7U\x18}\xe6\xcc\x99\x9d\x8e\xfa\xfaz:\xe2-:\
-\x0e=\x92,\x8c}\xfb\xf6e\xad \x92\xd0\xa0\x15A\
-\xdd\x8f\xae!h\xe8\xec\x8d\x1b7t\x92\xbcr\xe5\x0a\
-\xdd\xf7y\xeem(w\x192d\x08\xeb0\x0b\x14Q\
-\xcb\x5c\xf7W\x91\x08I\x09_X\x99\xc9b\x95\xe6\xda\
-\xbf\x7f\x7f\xfd\xa87\x0ch\x80\xfaE(G(\xcb\x99\
-'\x84\xca4E\xf4\xc2\xa7\x8b\x92i&\xa5\xab#A\
-\xca\xd6\x90\xae\x84\x19\x94\x83\x81ip-VK\x22\xd1\
-\xcd\x0e&\xa2<[\x0f\x93\xc5\xdc\xcdr\x0c\x1d:\x94\
-\xb3\x22\x13\xe7\x1eJ\x8f\xc6!\xc2\x17vD\xc9\x12\xa1\
-\xcb^\xca\xc2\xeatwk\xba~\xd9\x14\xb2\xb4\xdc4\
-\xa1A\xb3\x08\x8b\x8b\xcc\x1e\xc9\x0c\x8a\x8c$nP\xe9\
-\xbf\xc0d}\xb3F\xeb\x1aaY&8uA\xa8V\
-0\x04<\x00\xe0\x1e\x8a\x04\xd6# z`\xdb\xb8\xe8\
-\xfe|\xfc\x91#G\x88*\x880\xd6\xaf_\xcfr|\
-\xfc\xf8\xf1\xb3g\xcf\x12|\x00K3\x11[;\xbd\x10\
-5\x88\xcb{\xb8\xb38+\x1d\xe1Z\x18\xa6\xa7{\x1a\
-\x8d\x00B\xa4)\x82l\x18\x16\xf6K}\xf7\x10\x11\x15\
-\xe1T\xd9\xde\x8c\xd2;\x8e\xa7\xe3\xc7\x8fW0j\xdd\
-l\x12\xd7K\x8fW\xb5\x0e\x06\xc1K\xaer\x92a\xcd\
-L7\x1e\xc2\xbc_\xb8p\x81\x15\x13\xf7 \x12\xe5\x94\
-\xb2q\xe3F\x04|\x06\x0f!\x8b \x95\xf8#\xac\xaa\
-\xcaO\x19\xd6\x19|F\xf1(\xcf\x14\xfb.I\xdc\x83\
-\xd8\x94\x5c\x9c\xca\x5c\xc59r\xb2v\x87\x9a\xb4#\xa1\
-\x0c\xaf\x99\x98\x81\x88*\x09\xb3\x84+\x94\x80L\x93p\
-`\x96A\x96\x82\x1d;v\x1c=z\xb4\x12^\x8b\x02\
-\xbd`\x95\xa6\x91\xfd\xfa\xf5\x1b1bD\xef\xde\xbdY\
-\x15I\x16\xe9\x9dd\xd3\x84Y\x06\xc5\x99\x17Vu\x82\
-o\xa6\x86yaW\xea\xdc\xb93ah\xcf\x9e=\xb9\
-\x11\x01\xe8\xd2\xa5K\x17-Z4{\xf6lmU}\
-\xfa\xf4\xe9\xe6~\xe5Yo@Y\xb5\xb8*\x06\xb5H\
-\xd4*\x8f\x9a\x97\x89\xd9\x8b0\x19\x15\x8f,\x8d\xe4\x96\
-\x85\xb3\xbc\x94#\xd3R\xca\xa4\x16\x87\x94m\x88\x86\x02\
-G\x02m\xb8\xc0C\xa1w\xa2,\xa4\xfa\xd2e\xf6\xd6\
-28\x1b\xd3\xc4\x91f\xfa\xf4\xe9L+G\x0b\xce\x12\
-\x9aMEN\x18h\x10\x0c\x95\x02\x9fvxU3\x89\
-&4\xa2H\xb5\x99YM*#\xd9\xf0\xaa\x025d\
-\xa2\x96\xcb^W\xebK\xd8\xa9\xa8\xf2\x10\xaf\xcd\xc1D\
-WP0\xcac<p\xe0\xc0\xb1c\xc7\x12\x92*\xe4\
-\xf2\x19\x8e\xa8\x03\xd6\xe1Po\xb2i\x22\xa4\xa7\xac\x8a\
-s\xd5\xbbO\xb6\x07\xae,C\x02\x99\xa7\xe2\xd4\xa9S\
-\xbbw\xef^\xb7n\x1d1(\x91\xa8\x82\x0c\x85\x17\x04\
-\x22\x82\xdd\x85\xa7\xc8\xd5\xdd\x8e0O\xb4\x9be1|\
-\x0d\xe0\xfa\xda\xd8Y%\xc1\x95H0\xd9\xf4\x12\x0c\xe5\
-F\xa0\xe7v\x8c\x001\x16\xa1\x15\xc17A\x15\xdd\xf4\
-\xd9\xed\x09\x9d\xe2\x102r\xe4H\x05\xa3\xac\x08\xb6\x1c\
-\x88\x22m6\xa1\x90M)De\xe5$a\x9d\xd20\
-\xef\x8c\x0f\xbb2#coC\xb7o\xdfNH\xca\x1e\
-\x86\x9eUU\xbeQ\x86\x95\xb4\xca\xfd\x05\xcb\x05\xce\xc3\
-2\xc2q\xa5\xae\xae\x0e\x17\xc2U\xd8\x0eq-s\x18\
-\x051\x08\xf2\xb7\x90P\x13z\xa6\x09F\x98+\xd2\xb5\
-\x89\xc8\x8c\xa4,i\x0c\x9e|\xe5\xca\x95}\xfb\xf7\xaf\
-_\xb7\x8e`\x94\xe37\x9aB\xf5\x94\x19\x16\x07\x96\x08\
-6\x0b\x96\x0bBR\xdb/\xacy\xea\x97\xf5.JB\
-\x94%\xe8\xb5\x96t\xd6\x22V\xa1\xa1C\x87r\x0b\xc2\
-\xd0q\xe3\xc6\xcd\x9c9s\xde\xbcy\xb3f\xcd\xd2W\
-2\x11\x86\xb2\x14\xeb\xcc,\x988/\xb9\x85\x8b\x96\x84\
-c\x156 \xbcc\x1ar\x0d\xaf*\x8c\xb7\xcb\xa1[\
-\xfb\xbc\x12\xc84\x962\xa9\xce!ek\x08\xc7A0\
-\xce\xfaEO\x1e\x07\xe2~\xe0\xa1\xd0\xa6\xc3r\xbag\
-\xcf\x9eK\x97.\xf1hx\xeb\xf6\x04/\x1a<x0\
-\xa7\x0bN\x1a\xec>\xfa\xd9\xa3\x86\xd1\xf0\xa6mMz\
-XB\x8a\xdf7\x9dk\x1aUk\xc9\xd0\x12YD\xb2\
-\x08\xe5\x12\xb1\x22\xf2u\xf5\xc7\xfa\xe5\xaa\xf7HcD\
-\x8d\xc4\x1fZ\x1c\x8c6\xbb\xd1M\xc2\x01t\xd2\xa4I\
-O?\xfd\xf4\x13O<1a\xc2\x04\x1eu\x9em\xf4\
-y\x8d\xce\xb5]\xca\xb0\xcf\xa1`I\x90\x9dd\x03\x03\
-\xca\xb2\xb0\xe2\xf1\x04\x10l\x09\xc8>\xcfU\xcb\x13r\
-\xfe\xfcy}x\x88%\x98$\x0f\x06h\xb7(?\x9c\
-\xcbY\x0a_x\xe1\x85\xe5\xcb\x97s\x1c\xd7k\x00\xf5\
-\x82\x5c\x1b\x87\x08\x0c\x22!\x84RV0\xb4dS$\
-\x16gQ\xf8\xe0\x83\x0f\xd6\xacY\xc3\xaeY\x9e^3\
-\xdd\x83\x06\x0dZ\xbat\xe9/\x7f\xf9K\x96\x86\x9a\x9a\
-\x1a-\xf44R\xcd\xcb\xec\x85 +\xc4\xfae\xa0\xf4\
-R\x01\xc2\x22\xc9\xb8\xe4\x0e\xee\x08v\xde@\xd6\xf6\x8c\
-\xcf\x5c\xbcx\x11\xc7\xe0\xf8\xce&M\xd2<\x04\x1b\x19\
-W\xa9R\x08v;|\x9b\xe3%\xe1\xce\x94)S\xa6\
-N\x9dJp\xa3o\xc5\xef\xef\xfe\xbe\x1f\x8b\xa1\xb6C\
-\xdb\x14U0\xf1K\xe7`\xd2(\x0b\x94\x95X\xe4\x13\
-)3mBT\x15\xe0\xf9z'\xca\x11\x8b\xe3\x16\xb0\
-\x18r\xd0*\xc3\xd9\xbbDX\x03\x19+\xd6\xc3_\xff\
-\xfa\xd7\xd3\xa7O\xd7\x11=\xea\xa0\xba\x93\xbe\x1a$\xa5\
-QA\xae\xf4\x9a\xa8\x88\xc5_\x1f\xf2\xd6\x0a\xc0\xd2\xc4\
-d\xf5\xea\xd5\x8b\xa8\x979BV\xdc\xc9\xf4Xu\xd4\
-c\x95\xa8N\xc9\x12\x22\xcc\xa0\x10\x91\x01\xf5\x08\x9fv\
-`\xd3d=M\x92\xbe\x11W\xd5\x0c\xf4Qzd\x09\
-E\xb0\xe6\xa5\x8d]\xdb\x1bs\x19U\x16Rv\x99z\
-\xc7\xad[\xb7X9\x89GO\xb8?3\xcb\x9e\x8b\xe3\
-\x11\xaa\xca\xbe\xbd\xe9\xd2\xa5\xcb\xc4\x89\x13\x7f\xf1\x8b_\
-<\xfb\xec\xb3c\xc7\x8e\xc5\x91x<\x93\xce\xb7zl\
-\x0b\xa1\xd1\x00\xc6AI\xe9\x0b\xdd\xd1f=\xcc\xb6R\
-i2+LW\x1e\xad-\x90\xb6\xc9$iz\xfe-\
-H\xd2\x17\x08\xb3\x84\x0c\xb8FY\x92\xd1\xcb\x80\x85\x85\
-\x91w9\xcd\xa6\xa4F7\x0b<\x80G\x9d(\x84x\
-t\xc9\x92%\x1cFy\xe6\xd5Pa2B\xd8+C\
-\x06a\x11\x99\x99\xb1\x09\xd80p<\x0c\xbbv\xed\xda\
-\xb0a\xc3\xc1\x83\x07o\xde\xbc\x19\x9a\xf1$\xa0\xb9\xec\
- \xce\xd0(+\xb7C`\xd9]\xb8p\xe1\xf3\xcf?\
-\xcf\xc8\x10\xb1\xb1\x93\xa9\x9b\xb4\xaaH\xc3l(\xc21\
-1\xc2\xb2\xa1%nA\xdf\xf7\xee\xdd\xfb\xd9g\x9f\xad\
-X\xb1\xe2\xd0\xa1C,\xd0\xcamWx6p\x80\xf9\
-\xf3\xe7\xff\xfc\xe7?_\xb0`\x01\xa7U\xdb\x92\xbdE\
-ad\xc3UH\x99\xa6P\x96\xc6!\x1c\x0d\xf7d%\
-\x1f\xe1`\xd1\x04\x04r\xf1\x0a|\x86\xb5\x92\x15\xf3\xe4\
-\xc9\x93\xf8\x06\x9b\x16'\x19\x96\xd1d(;\xd4C\xaa\
-\xdcw\xe0f\xfaq\xc7\xc0\x81\x03\x15\x89r\xce\xd4\x9f\
-\xfb\xb3\xaf\xdd\xc6@G2\xb9\xae\xdc\xccd\xf4\xe0*\
-k\xf4\xde\x10g\xde\xb4[\xca\xe1%p\xa5\x08>\xcf\
-A\x9dE`\xed\xda\xb5\xac\x90G\x8e\x1c\xc1\xf3y\x0a\
-\x9cyE@\xc7\x19\xb1\xc7\x1f\x7f\x9c`t\xce\x9c9\
-D\x8a\x04\x88j\xbf\xa1dx5H\x86\xd8@1\x0e\
-\x04F<\xe9\xc0J(%\x06lOL\x87\xb01\x17\
-\xe4JP%\xe0\xaa\xcc\xbb]q(\xe2%\x87\x15\x0f\
-\xf5\xae\xe2\xd8,S\x88\xcc\xc2\xa4Y\x1a\x91\xc6\x8c\xd1\
-;\xe7\x8a?(\x95\xae\xc1(t#\xe9\xb9\x9a\x01#\
-\xcc\xc1F\xbf\xe2\xc9y\x9e\x85\x14\x0d\xbb\x0c\x07\x00b\
-S\x0e\x03\x0c\xbe,\xcb\x00\xc1(\x07\xc2_\xfd\xeaW\
-l\xaf#G\x8e\xe4\xb9S0\xea\xb3\xdb\x01\x0d\x05\x9e\
-&A\x1a\xae\xbaitke\x19\xe9\x81M\x93\xa9\xa7\
-`X\xd6\x92&H\x96P\x9ct\x9b\xc1\xba#AJ\
-p\xd5\xc7\x91((\xa9\x5c\x04\xd6\x96n\xee/\xc1\xb6\
-\x80\xb6\xff1=}\xc0\x05q\xca\xee\xdd\xbb\x13\x88\xe8\
-\xc5\x98\x0e\xa02P\xa3%\x08%\x8dPc\xb2\x0d\x81\
-\x1b\x0d\xdf\x7f\x04\x16\x1a\x9c~\xdb\xb6m_}\xf5\xd5\
-\x96-[\x8e\x1f?~\xea\xd4\xa9\xd39\xf4\x99?\xfd\
-\xc8\x95\x86\xa9\x86\x0e\x84ew\xf2\xe4\xc9S\xa7Ne\
-\xbbb\xce\x18\x16\x94\xd6\xa34\xc9\xe8\xe4\x8fF\x88\xd7\
-\x06\xf8\x0c\x97\xc5\x80\xabZb,\x9d\x5c\xef\x96\xeb\xd7\
-\xc0Y\x05\xf4\xd31\x1c\x80M\x1a\x07\x90\xde\xba\xa9\x16\
-\x86\x90eJ\x93\xd3f\xa2\x90>\x82zp\x0f\x1e\x0f\
-\xbd ?\xe6 \xfa\xc4I\x88D7m\xda\xb4n\xdd\
-:\xf6\xe93g\xce\xb0z\xb2\x86Z\xf3\xaaTi\x16\
-\xf21\xbc\xe8\xdc\xb9s,;8\x1bk\xce\x8d\x1b7\
-X\x9a.^\xbcH\xfc\xc7\xe2\xa3\xad1\xf4\xf3\x10=\
-\xad\xe6\x81\xc5=\xdc\xcc \xb4T\x0dhT\x1b.M\
-$\x8a\xab\xe3\xe7\xf6N\xb4\xa2\x22Q\xa0\x9d\xb4\x96\xe5\
-\x828\xbeg\xee\xafh\xaaS\xd65\x0c\x04\x9aL|\
-\xb6\xc3\xab\x9cR\xa1''\x01B\x13@x8\xf7\x87\
-pBK\xa1{\x09KJ\x88rK$\xa94U\xad\
-\x88d!\xd94a\x16\xa3\xe4%GR,\x1f\x9f\xe1\
-PRz\xa0\xa7\xa6\x8c\xeaI#3#JZq\x84\
-\xbf\xff=\xd9yq\xaa\xf5\xeb\xd7\xeb\x8f!s\xd4\xa9\
-\xab\xab\xd3\x9e{\xeb\xd6\xad2{\x1a\xd3\xda\xbf\x7f\xff\
-I\x93&\xd5\xd6\xd6r\xa4\xd1a#j\x7f{\x90\x1e\
-R\xdd\xb4\xf8\xad-\xd7\x8cMc\xa45 \xa5e%\
-\xc5\x82\x1a\x84\xb2\x9aD\x96*\x22\xc2\xa4\xfa\xe5\x13\xb9\
-,\xae\x11\xca\x05%Y\xe8*\xe83\xa3@\x04\x80\x1f\
-\x10\x85\x8c\x1a5j\x90\xfb\x0b\xf5z\x1e\xac{\xce\xca\
-\x0bRFY\x10\xca\xe9\xf9\x06+\xce#\xb1{\xf7n\
-\x1e\x06\xb6\x01\x02/w\x18n\x84G\xc2N\xc6\x1d\x0e\
-K!\xc3B$:t\xe8P\x82\xd1\xf4\x08\x18\xca\x0a\
-\x07!$SoE\x0c\xead\x048\xb0\x12\x84\x95\xed\
-\xb7\xe9\x05k\x01\x91\xf7\xb0a\xc3\x08I\xd9\x03p\x80\
-\xa0\x83\x19\x8d'\xd7\x90\x86\xf6\x9b\x10!}!d\xc0\
-S\xc1\x09\x84\x10\x81\x98\x80\xf5q\xfb\xf6\xed\xabW\xaf\
-f\xdd\xd4\xdf2\xd8\xb5k\x17\x9b4\x0es\xf3\xe6M\
-\x86\x08\x0fQ\xd9*UZ\x06\xfe\xc6R\x83/\xc9\xe5\
-\x08L\xf1:\x9e\xbbC\x87\x0e\xf1\xe8\x11\x17*\x0c\x92\
-{\xeb\xe5\x9f\xb9\xbap\xae\xdd\xe8\xf3\x12D\x98L\x97\
-\x92\x90<9.\x0b\x0d\x02\x8daa\xdc\xb7o\xdf\x9a\
-5k\x88D\x09\x14hU\xa5E\xa2\x82\xa1\xfb\xc1\xc1\
-\xa9\x95\x90T\x9f\xf6S/\x80\xa5\x83\xe1\xd2\x885\x89\
-*\x94 \x0dP\x83\xa0\x12\x09\xd2\xcb8\x84\xdbEW\
-\x88,M\x0f\x99\x95\x08eE\x06$U\x1cAH/\
-\x94\x0c\x95\x91Axk#\xb2\x014\x06IJ\xa5\x0b\
-\x92\x15*e)\x5c9\x0fI3s\xd5$G\x1d\xae\
-L\xd9\xed\xdbw\x8e\x1e=\x82w\xb1\xae\xee\xd9\xb3\x87\
-C\x17\x9e\x8f\xff3\x8f\x1d\xb2\xe1\xf2p\xb1\xd7tl\
-0\xea\xc6\xcc\xdf\xb1\xc9[7i\x90IX*\xb9\x99\
-#\x92K\xc7\x97\xc9\x9529s\xfa\xcc,\x8deU\
-\x5c0\x0a,+\x84\xa1\xe3\xc7\x8f'\xf0\xb2\x8f\x01\xb9\
-\x9e\xbaF\x9b\xe0H\xf7\xdcrC3\x90\xa5+\xdd\xd8\
-y\x8e\xfb\x07\x0f\x1e\xdc\xbbw\xef\xa5K\x97*s\xb5\
-5h?\xeb,#3z\xf4h\x96\xdd\xa8w\x11a\
-73\x9d\xc30\xcb\xf0J\x11F\x83\x13\xea\x993g\
-\x0e\xb8?\x22U\xce`\x94\xad\xb7_\xbf~:\x8dt\
-\xce\xfd\x98\xde5L-\x94U\x1e\x99}T)\xf0\xe9\
-\xa6\xa0\x12\xc0+\xd8\xfe9\xa0\x1f?~\x9ch\x80\xd0\
-\x930t\xc3\x86\x0d\x1a\x07\x06\xa4\xbe\xbe\xfe\xba\xfb;\
-\xf2\x997\xadR\xa55\xf0\xdc\xb11\xe3`\xb8\x19\xce\
-v\xee\xdc9\x02A6i\x1eF\x0e?\xe4\xda\x9b9\
-_\xc0a~\x1e\xfadh\x13\xca\x22\x9d\xab\xab\xfc\x9f\
-\xbbo\xdd\xba\x95X\x01\xb7g\x91\xac\xd8\x13\x17\xad\xe5\
-\xdcx\xf7\xee]\x16\x0a\x96\x0b\xd6\x0d\x04\x8b>\x19(\
-\x0b\x22#d`\xa86\x09a2$]J\xc8\x18\xdc\
-\xfa\x91\x8c\x7f4\x0ba\xd2\x08\x0bF(+\xbc6I\
-\xf1\x22E\x1a\x10\x19\x93L\xfa\xe00\x8d!\x0d(W\
-\x9aP\x1fa\x95\xb8\xfa\x12\x99\xf9\xc2\x99\x1b\x1a\xaes\
-\xaa_\xb9r%\xe7|\xfd\x80^f\x1d\x05!\x07\xc1\
-\xe8\xe4\xc9\x93\x15\x8cf>b\xed\x81\xc6$}\xa3\xd2\
-o-K\xd5\xa3kq\xacf\x04a\xb2\x04\x97\xd96\
-\x94^\xa7l\xf0\x8d\x16\x07\xa3\xf1GI\xda\x0a\xc6\x94\
-\xb5\x8feW\x87$\xb0\xfe 4\xd93\xec\xbdT\x94\
-\x12\xcd*\x07\x9eXv#\xfb\xd8\x80\x1b\x98\x0c\xbcu\
-\x96\x83\xa65\x11\xe1\xe8r\x0b\xc6\x1ft/\xaf-\x0b\
-,\x04\xe1{\x0844\xc0\xb5A\xff\x9a@\xc64[\
--\x17>\xaf)\xb0\xa4\xcb\x0c\xf2\xbe}\xfb>\xfb\xec\
-\xb3w\xdf}\xf7\xaf\x7f\xfd+\xc1\xe8\xc9\x93'\xaf\x5c\
-\xb9BX\x00z\x83^z\x9dU\xaa4\x0b\xc5\xa3x\
-\xda\xb5k\xd7\x88G\xb7m\xdb\xf6\xb7\xbf\xfd\xed\xcf\x7f\
-\xfe\xf3{\xef\xbd\xb7f\xcd\x1a\x0eH\x17/^\xd4[\
-y\xd9\xe3\x8a\xf6\x90f.\x90Rr\x8dr)\xa2\xb2\
-@RO\x1c2\xc1\xa8>6\xa0\x9f\x99\xf2D\xc8\xbe\
-2a\x1c\x18(\x9a\xcaUcB/\x88'\xa0\xc9w\
-\xa2Xr\xa5\x88\xae\xa1\xd0b4\x11&X2\xc4\xee\
-\x92L\x80C\xc96\xa1\xc4\xdaB3k\x0f\xb3o\xfa\
-\xa4Y9\xf7\x00d\xcc\x0c\xd9\x84\xc8\xdeP\x11\x11\x1a\
-0G\xf86\xde\x85os\xe8\xea\xf0H4Mf\xef\
-\xda\x09\x8dIx\xc7\xf4\xdd\xa5\x91e&\xcau\xb6\xcd\
-&\xbc]\x8b+\x09\xa1B\xb7\x90\xf8\x93\x9b\xd7:\xa2\
-d\x1b\xd2^\xc1(\xb8\x11\xf6C\x0c\xb8u\xa87\xa4\
-l\x16\x94rO\x96\xaf\x90!\x93p_@\xb3K\xec\
-\xb8lJ\xb1\x14\x99~Cq\x17\x8e\x96\xf5\xe7&\x1c\
-R\xbbw\xef^SS\xd3\xb3g\xcf\x87\xdd_U\xf1\
-\x19\xcd\x81\x06\x0b\x8d\x984\xca*\x84\x1b\x80\x04\x8a\x10\
-\x8c\xb2\xe5\x13\x83\xae[\xb7\x8e\x13<\xeb\xa6~\xa9V\
-\xb5\x09_\xacJ\x95v@>\x86\xbf\xb1s\x13z\xee\
-\xdf\xbf\x7f\xc3\x86\x0d+W\xae\xfc\xf2\xcb/\xb9\xe2\x99\
-\xb8\xe5i\xf7\xc7\x140\xd0Cj\xce\xe9\xab\x080\xa5\
-wq\x874\xca\x92\x06\x99J\x08\x0e\x14\x04\x9f={\
-\x96\x90\x97\x9aeY\xc9\xd0H\x02h@\xa0#\xc4\xa0\
-\x0aFmG,\x04eMH\x93\x8cf\x0e%\xa5\x0f\
-)\x92\xd52\xacUJ\xa6IZ\xe3\xf0\xe9,\x22\x83\
-\xe2\xb5\xe9\x1a\xd9\x90\x04\xf4\xc9\xaa\x17\x90\xd4\xeb\x8a\xc8\
-^W\x90\xde\x1b9\xa4\x01%\xb1\xe1\xcaA\x0b\xa7=\
-u\xea\x94\xbe$\x91\xa4\x8aW\x02\xd6\x97\xb2\xc1\xe0x\
-\xa944\x9e\x11>\xaf42\xed\xdb\xb0\xe3\xe6\x15\x86\
-\xf4\xc5in/\xd2\xb4c\x18g\xdd\x90\x00\xc8\xd6\xe2\
-d\x06rHS:T\xa5\x15\x8a\xb2z6\xb8\xb6\xa0\
-\x9e\x8eB\xcd\xb6\x06#\x08%\x9b\x85J\xb9\xd1\xf5\x1e\
-c\x02(\xd7\xd5]\xbe\xc1aj:u\xea\xd4\xbf\x7f\
-\xff\xa1C\x87\xea\xb7\x97tZP#\x85,\xc1\xa7\x1d\
-\x98\x01\x82\xb2\xd4l\x06J\xa8\x0b\xba\x16\xc2\x95H@\
-\xc6+8\xbb_\xb9r\x85\xe5R\xaf\xa0\xa4\xafR\xa5\
-\xfc\x10`\xdd\xbau\xeb\xea\xd5\xab\x04\x88\xdb\xb7o\xd7\
-\x0b\xfb\xf7\xdf\x7f\x7f\xf5\xea\xd5\x1c\x99.]\xba\xa4\xb7\
-\xf5\xa0hL\x0e\x0f\x91\xf3+\xa9:\x0d=>@\x16\
-n\xff\xddw\xdf\xe1\xf3\x87\x0f\x1f\xde\xbau+\x95S\
-s\xbaH\x05B\xef\xe8\xb8\xfaN\x92\xeeh5\x10\xb2\
-\x89\xf0y\x05r\xd3$\x03\x9a\x85\xcf\x0e\xb0:%\x94\
-~\x8b\x88\xcc\x82vG\xdd\x1d\x94,\x825\xc3 \xa9\
-\xb2\x89C\xe4#= \xe3\x0f,}\xfa\xd6m\xc07\
-\xd0\xf8lw_UU\xa46a\xb9\x9cs\xa8\x87C\
-\x14\xde\xc5i\x8a\x05\x96\x0aUC%@#\xbd\xd4\xce\
-h@\xc0\xa7\x1d\x9a\x1a\x08e!\x03\xe1K:\xbc\xaa\
-\x00Q\xc1\x08\xd5,\xbc\xaa\x8dP\x85\xaa\xd9PV\x11\
-\xe8N)f\x85(\xdf;E\xf5\x07\x905\x07n.\
-\x1aqV\x19X)\xc9&H\xf6\x85s\x15\xba\xccJ\
-\x87v\xf2T\xfbD\x16\xaeC\x19}Q\xaf\x05\xc9\xd0\
-\xc6\x94!,\x13,\x1c\x9cb\xd9\xe4\xca\xb9d\xb0\x8b\
-<\xec\xfer\xf7\x83\xc1/\xc6\xa6\x9b\x17fE\x1b\x8f\
-u\xcd\x8dD#R\x16G\x96T\xa8\xdf\x9f\xa5\xc2\xe2\
-\xa3]\xa5J\x19\xc0'\xf1C\xa2\x01B\xcf\x83\x07\x0f\
-n\xdc\xb8\xf1\xeb\xaf\xbf^\xb1b\x05\xf1\xe8\x86\x0d\x1b\
-\xb6l\xd9B\x90z\xe0\xc0\x81s\xe7\xce\xe9\xec\xa4\xb0\
-L(J\x93cK#Y\xcf\x0b c@\xa0@\xd8\
-q\xd1}\xab\xe8\xa6M\x9b\xa8\xb3\xae\xae\x8e\x15\x80\x5c\
-\xdf\x88\x8a\xc7u+\x01Y\xdd\xa4w\xcaJ#\xcb\x10\
-\x94i{\x9f\xe7\xf0\xaa|\xa2,\xd5\x90\x0ck\xe1[\
-\xa7Q%\xa0\xa4\x95\xcd\xac$\xb4\xccD\x06\x9aw`\
-(\x5cs|U\xca\x05\xf42`y\xb7\xab@\xc6\x19\
-X\xfc\xcf\x9e=\x8b\xbf\xed\xd8\xb1c\xd7\xae]\xc7\x8f\
-\x1f\xe7Dd'sU\x02\x89K\xe5\xe33r\xe8\xbe\
-\xaa\x99c\xd5\xa9S\xa7v\xee\xdcy\xe4\xc8\x11|\xd5\
-r;\x9c\xb0\xa9\x95\xd3\xaa\xe2\xa8\xcd\xc2\xabJC\xfe\
-\x90\x89\xb7h\x1d\xaaG\x15\x0a\xe9!\x94\xdb\x90v\xff\
-1\xbd\xf0\xaa\x14>;0P\xb7\xc1\xa7s^%\x8d\
-dW\x22\x11\x088@\xb9\x02\xb9\x92\xb1\x96K\xe6\xea\
-\xdb]B\xcbe\x93\xb6\x94F5\x83\xad#\xac\x1a,\
-:\xecm,\x19\x5c\xef\x95\xe5KF\x81[s/v\
-\xdc3g\xcepn\xb6O\xc7\xfa\xec|\xacS\xc24\
-\x11\xaeC\xd9X\xae[B\x13\xa4$\x12\x1d:t\xe8\
-\xe8\xd1\xa3{\xf6\xec\xf93\xf7\x15ZU\xaaT\x02D\
-\x09\x1c\x0e\x89\x09\xd8\xd1\xb7m\xdb\xf6\xd9g\x9f\xbd\xfd\
-\xf6\xdbo\xbd\xf5\xd6_\xfe\xf2\x97O?\xfd\x94\xc0\xf4\
-\xd8\xb1c\xe4\xb2\xcd\xb3\xeb\x83{a\x9a|\xc4\x99'\
-\x1a\xf7\xe6J\x0d89O\x8a\xbc\x1dP\x12t^\xbf\
-~\x9d\xc8\x83\x98\x83\x00w\xdd\xbauG\x8f\x1e\xbdq\
-\xe3\x06Y\xfe\xc6\xf7\x03\xea\x0e\xd8\x83\x9cI\x93\x06\x22\
-m`\x05\x0b!3\xb7\x1ayL#\xa1\x102\x16^\
-\x95\xeb\x0e\x82)\xb9{\xd8\x00d\x94&K\x00)\xd1\
-0\xd7\x9c1\x14eJOU\x08\xf8\x033.\xdf\x10\
-\xa1\xb7\x002\xcb\xef\xe1\xc3\x87\xd7\xae]\xfb\xe1\x87\x1f\
-\xe2`\xef\xbe\xfb\xee\x17_|\xb1w\xef\xde\xcb\x97/\
-\xeb\x15)u\xa6Q3\xb8JH\x1a\x1dt\x04\x03\x1d\
-xX\xde+\xeag\xf4j\xa1\xb5\xdfk\xdb\x1f\xdd7\
-D\x0d\x08\xf1\xa6Y8\x7fi\xc2\xb5:\x0ak\x98\x04\
-K\x16\xefQ\x8bi\xafM\xbaS\xa7NC\x86\x0c\x99\
-8q\xe2\x88\x11#\xec\xab:\xac3&\x18\xca\x15\xd2\
-X\x87M#\x98i\xae\xca\xe5J\x92\xc3\x1f'\xbf\xfd\
-\xfb\xf7\xf3\x8c\xe1\x8b\xce\xaaB!t&6\xaa\xad\xad\
-\x9d<yr\xff\xfe\xfdmX\x847\xcaaJ\x09B\
-Y\x82$\x15\xa6\xf5\x82\xc1aI:t\xe8\xd0\x96-\
-[\xf4\xd3:\x9f\xd1\xfepk\xba\xd6\xbbw\xefa\xc3\
-\x86\xe9\xbb\xbd\xf4\xcbL>;\x1fk<\xa5@\xb2:\
-U\xa4w\x11*\x0b\xd1J\xc4\x8e\xce\xf6\x5ci\x1fl\
-\xaaR\x05/\xd5\xbeN\x04y\xfe\xfcy\x02S}G\
-\xa3\xbe\xe4\x81'\x97H\x02\xbd 6E\xc9\x83\xa0R\
-\x5c\xf5P\xe0\xed@`\x81\x01\xc5\x89>\x0f\x1c8\xb0\
-u\xebV\x22Z\xa2\x10\xaa\xaa\xf0\xf50\xe4\xc1\x07\x1f\
-\x1c8p\xe0\xa4I\x93F\x8d\x1a\xc5\x22\xa9\x1f\xaa\x08\
-rM\x80\xf0\x017\xa5\x11jd\xe9\x8az\xa47!\
-\xac\xaa\x08\xb2\xb7R\x90\xd4\xe5\x08eC6\xc2\x92\x12\
-\xc2;J\xd6$\x22G\xb0d\xe1\x06\xcc\xac\xfd\x86\x10\
-\x1abP\xa6\x9b@\xf3\xc2\x85\x0bx\x0b \xd4\xd7\xd7\
-\x9f\xcb\x81\xb7H X<~\xfc\xf8\xce\x9d;\xd7\xaf\
-_\xbfi\xd3\xa6}\xfb\xf6\x91\xbct\xe9\x12.\xf1\xf0\
-\xc3\x0f\xb3A\xb3D\xbbV$\xcd\x10J\x86\xed\x0f\x17\
-m\xf4\xd8\xd0\x00\x96S\xfd\xc9:BR+\xd5\xe1\xd0\
-\x1d\xdc\x86\x1dg\xf8\xf0\xe1\xfa\xf3Z\xda>|v\xbb\
-\x11\x8e[4\x86\x99w\xb7\xac\x08\xe5F\xf8\xbc\x14d\
-\xd9\xe6\x08\xb2t%\xda\x1ejV\xbft\xc5W\x9d:\
-\xc1\xdd\xbc\xf1\xbe\xb2\xac\xb8\xafv\xc2\xdd\x89B\xec/\
-\xd4G\xc1\xa8\x08\x93\xca\x15$\xc3I5\x8d\xa1,\xc9\
-\x0c\x0d\xc1(\xc1\x16\x8f\x87\x9e4\xe5V&8\x10\x0f\
-\xcc\xb8q\xe3\x08F\xfb\xf6\xed\x1b\x06\xa3\xe4z)G\
-\xa6&\x22Si\xb0p\xb0\xa5\x9d>}\x9a\xd5\x8a\xf5\
-\xabl\x83C\xbf\xfa\xf5\xeb\xc7Q\x84\xad\xc5\xbe\xdaI\
-\xf3En\xd8f\xd7\xad$\xa9,!e\x84\xe9e\x13\
-\xa1\xca\xc1\x92\x12X7\x8f\x1c9B\xf7\x19\x0ai\xaa\
-T\xa9\x1cX\xbe\xf4\xb3\xf5;w\xeepp\x22\xec\xe0\
-\x81\xc5]\x89\x1bX\xd0\xf4\x85\xb8{\xf6\xec!\xb2D\
-\x8fW\xeb9\xa2\x14q\x09\x05\x15\x9ap\x08\xdf\xbbw\
-\xef\xb7\xdf~\xbbn\xdd\xba\xed\xdb\xb7c\x7f\xf2\xe4I\
-V\xc5\xfb(\x12\x05}O\xe4\x84\x09\x13\x08Fm\xcb\
-\xa0\xb3z\xeaAf&\x08%]\xbeGza\xeb@\
-Dd\xd6$f\xef\xee\x90`J]\x8bC3\x84+\
-\xea?\x1c\xaf,9\x00\xf3\x08\x12\xb8\x02g\x0ff\xf0\
-\xc4\x89\x13D\x93\xfaf.f\x9c5\x9c\xb9&\x04<\
-v\xec\xd8\xb6m\xdb6n\xdcHD\xc8\xd4\xe3$\x98\
-\xd9U\x02Y\x5cq\xa1\x83\x07\x0f\x12\xb3\xb2\x12\xe2`\
-\xd4s\xe3\xc6\x0d\xeeB\x03\xf4M\x9cj\x03mCP\
-\xf3\x5c\xbb\x12\xd4\xd4P\x03\xf27\x9a\x84\x7f\x12(\xab\
-`%\xa0\x96\x10x\xd4\xd4\xd4\xe0H\xdd\xbauS\xe3\
-\xa3\xf6\xb7!\xd4\xac\x9b\xda\xe89uB\xa1\x9bJ\xcf\
-5DY\x99X\x172\x91\x8d\x04K\xb6-Q\xb5\xf4\
-T\xf8t\xa0\x01\x92\xf8\xd2\xbf\xfe\xeb\xbf*\xab\xb9\xb4\
-\xe3\xf7\x8c\xf6\xef\xdf\x7f\xcc\x981#F\x8c\xd01W\
-~\xaf\x16C8\x82\x5c#\xc1\xb0\xa4z\x0bJ\x86p\
-|d\xb1\xbe\xef\x82Q\xc2\xb5\xf4\xa3\x1e\xe2\x06#{\
-XB\x8ad1\x5c\xe4\xb2\x8ai\x93c\xcf\xcb\x1c\xc0\
-6\x87\xe9f\xde\xe7\xcc\x99\xa3\x17\xc08\x8352\x14\
-L\x16Q\xdb\xc2\xdc\xb4\xb1\x91\xf8D\x80)\xf1\x04\xd6\
-MVa\x1c\xe3\xdc\xb9s\xc8\xca\xaaR\xa5\x02\x91\xf7\
-\xf2\xa8\x12\x95\xb2\xc7\xe3\xb7uuu\xc4\x94\x84#\x80\
-\xcc\xe2F\x80\x82\x1b\x13R\xf0,\xeb}\x18p\xd4d\
-\xf5#.!\x18%\x0a\x91%K\x22\xbb\x82\xaf\xfa>\
-\xe1g?\xfbY\xaf^\xbd\x86\x0d\x1b6d\xc8\x10\x16\
-I\xa2\x0am\x19\x10=\xfbJ\xba%\xc1\xebM\x08\xd1\
-\x90\xfaD\x8e\xb0T:\xd7\x90\x99\xe1\xb5\xf9H\x1fV\
-\xe2n\x98\xa0R\xb6\xe5\x09\xd90/\x82\x05\x8a\xa0\x90\
-\xd0\x90I<u\xea\xd4\x993g\xf4\x16\x9c$\x93\xab\
-\xf7\x9a\x04\x94\xeb\xd7\xaf'\xdcDC\x1cI.\xcep\
-\xf4\xe8Q\xce\x1b\x9b7o&\x1e=t\xe8\x10\x81\xa9\
-\xc0^\xde\x02\xf2\x1c\xaa\xa5\x08\x8b?n\xa3\x9b\x22p\
-G\xc0\x97p6y\x14\xad\x22\xf4g\xfc\xc3v\x0a\xf5\
-\x11\xa4\xa7\x08\xae\x85\xcb\xe1i\x0a\x91#\xfb\x0e\x84\x96\
-0\xa4\xf4\xb1w\xef\xde\x9cg\xfa\xf6\xedk/\xd7\xbd\
-E\x9b\xa2j\x93\xf1r#\xa0\xa4\xbb[Bb\x91\x1b\
-\xb4\x10\x9f\x9d3\x90\x10^\x8d\xc4\xc8\xa1d\xba*0\
-\x83\xf0\xdaz\xc2{\xa5\xeb\xcfl\x89An\xc5\x05\xa3\
-,%\x03\x07\x0e\x1c?~<n\xa1o\xa0\x0d{\x82\
-,B\x19\x92\x92\xa9\xde\xa2G\x13)\x0d\x9c\x8fG\x8b\
-\xe5x\xef\xfd\xf9fT\xf1\xa8\xf5\xdd\x90\xc6\xb2t-\
-D:W\xc3E\xe5<\x90\x08\xec^,L\xacJ\x0c\
-\x97\xcbo_X\xd7\xe8\x1dG\x11[\x14\xc2n\x9a \
-\x0a\xcd\xac\xcc\x844\x85,!\xf1\x0f\x07\xb2\xec\xe9)\
-\xeb&\xbd\xde\xbd{7[{5\x18\xadr_\x80\xdf\
-\x12\xa3\xe0\xaez]\x0a\xb8\xf1\xad[\xb7\xd8\xf8y\x8a\
-\xf1db\x11\xceW\x04(D$\x5cqo\xbd\x00#\
-\x1c\xc1\x80\xf0\xe2\x87\x1f~\xd0\x83p\x7fA\x9bY%\
-:w\xeeL0\xc1\xa2\xd1\xad[7\xed\x1az\x9c\xdd\
-\xc3\xdd\xd8)\xe9\x0d\xaf\xcd'*R:VaX\xb3\
-\xbbO\x1e(\x9b\xac_\x06Z\xfd\x10\x14\x802\xb9\x5c\
-\xe1\xda\xb5kD\x93:Hl\xdf\xbe\x9dIdN\x01\
-\x81hOWb>\x82?\x82Q\xc2J\xc2M\xec\xd9\
-\xec\x80\xe9V\xa0\xc9\xf6\xc7\xf9\x04'\x019\x8c\xc0\x7f\
-p\x06\xee\x12\xae\xf9\xb4\x07\x0d\xeeDA\xea\xe4\x94\x8e\
-@\xf3\xbav\xed\xca\x96\xad~\x91\xf4\xd6\x8ed\x10]\
-x\xcd\x95\x96\xe3\x81\x04\xc1\x1b6l \xd8\xa5~o\
-T1\xe03\xfa|\xe0\xa0A\x83\xf4\x12\x04|^\xfb\
-\xc0\xb0H\x88nd\xfa\xd0@\x98,!J\x0a\xcb\x82\
-tU!fl\xf6m\x88UkW\x09\x85\xa0\x85\x15\
-\x17\x8c\x12\x7f\xb0\xa0\x10\x8b\x0c\x1f>\xbcG\x8f\x1er\
-\x0b\x0d\xa5\xfa\x03\x99rR\xb8\x04\xb0\xd43\xc3\xe3\xcd\
-\xa3\xc5A\xf0\xe8\x91#\x04\xa3,\xc42\xa8Lhs\
-\xf8f\xb4\xc4`\x14\xa4\x14\xa1GZVhc\x06(\
-\x91Y}XtX\xc5\xca\xf6\x99Z:\xd5\xa5K\x17\
-:\xc8\xec\xf7\xef\xdf?z\xc9!\x94,B)6\xa0\
-\xceZ\x97\x11L\xc3\xd2Y\x0dF+\x19\xa6\x98s\x0b\
-k\x05W\x9e\x85L\xc8\x02\x9b\xd6\x9f&\xc4\x138\xb0\
-\xde\x8d\xd5\xd5\xd5\x11\x94\xe8M\x98\x04\x9c\x9c\xc0\x82X\
-\xe4\xbe\x1e\x22\x1a\xcf\xeaMO\xf5~\xb4\xa6\xa6Fo\
-\xb6\x94\x95\xeeZ\xa1\xf5A\xc6 YJ0\x99\x82\xa1\
->\x84\xacB\xd5B\x91,P\x9d\xaa\x01Yo\xe9\x00\
-\x19\x10X\x87\x89\xfc.^\xbc\xc8$re\xca\x98\xbb\
-M\x9b6\xadZ\xb5j\xeb\xd6\xad\x07\x0f\x1e$\x19\xc2\
-\xa6\xc6\xc2E\xc0\xca\x06G\xb8\xc9\xea]__OY\
-\x0a\x22\xa3\xd1\xa9\xc3P3\x9a\x04KZBq\xbdV\
-\xd7\x1b\x1c\xce\x00\xac\xd8l\xd3<k\xac\xd5\xa0\xceb\
-,AWb\x5c\xe2`\x1a\xbce\xcb\x16N>t*\
-\xa9\xb1b\xa0\xd9td\xf4\xe8\xd1\xd3\xa6M\x1b<x\
-\xb0\x85\xd7>\xbb\xdd\xd0\xe0\x97~#\xb5J\xd8\xc4\xf9\
-t\x80\xf4203\xc3\x1b9,\xa9\xac\xb6E5\x83\
-d)!\xad\x01\xdaYq\xc1(\xe0\x19\x9d:u\xe2\
-\x98\xcb\xb2\xd2\xbd{w\xf3o\xaeBfi\x8ad\x81\
-\xca\x82d\xae,\xd3<Z<T<\x1e\xac\xc8\x95\xf6\
-\x84\x840\x08\x16\x8c\xea\x17\x98\xd0\xa0WG\x22\x5c/\
-\xbd\xde\x84\xb4S\x82,\x854f\xc6h\xb0\x82\xb0\xae\
-\xed\xdb\xb7\x8f\x15\xb0<\xc1(+\x1a\x93>v\xecX\
-zj\x9f\x19UO!lg\x11J\xb1\xc9\x84\xbe\xd3\
-kzz\xf7\xee]\xf6\xe9={\xf6T\x83\xd1\x0a\x84\
-\xf9e}\xe8\xd3\xa7\x0f\x0f\x02\xe7\x16\x1c\x068\xc1J\
-0X@\xd8&\xb1\xff\xbb\xfb:a\x95\xfd\x09\x82W\
-3\x02\xb8\xb1\xbd1\x05\xbd\x0c\xd3\xdbPow?C\
-\x1f\xf1\x0a|\x80xb\xe0\xc0\x81\x0a&\xf48\xcb \
-Z\x13\x9a\x5c\x22(\x0b>Q\x02\xba\x9dOdaw\
-\x8c\xcc,\x89@k\x99)fDW \xf8c\xe2\xf4\
-\x1et\xc3\x86\x0d\x1b7n$\xfa\xd4\xc7:\x810T\
-g\x09\xcd\xa9\xc1DSP}\xe7\xaaJ\x00\x81\x9a\x9b\
-\xd5\xaf4\xd4\x80\xdbpS\xb6N\x82]\xea\xe7a\xe4\
-AcK\x22W\xcb\xb5u\x16\x01\xfe\xfe\xf7\xe4\xcf\xda\
-\xd1\x05}Q\x03-Qn\xe5@\x9b\xd9k\xc6\x8c\x19\
-3}\xfa\xf4\xf2\x04\xa3\xccB4\x11\xc5\xe7\xc5\xda\xa3\
-\xab\x157\xbdd\x09i\xa2\xca\xad\x94\x04\x90\xbe\xcdQ\
-\xcd\x99\xf5[\x96@\xae\xb8_`\xc2\xb9\xf5\xd8\xe0\xdf\
-\xb8\x85~\xbb\xcd\x9ak\x82\x0d\xae\x92\x86\x19\x18JJ\
-\x0fR\x0a\xf7\x02%y\x84x\xae\x88Gy\x86\xa39\
-\xab\x1cxZ\xc2`4\xfa\xf9u&\x96[\x8aM\x04\
-\xe3@L\xc6Zs\xe4\xc8\x11b2\x96\xbc\xf2\x04\xa3\
-\x9c\xb0\x87\x0e\x1d:{\xf6\xecI\x93&\xe9\xcd(J\
-\x5c\x82\xf6\xa4\x9b*\x8d\xf0\xaa\xc24i#\x03u\x9c\
-\x05\xbd\x1a\x8c\x96\x07\x86\x9dg\x90C\x88\xaeM\x82Y\
-\xd7\xae]\x87\x0d\x1b\xf6\xc8#\x8f,^\xbcx\xde\xbc\
-y3g\xce\x9c1c\x06\xbb\x08 \x00\x9ai\xd3\xa6\
-M\x9d:\x153<\x8a\xd9d=\xe1y\xf1U\xe4@\
-C\x03*\xf6\x91\xaf\xd2,p\x8c^\xbdzq\x82e\
-\xdd\xc0CH2\xbf6\xb9\xc9\x1a\x91\x8f\xf4\x85(\xc5\
-+|E\x0e\xaf\xca*h\x06\xa1\x99\x901W\x968\
- \xfa\xbcq\xe3\xc6\xe5\xcb\x97/]\xba\xc4U\xd4\xd7\
-\xd7+\x8c\xfb\xea\xab\xaf6o\xde\xbcw\xef\xde\xc3\x87\
-\x0f\x9f8q\xe2\xfc\xf9\xf3l[\xa5\xb4\xb3=\xe0\xbe\
-,\x8c4@\xaf\xd5\x19j\xdaO\x9cJ\x96\x1e+\xd9\
-\x00\x9d\xc2\xe6\xcc\x993\xbbv\xed\xda\xbe};\xdd\x91\
-YE\xc1j\xc0\xf6:~\xfcx\xd6\x0d\x5c\xa8]\x83\
-Q\xc6DW\x81\xcc\x8d$D\xa8\x0d\x22\xd4XA\xc3\
-\x0c@Y\xd2DfBYIE\x01\xcaj't\x0b\
-kL\xd8\xaaPY\x89oFqV<\xbbG\x8f\x1e\
-\xc3\x87\x0f\xc73\xec\xab\x16\x80\x5c]C\xd2\x9a\x08W\
-4\xc1\xa7]|\xc3\x15\x17\xe4<\xc4\xb2u\xd5}u\
-\x1f\x07P\xe9+\x10F\x80\xa7e\xc2\x84\x09\x8a\xd2\xb4\
-\xd4Z\x8flFM\x93\x162!7\xd3\x80\x0a\x19\x0a\
-\x82Q\x0e\xb2\xfa\x14|\xd9\xde\x8c\xf6\xee\xdd{\xc4\x88\
-\x11\xf6-\x1bh\xd4Bkj\xe8\xca\xd2\x94B!K\
-\xe9\x93\xaa\x9d\xa0\x95\x94uV\xc1(kh5\x18m\
-?\x18m\xce\x9cL40\xefx\xb8A`\x11\x81\x01\
-\xd4\xd4\xd4\x8c\x1c9r\xce\x9c9O<\xf1\xc4\x92%\
-K\x88;9\x9e\xf1P\x88\x899\x90\xd9Z\xb0$.\
-\xc1a\xf0\x22\x04*Q\xe5\xac-\xa0\x85E\xab\x8do\
-P\x95\xfb\x16&\x91\x89fBY\xd2\xbbw\xef\x8e_\
-1\xe9>/\x87\x9e\xf1p\x01\x11\xe8QF\xf8\xbc\xc2\
-\xb85#\xc1\xa7\x03\xa2\xe2i\x1b3\xa0\xd9,\xadD\
-lws\x7ft\x80\x88s\xd3\xa6M\xdb\xb6m\xd3o\
-\xb8\xef\xde\xbd{\xc7\x8e\x1d\x84qG\x8e\x1c!6%\
-\xb0\xc3\xf2\x9e\xfb-\xa2R\x1a\xd9~pw\x9a\xcd\x1e\
-q\xfd\xfau\xa2g\x96\xca+\xee{\x1b\xf4\xc9::\
-E\x0b9\x04\x12\xb0\x9e<y\x92N\x11O\x13U7\
-44\xf8\xf2\x15\x03\xadeq`\xad\x985k\x16\xc1\
-\xa8>\x05gS\x86`\xe3\x9c\x9e\xc7fa\xf5 \x08\
-%U\xad%\x85\x94\x99wl\xd222H\xdb\xa7\xf1\
-y\xedCX?\x8dQ{L\x10\xc8-\x0eF\xdb\xb7\
-\xf5l\x18\xf3\xe6\xcd{\xf5\xd5W\x97.]\x8as\xe0\
-\xdf\x8a\x12\x8c\xb0\x1b\xe9\xa1\x0cs\x0d\xcc\x92\xde\xe7\x06\
-BW\x1e\x98\xba\xba\xbaO>\xf9\xe4\xcf\x7f\xfe\xf3\xfe\
-\xfd\xfby\xba\x9cm\xc5\xc1\xc2:l\xd8\xb0\x17^x\
-\xe1\x95W^a\xf7\xd5gt\xd4q\xd7\xa7x4\xd2\
-W\x08\xcd\x04Ya\xae\x90\xccP\x9c;w\xee\xd3O\
-?}\xeb\xad\xb7X\x10YVd\xd6\xae\xb0\x0ap\xfc\
-X\xb4h\xd1?\xfc\xc3?,X\xb0\x80\x18E\xdd\x14\
-\x18\xa8y!\xd2\x8bt\xae\x08m\x80\xa4Y\x86E\x90\
-\x81\x8es8Y\xbbv\xed\x9f\xfe\xf4\xa7\x8d\x1b7V\
-\xe0\xeaY\xe10\xbc<\xad\xd1\x98G\x90\x0b\xdd\xbau\
-c\x0f\xc0\x9f\x87\x0e\x1d\xfa\xf0\xc3\x0fG\xd1\x83\xd5\x10\
-\x0ax>\x8b\xc3\x90!C(\xc8\xa9L\x01\xa5r\x85\
-\x193\x95\xec\xdc\xf8\xf0\xf1\xe3\xc7\xd9)\x91u\xa0B\
-O\x04\xc0\x19\x83Y\xe6\xacu\xf0\xe0A\xf6\xf8\xcc\xad\
-\x1d3\xf0\x89*\x15\x0f.\x84W\xb0e<\xfb\xec\xb3\
-\xd3\xa7Og\xf5x\xd0\xfd\x16f\xe4H\x5cM#G\
-\x85\xe4\xc9\xcf\xbd\xa1T\x960\xcb\xb4{X\x96\x8aX\
-\x12\xd0(I)\x04\xcbr7\xf1\x1f\xa6D\xc0\xeb\xf0\
-C\x82K\x85t\xecD\x04m\x80\xbb\x12n\xaaZ\xae\
-\xf8\xad~\xf2N\x11WM\x05A_x$y\x0c9\
-\x00\x0c\x1f>\x9c]\xfb\x91G\x1ea\xab\xd2\xcbEZ\
-~\xed\xda\xb5\xbd{\xf7\xae\x5c\xb9\x92\x90\x9a\x07M\xcf\
-`EA\xfbi0'\xdbg\x9ey\x86\xc6\x0f\x180\
- |3\xca5\x1cv)[\x86\xeaaBA\xb2\xae\
-\xba\x85H\xec\x82\xbb\x94r\xbb\xb4\x8dU\xa5,\xab\x16\
-\xd0\x80\xb9=\xf8\x8c\xd2\xeeU\x9c\xf0F!\xaaY\xb9\
-\x5c\xe5\xd2\x5c]f\x92\x8b\x12\x0d.$Msim\
-\xbb\x8b\xd3\xa3G\x8f9s\xe6\x10\x8c.[\xb6l\xe0\
-\xc0\x81\xb8K2l\xb9\xc1*\xd4\xe7\x90\xb4\x8d\xfal\
-z\xd5\xa6\x90\xeb\xe3\x8f?~\xf3\xcd7\xf7\xec\xd9S\
-\xe1\xc1\xe8\xf3\xcf?\xcf\x98L\x992\x85\xa7\xc5\xf6`\
-\xeb\x94zT\xe8j\xd8\x08\x08\xb3\x91\xdeU\x96\x08\x0c\
-\xc5\xd9\xb3g\xcb\x1c\x8c\xb2y\xd0\xcd\xc5\x8b\x17\x13v\
-\xcf\x9d;\xb7\xaf\xfb\xde\x00\xb5'\xeaEH:KE\
-D\xd4\xc1\x90HC\x12\xe8\xa9\x82\xd17\xdex\xa3\x1a\
-\x8c6\x17\xe6\x8b\x9d\xa9K\x97.\x0a.5\xec\xe9\x09\
-B\x83\x01\xeb\xfe\xacY\xb3\xe6\xcf\x9f\xafW\x98ri\
-\xec\xcdFW\xe9%\x00\xb7\xe8\xec\xd0\xb2\xe0l\xbdq\
-\x88\x9b\xcc\xe4oz\x11\x862\xa7l\xfc(Y\xf2\x00\
-=A\xc0\xf9\xf3\xe79\x7fn\xd9\xb2\xe5\xc8\x91#\xcc\
-\xb2\xf4V\x16\xfb;\xee\xb3\x95\xe5\xf1\xfc*m\x02\x07\
-\x15\xd6\x8d_\xfd\xeaW\xc4\x16\x9cX\xb4NjZ\xf1\
-\x10\x81l\x13m\x1a\x81\xde\xf6H\x08\xb3\x90\xad\x94p\
-E\xfd\xdf\xb2\xf2\xaa\x9c\xd7\xa1G\xe6\xd6\x08$\xb1\x91\
-\xfb\xc9\x18%YxW}}=q\xe7\x85\x0b\x17\xae\
-\x5c\xb9B\xa0\x86\xcc\xd1\x88\xb3\x93>\x8b\x89\xa5\xab2\
-!\x94+\x90d \xfe\xd3\x7f\x22\x98\x185j\xd4\x98\
-1cX\xb7\x19y\xf4\xf4\xe2\xc6\x8d\x1b\xa7N\x9d:\
-|\xf8p\xd9~\xbc\xd6\x5cXI\xc6\x8d\x1b\xc7\xde\xfa\
-\xdcs\xcf!\x10{\xe8\xcd(\x90\xcb5\x1c|)[\
-\x86\xeaaL\x84\x94!-\xb8\x91\x99\x15\xf7\x90\xa86\
-y\xa6\xf0*G\x94l\x0fh'n@\xf7\xa3\x06\xa3\
-a\xd7\xf0\x89f\xd2\xbe\x8d\xc6!f\xcf\x9e\xfd\xca+\
-\xaf<\xf1\xc4\x13\x0aF5|\xca->\xee\x22m\xa3\
-\xe2\x91\xfe\xbe\x0eF\xd5\x17\xeb\x91:\x98\xbe\x8aP\x0e\
-\x07!\xad\xd7\xb5C\x82Q\xe2\x98\xe9\xd3\xa7\xff\xf2\x97\
-\xbf\xe4\x102v\xecX\xbc\x93\xe6\xa9\x85\xd6\xcet\xe3\
--\xcb\x88\xc6\xc4\x08\xcbB:\x09t\xdc\xde\x8cn\xda\
-\xb4\xa9\x1a\x8c\x16\x01'\x0c\x1fL\x16\xf1^\xbdz\x11\
-Y\xb2!\x0dr\x7f@K\xfa\xf4,\xa0\xc1\x87kj\
-j\xf4\xbd\x19\xc4\x10\x94\xc5\xc9\x81\x5co\xe7\x0a\x1aJ\
-\xea\xaa\xfbB\xa8\xe4\x1a\xa2\xf5.Y\xf5\x9d \x94\xc4\
-\x98\x05\x91@\x93h\xa0\xae\xae\x8e\x15\xe0\xe6\xcd\x9b\x84\
-\x0b\xb2\xe4\x8a\xcc\xbc\x9f8qB\x9b(\x91+\xca\xca\
-\xdcJ\xab\x84\x10XL\x9a4\xe9\x99g\x9ey\xea\xa9\
-\xa7\x08,\xf0+<\x8a\xb9#\x0bo1'a\x96#\
-AY\x96\x14\xa1S!\x87\xb9$M\xc3UI\xf3\x1f\
-\x93\xb9;2\x9e\x03\xf8\x18Q&\xcb\x0b\xae\x8e\xf3#\
-\xb3\xae\xeaO^\xb1\xe0\x10\x9b\xa2\xc1\xeb8>\xa9\x92\
-\xfb\xce\xdf\xe8);5S\xa0_i\x90\x92\xfe\xf2\xa0\
-\xf1@Ulwhpmm-{\xeb\xf2\xe5\xcb\xc7\
-\x8f\x1f\xcf\x0a\xa6oc\x00r\xb9j\x96\x85\x94-C\
-\xf50\xb3\xf2\x8d\xb0\xda4\xcd\xbdQTa\xd2\xfa\xc2\
-\xde\xabg\xc1\xe6\xc8\x08\x8b\xb4\x134C#\x00^\xe5\
-\xeeK\x92\x89\xf0\xe9f\xd2\x8e\x9f\x19\x05\x9e\xd5\xc1\x83\
-\x07O\x9e<y\xf4\xe8\xd1\xdd\xbau\xd3#\x1d\x8eT\
-8\xb2\x22\xcc\xcd$\xd3\x80zX#X\x0e\x88D/\
-^\xbc\x18\x0ePE\xc1\x08\x10\xa0\xdb/0\xb1\x9cI\
-o\x0dv\xc3\xd3\x88)%@$\x1b^\x95\x82\x9aY\
-\x1c\xf5=\xc9e;\xd4\xd2/\xe6\x9dh\x9by\xef\xdd\
-\xbb\xb7\xba\xc93\xa3\x87G6!Rr\x8d\xfc!\xe9\
-\x98\xc3\x92\x12Dh\x9cv$:\xae_`b\xab\xa8\
-\xfe\x02S\x11X\xb2\xbbw\xef\xae\x8fr\xb2\xeb\x13Y\
-\x0e\x1d:\x14\xff\x5c\xb0`\xc1c\x8f=\xb6h\xd1\xa2\
-\x993gN\x9d:\x95\xd9\xcc`\xea\xd4\xc9S\xa6L\
-\x980\x81#\x96~\x9c\x8a\x87[<*H\x86x\xad\
-C.\xe1\xdb\x11\xb8\x81\x92\x82\x99E#K\x95\xa2\x12\
-n\xc4~)\x81\xb5\x8f\x8dg\xc0\x80\x01D\xcflB\
-4\x86\xc6\xab\xc1\x13'N$J\xa6_\x98Q\x5cW\
-\x1e\x81\x8a]\x1f\xaa\x18L:\xf3\xd5\xb5kW\xfc\x8a\
-5\x13\x19\x0dX.\x14Y\x01d\x90\xc6g\xe70\x8d\
-\x8ag\xda\xe00\x04a, :\xf6\xb0\x90nt\x7f\
-\xfa\xe8\xf4\xe9\xd3(\xf1(\x16X6\x9dk\xd7\xaeq\
-\xd4\xc7\xb5\xd0\xe0\x93<Slyz\xb3H\xf1\xf4\x02\
-U\xc9\xd0e\xfar7\xf8\xde\x06\xe4\x0a\xef\x05\x1e\xc2\
-\xda5\xd6\xd1\xb7o\xdfN\xf9\xbf\xa8 \x1b#\xadi\
-.\x0c\x85F#\xb3*\x94\xb8\x81O\xb4\x02\xeaQ\xfd\
-\x91`p\x17\xae\xce\xb6\x91\xb4\xa6<p_\xc6\xe4\x7f\
-\xfc\x8f\xff\xe1\xd3\xcd\xa4\xdd\x83\xd1A\x83\x06)\x18e\
-Y\xc192\xc7.\xa2\xb8Af.K\xc0}\x11\x8c\
-\xd2}\x16V\xfdm\xfa\xf0\x13\xd6rk iH\x03\
-\xa1\x0cQ2BUY\x85\x1a\x992\xff6=\xddd\
-\xba\xe9 !)W\x96f\xa6\x1e\xbdZnW#)\
-\x93\xd3GC!9\xc4\x0c\x8aCOYC\xd90\xaa\
-\xc1\xa8\xc1\xbc\x80\x1eC\x09\xac\xe0\x03\x07\x0e\x9c6m\
-\xda\xfc\xf9\xf3\xe7\xcc\x993}\xfatB\xcf\xd9\xb3g\
-#\xcf\x981\x83e\x9d\x5c\x22T\x9cV\x9bk\x08S\
-\x9c\xfc\xd7\xb5+\xeb>\xa1\xa1U\x0b\x9a;\x09\x5c\xc3\
-,\x83\xf6\x90\xcbl\x1a\xaeP\x82Z+\x94\x85\x80\x9e\
-R\xca5Y\xf0\x1c\xb1\xd4t\xe9\xd2\x85F\x0a\x9a'\
-\x81\xc6\x13\xcd\x10\xaa\x0e\x192\x84\x88\x99$\x8e\xa1O\
-\xf2QP5W\xa94\x98\x1d\x1eX\xa6\x899\xd2$\
-j\x0d!)\x83d\xd6\x1d\x92M)\xc1\xf9\x97w\xb0\
-\xd0O@\x06\x864\xdc\x0ep\x06]\x95\x85L@\xd6\
-\xd0\xd0p\xf5\xeaU\x02M}K\xfc\xbe}\xfb\xbev\
-\x10\x8c\xb2\xaa\xe0x\xf8\xd5\xf0\xe1\xc3q-\xf6\xb8q\
-\xe3\xc6\xb1\xb6s\xe5\x14\xc4\x0a\xcf\xd1\x88\xed\x0f\x1b:\
-\x82\xd7\xa9\x01\xb4\xe7\xbe\xf0:\x1a\x19\xe2\xb5\x15\x0cK\
-\x10\xa3\xcd\x0a6i\xd2$\x82Q\x9d<}\x9eCs\
--B\xb9\xf5D\xb5\xa5\x93\x91\xa6t\xcc{}:\x9f\
-\xd0\xb7\xbd\xca\x11%\xdb\x15\xbb\x17N\xc2#C\xb2B\
-\x83Q\xfc#z3*\xff(>X\xcd\xca%\x09\x8c\
-\x02\xc7\xd3\xca\x0fFi*k\xeb\x981cX\xa7\xc2\
-\x07\xc6\x9ev\x0c\x8a\x0f\x91\xf4QnX\x5c\x82\xc1P\
-(\x18-\xe7o\xd33\xef\xfd\xfb\xf7\xd7\xbaL4C\
-\xb0\xa2NAf\xfb!\xad\x11\xa6/dP\x08:\xce\
-\x1eP}3j0)l\xea\xbd{\xf7\xb6\xdfFG\
-f\xf9\x9e:u\xea\xd2\xa5K\x97,Y\xf2\xc8#\x8f\
-L\x992\x85\xa7u\xc2\x84\x09<\xb0C\x87\x0e\xc5R\
-\x81&\xf0\xf0\xb2\xad\xa6\xc1\x87\xb9f.\x8b>\x9d\x8f\
-\xf4y\xb9\xf9eu\x0d\xb1\xac4\xca\x025\x80\xab\xb5\
-J\x10\xa4\xf2\xc4\xf1\xac\x11.\x8c\x181\xa2\xa6\xa6\x86\
-\x5c\x0ar\xa5G<\x0e\xe5y\x22\xaa4\x17=\xbfz\
-!\xc7$\xb2}\x10\x8fj\xeel\xba\x85\xec\xc1\xa7\x1d\
-2\xf0\x199\xc2\xa0\x0aY\x06\xdaDq\x03n\xf4\x83\
-\xfbrP\xc1Q\xf6\xfc\xf9\xf3\xbbv\xed\xda\xb0a\xc3\
-\xb6m\xdbXF`\xcb\x96-\x84\xa1'O\x9e$\x97\
-c\x18\x8f\x09+9WBR\x9e\x17\x1c\x0c\x99#\x9c\
-\x82Q\x9e#\x944\x9b\xfaqE\x0eK\x14A\xe0\xa6\
-\xdc.lL\x95\xd6\xc3\x1a\xa5s\xb5>\xd7\x81\xab\x84\
-\x0e \xd94i\xdfh\x01\xe6B\x80\x90Y\xa7\x94\x99\
-Y\x99D\x96a2\x92\x0d\x5c\xddks\xa0\xf4R{\
-\xa2\xbb0\x08\xe6\xc9\x12*\xf7\xcd(\xc1('\x95Q\
-\xa3F\xf1\x1c\xeah+\xbcE\xae\x03B\xfa\xf0\x9a\xc6\
-r\x85\x94\x0a\xb9\xee\x8b7\xa3\xac\xaa#G\x8e\xe4\x81\
-\xb1\xaf\x17\xa0\x176\x08\xea\x14(\x99\xc6\xb22m\xa4\
-\x0c\x87T#S\xce`\x94\x1e\x11\xc4\xb0\x10\xcf\x993\
-\x87\xab~\x95^zuV\x8d\xd4U\x84r\x88\xb3\xcd\
-3N{\x8b\x08eA\xc7\xd9\xc9~\x82\xc1\xa8\xc6\xd9\
-`\xf0\x81\x1dq\xf8\xf0\xe13f\xcc\xd0+O\x02P\
-6K\x16\xeeY\xb3f\xcd\x9d;w\xfa\xf4\x19l\xa2\
-DlL\x5c\xf2:\xb1{w\x9eV\x1e^ElT\
-\x92LC\x00w\xf1Rj\xd8\x81\x91\x07\x9f\x9d2\x08\
-5\xe1lB!\xfbH\x19&\x95+\xd4_0\x19A\
-\xdd\xd7{\xd3\x1e=z\xd0A\xe2\xd1\x01\x03\x06\x10\x9b\
-\x22\x13s\xe8\x93p\xbe\xba*\x95\x84f\xe7\xd6\xad[\
-\xcc#\x93\xc5J\xc2<2\x9b$\xc9\xe5\x1a.\x9b\xba\
-\x1a\xd2\x8b\xc8\xcd\x00\x0d\xe0\xa5\x5cY\x12\x89zY$\
-\x1b\x1a\x1a\xf4\x06\x14\xe1\x8a\xfb\xeb\xff\xac\x99_\x7f\xfd\
-\xf5\xaaU\xab\x08F\xd9Y\xf6\xef\xdf\x7f\xfc\xf8q\xf6\
-\x97\xef\xbf\xff\x9e\xf6\xf0\x10\xcd\x9b7\x8f`\x94\x86\xe9\
-\xccF\xf3xpt\xcc\xc3\x00$s2g\xcd'H\
-\xe5\x8a1\x9e\xa9\xa87jg\x95\xd6\xc0\xf8\xf3\x5c\x13\
-l\x8c\x193\x86']\xe7\x16\xb0Av~\xe1\xfdD\
-\x9a6!\xacM2N\x15&\x9b{S\xb3\x17R\x0a\
-K*\xcb\x90\xd2Hk\xda\x9cB\xf7\x85\x8a\x0eF\xa3\
-7\xa3j\xb1\xb7\xc8G\xfaB\xb9\xc2rm\xca\x81e\
-\xe5\xbe\x08Fi<;=\xa1ymm\xad^\x19j\
-L|vn:\x85W\xe5;\xb7\xe9C\x83\x22hd\
-\x14\x8c22\xe5\x09FY\x7f\xa7L\x99\xf2\xc8#\x8f\
-\xe8\x10\xc2\xba\x10\xcd\xbb\x04i@J\xba\x19\xce)\xf8\
-lg`Y\x91\x8d!3\x09\xd8\xd0\xf1\x9fZ0J\
-\xc7\xf1(\x1c,|\xfd\x89\xc0\xb1\x87]\x90\xb8s\xd9\
-\xb2e\x8b\x17/\xd6\x97z\x02s\xc4\xda\xcd\x1e9d\
-\xc8`\x96oE\x9f\x90\x84o\xf91\xa8\xbfAn\x90\
-CM\x1ar)\x1eZr5\x9cIc\x0d\x9aM%\
-]\xbe\xd7\x17\x222\xb0\xa4+\xea\xdf\x87\xe9jzS\
-\xb2]\xb1\x0a\x11\x0d\x0c\x192\x84\x15\x89a\xc1I\x88\
-u\xaa\xf1h\xc5\xc2\xbc\x10\xb7\xe1\x99\xac\x96\x83\x06\x0d\
-\x0a7\x11o\x91\x0f\xfa0+s\xd1\xd0\xe2\xc0J\x08\
-\xfa\xbd\x1c\xd6\x87}\xfb\xf6m\xdf\xbe}\xd7\xae]\x08\
-@\xdc\xc9\xba\xb1u\xebV\xc2P\x02P\x82T\xfd\x09\
-x\x96\x14\x8ap\x0b\xe2\x9e\xd9\xb3gs\x90\xe3T\xa3\
-W\xb6\xb4\x8a+>\xf6\xa0\xfbY\x81\xae<\x8f<\x8c\
-C\x87\x0e\xc5\xdfX\xf3Y\x0f)\xa8_\xe8\x94\x0d\xed\
-\xa1\x8fa\xf3\xaa\xb4\x8c(\x18\xc5O\xa47\x7fH<\
-\xc3\xc9\xa6iC2\xeb,\xa4\x0c\x91\xd2\x1c@\x1ae\
-\x81\xf4\x08.3O\x08\x91\xd2Hk\xda\x90L_\x95\
-\x92G\x80\xeb\x7f\xff\xef\xff\xdd\xe9\x9aM\xbb\x07\xa3\xac\
-\xfb\xf8\x87\x82Q=\xb1\x1a)Z\x9f\xee\x95\x1b\xd8\xbc\
-q\x0c\x93\xca\x05d\x95\xb5\x1aP\x86\xc1h\x19B\xae\
-\x96A\xf7\x89\x0f8LO\xcb\xfd\xf1\x5c\xc6\x84\xc6\xd3\
-\x11\xd7\xb3\x84h\xa9\x0dGI\x06\x11>/\x7f\xac\x04\
-e\xc3`\xb4loF\xe9#+/}d\xf6Y\xa9\
-\xe5\xa3\xd6<\x09I\xd3s\x9ah6\x0d\xd9\x80\x92\x18\
-\xa4mB\xcc\x18\xb3\x9fB0*W\xe1\x0a8\x12K\
-\xf0\x88\x11#\x081g\xcc\x98\xc1\xe0\xf3\xdc\xc1\xc4\x89\
-\x13\xd1\x10\x80\xce\x993\x07%Qi\xff\xfe\xfdkj\
-j\x88\xc9\x14\xb0Z\x18j\xb5\xb9QlD\xf7\x8aF\
-\xde\xb2$D\x98\x8d\x19\xb866\xd6\x1c\xe5\x1aI\xb1\
-\x02x\x8b\xfcR\xca\x02\x9f.\x5c'\x02\x0d`\x8b\xa2\
-\xb3\xc4\xeb\xea8\x8b\x12Y< P\x8dG+\x16\xa2\
-7\x05\xa3\xf2U\xe6\x91\xa7[3k\xf3+\xc2\xa4[\
--\x1aa\xe9\xa3\x140\xd1\xac\x0c\x04\x97\x84\x98W\xae\
-\x5c9s\xe6\xcc\x8e\x1d;\xd6\xacY\xb3n\xdd:\xe2\
-Q\x96\x0b\x05\xa3\x07\x0e\x1c8v\xec\x18\xbb\x09\xc6V\
-\x96z\xa8\x99\x06\xf0\x10\xf1XM\x9d:\xb5\xaf\xfb\xfe\
-\xa3\xd0\xb7%s\x05\xfc\x8d \x895\x10O\xa3\xf1x\
-\x1d\xf6<}t\x87\xb5\x91\xe3\x10\xcf\x1dK\x13\xb7P\
-\xcdUZL\x18\x8c2\xce:\x0f\x03Y\x8c\xad\xc9\xe1\
-\xb5eDe5q\xe1\x15\x03\xa6>\xc9KAVT\
-<\x22\xcc\x0d]\xc2\xf4\xe9\xe2\xa5h\xda\x15\xdai\x1d\
-\x87\xca\x0dF\xf1\x8f\x09\x13&\xb0\x05\xb2\x01p\x10T\
-s\xd5z\x90\x99\x04\xf4J\x9a \x5c\x89F\xbc\xd6\x95\
-\xf2*\xf7\x99Q\x85\x5c\xf7E0:n\xdc8V1\
-\xbd\x19\x8d\xbc\x96\xa4z\xe4\xd3\xf9(\x0b$su\xa3\
-\xd8\xe8\xb2\xc2l\x80\x91\xe1\xe8\xaf`\xb4\xbe\xbe\xbe<\
-\xc1(s\xcd\xf1\x83\x98\xdb\xde\xfe\x86M2\xa1IT\
-\x0a|:G\xd8eo\x91\xb2\xa1\xe3\xfa\xcc(.\xc1\
-~\xf3#\x0bF\xe9/;t\xf2\x83@\x17Pr\xe5\
-A\x1b;v\xec\xacY\xb3\x16.\x5c\xb8`\xc1\x02\xfd\
-\x19\x92\xc9\xee\xcf\x1a\x11\x8f\xf2\x0c\x8e\x1a5\x8a\x1dT\
-gB\xd0\x9b\x1b`\xbe\x80:mT5\x9eB\x9aR\
-\xf0\x05\xb2\x8a\xf8\x8c|\xd2z\x19g\xe2-\xb2J\x09\
-\x99E(+\xea\x17\x9d\xa5\xefl]]\xbbvUp\
-\x83\x9f444\x10\x9d\xe03\xb2\xacR90e,\
- ,#\xf2v9\xb0\xa62D\xb3\x8c\xc0\xd5\x89\xee\
-?\x17\x83\x82~,.\xe1\xea\xd5\xab'N\x9c \xe2\
-$\xee\x84]\xbbvm\xdd\xba\x95xT?\x82\xd7O\
-\xea\x01\x7f\xb8s\xe7\x0e\xf6\xd4\x13\x81\x0b\x11G\xf2X\
-\xe9g\xf4\xda\xd7|^\x80kW\x1e8\x1b.G<\
-:x\xf0`\xf6D\xe2Q\x9eb\x96&\x96h\xaeU\
-\xf7k\x0d\x0aF\x99\x14\x96A\x06\xd9\x82\x0d\x9f\x9d\xf3\
-\x8dP\x80P.\x1d\x95\xc2\xbb\xe4u&\x08\xe5r\x95\
-\x10\x92\xa9\x0c)\x92kY\x12\x92\x8ar\xa4\x93\xe5\xc1\
-:\xce\xd5\xee[\xa1\xc1(\x0e\xc1)\x90]p\xe8\xd0\
-\xa1l\x99\xb8\x8bm{Bf&\xd8PZ\xc7\x8cH\
-\xa3\x22\xd4\xe6J\xf8_`b5\xe1D{\xe1\xc2\x85\
-\x8a}\xc9A\x83yNj\xddo\xd3\xf3\xe4h@\xd4\
-5z\xa4\xbe\x08\x1b\x93\x10\x9f\x97\x1a\x9cLd\xa9`\
-\x94\xc5\xb7l#C\x8f\xd8\xe6Ym\x89G\xe9#\xab\
--\x9b\x87\xcf\xcb\xcd\xa3\xae\xeacxm\x01\xae\x97\xbe\
-N\x83\xa4\x05\xa3\xec7\xf7u0Jw\x18R\x83\x8d\
-\x99\xf1\xe4ibx9\xd2\x80b\xcd)S\xa6\x10\x80\
-\xce\x9e=\x1b\x81,\xc6\x9f=\x8f\x9d\xd2^\x82rB\
-\x08\x0f\x06@m\x12\xfc\x9d\xf2\x09\xf5\xccN\x93\x13\x14\
-\xd5\x13\xda\xdb\x8d\xc0\xab\xcaBx;\xdd]-Q\x92\
-\xa1\xe0\x01\x04\x04\xc2\x8e\xb3g\xcf\xde\xbd{W\xc6U\
-*\x07\x1c\x89\x88P_\x90\xccb\x82\x1b\x13\xd2\xc9\x8d\
-\xd1pu\xbe\x99\xb7\x86\x98\xc0\x22\xc0\x9c\x86\x1f\x06%\
-\xdc\xe4d\xae?k\xb9q\xe3\xc6\x9d;w\x1e8p\
-@a\xa8>\xad\xa1\xe0\x95\x82`\xf5D\xe0E<\x5c\
-\x16\x8c*8\xf6y\x01(\xa5\xd7\x95RX\xb2'v\
-\xee\xdc\x99\x15\x92G\xb2\xb7\xfb25\x9eJ\xee\xcb\xdd\
-Y\xaf\x5c\xb9*-\x81\x07\x99\xed\xc6\xde\x8c2\xd4M\
-.;E\xb2J!q\xbb\x00)\xa3:\xa3\xfa\xa3\x5c\
-Cz@\xb6\xaa2\x91\x8d\x8c\x0de\x95\x19\xf5Z(\
-\xc9\x95\xc6Th0\x8a7\xe0\x22,\x1f\xda\x11y\x02\
-\xd1(+\xec\x80a#\xab\xab\x11%\x85\xb3\xf5P\x0f\
-O2\xc1V]]\x1d\xd7\x8a\xddT\xe8>\xcf\x09\xc1\
-(\x11C\xff\xfe\xfdY\x98\xf4\xc0\x90\xa5\x8e\x08\x19\xa7\
-)\x9e\x1bbf\x8c\x0cq\xd8\xf9\xf3\xe7O\x9e<\xc9\
-\xc8\xb0\xe9J\xdf~pk\x16\x82n\xdd\xba\xf5\xeb\xd7\
-\x8f>\xea\x10\x126;\xe9C~/\x227\x08\x09\x8d\
-\xa3RB\x06\x11T\xa8}\xe8~\x0fFq\x0f\xed[\
-\xa0\x1f\xf3\xb1\x81\x0d\x1c8\x10\x17\x9a7o\xde\x92%\
-K\xb8N\x9f>\x9d\x90\x94\xe3\x0d[\xa3~\x0a\xcf\xe0\
-\xb3a3\xec8\x98\xf6?\x08\xf7o\x13\xdcM2(\
-\x92\x95Ih\x1f\x95%\x09\xf2s\xf0\xda\xb2\xa0\xdb\xd9\
-U\xb8\x9cFh\x18Ct\xf3\xe6M\x5c\x85x\x05\xb7\
-\xf1\x19U*\x06b5\x96w\x1eg\xc2D<\x99\x90\
-\x14\xdfFO\x92,BU\x90\x0c\x08$\x11\xf4\xc5L\
-\xfa\xd9\x88>\x0cz\xf0\xe0A\xce\xe4\x04\xa0\xdb\xb6m\
-\xdb\xbbw/\x9b\x85^\x85\xde\xbauK\xc1n\x89\xe0\
-3\x0aF9\x04\xf2<\xd2$\xfc\xaa\xf8^\xc6\x95\x07\
-\x90\x82\xc8\x5c\x91)ET\xcaC\xcd\xa3M<J\xb3\
-\xc9\xa2_\xe4\xd2\xf8\xaa\x1f6\x17\x86.|3j\xc1\
-\xa8rM0\xd0\x08\x9fn>\xcc\xb8&=\x9c\xfat\
-\x9da2\xca*\x85\xa8r]#\x94[\x1et;\xd7\
-\xf5<,\xb7B\x83Q\x9a\xa8u\x81\xa7\x8e\x1d\xb4\xd0\
-sk$\xe3\xea\x08eP\xaePY\x9f\x11d\xf1\xf4\
-\xb2`\xb1\xb2\xb0\xbe\xb0\x06qS\x9fQI\xf0x\x10\
-O\x104\x14\x09Fe\x99I\xa1\xdc\xb4\xde4\x08\x0c\
-\x05\xab-\x91(1\xd9\xd5\xabW\xa5o?\x98 \xbd\
-T\xd0\xa4\xeb\xe5(\xdd\x04r\xc3\x86q-\xe4\x09\x06\
-fV\xc4\x0852\x00\x9fv\xa8\x0d\xf7i0J_\
-4\x5c\xac\xa7\xac\xaa\xa3G\x8f\x9e9s&\x0e\x83\xdb\
-\x00\xfb\x1f\xa1\xe7\xacY\xb3\xe6\xcc\x99\x830b\xc4\x88\
-A\x83\x06\xe1K\xec\x8e<_\x0aC\xb5\xed\x85(\x12\
-\xb5Q\x0a\xe54QV\x93sT\x1c\xdd\x8b6H\xf0\
-\xda\xb2\xa0;\x82\x92\xea\x08I5F2\x10\x88\x9c;\
-w\xee\xc8\x91#\x97.]\xaa\xccu\xa3\x0a\xfb\x08\x07\
-\xe9\x1b7n0Arf\x9eh\x965@\x09z\xf1\
-\x09\x92\x81\xb5\x8ep\x93\xb8s\xd5\xaaU\xeb\xd6\xad#\
-\x06%\x00%\x18=|\xf80\xcb\x02\xb9\xac\x0f\xd4F\
-\x14\xd8\x5c\x0f\xc7\x7f\xec\xcd\xa8mj>/\x87\xf3,\
-\xaf4Y\x02\xc8\x03\xe9\x08\x8bdw\x07\xf5\xd4\xd4\xd4\
-\xf0 \x13\x98\xd2\xb5f\x05\xc7U\xa0H0\xaakH\
-2\x079\xbc\xaa\xf9\xe06\xf2\x9c\xd0\x7f\xac\xc2\xb0f\
-w\x9fb7*\x94\x1b\xd6,TU\x84\xcfk\x7f\xa2\
-\xf6$\xfd\xcf\xef;\xc9J\x0fF\xd9#\xd95\xf5\x09\
-B\x9f\xe7\xd0Pf\xe2-\xf2I\xf7\x5c\x02\x10|\x00\
-k\x13\xfbJ\xc5\xbe\x1c\xe5\xf1P0:9\xf7\x17\x98\
-\xd0\xa0W\x17@f`\xb2\xf4B\x9ah\x10\xec\x1aa\
-\x83\xc3\xd2\xc6.{\xe2\xc4\x89c\xc7\x8e]\xbe|Y\
-\xb9\xed\x8an\xcd\xa4\x8f\x1a5\x8ay\xef\xea\xbe\xd5\xcb\
-\xf4\x90\xd9`#\xccMw0*KR\xf8t\xee.\
-\xf7i0\xca@\x11M2t\xac\xa7lND\xa2\x0b\
-\x16,x\xfc\xf1\xc7\x1fy\xe4\x91\xe4G\xf2\xee\x0f\x0b\
-M\x9a4i\xdc\xb8q\xc3\x87\x0fgG$\xd0\xe7\x99\
-\xd2KP\xc0\xa3\xb4U\xfb\xea\x1c\xe1\xf8\x84r!B\
-\x83\xd0\xd9\x9a\x85U\xe2n\xd8\x91oFM\x08\xdd\xcf\
-\xb2\xb4h\x1c?~|\xdf\xbe}\xac\x1b\xd5`\xb4b\
-Q<\xcad\xdd\xbcyS\x7f\x02\x1eX\xedy\xc6Y\
-\xd98K\x00\x81&\xd7\xa3G\x8f\x22\x1c<xp\xcf\
-\x9e=\x04\xa3\x84\xa1\xac~\xac\x81W\xae\x5c\xb9v\xed\
-\x1a\x01\xeb\xbd{\xf7Z3\xd18s\x18\x8c\xf2\xd0\x99\
-;\x19\xa1\x8fE\x84zd\x8a\xb3B\xf6\xeb\xd7o\xd8\
-\xb0a\xfa<\x1b>\x89\xaf\xf28s#be\x92\xde\
-\xbaJa2\x83Q\xf4\x1a\xed\xf4\x5c\xa0\x11>\xdd|\
-\x98#[R\x8c\xb0\xc2fU^\xc88\xbcE\xd2\xdc\
-,|v\xd9Q\xdb\xac\x85jI\x85\x06\xa3@C\xf1\
-\x09\xb6\xd5\xda\xdaZ\xb6O\x0e\x82\xda\x96|\xb6\xc3\x8d\
-g#\xd2(+$\x9ax\xb3A \x0bxnYh\
-N:n\xdf\xbe\xad\xdc\x8a\x82\xbe[0\xaa_\xa5L\
-:\x5c\xa0\xcb\xca\x0aA\x19\x0d\x02XV&,d\x0c\
-\x05\x8b\xf5\x8e\x1d;X\xa0o\xdc\xb8\xe13\xda\x19\x96\
-\x06:\xa8O\xf0\x10Z\xd1B[R\xa3\x06\x87=R\
-\x16\x98,=\x98\xd2\x92!h\xc2z\xe4\x0c\x04\xa3u\
-uu\x95\x1f\x8c\xd2~\x22H\xc0\x1fp\x0f}\xdc\x96\
-p\x13'!\x06\x9d?\x7f\xfe\xb4i\xd3\x08\xeb\xd1s\
-\x80\x016B\xcc\xd8\xc0\x18d\x8a\xa8,\xaeeO\x96\
-\xae\xa01\xb1\x911=B\x11d\x03\x99S\x93\x897\
-\xca!\x8d\xb2@\x0d\x132h?\xfcm\x0a\xdc(\xcc\
-\x92\xf0\xfd\xf7\xdf_\xbdz\x95Gc\xef\xde\xbd\xd57\
-\xa3\x15\x0e\xb3C0z\xf1\xe2E\x02P\x22NBL\
-\xd0\xdc\x11wr\x9c\xd0\x15\xf6;\x88G\xf5yP\xa2\
-O\x16\x04\xa1P\xcf\xd7\xd8\x22\xf0g\x05\xa3<\xa4z\
-3\xea3\x02BO\xb3\xdb\xd9\xad\xb9\xca@\xf0\xfc\xf2\
-8S\x15\xd5r%\x96\xea\xd3\xa7\x0f\xb2\xde\x92\x02\xcd\
-V\x0dU\x0a\xa1`T;\x0e\x03\xc8\x902\xb0\xca\xd2\
- K\x16\xd2\x08\xafj>L\xa2\xe6Q\xc9\xcc\xda\x22\
-\x0d\xf6^\xca\xc7\xcc\x5c\x1d\x8dD\xf6^\x9b\xc2g\x97\
-\x17\xd7\xfb\x04\xc9RB\x8b\x83Q\xff\x09\xcev\x85\x86\
-\xb2\xe2\xeb\x89\x0a\x1b\x0d~,\x1d\xa5\xefX\xc9\x008\
-\xc2$\xa5X\x14xz\xf5cJe\xddG\xa8\x17\xc2\
-\xab\xf2\xc7\xc7\xab\x0a\x10\xdaD\x95\x00I\xd6\xf1\xb2\xad\
-h\x8c?\x13\xc1\x8a\xa0\xb3G\xd8\x9eR:\xe2\xa5,\
-T\x8f\xebk#\xca2\xec^\x10\xca\x95\x89\xf6!\xf6\
-\x9e\x81\x03\x07\x12qN\x9d:u\xd1\xa2EO=\xf5\
-\xd4\xcf\x7f\xfe\xf3_\xfe\xf2\x97\xcf<\xf3\xcc\xcc\x993\
-\xc9\x22\xa0\xef\xe2`H\xf1p\xd0\x8b\x13j\xa0\x8f\xda\
-\xe4\x84\xaa\x156>\xa67M\x1b\x12\xdd\x14\xd0\xe8F\
-\xe0U\x15\x83oV\xaea\x84)\x04+g\xcf\x9e\xe5\
-\x9cV\xdd\xf2+\x1c\xfc\x8a\x13\xe6\x85\x0b\x17\x88D\x89\
-8\xb7m\xdb\xb6\xc1\xb1u\xeb\xd6\x9d;wr\xecT\
-$*\xf4\x9bI\x1c0\xda\xe9G\xde4\xc6\xf0*G\
-\xe8]\x11\xa1^\xb2\xae,\x02\xc4R<\xdd\xbdz\xf5\
-\x22\x96z\xf4\xd1Gy\xf6\xff\xe1\x1f\xfe\xe1\xc9'\x9f\
-\xe4 \xca\xf9\x93\x5cW\xa8J\xd3\xd8 \x87\xf3\xa2i\
-\x02\x9f\xce\x9f\xbeL\xbc]\x0a\x9f\xed\xf0\xaa\xc2\x93n\
-6\xa1`H\x03\x96\x0c\x95\xa2P\xb5\x22\x92[\x86/\
-_\x02\x85\xecQf\xb6\xb3Y\x94)\x18\x05{1\x06\
-n\xe2\x12$G\xd7\xd2Q\xcd&\xff\xe0~\xe9\x92\xab\
-)+\x13\xd7\xea\x92Z\x986\x8b\x86\xa8\xd0\x88\xe9\x16\
-@\xbc\xc2BF\xac3x\xf0\xe0\x9e={\xfa\xec\xf6\
-\x84&\x11*q\xac\x1f6l\x18Wd\xc5L\x85\xb0\
-\xa9\x97 BY\xa8;>\x91\x8f\xca\x82O\xdf\x0f\xd0\
-Zv \x02\xca\xde\xbd{\x8f\x1b7n\xc1\x82\x05\xcb\
-\x96-#\xf4|\xee\xb9\xe7\x88D\x97.]:\x7f\xfe\
-\xfc\xe9\xd3\xa7\x8f\x1e=\xba\xa6\xa6\x86\x00T?u\x02\
-J\x81d\xeb\xb5\x06\x07Ty\x84\xcc\xc0\xa7K&]\
-D\xf5\x08\xafr\x84w\x97lH\xa3\xacJ@\xad\x12\
-D\x9f\x0d\x0d\x0d\x07\x0f\x1e$v\xb9|\xf9r\xf5\xb5\
-\xe8}\x01\x13\xc7\x22OT\xca\xf9\xe1\x8a\x83I\xbc}\
-\xfb6\x1a\xbdG\x14\xda\x0b\xc2}\xa7\x9d\xf0\xcfC\x0a\
-\x9f\xed\x0c\xf4\xc0\x0a\xe5\xd2\x0b\xb2t\x95\x06X\x108\
-v\x0e\x1d:t\xc2\x84\x09\xb3f\xcd\x22*e)\xd0\
-q\x94\xe3=e]}U2\xd0\xe8\xe9\x87\x8d\xa6\x11\
-J\x0a\x0d\xb8\x84\x10)K\xc7\x17s\xd8]\xa2{E\
-\xc8\xd8'\x0a\x13\x9aE\xd5&\xb7\xc9\x7f]*c0\
-Y\xfa\x10\xe9\x0b\xe1\x8d\x1c^\x95\xc3k\x03|\x86#\
-\xfc\x09\x83Z(\xbd4-\xa0L\xce\xad&\xea\xaav\
-\xbbQM\x085\x5c\x8b\x10\x19D\xddf\xddaU:\
-}\xfa4\xe7fV\x22\xaf\xadH\xac\xe5I\xff\x9b\xea\
-u\x88\x8cU\x0al]\x03\xd3;\xc3Ft/\x22B\
-\xd68\x963)\xdb\x15\xda@\xf0\xa4\xf7|:\xd3[\
-\xabh\x8c\xf5]\xb8&\xc7\x1d\x09\xcd$\x1bR\x16\xa1\
-\x14\x9b\x0e\x87h\xb2K\x97.\x84\xa1\xfa\x93\x10\xec7\
-/\xbe\xf8\xe2k\xaf\xbd\xf6\xd2K/=\xfd\xf4\xd3s\
-\xe7\xce%<\x1d4h\x10\x87\x07F\x0fc\x86%\xd9\
-\xc4\x1c\x1a%\xd0\x80\x00\x15zU0\xce\xa12,h\
-\x06\x99(W\x96\xc2\xca*\xcb\x90\xb1JA\xa8\x94\xc0\
-R\xa5\xd5\xca\x94eF\xed7L\xa3\x5c@\xa6\x85\xb7\
-n\xdd\xaas\x10\xcd\x90\xf4yU\xaa4\x85\xdc\xc9H\
-k\x222\x8b\x08{LP\xf2\xbc\x13T\xb1>\xf4\xe9\
-\xd3\xa7\xb6\xb6v\xd1\xa2E\x8aG\xf5\x07l\xc3\xe5\xb4\
-\x8a\xc1\x98\xb0\xc7u\xef\xde\x9dm\x8e\xd1\xd3\x9a)\xbc\
-E\x80\x8d\xb6\x09\xad$\xac\xc7\xdf5@\xfaL\xc8\x0d\
-WW\xd5#\xdc\xf2\x99\xf7y\x12)]f\x82\xd7\xa6\
-(\x92\x95Ih\xef\xda\xdb\x88\xd7\xe6p\xb7\xf5Dm\
-k\x13:\xe6\xa4\x95\xeegs\xd1\x88\xd8\x90!\x13\x80\
-\x9e;wn\xdf\xbe}'O\x9ed\x83\x91\xd9}\x81\
-z\x11\xe23\xf2\x07JY!\xa6\x97\xc0 H\x00\x19\
-\xe0\xe8\xc8\x84\xe9\x97.]\x22L\xbfv\xed\x9ar\xdb\
-\x15\xee\xcbr@ USS\xc3\xd2@\x1b\xc2\x86\x85\
-$S\x98\xc3\xabrxm>\xd2\xcb D\xb9\xc2\xab\
-*\x03MA\x08\xab\xa4^\x1bO\x9c8Q?\x8e_\
-\xbe|\xf9\xe3\x8f?>o\xde\xbc\x193f\xa0\xd4w\
-3\xf5\xe8\xd1\x83\xdd\x08K\xec\xa9\xc7\xba&\xc1p7\
-\xf1c\x22\x8d\x90\xbe\x05\x14)\xeb\x1c\xaa\xd1\x1b\x0d\x15\
-q\xb7\xf5\x82S\xe7\xb5GH_\x09X{\xb8\xea\x1d\
-\xdb\xbd{\xf7\xa4\xa9R\xa5Y\xe8\xb9\x00\x9en\xafJ\
-Anx\x8dH+m\xa1\xe0\xbc:v\xec\xd8\x05\x0b\
-\x16\xb0P<\xf9\xe4\x93\x8f<\xf2\xc8\x88\x11#\xca\xf3\
-N\xe1\xfe\xa2s\xe7\xce\x03\x06\x0c`p\xf4\xe5-\xfa\
-9\x92\xcf+\x80\xad\x00\xe1\x83\xef'\xc0\xe1U\xed\x86\
-\xddB\xb7\x03d\xb5G(7\xc4\xf4\x5c\x09\x07\xa5l\
-otS#\x89\x91\xdd\xad}\xa3\x1d\xb2\x0c\xe5\x16P\
-\xbe`\xb4HC\xe9\xa1\x97J#\xac\xc7d*aG\
-ihh \x12e\x83\x91\xb2\x92Q\xcb\x0b\x8d\x09D\
-Yf\x1f\xa1\x5c#T:\xe7I\xc2\xf4\x0b\x17.\x9c\
-8q\xa2\x0c\xdf\xeb$h\x00\xcb\x81\xad\x08j\x92\x90\
-\x01\xd00/9,\xe9\x9a\xec\x9f\xb74\xd2;\xc3<\
-\x94kxm\xc7A\xc7\x1fr\xdf\xb0\xcbv\x02}\x1c\
-\xfa\xea\x16\xc2\xcd\x993g\xb2\xb5\xbc\xf8\xe2\x8b\xaf\xbe\
-\xfa\xea3\xcf<3m\xda4\xd6P\x02w}\x1eT\
-?lb7\xa2\x92\xf4\x00\x86\xbd\xb3\xce\x86\xca\xf6\xc0\
-\xdf;\x87\xd7\xe6\xb0\xbbK\x08m\x92\xf6\xb5s\xdbZ\
-\x0cK*mc\xb4\x19y\x9d\x9a|F\x95*M\x81\
-\xe7\xfc\x1f\x87\xf6f\xe7\xe6-\xf4\xf3\xf4\x03\x85F\xcf\
->\x8b\x00k\xc8\x981c\x1e{\xec1}\x82|\xfa\
-\xf4\xe9\x1ceY\x1f\xbci\x95\xff\xe7\xffa4Xc\
-kkk9\xcc\x0f\x1e<\xb8\xab\xfb:\xf3\xccQ\xf5\
-Rn\xa5\xb2)s\xb3\xd7\xbc\xe9\xa3\xb6\xf4-\x8a\xa3\
-\x22\x11\xa6\x97\x8da\x1a\x049\x83\x90R\xa8\xd9\xe0\x93\
-\xee_\x22\xe4\xe3t\xd9x\x8b\x1crfa\x1a\xd3K\
-cP<l\xb64\xad\xa1\xdc\xebo2\xea9\xbc\xaa\
-E\xa8\x06\x1b\x14\xc0#\xd9\xecu6bS\x97\xb2\x92\
-Q\x17LH#3\xa1dZ_\x08\x9918,\x97\
-\x84\xe6\xc4\xa3\xb7o\xdfn\xa7\x0f\xf2GpS\x1c\x97\
-\x9b\x02\x02-\xe1\x11r\x0d\xcfn\xb9\x9b\xc3l?V\
-\x16\x84I\xc9F\xa6\xb2c\x91+\xb22\xea[\x99\x9e\
-p\x10}\xc2\xf2\xe5\xcb\x9f}\xf6Y\xaeK\x97.\x9d\
-7o\xde\xd4\xa9S\xf5\xa9P\xbd\x07%0\xd2X\xd1\
-#=\xfc\xd4Vd\xe8JA\xb5E\xf8\xbc,\xbc\xb0\
-j\xa9s\x00\x00\xff\xf4IDATE\x0a\xe5\x16o\
-Ik\xda\xd9&\xf8\xb6f\xa1\x5c\x8d*W\x094\x98\
-0t\xd4\xa8Q\xfa{\xc5\xd1Z_\xa5J&x\x0e\
-\x8b\xdb\x1d\x07\x8b\xaa|IYxT\xe9O\x81\x8c\xd3\
-X\x16\x0e\xc9b\x82g\x0e\x192d\xfc\xf8\xf1\x93&\
-M\x1a>|\xb8~U\x5c5T\x01\x96M\x8e\xfa,\
-\xa4D\xedD\xea$\x19:\x9b\x91\xe2`\x16\xe13\x9a\
-\x83/\x99\x85\xb7\xc8\xad\x8dnV=\xd2\xa7\xcd\xc0v\
-L\xadT\xa0,,\xb5\xa1\xc3\xdf\xff\xee\x7f\x1d\x5c\x96\
-Ia\xd2\xde<!\xa9\xd7\x91d\x15F6\xd8\xebd\
-\x95\x1c\xb0\x02L\x1f\x0a\xe9:\xad\x12\x9fn\x11\x1d\x13\
-\x8c\xfaD0\x8b>]\x1a\xd8[=V\xf6\xa1\x87\x1e\
-\xe2\x89\x9d<y2N\xc9\xd9H\xca\xca\xc4\x1a_\x22\
-f\x5cz\xa9pH)U\xc8\x87\xda\x09\x16\xe8\x86\x86\
-\x86+W\xae\xe8sx\xe9\xfbJ\xc3\xd5\xb2$\x83\x92\
-\x22\x19\xa6\x02]\xf6\xd6\xe5\xeaQ\xe9(\x12e\xdbx\
-\xfa\xe9\xa7_}\xf5\xd5\xd7_\x7f\xfd\x0f\x7f\xf8\xc3\xef\
-s\xfc\xf6\xb7\xbf}\xe9\xa5\x97\x88M\x09C\x07\x0d\x1a\
-\xc46\xc3\xc1I1\xa8-@T\x12\xf5\x8b$\xc3\xc8\
-Z\xd0\xdc\xfe\x16\x1a\xbdB\xfa\x22D\xb7n\xb2\xe6\xb4\
-\xd02\xb8o!\x9cS\xe7\xe13\x0a\x83\x8d\x86Q\xf6\
-\xb4\x8d) \x18\xad\xad\xad\xed\xed\xbe0\xd2\xdf\xb5J\
-\x95\xc2\xe0?\x84\xa1\x17.\x5c8w\xee\xdc\x0d\xf7=\
-\xfch|^\x01\x12\xe7K\xd9\x98\x06?\x8c0{\x96\
-\x05BOv7\xce\xab\xf8\xaa\xbe\xd0\x0d\x03\x15\xac\x02\
-\x0c\x11\xc3\xd2\xaf_?\x22QFI\xa3\xa7,\x1bF\
-\xe1\x86\xd6\xe3U\xa9\x15\x86e\xc1K\xa9\xf9*\x8e/\
-\x93\xc3\x94\x12\xc0\xdf8\x07\x1a\xddK\xd7B\x06\xc4\x9d\
-\xee7\xf1<8\xde\xc5\x8b\x17\x8f\x1f?q\xe2\xc4\xf1\
-\xcb\x97/\xa3\x09\x1b\x8cl\xc9P(Dd\xc0\xda\x18\
-\x22\xa5\x19\xc88\xe9\x89C-\xd4\xb5M\xe8\x987\x01\
-m\xd2\x81\xa8\x12\x9eX<\x12w\xec\xd9\xb3'\xbb\xbb\
-\xd7V$\xb4\xbc\xc4\x11\x88,#o\xc8\xc4l$\x98\
-\x1b)\xb7\x0cp;\x1e\x98\xfa\xfa\xfaS\xa7N]\xba\
-t\xe9;\xf7\x95^(\xc9\x8a\xba#\xd4N\x9f\x080\
-\xcb\xb4\x10\x11\x1a\x08%\xcb\x097eM$\x9a\xe9\xdf\
-\xbf\xff\x8c\x193\x1e\x7f\xfc\xf1\xc7\x1e{l\xde\xbcy\
-3\x1d\xb3f\xcd\xe2\x8a~\xda\xb4i\x13&L\x186\
-lX\x8f\x1e=\x14\x83\xaa,WM\x93pU6\x12\
-jJ\xe9]2\x04\x0e\x9f\xce\xc2[d\xe1-R\xa8\
-mf#\x81.\x80d\x90\xa50M\xa4o=jI\
-\xb3H\x1e\x03\x87O\xe7\x86\x94Y`\x8f\xd7\x9fd\xd4\
-tT\xa9R\x1c\xbc\x88\xc3\xf6\xf1\xe3\xc7\x0f\x1e<H\
-<z\xf7\xee]s'\x13\xd28\xa7\xcbCz=&\
-!R\xea\xb1\x92\x0d2\x1b\x1c\xcb\x0b8\x936~\xa0\
-\xeek\x18\x0d\x86\x85\x18\xfd\xe1\x87\x1f\x0e\xc7\xc7F\xb8\
-\x10\x9a\x05\x11\xae\x0c\xc2\x1b\x95F\x93\xf6j\x95 \xe9\
-\x96\xa2\x04\x85}\xa0\xa4n\x8d\xc0\x09\x87\xad\x93\x9d\xd4\
-\xfd-\xb1+\xc4\x9dl\xa6\x84\xa1\xa7O\x9f\xde\xb5k\
-\xd7\xd7_\xaf\xfc\xfa\xeb\xaf\x0f\x1c8@.\xf1\xa8\xbe\
-\xb7Q\xc5\xb9ZmM\xe2\xee\xec\x0b\x0a\xb5VxU\
-\xbe\xd2\xf7!\xe7\xa5\xa6L\xb6\x81\xd6\xad\x9f\xf7\xf1\xe2\
-\xab\xfes\xb5\xc1\x22\xc9\x13+\xa54\x95\x09\xcdK\xb7\
-0s\xd6\xbd\xe4\x08\x9326\xa4\x8c\x0c\xb8&\xb7q\
-Hc\x96\xed\x0d\x8f\x07\x0f\x09\xf1\xa8\x1e\x15k\x03\x98\
-\xac\xc6X\x93\x5c\xeb\x1a;\x22\x9b\x10i2\xb3D!\
-}\x19\xc0\xe5:\xbb?3=x\xf0\xe0\xe9\xd3\xa7/\
-[\xb6l\xe9\xd2\xa5S\xa7N%\xd9\xa7O\x1fNG\
-d\x81\x84n\xee\xb3\xa1\x8aD\xa36\xbb\xcey\x8d\x06\
-DDY\x92\x0d)E\xa8\x09e_\x91C\x1a\xe5\x86\
-H\x0f\xde.\x87\xd7\xe6@\xe3\x0b\xa4 WW\x09F\
-\xa8/\x82n\x17\x91\xd6\x87K\xa7[Q3\xf0\xd9\xf9\
-H\xaf{\x19\xf7\xee\xdd\xbby\xf3\xe6\x8d\x1b7\xaa\xbf\
-\xc3T\xa5tn\xdf\xbe}\xf2\xe4I\xa2\x01\x8e\xdc\xf8\
-O\xf8r\xb4\xf5^\xa4\xa7\x06\x90#\xbfe\xd1\x00\xc9\
-UBl\xc4$\x08ee\xa2!\xd5\xf0j\x84C\x94\
-%AD\xc9\x90L}!cp5\xf9\x1f\xb8\x7f\xef\
-@\x00\xbcH\x02k\xd1\xad[\xb7\x88;w\xec\xd8\xf1\
-\xed\xb7\xdf\xae^\xbd\x9a\xd0\x13V\xae\x5c\xb9b\xc5\x8a\
-/\xbf\xfc\x92\xeb\xfa\xf5\xeb\x8f\x1c9\xc2\xc2\x85=U\
-\x85\xf1(\xa8S`\xc9$\xea\xccBf@\xc3\xfc\xa8\
-9\xd4\xd44\x96k6\xd2\x18R\xb6\x80\xf2\xb95\xbd\
-U\xcf5:^\xebP\x07\xa4\x8f\x88\xf4\xce<\xcf^\
-\x1a\xc3\x8dF\xcb\x87\xa3<\xd0\xecp\x1cBAzg\
-\x95\xd7A\xeb\x14\x82)\x0d\xd7\xe9<=I\x09\xb6r\
-\x99\xa6\x0c\xd0\x12\x1e0\x1e'm\xf0\xba\xb5uY\xc8\
-2\xc2\xe79H&\xbd\xcaa\x06\xd4\x03J\x1a20\
-\xb3r\xc2Y\xbc_\xbf~S\xa6Ly\xf4\xd1G\x97\
-/_\xfe\xf4\xd3O\xcf\x9b7\xaf\xb6\xb6V?3\x22\
-\xe8L\xdef<\xf0\x80\x09\x9c\x97\xa2vZg\x95L\
-\xf7\xa2\xc4\xde\xa5\xabU\xcd\x99(7$S\x09\x9a8\
-\x95\x12a\xd2\x99\xf8\xf6\x83\xc9.3n\x83\x92\x10\xca\
-!\xdcKKd\x88\x9b\xf0\xa4\x0d\x12\xc0g\xa4\xd6\x13\
-\xc9\x22\xd2(\x09\xa1Lq\x22\x89\x13'N\xb0\xac_\
-\xb9r\x85\x05\xddgT\xa9R\x14y\x0e\xe7\xed\xcb\x97\
-/\xdf\xb9s\x87\xa4\xcfh\x0ay#\xf8t\x81\xe7\x1a\
-\x83\xd0\xb7\xb9b\xc6\x1a\xf2\xb0\xa3\x1a\x8f\x8608,\
-\x05\x8a\xe44P>#\x9fd(\x03\xa4Q\x96\x90\x1e\
-\x18y\x9bP\xaf\x0a\x90\xde0\x8d\xeek6\x5c5\x83\
-\xaaM\x8b\x15\x175\x95\x9d\x918\xf2\xd2\xa5K\x17.\
-\x5c\xe0\xca\xe2s\xed\xda\xb5\xab\x0ed\x9c\xea\xf8\xf1\xe3\
-\x84\xa1\xef\xbd\xf7\xde\x1bo\xbc\xf1\xff\xcf\xf1\xa7?\xfd\
-\x09\xcd\xaaU\xab\xf6\xed\xdb\xc7)\x08K\xea\xa1Zn\
-'\x97p7O@6\xbc*\x0bo\x91O\xd8\x11\xd7\
-\xf6\x04\x19\x87c+\x03\x9fh\x0b\xca\xe1\xd3\xb4\x98\xd0\
-\x84'\xf6\xee\xdd\xbb\xcc\x84\xfa \xc8\xa5{a\x0fK\
-\xc4\x8aX%\xf7\xe9\xf3\xa9\xf6G\x82\xc9i2\xb3L\
-)\xc1\x8d\xa8Gz\x06'L\xb67\xdc\x88\x90K/\
-\xff\xe4\xcaR\xa6\x1b\x90\xd6$\x9dwH\x962M\x94\
-\x15\xdas5L\xd9\x86\xd0\xb5\xce\x9d;\xbb\xdf\xc0\xee\
-\xd6\xb3g\xcf\x81\x03\x07N\x9f>\xfd\xd9g\x9f}\xed\
-\xb5\xd7^y\xe5\x95\xc7\x1f\x7f|\xfc\xf8\xf1\xe8\x89;\
-\xe9\x1d#`\x83\x0f4F\x03\xe2Z\x97@\x85&\x84\
-2\xc6\xd2\x84\xa8\x12\x9f\xc8!%\xf8t>Vs\x93\
-\x94n\x19b\x1dD\xce\xac!3+\x9d\x14Q2\x22\
-\xca\x92q\x11\x22\x1b7H~\x94\x10\xc8eW`Q\
-b?\x00\xadN\xca\xadR\xa5I\xe4<\xeck\xc4@\
-<\xd1x\x94\x9e\x05\x9f\x9d\x8fs\xbd\xbc'\xd4\xb9p\
-\x82O\xe7\x13\x1a#S-\xeb\x09\x0bN\xff\xfe\xfd\x07\
-\x0c\x18\xd0\xa3\xfa;L)XS\xb5\xb4*\xe9\xc6\xdb\
-#M\x84\x8d|h\xa3\x1aBX\x13\x84\xec\xadT2\
-s\xf9s\x17j$S*y\xcf\xe9^y\xea\xedL\
-C\xc3u\xc2MV\x1bN\xbf[\xb6l\xf9\xe6\x9bo\
-\xf4\xbe\x93\xf8ru\x8e\xf0%(\xc9\x8d\x1b7n\xdb\
-\xb6m\xc7\x8e\x1d;w\xee\xdc\xb5k\xd7\xfe\xfd\xfb\xf5\
--\x8d\xb7o\xdf&\x12\xa5f\xdd\x8b\xa6r\xd5\xddE\
-\xa1\x8e\x17',\x15UX\x087~-\xb9WD9\
-\x028\xa6\xc4\x0e\x91\xdf\xb9\xaf\xa3\xa7\xe9\xea\xa7\xf5!\
-\x19\xce|\xa4\xcfD\xc5\x85W\xe5\x06\xaeM\x06\xa5\x02\
-\x89:\x9b&m\xc0Ph4\xca<&\xdc\xaeS\xa7\
-N\xfa\x0e#\x025\xe26[\xa0\xd5HPR\x84\xcd\
-\x0b\xb3d\x19\xe1\xf3\x02L/A+\x88\x90\xbemy\
-\xf8\xe1\x87\xd9\x0c\xa6L\x99\xb2`\xc1\x82\xc7\x1e{\x8c\
-\xd0\xf3\xe9\xa7\x9f\xd6w\x85\xea\x8f\xc8\xd3kE\xa2j\
-\x8fJ\xa9\x8fM\xb6'2\xa0\x94\xf0\xe9\x1c^\x9b\xc3\
-ks\xb8\xdb6\x22\xa57uH\x93\xa6HV\x11t\
-\x0b+\xeb\xd6\xed\xbc\x17\x96\x96\xa5d\x88l@\xb2]\
-\x8b\xd3\xa4M\xf1\x8e\x84\xb9T\x85s>\xf4\xd0C\x1c\
-\x9cJ\xb9u\x95*!\xb8\xbaB\x0d9\x0f\xae%\x94\
-\x1b\x91\xce\xa2\x94\xf0\xe9\x1c2\x8b\xae8j\xf7\xee\xdd\
-Y^X|\xc6\x8c\x19\xc3\x22S(\xf0\xfd\xa9\xc1\xe0\
-\xb8\xf1I\xde\x80 HcY\x12JA\x13\xa1\x19a\
-\x05\xd3R&er\x83\x5c\xcd20\x92\x92\xae\x14\xc6\
-n\xdbI\x96>\xae\x84:\x9cU\x08\x19o\xdc\xb8A\
-\x00J\xfcs\xfc\xf8qB\xc9={\xf6\x10\x5c~\xf5\
-\xd5W\xef\xbd\xf7\xde\xdb\x8e\xb7\xdez\xcb^\x7f\xfe\xc7\
-\x7f\xfc\xc7\x9f\xfe\xf4\xa77\xdf|\xf3\xc3\x0f?\xdc\xb4\
-i\x93\xe2N\xc2'A8\xcb\xe1\x87\x9aq9\xddN\
-w\x07kI\x88\xda,BY\xa45-#\x19\x85\xac\
-\xbb7\x97rx3\x8f+\x93q\xe2\xc4\x89\xba\xba:\
-&F\xb3\xa5,\x86\x032{\x22e:K\xf6\xc2\xab\
-R`\xe3\xa5\xfb\x84t_L\xe3:\x9a\x87\xf4!\x85\
-\xf4\x82\x8dV\xbf\x89I \xe5U\xed\x09\x83\xcf\xed\x86\
-\x0d\x1b6a\xc2\x84\xc1\x83\x07[0J\x0b\x93'5\
-+FL\x9c 5eEz\x14\x91t\xbe\x00\xde\xa2\
-\x15\xd0x\xc6\x8d\x1eu\xed\xda\xb5\x87\xfbT\xe8\xcc\x99\
-3\x9f{\xee\xb9\xdf\xfc\xe67\x7f\xf8\xc3\x1f^\x7f\xfd\
-\xf5\x97_~y\xe9\xd2\xa5c\xc7\x8e\xadq_\xf2O\
-d\xa35Q=\xf2\xedpX\xd2U\x9c\x87\xe9%\x08\
-e\xa5\xf1\xd9\x0e\xafj#\xd4l\x11i$K\x19b\
-\xcd\xd0\xcc\x02\x0b\xa5\xd0>\x1d\xae\xd1f/\xc2\xa4d\
-\xae-\xc0\x1a\xe6Z\xea\xe5\xb06w\x87\x04\x93\x11\xb0\
-d\xa6\x982\x8eL\x80P\xdd\xdd\xab4\x0b\x1c\x09\xc7\
-\x96`(\xab\x0d\x91K\xe3\xab\x1c\xf2\x07\x0d\x1a\xc4\xba\
-\xcaj\xd3\xbbw\xef\xea\xcbQ\x83'\x97\xd1\xe0\xaa\xb1\
-j\xabY\xd0\x84j\xed2|\x9e\xcbM\xc2U\x87\xe9\
-\x11\x08\x16\x09x\x8e\x1c9\xb2u\xeb\xd6u\xeb\xd6}\
-\xf3\xcd7k\xd6\xacY\xb5j\x95}\xdc\x13\x08F\xd7\
-\xae]\x8b\xc1.\xc7\xf6\xed\xdb\x89P\x01\x0d\xf2\x8e\x1d\
-;\x0e\x1e<x\xe1\xc2\x05}\xce-\x0d7\xa2\xa7\xf4\
-\x17\xd9V<\x04\xc9\xa6\x89\x08\xf5\x85lBJ\xb1i\
-C\xca\xb1\xf82\x97\x04\xf5\xa7N\x9d\x22\x18mhh\
-`\x7f\xd2h\x0a7\xb6\x19\xf8\xec\x14>;\xc0g\xe4\
-(\xf3\x086\x0b\xda\x165/\xb3\x0b\xd2DYQ\xb2\
-DxD\xf52o\xd4\xa8Q\xac_^\xdb\x9e\xd0A\
-\xee\xd8\xa7O\x9f\xfe\xfd\xfb\xb3\xc1\x93\xb4\xf5Z\x06!\
-n<<^U\x1a\x91\xbd\x06'DJ\xe5\xb6\x18\x22\
-K\xc2\x94I\x93&\xcd\x993g\xe1\xc2\x85K\x96,\
-!\xee\x5c\xb6l\x19\xc2\xe2\xc5\x8b\xe7\xcf\x9f?w\xee\
-\xdc\xe9\xd3\xa7kl\xd9*\xf4\xc9\x04u\x07\x9a\x1b\xdc\
-D\x0d.\xa5\xfdf\xa3;J.\x05\xd9\xa7Q\x96\x19\
-X\x12\xb8W\x84\xf4\xe0\x82\xcf\xe4\x83P\xfa\xc1\xe5m\
-\x07\xe7x\x09\xdf\xe7\xbe\x8b1Z\xd6\x81\xb2^jN\
-g\x0dk\x9bk\xac\x97C2k\x96\x92\xd9y\xe0\x81\
-\x078cp\xc0\xd0\xdfZ$\xe9-\xaaT)\x8dL\
-\xaf+B)\xf6\xf2O\xf0\xe9\x9c{\xcbcYd\xb8\
-j\x9d\xf1\xd9?y48\xd1\x98d\x8e\x8f\x1f\xd9\x12\
-V\x1b\xc1\x92E\xac\xc9\xe2\xa6\x88\x13\xd0h\x1d\xb3\x5c\
-`\xd1c\xb9#\xce\xb9q\xe3\xc6\xe5\xcb\x97\x09%\xbf\
-\xfe\xfa\xeb?\xff\xf9\xcf\x7f\xfc\xe3\x1f\xf5Y\xcf\xb7\xdf\
-~\xfb\xa3\x8f>\xfa\xfc\xf3\xcf\x89G\x89M\xf7\xee\xdd\
-{\xee\xdc\xb9k\xd7\xaea\xafR!z\x09\xcaa^\
-mH\xa3\x93\x09\xdb\x13]V\xab\x04Y\xeau\xd4w\
-K\x22\x08%\x8b \x1b\x19\x1b\xca\xca\xc4\xb7\xa0\xe4\x81\
-MS\xa67\x01\xcc%g\x85K\x97.\xd9\x07\xb3\xd4\
-7\x9a\xaey\x8dP\xa94>\xbbh\x87\x8b\xe7v,\
-xO\x8f\x1e=\xf4\x92Rn\x84\xd2u\xc8#\xb3\x10\
-\x9f\x11\xe03J\x83\xbb\xe0\xb8\x04\x85555\xdc\xd7\
-k\xdb\x19nJO;w\xee\xac\xa7Esm\x827\
-\xcaGY\xe0\xd3\xb9\x87A\x82P\x12B\x19\x9a;&\
-\xa5\xc0\xa0\x11\xa6\x10\xa3\xcc\x9b7\xefW\xbf\xfa\xd5?\
-\xfe\xe3?\xfe\x97\xff\xf2_\xfe\xe5_\xfe\xe57\xbf\xf9\
-\xcd\x13O<1~\xfcxBm\xfdQ\xa5\x9e={\
-\xd2S\xeci\x86\x9c\xd9\x96*\x88Z\x0ea\xd2\xe4\xc8\
-\xc6\x08\xeb\x91\xd0dg\x0bU\xd5,\xa8\xc4\xf0\xaa,\
-\xe8\xa9\xe0\x01\xbf~\xfd\xfa\xb1c\xc7\xb6l\xd9\xa2\x97\
-\x01\xabW\xaf\xe6\xba~\xfdz\x8e\xfb\xc7\x8f\x1fg\x85\
-em\xe5\xd9\xc7\x98.\x84P\x8f\x97r\xa8r\xf0\xe9\
-\x9c\x8d]K$2\xf6\xfd\x09FR2s\xc7\x06\xcf\
-U\xfa*U\x9a\x8b\xfc\x0a|\xba-\xd0\x93\xe5\x13n\
-Q\xa5~4<Gz\x94\x9a\xf5,\xfc\xb8\xd1\xe0\x83\
-O\xb7\x08_E\x0eSj\xe4\x91mF\xb82\xfe\xcc\
-\x02\xc7l\x0e\xdb\x17/^$\xfad\xe9\xb3\xdf|_\
-\xb1b\xc5\x17_|\x81\x80f\xc3\x86\x0d\x1b7n\xdc\
-\xbau\xeb\xbe}\xfb\x0e\x1f>|\xf4\xe8\xd1\xba\xba:\
-\xc2!\xca2\x83\x85p7/\x08M\xd2\xb1\x04\x81\xa4\
-ko\xd2\xc2\xf4\xd5H,\xf2\x89\x942\x13JJ/\
-B\xbd\xf0\x0d\xcd\xe1\xb5\xad\xa0L\xc1\xa8\xfa\xa0\x89\x0c\
-\xf1\xfdpxU\x8e\xb4R\x1a\xc3k\xf3\x91\xbePn\
-\xc7\x82\xeb\x10\xbb\x8c\x1e=z\xc4\x88\x11\xc4\x85\xb8\x91\
-<\xa9\x142{\xe4\x9c$\xc1\xa7\xb3\xe0\x99\xe1\x00p\
-\xc1}?3\xe7-\xafm\x7fh\xb0M\xb7Z\xa8\xa6\
-\x8aP/\xac\x83\xa1\x12\x99!J\x0a\xe4\x90R\xb9F\
-\xa8qV\x09\xc8\x1a^\xc9\xcd\x82\x18\x9aXs\xf2\xe4\
-\xc9\x8b\x16-Z\xb6l\xd9\xe3\x8f?\xbed\xc9\x92\x85\
-\x0b\x17\xea/\xc8\xeb=(\xc7\x09\xbd\x0a\xb5\x15\x01\xb8\
-W2\xa9\xb9\xc5\xcbH\x1a\xe44v\x8dpV\x8d0\
-\x1aB\xc9\xb4A\x88\x99\x19\xc5\xed\xdb\x10\xdd\x88H\x94\
-X\xf3\xd0\xa1C_}\xf5\xd5\x9f\xff\xfc\xe7\x7f\xff\xf7\
-\x7f\xff\xb7\x7f\xfb7\xae\x7f\xfc\xe3\x1f\xb9\xbe\xf3\xce;\
-k\xd6\xac9y\xf2\xe4\x9d\xd4/\x1d\xab\x8f\x10\xca\xa0\
-\xdc\x90P)\x1b#TJ.B2\xd6n\x8e\x90y\
-4h9\xad:}\xfa4\xcd\xbbv\xed\x1a\x1a\x99U\
-\xa9R:z\xde\x0d\xafMa\xfe\xe9\xed\x1c\xd2d\xa2\
-\xdc\xd0\xb1\xd1\xb0\xdats\xb0F\x15/\xfe\x93\xc2\x86\
-($S\x99&\x99\x06G\x94\x0cA\xcf\xda%\x88A\
-\xbfs\x7f\xd1\xf0\xd6\xad[\xc4\x94\xa7N\x9d\xda\xbe}\
-\xfbg\x9f}\xf6\xd6[o\xe9=(\xc2\xe7\x9f\x7f\xbe\
-w\xef\xde\xfa\xfazV\x95\x86\x86\x06{\xd9\xc9j\xc3\
-vL\xf1V.54\x83\xb5\x0b\x94\xc4\x03\xf5\xb2\x1c\
-Y\xad\xd5\xb5\x058wK@v]oD\x06\xedG\
-\xa9\xc1P+\xf9\x99\xfb\x1b\xbb={\xf6d\xff\xb67\
-\x10\x0c\xa8\xfa,4\x04 YJ\xc3\xf4V*mS\
-\xe1\xb0|\x0c\x1c8p\xca\x94)\xb5\xb5\xb5=z\xf4\
-\x90\xeb\x14\x87>\x0a\x9f\xce\x119G\x944p\xd6{\
-\xf7\xee]\xbe|\xf9\xc4\x89\x13\x9c\xc9\x10|F;C\
-\x83\xf5\xa8\xa8\xe5\x9a2\xc9j\xaap\xb6yH\xa9\xdc\
-B\xc8\xd2\x085\x92\xb92\xb6\x906n\x12\x1ei\x1c\
-u\xd8\xb0a\xb3f\xcdz\xea\xa9\xa7~\xfe\xf3\x9f?\
-\xfa\xe8\xa3\xfa\x9e&\xbc\x97\xac.\xee\xefv\xea\xc9\xa7\
-G\xd65\xdd\x94\xabn*% \x9bR(\x19\xe23\
-R\x96\x22\xad\xc9\xc4\xee\xa5\xa4\xab)A\xc9\x12Q%\
-\xae\xe1\x8d(+\xc4\x96B\x90\x83\x1d8p`\xfd\xfa\
-\xf5+V\xacX\xb9r\xe5\xda\xb5k\x91\xc1^\x91n\
-\xd8\xb0!|9\xaa:\xc3\x9a3\xefR:V\x1cA\
-\x84J!\xbd\xeen#CRG\xb5\xf3\xe7\xcf\xb3U\
-T\x83\xd1*\xcd\xc5\x1e19\x98\xe4B\xa4\x0d\xacx\
-\x84\xf3\xd0$\xcb\x8a \xa0\xe9\xdc\xb9s\x1fG\xf8\x8b\
-\xa1U \x19\xfd\xa6\xc6\xbf\x10*\x1b\xe23\x1c\xa1\xe6\
-\xfb\xef\xbf\xbf~\xfd:\xfb\xe9\xae]\xbb6o\xde\xbc\
-i\xd3&\x16:\xfd\xe6\xbb\x96>\x16\xbd-[\xb6\xb0\
-\xdb\x12\xa7\xb2<\xaaT\x9b\xc3\x0aLD\xcbr\x8a \
-?\x09\x91&\xad\x07\x94\xc2\xa7K&*e\x03\xa2\xc1\
-1\xa4l\x19\xe5\xf0fE\xa2\xc3\x87\x0f\x1f5j\x94\
-\xde\x08\xaa\xd1\xa5\x8cH\x93\xddS%n\xa0\x9a=\xbe\
-e\x86Cm\xaf^\xbd\x88GK\xf9\xeb\xf9\xa5\xcc\xab\
-z-\x94\x94^P\x03\x9e\x8a\xbf\xb2\xcb\xb2\xdd^\xba\
-t\x89\xc3\x9c\xcfk\x7f\x98\xe5p\xad\xa41\xe9\x1eI\
-iH\xa9\xeeDX\x96\x04#\xd4HN\xacsH_\
-:D\x99\xfd\xfb\xf7\x9f:u\xea\x92%K\x9ex\xe2\
-\x89e\xcb\x96\xcd\x993g\xe4\xc8\x91\xbd{\xf7V\x0c\
-\xcaq\x02\xe8\x97\xea\xf7\xed\xce\xa1J\x18sb\x1a\xae\
-`\xca\xd6\xa3[\x18^\xdb\x14\xb2\x8c\x8ad\x8e\x8c\xd9\
-\x84\x96\x86\xe5\xd2)VX\xd6Ab8\xdc\x89\xe3\xbe\
-\x22Q}G\xc9\x9e={\x88\xea\xecM\x00 \xe3{\
-g\xce\x9c\xe1z\xe7\xce\x1d\x8b\xf62\xefb\xe8v\xe0\
-\xd3\x8e\xb4\x06\xa44\xbc6W\xbf\x94\x22T&\x16\x0e\
-\x86\x82\x09\xadqpN\xce\x1c\x99*U\x8a\x80;\xd9\
-\xc3.|F\xbe\xfb\x81\xd7\xe6S$\x0b\xd2\x0e\xc9f\
-\xcaB\x04\x9c\x87\xbd\xaaJ\x0e\x86\x0b\x18O\xa6C\xc7\
-\xcehl\xa51\xbc\xd6\xe1U\x0eK*\x0b\xacf\xce\
-\xdeD\xa2\x1c\xb0\xff\xf2\x97\xbf\xfc\xc7\x7f\xfc\xc7\x1bo\
-\xbc\xf1\xc1\x07\x1f\xacY\xb3\xe6\xd0\xa1C\x17/^d\
-\xb9\xd3\xebOVH\xda\xe0\x0b\xb7\x03\xea K\xb15\
-R\x1e(\xb9\x08fc\x82\xba&9\x133\x08\xcd(\
-^\x08o\xd1|\xca\x11\x8c\x12\x84\xf5\xeb\xd7o\xe2\xc4\
-\x89\x13&L \x1a\xb3\xbd\x1c\xbcEQ\xe8\x9e=\xea\
-\xbe\x98\xc3E;IU\x5c\xbdieCSYAX\
-G\xc2O\xa7\xb9\xae4\xe2\xb5\x0e\xf5W\xdd\xa4\x08W\
-\xb3\xd1h0,\x86\x8a\x98\x81\xc9\x98q\x98#t\xe0\
-*}\x19\xa0\xa9L:\xdb|\xd4S\xaej\xb9\x04\xa7\
-n\x04\x8d\xfa\xe2L\x92\x5c\x15\x09q}j\xc4k\x1d\
-*\x22\x1a\x8b\xa7j\x08\xd1\xcaN\x14B\xac\xa9\xdf\x94\
-\x7f\xe4\x91G^x\xe1\x85\x7f\xf8\x87\x7f \x12\xc5]\
-k\xfa\xf6\xc5@\xc6\xe9;\x92t\x93\x93@\xd2n\xea\
-Un\xbe\xa4O#K\xaei\xa2\x1a|\x81\x1c\xde(\
-\x8b\xc8@I\xf0\xe9\x5c\xcda\xab\xa4\x14\xa6\xb1\x5c\xd6\
-;-yB?\x9f\xbav\xed\xda\xa9S\xa7\x08@w\
-\xed\xda\xb5c\xc7\x8e\xcd\x9b7\xaf]\xbb\x96\xe5\x98H\
-\x94\x03\x8f\xb9\xa2A)\xdc\x8f\x05\x1a!\xac_s-\
-\xa4\xccDm\xf3\x09G\x94\xb4:!4\x0e\xf5\x11\xdc\
-\x91\x5cf\x9f\xe7\x91\x15\x89\x89\x9e6m\xda\xa0A\x83\
-\xf0XoQ\xa5J3\xc1\xa3\x0c\xafJ!\xff\x04\x9f\
-v\xa4\x8b\x98\x06K\x1eX)\xc1\x0a\xba:\x12\x94\xfc\
-\x89\xe3\xc7\x22@z\xad-\x1aL\x08e\x90\x8d\x19g\
-\x82\x19\xa5B\x99m\x94\xa0s\xf7\xee\xdd,z\x84\xa4\
-\xdf~\xfb\xed\x96-[\xf4c\x1f\xab\xb3\x0c\xa8\xd9\xba\
-jI\x07s\x15\xb5$\xbcF\x84Jd%U\x09H\
-\x0f\xa1\x19\x84\x03H\xd2\x84\xb6\xa2\x1ca\x1cc\xd4\xb5\
-kW\xfd\xc2\x07\xcb\xbd:\x5czO\x223\x15\x07\x9f\
-\xbe\xaf\xa0\xd9\x8c\x86\x22K\xaf*\x8d\x12\xc7*\x84\x22\
-\xdc\x8e\xabB\x0a\xf0\x19e\xc1MQ2G\xd6r\x04\
-\xa1d\x88\xcf(\xdcG\xab\xadI\xc2z(\xc2@K\
-N\x83+\xf6\xed\xdbw\xf4\xe8\xd1\x93&M\x9a2e\
-\xca\xacY\xb3\x96,Y\xf2\xd4SO\xe9\x85\xe8\xa8Q\
-\xa3\x08S\x1e\xcc}q\xbd/\x13tGX\xab\x92\xf6\
-\xe5\xb70\xd4D\xa5\xc05\xd3\xe3U\xad\xc0WT\xa0\
-m\x11\x91\x99\x15\x8c\x1aL\xecx\xef\xde\xbd\xdb\x0eB\
-IN\xfc\xfa\x13\xaf,\xc4\x9f}\xf6\xd9\x9bo\xbe\xf9\
-o\xff\xf6o\xff\xfb\x7f\xff\xef?\xfd\xe9O$\xf7\xee\
-\xdd{\xf5\xeaU\xd5\x93F\xf1\xa8>)\xe5\xee\x16\x9b\
-e*\x8b\xa0\xa6\x1a\xa6\x8c\x84L\xc2{\xf1$\xea\xcd\
-\xe8\x80\x01\x03\xf4C\x1b\xe9\xabTi\x16\xce\x0d\xe3M\
-MJ\x90,\xa5\x88\x92UZ\x03\x8f-O\xb1\xde\xf2\
-h\xfc\xd1\xd8\x08kR\x8cd>\x1c\xca\x15^\x95\xc3\
-\x94\x5c)\xa2U\xcb\xf4\x0f\xba\xafJ$2\xd3\x0f\x7f\
-X\xd9X\xdf\x94UNh\x0f\xfd\x05KJp\xbd\xcc\
-@\xb9f\x06>#\x97e\x026\x8642\x8bPV\
-HX\xa4\x05\x94i\xf1e\xc8\xf0\x15`\x22\xa3\xe6\xaa\
-\x03!>\xc3\x11\xf5Y\x06r5\xf0\xda\xfb\x07\xc6\xc1\
-\x1a\x0f^\x9b\xc2g;\x03M\xbcPn\x89`\xffw\
-\xf7\x1a_\xf5\x94\x13\x1eNb\x97\x86\x86\x06\xa2\x19\xaf\
-\xca\xa7x_,72\xb3\x8e\xa0\x8f\xb2\x04Jl\xdc\
-\x13\xea\xc3}\x92\x12\x8c\x07\x1ex\xa0S\xa7ND\x1e\
-C\x87\x0e]\xb0`\xc1K/\xbd\xf4\xfb\xdf\xff\xfe\x9f\
-\xfe\xe9\x9f\xfe\xf0\x87?\xbc\xf2\xca+\xc4\xa3\xfa0\x09\
-\x8eJA\xeair\xf40\xc8\xc4g\xe7H78\xb3\
-\x0b\xad\xa4P\x9d\xd6$3P\x92%\xd5\x9dS\x12\xc8\
-\x12\xc8\x04\x8e\x84\x9eg\xce\x9c9|\xf8\xf0\xbe}\xfb\
-\x08@\xdd\xd7\xe1%\x1f\x93Z\xb5j\xd5'\x9f|\xf2\
-\xf1\xc7\x1f\x13\x83~\xf9\xe5\x97\xabW\xaf&\xb7H$\
-\x8a\x9e\xf5Z\x7f\xe3\x0e\xc1\x8e\xd7\xca\x92P\x84\xe2\x06\
-\xea\x970M$\x14\x01\x1b\xfc\x81\x9d\x0c\x22?\xa9R\
-\xa5e\xa4=\x167\xcbTz\xa9J+`\x89\xee\xda\
-\xb5k\xef\xde\xbd{\xf6\xec\xc9S\x8c\x86\x15F\x8b\x8c\
-\x0c\x00\xd9\x92&0\xfe\x9a\x82\xf0\x9aF\xbb\x00WU\
-\x8b\xdc\xabW\xafA\x83\x06q;\xd6IoTvh\
-F\xe7\xce\x9d\xd9\xc8X\xbe\xac\xe5Q\xaf\xd3\x14\xeac\
-T\x0a\xb3\x10\xe5r\x0d\x91e\x88\x8c}\xa2E\x94o\
-\xfde\xa4\xb8\xaa\x1b\xba\xd2t\xe6\xb8H\x07\xda\xa9\xcf\
-\x1d\x05~\xa3\x1f^\xab\xd7\xeaE2\xb1\xf9\xc8\xb8\xf5\
-P\xbf\x0d/\xd5J(\x03L\xf4\xed\xdb\xb7O\x9d:\
-u\xe4\xc8\x91\xfa\xfaz\xc2\x1aM\xb6\xbb$\x94\xd2G\
-7\x12\x89\x99\x09\x86%#\xbd@\x99\xac\x19\x0e\xba\xcf\
-\x80s\x04b\xe4\x91\xc9E\xae\xa9\xa9\x193f\xcc\xf4\
-\xe9\xd3\x17/^\xbc|\xf9\xf2\x9f\xff\xfc\xe7/\xbc\xf0\
-\xc2\xf3\xcf?\xff\xf4\xd3O?\xf2\xc8#\xc3\x87\x0f\xe7\
-\xd4\xab\x18TET\xa7Z.\xa4,\x85&\x8d\xa9\x19\
-|\xa2\x8d(\xa5B\x8d\x0f\x96\xf4\xd1\xa0\xb5\x12Xd\
-\x09.\xf7\xec\xd9co@A\xbf(\xfa\xce;\xef|\
-\xf5\xd5W\x84\xa7\xe7\xcf\x9f\xd7/\x8a*\xbe\xf4\xf5f\
-Am\xc4\xb5\xc7\x1dTk?\xac\xb7v\xb6~\x04\xc2\
-qVm\xa6!)Be\x84r\xa1\xc9\xf9\xaaR\xa5\
-\x14\xcc\xa3\x00\xa7\x0a\x93!d\x09\x9f\xae\xd2LX\xac\
-\x08\x0aG\x8e\x1c9~\xfc\xf8!C\x86t\xeb\xd6\x8d\
-\xa5^\xb1#\x14\x19XeE\x0f~2\x13\x01\xca\x92\
-\x0dW\x09\xdf\x7f\xff=\xeb\x9e~\x01C\x9a\xf2\xc3\xa6\
-F@<b\xc4\x08bb\xfb\xa4;\x8d\xb16\x17B\
-\x0dnA\xb3)be\x85\xf4!>\xa3\x15cR\xa6\
-`\x94a\xc2E$\x87\xcdE/\xbf\xf1\xe9\x80\x22\xbd\
-jM\x87;\x0a\x1c\x88\x03\x1c>\xc4\x95\x07\xa6x\xef\
-\xda\xaa\x83\x0c.W\xc5\x0amUg\x93p#\x1e\xd4\
-s\xe7\xce\x1d;v\x8c\x90\x85`\x94G\x84\x7f\xe8]\
-\x08\x14\x07.\xf8\x00\xf8D>\xc9@\xb8fK\x80\xb4\
-^\x9a4\xf8\x1bq\x7f\x8f\x1e=\x88>\x19vB\xcc\
-\xee\xee\xd7\xe4\x17-Z\xf4\xe2\x8b/\xbe\xfe\xfa\xeb/\
-\xbd\xf4\xd2\xc2\x85\x0bG\x8f\x1e\xad\x0f\x90\xe8\x97\xe5y\
-\xb6\x93\xb7d\x0f=d'\xce&o\x944%\x1f\x9f\
-Q\xb4\x94\x90\x81+\xe4-%\x83\x92-\xc3W\x11\xc4\
-\xd0>#\x80\x5c]e\x80\xf0w\xf7\x9bI\xb7n\xdd\
-\xbax\xf1\xe2\xa1C\x87\xd6\xad[\xf7\xc9'\x9f|\xf4\
-\xd1G\x5c?\xfd\xf4S\x02\xd3/\xbe\xf8\xe2\x9bo\xbe\
-9p\xe0\x80~QT54\x093N\xccZWW\
-G0\xaa\xafO*\xb1\xa0Q\xc8\xde\xfa\x85\x81a\x1a\
-\x09 = \xab\xb3\x10fI\x90\xa6J\x95\x12\x09=\
-'q\xa3\x02.\x14\x1a\x08\xe9\xab\xb4\x1e\x16jV\xef\
-)S\xa6L\x9d:u\xf0\xe0\xc1\xac\xde\x99aFq\
-\x8a[\x92\xcb\x92\xa5U\x8bE\x8fs\xf5\xe1\xc3\x87w\
-\xee\xdcy\xe6\xcc\x99\xf4^V\x06X\xbb:w\xee\xcc\
-F6m\xda46/\xc2\x890|\xd2\xe2\x06\x92\xed\
-\x0a\xeafx-\x04\xb9B\xb2\x94\x11\xa1\xde\xdd0\xc1\
-\xa7[J\x99\x82Q\xd7\xb5\x8c^e*\xd3\xf8\xbe:\
-\xbc\xea\xbe\x82'\x84pg\xdc\xb8q\x1c\xe0\xf4\xab\xf4\
-\xf6\xcc\xb4+\xff'\xf8c\x8c^U\x16x<X&\
-\xf4s\x04\xeb)\xca\x223XdfC\xe7\x89d\xbb\
-\xaa\xe6\xe4X\xe3\xe0\xa6\xf0\xb0\xfb\xd3S<\xb4s\xe6\
-\xcc\x991c\x86>\x15\xfa\xcc3\xcf\xbc\xf0\xc2\x0b\xcb\
-\x97/\x9f?\x7f>Gj\x02P\x9a\xcaQAoO\
-\x81\xda4b\xeeV\x8d\xb7\xc8$3\xcb\x95\xcb\xd3\xab\
-y!>#0\x8e\x8aD\xc9V\x12\xddQm@\xb0\
-\x9e*\x12\xbdy\xf3\xe6\x85\x0b\x17\xf6\xec\xd9C\xd0\xb9\
-v\xed\xda}\xfb\xf6q\xa8 \xf4$\x88\x04\x16\xe2\x1b\
-7n\xdc\xbbw\x8f\x22\xbe\xae\xd2`TY4\xf5\xe1\
-\x07\xdd\x1a\xa5\x04!3\x08\xe5&\xc9\x1c\x22\x94\xd2K\
-\x80P\x0fJ\x1ah\x9a\xdb\x9d*U\x84<J\x90\x94\
-3\x0b%\x9dUb&AD\xc9*-\x86\x85\x85]\
-\xa6\x97\x83\xd5\x9e\x01wS\x91<\xd1%\x0e\xb2\xcc\xb8\
-\xbaI\x8b\x17\x1f4nO\xf0\x9b\xc2\x0f?\xfc\xc0\x02\
-x\xdeQ\xe6\xdfX\x0aa\x15\xad\xa9\xa9!\x1e%\x10\
-\xa7\xd7h\xac\xcb\x86\x94v\x15.'A\xb2\x94\x99\x1d\
-\x17fS\x84Be[@\x99\x82Q\xa0c\xb6\xe8\xab\
-\x03\xc9\xa8\x94\xec7n\xc4\xda\xac\xdbe\x86\x07f\xc4\
-\x88\x11\x04C\xfa\xa5]\x0b\xd14\x02\xc5Q\x0d\x99h\
-L\x84W\xe5PY\x22\xd1\x86\x86\x86+W\xae\x10d\
-\x10m\xf8\xbc\xf6\x87\xa7\x97\xd5\x81\xa7\x85gF\xaf\x81\
-A\xfatSA]\x10^\xe5PA\x90,%H)\
-\xa4\x09\xcbJ\xcf\xbd\x18g\x8e\xcb\x0b\x17.|\xf1\xc5\
-\x17\x7f\xf7\xbb\xdf\xfd\xfe\xf7\xbf\xff\xd5\xaf~\xb5`\xc1\
-\x82Q\xa3F\xf5\xed\xdbW\xefA\x99\x08,]\xec\x9a\
-\xfch^e\xcdQKD\xa5\x84W\xe5\x94>\x91\xe5\
-\xc02\x00\xc9R6\x89\x8a\x08\xaf\xca\xea\xbe\xa1\xdc0\
-\xcb\x9d\xf3\xfd\x11\x05\x90\x09C\x894O\x9d:u\xf0\
-\xe0\xc1\xad[\xb7\x12\x89\xea\x0f\xd6\xe9E&6*h\
-\xa8\xb6\xd2\xc1\x07\x98\x08\x1e\x81\xdeM\xfdA\xed\x16T\
-\x9e&j\xa4\x92\xa0\xfe\x02\xb2\xcf\xcb!\x03\x9f\xa8R\
-\xa54\xf0\x19\xdc\x89gD\xcec\x0f\x9a\x902\xd3\xaf\
-\xaa\xce\xd6V0\xfe\xc4\x88\xdf\x7f\xff=\xb3@\x92)\
-`=\x17\xd1t\x840\xfe!^\x9b\x9aA\x03=`\
-\xa9\xdf\xe9d\xc1\xe4\xbe>\xaf\xbc\xa8%\xac\xa8\x84\xa1\
-\x0f\xb9\xef\xab!\xa9\xacdi\xcb-n\xae[\x09\xa1\
-\x0c\xce0!L\xaaNP2\x22,\x15\xe1\x8b\xe5\xe3\
-\xf3\x9aO\x99\x82Q\x9a(\xff\x90\xccU=t\x03\x92\
-\x90\x18\xa5(\xa4\x8f(\xd1\xac\x03\xd1Qf\xe4\xc8\x91\
-\xc4g\xd1{\xf5L\xdc\x90$H\x96\xd2h2K\xf0\
-p\xf2\xd8\xe8\xeby\xf5\xf7o\xbcQ\xfb\xc3\xddyh\
-\xb9#k\x04\x8f\x87f\x9c\xf6\x10\x10\x93\x94\x018\xdb\
-\xc66+\x99\xb8\xb3CI\xe1-rx\xadCI]\
-}I\xe7l<\xa5\x0c{\x8f\x1e=F\x8f\x1e=\x7f\
-\xfe\xfc\xa7\x9f~\xfa\x89'\x9e\x98;w\xee\xf0\xe1\xc3\
-Q\xf2$\xebU\xa8\xab#)\xee\x1ed\xff$S\x83\
-\xf4\x11\xaa\x5cxU\x0e\x0a\xaa\xac\x09\x99\xa4\x0b\x8aB\
-z#4\xb0[\x14\xb9Q\x88\xec\x81\x0e\xb2p\xb3\x92\
-25\xf8\x86\xe0\xb8r\xe6\xcc\x99\x1d\xdb\xb7\x7f\xfa\xe9\
-\xa7\xef\xbe\xfb\xee\x07\x1f|\xb0z\xf5j\xa2\xd2\xeb\xd7\
-\xafc\xef\xabh\x1d\xd4\xc3\x8d8\x11\xe1\x0f4\xc3k\
-\x1dj\x18\xf8t\xabQU\xaa\x13\xa4,\x84\x194i\
-Y\xa5J\x1a\xdc&Y5r4\xcb\x8b\x22c\x92\xa1\
-FI\xe1UU\xf2aId\x85g?\xed\xd6\xad[\
-\xe7\xce\x9d\x91\xb5\x9e\xfbQs\xc8\xb2\x14|\x81\xd4\x14\
-\x98\xc0\xed\xb8\xb2\x8b\x01\x82l:\x0am\x07\x5c\xd5*\
-\x90\x06\x94\x0c)\xa4,\x8e\xb7\xcb\x15\x97\xd2\xb0\xdb\x85\
-\x98}\xcb(S0\xaaV\x82\x9eX@\xe9F\xb2\x11\
-YF\xa0\xc7\xc3\x0a\xe5\x86\xb8:\x1a\xf1\xda\xca\x80\xf6\
-\xf0\xa8tr\x7f=\xd2\xde\x0c\xa9\x9d\xa0d\x89h\xe8\
-B\xc1\x90FW\x1e\x18\xc2\xc1\x0b\x17.\xec\xdd\xbbw\
-\xeb\xd6\xad\x84\xa4\xe5\x0cF\xb9;\xa1L]]\xdd\xa5\
-K\x97\x88~\xa2e\xbaH\x17\x0c\x8d\x8c\xa6\x1e\xa4\x94\
-\xbd4BI\x97\x99 %\xf8\xb4{\x17\xcbj\xd5\xa7\
-O\x9f~\xfd\xfa\xf5\xed\xdbWa\xa87\xca\x15\x97\x80\
-%S\x13\xddQ2()hF\xd8\x12)#\xcc@\
-\xc94*+\xbc\xca\x11jT\x89!\xbd\x94I\x0b\x82\
-\xdc(iPDz\xaeL\x0a\xb1\xe0\x95+W\x98\x97\
-\xa3G\x8f\x1e:t\xe8\xc0\x81\x03\xb8\x07l\xdb\xb6m\
-\xd5\xaaU\x1f;\xd6\xacY\xd3\xb6\x91(\xe0\x03\xfa\x85\
-\xb6\x8b\x17/\x12\x0a\xd3\x18\xeb\xa3\x91t \xab\x0bi\
-\x92\x01\xca\xe1U\xf9X=2\x90\xa5\x81F\xf7\x0a\xd7\
-\x22\xe6=)P\xa5J\xc9\xe09\x9c\xaeu\xae\xd3\x9b\
-9\x90;\x85x\xb7+\xe0\xabUZ\x0cCJ\x0c:\
-h\xd0\xa01c\xc6\x0c\x1e<\xb8K\x97.Z\xbd\xc9\
-r\x8fu\x82YJ\x00\xc9\x5cC\xd0\xf8\x02\x0eg\xd8\
-\x88\x19H\xce\xb4)3r\xb6p\x05\x03\xd7\x95d\xd3\
-T2DfB\x1a\x19\x9b\x10!\x1b\x08\x8b\x80\xcf\xce\
-\x15\xe4j\xb9\x12Z\xb3k\x94i\x09f\xe0\xd8\x84\x80\
-\xb6\xaa\xb9\xea\x09\xb8\xce&\xdd0\x8d\x91\xd6\x14A\x95\
-T,\xe1\xfc\x81\xf5\x1aP\x9a\xbeIJ1V\xe5,\
-\x94\x0d\x0d\x0d\xa7O\x9f>s\xe6L\x99?\xe0B\xcc\
-\x1d\xfe\x10\x01l\x99\x10\xc5\x1b#\xcb\xf0\xda$v\x8b\
-P@\x8f\x0c\x0f\xe4P\x12\xbd\x1b\xa1\xc66\x98}!\
-2s\x8b\xf7B\xb7\x00\x9f\xcea\xf7\x92 \x94\x95&\
-,.9\xd3\x98,\x1e+-O$\xadN\x92I\x0b\
-\x5c.\xfb%\x87\x93\x1d;v|\xf2\xc9'o\xbd\xf5\
-\xd6\x1bo\xbc\xc1\xf5m\xc7\xfb\xef\xbf\xff\xf5\xd7_\x13\
-\x9b\x9e?\x7f\x9e0\xb4\xc9_\x90o.\xd4\x86\x07\x12\
-\x07\xdfr\x7fr\x93\xf6\xf8\x8c\x02\xddiC4\x14\x22\
-\xd4H\x86P\xaeR\xa5t\xe4\xd5,\xb0\xc7\x8f\x1f\xe7\
-\xd4\xadS\x96|[\x82!\xfb\xb4\xa7Y\x96\xcc\x8cL\
-\xa5PV\x15`<\xd9hz\xf4\xe8\xa1\xb7\x0cl7\
-h\x18\x22\xe6\x05\xa2\xb1\x22KH\x8e4\xc51\xb3J\
-\x18\xff\xc4\x09\x5c\x1f\xd9\xdf\x01\x99\x1dM-\xd4\xee&\
-\xd9[\xe7\x90Rx\x95CI\xd5\x09R\x8a\xc8R\xb8\
-\x0a<^\x95\x1b\x16)i\x80\x94-\xa0L\xc1(\xa3\
-\xc6\x0e\xa7`\xd4\x9a\xae\xac\x10\xf5'\xc2\xe7\xdd\xcf\xd0\
-\x0b&\xc9>\xde\xe1\xe6\xbdUn\xed\x06\xa6\xb1*\xa1\
-,\x90\xcc\x95\x01\xe7\xd4\xce\x95\x08@Ye\x80\x98\x8f\
-\xa5a\xd4\xa8Q\x13&L\xe0\xd8\xaa7\x91\xe8\xad\xcd\
-\x22lp\xa8\xcf\xa4\x88\x01Y\xee\x19L\x1eB\x1bd\
-\x11\x1a\xd8[\xcfd\xa4r\xb76\xd9\x04\x11\xca\x11\xb2\
-4\xd0\xb8[%X\xae3lD\xca\x10\x94\xb2\x0fI\
-k\x84/\x13T\xeb\xee\x96g\xac\xae\x817\xcd\xad\xc8\
-\x82\xa7\xef\xce\x9d;\xfa\xbe\xfa\x95+W~\xf4\xd1G\
-z\x09*>\xfd\xf4\xd3\xb5k\xd7\x1e>|\x98\xa3\x0b\
-\x96Q\xb0\xd8V\xa8Uj\xb6\xda)=\xb8\x86{\xbc\
-\xaa}\xc8\xac?lI\x95*\xa5\xc3\x93\xc5\xc9\xed\xc8\
-\x91#\xfb\xf6\xed\xab\xab\xab\xd3\xe7\xf2\x9d\x9b\xc7\x1e\x95\
-\xa94\xc2,\xc9\xce<\xbb\x120Y\xfa\x9f2\xac{\
-\xc4\xa0l1\xfa\x19\xbd\xc6D+\x89\x88\x92!\xae\x82\
-\xc6Q\x8dPn\x88/\xe6\xf0\xaa\x0e\x82%\x9ah\x0a\
-\x7fcU\xb7\x9d=lv\xba\x91\xd2\xa4\xf1\xd99\xd2\
-\x1d\x0fm\xd2\xf6i\x98\x05/5\x9fr\x04\xa3\xf4\x90\
-!\xfb\xfe\xfb\xefyVIF\xcduc\x92\x8d\xb7H\
-\xe1\xb3\x1d^U\xd9\x10\x09\xe9W\xb6[3U\x85p\
-N\xd8\x88\xd7\xe6\x86\x9d1g\xd1\xf4\xaa\xb2@0\xda\
-\xabW\xaf\xb1c\xc7N\x9c8q\xe0\xc0\x81\xf4Z\x0d\
-\x03o\x91\xa2P\x96\xe67s\x96Q2\x98\x16b*\
-i\x02\xc8\x06d_\x84\xf0\xee\xae\x99\x05\xdb\x99F\xc6\
-\xba\x11Hi\xa86\xc3k\x03|1\x87W5\x85\xb7\
-\xce\x81F\x95+\xa9\x01\x91%J\xa6\xfe\x07\xf7\x07\x08\
-\xce\x9d;\xb7}\xfb\xf6U\xabV\xad[\xb7\xee\xe0\xc1\
-\x83g\xce\x9c9\x7f\xfe<\xe1\xe9\x05\xc7\xd5\xabW\xdb\
-\xfcmh\x08-\x91\xc0-\x5cc\x0b\x8e\xb0z\x11\xe1\
-\xf3\x1c*\x1e\xe23\x1cQ\xd2\x97\x0fj\xf0i\x87W\
-U\xa9\xd2R\xee\xdd\xbb\xc7\x93E<\xca\x03\xc5SV\
-(\x185\x8a{\x9d\xca\xea\x19\xf1\xaa\x1c\xa1&\x9d\xfb\
-\x13'\x195\x87d\xae\xac\x81z\xc6\xc1\x994\x12*\
-\xadH$H\x96 \xd2\xf5t \x84R\x97/_>\
-u\xea\x94>\x05\xe7\xb5\xb96\xab\xa9\xae\x97\xc5p%\
-2pc\xe0\xfb.3\xd9C\xa8\xcc\x84,+\xdb\x02\
-\xca\x14\x8c2|\xfal\x0d\x8f\xab:\xe3\xba\xec\xc7N\
-\x1a\xa1\xa4\xe1\xb5\xf73\x04g\xdd\xbau#>\xeb\xd2\
-\xa5\x0b\xb2\x94-\xe8Zf\x11\x0dc\x84\xcfs\x90,\
-g0J#\x89\x87\xbav\xedJ\x18\x0a\xdd\xbbw\xa7\
-\xcb\xad\x99G\xcaF\xb8P3\xc1\x22Q]\xd3\xc6\xaa\
-\x01B\xb9\x08\xd1\xd0\x89\xa8\xaa4*%\x9b&\x8dE\
-2IE\x1f\xdaB\x95\xa8~\xc3ks\xb3\x1c^Y\
-\xa4x\xe2X\xb3\xea\xea\xea\x88>\xb7m\xdb\xb6z\xf5\
-j\x22\xd1c\xc7\x8e\xe9\x17\x89x\x12\x05'\x16(\xde\
-\x9e\xd6\xa3s\x11w\x89Z.\xa4\x14^\xe5\x88\x92\xa5\
-\xd0\xde\x1d\xa9R%\xe4\xbb\xef\xbe\xbbv\xed\x9a\x8es\
-E|\xaf\x90'\xeb\x89\xf0\x89*\xad Y;\x1c\xc8\
-6\x11^\x15`\xb9v5\x92\x029\x8dd#\xad\xe9\
-(h\x09.G\x18\xca\xc2^__\x8f\xd7\xb1\xb4\xd2\
-/\xdb\x041\x90\xa0k\x88\xe9C\x94\x15\x91\x0c\x81\xc3\
-\x1b\x05\x90\xabk\x08\x96\xbaJh\x19\xe5\x08F\xd9\x84\
-\xf4\xe1\xc5\xb3g\xcf\xb2A\xa6\x9b\x9b\xee\x83\xba\x0d>\
-\x9d\x8f\xec\x85WU*\x04L}\xfa\xf4\x19\xed\xe8\xd7\
-\xaf\x9f~\x89\xbbP\xbf\x9aDc\x02\xc8a\xf7CY\
-\x98\x99\xae\xe5\x84;>\xf4\xd0C\xc4\xdf\xa0\x97\xc1\xae\
--\x09\xca5d_\x0a\x18S\x8f09\x14\x0c_ \
-\xc0g\xb4\xc58D\x83lH\x9fy\x8b&\xef\xeb\x9a\
-\xe6\xf1*G\x944d\x09>\x9d\x8f\xc2Pb\xcd[\
-\xb7n\x9d9s\x86\x18\xf4\xf3\xcf?\xff\xf0\xc3\x0f?\
-\xf9\xe4\x93\x0d\x1b6\x1c?~\x9cH\xb4\x9c\x87\x13\x83\
-!*~_\xf5(\x1aa\x1b\xd8B\xfdm\x92t\xc1\
-\x16WU\xa5J\x1a\xbc\x9a\xc7\xed\xde\xbd{:k\xa1\
-q\xde\x9a\xe7cM\xba\x9c\x8a\x80O;\xa2d\x95L\
-\xc21\xd7v\x00\x85\x86\x0e\xe34\x91^\x96\x85(\xc5\
-\xa6\xbd\xc1\xe5\xac\x0d\xc8\x96\x0c{\xed\xc6\xc3c\x1a\xbb\
-\x82\xebG^G\xa4\x11^\xd5|\x18|/5\x9fr\
-\x04\xa3D\xee\x04\xa3\xc7\x8e\x1dc/\xbc~\xfd:I\
-\x946(\x11\xad\x19\x88J\x83>v\xef\xde\xbd\xb6\xb6\
-v\xde\xbcy\xd3\xa7O\x1f4hPg\xf7u\xf7\xe8\
-\x85\xb7k#*d\xe8\xe8\x17\x1eI7\xd5S\xe7\xdb\
-\x09\xca\x0aA\xe3\xf3r\xb8\x0a\xf2\xf0\xa6\x01n\xb5\xc9\
-\x0b@\x0d_\xc6\x91\xae\xcd\x1b9\xbc*\xa0\xd0\xdd\xbd\
-\x14\x90\xa9\x14\xae\xee<B%\xb2\xebe#\xaePA\
-\xacTD\xa4W\x12x\xb28(sh\xe6A\xdb\xb7\
-o\xdf\xa6M\x9b\xbe\xfc\xf2\xcb\x8f>\xfa\xe8\xd3O?\
-]\xbf~=J\x22TV._\xac#(\xa5\xd7M\
-\xa2J\x0c\xaf-\x0dF\xc9KU\xaa\xb4\x118a\xfa\
-\xb1\xd2#),\xa9\xac\xd2\xb1\x22-(\xfbS\xc0\x1e\
-\x7f\xb7\x12x\x18+\xdb#\x94\x1b\xe2\x8drxmQ\
-dV\xa2q\x19\xa0_\x9d:u\xea\xd7\xaf_\xef\xde\
-\xbd\x1f~\xf8a\xf6Y\x94\xae7\x8d\xa3!\x01KC\
-I\xe9\xd3\x96\x12\xb8\x86(\x0b\xac\x86\xe2D\xa5\x9aK\
-\xf9~L\x7f\xf9\xf2\xe5\x0b\x17.\xdc\xbe}[\xc1\xa8\
-QJ\xeb]\x1f=^u?\x80\x97\xf4\xec\xd9s\xdc\
-\xb8q\xb3f\xcd\x1a;vl\xaf^\xbd\x1et\x7f\x81\
-\xa6\xd0sR\x9cR\xfa.\x1b7N\x1d<P\xce{\
-\x1b\x1f\x00k\x92]%\x84\xc82\x8d\xab\xc9\xa3\xa1\x13\
->\xbb4\x22{\xd5\x00>]\x98\xb4M\xd8\x85\x10\xe5\
-\x0a\xafJ\xe1\xb3[\x81\xd5\x135\x8c\xed\x90H\xf4\xec\
-\xd9\xb3\xdb\xb7o\xff\xe2\x8b/\xfe\xfa\xd7\xbf~\xf6\xd9\
-g\xdf~\xfb\xed\xde\xbd{O\x9e<\xc9\xa3w\xe7\xce\
-\x9d\x8e\x8dD\xddxg\x0cx!}\x88\xba\xack\x1a\
-\x15w\x03S\xea\x08G\x96\xa5\x17\xacR%\x0d\x1e(\
-\x17r\xbe\x9c\x01Y\x89w6\xdf\xcdT6$\xad\xf9\
-\xc9\xc2P\xd8f\xaa\xe1\xcdD\xc6-\xc0\x97w()\
-}\x87\xa3&\x01r\xe9\xe1\x84/\xd3\xa2^D\xa5\xd2\
-wT\xcd\xe0\xd3\xcd\xa7\x1c\xc1(\xd0\xc4\xbf\xff\xfd\xef\
-\x84\xa4\xe1v\xa8\xa6\x17\x1f\xc7\xcc>{)\x85\xb2\x5c\
-\xad-\x1f\x91\xb6\x82\x96?\xf0\xc0\x03\xdd\xbbw\x1f0\
-`\xc0\xc0\x81\x03{\xf4\xe8\xa1HT\xe0@\x02\xd9\x17\
-\x08\x90\xd2\x19&H\x19\x91\xa97%\xe3lC]\xa8\
-\x862\xa0\x0eZ\x03\x8a\xcc\x8b\xcc4&^\xe5\x8aG\
-\xc8\x8c,\x13\x9aKX\xb0\xc5~\xe2\x5c,\x8fH\xaf\
-d\x8b\xa1\x06\xcd\xa0j\x03k6\xb2\xf4\x5c9\xd79\
-\xab\xe4\xf7\xe59\xe6\x9d?\x7f~\xcf\x9e=_\x7f\xfd\
-\xf5\xa7\x9f~J<\xbaq\xe3F\xc2P}B\x14K\
-\x8a\xa8\xf2\x8eE\x1d\x01\x9fv\x94\xd26\xb3\xb1\xb2\x08\
-\xb8\x84\xe44\xe1-\xa2\xdb\x855DYU\xaa\xb4\x00\
-y\x11.*\xa4\x0c\xc9T\x86\x1420\xbdn\xc1\xd5\
-VB\xe9\x7f\xb20\x08\xec\xb0\xfa\xf9\x9bW\xb9\xf1I\
-\x8f$\x1a\xe1\xd3)(e\x95\x84r\x88\x8a\x17\xa9\xa4\
-l\xd0\x86{\xf7\xee]\xbat\xe9\xda\xb5kaL\x95\
-\xd9\xec&I\xc6%\xf8\x98\xa9U\x22Y`\x80F\x96\
-B6mK\x99\x82Q\xfa\x93\xfc\xd46\xf7\x13j\xeb\
-\x8fd\x09\xce\xb0Q\x80P.\x11\xd5V\x09\xf0\xa8\x10\
-\x89\x0e\x192d\xf0\xe0\xc1\x8aDQZ\xf3\xe8Z\x88\
-4\x96\xa5\xab\x09N\x9d\x81lB|\x86\x83{)X\
-\xe9\xa81\x09\x9b\x84@3\x0c)Cd\x5c:\xbeX\
-Q\xfc\xcd\xdc\xedt\x0d\x95 \x8d\xf0\xf5\xe6cY\x12\
- *e\x14\xd2\xb7\x98\xb0\x01`\xf5#\x10z\xb2\x18\
-\xc1\xdd\xbbw\x89Ao\xdd\xba\xc5\xaat\xea\xd4\xa9\xed\
-\xdb\xb7\xaf]\xbb\x96\x18ToC/_\xbe\xdc\xe1o\
-C\x8b\xa0\x0e\x82\xe4HS\x9c\xd0,\xb4\x97^(i\
-W\xa1at\xf9q)\x9f\xa8R\xa5\x99\xb8\xe0\xd0G\
-\x87\xed\xeaH\xae\xf2d'}\xe8\xa1\x87Z\xf9\x8b\xa1\
-?\x02\x18\x81.\x8e\xf0-\x8f\xf0\x16)x\xfc\x0do\
-\x9a\xc2\x9b\x06\x98R\x05%w t\x5c\xdff\xa5\x80\
-JJ\xd7\xf6FY\x82\xa1\x96\x87\x84z\x09V\x83\x04\
-\xe1\xac20\xfb\x88\xd6l7e\x0dF\xe54$\xdd\
-\x084v^\x1a\x09MbE*\x1c\xdc\x85Ht\xd2\
-\xa4Ic\xc6\x8c!\x18\xc5\x81P\xd2\xcd(:\xd4 \
-\x84\x98RB\x98LF\xcd\xa1\xa4P.\xd8\x82\x08\x84\
-\xa1\xc4(7n\xdc d\x89>\x17Qf\xacI&\
-\xa4IZ\x9f\x85\xcfn>~\x98\x1cJJ\xdf\x5c2\
-\xdb`\xd5F\xb4\xf8.\x11\xaaG#\x00L+I\xdc\
-\x06\xf4;\xf2W\xaf^=w\xee\x1c\xd1g]]\xdd\
-\xf1\xe3\xc7\x0f\x1f>\xbc\x7f\xff~\xfdMy\x22\xd1c\
-\xc7\x8e544`\xd9\xb1\xf3^\x1c\xfa\xe5\xa5\x9c\x1c\
-j2)d`\xc3\xded\x0d!.~\xf0\xab\x1f\x05\
-\x85\x92U\xaa\x94\x0en\x93\xbce\x09\xbec\x0e|^\
-[\x90_[\xb2\x1a\xe8\xd7C\xbbw\xef\xce\x16\xd3\xb6\
-\xf7\xba\x8f\xa0\xe3\x9d:u\xaaq\x10\x8f2\xfe\xc9\xb8\
-g\x8dF\xb2X\xe7\xf0*\x87%\xad\xa0\x092\x06\x97\
-\xefQ\xd2l:\x0a\x1c\x80\xd9\x1f1b\xc4\xe4\xc9\x93\
-\xb9v\xed\xdaU}W\xae5O\x02H\x9f\x89u0\
-\xec\xa9/VB\x1f\xa3\xf1\xd1\x0e\xe5\x13-\xa2L\xc1\
-($k\x7fK\x8f\x8f\xcd\xb5\xefph0\x8f\xca\xa0\
-A\x83\xc6\x8e\x1dKH\xaa\xbfG\xaf^h\x0a\x996\
-\x9bK\xf4\xca\x92 \x94t\xf9\x19D~\x10\x16\x91@\
-\xc8r\xfa\xf4\xe9#G\x8e\x9c?\x7f\xfe\xbb\xef\xbes\
-V\xe5\xc3\x9aaH\x03>\x1d`z\x09idV:\
-\xd1\xe0(\xc9\xb5\xb9Xq\x93[\x86\xefF\x16\xde\x22\
-\x05w\xc4C\xec\xc5\xb6 y\xf7\xee]\xfd,\x9e\xb8\
-\xf3\xb3\xcf>\xfb\xc8\xf1\xf1\xc7\x1f\xff\xedo\x7f\xfb\xf2\
-\xcb/7m\xdat\xe2\xc4\x89\x8e\xfa}\xf9\xe6\xe2\x87\
- 7\xf5\xbe\x93\x0e\x19DH/\x03!}\x0bPY\
-\xbb{8\xd4.\xbfJ\x95\xe6!_\x02\xe46\xf4\x22\
-_i\x0e\x22\xde\x07\x1f|@_\x9c7r\xe4\xc8\x01\
-\x03\x06\xb0\xcbx\xd3\x9f\x18\x0f<\xf0@\xcf\x9e=\xd9\
-a\x19\x04\x06\xc4\xdes\x15!Y2\x0aO\x8dF\x18\
-|:\x87\xd7\xe6`\x1f\xf7\x19\x1d\x04\x1d\xef\xd1\xa3G\
-mm\xed\xf4\xe9\xd3\x09F\x09\xc4Q\xaa_\xbe\x89\x0e\
-g\xeb\x89\x92\x99d\x0e\x8e\x94\xa0d\xba\x1e\xcb2Z\
-3>\xe5\x1bY7D~.%#\xa4;S\x08\x15\
-\x01\x9f\xaex8\xafp\x82\xe9\xdd\xbb7W\xbd\x16\x15\
-t\xc1\xcdo\x82W9\xd4\xbb\x10\x9fQ\x1a\xaaM\x05\
-\xd9Y\xaf]\xbbv\xe0\xc0\x81\xad[\xb7\x9e<y\x92\
-\x08F6\xe5\x81\x8e\xb34\x00s\x1d\xb6\xca\x884\xae\
-P\x1e\x85\xf4\xa5\xe3F7\x0f\x9f\xd1\x1c\xac\xa0\x04\xa1\
-\xacB\xa4\x9b\xdd\xb2\x8e0t*\xc8T\x1a\xccc}\
-}=\x91\xe8\xca\x95+?\xfc\xf0\xc3\xf7\x1c\xef\xbf\xff\
-\xbe\xbe\xb9i\xed\xda\xb5\x95\xf0\xfb\xf2%\x92Lp@\
-\xf1\x81\xb5\x5c7\x03\x09J\x82d\xaeT\x82\xa0\xda\x0c\
-iLoI\x95\x92\xcc\xc0rrc\xdc\xbe\xff\xfe\xfb\
-\xb0\xe6*UJ\xc4\x0e3\xc2kKF~(B\x19\
-\xcci\x0d\xb6\x12\xbd\x18\x9b6m\xda\x84\x09\x13\xfa\xf4\
-\xe9\x13n.?\x1d\x14\x93\x11\x89\xf6\xeb\xd7\x8f\x80\xcc\
-\x16L\x8d\x92l\x9aE\xf1\x82d\xe9\x16\x9a\xe2\x0e\x5c\
-(h\x06'\x10\xe6\xbdo\xdf\xbez\xc9Ec\x0co\
-\x94C\x9a\xb4\xbet\x5c\xad\x09>\x9d\x85\x1b\xb9\xc6\xcf\
-azm\xf3)G0J\xfb\x1ez\xe8\xa1^\xbdz\
-1\x82\x8ccs\x9b\x9bt4\x1f\x9fQ\xd901\xf4\
-:\xfab\xd1\xa8\xfd6\xc7\xd2\x1b\xca\x8a\x90\xa5\xe1\xb5\
-)xT\xbe\xfb\xee\xbb+W\xae\x10\x9a\x1c;v\xec\
-\xf2\xe5\xcb,\x94\xbeL\xfbCgyBjjj\xec\
-\x93\x09\xa0\x1e\xa9kB\xfaL\xbc\x85\xc3\xabZ\x0a\xa3\
-aB\x11d\x93\x89\x19H\x10$}\xfb\x02\xa4L\xca\
-\xb4\x05\xba\x0bWf\x93 \xe9\xde\xbd{7n\xdc\xe0\
-\x5c\xb1y\xf3\xe6U\xabV\xad^\xbdz\xd3\xa6MD\
-\xa5\x87\x0f\x1f>z\xf4(\xb3\x5cWWw\xe9\xd2%\
-\xa2U\xecUC\x05\xe2\x06\xaf\x11\xafM\x8dm\x88\x0d\
-\xa9\xcf\x0e\xe6B\x82\xcb,\x95p\x82(\xabM\xe5\xf6\
-\xed\xdb\xa7O\x9f>q\xe2\xc4\xf5\xeb\xd7+y\xf4\xaa\
-T&\xb8PrRl\xc5/\x08\xaa`\xb2\x88\xe4\x96\
-\x11\xc3\xe5\xe7\x81\x92=\x85\x08l\xfc\xf8\xf1\xe3\xc6\x8d\
-c\xa5e\xa3\xf1y?%\xfe\xf3\x7f\xfe\x191h\xef\
-\xde\xbd\xd9h\x18\x10b2\xe9\xd3\xb3\x909\x8ci\xac\
-`hor\x8b'\xb7\xcd\xa1I\xcc8]\x06\x05\x7f\
-\xf4\x1d\xd4T\xda)L\xd6*\x97\x89\xab\xcf\x13\xf6\xda\
-\x08m$Gfa\xd2U\xd9\xaaQ*G0\xfa\xe0\
-\x83\x0f\x12\x86\xea\xe1\xe9\xd9\xb3\xa7=<\xea\x09W!\
-eD!}\x85#w!,\xeb\xdc\xb931\x99|\
-\xc5\xf0F\x8e\x22S\xa8,\xe1U9\xa4Q\x96P\xcd\
-\x088\x1f+#[\xec\xd5\xabWo\xb9\xbfP\xa7\x22\
-e\x80\x06\xd0\xdfA\x83\x06\x8d\x1e=\x9a3+#@\
-\xc7}\x9eC\x8d\xf4\x89\xb2\xa0\xc1\xf1\x89\x02\x141P\
-q\x08\x93\x92#\xac_\xea\xa3!e\xe90}\x9aA\
-&\x8eC\xc5\xcd\x9b79N\x9c?\x7f\x9e\xa3\xc5\xb6\
-m\xdbV\xae\x5c\xa9\xbf#\xaf\xbf\xf8\x82\x01\xa1\xea\x0f\
-?\xfc\x80q\xa1\x86U\x08\x1a:a\xc9P(\x82l\
-\x0c\xd3(\xd7H\x8f\xb64\xa1>\xd40\xce\x8c\x9b~\
-\x86\xb0w\xef^\xc6\x99\x91tVU\xaa4\x0fy\xa3\
-\xc5\x04-\x86\xe2\x06IU\xeb\x9c\xdd\x83\x9e\xbb\xb0\xa5\
-v\xea\xd4\x89\x056|\xd3\xf1\x93\x82\x91\xa6\xfb\xdd\xba\
-u#$\xd5[\x0f\x1b\x1f\xe4d\xf8\x1c\xce6\x1b\xcb\
-UA!\x8d\xca\x82\xc9\x8c9\xb9\xac\xb7\xf7\xee\xdd\xd3\
-\x97\x93\xc8\xb2CP{\xb8*\xa9\x96\x1b\xd2\xb0\xb8)\
-\x09\x92e\x5c\x84t\x85JF$\xc3\x91CI\xaef\
-\x5c\xa8T)\x94#\x18e\xe0z\xf5\xea5r\xe4\xc8\
-\x11#F\xe0=\xb4\xdeFG=)D2\x1eA\xdf\
-\x94\x84P6dS\x09\x10\x89\x12s\x0fs\xd8\xd7\xd2\
-2\x08>;\x98N\x9f\xce\xef\x8eW\xe5\x13fI\x06\
-%#\x14\xca\xf0\xc0\xf0\xe4\x943\x12\x05z\xf4\xd0C\
-\x0f\xd1\xe5\x81\x03\x072\xe3\xc8\xd6Mk\xb0i\xee;\
-l\xc0\x11\xd4\x8b\x10ee\xd2\xa4\x81\xa0Z\xcd\x1d!\
-\x11s\xa7_\x90'\x00\xfd\xfa\xeb\xaf?\xfb\xec\xb3O\
->\xf9d\xc5\x8a\x15\xfa\xdc\x05'\x0dk\xcc\xfd\x02\x0d\
-V\xd7\xec\xd9\xe7*\xa1\x08\xb2\x11^\x95\xc3k\x1d^\
-U`=\x09\x0d@\xd3\x01\xe8y@n\xde\xbcu\xfa\
-\xf4\xe93g\xce\xb0\xcdD\x96U\xaa\x94H\xe2\x85\x0e\
-\x9f\x0e0\xbd]\x0d\x97\xef\x095\xdeA\xb3\x9c\x99\xc7\
-\x07\xa7\xbdq\xe3\xc6\xb9s\xe78\xa3\xde/\x1f\x10o\
-s\x18\x1c\x8b\xc8\xc3\xbd5\x1cF\xd0\x18\xda5\xc4\xe5\
-\xe7\x91\x1e\x7fP\x85\xc0\x9a|\xe9\xd2\xa5\x13'N\xd4\
-\xd7\xd7w\xecZA\xab\xbc\x94\x83\xc6\xe0\x06\xe0Z\x9a\
-4L\x820\x9b\x08\xe9!\xac0\xd47IX\x109\
-\x9c\x88\x16P\x8e`\x94V\x82\x05d\x1a2\x9e(;\
-^X\xff1\x93 \x92\x01\x0b\xf0\xdaf\x8eW\x99\xa1\
-\x9b\xc4a\x13'N\x5c\xb4h\xd1\xcc\x993\x07\x0d\x1a\
-\xc4\x03C\xc7\xe9\x9a\xae!\xbe\x8c\xebQ\xe4L`\x06\
-R\x0a\xd9H\x1f\xa1\x5cF\x95G\x85x\x85\x87\xc7F\
-\xb8l\xd0\x06n\xca\xe4\xaa\x9d\xea\x02\x02\xc8@\xb8\xde\
-\xc7\xf8\xbcV\x13\xd6\x16\xdd\xb7MP\xe5\xbaK\x84\x0c\
-\xd2X3\xdcH$\x84\xcad\xe2\xdd\xc4\xdd\xb9s\xe7\
-\xfa\xf5\xeb\x97/_&6:x\xf0\xe0\x86\x0d\x1b\x88\
-A\xdfy\xe7\x9d\xb7\xdez\xeb\xbd\xf7\xde[\xbdz5\
-\xe1\xe9\xdd\xa2\x7f\x02\xbb2\xa1\xc1\xea\x1d\x116\xdb\xa7\
-BR\x9f\xe7\xc0 s\x00\xd1\x83O\x94\x86\xea\x11a\
-q\x92\x5c\xc3\xdar\x9ad\xe4!\xcc\xaaR\xa5Y\xc8\
-\x97D(\x0b\xe7\x86\x1e\xafrX2\x14\x84\x92\xe9\xaa\
-\x80\xd5\xf5\xca\x95+\x87\x1c\x84G?\xcd\xd7\xf9\x8c\x0c\
-\xb0\xa5\xda\xae\xea3\x1c~\x10\x1d\xd2D\x06Q\xb2\x10\
-*\xceb\xc5\x98\xb3\xa5\xd6\xd5\xd5\xed\xd9\xb3G\xbf$\
-j5\x97\x9f\xe8\xd6a_\xc8r\x9bI\xb2\xf9\x9a \
-\xbcE\x80\xe9\xa9!\x0aNd\xd0$a\x0d\xd2\x94^\
-6M9\x82Q\x83\x86\xaa\xcf\x92\xb9j\xb0\x5c\xa6\xd7\
-p\x95p?B\xef\xbau\xeb6r\xe4\xc8y\xf3\xe6\
--^\xbc\x98\x90\x94\xc0T?IQ\xa7\xc2\xab\x04\xc9\
-6\x08\x86\xd9\x94\x8e\x8a|\xff\xfd\xf7\x1c\xddN\x9e<\
-y\xf1\xe2\xc5\x0eY\xa7\xec\x19P\x92V%\x0b\x86C\
--\xe4\x1a!KAA\xafuxm\xf3\xf1\xe5s5\
-\xf8D\x01d\x93&\xcc\x92%\xf8t\x16\xde\x22\x00\xa5\
-\x06\x04\x905\x08\xd2\x03\x9d%\x0cb\x9a8?\x5ck\
-h`\xd66m\xda\xf4\xc5\x17_|\xfa\xe9\xa7\x9f}\
-\xf6\xd9\x97_~\xb9f\xcd\x9a\xcd\x9b7\x13\x98\x92u\
-\xf5\xeaU\xccT\xf0\xfe\x82nr4:\x7f\xfe\xfc\x81\
-\x03\x07\x0e\x1f>\xccVJ\x97Q\x02\xb96 \x12\x84\
-+\xe71\x8d\x04C\xb9!>\xc3e\xa9\xf2\x08\xb2t\
-_ \xc9\xd1\x91\x07V\xbf\x06\x81,\x9b*UZ\x89\
-\x9c\x10\x90\xe5iv\x0dIL\x0b\xa3\xe2\x12\x0c\x92\x14\
-$6\xe2P\xca\xe9\x8e\xd5\xbe\xc9z~\xac\xd8\x80\xd8\
-UB!d \x94\x94>\xc2\xf4\x1a\xd8d\x9er[\
-\x12\xab\x16\xc3\xce\x22\xcc\xf8\xcb\xa6CP\x93\x22Y-\
-\x94\x12\xcc\xa0\x10VPXq\xbbJ(\x84\x8a\xa7)\
-^\xaa8e\x0aFY\xe8\x89\xc9\xb8\xaa\x93l\xc9\x92\
-\xad\x03\x86/P\x94\x12\xcd\xca\x0c\x9d\xea\xd2\xa5\xcb\xd0\
-\xa1Cg\xce\x9c9g\xce\x1c}\xba\xfc\xc1\xdcw\xdd\
-\x83\xcc@\xc9\x10\x9f\xd1\x0a\xa8\x84\xb0\x86\x87\x84C\x1b\
-\xfb\xfd\xf6\xed\xdbO\x9d:\xc5j\xe5\xb3\xcb\x05S\xf3\
-\xd0C\x0fu\xea\xd4I\x9f\xe3\x11\xb4\xcd\x87c\x8e\xa8\
-\xbfn\xda\x93\x09M\x06\x22\x97%YH\xd3,T\xa1\
-j\x16\xd2\x8b(\x99\x89\xbfw\xe1\xbb\xfb\xec\x14>;\
-\x80\xdb)\x06\xa5\xefz\x03\xa7\x99\xe2\x0a,mLY\
-\xf2\x07\xe5\x8f\x1e]\xbf~\xfd\x07\x1f|\xf0\xa6\xe3\xa3\
-\x8f>Z\xb7n\x1d1(\xb9Z\xfe2+\xbf_`\
-\xd7<w\xee\xdc\x0e\xc7\xd9\xb3gI\xa2\x94? \x94\
-2#!\xd8\x0b\x9fv\x90t3\x90\xe0U\xf9\xd8q\
-\x88\x9bbCR\xbfX9y\xf2\xe4)S\xa6\xf4\xed\
-\xdb7t\xda*UZ\x86\xb9\xa5\xb9\xa2\x04\x90\xde0\
-e\xe2\xca\x01\xca-\x04[g\x9f>}\xc6\x8c\x193\
-j\xd4\xa8\xde\xbd{W\x9d6\x8d\x06\xd6\xf0\xda\x14\x99\
-C\xed\xcb\x04\xa5X(\xe0\xe1\x87\x1f\xe6\xd4:r\xe4\
-H\xc6\x9c\xa4\xcf\xeb8\xc2\x16\x82<\x07\x90-\xcb\xab\
-\x1cJJ_\x9cR\xcc\xdc\x08y\xb4\x9c\xa2,\xb1\xfe\
-B\x94cLi\xeb\xed\xdb\xb7/_\xbe|\xf5\xea\xd5\
-\xef\xbe\xfb.\x19\x98\xa2\x8d6\x03\x09id\x96\xa6x\
-n{\xc3\x1a\xd1\xb3g\xcf\x09\x13&<\xf2\xc8#\xe3\
-\xc7\x8fg\xbd`\xab\xd3kQo\x91zH\x0c\x9f\x9d\
-#\xad1\xa2\x0e\xaa\xb8H6\xf6\xff\xfb\x7f\x09\x5c\xce\
-\x9f?_WWw\xfd\xfaub\x1doW\x16\xb8;\
-\x07\xc7\x86\x86\x86\x1b7n\xd8Oc\x81,73\x09\
-\xb2\x8c\xf0\x1dp()}k\xd0\xbdtS\xd5\x0c\xca\
-j\x19\xaa\x0a\x90}u)d\x19\x11e!3&\x04\
-\x97\x04d\xcc\xd1\xb1c\xc76n\xdc\xf8\xe5\x97_\xea\
-U(\x01\xe8\xee\xdd\xbb\x8f\x1c9\xc2Y\xe2\xca\x95+\
-\xf7\xe9\xab\xd04\xf4\x9aE\x80x\xf4\xf4\xe9\xd3\xd7\x82\
-\xbfb\x17\x8d\x8c\x97\xb2\xd0\xc8k\x0a\x22dP\xbc*\
-\x99\x85\xf6\x08l*=z\xf4`_\x9f8qb5\
-\x18\xad\xd2N\xe0\x8d\x11>#\x87\xdc2\x04\xa5\xcc$\
-\x1bx,^\xca\x09\x8aHt\xf4\xe8\xd1\xec2\xec;\
->\xafJ\x01l\xc0\xa3\xc1\x84\xb4&\x02\x03\x8a\xb3X\
-qe\xf0\xd9\xd3\x1f,\xe1;M\xcbC\xda\x91 j\
-\x1bI\x9a\x0d\xc5\xdbLU\x99\xb5\xa5\xb1zT\x04\x94\
-D_\xfc\x16MR\x8e`\x94\x8d\xe7\xc2\x85\x0b{\xf7\
-\xee\xdd\xbf\x7f?\xfb\x10\xdb\xb0\xa6\x96,Z\xafa\x0a\
-\xbba\xdd+\x9d\xb0x\x87@\x03\xf0Q\x82QNN\
-\xb5\xb5\xb5\x83\x06\x0d\xd2\x97\x9fY_BA\xdd\xe7*\
-\x90\x81,\xf5Br\x93X)\xe1\xfc-\x19I\x02P\
-v}`\x9c}^\x19!x:{\xf6\xec\x9e={\
-\x8e\x1e=\xaa\x98\x83F\xd2*VL5\x0f\xbci{\
-\xa2\x91I\xdfNz\xbb\x96\x08\xc6V\x8f\x92EP\x91\
-\x10\xa6\x98IA\xa0\x12\xae\xcc\x0bG2&\x88\xb3\x19\
-g\x86\xf5\xeb\xd7\xbf\xf7\xde{o\xbe\xf9\xe6\x07\x1f|\
-\xb0i\xd3&\xfdR\x021=CW\xe6\xb3D{C\
-\xdf\xe9\x11\xfdR\xd7H\x9a^(\x99\x89\xc6?\x99\xce\
-\x14\x96[\x043\xe0.\xc8rE%\xd9\xda\xbbw\xef\
-\xce\x93\xdb\x82o\x9d\xabR\xa5\x10\xf2\xe7\xc4\xad\x9bZ\
-1\x9a$rK\x92,\xa7\xb8+[\x8c~I\xd4g\
-T)J\xa1\x81Boh\xbe\x0co\xe1\xde\xb344\
-4\x1c;vl\xdf\xbe}\x17/^\xac\xd8\x95\xd9w\
-#\xe8\xa9d)\x85\xf4m\x88\xc6\xca\xc52y\xbf\x09\
-\xd0\x5c\xca\x11\x8c\xd2Pb\x14\xe2\xd1\xfa\xfaz\xf6`\
-\xedC@\x96\x8d\x8e4B\xc9\xa4di\xa8\x06];\
-\x0a\xee\xce\xd20x\xf0\xe0a\xc3\x86\xf5\xed\xdbW\x1b\
-\x9b\xba#\xbc]\x0e)5\x7f\xa0\xa4\xf0\x16E\x91\x99\
-\xec\xc14@\xac\xc3\x08\xabNi\xca\x09\xb7\xber\xe5\
-\x0a\xc1\xe8\x86\x0d\x1bv\xef\xde\xcds\xcb\xd4\xab1\xc5\
-\x9bD\x96he\xcbUIH!}\x88l2i\x96\
-_eVE\xe8\xc3\xe6A=t\x8d\xf1\xb9u\xeb\x16\
-1\xe8\xd6\xad[W\xae\x5c\xf9\xe9\xa7\x9f~\xf5\xd5W\
-z\x1bz\xe2\xc4\x09\xbd\x0a-\xde\x9e\xfb\x1a\xbaO\x07\
-\x09\xb5\x09\xc7\x19\x0d\xc6\x84\xc1\xf1yM\x811\x98\x10\
-\xe2\xe60A\x96i\x94e6*\x15\xea\xcbyR\xaa\
-\xf2\xe3FNU\x08\xb9\x99\xe1\xb5)\x12O\x0d\xf0\xd6\
-9{\x04\x96\x14(\xfd\xf1\xa9\x02~4\x1d^\x15 \
-\xa5r#X\xaf\xae^\xbdz\xfc\xf8\xf1#G\x8e\xb0\
-J\xb3v\xa9H\x85 \xc7p\x0e\xd2(@\xb8\xac\xe9\
-Z\x04\xdfU\x87We\x91\xce\xb5\x9a\x8b\x17l\x922\
-\xb92\x8f\x8d\xbet\x13\x81\xa6\xab\xd1\xc9 eEl\
-\xa1\x5c\x1c\xd5\xe0\x13\x1d\x07S\xde\xa3G\x8f\xb1c\xc7\
-\xce\x9e={\xe2\xc4\x89\xf69\x1e\xdaF\x96\x1cB\x96\
-ak\xd5M\xdc\x1a$\x1b\xde\x22E\x98%\xd9\x99'\
-\x95(\x06\xe5\x99\xb9y\xf3&\x11\xff\xf7\xb9\x1f\x83\x96\
-\x1f\xa2\x8d3g\xcel\xda\xb4\xe9\xdbo\xbf=|\xf8\
-\xb0\xbe\xeb\x94F&S\xe5\xf0vY\xa8;\xc2\xab\x9a\
-\x8f\x8a\x87\xa3j\xca\x10S\xbaB\xd9\xa8\xb5\xd6\xe6\xe2\
-\xc6\x85PK4G\x8aD\xf56\xf4O\x7f\xfa\x93\xde\
-\x86\x9e;w\x0e=\xe3\xc6\x0c\xfa2?F\xe8\x1d\x9e\
-y\xed\xda\xb5\x86\x86\x06\x1cU\x9du\x1eQ\xcc%\x8a\
-\xe7\xba\x09\xcc\x98\x94t\xa9\xd0\xcc\xdd\xb3\xd1@r\xa8\
-\xa9R\xa5\xc5\x84>\x19\xb9\x99\xd0\xa6 H\x92\x15\x16\
-\x91\x1c\x22\xbd\xa1\x22\xac'ZX\xa4\xac\x12\xa2!2\
-\xa2\xa4\xc8\x1c\xba\xb4\x12\x0d+\x15\xfb)\x1b+a\xe8\
-\x8d\x1b7X\xbb|^\xc7A\x8fB\xa4Q\x96\x90\x1e\
-L.\xa4\x14\xa5;\x12\x96@\xd9\xd0\x81]e\x09\xb2\
-i\x19\xe5\x08F\x89\xcc\xbau\xeb\xa6\xb7\x86\x08t\x00\
-\xa5\x9a\x1e=Q\xea'\x98,}\x84\xca\x82Ow(\
-4\x838{\xe4\xc8\x91\xf3\xe7\xcf_\xbcx\xf1\xb8q\
-\xe3\x08L\x15s{\x8b\xd4\xc4\x1bt0\x1a\x81f\xe1\
-F(\x81\x1aH\xf2\x90\x10\x05\xee\xd9\xb3\x87\x03\x5cG\
-\xfd\x98\x1eh\xcf\xdd\xbbw\xcf\x9e=\xbb\x7f\xff\xfeS\
-\xa7N\xd1\x92\x1f~\xf8\x81\x87Y\x1f!\xc5 s(\
-B\xa5\x0d\x88\x1b\xb6\x16\xce\xb2\x86E\xf5\x84H\xc35\
-\x9d\x15b\xb7\x0e\xafP\xbc\xa0\x99\x01f\xacb\x82\xb9\
-`v\xae_\xbf~\xe2\xc4\x89\xcd\x9b7\xaf^\xbd\x9a\
-H}\xe7\xce\x9d\xfa\x13Y\x0cN\x91:\x7fL0\x08\
-\xac\xe6\x8c\xc3\x9d;w\xcc\x19\xc0\x16\xb5\x12\xd1p\xb5\
-x\xd0\xb8\x97\xca\xba\x9b'/\x99\xb8*\xabJ\x95\xb6\
-E>\x06\xa1\x1c\x82+\x9a'K\xb0d!x^\xd8\
-U\x7f\xca~K\xc7\xe9>\x83\xa0p\x22\x8d\x1bZ\x8f\
-\x92\xd2\x8749\xce`5\xb0\x86\xeb\xf3E\xd2w \
-j\x8f\xd6L\xc9\xba\x82z$=H6\xbdP\x96\x81\
-\xa6\x94q\x10X\x0ad\x15\x0f\x97n\x13ZF\x99\x82\
-\xd1\x9a\x9a\x9a1c\xc6\x10\xb1\xf5\xea\xd5\x0b\x1f\x92\x03\
-i7\x02\xfa\xa6\xb8A\x9d\x0c\x91\x12\x90\xa3\xae\xfa\x0c\
-\x17\xa4+)=\xc9\xc8\xb2\xfd\xe0F\xdd\xbbw\x1f;\
-v\xec\xa2E\x8b\x88D\xc7\x8f\x1f\xdf\xbbw\xef\x87\x1e\
-zH}\xccl\x06J\xb2\x0c\x06GO\x94\x8c\xb9J\
-\xb0\xee\x18\xae\xaf\x19\x01\x96\x92\x84z\x17/^\xdc\xba\
-u+\x81\xce\xbe}\xfb8\xc6)\xb7C\xa0I\xf7\xee\
-\xdd\xe3\x1cy\xe1\xc2\x05ZE\xbcu\xed\xda5\xbd\xaf\
-\xe5\x91\xb6\xb9\x06_ \xe8/\x02\x06\x86\xb3J\xb0\xdc\
-\x10)KA\xa3jh\x9c\x0d\xafuxU\x0ei\xa2\
-{\x85I\xb3\x91\x99\xc1\xb2E\x7fo\xdd\xba\xc5\x5c4\
-440\x1aD\xa2\x1b6lX\xb9r%\xd3\xc4\xb1\
-\x81\xb0\xecG\xff64\x82a\xc1Q\xc3^k\xdc$\
-\x87HiW\xe1r<T\xe5\xa5|\xdc\xd8'\xf8t\
-\x0a\xb2\xf0+\x9f\xa8R\xa5-H\xfb\x9b\xf3\xc1\x04%\
-\xbd\x07\xe7|\xd8\xb2\xbc6\xa7\x97 \x8d\xa1\xac\x08\xb6\
-\x8c\x22\xbb\xcc\x8f\x1e\xfa\xde\xc9}\xe3=\x82\x063\xbd\
-Y\x84\x14\xd2\x0b\x8d\xb3\xf0\xaa\x00)\xddv\x14o\xbe\
-\x1d\x85\x9adW\x09\x11\xa1>\x14 \xed6\x1a\x9f\x08\
-\x9f\x97#\xad\x11\xd4\xd6&~X\x8e`\x94\x86v\xeb\
-\xd6m\xa0C\x7f/\x01|\x9e\xa3P'#B37\
-\xa4\x9e\x12\x8b\xb7\x07t\xa7\x7f\xff\xfe\xb3g\xcf^\xba\
-t\xe9\xd4\xa9S\xfb\xf5\xebG$\x1a\xf5\x0eh\xa4\x97\
-\x82\x96c\xc6\x83\x04\x08^\xe5\xf0v\x01\x99\xca\x10\x1e\
-\x92\xef\xbe\xfb\xae\xbe\xbe~\xcf\x9e=\xbbv\xed\x22\x04\
-\xec\xd8\x1f%0#\xc4a\xc4\xa0\xb4g\xcd\x9a5\xc4\
-\xc7\x04a\xc8g\xcf\x9e\xbds\xe7\x0e\xb9\xd6#\xe4L\
-\xf46\x91\xab\x9e\x7fC\xa5J\xc4\x0dg\xc6\xc8\x87r\
-4\xf8 \xe3\x10\xbb\xaf\xb7\xc8\x1d'$H#\x03\xa0\
-\xcd\xc4[w\xef\xde%\xfe>v\xec\xd8\xa6M\x9b\xbe\
-\xfe\xfak\xfb\xeaP\x22\xd1m\xdb\xb6\x9d;w\xaec\
-'\xa8\x03\xd1<\x0a\x92n\x85\x8f\x97x\x0di\x84\xe9\
-e\x93\xa6HV\x11(\x15\xdd\xbdJ\x95\xd6\x90\xf6\xc3\
-\xc4k\x1d\x92\xa54\x94\x05Q2DY\xe0\xd3\xa9J\
-Z\xcf\x83\x0f>\xd8\xa5K\x17v\xea\xee\xdd\xbb\xf7(\
-@\xd7\xae]\xd9\xf2|\x81\x8e\x836\xd4\xd4\xd4\x10N\
-\xf4\xe9\xd3\x87\x90\x94=\xd4gd\xe1V\x1a\x0fI?\
-|9\xa4q\x86\x09R\x86\xa0T\xc1\xca\xc4\x1a)\x94\
-\x14^\x95#S#|\xba4\x8a\x14inU\x11\xe5\
-\x08F\x01w\xc1i\xf4\xcaP\x9d\x11d\x15\x99i\xe7\
-?\x09>\x9dOX\x03\xb0\xa5\xe9\x87\xa1\xf6\xe3\xe0\xf6\
-\x86\xbb\xd3)\x1e\x89\xb1c\xc7\x8e\x193\x86HT\x0f\
-\x86Z\x05j\x98\x04iB\x5c\xf3\x13K\x13D\x11Y\
-\x84I\x05C$\xe9\xfb\xad[\xb7*\xe7C-\xb4\xe7\
-\xd2\xa5K\x1b7n\xfc\xe0\x83\x0f\xdey\xe7\x9d\xf7\xdf\
-\x7f\xff\xf3\xcf?\xdf\xbcy\xb3\xfe\xee\x22\x06\xd6\xf2p\
-p\x988\x05\xa0>\xedr\x15\xac\x08\xaf-\x017<\
-\x051\x83\xc8XI\xf0\xf7\xcb\xe1\xb59K4j\x15\
-W\xf0y\xae\xfdD\xe17o\xde\xbcz\xf5\xea\x91#\
-G\x88\xc2\xff\xf2\x97\xbf\xfc\xf1\x8f\x7f\xfc\xf7\x7f\xff\xf7\
-7\xdex\xe3\xc3\x0f?\xdc\xb2e\xcb\xc5\x8b\x17\xb1\xf1\
-\x05~\xda\xd8\xc0jTA\xc9&I[\x9a\xc6U\x93\
-\x8d\x0c\xaaT)\x03\xf2\xb7v\xf5\xba\xb6\xaa\x9c\xa5\xb8\
-g\xcf\x9e\xa3G\x8f\x9e={\xf6\xa3\x8f>\xfa\xd8c\
-\x8f-Y\xb2\x84k\x04Y\xf3\xe6\xcd\xab\xad\xad\xed\xd5\
-\xabW\x07>MD\x11\xec\xb9\x93\x1d\x08\xf6\x8b(>\
-;\x7fX\xc2\xa5\x1b\x94\xc4 DY YJ!}\
-\xa5\xe1\x1b\xe7\xf0\xaa\xfc^\x87\x14\xb2)d_\x22V\
-\x5c\x82\xae\xd1h7\x972\x05\xa3\xb4R\xef\xbaBo\
-PV!2\xddH\x82d\x13$\x13\x81\xb1\xcd\x9f>\
-}\x9a\x18\xa8<\xd1\x18\xcf\x00\x87\xc5a\xc3\x86\x0d\x1d\
-:\x94\xe7S\xdf\xb2\x11\xbd*S#AIC\x06\xb2\
-\x8c\x90\x81!\x8d\xb2@J!\x0dwD&\x0c\xa2\xd7\
-\xc08+\xb7c\xa1\xcb\x04\x9d\xe7\xce\x9d\xdb\xbbw/\
-1\xe87\xdf|Cd\xb6i\xd3\xa6\xa3G\x8f^\xbf\
-~\x9dh\x0c\x83\xb0;&Gc\x95\x8c\x9dC1\x1f\
-\x82\xf4\xae\xeb\xf1X\x85\xa8\x14\xc8\xb2I|1\x07\xa5\
-\xbc\x94#\xad1\xc8\x92o\xd3_}*t\xfb\xf6\xed\
-\xdf~\xfb\xed\xd7\x0e:N\xf7\xb7m\xdb\xb6k\xd7.\
-\xfa\x8esV#Q\xd0x\xda\xb0\x934\xa4)Nd\
-\x16M_\xb3PU%\xde\xb7J\x95&q\xcbIA\
-\xbcQKI\x9e\x90\xfcg\xa7\x05P\x96\xdd\xaak\xd7\
-\xae\xc4\xa0}\xfb\xf6\x1d2d\xc8\xa4I\x93\x1e\x7f\xfc\
-\xf1\x97_~\xf9\xf7\xbf\xff\xfd?\xfd\xd3?\xfd\xf3?\
-\xff3\xd7\x88?\xfc\xe1\x0f\xaf\xbd\xf6\xda\xf2\xe5\xcb\xa7\
-N\x9d\xda\xbf\x7f\x7f\xf6\xbeNe\xff64n\xd7\xa5\
-K\x17\xe2\xe69s\xe6\xa8\x19\xdav\xa3\xe7\xb7H\xab\
-BK7\x96yP0\x8d\xb7\xaeH|\x13\x8b62\
-\xcc\x0d\x8d%\xa7Qn\xe9\xb4\xa0H&e\x0aF\xf5\
-\xce\x92m\x98m[\xb3\xee3rh\x14\xc0\xa7\xf31\
-\xfbHH*r\x02\xf5\xdf\xb8q\xe3\xf0\xe1\xc3[\xb6\
-l9r\xe4\xc8\xed\xdb\xb7\x9dU;\xa2\xd3\xe4\xc8\x91\
-#'N\x9cH0\xca\xf9L\x8d'f\xb2VEW\
-\x83$\xa8\xbf\xa0\xa4\xf0\x169\x1b\xe1\xed\xb2\x06\x07\xa5\
-\xc2_\x05C\x8cp\xf8\xa2\xae\x12\xa0I\x0d\x0d\x0d\xf5\
-\xf5\xf5Di\x87\x0e\x1d\xe2\xca\x99A\x1f\x97\x0c\x0f'\
-\xea5$\xfdt=E\xd6[R\xe9\x85\xf4v-\x05\
-,Ug\x84\xcfv4\xb7f\x15\xd7U\xc7\x00\xfax\
-\xf9\xf2e:H\x00\xfa\x97\xbf\xfc\xe5\xcd7\xdf\xfc\xe4\
-\x93O\x88J\x09\xc7\xc9\xbas\xe7\x8e\xfa\xebJ\xff\xa4\
-ax\x191\x90,\xa4A\x90MsQ%>Q\x14\
-Y\x82O;\xd4\x98*U\xda\x8ap}\xe0*\xa1\xcd\
-iY\xcd?s\x7f\x02\x97\x00\x94`\xee\x91G\x1eY\
-\xb8p!a\xe8\xd3O?\xfd\xe4\x93O>\xf6\xd8c\
-$3Y\xb0`\xc1\xa3\x8f>\xbat\xe9R\x82Q\x8c\
-\x97-[F\xd9\xda\xda\xda\xde\xbd{G/&\xdb\x15\
-6;\xb6\xdaA\x83\x06\x8d\x1d;v\xf0\xe0\xc1\xc4\xd3\
-\xdc\xdd\xe79J\x1f\x13-\x02Z\x0d\x84)U\x89H\
-L\xef\x13\xd2\xad5\x8d\xebJB\x98\x94\xdc\x1a\xda\xa4\
-\x12\xa3L\xc1(\xcb=;1\xb8M\xc7\xef:\x1a\x11\
-!3C\x06\x11\x91\xd2\x92TH\xc4s\xf5\xea\xd5\xa3\
-G\x8f\xee\xde\xbd\xbb\xae\xae\x8e\x8d_Y\xed\x04\x8fD\
-\xf7\xee\xdd\x89D9\x9f\xcd\x9e={\xf8\xf0\xe1\x9c\x11\
-\xd1\xd3$\xa0=23\xac\xa9\x11\x85\xf4\x90\x99\xe5\x07\
-+\x1f,\xe9\xfe\xf5\xeb\xd7/\x5c\xb8@\x90\xa7p\xdf\
-\x17\xa8\x18h\xd2\xcd\x9b7\x99\x1a&\x88\x10\xed\xe0\xc1\
-\x83\xe7\xcf\x9fWH\xfa\x83\xfb]{@\xc0\x92\x1e\xc9\
-\xde\x95\xcb\x03\xa5\xf4\xe15\x13g\xe8\x91Fc%\xa4\
-\x11\xde\xc8\xa1\xa4\xf4idc0\xce\xb4Ya\xe8\xc9\
-\x93'w\xed\xda\xb5a\xc3\x86\xd5\xabW\xafX\xb1b\
-\xe5\xca\x95\xc8\xfb\xf7\xef\xaf\xfeD\xbe\x08~\x1c\xdd\x80\
-\xf3@\x89hv\x8a\xe3\xcb;\xd2\xc9\x88B\xcaL}\
-\x95*-C\x0e\x1c9U\x9b\xfbX\x0b*\xa4a\x0f\
-?\xfc0\xdbVMM\xcd\xa8Q\xa3\x16/^\xfc\xe2\
-\x8b/\xbe\xeex\xf5\xd5W\x091g\xcd\x9a\xa5\x1f\xf1\
-\xe9c\xa3\x11\xee#\xa3=\xfa\xf7\xef?i\xd2\xa4g\
-\x9f}\xf6\xb7\xbf\xfd\xed\xef~\xf7\xbb\xe7\x9e{n\xda\
-\xb4i\x03\x07\x0e$\x8b\x18\x91\xe7\xd7\xdf\xac\xdd\xa0\x17\
-\x0f<\xf0\x00\xf7\xd2\xa7W\xc3;\x92%L\x96\xe02\
-\xf3H\x9ey7\x80v\x0d\x93&\xa8\x12!}e\xe2\
-\x9a\xef[n\x14jv!}\xcb\xb0\xfb\xa6\x1b\xd0\x02\
-\xca\x14\x8c\xe24\xf8\x10\x87\x18\xed76\x1c\x92\x854\
-!n\x90\x9b\xe8$\x06\x04\x7f\x84\xb9D6Dc\x97\
-/_\xbe{\xf7\xae\xcfk\x1fh*\x0f'\xcf3G\
-\xc3\xb9s\xe7\xeat\xa8\xbfA\x0fa\x83\xc3N\x15\xea\
-\x88\xf4\x5c\x0d\xe9!\x94\x0d\xead\x0c\x0dl\x88\x8a\x88\
-\xf3\x8e\x1c9\xb2w\xef\xdeJ\xfe\xcd\x18\x1aF\xf36\
-n\xdc\xf8\xb7\xbf\xfd\xed\xf3\xcf?\xdf\xb4i\xd3\xb1c\
-\xc7.]\xba\xc4)\x02\x98>\xfd\xd9!;\xb1@\xe2\
-\x16\x0e\xd5\xe0\x86'A\xb2\x94E\x88l\xac\x1e\xc3\xaa\
-2\xa4/\x847r\x7fE\x89\xa6\xde\xbe}\xfb\xca\x95\
-+\x1c\x81\xf4\xd9\xd0\xb7\xdez\x8b\xae\xed\xdc\xb9\xd3\xe2\
-l\xa6\xc6\x97\xac\xe2`\xe8\x18\x93\xe4T\xeaf\xd9k\
-s\x90\xeb\xa5\x12\x90\xb1\x15A0\x19\x94\x0c\x91R\xb9\
-U\xaa\xb4!\xa1_\xa5\xe5\x0e\xf7:\xd6=v\x0a\xbd\
-\x0d\x9d2e\xca\x82\x05\x0b\x96-[\xf6\xe4\x93Or\
-]\xbat)Q\xa9\xfe~5\x81\xa6\xfe\xa4\x13{\x99\
-\xfb\x8a\x97\x0c:u\xeaD,;v\xec\xd89s\xe6\
-<\xf6\xd8cO9\x10\x08dG\x8f\x1e\xad/\xd8N\
-/\xb3m\x08\x95\x13E\xd0H\x22Q\xbb\x17#\x1c\xde\
-T2\xd7P\x99&\x9c\x1d\xae\x91 \x94\x04\x9f\xae\x0c\
-\xacI&\x84r\xd4q%\x8dH\xa9d\x84\xcf\xcb\xc2\
-[\xb8\xdby)\x90#\x9b\xe6R\xa6`\x14\xbf\xc1{\
-pe\x04\x1e\x0c\xb5XM\xb7d\x84\xf50\xecv\x84\
-\x0a\xb2\xab\xb1\xc3\x11\xeb(\x9aQV;\xc1\x1dy\xaa\
-\x89D\x17-Z\xc4\x93\xcc\xb3\xcd\xc3i\x9f\x16\xf5F\
-M\xa1\x1eE\xfd\x22\x19!\xa5r#\xb8\x1dH\xa6\xef\
-\x0d\x0d\x0d\x04\xa3\x95\xff*\xee\xce\x9d;uuu\x9b\
-7o^\xb9r\xe5W_}\xb5f\xcd\x9a\x0d\x1b6\
-l\xd9\xb2e\xfb\xf6\xed\xbbv\xed\xa2\x0b\xb4\x1f\x1b\xba\
-\xf0C\x0e&7\x1c\x0d#J\x1a\xc5\xf5\x5c#2\x95\
-E\xc0\x1eO\xbb~\xfd\xfa\xc9\x93'\xf7\xec\xd9CH\
-\xbdj\xd5*b\xeb/\xbf\xfcr\xed\xda\xb5\xfb\xf6\xed\
-#\xbc&\xd2\xf2\xd6U\xf2\xd1\xe8q\xf6 \x88\xd7W\
-\xe1\xa2\x81\xe4\xe4\x91\xfb\xc1\xbd\xae&$\xc5rH\x0f\
-\x96\xb4k\x1ag\x98\x87)e \xd2\x9a*U\x9aK\
-\xda\x8bJq*\x95\x0a\xf1\x19Y\xe4\x1b$\x1b\x8em\
-\x01\x85\xc0\x80m\x97\x0dK_\xad\xb8d\xc9\x92\x97^\
-z\xe97\xbf\xf9\xcd/\x7f\xf9\xcby\xf3\xe6\x0d\x1f>\
-\xbcO\x9f>={\xf6\xec\xde\xbd\xbb\xdek&\x95\x16\
-\x05\x03bA\xea\xec\xda\xb5+u\x12\xc2\x12\xd4\xbe\xfa\
-\xea\xab\xaf\xbd\xf6\xda\xb3\xcf>;u\xeaT{K\x1a\
-\xfd\xf4\xbc\x0dQ\x1b\x88\x98\xb9\x86#\x80,\x90\xc3\xb1\
-\x92&B\xb9\xe15\x14D\x94\xac4\x8a4;\xd4(\
-i\x84J\x84\xcc\xc1)\x11\xd5\xa0k\x9b\xd0^\x1e\x13\
-\x82\xdf\x0c\x1a4h\xfa\xf4\xe9\xb5\xb5\xb5x\xaa\x0e4\
-6\x0a\xa5t&\xb47\xa4\xa48\xdb\x18\xe1K}}\
-\xfd\xde\xbd{\x09hn\xdd\xba\xe5-\xda\x1an\xc7s\
-\xcb\xb9\x90\xc3%\xc7\xc1\x993g\xf2\xec\xf1d\xaa%\
-!\xbe@>\x85\xf4\x10\x0d\x82,\xd3\xf6\xa61\x81H\
-\xf4\xde\xbd{\xa7N\x9d\xda\xbau+\xb1\x91\xfe\xf4\xbf\
-\xb2*\x13\x1aL\xb8y\xd3\xfd5\x8bs\xe7\xce\x1d=\
-z\xf4\xc0\x81\x03\xc4p\x87\x0f\x1ff\x06\x89>\x15\xd9\
-\xeb\xfd\x193\xab\x15P\xfde\x94\xc2\x81\xb2\xe4\xff\xc7\
-\xde\x7f\xb0\xd7u]w\xfe\xf8\xf3\xfbG\x14\x1bH\x80\
- X\xc0\xde;%J\xb2\xba\xacb\xc9\xb2,K\xb6\
-,\xcb-\xc9\xcc3\xf3Z\xa6\xbc\x8f\x99<\x9e$N\
-\xe2\xc4v\xe28NlY]\xa2DR\x12\xab(\x16\
-\xb0\x13\xac\x00\x08\xb0\xca3\xff\xcf\xd9\xdfu\x17\xf6=\
-\xe5\xe2\xa2\x9f\x0b\xde\xcf#\x1d\xee\xbd\xf6\xda\xfb\xec\xb5\
-v[\xe7\xe0\xe2\x22\x16\x86\xa8&\x89_\xb9J\xa2\xea\
-@:\xd6\x14\x92\x17\x91\xd2'\xcbLS\xe8O\x18\xfd\
-\xf6\xdbo\x13\x8c\xee\xd9\xb3\xe7\xd0\xa1C\x84\xd1<\x0b\
-)\xba2\xed&\x05\xb0d\xe6\xcd\x9b\xa7\xdf\x81\xf0\xa7\
-S!\x05%r=\xe9B\x12Jg+:\xae\x9c\xc2\
-\xab\xa0\xc0<!,>~\xfc\xf8\xe7\x9f\x7f\xae\x19(\
-\x9d&M\xea\x81\xd9\xcbd&\xd4\xdb\xb0aCGG\
-\x87\x1f\x07V\x5c@jf\xc6\xfaJ\xe7N]\x09\x99\
-\xb1\xec\x8e}}}\xc7\x8e\x1dc\xf3\xec\xee\xee\x8e\xf7\
-\xfcps\x83\xd3j\xe9\xd2\xa5\xabV\xad\x22j|\xe8\
-\xa1\x87\x9ez\xea\xa9G\x1ey\x84\xf4\xb2e\xcb\xe83\
-!\xa3V\x9fc\xd5jv\x9eRir\xac\xcf\x981\
-\x83X\x96C\x90\xf3]\xb6\xd3&\xb1/r\xba\xaaW\
-\x09Vm\x8c \x00e\xd3 \x90\xd8\xb2e\x0b\x1b\x08\
-}\xf0\xde&\xfd\xae\xa4s\xbd\xe7\xb8Z\x0a\xb5\xe0H\
-HSX\xc1#4~>p\xe0\x00\x1b\x05\x87W\xed\
-\xf6\xc7\x15Lf\xec6\x05H(\x22\x8f{\xcbUY\
-\xae5\xfa\x99-JI\xbcMQ\xd4Tr\xef\x8a\xa6\
-\x12\xff\xed\xbf\xfd7e\x87\xcbD\x04\xa3\x84\x17L\xd6\
-m\xdb\xb6\xb1bY\x1e\xa9\x07\x1a\x88\xed\x8c\x0d\xabg\
-yP\x17\x98\xf7\xe7\xce\x9dc\xae\x10\xdc\x8cS0J\
-\x1fx\x1c$\x12eI\xeb[EY\x0c\xac::\xe9\
-\x0a\xea\xa7\xaeB\xc2,V\x5cQ\x8e=\x00\x12\xc6j\
-\xc2%J(\x12\xe5\x04\xc5\xf0\xdd\xbbw\xeb\x0f/\x8d\
-\xf9\xfa\x1f\x0f\x08\xe9X\xd2\x17/^<}\xfatW\
-W\x17+\x9c+#\x889l\xacD{\x14]\xbat\
-\x89\xa1\xc4\x1c\x9f0\xa4\x1dlW\xc0\xcaUs\x00!\
-Y\xbdU\x95\x1c\x09\xf2\x22g\xd6I\xb8O\xd2\x14\xd0\
-8\xe1>s\x8cH\xf4\xcd7\xdf\xfc\xf0\xc3\x0f\x89J\
-\x09\xa9\xb1\x05\x1d\xab\xd0\xa4\x18\x0d\x13\xfb)G\xd7\xca\
-\x95+YAl\x0e\xc8\x19\x1d!5O\xc4\x84A\xae\
-Bj\xa1^\x1aU)\x22\xd6\xa1?\xac\x1a\xa6_3\
-\x18m2\x02\xd8\xff9\x17\x16-Z\xb4b\xc5\x0af\
-\xf5\xacY\xb3\xb2\x07\x5c\x0c\xf3\xd6R\x11\xb1~\x9c\xce\
-UF\xc8\xfe\xc6\x9e\xc3\xa4U0\xaaIKO\xf4\xf3\
-k\xae\x1cL\x04\x85k\xd6\xac\xe1\xb4z\xe6\x99g\x1e\
-\x7f\xfcq\x82Q\xc2P\x02G\xe4(\xa8\x93\xf1\x09\xeb\
-\xe8.Y\xac8\x82\xea\x84\xb3,gbP\xa2R\x96\
-3N\xe0\xa6$h_\xc1(j\xc9Z-\x08e\x86\
-\x0b\xcd\x12\x8cr\x0a\xa7\x82\xd1\xd0\x1dK\x04\xc5Z\xb8\
-r\x0a\x84r\x88\xd2~\xa5\xf3\x04\xa3:g\xcb\x13\x8c\
-2\x9ammmz\xb5\xa7\xa2\xb8W\x08\xbd\xf3\x92\x80\
-k\x82\xcbcaL\x91<\x85\xd4b\xe5\xff\xfe\xdf\xff\
-\xbb\xa5\x86\xc9\x04\x05\xa3\xac\x81\xa2`\x94tjhS\
-\xa5\x96*\x80\xba\x8a\x124W\xc6)\x18e\x8e\xb2\x86\
-\xe9\xbf\xde\x89\xee\xd8\xb1C\xefD\xb3s7\x9bu\x90\
-\xc4\xc4V\xe7\xce\x18\xd5\x12\x928\xe8\x13\xfd\xe8qm\
-\xd7\xae]o\xbd\xf5\xd6\xa7\x9f~\xdaX\xbf.\xc3\xa8\
-)v\xc4\x0abP\x02\x02b\xd0+W\xae\x10\x92\x12\
-\xe1\xb1\xc9\x1e:tH_J\xaa\xf5\x862\x9a@\x15\
-\xaf\x05\x92p\xbdq\xe3\x06\x8d\xf4\xf5\xf5\xd1\x0e\x09\x84\
-T\x01\xee\x95u\xa0#\xcf\xc7\xfe\x8f\x91\x93u#\xda\
-\xef\xe9\xe99|\xf80\x91\xe8;\xef\xbc\xb3w\xef^\
-}\xa8\x80[`\x8bUhR\x13\x06\x82\x93{\xf9\xf2\
-\xe5\xec\x06\x9b7o\xe6\xf0fs\x88ODW\xf3\xab\
-(\x1a\xa0X\x93\xab\x12EHAH\xc2\xc01\xc4\xec\
-\x18\xcd7\xa3MF\x86f&!\x82\xa21\xe2\x03\x8f\
-\x90\xb2\xd4\x9e\xc6\xc2\xd3)\xe58\xcb\xa4e\x8bc{\
-\xe4\xbcS0\xca\x22\xd2{P\x9e\xf1\xb8\xc2\x86\x0d\x1b\
-\x1e~\xf8\xe1\xa7\x9f~\x9a+i\xbd\x0d%H\x8d\xc3\
-P\x9a*\xeaj\x8a\x5c5\x84@Sl\xd1\xb4\x8c\xed\
-\x1c\x8b\xdcz\xc1\x82\x05tF_\xa1\xcf)\xa9\x03z\
-L6I:O\xcb\xeb\xd7\xafg\xf7\xe0\x01\x00W\xc7\
-\x86\x08\xa5\x83\xba\x91\xcaB\xac\xc65E\x5c\x84\xdb\x81\
-\xfe\xebmWI\x82Qbq<\xd0\xde\xde\x1e\x07\xa3\
-1\x89\x19\x19y,q\x13\x5c\x98\xd2\xcffS\x12!\
-\xa1\x17\xd1lc\x04\xa3<\xd0\xcc\x99;\xf7\xcf2?\
-\x98K\x0d\xad\x84N*\x0b\xb1>i`\xae\xb0&\xf7\
-\xef\xdf?\xe6\xc1(wg9)\x12ea?\xff\xfc\
-\xf3z'\x8aP\x0a\xd8\x225\xf5\xd3\xaf\xb9$\x15\xf2\
-\x88-2\xd5\x80\xb2\xb10\xa8$\xfa\xacm\xf6#\xd6\
-\x06\x81\xd1{\xef\xbd\xc7S2\xd1R\xdcN\xc3AT\
-\xc7:'\xc2;q\xe2\x84\xde\x95\x9e9sFa%\
-c\x8a\x9c\xed@\x9c\x0dX&d\xd1\x84S\xa7NQ\
-\xf1\xd8\xb1cH.\x05\xae^\xbd\xcaN\xcd\x16\xa6a\
-\x92\xdfb$\xe1\x9a\x82\xed\x9e\xfb\x12}\xd2\x14\xcd\xaa\
-\xfd\xa3G\x8f~\xf2\xc9'x{\xdf\xbe}\x97/_\
-V\xa4\xdb\xa4~\xd8:Y;<\xcb=\xf1\xc4\x13<\
-\xd9s~\xebhLa\xda\x95\xc9oC\x12\x90<F\
-:\xa1\x9e%\x5cMB\xc7\x85J\xa8A\x06\xb1\x19\x8c\
-6\x19\x0dz\x1c%\xf6\x22\x0e\xe3\xa4\xd3\xe7/\xad,\
-B\xd3R\xd7\x98xrB\x9c\x86\x94~2e\x03\xec\
-N<\xba\xb3;q\xe5\xeez_\xf8\xd4SO\xe9\xab\
-\xe9\x1fz\xe8\xa1\x07\x1f|\xf0\x81\x07\x1e nc\xc5\
-\xe9w\xcfY}\xbe\xdch\xc1Z\xcc\xdc1\x97\x22\x1d\
-\xc9\xb9\xd22\xeds\xd6\xeb-)\xcf\x99<s\xaeX\
-\xb1b\xfe\xfc\xf9t\x8f%\xc6\xf3<\x09\xd5\x1a1\xdc\
-\x85\x90\x17\xa3\xb6n\xdd\xaa`\xd4;FB\xc4Y\xa5\
-!N\xc7H-\xc6\xe5J\x00\xdd\xbeUy3\xca\xe1\
-R\x86`\x94H\x14H(\x18M\xf5'\xd8\x91`\xf9\
-\x0a\x92\xb8<\xa5\x90T\xc8\xc3\x8a\x0b\x90\x02W\xef\xc3\
-\x88\x83\xd1!\xee4&\xb0\x128~~\xfc\xe3\x1f\xbf\
-\xf8\xe2\x8bK\x96,\xd1\xbb\x10+\x0b\xab+5GS\
-\xf6g\xdd\x11\xbb\x9e\xbaz\xb7\xf1\xe9\xa7\x9f\xfe\xfc\xe7\
-?\xff\xedo\x7fKtbe\xa3\x86[\x13\x86\xf2\x9c\
-\xc7\xba\xba\xff\xfe\xfb\x09F\x89DYf<\x05\xaaW\
-\x8a\xaa\xa5\xecd%\x22\xee6\xe9T\xd6R\x95\xea\xf1\
-\x15\xa4\xa0,i\xbd\xb1#\xd8\x226\xfa\xc5/~\xf1\
-\xf6\xdbo\x93\x1e\xfdR/\x03n2\x09=\xc6\xe0|\
-V\x1di$^\x9a\x05\xb7\xe0\x01\xf6h\xce\x06\xc6\x85\
-1b\xdd\xea\x03F\x8c\xdd\xca\x95+\xf5\x134\xd3\x8e\
-\xc8\xb6)\x0f+F\xd9\xbbw/aq__\x1f-\
-\x13\x193\xbbN\x9f>]\xfe\xcf\xe6\x96\x13F\x84#\
-\xf3\xe5\x97_~\xf5\xd5W\xd9L\x19\x11m\x05\x5cA\
-\x03\x11\x0f\x07\x03!<\xadD(4\x929Q\xc1D\
-\x81\x94\x9a\x90Zh))\xd5#\x07\xc7\xcc\x1f\xfe\xf0\
-\x87\x9f\xfd\xecg\xec!\xd7\xaf_\x97f\x93&u\xc2\
-\xd4e\x83z\xe4\x91G8\xe3\x9e{\xee9\xce\x0bB\
-\x04+\xab\xccC\xbf*\x11\xe33_(-M\x900\
-Fr\xf6\x22}^h\xcf\x9e=\x17/^\xe4\x90\xdd\
-\xb4i\xd3\xc3\x0f?\xbcf\xcd\x1a\xce\xac\xb0\x9e\x92\xaf\
-\xe4d\x1bT\xbcBEE\xa2\xde\x02\x90F\x22a\x0d\
-\xb2\x0a\xaa\xeb\x09\xae\xd2\xd1\x19DV?\xaa\x22n\xe3\
-I\xfe\xc3\x0f?|\xe7\x9dwx\xd8\xe3\x90\x1a\xe5\xc3\
-\x1e\x1b\x08\xc7\xc1w\xbe\xf3\x9d\x1f\xfe\xf0\x87[\xb6l\
-\xc1:\xccTQ\xb0#\xe9\x83\xae\xe0\x9d\x14\xa9\xacp\
-e\xf0t,\xa4\x16[=\xfb?~&\xc0\xf8\xfd\xef\
-\x7f\xcf\x03\x00\xfb\x86\x15O8\x8c)C\xfc\xfa\xeb\xaf\
-\x7f\xff\xfb\xdf_\xbdz5\xcf\x18\xea\xad[G\xd6A\
-\xe8r@\xe2W\x15A(I\x88K\x8b\xc8\xad\xa2\x84\
-\xcb\x19\x14%\x86K\xad\x1b\x8f\x15C\x06\xa3B\xd9\xd8\
-\x17E~qe\xf0`\x94\xb9\xf2w\x7f\xf7wc\x18\
-\x8crw\x06\x9e\xf1&\x94\xa1\xff<\x8a\xad\xad\xfc\xcd\
-O\x7f\x1c\x89\xc7\x00RYp\x13$\xf7\xd2\x94\x9ag\
-\xa5\xef\xb5R\xd5\x05i\x96\x07\xeb\x9c \xe9\xddw\xdf\
-\xfd\x97\x7f\xf9\x17\x0eQVK\xaa\xcd\xa9\x01\xaef\x14\
-\xb82g\xdc\x1b\xb9\xc8|\xaeJ$\x9bq\xd8\x8eY\
-\xba\x8f>\xfa(\xc3\xc7\xf3z|H8\xd9fi\x81\
-IE\xc4y\xf0\xe0A\xc2}\x9e\x86\x99`\xcc4v\
-R\x9e\xef\xb9N\x8d\xb8\x7f\xe2a\xedo\xd8\xb0\xe1\x95\
-\xc0\xc6\x8d\x1b\x19\x1d\xc6HE\x8c\x02i\x8d\x85\xae\x1a\
-\xc70\x9e\x96\x88\xb3\x0e\xca\x0e\xd9Ti\x0a\xa9y#\
-\x8c2\xa7fww\xf7\x14\x0bF\x09;\xc0\xfd\x09\xd8\
-\xcb\xa6\x81\xbd2\xbc\xc9\x18\x82\x93\xdb\xda\xda\x08\x049\
-\xe3^x\xe1\x85\xa2`\xd4\x91\xdcI\xf6\xa9\xe8@\xd4\
-\x90\x99j\xb5r2w\x03\xa4\x19\xcd\xde\xde^\x1e\x8c\
-\xcf\x9c9\xc3Y\xa0\xe7\xf6e\xcb\x96i\x97\x93N2\
-\x09B\x9a\x8c7\x95d\x03j\x9f\x84\xe4\xb9\x14\x95z\
-kJ\xc4\xed\xa8ef\x1a=\x04\xfa\xc6\xfe\xf9\xfe\xfb\
-\xef\x13\xc6}\xf6\xd9gl\xaa\xa3\xd9<\x09F\xb1\x91\
-\xa7\xd9\x1f\xfd\xe8G\xdb\xb6m\xe3,\x8e\xef\xeb\xe9\x18\
-\xefj\x96\xb8\xae\x12\x10\xa7\xa9\x0bX\xc1\xf1\xbak\xd7\
-\xae\xbf\xff\xfb\xbfg\xa3\x98\xf4`\x948\xe4\x07?\xf8\
-\xc1k\xaf\xbdFp\xa2w4\xc8\xddL\xb2\x8e\xfa/\
-9 \xf1\xab\x8a \x94$x\xa9\x12Y\xa4\x1cW\x11\
-\xd2wy\x03\x04\xa3?\xf9\xc9O\x08FY0\xa9`\
-\x14\xdc\xc8\x94\x17j;Ex0\xba{\xf7n\x82\xd1\
-\x7f\xfb\xb7\x7f\x1b\xab`\x94%\xdd\xd9\xd9\xf9\xf8\xe3\x8f\
-?\xfb\xec\xb3\xf4\x7f\xe9\xd2\xa5s\xe7\xce\xa5\xf3\xda\xe5\
-Q\x88\xbb\x11\x8f\x87\xcb\xe3\xfe\xa7\x8aR\xc4U\xe2Z\
-\xd9\x16d/'({\xd0\xc7\x1f\x7f\xcc\xda\xe0\xb9\x93\
-4\x12\xa9M=R>\xa9\x1fUdw\xd6\xe7\xa8\x98\
-\x87\xa9\x89'\xb2\x8d\xe3j\xfc\xac\xf7\xa0<\xd9\xf7\xf4\
-\xf4\xb0\x1f!\x14\xa6\xd4d\xf8\xb0|\x88A_}\xf5\
-U\x82Q\xa2R6VV\x93\x95\x054dJ\xcb\xd5\
-\xb1\xc3\x95N\x1df\xaa\x02J\xa7\x06(%\x09\x8a\x83\
-{\xb4\x96\xd2\x14\x0bFq2s~\xfe\xfc\xf9Lx\
-\xc5%2\x93\xd8\xe5\xf2\xe5\xcb\x188\x9ah\xa0I\x16\
-<L0\xfa\xb5\xaf}M\xc1\xe8\xc2\x85\x0bs\x83Q\
-\xdc\x1e\xe6]z~&\xa1hA0\xaaD\x10\xdb\xd4\
-\x8d5\xd9\x94x6f@y<\xa6h\xd6\xacY\xc4\
-\x01~<q;U\xa1\xbeV\x14\xe9\xf8\xea-\x17!\
-\xcd\x5cr\xeb\xc6B\xd2\xca\xd2I\x02P\xc2\xd0\xdf\xfc\
-\xe67\xac\xb2\xae\xae\xae\xd1\x1cU\x1e\x8c\xfe\xf0\x87?\
-\xdc\xbe};\x1b\x88\x1bB\x22\xee\xb0\x84N\x9c\x95Z\
-\xac\xec\xe9X\x08\x89\x0d\xe1\xd7\xa3Y;\x0a0\xde|\
-\xf3M\x82\xd1I\x5cA\x1e\x8c~\xff\xfb\xdf_\xb5j\
-\x95\x07\xa31H\x84\xfao\xd2j\xc3%wC\xe2\x22\
-]\x8b\xf0\x06I\xc4\x9a\x92#\xf1O0\x0e\x97\x89\xfe\
-\x05\xa6\x96\x96\x16VK\xca\xda\xac\x0bH\xc7\xd9\x14q\
-\x11\xde\x84\xdb\xe1\xf3\xc5\xfb\xf7\xef?z\xf4(\x81\xa9\
-\x95\x8d\x08\x1ag+\xc1\xa1s\xc2\xb78\xe9\xeb0\x88\
-f\x14\x89\xc6{\x01h<|\x18$\x04\x1f\xb0\x18\x09\
-SE\xd4REO8.\xe7\xeau\x81\x0d\x88\xe3s\
-\xdf\xbe}\xef\xbe\xfb.\xf1(\x91(\x92\xa4\xc2\xd4E\
-\x86\x8f\x00\xe6\x86\x8ea\xa6\x87>\x8a\x9a\x85\x07\xf7\x14\
-\x92\x9f<y\x12?\xf3d\xcff\xa4\xd6\xac7MF\
-\x0ak\xbf\xa3\xa3\x830t\xfd\xfa\xf5DK\x1c-\xa9\
-\x05\x95Z\x02)\x9f\xa7J\x1d\xe4*\xd2\xd5k\xb9\xdc\
-\xf1\xac\x12h\x12\xa8\xe9\xb3\xd7{\xf7\xeem\xd0\xcf\x8c\
-\xe2U<\x09l\x5c\x84#\x0b\x16,\xd8\xbau+O\
-\xd1\x0f?\xfc0O\xd1l\xbc\x9b6m\xe2\xdc\x22B\
-\xc5^\x82\x03l\xa7\x0a\xca \xff7\xe7\xf6h\xc0\x9f\
-\xb8\x9d\xc7]\x5c\xbdf\xcd\x9a\xa2\x87^wr\xca\xdb\
-(\xc7\xb34N\x83\xb2\x5cA\x9a\xa0\x22\xb2\xc0\xb8s\
-wb\x14\xce,I\x5cA\x09\xfe'\x91*\xaa\x87X\
-\xb9F\xc5\xdc\xc9\x83\xbe\xd0M\x99u<\xd2_\xb8p\
-\x81\xc0\x94\xc3z\xc4\xf3\x8d\x19\xdb\xde\xde\xbey\xf3f\
-f8\xf3\xdcC\xb1\xf8\x9a\x22\xe5vt\x84\x84P\x94\
-v\xe8\xf0\xa5K\x97\x0e\x1f>\xcc\x16\xc1\xa1\xc0v1\
-\xe2\xfe\x8f\x1e\x86\x1b\x0f`\xbe>3\xaag\x8f`\x90\
-\xf5\x5c\x89X\xe2x\x91_\x95\x88\xd3~\xcd\xe2\xa5\xc2\
-\x85q\x1a\xcf\x8c\xf83\xa39kf<\xf0\xee\x8ax\
-,I\xc7Y\x90r\xaa\x0aYI\xa4\x0f.\xe7\xca\x89\
-\xc2t\xe7\xea\xf2\x91\xc1\xb8\x12t\xaeX\xb1b\xcb\x96\
--l\xe5l\xe8\xf7\xdf\x7f\xff\xf2\xe5\xcb\x09L\x99\x04\
-\xd9\xc5\xac,\xd7\xdc\xfb\x86n&X\xbe\x80\x94B\xb6\
-\x8agI`c__\xdf\x91#G\x08C\xf7\xec\xd9\
-s\xfa\xf4\xe9F\xff\xbd\xa5\xf1\x86x\xf4\xfa\xf5\xebl\
-\x82\x97/_fO\xa9\x13\x94\xa9\xc2\xbe\xc3\xbc\xb2\x86\
-\x9a\x8c\x05\xc9\xe4\x8e\xa6kj\xea\xaa4\x85\x95E\x9b\
-@\x0aW\x8b\x95sqMPk\xa9\xad\xbc\xe1 \x04\
-\xe1T&\xb8g\xcb\xda\xbe}\xfb\x83\x0f>\xf8\xc4\x13\
-O|\xe3\x1b\xdf\xf8\xe67\xbf\xf9\xe2\x8b/\xeao\xe4\
-<\xff\xfc\xf3\xcf=\xf7\xdc\xb3\xcf>\xfbL\xf8\xe3\xe3\
-\xe8\xdcw\xdf}(s\xa4\x11\xa7.[\xb6\xac\xa5\xa5\
-\xa5q=P\x12\xe2Y\xa4i&$\xc9\xc5\xab\x98j\
-\xf5Tgf\x0a\x05\x1c\xba\x82j\x09=T\x10\x93\xc5\
-\xc7\x93\xb5\x15Pk\xa0,\x9b\xa1\x12\xb10\x8bJc\
-r\x851\xaa\x98\x85\x22\xba\xa7o\xdd_\xb7n\x1d\xcf\
-\xa2tUU\x86\x0b\xd6Q\x97\x03\x1a\xf4YI\xb5/\
-\xabAw\x14\x92\xe4\xe2\xfa\x22VV\xdd\x18\x0e\xdck\
-\xd7\xae\x1d=z\xf4\xf3\xf0\x97\xc6'7\x12\xcd\x12\xdb\
-B\xda1Q5\xb2\x08\x94\xadS\x0d\x94\x8e%\x90\xba\
-QQk\xf53A\xc1h0-Y\x09\xca\xa6\xfa\xad\
-R!\x89+\xb8\xd0\x13J\xbb\x02\x09\x9a\xed\xef\xef'\
-z J\x1b\xc1\x8b\x0dZ`\x8a\xb3`x\xbe\xe4Q\
-\x83m\x9d]\xfb\xb5\xd7^{\xfd\xf5\xd7\xd9\xc47l\
-\xd8\xd0\xda\xda\x8aB|G%br\x85)\xa4S[\
-S6\x06[\x07\x8d\x05m\x22d1\xf0\xca\x95+_\
-|\xf1\xc5g\x9f}\xd6\xd5\xd5\xa5\xcf2J\xb3I\x11\
-r \xdb\xca\xb0p\x9f7\x19\x0fX\x08\xd9\xb5\xa0\x91\
-rL\x1a\x88\x95\xb3\x15\xc1\x07+4l(+y\x11\
-\xd2\x04\xcb7\x08D!\xb3g\xcf&\x94\xe4\xb1\xf9\xe5\
-\x97_~\xe3\x8d7~\x14\xf8\xde\xf7\xbeG\xd0I\xa0\
-\xa9O\xa7tvv.Y\xb2\x844\x01(;\xdbw\
-\xbf\xfb]4\x7f\x18 \xf1\xea\xab\xaf~\xfd\xeb_g\
-\xd3kkkc\x03d\x1bt\xd8\xf4\x88u\xecfM\
-\x86\x82\xe9\xe7\x98\xa8\x1a\x9bd\x11\x92\xe7V\xa1\x94\xe0\
-\x12\xff\x13l\xea%\xb6\xc7\x9a*\xf2\xac\xd2\xc2\xdb$\
-\xe1\xe9\x22\xfc\xa6\xea\x00(+\xb2\xd5M)`\xa2\x80\
-\xee%LT\x01\x09\xbd\xa2\xf3<\xed0QW\xaf^\
-MTJ\xd6\x8a\x87\x09\xce\xe0,\xd6\x94\xd6\xeb\xe7\xec\
-\x1dk\x10:\x98`6T\xa0HW\x8a\x82\xa2\xa1R\
-\xbd\x16=x\xf0 \x07\xee\xa9S\xa7\xae_\xbf.\xe5\
-\xc9%\xee\x83\x8c\xca\x12\x17IS\x04\xb3\xac\xba\x15W\
-\x90\xd0\x91\xa6\xb0\x1d9@\x96R\xaf\x22\x05\x08\x95F\
-\xce\x04\x05\xa3\x22km\x11\xb5\x0ds/\x00\x9a\xb7\xc2\
-\x1f=?|\xf8\xb0^\x13J^\x0fL\xee9s\xe6\
-\xb0H\xf4^\x81\xcd\x9am\xfd\xe9\xa7\x9f\xfe\xe67\xbf\
-\xf9\xado}\x8b\x0d}\xfb\xf6\xed\x0b\x16,P$\x9a\
-\xc2\x9a\xa8\x1e0\x13\x15[*yh\xc0\x90\xdc1i\
-\x90[\xa3\x01e\x99\x07\xac\x8d\xabW\xaf\xea\xcb\x86\x9a\
-\x91h\x93F\xc4\xa6x\x05\x9f\xe1\xb9\xa0\xe0\xd7\x98P\
-\xd50Q5\x92\xfbU\x89,\xb5\xef^Z8\x959\
-\xdaw\x84/\xc9\xe2\x99\x99\xfd\xea\xa5\x97^\xe2\xfa\x8d\
-o|\xe3\x91G\x1eaC\xeb\x08_\xc0\xae\x98\x92(\
-S\xa78\x11\xeac\x8f=\xf6\xdcs\xcf\xbd\xf8\xe2\x8b\
-(\x0b\xd2\xecu\xd4b\x03DA\xb0\x1f\xae[\xb7n\
-\xf1\xe2\xc5E?tn\x12\xc3\x14\x0a\xc7\xb4\xbdw\x04\
-+\xa8F\xf30\xc6\xe5~U\xc2!\xe0Jb\xae\x0c\
-\xd2L\x11\xcb\xb3jq\xaf\x8az\x08\xa9Z\xf5\xe0\xad\
-\xe9\xa6\x8e\x8a\x80\x00\x94\xa3\xb6\xbd\xbd\x9d\xe9\xc4\xb1\xab\
-\xa2a\xc1$d>sX\xfbgN\x98\xd8\x1e\x8f\xd6\
-h0\xe9G\x84I#\xbc\xf3\x9ep\x18\xd0;w\xee\
-\xf4\xf4\xf4\x10Z\x10c\xf4\xf5\xf5\xfd\xa94\x7f\xdc$\
-\xd5[3/\xe3\x8d8\x1d\x93\x8cJ\xdd\xc4\xfa\x9e\x0e\
-\xcdT\x81\x10\x8fYf\xf8L\xdc\x8f\xe9\x85\xe5k\x92\
-kg\x8clN\xfc\x114\x09F/\x5c\xb8\xd0\xd5\xd5\
-\xd5\xdd\xdd]\xff\xa7'Y\x12mmm\x9b7of\
-\xfb\xd6_\xec\xfd\xc9O~\xf2\xc6\x1bo\xb05?\xf0\
-\xc0\x03l\xf4\x8b\x16-\xd2O\xe7\xbd\xdb~_\xcfz\
-:F\xfau\x1a\x9b8%C\xaaHK\x8e{\x11j\
-_\xbcx\xf1\xf8\xf1\xe3\xfe[5\xd2l\xd2\xa4\x81\xd0\
-\xc2\x89\xb1\x82\xeaU\xe3\xe9X\x08\xa9l\xfdPQ(\
-\x9b\xbau\x031s\xe6\xcc\x8d\x1b7\xf2\xcc\xfc\xfd\xef\
-\x7f\xff\x95W^y\xea\xa9\xa7\xd8\xc7V\xae\x5c\xc9Q\
-\xdd\x19\xfe0#G\xbe\xde\xa5\x01\x1b\x1d\x9b\xd8\xf4\xe9\
-\xd39\xcb9\xc2)eg#\xca\x5c\xb2d\x09\xfak\
-\xd6\xacy\xe8\xa1\x87\x08d\x7f\xf4\xa3\x1fi\x0f\xfcq\
-\x85\xd7^{\xed\xc9'\x9f$\xae\x9d?\x7f\xbe\xe2Z\
-\xdat\xef5)B\xf3J\x98(\x9a{\x8e\xcb5L\
-\xa0t(\x1c\xb9\x93Su\xebiM:\xa0\xb4_\xb3\
-\x98U\x19RER\x16&\xfa\x7f\xff\x0f\xd3\x98\x8a\x5c\
-\xad`\x98P\x91Y\xcd$\xe7I\x89\xab\xff\xf2\x89@\
-AW\x11\xa7\xebA=\xb4L5D\x9f\x04\x15\xfd\xfd\
-\xfd\x1c\xbe\xa5\x8aD\x85\xe5#rmO9\xc7*\x17\
-\x98\x5c'\xd9\x16F\xd9\xe0\xc4=\xf2\xaa\xa3\xf5\xcf\x92\
-`\xa9\xd9\xa6\xb4\x90D\xd0\x1a0)\xd9(\xd9\xa0\xd9\
-+\xeb\x0c\xcc\xa9\xc2S\x1a\x1b\xfa\x13O<\xc1\x9e\xce\
-^\xac\xf7\x0az\x1b\xcaN\xcd\xe6\xcb\xf6\xad\x0d]w\
-\xb1\x9a5I\xa9\xa9\x22X>\x10KRE\x8et\x80\
-\xb4\x99\x1d\x22\xd1s\xe7\xce}\xf6\xd9g;w\xee\xfc\
-\xf2\xcb/K\xf5\x94\xd6\xa4I\x9d0\x93Y\xa4\x0eY\
-\xcdsG3\x1f\x94\x96\x10\xc2\x22\xb0\xe5\x1f\xcbG\x86\
-7\xd5\x88\xcc\x9b7\x8f\xbd\xeb\xeb_\xff\xfa\xf3\xcf?\
-\xff\xc8#\x8f\xe8E\x11\x1b\xe0\x8c\x193\xd8\xb5\x08=\
-\xd1\xc1@w/\xdb\x1d[\x19rH~\x00\x1f\xfd\xd1\
-\xc8\xb9s\xe7\x12\x95\xdew\xdf}l}l\x80/W\
-\xf8\xcew\xbe\xc3\x95]\xf1\xb9\xe7\x9e{\xec\xb1\xc7\xee\
-\xbf\xff~\xeeH\xf0\x8a>\xad\xa9\x1bM\x8aHfj\
-@C a2\xa7C\xb8\x89\x03u\x15~\xc4x\x22\
-Fu\x87\x85\xd5\x0c\x98\xa8\x18\xd3\xab \xa1:\x9fB\
-EY\xb2\xa5\x92\x08\xb5I\x82\xd3\x0ap\x88t\x86\x0b\
-\xed0iy\x94b\xbarv3{\x91\xe8\x16\xa6\x11\
-\xd9\x12\xa7c\xa4V'j\x9c\x0e\x7f\x15\x18q\xcf'\
-\x18u\xdb2\x11\xe6\x82\xe18!V\x1en\xdd\x110\
-\x11\xc1\xa8\xcc\xd0J3\xd1P\xe4z\xd3Q\x83\xa0,\
-\xfb,\xbbsgg'\x1b\xa5$YP\xf6\x8d\x98-\
-\x98g}\xf6V\x9e\xfb\xd9\xd0\xd9g\xd9\xcd\xd9g\x99\
-\xe5\x0b\x17.d[\xd7DW-%\xd4\x1f\xd2CZ\
-\xa1\xd2\xa4\xdaPj5\x14T\xcaMY\x00\xc0\x1a\x1e\
-\x18\x188\x7f\xfe\xfc\xfe\xfd\xfb\xdf\x7f\xff\xfd\x8f?\xfe\
-\xf8\xe4\xc9\x93<\xae\xd5\xf6R\x93&e\x83\x19{\xfb\
-\xf6m\x9e\xa3zzzx\xb8\xd2\xfe\xae\xd9.\x05P\
-V\x98\xa8zC\x90<.\xbd\xab\xe0H^\xb0`\xc1\
-\x8a\x15+\xf4*\x94\xb4\xbf\x07\xf5\xc8\x06\xb5\xd4\xe6\x80\
-P\x0ah\x02\x9b!W\xb2\xecuD\xb1mmml\
-}l\xa14H\xcbb\xc3\x86\x0d\x8f>\xfa\xe8\x8b/\
-\xbe\xf8\xfd\xef\x7f\xff\x87?\xfc!\xd7o|\xe3\x1b\x9b\
-7of\xf3\xa4\x0f\xb4fM7\x89\xe60nwT\
-\x14#5\x0d\x84\xa3!\xcb\xc5\xaa\xd5\x8dW)\xea@\
-\x96Xs\x04w\xcc\xa2\x06\x1d\xc5\xa0\xacz}\xb3\x98\
-~\xaf\x03\xb9i\xd7\x0d}\xc3Q:\xbe\x99\xbd\xea\xaa\
-n\x01d\x85\x94\xc7\x10\x1a\xd7)l\xf9\xd2P\xbf\xbd\
-#s\x8b\xda\xcf\xa2\x22\xe9d\x19\xcd\xb60A\xc1h\
-\xf2H\x9e\xf7\xdb\xe85`\x12x\x22&\x96(\xcdD\
-a\xae\xdf\xbau\xabh\xc6\xb0\xed\xea\x05\xc0\x9a5k\
-\xd6\x87?k\xfb\xe0\x83\x0f\xea/\xa7m\xdf\xbe\x1d9\
-\xa5z\xaf\xc0\x5cG\x99*j?\xf1}@\x12%t\
-\x8d\x13)b\x85\x18\x09k\x80A\xdc%\xcc\xfc\x04\xd2\
-A\x98|\x97\x13\x91\xe8g\x9f}\xf6\xce;\xef\xec\xdc\
-\xb9\xb3\xf9{KM\x1a\x14\x8e%\xce\xa4\xe3\xc7\x8f\x7f\
-\xf1\xc5\x17Li=Pi\x9e\x0f\x0b\xad&_Sq\
-\x96\xab\x08%\x85\x0c\xa9PN\xe8vGG\xc7\xbau\
-\xeb\xd8\xca\x08C\xd9\xb5\xb4\xaf\xaaH:\x90\xd8_!\
-+\x01\x09A\xce\xf7c\x9e(S\xe8\xa5)\xb1)\xcf\
-\xea\xec\x93\x84\xa4\xdf\xf9\xcew\xbe\xfd\xedo?\xf7\xdc\
-s\x0f=\xf4\x10\x1d\xe0\xeeTQ#M w\x1a\x9b\
-\xbb#p\xb5P$j\xd2<\xac\x89\x91\x12\x16\x96a\
-\xa2\x0c\xa9\xd2\x1a\x9a5\xc8vU\xcdrB\x11w\xea\
-g\xdc\xdd\xdd\xdd,\xf9\x03\x07\x0e\x9c=wn\xc4\xdf\
-3*\xb7\xc4XAdl*=,\xb2\xb5\x94\x8do\
-T\x12R\xe6\x83:\x0f\x96\xaf M\xc7\xa4C\xe1\xca\
-J\xa4\x90<(V\xe1\xa5#c\xdc\x83QV\x1d\xfb\
-ZkkkKK\x0bq\xdep\xfb\x9au\xae$\xc1\
-\xed\x09\xcc\xf8\x1b7n\x9c={\xf6\xc8\x91#\x97.\
-]\x92\x8e\xe0^\xec\xd4\xdc}\xde\xbcy\x9b6mb\
-\x1b}\xed\xb5\xd7x\xc4\xff\xd1\x8f~\xf4\xfa\xeb\xaf\xf3\
-\x94\x8f\x90\x9d\x1d\x85xS\xa0\xa26\x0b k\xa9\x90\
-V\x80\x08A\xd1\x86\x04\xa4\x10\xeeiH.L\x94\x19\
-?5\x15\x932WB\x16\xf3\xb9s\xe7>\xff\xfcs\
-\x22\xd1\xf7\xdf\x7f\x1f3\xafM\xea\xdf\xc6m\xd2d\xc4\
-\xb0\x82zzz\x0e\x1f>\xcc\x93\x15!)3\xf9\xab\
-\xca_\x13\xa0T\xeb%\x8b\xea\xa6\x90\x5c\x0a1*\xcd\
-\xa2\xbb\x08I\xacB@\x92\x86`\xf1\xe2\xc5<N\x13\
-\x8c\xea\xfb\x98\xb4)!\x97idA\x9a\x92x\x9a\xab\
-\x8c\x15\xbek\xb9\x8e\xe4Jp\xa5T[\xf7\xc2\x85\x0b\
-yb_\xb5j\x15\x81\xe9\x0b/\xbc\xf0\xbd\xef}\xef\
-\x95W^y\xf4\xd1G;;;\xd99C\xd5\xbb\x1a\
-\x9c\xc0A\xc3\x83\x01\xd1\xb9\x5c\x1a\x1c\x99\xff\xbeSU\
-\xe2\x84\xe3Y\x15\x8d\x06\x8d\xa9&\x83\x8fo\x8axn\
-\xa4\xd2\xa0l\x0au/\x85\x95U\xc3}9\xb9\xf4\xbb\
-\xb6\x87\x0e\x1d\xda\xbd{\xf7\x07\x1f|\xc0\xaa\xbfr\xf9\
-2O\xa4\xa64R\xd4\xbd\xdcN\x86\xbe'X\xbe\x9a\
-\xa2\xde\xc6\xf2T\xdd\x1a\xadM\x22\xc1\xf1\x86$\xde\xcf\
-\xdc\xde\xba\x9a\x12\xa1^\x82\x845P\xb3\x0e\x92lE\
-I\x84\x89F\xc4\xf8\x06\xa3\xac\xcc\xd9\xb3g\xeb\x95$\
-{(\xcb\x95u\xab\xe5*d\x9e\x12J+\xe1\xa84\
-\x056\xd3\x08W\xad4\xfd\x82\xb9\xbe\x9f\xdc4\xc2\xad\
-\xe7\xcc\x99\xc3v\xb9v\xedZ\xf6\xd0g\x9ey\xe6\xe5\
-\x97_\xfe\xeew\xbf\xcbN\xfa\xea\xab\xaf\x12\x98n\x8d\
-\xbe5\x17\xa8\x12V\xae-]\x09I\xb3rba\xd2\
-t\xa5\xdb\xd2\x11\xb1<\x85\x97B\x9c\x8e\xa1\xa2 \xe9\
-\x12\xee\xab\xcf\x89\x12\x89\xbe\xf7\xde{;w\xee<v\
-\xecX__\x1fr\xe94i\xd2p\xb0Z/^\xbc\
-\xd8\xd5\xd5\xc5\xc4\x1e\x18\x18\x88\xd7\x17\x84E0\x88\x84\
-)\xbc(\xac\xbc4\xd2q\x8a\x1aq\xb2UJ\x0eq\
-\x0f\x9b\xaa\x1e\xa1\xc9\xd2\x7fm\x86X\x1a{\x12\xb2\xa6\
-!\x11\x96\xafT\xa7\x96\x06B\x12\x15\xa9AJ\xd9$\
-\xa7\x87\xdf\x7f\x22*\xdd\xb2e\xcb\xd3O?\xad\xdf\xd9\
-_\xb9r%B)\xdfm\xe0\x7f\xce\x17\x9e\x07\x18\x0b\
-\xe2\xf5\xa5K\x97\x12\xacwtt\xe0(}\xfe\x81\x83\
-N\x87\x9d\x13\x1c\x9f\xa0\x16<\x01\x92\x83\xe5\x87\x03\xc3\
-$,_\x80\xdd\xa0\x82I\xc7\x08oP\xdd\xe0z\xeb\
-\xd6-\x96\xf9\xde\xbd{\x7f\xff\xfb\xdf\xff\xfa\xd7\xbf\xfe\
-\xd7\x7f\xfd\xd7\x0f?\xfc\xf0\xc4\x89\x13\x9ch\xd2\x1c\x01\
-\xea9\x90\xd6\x8d<\xadl\x16\xe9;.Q\xa9\xf0\xac\
-\xb7S\xd4Z\x09\xf1>\x0b\xa5%\x848\xed\x86+\x01\
-q:&\xaeU\x04:1V3`\xa2\xe13\xbe\xc1\
-(\xcb\x92\x80o\xdb\xb6m\xf7\xddw\x1f\xcb\x95uk\
-\xfd\x8dz\x8ca\xdaC\xe3\x84\x95\xd5\xc4\x1b!\x11\x16\
-\xbf}\xfd\xaf\xb6\xcey\xf3\xe6m\xde\xbc\x99\xe7\xf8\xd7\
-_\x7f\xfd\xfb\xdf\xff\xfe\xf3\xcf?OH\xbaz\xf5\xea\
-\xe5\xcb\x97\xeb\xb3\xa1ss\xfe\xa2RU\xc7 \xc9g\
-PQ\xdc\xc9\xb8\xcf\xb1\x1c\xe2\xa2\x22\xb4U\x91\x88\x95\
-9\x1bx\xb2\xbcp\xe1\xc2\xbe}\xfb\xde~\xfbm\x82\
-\xd1\xe6;\xd1&S\x83;w\xee\xf4\xf7\xf7\xf7\xf6\xf6\
-\xea\xc7\xf4\xf1\xb2JQc\xb6\xab\xc8\xeb\xea:\xe4\xea\
-p}\x11\xa7\x1b\x02\x0c\xec\xe9\xe99\x7f\xfe<\xd7\xdc\
-7L\xdaLd\xa6\xa7\x91K\x22\x9d\x18\x1a\x94\xd3\xbc\
-T\xd98\x01\x94\xd2\x14q0\xe1\x17\x9b'\xbb(\xfb\
-\xb9><j\x1aw\x07\x9c2z\x18X\xb6l\xd9\x03\
-\x81\x8d\x1b7r\xc0=\xfe\xf8\xe3\x8f>\xfa(\xe7\x0b\
-\xfeAA\xf1(\x1e\xd35\xf8\xde\x9e\x19\x8457F\
-\x8414$\xd1]\xb8\xa3n*\x1d\x15\x81\xd2\x92\xc7\
-\x09'+I\x11n\x954\xa2+x\x15\x0eq\x22\xd1\
-\xcb\x97/\x1f<x\xf0\xcd7\xdf\xfc\xe5/\x7fI0\
-\xfa\xce;\xef\xe8\x8f#\xea\x81g4\xf8\xad\x85\xdf\xd7\
-\xe5\xb1\xd5)\x5c\xce\xd5Q\x91\xa3v\xc0\x8a\xf3\xda\x99\
-t\xac\x8b\x15?x\x22\x85t\xc0\xb3.\xf4XKH\
-!&W\x8e\x84\x8a\x22\xa5\x90\xca\x8e\x80\xf1\x0dFY\
-\x96\xed\xed\xed\xeb\xd6\xad[\xbbv-\x8f\x8f\x9a%\xc8\
-5\xc0\xde\xf5\x1a\xe3-\x0b\x85$\xaeLBk\x9e\xa7\
-\xf3\xce\xceN\xdde\xc5\x8a\x15l\x13<\xa4n\xdf\xbe\
-\xfd\xd9g\x9f}\xe5\x95W^}\xf5U\x9e\xe3y\xa0\
-\xe7\xb1Uo\x14\xfc\xe1US3jP\xad\x0ev&\
-\x14\x0eb\xd2\xb1\x83\x11\xe5D\xf9*|C\x13\xed\xab\
-?.$\x12\xfd\xf4\xd3O\x89Dw\xee\xdc\xa9\x9fi\
-\xba\x13\x9a4i\x5c\x98\xc6\xccpBR\xae\x9a\xd2a\
-y\x15\xae/\x95\x82\xe5\xab\xa9Q\x14S\xa7Z\xf9!\
-\x0c=s\xe6\x0c\xd7\xdb\x95?\xab\xa8\x83\x81\x84l\xcc\
-%.MZ\x89\xa0\xae\x15T\x8a\x90\xa8A\xa1\xb4\x14\
-\x14\x8d\xb1\xe5\xb2\x9d.^\xbc\xb8\xb5\xad\x0d\x89\xd4\xa6\
-<\x1c\x1c\x1cgD\xe1\x04\xa0\x8f=\xf6\xd8\x8b/\xbe\
-\xf8\xd2K/=\x1f\xe0\x88y\xf0\xc1\x07\x97,Y\xc2\
-\xf9\xe2\xc7\x0aP\xcbR\x19\xe2\xa2\xd0\xfch\x89G\xcd\
-\xda\xad \xa1\x97:^\xea:.\xc9\x22y\x12\x86D\
-\x81\x88\xf4AiD\xb7\xef\xdc\xe1\xe4\xfa\xfc\xf3\xcf\xdf\
-}\xf7\xdd\xf7\xdf\x7f\x7f\xef\xde\xbd]]]\x17/^\
-\xbc~\xfd:\x15\x93\x86F\x8a\xdfT\xe8\xa6q\xc2I\
-:\x14\xa8'\xeb\x984@6\xbeW\xa9\x18Y\xf7\x82\
-\xf3\x86\xc6\xb4\x0b\xf4\xad,3\x16\xceh\x86x|\x83\
-Q\x96%\xdb\xd6\xbc\x00\xabTN\xd45E2\xfe\x19\
-\xac\xacB\xcaxe\xb9\xc5\x9c9s\x885\xd9\x17\xc2\
-_\x15I\xf8\xf1\x8f\x7f\xacO\x85\xde\x7f\xff\xfd+W\
-\xae\xd4{\xd08\x06\xe5\x9am?\xef\x9eu\x11\xc6\xc5\
-P\xd6\xe5J\x14\xa1\xfb\xa1\xa6\xe5\xad\xb3\x19\x88D/\
-]\xba\xc42~\xeb\xad\xb7\xde{\xef==S\x22W\
-\xad&M\x1a\x1d\xcdsM{\x13M\x06a\xc9'\x0f\
-\x81\x96o\x04n\xdd\xba\xc5n\xa0\x97\xca\xf4\xdc;/\
-[\x94\x06\xa5%\x14.t$\x07\xcb\x17`J\x01n\
-\xc7.\xca\xae\xbeh\xd1\xa2\x0d\x1b6l\xdc\xb0\x81\xa8\
-\xd4\xfb0\x95\xc0X\x8e\x09\xc0^\x99\xbcb\xc5\x8a\xc7\
-\x1f\x7f\xfc{\xdf\xfb\xde\x8f~\xf4\xa3W_}\x95\x18\
-\xf4\x9b\xdf\xfc\xe6\xcb/\xbf\xfc\xc2\x0b/\xec\xd8\xb1\x83\
- \x15\x1d\xb9B\xbe\x12jm\x9c\xb0{T0i\x01\
-\xf1\x8a\xb3\x0a\x15\xa40$\xa6\x9dy\xe7J\xb3\xc0\xb1\
-u\xe3\xfa\xf5\x8b\x17.\x1c8p\x80c\x0b\xbe\xf8\xe2\
-\x0b\x9e\x9a\xe2\xc7\xce\xd1\xa0\x16tk\xc6\xc5;0b\
-\x82)i\xac,0\xfa>O\x0c\xd6\xf5@*+0\
-\xc4A\xc1R\x81\xd0\xc0\xa0\xa5Jx\xb6Nt\x17\xcb\
-\x8c\x94q\xdfD\xe8b<o\x12\xeb\x03*U\x22\x18\
-b(\x1b\x0a\x07\x13\x0e\x12MDA\xda\xb7\x89'\x9f\
-|R\xbf\x9fD$\xca\x95\xd8t\xeb\xd6\xad<\xb8\x13\
-\x83\xde{\xef\xbd\xf7T~\x97_\xa8)\xb5)jg\
-s\x91!`\xf9\x80\xb2.WB\x84rCY\xee\xa2\
-\x9d\x8e\x84+\xb0n\xcf\x9f?\xbfk\xd7\xae?\xfc\xe1\
-\x0f\x1f~\xf8\xe1\xf1\xe3\xc7\xc7\xe4\xa7\x1bM\x9a\x94\x96\
-\xb0>lEH\x22\xeaY\x86w\x158d\xf6\xec\xd9\
-<\xdb+\xee\x91\xd3|w\xe5\xea(\x9b\xd4\xa9\xe0B\
-\xc7\xb3\xa1\xbc\x10\xe9\x80n\xc4u\xc6\x8c\x19<\xe1o\
-\xdc\xb8q\xfb\xf6\xed\xcb\x96-\x9b9s\xa6\xa9N\x15\
-0\x93\x83\x03?\xeb\xaf\x03,_\xbe|\xd3\xa6MO\
-<\xf1\x04\x91\xe8\x0f~\xf0\x03\x22Q\xa2\xd2\xf5\xeb\xd7\
-\xe3\x81\xfb\xef\xbf\x9f\x22\xbc\x81~pR\x82\xb52\xfe\
-\xd4y\xbbXGk\x0d,_7T\xe1\x18R]5\
-H\xc2\xe5<\x1d]\xbat\xe9\xcb/\xbf\xfc\xe0\x83\x0f\
-8\xb9\xde\x7f\xff}E\xa2cxrqS\x9f\xea\xdc\
-\x94\x83\xd2\x1bG\xe8H\x12\x93\xf4\xb8\x82)\x15\xe0\xfa\
-\x9e\xe6\x16\xa0\xba a\xa9\xf0\xae\x8aT\x16\xac\xeb\x11\
-V\x10\xf0lJ^\x0f\xa11\xab\x95\xb8/\xa0\xec\x08\
-\x18\xdf`4\xee\x5c\xdc\xef\x1aH\xdf+z\xc2\xd31\
-\x9a\x9aD\xa5\xec\x86<\xa0\xb3k\xac\x5c\xb9\x92\xc0\x94\
-\x87T\x1e\xdc\xf5\xa9P@\xc1\x95\xd5N\xb6AID\
-*;$2M(\xebr%D*\xabY.\xb4\xae\
-\x92'\xcb\x1b7\xba\xbb\xbb\xf7\xee\xdd\xcbz~\xf7\xdd\
-w\xc7\xeas6M\x9a\x94\x8a\xd4Z\x88\xd1z\x14\xca\
-J\xdeDtvv\x12\x03\x11\x02\x12\x8f\x92\xf5\xcd\xc1\
-\x1d\x15<\x97\x10\xa7A\xd9\xa0\x92CR\x94W\xea\x15\
-\x85\xd2\xec\xa8\xc4\xc4\xdao\x1b\xee;\x9e8\x08\x927\
-\x19\x05\xdc\x13\xbe\x84\xb5\xa5\xa5e\xf5\xea\xd5_\xff\xfa\
-\xd7_{\xed\xb5\x1f\xff\xf8\xc7\x7f\xfe\xe7\x7f\xfe\xd3\x9f\
-\xfe\x94HT\x7fj\x15\xc3\xdb\xda\xda8t\x08@\xb9\
-\x82\x9f2v\x8f\x09$\x0cK\xada\xcd-e\x01\x0a\
-\xcb\x0f\x07\x1a\xa4\xa2\x8e-\xce,}\x87\xe8\xe9\xd3\xa7\
-\xf7\xed\xdb\xf7\xde{\xef\xfd\xf6\xb7\xbf}\xf3\xcd7\x0f\
-\x1e<\x88p\xacN.\xee\xc8\xa8148\xd9o\xed\
-\x9d\xcf5\xb0\x88\xc4\xe6j\xab\xbd\xba\x8a\x1c$\xdc\x05\
-\xeb8\x94\xb9\x96\xed\x14V\x0fS\xc8\x96\x5c\x87\xe4\xea\
-\x17A\x0b\xb9Xq\x06\x1a\xc7?\xc2D\xc3g\x22\xde\
-\x8c2\x87<\x10t\xeaq\x0dU\xa8\x08a\x97HH\
-\xb5\xa3F\xa4\xc6\x0e\xa2\xad\x81\xa7v\xd2\xa1\xde\xff\x0f\
-U9\x08WI3\xae\x9eK\x0d\x85z\xaa\xa7\xec\x22\
-\x9b\xc2\x0a* I\xba\x17\x9e\xf3\x98\xf4g\xce\x9c\xf9\
-\xe4\x93OX\xcc\x1f}\xf4\xd1\x89\x13'\x06\x06\x06\xb2\
-U\x9a4\x99\x92\xa4\xa6z=\xcbm\xf44\xdc\xfa\xc2\
-'\xc9\x0fS*\x7f\xed\x13\x09&\x88\x5c\x8fYY0\
-\xd3\x13)T\x91\x9a\xe1bH\x16c\x05!\x9e\xa3\x03\
-D\xc3s\xe6\xcca\xbfeg\x8eKK\x0b\xdd\xe6\x80\
-\x987o\x1e\x01\xf4\xc2\x02\x16-Z\xb4t\xe9\xd2\xcd\
-\x9b7?\xfd\xf4\xd3\xaf\xbf\xfe\xba\xc2P\xfdq\xd4G\
-\x1f}t\xf9\xf2\xe5\xad\xad\xad\x1c4\xf2\x7f\xec\xcc\x5c\
-\xc7\x8e+\x1a\x14a\xa2j\x8a\xe4\x22\xcc\x85ALZ\
-\x13\x8d\xbb\x1f\xc4\xd4\xe2\xd8\xbap\xe1\xc2\x9e={~\
-\xf7\xbb\xdf\xfd\xf3?\xff3\x91('WWW\xd7\xb5\
-k\xd78\xd7\xac\xdaX\xa0\x97\xf1\x1d\xe1\xab\x18%\x09\
-v\xe7\x1b8\xa4E\xa9R\xb5\xa3Z@:D\x0d\xc9\
-\xf7\x97\x9f;w\xee\xe8\xd1\xa3\x5c\xf5\xc1\x98\xa0^\x16\
-r\xfb\x83-.O\x8c\x09(\x1b\x13\x9cg\x98\xa8\x0e\
-\xacB\xc0D5\xef2,\xc67\x18\xb5>Vz\x19\
-\x1b\x00.\xaf\x01\x93>F-\x04W$HG\xed\x90\
-\x8d\x15H\xf3o\xa8d\x9f/\x91\xa6H\xaaeHZ\
-\x8cz\x18\xa7s\xb1\xb6\x02&\xaa\x10\x0b\x95\x06e\x1d\
-\xdaG\xc8\x8c\xbfs\xe7\x0e\x0f\x91\xdd\xdd\xddD\x9f\xbb\
-w\xef\xfe\x8f\xff\xf8\x8f\xb7\xdez\x8b\x05\xd0\x8cD\x9b\
-La|n\xe7N\xf2!W\xdf\x98\xa0[\xb3\x06\x95\
-m\x08\xd8(\x8e\x1c9r\xfa\xf4\xe9\xeb\xd7\xaf\xd3\x7f\
-9JW\xb2\x22(&\xe4\xa6\x83\xca H\xa8\x0el\
-\x92J\x14\xa1\xeaJp\xd5\xd6\x0a\x92O:\xa1\x8f\xf9\
-\xd0U\xa2\xa8\xb6\xb6\xb6\xad[\xb7\xeaoJ\xbd\xf1\xc6\
-\x1b?\x0c\xdf9-\x087\x7f\x12\x90\x90R\xd4\x1ex\
-\xe0\x81\xf5\xeb\xd7\xaf^\xbdzY\xf8KWT'\x0c\
-\xd5i\xe2m*8#k\x9d\x98(t\xc7\xc4\xb6\x0a\
-\x92\xa7\x88\xe5J\xdb\xa8W#\x05'\xb4\x97\xd3\xa0^\
-\x85\x82^L\xb2p\xf4\xfdM\xbf\xf9\xcdo\xfe\xfe\xef\
-\xff\x9e\xeb'\x9f|\xe23\xd3\xea\x8c\x05\x04\xa0K\xc2\
-\x1f\xad\xd5\x1f\x00\x9b6m\x1a\xed\xd3\x07\xe1\xeb7\xb1\
-\xa4\x1a\xc9\xc1\xf2\x15\x5c\xa2\xd2,\xb4I\xcbz=t\
-\xe0\xc0\x81\x93'O\x96\xfc8N\x0d\x99\xac\x13\x92H\
-AH\x22L\x140Q\xc0DCa\xda\x01\xb2,\x0a\
-\xcb\x0c\x9f\xf1\x0dF\xbd\xbb\x0cm\xec\x97\x1aHGW\
-U\xc7<\xa1,H\xc15A\xedS\xc4\xbe\xc0\xee@\
-%j\xab\x86\x97\x02\xfa5\x18R\xa1\x06j\x1f\x94\x96\
-pH4\xdd\xcf\x9e=\xbbk\xd7.\x9e,\x7f\xf9\xcb\
-_\xb2\x9e?\xf8\xe0\x03}\x1f[\xfd\xed4i2\x95\
-\xd0\x1a\x9f\x18\x1an\x95\xb13\xf0\xecz\xfb\xf6\xedx\
-'\x04\x95\x8a8\xabRPZ\xc2\x5c\x92\xed2\xec\xb7\
-J\xc4\x98Feh\xb8J-\x16N.\xf4\x81H\xb1\
-\xb5\xb5\xb5\xbd\xbd\x9dx%\x868\x12\x08(\xb7o\xdf\
-\xfe\xdcs\xcf\x11\x89\xfe\xf4\xa7?\xfd\xf3?\xff\xf3\xbf\
-\xfc\xcb\xbf\xfc\x8b\x0ad\x81\xc4\x7f\xfe\xcf\xff\x19\xf9w\
-\xbf\xfb\xdd\xc7\x1e{L\x9f\x85\xa0Y]=\xe8T<\
-J\xc2\x1d\xebH\x02\x96\x1fO\xd4\x19\xae1*r\xac\
-7\x95\xfe\xb8\x8eI\x03\x9e\x0d*u\x8d&\xd3\xef\xda\
-\xb5k\xa7N\x9d\xe2\xe4\xfa\xfd\xef\x7f\xff\xee\xbb\xef\xee\
-\xdf\xbf\x9f\x83l\xc4\x7f\xed\xb3\x06\xf4\xe7\xde{\xef]\
-\xb4h\xd1\xbau\xeb4\x22\xf8_\xc4]\xd5M\x83\x1d\
-\x09\x12\x16\x11+\xb8~\xe2\x9a\x80\xcb9\xa0o\xdd\xba\
-u\xf3\xe6M\x8c\xf2\x90w\xd2\xf1\x0e\xa7\xd2\x22.R\
-\x22\x8b\xd9Y\x8d\x8aB{V\xd1\x0a2\xa8T\x9aB\
-\xca$\xf0\x98JG\xc0\xf8\x06\xa3N\xbcs\x89`\x94\
-a\xa2\x80$\xe8\x0be\xc1\xf2\x01\xcf\x92\xa0\x8a\xc7\x9a\
-\xa04%^5\xd6\x94\x0e\xa0\xe6\xe0> \x81<t\
-\xc1\xdc\xaa\xd2\xa0\x9e\xe0\xd5\xa5\x93J\xa8}%\xc0\xeb\
-\x22\xe1\xee\xa9e\xe3\xa5Lq\x160O\x93\xbf\xfa\xd5\
-\xaf\xfe\xea\xaf\xfe\xeao\xff\xf6o\xff\xf8\xc7?\x1e?\
-~|\xf4\xdf\x82\xd1\xa4\xb1\xd0\xb4\x11&\x9a\xea\xb8\xa5\
-E&\xb3@\x1cI\x82{\xaa\x90\xdc\x89\x85J\x83\xb2\
-Y\xbceo\xbf!\x987o\xde\x92%K\xe6\xcc\x99\
-#\xd3j\xdb\x18\x83\x99^E\x12O\x04O$$m\
-evW\xf0M2\xbe\xa2\xaf\xea\x93\x8b:\xdc\xd1\xd1\
-q\xff\xfd\xf7\x7f\xeb[\xdf\x22\xd6\xfcA\x85\x1f\x06\xde\
-x\xe3\x0d\xbd\xfe|\xed\xb5\xd7^x\xe1\x85\x07\x1ex\
-`\xc3\x86\x0d\xfa\x93\xaa\xce\xda\x0a\xfe]\xd4mmm\
-\xc4@z\xf1I\xfb\xda\xc3\xdd'\xba\xb5#\xb9\x12B\
-\xd91G\xc3\xe4\xe4Jb\xe2\xce\xe4* \xd1P\x0a\
-\x1f\x5c\x8a|\x0e G\xf8U\xf8ci\x5c\x898\xaf\
-\x5c\xb9\xa2\xbfP\xfd\xbb\xdf\xfd\x8e3\xeb\xc8\x91#\xfd\
-\xfd\xfdc\xf5[\xf3Y\xe8\x06\x03\xc1\xf3\x80>\x9b\xab\
-\x8e\xe9F\xde\xc3\xa0\x98\xf6?\xf2X\xcd\x89\x15\x94\x88\
-\xa1T#>s\xe6L&\xc3\xe6\xcd\x9b\xf5U\x09\xa9\
-F&\x0b\xba!H\xcb\xc0\x98\x94\x90\xa1\x14\xa4C\xed\
-\xc1\xea O\x82\xcb\x91\xb8\x10T%\x85\x95U@\xe2\
-\xb7PvdLP0\x0a\xdeo'\x96\x04\xbf\xe58\
-\xcbQ\x910Q\xc0DC\xa1\xf6\x9d\xacP\xae\x04\xc9\
-\xa5\x10\x93\x12\xfa\xad\xbd\x1b(\xb0\x14\xb5 \x91h\xf3\
-\x92P\x12\x8d1\x12\xee\xc5\xf3\x16KZO\x96o\xbe\
-\xf9\xe6{\xef\xbd\xc7\x93\xe5\xe9\xd3\xa7\xaf^\xbdJQ\
-n\x07\x9aLI\x98\x15ly\x9c|z\xa3CbF\
-\xe5K\xd0\xee\x1e\xb0W(\xcd\x95%\x10\x13K\xa4\x09\
-\xae,b\xa1\x121V9\xc2\xe5J4\x0a\xfa\x9a\xcf\
-\xd9\xb3g\x93`\x93\x89\xfb/\xc3\x85\x89\x22$\xf4\xab\
-\x12\x10\x9c1\xe8\x0dG\x92\x22\x86T\x98\x00\xb4v\x88\
-\xce\x89\x18\xee\xbb\xef\xbeo~\xf3\x9bD\x9cz\xc1\xf9\
-\x97\x7f\xf9\x97\xff\xe9?\xfd'\xae\x10^}\xfe\xc5O\
-~\xf2\x93\x97^zi\xdb\xb6m\xac2\x1c\xa8\xdf.\
-\x10\xa4\xe3,A\x8f\xc7\xa0\xf2R=\x0e\x11\xb1c\xc7\
-\x83\x1a\x8d\xab\x87\xeaj\x8cJ!\xae\x9bJc\xa9\xec\
-u\x939\xb3\x14}\xba&G[OO\xcf\x89\x13'\
-v\xee\xdc\xf9\xaf\xff\xfa\xaf\xff\xf8\x8f\xff\xf8\xcf\xff\xfc\
-\xcf\xef\xbf\xff\xfe\x04\xbc=\xa1\xf1\x9b7o\x0e\x0c\x0c\
-p\xd5I\x8dP\xdd\xe6*\xa4)jKRE1\xee\
-.th\x9c\xd8\x97\x87\x1cf\xd7\xc2\xca\xb7%\xa8t\
-\xb2Hl\x88\xe2EI\xb8&\xc3\x9c\x99\x9f\xb1B\x0a\
-\x17\xc6\xf6\xa6\x90\xbc\x06\xae#}!\xc9\xc8\x98\xb8`\
-\xb4\x06Y?\xc2\xe8m\xab\x870\x88\x09q:K\xac\
-\xac4\xc4\xdd\xf3\xf9\x81\x02\xab\x05\xb4\x98=\xe1\xdc\xbe\
-}\x9b\x87H\x9e,O\x9e<\xb9g\xcf\x1e\x1e+?\
-\xf8\xe0\x03}$\x85\x22\x14\xac\xc5&w\x01\x1c\x00\xc4\
-\xa0[\xb7n}\xe6\x99g\xbe\x1dx\xfa\xe9\xa77n\
-\xdc\xa8\xbf\x101\x01\xf3\xbf\x9ch\x95\x85\xd5f\xb0\x8e\
-\x94\xf0\xd2:\x89\xab$\xf5\x03\xa1$!N7\x0al\
-\x14<\xb2\xeaE\x14\xb8EE\xb3\x05\xb9P\xda\xaf\xaa\
-\x08\x89R N;q\x958\xeb\x92\xc9\x82\xb5CX\
-\xa9\x18\xf4{\xdf\xfb\xdew\xbf\xfb\xddg\x9f}v\xc7\
-\x8e\x1d\xac\xa6M\x9b6\xb1\x886T \xad\x8f~.\
-Y\xb2D_8\xed\xbf\xe1\x0a\x1e\x84y\xf4\xa9\xac\xee\
-\xe2>\x09\xae\xaaB\xf22\xe0\xfdQB\xa8\x08\xe2\xb4\
-F-\x8c\x9e\x99\x09H8\xa44\x9dH\xc4\xfa\xac;\
-N\xa5\x1b7n0\xe5\xce\x9f?\xff\xe5\x97_\xbe\xfb\
-\xee\xbb\xff\xf4O\xff\xf4\xb3\x9f\xfd\xeco\xfe\xe6o\xde\
-|\xf3\xcdc\xc7\x8eM\xc0\xcf\xf1\xe8\x15\x13\xfe\xc2\x85\
-\x0b\xfa\xd6R\x09\xd5sGF\x09\x13\x05bI\x9c\x86\
-T\x16$q\xb8\x05\xb3BO}\xa9\xdbM\x16t\x83\
-\xfeh\x02[/+Q\x07\xa5\xa4\xa5\xe6\x09\x08*U\
-f\xc6\xc4\xc3=b\xd4~\xed\x1b\x0d\xc9D\xfb7\xee\
-+^\xc8:B\x0a\xc1(K\x04q\x15\xaa\x08\x96\x1f\
-)q\xe3j\x90#O\xc7\x9eI+d%\x22t3\
-\x01\x05\xaeLY\xff<{\x5c\x856\x892\xf56\xf4\
-\xf4\xe9\xd3\xfa\x9c\xcdo\x7f\xfb\xdb\x7f\xff\xf7\x7f\xff\xf8\
-\xe3\x8fO\x9d:\xc5z6\xd5&w\x07\xec&\xf3\xe6\
-\xcd[\xb1b\x05\xc7\xe7\x8b/\xbe\xf8\xc3\x1f\xfe\xf0/\
-\xfe\xe2/~\xfa\xd3\x9f\xfe\xe0\x07?\xe0p\xe5\x88\xe5\
-q\x9c8u\xe6\xcc\x99\xcc%\xabs\x17\xe0\xc6\xfa\xf2\
-!\x91B\xf2,^\xaa\x04H.\xe2l\xaa\xa8\x81\xa0\
-\xe7\xec\x15\x1c\xc9\x84\xa4\x9c\xd0&\xad\x03\x1c+\xdf\xba\
-\x87\x87\x84{\xe5V\xf1l\xfdM\x8d9\xec\xb1\xac\x8e\
-m\xdb\xb6\xb1X^\x7f\xfd\xf57\xdex\xe3\xf9\xe7\x9f\
-'\xbbp\xe1\xc2\x96\xc0\xec\xc0\xac\x80\xdez\xde{\xef\
-\xbd,:\xed\xcf\xd6J\x057$wb \xcc\x95\x83\
-\x8a\x84\x89&\x16\xbbw\x05\x93\x06L\x94\xe9\x18\xc6\xc6\
-\x98\xb4\x02\x12E]JP\x9d\xf9\xc6\x99\xb5{\xf7\xee\
-?\xfc\xe1\x0f\x9cY\xff\xf6o\xff\xf6\xf6\xdbo\x7f\xfa\
-\xe9\xa7G\x8f\x1e\xed\xee\xee\x9e\x98\xdf1W\xe0\xc5\x8d\
-\xe2X\xb9\xc6}\x13\xc3*\x90ES\xcaJ\x08e\x13\
-\xed\x8cO\x84\xe4\xdcZw\x97\xe6\xe4B7x\x94j\
-kkkmme>{\xaf\x8a\xba\x97\x95#\xc9\x0a\
-\xdd!*uTZ\x03\xd3\xabh\xd2\x88\xa7G\xc0D\
-\x07\xa3\xb29\xd8>\x88\x8a \x95\xad\x1fU\x04\xcbG\
-\xe4z'80\x91\xc7\xa5\xa1\xfaH\xee.R\x1d \
-\x00e\xe5(\x00\xbdr\xe5\xca\xc5\x8b\x17Y\xba\xc7\x8f\
-\x1f\xff\xf0\xc3\x0f\x7f\xf5\xab_\xfd\x9f\xff\xf3\x7f~\xfe\
-\xf3\x9f\xff\xf1\x8f\x7f<q\xe2D3\x12\xbd\xdb`\x1f\
-!\x0c}\xe2\x89'\xbe\xfd\xedo\xbf\xfc\xf2\xcb\xcf<\
-\xf3\xcc\x03\x0f<\xb0e\xcb\x16N\xd3\xaf}\xedk\x1c\
-\xab\xaf\xbd\xf6\xda\xf7\xbe\xf7=\x12[\xb7n%f-\
-\xcfn8\x86\xc4\x8bE\x8c\x89\x8dq\xb3Jgo\xd4\
-\xd0\xb0\xab\xdc\xbe}[/\xb1\xc8\xd6v\x1a\xa5\xc2\xb3\
-.\x94\xa4~T\x0b<-\xf9\xa4\xc0\x0a\xda\xb8q\xe3\
-\xd7\xbf\xfeu\xd6\xce\xc3\x0f?\xbci\xd3\xa6\x95+W\
-\xc6\xbf\xed\xce5&D\x14\xf6&\x89\xeac2\xf7J\
-8\xaf\x86\xd5%\x94\xf5\xe6\x05\xdb\xe51\xaed\x15\xf0\
-i\x9aqx\x9d<y\x923\xeb\x97\xbf\xfc\xe5_\xff\
-\xf5_\xff\xe2\x17\xbfx\xff\xfd\xf7\x91\x5c\xbbv\x8d\xa3\
-\xed\xab\xf0s|kn\xdc\xa0W\x0c\xeb\xe2\xc5\x8b\x19\
-\xe2\xf9\xf3\xe7\xfb\x8f\xcb\xb9\xb5\xee]4v.O4\
-\x03\x9eV\x22\xbe*\x91\x82\x16xz\x09/\x22\xa7\x15\
-\xdde\x22\xa1\x0f<b-]\xbat\xc1\x82\x05<_\
-\xe1\x19\x97+-+\xd4U\xbf\xc6 qd5X~\
-,\x18Mk\x13\x1d\x8c\x82\xec\xcfb\xc5\x01\x97\xa4\xe4\
-)rKS\x1e\x07\x0dC\x8c\xcb\x9502\x15\x9dX\
-3t\xcd0Q5\xc8\x93\x9f\xc7\x7f\xf5\xd5\xc0\xc0\xc0\
-\xa9S\xa7\xf4L\xf9\x9b\xdf\xfc\xe6\x9f\xff\xf9\x9f\xb9\xf2\
-d\xf9\xce;\xef\xf0dy\xe4\xc8\x11\x22\xd4\x1b7n\
-X\xb5&w\x07\xec\x1as\xe7\xce\xe5\xf8$\xd6$\xe2\
-\xfc\xc67\xbeA\x18\xca\xe62k\xd6,\xf6\x17v[\
-\xb2/\xbc\xf0\x82~\xfd\x22~K\xca6\xe4\xbb\xcf\x94\
-!^DaI\xd5Z\xef)\xc2RN\xb0\xfc\xf0\x19\
-M\xddI\x81\x09\xc0<a\xfe\xf8+\xf3\xe0\x80\x04)\
-\xd4\xcf\x90UP\xd0p\xa4\x06e\x04\xf7\x1a[\x08\x9b\
-X\x0e\x1b6l\xe0\x11n\xf5\xea\xd5<\xad\xe1\x13\x82\
-\x06\x9c\x93;\x7f\x12\xefD}\xce5\x8alJ\xd2\x10\
-\xc8\xae\xd8\xba\x11\xe0\x86\x93 \x06\xe59\x870\x14\x88\
-8\x89;w\xed\xda\xf5\xc7?\xfe\xf1\xddw\xdf\xe5\xcc\
-:~\xfc\xf8\xa5K\x97n\xde\xbc)\xfd\x89\x81\xe1f\
-|\x09F\x19k}vS\xdb`\x12G\x87\x9fMg\
-\x07N\x12\xbf\xd6 V\xf3\x1f\x8a\x86\xf9b\xefD\x99\
-W\xdcQ\xb3\x8b\xa2I\x07o\xd0\x1f\x1e\xc6HH\xa2\
-\xde\x82\xb21\xb1\x5ci!\x89#\xabG\x00\x15\xb3X\
-\xd9\xf0\x19w\xff\xc6\x96[g3Xq\xc0%\x9e\xa8\
-M\xae\x9a<.L\x14\x90rL\xac\x93\x1e\xa2\xa8\x1d\
-\xcbG-\xe4f\x81\xc5\xccZ\xed\xed\xed\xbdp\xe1\xc2\
-\xb1c\xc7v\xee\xdc\xf9/\xff\xf2/\x7f\xfb\xb7\x7f\xcb\
-c%W\x9e/y\xb2\xec\xea\xea\xe2\x89SO\x96V\
-\xad\xc9]\x03\xd3\x89\xbd\x95]\x95\xbdu\xdd\xbau<\
-\xee+\xd0D(\xf4\x0b\x19D\xab\x0f>\xf8\xe03\xcf\
-<\xf3\xf2\xcb/\xbf\xf4\xd2KO?\xfd\xf4\xe6\xcd\x9b\
-\xd1\xf4=h\x0a\x10/\x9c\x18-:\xc7\xa4An\xa9\
-a\x92\xba\x91\xda\x89\xaf\x8d\x02\xd3c\xe9\xd2\xa5L\x9b\
-E\x8b\x16\x11\x8f\x0e9\x19\xc2\xe6\x94\xe0Y\xbf\x02\xb6\
-\x0fi~\xa8m\x98\xa8\xbe\x8a\xe3\x07\xb7\xc6\x0f<\xb6\
-AKK\x0b\x07\xb3b\x05\x82\x09\xc8v\xcc{NB\
-\x01\x87K\x82\x1d\xc36D\xb5\xc0\xf2\x13\x88\xf7\xdc\xb1\
-\xaeT0i\x84\x15\x04L\x14\xda!\x8b\xd3$$\x8b\
-g\x14\x80^\xbe|\xb9\xbb\xbb\xfb\xfc\xf9\xf3\x9c_D\
-\xa2\xef\xbc\xf3\xce'\x9f|BT:Yg\x16=\x9c\
-6m\x1a\x0f`mmmz O\xc6/\xf4\xd8\x12\
-\x19\xa8\xe5\xd7\x14\xa1\xc9*\xb9\xb2\x92;^\x14\xe6T\
-\xd5\x9c\x99D\xe8\x03C\xd0\xd3\xd3\xc30\xf1\xccP\xa3\
-K\xf1X\x93\xf6l,\x87`V\xd2H\xac3\x5c\xbc\
-\x1b\xa3\xf4\xd0\xf8\x06\xa3\x98\xc7v\x09$\xd4\xe3`\xbb\
-\x11gSE\xf1\x0c\xc8R\xd4\x0e\x09\xa1\xac0Q1\
-a\x14\xaa\xb0\x82\x88\x229p\x0b\xd6\xa7\x1e%\x09C\
-Y\xb1\xa7N\x9d\xda\xb3g\xcf[o\xbd\xf5\xfb\xdf\xff\
-^\x7f\xd5\x93\xc5\xfc\xf9\xe7\x9f\xef\xdb\xb7\xef\xf0\xe1\xc3\
-,\xf2\xebc\xfd\x9d\xc0M\x1a\x0b\xe6\x92\x1e\xb8\xf5\x8c\
-\xcbVK\x96e\xc25\xfcDh\x1aB\xb6]B\xcf\
-\xad[\xb7\xeaw\x84\x7f\xf0\x83\x1f<\xff\xfc\xf3\xc4\xa3\
-\x84\xaahZCS\x17_qJ\x08eC\xb9\x11\x96\
-\xf8H\x96\x92\xb7&$,9\xf4\x93Y\xc1\x83\x0a\xc1\
-(\x0f3L\x12\xf5\xbc\x9e\xfe\xd7\xf0Rb\x7f\xa6\x9d\
-8\x9d\xa2F\xd1\x84\x91\xf4\xb8\xf2\xee\xcaD\x01\x84\xb2\
-4\xcc\x0bCE\x8eI\xf3\x1cBuK\x8d\x82\xdc\x96\
-\xc7\x9b\xe0\x8f\x848\xab4\xc4iP\x0f\xe3~\x92\xee\
-\xef\xef\xe7\xe4\xfa\xec\xb3\xcf8\xb08\xb6~\x17x\xf3\
-\xcd7\x89G\x91\x0f\x0c\x0c\x98\xead\xc0(\xb37\x82\
-\x86[\xe1\x81\x8ar\xbd\x9d5pHpQ\x98M\x09\
-d\xa9\xcb-\x88\xfc\xae^\xbdz\xf6\xecY\x02t\xce\
-\xf7a58\x1e\xd0\x01b\x0c:C<\xaaO\xeb\xc6\
-#\xab\xeeq\x15\x12\x8ad6\x04HgKcT\xea\
-\xe4J\xbc\x1d\xbfB\xa5\xf9\x913\x8e\xc1(]c\xbb\
-\xe4\x11vF\xf8{q\x1ac'\xd8e(+9h\
-\xaa\x09)\x08\x95Z&\xfc@A\x0a\xba\xaa\xd4\xfd\x11\
-T\x0c\x97(\x91%\xf8\xb1\x0a+\x08\x90U]\xc9C\
-\x93\x16.\xeb=(\x01(\xf3\xe3\xc2\x85\x0b\xcc\xda/\
-\xbf\xfc\xf2\xc3\x0f?\xfc\xcdo~\xf3\x0f\xff\xf0\x0f\xbf\
-\xfa\xd5\xaf\xf4\x1e\x94\xa9C\x00\x8af\xf3mh\x13\xa1\
-]O\xcfid5\xc1 \x99|\x95\xdf\x84#T%\
-\xf4\x5c\xbdz\xf5\xb6m\xdb\x1e}\xf4\xd1g\x03\xf7\xdd\
-w_GG\x07\x01+\xd5U\xb7A\xd1:\xca\x9a \
-W\xa8TH\x1e\x1c\x93({\x15/\x8a\xf1\xd2\x22\x5c\
-!i\xae\xba\xc1\xf2\xc3\xb8\xcf\x9d;\x97YAT\xca\
-\x0cq\xff\xb8-\xf5\xa3*`\xf9\x8c?=[[m\
-\xe2\xa1\x03\xfe\xfcOB[1r_\x11\x92\xa0V\xd4\
-\xd5\x94E\xcaB\x91\xbe@A\x89\x1a-\xd7na\xfc\
-\xf0\xfe\xc7\x1dP\x87]\xe8W%<\x8d\xaf8\x9e\xce\
-\x9d;G\xdc\xa9\x9f\xe3\xfd\xecg?\xfb\xeb\xbf\xfe\xeb\
-\x7f\xfa\xa7\x7fz\xef\xbd\xf7J\xf2[\x0d\xb1\x81\x8e\x8a\
-<\x11\x13\x0b\xe5\x07%\x94V\x02$\x8f\x09\x0d'\xc8\
--\x1c\xdf\xfb\xf6\xed;y\xf2dI^!\xd1+\xcd\
-|b\x8f\xb8?J'\xfd\xaeF\xa5\x8eKREA\
-7!N\x0b)\xe4b\x1a\x15L:R\xc61\x18%\
-\x06moo\xef\xec\xec\xd4\xdf\x93e\xa7\xb0\x82@\xee\
-<H\x81y\x8a8A\xd6\x82\x17qE\xaa\x22\x97\xb8\
-BL\xaa\x96\x12\x8e$IhPy$\x12J\x87B\
-\x13\xaa'l\x7f\xfaT\x0d\x91%a\xe8\xe9\xd3\xa7?\
-\xff\xfcs\x82\xce\xb7\xdf~\xfb\x8f\x7f\xfc#\x8f\x92<\
-V\xbe\xf5\xd6[\x1f}\xf4\x11\x93\xf8\xcc\x993<S\
-z;M\x9a8Z\x02\x9aZacL\x88\xe5\x5c\x89\
-J\x09I\x89<\xe6\xcf\x9f\xbfy\xf3f\x82\xd1o|\
-\xe3\x1b\xc4\xa3K\x97.\xd5G\xe5\x1a\xf4-)\xeb\x88\
-\xa5-\xe4\x01\xa1RO\xc4\xb8\x82\x12\x90J;8\x90\
-\xb5\x1c\xdci\xfe\x8c\x91$(\x1a./?\xf4\x93\x11\
-'$\xe5*\x90\x98\x0b\xf2\x9c\x16,3LT1\xdf\
-\xeaTP\x91\xa7\xe3\xab\x88[\x98\x5c\x98<\xbd\xbd\xbd\
-l\xad\x84\x08ze\x85\x84\xae&\xbbs\xf4\x057q\
-\xe7!qA@[=\x90\xb6\xb2bTE\x98(\x82\
-[\x08\xd2\xb9\x0a\xe3J|G\xebG\x05\x93\x06\xb9\x9c\
-#H\xb3\xe2\xfcS\xa1\x1ca7o\xde\xbcv\xed\x1a\
-\xa7\x98\xde\x89rrq\x96}\xf2\xc9'{\xf6\xec9\
-p\xe0\x00\xf2I?\xbf0\xd3\xc7KVxB\x98^\
-\xde\x10\xa8n\xdcB,QV\x9a\xb4\x13\xa6\x8f\x85\x13\
-@\xfa\xc6\x8d\x1b\xfa\xdb\xf4\x97.]\xc2]\x92O.\
-\xc1\xe2\x04e\xd5ae\x95p\xa4\x10\x13\x0b]\xc7=\
- b\x9d\x22\xb2:\xa1\xb1\x84Tk\xc3b\xbc\x82Q\
-\xb6K}\xc6|\xeb\xd6\xad\xfa\x13^\xf1\xd8\xfbU\x84\
-\x1a\x85\xb8\xbb\xe3\x89\x02d\xb5\xa8t\x9eI\x22\x1d\xa1\
-,X>\x90\xca\x0a\xeaz\xc2\xd3h\xd2\xb2\xeb\x93 \
-\x0c\xe5\xf1\xa8\xa7\xa7\xe7\xca\x95+l\x82\xe7\xcf\x9fg\
-\x9a\xea\xb7\xe3\xff\xe6o\xfe\x86\xa7\xc9\x9f\xff\xfc\xe7<\
-Y\x12\x86\xf24\xc9v\xc9R\xa7\x05\xb5\xd9\xa4I\x8c\
-&\x950Q\x1e\x94\xb2@\xf4\x96T\x0b\xea\xb1\xc7\x1e\
-{\xfe\xf9\xe7\x89J\x1fy\xe4\x91\xf5\xeb\xd7\x13\x92R\
-j\xda\x0d\x02F\xb1.8\x05\xd9\xebY\xc2H\x86\xdc\
-\x04 \xb8j\x90X\xa2t\xd0\xca'\xdb\xbeKHd\
-KK\x0b\xbb\x10\x1e\x03\x1c\xa8\xbd\x85\xce\xbb\x13\x86D\
-\x9a`\xf9\x88X\xae\x84gS\x04\xc5\xban7Np\
-wvWB%\xc2\xa6\xcf?\xff\x5c_0\x847\xb4\
-W\xebj\xaa\x115\xfaL\x91\xb0|\x85\xda\x13#\xa5\
-\x9f\xad>a\x84\xbe'X\xbe\x82\xbb\x82\x04p~\xb1\
-\xe2\xfa*\xdf\xee\x22\xf0^WW\x17\xd1\xe7\xef\x7f\xff\
-\xfb\x0f>\xf8\xe0\xf8\xf1\xe3W\xaf^\xe5\x98\xc3\xa5Z\
-\x9b\x93\x0e\x91\x83>\xcb\xa4G/\x17\x82\xd2BE\x5c\
-]\xc7I\x09SY\x91\xf2\x1eY<Ft\xd1\x1f\xc0\
-\x15Y\xf7N\x0a\xf4J\xcb\xdf\xfb\x13\xc66\xa1F\x0f\
-)\x8a1\xe9Pd\xbd\x04\xd6D\xa5\x119\x93\xb1P\
-B\xc2\x911^\xafUf\xce\x9c\xb9z\xf5j\x0eN\
-\x8e\xcc\xe5\xcb\x97\xebw?S}UVrp\xa1P\
-\xdamN\xc1x\x10\x14\xb2\x90X9\x0c\x03\xd3\x14M\
-\x0d\x09\x84\x8d:\xc1\xb3\xc1{\xc9\x11\xc8\xd5\x9a\x08H\
-(\x1dW\xf64\xab\x17$!\xc1\x13$\x8f\xe3G\x8e\
-\x1c9v\xec\x18\x0b\x98u\xbb\x7f\xff~BO`g\
-\xe41\xfd\xec\xd9\xb3tIa\xa8\xdd\xa0I\x93jX\
-\xb7s\xe7\xce]\xb7n\xdd\xa6M\x9b\x16-Z\x94\xfd\
-\xa1A\x0a-\x07@\x8d\xb8s\xf6\xec\xd9\x0b\x16,X\
-\xb9r\xe5\xaaU\xabZ[[\x99i\x03\xe1\xcf%0\
-]\xadB\xe9\xc1\x10\xacX\xb2d\x09V\xe0\x01\xbd\xdf\
-\xc5@+\x8epaj\xd9J\x1eW!\x1dg\xb3H\
-\xc1\x91\x84+K\x9bu\xcd\x8a&\xac\xe1\xf1\xb2$\x07\
-p.t\x98Sy\xfe\xfc\xf9K\x97.\xc5o\xfaI\
-\xbd\xdb\xa2D\x0d\xdc\x87)g\xc6x#C\xb6\x86\xdf\
-\x08Y\xd8\x0f\x0f\x1e<8\xf1?\xc9\xc5\x04\xee\xa8\x0f\
-2\xe2\x07\x16\x82{\x83\x85@i\xe2\x8e\xba=S\xa4\
- y\x0dw9\xe1&UX\xc1x\xe2w\xa1\x87\xb2\
-\x9a4\x8b\x0b\xd4\x07\xed\x09$8\xbc\x98\xd8\x04U\xfa\
-\xb5\xa4\xa3G\x8fre\xd4\x80\x83\x8c\xc3k\xe7\xce\x9d\
-\xc4\xa3d\xcb\xf6s<:\xcf\x9c_\xb8p\xe1\xe6\xcd\
-\x9b7n\xdc\xa8g\xef`\x5c\x82\x14R\xb8P\x89\xa4\
-\x95\x80\x84\xee\x1c\xb0\x82\x80\x89*B\x9c\x80\xd3\x881\
-\xbe\xf8\xe2\x0bN\xf9\xcb\x97/\x93U\xd1$B\xf70\
-\x1f'\xe0\x0a\x1c\xd2\x16\xbe\xf5\x0f\xb9\x86\xcc;\x0f\xc1\
-\x14\xf3@\xb6\x14|\x94]-N\x88P^\x0b\xd3\xab\
-\x80\x84)\xf7?\xfe\xc7\xffP\xe9p\x19\xc7`\x94\xc3\
-\xf2k_\xfb\xda\x96-[4\x81\xfc'JRP\xd7\
-\x83\x09\x836\xc7B\x90\x10\x94U]\xae\x9a%l\x82\
-\x1f\x7f\xfc1\xa1!O{\x0c\x09\x8bM\xefZXN\
-\xc0VE\x1aH\xc4\xa0\xe3\xb3\x8a\xfd\x94\xac\xf4\x81R\
-\xaf\xc2\x95\xa5\xcbC\xa4\xfe\xd8\x09\x12N,\xd6*\x8b\
-\xf6\xed\xb7\xdf\xe6\x09r\xf7\xee\xdd\x9c^{\xf7\xee=\
-t\xe8\x101\xa8~\xbb\x0dh\xbc\x81\xc2\x82&\x13\x0f\
-s\x95`t\xfd\xfa\xf5\xec&\x1e\x8c\xc6\xb3\x1d<\x1b\
-&\xfe`\x11\x9a\xd3\xa7O\xe7\xe8ew^\xbcx1\
-+\x8be\xe5\xf1\xa8/\xae\x92\x83EX\xdd\xd1\xd1\xa1\
-\xa0\xaa\xa5\xa5\x85\xfd\xc1\x8bR[D\x11*u\x9dT\
-\xb66\xae\xcc\xbd\xd8\x04X\xe0<X\xb2\x96\xcf\x9d;\
-\xc7\x12\x96N9aoa\x0e\xcc\x993\xa7\xb3\xb3\x93\
-g\x12&\x83\xacPi\x0d\xf3\xa53\xe4\x0c\xf1\x16\x8a\
-\x9a\xf2v\xf0\x1b\x9b\xe4d\x05\xa3\xc0Hi?\xc7\x09\
-,\x07btfQ\xbc\x94H(\x1d_s\xf1\xa2\x94\
-'\xb9\x0e\xe91\x81f\x0a+\x18kr[\xa6\x93\xc2\
-\xf2\x01I\x18&\xf6\x07f8\x07\xd9\xe9\xd3\xa7\xf7\xec\
-\xd9\xc3\xf9\xf5\xfe\xfb\xef\xeb\xfcr\x18D&?\xfeL\
-52\xe9`\xef\xb4i\xd3\x18\x5c\xfdU\xad\xf6\xf6v\
-\x05\xa3*\xe2\xaa\x11\x8fQ\x91H\x9a\x08X>\xcf{\
-B\x86\x07\x9f\x99\x07p\x1d\x01\xc0\xe1\xc3\x87\x09\xd6\xcb\
-\x13\x8c\xca\x1b\x84U8\xa4\xad\xad\xcd\xbd\x11\x13\x0c5\
-?H\x22\xe2\xac\x9b\x19ts\x94\x85\x97\xd6F:\x5c\
-i\xb6t\xc1(\x87\xcd\xf2\xe5\xcb\xb7m\xdb\xb6n\xdd\
-:\xb6Nm\x13\xc8\xe5\x02\xefz\x9c\x00\xd2\xa9l|\
-\x05\xaa\xb3\x071Ex\xb0{\xef\xbd\xf7XW\xac\x22\
-&Joo\xef\xc5\x8b\x17O\x05\xd8\x19O\x06<\x01\
-\x9ef\xc9\xb1,\xf5\xc3}\x96(q$\x8f\x89\xc0\x03\
-\x22u\xa5\x03\xe8#\xe1.\x04\xbb\xa4Y\xc6d9\xae\
-X\xc6D\xc0<-\xa1\x83\xb0\xbb\xbb\x9b\xb0\xb8\xf9\x1e\
-\xb4I\xfd\xb0\x10\xf4f4\x15\x8c\xfa\xee\xe0$k \
-\x92\x93 \x16AB\x00\xaa_\x0d\xa4\x1d`{b\x06\
-2\xa5\xa5\x8fN\xb6\xa9\xb2\x81\xc9\xc4\xa0\xc4\xd3K\x96\
-,\xe1\x80\xc1\x1czne\x11\xb2\xc82\xd5H\xee\xa5\
-\xb1Z*-,_A\x12\xb9\x943\x98\xd5\xcd\x91\x5c\
-\xfe`\x94]\x8b\xbd\x94\xd3h\xf5\xea\xd5\x84\xf2L\x1e\
-\x0c\xd1pgm\x14Yy\x0d}\x17\x16\xd5\xf2\x04=\
-\xc1o\x93\x18\x8c\x02\xf1\x013\x9f`t\xe5\xca\x95D\
-\xe7\xcc\x22\x84\xf4\xdc\x03\x14e\x83n\x82\x0bS\xd4\x16\
-\xd6v\xaf\xa0\xd4o*\xac`B\xa0\x87\x0c\x070\x99\
-A\x09\xaeL\xe6\xe4\x8c;w\x8eS\x8c3\x8b\x19\xfe\
-\xc1\x07\x1f|\xf8\xe1\x87\xfb\xf7\xef\xe7\xfc\xe2\xbc\xe3\x08\
-c\x04\xfdL\xb4\xe6\xca\x04^e\xa3c\xaa\x13Kl\
-\xd8\xb0\xc1\xc3\xaf,(\xc7W'\x14\xe6\x0fG,O\
-\xa9\xb1\x89~\xf5\xd5\x1d\xdc\xc2\xf4\xc6]W\xae\x5c)\
-C0\x8a7f\xcf\x9e\xbdl\xd9\xb2\xfb\xee\xbbo\xfd\
-\xfa\xf5l\xfeE?S\x82\x94E\x90\xcdJ\x12_s\
-\x09\x8a\x85\xa51L\xc5\x11\x07\xa3u\xdd`\x04\xb4\xb6\
-\xb6>\xfa\xe8\xa3\xaf\xbf\xfe\xfa3\xcf<\xc3c+\xe7\
-\xa5\xd6\xaa\x15\x17[.ybz\xc0w@`\x81\x91\
-euqr\xb0\xa2\xde|\xf3\xcd\xcf>\xfb\x8c,\xf7\
-\xea\xe8\xe8\xf0\x8f\xa5\x9av\xb4{:(\xcc\x9c9s\
-\xc1\x82\x05k\xd6\xacY\xb1b\x05\x0d\x12\x86\xb2P5\
-\xd5\xa4\xaf\x16H\x03\xeb\x199\x12\x16\x00\xca\xd7\xae]\
-c\xdd^\xbat\xc9O,Ui\xd2\xa4~\xd8>\xd8\
-M^|\xf1\xc5\xef\x7f\xff\xfb\xec)\xbe\xbd\xfa\x5c\x8a\
-'\x95\xe4\x92x\x02!\x90`~\xf2\x18\xf6\xe5\x97_\
-\xee\xda\xb5\x8bM\x93'\xab\xf3\xe7\xcfse>\x97<\
-\xa8\x22\x80`\x0d>\xf7\xdcs\xaf\xbc\xf2\xca\x03\x0f<\
-\xc0\x12\x96EY$w\xdb\x1d\xc9\xe3k\x8a\x940n\
-\x81\x22\x95\xb2\xa89\x83Y\xd1\x7f\xf8\xc3\x1f\xfe\xea\xaf\
-\xfe\x8a\xe7\xccI\x09\xaa\xea\x87no\xdc\xb8\x91\xc9\x83\
-\xdf\xee\xbf\xff~\x9e\xf3\xd9\xd3$\x97Bm\xe4\x81\xd8\
-\x0fJ@\xaa\x05e]\x13<M\x02\xe4\xb7\x9d;w\
-\xfe\xc3?\xfc\xc3\xdbo\xbfM\xda\x15&\x0c:\xc9D\
-\xda\xbe}\xfb\x8f~\xf4\xa3o|\xe3\x1b<\xd8\x10\x9d\
-\xfb\x83\x0dW9'E\x8d~\xd66!\xe5\xa2\x18\xdd\
-\x0bH\xd4P\x1b\x13R\x9d$\xab\xa0\x9c%\x7f\xb3\xf2\
-\xd9Y\xae\x14!\xbfp\xe1\x021\xe8\x9e={\x08:\
-\xf5{\x0e\x8c\xd4\x8d\xea\xbf\xb42\xf1\x03W?\x8c/\
-\x91\xe8SO=\xf5\xd2K/=\xf2\xc8#\x1eKX\
-q\xf5\xa0\x90\xce\xb5\xc5u\x86\xb4T1\x06\xe0\xc0\x81\
-\x81\x01b\x83_\xfd\xeaW\xbf\xfe\xf5\xaf\x8f\x1f?\x8e\
-\x87\x87\xac>\xde\xe0\x0d&\xf9\x13O<\xf1\x9d\xef|\
-\xe7\xb1\xc7\x1e#\x92\xc1\x1b\xc8\xd51:\x1f\xb4\x12\x92\
-Y\x18\xf0>+\xab\x84\x84q\x91_\x85\xa7S&\xa7\
-\xb2\x8e\xe4\xd4\xc2oDb\x12\x0e\x97\xf1z3\x8a\xd7\
-\x16-ZD\xf0\xce\xb9\xab7\xa3\xb5\x0c&\xadT\x10\
-J\xee\xa5\x02kA\xa7/\xe7\xee\xfb\xef\xbf\xcf\x02\xe3\
-\xdc\xed\x0b\x5c\xbcx\x914\xeb\x8dG\xbd\x1aH\x01M\
-\x16$+\x93Ht\xf7\xee\xddD\xb4$\xf4\xa63\x06\
-e`\xf5\x12\x80R\x05X\xd8\xfaq\xbc\xf5\xa9I\x93\
-\xe1\xc3N\xda\xd2\xd2\xc2\xb3\x10\xab\x835\xe2_]\xae\
-\xf5\x1c'|-\x08ec\xa8\xc8f\xc4\xb32\xbb\x12\
-\x0d\xea\xfb\xf39\x81\xd8F9\x96\xe2\xbd\xa9l\xd0s\
-\xa2p:\x8c\x13\x16/^\xccv\x819\xc8u\x8d\xc9\
-JDb\x7f\x05\x13US$\x07\x15q\xd5\xb1M\x5c\
-\xc5\xea\xd6\x8f;\xca\xf9~\xc8\xa1\xcf8\x8d\xf0}\xd3\
-\xa6M<\x81\xeb]`\xd8\x1a\x07?%Y\x84\xe6\x95\
-\xaeBUDJ\x12g\x95N\x81\xdf&\xfd\xcd\xa8\xc0\
-\x09,(\xa6\x10\x93\x8a\x83&\x8e\x08s\xa3CIR\
-XYMj\xa8q#\xbf\x17\x98t\xdc\xf0A\xe4^\
-\xa4Y\xf2\x1cL\xcca\x0e2\xc2&\x86\x03\xf4CB\
-\xfd4\xef\xa3\x8f>:|\xf80\x07YOO\x0f3\
-<\x9e\x03e\x06\xeb\xd8\xdc\xd6\xad[G\xf8\xc5\x9c\xd7\
-F\x91\x1dS\xd2X\x14KD\xd0JP\xb6\xc8j)\
-P*\x05\xb2$\xf0\x12\xc7\xfd\xa1C\x87\x88\x10x\xda\
-\xc7\xbdL\xf8\xa0>i\xd01\xbc\xb1j\xd5*\x82\xf2\
-\x1d;v\xe0\x0d\xfd`\x84\x22:\xec\x09\xaeY\x17\x81\
-KR\x09\x08\xe5IV\x89\x1aH_\x98(\xe0\xae\xe3\
-Z\xba\x1f\xd3\xb3/\xb4\xb6\xb6\x12\xc5wvv\x92\xd0\
-Nae\xd5]'\x1dg\xb3W!\x1dV\xdd\x95+\
-Wx\xd4\xfb\xf0\xc3\x0f\x8f\x1d;\xd6\xdf\xdf\xcfq\x02\
-\xc8\x89\x11\x99@\xb5\xe1\xe1\x86C\x9aZ\xacI\xa2L\
-\x05\xa04\xc8Nj\x1a\xd5\xd0\xa6P\x9a\xbbp/\xf5\
-\xa7I\x93\x91\xc1\xacf\x13!|\xe4\x89\x9f\xab\x7fb\
-R3\x5c\xc4\xe9,\x94\xd2\x88\xc3a<w\xee\x5cB\
-\x13B\xdby\xf3\xe6\x11\x9e2]\x99\xe4e\x8eG\xd9\
-\x10\x96/_~\xdf}\xf7\xe9\xb3\x0a\x0aF\xc1\x8a+\
-\xb8$U\xa4lR!$j\xbb+\x8bj\x09\xea\xb2\
-\xb4\xd9\x04\xd8\x0d8up\x9a\x15\x94\x12z\xce\x81\xc4\
-9\x84\xf7\x16\x86?\x8d\x88\x84Q\x96\x07dWl]\
-LV\x8edHe\xb5\xcc5\xbe\x05\x94$\x18\xa5W\
-\x0c\x1f\xb3\xbd\xb7\xb7\x97g0$\x9c\xc48\x84\xeeQ\
-Do\xc9\xaa\xe7\x0e\xc2\xd8\x16\xd2\xe0v\xc5 \x8c1\
-i \x95\x85X'[\x9aE}\x10\xf5\xe8\x0b\xaf\xa5\
-\x04WN\xa5\xbe\xbe>\xfd\xb4\xf0\xad\xb7\xde\xe2\xbag\
-\xcf\x1e\x8eH \x12\x05\x9e\xb2\xba\xbb\xbbqN\xc3\x9d\
-_\xb8e\xd6\xacYk\xd6\xacy\xf8\xe1\x877l\xd8\
-@ \xc1\xe6\x96x9`J\x01\xfc \x87\x80\x17\xa5\
-t\xea\x07/1\xa3\xf0\x9b\xfe`\x0dQ~\x19\xb6\x05\
-\xccQ0J\x5c\x1e\xff.\x97\x1b\x0eq:F\xae\xd0\
-5\xb8*\x8d\xe4\xd2Q\xc2\xc9J\x9c\x5c\xcd\xd2\x05\xa3\
-\xf4\x09O1{8n\xdb\xdb\xdb\xf5\xfaG\xbe\x10\xa4\
-\x15\xbf[\xbe\xe2\xa9\xd4\x15PK\x8a\x03l1\x1c\x1b\
-,0\xd6\x1b\x0b\x8cC\xd7\x0a\xea\x86\x8e\xd1\x08Q)\
-\x0b\x98\xfd\xeb\xc6\x8d\x1b,Q+k\xd2d\xa2`W\
-%\x82\x9c?\x7f~[[\x9b\x1e\xf7\xad \xa0\x99\xaf\
-\x84$\x22+\x97\x84\xea,7V\xd9\x9c9sXt\
-\xa4\xf5\x1bx\xa5\x8dG1y\xe5\xca\x95\xdb\xb7o_\
-\xbf~\xbd\xde\xf0\xc9\x90\x14\xa6\x1dPVr\xe1\xc2\x5c\
-\xb2E\xa1R\x82\xe5+\x9b)\xdb\x08\xbb\x0a\x11\xd5\x81\
-\x03\x07&\xf1\x0d_=\xd0y\x06\x94\x07\x98\xd5\xabW\
-\x13\x8fr8\xb9\x5c(-a\x96TQ\xa81\x88I\
-\x03q\x16/i\x16\xc5\xc2\x92\x04\xa3@0z\xed\xda\
-\xb5\x0b\x17.\x5c\xbdz\x95\x90\x8bi\xcfh\x82~\x18\
-\xcdZ\xd0(\xab\xf3\x89\x9d\x01\x97d\x85\xf5\xa0\x8a\x8e\
-$*\x12\x92\xd7\xc9p\xf5\x85\xc6\x85S\xec\xd8\xb1c\
-\x1f}\xf4\xd1\x9bo\xbe\xc9\xd5\x7f\x9fA?\xdc\xd3\xb7\
-\xbb0\xc3\xe5\x84\xc6\x02\xb7\xe87\xa1yje\xbb`\
-\xb6\x13E(l\x881\xed@VR\x0f\xb1sH3\
-\xb7\x09\x0f\x0e\x1d:\xf4\xf1\xc7\x1fs\xed\xe9\xe9)\xc3\
-.\x8a]\x84\xe6\xf8a\xdb\xb6m\x5c\xe3\x1f8\xc7\xc4\
-\x12\xa5\xb3:\xd8\x18#!jBY'+\xc9\x12W\
-\x1cq0\x9a\xf3\x91\x9a1\x81\x08\x8f\xed@\x9f\x9b>\
-w\xee\x1cC\xcb\xd6\xe0O\xab\xde\xef\xd8\x17YT\x0a\
-\x96\x0f0-\x08%\x81\xd6L4|h\x84\xeaP\x86\
-I\xd6\xe4\xae\x82\xf9\xcc\xc9\xcd\x81\xb1o\xdf>\x16\xc8\
-\xe5\xca\xb7v\xfb\xa2p\x5c\x12VL\x82g\x95\x10d\
-\x15\x8c\x12\xd2\x11\xda\xae]\xbb\xf6\xb1\xc7\x1e{\xfa\xe9\
-\xa7y\x80^\xb2d\x89~\x92[6\xd8\x1f\xd8\xe2\xcf\
-\x9e={\xf1\xe2E\xbc\xe1k9XY\x85\xe4\xc2D\
-\x19G\x0d\x0bm)B\xfb\x00\x9daw\x22\xa0)\xff\
-n@\x9f\xd9\xfa\x08/r\x9d\xa6l\x8c\xcct$4\
-\xed\x8a\xbe\x95e\xf6a\x93\x06/Y\xaax\xaf\x9eD\
-\xe8\x15\x0f]D],\xa8?\xfc\xe1\x0f\xbf\xf8\xc5/\
-\xfe\xe6o\xfe\xe6\xe7?\xff\xf9o\x7f\xfb\xdbO?\xfd\
-\x949\xc6\xc8\xfaK\x07Y\x81E\x0eBw\x85'@\
-\xe9\xc4MyH\xc7\xa1M]\x95\xa8\x87l#5P\
-\xcb\x10\xa7\xe9<v\x11t\x12\x83\xfe\xf1\x8f\x7f\xdc\xbd\
-{7i\x22rN[\xc0j\xaeD\xe7\x04\xeb(\xab\
-\x9d\x86\x03/\xb1\xb9\x89\xe0\xf8\x04+\x1bSR.\x22\
-\xea%\xda\x9b?\x7f\xbeb>\x93N68a\xda\xb4\
-i\xfa`4i\x09c\x9f\xd4\xef\x9c0\x83\xaa\xb0\x82\
-\xea\x06kS\xff\xed\xeaa\xbc\xde\x8c\x82vy\xba\x8b\
-\xfb\xe48\xae\x8c\xab^\x91\xea*/\xc8$7,\xce\
-\xea*5\xd6\x1e\x0drx\x1f8p\x80\xc7q\x0e3\
-\xed/M\x9a4\x16Lf\xa6.K`\xd1\xa2E+\
-V\xac\xd0\xaf\x93\xb3:\xb4L\x84\xcf\x7f\x11\x0bEJ\
-\xc8\x95\xea\xb4\xa9\xdd\xaa\xa5\xa5\x85+k\x90\xd3(\x0e\
-\x5cJ\x02\x1e\xa0KX\xbdp\xe1\xc2\xce\xceNv|\
-:\x8f\x09\xb2%&+\x89)*\xad]K\x84M%\
-\x19\x08\x5c\xf4\xe5\x97_r\xa2wuu\x11\xeaYq\
-)\xc1.\xfd\xa8\xee\xfe\xfb\xef\xe7\xa9\x83\xb4,\xe5\xaa\
-\x84\xd2J\x08lTB:\xa0\xac\x13K\xa4\xecj\xc1\
-CU\xa7\x94_\x19>\xe6U\x19\xde\x8c\x0a\xfa\xc9\xd8\
-\x11\x81\xe9\xf7\x07\x08\xcb.\x5c\xb8@\xac\xa6\x8f\xac\xd0\
-=\xba\xad7Ihz\x0c\xaa\x15\x17\xdb\xc5U\xa4$\
-$\xea\xc1\xab([\x1bW\xab\xad\x1f\x06ap\x14\x94\
-\xc5\x04\xa2L\x1eK\xf6\xef\xdfO$\xbas\xe7\xces\
-\xe7\xce\xe1\x01\x95\x0a\xab\xd0\xb0\xe0\x96\x993g\xb2C\
-n\xdb\xb6M\x7f:Ga\x83\x83N\xcaR\xc9\x87\xb4\
-]u\x8b\xf0\xeaL\x1b\xfd\xcaW\x19\xb6\x05\xe6*\xeb\
-}\xf5\xea\xd5\xdb\xb7o_\xbe|\xb9{C\xa5qB\
-xZ\xf2\x14\xb2\xd1-\x95\xa6#!(\x1dK \xa8\
-\x98$N\x03\x0d\x96\xee\xcd((p\xfc\xec\xb3\xcf\xfe\
-\xfd\xdf\xff\xfdw\xbf\xfb\x1d{\xfd\xb1c\xc7\x88 \x19\
-W\x16Rj;\xa8\x07\xec\xa4M\xf6\x17\x9e\x83\xd9\x0a\
-\xc9\x82\x955i\xd2P(L\xe4\xec\xd4r\xf0\xc9\xac\
-\xb5\x1dGf~U\x22\xc6\x85\xd4\xf5\x05\xc5\x89\xab\xf7\
-\xa3\x0f?\xfc\xf0\x93O>\xf9\xc0\x03\x0f\x10\xf2\x96\xe7\
-\xe1^`>!\x02q\xc3\x95+W\xb4\x9c\xad \x0f\
-\x99\xe9\x984\xe0~\xcbb\xda\x15LZ\xc1k\x91`\
-W\xa1\x0f\x0cG\xedn\x94\x81\xe9\xd3\xa7/^\xbcx\
-\xdd\xbau\x5c\xf5\xce\xdb\xcc\xcb\x18X\x83\x22\xe5\xd8\x93\
-\x89[#L\x1a0Q\x81\xdb'\x11\xba\xa4x\xf4\xea\
-\xd5\xab\xc4\x10\x87\x0e\x1d\x22J\xfb\x87\x7f\xf8\x87\xbf\xfd\
-\xdb\xbf\xfd\x97\x7f\xf9\x97]\xbbv\x11:\xf7\xf5\xf51\
-\xf1t\x88\x10\xcc\xf9\x88\xcb'\xc1\x91\x83\xa8H\xc6\xc6\
-h\xc1\xaa4E\x91\x5c\x84\xdaU\xd4\xbeQ\x11\xc9\xf1\
-\x19^\xeac\x05\x87,\xc17\x01\xd3\x08>\xb4\xd6@\
-\xf8\x96\x08\x92\x98/\x22\x87\xc7\xa5\xb5\x89k)\x1d\xd7\
-%\xc1\x86\xa9\x0f\xe2\xeb\xbb\xf3\xbch\xd2\x89{\x0b\x12\
-\xc6\x89\x18\x09G\x86\xb7\xe0W'\x94\x0f*(\xad\xc4\
-h\x18\xc7`\x14\xd8\x1a\xba\xbb\xbb\xf7\xec\xd9\xf3\xfb\xdf\
-\xff\xfe?\xfe\xe3?\xdey\xe7\x1db\xd3S\xa7N\xb1\
-\x1d\xb0r\xb4\x17\xf8\xc2\xe6\xea\x09\xcf\xc6\xa5\xe8\xb3\xf0\
-N\x86\xef\x0a-\xe1\xcb\x9e&M\xeaGs\x9b0H\
-3\x1c$g\xcf\x05\x12Z\xea\x90J\xe7\xe2\xa5\xb4\xc6\
-\x95\xdd\x93x\x94g\xe8\x87\x1ez\xe8\xf1\xc7\x1f\xe7I\
-\x9a\xd8\x85\xa7j\xc2\x97\x1a\x8dL0:J\x09\x01\x15\
-\x8e#\x91\x15)\xa4<,\x86[\x8b\xbb\xd3\x19\xf0Q\
-('\xd85k\xd6\xacU\xabVm\xd9\xb2e\xc9\x92\
-%\xf1G\x8d\xe3)4z\xealJ7\x05\xcb\x97\x00\
-\xf5G+\x8b\xa8\xb4+\xfc\xa1KB\xd2\xdf\xfd\xeew\
-:\x80>\xfc\xf0\xc3\x9d;w\xee\xde\xbd\xfb\xf0\xe1\xc3\
-<\x0b1\x03\xe3\x05\x18f\xdc j\x13\xa4\x90\xc2\xca\
-\xf2\xc8-U\xad\x98\x94\xd0\xb3t)FBa\xa2\x0a\
-\x1c\xa3\x1c\x85\x80\xbd\x94\x86\xfbLA\x98\xe7\xf1\x88\x90\
-\xa8al\xacY'\xee\xd8\xc4\xc5\x954O,L!\
-\xcd\x10\xd3\x9bT\xd41\x06Z\xb1\x13Y\xc9\xddX\xf7\
-R\x8c\x8a\x8a0\xa5\xba\xdd\x15\xdcS\xc5\xb0\xaa\xd7f\
-|\x83Q\xc0q<\xa7\x1e=z\xf4\x83\x0f>\xf8\xcd\
-o~\xf3\xcb_\xfe\x92\x1d\xe1\xd8\xb1c\x08YB\x94\
-j\xa4\xb1J\xfa)d'\xa5\x8cAoo/\x0f\xbb\
-\xec&\x07\x0e\x1c \xcd\xe1!\x9d&M\x1a\x91\xb0\x96\
-\x0d\x13\x05r\x97\xb7KT\x0a\xca\x0a\xb2\xda\x89|?\
-\xe2\xc9\xbe\xb5\xb5u\xdd\xbau\x8f>\xfa\xa8\xfe\x96=\
-\x89\x8d\x1b7\xce\x9f?\xff\xcf\xa2\xef\xb5\x98D\xb0\x9a\
-\xb5\xaf(\x90D\xd6\x0fB\xe6\x08\x13\x15`J\x155\
-5\xe8H\xe8\xb8Z\xac\xafD\x99aXy\xa8`d\
-S?\xa4\x1b\x92\x94[\x94N\x11\xb7\x16\xeb \x17\x96\
-\x8fPk`\xf92\xc1\xa4\x22\x92\xe0\xa4\xe8\xee\xee&\
-\xf4$$\xfd\xbb\xbf\xfb\xbb\xff\xfd\xbf\xff\xf7\xff\xfa_\
-\xff\xebg?\xfb\xd9\xaf\x7f\xfdk\xe2\xd4\xf3\xe7\xcf\xa3\
-\xc3\x0c43\x02\xd4\xf5D\x16\x97{\xc2\x9d#In\
-E\x84\x8e\xcfv\x88\x8b\x90\xa7p\xb9\x12\x8e\xdaDN\
-\xcf9\x19\xd5\x7f\x09\xa7\x188V{\x9a\xe5\x03r\x82\
-0Q VKU\xa9\x1fU$8\xd1o4\x9e:\
-u\x8a\xa84u\xa3\xc9\x82n\xf0\xe8\xae\x07x\x06\x1d\
-\x09\xceQ\x11\xdd\xce\xa2\xa2\x5cL#\xb87\xe5\xe1\xe0\
-\xd7*\xb2BiB*;\x1a\xc6=\x18\x05\xd6\x0c\xc3\
-\xc9\xb2\xdf\xbf\x7f\xff[o\xbd\xf5\xef\xff\xfe\xef\x5c?\
-\xfe\xf8\xe3}\xfb\xf6\x9d>}ZoIu Y\x85\
-\x0ar\x90L\xa5\xb4\xaf\xaf\x8f\xa0v\xef\xde\xbd\xcc\x0f\
-\xe6JV\xbfI\x93\x06B\xcbX\xf8^@\x9ak\xbc\
-5\x88\x22\xb9\x13\x9aI@GL\x9b6M\xf1(\x91\
-\xe8\xeb\xaf\xbf\xfe\x837\xde\xf8\xe67\xbf\xb9v\xed\xda\
-\x993gRj\xd5\xca\x87:\x1fc\x05c\x847\xa8\
-\xc6\x85$%\x87\xc1%\xf2`\x1b\xd4\x93<\x1b`=\
-\x9d\xcf\xeah\x9e\x00\xe9TQ*\x0b\xa1v\x15V\xd0\
- \xe0%\x9c\xc6)s\xf2\xe4\xc9\xdd\xbbw\xeb\xef\xf6\
-\xfd\xe1\x0f\x7f\xf8\xdd\xef~\xc7u\xcf\x9e=\x9cA\x9c\
-\xee\x0a\xe9\x1c9'&\xd7p\xd4\xacB\x85\x1a\xa7R\
-pyB\x9c\x86T6\x86\xd6@\xe9\xd0F\x0e5\x8a\
-\x1a\x1d|\xce\xd3\x17\xcf]\xfa\x91\x8e[\xaa\x84_E\
-(\xa9\x1a&\xd2)\x10\xc6\xcaY\xa4\x86\xcf5a\x0e\
-\x1d:\xa4\xc7\x95\x1aU&\x12:v'\xfci\x03\xff\
-i\x12\xc8.%\x88-\xc35g\xaeJ\x0eJ\xbbD\
-\x91\xa8\xae\x80<kl\xae$+\x84\x5ca\x9dLD\
-0*\xb4\x8d\xb2\xf2w\xed\xda\xf5\x9b\xdf\xfc\xe6\xe7?\
-\xff\xf9/~\xf1\x0b\xf6\x85#G\x8e\xf4\xf4\xf4\x10\xad\
-\xe2e\xf7\xaf\xc00_\x8a$\x18\x00va\xfd\x01\x89\
-\x94f\x93&\x8d\x08\x13\x9b\x03\x8c+im\x04\x12J\
-\x92Bra\xa2\x806\x11v\x13\xcbG\x12\xc5\xa3k\
-\xd6\xacy\xe4\x91G\x9ey\xfa\xe9\xc7\x1e{l\xd5\xaa\
-Uz\xa9f\xaa\x93\x0a\x86\xb0\x90}-\xd3g%\x1c\
-\x19\x9b\x95\x8f\x0c\xb5\x06\x96\xaf\xde\x8eMTn\x88A\
-\xcf\x9c9\xc3\x9ey\xe1\xc2\x05=\xc3[A\x012\xd0\
-1i\xa0vV\x84JUXA\x81~ia\x8eq\
-\x84s\x00]\xb9r\xe5r\xf8CD\x87\x0f\x1f\xfe\xe0\
-\x83\x0f\x88G9\x8f8\x958\x83\xae]\xbbF\x08\x82\
-\x87\xd1L\xbdn\x94\xed\xa0\xf9#P`\x08P&\x96\
-\xa5\xa2\xea\xeag}R\x08S;\xfd\xee\x1f$\x17*\
-\x15dU*5\xdd\xda\xc9\x0a\xe3,}\xb3\xd4\x14b\
-\xfa\xf4\xe9\x1d\x1d\x1d\x8b\x17/\xf6\xef\xbf\xcb:!F\
-\xa5P\xe4\x8dz\xbc\x84\xf7\xf9\x8fhDO}\x8c/\
-#be%@\x06zZ\x09\x90i\x5c\x86\xb4\xb1\xa2\
-i\xa4\xd2q\x9b\x22%In\x9f\xc1\xcaF\xc7\xc4\x05\
-\xa3@\xa7Y\xabl\x04\x9f}\xf6\xd9[o\xbd\xf5o\
-\x01}\x90\xf4\xe8\xd1\xa3\xdd\xdd\xdd,f\x85\xa4\xf1\x82\
-T-\x8az\x03$\xd8)T\xd4\xa4\xc9\xd4\x83\x99\x1d\
-\xe6~\xce\x16\xa0ua\xa2\x80\xed\x22\x01BL\x8f\xab\
-\x94\x80{\xc2\xf7\x8f\xce\x9b7\x8f=]\x7f\x84b\xee\
-\xdc\xb9\x94\xaa\xfa\xa4\xa3N\x92\x90\x81\x12\xa6@.\x1d\
-]\xb3\x846\xf2\x8bbt\x0ba\xa2j\x07\x9a\xa8\xc4\
-\xb0\x13\x12N\xe9O\xe9\xb0\x0dJ\xa8\x9e\xcb\x04\x88\xd3\
-NP4\x5c\x12\xcb\xf1I\x9cM\x11\x17%\x95+4\
-P\x1c\x0f\xd8\xa8\xc3\x85\xc8\x8f\xd8\xf1\xd8\xb1c\x1f~\
-\xf8\xe1\x1f\xff\xf8\xc7\xf7\xdf\x7f\xff\xe3\x8f?\xde\xbd{\
-\xf7\xa7\x9f~\xba\x7f\xff\xfe\xe3\xc7\x8fs\x18\x11br\
-\x18\xe1dAZ\xc7\x10\xb1,\xa5\x8c\x02\x87\x11g\x19\
-\x0f\x06{\xf7\xee\xe5\x08\xd37\xb5!\xa1e\xf4\xc3,\
-3\x14kZ&B\x9d\x01\xcb\x07\xac\xaf\x19\xac8(\
-\xb8\xcf\x95\x9d\x92\xe8\xab66n\xdc\xb8~\xfd\xfa\xf9\
-\xf3\xe7\xfbo\x11\x15\x99\x1c|\x93\xa0t2;\x03*\
-u\x8a\x84\xcc\xe4A\x82\x82F\x8d\xd1\x91N\x19\xa0\x9f\
-\xf8\x01\xcf\xc8\x1b\x98\xa9\xc9\xe3\x16%\xf6G\xfeA\xee\
-H\x92U\xe0\xeaB%\x9c\xa0\x92\x83\x15W&\xb0e\
-\x02\xa61\x22&\xe1\x05\x09\xbd\xd7\xaa\xe6I\x14\xd8U\
-y\xca\x07\x1eAp1HG\xab\x17g\xb1\xb0Y\xde\
-g\xce\x9ca\x9b\xd8\xb3g\x0f;\x05\xd9Q\x9a\xdd\xa4\
-\xc9\xe4\xc2\xc4\x9e3g\xce\xea\xd5\xab\xd9m\x09\x10\x89\
-\x17\xb3\x1f\x01,\xca\x92P\xba(\x01\x89^\x05e\xd9\
-cYJ<\xebs\x94\x96\xe1\xcbJ\xb0\xb7\xbd\xbd}\
-\xc3\x86\x0d\xfe\x97-\xc3)\x90\xee|Lv\xd5K_\
-\x98\xa8>\xa4\xcf\x95}\x86\xb0\x83]\x85x\x82H\x82\
-\x98C\x0a\xe5\x84G\x0b\x0ef\x9c\xb6u\xeb\xd6\xa5K\
-\x972m\xe44\x8a\x12\x17T(\xcaf\xe51\x92\xd4\
-(RBi\xfcv\xe3\xc6\x0d}\xb5\xd3\xc9\x93'\xd9\
-\xcf\xa5\xd0@\xb0\x1c\xe86+\x82\xe0\x9e\xc0\x94\xf3\x05\
-\xbe\xfc\xf2K\x16\x08\xab\x03\xc72E\x99r\xa8\x91\xd5\
-\x1bP4\x0f\x1c8\xa0\xaf\x07\x06\xf4\x15\xc82y\x0e\
-\x1d:\xa4\xcf\x17\xce\x9a5\xab\xa5\xa5%\xfe\xe1C<\
-o\xeb?\xb9\xdc\xe7\xb9\xd0\x0eC\xc0\x01z\xf4\xe8Q\
-\xbaD\x9f\xe9\xa7\x955>\xd8\xce3\xf3\xe6\xcd\x9b\x9f\
-|\xf2\xc9\x87\x1ezh\xd9\xb2e\xb3\xc37\xde\xcb'\
-\xf1\xd5q\xa1'\x828\x8d\x14\xc0\xf2\x91\xc4\x96R\x18\
-q\xc2\x92/\xbe\xf8\x82\xb9\xcd(\x97\xc4\xb1\xf4\x0d'\
-,_\xbe\x9c\xb5\xef_zoea{\xd7\xd4JL\
-(6\xdfA!\xd6\x19R_\x0c9{Q\xf8\x9f\xff\
-\xf3\x7fZf\x98L\xe6O\xeb\x888Y\xde<b\xb2\
-\xa3A__\x1f\x12m\x10z7\x0e\x9c\x0d<\x80\x9e\
-\x08\x7fcw\xe7\xce\x9d\x5c\x09[K~`4i2\
-$,\xfe\x193f\x10\x86\xaeZ\xb5j\xc1\x82\x05\xec\
-2\xdaY\x90\xeb\xb9<\xb5;xV\x89\xb8\x94t\x9c\
-u\x5c\xce\x06\xa1M\x84,\x09\x9e\xe5\x88\xbaXn\x1c\
-fAqr\x88\x83Q<\xc0Sh\x8d`T\xfd\x8f\
-\xaf\xe0\xca\xb9Uj\x10\xd7\xc2\x09zI\xf6\xf9\xe7\x9f\
-\x97?\x18%\xcaY\xbbv\xed\xd7\xbe\xf6\xb5\xed\xdb\xb7\
-\xeb\xcf\xa8\xe2\x8d\xc4\x0b\x19?(\xed\xbe\x12\xae\x10\xcb\
-\xe3ZEdu\xf0\x1b\x1b\xb5\x82\xd12|\xcf\xe8\xc8\
-\xd0\xf9\xc2\xb8\x13O3\x07\x80\xc7\x12\x22N\x82<E\
-\x9f\xfa`\x18\x0ag\xcf\x9e\xd51\xf4\xc1\x07\x1f\xe8[\
-\xa2\x90\xec\xde\xbd\x9b,\x91\xe8\xe1\xc3\x87\x09\x0a\x11\xe2\
-\x96\x85\x0b\x1724\xa3\xff\xe6\x8a!\xabs>\xb2\x8a\
-\xe9\xf3\xd4\x0bF\xd9\x0c\xd9\x1c\x1ey\xe4\x91\xa7\x9f~\
-\x9a\xfd\x81\xc0\x8b\xed\x82\xfdA\xa5\xb1gH\x0b\xa5]\
-\x18g\xeb\x81\x15\xa1\x90\x83\x11\xe4\xca\x04\xe0\xb1\x04\xc7\
-\x96*\x18\xf5ov\xe3AT\xdf9\xe5EJ\x08\xb2\
-\xa9\x85_\x03\x94\xbdz\xfd\xb5j\xd0\x90\xc1(`\xfc\
-\xed\xdb\xb7\x19x\x86\x9ce\x7f\xf1\xe2E6\x05\x9e/\
-\xd9 (\xc2G$\xd8\xec\xde{\xef=\x1e@9-\
-\xf4a\xf31qY\x93&\x93\x0b\xd3\x9b\xdd\x84\xf0B\
-\x7f\x14T\xaf\x06\xbd(\x85\xe4\x8eKT\x0a\xca\x16\xc1\
-\x92\xf1U\xc3\x9a\xd2\xa7b&7\xf0\xe2t\xd1K\xbe\
-\x8d\x1b7\xa6\xfe\x22\xa8iTP\xcf\xe3\xabp\xe5l\
-\x95\x22\xbc\x8a\xd2\x5c9{\xf4f\xb4\xfc\xc1(\x1df\
-\xb6p\x14=\xf8\xe0\x83\xeb\xd7\xaf\xd7\x1f\xa7\x96\xdc\x15\
-\x94\xa8M\xecC\xa7v\xddl\xe9\xd4\x08F\x01o0\
-\xe8\x84\x9e\x98\xc0L`u\x5c\x09\xe8u)\xd6\xed\xdb\
-\xb7\x8f\x18\x94\xe9A\xd0\xa9?\xfb\x8e\x1c\xc3\xb1\x9a\x04\
-G\x12'\x17\x15\xa9\xceYF\xd8\xc4\xd3\xc2\x8a\x95+\
-g\xcf\x9a\x95\x1b<e\xa14\x17+.\x86!\x98\xda\
-\xc1(\x0f]\x8f>\xfa\xa8\xbeRWO\xaa\x14\xb9g\
-r\xa71\xb8\x9ak\xd6\x89\xf4\xb9\x11\xc1\xa8\xde\x8c\xee\
-\xdf\xbf\xbf<\xc1(\xb0g\xce\x9a5\x8bGw\x9ev\
-X\xfe\xc4\xa62\xd3]!\x13R\x149\x0aT\x1d,\
-?\x16\x8c8\x18\x9d\xfc\x8f\x8e\xe1)\xc6\xfe\xd6\xad[\
-\xc4\xa0;w\xee\xfc\xedo\x7f\xfb\xcb_\xfe\xf2_\xff\
-\xf5_?\xfa\xe8#\xd6\x18\x8b\xff\xcd7\xdf\xfc\xb7\x7f\
-\xfb7\x82QNP\xc2\xd6\x1a\x9em\xd2\xa4Q`\x1a\
-s\x80q\x90\xec\xda\xb5\xeb\xf0\xe1\xc3\x9cgly\x08\
-\x05+\x82\xab\xa9F\xd8\xce\x11\xed\x1d\xd2\x07\xcbWC\
-;@B\xef\x15\x80\xf0\x97\x9d\x9d\xbd>n\xa4$\x8c\
-w\x97\x82\xe7\x061i\x85\xac\xa4\x9c\xd8x\x87\x11\xa7\
-\xcf\x8c\xa9>\xef6a\xfdO|\x17\xb0\xfc\x94\xc0|\
-\x1a\x96^\x7f\x7f?\x0f'\x1f\x7f\xfc\xf1\xef\x7f\xff\xfb\
-\xdf\xfc\xe67\xbf\xfa\xd5\xaf~\xfd\xeb_s$\xfd\xc7\
-\x7f\xfc\x07B\x8a\x88\xfc\xb8r<\xe9{]\xacf\xfc\
-9\xc5h=\x9a$\x80\x8e\x12\x8e\x17\x8d\x8c\x89\x1c\xf7\
-\x89\x04\xa30\x8dm\x0aHH\xe2W\x90'\x83\xd7s\
-\x90\xce\xb0\xa0e\xd0>I\x0b\xec\xc6<\xa20\x19F\
-\xd6\xda8q\xe3\xc6\x8d\x8b\x17/\xf2\xfcC\x88\xcc\x93\
-\x0f}\x93CH\xa8\xab \xcdaQ\x7f-\xddN\xd7\
-1g\xf2\x83Q\x87\xe7<bM|\xdd\xd5\xd5\xb5{\
-\xf7n\xa2\xd2\xbf\xff\xfb\xbf\xff\xc7\x7f\xfc\xc7\xb7\xdez\
-\x8b\xd3\x1a\xef\x13\xb0\x8e\xcc\xd7M\x9a\x94\x10&so\
-o/\xe7\x19\xf0 \xae\xe9\xad\xd3%w\xb5\xbb\x105\
-\xa1l\x0d\xbcJ\x9cP\xda%w-\x0d\xe7\x01F\x9c\
-I\xa2Ww<\xc9p\x1a\xe9IC\x13\x82\x7f\xb3\x16\
-\x85\x92\x04\xcb\x173\xa4N2o\x02\x96\x9f\xd2\x10\x88\
-\x10\x92\xe2g\xce#\x87,'\x94b\x14N+0\xff\
-\x07\x88c\xe6\xcd\x9b\xb7l\xd9\xb2\xf6\xf6v\xfd\xfc4\
-v\xe9x\xf8\x8d\xf6\xcb\x16-\x8d!\xf2\x18\xd6\xb9\x81\
-\xb9>\x94\x02~\x10&\x1d&\xde\x82\x0f\xab\x12@\x91\
-)\x95\x03\x9c@\x80\xced\xf3\xac\x12E\x14\xf5\x9f\x8a\
-C\xd6\xcdE\x15\xc1\xf2\x11\xb9\xc2\xfa)Q0*\xf0\
-\x1d\x9b\xec\xb9s\xe7>\xf9\xe4\x93\xdf\xfd\xeewo\xbe\
-\xf9\xe6\xa1C\x87\xf4qR\xd3h\xd2d\xaa\xc0\xac\xe6\
-a\x97\xe9\xad\x0fIk\xe3\xc8\x8dG\x95M\x09\x87\xdc\
-(\xd1\xd7{\x05i\xb2\x85\x81\xda\x0f\xe5\xa5`\xc8\xce\
-\xc4\xb6\x8f\xb8\xe7TLa\x05\xa3hs\xe2\xb9\x1e~\
-\xe1\x86\xc0\x88\xa8\xc8\xb7D\x12>y\x8a\x18r\xaa4\
-I\x81\xc7r\xb1\xe2\x0c\x04\xa0\x8b\x17/^\xbf~}\
-\xea\x03\xa3\xb5k\x8d\x86\xf1ky\xd2\x91\xf7\x92U\x1a\
-\x900\x85\xcc\x07M~\x90\x90kQ\x95!\xa1:\xe1\
-GOO\xcf\xd9\xb3g/\x5c\xb8\xc0r\xd3\x0f\xac\xac\
-x\xb2\xc1\xae\xd9\xb3g/]\xba\x94\xc7\x1e\xe6\x9b\xcc\
-L\x1cT\xd9\xe7c\x12\x8f\xd4\xd1\xf3XGM\xd5\x8f\
-U\x0b([\xcf\x1d\x8b(]0\xea\xf0\x00\xca\xd3?\
-G5O'&j\xd2d\xca\xc1N\xca~\xc7$g\
-7\xd1\x86\x92\xbb\x9es\x85\xd9\x1d!\x05\xb5|\xa7F\
-\x93\xf6\xb9*m\x1a\xe5C\xbd\x15&\xaa\xect~\x15\
-\xa1$!VV:K\x12\xafUc\x05\xa3\xd8='\
-\x1ez{\xcf=\xf7L\x9f>]\xef\xde\xe4\x07\x86\x95\
-g\x0c\x125l\xa1\x94\xab+$fW\x90\x04,\x1f\
-0Q\x84\x154\x94\xbb&\x12<\xc3Bf^\xc9\xd5\
->\xc1T$\xe24(\xcb5\x8b\x14\x84\x89\x22j\x8f\
-\xf5\x14C\xfe\x84\xac\xc9\xc1=\x83\xc28\xed\xb5\x9c\xac\
-$\x05\xd5\x19A\x22\xd1\x83\x07\x0f~\xf8\xe1\x87\xfb\xf6\
-\xed#\xcd8Zq\x09P\x0fo\x86\xbf\x19\xa6\xac\xba\
-\x17\x8e\x0e\xdb\xdb\x91\x08\xd2u\x12\xda\xce\x876\xeb\xc4\
-\x95Uq\x04\x947\x18m\xd2\xe4\xaeB\xdb\x87e\x8a\
-\x09\xeb\xdd^\x9d\x82$\x5cUWBHT\xabwg\
- K\x11\xa1\x8c>\xf9n\xd2IE\xdd\xa0c\xa9\xae\
-\x8a!;YTqX\x8c\xbe\x85\x89\xa4\xbd\xbd}\xc9\
-\x92%s\xe6\xcc\xd1\xab\x11u\xbe\xc8\x04\x14\x04\xe9\x94\
-&\x89X\x22\x9d\x18U\x14&jR\xcc\xed\xdb\xb7O\
-\x9f>\xbd7\xfc\x81\xc0[\xd5\xdf\x9bV\xe4@y\xbe\
-N4\x10\xc2DS\x9a\x94\x99Y_\xa1\xe0AX\x0a\
-\xd3\x08\x98\xa8\xa6\xd3TJ\x84w\xe3\xc6\x8ds\xe7\xce\
-\xed\xd9\xb3\xe7\x9dw\xde!$\xed\xed\xede[\x96N\
-\x19\xc0\x09\xfa\xcd*}\x99\x1aY\x99&\xa4\x90B\x15\
-kSC3Udw\xaax^\x98(t@\xd7\x91\
-\xd1\x0cF\x9b4i0X\xef\xbe\xf8\xa1\xc6>b\xa9\
-\x08\x22\x98\xd6\xd6\xd6\x85\x0b\x17\xce\x9e=\xdbD\x93\x07\
-=\x0c\xcf\xf0\xc3\xdb\xee\x93\xdd1\x0f+\xae\x8fx\xd3\
-\x8c\xd3\xe5\x07wa\xac>n\xe1\x86\x0fi\x82\xd4\xa4\
-/<\x1b\xca\x93t2\xa5\x22$\x8f\xd3Mj\xc0\xb8\
-\xf4\xf7\xf7_\xb8p\x81p\xe1\xce\x9d;\xeeO\x8a<\
-\xe1iG\xc2,V\x1c0Q4\xca>jS\x1bf\
-8\xfb\x95>\x22\x19\xfb!Ep\x92a\xa2b\x92\x19\
-_\x8d\x15\x84\x22\x9e(\xae^\xbd\xaa\xaf\xf4)\xe1\x87\
-\x03\xe5\x10\xbdM \xe1\x81 E2D\xd9\x98P/\
-\x87`z]HY\xb5\x1cIt\x0buC\xf2\xd1\xd0\
-\x0cF\x9b4\x99|\xc2\xaaO\xf0\xb4\xe4N\xbc\xda\xa5\
- LTA\x12\x97\xabVPL~5\x8a=}\xc6\
-\x8c\x19\x8b\x16-\xda\xb8q\xe3\x86\x0d\x1b\x88J\xa56\
-\x89\xa8o\xc9\x96V\xc7v\x86\xa6'RH~7@\
-\xacs\xfe\xfc\xf9\xcb\x97/\xfbG\x98\xcc\x05C9\xc1\
-\x94\x22b\xa1tb\xe2AQ:\x8bJ\x9b\x08b\x17\
-\xc2P\xfd\xb0\xdeD\xd1\xca\xad\xdf]6$\x11.\xf7\
-+\xad\xb1\xa2!\x94LM\xb0\x14g\xe2R\xe6\xb9;\
-!E\xecU\xd2\x9eE?K\xb6\xc8\xb3$\xa8\xcb\xc0\
-\xdd\xbcy\x93\x87\x0a\xffQxy\xa0{\xb3g\xcf^\
-\xb1b\xc5\xb6m\xdbV\xae\x5c\xa9\xbf\xea\xec\xf6\x8a\xc4\
-\xfe\x9a\x98^@\x86\xa7\xc8-\x92$\x96\x07\xad1\xa6\
-\x19\x8c6iR\x22\x86\xbb\xce\xa5\x1f\xf6\x87\xba*\xf2\
-H\xbdp\xe1\xc2-[\xb6l\xdd\xbaU\xbfia\x05\
-\x93Gj\x8bL\x91\xbb\x81z\x02$\x1f\x16q\x9b\xb5\
-\xef^68~@\xcf\x15J\xd0\x7f\x9c\xc0!:\xa4\
-+\x82\xb7\xccu\x92\xd4 \xeb\x16$\xc2\xf2\x81T\xb6\
-\x09\x0e\xc1\xbdq0\x1a\xbc\x9e@:\xd7]V\x1c\x91\
-\x15j|\x1dU\x848=\xc5H\xa6Z\xc0\xb3\x5c\x94\
-N!\xb5\x18\x84rTm\xa4\x16\xdaH\x12D\x9f\xc4\
-\xbe\xb7o\xdfN=N\x94\x07\xb6k6\xed\xb5k\xd7\
-vvv\xb2\x93\xcbR\x08\xd6\x0c\xfedC\xc2\xda\xa0\
-o\xa9\x0aY\x89S\xa3h\x0ci\x06\xa3M\x9a\x94\x91\
-\xfa\xd7?\x9aR\xce^c\x90(\x88iii\xe1\xc1\
-z\xcd\x9a5\xfe\x1d4\x93\x08\xbd\x8a\x0fZ\x93\xd6\xa4\
-\x86f\x8d\x16l\x9f\x0e\x98\xc8N\xb8Fb\xee\xdc\xb9\
-K\x96,a\xf8x\xa2\x981c\x86^\x8c\xc9(\x90\
-N.\xb1gjk6\x1918Y\x939\xe5a$\
-\xb51\xbdj\xac,\x83\x15G\xbf#5\xf5\x06\x94\x89\
-\xad\x1f\xd0k\xcb\xaa\xccs\x15\xe6\x93,\x80\x80\xe5\xeb\
-p\xa0\xb2\xb8Q\x9et!Y\xa5K\x05\xa6\xe1\x07\xe2\
-Q\x16>W\xdc\x12\xba\x9f`\x1a\x91\x13\x84I\x0b\xb0\
-\xca\x01\x13\x0d\x13\xab<\xd2\xea)\x9a\xc1h\x93&S\
-\x81\x1a;Bjcb\x97'\x1e\x9d7o\xde\xec\xd9\
-\xb3\xb5\xcbO\x16\x7f\xfa\xd3\x9fn\x07\xbe\xaa\xfb\xfbS\
-F\xb6\xf1\x0d\xb9/7\x04X\xc19D\x18\xbax\xf1\
-\xe29s\xe6\xf8\xd8\xc9\xbad\x8c\xf3\xa0(\xeb4\xc9\
-\x95p\xe2\xacJ\xa9\x98\xc2\xe5\xa9D\x93\x18\xf7a\xf0\
-Y\x82\xe4\xc2D\x15LZ\x1fq\x15n\xc1\x1cP\xd0\
-\xa6\xdbM\x0d0\x8a\x0d\xaa\xb3\xb3\xb3\xa3\xa3#~\xff\
-\x97\x8b\xbc\x91\xb8; \x89\x08\xe5\x85\x98R5\xc8\xbd\
-\x9d\x12\xa2\xbe\x11\x862\xe2&\xaa\xc6\xad\x10\xd2\x07\xcb\
-\xd7\x8dU\x0b(\xcb5\xd5\xb8\xa7S\xf2\x11\xd3\x0cF\
-\x9bL\x10Lhv\x19\x16R\x0c\x12\xd0\x5c\xbf\x9b\xd1\
-z\x06\xcb\x0f\x85i\x1b&LQT\x86\xb7\xd9\xcb8\
-\xc3\xf0\xff$z\x9e\xbe\x11\x83\xde\xb8qC\x7fG1\
-\xb7\xabCB\xff\x1dI\x82\xd1\xa0\x5c\x82\x8a\x5cA\x84\
-\x1a\x8d7\xeb\x182\x8eg\x9e\x22\xee\x0d\x7f \x110\
-\xb5\xce\x179UN\x09G>\xc8\x0f\x80DW\xc7\xf5\
-\x13w\x06<\xebBI\x9a\xa4H9G\x1e\x06\x97+\
-!\xa4S\x03\xd5\xcd\xa6\x81\x11dJL\xb1`\x94'\
-.\x1e\xb7\xb6m\xdb\xb6n\xdd:=t\xc9\xba\x22_\
-e\xe5z\xd3\x99\x8bi\x04L\x14H\xde\x8e\xe6\xfd-\
-\x83RA?\xb9\xca\x1b\xc9<\x08\x84\x12\x13\xca\x16!\
-\xb9p\xb5z\x08\xadVa\x05\x19\xb27\x1a\x0d\xcd`\
-\xb4\xc9D\xc0v\xc9\xb6\xb2h\xd1\xa2\xa5K\x97.\xaf\
-\xb0,\x80p\xee\xdc\xb9E\x8fzw\x15Z\xf6\xbe\xc2\
-\x95p$I\xf4\x8a\xc9U\x8b7\x94\xa4\xa1P\x1aB\
-\x91I^\xfe\xec\xfb\xb7n\xdd\xbay\xf3f\xd1\x9bQ\
-\xf5\xd61i\x05\xd9\xe5\x98\xb4\x82W\x89\xaf\x22V\xce\
-V,3\xc1\xa6\xb4Q\x9c\x9dAl$z\x15<\x9b\
-\x92\x07\x87\x0d\x22\x89\x8aB\x1b\x09\xca6\x19=\xee\xe4\
-,\x92\x9b\xc7#T\xa4E\x1aj'(\x0b\xa4\xa5\xa6\
-\xa1W\x0bIsS\x02\x9e\x93\xf5\xb7\xac8\x1ax\xf4\
-B\xe2\xd6%6\x0fe\xe9\x90\x0aB.\xb5L4\xff\
-E\x9d\x8dL<\xf4\xd3\xe7\x80\x12\x92\x07\xc7T\xf5\xd9\
-%\x9eH\x91\xd8_\xc1D\xd5\xe4\xcaSM\xa9\xf1\x18\
-+\x18>\xcd`\xb4\xc9\xf8\xc2jaC\xe9\xe8\xe8\xd8\
-\xbe}\xfbs\xcf=\xf7\xca+\xaf|\xef{\xdf{\xed\
-\xb5\xd7\xb8~\xf7\xbb\xdf%\xfb\xc2\x0b/\xec\xd8\xb1c\
-\xe1\xc2\x85\xa8%/K3\x14-\x95)\x83\x16\xb0\xcc\
-\xf4\xf5\xac\xabK\x92\xc7\xf6\xe8y=\xd9?\x061a\
-\x8a\xb8@\xad\xf9\x95\x22\xbd\x1c\xf5\xbdl\xe2\x91Q\xb7\
-o\xdf&\x1e%*U\xdf\xb2\xa4\xe4\xc1^\xecJL\
-S\x1aHK\xcd\xf2\x09\x892 w$\x19,\x0b\xb8\
-\xbc!\xc0Q\xc4\xeez\x97\x8c\xf7dW\xca\xa2\x14\xd2\
-!\x11\xdc\x92\x83\x8a\x82n-be!y\x93,\xee\
-\x1fOT\xb0l\x10\x0f\xa2\xb2\x14V\x16\xe1B)0\
-\xac\xcc\x01\x1e\xe4\xf4MR\x12N\x0dd\x1aW\xd9\x0b\
-V\x10pc\xad,*\xad\xd3\x0f\xaa\xc5\xee\xe7uS\
-\xf7\xd2\xb5l\xc4\xbd\xca\xf60\xb7\xcf\xf5;$\xf6F\
-mRm\x92\x15JK8\x02\x9a\xc1h\x93\xf1\x82\x99\
-=c\xc6\x8c\x05\x0b\x16\xac^\xbd\xfa\x81\x07\x1e \x12\
-%\xfa\xfc\xc1\x0f~\xf0\xc6\x1bo\xfc\xf0\x87?\xd4\x15\
-\x90\xbc\xf8\xe2\x8b_\xfb\xda\xd7\xd6\xad[\xa7\xd7\xa5K\
-#\x16/^\xccSr\x19~\xe9{\x9c\xd02f\xe7\
-\xd5\xe6\xebB%D\x9c\xf54\xeeM!9\xc4iH\
-\xb5\xc6\xa6C\x18:w\xee\x5c\x86f\x12?6J\xaf\
-\x88\xabz{{\xaf^\xbdJt\x85\xf9\x12\xaa\xb4\x06\
-\xb25\xd8\x18R\x15\x92L\xc0\xf2\x11\xf54[~\xb0\
-B_\xca\xdd\xd5\xd5\x85\xd3\x88B\x102|<\xb0\x85\
-A\xcc1<\xd7\x1b\xee%%@\xf2\x22\x8at\x86\xac\
-x\xd7\xc2H\xa5\xa6\x5cE\x92\x08\xe5O\xa1\xd2\x22R\
-\x8dH?%d\xe1\xf0\x88b\x99\xa9\x82\x9c\xa3\x9f\x98\
-\x07\xcf%XY\x05yC\x9a\x92\xa4\xc8\xca\xa5\x0cJ\
-\xbb\xc4\xb3N\xf6v\xa5\x22vH\xdc\xf3`\x8da\xa2\
-\xe1\x90\xaaX\xc3\x09\xb9E\xa1S#\xf7[3\x18m\
-2^L\x9f>\x9d\xe0\xf2\xb1\xc7\x1e\xfb\xd6\xb7\xbe\xf5\
-\xd2K/=\xfd\xf4\xd3\x84\xa4[\xb6l\xd9\xbcy\xf3\
-\xa6M\x9b\xb8\xea\x0b\x86v\xec\xd8\xf1\xf5\xaf\x7f\xfd;\
-\xdf\xf9\xce\xab\xaf\xbe\xca\xf5\xdb\xdf\xfe\xf6\xcb\x01\x12T\
-$\x84\xa5\xd6\x92%Kf\xce\x9cyO\xf8\xf6cg\
-\xb2\xa2\xa8\xb1\x85\xdd\x96\x98l``\xe0\xd6\xad[\xac\
-dm\x07`\xc5\x01\xcf\xc6\xab\xdd\x131\xae\x99\xaa\x22\
-$\xc7u\x04\xa3\x1d\x1d\x1d\xeb\xd7\xaf_\xbbv\xed\x9c\
-9sR\xb7\x9b\x188i\x88A/]\xba\xd4\xdd\xdd\
-\xdd\xd7\xd7w\xe7\xce\x1d\xc5\xa3\xf5@\x87C\x9f\xcd(\
-\xe1i\x99#\x1dGE\x90\xd4\x09X\xbe\xa1`\x9e\x9c\
-9s\xe6\xe8\xd1\xa3\x17.\x5c\xd0\x84AX1'\xdf\
-\xa2\xd8\xf6z\x90\xbb\xb2PT\xb9\xd1 \x927I!\
-G\x09\xcf\xaa(\x85\x1c\x98u\xa3K\xe2\x8aq;(\
-\x08\xc9%\x9c\x1a\xb0\xb1\xb3\xdb\xb3/\xf1\xa8\xccf\xa5\
-p\xd4\xca\x22jXm\xae\xa9\x89\xa9VH\xeeQ\x81\
-lV\xa1<X/\x03\x92\xe4Z\x94k\x82kzb\
-\xc4\xf8\xddE\xdc\x9f\x91\xd1\x0cF\x9b\x8c\x0bl(\xec\
-&\x1b6lx\xf6\xd9g\x89,\xb9\x12z.\x5c\xb8\
-\x10\xe1\xacY\xb3\xd8k\xb8\x02\xdb\xcd\xbcy\xf3\x88\x8a\
-\x08U_{\xed5\x7f]\x0a?\xfe\xf1\x8f\xb9\xbe\xfe\
-\xfa\xeb\x84\xa4\x8f>\xfa(M-[\xb6\x8c\xa8\xb43\
-\xb0h\xd1\xa2\xb6\xb66\xe2\xddQ\xae\xa8\xc9\x85\xd5K\
-$z\xfe\xfc\xf9\x13'N\x10\x96y<J\x91\xdb\x15\
-e\xf3-\xcd\xf5\x80\xf6\x85d{\xa8 9\xe3\x02\xf8\
-m\xc1\x82\x05<\x0fl\xdb\xb6\x0dgN\xee\x8bg\xbd\
-\xda\xf1\x1e\xa6\xc8\xb5.&\xb6\xce\x13C\xd6\x02Wn\
- \xbe\x0a\xdf\x83\xc8<\x01\x8f\xdd\x83\x03j\xd9\x827\
-bL:R\x0f\xe8v`\xf9&\xd5\xa4<S\xa7\xa3\
-\xe2q\x89\xd3P\xd4BJm\xca\xc0\x065c\xc6\x0c\
-\x9d\x14\xe1\xa5\xc3\xd0ff\xbd\xe7\xd7!\x09\x95\x0c<\
-\x9d\xcc\xec\x80\x89\xca\x04\xbd\xd2n\xc95\xdbE\xb3\xa7\
-\xda\x15\x9e-J\xd7\x89\xaa\x08\x13\x8d5\xcd`\xb4\xc9\
-\xb8\xc0\x86B\xc4I\xc4\xb3r\xe5\xca\xb5k\xd7\x12G\
-\xb6\xb6\xb6\xb2\xc5\xdc\x13\xbe:\xce&u\x80H\x88\x22\
-\xa2LB\xd2\xad[\xb7n\xdf\xbe\x9d\x08\x09H\xdfw\
-\xdf}\x0f<\xf0\x00q*\xf1(\x11\xedK/\xbdD\
-\xe2\xc5\x17_|\xe1\x85\x17\x88n\x1f|\xf0\xc1\xe5\xcb\
-\x97\xb7\xb4\xb4\xf8\x1bSZ\xb6\xdb7\x0e\xd7\xaf_\xef\
-\xea\xea\xda\xbf\x7f\xff\xa9S\xa7H\x13m(\xc8H\xf6\
-\x9a\x0ax\x09I\xd1&\x80\x82\xa5*\xe9\xf8\x9a\x02!\
-^\xc2c\xec\xf5+V\xacX\xb3fMGG\xc7\xa4\
-\x04\xa3\x8c\x17\x8f\x22<\x9f,]\xba\x94\x07\x92i\xe1\
-/\xad[Y5\x15\xf3\x07\xafY\xb2\xc6\xa2\x19\x83\x04\
-\x9d\x18\xa95\x1c\xfa|\x85~\xe7Ov1\xa0\xa0t\
-\x11\xb5K\x9b\x94\x81d\x9a\x06,\x1faS6`\xa2\
-\xa9\x0b\x1e`>\xb3?`\xac\xa2\xaexz\x07\x1f\x0c\
-\x22\xa1\xf0l\xae\x0f\x9d\xc4\xc5\x91\x82\xb2@\xf5?\xfd\
-)y\xd8\x1b\xd6Oi&\x18:\xc6\x19aO\xef\x89\
-\x03\x06\x7f\x98\x06\xa6TM\x5c\xa44(\x9bKhu\
-\x10\x93V\x90$\x96\xd7n\xad~\x9a\xc1h\x93\xf1\x82\
-9\xcay9=\x10\xff\xae\x8c\xcf]\x9f\xd6\x14\x11\x0f\
-\xf9\xebR \xad,a\x0a\x01\xd3\x93O>\xf9\xdd\xef\
-~\xf7G?\xfa\xd1O\x02?\xfe\xf1\x8f\xdfx\xe3\x8d\
-\xef|\xe7;O<\xf1\x84\xde\x98.^\xbc\x98\x13\x9a\
-\xa0\x96{\x8d\xd5\xda\x98\x18\xd8\xf8.^\xbcH<\xca\
-\xf5\xd6\xad[H\xe8\x7f\xca\x04\x5c$!\x98\xa8\x1a\x14\
-\x84\xd2\xa9k\x0a\x09\x19\x1a\x02\x9a\xf6\xf6\xf6\xc9\xfa\xd8\
-(7e|\x09F;;;\x198\xcd\x90\x22\x03\x87\
-\x8b|\x05\xca\xba7\x02\x925*\xac\x14\xfc\xc6\x95\xd3\
-Z\x06\x9aY\x05\x86\xb9\x1f\x94\x00\xd2E\xcaE\xe4\xea\
-\x87{6\xb87\xcb\x84\x0dO\xc0D\x11YoK\x22\
-L4\xb5 \xf0J\xde\x01V>6j\xd2j$\x97\
-B\x8a\x5c\xb9W\x11\xe6\xee\xe0p\xc2\xd0K\x97.\x9d\
-9s\xe6\xca\x95+l\xcbR(\x15\xf4\x9c0\xd4\x22\
-\xd1\x0af@4g\xe2t.q\xf5Q2\xe4\xbd\xea\
-\xa7\x19\x8c6\x19G\x98\xa9D\x18zg\xe9o.Y\
-\x09\xc8\xb9\x0a\x97\xa0\xe0H\x1f\x88Q\x88\x96\x88W6\
-m\xdat_`\xc7\x8e\x1d\x0f<\xf0\xc0C\x0f=D\
-\x84\xfa\xe2\x8b/\xbe\xfc\xf2\xcb\xdf\xfa\xd6\xb7\x9e\x7f\xfe\
-\xf9\xa7\x9f~Z\xefJ9\xaa\xd5B\xe8B\x03\xc0\xe6\
-B\x18\xcaVH\xa2\xf6\xce\x0b\xbe\xf8=\x11+\xab.\
-(-a\x16\x8a\xa8\x8eo\xf5R\xd9\x9b\x9a`\xb8/\
-\xc3\x04\xea@\x8d\x0eK\xc1\xafN(4R\xd5M\xa3\
-\xa2\x13\x95Z\xa2\xc6\xed\xca\xcc\xb5k\xd782\x07\x06\
-\x06\xf4\x0bL2\x10[j\x98#?\x80\xe5\x03E\xfa\
-j*\x85\x955\x19))\xe7;E\xee\xd5x\x09\xb2\
-\xd2\x91\xb2\x13\x14\xa7&X\xcd\xb6\x90\x1c\x00asp\
-c\xe3\x84\x88\xd3B\x0a`\xf9\x0cV\x5cq\xb2\xb6 \
-\xb2\xac\xa9\x13'N\x1c<x\xf0\xf4\xe9\xd37n\xdc\
-\x885\xcb\x83L\x10&\xca\x03\xbb,\x95\xa1v\xc5z\
-H\xb5 7\x0a\x13\x8d\x88f0\xdad\x1c\x89gm\
-\xeeL\x8dgp\xb2\xbc\x02H\xd8\x1dt\x0d\x89\xe4\xc7\
-\xca\xd3\xa7O\xf7W\xa7\x84\xa7mmm\xabV\xadz\
-\xec\xb1\xc7^}\xf5U\xbd1\xe5J\xfa\xf1\xc7\x1f_\
-\xb7n\xdd\xc2\x85\x0b[ZZj\xfc\xe4\xb7<` \
-\xe6\xcc\x9f?\x9f\x0e+.\x14V\x5cM\x5c$_)\
-\x9dEE\xd2\x17\x92\xa7(\x92O\x0ct\x92\xf8[\x9f\
-L(\xb2%12\xa0t|Ub\x04x\xc5\xd14\
-2)0[p\x17'\xa5\xbe\xcdG~c\x10\xc32\
-)\x1c\xca\x1a6&\xf6Wc\x05\xd5\xd4(j\x92B\
-\x03\x91\x1d\x0e$Y\xa1p\xdf\x16)8h\xfabA\
-Y\xe3>d\xad\x86#\x99mabC\x9ds[U\
-b$\x8fA&y\xaaT\xed\xb3\xb2\xfa\xfa\xfa._\
-\xbe\xdc\xdf\xdf\xaf'\xbd\x12\x12\x5cb(\xcb5\x98\x9b\
-\x10T\x0c\xd7\x89q\x9d\x94\xf2\x90H?\xb9G\x94\x10\
-du/\x91h\x8f\x88f0\xdad\xdc\xd1|\xd5\xc4\
-\x15\xec\xa7H\xe2\x89+\xb9e\xaa\x17\x12\xff*\xcb\xae\
-\x94<+\x07\x084\x89\xde\x16-Z\xb4~\xfd\xfa\xed\
-\xdb\xb7\xef\xd8\xb1\xe3k_\xfb\xdaSO=\xf5\xado\
-}\xeb\xdb\xdf\xfe\xf63\xcf<\x83\x90\x90tR>\x0d\
-9,f\xcc\x98\xb1b\xc5\x8a-[\xb6p%*\xc5\
-\xb4a\x1d0\xb1\xd3\x1a\x0e\x9e10\x9fg\x0c\x125\
-\xec\xd5\xdc\x88\xdf\x19\xeb\x1a'\xb2P\x14\xc7\xb8I\xfb\
-\x95\xffR\xf7\xaa\xd1H\xd9\xe0I\x8cY\xbd|\xf9\xf2\
-y\xf3\xe6\xe14$nK\xca\xa8\x14\xd88z3\xe3\
-\x16H\xe3\xdexP\x9a8\x8c\xc5\x88}\x12\x8fc\xed\
-1Uim\x9d\xa9\x81\xc7\xa3n,\x09Ok\x06\xa6\
-\x90\x5c\x0a)r\xe5\xb4\xc6\x82\x9a3gN\x99\x7f/\
-V\x9d\xd4O\xb4j\xc7\xe8\x22xb\x10\x93f\x18\xa5\
-\xb1j\x99FF\xd9N3\x18m2\x8ehv\xa6\xe6\
-h\xedU!,_\xc1\xa4\x15\xb9e*\x9fI%\x9a\
-!0mmm\xe5\x90~\xe4\x91G^y\xe5\x95\xd7\
-_\x7f\xfd\xf9\xe7\x9f'N\x9d\xac\x0fD\xd6\x09&\x10\
-^\x10\x86n\xda\xb4I__\x85$^\xdb\x8e\xf4s\
-1\x8dj\x1d\x13U0i\x99\xa0W\x0c\x1f&3F\
-\xfe\xcc\x90l\x99\xd5\x14\xc9\x85\x8a\xa4\x03\x12:&\xcd\
-z\xc3\xfe-\xa3[j@\x87\xf1\xd5\xb2e\xcb\xf4\xee\
-\x9f\x99\xcf\xdcVD\x08\xb2Wv\x81\xaa\xa4\xfc L\
-#\xe8HA\xa8\x14\xbc\xd4!\xeb\x87\x1f\x9a\xdcN\x9f\
--\xb9~\xfdz\xfc{\xfdMD\xec\xcc!\x09\xce\x1e\
-\x1c/\x97\x80\x84)\xac\xac\xa0tj \x03\x99r>\
-\xeb$\xc9EU\x1cw\xbe\x15W\x91\x08U*P\x16\
-\xa4\xff,\xfc\xad]=\x1b\xab\xb4l\xd0y\xbd\x88\xf1\
-`4e\xcepQ\x0b\x82\xac\xbb\x22.R\xb6N\x86\
-\xab\x1f\xd3\x0cF\x9bL4\x9a\xe25\x90\x8e\x94!N\
-\x83\x16\x0cX>l\x22\xa0_\xec\xe0\x90&\x06\xdd\xb1\
-c\xc7\xfd\xf7\xdf\xbfr\xe5J\x0e\xef\xd2\xee,\x82\x9e\
-\xd3\xed\xb9s\xe7\xb2\x09\x92\x96\xb1\xb2.\xf1Efm\
-\xc7\x86\x0f\x89\xb7\x90m'\x040\x83/\x0e'\x1en\
-\xad>\x80\xba\x91\xdb\x19\x84\xb9rQ\xa3(\x0b.\xf0\
-\xff\x1cwQC\xc0df\xaa\xb4\xb5\xb51[8\x8d\
-\xdc{\xb2\x02\xa4&\xb7\xf8U\x89,)y\x9cM\x15\
-\xa9e\xae\xc8u\xd3\xdb\xb7o_\xbbv\xad\xa7\xa7\xa7\
-\xbf\xbf\x9f\xc0TjM\xa0\xd0\xdb\xf6\xef\x10\xe4Vw\
-\xff+\x11St\xbb\xc6\x85\x89\xcd<g3\xf4H\xb4\
-\x1e\xe4\x1ca\xa2j\xa1\x90P\xa5\xee:\xe63s\xf8\
-\xe6\xcd\x9bW\xae\x5c\xb9p\xe1\x02\x8fXe\xf6\xaa\xf7\
-\xbf\x1e\x82\xd1\x86g\xb3r\x07\xc3\x1d\x13\x05\x5cM\x89\
-Po\x10\x15\x8d\x92f0\xdadB\xb1\xc9\x9b\xc1\x8a\
-+\x0a\x9e\x00\xc9!\xb5B\xe2,j\xda\xc2\x08I9\
-\xa7\xf5]Q\x04\xa3\xc4\xa6<GJ\xa7\x9cp\xa8\xb3\
-\x03^\xbcxQ\x87\xba\xec\x8d\xadN\x5c\x10e\xc7\x0a\
-5\x0b\x96\x9fp\x18;6\xfd\xee\xee\xee\xb3g\xcf\xf6\
-\xf6\xf6\xd6\x0eh4\xd61V\x10\xf0l\xb6\xc81k\
-3Xq\x83@\x87\x99\xe7\x9c\xd3\xa4S\xc6z:W\
-\x98\x22\xa9\x99W$a\xb6(\xa8\x0f~\xec\x81+\xe3\
-u\xe7\xce\x9d[\xb7n\xe9\xd3\xabRk\x92K\xe2;\
-\x5c\xa4k1\xa1<\xc7\xff\x9a\xa5>W\x1bn\xd2\x0e\
-\x0b\xa67\x1b8O\x5c3f\xcc\xc0R\x19\xeb\x9e\xa9\
-\x13\xaf\x98Knk\x0aF\xf578\xd8\x97L:E\
-\x91\x7f\x1c\x09\xe5\x96\x08\x89\xeb%njd4\x83\xd1\
-&\x13\x87\xe6k\x8aTQ*\x9bE\x0aY(b#\
-\x03\xa2\xcf\xd9\xb3g/^\xbcxk\xa0\xa3\xa3\xa3\xb4\
-\xf1(+~``@\xdf3z\xe6\xcc\x19\xfd\x0a\xa7\
-l\x0c\xb6&HS\x14\xed\x0f)\xb5\x5c\xd4\x9a#_\
-\x01i\xd3\x98X\xd8\xfd\x89A\x8f\x1e=\x8a\xed\xc4\xa3\
-\x9c\x04\x1e\xeb\xd4\xc3\xb07\xcb\xa9\x82\xc6+\x8ca\x02\
-i\x5c\x813\xb9\xd6\xe3\x13WS\x22\x85tr1\x8d\
-\x00Y\xad\xb2\x96\x96\x16\x82\x06f\x91t\x9ad\x91\xbb\
-\xe4\xb7,\xd2\x89I\x095\xc4~u\xc8\x16\xb5\xd0\xd0\
-\x10\x86\xae\x5c\xb9r\xcd\x9a5\xed\xed\xed\xc9\xbe\x1d,\
-\xad\x8d\xbc\xe1xV\x89\xc4Y\x15$\x97\xdf\xd8m\x94\
-\x15H\xbe\xfa\xea+v! A\xd6\x0a\xcaG\xe8~\
-\x15V\x10!c\xddd\x08\x0e\x18\xc4\xa4\x15\xd4H\xdc\
-T\xac\xe2\xfaJ\x84\x06\xd2\xc4\x0a#\xa3\xb9\x894\x99\
-44\x89\xc1\xf2\xc5HG\xca \xa1\x83DA\x95 \
-\xfdg\x7f\xf6gs\xe6\xccY\xb7n\x1d\xc1\xe8\xa2E\
-\x8b\xca\xfckLw\xee\xdc\xb9p\xe1\xc2\xb1c\xc7\x14\
-\x90)\xaaPQ\xb2\xcdD\xbbC\x92\x8e\xb2\x02{-\
-5\x1cT+xk$\xd5\xc7\x04\xcc\xb9u\xeb\xd6\xd5\
-\xabW1\xbf\xaf\xaf\xaf\xb4\xbf\xbeZ*|\xbc\xc2\xd4\
-H&\x83\x06\x11\x5c\x08A%\x07+.\xc0\x94\xaa\xb1\
-\xb2\x80$\xdc\x8b%F\xa0\xa0\x8f\x97\x10\x92\xeaMm\
-\x93\x14\xee4% N\x83\xb2)a\x0cE\xa0\xc1\x0d\
-\x83\x9c\xe0\x92\xa9\x07\x0f6K\x96,\xd9\xbe}\xfb\xa6\
-M\x9b\xf4\xa9h\x5cS\xc3X/\x8a\x13BY0W\
-\x06\xa2\xac\x0a\x07A\xc4\xdeK\x84\x9a\x0aRK\x85\xba\
-\xee\x984\xc2\x8c\x1f\xfe\xf4HU\x89\xb3\xd9\xa2\x94\x04\
-\xb2\x92\x11\xd0\x0cF\x9bL\x1c\xb6\x86\x02&\xaa\x03M\
-t\xbfB*\xf4\xe4\x1a\x14\x13<{O\xf8\xd5\xc8\x8e\
-\x8e\x0e\xaee>,q\x051(\xd1\xd8\xc0\xc0@\xfc\
-\x13\xcf8\xe1\xe9\xb1\x82\x06}\xdb\xd5g\xb3$\x9f`\
-\x18)\xce\x9b\x96\x96\x16\xfd.\x8e,Ma\xaa\xf5\x91\
-L\x88\x82m\xd1\x9a+\xc0\x94\x1a\x07\x0d\x1f\x98\x01\x11\
-\xa6\x11\xc8\xf5\x06:^\xd1D\x11\xb1Pi\xae\xaeO\
-\x83\x8c\x94\xe6Lpv\x82\x94\x9b\xc4\xe0+O(\xed\
-\x09'\x95\xcd\xa2*\x10;Y\xe9)\xe9v\x82\xd1\xc5\
-\x8b\x17\xaf[\xb7n\xd9\xb2e<\xe4\xd4c\xa3\xeb\x90\
-\xc8M\xc7\xe0I%\xbc\x10IXF\x09<\x0f\x03\x09\
-W+!\xdea\xa5ktU\x1e\x90+@B\x91\xaa\
-\xa5\xd2\xac\x1a\xc4\x92X!%\xb7\xd4\xe8h\x06\xa3M\
-J\x81\xd6\x15\xe4fEX\x0b\x16}\xc6g\xa1\x90\x8e\
-U\x0b\xdb\xf7\xb4\x00Q\xa9\x97\x96\x13z\xcbC9x\
-6\xc6\x85Jd\x19\x81uT!\x9e\xc03\xec\xfe\xb3\
-f\xcd\x22a\x05\x13\x0b\x83\xa8\x0e\xdc{\xef\xbd\x1aP\
-+\xc8#U\x1agG\xe0\x81\x06\x85i\xc09\xa4\xa9\
-\xa2A\xc4oB\xa5\x8e\x14b\x92\xfa\x95\x16\x5cG\x09\
-\xf0t\xd0\x1aDB \x1d\xb7\x03\x085oU\xdaD\
-\xc4.\x12\xc1\x7f\xa3u\x91\x9c\x0fJK8\xc5`#\
-jkk#\x1e\xd5\xdf(\x8e\xedU\x22\x97\xb8(\xd6\
-\x94\xdbc$g\xb1\xa4\xd4\xee\xdc\xb9s\xed\xda\xb5\x8b\
-\x17/^\xb9r\xe5\xd6\xad[\xaeYfF\xd6\xc9\xc4\
-\x0by\x15\xe5\x0d\xb9%F\xa5\xe0\xe98!<\xab\xc4\
-\x88i\x06\xa3M&\x01\x9f\xb8\xb9kC\x12\x159H\
-\xc2\xccO**\x91\xc5kY~\xd4\xcbcb \xa4\
- h\xe6\xea\x9d\xb7\x82j\x5c.5\xf0\xb4\xc2\x0b\x95\
-\x0eIpL\x02[\xff\xdc\xf0\x87\xce9\x00&\xe5\x93\
-\x0c\xc41\xfd\xfd\xfdW\xaf^\x8d\xff(\xbf\x90Q\x10\
-\xc7:\xf49'\x11\xd2\x89=\x11H\x12\xbfD\x04\xf5\
-|\x5c_\xd92C'C\xf8g\xcf-\xea9x\xe7\
-\x13S+H\x92\xc5k\x15QT\xdd+2.(p\
-\xa83\x85t\xb4K\xde$\x97!\xfd3\xdc\x11Qz\
-\xea\xb9\x1d\x8b\xf4\x1b\xa8\xda\x0f\xc9\xca\xc6\x94\xf9)\xe2\
-\x22\xa5U\xabN\x98\xcc\xecB\xc7\x8f\x1f\xff\xf4\xd3O\
-\x0f\x1f>\xdc\xd7\xd7\x87\xc4\xca\xcaJ\xf0\x87\x91\xec\x92\
-\x95\x17\xa5JK\x0eYeIr\x91\xb7\x93\xe7\xda\xca\
-\x0f\xca\xe2*\xb5\xeb\x0a\xb5`\x99\xe1\xd3\x0cF\xcb\x08\
-\xb3Ao\x8cf\xcf\x9e\xcd\x954\x9b\xfeh\x86y\x12\
-\x89\xbb\x1d\xe6j\x82\xd2\x12\x8aT6\x8b/\x8c\xd0\x80\
-\xb5\xa0\x84\x93\xbb`r\x85\xa5B\xc1\xa8\xf6_\x86^\
-v\x09\xd3(\xf0\x8f\x0c\xcb50U=\xf1]\x04w\
-\xe1v\xd3\xa7O'\x18\x9d?\x7f>W\xb2\xa6:\x81\
-\x10T\xb1\xf5_\xb8p\xa1\xa7\xa7\xf7\xd6\xad\xdb\xdaF\
-\x91\xab\x93\x22\xce\x92N\xd9\x05d$t\xac\xa0n\xd4\
-rC ?\x80g\xfdZ'\xe6\xa3:\xbc\x94m\x96\
-\x01R\x82\xea\x94\x86\x83o\x18OAw\x1bx\xc6\x9d\
-3\xa4\xc3\xc3\x98\x18&*\x806\xe5we\xa7\xd8\x10\
-\xc4\x1b YO8\xa9l\x96\xe0\xf5\xba\x1c\x22Mv\
-\xa1\x81\x81\x81\x93'O\xee\xdf\xbf\xbf\xab\xab\xab\xfc_\
-U\xe6>Q\xff\x1d\x95\xd6\x8f\xda)\xc2\x94\xc2]<\
-!H\x9bR@\xa5\xa3\xa7\x19\x8c\x96\x0b\xc2\x91\x8e\x8e\
-\x8e-[\xb6<\xfc\xf0\xc3O\x04\x1e\x7f\xfc\xf1\x1d;\
-v\xacY\xb3\xa6\xad\xadm\xb2~\x9c:\x1a4wc\
-\x8afp\x91<\xdb\x02H\x19,_Ak%\xb9\x06\
-LZn\xd8\x7f\x19Y \xc1\xd1\xc2V\xe8\x07Ll\
-\xa3,\x02e\x13\x8a=c\x99\x8aC\xb2\xa0\xc3d\xd3\
-\x875'\xeb<\xe3\xa6\xb7o\xdf\xbe~\xfd\xfa\xcd\x9b\
-7\xb0[\x92\xb8'\xca\x0a\x13EB\xcf*\x01\xb1\xe1\
-\xf5#\xf3GVw\x82I\x866\xbc\xbd\xb0|M0\
-J\xa6\x09\x93\x82Z\x19\xca\xde\xb8\x96\xeeh\xd5BE\
-f)\x03w\xed\xda\xb5\xe6\x97\xde\xa7p\xa7\xc5\x0e\xcc\
-\xc5\x9d\xa9D\x8c\x14R\xa8AA\xc6\xa4S\x0esA\
-\xc0D#\xc2\x9a\x88\xb0\x82hh\xb82{o\xdc\xb8\
-q\xf1\xe2\xc53g\xce\x5c\xbdz\x95\x1dI:\xe5\x84\
-\xde\xde\xb9s\xe7\xab\xca\xaf{\xca\x8a8\x01\x89m\x11\
-&\xad&\xf6\x86\x9c\xe3\x984\x22\xdbN6+,?\
-\x22\x9a\xc1h\x89 8\x987o\xde\xd6\xad[_z\
-\xe9\xa5\x1f\xff\xf8\xc7\x7f\x11\xf8\xc9O~\xf2\xfd\xef\x7f\
-\xff\x99g\x9e!B]\xb4h\xd1\x9c9sf\xcd\x9a\
-5s\xe6L}\xa4\xc6j\x96\x15\xcdNMS!y\
-=\xc4\x0bcX\x15\xe3\xfb\x99\xa4\xdc\xa8\xab\xec2`\
-\xa2\x08Y!\x1dIb$\x94\xaf\x84\xe4\x9e(B\x15\
-\x89\x80g\xcc\x98\xa1\x8flJ>\xc1\xd0\x0dY\xad\x0e\
-\xeb\x9a\x98\x1aH4\x8aq\x1dO\x8c\x0c\xbf\xa9\xb2e\
-\x86\xae\xfaH\xf9\x10\x93\x88\x91P>\x89\x91\xdc\xab\xb9\
-f.\x83\xfa\x95\xf6\xb9/(\x0d\x8c\xda\xcd\x9b7\x07\
-\x06\x068\xc8s\xe7\xed\xddL\xb2\x92+>qO\xe2\
-4%\x84g\x83;\xd3\xa8\xa8\x06aH\x93\x96\xeb\xd4\
-o\x08\xd8\x8e\xa6\xe5}\xca\xdfmt\xabG\x86\xb7\x13\
-\xc3c\x15\x01h\x7f\x7f?OV$F\xd3\xfe\xb8B\
-\xc7\x08C{zz\xce\x9f?\xcf\x95\xb4\x15\x04\x86\xdb\
-\xed\xc4\x8f#\xaa\x02\xf5dG@3\x18-\x11\xc4\x04\
-\x9b6m\xfa\xfa\xd7\xbf\xfe\xec\xb3\xcf>\xfd\xf4\xd3O\
-<\xf1\xc4\x93O>I\xf6\xb9\xe7\x9e{1@\xe2\xa9\
-\xa7\x9ez\xec\xb1\xc7\x1ez\xe8!}\xf9\xc5\xa4\xfct\
-\xb5~\xb2\xb33+\xc9\x92\xdd/\x9c!\xeb\xc6\x0cK\
-y\x12a7\xbcu\xeb\x96\xf6Al\xd7\x91oe\xd1\
-\x22\xcfb\x1a\x05\xa8\x11\xae\xfc\x93\x5c+\xa8\x14\xb8Q\
-KK\xcb\xca\x95+\xd7\xae]\xdb\xd1\xd1\xc1\x19`\x05\
-\x93\x81\xcc)\xb2+\xee\xb6t\xc0\xf2\x11\xb9\xc2\x22\xd4\
-\x08\xf0\x10\x08x\xc3\x0a\xca\x0d\xae\xa0\xb7\xb1C \x19\
-\xd7\x083,\x02\x1d]U\x0d\x1d]\x9d N\x90Z\
-\x8c+PD\x8c\x15+\x90\x8e\xeb6\x89\xc19\xf2\x95\
-'\xe4I\xa1l\xa2\x97\x87t\x84\x89\x0a\xa8G\xa7Q\
-\xe0\xc1x\xce\x9c9\x5c\x87\xb7\x18\x87i\xbe\x86CH\
-\xc2\xacf\x13N}l\xbdl\xd0\xdb\xeb\xd7\xaf\x9f:\
-u\xea\xc0\x81\x03]]]<\x07\xc6?C\x93\x82\x12\
-\xf5\xa3*\x5ccTT\x83\x1a:\xf5T/\xa2\x19\x8c\
-\x96\x05\x0e\x98\xf9\xf3\xe7\xdfw\xdf}\x0f?\xfc\xf0\xc6\
-\x8d\x1b\x97,Y\xb2`\xc1\x02B\x04\x22\xce\xd5\xabW\
-\x7f\xedk_\xfb\xf6\xb7\xbf\xfd\xd3\x9f\xfe\xf4\xbf\xfc\x97\
-\xff\xf2_\xff\xeb\x7f\xfd\xcb\xbf\xfc\xcbW_}\x15!\
-j\xc4\x13\x93\x1bF\xd4`\x04\x1be\x91~X&\xe9\
-\x95\xa3\xa2\x22\x86{\xeb\xc9\x82\x9d\x97\xe7\x10\x9e+\xbc\
-\xc3\x89\xd7\xa2\xce\x9b\xb5\x01\x13\x05RY\xd5\x12.I\
-\xc9\x85J\xa9>k\xd6,f\xd7\xfd\xf7\xdf\xbfl\xd9\
-2\xce\x00\xc9'\x85`\x9c!\x89\xf7S\x09\xcf\x8e\x09\
-\xf1]\xf0\xff\xf4\xe9\xd3\x1b\xf7\xfb2c\xcf\xb8\x03=\
-!\x94\x1a\xd2\x93^WY\xe1\xfa\xa1I{\x85\xafI\
-;3\xfc!\xef\x1a\x0d\xdem\xc8EJH\x92\x02_\
-9\xcar\x95\xb2\xd2\xca\x0ae\xb3x-H\x1a\x9a\x12\
-\xfe\xe7 [\xbcxqgg'\xf1(\x93\x8a\x09\x06\
-VV\x93a\x19/\xa7\x81gS\x892s\xfb\xf6\xed\
-\xabW\xaf\x9e={\xf6\xf2\xe5\xcb7o\xde\xa4\xcf\xa9\
-\xa1\xaf\xc7\x0at\x1ce%w\xb2\x92,\xa1\xf6 &\
-\x1d\x1d\xcd`\xb4,p\x10\x12}._\xbe\x9c\xb0@\
-\x7f{\x9a\xe0\x803\x92+\x11\x03E\xeb\xd7\xaf'\xfa\
-\xd4{\xd3\xe7\x9f\x7f\xfe\xa5\x97^\xfa\xd6\xb7\xbe\xf5\xcc\
-3\xcf\xec\xd8\xb1\x83Z\x93\x1bI\x14\x91\xdd%k\xef\
-\x9b^\xea\x89\x91\xcdu\xaa\x0b\xcb\x97\x18N\xf4E\x8b\
-\x16\xad]\xbb\x96\xe7\x0a\x06\x9d>cn\xd6b\xf9!\
-\xc6\x0a*\x14\x19\x1b\xdc\x90FE\xec\xf5L0\xa6\x16\
-\xb7\xe6Ah\xd2\xdf\xb2\xc7v\xa9\x9f\xf4P\x09\x90\x1c\
-\xe2tL\xd6'Y\xb2u\x91`8\xe6\xb3\xee\xda\xdb\
-\xdb\x1b\x22\x1e%\x16\xb4T\x817\x86\xbd`\x8aIy\
-\xde\xb3\x0c\x8d\xb6&\xa6P\xac\xd3\x04\x8a\xa6b\xae\xa3\
-\xc2\xac7RY!5'\xd5H\xaeN#\xb2p\xe1\
-\xc2-[\xb6\xb0\x13\xce\x9b7\x8fI%a\x9dS\x0b\
-5\x87\xac|\x02*\xad\x0dU\x14\xf5\xd6\xa9?\x89\xb0\
-S\x11\xa9\xb3Y\xb5\xb6\xb6rp \xf1>\xcb\xf0!\
-I\xd98b\x93\xa9\xe8\x98h\xd44\x83\xd1\x12\xc1A\
-\xc8\x22d\x92\xe9D\x0c++A\xa5<,\x12\xac\xf0\
-\xf8\xc8D\xec\xe8\xe8`\xd1>\xfd\xf4\xd3?\xf8\xc1\x0f\
-~\xf4\xa3\x1f}\xf3\x9b\xdf\x5c\xb9r\xa5fg\xd90\
-\x1b\xaa\xb1\xb2\x0c\xf1\xcc\x8e\xd5\x8a\xe6\xbb\xf4\xc3\x8aH\
- M\xad\xdc\x08\xa6\x9c\xd0\xc3\xd9\xb3g\xaf^\xbdz\
-\xdb\xb6m<Q\x90\x0e\xefG)\x19z\x85\xcb^\xc7\
-\x8d\x95+j\x13\x14\x13G1\xd3\xb8rS\x12\x93\xeb\
-\xae\xf4\xdd\xc9\x87\xa1T\x0f\x85\xeb\x84\xc2\xb4\xbd\x9e\x96\
-\xbc\x1eh\x93\xf6\x09\xaa\x08\xc7\xb7n\xdd\xbai\xd3&\
-\x86\xc0\xca\xca\x8al\x04\xd2\xee\x04!a\x16w\x96\x14\
-r\xebfA\xc1}\xee-\xbb\x90+\x1b\x0e\xc1(W\
-\xd2*m\x92\x0b\xee\x02\x12\xb81\x17\xa9A\x9c\x86T\
-\xa9\xb7\xa34WJy2\x89u\x1a\x17bPN\xb1\
-\xa5K\x97\xfa\x9bQ\x84n\xaf\x08\x0e\xc8G\x0a\xc1a\
-\x86gU\xe4\xa0\xac]\xc5\xf2\x0d\x02\xddfw\xc2E\
-\xf7\xdf\x7f\xff\x9a5k\xe4%3<\x5c\x13/T\xbb\
-\x0b\xb2\x12\x91\xf5\x8c$\xa0vbL\xa3\x02:\x96\x0a\
-(k\xaa\x05\xb7\xab\x87\xe6&R\x16\x18EV\x88`\
-\x9d8d\x99s@\xc4\xc0\xbe/8>\x09IW\xac\
-X\xf1\xd0C\x0f=\xf9\xe4\x93;v\xecX\xb5j\x15\
-3u4Sa\x9c\xa8=S]\x92,\x82\xa0\xc95\
-G\xad\xd2\x82\xe5#T\xcb\x09\xcdX\x0b\xa9\xa2r\xc2\
-\xf8\xf2\x80\xd1\xd6\xd6\xc6\x95\xb4I\x03\xb2E\x09Id\
-W\xf0\xc4 \x92\xb8N\xdd\xd8\xcf[\xbd\x05I'\x91\
-\xc4\x98J7\xf4Op@\x9aPR\xa5,\xbc\xa86\
-\xaa\xe5uYb<\x01\xce\x9f?\x9fHt\xc3\x86\x0d\
-\x9c\x88\xa9f\xcbL\x91\xc9\xb1\x015\xcc\xa9mi\xaa\
-\x94{\xc5q\x0f~\xd3\x8e4x\x226\xa9\x80C\xb2\
->\xc9\xf5\x12\xfe\x14\xca\x16\xe9X*\x22\xae\x95\xab\xd0\
-p\xdc\x0e\xfc\xe9O\x7f\x8a\x9d\x80i\xb9>\xc9E^\
-\x08\x8e\x19$\xc8\x06\xa15\x90<\xd5r*[6\xe8\
-\x1e+N?\xc3\xb1\xbf\x95Z\x91\xd7\xe8w\xd6\x03\x06\
-\x95\x0a\xea\x15V\x19g\x9a\xc1hY \x10\x99\x19\xf0\
-\xcd=\x99d\x95\xe9\xa2\xb4\xa3 \x95\x90\x94\x00t\xee\
-\xdc\xb9\xc41\xa4\x11J\xb9$0\xa7\x15\xee\x90\x10\x08\
-\xe9\xbcJ\x1dYD\xc2u\x1c\xe4\x18\x05R\x98z`\
-\xefW_}\xd5\xdb\xdb{\xf9\xf2\xe5k\xd7\xae\xc9W\
-\xc1\x1ffop\x89\xf9M\xaep\x98\x00\x5c\xa5,\x9d\
-\x22\xa4\x93\xc5\x8a+\xdfmd\x99\xc9\xc0:\x14\x90Q\
-VP\xf1@.\xa6Q@\xdc\x1a\x984\x0fJYt\
-\xfec\x07\xdf\xe5\xcb\x89\xcc\x01\xcbGXA \x99\x22\
-\x01eM# \x09X>CR\x96\xd9L\xb2\x0e\xaf\
-\xd1\xc2]K\xe2\xba\x8a[\x94\x06\x8d\x82$*\xaaM\
-\x9djP\xbff\xf9\xe9\xef\xef?w\xee\x5cOO\x8f\
-\xbe\xb7\x08\xa7I\x8e\x8d\xb9f\x0ei{<c\xb3\x8d\
-\xa8\xd4\x87\xa6!\xa0\xabl\xfblVr\x0eW\xb2\xc3\
-\xea\x7f\xe2\x85\x00fkk\xb0\x82@\xb2\xab\xe6\xed\xab\
-)5\xee+B\x03\x09V0:\x9a\xc1h)`J\
-q\x0a\xf2\xc4\xc3s\x0fga<\xba\xd9\xc9\xa1\xd20\
-\x07\xec\xc8\x91\xa4T\xa8\xdb\xfa\x15E\xfd\xd2_,O\
-a\xc2\xb1\xb3B\x0d\xca-%tN\xcc\x8d\x1b7\xce\
-\x9c9\xf3\xe5\x97_vww\xeb3\xe9\x08S}&\
-+\x94\xae\x5cM\x92\x22WX\x04\xb7\xf3\xa7\x05\x13M\
-*5:\xafN\x0a\x13\x05\xe2*V\x5c\xd3\x16\x95\xfa\
-U\xc6_\xbf~\xfd\xf4\xe9\xd3]]]\x9c\x85>W\
-K\x0bK\x9ek2\xfcu\x8fu\x91\xa6\x1aI\x91\xc8\
-U\x1c!\xb9\x9c\xe3\xe9\xf2\xfb\xaa\x0c\xf8d\x8bQ\x11\
-\x04\x97\x0f~\x01\x82Ik\xa2*\x96\x99\x12L\x9b6\
-m\xd6\xacY\xfa\x01\x11\xc1\x96\xfc \x1bs\xdd\xa2\xa2\
-\xd8\x09\xb5=\x92jA'gR\xa5\x1a+.7\xf5\
-w\xb5~\xcd\x14\xf2\xb9\x83DM\x09\xe98\xae3J\
-\x9a\xc1\xe8\xe4\xc3\xe8\xce\x993g\xcb\x96-\xdb\xb7o\
-'\x1e\x9d9s&\xcf;\xc8s\x07XS!L\x89\
-*\xc6d6\x8c-\x1cTD\xa2w\xee\xdc\xd1\x89\xa5\
-,\xd7\xa2\xae\xfa\x1c/R\xa8\xdfF\xd7\xc43J\x94\
-\x96\xdb\xb7o\x9f?\x7f\xfe\xc8\x91#g\xcf\x9e\x1d\x18\
-\x18H\x9d\xee\xb9\xfd\x97P%\xc9\xd8\x07\x92L\x85T\
-\xb6\x068J\xb1\xa8\xe5\x1b\x8d\x22K\x8b,\x92<\xbe\
-\xf2\x8f^N\x1f8p`\xdf\xbe}\x97.]bD\
-\x12\xf9]@\x988\xf9\x98F\x05$\xc9\xe9\x1d\xceo\
-\xfc\x06<a\xb2\xb4}u7\xa9\x81<\xa6\x84$\x10\
-\xa7GFv\x98\x1a\x17\x22\xd1E\x8b\x16-_\xbe|\
-\xfe\xfc\xf9\xfa\xd9\xa0{,v\x14ra\xf9<L\xa3\
-\x82I\xab\x91\x98\x96\x99\xc6\x82i\x5c\xfe\x99\xec\xde\xd0\
-\xb5\x08\xb3\xbcb\xbbe\x02\x92d\x89\x1b\xcc6^\xfb\
-v\xa2\x1e\x9d\xda4\x83\xd1\xc9\x87\xb5\xd7\xd1\xd1\xb1i\
-\xd3\xa6\xcd\x9b7/X\xb0 \xf9\x81{\xd8\xfa\xad8\
-\x0f\x9fU>\xc3\x98\x0a\xa3\x9f\x0d\xe3\x04=\xd4I\x06\
-&\xca C\xc0\xf2\x05\x0ci\xa6\xb7 \xb5\xda\xcae\
-\x80\x1e\xde\xbcy\x93`H?\xa6\xa7\xff\xee%\xd9\x92\
-8\xa5\x1a/\xaa\x814\x85\x89\xaaq\xf9P-\x95\x17\
-Y'LT\x0761\x94\x09\xe0v\x86\x800\xf4\xca\
-\x95+DW&\x9dr\xe4zI\xdes\x98{JX\
-q\x05-#/\xc2\x87D\xf0}}}x\x8cyK\
-:)n\x92\x87oDJ\xc4d%\x8e\x5c\xed\x984\
-\x90\xcaj\xc8,\xd3\xb0`\x85~\x1db\xda\xb4i\xa4\
-\x01a\xae\xc7\x8a\x9c\x16\xfc\x94Fr)d+r\x17\
-J\x89Do\x05H\x145^*\x86\xd5I7\xbf\x06\
-j0n\x96\xb4\xb0|5\xf5\xb49\x02\x9a\xc1\xe8\xe4\
-\xc3\xd0\xce\x9e={\xf1\xe2\xc5<\x1a\xb6\xb4\xb4h)\
-j\x1e\xf8U\xb8\x04\xa8\xa59\xc1U\x8bJ\xf2\x92\x10\
-zg1(}\xe6\xbc\xe7*!\x98R\xdd$\xc6W\
-PV\xf2\x5c\xfc\x16\x04\x16\x1c\x93l1\x92\x97\x13\xba\
-\xca\xd3\xc8\xf4\xe9\xd3\xb9\xe2\xa5\xe4!\xbdzO\x94-\
-N\xd6\x03\xa4\x1d\x13\xd5\x01\xca\xc1O6F&\x9dT\
-d\xa9z\x15\xa3\xd2\x14)\xb9\xccwLZ\x1f\xe8k\
-~\x0e\xb7\xe2d\x11\xf7\xb6\xc8?\xb9\x04w\xe6L'\
-\xc9AB\xa1[\x08\xcf\x9a^8\xc2\x09C\x89\xe0\x09\
-II\xabJ\x93\x5cb\x07:*\x02\x9c\xa9D,\xac\
-AJ-4VW\xc5\x92s;\xfce`\x82B\xcc\
-\x91O\xfc\xd4\x90\x82\x13,6\x93\x93\xb9\x18\x88\xd31\
-RK\xe1\xd55\x8d\xcf\x9f?\x7f\xe1\xc2\x85\x1b7n\
-\xb8|\xcaPdQ\xe2\xc1\x08\x93\x16czAS\xd7\
-1\xa7\x19\x8cN>,\x18}b\x06\x88HjD\x06\
->\x09<Qc\xbdM.\xea!}\xc3\x1c\xef\xa1O\
-\xe5\x14*\x85\x5c[b\x05HeSP\x18\x9aL\xc2\
-\x0b\x82\xd1\x9b7o\xea\xb3\x01V\x5c>\xf4^|\xd5\
-\xaaU<\x8d\xcc\xc8|Y\xac\x1c\x92r\x8b<\x10_\
-\x9dT\xb6\x08\xd4\xa4I\xcb\x8e\x8a&\x97\xdcn\x14\xf5\
--%\xc7 \xb7\xab\x06\xaa\xc5\xff\xd9f\xeb\xa9>\xe9\
-x'=Q\xe4\x9f\x98X'\xd7p\xae\xc8CQN\
-k\x88+\xa5v_\xd2L]6\xae?+\xfeLQ\
-\x13\xa7N\xff\x04\xd7\x16j\xe6\x96\xd6\xd0o\x148#\
-x\x1a\x9f;w\xee\x9c\xca\x9f_J\x19\xc5d\x0b\xa6\
-\x0f\x82\xd0R\x01\xa9\x81\xa6h=PKo\xf7\x8f\x1c\
-9\xb2{\xf7\xee\xc3\x87\x0f\x97\xff\xb1*Y\x81\x01\xcb\
-\x17 \x9f\x80\xe5\x0b0\xa5\x0a&\x0d\xd8m\xf2n\x94\
-\xd2\x04S\xad\xdb\xf3E4\x83\xd1R\xa0_\x91\x83!\
-\x7f9\xce\xe7\x8d_\xe3l\xa9`\xa9\xf3\xa4\xcbs\xa7\
->\x84W\xcf|\x1d\xa5\x15\xc1\x19\x06\xdb\x0a\xf7\xe59\
-\xbb\xcc?C\xc4!<\x81\xac^\xbd\xfa\xbe\xfb\xee#\
-\x1ee;\xbe7\xf3\xad\x8d\xf2\x1bX>\x023-\x15\
-\x91+\x8c\xa18x(\xc1D\xe1.\x96*\x19\xb9\x1d\
-\x0b\xfe\xc8\xca\x87=y\xd4\x08\x0e\x97\xcfc\x87\x94\x16\
-u2\x8c\xde\xa8z\xab\x16\x84\x89\xac\xf1\xc2fc\x9f\
-\xb3S1]y\x8e\xe2\xca\xc6\x957\x1cw5\xc9\x04\
-\x8d|\x22?;\x12\xa6tr\xc9UP\x0b\xdeN\xa3\
-\xc3\xea#\x0ce\x03\x5c\xbbvm{{;O8\x08\
-\xddF\xbd\x1fu\x89 \x9d@\xc2\x04\x09\xf2\xa7c\xd2\
-b8\x1azzz\xbe\xfc\xf2\xcb\xcf>\xfb\xec\xf8\xf1\
-\xe3\x03\x03\x03VPz\xea\xb1\x0e*N*$V\x90\
-\xd3\x84$B:\x8e$*2\xed\x80$\xa3\xa1\x19\x8c\
-\x96\x02\xc6\x92\x059d$*\xe29\xa1D\x09\xdf\xfc\
-\xd11\xfd\x9e\xb8~5\x87\xa8To(\xbd\xcf5\x90\
-\x8e0\xd10\xb0\x8a\x8eD*+!\xd3\xa7O_\xb8\
-p\xa1\xfe\xfcO\xbc\x0b;\xc1\x08\x93\xc4\xe9\x91\x91T\
-\xcf\xb46&[\xc9(I\xf6\xb3\xd0\x0d\xf5*\xc6K\
-!\xe8&H\xae\x84\xa7E\x9cM\x15\x89\xb8\x1d\x08\x0d\
-\x0c\xdeE\xc2r\xa2\xae\x82\xe5M\xe2\x89*B\xb9\xa1\
-\xac\xe4B\xf2\x98\x5c\xa1C\x99\xd6\xaf\xbc\xc4f\xc5\xd4\
-\xe5Q\x8a\xabB\xf9&\x10\x5c;H\xd1t\x92\x0f\x05\
-Y\xd3\x8ep5%bT\xea:S\x00\xe6\xcf\xcc\x99\
-3\x17,X\xc0N8;\xfcU^Y\x97rN\xd0\
-\xad\x22\x11\xaal\xf8>Q\xad\x9b7o^\xbe|\xb9\
-\xbb\xbb\xbb\xbf\xbf\xbf\xcc?@K\x91k\xa9,\x8a\xb1\
-\x82:@\xd5\xea\xd4Q+wZ\x8e\x9e\xe6&R\x22\
-X\x0cZ\x0f\xc9\x16\x15\x8dw\x9c\xb5\xf9\x12\xcd\x18\xa5\
-cI\x19\xc0\x10\x1e4\xf5\xa5E\xe7\xce\x9d#0\xfd\
-S\xf8\x8d\xc5\x11\xf436\x1fR\xd9\x22\xd8\xe0\xf4=\
-\xac\xd9w\x8d\xa5\x02[\xf4R\xdc;)\x03\xc9r%\
-\x9b\x0cv\x05)\x8c\x12\xb5\xa3\xbb\xc4\x92\xc9%\xee\x0f\
-\x04s\x0dIp\x88\x88\xbb\xed\xa51q;E\xb8\x0e\
-\x09\xda\xe41\x80\xd9\x02\xf5\xd4\x9d\x5c\xb2V\xff\xbf\xf0\
-\xfdT!aH\x0e\x98#,\x1f\x88\x15D\xaaV.\
-\xde\x04\x9a\xdc\xef\xab?\xfd\x89\x83\x5c\x1f\xf2\xd3\xae\xd5\
-$\xf1L\xf8t\x10\xf8\x0f|5cuu\x90[\xaa\
-x\xbe\xd5(\x9ab`)\x01(k\x90\xbd:~#\
-\x83?\x13\x07E\xee\x92|\x90d\xda\x0eb\xc2\x0a\xd9\
-*\xa6Wy\xdb\xaa\x9f\x9e1\x8dK\xfe\x03\xb4\x18\xef\
-<$\xf9aN\x92\x1c\x1f\x0eE\x9dUF\xd0r\x8a\
-\xc9?\xa4\xb1\x81)H\xd0\xd0|\xc2\x8e\xc1-1\x12\
-\xda\xfc\x0b(\xad\xa2\xaa\xd9Y\x1a\xe2\xbe1\xb2\xbe\x1d\
-\xab\xb4~TEuA\xc2\x18\xd9\x0e\xa4M)\xec\xfe\
-Dx%\x8fDA]e\x0b\x96\x7f\xdcKfRf\
-L)J%\x9cP/\xc1\xf21A\x98\xdb`\xa9\xc8\
-\xef|D\xa1\x81\x19\xf3el\x16\x95\x82i\x07\x9f\xb3\
-\xff,[\xb6l\xc9\x92%L\x18+.+\x9a!\x96\
-\xa9M\xa4\x16W\xa9Q=qG\xcdR\x1c\xc8\x8a\xfe\
-\xd3W_\xf1\xa8y\xf6\xec\xd9c\xc7\x8euww\xeb\
-\x97NL\xe9n%L\xae\xff\x87+\xfa\xfa\xfa\xfa\xfb\
-\xfb\x89G\xe5\x13\xae\xf2\xaa\x90r\x96P;\xc1\xf2\x15\
-\xb2\x92)I<\xab\xdd\xe4\xac\xc7$\x11&\x1a\x8a\xac\
-\xb2\xda\xd7\xc1\xa4D\xc9?*\xea\xd0a\xbaJ\xdc\xcc\
-U\x9d\xaf\xd3\x0b(\x0b\xd2\xb17\xdc9\xb5\xdb\x91\x9a\
-#\x89\x8abr\x85\xf53\x99\xe74\x070[\xff\x9c\
-9sV\xae\x5c\xb9u\xeb\xd6\xd5\xabW\xebw\xc9\xad\
-\xb8I\x01\x1ar\xcd-\xe6%\x1b\xdf\xb5k\xd7x\xbc\
-cQI\xa1\x0c\xd0\xc9\x193fttt\xe8\xab\xe3\
-x\xeaed\xeb\x1c\xdc\xfa\xe7\xb4V\x97\x12\x0eYZ\
-\x00\xddQi\xa9\x95\x10\xf5\xd3\x83Q\x09\xdd\x90\x98`\
-G\xa2\xa0\xab\x14\xa4\x09\x89F\x0dLk\xb0\x8a\xc4\xe5\
-!\xd5+\x19+$Q\xa9\x89\x02\x92gQ\x91\x1at\
-T\x94\x0b\x9e\x9f5k\x16\xbb\x10\xf0Hl\xd2R\x22\
-\xc3\x8bf\xb5\x84`iI\xf3(*\xac\xed(/e\
-\xab\xb9\x1e~\xeeq\xf4\xe8Q\x05\xa3\x92\xdf\xe5\xe0\x96\
-\xdb\xb7okC\xd6\xcb6\x8fx\xdc\xe1\xc9\xb8D\xce\
-\xd7\xd4L\xb9=\x11V0\xd1]@\xbc\x01\xc6\xe4\x0a\
-\x8b(\xf2\x98\x1aI\x5c\x1f\xfd\xd9m\xd2\x8aD}\x98\
-J\x0e\x9dT\x87s{\x8b9\x96\x0a(\x9b\x12\xc6\x15\
-)rL\x94\xd1\xcf\x05\x9d\xb8\x1d\xd2\xc2\xf2#er\
-\x22?\x8ca\xf7_\xbcx\xf1\xbau\xeb\xee\xbf\xff\xfe\
-'\x9f|\xf2\x85\x17^x\xfc\xf1\xc7W\xadZE\x04\
-cJM\x86\x82I\xc9\xc6w\xf2\xe4\xc9/\xbe\xf8\x82\
-#\x81}p\xf4\x13b\xac`\x889\xd7\x09C;;\
-;\xe7\xcd\x9b\xe7\x9f\x86\xcc\xf6PBa\xa2\xfa\x96\x84\
-\xb0\x9a\xd5 \xa7\x85\xa23\xbblxWI\x9b\x01\xc5\
-\xe3\xe8\xe6d\xd5$\xa9\x81\xe9\x05R\xd92 \xd3\x86\
-\x1c/\x14\x5c3\x17\xa9\x0dI\xca'\xac&\xb0L\x89\
-1#+H\xa2\xa2!Q\x15H\xa5k\xe3:r\x17\
-Y\xa6\xab\xcfXNG\x08\xe5w;\x897+\xce1\
-Q@\x8e\xd2\xd5\x19\x9c~\xc3\x5c\x89\xa9v\xa6\x00\xb8\
-\x8b\xd00\xe54\x91\xeb:'W.\xc7\x0a\x13EX\
-A\x88\xeaxZ\xe0\xd0\xbc\xd3h\x7f\xb8!\xb6Z\x16\
-\x9aI\x91\xbd\xb1\xdfb\xf9(I5\x18\xee9f\x8d\
-OB0\x8a=\xb3g\xcf&\xee|\xea\xa9\xa7^}\
-\xf5\xd5\xd7^{\xed;\xdf\xf9\xce3\xcf<\xf3\xf5\xaf\
-\x7f\x9d\xc0\xb4\xbd\xbd=wR6\xc1o\xf1T\xe0\xca\
-Z\xea\xed\xed\xfd\xf2\xcb/\xf7\xef\xdf\x7f\xee\xdc9\xd6\
-UP,\x0b\xf14\xf5\xce\x8b\xa2\x19\x5c\xa3J\x0a4\
-\x8b\x1a\x01\x95\x82\xe5K\x0c62\xe1e\xa9u\xba\xb8\
-\xdb\xb1\x9a\x12A\x9c\x10\xa7S\x04\xf5\x06p\x85\x93\x0c\
-|\x05\x13U0i\xc0D\xc3\xc1k\xb9CH\x10\x83\
-\xf6\xf5\xf5\x1d;v\xec\xf8\xf1\xe3\xe5\x7f\xc9\x87\x09z\
-\xa9\xe3\xb6\x80\xb21\x92\x87\x917$\xc9\xc5\xf5A\x9a\
-jDH\x0eLT\xe7\xde{\xef\xe5!s\xc1\x82\x05\
-\xb3f\xcd\xb2\xe2\xbb\x1e|5c\xc6\x8c\xd6\xd6\xd6\xb9\
-s\xe7\x92\xd0\x07\xc1\x11\xba\xf3\x83;\x0dID*+\
-\xc2\xa0Ua\x05S\x0e\xe6RKK\xcb\xcc\x993\x99\
-\xd8fj\xc6\xd8\xd8iJ\xf8U\x89\x5c\xe2v\x5c\x9f\
-+\xd1'+\x9d\xd3\xf3\xe2\xc5\x8bW\xaf^-\xd5{\
-\x9c\x1a\xd0\xf9\xe4\x8dn\xf5\xf2\xa7\xdf\xc1a\x86\xd4\xfc\
-*\x89\x8a@\xe9P;\x1f\x14\x8aH\x95\xaa\xb51d\
-\xa2\xc3>\x16'\x0bu\xcd\x9a5\x8f=\xf6\xd8\xb7\xbe\
-\xf5\xadW^y\xe5\x9b\xdf\xfc\xe6#\x8f<\xb2q\xe3\
-\xc6M\x9b6\xad[\xb7n\xd1\xa2E\xe5\xff\xd8\xd6\xa4\
-\xa3y\xc3\x8a\xbaq\xe3\xc6\x85\x0b\x17\xce\x9f?\x7f\xfd\
-\xfa\xf5R=\xde1SY\xe1\xacs\xfav\xe5\xca\x15\
-V\xbe\xba\x97\x9a\xd0Y\xea\x99\xe2\xbe\xa8\x84\x841\x08\
-\xb9\x1d\xe4\x96\x96\x8a`Aa'5\xd0\x96\x89L\x06\
-Y\x07V\x96A\xa5YT:\xe4@L\x0c\xb1\x81\xea\
-[,\xa9\x8d4\xb3Xq\xddp\xdf\x9b7o2Q\
-\xf5\xe3\x05\x93\x96\x9e\x1a\xc6\xaaH\xfeL\x86<\x83\xd4\
-j\xa3F\x04\xd9\xb8\x22s\x0fG\xb1\xf9p%-\xe1\
-]\x0e^R\x8cN\x5c\x95\xfb{\x93\xf2d\x0cBw\
-\xa9\x89\x82P\xd7\x1a\xb8\xe6\x14\x00G\xcd\x9f?__\
-'\x92\xfb!\x99\x94\xa5\xc35\xdc=\x0c\xc1m\x09\x08\
-\x07\x06\x06x\xf8\xfc\xec\xb3\xcf\x8e\x1e=\xca\xb3hC\
-LczN$\xca\xbc\xd2\xd4J,QA k\xa9\
-\xd2\xb1|4\xd0\xceX5\x95\xcb\x84\x06\xa3x\x90\xa7\
-F\xe2\xce\xa7\x9ez\xea\xd9g\x9f}\xe8\xa1\x87\xd6\xae\
-]\xabY8\xa7\x02\x8fG<PZ\x85&\x11>\x0f\
-4\xc9\x94\xfdS\xf8}@\x1d\x09\xe3:Q\x86\x0b\x9d\
-\xe1\xac:{\xf6\xec\xe1\xc3\x87\xbb\xba\xbazzz\xe8\
-$\xbdE\x9e\xed\xa7\x84`\xf9\x08_Q)\xa4\x9c[\
-\xc5\xa9]Z6\xb0\x94\x05\x92k/B\xc9\xb1H\x03\
-\xed\xc3\xcdU\x89\x5cT\x1a\x83\xd0[s\x8a\xee;\x01\
-pk\xbd@\xb2\xfeUl\xf1N\x8e\xa0cEUr\
-\xe5\xdc\x119\xfed~\xfa/\x9d\x94\x1f\xd9\x92\xed-\
-r\x15\x89\xc4\xa1\x15LTMJ\xbf64\x82\xa3X\
-\xc5\xfaB\x1c\xce\xf2c\xc7\x8e\xf5\xf6\xf6Zq\x93\xe0\
-O\x7fwe\xa2\xca((\x1d\xfcmH\x92\xc2\xe5\xaa\
-\x05\xcaB\x9c\x86\xa2\x16\x1a\x08\x16\xbe^Nm\xd9\xb2\
-e\xe9\xd2\xa53f\xcc\xc0uV\x16\xe1\x96\xa6\x12\x5c\
-c\x90\xc8cN\xd0\xad\xf2\x9b\xe4Lc}\xdd\xbd\xbe\
-a\xb4\xbf\xbf?\xd6)-\xd8\xa8\xbd:\xb7\xb7\xf2@\
-\x9c\xc82z3\xd5\xc2x\xb8k\xe2\x82Q\x9cH\xac\
-\xb9~\xfd\xfa'\x9ex\xe2\xf9\xe7\x9f'\x12]\xb2d\
-\x09\x0f\x91\xfa%z\xa7\x86\x1f\x9b\x80\xfc\xc3T\xf0\xd9\
-\x10\xa7K\x05G\xfb\x95+W\x88DO\x9d:u\xf5\
-\xea\xd5[\xe1Wn\xe3\xae\xa6\xc6:w\xe8SUb\
-r\x9b\x22!\x94m\x08\xdc\xc6\xd8\xa2\x5c\xa4\x19\xe3r\
-/\x95dH\xe4\x22\xf4IL\x0b\xb0\xfaT4ap\
-\xc7{\xef\xbd7\xf5]\x95Y+\x8aF3\xa5\x06\xb1\
-fn:\xb7\xa9l;\xe5'8\x09\x06\xd3A\x9c\x8f\
-\x14\x1c\x93\x06RY\xc8\xea\x08\x5c\x07\x9c\xe2\xack\x82\
-Q\x96\xf6\xe9\xd3\xa7\xcf\x9c9300\x90\xab\x7f7\
-#_\x81\xe5\x03\xb5\xbdd\x15*U\xc2 \x0c\x22\xa1\
-c\xd2\xc6w;\xab\xbe\xad\xad\x8d\xa8`\xf3\xe6\xcd\xc4\
-\x03\x04\xa3\xee\x81\xda\x0c\xd7\xf6X_\x0fT7n\xdc\
-`\x0e_\xbat\xe9\xda\xb5kd\xad\xacq\x08\xe3\x9f\
-\x18\x85\xbf\xe2\x99S\xa7\x03UE\x98(\x0f\xdd%K\
-\xaa\xc8\x95\x95\x18\x19\x13t\xfc`0G\xce\xaaU\xab\
-\x1e{\xec\xb1\xa7\x9ezj\xdb\xb6m\xfa\xe3\x87\xf7T\
-\xfet\x07fT~\xea8*{\x1a\x94\x11X\x1df\
-Q\xf2\x84Tf\x8fqn\xf1\x00\xca\x9a\xe7\xc4\xd2\x82\
-W\xb7U\xaa\x9e\x93eK\xd2\xbb\x04\xa1R%d \
-HX\x03\x1a\x01o\xc1\x13\x0d\x01\x06\xb2E\xcaL\xf5\
-\x1cT$b\x0f\xa4\xd21&\xad\xc6\x9b\xf2f\xb9J\
-\x99\x04\x9e\x9f9s\xe6\xdc\xb9s\xb9\xe2\xc0\xa08A\
-\xb0\xfc\xb9oGG\x07\x8f\xa9\xf1\xaf\xb89\xa1\xbf\xd6\
-\xe1P\xa3^\xbc\x96\x90Pm*M\xa1\xfd\x1b@\x87\
-\xb0\xd8\xb7\xa3\x92#C v\x18\xf2\xa2\xceKA\x13\
-\xcc\xb1\xb2j\x5c.\x1dGB\xa1x\x94\xb3\xbc\xbf\xbf\
-\x9fk#\x1e\xe4\xe3M2\xe7\xea\x98HR\x13&\xca\
-\xc3\x87 \xa5\xe6\xf2\xc6\x85\x0d\xa7\xa5\xa5\x850\x14\xd8\
-\x04\xfc\x87\xa2Y\x87\x04'\x0d\xe1%%\x5c-\xa5\xef\
-\xee\xe2\xca\xa4\x05f\xb2\x8a\x1a\x057!8\xa3\xca:\
-\xcf\xbaN\x91f=\xa8\x11He\x9d\x94\x8e\xae\xa3d\
-\x22\xce\x1e|\xc19\xb7t\xe9\xd2\x07\x1f|\x90`\x94\
-H\xd4\xbf\xeb\xa7\xdaMfX\x93zH\x9c\x15\xb0|\
-)\xa1{_}\xf5\x95\xbe\xe5\xc4D\x01\x1f\xf7d\xa1\
-dPQ\xca\xb4\xac\xa5\xa6]\x0d\xf2\x92\xfb\xa46t\
-\xbe\xa8\xff5\x8a\xb2\xa44\xcd;\x15\x90H\x815H\
-\x10\xd6\xde\xde\xbe|\xf9rV\xe8\xec\xd9\xb3\x83\xfaD\
-\xc0\xady@]\xb4hQ\xfc\xe5_V\x96\x87\xf7\xbc\
-N\xa4\x0f\x96/\x00\x05\xee\xcb\x83\xf1\xbcy\xf3\xda\xda\
-\xdar\x7fJXfjO\x09\x99\x9frB2\x8d\x02\
-\x96\x0f\x0c\xe9(\xe9KM\xf1(4\xdcq>1\xb8\
-3I\xc4H\xe8\x98\xb4\x82I\x87\x04\xcda\xe9\x97\x18\
-\xac`\xffI>\x9f7g\x0e\x09\x19\x15\x8c3\xa4V\
-\x84\xa6\xb1P\xd6\xaf\x22\xdbB\xd0\xfd\x7fz\x9aj\xc4\
-?\xd9@o\xe9\xbf\xec\x22Qy\x83\x91\x9056\xf1\
-`\x06\x15%^\x08(;\x1a\xc6\xa4\x11\x98\x88`\x94\
-cf\xc1\x82\x05;v\xecx\xfc\xf1\xc7\xb7o\xdf\xae\
-_Q\xe2\x00\x00\x5c\xc3\x15\x1d\x1eS\x98\x167o\xde\
-$j\x19+\xdb\xa6\x00a\xb6$X>\x8f\xda\xa5\x93\
-\x0e\x8bG\x90\xd6b\x00O\x07\x95\x9cU\x04C\x1a\x9e\
-%\xa5\x9f\xdbl\x99\xf1\xfe\x07\xd3\x93\xb4Kb\x82\xe7\
-\x12,_-\xa1Fn]\x95\x0a)\xa3\xc0\xea\x9b>\
-}zGG\xc7\xa6M\x9bxJ\x5c\xb8p\xa1\xd6\xe3\
-\x04\xc0\x8dxFeg\xe8\xec\xec$\x0a\x9c6\x8d\xa3\
-\xc8\x9eNu\xe5\xdfp\x1d\xb4.\x8b\x14\x84\xb2\x92\x83\
-\x84\x10\xa7\xb3H\x99\xb0x\xc9\x92%\xf4\x84\xad\xc9\x0a\
-J\x8c,\xf2\xab\x08%UH\x98l\xb3\xd5?1\x08\
-\x85FJ\x98*\x8d\x895\x999\x0d\xfanib\x08\
-\x0b\xaf\xd0\x93\xce\x90+\xd41\xa9\x08+|jx\x1e\
-\xd3\x98\x9fp\xcf=\xf7\xc4\xcf\x81x&\xe5\x9c!Q\
-\x15\xb0|\x01((\xd8\xe8\xe9\xe9\xe9\xee\xee\xd6/\xd7\
-ZY\xb9\xf1\x9e\x13F\x13)\x85\xc5\x97@\x89iT\
-O\xa1\x980\x89\x06\x89\xbd\x94\xeb1\xa9Y\xa6`6\
-zB\x0c\xe9\xf9!\x99\xa0`t\xf1\xe2\xc5\xf7\xddw\
-\x1f\xa7\x1dg\x8f^\x81\x08J\xb1\x01xF9}\xfa\
-\xf4\x89\x13'\xae^\xbd\x9az\x8bv\xd7\xe2\xa3+\x17\
-)\xdd\x88x\xe75\x95E,QZ\xc8X\xb0|\x1e\
-\xb5K\x85Z\x06\xcb7\x08\xb1\xedY3\xeb3'\xc7\
-9\xd9\x8a\xc17\x89\x90eH<\xda\xde\xde\xce\x22-\
-\xfa\x85\xd6\xf1\x00\xeb\xd8[\xf5\x82-<\x82\xfe_\xba\
-\xe3\xbd\x0a\x04_\xd41\xd6C\xa2f\xc1\xf2\x11\xb4\x8f\
-\x1c'\xcc\x08hS*?\xb2%\xd7\xa2\x18S\xab\xf6\
-\x80'b\x5c\xa2\xd2\x14*\x12\xca\xe2\xb7p\x10\xe6\xcc\
-\xd2&8\x85\xff-]!\xeb\xc9,\xd2\x818-\xa4\
-\xe0d%\x0dM%\xae\xaab<\xa6\x16w\xa1\xd9\xaf\
-\xfe\xf4\xa7\xfe\x81\x01\x82\x0d\xff\xfcXC@$J\x00\
-}\xfc\xf8\xf1\xf0\xfd9I\xcf\xffo\xf8S\xc0\x9a\x0c\
-a\x9a$H\xd9\xc9J\x80Z`\x99\x02\xd4\x1aX\xbe\
-BV2dS\xf50\xee;\xafv\xf9\x8e\x8e\x8e\xce\
-\xceN\xae\xfe\xebJ\xd8\x83\x01\xcc\x0c\xce!N#\xa6\
-\xc5\xc1\x83\x07\xf7\xef\xdf\x7f\xe1\xc2\x05\xb2V\xf9.F\
-\xa3\x9b\xcc\x97:f\x8c\xa5\x1a\x84dv\x07H\xcb@\
-\xa1Ra\xa2\x80\x89\x86\x83\xb7\xdf\xa0\x14\x19>,\xbb\
-\xa4,\x5c\xa2\x84\x1ag\x19*\xcb2\xe4i\xb0\xa7\xa7\
-\x87g\xee\xdc\xfb\x8e\x07\xec\xa4\xfd\xfd\xfd\xec\xaa<\x85\
-^\xb9r\x85U\xafs\xc2\x8a#\xea\xe9\x92\x9b\x16C\
-E\xa1l\xf0D\x8e\x1a\xf7e\x97\xbfx\xf1\xe2\xa5K\
-\x97\x1a\xf0I\x18\x8b\xf2\xed\x02\xb3?r`\xf0\x81a\
-\xa2\x80t\xa4\x0c\x12\xc6XAT\x94\xca6\xc9\xc5|\
-]0@EX\x9dj\x90\xe3p\xa6\xabt@\xd90\
-\x0e\x0d<\x10\xc14\xb3.eH\xfdv\xa9.X\xbe\
-\x00\xb9\x11\xa7\xdd\xb9}\x9bU\xdf@\xeb\x1d\xd3\xd8\xa5\
-\xcf\x9c9C\x98\xd4\xd5\xd5\xc5\xe6\x99\x84\xd1Q$*\
-\xb5\x5c(\xcdU\xc8uW\xed\xa6 \xb89\xa9\x98j\
-6\xb7\xb5\xfa\x19\xdf`\x94\x8e\xce\x9a5\x8b0t\xd5\
-\xaaU\x0b\x17.$\x1d\x7fT\xd4\xbb\xce\xcc\xb8v\xed\
-\xda\xd9\xb3g\xf5\xbb\x99\xf1bkR\x84|\x18O\x85\
-F!\xcc\xe4\x04\xcbGH\x98*\xcad-Q\x84\xfb\
-\xa4\x11\x9d\x03\x18\x98kc\x0d\xbbr\x9d\xe9\xa0/,\
-\x1f\xf4\xa9 \x09\xcb\xed\xf6\xed\xdb\x84b'O\x9e$\
-\x1a#-\x9d\x09\x80\x93\x80\xf3@GB\xd2\xa5\x0aV\
-\x1c\x91+\x14\xb1iq:\xa6Fu\xc0\x03D\xe1x\
-\x00\x1a\xe8I\x18\x9b\x82Y\xfc\x9f\xef\xb4\x22b/\xa9\
-bR? a\x93\x89!5W5.\x8eI\xf3\x88\
-\x8f\xc8\xda\x9a%\xc7\xa6]\xf2y\xa1A+\xc8Z*\
-\x90\xca\xe6\x12\xeb\xd4\xa5_\xf9+\xa0\x96o\x100\x8d\
-\xdd\x92\x904\xf5\x8b\x83CN\x98a\x91rf\x9c\x05\
-2\xfa/EJm\x04\x8co0:s\xe6\xcc\x15+\
-V<\xf2\xc8#\x8f>\xfa\xa8\xfe\xf4\xbc\x5c\xc6U]\
-\x0f/I\x93>p\x06\xdc\xbcyS\xdf\x97\x99\xd4l\
-\x12\x11\xe6C\x02\xe90\xeb\x06\x91B\xf9QW\xdd\x8a\
-\x18\x09\xc1\xb3J\x143\xa4B\xd5\x06\xdd@^\x82`\
-~\xf2_\x91\x1fd\x0eWG\xf2\xa4B5\x92\xbbB\
-\x0a\x9e\x08\x95 \x10T(v\xfe\xfcy\x9e\x09'r\
-\x01\xfe\xd9\x9f\xfd\xd9\xdc\xb9s\x17,X0g\xce\x1c\
-\xed\x03@\xcf\xe9\x83L\x00\x09\x8b\xa8\xb2.Jg\xeb\
-f%\x0e\xb7\xc3\x09l\xf1\xe1\x93X\x0d\xf03\xbb\x8a\
--\xfao\x08R\x13@uc\x0f\x83\x95\x15\x93\xcc\xb3\
-\x0a&j2R\xcc\x8f#\xf2$\xb5X)\xfa\xee\x11\
-\x06\x8es\x93\xe8\xa4!&m.\x182m\xda4\xff\
-\xb4\xa8\xfb$5'\xeb\x99\xa2u\x22\xa7\xb1\xe3\xb1\xde\
-I\x8ca\xcb\x13\xc0\xf4\xf0\x17\xb6\x97-[\xd6\xd1\xd1\
-1#|'\xab\xb6M\xac\x18\x99!\xb5'a\xb6\xcd\
-DR\xf9O\xa5\xb4\xe0Hg\xc4\x8c{0\xbav\xed\
-\xda\xc7\x1f\x7f\xfc\xc1\x07\x1f\xd4/\x07\xb0\x8c\xac,\x98\
-\x11,\xb2\x9dq\x22O\xc12\x83+\xe2\x84g\xb3\x8c\
-\xc9\x0c\x98D0\xad\x86u*\x05\xcb\x0f\x93FwN\
-.\xc3\xb5H\xfa\xc1\x13\x86\xe4\xa0E\x87\x84\xedL\xa1\
-\xd8\xc0\xc0\xc0\xc4\xbf\x17\xd4itO\xf8\xde{\xb2>\
-\xe2\x9ep$\x89\xb1\x82\x0a\xb2-\x96\x9a^\xc0D\x81\
-\x90\xad\x92\xe0\x01l\xd7\x0bZ\x135\x08\xc1\xb8B\xa4\
-\x13\x8f;X\x19\xa4\xb2\x15\x828!L\x99\x848-\
-\xa4\xd0$\x97\x227\x0a\x93V\xe4\x96\x89(\x12\xba\x9c\
-\xc6\x99\xab\xbd\xbd\xbd\xa7N\x9d:}\xfat___\
-#\xc6\xa3\xac}\x9eB\x17.\x5c\x18~\x7f\xd1\xbe\xd9\
--\xb6Q\x09\x91\xca\x0aW\xae\x07ZP#lt\xf8\
-\xed\xd8\xb1c\x97/_\x9e\xf8\x1do\xc4`,\x01\xe8\
-\xe2\xc5\x8b\x89\xa9\x96.]:k\xd6,\xf6\xccdN\
-\x04'\xe4\xfa'&\xa5\xe0\x15s\x09\xae2}\xa59\
--\xb2O\xb0\xd6B\xa5\x9d\x1a\x0d\xd6\xc38\x06\xa3x\
-\x0a\xdf\x11\xc8/Y\xb2\x84\xab}Z4\xb8\x00t\xf6\
-H \xfd&`\xe3\x1c\x90D\xee\x12R\x90\x5c:\xa0\
-l\x99\xa1\xe7u\x0et\xb02\xc1\xd3\x92\xd7C\xd6\x15\
-T\xd74+32\x13Hk@E6+\x89\x12Y\
-b5P\x83BE\xc2D\x01\xb2~ke\x95\x980\
-8P/\x5c\xb8p\xe2\xc4\x89\x1a\x9f\x19M:\x9d\x87\
-\x17Im\x10I\x87\xd3\x8e&\xa7g\x1b\x02\x1f5P\
-\xcf\x8bH4*\xa3,\xc9\xe0\xa1\x92\xe7p\x08%I\
-\x91kJ\xe8\xd7&E\x04o\x99\x8b\x94\x1e\x9208\
-\x09\xaa\x15c\x1a\x91\xe7\xa5\xc6\xb8\xdc\x0a\x9fr\xde\x1f\
-`\x11\xb1\x94\x92\x0a\x8d\x03\x86\xb4\xb6\xb6n\xd9\xb2\xe5\
-\xe1\x87\x1f^\xb9r%\xa1\x02\x1276\x85\xacV\xa9\
-\x90\xdcA!F\xc2\xac&~\xbbq\xe3\xc6\xb9s\xe7\
-v\xef\xde\xbdk\xd7.\xe2\xf8\x9b7oZY#\xc0\
-C\xbb\xc2\xf7\xf6\xf6v\xffJ\x22+\xabF\xb6k\xfd\
-\x9a(\xc2]\x94K\xb6J\x22I\xda\x1b\xc4\xfd\xac\x7f\
-\x94VQ\xa81\x12\xc67\x18\xc5_\xc4\xef\xfaC\xbd\
-t\xd7z\x9at\xdf\x90\x1a(;\x1aK\x1a\x1aw\x05\
-\x0f\x8bJ\x8b\xe0\x95\x04\xcb7&\xea\xbf\x0c\x81\xacD\
-$\xaa\x15\x5c\xa2k<1$q\x82b\x82\xe5\xa3*\
-B\xc22\x93\xed|m\x86\xd4\x91B\x0d5/\x92\x8b\
-\xd8\xe3\xda\xda\xda\xe6\xcd\x9b7a\xbfJ/\xb85g\
-Coo\xef\xf5\xeb\xd7\xff\xf4\xa7?\xd1+a\xc5\xc3\
-D\xb6X\xa6\x80\x94\x82\xdf\xce\x13\x0d\xc1p\xbbZ\x8f\
-\xb6<\x00\x96o2\xfeh6\x9a\xdf#\xc2DN\x90\
-\x1a\xc4i\x148)H\x5c\xbbv\x8dp\x0a\x06\x1a\xf0\
-\x8f`\xb1\xe7tttl\xdb\xb6\xed\x81\x07\x1eX\xb5\
-jUKK\x0b\x12L\xb3\xe2\xca$O\xdcQ0'\
-Sri\x82\xe5#$$2#d'\xfa$\x18=\
-t\xe8\x90\xfe\x92-B\xe9\x94\x1fY7-\x10\xfbJ\
-rP6K=s\xc3\x9a(n\xa4\x881\x9cx\xe3\
-\x18\x8c\x12Wq\xb6\x81;.\xb65IG\x96\xa7\xb2\
-w\x1b\x1aQ\x16\x06LU?\xc4v\x15\xcd`\xe4\x94\
-\xf0\xbf\x5c\x11\xb2\x83\x9a\x9e\x0eM%\xff\xa9M\xbf\x0a\
-\xd2\xaa\xa8\x16\x92\x0a\x0d\x85[\x91eP\x9e\xa7\xa0\xd2\
-\xf8*\xe4\x0d!\x09\xa5\x824\xeb\xb4\xb5\xb5u\xf5\xea\
-\xd5\x1c\x0cK\x96,\x99\xb0x\x94\x03u\xe6\xcc\x99\xf3\
-\xe7\xcf_\xb0`\x01G\x11\xdd@\xe8=\xac\x07\xf5_\
-v\xa5p\x85\x18\x09S\x14\xc9\xcbLl\xe3\xb0\x90\xb1\
-nr\xd6\xf6\x06\x5c.\x0d\x83F-\xc6\xe5J\xd4\x06\
-%\xd5\x02\xedl<\xbf\xe9\x17-H\x9bR\x83\xc0\xc4\
-\xd3\xcf\xe8\x97.]\xbax\xf1\xe2\xd9\xb3g#\x91\x15\
-\xf1\x9cT:;K\x85\xeb\x0b\x09\xc1\xf2\x01I\xd0t\
-pWOO\x8f\xfe(`\xc3\xbdN\x86\xe4\xd5\xddp\
-~\xdc\x87\xc9\x96\x1a\x0e\xf2\x15(+O\xba?S\xc4\
-\x9a\xa3a\x1c\x83QN5N\x1a\xb8\xf7\xde{\xe3\xbe\
-\xca \x19 <[d\xed]\x02\x1e\x081X:\x84\
-Je\xa7*\xc9\x0c\x18\x9c\x0b9HM0S\xe2\xc9\
-\x12\xcf\x1ci\x22i\x88\xe9\x945\xad62*e\x98\
-\x1b\xabk\x0dt\xb7\xf8\x8e\x0a\x0aW\xacX\xb1i\xd3\
-\xa6e\xcb\x96\xcd\x981\xc3\x0a\xc6\x19\xeeK\x0c\xca\x1d\
-\xd7\xae]\xbbp\xe1B\xb6\x0b$5\xfa\x1fznx\
-6[\x04\x12\xd6`H/5\x16\xc9\xd8\xd7aQ\xac\
-Sg\x95&cE\xedi\xa9y\xeb\xa4\x84\xca\x92\xaf\
-\xfc\x9b@$\xcaI!I#\xc2\xf4\xbb\xe7\x9e{\x92\
-\x97U\xd3\xa7\xfbT\x1c\xdb9\xe9\xad\x0d\xfa0\xa4\xf1\
-\xdb\x9d;w\x1a\xf4\xb7\xbe0*\x0eFc\xd3jP\
-\xa7Z\x16\xaf(gr\x15\x12\x8e-\xe3\x15\x8c\x12\x80\
-r\xc0l\xd8\xb0\x81\x93f\xde\xbcy\xd3\xa6M+2\
-@\xd6RZ\xfb(\x9a\xda\xc8|\x16\xe7]\xe8\x04\xec\
-\x8dLf:$Xn(\xe2\xba\xd94\xce\x04I\x1a\
-\x85\x94\x09\x8e\x841V\x10\xf0\x9c\x95\x0dA\xda\xbdL\
-\xbcY\xb3f\xcd\x993\x87\xa8To('\x00z\xab\
-\xcf\x94\xc7oF\xeb6a\x10\x9f-\x9a9\x8e\x84N\
-\xaa\xe5\xc4Y\x91\xa4\xa1\xcf\xf5zpcc\xab!\xce\
-\x06\x9f\xd5\xbb\xf4\x9a\xd4Ov6\x0aM\xd4\x22L)\
-\xc2\x0a\x02\xc9K\x8b\x0aV\xdcP`\x02WV}\xf6\
-\xe7\xce)\xa49$T\x17\x96\xafTLU\xff*\xfc\
-\xaa\x22\x91h\x9d\xcd\x96\x0d\xba-,\x9f!\xf6\xc0\xd8\
-\xe2\xee\xf5[\xd4\xe8\xc6\x08\x18\xc7`t\xd1\xa2E\xeb\
-\xd7\xaf_\xbdzukkkr\xd2T\xcf\x12\x87,\
-\xb6q\x0a\xb6\xb7\xb7\xfbo\xd5\xddm\xe0\x07\xf6\x14\xae\
-a\xb8\x13\x10\xeaz\xb7\xa1)Q\x0fE\xfe\x09\xfeK\
- \x9d\xcc\xb0ro:\xea\xa7SOoe]5U\
-b22\x1cB\x8d4^\x842\xf1:\xbb\xf3\xd5\xab\
-W\xbb\xbb\xbb{zz&\xec\xd7K\xb95\x8b\x9d0\
-\x94 x\xc8U\x9f2\xc4\xb3ux+A>\xd15\
-E\xf0D}\xad\x94\x86\xb8\xc3\xb9F\x15\xe1~p\x5c\
-\x18\x9al0?\x94\x10\xf7j\xfdh\x06\xa6\xb0\xb2\xbc\
-\xf1\x95\xc2p\xefRf0G\xd1!H2z\xeb\xd4\
-\x1aX\xbeB\xa3\xfb\x0d\x8b\xf4\xf8\xe1\xd6\xe9*&\xc0\
-:\xdd\xc2o\xc4\xdd\xe3\x9b\x8e\xa6\x03\xe3\x15\x8c\x12}\
-\x12_\x12\x5cr\xd2\xf0\xd0\x83\x84>\xaa\xa3\xb1\xef\x00\
-!\xcahn\xd8\xb0a\xe3\xc6\x8d\x84\xa4zGr\x17\
-\xe2?y\xc1'\xf2\xd5\xdd@\xb2\xa4*S\x2257\
-\x1cy#\xe5\x13UL\xe1:\xca\x92(\xbf'G\xdf\
-CZ\xa8\xd1F\x8d2\x5cD\xf4y\xed\xda\xb5#G\
-\x8e|\xfa\xe9\xa7'N\x9c\xb8q\xe3\x86\x95M\x08\xf4\
-\x8dh8\xf4\x7f\xd8N\x08\xe3\x9b;a\xbc\xb5\xd0n\
-\xf4\x1b!\xa4\x83|\x10\xc9-\xd3\x08d{+\x1b\xc1\
-\xf2\x85$\x0a\xb9\x9aA\xd2HNhP4\xd9\x1c\x93\
-\x16\x907R>\x82\xc9\xaf\xbaBH\xa7G\xb3!H\
-l\x08\x0b\x1f?\xe8E\x8c\x84~M\x81PX>C\
-\xf0h\x82\xe5+x\x15\x8a\xbe\xaa\xd0\xa0?\xa3\x07|\
-\xe5\xee\x02O\xc89\x89\xfdC\xcd\xabzp\xa7\x15\x91\
-\xba\x91\xee\x0e\x96\x1f\x11\xe3\xf8CL\x96\x8a^\xbf'\
-?+\xcd\xfbi\xa9\x1bC\xe9\xbcy\xf36m\xda\xb4\
-u\xeb\xd6\xce\xce\xce\xe9\x13\xfb+\xbd\x93\x0eC(/\
-\xe1\xb1\xe0*;\x9b\x85\x14\xa4\xd9\xd0\xc4s7E\x98\
-\xd8\x09JK(\xf3\xdd\x1b)\xb7\x80\x94c$\xa1H\
-i\x128\x96I(\xe5\x86 \xd81\xe8\xa8\xc4\xce\x0a\
-\xe4L\x1a\xc9\xc3|\x19\xf4\x8c\x15Wce\xd5XY\
-@\xbf\x96{\xf4\xe8\xd1\xcb\x97/\xb3S\x9btb\x89\
-\xad\x1e\x01X$W\x04d\x22X)x\xfb^\x10<\
-\x9d \xb9'\x1a\x14\xd9\x95\xc5\x8a\x13\x85D\xa7\x92\xae\
-*jt\xdbK\x88\xdc\x1b\xe6\xd7\x10\x13L:Y(\
-\xd20E$\xfa\xfc\xc3\x0c\xe7\xb0\xe0\xa0lmmm\
-iia\xc6'\x05\x8d\x06A\x95\xde\xbf\xc8XYm\
-Ff\x08\xe6\xa7A\xaeZ 5\xf0\xac)\x85\x9dA\
-\xc2[\xb7n\xe9\xef\x0f7\xe87\xb3bB\x88E\x13\
-L\x14\xc0\x5c\x19\x18\xd2\x83\x90\xc5|\xbf\x0a+\xab`\
-\xd2\x88\xe0\xb3\x04\xd2(\xd8\xfd\xc209\xd2\xf4\xc4\x98\
-0\x8e\x93X\x9d\xc6$\x1d\x0e\x92p\x0df\x0e\xba\x86\
-4\xebJ\x9f\x1e[\xb6l\x99~\xe1\xc9\xca\xee\x0e\xf0\
-\x00\xdb\x0aV\xbb\xa3\x1cyL\xd7\x14)\xcd2C\xff\
-s\xa7r\x8c\xcb\xb1\xcb\xc9\x0f+\x22\x8a\xe4\xaa\xc8\xbc\
-\x9a5kV[[\x1b\xbe-\xd2\x9ct\xe8*\xfd\xd4\
-\xd3\x88\x89\xaa\x89<#A\x82\x0bu\x15Q\xdaT\x13\
-\xc7UB\xf3\x14r\x88\x97\xb2M\xdf\xbcys\xc2~\
-F\x9f\x82n\xa4&?\xe98;\x5c0\x0a\xb4\x87\x82\
-l\x94PH\x0dt\x97XRrb\xb7\x04'\x0d\x8d\
-i\x17 \x87\x08\x13U\xdfE\xa8\xa9x\x98$Q\xba\
-I\x0a\x9fu\xf5#\x7f:&\xad\xc6\x8a\xc2\x95\x9dm\
-]\x80\x90\xb4h\xf7(-rN\x98t\x86\x0bGI\
-\xf0\xcd H\xd4>\xf4\xf6\xf6\x1e<xp\xef\xde\xbd\
-\x84\xa4\x13\xf9w\x8f\xc7\x10\xac\xb0T@\x06r\x91\x81\
- \xb9p\x09Ww\x85\xcb\xc1%\xc3BM9#h\
-!\x97\xf1\x9d\xc1:\x09\x84\xf5\x183\x92\x19b\x04\xad\
-D\xc0Z\x22nX\xb4hQgg\xe7\xdd\xf6\xc9Q\
-\xcc'\x1cqo\x8c\xd5\xd0\x96\x07,\x02\xe6\x80\xe5+\
-\xb8\xc91\x08\x05S\xc2\x91\xc44*H\xa2\x22!9\
-\x90\xd6\x9b\x03\x9emV\xadZ\xb5|\xf9\xf2\x09\xfb%\
-\xf1a\x81itl\xe6\xcc\x99\xfe\xfa6\xd8\x91\xb6\x94\
-\x09!\x1fZ\xbeBV\x22h \xb7\x9d\x18\xea\xba\x02\
-w\x9f\x13\x98\xe0u\x17lJ\xb0|4\x9a\x9eN\xc9\
-\x9d\x94\xd0\x1a\xaa@\xa9\xae)r\x85j\xc12\x8d\x80\
-z[\x7f\x9f\x83}#T\x0e\xeeL\x13\x17)\xdd\xa4\
-\x06\xee(\xf9\xd6Q\xa9e\xaaQ\x91*\x0aI\x04\x1b\
-\x22\x0f\xd8\xed\xed\xed+V\xacX\xb6l\x19'&\xdb\
-\x9d\x955\x14Xj\xe6\x05\x03\xd9\x0f%\xaf\x1f\xb9\x0b\
-,\x1f$\x5ci\xd0_\xbb\xaaq\xae\xfd\xfd\xfd\xc7\x8f\
-\x1f?z\xf4\xe8\xd5\xabW'\xebG@\xa3\x01\xd3\xc2\
-yh\x07\x22\xc8\x012\xd0\x09\x16W!\xa1\x97*1\
-\x02\xc2=\xab\xb0\x82\xb1`\xbc\x82QuTsK\xc6\
-Kb\xd3$\xe3;4g\xcf\x9e\xcd\xba\xba\xef\xbe\xfb\
-\xee\xc2O\x8e\x06\x97\xd8\x8b\x1c\x13U#\x05PZ\xc2\
-F\xc1{\x0e>\x0b\xb2d\xe5CZ\x9a\xdb\x94jQ\
-D\x9c\xb7x\xf1\xe2\xad[\xb72\xa9x\xce\xd1g\x97\
-\xcb\x03=lii\xa1ct\x92D\xfcrTv\x0d\
-ZW\xf1Cp\xe4 .T\x22\xd7\x1b\xb5\xa1\x0a\x10\
-\x0d\xd3\x07\x0e\xb6\xb9s\xe7Z\xc1D\xa1\xcegm\x81\
-8]\x9b\xfa5\xe5\x22]\x85\xd2\xf5\xb7P6\xe8y\
-BM\x13\xb2\xf6\x0e\x17\x1a\xd7\xee\xa4\xbb\xd4\xb8\xd7]\
-\x8e<\x83\x93\x1d\xc9E\xae\xdf*jU\x0fT\xc8-\
-U\xa9b\x99\x08\xc2\xa9[\xb7n\xdd\xbe}\x9b\xa8\x8b\
-\xac\xd4\x1a\x05\xf6:\x8ex\x88]T\x94\x86\x91\x19\xa8\
-IKB\xad\xdd\xb9s\xa7\xb7\xb7\xf7\xda\xb5k\x126\
-\x22\xf8M\xae\xc3\xa2\x80y&\x99\x10\x15\xa4\x19c\x05\
-\x81l\xb66v\x9f\xc1\xe1H\x12&\x8aP\xd9h\x18\
-\xc7`TS\x0d\xc7\xa9\xa3\x9e\xc8\x22\xe7\xf2\xa8\xc7\x89\
-\xb8}\xfb\xf6\x1d;vL\xe4\x97oO:\xb2}\xda\
-\xb4i\xf8\x81l\xed\xf9\xa1\xd20\x8b\x86\x9eF%\xa4\
-\xa8\xdb\xa9\xb9\xe1\xd9\x91\x99I-\x9cIx\xd7\xda\xda\
-\xbav\xedZ\x1eo:;;\xcb\xf6rT\x13\x9e\xbe\
-\xadY\xb3f~\xf8{\xb9\xcc\x04\x0cO\xb9\xa2\xb6\x07\
-F\xec\x1fOh\xf5\x11\x0d\xd3\x07\x1e\x08%\x9fx\xe8\
-\x89z\xe5\x09\xa5]\x92B\x0a\x10\xa7cRnL9\
-VY\xa0:Wy\xde\xcaJO\xe8\xb8\xc5.&\x8a\
-\x9c\xa0\xd2\x18\x17\xbaB*!R\xd9\x18\x8a\x98'@\
-z\xf0\xa6M2\xc4\xbe\x15\xca\xd6A\xd5\x94\x8e\x9d\x9c\
-r8Yb)}\x03\xc6\xc9\x93'O\x9d:\xd5X\
-\x7fI\x08\x98H<\x00\xf3\xe8\xcbU\x0f\xe1\xa9\xa95\
-\x1c\xbf\xe5@u\xb5\xa9v\xd4,\xd7\xf8#\xaa\x0dJ\
-l\x97S\xc3\x22\x8a*\x0c\xfaAE1A!\xc1\xf2\
-\xb5\xc8i\xa4\xbe\x8aC0^\xc1(3\x8c\xb3\xdf\xcf\
-W\xfaZ\xe3\xe9Mr\x5c\xcc\xd4\x5c\xb4h\x11\x91h\
-\xe3\xfe\xdca\xb8\x10\x91\x10\x04`\xf2\xc2\x85\x0bg\xcd\
-\x9a\x85\xdfF\xb9\x0eK\x88\xd6\x0f\x89x\x02\xc8\xcc\xf8\
-\xaa\x84P\xb6\x1e\x8a\x94\x91s;B\xfc\xf6\xf6v|\
-[\xb6\x8f\xf9\xd3\x19\x86\x9bq_\xbf~\xfd\xb2e\xcb\
-\xf4f\xd4mI\x5c\x10P\xb6~\xea\xac\x12\x0f\xc4W\
-_}u\xed\xda\xb5\xee\xee\xee\x0b\x17.\x5c\xbf~\xdd\
-\xa4\x13\x85:\x1clM\x90\x10\xbc\x87qWc\x90\x0b\
-\xcb\xe7a\x8d\x06b\x89\xd2\xa0\x16t>\x81I\xef&\
-\xe4\x10\xa1\xac\xe4\x05$k\x0aw\x09\x935\xa9\xc9P\
-.\xb5Ih\x99\x02\x5cA\x09\xda$\xc1j=\x1f\x18\
-\x18\x18h\xa0\xe1\xa0\xf3\x1c\xf4\xcb\x97/\xdf\xb0a\x83\
-\xde\x11\xb0\x19\x22\xf4\xfd9\xe5\xb1\xc4;\xc3\x5c\x9b\xe8\
-\xb3\xa4\xf9\xcf\xf2Q#4\x9ej\xbf\x11\x19\x96\x152\
-\x9c\x7f\xc3u\x18\xe8.1rc\x11Vm\xa4\x8c\xcb\
-\xf1\xcc\xf4\x9a7o^GGGkk+\xc1\x16a\
-%x8\x12w\x1a\xf3\xb8JB\x1a5\xe2W\x0ei\
-\x7fM8\xb5\xc1^\x5c\xb4u\xeb\xd6\xed\xdb\xb7\x13\x97\
-\xe0+-K+\x1e\x0a9\x13,_V\xb0\x08\xbbd\
-\x9a\xac\xd35\x85J\x1d\x93\xd6AJ\xdf\x1d\x229s\
-\x89I\xa5\xe7o\xc9K\x02\xc3M\xa0\xbcx\xf1b\x1e\
-\xbd\xe8\x1e\x12?Qd\x82\xae\xb1i\xf5 \xab-S\
-L2oB`q\xfb\xf6\xedK\x97.}\xf1\xc5\x17\
-\x87\x0e\x1d\xbaz\xf5\xaa\x15O\x08\xea\xaa\xcf\x0d\x93V\
-\x90\xf9\xb5\x91\x15`\xf9\x9a\xe4\xde\x02\x0f\xdc\xb9s\x07\
-'\x10\x94\xd7\xd9N\xa3\x10\xbck&\xc7\xa6\xe5\x9a\x19\
-+g\xa1J`0j\xaf\xa1\xdcD\xc8Q\xa0\xe9-\
-$\x191\xde\x08\xf3\xf6\xe6\xcd\x9b\xbd\xbd\xbd\xfd\xfd\xfd\
-\x8d\xf5\x8b\xe1\xecu\xc4\x06\x1cy\x0f>\xf8\xe0\xca\x95\
-+\x09Lc\xff\x80\xe9\x05\xdc\x87\xc3\x86\x8aQ]\x5c\
-\xc4\x02\x07\xfc\x16\xa6\xf0H\x9b\x9dl\xd4y\xb0|\x86\
-\x94\x03\x8b\x88]m-\x06$\x01\x95\xbaN\x8c\xd4\x5c\
-9\xd4\xab\x92\x8c\x8c\xb1?\x9e\xf5\xc3\xc7m\xdb\xb6\xdd\
-w\xdf}K\x97.%\xb2$\xe4\x92I\xdeiav\
-\xf2Oe.2)\x09\x1d\x88e\xf5\x8e0hMe\
-\xb0q\xc1\x82\x05\xfa\x82U\xc2w\x5cg\x05y\xa4\xbc\
-\xd7@\xb0\xfe\xb5]2\xc4~Me\xb9*\xe1`\xea\
-\x90\xd6\xc6UR\xd5!4iB\x12e\xf3\x1e]R\
-\xa0\xcc\x955\x22\x89\x8a \xb7\xb7\x89=\x11.\x89\x13\
-BY\xb0|5*\xd2\xb8\xdc\xbau\xab\xa7\xa7\xa7\xbb\
-\xbb\xfb\xf2\xe5\xcb\x1co\xa61Q\xd0\x8d$\x14\x1d\xd1\
-sBX\x10\x09\x96\xaf\x89L\xb6\x8cfW\x00\x0f\x10\
-\x89\x0e\x0c\x0c`;g\x95\x15\x97\x1b\x99,\x8b\x1c\x15\
-9\xb1D\xfa\xf15E\xb6z\x0aWH\xeeT\x999\
-:\xd7%o\x02x\x86\x85\xec\xe7\x1d\xe0\x1f\xa1l.\
-\xa6\x11\xe9x\xf5\x5cT\xca\x5ce\xde\xea3\xa3q\xdd\
-\x92#\x17\xf1\xf8\xbdv\xed\xdau\xeb\xd6\x13\x95\xfa\x8f\
-OM#b4v\xa9\xc1\xe0W{\x97\x8f\xaf\x08\xdc\
-o\xdcH\xbe3d4-\x97\x10\x8cu\x94\x95\x5c\xd4\
-\xc8\xa6\x8a \xf6\x8c\xb7\x96U\x83\x94|\xf4.\x1d\xfb\
-`\xb4\xa5\xa5\x85\xd0\xea\xc9'\x9f\xe4\xb9\x87`T\x1f\
-\xd4KfD@:BY\xac\xe1?\x95b\x1b\x01Y\
-kk\xab\xde\xaarHKs\xaa\xc2\x19L\xd8\xbd0\
-0{\xf6ll'<\xc5\x09\xf2\x06\xa0\xa3k\x96\x22\
-y\xd9`\x17\xd0\x9b'\xae\xa4M\x1a\xc8Z\x10\xa6w\
-2\xbfey\x8eFMT\x97+\xce\xe1^\x89\x07C\
-\x22.-\x0f\x1c'}}}W\xaf^\xbdq\xe3\x06\
-\xfdd2$\xc6\xe7-o\xc9A\xd9\xd1\xe3Mq\x0b\
-\xc5\xa3\x84bz`\x98Hd\x14X>\x83{@\x90\
-\x8d1i@\xd9\xa2\xa6b\xb9\xd5\x0dWL\xc6p\x02\
-\xf1c\xc7\x8eqe\x96\xa6\xa6h\xd9\x08\xdeJlI\
-L\x88$B\x92\xb1\x22\xd5\xa0\xdf\x82\x85\xcc\xa1\xce\x03\
-\x0c\x11\xfc\xc4\xcf\x99\xd2\xc2\xfa\xe5\xb0c\x1b\xe7Jt\
-\x85\x841b:A\x98kiT+&\x16\xca\xdb1\
-.\x97Z\xf2\x00Wy\x84\xcbm\xad\xb4`\x02\x01h\
-\xf8\xf6\x0e\xfb\xad\xcd\xc4\x1d\x01\xd3\xf0EJB\xf9\x0a\
-\xb1Nm\xd4\x82`\x96\xb2\xc7\x9e;w\xee\xc8\x91#\
-\xe7\xce\x9d\x9d\x94\xbdn\xac\xc0{x\xcc\xe7\x83Y\x18\
-P\xa9\x8a\x94\x10A\xb1\x0a+\xc8+\x025U\xa1J\
-\xc7\xaa\x15S]wx\x8cq0\x8a\x9b\x88\xae\x96-\
-[\xb6a\xc3\x86\xe5\xcb\x97\x13\x98\xea\xa1\x07\x92\xa5S\
-qbp]\xd2i%\x04YJY\xc9\xfa\xad\x8e\xf5\
-\xeb\xd7O\xf9\xdf\xa9\xc7^\x0c$\x06%\xec\xc69&\
-\x0d\xc8'\xbe\x91\x994r]\xa3\xa0\x8d\xe0\xda\xb5k\
-l\x01\x98cR#\xc7\x90aY\x97UN\xa6Z\xf5\
-\x1c+'\xf4\xed\xfa\xf5\xebg\xcf\x9e=z\xf4\xe8\xf9\
-\xf3\xe7q\x0e\x12\xf5<&\x181\x88\xac\x8b1\xbd\x8a\
-+bIm\xd4\xa0\x12\x8c\x0b\xc3\x94\x19\x9dIF=\
-\x8c\xb1\x82\x0aY\x89\xc8U\x06\xc9c0\x99\x87\x81}\
-\xfb\xf6}\xf4\xd1G\xc7\x8f\x1f\xcf\x9b\xa2\xe5\x82\xf1\xd5\
-.\x0a\xf4\xdf\xa4y\xc8@\xb0|5V\x160Q\x06\
-\x95\x98R\x05-gf\xec\xc9\x93'/]\xbaD\xf8\
-\x1et\xefv\x18\x0eN\xaeE\x8b\x16\xad^\xbdz\xc1\
-\x82\x05l\xe9H\xac,`\xee\x8b\xbc\xadt,\x19\x12\
-osX\xb5\xca\x06V\xe8\xd4\x03&3+.\xf1K\
-\xc5\x22O[B\xd7a\xc2-\x92h\xa3\xb2R\x98\xb4\
-\xcc\xd8O>\xf9\xe4\xbd\xf7\xde\xe3\xb1\x93go\xd3k\
-@d\x91e\x02\xc1C\x09\x9e\x96\xdc\x910`\x92\x14\
-VX\xc1\xa4\x81p\xab\xf4\x99\x12w@\xfd\x11dS\
-\xd5\x87\xc5\x18\x07\xa3t\x88g\x1d\xe2Q\xbd\xe7S\xff\
-\x9c\xd0\xe1A\x89\xfa\x1d\xccO\x12\x141G\xa7\x87`\
-\xf4\xfe\xfb\xef\x7f\xe0\x81\x07\x08jy\x84\x0a\xbaS\x16\
-\xc5\x01\xfa\xf9\xa0\xfbA^\x92g\x9cD\xbb\xd1\xa0\xdb\
-\x18\xc8\x19?00\xc0\x16\x90\xdaw\x1c\xd9;\x86\xd0\
-\xa0\xefD a\xf6\xbe\x93\x08\x9d\xc1!\x17/^<\
-}\xfa\xf4\x95+WH\xab{q'I\xe31\x87l\
-\x5c*\xdc:G&\x0b\xb2^E\xd5\x05Y\x95\xc6\x89\
-\xc9%\xf47\xc1\xf2\xc3A\x16\xc5\x89\x5c\x82\xe9U\x9a\
-xU\xc1\xe8\xa7\x9f~\xaa7\xa3*-'8\x87M\
-uf\xf8VZ\xb2n\x8b\x90\xf7\xc0\xf2\xc3\xa4R7\
-\xbfz\xf0\x9cyL\x0fQz\x97\xdc\xd0\xe7\xfa\x18\xc2\
-\xc95w\xee\xdc5k\xd6l\xdd\xbaU_\x05\xe3\x03\
-\xe1\x89,\xf1\x08\x06\xf7'\xdf\x0fl\xf9\x80\x84B\x1b\
-\x9a\x0b\xa5 R\xd9\x92\xa3\xfe\x83\xe5#\xdc!\xb1g\
-F\x80\x1a\xa7\x11\xa6\xab\x1e\x9f\x98\xb1\x1f\x7f\xfc\xf1\xae\
-]\xbb\xca\xbf\xcc\xeb!\xd7\x81u8\xcd\x14\xe2\xba\xd9\
-ZH$\xd4]\x82\xae\xa5\x84\xf2\x89j\xc0\x8fZj\
-\xe1p\x93\x0e\x9f\xb1\xff1==#\x1e\xd5\xebw\x13\
-\x15 {d\x06\x09\xd9OEVugg'\x91\xe8\
-\xbcy\xf3\xc8&\xaaS\x17\x99\x0f\xca\x86i\x90\xa0\xb4\
-\x84\xb9X\xb5\x80\x89J\x09\xd3\x80\x13t\xc6\x8c\x19\x0c\
-eQW\xddRO\xa07\x02\xd3\x12\xc7\x05<\xab\x84\
-\x18nk\xe3\x0d!\xc5\x9c9s\x98\xe4\xfa\x5c5\x92\
-\x5c\x93eQ\x0a+\xab\x0e\x1d\xac,\x22\x96+-\x94\
--\x89C\xe8L\x1cj\x17\xf5*W\xae*U$.\
-L\xb0l n\x5cE\xbarP\x11N\x11\x8fB\xf9\
-?0J\x88\xd3\xd6\xd6\xc6\x84\xd1\x17\xe2`\x82\xec\x0a\
-6\xe5;M\xc4\xa5E\x9a\xf2O5\x83\x92p\x87\x04\
-\xd4\x08F/_\xbe\xccs\x14\x89\xbcZw#x\x86\
-\xd1ioo_\xb0`\xc1\xec\xd9\xb3k\x9c}\xc9\x80\
-\x05<\xcb\x95\xea~\x8d\x89\x9d\xabZ\xc2%J4\x16\
-2!\x8eZ\xdc\x10\xf7\x00\x89\x18\x09!\x95-B\xb7\
-P\x9a\x1b\xdd\xbcy\xf3\xd2\xa5Kg\xce\x9ca\xde6\
-t$\xea\xb6\xcb@y\xc3QQ\x16+\x0e(+9\
-\xb8\x97R\xa8}P\x96\x1aq-\x04\xf6o\x05JQ\
-\xc6\xd5\xa3q\xef\xd8\x07\xa3\xb5q\xf3D\xe2\x9e\x80\x82\
-\xebDT\xf9\xe4(k;\xfb\xc3\xeb\xa9\x07\x06\x12\x88\
-\xc4\xb1{\xcaE\x0d\x0dC\x89u\x9c\x9dD]\xfe[\
-\x93VVM2\xf1\x87Z\x1850\xd5jee\x8b\
-\xee8\xb9\xd0+\x0e\xad\x95+Wn\xde\xbc\x99\xe7.\
-\x1d`\xeasm\xdc\xae\xa1U+\xcae\x86\x1ez$\
-:V#E;BY5\x1e#9\x90&\x1e\x85\xf8\
-h,'\x98\xc3\x22Z\xb4h\x91\xc2\x1d\xf6F=\xc0\
-\xd4I\xec\x908\x0d\xee\x93p\xad\x9a0\x92+!p\
-\xd4\x9d;w\xae]\xbb\xd6\xd7\xd7GB\xa5M\xc0w\
-r='\x98\xb4\x18\xf9\xd32\xd5d\x8b$\x818\xab\
-t\x83B\xff\xe3EW\xc3\x1cMW\xb0|\xf5\x04\x0e\
-\x9eHP6\x06\x1dm\xaa<g\xf2\xe0\x04$r5\
-\x1b\x05:\x8f\xd3\xa0\xc8^]S\xa84K=\xae(\
-\xb8\x91%\xb2\x8c\xe6\x91~\xbcB=sC\xd2k]\
-\xab\xc8Z\x98\x92\xd4\xe3\xa6\xa9\x01\xabE\xfbW\x1c\xa8\
-a~\x9d\x1e\xc8\xfa\xb6l\xb8!\xb1EEi\x81\xa4\
-\x08\xd3\xc8\x10\x97\xc6\xe9\xd2\xc2\xc0\xf1\xc4\xa5\xafvj\
-mm\xcd\x0d,\x92\x95\x13\xb0|\x01\xb5\x15J\xee\x0a\
-:\x8f\xedL~\xcd\x7f\xd9\x12_EVR'n>\
-\x09\xdf\xc7](R\xd9r\x82\xed<\x9f3U\xe2\xaf\
-\x0aw\x87\xc8\xa8\x5c\xa4 j80\xab\x9c\xca\x82\xbc\
-\xc7\x950\x94S\x87\x84\x154\xa9\xde\xc9M\x14\xc8\xba\
-qX$\xa3\x12ZPB\x90\x8dg\xb2\xae\x0d\x04\xf3\
-0\x85\x15\xd4E\xa2\x9c5<\xe5\x04e\xd52i\xdc\
-\xc53gJ\xa7\xb1\x90\x15\xb7o\xdf\xbeq\xe3FQ\
-T\x9d\xeb\xc9\xe0`\xe4\xfe\xdf\xf0\xf06\xa3F<;\
-\x08\xd3\x9e\x9d<%\x1c\x16\xe3\xfe\xdeQ}\x8b\xbb\x98\
-\xf5!\xa5\x8e$r4\xd7\x5c\x8fO%0\x99\xfdK\
-\xa3(\xac \x0f\xd3\x08:q\x22\x14\x96\x11\x86\xcf\xd7\
-\x0fWm\xa0VV@\x18\xf3|\xbcT\x9a1\x92\x0b\
-\x13\x05\xa1\xa5J\x09\x03\xc7\xd0\xeb\xf5\x7f\x18L\x8d\xa3\
-\x8d\xa6$)T\x94b4f\xd6hvb\xc0\xf6\xaa\
-]\xac\xba?!\x97`\xf9@\x18\xe4\x04\xd2\xa9\xa2\xda\
-X\xb5PQ\xd7l\xe3%\x87\xde\xe2+\xa6M\xdcm\
-\xd9R\x0fE\x9a\x89S\xaa\x8b$q\x90\xe8\x8e\xa4=\
-\x0c\x82\xa0\xdb$\xc1\x87f\xb8G\xb2{\xd2\xfdIu\
-k\xa1\x22w\x05GY\xbf6\x0a\xd8\xa5\xf5^\xf4c\
-\xcf`\x5c\x9aXN\xd25\xab\xe5U\xb8\x0f\x99\xae>\
-cU\xd4\xb8`\x02\xc7\xe8\xad[\xb7x\x1atsd\
-\xa9\x90$\x17\x0a\xf5_\x9d\x04\x87\x99\x87%\x01o!\
-u/Wf\xfeK2\x02\xc6\xf1\xcd\xa8\xa5\x22*V\
-\x0d\xda\x06\xc1\x87\x06Yt\x98:q\x91\xd2S\x15\xd9\
-\xa8e\xa94xA\x92\x08\x90F\xc7\xaf`\x05\x8d\x00\
-\x8f\xa4z\x8f\xa2\x19\x1b\xcd\xedAR\x16\x05\xcd*\x5c\
-(\x85\x98zJK\x08\x1d\xc3-\xf1\xb6\x92\x18\x10\xbe\
-W\x5cYG#.L\x84\xd0\xfe\xadE\xaaJ\x8a\x1a\
-E\x13\x80\xfa&\x82\xe1\xc1\xea\x8a\xedVP\x8d\x8a\xb2\
-\xc4E)\xa5\xaa\xa2\xea\x16\xdc\xcf5Z.\x15L\x95\
-\x9by\xdfJ3\xe8\xbd<T\x14+\x04\xf5|\xfd\x22\
-\xb9pG\xd5V\xbbkQ\x98\xa5-\xdaD\xf5\x11\x06\
-$qiQ5W\x10\xca\x0a\x135\x0e\xf7\xde{\xef\
-\xec\xf0\x05X\x04.\xee+]\xdd\x1c\x99\xe6\xc4\xd1\xa4\
-\x12\x8e\xf4\x85g\xe3\x04P\x9d\xb5\xe3qE\xe3\x22s\
- kK\x9dS\x0e\xb5\x94\xab\xeb\xa1v\xe3\xde\x14j\
-e\x0cF!\xd7\x00\xf5;qg\xe4\x0be5\xe1$\
-I\x1cV\x9fs\x1b\x1d\xccdA\x92\x90\x13\x5c(\xe3\
-\x93D\x01\xa1<\xc1k\x95\x13\xceN\xfd6\xbd\xde\x8c\
-\xd2\xdf\xf0\x9f0+d\xbb\x1b%\x8b$\x84X\x18#\
-}\xc9\x83\xa2\x11\x0a\x8dT\xb6T\xb0?\xf6\xf4\xf4\x5c\
-\xbcx\xb1\xaf\xaf\xcf\x7f\xec\xa2\xfe\x06;\x8c$\x1f!\
-\xab\xe3\x090$\xb9\xca\xc3ja<\xa0\x03\xfah\xb8\
-\xde$\xc5\xfdQ6\x85\x95EXA\x05IT\x14\xe3\
-B\x12~\xf8e\x1d[~XJ\xcc\x19\x0fFeB\
-\x98#C\xd8\xe2\x9a~\xcd\xa5vQj\x7fV\xa2\x89\
-\xc0!\xc0\xec\x12.T\x22\xd7\xb1\xaaB\x82R\x11\xcb\
-\x85J%\x07\xa9\x09\x86\x83\x99\x00\xa4\xad\xb8\x11\xc0(\
-\x22\xd1\xf6\xf6v\xff\x03\xc8\xc2\x8a\xf3p{\x950i\
-\xc6\xab\x9eU\x82+U\x80s\xe7\xca\x95+\x97.]\
-\xbaq\xe3\x06Y\xe944\x98&\x86t]\x8a\xda\xca\
-\xb9\xadq\x17%\xe2\xa2\xac\x9aS\xd2`T\xc8k\x9a\
-\x16nXD\x95\x85\x0e\xd9<\xe5\xbb\x0b\xf9!N\xa4\
-\x08\xae-\xb5\x97\xe8\x1e\x91hww\xf7\xc9\x93'\x89\
-\xba\xf4^\xc7\xfb\x5c<\xa5\xcd4\xb0|\xc0\xb3Yy\
-\x0a\xc9\xc3T*\xbe\xc7\xa4B'\xaf_\xbf~\xe6\xcc\
-\x99#G\x8e\xe8+r\xb4Q\xc6\xfduC\xb2T\x8a\
-\x12cE\xc8\xe6 \x0f\xc4~\x08^\x99d\xb7\xd0\x01\
-\xc2\xd0\xb9s\xe7\xb6\xb6\xb6\xeaK\xc2\xb3]\x0a\xdd4\
-L\x94\xc1\x8a+\x984\x83\x15W0i\xe4\xe1\x1a\x0e\
-,\x09\xd3\xa6M\xd3_\x03\xd1\x977K\x982gX\
-\x84Y3\x88\x0b\x0b6\xea\x84\x22y\x13G\xc3\x91\x1d\
-\x94z\x86I\xeeMF4(\xc7\x83\x92\xca\x02\x8f\xaf\
-\xfaqm\x8d\xf1*!D\xea\xf3\xe7\xcf_\xb6l\x19\
-Wv\x00Y*\x93e\x97\xd4j 5\xb0|\x01j\
-\x90H\xf4\xc2\x85\x0b{\xf7\xee\xdd\xbf\x7f?\xf1(\xa7\
-\x8f\x157&\x8c5gh\x7f\x7f\x7f\xe6$\xadr\xa0\
-\xb2Y\xa4\xecj1^\xea\x89,\xa1\x8d\x04\xa5%\x8c\
-\xc96;,\xc6=\x18\x15\xb2\x1f\x94\x8dL\x92\xc0p\
-\x05\x11W\xb9\xab\x90\x7f\x1c\x09\xe5\x8a\xc6r\x08\xbde\
-\xc7d\x178u\xea\x94\x82Qm\x9d\x8eY\x18\xb0:\
-\x19P\xb3T@\xd9P;A\xc2\x14\xd6b\xf4&\x0c\
-\x8a\x94'\x05:\x83g\xf4GA\xce\x9f?\xefO\xed\
-\xa9>\xc7\x04s\x0d\xcf\xaa\x08\xe2t\x0a\xb5\xc6UH\
-(\xc8\xa6\xda\x99\x18\xb0q\xd6\xacY\xed\x01\xfdn\xb8\
-\xbfOr\xd4+\xf5YH\xae\xb4\xbc$$\x878\x9d\
-B\x9a\xe0i\xc9\x1b\x02z\x8b\xbbV\xacX\xb1i\xd3\
-\xa6\xc5\x8b\x17s\x8a\xbb\xf9*\x95\xdaPT\xa9i\xdc\
-\x85\x89*d\x85\xdc\x82;\xea\xa6\x5cM\xda$\x83\xfc\
-\x96\x0cL5*\xcdB\x91\xbcj\xf9:`\xa3\x18\x18\
-\x18\xe0\x09\x96G\xd9+W\xae\x10o\xa5\x06\xab\xcc`\
-)\x8f\xa0\x0b\x17.\xf47\xa3\x08\xe5\x810\xe9\xcc\x10\
-\xb2*\xca%\xd6tb}J\xf1\x12\xb0\xc7\xe2\xa5O\
-?\xfdt\xdf\xbe}\xf8j*\x05\xa3\xf2\x80;*v\
-H\xd69NnQ\xec:P\x9b\x8eI\xab\xa9q\x8b\
-\x113\x09\xdb\x8a\x99\x180Q\x93hVe\xaf\x0d\x0d\
-\x1b\x0dg\xa7\xbe\xa9[\xc7X\xee<F\x18\xcb\x13_\
-D\xb6{Q\xac\x93K\x5c1n\xa1\x84\xb0\xb3\x5c\xbf\
-~\x9d-R\xdf\x92\x13\xdb\xa8\xb4\xfa\x1f\x0c2CT\
-\xe4H\xa2\xa2\xda\xa8\x11\xc7\x85\x5c\xc3\xa6\x9dPgS\
-c\x02\xb7\xfe\xb3\xf0WX\x98\x18\xa9\xd0*E0\xd4\
-:&\x9d\x18\xc9\x9dzLP-U\x07\x09K\x0e\xfd\
-\xd4\x1f\xf8Y\xb6lY[[\x9b\xbfHf\xd4T\xaa\
-lm\x5c%v)xuo$VP)(\x0b\xa4\
-\xb5\x90\x9b\xa4\xc0i\xbe\x94\xe44Ml+\xce\xe0E\
-A\xb7P-\x86\x96\x09D\xce\x9e=\xfb\xd9g\x9f\xed\
-\xde\xbd\x9b\x87|\xb2V\xd6 |\x15\xfe\xaa\xbe~\x8b\
-@\x12\x1c\xe6i!o\xd4\xe9\x93\x14\x9a\xba4H\xe8\
-\xc9C\xfe\xa5K\x97N\x9e<\xa9\x9f>\xf9\xacnP\
-p\x08\x11<\xdb&\x87\xa9~<\x22\x8b\xb2v\x8d\xd8\
-\xd2d\x22V0Qh-\xc6\xa4\x11E\xf2a1A\
-{JlX\x0d\xeaTk\xd2(0\xa0D\x1b\x9d\x9d\
-\x9dk\xd7\xae\xe5\xca\x81\xaa\xddYs\xd7\x91\xb2\xa75\
-\x0d\xb8\xa64\x83\xd6 .\x91f\xed}\xbf\x9c\xb0c\
-\x12\x86\xa6\x22Q\xed\xcb&\x09\x16)\xcd5&)\xad\
-\xc6\x0a\xf2\x8aR\x98^\xf81\x96\xfe>>aq\xea\
-<\x98\x00\x18/\xb6TE6tFBP\xdf\x1c\x93\
-V\x06Z\x98\xa8\x98\xb8b\xdcN\x9d\xd5\xcbIl\xc8\
-\xd8\x22\x9f\x14y&\x96\xeb\x98\x9f\xf8\xd9R~44\
->@\xc9<\xab\x90\xca\x82\xeb(\x11\xa3\x16T\x14t\
-\x0d\xb2x\xbe\xbf\xbf\xbf\xab\xabk\xd7\xae]\xc4\xa3\xe7\
-\xcf\x9fg\xf7H\xea4\x08L\x1b\xfa\xdf\xd3\xd3C\x98\
-\xe8\xef)\xd9\xf3\xea\x9c\xd5\xb1o\x95H\x11\xb7\xc3\xbd\
-\xd8\xdf\xb8\xdd\xb5k\xd7\x1a\xeb\xfdq\x11XM\x18J\
-0\xea\x8f\xa31\xc9\x14\x89\x84\xd8;N&\xab\xe5\x18\
-\x17Jad\x8c{0\xea\x0e\xf2\x84P\xd7\x1d\x936\
-\x99\x8a\xb0~\xf4\xeb\x93\xb6\x84*\xd3\x80q\xd7\xfb\xb8\
-0\x05l\x0eh\x9e8\x12:&\x0d\xf2l\xadF\x8c\
-Ge\x05X>\x98\xa2,W7&R0\xb2\x12\xa7\
-F\x91\xd0-8\x0cz{{\x8f\x1c9r\xe0\xc0\x81\
-s\xe7\xce\xdd\x9a\xa8?\xed\xc8\xdd\x99\x12\xfa\xebSL\
-\x0c\xffi]\x11t5\xb1(qL\x1a\xd3\xa8\xe8\xc4\
-\xc4rO+a\x95\x03\x92\x94\x1c\x8eU\x9e\x16\x18\xa3\
-S\xa7Nq\x90\xc7O/\xb1\x09\xb5\xcd\xf1*\x22X\
-?\x88$qQ,\xf1\xba_}\xf5\xd5\xcd\x9b7\x99\
-*L\x9eT\x83M\xdc]\x22xq\x10\x93\xd6\x07\xbe\
-u\xf7\xaa\xae\xae\xb8\x9d\x99\xd0\xdd\xdd}\xe2\xc4\x09\xe6\
-\x03\xe9\xc6\x1a\x05\x16>\x07\xc1\xf4\xf0\x17mdQl\
-\xa9\xe3\x92\xac\xdf\xea\xb4V\x15Y8\xccX\xc8\xde\xa2\
-\xe1\xc0\x04B\xea\xabW\xaf\xf2\x04r\xe5\xca\x15\xfd\xa4\
->\xb6+\xeb+\x88\x15\xc6\x8f1\xb9\xcb\xb8\x04\xa38\
-\xc5qI*\x91bb\x5c\xd6d\x82aX\xf5\x83\x92\
-\xb3g\xcf^\xbct\x89\xf5\xc3\xee\xa0\x19@Q\xe0\xff\
-\x92\x0c\x82*jO\x18\xd5\xb4L\x04\xca\xc2\xf2\x8d\x83\
-,\xd2\x8f\xabrM\x83\x94\xdc\xcd\x0cU#L\x18\xfe\
-)@Z\xc44\xfat\xbf~\xde7\x91\xc1hKK\
-\xcb\xd2\xa5KW\xadZ\xd5\xd1\xd1\xc1\x83>O\x11C\
-?H\x84>'\xa3[Ab\xa8\x18=\xe8\x0a\xcf*\
-\x91%\xd5B\xf9!\xec8}\xfa\xf4\xb1c\xc7\xf4'\
-\x0dk\x98&\x82\x1b\x06\x89\x85J\xa7\x907\xb8j \
-\x04\x12U\x01f&k\x99S\x90\xb5L\x1fX\xcb\xfe\
-f\xabI\x8c\xfc\x068M\xd9\x22\xa4\xe6\x09\xa1Z)\
-\xa4\x0f\x942\xfa\x03\x03\x03\xfd\xfd\xfd\x0d\xf7sg\xa6\
-\x16\x8f\xa0K\x96,Y\xb1b\x05\x0f\xa2,|YD\
-\x91\xac\x03i\xc6\xb8\xd0\x8c\xad|\xefJP7T\x1a\
-\xe3\x92\x1a;j\xc3\xc1\xa2#\x12=t\xe8\xd0\xc9\x93\
-'\xe3\x9fe\xc9\x09\xb2\x17$t\xb2\x92r2\xbeo\
-F\xe5\xa3\x18+(\xa6N\xb5&\x8d\x82\x22\x9e/\xbe\
-\xf8\xa2\xeb\xf8\xf1\x9e\x9e\x1e\x1eR\xb5;\xa40\xed\xa1\
-\xa8\xa1l\xd3\xa6\xd1&\x8f&<\x84\x1c[g\xf2\x03\
-\xd0\x5c3+:9T\xe9[b\x08\x97\x12Ip\x98\
-\x11Utuu\x11\xe5\xf4\xf5\xf5e\xef8Np&\
-\xcd\x9e=[gR{{\xbb\xce$\xe4\xc1\x0d\x83\x09\
-\x08\xea\x83\xc8L\xc3d\x83\xc4\xb2\xbcr\xc3\x8b<\xe1\
-{z\x99\xc1i\xfaHClZ\xd6E\x22k}\xb1\
-srZ\xc8:\x9f*\xc4@<U\x1e<xp\xd7\
-\xae]G\x8e\x1c!\x18\xb2\xb2&\x01<\xc6\xe8\x80\xb2\
-x\x0c\xe2HH^M\x91*RVuc$\x97\x02\
-m\xb2\x8b6\xe2\x9bi\xfa?s\xe6\xcc\x05\x0b\x16t\
-vv\xce\x9d;7\xf55@\xc1\x019\xb31K\xae\
-\xe1\xc1O\x86\xb2\xba\xc6C\xd0\xe8`\x0b\xcf!\x17/\
-^\xbcz\xf5\xaa\xde\x8c\xcac\xba\xba\x99Y{'\xcc\
-\x03u\x8e`.\x13\xfdcz\x90\x5c\xe0#\xa1l\xaa\
-\xb4\xc9\x14\x80\xf5\xc3\xca9~\xfc\xf8\x89\x13'\x08F\
-9\xd2\x90 \xb7\x81\xaf\x80$;=D\x91<fH\
-\x85\x92#\x1bA\x9fd\x00+\xa8FE\xc2D\x11r\
-c=\xa0\xc9a\xc6s\x02!Eoo\xaf\xff.\xff\
-\xc4@\xe7\x09@\xdb\xda\xda\xe6\xcf\x9fOT\xea\x9f\x7f\
-\xf2i\x10\xb4\x12\x12;\x03\xa4)\xa5\x93`fV\x1b\
-\x9b\xb5=+\x01\x17\xea\x1f\xb2\xb9je\x03\x0f\xb4\xb4\
-\xb4\xac\x5c\xb9r\xfd\xfa\xf5\x0b\x17.\xbc\xf7\xde\xe9V\
-\x10\x99 /\x0d\x9f\xba\xcc\xc7\xed<\xba\x9c;wn\
-\xf7\xee\xdd;w\xee<v\xec\xd8\xf5\xeb\xd7\xad\xacI\
-eJO\x9f>\x9d\x00K\xf1(\x83\xa2\xe9\x0a\xa4\x93\
-I\x9c7@\xb9B\x11\x066Ai\x09!+i\x14\
-0\x96\xc5>#\xa0\x1f\xd3K\xc2\x95\xd2\xc4\xd4j3\
-\xe3\xacp\x89\xaa\x88\x5c5\xdcN\xc8N\xc4\xa6\xaf\xb8\
-\xce\xea4(\xb8\x0b\xd7q\xf5i\xa6+\xf6\x86rc\
-\x5c\xed\x0d\xe3V\x88)\x0d\x9f1\x0eFS\xbd\xc1#\
-rJ\x8e<\xcf_\x89<`\xf9\xbb\x0c3>\x98\xaf\
-k.\xd2qLZb\x08z\xae]\xbbF$J\xe8\
-\xa3\x8f\xbb\x8d\xb2\xdb\xaa\x9e\x9aT\x22\x95\x1f\xe5\x8d&\
-\x80\xe0\x8c\xaa0KF\xa5L\xf3lbs\x05\xe5\x83\
-\xd8P\x0b\xba*Q\x04\xa5\xdc\x91\xe1\xf0\xc7\x83\x09\x83\
-\x9e\xb3\x9f\xce\x9a5K\x1f\x18\x0d\xa6Wu@\xd6\x81\
-\xd2\x12\xaa\xcfJxzH\xa4,b\x89\xfe\x91\xa4\xfc\
-\xe0\x04\x02\x1db\xf7\xc5\x8b\x17\x13\xc4O\x9b6\x18\xf1\
-\x8c\x89\x15j\xc7\x91\xd0\xfd/!O,\xdd\xdd\xddG\
-\x8f\x1e\xe5\xa9\x92\x07\x98\x09\x9e3eF\xa33w\xee\
-\x5c\x86f\xe6\xcc\x99\x1e]\xc5\xc8\xabE\xf2\xe0`C\
-\xf2\x18\x09\xe3\xa2\x5c\xb5\x86\x00\x0f\xc40\x8d\x95H,\
-\xcf\x0b\xd9eiJ8$\xd4\xe2a\xfb\xea\xd5\xabG\
-\x8e\x1c\xf9\xf2\xcb/IL\x8d\xe9\x8a\x1f\xd86\x17-\
-Z\xd4\xde\xde\xce\x94s!\xd7\xe0\xbf\xaaY\x91\xcdJ\
-\xa2\x84PQ\xfd$\xc3\x937\x16\x92\x83\xe5G\xc4\xb8\
-\xbc\x19M\xf5\xc9\xecvGT\xa4\xfa7\x17\xd7\xbaK\
-\xa8g\x14]'\xf1a@\xd9\x86\x80\xbd\x80\xb8\x87\x0d\
-\x82D\xfd=Ofw@YY\xed-x\x91+T\
-\x12&\x17\xaae\x99\xf2\x11w^i\xae\xbeG\xc7E\
-\x08S\xf2\x84\xa1Ls\xf3\xe3\x04>\xfc\xea\xab\xaf\xae\
-_\xbf\xceC\x82>\xc8\x1bt'\x14\x19\x22L\x94\x87\
-z\xab\x9e\x0f\x97T-\xb21\x12Z\x0fj\xf6\xa1\x0c\
-\xd0a\x96\x8f\x90CdB\xe8y\xd2yeE\x0dk\
-\xd0\xcf\x99E\x19_\x09\xa9\x81&\xcc\xc0\xc0@__\
-\xdfdM\x98\xd2BX@|\xb0z\xf5\xea%K\x96\
-\xcc\x993G/\xae\xf4\xeeJ\xae\x96Z\x18\xb1\x1c'\
-K\x1e#y\x5c1\x1eqI<\xddp\x84\x09\x95\x98\
-\xe6\x06\x92\x88\x1d\xe5\xa5\x22N;A1\xc73\x82,\
-\xc7\xcd\xe5\xcb\x97?\xfb\xec\xb3\xcf?\xff\xfc\xd2\xa5K\
-\xcc^+kd\xf0\x92~B\xd2\xd9\xd9ITJ\xd6\
-\x0a*.\xb2L\x85\xd8-\xa4\x82\x9f\x12L\x94%j\
-\xc1T#\xac \x90\xba\x97i\x8cnN\x8eK0:\
-,\xe4D\xb0|\x93\x88dl\xa3\x85\x17#a\xa3\xc0\
-\x96!,_=\xee\xba\xa6\xc8\x15f\x89\xd5\xe4\x16\x17\
-T\xb2\x09J\x04q\x19Q'\xd9\x5ct\x86)\x9be\
-\xd0\xb6\x02\x12\x9djK=MB\x9b\x97F\x81\x90\xe2\
-\xc4\x89\x13_|\xf1Eww7\x1bwP\x99\x04\xe8\
-\x95\xb0| L\xf0AL\x9a\xa1FQ=\xe0\x0d9\
-$u\xf7rBW\xfd\xc7stX\x9e\x81\x8c\xf3\x8c\
- 7L\x94\x11z\x22\x8b\x8a\x84\xb2\xdc\x8b\x13\x1d\xe2\
-U\xdc\x84\x11\x997o\xde\xda\xb5k\xb7n\xddJ<\
-\x1a\xde[\xdb\x0f\xa0\x1dS-\x00\xc7Z\xaa\x1a\x97{\
-\x0b\xc9xW\xf64I\x1a\x0e\xdc\xa5i\x1c\x1ccV\
-(\x0d\xca\x82\xe5+\xa4$\xd2\x11&\xaa\x16\xe2%f\
-)O\xdag\xcf\x9ee\x7f\xbb}\xfb\xb6\x15L\x09\xdc\
-^\xb9\xd1gE\x11R\x1e\x12kt\xa4\xd0\x07\x9e\x93\
-G\x13\xf4Ot0\xea\x06'\x89@\xc85Ic\x9e\
-a\x92i\xae\x05\x92h\xae\xf2 (\x82nc@\xcf\
--\x15\x8d\xbe0i\x1e\xa6\x91\x87i486\x90\xd1\
-\xe0\x22,\xb4\xae`\xc4\xe5\x10\xb0|@M\x81\xe4R\
-\x00\xd2\xec\x1a}}}\x07\x0e\x1c\xd8\xb3g\x0f\xfb\xf5\
-\x8d\x1b7\x82b)\x08\xce0\xdc'\xe0Eqb\x04\
-PQm\xe2\x04]\x95\xb0\xe2RB\x00:s\xe6\xcc\
-\x8e\x8e\x0e\xfd\x11\xc5T<jJ\xd1\x88\xa7\xd0\xa0\xd7\
-&WGB/\xa2}\xb9N\xd9&@h\xb5`\xc1\
-\x82\xcd\x9b7o\xdb\xb6m\xf9\xf2\xe5\x0c\x93\xbb+\x9b\
-\xc8%[\x9a\x0cj\xb5\x93\xd1A\xe2\xceO\x956\x0a\
-\x04O\xb3f\xcd\x9a3g\xce\x8c\xf05\x7f&\xad\x80\
-\x8dYW\x80\xe4\x8e$\xa9\xa2TZ\x10\x18\x11\x86\xea\
-\x83a&jp\x98\x00\xd7\xc3\x17{]\xbdz\x15\xd3\
-\xb4q\x01V\xb3'\x089\xc1QEKU\x1ce\x92\
-\xc8W\x22+\xa9\x1f\xea*8\xb6\xfc\xf0\x99\x947\xa3\
-9^h\x12Q\xe5\x1f\xcd6\xf0SYXq\x83P\
-\xfb\x0cK\x0c\xce\x9b\x12.W\xa2\xc2\xe0\x0ft\xb2p\
-\x8f\x06\xf2\x0fnaCa[\x81\xa2\xf1\xcd\x1ak\x1a\
-\x15L\x9a\x87+(!\xc8\xb2M\xf7\xf6\xf6\x9e\x0c\x0c\
-\x0c\x0cHX*\xe8\x92\x1c\xc2\xd5Iz\x1f\x90\x824\
-\x8bp\xb5\x14^J\x83\xfa\xc8\xac\xef\xe9**\x1bL\
-\x00\x22\x9e\xb6\xb6\xb6E\x8b\x16\x11\x8fr\x9c\xb3\xe9\xab\
-\xb7Y\xb7\x14\xe1\xb3\xc85\x91\xc4\xa84N\xc7\xe4\x0a\
-\x9b\xe0\x96{\xef\xbdw\xde\xbcy+W\xae\x5c\xb1b\
-\x05a\x96\xcec\xb9\xcbG\xc4\x13)\x5c\xd3\x09\x83\x93\
-SKr\xc8\xcd6\x04\xcca\x1e\xa5p\xd4\xd2\xa5K\
-[[[\xf5\x1d\x1a)\xf3\xebAU\xbc..\x90\x1f\
-\x94M\xa8\x14i,\x1a\xcbK\xf5\xe0\xab^\xd7`\xae\
-\x05\xa3JH\xe2\xa8\x96RA\x90 !(\xedB]\
-\x87$\xf6\xaa\xfb_}\x90p\x04LJ0J\xe7\xa7\
-\xda\xfc\x18S\xd2\xceI\xfc\x15a\xd2\x86\xa5\xce\xe9\xee\
-$\xab\xa4B\x98\xed\x96\xb6\xe2bJ\xee.\xfaFP\
-H,x)\xa0_i\xcf5\xad\x1ec\x1dW\x96\xf9\
-BYn\x07\xdc\x85{\xe9\xa6<g\x13\x8aI\xbf<\
-\x04\x1f$V\xd0g\xb6[z\xe8\x04k\x12\xa4Y'\
-\xe8'\xfbwe\xef\xd6\x1c\x22\xdd\xd7\xd7\x87\x13\xb8\xea\
-[\xdcM\xbbd\x04g$A\x0f\xb1NKK\x0b\x89\
-\xd4\x8e_\x8f7\xa4\xe3\xd7\x14A%\xc1\xd3\x12\xc7E\
-Mra,f\xcc\x98\xa1\xa1!\xde\x920x\xaf\x16\
-R\xabA\xac\x13\xa7yvb\xcd\xde\xbcy\x93\x85l\
-\xa2F\x80\xb8\x90\x00t\xf3\xe6\xcd\x8f>\xfa\xe8\xc6\x8d\
-\x1bI\xdfs\xcf=\x08)bn\xfb\xb56a\x1dd\
-\x94\x83?\x81\xd5\x8d\x5c\xe7\x03b\x963.*\xed\xa2\
-\x1e\x19\x18\xc7L[\xb5j\xd5\xe2\xc5\x8b\xe3\xb7\xcb\x98\
-/cIH\x92K\xf0\x9b9\xd0\xa9\xc8GBp|\
-rG\xae\xf8\x7f\xc8\x0e\xd4f\xa2\x83Q\xefkbD\
-\x05I\x9a8\x19\x9f\xe4<\xde\x05\xcf\x19&\x9a\xd2T\
-V\x8e\xfe5\xac,\xc25,_nX\xc0W\xaf^\
-\xdd\xbf\x7f\xff\xa7\x9f~\xaa\xef1\xd6\xee)\x13@j\
-5\x88u\xb2U\xe2\xb9A\x9a\xc6\xe1\xca\x95+\x87\x0e\
-\x1d\xfa\xe8\xa3\x8f\xf4m\x91\xbacy\x90\x09n\x8b\xec\
-\x09\xd3<!\xe4\xea\xc5\xeaT;\x01p;{7a\
-\xe8\xbe}\xfbv\xed\xdau\xe2\xc4\x89\x92\xff,\x0fW\
-p\xf0\xe8\xc3v\xca\x9as2\xc3\xed\x98(`\xa2\x80\
-\x22r'V\x88\xd3\x10\x92\xe1\x7f\xa5\x9a\xe4\xa1\xb1`\
-\x5c\xf4\x84\xe0#\x82\xc7pu\x16\xe41\xaa\xe2\xb5\x1c\
-\x17\x9a^\xd0d\xd2\xf6\xf6\xf62]\xbb\xba\xbazz\
-z\xca\xb6rk\x80-DQk\xd6\xac\xd9\xbau\xeb\
-\xd2\xa5Kg\xce\x9c\x99rW=\xc8\x09J(\xad\x84\
-P\x11\x04\xcf%\xcd\xba\xc3%\x9f\x1a0\xd3\xa6G\x7f\
-\xbf\xca\x8dM!\x9f8&M\xf4-\x11\x13+\xd4O\
-\xaa\x16Y9\xdc\xf2\xc3gB\x83\xd1\xc4+\x95\x1e+\
-\x1dcJw=\xe6\x8e\xea\x09\xe4\x13.w\xe65\x16\
-f^\x06+\x8e\xb0\x82P\xa4k\xec\x8a,\xc9\xba\x0c\
-\x1a\x96/=\x18E0JH\xf4\xde{\xef\xed\xdd\xbb\
-\x97\xf0\xc8\x7f^/\x85`\xec\xa09!kf\x0a\x97\
-{:&%${\xeb\xd6\xad\xb3g\xcfr\xbb?\xfc\
-\xe1\x0f_|\xf1\x05\xe1\xaf\xdf\xab<\xfc\x7f\x95\xb7\xdf\
-\xe15\x87^\x87\x1b\x92\x0b\xd3\x1e\x0a\x0c\x94\x8dT\xa1\
-\x05\xd2\x84\x9eD\xe1\x1c\xea\x1f|\xf0\xc1\xbb\xef\xbeK\
-\x02\xb7K\xb9\xb4(\xdc\x11\x92\xc8\x09@Z6\x0a\x95\
-*\xc1\xd57\xdb8!b!\xb8$\x12&G\x0b\xff\
-\x84&\x9b\xe4\xa3!\x88\x91\xef\x00O\x86\x07\xc0\xc1/\
-@\xf0\x84\xab\xa9JL,\x94\x0eP\x91\xc5{\xfe\xfc\
-y\x9e]y\x98\xbc|\xf9r\x03\xbd\x1c\xc5E\xf7\xdc\
-s\xcf\xacY\xb3ZZZf\xcc\x98Q\xf96V\xf3\
-\x9b\x1c\x98L\xe5\x80\x841\xe6\x82\x08\x09\xadB\xf5\x12\
-\xc0-8\x8a\x05N\xbc\xae\xbfJ\x8f\xebB3\x0d\x0f\
-\xd6\x0d\x0c\x0c0\x07\xf4\x99\xd1\xca\x5c\xa2\xc4\xb6JR\
-\x12\x06\xf54A\xd90Q\x05\x93\x06LT\x93\x94\x1a\
-\xb7V\x07\xea\xac\x9e\xcb\xc4\x05\xa3\xc1\xcc!0\xd5\xbb\
-\x0f\xd9\x9erB\x9c\x86d\xcdU~k\xc1Dw1\
-\xb9~0a\x90{\xa9'\xca\x09[\xe7\xc5\x8b\x17\x0f\
-\x1f>|\xec\xd81\xb6\x18\xb2\xf1\xd6\x19:\x9f\xf4\x9f\
-\xa1\xafd\x13b\xa3|V\x08\x93V6\x08\xb0|\xd8\
-\xa7n\xde\xbcy\xe6\xcc\x99\x83\x07\x0f\x1e9r\xa4\xaf\
-\xafo\xb2\xb6\xe9d*W0Q\x05\x17\x85B3\x81\
-PLT\x0a\x13\xcc\xe0\xcc\xf8\xe6\x0a\x1d\x8a\x08\x0e\xb4\
-\xa7\x7f\xf9\xe5\x97]]]\xa4'\xcb\x0f\xf5\xe3\x16\x05\
-\xe3,\x8d7\x94M\xa1RO8q)d\x15\x1c\x15\
-\x05\xf5B\x9d&\xb5\x91\xf7R\xc4r\xa9\xd5\xc0uH\
-0Ey\x88b\x8b8u\xea\x14S\xb7\x9c\x8f\x915\
-\xd0Z\xf6\x9f\xce\xc7}\x8f\x0d\xc9\x1a\x95\x92\xa4\xb2\xc9\
-\x1eQ\x81\xac\xbcD\xa4\xce\x16\xb7{\xf7n\xf6\xba\x92\
-\xff\xd0c\xb8`\x0bg\x04;\x18\x09\xfc\x89\xd5\xe1\x89\
-\x91\x9caz\x19T$\x9d\x18\x95\x82\xe5\x03&* \
-V\x90\xbe3\x9a\x07\xa4q\x09F\xe9\x93\xa5\xaaQw\
--\x93\x87\xa6\x14\xc8\xcb\xc2\xca\xa64\xb8\x85U\x94\xeb\
-\x1c\xf3B\xde\x99m\xa9\xc6!\x8c\x7fb\xa3,\x82$\
-\xd0\xa8\x8c\xb5t@Ya\xa2\xe1\xd8\xebw\xf1\xc6%\
-/-l\x97\xc4\x85<\xc7\x13\x15\xf9\xd6\xa9\xab\xe3\xd9\
-\xc4\xb6\xea\xa2:\xa1\x16;\x85>%I\xf8;\x89\x9f\
-\x16eD\x18\x17\xce$\xae\xcar\x95Q>X$ \
-\x0c\xe0 \x12\x82tj\xe3\x0d\x0aUW\x11`;\xae\
-\xe8\xed\xedm\xaco\xcdL\xc6\xbe2\xfa\xb2\xcb\x85B\
-ENV\x12;!N;\xa1\xd5\x04e\xe3F\xb3\xad\
-5a^)\xc0\x8a\xe7\xb3#\x1d\xc0u\xda\xe1\xe5C\
-+\x0e\xb8\xd0\x91\xdc2\x11\xa8\xb1?\xdc\xbau\xabA\
-\x03\xac\x8c\xb1\xa33\x01\x17U\xbc$w\xe1a`\x17\
-=z\xf4\xe8\xdbo\xbf\xfd\xee\xbb\xef\x9e<y\xb2\xfc\
-?\xf4\xa8\x1f\xcc\x9c5k\xd6\x82\x05\x0b\xe6\xcd\x9b7\
-c\xc6\x0cY\xed^%\x11$93GD\x9e\x1fD\
-\xc2\xd0\x80!yhj\x90T6\x85\xd7br*1\
-\x02\xc6%\x18\xad\xdd\xef\x14Y\x9b\x85\xe5\xef&4\x15\
-\xc0\xf2\x15\xcc#\xc1'\xba\x82\xd4\x92#\xba\x11\xe2\xad\
-,\xc1 \xb3H\x09GN\x00\xd2*\x05\x15\xd5\x89\xea\
-\xea*\x86\xdb\xc2\x04Cl\xc4\xa6\x09\x0a\x10\xe3\x9e;\
-\x89G\xf2\xe4 \x17\x01i\xa9\x81\x171C\xc8\x12\x89\
-\x12{uuu\x1d<x\xf0\xfc\xf9\xf3\x9cgR\x98\
-x\xe8\xcf\xcc\x993g\xcf\x9e\xed\xbf\x8b\xe3\xbd\x0d\x1d\
-7$Q\xffeZba\x05\x95:&\xcd\x1be+\
-\x08\x1f\xec\xf3\x88\x01?\xe3\x01\x1c\xee7j\x08\xd4[\
-\xb3'\xcf\xd8\xe0\xb9\x04\xa5%La\x95+.\x95\x10\
-\xe2t\x15\x95\x06\x0b\x15\xeeV\xf4-\x07\x1d\x1d\x1d-\
---Y\xe7 \xa9\x08\xc7\xc0o\xde~\x18\x8dF\x9a\
-\xb41\xea<\x904Q\x06\xd3\xa8`\xd2\xcc\xf4K2\
-\x99Rv9\x82\xd1\xb3g\xcf\xb2\xcb\x1d;v\xec\xda\
-\xb5kq\x0bS\x00\x05\xdcl_\x5c\xc9\xcaj\xaeJ\
-\x84\xb4ecT\xe4\xc8\xb1`\xf9@,Q\xc2*\x07\
-\x5c\xee:)\x8a\xe4\xf53.\xc1h\x11n\x92\xcc\x13\
-qV\xa5w!\x1ac\xa1\xac\xe4)\xccM\xd1\xf3%\
-i\x0eW?\xad\x1b\x88\x94\x8d\xde\x7f\x99\x16#\xf9p\
-Q]V\xec\x88[\x98`F\xd3\xd5dN\x14L\x00\
-\xed\x5c\xc0\xbe|\xfc\xf8\xf1\x0f?\xfcp\xe7\xce\x9dl\
-\xd6\xc4a\xa61\xb10W\x09C\xe7\xb5\xb7\xf3p\xaf\
-\xbf\x9d\x18\x06\xaa\x16\xaa\x982\xb0\x86\xc9*\xcab\xc5\
-\x0d87\x9c\x94!5\xc85\xad\xa8\xba\xcbS\xa5\xca\
-\x06o\x19\x927\x01\xa6n{{\xfb\xbau\xeb6m\
-\xda\xd4\xd9\xd99c\xc6\x0c\xe66B+\x0e\xe0\xc0 \
-\xb4\xcf\x99$;u\xf5^-\x97\x22q\x5c\xee\xde\xb6\
-\x82\x0a\x126\x1c\xea\xbc\x9c`\xa2\x0c\xb1\xd5NV\x92\
-B-\x93@\x93`\xf4\xfa\xf5\xebW\x02$\x14\xb1M\
-\x190\x87m\xbc\xab\xab\xab\xbb\xbb\xfb\xe6\xad[\xda\xc1\
-\xe4\x1fy N\x14!}'\xa5\xef\x0d\x0e\x8bd\x00\
-\xc2T\xf7?R:\x02&(\x18u\xf3R\x96\xcb\x06\
-\xb0|\xc5\x17`\xf9\xa9\x8eY\x1b0Q\x1e\xee\xa5\xac\
-\x9a\x175\x1c\xb5M\x1e+pN8\x02&\xf4\xb9k\
-\xc4\xd4\xf0\x89\x06\xda1\xe9P\xd0 \x1b4[\xf3\xc1\
-\x83\x07\xdf{\xef\xbd\xf7\xdf\x7f\xff\xf0\xe1\xc3\x93\xfbi\
-Q\x8e\xed\xd6\xb9s[[[\xfd\x97jk\xcf\x04\x95\
-\xd69[\xdc9J8*U#\xdcT\x92:\xdbl\
-8\xb0+\x05B\xf7\x83\x12B\xd9\x94P\xc4U\x80\x09\
-\xa3\xf71j\xad\xc9\xbd\xf7\xde\xbbx\xf1\xe2m\xdb\xb6\
-m\xdd\xba\x95\x04\xc70\x91VR \xafU\x08{\xcf\
- \x92p\x0dm$\x04\xad\xc1l\x0a\x15I'F\xa5\
-\x0dD<m\xc6p\x0a%\x93;\xa04{]\x7f\x7f\
-\x7foo\xaf\xbe)O:S\x06\xc6\x1d\xa3n\xde$\
-\x10\xbd\xc5jt\xc3S\xf3!L\x10$#\x9c$E\
-\xcd\xd6\x03\x8b\xc2R\xc3g\x12Nhy*\x8b\x15\xdf\
-}\xf8\xd8\xd7\x83\x94\xcde\x0d\x15fM\x0c)O\xba\
-\x8b\xee\xb9\xe7\x1e\xd2&\x9drhV\x80\xe5+\xfb\x08\
-\x92;w\xee\xf4\xf4\xf4\x1c9r\xe4\xddw\xdf}\xf3\
-\xcd7\xf7\xef\xdf_\x86/\x85\xe1\xd8f\xdb\xd2/\xd5\
-&\xaf\x8c\x86\xff\xa7;R\xf6\xa6\xa0\xb5\x1a\xa8.\xa0\
-\xa9k\x03\xe1\xdd\x95\x09)$/*\x05\x8a\xf0@R\
-\xbf\x82\x84 \xe7\x00\x83\xc25\x16r\xc6s\xbaC\x83\
-~Zq\xcc\xc1'\xd3\xa6M\x9b7o\xde\xf2\xe5\xcb\
-\x97.]:g\xce\x1c&sp\xb0\xfd\x02\xa5\xfc\x96\
-\x8b\x97\x86\x96\x8c\xac\xc4)\x927\x10n\x9d&\x0f\x13\
-,\x88s\x18\x96\xb1\xe6\xf0J\x9am\x8d\xc7\xec\xb3\x01\
-B\xd2\xa9\x17\x8c\xf2\x18\xbf`\xc1\x82U\xabV-\x5c\
-\xb8Pa\x9f\xcc\xd7\xd5\x9d,B2\xc7\x99Y\x0f\xab\
-\x22X\xbe\xda\xb1\x13\xc6D\xc71ft5.\x97\xce\
-]\x05V'\xb1\xd2P\x01evf\xc8cl\x88\xad\
-\xad\xad\xec\x89\xfa#\x81V\xd6 \xd0\x7f\xae\x9a\xf7\x10\
-\x0bG\x83\x9a\x0a\xeeI>>CFi\x90\xc2\x14C\
-\xde\x03\xcb\x07$!t\xb8z\xf5\xea\xe1\xc3\x87?\xfc\
-\xf0\xc3\xf7\xdf\x7f\xff\xc0\x81\x03\x97.]\x22\xb00\xa5\
-\xc9\x80Y\xca\x96\xda\xd2\xd2\xc2\x8ceD\xd4\xed\xda\xa3\
-#[<\xe1\xa8\xb4\x08\xb5)$Q-\xbd\xdek\xe0\
-\x97|\xc1\x0au\x1eLX\x8d\xe4RH\x91-M*\
-D\x98\xcb\x82\xd3T\xca\xbd\x06\x06\x06N\x9f>}\xe2\
-\xc4\x09}\xe1CP\xbc\xdb\xd1L\x9e;w.\x93\x99\
-H\x14I\xca\x9f\xe6\xc7<L#3\x0aq\x91\x90>\
-X\xbea\xc1]xI\xdf\x95K:\xd7(IR\xf2\
-\x5ca\x8c\x1c\xa8\xe7\xa5\xf3\xe7\xcf\xeb\xabB\xae\x5c\xb9\
-2\xe9\x8f\xdcc\x0b\x1e\x989s\xe6\xb2e\xcb6m\
-\xda\xc4#\xd0\xacY\xb3\xe4F\x8a\xe4\x01\xa9)-\xc8\
-I\x08hJYi%\x8a\x90rha\x18P\x85.\
-Yf\xf8\x8cW\xf8\xe2nr\xb2\x86\x05\x85\xc4\xe6\x90\
-Hp\x9d\xe1z\xa1\xd11/\x04\x94\x95<F>\x91\
-\x0e\x90\xc6\xc9\xfa&\xe1\x8d\x1b7vtt\xb0\xce\x83\
-by\xb1\xaeW\x90\x10\xbb\x84\xb2`\xc5\x15LZ\x8d\
-\x95Uce\x01\xcb\xd2n\xe5C\x93\xf1-\x1a\x94\x94\
-\x8dY\xa4\x10\x8cN\xbe\x95\xb0\xb7\xb7\xf7\xe8\xd1\xa3\x84\
-\xa1\x7f\xfc\xe3\x1f\xf7\xee\xdd[\x86\xef&d\x96\xf2p\
-\xcf\x96\xda\xde\xde\xce\xc3=\x1dN\xc6>`\x1ay\x98\
-F\x84\x15\x14\xe3:J\x84J\x89[Hs\xbd}\xfb\
-6\xfei\xb8\xb8J&\x80\x12\x5c\x11fgEbj\
-\xc5j\xd7wIP\x19\x1a5\x8b\x8bp\xd4\x85\x0b\x17\
-\xf6\xef\xdf\xff\xf9\xe7\x9fs\xd8O\xd6\xa7\x8d\xcb\x06\xfe\
-a\x07&\xc0\xf2w\xfcH\xe4\xb4,\xf2\x7f\x8c\x15D\
-\xa8\xae\x1aqT$\x8a*\x96\x1f\x02P\x02w\xe2'\
-E\xedLH\xaeu:\xc1\x855\xa0)v\xf8\xfe\xfe\
-~\x1e\x99\x08F\xd9\xf4\xfa\xfa\xfa\x1a\xd4WE\xe0\x04\
-\xdc\x98|\xe0~\xde<\xce}\xd22\x90\xab'|\xa5\
-W\xb0\x8a\x83\x0e\xac\xa4\xc3\xbf\x83^%\xcd\x04\xf69\
-\x0cV0\x0cF\x5c\xd1\x18\xdfwi\xf4l\xd0%\x15\
-\xe2\xeef{\x9eR\xbe{\x08\xe3h\x98(\x0f\x9f1\
-J\xfb\x9f\xb5X\xb2d\x89^5I\xad\xb4\x04\xfb\x12\
-,\x1f\xd0\xa0\x87\x99\x92@:\xab\xe3H!\x17\xd5\x12\
-d\xd1dqr\x9ar-y0\xaa\xae\x82\xd2.L\
-\xaeYI5*\x02Y\x0d\x08\xb1\x9a\xad\xf9\xd8\xb1c\
-;w\xee|\xf7\xddw\x09#.^\xbc8\x89\xbfA\
-\xef\xb0\x87\xb6\xb4\xb4\xb4\xb5\xb5\xb1\xab\xea5\x09\xddv\
-C\xc2\xd0U\xa1Z#Cm\xc6\x09\x1a\xc4\xc9\xd7\xaf\
-_\xef\xee\xee&\xaej\xb8\x9f\xe5\x05?\x19&\x1a\x07\
-\xbcq\x9c\xc3\xc2\xc1]\xf8\xea\x8b/\xbe`:5\xd6\
-\x1f\xfe\x19o\xb4\x1b+\xadA\x89\x91\xdc1i\xc0\xb3\
-*\x12\xa9\xac\xe6\xbfC)\x9eg\x09kC3\xa5F\
-\x80\x00t\xee\xdc\xb9\x9d\x9d\x9d<\x85\x12\x8f\xfa\x92\xb7\
-\xe2\x8cgdo\x0cR\x15\xd5\x00\xe7\xdc\xb8q\x83]\
-\xee\xcc\x993<uO\xd5Y\xea^\x029\xc7\x85\xcc\
-\x0a\xa1lPI\xaeJKY\xfb\xa9\xa5\x03A\x90H\
-r\xe5N\xae\xb0\x1a\x0b\x85-7|\xc61\x18\x1d\xaa\
-\xeb\x83nU\x02\x5c>d\xdd\xbb\x900\x19\x0ce\xd9\
-\x07y(omm\xed\xe8\xe8\xd0\xa3\x924K\x8b\xaf\
-\x130Qe\xf4\xe3\x22\xc74\x9c\x82Y\x81\x9eU\xa8\
-F\xa58\x8a4\xed+[N\xe8\x1e\xc7\xcc\xed\xdb\xb7\
-u\xd2\xc4\xfd\xc76K\x04T\x94EE\xaeCS\xc4\
-[\x9f~\xfa\xe9{\xef\xbd\xb7\x7f\xff\xfe\xf2\xfc\xbd\x16\
-\xba\xd1\xdb\xdbK\x7f\x08\x04904\x8d\x85&v.\
->\xe7\x95\x057\xb66\x89k\x22M\xd2t\xe0J\xf8\
-\x83\xa8\x07\x0e\x1ch\x94C\x0b\xc3c\xdb!\x95M\x11\
-\x97\x86\xaa\x83\xde\xd35N\xc8E1\x92\x0b\xcdLb\
-P\x8e\xf9\xbe\xbe\xbe2<\xcf\x94\x0a\xb9\x11\xa71\x91\
-@\x8bWE5\x08n\xae\xa5F\xb3\x0eY\x94\x99\xb7\
-,\x19\x86\x80\x90\x8bt\xed\xea\xe5\x81u\xcd\xc3\xe7\xea\
-\xd5\xab\xef\xbb\xef\xbe5k\xd6\xf0\x14\xca\x99\xc5QU\
-{\xbd;\xc1O\xf61\xdc,\xf2\x0f(\xcb\xe4\xe4\xc1\
-\x09J\xbe\xdb\x8f\x0c\xb9\x82\xa1\xcf=&\xe2t\x8c\x84\
-^\x1a\xbb+\x85\x8a\x84\x89\xea\xc0*T0\xe9\x88\x18\
-\xfb`4\x1c+9/{-\x9f\xe9\xae|\xd4d\x90\
-\x8a\x8bbw)\x0d\x9e\xc5\xc9,i\xe0\xb9\x13\xe4s\
-\x95\x96\x10F\x99\xf5\xa3\xc7z\x1f\xf1T\x87\x93\xe5R\
-!\xde\xd3\x07\xad\xd6?\x11h$j\x15M\xaf\xe2\xe0\
-'\x5cTf\xcf\x00\xddf\x7f\xb9t\xe9\xd2\xd9\xb3g\
-\x09\xd4\xf0R\xd6\x10\xc8\x15\xa6\xf0\x1d\x8a\x06/\x5c\xb8\
-@\xbcu\xf0\xe0\xc1\x92\xbc\x13u8-\x08ntf\
-\xa8\xb7\x92g\x87IE\xc8\xc1w\x15\x159\x12\x0a\x13\
-E\xa8\x85p\x93\x04\xee\xc8\x0c\xe4D?v\xec\x98~\
-\x96\x87D\x9aeF+=\xd9X\x03\xb2T&\x83t\
-\x84\xd9\x19\xb9\x14\xacZ@\x92\x14\xa9\x8a\x96\xaa\xa4o\
-\xdd\xba\xc5`\xdd\xbcy\xb3!\x02\xf7\x09\x03\xbf\xb9K\
-\x95\x15\xa4\xe5:\x09\x95\xc8Ej^+\xc6\x8b\x94f\
-\xfd\xf2\xe0t\xe4\xc8\x91\xc3\x87\x0f\xb3\xaeY\xdd~\x8b\
-\x92\x83\x7f\x08@7n\xdc\xb8c\xc7\x0eB\xd2!_\
-\x9a\xc4v)\xcd5\x16\xba\xbbb\xa1t\x98\x9f\x1e\xa5\
-Y\xc1\xd4\x02\xbb\xb0Nf*\x0d\xc8\xe5\x10%\x1cI\
- \xe5\x0d+\xaeF\xf2\xa2R\x08U\xf3\xa1\xb4\xb2\x0a\
-j\xa9\x0d\xc9\x18\x07\xa3\xcc\xb3i\x01:\x87\x0b \x18\
-2\x88\xe95\x19\x1d\xb13\x95\x06e\xcb\x09k\x86\xc3\
-l`` \xdeF\x95\x18U\xe7\xa7\xca\xa6\xc3a\x7f\
-\xe2\xc4\x89}\xfb\xf6uuu\x91\xd6\xc2A\xee\xce\x91\
-\xaf\xb8*\x11\xe3E\x5cQ\xc6\xd5\x1c]\xb8\x9a\xe8\x96\
-s\x8bx\x8b\x9d+(N><5q2-\x0f\xb4\
-\xb6\xb6j\x97\xb0\xb2j\x1bSH!F\x9e\x01O\xc7\
-B\x08Z\x09qu\xee\xc8\x95\xe8\xaa\xbf\xbf_\xd1\xb0\
-\xe4%\x87}U\x1fL\x94])\x03!\x96\xb8\xc7$\
-\x04\xa5\xfd\x0a\xae\x93%.\x22\xc1\xe4a.1\x8bX\
-\xbf.o\x02\xcc%=!\x04\x1f'\x90v\xc8\x9a^\
-\x85\xac\xa46x[\xf3\x93\xab\x7f\xe4\xe6\x93O>9\
-}\xfa4\x13X:\xe5\x07\xabg\xcc\x98\xd1\xd1\xd1\xb1\
-x\xf1\xe2\xb9s\xe7z$\x1a\xcf\xa5\x1a\x9e\xc9\x9dr\
-)!Y\xc1\xbe\x07\xc4j\xa4\xadlj\xa19\x86\x0f\
-\xc1\x9d&\xdb\xc9J\xe2\xf2\x98\x94C\xa4\xecH(\x9d\
-\xd0X\x82\x84uR\xd1\xb7\x19;2\xc62\x18\xc5*\
-vL&\x1cO?$d\xa7cJM\xc6\x8e\x06r\
-,G\x1a\xfbi\xd1\xd7\xbf\xc9\x10\xb0|eE\x0dw\
-I\x88TS\x0d\x01\xa7\xcb\xf9\xf0\xa7\xd29i\x12\x17\
-\x05\xc3SV\xd4\xe9\x0d\x5c\xdd\xd3\xd3s\xfc\xf8\xf1\xc3\
-\x87\x0f\x9f;w.\xd7\xe1\x93\x05\xc7\xd2\xd2\xa5K\x1f\
-x\xe0\x81\x1d;vtvv\xb2KH\xeeC\x16\xdb\
-\x98MK\xcdQQ\xfdX\xb5\xca\xc76\xea\xf4g\x19\
-\xe0\xec\xc1W\x9cC\x96\xaf\x80-\xba*\x01)\xa3T\
-\x04JK\x985\xdcu\xe2\xb4\xbct\xed\xda5f\x11\
-\xd3\x92\xc5[\x9e\xa7\x9aI\x87\x11\x99={\xb6\xbe+\
-7\xf5\x83)9\x10\x94\xad\x81\xebH\xdf\x91\x104\x04\
-\x04X8\x9f\x15\xfd\xf9\xe7\x9f\x1f9r\xa4\xb1>\xb6\
-\x8b98\x07\x17\xe9\x15\x15\x12\x8c\x02\x95:\xb1\xd5\xf5\
-\xe0-\xa8}@\x82[\xf0Uy\xb6\xbb\xb1%\x99\x19\
-\xe1w\x98p&W\x97\xa84vi,\x8f\x91<\xc6\
-\x0a*\xc4\x8dDiS\x16&\xcb\x83*\xa3\xd9\x22\xc6\
-2\x18\xc5A,N\x0e\x9b\x85\x0b\x17\xeao\xabx\xd7\
-\xe9\xa5PVV\x81\xb2M\x86\xc4\xdc\x17\x90\xa4\x81\xbc\
-G\x9f\xb5\x9f^\xb8p\x81\x9d\xf4\xf6\xed\xdbq(\xa0\
-\x99\x00\xa9\xf4\x98@K\xd6b\xe9\xddE<\xda\xd7\xd7\
-G\xc8\x8e\xaf8\x82LZ\x8d;-\xc6M\xa3\x94\xbd\
-\xe0\xfa\xf5\xeb'O\x9e\xdc\xb9s\xe7G\x1f}\xd4\xd5\
-\xd5E0\x9a[k\xe2\xa1\x9f\x1cH\xed\xed\xed\xcb\xc3\
-W3\xf2\xd4\xaa\xf3\x099=\x8c\xa7\x04\x09OgI\
-\xc623\x9a\xa9\xba\x90\xd2A\xc2-8\xae \xbeW\
-C\x10\x9f@N\xca\xc0\xe0\x95\x9cI.9\x90\x0e\x8e\
-\xa9\xe5XK\x05\xd0d*^\xbati\x7f\x80\xc5K\
-\xd6\xca\xeenp\x14\x91(sx\xd5\xaaU\xccg\xa6\
-qpp\x82iT&d\xca\xdb\xa6T\xc1\x85J8\
-q\xa9f,\xab\xf8\xf2\xe5\xcb\x17/^\xe4\xd9\xa0q\
-\x1f\x09\x145Bl\xa0#!X>\x90\xca\x82\xbb\x94\
-\x84PZ\x8ej\xb8\xa5]?\xd8\xa5\x1d\x8c\x09\xc0\x15\
-\x89\xbb+\xf1B (\x1a^\x9aJ\xd7\xc6\x1a\xaaj\
-\xaa*\x9bm\xc7KIp\xb8+=\x02\xc62\x18\xe5\
-\xd9\xbd\xa3\xa3\x83\xf5\xb9d\xc9\x12\xd6\xaa\xb6\xce\xc4\x8e\
-):9&\x9d:\xa7\xd7\xa4\xc3\x04 \xd2b3=\
-{\xf6,g\xdb\xcd\x9b7YTVV\x93!\x0d\xac\
-\xa1\xd0(\xce\xa9\x81\xd6\x0eX>\x036\xc6\xe0U\xc2\
-\x05\x82\xd13g\xce\xec\xdd\xbb\xb7\x0c\xdf*\x9a\x82N\
-rr\xf3\xa4:#\xfc\xedD3\xaf\x82)\x15\x13\xeb\
-\xd0\x14WI\xfc\x1a'@j\xd2ty6]rp\
-\x14\xdb)\xb1\xbb\xff&\xb2\x15\x04b\x03AY\xb0|\
-\xe4\x0d\x91\x92H'FB\xe6\x12\xb0T\xcf\x9f?\x7f\
-\xe8\xd0\xa1#G\x8e\x5c\xbdzUG`\x13F\xa4\xad\
-\xadm\xed\xda\xb5\x1b6lX\xb8p!S\xda\x0a*\
-d\x1d\x1b\x8fHL\x91<\x86\x81`\x15s\xcc\xb3\xba\
-\x1bq\x08\x8a\xa6\x99\xb0|1a:Wy)U\x0b\
-\xff\xe0\x19\x9e\xe4\x09\xd6\xaf\x5c\xb9\xc2YSO\xb3\x8d\
-\x08\xd3\xa0\xb7\xb7\x173\xb9\xc6O\x865f\x91\xbc\x07\
-J\xf3\xbf\xe4\x90\xf2R6\xeb(+ym\x18\x0bK\
-\x0d\x9f\xb1\x0cFyvomm]\xbcx\xf1\x82\x05\
-\x0b8ld\x7f\x931'L\xad\x04\xa5%,9\xac\
-\xa2\x9e\x9e\x9es\xe7\xce\xb1Y\xc4\xc1\xa8\x1b\x92\x9d\xeb\
-\x92\xeb\x9a%\xd43\x05\x11\x0bE\x9c.?\xc4\x19\x9c\
-j,\x22u\x1b\x17\x85}\xa0j#\x08\xf6\xa5\x91\x9c\
-+j\xf8\xf9\xda\xb5k\x04\x10\x80\xc3K\xf8*\x8b\xae\
-b\xa9\xde\x8e\x90\x0d&&\xd6)\x9bE\x0a\x22\x9b\x8d\
-%J\xbb\xdf\x94\x90\x8e\x88o\xe1\x1d(9t\x92\xd8\
-\xbd\xb3\xb3s\xf5\xea\xd5\xf3\xe7\xcf\xf7w\xc9q\xe7e\
-\xa6LU\x91\x08\x82AL-\x83JS\xfax\x8f\xb8\
-\x87s\x9d\x18\xb4\xbb\xbb[?\xd0\xb0\xb2\xbb\x1e|\xc5\
-\x01\xc71\xc7a7'\xfc\xed%\x84x2\xb5f\x95\
-p\xb2#R\x83d\xfc\x02\xa4i\x87\x96Y\xda\x0d\xfa\
-0\x902\x84\xab\xb2\x22\xeb\xa5\x14VP\x0d\xb5\x1c\xda\
-\xbcq\xe3\xc6\xe9\xd3\xa7y\x02\xe7\xc1i\xea}\xdd\xbd\
-\xc0\xd2\xeb\xd7\xaf\x9f={\xf6\x8b/\xbe8u\xea\x94\
->\x7f\x85\x90\xa2\xd8Q\xc1%\x09\xcaz\x91+\x80i\
-T0iF\x9eEjqSN\xb8\xcf\xff\xa7\xb50\
-2\xc62\x18e\x97d\xdf\xe4\x09^\xdf \x88\xc4{\
-\x0f\xb9\x06@ld\x93\xa9\x0aCL\x0c\xca\x91F\xa8\
-D\x844\xe4\xa0k\xb6\x14\xcd\x19'\x99\xfe\x15\x9d\x94\
-\xb2\xdaO\x09K\x0b\xfdd\xed\xe8\xdb7\x89\xd5b\xe7\
-\x04W%X\xbe\x82L\xe3\xaa\x04\xb07\xf5\x87\xaf}\
->y\xf2\xe4\xe5\xcb\x97K\x18=\xd0Uv\x898\x9c\
-\xc2.\xba\xad\xd2\xdad\x9d \x09x\xd6\x13\x9e\x06\xdd\
-+\xbei\x03A\x87\xd9QW\xae\x5c\xb9~\xfd\xfa\x85\
-\x0b\x17\xea\x8d\xb2\x95U\xe6\x00$\xf6f~[\x14T\
-\xea\xc83\x8eI\xab\xf1\x22\xae\x1c\xea,[\x8e\xbd)\
-y\xba\x8f\x06\x16\xe9\xf4\xe9\xd3\x19\x0e\x8fD\xddiY\
-B\x8d\x1c|\x804X\x0e\x12\xaf%\x89\xda\x01\x09\x1b\
-\x0b-\xbd\xd4\xaa\x8fm\xc9\xda%5\xbf\x8aP\x92\x86\
-\xddC\xafE\xd9\xf4\xf6\xed\xdb7%\xbf\xee\xde\xc1R\
-6\xf6\xae\xae.\xffe\x000\xef\x04\xa4&\xf3\xdd\x09\
-q\x11\xd2\xca\xbf\x09J\x17\xe1:)\xcdT\xd6a\x88\
-\xfd\xd7\x00F\xc0X\x06\xa3\x18\xac\xb7;\x5c\x07\x8d\xcf\
-#\xd8h(\x8bO=+\x89\x12w\x09\xb1\xed\xee\xb8\
-X\x08\xca\x0a\xcdB\x12V\xd6\x08p\x9e\x11\x1e\x01=\
-\x97dHC\x5c\x01H\x0fR\xed\x8dD3HT\x0b\
-H\xab\x96\xd2BE\xe5\x845\xac?:\xbch\xd1\xa2\
-\xda?Up[\xdc\x22\x12X\xca>E\xa0\x7f\xe2\xc4\
-\x89\xcf>\xfb\x8cM\xf9\xc2\x85\x0b_\x95\xec\xb3e\x18\
-\xc5\xc9\xad\xb7\xbf\x1eQ\x05k\x12\x94\x15\xb5w\x8f\xda\
-P\xd71QE\xc8M\x05\xe9\xecM\xcb\x09]en\
-\xb4\xb7\xb73=\xf4\x12N\xfdW)\xe3\xee\x86pU\
-VE)\x82V\x15VPq\x0e\x09\x84q\x83\x08\xc9\
-\xb2lk4{\xd7\xc2(0\x16\x9ct\xa4S\xce\x09\
-\xfeK\xa3\x22\xf99\x8bt\xf0\xb3@\x12k&\xc3S\
-P\xb1\xfc\xe0(\x96\xbc\xa2v\xac\x90\x99\x5c\xb1\xca4\
-\x02\x89\xa4\x92\x10\xca\xe6\x22\x87\x00i49S\x08@\
-\xbb\x03S\xfb\xd7\xec0\x16\xebx>\xbcu\xeb\x96\x9e\
-\x0fq\xaf\x8a\xf0Fp[\x8e\xdf\x10\xa9\x08L\x14\x90\
-\x03S\x03a\xc2\x0aqV-h\xf8\x1c+\x0b\xa5\x5c\
-\xb5\x22F\xc6X\x06\xa3@\xd7A\xdb%\x984\x90\x92\
-\xc8\x12G\x12\xadC/M\xb50%\x89\xadvdx\
-\x91\xf9r\x0eX\xbeq\xf0n'S!3=,\x15\
-\x90&X>%\xa9\xb6=\xc9d\xbc\xa1[\x08\x13\x95\
-\x98\x993g.Y\xb2d\xdd\xbau\x5cI\xb3q[\
-A\xc0\xcc(\x9e\x0f\xfa\xe9\xfc\xf1\xe3\xc7w\xed\xda\xf5\
-\xe1\x87\x1f\x1e:t\xa8\x84\x9f\xf0c\x9f\xd2\xdf^\xd2\
-g\x1f%d\xaf\xf0\xfd4\x17\xb3<\x83\x15GXA\
-%\xe8\x94Ps\x06\x94\x05)H\xd3D\xe5\x86\xde2\
-\x1f\xfc!?\xb6\xc5M\x8b\x85 \xeb\x1c\x93\xe6\x91\xab\
-\xa0f\xc1\xf2M\xaa\xc1ca\x8a\x0d>\x15\x04/&\
-\xe9!\x9d\x16WQ\x02\x86\xf4\xf6\x90\x0a\xe5DK\x9e\
-\xe7\xa8\xf9\xf3\xe7\xb3\xadi\x02\xabh\xd0\xf8\x0a\xb1\x8d\
-Jx6&\xf6\x1b\xb0\xcb\xf5\xf7\xf7\x9f?\x7f\xfe\xec\
-\xd9\xb3\xe5\xfc`\xd2\x18\x82\xed<\x9a\xe2R\xfda\xd5\
-\x94+\x1c\x93{i\x81\x1b\x0d\x13$('q\x0a)\
-\xd4\x1e\x11J\xb3\xc1L\xfd\x8cq0*\xd4c\xd9\xe0\
-\xa8H\xa0\x10\xe3\x12%\xb8f\xabLabKI\xbb\
-+\x94U\x02\xa6\x80C\xb0\xcb\x1e\x8b+YO\x03\x06\
-\xcaF\xc9\x1d\x95\xd6 \xf6\x8b\xf4iG\xa7\x85WW\
-\xcb\xe5\x84\xbe\xe9\xedWgg\xa7\xff\xc5\xf6l\x87\xdd\
-4/B\x82?\x81\x07e\xf6\xe2\xdd\xbbw\xbf\xf3\xce\
-;\xe5\xf9\xcb\x9f1\xf4y\xce\x9c9\xcb\x97/_\xbb\
-vmGG\x87\xdb\xe8\x98^1\xa6\x170\xd1]\x83\
-L\x8e\xd7\x02\xe98\x9bE\x0a\xc2D\x05\xa4\x14\xbc\x0a\
-\xd7\xbb\xd3\xdbC\xc2\xc6\xc2\xb3\x01s8\x1b\x10\xd4\xe3\
-\xae\xe0\xd4A5y;&\x8c@\x02i4Y\xe0<\
-m\x02\x09\x09\x1b\x02\xbc\xd4\xda\xda\xca\x03\xb6\xfe\xf6\xd2\
-\xdc\xb9sqW\xd8\x95\xedQ\x10L5bX\x06\xa2\
-\xcc\xd6w\xee\xdc\xb9\xfd\xfb\xf7\xeb\xaf{\xe0%+\x9b\
-\x8a\xe0\xb1\xd9\xb3g/[\xb6l\xd1\xa2E\x04\xf7r\
-\xa0\xae\xb8\x82\x84|\x1btk}\x01=:1.\xcc\
-\x16\xc5H-&\x11Fr\xfap\xf3\xe6M\xcb\x0c\x9f\
-1\x0eF\xeb\x99I\xd2\xe1\xeaH\x1e\xa3)\x0b\xb9.\
-\x98J\x84Q\xae\x1aN\xf0M\xc7K\xfd\x1ag\x1b\x0b\
-7\x8dgY\x11\x9b)\x9d\xfaQk\x96\xc9\xb4\xa0,\
-\x0a\x8d\xb2}3\xd5g\xcc\x98\xc1\xfe\xc2\x09\xe7o\x0d\
-}\xac\x95\xc8\x12|\x90\xa0\x1dy\xdf\xbe}\x07\x0e\x1c\
-\xe8\xee\xee&k\x1a\xa5\x01\xa3\xda\xda\xda8\x996l\
-\xd8\xb0`\xc1\x02\xcc\xc4d\x15\xc9@'%\xf4\xac\x12\
-\xf5 \x9fX\xa6\x82$j\x87Y!BI\xc3 \xbb\
-\x84\x89*\x04W\x19&\xca\xe8[q@\x0a5\x90\x8e\
-*z\x0bM\x80yK@\xc0\x03\x95\xde\xf6)\xc0R\
-Q\xec[\xa5\x85$\xc3B>g\x8a\x12]]\xbbv\
-\xed\xc2\x85\x0b\x97/_\xe6\xa4o\xa0\x81 ^\xe7\xe9\
-\xfa\xa1\x87\x1ez\xfc\xf1\xc7\xd7\xaf_O`*_\xa5\
-\x1c\x22K\x1dI\xe2\xab\x93hW\x83\x90\xa7nb\xd0\
-/\xbe\xf8\xe2\xf8\xf1\xe3\xbd\xbd\xbd\x0d\xb7\xa8\x87\x05\xae\
-c\xe7\xc4\x93---\xb8\xd7=)\xff$S-B\
-\xfaR\xa8\x8d\xab\x85z\xf5V\x91\xa6\xdd&\xa4\xe9\xc3\
-\x8d\x1b7\x92\xe2\x111\xf6oF\x99\x0d\xf4Iiu\
-\x11\x82\xaf\xd2\x93I\xc2\x18+\x08G\x17N\x07?\x98\
-\xa76\xb5\x1d\xe5\xa51\xb9\xc2\xd2\x82QL\x0c6\x0e\
-\xfd>\x04\x0973ko.C\xda+\x05\xae\x908\
-1\x80\xc4\x22\xdfr\xffY\x0eu[;5W\xdf\xb2\
-u\xcd\x22\xeb\x04\x8e\xc5\xabW\xaf^\xf5\xafq5\xa5\
-2\x81!\xb3f\xcd\x22\x0c\xe5\x99\x9e\x9d\xd4\xad\x13\xd2\
-\x11)I*;\x1ap\x94|500\xa0\x0f]\x91\
-\xb5\xb2\x06\x81\xe1\xb6T\x069J\x98\xa8\x1a\xe4>\xb5\
-\x1c+\xab\xdey\xbc\x08\x89\x5c\x14k\xde\xcd\xe0\x07\x22\
-\xd1\xd5\xabWo\xdd\xbau\xe5\xca\x95z\xdb\xe7\xce\xc1\
-}\xee\xc31\x81\xd6\xae_\xbf~\xea\xd4\xa9\xcf?\xff\
-\x9cx\x8b5\xde(o\xfe\xf0\x09\xc77\xf1\xfa\xda\x00\
-\x09\xb2\xa9Y\x94\xeb+\x09\xb9\x0a\x09\xb3\xa8)\x14\x98\
-\x9f\x1c(\x84\xa1\x84\xecS\xfb\xb5(`/\xc6\x12|\
-k\x9f\xc7\xf6\xe0\xa4*/\xe1\x19G\x12\xe9\x14!\x9d\
-X_i!\x89c\xd2 \x1fLD\xb7\x18\xcd\x8e:\
-^?\xa6w\x94ua(O\x83\x5cn\x95yl\x97\
-L\xdc\xb6\xb66\x8e.\x1e\x02x\x020\xbd)\x8d\xc6\
-\xd5\x91O\xe4\x16I\xe4\x1c!Ic\xc1\xd9\xcf~q\
-\xfa\xf4\xe9\xae\xae.\x96\x13\xd1\x80\x9b\xe6\x89,fp\
-\x81\xc9\xb9\x15\x11\x02\xae#M\xd4{\xf9\xf2\xe5\xee\xee\
-nnM\x07\xa4PN\x98\xf6\xfe\x99\xaa\x5c\xbbD\xca\
-\x15\x18\xd5\xd7\xd7\xc7qu\xfc\xf8q\x82\xd12\xbf;\
-\xd1\xba\x0673\x19\xd7js\x5c\xa2\x04H>&p\
-V\xe9\xb7n\x8f\x1e=\xca\x0c\x8c\x7f\x97\xae\x81\xa8\xe1\
-\x93!\xdd\x15<Z\x85\x15DH\xc8\xbc\x02\x5c\xc4\x0a\
-\x22Q\xdaI5\xc10\x879\x98\xb6l\xd9\xb2c\xc7\
-\x0e\x82Q}\xf7\x85\x8abg\x06\xd7Va\x05\xc3\xf1\
-\x88\xcb\xde\x00\x00iPIDAT\x04\xcf\xb3q\xb1\
-a\xee\xdd\xbb\x97\x05N\xbaQf,&\x13\xa6O\x9f\
->\x9d'O\xbcDZrM$w\x88\xb2\x5c\x1d\xcf\
-f\xe5\x8eWW\x02\x9f\xe0\xa8F\x5c\xcb\xc3\x05\x1b\x99\
-\x03\xcc\x04\x8e\xd1\xfe\xfe~\x99\xec\xfe!\xabt\x8aP\
-\xb5\x10S\x0a\xe0O\xf7-\x98\xb4\x82J\x1dS\xaa\x1e\
-\xaf\xd1\x8c\xc2\xb8\x04\xa3\xa0\xce9\xa1\xb7\x86\x89\x22$\
-t\xf3X\xde3f\xccX\xbcx\xf1\xc6\x8d\x1b7m\
-\xda\xb4p\xe1B\x9f\xcaw\x09r\x14hz\xa5\x068\
-5\x15\x1a\x05\xac\xe0yn\xdf\xbe}\xfa\x0d\x1b\xd2\xec\
- V\x16!\xeb\x1c\x93F\xc83BY\xc9\xc1\xea\x84\
-Z\xdc\x8e\xa3\x94Ht\xff\xfe\xfd\x9f}\xf6\xd9\xb9s\
-\xe78V\xa5VB\xe8\xb3^Y\x91\xd6\xa0;R\x80\
-`Y\x95C\xd0\xe4A\xf9\xc4\x89\x13;w\xee\xfc\xf8\
-\xe3\x8f\x09I\xcb\x1c\x8cf\xfb/R\x1d\x1e\xa7\xfe3\
-\xd9p\xce\x993gv\xef\xde\xfd\xd1G\x1f\xe1\xb4\x12\
-~\x98\xa16\xcc\x10 Q\xe4I\xa8Q\xe4\xa0\xe0\x93\
-M\xd7\xec\x100\xb5p\xd7\xa5K\x97\x88\xda\x1b\xe8\x8f\
-\xf8\x8f7\xb8\x8b\xe8j\xc9\x92%+V\xac\x987o\
-\xde\xb4\xea\xaf}\x1d\xc2\xefy\xe0ja\xf9\x80$\xf8\
-\x9c-\x8b\x98\x83\x87\xcc\xd2~mp\x0d\xf0\x09G\xb9\
-\xd0\xbc\xcd%k\xbb\xa5\x8a\xa8\xcc[\x87lpXB\
-\xd0\x98\xca\xb0k]\xb9r\xe5\xea\xd5\xab,O?)\
-\xac,\xf2\x83c\x05y\x98F\xa6\xba\x5c:\x02\xa8\x9b\
-{\xa6\xd7\xc9\xb8\xbf\x19Ma\x1a\x01\xcd$\x07\x89\x14\
-H\x13\x8cvvv>\xf8\xe0\x83O<\xf1\xc4\xfa\xf5\
-\xeby\xb4\x0a5\xa6,\xee\x01G\xee\x82x\xc2\xc5j\
-)\xfd\x86\x80S\xed\xd8\xb1cD\x03\x04\xa3z5%\
-\xbb\x84[\xa7\x84\xa3\xd2\x1a\xc4\x8d8T\xa4\xfd\xee\xee\
-\xee\xbd{\xf7~\xfe\xf9\xe7$\xc8ZY\xf9\x08#\x9c\
-c\x05x\x11WM\x06\xd2XG\x82\x95\xdf\xd7\xd7\xa7\
-_\xa2\xc7L\x0e\xad\xd2\xda\xa8qT\xe7AG8Y\
-\x03\x11\xf9\x82_\x15\x1f1\xa1\xc9\x04\xfc\xf6\xd5W_\
-q\xae\xcbW\xcc\x07N\xf7\xc6:\xda\xc1\x8c\x89v\x00\
-O;\xee\xb1\x1a\xa5*\x12\xca\x86\xc2APcj\xf5\
-\xf6\xf6\x1e=z\xf4\xc8\x91#e\xfb;^\x93\x08\xbe\
-\x22\xb4\xe2x\x9a5k\x96>\xb4'\xac\xb8\x9a\x1aE\
-Y|\xe0<\xc1\xa4e\x14\x98\xa5<p\x12y\x8c\xe6\
-\x98\x9f,0?\xb5\xd2\xad\xa0\xa6s\xa4\xe6\xca\xa1\x9e\
-!\x89*rE\xc2\x8eG|\x86\x97p\x97J\xa7<\
-\xda\xcd\xb8\x0ay\x06\xe4\x16\xcb\x04\x94\x0d\x95j!e\
-\xd7\x8b\x92\x85\xa8F\x0a+\x1b)\xe3\xf5f\x14\xac\x83\
-\x05]Lfbe.*-\x94\xbd\xe7\x9e{\xe6\xcc\
-\x99\xb3r\xe5\xca\xcd\x9b7\xeb\xa7!*\x9a\xda\xb8\xf9\
-\xfe\xde\x22\x17\x8aj\x94\x96\x19V\xce\xb5k\xd7\xce\x9c\
-9s\xf2\xe4I\xfd\xdd6$*r\x8bd]\x16\x95\
-\x16\x91\x9af\xe8#a\xc5\xf2\x04y\xfa\xf4i\x22\x0f\
-\xe2\xe0\xa2\xa9X\x12\x92\xa5\x12H\xd9k\xd2\x80gI\
-\xe0:\x0c\x1c\x18\x18\xc0:\x5cz\xf9\xf2\xe52\xbf\xea\
-\xc3\x22f\xb5&\xb6[\xe7\xb6\x90\xe7?\xa5]\x1e#\
-\xb9He\xb3\xe8\x16\xa0\xb4\x84\x9c\xe5\xcc\x01\xe2\xf5S\
-\xa7Nqm\xa0\xd7\xa2n\x82\x5c\x11\xa3R\x11+\x04\
-\xf5\x04+\x0b\x98(`\xa2\x80\x89*P\x9d\xa9\xc5\x19\
-\xcf\xbc:p\xe0\xc0\xc1\x83\x07YD\x0d\x17\xb8\x8f\x1f\
-\xcca\xbd\xeas\xef\xc5>t!\xa4\xc6\xc2\x91\x5cx\
-VE\x22\x96\x90`\x997b$\x0a2$\xc6\x0a\xf2\
-\xac\xae\x81\xbc\x0a\xca\xaa\x22\xb3T/\xefY\xcel\x83\
-\xb8\xa8\xfe\x06\x1b\x1a\xfc\xc0\xf4\xb3L\x04\xe6\xe3\x13'\
-\xf1op\x88\x12\x10\xa7\xb3\xc4e\xa1\xbd|L#\xc2\
-\x0a\x02>F#`\x5c\x82\xd1x\xd2\x08\x09]\x9e\x1c\
-J\x95x+\xe58\xa9\x01\x0a\xd3\xa7O\x9f;wn\
-KK\x0b\x09\xd6\x7f\xa8:eIy\x09\xf3\xb5\xe5A\
-(7g*-\xa4\xd9X`\x02\x1b\x07\xdb\xc7\xb9s\
-\xe7\xfb\xfa\xfa\xd8g\xb1\xc2m\xacA\xca\xd8\xc4M\xd5\
-\x92\xd89\xa4\x99T4~\xe3\xc6\x0dn\xc7Q\x9ar\
-]\x09\xa1\x871.\xd4\xd5\xd7HX.\x09l\xbeD\
-T\xfd\xfd\xfd\xbd\xbd\xbd\x5c1VU\xca\x09\x83\xa5\xbf\
-X\xa3\x9fl\xbaP\x90\xc64\x09\x85\x8c\x8d\xb1\x82j\
-\xbcz.\x14Q\x91\xab\xeeH\x80E<\x0a%\xf7U\
-\x0a\xfa\xaf\xad\x00[|\xe8\x81D\xae[\x5c\x98\xb8&\
-\xa0l\x0d\xa4\xc6-\x80\x04-3\xb5\xce\x9d;\xf7\xe5\
-\x97_\x12\xbb\xe31\xd3k\x12\x1d^\x80\xab\x85\x8a$\
-T\xba\x1e\xe2\xbaY(b\x94\x89\xb7\x98\xb7$jh\
-\x96\x1c\xb9E\x90\x0dF\x0f\x22\x9d\x18\xa99\xeeme\
-\xf5\x0fS\x14\xb7\x10\x89\x1e\x09\x90h\xa0\xc7\xcbQ\xc2\
-n\xa0\x0d\x01\x9f\xc4\xce\xf1\x9dAh\x7f\x88=\x5c\x94\
-\x16\xa9RP\xcb\x82Q\x91\xdc\xafN\x9cM4G\xca\
-\xb8\x04\xa3\xb9=\x06Y\x05\x96\xcf\xe0\x15\xa8\x8b\x1a\x1e\
-\xe7\xe8\xba7|\x0bL\x8dZS\x80\x94\xaf\xdcX%\
-rm\x970\xeb\xe4\x92C\x87\x89\x0e\xbb\xba\xba\x0e\x1e\
-<\xa0s\x8ee\x83\x1cs\x1c\xd7\x14\xca\x82\x15\x07L\
-T\x0c\x15Y\x8d\x84\x1d\x8d\xf2\x13\x1c:Lo\x83\xc5\
-\x83XY\xc0%\x5c\xd1d\xf3%\x0c=\x1b !7\
-\x96\x13\xd6/O\x95\x9d\x9d\x9d\x1d\x1d\x1d\x84\xa4d\x11\
-\xca\x96\xfa\x09\xd6WU\xc9\x9d\x09\xae\xa6\x22]mW\
-\x0eS\x02G\x91HT\x1b\x01\xfa\xcf\x06H\x10\x7fO\
-\xe5+\x84\xbc\xf3\xc1\xa0$\xad\x84\xf0\xa2\xff\x7f{\xef\
-\xe1\x1d\xd7q\xe5\xeb\xceX&\x89\x0c\x92\x08$\x98s\
-N\x22)\x91\x92,\xd9\xb2\xafoZ\xb3\xd6x|\xaf\
-\xe7\xef\xbb\xeb\xce\xbbo\xdd\x91\xadl\xcbA2)1\
-\x8a\x04s\x00\x09\x80\xc8D&r HQ\xf3\xde\xd7\
-\xe7wz\xb3p\xba\x01\x81\x08\x14\x1a\xdc\xdf\x92\x0ew\
-\xed\xdau\xd0\xb5O\xd5\xae]\xa7\xbbOs4\xe7 \
-$\x90\xde\x88\xb5i\xd00\xc0\x98\xa7\x03\x03\x03,\xf9\
-vZ\x07\xe7hIbm\x8aU3C^}!p\
-;\xe1\x914+\xe7\x1e\xea\x046\x02m\xed\xd6\xf1\x07\
-{\x81Y&\xe8i\x18\xb6e\x22k\x1d\xb9y\xf3f\
-MMM\xcf\xe2\xfb\xc1\xb9\x05\x02\x7f2\xfc\x88\xa2\x04\
-\x04y&\xe1\x1f\x13\xe6\x8b\xd4\xf9\xf57\xa6\x05\x13P\
-\x8c\x9a\x1d\x0b\x92\x8c\x1a\xf2\x0b\x84E\xc9\x86\xfa Y\
-\x1b\x7f\xd9\xa0\x8c6\x00\xa9/\xde\x9a\xc1\xd2F\x1d\x8f\
-\x9c\xf4\xdcK\xea\xbe\x90&\xabY\x0e\xa1\xef\xdc\xdc\xb8\
-q\xa3\xa1\xa1A_r\xe7\xa2\xa3\xb7\x0eB\xd85\xf5\
-4A\x5c\x97\x0d\xe6\x03\xc3\x86#g&\x13]\xccY\
-\x9a\xa0;,6$\x94\xc0\xf2\xa3\xd7\x1c\x12M\x8b\x14\
-*b@ \xee\xee\xee\xae\xad\xad\xbdu\xebV]]\
-\x1d+\x16\xca\xf8t\x8b\x8f\xe2\xe2\xe2\x03\x07\x0e\x1c?\
-~|\xfb\xf6\xed\xa5\xa5\xa5\x5c\x9d\xb8\x22\x8d\xae\xa9\x11\
-k#\xa4\xa1\xef\x09\xbd\xc8\xaa\x04\xe95\xa2hKY\
-\xca\xa9\xce\xb38\xe1\xf5\x93\x86\xaeZ\xb5j\xe5\xca\x95\
-,?\xa9\x10\x90\x11\x09\x13\xdd\x09\x8b\xd3\xf4\x94*a\
-E\x09\xa0\xbf\xa2a\xc6\x02\x9f\xf2\x9e\x13\x81[\x0a\x0a\
-\x0a\xca\xca\xcaV\xaf^\x9d\x9f\x9f\x9f\xb9\xee\x86.\x05\
-\x15A\xb2\x94\xc0yL0\xa4\x11\x14\xb1g\xb7\xd9\xd5\
-\xd5\xc5\xecnjj\x1a\x1e\x1e\xce\xad\x0b\x91\xe8\x11\x98\
-\x07R\x1e\x09\xbc1=:O\xcaA\x11\xc8\xf8\x81\x91\
-I\xa8\xc4-d\xa2\xd7\xaf_oll\xa4\xc8\x88\x8d\
-Z,q\xc8A\x19{z\xaf8vJ\x86\xabAN\
-\x0e\x89+\xa6&q\x9e\xac\xa7\x85iNE\x93\xcc\xd8\
->s\x166\x195\xa6\xea@\xca\x91ibU`\x8c\
-RY\x85\x8a\x8e\x91\x1a\x5c3\x9e\xcf\x8b\x0d^\xf9\xe8\
-\xe8hggg{{\xbb\x82\x08\x978\xeb\x00\x98\x86\
-il\xa8\x22`=}\xfaT\xef\xd1#,\xfe8\x8e\
-\x1fH\xcd\x89\xad\x0f\x1e<\xe8\xeb\xeb#G\xe7\x95\x0b\
-\xd2S\x1d\xe9\xce\xe3\xc7\x13\x08\x18\x13\x7f\xcf\x9d;\xf7\
-\xc5\x17_|\xfd\xf5\xd74\x5c\xccoQ\x11=+*\
-*\xf6\xec\xd9C>\xbaa\xc3\x06\x96\xf3\xcc\xcbm\xc4\
-\xaatd\x88\x0b\x11\xb1E`\x13\xca!\xd2s\xe4\xba\
-C\xaaM\x84\x15e\xb6\xf8a\xc9Y\xbf~=\xae\xdb\
-\xb8q\xa3\x1ei\xa9\x8e\xc4\xd5\xf3A\xe2lr;J\
-f\x0dK>\xee\x8a+\x9c\x7f\xf8\x076\x06\x9b6m\
-\xda\xbd{\xb7]\x0e\xe9\xa3k\x92BE\x11\x163k\
-\xe5\xe7\x04q]d\xcf6\x80 \xd0\xda\xdaz\xf7\xee\
-]%\xa39\x9al\xd1\x17\x9bw\x10k\xd3\x84\xbd\x9e\
-\x1es\x11\xa7\x22\x1a677_\xbcx\xf1\xec\xd9\xb3\
-\xfa\xe9\xe3W\xe4\xb6(\x90\x11\x11\x16@wF\xe5\x93\
-\x99 \xff\x1b\xb16M\xe2<3?\xad\xc19i\xb5\
-|\xf9\xf2\xb8\xfc\xe2\xfc\xf8y^\xca\x9d\x01R\xcaY\
-\xa1f\xc9\x931<RD\xc3&&S\x03R\xe6\x1c\
-\x04\x14=\xb2\x04\xc8\xb4\xe6+\xce\xe2\x10\xceL`\x22\
-9\xe3\xb4\x9c\xbc\xbb\xbb\x9b\xd4m\xf1\x87*^v[\
-[\x9b\xc2\xeb\xb5k\xd7\xea\xea\xeaH1\xc98Y\x87\
-8\x8a\xe8\xc3Q\xf5\xc0\xfat\xe1\xc2\x85?\xff\xf9\xcf\
-_}\xf5\x15\xf9+\xdd$u\x88O\xb4\xf8`\x0a\xb3\
-\x95_\xb5jUYY\x99\x9e8\x88\xc6F\xaf\x09\xb3\
-C\xcd!.\x07\xe0RP\x15\x03\x8c$\x9eE\x8b\xc1\
-\x90+\xef;\xb3\xea\x94\x96\x96\x92\xfa\x1c;vl\xc7\
-\x8e\x1dd?\xe67\xc0`.\xb1q\x9a\xb6\xf8jb\
-b\x82\xe9I\x02\xc4<\xd2\xdfr\xb8\x1c\xe5\xe5\xe5\x07\
-\x0f\x1e<~\xfc8{*\x864\x9a\xa9\xdc\x98\xd5i\
-3\xf7$\xe3\x96\xab@\x04\xeb\xe8\xe8 \x02,\xf2'\
-\x81L\x05\xce\x91\x7fR\xe35BzC\xb523T\
-%\xacH[\xcde\xc03\xc3CC\xe4\xa0\xec\xc6o\
-\xdc\xb8\x91\xa3\xce\x99\x1dr\x11!Tc\x0f\xa4\x0ck\
-!T\x82\xfc\x16\x172\xb0&F\xa28Ch\xf5\x93\
-\x9f\xfc\xc4vh\xb3`a\x93\xd1\xa8\x9b1\xa6\x91\x00\
-\xc8\xbaG2\x15\xb1\xdd+@4VR\xc3%\x1c4\
-&\xa7\x86R6B\x9b\xdc\x82\xec\x90\xcc\xe0\xce\x9d;\
-\x97/_&\xbbR\xbeh}I\x5c}\x153\x89\xab\
-\x03\xe2\x8a\xa8\x8a\xd5\x94\x04\x8e\x98E@gq\x95\xc1\
-bfdd\x84\x1c\xf4\xef\x7f\xff\xfb\xef\x7f\xff\xfb\xff\
-'\xe2\xdf\xd2\xa8\xf8\xff\xa6\xf9\xe0\x83\x0f\xfe\xf2\x97\xbf\
-\x5c\xbf~]\x8f>^\xe4\xa96\x97C\xbb\xf9\xf0\x93\
-v\xd1\xf8\xcd\x8e\x0c@\x972\x93\xb8z2a\xc3\x04\
-T}\x97\xfe\xcd@\xe8\xeb\xeb\x9b\xaf\xcd\xcf\x82BO\
-\xc9\xdd\xd7\xaf_\xbfy\xf3\xe6\xd5\xabW\xeb\x8b_\x89\
-\x80i\xc5\xb8M\xd4*\x96\xa6v \x84\xb52\x16x\
-\x06_\xf5\xf7\xf7\xdf\x8b@\xc8\x09_\xbd\x04pTq\
-q\xf1\xd6\x08\xb6U,\xbar\xfeT\x03/5\x94\xa7\
-%\xb6\xcb\xb0\x94\x12\xb7\x13\xb5\x06\x07\x07\xf5A&)\
-s\x0e\x5c\xc4\x94\x97\xa3b\xd5\x0f\x91\x1a\x91i2\x8b\
-\xa4\xa4\x8cO|B\xe8kiiy\xf4\xe8\xd1\xab\x93\
-\x89\x02\xc3C\x1e \xe6kT\xc8\xb7\xa1\x9fU\xe4(\
-\xfb\xacD'\x8b}+\x19T\x84\xb8\x9c\x8d\xd8\x22\xc3\
-F\x1a^\xdb\x5c\x16\xa3\x05LF\x13\xaf8\xeaB\x96\
-\x9e\x03\xc5\x84\x83\xf0\xa6\x8a\xa6_\xaaDcc\xca>\
-\x86\xb5\x99f\x99\x9a\x1c\x82\x80B\xa6x\xfe\xfc\xf9\x9b\
-7o\x92\x1fh\x10\x87=\xd2H\x80\xb8<\x03h\xce\
-|x\xf2\xe4\x09\x99\x07'\xbfr\xe5\xca\xed\xdb\xb7I\
-\xd7r\xc2Q\xbcH\xd6\x9e[\xb7n\xfd\xf5\xaf\x7f\xfd\
-\xe4\x93O\xfe\x10Ab*A|\xf8\xe1\x87\x1f}\xf4\
-\xd1\x17_|Q]]\xad'e\xe6D\xd7\x98\xce\xda\
-\xcd#\xf3\x82_\xe85\xc7\x83 \x88\xb0\xa0\x93\x18\xa1\
-\xd2d\x8e\xb2'j3\xd8\x9a\xa2'\x8c\xd6\xd4\xd4\xd8\
-`[\xe4\xf0\xe2\xf1X^\x84\x5cg\x8b\x0d \x83,\
-!\xd6\xa6\xfdc\xc2\xf4\xa8\x89\xa0\xa8\xb5dll\x8c\
-]\xdc\x85\x0b\x17\x18c\xcc#\xc6\x98\x8c_qp\x11\
-\xbb\xa9\xa2\xa2\xa2\x82\x82\x02-\xfc(m\xbc\xcd\x90h\
-\x84N\x1a\xae\x10\xca!x\x1e\xb8\x22\xc8j\x92C\xc8\
-]\x0c]mA5\x5c!\x1ak\xcf\x07g(O\x85\
-:/K\x5c\xc1t&\xc2\x8f\x8f\x8f\x93\xac3b\xa3\
-\xcaW\x08\x86\xc4\xf0\xf00\x8b\x9a\x92\xd1\xc8\x9dql\
-\x0c\x05\xa1&\x22s\x14%4\x143m2\x89O=\
-\x19\xf4\xca\x92\x07\x06\x06d6\x0b\x16$\x19\xd5\x8b\xcb\
-\xda1uX\xc4\xaa\xc0R\x1d\xc3\xa3*\x866K\x98\
-\xc8\x19\xb3\xec)\xcdr\xd4K\xbclf\x94\x9e9\xca\
-\x06\x97\xc8\xa2\xd9\xa5\xee\xa4<\x12\x80&\x1e\x1b\x19C\
-K\x06 \x99\xf9\xd0\xd3\xd3CJw\xee\xdc9\x92\x8f\
-\x5c\xb9-j\xe0\x04\xdcB\xc2D\x1e\x90\x15|\xd5\xdf\
-\xdf\xbf\xf8o\x88\x1a\xc4G\xd6\xa4\x15\xd9>q\xaf\xab\
-6\x0dfiD\x97:\xd9JJC\x1a\x8e4\xe7\xaf\
-\xcb\xa5\x9d\x9d\x9d\x8c4\xc6\xc6b\xfe|mV\xe8\x82\
-\xbd1\x17\xab\x22\xac\xb3\x99H/\x83\x10SFV\xb1\
-\x99\x90\x1e\xe70\xf6\x9a\x9b\x9bkkk\xd9\xed\xe4\xd6\
-\xdcYPp~~~>#y\xd9\xb2e\x5c\x0b\xb9\
-+\xae\xcb\x00\xe3\xf0b%\x8cU\x14\xb1*\xb0\xb1\xa3\
-\x84\x1c\x85\x1ct\xd5\xaaUk\xd7\xae\xd5\x0fz3\x86\
-!\xf4\xc9T$:\x9e\x92\xa3\x22\xb9\x0e\xa8\x96\xd0\xf7\
-4\xfd\xcb\xec2{uH\xf8\xd0< }j\xd8M\
-F\xb5S\x11\xb93>\x83\x093!>{\x00J\xae\
-\x0b\x89\xb2\x0cf\xc1\x82$\xa33\xc4\x1c\x11\xf7\xc6H\
-k\x18\xbe\xb2TQ\xf2\x12CN\x80x\x9eeuH\
-\x1a5\x81\xb8\x1ci\xe2f/2\x92\x16\x09d\x09\x8c\
-\xdd\x87\x0f\x1f644\x90%$v\xbaq\xaf\xa6\xe8\
-W\xc2\x92\x22g#B\xb13\xab\xaf\xaf?{\xf6\xec\
-\xd7_\x7f\xcd\x82J\x162\xd5\x19\x163tgzr\
-\xa5S\x0cQ\xd6\xef\xf2\xf2rV&\xd6r\x92*\x8d\
-[\xa06uu\x83\x8e\x98\xde\x84\x90\x84\xf14\xc8,\
->\xe2\xcch\x8b2\x1e\x81\x10\x99\xe4*Z\xd4!.\
-\xa7\xbb\x99\xc9\xf4\xbe\xa2V\x06&0\xa8p\xce\xc8\xc8\
-H[[[SS\xd3\x22\xff \xf2\xcb\x87\xddTE\
-E\x05\xa9\x15i\x96\x0dNy\xcf\x90\xd2j3\xc7p\
-jXOV\xd2*\xd4 \xeb\xe2\xea\x84BU9\x04\
-\xd3\x9c)\xbf\x7f\xff\xfe\xd7_\x7f}\xe3\xc6\x8dD\x00\
-:\x95\xe8\xb8H\xf4N\xfd\x15\xb1*\x22\xe5\xb5\x08d\
-\x86%Q}\x09\xcc\xe5\xd9\x81o\x8b\x8b\x8b\x8b\x8a\x8a\
-\x94\xe2\xa3\x91\xbb\x98\xbf2\x90\x97\x12\xa0\xd4%\x10\xb1\
-6\x8d\xce !<\x8fH\xc9\xe9\xa2\xaa\xb2B[-\
-\xc1q\xf9\xc5y\xd9\xc9\xa8\xba\x04*FNHy!\
-\xab\x92#{\xd0\xd47\xc7\xd2\xcf&\x5cz\xd0G.\
-?W\x112\x93\x8c\xd0-\x22\xd4\xa4\x8c'\xdb\xe7\x16\
-\xbc~\x92Q\xbd\x9f~\xef\xde\xbd\xc1\xc1A\x9b\x09\xa0\
-nb\x93\x15UE\x86\xf1:J\x84\xd2/\x8f\x9f:\
-u\xea\xc2\x85\x0b\x8d\x8d\x8dh\xc2\x13:/\x1f\x12\xd0\
-\x1d;v\xec\xde\xbd{\xfd\xfa\xf5\xc4P\xbdg\x87\xde\
-.b\x02)U\x9b\x89lBl.\x84DS$\x0e\
-\xbe\xcc.\xfe\xd3\xad\x94\x1c}\xc7\xd3P\xbf .O\
-F.\xca$\xae\x9eL|\xa20\x92\xfc\xc3?\xb0\x1b\
-\xec\xe8\xe8\xb8q\xe3\xc6\xd5\xabWII_\xcd\xc5>\
-+\x0c\xe3\x9d;w2\x92\xab\xaa\xaa\xf2\xa2\xc7A\xa0\
-\x9c\xca\xb7B\xbe\xb5\xa3\x04\xc8l\x85&\xac\x15\x92\xa5\
-\xcc9\xf0\x8f~\xc1\x7f\xc3\x86\x0dz\x94\x9b<\x10\x82\
-\x99z:\x13tZ\xc5\xf9\xfe\xfe~b{kk\xeb\
-\xab\x19\xdec\x8f\xa4\x89\xb5\x11\xa6\x91{3\x91\xe7!\
-.\xa7\x91\xc6\x9a\xdb1\x93\x94\xf5\xb4\xcc%h,`\
-\x86\x97\xd9\xe7\x04a\xdfdlM\xd4s\x8a\xec\x03\x0a\
-\x0a\x0a\xf4\xd5EU-%\xe8\xe3\x93'OF\xa2\xe7\
-\xf8|\x1f\xbd\xeb\x1a:\xcd\xe4P\x99\x803\xc4R\x0e\
-\xc2\x8bg\x83\xdb\xdc\xdc\x5c]]}\xe9\xd2\xa5\x07\x0f\
-\x1e\x10hH\x1a\x18\xd0\xe4\x0dd\xe7\xa9A\x10%\xeb\
-\x09\xa4\xc7\x003VP\xb2\xd8\xee\xeen=\xbb\x94L\
-T\xf7DIs\xb1\x8c\xff\x92\xf3c\xc0\x9c\xad\xa8\xa8\
-8p\xe0\x80n\x90d>\xd4)\x81.\xab\x91\xa9\x11\
-\x893d=\xa1\x94\x0c\x80h\x97\x17\xa3\x91#\x83\x9c\
-\x00w\x99\xc78\x1a\xaa5\xe4\x96\x04\xd2\xdbQ\x84\x1a\
-\xce\x13\xd4\xc4O\xb9ojjbgx\xf3\xe6M&\
-f\x5c\xf1\xca\xa3\xfb|\x87\x0e\x1d:v\xec\x18\xc3\xb8\
-\xb8\xb0\x90\x81\xcdu\x89\xab\x03\x12\x0e\xd7\x95\xb2\xeb\x95\
-y\xe1\x0ck\x92\x8an\xd1\xa0%\xacq9\xb8\x0a\xb9\
-\xb8\x83\xa2\xa7\xcb\x96-+,,\xd4\xaf'\xcaW\xf4\
-\x22\xec\x88\x159\xaa\xd7 \x8d\xd5J\xa9\xa2\x8e8\x84\
-8\x7f\xfd\xfa\xf5\xfa\xfaz\x22<\x8e\x8a\xcc_!\x18\
-\x0fd\xe1\x8c\x0d\x84X\x15\x10\xb9-\xe5\xabp\xd4\x19\
-\xd2\xc0T2\xe8\x0c\x22V\xcd\x98\xd9\xb52\x16$\x19\
-\xcd|A\xeap\xa2\xdb\x092\x9d\x82&//\xaf\xac\
-\xac\x8c%\x0d!\xaeXB0\x97\x06\x06\x06\xd8\xe71\
-\xc1HI5\xf1\xc0\x1ch>A\x10\xa6L]\xf69\
-\x5c\xf8E\x02]`j544\x5c\xb8p\xe1\xf4\xe9\
-\xd3w\xef\xde}\xf4\xe8\x11\x11g\xe2\xc9\x13\xc2q\xea\
-\xb9\x9aiB\xd9 \x1eutt\x10\x9b\xfe\xf2\x97\xbf\
-|\xf4\xd1G\x9f\x7f\xfe\xf9\xd9\xb3gIj=\x13]\
-\x0ch\x15\xdf\xb9s\xe7\xf6\xed\xdb\x11X\x9fP\xfe\xe0\
-\xa05\x83LK4\x02\xd9\xa6CV\xb8\xfa\x98qd\
-\x8a1r\xd8\xae0$\xd8\xe7\xa8mN@\xef\xf0\x18\
-k9n\xd4rn\xfd\x0d;.9\xb3_\xa1\x069\
-a \xcf\xe0!\xf4v\x06\xfcC8\xea\xec\xecd\xa9\
-K\xd8\xbf\xca\xe0\x9f\xe2\xe2\xe2\xcd\x9b73\x8cY\x8c\
-\xb8(3\xbf3\x22\xdfr\x94\x90\x15s\xb5\x04.\x0d\
-\x17\xa2\xab\xab\xeb\xfe\xfd\xfb,\x0d\xe1\xba\x90C\xd0\xdf\
-\xd4F*\x8d\x94t0DJ#\xd6\xa6\xd1\x14\x16\xd4\
-R\x84\xef\xa2\xaf\xc80D\xfb\xfb\xfb_\xc1;\xf7\xb8\
-B\x1b\x950\x94e\x0aB\xa3\xce\x90FU %\xc4\
-\xe5\x00\xce\x938\xd5\xcbaA\x92Q#\xeen\xda\x11\
-/\xd4C\xec\x19\xc4\xe4\xa0d\xa2k\xd7\xae-((\
-\xd0y\x96\x12L'}\xdb\xe6\xe6\xcd\x9bL0\x06\x19\
-C\x8d)\x17WG\xa4\xdc\xb7\xe4:\x1eB\x7f\x87\x86\
-\x86HC\xbf\xfa\xea\xabS\xa7N\xdd\xb8q\xa3\xb9\xb9\
-\xf9a[\x8a\xd6\x08\x13H\xd9A2 \x93w^\xbb\
-v\xed\xcb/\xbf\xd47\xcdi\xce\x8e9G\xc3\xf7\xd2\
-\x83D\x8a\x1c\xb4\xb2\xb2R? dk\x12\xcceH\
-+VB\x5c\xce8[X\xa5\xd5\x8b!\xd4\xde\xde\x9e\
-C\x03\x83\x1e-_\xbe\x1c\xbf\x81\xde\x17B\xa3^\x83\
-\x0c\x84\x8a3A\x96\xa1\xbdi\x08;\xcf\xa2\xf7\x22\x9e\
-D\xcc\xfc\x9c\xaf\x028\x99\xd1K>\xaa\xa7\xe4\xa2\xc1\
-?YQU\xd4(\x85)M\x06\x15\x0dN\xce\x11\xbd\
-\x8dL\xae\x02\x1b'\xf6\xe7\xd5\xd5\xd5\xfa\xf0\x12\x1aU\
-\xe5\x0a\xd1\xc0\x8c\x89Ui\x0f\xd0M\x09\xb16\x1b2\
-\x003\x06\xe9q\x053\x9a\x852\x17o\x18\xcf#\x91\
-K\x9ew?\xab+\xe2\x0b\x10\xa1b\xc2,:GL\
-\xac\xfaQY\xd8dT\xc8\x1d?\xd8\xe1\xd0)j\x02\
-h\x14%\xadj)A\xa7\xc6\xa2\x07\xa9\xd4\xd5\xd5\xe9\
-{\xbe\x8a;t\x5c\x06Y\xa1\x95\x9c\x03\xb1*\xc7Q\
-\xfc\xad\xad\xad\xfd\xfb\xdf\xff\xfeQ\x04\x99\xa5\xf8\xf8\xe3\
-\x8f\xa51P\xea9G@\xed\x17_|q\xf6\xec\xd9\
-;w\xee\x90\x9b\xea\xae\xaag\xa2\x8b\x01\xb6\x91\xeb\xd7\
-\xaf\xd7\xc7\xec\xd8I\xb2\x8a'F\xec\x8b\x8e^\x86}\
-&v\x92\xe8\xdc\x93d`$0\x1e\x1e>|\xc8\xa2\
-\xce\xeaNV\x9a+\xeb:\xd9\xcf\xbau\xeb\xf0\xde\x86\
-\x0d\x1bJJJ\xf4\xa5\x19u9\xb6H\x93U\xf9B\
-\xe8\x0c\x80s\xc0\xa7O\x02<\xcf\xe5`<3\x86\xf5\
-\x06\xbd\xdc\x15WO\x81l\x84\x92\xaa\xb8bZ0c\
-\xbd#\x182hY\x17r\xf4kdx\x8c\x11\x0b\xe1\
-\xfe3\xf2D\xca\x09vL\x11Ua\xaf\xa3\x04\xd5\xc8\
-i:Bd\x98z\x93\x9aU\x92|\xf4\xd5\x1c\xa5\xf8\
-\x87\x11\x88c\x97-[\x86\x1cz&\x81<\xa9\xa3\x08\
--\xada(D5\x93Pm&q\xf5|\xb3\xe0\xc9\
-h\xe8\x0e\x88{\x13\xf5\xc7\xaa\x12n5=\x03\xee\xf1\
-\xe3\xc7\xbd\xbd\xbd]]],*R.1\xe85\xf9\
-(}$\x001\xd3\xe8{8\x81\xc1<#\x01$c\
-)\x22\xab\x9c\x87k=22B\xd2\xf0\xe5\x97_\x92\
-q\xfe\xfe\xf7\xbf\xff\xe0\x83\x0f\xec\x18\x12\xe7\xa1\xd1\xad\
-\xd0\xcf>\xfb\xec\xeb\xaf\xbf&\x95\x1f\x1a\x1a\x22H\xbd\
-\xe2\xdb\xe5\xc5\x03\x11s\xd5\xaaU\x07\x0f\x1e<z\xf4\
-\xe8\xa6M\x9b\x0a\x0b\x0b\x19\xd5\xf1xM\x83Y,M\
-\x1e\xc3VL\xe8\x13\xd8\x85\x0e\xcd\xc2\xb6\x18\xb0h1\
-\xadZ[[\xef\xdf\xbf\xcf1W\xde}\xc6{$\xa0\
-\xdb\xb7o?t\xe8\xd0\xd6\xad[\x8b\x8b\x8b\x95\xca\xc7\
-\xd5\xf3\x0a\xa7\xe5\xd2\x00\x9e!\xd8\x8e\x8e\x8e\xe6\xd6\x87\
-\x19\x16\x1a\xfcC&ZZZZTTD>\x8a\xa3\
-\xa4\x04\x19d\x82\xf7\x84d\xa5S\x92\xa3\xfa$:\x9b\
-\xa0\xc8~`bb\x82\x80\xc6\xd0\xcd\xc5kA/p\
-\xd4\xca\x95+qZ\xf8~\x88up\x12\xe9\x85\x0c3\
-\x09\xe6+P\xc6)\x81\xd8\xce\xf8\xd43\xef\xf4\x89I\
-\xf4\xd1)^-\x08\x0e\x84\xd3\xc4\xb7h\x22o\xc5\xde\
-\xc0\x87&\x08\x15Eh\x99)\xfc\xb8,x2*2\
-{\x9brIz \xc6\xaa\x08YJ\x89\xccl\x1c\x1c\
-\x1c\xec\xef\xef_\xc2o\x1e1\xd3\x88>@\x18\xa2(\
-\x9f\x80j3\x91\x1f\x96\x9e7\xf0\x03[\x8e\xee\xee\xee\
-\xe6\xe6\xe6\xc6\xe8\x970\x01\xa1!\x03\x942hii\
-\xc1\x9e\xd8$\xd79\x8b\x04\x96\x16V\xa3\x9d;w\xee\
-\xde\xbd\xbb\xa2\xa2\x82\xad<\xca\xc4]\xb7p\x90K\x16\
-\xd2@\x18\x0a\x04\x9a\xe9\x87\xbd\xd5\x22\xf0\xe7\x88\x1e,\
-\xeale\x19$9\xf4\xdd[\xbcG\x02\xbaq\xe3\xc6\
-\x1d;v\xac]\xbb\x96\xa5\xdd\x9c\x10yhRdP\
-1r\xcc$\xcf$\xcc\x84l\xcc\xd2\xda\xb2\xb4\x13f\
-\x99w@\x0e\x948\xd5\xab\xcc\xb2e\xcb\xaa\xaa\xaa\xd8\
-\x12\xacY\xb3\x86\x0c\x80K#\xe7L\xe5\xde\xa9\x5c'\
-\xbd\x0c\x04\xc5\xf0$\xca\xc6\xd03J\x19\xba\xec\xa3r\
-4\xdf\xc2K\xeb\xd6\xad\xc3cz\x80\x86>\xf1\xac\xde\
-Q\xcbQ\xdd\x94\xb1\x90\xd2l\xc2Zd\xd0\xd2\xd0\xd6\
-\xd6v\xf3\xe6M}\xaf\x00\xff\x84f\xaf\x0er\x14\x99\
-\xa8|\x15\x92rb\xe0d@\xce\xea\xa5\xc8\xa9\x93\x88\
-+\x22\xacm&\xb2T\x13!\xfd\xbc\xb0 \xc9\xa8:\
-\x03\xf1\xeb\x9d\xfa\x15\xc7\xd5\xd9\x0ch\xce\x91*\x06\x22\
-d\xb5Y2\xa8\x83\xd6G\xf5\xdd\x8e\x12Bd\x0c\xc8\
-2\x00U\xe5:t\x8a\x1cb\x86\x10\x92\x08\xdc\xf2\x83\
-\xb3\xa8 \x85Z\xb5j\x15)ixw\x04\x12\x17\x8b\
-q\x9bZ\xa9\xd2\xf7Ebm\xda\x8ccB\xc8J\xd8\
-\xd0\xc0\x9e\x1d\xac\xb6\xb2\xb9\xb5]\xa1;\xe4@,\xe4\
-xO\xbf\xf7#\xa59Jf\x80,T\x94\x8bLc\
-\xfa\x90\x84\x1b\x89<\xca\xda{{{o\xdf\xbe]S\
-S300\x802\xae~\xe5a\x1f\xb5}\xfb\xf6}\
-\xfb\xf6iW\xa0K\x80~\x9a\xd1(\xcc\xf9&\xd0\xc4\
-\x90&\x13<\xcf\xb5`\xb8\x02\xc9h\xac\xcd\x1d\x18\xab\
-\xcczv\xa1\x07\x0e\x1c`7UTT\x14\xa6M\x08\
-&\x87\x84\x0e\x09m$0>\xc9D\xf5\xd0\xb13g\
-\xce\x5c\xbf~\x9d\xb1\x9aC\xd3y~aT\xe0\x8d\xc7\
-\x8f\x1fg\xf5\x80\xbc'bU\x06\x1a\x81\x8c4C\x1a\
-\xaa\xac\xa1i2Q\x15XQ\xc2\xdcY\xf0;\xa3\x89\
-\xd7j>\xb2n\x1b\x89\x220\xed\xb5\xa4\x95\x95\x95i\
-W\x1aW,-\xb2^Ny#rR\x12\x198\xce\
-\xa2\x85Q\xca\x84\x85\xcc\xcf\x8d\xc5R\x1a\x1b\xcf\xd1\xd0\
-N\xa1\xe2T$\x0c\xec\x84\x99\x0d\xd1P\xcbv\x85\xd5\
-\x9d\xc0\x9du\x96-Zx\xf1\xac\xe2\x80\xf7\xd45\x8e\
-\x92Cd\x9c\xc9\xf4\xb5 o\xe8\xc8j\xc4\x0a74\
-4\xd4\xd6\xd6\xd6\xd9\xd9\xb9\x84\xdf\x83\x9a\x05\xb8\x91a\
-\xcc\xc6\xc0v\x05RN\xef^\xc0\x87\x86\x15Ue\x98\
-\xc6N\xa8\x0b\xd1\xda\xdaJ\xeeE\xce\x91\xd9d\x91\x83\
-\x8bJKK\xb7l\xd9B>\xbaf\xcd\x1a\x96o4\
-\xe6+\x13\xa6\x81Anc\x1e\xf0\x00\x03\xb2\xbb\xbb\xfb\
-\xd6\xad[\xe7\xcf\x9f\xbfv\xed\xda\xc3\x87\x0f\xf1\x0c\x83\
-V\x06\xaf\x14x\x83PF&:\x91\xf1S\xa8\xe1X\
-\x92\x90\x096!\xb1vjfh6_\xccgz\xa7\
-\x97n\x896\xe0\x17@\x88-\x22\xa4\x14\x16^\xe3\xba\
-\xc9\xae\xa4\x96(\xa0\x91]YY\xb9,z4\xcc+\
-B\xe8\xb4i\x1c\x18\xab\x1cg\xd1\xc0\xb0d\xfd./\
-/gY\xd2\x07\xed\xa5\x94\x00\x89\xb1\x1d\x16\xcd\xcc\x8e\
-Y\x89l\x93\xf3\x02\xc2*\xd5FK[\xeemb\xad\
-#\x10\xf58E\x5c\xce \xd3\x0f3A\x81Z2\x02\
-K\xfe\xd8\xd8\x18\x8b\xdc\xec\xce\xb6Ta\xed\xef\x89\xb0\
--\x8dFT|I\xb2A+\xcc\xcc\x8d\xa1\x1c\x92\xa9\
-\xe4\xfc\xf8\xbf\xbd\xbd\x9d\xc4\xeb\xc1\x83\x07\xb9\xf8T\x10\
-\xba\xbfb\xc5\x8a\x92\x92\x12\xe6\xbe}mQz\x09&\
-\x1b\xd2X\x95\x8e '\xe3\x01r\xaf\xa6\xa6\xa6o\xbf\
-\xfd\xb6\xba\xba\x9aL\x94bV\x7f\xbe\x22D\xa3)\x86\
-\xa2|\x05\xaa\xb2c\x82\xc8|\x12q\xb34\xb1]6\
-0\x8e\xa5\x00k2}\xdb\x17b\x9e\x93Qf,\xd3\
-\x89\xb8\xc6\xbc2\xa5\x90,eH\xe4\x8a\x14\x92\xa5\x14\
-l\xaa\x0a\x0b\x0b7l\xd8\xb0}\xfb\xf6\xb5k\xd72\
-\xca\xe3\x8a\xa5\x8e9*\xf2\xdc$\xd7\xc9W!\xd2;\
-\xce\x22\x81y\xbaq\xe3F\xcdY\xbd\xb3i\xa3t&\
-\xc35\x1a\xd4\x93\x902\xca\x01\x9e\x9f*\x93\xc86^\
-\xc3(\x12\x82\xc6\xc7\xc7\x07\x07\x07\x87\x86\x86\x88K6\
-\x83r\x82\xf0\xd5\x9a\x8c\x90 \xac}Q\xe4%\xe0\x0c\
-\xf8\xeaY\xf4\xd0\x920Cup\x11k\x10\x83\x87\x15\
-Mo\x9akt\xa5\x5c\x9f\xb1\x9c\x1bj;s\xac\x15\
-\xce\xe7\x0f=z\xf4\x88\xdc+woQ\xd3\x97h\xa6\
-\xa6\x1ceX\x95!\x0dH\x0e5@Qg\xc0'z\
-\x8f\xbe\xb6\xb6\xb6\xad\xad-\x17\xef\x16\xcf#r\x0b;\
-|}\x12\x17\x8d\xbca>\x09\x05\xa1\x22\xc4\xe5\x88X\
-\x95\xbe\x22\x12\xa4\x99\x06\x19\x8bX5\xaf\xccg2\xca\
-t\x1d\x1e\x1e\xee\xee\xee\xee\xeb\xeb\x0bo#+\xc0\x85\
-\xc7\x042\x0b{hJ\x9cN>\xbaj\xd5*\xbdK\
-\xb2@^XTX\xdfM\x10)OE\xa8(W\xa4\
-\xc6\xc5+\xe0\x13'W`\x92\xae^\xbd\xfa\xe0\xc1\x83\
-\x87\x0f\x1f^\xb7n]~\xf4\xe9\x9a\x17\x1d\xa2\xb2\x8f\
-\x86v\x123\x10*\x1a\xb16\xe2\xbb\xef\xbe#\x16\xe9\
-\xc9\xe19\xf7\xb0Fu\x01!\x9e\xf3\x93\x91\xcd\xbc\x80\
-[H\xb6\xf0\x0fA[\x9fS\xb4\xb8\xed\xb0\xeaWV\
-V\xee\xdd\xbbw\xc7\x8e\x1d%%%\xb6\xfc\xdb%\xd0\
-e2\xa4\x14\x89\x22H\x13\x19\xc6U:\x95\x90\x06\xe7\
-\xb3t\xe6\xf43\x0d\xe8\x9d\xa6|\xa2\x9b\x92M)T\
-\x9c\xeaH+\xfc\xd0\xdf\xdf\xdf\xd5\xd5\xa5\xa4\xc2\xce\xf3\
-\xcaB\x80e\xb7\x0f\x16Wm\xc2R\x94f*\x12\xde\
-\x93\xbdPQ\xfa\xac\x98M\x02\xab\x829^\x9d\xf9L\
-F\xd9\xc9\xb1\x9fc\x07\xd3\xd0\xd0\xc0\xd0\xa1hn\xe2\
-UBf&j\xb5\x12D\xa2\xa8>\x8bX\xf5\x0a#\
-\xe7\xb8+\x9c\xc5\x09\xbbG\xd6\xef={\xf6\xec\xda\xb5\
-\x8b=$\xcb\xb9\x05\xcd\x17\x1a\xb4\xa9\xd9\x1e\x91\x90-\
-8\xc4\xaa\x8cs\xca\x80#KWOO\x0f\xb1\xa8\xbd\
-\xbd\x9d4+\x11U\x163t\x0a7\xc2\x0fn\xbf\xe7\
-\xd2)\xda\x12\x90I\xd9\x89\xd5uuuw\xef\xde%\
-z\xb3\xf6\xc7\xd5\xaf<8\xbf\xa0\xa0\x804\xf4\xe4\xc9\
-\x93\xfb\xf7\xef/--\xe5Z\xe04H\x0d\xbbl\xd7\
-EJ\xab\xe5\xc8\xe07LoH\xa3sr-\x00\xff\
-C\xeen\x09\xe8\x0e~\xd3\xe8U\xafQ\xaa\x83\x86\xcc\
-\x84\xe4\xc4Q`\xf9\xf8\xf1\xe3\x8e\x8e\x8e;w\xee\xdc\
-\xbbw\x8fQ\x8a[\xd4\xfcU\x06\x17\x85\x91!vh\
-\xe0RH)\xd3D\x95)B\x19d\x19\x17\x22\x12\x06\
-F\xc2,\x81j\xcdf\xaa\x93\xcc\x84y\xbe3J\xf4\
-\xaf\xa9\xa9a\xe8\xb0\x95\xd1\x17\xbexq\xd3wf*\
-h(\x909\xc3\xecN\x92\xbb\xa8\xe3\x09\xe4\x10\x11j\
-$;\xce\x8f\x0b\x93t\xf9\xf2\xe5eee\xeb\xd7\xaf\
-\xaf\xa8\xa8\xc8\xcf\xcfG\xa3\x05I\xf375\x8d#\x22\
-\xf3\x14aQ\x83YH\x032\x00\xe4\xb8.]+e\
-\x88\xaa\x08;\x04\x9f\xfe\xfe\xfe\xee\xee\xee\x9c\xfb\x1d\x04\
-:\xc5bC\x1aTTT\x94\xf8\xfa\x97\xc8\xec\xf5\xec\
-\xc0Wd\xa2x\xe9\xfe\xfd\xfb\xe7\xce\x9d\xbbt\xe9R\
-[[\x1b1<\xae~\xe5a\xbd'\x01\xdd\xb8q\xe3\
-\xd6\xad[\xcb\xcb\xcbu-l\x1cr\xccz!\xa4\xe4\
-\x98J\xc4&\x83R\xb5\x09\xa4d\x88>I?\xfc\x81\
-\xd1\x9b\xa3\xf9(^b\xe8\x82v\xa1\xa9\xb9\x1a\xf9J\
-\x02\xc8\xccP\xdf\xc3cl\x17=nl``\x80\xc1\
-y\xfe\xfc\xf9\x1b7n(\x19M\xb5y\xb5aT0\
-mq\x05.B\xfe\x0f\x5c\x9a\xf6\xaa\xfc\x06*\x8aX\
-\x15)S\x1eN\x8fLy;\x81\x99\x85H\x13\xd5\xc7\
-H/bU\x9a\xb9\x0c\xda\xf9LF\x81\xe9D>\xda\
-\xde\xde\xce0\x9a\xc8xp&\xc8LX1\xac\x92;\
-\x84\xf4\x10\x97\x974a\xc7g\xc2\x8b\xda;\xce\x82\xc2\
-<]\xb1bEee\xe5\x96-[\xd6\xad[\xa7\xdf\
-NT\xd4\xd3\x14\x96\x90@m!\x1c\xcf\xc8!\xb16\
-\xd0#\xc7\xed'\x9f\x01\x88\x86O\x9f>%\x07\xad\xab\
-\xabc%#\x1c\xe5\xd6g\xefX\xceW\xaf^\x8d\x03\
-\xd7\xacYC>\x1a\xfaP\xc4v\x11\xea2\xc4\xe5\xa9\
-\x89\xed\x02K-\xf6\xb5\xb5\xb5\x17.\x5c\xb8x\xf1\x22\
-\xee\x1a\x1e\x1e\x9e\xcbZ\xb2\xc4\xe0Bp\x096m\xda\
-\xc4\xe6*/\xfa\xf9%]\x88(\x01\x98\xce\xe1\xbaL\
-Fj\xe5\x9fz\x16\xa8\x09'd\xd0\xb2w\xbaw\xef\
-\x1e\x83\x96|4\x17\x13/\x0d]6\xa2\x04\x01\xf2Q\
-z-}\xe8.\xc9q\xe7'\x0ff\x03\xbdf1\xe3\
-\xb3\xa1\xa1\xe1\xee\xdd\xbbl\x93H\xd0\xe3\xeaW\x1e\x9c\
-#R\xceL\xfb\x16Y\xa88\x15x|\x1a\xcf\x1b\xb2\
-1b\xed\x0c\xf8\xc1\x170\x0d\xf3\x9c\x8c\x02i\xfbx\
-\xfa9Xzeq\x87\xd2\xc8,SH0\x95~\xa9\
-\x82\xaf4\xbc\xcci\xd2g\x22\x1b@~\xd5\xbc\xe4,\
-Z\xc8DY\x87\x8e\x1d;\xf6\xc6\x1bol\xde\xbc\x99\
-d\xf4\x07\xdfeN\x10\x0f\xebh`+\xdaB\xac\x8a\
-f\x87\xcc\x12\x84\x7f\x02\x1b\xe2\x0fI\x15k\xd8\xb7\xdf\
-~{\xf5\xea\xd5\x8e\x8e\x0e\x92\xd1\xb8z\xd1\xb3l\xd9\
-2R\x9f\xfd\xfb\xf7\xe3C}N\x11\x1fjQ\xc7\x03\
-\xb2\x99\x09f\x1cy.\x85\xc9\xa6g\xb1ooo\xaf\
-\xae\xae\xf6L4\x13RO\xf2\xaa\xdd\xbbw\xef\xda\xb5\
-\x8b+\xc2u\xb1a\x86 T\x0c\x91\x87E\xac\x8a\x88\
-U\xd9\xae \xe7A\x8f\xe7\xf1?W\x81kq\xfd\xfa\
-u\xb6R9w-\xf0\x18\xb9\xfb\xe1\xc3\x87\x89\x00\xdb\
-\xb6mc\xe8\xa2A\x9f\xb5\xd7\xa12\xd3\x93\xf4\x1d\x98\
-\xc8ccc}}}\xba\xb1\x95\xf5<\xaf \x04\x84\
-\xfc\xfc|}1\x94\xa2\xf69\x08\xa1\x1b\xf1U\x88\x94\
-\x18\x80\xed\x8b\xe0\xb9\xa5,\xa6\x1d\xdb\x99\xc4m\xd3\xa0\
-\xa1\xa1\xed@f\xc1\xfc'\xa3\xc0H\xd2\x8b\xb3\x9e#\
-K3\x0d2\x93=H)25K\x92\xe8\x9a>\xf7\
-\xd24]6\xb3L\xc1q^>\xcb\x97/\xaf\xac\xac\
-|\xfd\xf5\xd7\x7f\xf5\xab_\x9d8q\x82eI\xeb\xb7\
-\x8da\xc9\xa0\x22\xc4\xe5\x1f\x9a\xd7\xa9)\x11\xa1b\xd8\
-$\xd4\x0b\x8a\xcf\xa2'5666\xde\xbe}\x9b\x94\
-\x14Y\xef\xcf,~\xe8\x97%\xf4o\xbe\xf9\xe6\x96-\
-[\x0a\x82g[\xaa\xb3B\x1aC>1bm@\x5c\
-\x11Tq\x12\xbd\x8bU__\xdf\xd4\xd4\x94C^z\
-90z\xcb\xcb\xcbI\xaal[\x85R>dQ\x9b\
-\xcb\x8a\x9b\x89\x12/\x92Q.\xc4\xdd\xbbw[[[\
-\xc7s\xf0\xb7\xaf\x19\xba\xf8\x8aq\xcb>j\xe3\xc6\x8d\
-dK6\xde\xe47CJ\x91(\x0a)\x99\xc8\xf8\xc1\
-\x7f\x9f6\x01)>a!\xbcU/=\xc24\xc3\x92\
-\xda\x04q\xc5l\xb1+\x92\x8aG\x11*\xceej\xcc\
-\x7f2j/+\xeet\x84\xf4V\x15\x22\xbd\x88U\x11\
-\xd6\xd01\xcc':\xcac\x99\xaes\x9c\x97\x09aq\
-\xd5\xaaU{\xf7\xee%\x0d=|\xf8\xb0-E\xa0\xc1\
-i`,=H\xb6c(@\xca\x22M\xac\xca\xc0\xce\
-)Y\x82\xd6\xf5\xee\xeen\xfd\x86u\x0e\xe5X\xf4T\
-otn\xda\xb4\x89\x94T\xf7\x96\xd4}\xf54\xc4\x9a\
-\xc8@\x84r\x885\x91\x81\x8a\xe4@\x13\x13\x13##\
-#\xb9\xf5\x99\xda\x97\x03\xc9(C\xba\xaa\xaa\xaa\xac\xac\
-\x8c\x8b\x12\xb99\xf6\xad\x09\x86\xfc\x09q9\x22VE\
-\xc4\xaa)\xe0\x84\xba\x16}}}\xfa\xc0\xe8\x0f6Y\
-l\xd0\x05\x0d]}DG\xbf\x02*=\xc8F\xae\x08\
-\xc9T\xdam,\x04\xfc088\xc8\x5cfFG'\
-pb\x7f\x92\xf0\xe9M'\x88+\x2225!Yk\
-\xa5\x946\xfdo\x0a]\x0e#\xd6N&\xaeK\xa3k\
-\x07q\xf5\x8b\xb3 wF\xf5\x9a`\x9a\xd7'=$\
-\x8a \x8d3\x15\xe1\xa0q\x9c\x1f\x1d\xd6\xa1\xb5k\xd7\
-\x1e\x8cX\xbb\xb6\x8a\xa2be\x5c\x1d0\xcd\xec\x96=\
-G!\xe5\x0bA\xb4a\xddb9ojjjii\
-a%\xcb\xad\x0f\xde\xe14V\xf1\xf2\xf2r\x16\xf5\x82\
-\xe8\x81\xe1\xe1\x9d\x8fi\x90\xc7 .O\x06\x9f\x93\x91\
-\x83\xa21G9j4B\x9f\xec\xf7\xa8\x1b\xc2\x00&\
-\x13e?\xb0f\xcd\x9a\xc2\xc2B\xbb\xc7/0\x88\xa5\
-\x0c\x87\xe3\xc6\x90\x84R\xc5\xacpE\x9e<yB\xfa\
-\x95\xa3w\x01q\x05\xa3w\xc5\x8a\x15\xecB5\xfd5\
-t\xad/Y;\x95r\xcad\xa4\xd7\xf8\x1c\x18\x18h\
-kk\xeb\xe9\xe9\xf1\xf7\xe8\x0d\xfc \xe7\x80|\x12\x0d\
-\xc3\xe9\xc6dVR\xbe\xce\xe6\xd2\xa9\x9a\x87\xc6\xd8X\
-1\xd4#\xf3\xda\xe2\xc2\xacX\x90dT\xe8\xc5\x81^\
-q\xe4\xa8\xe7]E)\xbd\x8eY5NV\xcc?\x91\
-\xc3\xdcW\xce\x8f\x0c\xcbOEE\xc5\xd6\xad[7l\
-\xd8PR\x92\xba)\xa2\xc9\xae\xf1\x99\x95\xb8e\x1a\xd9\
-\x1b\xd2\xa8j\xe6pZ\xb2+2\xd1+W\xae\xdc\xbd\
-{\x97\xac\x944+\xae[\xf4\xb0x\x97\x94\x94l\xd9\
-\xb2e\xcf\x9e=\xf6|\xd6\xb8nj\xcc]\x99\x98\x9f\
-1\xb0\xa4VJ\xdc266\xd6\xdd\xdd\xdd\xd1\xd11\
-44\x94\x8b\xdf\x95Y8\xf4\x06\xfd\x81\x03\x07\x8e\x1c\
-9\xc2x\xd6\x85\x90\x03\x8d\xd8\xf4\x87F\xa9\xbc\x1d\x17\
-\xa6\x86\xcbAnA2\x0a\xb9{-p\x119\xa8v\
-P\xf4ZK?\xcc\xd0\x09B\xfe\xc4!\xe4\xe5\x0c\xce\
-\xfb\xf7\xef\xb7\xb6\xb6\x22\xab\xd6\x01\x86\x0aQn||\
-\xdc\x86\x0aN\xc3\xe7\x08\xe6\xe7\xd4\x18\x0d\x90\xc6\xf4\x91\
-\xc9$B}V\x03\xb0\x93Os5\xa9\xe2\xe5\xc5\x85\
-\x17g\xfe\x93Q\xeb\x98\x09z\xf5\x92E\xa2c\xd3t\
-\xcf\xc9\x0a\x1es\xa79\x8b\x81\x15+V\x94\x95\x95\xd9\
-;\xcb,H\xac@\xe8\xa7\x1a\x9f\xd2'\x8e\xc2\x22\xc6\
-\x0cI\xd8\x13\x9d\xf5iQ2\xd1\x96\x96\x16\xf2-\xbd\
-\x92\x9c\x80U|\xd5\xaaU;w\xee\xdc\xbbwoe\
-e%\xf9=J\xb9E\x06!\x09/%\x8a\x99D~\
-\x8a\xa1\x88\xa3\xc8\xd4\x1b\x1a\x1a\xea\xea\xeaz{{\xed\
-.\x8b\x03\x5c\x08\xfc\x7f\xe8\xd0!\x92\xd1\xb5k\xd7r\
-!\xb4\xd2O\x83\xbc:;\xf0<\xb9\xd7\xf0\xf0\xb0\x9e\
-\xeb\x9e\xa3wFuS\x9f\x01\x9c\x17\xe5\xee\xa9Q\x1b\
-A\x95\x8e3D\xad`bb\x82\x91\xc9,~\xf4\xe8\
-\xd1\x5c\xf2\x9b\xa5\x07\xa3%\xfc\x82\xb8M\xea\x17E~\
-\x8e\x0b\x11?x\x1e5\x81\xb8\x1c4AI\xb0\x1d\x19\
-\x19a\x0b!\xcd,\x98\xffdT/\x0bOi%\x88\
-|\x15\xbfb\x09\xeaL\xaaOi\xa2J\xe7\x87\x89\xfd\
-\x15\x11\xab\x1c\xe7\xc7#//\x8f4\xf4\x8d\x88\xcd\x9b\
-7\x17\x15\x15\xb1\x14\xd9j\x84\x81\x04C\xad$H\x03\
-\x09Y\xc4\xe54\xb1v2al\xc1Fa\x9a\xd5\x0b\
-r\xeb\xd3\xa2\x80\xd3\x0a\x0a\x0aH\xeb\xcb\xcb\xcb\x0b\x0b\
-\x0b)\xc6\x15iWH\x0e\xbb,!Q+A\xa0W\
-(\x06djuipN[[\xdb\xad[\xb7jj\
-j|\xb1O\x80\x8b\xf0\xff\x9a5kHI\xf5\xd5%\
-\xb9\xd7\x9c\x9c@>\xb7\xa3\x84L\xb2\xea9'\x97F\
-\xb7\xf3o\xde\xbc\xf9\xe0\xc1\x03\xb2\xd2\xb8.w\xc0c\
-\xa5\xa5\xa5\xdb\xb7o\xdf\xb5kWy\xf4\x11\xdb\xcc\xd1\
-+b\xd5\xd4\xc8\x81\xf8\x84]%\xc9\xe8\xe0\xe0\xa0\x7f\
-{)\x04W0\xa3\xd9L\x02B\xe4\xd4\xa4s\xb2\x8e\
-\xb4i\x90\xcf!.g\xa0\xbfb\xc4\xda\xf4\x1f\xb2\xb6\
-O\x9e<!\xaa\xdc\xb8q#\xaa\x9c\x0d\x0b\x92\x8c2\
-\x80\x94\xbc\x87{\xee\xa8#3\x1dU2\x86\xb8\xfc*\
-\xa1K\x9b\x95\xd8)\x93\xdd2\x8d\xbd\xe3,\x1c\xac:\
-\xfa\x06\xfd/~\xf1\x8b\xe3\xc7\x8f\xaf[\xb7n\xc5\x8a\
-\x15z\x8f^\x06\x89\x81\x0a\xa6\x89FqJ6A$\
-\x8a\xd3c\x96\xfcEd\x85\xe9\x89\x89\x09\xc2\xa2v\xc2\
-9\x04]X\xb6lY~D\xf8!\xc5\xb8:\x8d\xba\
-\x9c\xb5j\x1a\xcc\x9ee\x1e\xff\xf4\xf4\xf4\x90\xf7\xd4\xd5\
-\xd5uvv\xe6\xd6\xfd\xe3\x97\x00\x89\x14\x03\xdb>\xfb\
-\x98\x1a\x8e\x11T\xe9\x98\x89|kN\x9e9\x9c\x90%\
-\x92\x94\xab\xa1\xa1\x81d\xb4\xb9\xb9\x99\xa1\x1b\xd7\xe5\x0e\
-xi\xf5\xea\xd5d\xa2{\xf6\xec\xa9\xa8\xa8\xd0\xe8\x0d\
-}\x95r\xdf\xb4\x0e4\x18\x8ax\xa0\xbb\xbb\xbb\xb6\xb6\
-\xb6\xbe\xbe~``\x80\x19\x1d\xd79i\xe4F\x06\xaa\
-\xc6[\xe4\xdd\x14Qe\x16d6\xd5\xe04=B(\
-K0\xe2\xbf\x91FJ5\x01d\x02KGG\x07\x17\
-NU\xb3`\xfe\x93QF\x0f\xdb\x1a\xc2\x1c!\x8f\x94\
-T\x9br{\xf5?\x88\x8c\x8dX\xfb\xca\xa0\x11\xa6\xab\
-k\xc8\x15\x895\xc3\x9c\xa3Z\xc9\x8e\xf3\xd2X\xb5j\
-\xd5\xc1\x83\x07\xdf~\xfb\xed\xa3G\x8f\xea\xb6(\xcbR\
-\xd6\xa1k\xc4\xda`HK0\xe2\xea\xa9\xc9z~\x09\
-\xac\xeb\x04Dv\xc2\x8a92\xc8\x15\x98\xf8\xa4\xf2\x05\
-\x05\x05\x1cm\x99\x99\x8a\xa8\xd31\xb1* \x15>\xa2\
-\xe6\x12\x0c\x8cY\xe9\xfb\xfa\xfaX\xe6\xf5\x08\xa1\xd1\xd1\
-Q|\xa5V\x8e`\x0cs\x09\x12\x99h\x02YJf\
-\x0c\x87\x91Y\xae\x8e\x0b\x19\xa8\x09\xc8\x8c\x86\x0cZ\xae\
-BWW\x17+\xe6\xc8\xc8\x08U\xb1i\xee@G\xd8\
-A\x95G $\x960\xf5WH\xa3ZP\x11\xac\xc8\
-\xe4\xed\xed\xed\xbdu\xeb\xd6\x993g\xae^\xbd\xcaX\
-\xf5\xf1\x99\x89\xb9K\xc7L\xb2\xea\xe5\xff\xc4U0M\
-f\x93\x84F\xc5T\x9b)N\xae\x91L\xee\x17\xab^\
-\x9c\xf9OF\x19O\xecl\xd8v7662\x98\x08\
-\x7f\xa4\xa7\xd6a\x91\x90U\x94\xf0*\xc34\xe6\x88+\
-p\x97\x90\x1e\xe2r\xa4\xc1\x8c@\x09\xb6h\xa5\xfc\xe8\
-\x0et^\x22yyy\xeb\xd6\xad;r\xe4\xc8\xa1C\
-\x87\xaa\xaa\xaa\xecY\x8c?\x88\xc6\xb0\xd0\x90\x16\xb1j\
-j4\xc8A\xd3D\xa8\xc8\x91u}xx\x98\xad9\
-{\xe0\xc7\xb9\xf6p\x1c\x5cWRRRYYYV\
-V\xc6r\xaeo\x81D}\xfd\xe1I\x9d\xb0Q+\xb0\
-3\x00z\xfcC\x1c\xd6\xf7B\xc8DkjjpT\
-.\xde\x87[P\x96-[VZZ\xbaf\xcd\x9a\xd5\
-\xabW#\xe3\xc3\xac\x03)\x1a\xb01\xa6\xe1\x18\xbb{\
-f\xa1Xf\x5c\x17.\x0aC\x97\x85<Ljs\x08\
-:\xc2\x00&}\xd7\xb8\xb5\x81G\x15=2/\x99\x92\
-\xa2\xf4\xa9\xc6\x11\xe41\x0cE<@F~\xf3\xe6\xcd\
-o\xbe\xf9\xe6\xc2\x85\x0b\xcd\xcd\xcd\xe39\xf8\xbc\xd5\x97\
-F\xe4\xd7\x14\xc8\xe6[C\x1a\x11\xab&\x93Y\x95U\
-\xa3\xa3\x11\xea3\xe1\xb2\xcee\xf3\xb0 wF\xd9\xdc\
-\x90\x8c\xd6\xd6\xd6\x92\x95ja\x08_}\xd4\xa9\x98X\
-\x95\x9e\xcc\xaf8\x5cK]N\x8e\xd10{\x0e\xb5\x9a\
-\xe4\xb2\x04\xc9\xaa\x0a\x05\xc7y\x09\x90\x8c\x92<m\xd8\
-\xb0\x81cAA\x81\x8d\xcc9\x8e\xc3\xb0y*@\xa4\
-\x095\x12\xb0d\x9aH\xcfb\xc6\x8e\xbc\xa1\xa1\xe1\xea\
-\xd5\xab\xf7\xef\xdfG\xb6\xaa\xc5\x0f\xf3\x9aLt\xdb\xb6\
-m\x07\x0e\x1c\xd8\xb2e\x8b=^T=\x15*\x8aX\
-\x15\x10W\xa4=#\xa5\xa0\x98\xda\xb6F\x1bW<\xc6\
-z\xff\xf0\xe1\xc3\xfa\xfaz\x8e###9\xe4\xa5\x97\
-\x00\xe9\x14i\xe8\xc1\x83\x07\x0f\x1f>\xcc\xc0\xd6\xa8N\
-\xf83\x01.\xcdJ\x5c\x1d\x90\xd0#\xcb\xf9\x1cS\xa9\
-Xn\xde\xce7\xe4\xa8\xc4\x0a\x05\xd2\x0b\x15\xb113\
-\x1d\xe9>I\xc2\xd8\xd8\x98~\x0f\xec\xcb/\xbf<w\
-\xee\x1c\x99(c5w\x1d\xb2\xa0\xc8o!h\x8cX\
-5-f\x99\xb0\xcft\xb8,\xc1d\xe9\x13\x98\xc1\x5c\
-.\xd9\xfc'\xa3\xa0\x8f%1\xb6\xfa\xfb\xfb\xf5\x01d\
-\xa6\x5c\xd8\x0d\x93\x11\x84\x8a\xaf<\xc9\xc9l\xc8K\x9a\
-\xc9\x14\xf1'\xe0\xd8\xb9\x5c{\xc7\x995\xac\xdc\xa4M\
-\xc5\xc5\xc5d\xa5\xf69\xd1\x19\x8eF3\xd3\xa8\x16\xd2\
-LEh 9\x1a\xfb\xa9\xef\x7f\x10aX\xb7::\
-:n\xdf\xbeM2\xda\xd4\xd4\x94[\x9f\x83$S\x5c\
-\xbdz\xf5\xde\xbd{\x8f\x1c9\xb2i\xd3&r 4\
-\xd6G\xd9\xcc\x1c\xb9E\xa4\xdc\x1a\x81\xfe\xd9\xb3g\x83\
-\x83\x83\xfa\x8d\x1f\xb2v\x223\x1a5q\x04\x9e\xdf\xb5\
-k\xd7\xcf~\xf6\xb3\xe3\xc7\x8f\xaf]\xbb6\xeb\x07\xa0\
-u\x94`\xb2P1S\x9f\xc0\xae\x080t\xb9(\xdd\
-\xdd\xdd\x03\xd1B)\xe5\x12@}\x14*J\x0fZ\xb9\
-\x80\x99K\x1a\xcaT\xed\xea\xea\xaa\xad\xad\xbdr\xe5\xca\
-\x85\x0b\x17tO\xb4\xb1\xb1\x91\x19\x1d7p^\x90\xd0\
-\xdb\x99L_;C4\xc8E\xac\x9a<\xb0g\xc7\x82\
-$\xa3\xc0\xd4b\x9c=y\xf2D\x1b>{\x95\xf6\x8a\
-%\x08Ue2M\xd5\x92\x84}Et\x8c\x91\xd2\xb0\
-k\x1f\xd6*=\xcd4v\x9c\x85#??\xbf\xaa\xaa\
-\x8a\xcc\xa9\xa2\xa2\x02\x99\xe4)\xae\x98\x1b\x1a\xe1B\x83\
-\xdc\xa0VG\xc3\xf4,i\xa4V\x0f\x1e<\xa8\xa9\xa9\
-iii\x19\x1e\x1e&\xe6\xc8&'`\xfe\x92\xd3\xaf\
-_\xbf~\xe3\xc6\x8d\xa5\xa5\xa5$@(\xe5\x04\x19\xcc\
-\x10s\x88\xa13p$\xef\x1c\x19\x19\xa9\xaf\xafg\xa5\
-\xbft\xe9\x92\x9e\xdd\xf8\xa2\xe7_\xdap\x15\x0a\x0b\x0b\
-7l\xd8\xc0\xae`\xcb\x96-\x5c\x11m\x09Dl\x14\
-\x91\xba0\xd9\xb0*\x99M\x83N\xc8(e\x89\xd4\xed\
-|.\xcd\xd2H\xbf\xe4\x81\x90\xb8\x22\x82\x1cT\x09(\
-\x9de@\x0e\x0d\x0d\xb5\xb5\xb5}\xfb\xed\xb7\x9f}\xf6\
-\xd9\xff\xf9?\xff\xe7\xf7\xbf\xff\xfd\x993g\x9a\x9b\x9b\
-1\x88\x1b8\xd9\x88=\x1b\x11\xabf@b\x18C4\
-\xb4S\xa8\xc8\xd9L\x9e9\x89\xd70\x8b3\x18\x0b\x95\
-\x8c\xf2\x12\x99l\x90rX\xf4r\xa3^\xc7/4\x94\
-\x1d`\x96\xe2%\xd6\x0cyL\xfe\x01\xd5\x9a\x10\xf92\
-\xbe\xf6\x08\xd1\x0e\xf3\xf9\xdb\xfa\xd2;\xce\x82\xb2l\xd9\
-22\xa7\xd7_\x7f\xfd\xd0\xa1C\x08,\xe1\xe1\x0d\xa4\
-Y\x13\x0d\xed\x98X\x95&\x9a\x0a\xc9) \x0d#\x7f\
-bb\xa2\xab\xab\xeb\xee\xdd\xbb\xf7\xef\xdf'+E\x13\
-\x19\xe6\x0c$=\xf8\xb0\xa8\xa8H_]B\xa3>\x82\
-\x0c\xac\xef\xb3\x80\x93\xe0\x102\x80\x81\x81\x012\x9e+\
-W\xae\xc8K\x04\x8d\xd8\xc2\x89\xc0\xc9\x0c\xec\x82\x82\x02\
-\xae\x05\x17\x82\xa2\x5c't-\xec\x8aL\xc5\xf4\x06\x9c\
-\x13L\xd6&\xea\xde\xbd{\x97/_&%]\x02\x19\
-X\xec\xac\xf4\x92\x048\x04\x10X\xdat\x7f\xaa\xa7\xa7\
-GO\x02\xbeq\xe3Fuu5\xbb\xa3\xaf\xbe\xfa\xea\
-\x8b/\xbe\xf8\xf2\xcb/\xd9&\xe9\xdd\xf9\xf8t\xce\x0c\
-\x90\x87!.O\x81\x0d<\x08\xe5Y\x13\xff\xd5\xf9\x88\
-Q\xc6B%\xa3\xc0\x0b\xd5pD\xe6\xb5\x0aU\x81u\
-c*B\xe3%\x0f\xb3\x975\xf5\xc9\x93'\xccX\x82\
-\x94RR\xf4rB\xe8C\x04\xbc\xaa\xd9\xce\x11{Z\
-\x81\xb9\xdaq\x16\x94\xe2\xe2\xe2\xad[\xb7\x1e<xp\
-\xd7\xae]eeez\x92\x8b\xaa4DA\xc5\xe91\
-3\xc6\xadF\xaf\x90\xd2\xb0\x13\xc6\xd5ih\x82\x92E\
-\x8e\xd5\xab\xbd\xbd\x9dL\x8b\xe3x\xae\xfd\xcc:\x99\xe8\
-\xca\x95+\xab\xaa\xaa\xc2{\xcc\xea`(\x98\x13\x84\x8a\
-F\xea\xcd\x91\xf4\xb7F\x0c\xcc\xd4\x1c\x87\xc8K\xa4\xec\
-044D\xdc\xd0y\x1c\x03\x8f\xe1C\xfc\xcf\xce\x0a\
-\x01\x8d\xbc\xa7\xda\x04\x99Urx\x02\x9d3u1\x82\
-OX\x09.\x0aq\x9ek\xd1\xd1\xd1\xd1\xdd\xdd=2\
-2\x12W\xe4 \xb8B+\x11K\x98>\xfd\xc9`\x03\
-\x13\x00\x99\xedPSS\xd3\xc5\x8b\x17?\xfe\xf8\xe3\xff\
-\xfd\xbf\xff\xf7\xff\xfa_\xff\x8b\xe3\xef\x7f\xff\xfbs\xe7\
-\xce\xa1\xef\xeb\xeb\xc3\x06\x9f\xc4'u\xa6F\xc3\x0f\xe2\
-r\x84\x155\xde\x12\x84UYmd\xc0I\xe2r\xb6\
-\xf1\x9c\x95\xe8\x85\xa4\x90,\xe5\xecX\xd8dT9\x93\
-\xf5m\x8e\xafu\xa9\xc2R\xa1\x89\xca~\xb1\xb6\xb6\x96\
-\xf04<<\xcc\xc4F\x0f\xf8P\xa8((2\xed{\
-{{\xd9R\xd7\xd4\xd4\xb0\xd7\xd4\xc3\xab\xdd\xc3\xce\x82\
-\xb2|\xf9\xf2\xd5\xabWo\xd9\xb2\x85|T\xbf\xdc\xcd\
-\xfam\xa3\xcef\xfa\xf4\x84fS\x8dX\xe9\xa7?\x1b\
-\xeb\x1f\xcb\xf9\x83\x07\x0f\xee\xdc\xb9\xc3D\x18\x1c\x1c\xcc\
-\xadL\x94\xde\x91\x89\xea\xd3\xa2zkx&\xf7\x98S\
-\xbe\x9b\x8c\xf4x\x0c\xac(\xd0\x10.\xc8u\x88*$\
-\xeb9\xf7\x19\x86\x97\x06\x9e/\x88\xd0%07\x86\xf2\
-Td5\xb0\x86&p-\xa2\x9a\xf8\xa2\x001\x9cD\
-\xedI\x8e?\xd3\x80I\xc74lmm\xd5\xfd\xce\xeb\
-\xd7\xaf_K\x83l\xc5\xabW\xaf\x9e?\x7f\xfe\xaf\x7f\
-\xfd\xeb\xe7\x9f\x7f\xfe\xc7?\xfe\xf1\xcf\x7f\xfe\xf3W_\
-}\xa5\x0f\x8d\x90\x86\xc6\xe7r\xe6\x80\x0d\xb0\x99\x80\xb1\
-\x11\xab\x22TL(\xb3\x125\x8d\x8d\x95\xe61}\x8a\
-\x8a\x8aT;\x0b\xe6\xe7\xc3^\x99\xb0h\xb1\xd7\xdf\xb6\
-m[\xf4s\xd5%\x145!_\x14B\xe7\xf8\xf8x\
-[[\x1b)\x17\xa3\x96\x14-\xaeXBp-\xe9#\
-]c\x8b\xdc\xd9\xd9\x89@@d\x8dW\x02\xaa{\xa5\
-\x1c\x05\x91\x8b#\xb3\x97\xd5\xe5\xe6\xcd\x9bg\xcf\x9e\xbd\
-p\xe1\xc2\xad[\xb7r\xf4\xd7;\x9c\x1c\x82Y\xbcv\
-\xed\xdaC\x87\x0e\x9d<yr\xff\xfe\xfdz\xc0\xb5\xee\
-\xfd\xc4\x16S,\xcc\xc2\xaa\xa6\xb7G#ep\x8cm\
-\x14\xfb\x84n,\xdd\xbbw\x8f\xf1\x0f\xf5\xf5\xf5\xa4\x5c\
-\xa1\xc1\xe2\x07\xef\xad[\xb7\xee\xd8\xb1c'N\x9c\xd8\
-\xbe}\xfb\xaaU\xab\xf0\xb0\xfc\xa9\xbe\x8bP\x06\xd5\x86\
-\xc4\x15\x01\xe6\x07\x16\x092\x9e\x96\x96\x96\xea\xea\xea+\
-W\xae\xf8\xa7E\xb3B\xb0e\x8b\xb5o\xdf\xbe\xa3G\
-\x8f\xee\xda\xb5\x8b\x0b\xc1\xa5\xc1I\xb8\xd6\xdc+!\xe1\
-\xed\x94\xf7\x03\x8d9\xd6\xf4\x89Z@\xc3\x91\xd1\xcb\x85\
-`]\xbb}\xfb6\xa1;\xa7\xb31\xc6\x18k\x16K\
-\x18\x8b\xd7\xfd\xfb\xf7\xe9\x11\xebQ\x08\xeb\x14))y\
-*2\x09+\x83Pw[X\xcb\xf0Cnm \x7f\
-t\x18\x99\x1a\xab{\xf6\xeca\xa02t\xa3\xb1\x16\x0f\
-3\x134\xd2$\x87D\xb6\xd9\xf5\xb1\xf4Cpf;\
-\x0a\xb5E\xc3\xce\x8a\x1d\xef\xac\x7f\x84i\xa1\x92Q^\
-_aaayyyeeeiii~~~\
-\xca\x07\xd1\x8b6!\x81\xf4\x06\x1a\xbaGBF\x0f\x19\
-\xbe$\xa3L\xdd%\x99\x8c\x02\xdd\xec\xed\xed%\xbf\xa4\
-\x8f\x83\x83\x83\x14\x99\xa8\xac\xb5\x8f\xfa\xfa\xd0\xf7D\x90\
-\xaar\xa4\x88\xc0%\xbf{\xb7\xe6\xdc\xb9sg\xce\x9c\
-a\xaa\xb3\xd8\xe0\xa5p|8\xce\xfcB\xd4#\xf6\x1d\
-9rD\xbf\xb7\xb4q\xe3\xc6\xf0\xd3\xa2:\x1aVL\
-\xcd\xe44\xd2\x08\x15\xa5\xcf$a\xa3\xb4@\xc3[J\
-6i\xacg\x0d\x0d\x0d\x17/^<}\xfa4\xeb_\
-\xce\xdd\x16\x05\xd6\x15\xf6\xea$@\x87\x0e\x1d^\xbb\xb6\
-*///\x5cZ$\x80\x8c\xc1\x8a&\x88P6\xf4\
-\xa60\x91\x04G\x91\x01|\xfd\xf5\xd7\x04\x0a\x7f\x8ax\
-V\x0a\x0a\x0a\xd8\x0c\xbc\xf3\xce;o\xbe\xf9f\xf0P\
-\xa7\x94c\x19u\x91\x1c{X\x824B\xfa\xac$\x0c\
-,>#0\x80\x07\x06\x06\xd8J)z\x93\x98\xaa*\
-G\xa1;\x0c-\xd6\xaf\xa6\xa6&f%\xe9u\x82\xc6\
-\x08V\xb7\xfe\xfe\xfe\x5c\xbf\x13\xfc\xe3b\xc9(h\xd7\
-\x94\xb8\x1d`h\xf8A\x5c\xfe!\xa67\x0ek\x13\x99\
-\x06z^\x03c\x80\x0d\x09\xd7\x97\x80\x1cW\xbc \x0b\
-\x95\x8c\x12\xf2\x9eF\x0fu****+++)\
-)\xc1k\xea\x0f\xa0O\xf4\x07\xd0\xc7R\x84\x8a,0\
-\xec\x1augt\x09'\xa3\x80C\xe8\x1d9%\x8b\x07\
-\x13\x9b\x08E\xa8\xd2\x1e\x93\x80\x05\x91\x98\x82\xa5\x97\x22\
-{M\x04\xd2\xf4\x91\x91\x11\xf6\x97\xf1Y\x1cgaX\
-\xb1b\xc5\xbau\xeb\xdex\xe3\x0d\xd6\xec]\xbbv\xb1\
-\xc3\xd4\x8c\xa6*5\xa5\xa7\x88Ss\xc1N\xfe\xff\xfd\
-\x7f\xcf\xbf\x12A\x11\x99iR__\x7f\xfe\xfc\xf9\xb3\
-g\xcf\x92i\xb1\xae\xe7b\x8e\x85K\xd7\xaf_\x7f\xe8\
-\xd0\xa1\xdd\xbbw\x97\x95\xad\xd6m\xd1\xb8njR\xbe\
-\x9e\x1c*\x13P\xab\xa4\x96kAdx\xf4\xe8\xd1\x9d\
-;w\xae\x5c\xb9B\xfc$\x0f\x98\xc7\x0b\xb4d \xfb\
-\xdc\xb1c\xc7\x89\x13'\x0e\x1c8P^^\xae/0\
-\x81jC\x19By\x1a\xd4\x0a\xe2r05\x18\xc6\x84\
-\xfa\xe6\xe6\xe6k\xd7\xae\x11\xcf;;;\x97@\x00\xd7\
-`c\x80\xd1\xb5\xac\xe8>\xa8\xef\x85\xe6\x88%\xa3{\
-\xf7\xee%\x19\x9d\xea\x83=Rr\xcc:\xdfQ&\xf4\
-\xa9\x91:\x83\x81m6\xb2\x17\x14\x19\xd2d\xa2d#\
-\x84\x9ao\xbf\xfdV6/\xca\x02~ftpp\xf0\
-\xfe\xfd\xfbL\xb6\x87\x0f\x1f\x92P\x928g\xf5\x8b\x88\
-\xbb\x95\x0d\xdc-b\xd3%\x0d\xd3\x95\xd8t\xf5\xeaU\
-}\xc7\xf0\x8f\x7f\xfc\xa3>a\xf3\xa7?\xfd\x89\xa2@\
-\xfe\xeb_\xffz\xe9\xd2\xb7$\xac\x8c\x00\xc6A\xdc\xd8\
-q\x16\x06\xa6a^^\x1e\xeb4\xc9\x93}\xd5\x06e\
-\x18\xd4L\x96\x00\xa1\x9c j1%\xd1\xbc\x7f\x1e\x19\
-U$Q\xe3\x8fR\xd4m\x18v\xa7\xe7\xce\x9d\xbbq\
-\xe3F\x8e\xde\xed\xa3;\xe4@\xac+\xac(\x08\xc4\xb7\
-\x99d\xa2\x86|\x22L#\x01\xe7\xe2a|\xa2wW\
-\xba\xa2\x9f\x9aD \xb6\xfc\xa0\xe7_M\xf0<;\x01\
-rP\x06Xj\xc7\x93\x8e\xa8\xe6\xde\xd0o\xd3\xf8P\
-\xf6\x22V\xa5A\x13N\x99\xc7\x8f\x1fsQ\xd8P\xb1\
-8\xe6\xfamQC]\x9b\x9e\xd8\xd4\x99o2\x87\x1c\
-\xc8\xe1\xf2\xbc\x90>+\xaa\x95\x19 \xa7\xc6\xf1\x0c\xc0\
-\xd8\xee\xf4\x93\xbaD'\x9b\x0d\x0b\x98\x8c\x02\xfb!^\
-b\xe2\xd6\x9d\xfa)\xa2^O\xe7 \xad@\xec\x06@\
-K\xd1\x92\x87U\x84\x14\x93\xc5\xa3\x7f\x0ap)\xb5\xa3\
-\xa3\xa3\xba\xf7\x1c7s\x9c\x05\x83\xa5\x9aLT\x1f\x01\
-/**\xb2\xb4\x89H4\xf3\x14J\x93\x1d\xe2\xf2\xcc\
-\xc0^\xc9\x81\xfe\x16G&\x08!\xa5\xbd\xbd\x9d\x8d8\
-\xd3!\x173QzQXX\xb8q\xe3\xc6]\xbbv\
-q\xb4\xaf.\x89\xd8hZ\xe4I\x11\xab\x8c\xc8c\x84\
-\x5c\xbc\xf4\xe0\xc1\x83o\xbf\xfd\xf6\xfa\xf5\xeb\xdd\xdd\xdd\
-\x1e.\xa6\x82\x95\x85L\x94A\x8e\xc0\x85\xe0\xa8\x91\x16\
-\xbaw*y&\xc8\x1eT\xe4\xcc,\xde\x83\x83\x83\xbd\
-\xbd\xbdccc\xa6w\x9c\x19\x12\x0e'#\x0a\x1e1\
-*J\x1f\xa2\x86\x09\xe2\xba\x99\xa1\xf3\x87p\x06\xa2\x0d\
-\xe3\xb9#\x22\xb6{q\x166\x19\xe5U2\xebx\xa1\
-\x04Gd^w\x5c\x11a^\x98\xca\x1d\xea*\xd1\x81\
-\xc0]ZZ\xaa\xaf\xee\xc6uK\x1a\x1c\x92\xda\x9eO\
-\xcbTNs\x9c\xf9\x85I\xb7r\xe5\xca\xdd\xbbw\x1f\
-=zt\xc7\x8e\x1d%%%6\x0d5\xa3u\xcc\xca\
-4U3\x81A\xaeq\x9e\x0a\x04\xe9-8\xf1\xe4q\
-\xf4s\xde\xec\xd9r1\x13\x05bZee\xe5\x91#\
-G\x8e\x1f?\xbee\xcb\x96\xa2\xe2b\x92 U\xcd\xc5\
-c\xe6%\x5c\xc4f\xb5\xb9\xb9\xb9\xba\xba\xfa\xcc\x993\
-\xb7n\xdd\xea\xeb\xeb\xc3u\xb1\x9d\x13\xc0\xb5`\x7f\xc5\
-\xfa\xc2\x91|T\xfe\xc7\x87Ycl\xa8\xc9\xac\x0d\xd1\
-y@f:\xa1i\xb8\x16\xa4\xa1\xc0\x95\x92\xd2q\xe6\
-\x17\x1bx!\xaa\x9a#6\xb6\x0d\xbd\x0fC@\xe6\x18\
-\xab^\x9c\x05OF\x99\x81\xbcP9\x02\xe2\x8al\xc4\
-\x16\x01(\xd9\xa1\xe6\xe7\xe7\xafY\xb3f\xe7\xce\x9d\xfa\
-\xc2\xe9+\x92\x8f:\xce\x22A\x9fRb\x02\xee\xd9\xb3\
-\xa7\xaa\xaa\xaa\xa0\xa0\x80Y\xc9\xbcfA\xd5\xfa\xaa\xa9\
-\x9a\xca\x83\xa2 %\x01R\x8d\xa7@\x13<\x93\xb8:\
-\x22,\xaa\x16\xf8\x8b0\x11=\xd10w\xb3+\x12\xa0\
-\xf2\xf2r\xc54|\xbb\xec\xa7?\x9d\xcaY\xb1+\x03\
-P\xc6\xbe\x08\x901\x02\xce!\xde\xb2*\x90\x89^\xba\
-t\xe9\xec\xd9\xb3555d\xa2\x9e\xf4d\x85\x91L\
-\x1a\xbay\xf3\xe6m\xdb\xb6qEHFQ2\xae\xb4\
-f!\xcb\xe1\xb3#l\x1b]\xba\xd4>\x01Y+7\
-\x03\x98#\xb2\x0c\x1cg\xd6ht\xc5\x85\x88D\xd1H\
-\x05\x8bh\x10\x9a`\x96\x12R'\x8a@\x96M&f\
-l\xa0d\xd6\x10d\xe62\x9e\x176\x19%22\xdf\
-\xd8\xff1\xf14\xbd\xd5\x93L\xa6\xd2\xd3g\x02\x04\xc9\
-\xe8\xa1C\x87^\x7f\xfd\xf5\x0d\x1b6\xe4\xe5\xe5\xc5u\
-\x8e\xe3,0L@f\x5cee\xe5\xbau\xeb\xca\xca\
-\xca\xc8D\xd9\x0d\x86\x91(1s\xa9\x0a\x91\xc6\xaa$\
-\xcc\x9c(`\xc4\x09\xa8d\xc2\xc8\xf0\xf0pooo\
-\x7f\x7f\x7f\x8e~\xd8\x8e\x04\x087VTT\x10\xd6\xc8\
-\x84\x88ozS\x98*uVf0C\x8f\xc93 \
-\x19\x17\x8d\x8e\x8e655UWW\xdf\xb9s\x07_\
-y&:\x15\xfa\x0e\xd9\x91\xf4\xcf\x89\xd9\x87\xa1\x8d\xd8\
-.@~\x9e\x9e\xcc\x86\xd1\xf5I\xc1\xf5\xe5\xeatv\
-vr]\xd83\xa0\x89-\x1cgfh\xccD\xa3)\
-\x19{\x13B\xc2\xc0\x98\xaa\xe1\x0c\x89\xfer|\x06\xc9\
-\x8a\xcf\xd2\xcc\x9a\x85MF\x09\x82l\xca\x09\x8b\x0f\x1f\
->\x1c\x19\x19\x09\xe3\xec\x0c\xc1MD\x87\xa2\xa2\xa2\x8d\
-\x1b7n\xdf\xbe\x9dEqY\xf0\x8b/\x8e\xe3,(\
-\xa4J\xa4M;v\xec\xd8\xbcy3\x99\xd3O\xa3\xef\
-\xd9\x00\xb3\x12\xc2,*\x0cF(\xa5\x0f\x8f\x12L6\
-\xd4\x16\xe2rDX\xd4_D\xc3\xe6\x9bL\xb4\xb1\xb1\
-\x91\x1c\x8b\xa8\x82\x1c[\xe4\x0etD?a\xb5w\xef\
-^b\x1a\x91\x0d7\xc6u\x93\xdd\x98\xe9\xa8\x04fl\
-\x96\x14\xc9D\x89\xbaJwZZZ\xfc\xdd\xf9\xe9a\
-5)//\xdf\xbem\xdb\xa6M\x9b\xecZ\xe0O\x0d\
-9\xd9\x08y\x1b$'\x94\x99$je\xcf\x99\xc7\xc6\
-\xc6\x18\xbaW\xae\x5ca\x0c\xe7\xe8'\x9e\x9d\x1f\x1d\x1b\
-Q\x1a]\xa0\xa2BA\xa8\xf9AdICC\xfai\
-\xd0\xf9C\xe2\x8a\xb9\xb1\xe0\xc9(\xfb\xbf\xda\x88\x81\x81\
-\x01\x8az\xdd\xea\x80z\xce\x9cW\xff\xa5L@\xfeJ\
-\xce\x8d\x01[\xd8\xc2\xe8W\x83\xc3\xd8\xed8\xce\xc2\xa1\
-7%\x0e\x1e<x\xec\xd81\xb6\x82%%%$\xa3\
-L\xc6xr\xa6\x89\xad\xd3q\xcd\x04\xcdk\x1d_\x08\
-;\x0fm\x052\xd1cpp\xb0\xa1\xa1\x81\x85\xbc\xba\
-\xba\xba\xad\xad-\xe7\xd2,:B\x04#\xefy\xfb\xed\
-\xb7O\x9c8\x81`\x9f\x83\x9f\xdd\xad\x85\xd0Q\x9ca\
-bb\x02\x17\xb5\xb7\xb7\x93\xee\xe0\x1fd\x0b\xb9NV\
-X}\xb8\x22\x05\x05\x05\xf9\xf9\xf9\x8cmSj\xc8\xa5\
-F^\xc6\xe8\x0d\xfd)\x99\xa3az\xc9\xa1&Z\xcb\
-RO*\xac\xab\xabc\x00\xb3&\xb2\x9b2\x03\xc7\x99\
-w4\x80S\xfb\xaa46\x9eM\x80\x99\x0fB\x1b\xc6\
-0\xefCw\xc1?3:>>\xde\xd1\xd1\xc1\x1e\xfd\
-\xd1\xa3G\xc8\xac\x1f(\xc3nL\xd5+\x94\xea\xf3\xf7\
-\xdf?\xfb\xee\xbb\xd4\x0f\x11\xd1v*c\xc7q\xe6\x17\
-e\xa2\x07\x0e\x1cx\xf3\xcd7\xc9G\xf5iQeN\
-\xa9\x09\x9c&Q\xd4\x0c\x85\xe8\x1cS\x12\x86B\xc9\x1c\
-C\xa5\xa1s\xea\x9eh}}\xfd\xb9\x08\x96\xf3\x1c\xbd\
--\x9a\x97\x97G\x0e\xfa\xfa\xeb\xaf\xef\xdb\xb7\xaf\xa2\xa2\
-\x02'\x87\xbd\xcet\x82\x9ci\x84J\x043\xa6H\x84\
-$\xc6\xea\xf9\xf6_~\xf9\xe5\xd5\xabW)*\xde\xca\
-\xc6\x99\x06y\x89\x0b\xc4\x087\xaf&\xaeEHV\xaf\
-&\x1a\x866\xc8\xc0H~\xf2\xe4Io\xf4\xfb&\x0c\
-`\xbf-\xea\xcc#\x1ac\x99\xc4\xd5\x11\x8c\xcc\x90X\
-;3\xe2\xd3\xa5O\x18\x17\xa2\x22G\xc66\xa88;\
-\x166\x19\x05\xa2\xe1\xc0\xc0\x00\xc9hCC\xc3\xc3\x87\
-\x0f\xfb\xa3\x1f`\xd0\x8bf*N\x036\xb4\xc5\x98\xfd\
-}ggGkkkWW\x17\x13\x98\xbd~|j\
-\xc7q\x16\x06\xbd;O\x0e\xfa\xb3\x9f\xfd\xec\xf8\xf1\xe3\
-\xe4O\xc5\xc5\xc5\xcb\xa2_\xfb\x88-\x22R\xa1(M\
-\x14\x8b\x9eg\xa2:*\xde)\xf0\x85\xa4\x1a\x07H\xa3\
-\xa3\xce\x00QM\x0a\xdd\x13mll\xfc\xf6\xdbo\xbf\
-\xf9\xe6\x9b\xdb\xb7o\xe7\xe8\xbb\xcfx\xaf\xb0\xb0\xb0\xb2\
-\xb2r\xed\xda\xb5\xf6\xeb)q]\xba\xfb!\xb1#&\
-\x13\xd7E\x98\xc7\xf0\xfc\xc4\xc4\x04A\xf2\xfc\xf9\xf3\x7f\
-\xfe\xf3\x9fO\x9d:USS\x83\xd3\x08\xa4\xb2t\xa6\
-\x02\xefi\xb91\xdfJ\xc3\x11\xf7r\x812\xaf\x8b0\
-{\x0c\x12H\x8f\x81!=\xcb\xd9\xd0\xd0\x10\xd7e,\
-z\xf0\xb6\xcc\x1c\xe7\x85\xd0XJ\x10\xd7e\x83\xe1'\
-\xc1\xcc\xd4Dc\x1b\xd0h\x94\xaav&X+\x8e\x8c\
-\xe4\xf1\xe8a\x94\xa3\xa3\xa3s\x098\x0b\x9e\x8c2\xc9\
-GFF\xea\xeb\xeb\xcf\x9c9C\x88\xac\xae\xaenj\
-jb6>\x8e\xa0\x0f\x1c\x09\xa3\x99\xa0g\xc6vw\
-w\xb3\xd7?}\xfa\xf4\xdf\xfe\xf67\x96\x22\x92Z\xaa\
-^\xc8k\x8e\xe3\xbc\x10d\xa2\xe5\xe5\xe5\xfb\xf6\xed{\
-\xeb\xad\xb7N\x9e<\xb9s\xe7\xce\x95+Wff\xa2\
-`\xb1\xcc\x88bZ\x8a\xb8\x9c\x0e[\x09\xcb\xd0@X\
-m\xa29\x01\x84\x18g\xbf\xb7\x94\xbb\xdf\x0d\xa7\x83\xf9\
-\xf9\xf9\xeb\xd7\xaf'\xb3\xc7\x9f\xfa\xf4m\xe4\x95\xd8?\
-2\x13\x143]\x04r\x8e\x19\xab\x88\xc0\x1a\xc0F\xbd\
-\xb9\xb9\xf9\xd6\xad[\xfa@-1\xd6\xf7\xed?\x08\xde\
-\x0b\xd3P\x08/\x87\xf4\xc8\x22U\x9dq\xa5\x84\x0c\x8c\
-X\x1b\xc0\xa9\xc8D\xbb\xba\xba\xee\xdf\xbf\xcfebi\
-\xe3\xef\xc6u\x8e\xf3\xe2d\x1df?\x88\xc6g\x88\x94\
-\xaa\x9d\x1e36{F5\x99(\xf1\x99\xc4\x8c\xc8\xcc\
-f\x98\xb4MU\xb3\xe0e|\xfe\x92@\xc9K\xec\xef\
-\xefg*\x92>3'\xd1\x90\x86\x0e\x0c\x0c\xb0\xaep\
-\x04j3!\x13\xd5C\x9bId\xaf]\xbb\x86\xfc\xe8\
-\xd1\xa3\xa7O\x9f\xc6\xe7u\x1cg\xbe\xd1=\xd1\x03\x07\
-\x0e\xbc\xfb\xee\xbb$\xa3\xbbv\xedJ={(\xfd\xad\
-A[\xb6\x15\x92\x844!qE\xba*\x14LN \
-\xbd\xad\xd0J|\xf9sdT\x9d\x9d\x9d\x04\x01\xb6\xb2\
-\xb7o\xdf\xd6[\xcf\xb2\xc9-\xf0aUU\xd5\x9bo\
-\xbe\x89W\xb7m\xdbfw\x9a3}\x92(&\x90=\
- \xebr\xe04e\xa2W\xaf^\xbdr\xe5\x8a~\xd4\
-\xc7\xae\x943\x0dl\x09\xca\xca\xca\xb8\x1c\xeb\xd6\xad\xb3\
-/0qQ\xa2\xe1\x17_\x05\xb9Z\x84r\x82\xe8\x9a\
-\xa4\x88\xcb\x01\x5c\x0b]\xa3{\xf7\xee\xb1\xa1b-c\
-ic\x1d\xf4k\xe4\xbc(\x04\x0d\xfd\x1c(\xd8\xcf\x81\
-\xc2\xf4cI\xc3\xd2\x8e\x22\xaay>\xa4C\xe54\x84\
-\xf6\x8cj\xf2\xb1\x9e\x9e\x1e\x22\x0fI\x9a\xde\x8d\x99\xf5\
-\xa8~I_\x06b\xfd`/H\xd2\xc9k\xe5HV\
-\xda\xd8\xd8XWW\xc76\x91\xa3\xbe\xe1\x94\x80yK\
-\xdf\xd8\xe8_\xbf~\x1d\x99&###\xfe\xd6\x86\xe3\
-,\x1cd\xa2\xac\xcd{\xf7\xee%\x13}\xe7\x9dwv\
-\xef\xde\xad{x\x89 \x95\x0aZib\xd5\x8b\x07\xb5\
-\xe9\xe1\x0c\x045v\xad\x13\xd1\xafx_\xbcx\xb1\xba\
-\xba\xba\xa3\xa3#w#\x00\xbe%\xe9\xc1\xb1\xaf\xbf\xfe\
-zeee^^^\x94\xf1<\xf7\x9b\xf8A\xd7\xa5\
-\x9c\x1b\xb8\x9a#\xa1\xb5\xa5\xa5\x854\x94\x94]\x9f\xa6\
-\xf5,g\x86\xb0\x9a2\xbcK\x22\xf2\xf3\xf3Y\xe9\xa5\
-\x97\x93\xb9@\xf2\xb0\x90\x12\xe2\xf2d\xac\xca\x9co\x96\
-\x1a\xc9\xac}7o\xde<\x7f\xfe\xfc\x83\x07\x0f\xb8F\
-\xb6\xefr\x9c\x99\xa3dt\xff\xfe\xfd\xf6\xdb\xf4\x0a#\
-\xd3\xa3\xa1h\x03\xd2H\x0d\xd94\xb1jZ\x12\x96\x0c\
-l\xf6T\xec~\x09\xce\x97/_F\x98K|~I\
-\xc9((\x89\x1e\x1d\x1d\xed\xeb\xebkmm\xad\xaf\xaf\
-'\x13%\xe9\xe48\x15\xd42o\xdb\xdb\xdb\xf5\x96\x93\
-GX\xc7Y8^\x8b~i\x89\x18G\x1az\xf2\xe4\
-\xc9]\xbbv)\xd8Q\x15\xae\xaf\x864\x10\x97\x03L\
-)\x83\x04\x99\xfa\x84&j\x9aJF\x89t\xcc}\x12\
-,2\xad\x1c\xfd\xd2\x92\xa0;EEE{\xf6\xec\x91\
-cI}\xf4E\x19a6&O\x036\xe1\xe5 \xcb\
-a{O\x96s\xfa\xf4\xe9\xabW\xaf\xf6\xf4\xf4\xf8\x8e\
-}\xe6\xe0I\xdc\xa5\xc5\x85E\x9dE\x8a\x22\xb2n\x91\
-F\x17$\xf6\xb6d\x90\x9cj<\x05\xd8\xcb\x12\xa4\xe1\
-\xb4\xbaL\xb7n\xdd\xe2\x1a\xe9\xb6\xa8\xaa\x1c\xe7\x85\xb0\
-;\xa3\x96\x8c\xda0\x9b\x0a3\x90\xa0\xf1<Gt*\
-\x06\xb6\x92Q\xdd1d\x84\xabvv\xbc\xbcdT0\
-\xd5\x1f?~<44\xc4\xeb\x8e\xdf\x8c\x9f\x02\x0cX\
-\x87FFF\xb0\xf7M\xa4\xe3,4\xcb\x97/\xaf\xaa\
-\xaa:q\xe2\xc4\xcf\x7f\xfes\x22\x1d!\xcf\x22]\x22\
-\x9cA\x18\xd1t\x03IU&\x18\x89\xe2T\x84f\x92\
-Y\xbf\x99\xfe\x8d\x8d\x8d\xac\xdf7n\xdc\xe8\xe8\xe8\xc8\
-\xd1%\x9c\xee\xe4\xe7\xe7o\xdc\xb8\xf1\xf8\xf1\xe3\xc7\x8e\
-\x1d\xd3/wX2j6\x12\x12\x84z\x93\x89\x87\xc8\
-r;\x11\xb5\xab\xab\x0b\x17]\xb8p\xa1\xa9\xa9ib\
-bB6\xce\x0c\xc1\x81\xe3\xe3\xe3\x8c4V\x1c\xfd\x98\
-\x02\x03O\xcf\x10\xb4A\x8e\x9f\xc1d\x09Y\xc9\xda\x04\
-%\xf9.\xfb\x04\x92\xd1\xdb\xb7o\xf3'\xf8\xa3\xaar\
-\x9c\x17\x22|\x9b^o[\xc5\x15\xe9\xb1\x17\x8eO\x1b\
-\x84\x12d`CT\xc8 $a\x00\x09\x9b\xe8d\xf1\
-;WO\x9f>\xed\xec\xecdT?x\xf0\x80I\x14\
-[\xcc\x8a\x1f\xbe\xc1;\xef\xd0\x01\xa6\x22\x93s&`\
-\x99\xe9\x1a\xc7q\xe6\x1d\x92\xd1\xd2\xd2RR%\xd2&\
-\xf6\xdc\x14\xa7\xcf2EX\x0bR\x8a\x19\xce\x5c\xcc@\
-\x1bN\x9d\x84\x221\x8e-\xab>\x07Y]]\xdd\xd2\
-\xd2B\xc6 \xfb\x9c\x83\x05\xa3\xbc\xbc\xfc\xc8\x91#G\
-\x8f\x1e]\xbf~}\xf8\x1br\xea{\x5cH#\xa5\xa0\
-hWA\xc5\xf0Hxd\x01\xe8\xee\xeef= \x97\
-\xf2\xcf\xd3\xcf\x02\x06\x1e#\xad\xbe\xbe\xfe\xec\xd9\xb3\x9f\
-\x7f\xfe\xf9g\x9f}v\xea\xd4\xa9\xeb\xd7\xaf\x93\xd9\xeb\
-K\x0ex\x15?\xb3l\x19\xe1%\xd0\xa5QQ\x1a)\
-\xa5\xd1\x91&\x5c&2\xdd\xbe\xbe\xbe\xc7\xb9\xfc3\xb6\
-\xce\x22!\x1ak1\xa6I\x08\x10\xca!\xe8\x19\xf6\x80\
-0\x95\xcd\xf4X\xc3P\x88jf\xcf\x8f\x90\x8c:\x8e\
-\xb3\xd8 \xf5d\x9fM\x1aZUUU\x5c\x5cl\x1b\
-\xee0\xc4h\xdd\x85\x84<\x132-\x13\x1a\xfe\x90\x05\
-G-\xdel\xb5/^\xbcx\xee\xdc\xb9\xbbw\xef\xe6\
-\xee\xf7\x96\xe0\xb5\xd7^\xab\xac\xac<p\xe0\x80\xee7\
-\xeb\x9e\xa8z\x1a[\xa4czH\x5c\x91\xae\x92s(\
-\xa6\x9c\x1e\xdd\x16\xc5!\xca\xa2\xc8\x9c\xee\xdf\xbf?\xe8\
-\x0fr\x9a-\xf8VOnihh\xc0\x99\xdf|\xf3\
-\xcd\x17_|\xf1\xa7?\xfd\xe9\xf4\xe9\xd3w\xee\xdcA\
-O\x06)HL1\xa6\x89.\x8a\x81F\xd7E\xc8\x00\
-K\xae\x08\x97i8\xfa\xd9\xb0\x1b7n0\xa4\xe7\xf8\
-\xf8\x1b\xc7\x11\x1au\x09\xa2\xc1\xf8\x9cX\x1b\x10W\xa4\
-\x89\xb5\x11\x1a\xb7/\xc4,\x9aL\x83'\xa3\x8e\xf3\xaa\
-C\xea\xa9\x0f\xc5\xbf\xf1\xc6\x1b;v\xec(**\x22\
-\xd7!Ti\xdd\x85D\xd0\x99&\x06\xa9\x8a\xa3\x90\x12\
-\x12\x81/Df\xb2\xe7/\xb2x?y\xf2\x84\x0c \
-J\x0b\xce\xb0\x84#\xe7\xee=?:\xb5b\xc5\x8a\xf2\
-\xf2\xf2u\xeb\xd6\xe1d}E\x06%\xc7h9\x98\xe4\
-\x96\x84Ff!\xaa\xe5HBC\xfed\xcf^%_\
-'\x19\x0d\xdb:/\x84\x5c\xca0\x1b\x18\x18 \xb3\xff\
-\xfa\xeb\xaf?\xf9\xe4\x93\x0f?\xfc\xf0o\x7f\xfb\xdb\xcd\
-\x9b7\xf1s[[\x1b\xe3\xb0\xbf\xbf\x9fl\xf2\xbb\xef\
-\xbe\xd3\xd4P\xbai\xd3\x048\x0f\xc5\x10\x8c{{{\
-o\xdd\xbau\xe1\xc2\x05\xffz\x99\xf32a\xa4M?\
-\xd8f2\x143\xa3\x10\xb0@\x88\xac\xb5\xb3\xe3e\x7f\
-f\xd4q\x9cE\x852\xd1={\xf6\xbc\xf7\xde{o\
-\xbf\xfd\xf6\xb6m\xdb\x0a\x0b\x0b-\xcapD\x96e\x18\
-w\x12r\xd6\xaa\x84~\x1ad\x09\x04GV\xf7\xf1\xf1\
-\xf1\xa6\xa6&\x16\xef\xcb\x97\xab;::\x9f>\xcd\xd5\
-o{\xd0\xa3\x82\x82\x82\x8d\x1b7\x1e=z\xf4\xd8\xb1\
-c\x08\xfa\xd9IuV\x06f\xa9\x85\xc1\x96\x87\xc8d\
-\x92W\x85R\x1c\xdd9\xc6Eg\xce\x9c![\xea\xe9\
-\xe9!\xe9\x89M\x9d9\x80\xff\xf1\xa4\x9e\xfd\xf2\xe8\xd1\
-\xa3\xa1\xa1!\x5c\xdd\xd5\xd5\xd5\xd2\xd2\xd2\xdc\xdc\x8c\x9f\
-\xd9)q\x05\xf5\x89R]\x0bZq]l\x9a\xa0a\
-C\xc50\x06\x04N\xc5`\xbex\xf1\xe2\x95+W:\
-;\x19\xcc\xfeQ\x0ag\xf6\xe83\xa3{\xf7\xee%b\
-\x87_`\xd21\x93T\xc8\xc8V\x15\xc6\x19\x09Y\x99\
-\xaaVzN211\xc1\xa8f3\xcc\x86\x8d\x99\xa2\
-\xda\xd9\xe1\xc9\xa8\xe3\xbc\xba\xb0\xa6\x96\x95\x95\x1d8p\
-\x80L\xf4\xad\xb7\xde\xda\xb9sgii)\x01\x8e\xaa\
-T\x0c#\xe2DG\x82N\xf4\xef\xa4\xc0$\x0d\xc4\xe5\
-\x80\xb8b\x8a@\x06\xaa\xca4P*\xa0w\x9f\xab\xab\
-\xab\x1b\x1aRokZ\xdc\xcc-\xe8\x1d\x99\xe8\xe6\xcd\
-\x9bI\xf1\xdf}\xf7\xdd\xdd\xbbw\xb3\x8a\xc8\xb7\xeaQ\
-\xcaAi?H\xc8\xec\xa9\xf4\xe1\x1d\x08\xd2\x1c=\xcb\
-\x89L\xf4\xef\x7f\xff\xfb\xad[\xb7<\x13\x9dwH(\
-I%\xc9;\x87\x87\x87\xbb\xa3\xc7]\xdf\x8b`\xc5e\
-@\xearP+\xb0\xa4\xc8\xb5C \xd7dI\x06\xae\
-\x11\x964\xef\xed\xede0_\xbbv\xad\xa1\xa1!w\
-\x07\xb3\xb3H\xb0d\x14f\xf8mz\x90\x0dc\xcf\x86\
-\x9f\x04k\x8b\x90\x90\x854\x22,\x22s\x06\xa6\x09\xe3\
-\xbf\xa3\xa3\xe3\xce\x9d;\x9a\x1aq\xf5\xac\xf0d\xd4q\
-^QXSI=\x09j\xbf\xf8\xc5/HF\xc9\x96\
-\x88n\x04;\x8bS\x18\xb0\xea\xca8\x15\x99\x22T\x9c\
-\x9e\x99[\x1a\xb2'\xba\xe9\x03vW\xae\x5c\xb9y\xf3\
-fWW\x17\xc1N\x06\xb9\x05\xdd\xc9\xcf\xcf\xdf\xb4i\
-\xd3\xc9\x93'\x7f\xf5\xab_\x1d>|\xb8\xa2\xa2\x82\xd4\
-\x1f\x8f*\xd1\xc1F9\x8d:\xae#\xd8j\x01\xaa\x05\
-\xc94\xa4\x96\x88\xdf\xd4\xd8x\xe9\xd2\xa5o\xbe\xf9\xe6\
-\xc6\x8d\x1b\xe4:\x9e\x89.\x1c\xf8\x16\x87\x0f\x0e\x0e\xf6\
-\xf5\xf5=z\xf4\x88\xc4\x14\x99!\xca\x06\x80\xfd@S\
-S\x13+\xf1\xf8\xf889\x01W\x93\x04\x94\x22\x99k\
-mm-\x09(\xdc\xbf\x7f\xbf\xa6\xa6\x86\xa5\xfa\xf6\xed\
-\xdb\xb4\xf5+\xe5\xcc\x91i\x92Q\x13\x12\xa4\x22H\x94\
-;\x86\xb1\x05d\xaf\xdaP\x93\x15UE\xb6)\x909\
-\x1b\x11ibb\x821\xcf \x9f{2:\xe5\xdfv\
-\x1cgiSTT\xb4o\xdf>2\xd1\x9f\xff\xfc\xe7\
-\xf6\xa0\x10\xd6T\xc5\xac8\xeaL\x8eS:&\x82Z\
-&343\x03\xc55 \x9c\xb1\x96\xeb\xa7\x83Y\xc2\
-s\xf7!8vO\x14\xf7\x1e=z\xb4\xaa\xaaj\xc5\
-\x8a\x15q]\x94s\xd3e\x5c-\xa4D#T\xc4\x87\
-T\x99\xdb\xc9_iE\xba\xd3\xdc\xdc\x8c\x7fN\x9f>\
-}\xeb\xd6\xad\x9c\xfe4m.\xc2\x85(,,\x5c\xb5\
-juqq\x11i\x01\xf3\x85\x84`\xcf\x9e=\xc7\x8f\
-\x1f\xdf\xb2e\x0b\x0b3\x09\xe8\xdd\xbbwY\x9e\xb9R\
-\x14\xd9JqT.\x8b`\x17\xd7qf\x07[\xdc\xed\
-\xdb\xb7\xff\xf6\xb7\xbf\xfd\x97\x7f\xf9\x97m\xdb\xb6\x11U\
-,JhtM5\xc6B=\xb2\x8aj(A\xa8\x18\
-2\x95\x92\x88Dp\x1e\x1a\x1a\xbav\xed\xda\x07\x1f|\
-\xf0\xd5W_uvv\x86\x7f\xe5E\xf1;\xa3\x8e\xf3\
-\x8aRVV\xf6\xe6\x9bo*\x13e\xb7\xbd|\xf9\xf2\
-(\x1c=\xcf\x81@B\xa4NaJ\x93E\x18\x832\
-k\x13d\xd6\xd2\x9cLkdd\xa4\xa9\xa9\xe9\xf2\xe5\
-\xcbg\xcf\x9eeE'\x13\xcd\xd1;I8\xb0\xb4\xb4\
-\xf4\xc8\x91#\xbf\xfe\xf5\xaf\xf10\x99(\xbe}-z\
-\x8e\xba\x1c\xa5/\xd4\xcb2\xf2\xd6s\x87\xa8\x08\xa1\x8c\
-s\x08\xfdd3\xad\xad\xad\xd5\xd5\xd5_\x7f\xfd5\x0b\
-@OO\x8fg\xa2/\x1f\xc6\xe4\xd8\xd88\xf9%\xe3\
-\xf3\xd1\xa3G\x5c\x85\x81\x81\x01\xbd\x9b_[[{\xe5\
-\xca\x95\xabW\xaf\xde\xbf\x7f\xff\xe1\xc3\x87]]]\xd4\
-\x92\x86R\xebW\xca\x99\x17\xd8\x02\xb1\xff\xd9\x9b\xf1\x99\
-Q#Q\x14\x999b\x14W\xb2\x87\x9d\x90L\x8d\xc1\
-9\x81\xed\x16\xe3\xbc\xa6\xa6\x86\xd0M\x00\x8f\xebf\x85\
-\x7f\x9b\xdeq^EH\x83JJJ\xd6E\x909\x11\
-\xe3\x14\x8c\x0c\x0c\x00Kd51A$\x8a\xd3\x10Z\
-J\xe6\xc8\xc99*\xa2\xa1a\x93\xcd\xca\xcdB~\xea\
-\xd4\xa9\x9b7o\xf6\xf6\xf6\xe6\xee\xfaM\xd7\xf2\xf3\xf3\
-\xd7\xae]\xbby\xf3\xe6\xf2\xf2r\xf9\x96n\x92S\xca\
-@]\x96{\xad8\x15\xaa\xe5H\x02\xa4_Z\x22\x13\
-\xcdi\xff\xe44\x5c\x88g\xcf\xbec\x0d~\xfc\xf8\xf1\
-\xf8\xf8\xf8\xd0\xd0\xd0\x83\x07\x0f\xb8(\x1f~\xf8\xe1\xa7\
-\x9f~z\xe1\xc2\x85\xe6\xe6f\xd2S\x16\xe6\xd1\xd1Q\
-\x0c\xd8B\xe4\xe8\xdd}g\xf1CH\x01\xc6\xa4\x04\xd0\
-[(h\x0cYJ\x96\x0d\x02\x11\x09Te\xc8&.\
-\x04q[z\xc3N\xc2\xdfboF b\x84\xa3\x91\
-\xf1\xac\xf1d\xd4q^9H\x83\xd8U\x93*m\xda\
-\xb4i\xe5\xca\x95\xbao\x87\x12\x14\xa4B\xb0\xd71\x14\
-D\xa8OT\x81\x94`2\x82\xde\xdc\x09\x83\x17\xc1\x8f\
-\xf0\xa9\xcf\xdb\xdd\xbbw\xaf\xb6\xb66\xd7\xef\xf9\x91\x89\
-VF\x90\xee\xe3[y\x95\xd8\x1dWG\xc8!\x10\x97\
-#\xc2\x222.\xc2]\xb8B\xef\xf6\xf6\xf7\xf7\xeb\x9b\
-4d\xa29\xfaQ\xda\xa5\x07\xd7\x88\xac\x94+\xd2\xd6\
-\xd6\xf6\xf0\xe1C\xae\x11\x97&Z\xb2']n\xc7\x99\
-wf8\xc6\xcc,\xb4\x97\x1cE\xa0\x14\xa6I\x08\x22\
-,\x86\x02a\xbc\xaf\xaf\xaf\xa5\xa5\x85\x88\xada\x1f\x19\
-\xce\x12OF\x1d\xe7\xd5\x82\xdch\xf5\xea\xd5\x87\x0e\x1d\
-z\xfb\xed\xb7\xf7\xec\xd9S^^\xbeb\xc5\x0a}Z\
-4\x8eL\x19\xc4-#bU\x84\x8a\xd2\x83)CB\
-%\x02Y\xaf\x12_\xed\xadQ\x92p\xb1\xb9&\x19%\
-\xaeuww\x0f\x0d\x0d\xe5\xf4\xf7<\x0a\x0a\x0aH\xf1\
-\x8f\x1f?\xfe\xfa\xeb\xaf\xafY\xb3f\xd9\xb2e\xf4W\
-N0b\xd3\x88\xa9\x8a8\x07\x99pO\xae3<<\
-L\x96\xd3\xd5\xd5\x85\x7f\x90\xfd{0\x8b\x0d\x063\x17\
-\x85\x8b5\xc7\xf5\xd8q\xe6\x1d\xc6\xe4T\xc4\x16ib\
-mt\xef3\x962lT\xc5\x91\xd1\x9e\xfa2eS\
-\xd3\xad[\xb78\xce\xf1\xdbK\xe0\xc9\xa8\xb3\x18!7\
-\xca\xcb\xcbK\xac\xd3\xce\xdc!\x0b\x5c\xb9r\xe5\xbe}\
-\xfb~\xf5\xab_\xfd\xf2\x97\xbf\xdc\xbbwoqq\xb1\
-\xdeG\xa6\x96\xe34>Wl\x12\xb1*b\x9a&\x90\
-\xb0\xd7\x9f\x00+R;>>\xde\xd1\xd1\xd1\xd0\xd0\xd0\
-\xd9\xd99\x91\xcb\xbf\xae\x8e{KJJH\xf1\xdfz\
-\xeb\xad\xfd\xfb\xf7\x97\x96\x96\xa2\x0c\xbb/\xd4\xfd\xc8\x0d\
-\xb1`G\x13\x08\xf7\xb8\xe2\xd1\xa3G\xb5\xb5\xb5\x17.\
-\x5c\xf8\xf2\xcb/\xcf\x9c9SWW722B\x95\
-,\x1d\xc7ye\xb1\x88\x01a\xf4\x80(\xe8\xc6\xa0\x8c\
-\xa5\xc9\x10F .d\x98\x85U\x224\x90\xfc4\xfa\
-\xd1fb\x14Ai\xee;dOF\x9d\xc5\xc5\x8a\x15\
-+6l\xd8p\xec\xd81-\xe7dN6\xcd\x9c9\
-\x82'W\xadZu\xe8\xd0\xa1\xf7\xdf\x7f\xff\xe4\xc9\x93\
-;w\xee$s\x22\x13\xa5J\xf1ED\xd1,&V\
-e\x10\xdaCh9}+\xfbH\x93\xee\x8f*\xa2u\
-uu]\xbf~]\xbfAO\x06\x968y\x0eA\xdf\
-\x0b\x0a\x0a\xaa\xaa\xaa6o\xde\xbc:\xfa\xbd%y\x83\
-c\x884Q\x8bX\xb0\xa3\x04\xc0K\xa3\xa3\xa38\xe4\
-\x9bo\xbe\xf9\xbf\xff\xf7\xff\xfe\xdb\xbf\xfd\xdb\xc7\x1f\x7f\
-|\xf7\xee]\x94\xf8P6\x8e\xe3\xbc\xcaX\xb8\x98\x0a\
-b\xa9\x11\xab\x22T\x0c\xf5\xa1\x06\xa44bm\x844\
-D\xef\xfc\xfc|\xfd\xb6\x5caa\xa1\x94s\xc1\xbfM\
-\xef\xbcT~\xfa\xd3\x9f\x92n\xe6\xe5\xe5-OC\x91\
-1\xcdh\xe6XTT\xb4v\xed\xda7\xdex\xe3?\
-\xfd\xa7\xfft\xe2\xc4\x89\x8a\x8a\x8ag\xd1\x8fC\x92\xb8\
-\xb0\xae\xc7\x0df\x80\xde\x1b\x0dg\x8eC\xec(--\
-%\xbf\xff\xcf\xff\xf9?\xbf\xf7\xde{\xbbv\xed\xb2{\
-\xa2\xf2\x92\xc55\x09R\x9a\x03S\xae\x0c\x9c\x99\x19\x04\
-\xd1\x00\x7f\xc5\xaaB{C\x06\x02\x03\xf6\xd3\xec\xaa\x1b\
-\x1a\x1a\xce\x9f?\x7f\xe5\xca\x15\xb2\xd2\x9c~\x0f\x9a\x81\
-\xcdV\xea\xc8\x91#\x87\x0f\x1f\xae\xac\xacT\xc2\x0dq\
-u\x1a\xfa\xae\xa3\x04\x88\xbc;\xc9\xd5$\xa3ccc\
-\xf5\xf5\xf5g\xcf\x9e\xbd|\xf9rss\xf3\xa3G\x8f\
-\xc6\xc7\xc7\xd1\xcb\xccq\x9cW\x0d\x226\xbb\xdc}\xfb\
-\xf6\xd9sF\x15QUk1\xc4\xb0*\x13\x8cP\x93\
-\xb5VJ\x8e:m\x14\x96R\x82\xaa\x80\xd5yhh\
-\xa8\xbd\xbd\xbd\xa9\xa9\x89\xe8\xa4\xdaY\x93|\x05\x8e\xb3\
-@0v\x0b\x0a\x0a\xc85\x81\xd4\x93uZJ`:\
-)}dj\x91\x80\x1e<x\xf0\xd0\xa1C%%%\
-\x8c\xf2k\xd7\xae\xd5\xd6\xd6\xf6\xf5\xf5\xcd\xfc\xf3X\x98\
-\xd9$\xf1\xafz\x08|\xabw\xe7\x7f\x1e\x81\xa0o\xd0\
-\xc7\xd5\x11\xf8M\x97\xc3\xfc\x8c`\xb2\x81\x81\x1d\x13\x98\
-R\xad\x12\xcd\xad\xd6\xfe\xc4\xf7\xd1\xe3\x8azzz\xbe\
-\xfd\xf6\xd2'\x9f||\xee\xdc\xb9\xfe\xfe\xfe\xb0I\xce\
-\xc1\xe8=y\xf2\xe4?\xfd\xd3?\xbd\xff\xfe\xfb\x8cs\
-yX\x1d\x8f\x9c1\xc9\x1b\x02Y\xfa\xf0H\xc6\xc9\xb8\
-\xc53\xe4\xe8\x7f\xf8\xc3\x1f\xbe\xfd\xf6\xdb\xc1\xc1A\xf4\
-\x8e\xe3\xbc\xca\xe4\x07\xcf\x19\xdd\xbau\xdb\x8a\x15\xcf\xbf\
-\x1fi\xc4\xa6\xd9\x02\xb2\x8a\x09\xa28\x94\x02\xd9lL\
-\x03\xa9\x93F\x98^op\x11\xae/]\xba\xf4\xc7?\
-\xfe\xf1\xcc\x993---2\x985\xf1\x1fs\x9c\x05\
-\x82\x81\xcb\x92\xbc|\xf9\xf2\xbc\xbc\xbcu\xeb\xd6\x1d>\
-|\x98Ds\xcd\x9a5h\xa82\x1bf\x14\x09\x13\x96\
-L6j\xf5s5\xcaT@7\x84@\xf6`m3\
-aJ<}\xfa\x94LT\xbf\xe2\xc3\x8e-Ldi\
-\x88\xcc\x5c\xfa.B\xca\xa5\x8d2\xd1={\xf6\xfc\xea\
-W\xbfz\xe7\x9dwv\xef\xde]VV&\xff\xe3\x0a\
-\x903M\x90lB\xa8\x17*&\x94\x90h\xae\xb6\xd2\
-\x80\xd5\x22\xa8\x0a\xff\x0f\x0c\x0c\xd4\xd7\xd7\x13\xcb\xbe\xfc\
-\xf2\xcb;w\xee\xcc\xf1Iu?:\x8c\xf0_\xfe\xf2\
-\x97\xff\xed\xbf\xfd\xb77\xdf|Sc\x18\x12n\x11(\
-\xa5\xe7(\xbd\x1d\x81\x11K\xf6\xf9\xe0\xc1\x83\xaf\xbf\xfe\
-\xfa\xf3\xcf?\xbfw\xef\x9e\xef\xa9\x1c\xc7\x99\x9c\x8cn\
-\xd5C\xefU\xa5\xd0\x01*\x82\x22\x0c\x84\xcaP\x16Q\
-(\x8a\x89N\x902\xb0\x1b\xae\xd2\x08\xd9\x00\x0b(1\
-\xaa\xbb\xbb\xfb/\x7f\xf9\x0b\xbb\xe5\x1b7n\x0c\x0d\x0d\
-E'\x9b=\xf1ku\x9c\x85\x80Q\xcb\xe4\xa9\xac\xac\
-\x5c\xbbv-Gf\xd1\x91#G\xc8\x8a\x90\xc9;\xa9\
-\x8d\xed\xa2\x11\xaf\xd1\xcfQ\xef\xb3#\x93}\x92V\x02\
-Bh\x9c q\x1e\x8e4a\x9e\xdc\xbau\x8bI\xf2\
-\xf0\xe1C\x92ZKd1@\x1e\x1b\x1b#\xc7\xed\xea\
-\xea\xa2JJ\xd5.=~\xfa\xd3\x9f\x92\x89\x92\x80\x92\
-\x86\xfe\xe2\x17\xbf\xd8\xbf\x7f\xbf\x9eo\x9f\xb5\xcb\xf2$\
-UB2\xca\xd0\xc3B\x9aL}\x88\x9dA\xc5\xb0\x09\
-Gb\xd9\xe8\xe8hcc\xe3\xf9\xf3\xe7I\xb9\xae_\
-\xbf\xce%\xcb\xf5\xed\xc1\xaaU\xab\x8e\x1e=\xfa\xeb_\
-\xff\x1aoo\xdc\xb8\xb1\xa0\xa0\x80\xd5B\x839\xd3\x1b\
-BE0\x03\xc6\xa7\xbe\xa6z\xe1\xc2\x85S\xa7N]\
-\xbat\xa9\xaf\xaf\xcf\x1a:\x8e\xf3\xcab\xc9\xe8o~\
-\xf3\x1b\xfb\x05&\xf4\x16=\xc2@a\xe1\xc5j\xed\x08\
-V\x1b\xc5\xa1\x18i\xc0\xe4\xd4\x19\xd3\x0d\xcdF\xc9h\
-GG\xc7g\x9f}\xf6\xef\xff\xfe\xef555\x8f\x1f\
-?\x8e\xccg\xcf\xf3\xbf\xed8\xf3\x0eI\x0fi\xe8\x1b\
-o\xbcq\xfc\xf8\xf1\xcd\x9b7#WUU\x91\x1b1\
-\x85^K\xbfM/K\xc3\x86;s\x8c\xd1\xaf\xb7\x03\
-B}&\xaa\xd2\x84\x114y\xf2\xe4\xc9\xa3G\x8fH\
-7\xfb\xa3\x1f\xf2\xb1d\x14\x81Y\xc4\xea~\xe7\xce\x1d\
-}H\x91b\xd8V\xa0\x01\x8cS\xb7O\xbf\xfb.\xd3\
- 'P&\xbaw\xef\xde\xf7\xde{\xef\xed\xb7\xdf\xde\
-\xb5kWEE\x05\xb9\x91\xe2\x97\x08\xbdjn\xa4\xe3\
-\xd6\xe5\xc8\xbb)\x12N\x90RrfU,\x05\xc8\x86\
-*\x04\xce?>>\xde\xde\xde^]]\xfd\xe5\x97_\
-\x92o\x11\xd7\xd8B\xc82w\xc1\xe1\x8c\xf0c\xc7\x8e\
-\x9d<y\x92\xa5\xa2\xac\xac\x8c1_^^\xaeGC\
-\xa8\xef\x98!p\x09t\x15L\x8fO\x18\xed\x80g\xda\
-\xda\xda\xf0\xcc\xe9\xd3\xa792D\x97\x80g\x1c\xc7\x99\
-;JF\xff%BwF\xb5\x92*\xb0\xe8\x98\x89\xd5\
-\xea\x9fH\x97\x82\xc8\xa3c\x02\xd5\xda\xd9\x12\x02G\x05\
-+\xc2\xd4\xe7\x9f\x7f\xfe\xc1\x07\x1f\xdc\xbbw\xcf\x93Q\
-g\xf1\xc2\x98.((\xd8\xb9s\xe7?\xfd\xd3?\xfd\
-\xfa\xd7\xbf\xde\xb8q#\x13\x89\xc9\x93\xf8\xccu&T\
-\xd9\xe8\x07\xe4T1h\x90h\x1b\x16\xb1\xb4\x22I$\
-\xab\xb8rM\xd3#\xa0!Ce\xfe\x90\x8c677\
-\x8f\x8d\x8d1\xb5\xd4\xc4\x90\x19Ud\xb4\x18#0\xf7\
-\xe2\xba4\xd8\xc4\xd2b\xc2\xba\x8f\x9fW\xaf^\xbdg\
-\xcf\x9ew\xdey\xe7\xddw\xdfEH\xfc|\x1c\x82d\
-\x13\xacG\x08&\xab*\x13\xb5\x92\x99\x19\x0bU\xc5\x85\
-4f\x83\xc0u!\xc7\xbav\xed\xda\xa9S\xa7\xce\x9d\
-;\xd7\xd4\xd4\xa4[\xd4K\x00F8\xd9\xe7\xfa\xf5\xeb\
-\xd7\xacY\xa3\xcf\xa5\xbc\xfe\xfa\xeb\x95\x95\x95x\x9eZ\
-\xdc\xc2\xe0G\xc6\x8c\xad\x9a&\x020\xba\xd8>\x11\xd0\
-\x19i\x0f\x1f>\xbcz\xf5\xea\xf9\xf3\xe7o\xdc\xb8A\
-\x8e\xeeo\xd0;\x8e#2\x93Q\xc5\x90\xacq\xd8\xb0\
-Z\xfdc\x1a\x05\x9f\x04\xe8U\xc51<a\xaay\x00\
-!\x8bH\xf5\xe9\xa7\x9f\x92\x8c\xde\xbf\x7f\xdf\x93Qg\
-\xf1\xc2$!\xfba1f\xda\xfc\xf2\x97\xbf\xd4\x03\xc0\
-Q\xb2\x93\xe3\x88A<\xa8\xd3i\xa2\x8d~H\xb5\x8f\
-\xc8\x9c\x12\x10\xda'\x08\xed\xa33\xa5\x04\xe5\x9aVE\
-\x91\x05~``\x80\x95\x9eD\x13\x19\x8d,C\xf4^\
-\x7fmm-i+\x96\xe3\xe3\xe3L?3CP\xb2\
-\x9b\x99\xc8\xfeX\xe0X\xf2\x1b\xb9\x17\x8a\x8b\x8bw\xed\
-\xdaE\x1a\xfa\xd6[o\xed\xde\xbd{\xe5\xca\x95T\xa9\
-V\xfd\xc5!\xf2\x09\x98\xa0\x0eZ\x112=\x93Yk\
-6\xaa\x0a\x0d@E\xb3\xe1\xaf\xe3\xcc\x07\x0f\x1e|\xf5\
-\xd5W\x7f\xf9\xcb_n\xdd\xba5<<\xac\xaa\xa5\x01\
-\x1e\xe6B\xb0N\xe8\xc7\x05N\x9c8\xb1a\xc3\x06\x8a\
-\xf8\x81*\x84\x92\x92\x92\x8a\x8a\x0aj\xd9\xad\xa1a\x5c\
-\xe1\x90\xde\xde\xde\x9e\x9e\x1e\x8ex\xa6\xba\xba\x9aL\xd4\
-\xef\x89:\x8e\x13B2\xbae\xcb\x96\x7f\xfe\xe7\x7f\xfe\
-\xedo\x7fKV\x9a\x97\x97GH\x8f\xeb2\xb0\x90k\
-QZ\xff\x98\x86\x88\x94\x09\xfa\xa9 t\x03\x02\xcd-\
-\x19\xfd\xf7\x7f\xffwVIOF\x9d\xc5\x0b\xa9\xe7\xa6\
-M\x9b~\xfe\xf3\x9f\xff\xf7\xff\xfe\xdf\x8f\x1d;Fb\
-\xaaL\x08d\x90\x9a\x1b\x116\x078J#\x03!e\
-\x5cH#\xfbLR'\x0a\xec%g6\x07\xdd\x8b\x22\
-\xa1dve\xb5!\x0fx\xf4\xe8Q}}}MM\
-Mss\xb3\xd2VY\x02\x0d\x87\x86\x86\xc8V\x07\x07\
-\x075?\xa7\x01\xfbXZ\x00\xe8#G\xbcM\x8aS\
-YYYZZJ&\x04eee\xfb\xf6\xed;y\
-\xf2\xa42Q}r\x11K\xbd\xfe\x94\x9b\xd2>TQ\
-\xb2\xb0Z\x19Ki\x98\xf1T\xb5\x10\xea\xb9\xe2\xa1\x06\
-\xd7\xe1L\x92\xad/\xbe\xf8\xe2\xd4\xa9S\xf8v\xa9\xa6\
-\x5c\xf8\x9c\xa4S\xbf\xb9\xaa{\xd2\x1c\xf5 \xd2=\x11\
-\xec\xd0~\xbal\x19{\x9a\xce\xceN\x92rm{\xc8\
-A\x89\xf2\xfe \x08\xc7q\x12\xb0\x95]\xb7n\xdd\xaf\
-\x7f\xfd\xeb\xdf\xfc\xe67\x07\x0f\x1e\xd4CQ\xa2\x88\x9b\
-e\x95\x94\xc6\xf4aQG5\x0cI\xd9\x05$4\xb4\
-\xb2d\xf4\xd9\xb3g\x84\xa9O>\xf9\xe4\x83\x0f>\xf0\
-d\xd4Y\xd4\x90\x0f\xed\xdd\xbb\x97L\xf4\xfd\xf7\xdfg\
-\xdde\xda\xd8{\xc4\x1c\x19\xcdB\xc6\xcaW\x10B\xe5\
-4\xd8$\xc94\xa6JXQG,\x99H\xa6\x07\xf2\
-Q4\x9a]\x99`O6@\xae\xd9\xd3\xd3CV:\
-66F\x16\xa5?G\x13\xe6^KK\xcb\xb5k\xd7\
-\xea\xea\xea\xf4&\xfeT/\x1b=\xf3\x96\xb6\xd8\xc4\xaa\
-\xf9\x83\xfc\x1e?\x13\x8fp\xef\xce\x9d;\x0f\x1f>\xbc\
-y\xf3\xe6\xa2\xa2\x22\x94\x85\x85\x85k\xd7\xae\xdd\xb0a\
-\x832!,\xe9;\xaf\x5c\xafS[\x02d\x15\x0ds\
-\x97\x8a\x900\x00\xd5f\xb6\x15\xd4\x82\xd5\x22\xdb\xc5\xe5\
-\xaf\xe3\x87\x91\x91\x11\x5cw\xf1\xe2\xc5\xaf\xbe\xfa\xea\xca\
-\x95+\xf8v\xaaK\xb0\x04\xa0\xef\xac\x1f\x1a\xf9r\x05\
-\xc5\xf2\xf2r\xf6\x09G\x8e\x1c\xd9\xb8qc^^\xde\
-\xc4\xc4\x04\x19yuu5\xdb\x9e\xbe\xbe>F\x1d,\
-\xc4hq\x1c'\xa7!\x92\xe8[\x92\xff\xe5\xbf\xfc\x97\
-w\xdeyg\xdb\xb6mln\x15\xdbc\x8b bK\
-\xb0\x22\x84\x1a\x8e\x0aJ\x06J\x1dCB\x0dM\xd4V\
-\x91\xbc\xb5\xb5\x95d\xf4\x0f\x7f\xf8\x03\x8b\xa0'\xa3\xce\
-\xe2\x85i\xb3e\xcb\x96\xf7\xde{\xef\x97\xbf\xfc\xa5>\
-6\xc7\xbaky\x09\x84)\x88\xe9m\xb8\xeb\x18b\x0d\
-M\xc8\xb4\x11\xe1\xd98\x22'\x8a\x1c\x85%gSA\
-\x1e\xf94\x22L7\x91I \xf4\xd9\xbe\xdb\xb7o\x93\
-N\x85_\xd8\x0f\xa1\x09g\x18\x1d\x1d\xed\xed\xed%\xaf\
-\xfd\xc1[\x80S\xbd\x98\xf05\x1bx\x98D\xb3\xa2\xa2\
-\xa2\xac\xac\x8c\xed2\x1be\xfc\xbci\xd3&\xc2\x13U\
-d\xa8\xa9\x1b\xa4\xd1\x1b\xf7\xa0&\x9c?<\x15\xc5\xc4\
-_Ly*m\xa0\xaa\xd0@U\x1c3\xab\x8c\xe8\x04\
-)3jAE@#W\x10\xc2._\xbe|\xe6\xcc\
-\x19\xbc\x87\x0f\x97\xcc\xa7E\xa7A\xdd7\xb84\xec\x13\
-\xd6\xaf_\xaf'\x1b\x10\xd6\x19B\xb8\x82#ihV\
-\xaf:\x8e\xe3@~~\xfe\x86\x0d\x1b\xde~\xfb\xed\xff\
-\xfa_\xff\xeb\x89\x13'\xf4y\xf4D\x84Q\x0c\xb1\xa3\
-\x0403\xd3@*:Gz\x09a\x15\xa8*\x14\x80\
-HN\xdcnjj\xfa\xec\xb3\xcf>\xfa\xe8\xa3\xfa\xfa\
-\xfa\xb9\x87\xf1I\x1dp\x9cy\x84\xb1[\x5c\x5c\xbcs\
-\xe7\xce\xf7\xdf\x7f\xff\xe7?\xff\xf9\xee\xdd\xbbYzW\
-\xa4?p\x8d\x81eo\x14QJ\x8e&N\x0a\x93e\
-\xccQ\xa8\x0aA\x06\x1c\x13\xc8LP\x0c\xed\x81?\xaa\
-\xaa\xd4\xa9\xd3\xcd\xad\xd6\xb0Z\x09z\xa9f\x86\x86\x04\
-bll\xac\xab\xab\xab\xb3\xb3shx\xf8i\xf4\xc1\
-S\xd5\x86\xa0$\xbd\xc0\xe6\xce\x9d;\xf7\xee\xdd\x9b\xfe\
-\xe9\xfd\xfaC\x89{\xa8\xe4\x91\xc4\x1ae\x93\xe1\xebD\
-SRR\x82W\x0f\x1f>\xbcu\xebV}]fm\
-UUIq1U\xf8\x13\xd4J2'W\xf3D_\
- |=S\xe9\x85j9R\x95\xa8U\x91*a\x1a\
-)9\xd2)2Qe\xf0\xa7O\x9f&\x1fmoo\
-\x7fes/.\x8d\xb6\x0a8\x07\x0fp\xd1\xd9\xa80\
-6\xe2j\xc7q\x9cl\x101\x88\xfc\x07\x0f\x1e\xfc\xe7\
-\x7f\xfeg\xf2\xd1M\x9b6\xb1\xaa*\xc6\x1a\x0a\xaav\
-\x94\x002S\xcc\x91F\x98^\xc5L\xacJ\x02\x91\x8a\
-\xe5\xaf\xb1\xb1\xf1\xd3\x88\x86\x86\x06OF\x9dE\x0d9\
-\xd0\xaaU\xab\x0e\x1c8\xf0\xee\xbb\xef\xb2\x87\xdb\xb3g\
-\x8f=n\x1d4I\x100\x8b\x1b\xa4g\x8e!\xa5\xec\
-AE\xf4&gb\x96&\x84\x84\xe7\x940\x15\xb24\
-{\x90\xac\xd3\x22+\xd1\x04\xdd7\x95M\x02%\x97\xe4\
-\xac\xb7\x22H\xc5\xf4E\xa8\xb8:\x0dg\x03\xf4\xd4\x92\
-\xb0\x0e\x0c\x0c\xe8\x1e*ihii)N+**\
-B6G\xf1\x02p#{\xe2C\x87\x0e\x1d=z\x94\
-xD\xde\x9f\x97\x97\xa7w\x84\xcdF9(\xe8\x05\xab\
-\xb94\x08\xa1\xdb\x0dYJ6APeBt\x8eI\
-\xb5V\xe4\xb4\xb24\x1b\x8a\xf8\x81\xe0\xd5\xda\xdaZ]\
-]}\xf6\xec\xd9+W\xae\xb4\xb5\xb5\xcd\xfd\x9d\x9d\x5c\
-\xc7\x5c\x0a\xe6@\xc7q\x9c\xa9 h\x10\xea\xf5\x9d\xfa\
-\xdf\xfc\xe67\xfa\x1a\x93E\x12\x04\x0b\xbc\x89\xa3l\xcc\
-Rz\x91\xa8\xca$QE2\xcaR\xd5\xd4\xd4\xa4d\
-\xf4\xc1\x83\x07\x9e\x8c:\x8b\x9d\xd7^{\x8d\x5c\x8a|\
-\xf4\xad\xb7\xde\x22\x1f\xdd\x1d\xfd\xfc\xcf\xb2\xe8\xc7?c\
-\x8bh\xa0k\xac\xdb\xb4\x01\xdd\xc0\x03\xab\x95 \x1b\xc3\
-\xaaL\x1fY\xc5\x03[\x82\x15\x05\xc5\xc4ID\xc2,\
-\xf5\x22\x22\xe2r\x0462\xe3\xa8WH\x06)\x1b;\
-J00c\xdevww\xb7\xb7\xb7\xf7\xf7\xf73i\
-\xc3&:!\x02J\x12\xd0\x9e\x9e\x9e{\x11\xbd\xbd\xbd\
-4\x5c\xb9r\xe5\xce\x9d;\xf7\xed\xdb\xb7n\xdd:\xbd\
-\xf9\xaeV$|\xf8\x90\xda\xf5\xeb\xd7WUU\x91\x89\
-\xea\xee\xa9\x12A\x88\xfer\xb2G\x10\xbe\xb6\xb06\x94\
-C\x9b\x04f\x86M\xe6\xa9x\xc1\x08B\xb52\x93\x07\
-\xc8>uO\x94L\x14W\xe0\x07\xd98\x8e\xe383\
-\x84\xe8\xbab\xc5\x8am\xdb\xb6\x91\x89\xfe\xf6\xb7\xbf\xdd\
-\xb1cG\x22\x19\x95\x00\x0a\xb0Q\x0cN\x81\x9cY+\
-\xa4\x0f\x8fS\xa1V$\xa3\xacV\xad\xad\xad\x9f}\xf6\
-\x99>3\xea\xc9\xa8\x93\x03\x90$\xad^\xbd\x9a4\xf4\
-\x8d7\xde8y\xf2\xe4\xde\xbd{)\xe6\xe7\xe7/\x8f\
->\xce\xc8\xe0V\x12\x13[\xa7\x87;\xcap\xfep4\
-\x81\xa3\xc8\xd4\x88\xac66\xf7\xa4\xb1\xa2\x81^U\x02\
-\x83L\x1b\x90\x8dY&l\xd4\x0a\xe2rdI_\x9e\
-DO\x91d\x02\xab_a\xef@\x1aj\xc9A\xef\xde\
-\xbd{\xf3\xe6MR7&\xfc\x9a5k\xc8\xe3\x81d\
-\x14\x8fY\xae\x09\xc8$\xa0\x84!\xf4\xca\xec\xe3\x8a\xa0\
-\x0b\xa0\xa2\x8e\xa9\x975\xf9\x85\xc5\xd2d9\x93\xccV\
-\xd2\xe8\x988Oh\x8c\xac\xdb\xbd\xfa\x82\xce\xf9\xf3\xe7\
-\xf59Q\x5c\x11\x9a9\x8e\xe383\x81\x18k\xc9\xe8\
-\xff\xf8\x1f\xff\xc3\xee\x8c\x82\x19p\xb4\x10-\xa2\x9a$\
-\xd2'\x1a\xce\x04\xdd:!\x19\xfd\xf4\xd3O?\xfc\xf0\
-\xc3y\xf9\x02\xd3\xf3\xbbS\x8e\xb3@0\xe2I\xc5\x86\
-\x87\x87GFFH\xb0(2\x8e\x81\xa1O:\xa5\x09\
-\xc0QB\xe6\xb4\x91\xde\x90\xa5P\xd1\x94Q}\xd2^\
-d\x9e6\xa1\x09\x9b\x87\xb2\x84\x90Dm\xca:J\x0d\
-U4M\x08\xb5\xe4\x8b\xcb\x96-#j\x14\x16\x16\x16\
-\xa5A.((\x90\x86cqqqII\x89\xbe\x8d\
-D\x88!\x07=z\xf4\xe8\xa1C\x87\xb6n\xdd\xaag\
-6a\xa0\x86\x80=i(Q)qCT\xc7\x90P\
-\x9f\xa8\xb5bf\xabi\xc0X\xf6\x1c\xf5\xa7\xcd\x99\x12\
-8\x02\xe9\xb5>ZD\xcc\x22\x07\xfd\xe6\x9bo\xae\x5c\
-\xb9\xd2\xd1\xd1\xe1\x99\xa8\xe38\xce\xec \xde\xb2\x94\xac\
-Z\xb5j\xef\xde\xbd\xfb\xf6\xedc\xbd\xd02\x0a\xaa\x95\
-Y\x88\xd5&H\xe8\xb3\xda\x84(n+\xb6\x7f\x17=\
-\xa1\xef\xfe\xfd\xfbz\x06\x08\xa1^6\xb3\xc6\x93Q\xe7\
-e\xc0\xf0%\xfb\x1c\x1d\x1d\x1d\x18\x18\xe8\xee\xee\xee\xea\
-\xeaB@i\xef;\x03i\x0d\xd3\x01\xc1\x9ap\xd4l\
-\x01\xc9Q\xcdse\x82\xd0\xc6\x08O(\xd94\x09t\
-\x12\x11\xab\xb2\xfd\xad\xb8\x22\x8di$\x84G\xc3\x94$\
-\x8e\xa0\xb7\xd4-\x82(U\x95f\xf9\xf2\xe5d\x9c\x15\
-\x15\x15\x1b7n\xdc\xbcy\xf3\xa6M\x9bHC\xc9P\
-\xc9b\xa9%\x06q\x045\x91\xc0\x19\xf4W \x94C\
-\xa4\x0f\x8f\xc2\xe4\xa9\x1a\x8aD-Ei8\xca\x99\xa6\
-\x09!`\x91w\x92\x89^\xbat\x89L\xf4\xda\xb5k\
-d\xa2\xfe\xee\xbc\xe38\xce\xac!\xd2\x12\xf9W\xaf^\
-M2\xbag\xcf\x1e\x04\xd6\x820\xfc&Bq*4\
-\xa7\xc3u\x02\x19\x88Dq*R\x8bh\x94\x8c\x12\xdb\
-\xdb\xdb\xdb\xef\xde\xbdK>\xcaj\xfe\xfd\x9c\x1fE\xe7\
-\xc9\xa8\xf3\x92`\x04\x93\x8f\x8e\x8c\x8c\xf4\xf6\xf62\x88\
-9\x92\x97\xb0\xbbbL\xa3\xc7\x80\x09\xc6|`\x94\x83\
-\x86;E%[a\xca\x85\x10\x22\x8d\xaa2\xe1<:\
-J\x10S\xb5J\x9dn\xeaSMC\xa2\x95\x8a\x99J\
-z\x11v\x04T\x0c!\xac\x90q\x92\x92\x16\x14\x14\xe8\
-\xc6'2\x9eA\x1f\xb7\x89\xc0Rg\x8b\xcb\x11(c\
-)[\xc2\x1d\x9d>\x85d;N\x85\xd9$\xcc2\xf5\
-\xfc-\x93u\xf9\x08Ll\x94GFF\x1f>L}\
-N\x94L\x94cgg\xa7g\xa2\x8e\xe38s\x81`\
-\xcb\x1aQVVF2j\xdf\xc1\x08\xd7\x02\x8b\xc6!\
-\xa9x\x1d\xe8%\x9b&\xac\xfaA\x88\xe1,\xdc\xac\xe0\
-\xf7\xee\xdd\xbb~\xfdzCC\x03\xcb:a?\xae\x9e\
--\x9e\x8c:/\x15\xd2\x142\x92\xa1\xa1\xa1\xc1\xc1A\
-\xb6S===\xe4(\xfa\x11#\xb2.\x190\xd09\
-\x02\xc5\xd4\x04\x0a\x92Q\x1dMo\x9a\xf08\x13R\x8d\
-3\x8c\x13\xcaD\xfe\x9a\xc8\xa2B\xcbDm\xea,\x19\
-\xafGJ#S#\xa4\xe7H\x97I@\x13!F\xc4\
-\xe54\xd2\x84\xfa\xcc\x84/j\x97\xc2d\xe9E\xa6}\
-H\xd8\x0aL\xa3V\x92\x0d\x94\xa4\xa1\x5cb.n}\
-}\xfd\xe5\xcb\x97\xcf\x9d;w\xe3\xc6\x0d\xcfD\x1d\xc7\
-q\xe6\x0e!w\xc5\x8a\x15UUU\xfb\xf7\xef\xd7\x03\
-\x13IF\xd1[@\xce\x8c\xc9\xb1\x94\x8dL\xfb\xe9\xe1\
-l,\xd6\xa3\xa3\xa3uuu\x17/^\xd4\xfb]O\
-\xe6\xe3\x09}\x9e\x8c:/\x1b\x8df\x86/))\xc9\
-\xe8\xc3\xe8\x97\x0f\x1f?~L\x0e\xca\x06\xab\xaf\xaf\xef\
-QD\x7f\x7f\xff\xf8\xf88\xc6\x96\x90\xa9\xa1\x06}8\
-\xf4\xc3\xe9\x94)d\x12\x99\xa7\x88\xcb\x11*\x9a\x92\xf3\
-\xebO\x84z\xfb\xa3\x14\xa5\x09I\xd8\x87\x02\xa4,\xd2\
-\x84\x1akeH/\xac\xa8t\xdcP+\x8e\x12BL\
-\x13V\xc5\xcd\xd2\x98\x06!\xf3\x0c\x86\xd9\xe8\x18j\xd4\
-*\xfc[\xc0\xfe\x81\x8c\x93k\xda\xda\xdaJ\xa8\xbar\
-\xe5\xca\xf9\xf3\xe7o\xde\xbc\xd9\xdd\xdd\xed\x9f\x13u\x1c\
-\xc7\x99;D\xe0\xbc\xbc<\x92Q2\xd1\x1d;v\xe8\
-\x07\xf6\xd0\x13`\x15\x9fA\x96\xf3\x8e\xce\xcc*<0\
-0@`'\xbc\x13\xe7Y\xc7u\xe7h\x8ex2\xea\
-\xfc80s\xc8>I7\x19\xca\x8clR\xcf\xae\xae\
-\xae\xc6\xc6F} \xfa\xde\xbd{\x8cr\xb6\x5cO\x9f\
->]\xbe|9\xa9\x18\xf6\xcf\xd2?\xaa\x89\xc0\x91)\
-\xc1yl\xee\x85\xb9\x8e4:\x0a\x93S\xd6\x11\xc8a\
-\x13\xc9\xd2\x87\x98&q\xfeLKaz\xd9\x88P#\
-\x192Oh\xc4\xda\x08\x8a\xcaD\x91\xedEB\xd8\x5c\
-\xa0\xc8T\x0a5\x11YmL\x19\x1a K\x90F\xbb\
-\x02S\x1a\x5c\x0b\xae\x0bWjll\xac\xad\xad\xed\xfa\
-\xf5\xeb\x17.\x5c \x13\xbdq\xe3Fmm-;\x8d\
-y\xd97;\x8e\xe38\xf0\xdak\xaf\x15\x17\x17o\xda\
-\xb4i\xeb\xd6\xadJF\x09\xce\xb6L\x880\xe4N\x13\
-~\x13\xf1<\xd3\xd2\x0c\x10$\xb3\xf2\xb2^\xdf\xbau\
-\xeb\xea\xd5\xab\xba-*\x839\xe2\xc9\xa8\xf3c\xc2\xd0\
-\xd7\xed\xb4\xe1\xe1\xe1\xee\xee\xee\x96\x96\x16\xf2\xd1\x86\x86\
-\x86\x07\x0f\x1ep|\xf8\xf0\xe1\xe8\xe8(6$:\x83\
-\x83\x83\xbac\x0a}}}L\x06R\x1f}\x83\x8f3\
-`\xc0\xd1\xce\x09\x124\x7f@Uq!*\xca&D\
-z!Y\xe9\x17\xd8\x1d\xd9\xa8u\xaaJ\xc7\x10\xab\x0a\
-\x91&\xac2AX\x95\xe9\xed\x0f\xe9(\xa2\x9a)\xdb\
-\xd2$j\xf5\xbcGVe\xb2!\xa5\x91\xa9\xd1\x0b\x80\
-\xac\xf6V\x1b\xfd\xcd\xf8\xc7N\xb9(D\xa5\xd6\xd6V\
-\x22\xd4\x993gHF\xd9T\xb4\xb7\xb7\xb3\xd3 O\
-\xb5&\x8e\xe38\xce\x1c!\xa2._\xbe\xbc\xaa\xaaj\
-\xdb\xb6m\xe5\xe5\xe5+\xa2\xdf5\x0c\x93\xd1(6O\
-\x8a\xba\x89\x22\xc8\xd8\x8e\x12 \xd3\x12\xcc\x8cZ\xdd\x19\
-\xbd{\xf7\xae~\x0a\x9b\x08/\x9b9\x12\xffy\xc7\xf9\
-\xd1\x09\xe7\x12 \xe7\xe7\xe7\xaf_\xbf~\xd7\xae]\x95\
-\x95\x95\xcc7\xd3\x03Sq\xd5\xaaU[\xb6law\
-\x88\x19\xd3#//\x8f=\x22\xb2\x0c\x04\xe7d\x13\x09\
-\xc86\xc7L@)\x01\xb0\xe4H\x15DMSm\xd1\
-(\x0d\xe5\x18Y\xc5\x7f\x1dT\x0c\x91\x1e\xe3\xb8\x1c\x91\
-ii\x06&$l\xd0[\x15\x84\xb5\xa1\xde\xe4\xc8<\
-\x85\x8a\x22\xf5R\x82\x86*\x82\x8af\x8c\xc6\xda\x9a\x12\
-A\x96\x1c\xe5\x04\x81^~H\x9d(jH&\xca.\
-\x82\x1c\xf4\xde\xbd{\xec\x22z{{\xdb\xda\xda\xec\x96\
-\xb6\x5c\xa7\xb6\x8e\xe38\xce\xbc@X&\x07}\xff\xfd\
-\xf7\xff\xe7\xff\xfc\x9fo\xbc\xf1\xc6\xea\xf4\xeflS\xa5\
-\x90\xcb1\x8c\xbd\x89\xa2 \x86'\x8e2\x83Tu\x9a\
-\xd0\x00\xa8%\xfbljj\xfa\xe4\x93O>\xfc\xf0\xc3\
-\x07\x0f\x1e\x8c\x8f\x8f\xabj\x8e\xc4\x7f\xc0q\x16!L\
-\x00\xe6Xq\xf4C\x97$\x94\xb16bY\xf4\xa0\xb5\
-\x9d;w\xee\xdd\xbb\xb7\xa4\xa4\x84\xac\xa8\xa0\xa0\x80\x9d\
-\xa2}\x80\x06{&'f\xd4\x02\xe7\x09\xe7[t\x8e\
-8\xfd\x05\xd2&\x09\xd2\xc8\x8c#rh/d\x90I\
-\xaa}F\x15\x9aDs\xc8\xd4\xa8a\xc2X\xb2\xaa\x90\
-U\xd4\x11B\xe3\xa8\xf2yCH\x9c\x10A\x9aP\x99\
- :G\xac\x0f\xfd e\xa2\x15\x1e\xfb>\xfa\xad\xf9\
-\x96\x96\x96k\xd7\xae\x9d;w\x8e|tpppl\
-llddd\xbe\xde\xb8q\x1c\xc7q\x12\x10\x8d\xcb\
-\xca\xca\xde{\xef\xbd\xdf\xfd\xeew'N\x9c@\xd6\x87\
-\xd9\xe2\xea4a\xc4\x8e\x02\xf9\xa4\xb0\xcfI\xc0d\x8e\
-\xa1\x8d\x09\xaa2KP2\xfa\xf1\xc7\x1f{2\xea\xbc\
-ZXb\x14\x82\x86\xfcr\xcd\x9a5\x1b6l \x0d\
-%7\xa2\xc8\x9c,**\xd2\x9c\xe4H>ZXX\
-\xb8u\xeb\xd6\xdd\xbbw\xaf_\xbf>??\x1f}8\
-\xdftf@\xc3\x91,\x96\xe4\x95#\xb2n\x01\x82\x19\
-C(c\x13KiR'\xcaP\x8a\xb0\xa10\x8d\x9a\
-\xcc\xa4!rX\x04\xb52\xbd\xd5f=g\xa2\x88q\
-hfg\x90^>4e\xd8\x96\x1c\x94\xd4\xff\xe9\xd3\
-\xa7\xc3\xc3\xc3\xcaD/^\xbc\xa8\xef\xcb\xa3\xc4\xd8\x5c\
-\xe78\x8e\xe3\xcc;\x04d\x16\xbbw\xdf}\xf7_\xff\
-\xf5_\x95\x8c\xb2rY<\x97\x90 \x15\xd9#T\x94\
-\x19\xa8h\xc8 aiG\xe1\xc9\xa8\xe3L\x82\xe9\xc1\
-\x0c$\xc5$}d\xe6\x90z\xb2;T*I\x91#\
-\x90\x9b\xee\xdc\xb9\xf3\xe4\xc9\x93\xfb\xf6\xed[\xb9r\xa5\
-\xb2\xcf\xc44\xa3!\xe8T\xfae#;\x89,uL\
-\x9d.e\xcf\x7fq\x91cH\xda \x89\x9a\x87B\x88\
-5\x91\x10\xfe\xc5L\x12zk\x9b\xd9JU\x1c\xb3\x9e\
-\xca\xf4\x08 \xa5A\x15\x09\xa5\xe5\x942@\x09d\xa2\
-\x8f\x1f?\x1e\x19\x19\x19\x18\x18 \xfb\xbc}\xfb6\x99\
-\xe8\xdd\xbbw\xbb\xba\xba\xc8De\xef8\x8e\xe3,\x1c\
-\xc4d\x12\xd0\x9f\xfd\xecgJF\xcb\xcb\xcbY\xbft\
-\x07AXT\x0f\xa3\xb70}h\x1f\x22\x1b\xb3\x14:\
-\x0fG\xf4\x9e\x8c:N\x16\x12\xb3\xce\x8a\x80L\x96Y\
-QQ\xb1k\xd7\xae-[\xb6\x94\x94\x94P\x8c\xeb\x22\
-0`B\xea\x86h^^\x1e\x96\xdb\xb7o\xdf\xb4i\
-\x13\x96\xe8S\x137\xb8}\x08Xr\x06\xd3D\xe7x\
-Nd\x92T\x82\xce\x13\x17&O\xf2D\x13UE\xe6\
-)AU\x99\x06\xc2jM\x19\xd6\x82\x0c\x12\xca\x04\xd8\
-\x083#\x07%\xe3$\xdc\xe8\x0ba\xe8\xa9\x95\x00\x13\
-\x13\x13\x0f\x1f>\xac\xab\xab#\x18!\xe8\xabf\xbd\xbd\
-\xbd\x9e\x89:\x8e\xe3\xbc\x1c\x88\xc9JF\xf56=\xc9\
-h\xe2mz\x05m\x09\xc4m\xc9\x8a\xe1\x92\xcd \xc4\
-\x94f\x96@\x06D{OF\x1d\xe7\x85!},.\
-..,,$\xe3\x8cUi\x98Z\xba'\x0a\xf9\xf9\
-\xf9UUUG\x22\xd6\xacY\xc3\xdc\xd6\xc4\xd3\x113\
-}z\x95\xf3(\x1f\x95>\x81\xf4\xe1L\xb6\xa4V\xc5\
-\xb0\x0a\x12\xf6\x91a2\x0aX\x88I\x9c\x19\xd0\xc4R\
-Df[\x902\xacR\xab\xc4\x11\x03\xd2P\x8e\xcf\xa2\
-_\x93\x1f\x19\x19!\xef$\x1fUC\xab\xd2\x97(/\
-_\xbe\x5c__\xdf\xdf\xdf\x8f\x19\xc6d\xae\xd88\x8e\
-\xe38/\x01\x22\xb6%\xa3'O\x9e\xd4\xdb\xf4\xac\x14\
-aT\x17\x8a\xedq!Z\x08\x12\x9a\x04a\xdb\xa9 \
-\xe0766z2\xea8/\x0c\x13\x0c\xc2\x8d\xa3\xa1\
-\xb9\xc7\x91\x14\xb3\xb4\xb4t\xfb\xf6\xed;w\xee\xb4\xb9\
-M\x95\xe6\xad\xee\x9bn\xd9\xb2e\xeb\xd6\xad\xabV\xad\
-\xb2T5A\xa8D\xd6\x9dTd\x9d\xc4B\x80\x04\x0c\
-\x84\xd5\x8a\xc8\xe4\xf9\xa9\xf42\xac\xf8\xa2\xc4'M\x9f\
-\x16t\xaa\xd4\x1fN\x0b\xd4\xea\x93\xa0\xfa%\x82\xd6\xd6\
-Vb\x8d\x9eT\x8f^\x06\xb2\x19\x1e\x1e\xa6\xaa\xae\xae\
-\xae\xb7\xb7\x97\x90\x94z/\xdf?!\xea8\x8e\xf3\x12\
-!&\xb3H\xd9gFY\x9bXkl\xc1R`\x0f\
-A)\xc1\xaa\xa2\x88\x9e\x5c\x14\x84\xe4\xcc\x93\x08\x02\xbe\
-\xbdM\xff\x87?\xfc\xa1\xa1\xa1\xc1\x93Q\xc7\x99gH\
-\x1c\xf5\xb1Q}\xf5>\x9c\x93d\x9fk\xd6\xac9r\
-\xe4\xc8\xdbo\xbfMJ\x8a\x99\xf4!J\xcbt\xdf\x94\
-\xb8@\x93\xc2\xc2B\xb2X\x04\xf46\xf9\x13! <\
-\x0fgP1TF&\xb1R\x02\xd8I\xa2\xb3\xa6\xe4\
-\xb0VP\xe4\x84\xd4Z\xbe(\x034\x91\xedsc\xd2\
-\xd0\x89\x89\x89\xb1\xb1\xb1\xc1\xc1\xc1\x96\x96\x96\xeb\xd7\xaf\
-_\xbe|\x99\x94\x14et\xfa\x14\x98q\xc4\x92\xd03\
-::\xeawC\x1d\xc7q~\x14\x88\xde\xba3J2\
-z\xf2\xe4I\xbdMoQ]\x11\x1bd,A\xb5`\
-JaU\xd2g\x0aBE\xec\xbf\x8f>\xc4\xd5\xdc\xdc\
-\xfc\xd1G\x1f}\xf8\xe1\x87\x9e\x8c:\xce\x82\xc0\x94#\
-\x8fL\xccC@Cf\xb9y\xf3\xe6\xfd\xfb\xf7\xaf[\
-\xb7\xae\xa0\xa0 \xd3&\x84}jII\xc9\xa6M\x9b\
-\xb6m\xdb\xa67\xfd9\xadM~\x1d9\x83\x9dD\x82\
-\xfe\xb4\xa1*\x91\xa9\xd1I$\x98l6\x12\x08\x1c\xa0\
-\x94\x14\x8d\xbd\x06d\x8eJR9\x92\x5c\xb6\xb7\xb7\xd7\
-\xd5\xd5\xb5\xb5\xb5\x91\x83\xd6\xd6\xd6>x\xf0```\
-@\x0d\xa3\xf3=\x07%\xc4\x05\xc7q\x1c\xe7\xe5B\x00\
-\xcfLF\x09\xef\xaa\x8db|\x0a+r\xd4\x8a\xa0#\
-HiU\x89\xda\x10\xab\x02\xecYP\x1e?~L\x0e\
-\xfaqDSS\x13EY\xce\x91,\x7f\xdbq\x9cL\
-\x98\x8ayyy\xa4\x98\xf9\xf9\xf9Y\x13V\x83*\x92\
-\xd1\xd5\xabW\xef\xdb\xb7\xef\xad\xb7\xde\xda\xbbwoi\
-iij*On\xc2\xc4N\xc5\x82\x7f\xfc\xc7\xd4\x03\
-Q#83,\x0b\x1e\xd2!K\xc8l\x1bKi\xa4\
-\xe1$*\x02Qcbb\x82m+\x1b\xd9g\xcf\x9e\
-a\xf0\xdak\xaf\xa5\xfed$pBrJ\xbd5O\
-&z\xe5\xca\x95K\x97.\xb5\xb4\xb4\x0c\x0d\x0d\xe9\x93\
-\xa04\x8fO\xe48\x8e\xe3,\x1a\x88\xde\xe1\xdb\xf4Y\
-\x93Q\x09v\x14\xb6\x8e\x98R\x1a\x8e\x029\xb4\x07)\
-%\xb0d\xb0.\x0c\x0f\x0f\xdf\xbd{\xf7\xd3O?\xfd\
-\xf3\x9f\xff\xdc\xd6\xd6\xc6*#\x8392i\x85s\x1c\
-gzH\xe3\xc2\x84o*\x98\xb7D\x87u\xeb\xd6\x91\
-\x8fn\xdf\xbe]_\xcf\xb7Y\x9d\x00=\xa7%\xd3\xd5\
-\xcf\xbbq$%M\x18gm\xabP\xc3\xff\xd4*\x82\
-\xe8\xaf(\xcb\xec\xef\xefo\x8d\x18\x18\x18\xd0\x13@e\
-\xc9\xd1 \xb2\x90\x8cvuu\xd5F\x90\x89*\xdc\xf8\
-\xbdO\xc7q\x9c\xc5\x09a|\xfadTG\x13\x22u\
-\x0a\x8b\xff\xa6D#$K\x196\x01\xe9Q\xb2.\x8c\
-\x8d\x8d555\x9d={\xf6o\x7f\xfb\xdb\xb5k\xd7\
-\xfa\xfa\xfa\xe6\xeb\xb6\xc5\xa4\x95\xc9q\x9cy\x84\x00Q\
-\x14\x81`\xf3\x5c0\xb1M\x83@\x1c\xc1\x8c\xb4\xf5\xcd\
-7\xdf<|\xf8pee%M2\x83H\xe2$ \
-\x1b\x8e\x12d\x80L\xc8hll\xbc|\xf9\xf2\x8d\x1b\
-7\xba\xbb\xbb\xf5e#\xf4\xe1\x19\xa2F)HU\xd9\
-\xec\xfa\xddP\xc7q\x9c\xc5\x0fa\xdc\x92Q\xbdMo\
-\xdf\xb8\x15Du;\x86\x82\xc5\x7fi(JcB\xa2\
-\xa1P\x95\xeeqtuu\x9d9s\xe6O\x7f\xfa\x13\
-\x8b\x0b\xf2<~y\xe0\xf9\xca\xe48\xce\xbcC\x80x\
-m\xf2\xc3M\xb3\xc2l\xc7\x92\xf8\xb2w\xef\xde\xdd\xbb\
-w+\xb8$\x22B\x18kB0\x0b-9\x15E2\
-\xcb\xb6\xb6\xb6\x9a\x9a\x1a}\xa6g\xfa;\x9d\xd8c0\
-\xbd\x8d\xe38\x8e\xb3\x18 \xc8O\x9f\x8cB\xb8(\x98\
-\xac\xb4\x12\xa4Q\xd1\x8e\xd37a\x81x\xfa\xf4ik\
-k\xeb'\x9f|\xf2\xd1G\x1f\xd5\xd5\xd5\xb1\xca\x84M\
-\xe6\x88'\xa3\x8e\xb3X\xf8\xe9O\x7fZTTT\x12\
-\xfd\x92~\xd6\xd4\xd3\xe2BH\x18V\x04\x1a}\xed}\
-xx\x98\xe3<\xc6\x0b\xc7q\x1c\xe7\xc7\x85h\x1f&\
-\xa3\x15\x15\x15\xf6M\x83\x900\xf2'\x96\x89\xb0\x98X\
-;$d\x9eM\xc9hcc#\x99( <~\xfc\
-x\x1e\x17\x97\xe4\xdfs\x1c\xe7G\x84\x1cT g\x86\
-\x83\x99C\x8c v|\x9f~j\xbd\xe38\x8e\xb34\
-`i \x19}\xef\xbd\xf7~\xf7\xbb\xdf\xbd\xf5\xd6[\
-\xba3:\xd5z\xa1%@G\xb3\x09\xd7\x85DC\xaa\
-\xd0\x88\xd0\x0cybb\xa2\xae\xae\xee\x0f\x7f\xf8\xc3\xa7\
-\x9f~\xda\xdc\xdc<__]\x12\xd9\xdf\xf8s\x1c\xe7\
-G\x81\x0c\xf2\xd9\xb3gl@\xe1\xc9\x1c\xa09\xe7\x09\
-C\x89\xe38\x8e\xb3dPx\xb7 \xaf\xf4QrH\
-VeH\x22\xe3\xd4QH\x09,L@\xf6\xa9\xc7\xad\
-\xb0\xc4\xcc\xfb\x17\x0c<\x19u\x1c\xc7q\x1c\xc7\xc9I\
-\x945Z\xfa(AD\xf5)\x12\xa9\xea4\x19\xaa\x1a\
-\x92z\xaa\xb9,)\x92\x83\xb6\xb4\xb4\xdc\xb9s\xa7\xb1\
-\xb1\x11\xd9\x93Q\xc7q\x1c\xc7q\x1c'F\x19\xa4\x88\
-U\x11\x89\xe2L\x88\xb2\xd6\x14\xc84\x8fn\x89\xa6>\
--\xda\xd3\xd3s\xfd\xfa\xf5s\xe7\xce\xdd\xbf\x7f\x7ft\
-tt\x16g\x9e\x1eOF\x1d\xc7q\x1c\xc7qr\x89\
-T\xe2\x99-#\x94^\xc4\xaa\x17A\xadHFu\x06\
-x\xf6\xec\xd9\xe3\xc7\x8f\xbb\xbb\xbb\xef\xdd\xbbWSS\
-\xd3\xd5\xd55\x11\xfdR\xb4\xec\xe7\x0bOF\x1d\xc7q\
-\x1c\xc7q\x96 Se\x8d\xba\xf7\x99\x15\x9a\xfcG\xf4\
-\xa4?\xd9|\xff\xfd\xf7ccc\xbd\xbd\xbd\xa4\xa1\xfd\
-\xfd\xfdO\x9f>\x8d\xac\xe6\x19OF\x1d\xc7q\x1c\xc7\
-qr\x89\xd4[\xe9Q\xb2h\xc2\xf4\xc8\xcc\x88\xb5\x19\
-\x84Ud\xa5\xcaD;:;\x9b\x9a\x9a\x16\xe8\x9e\xa8\
-\xf0d\xd4q\x1c\xc7q\x1c'W!\x83\xfcI\xfa\x17\
-\xa7S\x99f\x1a\xd5\xbe(4\xd4\xe3\x05\x9f={6\
-22\xd2\xd6\xd6v\xed\xda\xb5K\x97.566.\
-\xdc\x83\xab=\x19u\x1c\xc7q\x1c\xc7\xc9\x19,\xd74\
-!!\x0b\x12\xc7\xd9\xe5\x8e\xff\x11=\xa6ztt\xb4\
-\xa5\xa5\xe5\xea\xd5\xab\x17\xce\x9f\xd7/K/\xd0{\xf4\
-\xe0\xc9\xa8\xe38\x8e\xe38N\xeeA\xaa\xa9\x8c\x13(\
-\x86\xf9\xa84\xa1\x90@\xc6\x10\x97#\x0d\xc6d\xa2\xba\
-'J&z\xf9\xf2\xe5\xaf\xbf\xfe\xfa\xda\xb5kd\xa2\
-O\x9e<\x89\xed\x16\x00OF\x1d\xc7q\x1c\xc7qr\
-\x91\xe7\xa9\xe6TI\xa7P\xa5\xa5\x9eQ\x16\x9a\x92i\
-e|\xff\xfd\xf7\xdf}\xf7\x9d\xbe\xae\xf4\xe0\xc1\x83\xea\
-\xea\xeas\xe7\xce]\xb9r\xe5\xe1\xc3\x87\x8f\x1f?V\
-\xc3\x05\xc2\x93Q\xc7q\x1c\xc7q\x9c\x9cA\xb9\xa3\x04\
-\x0e\x08\x96YJ\x06}\x8aTBT\x95z\x8e\xbd\x0c\
-t\xfc\x8f\xff\xf8\x0fRO\x12P\x8a\xba\x1bJ\xc69\
-88\xd8\xde\xde~\xeb\xd6\xado\xbe\xf9\xe6\xd4\xa9S\
-W\xaf^\xed\xec\xec\x9c\xdf_\xfe\xcc\x8a'\xa3\x8e\xe3\
-8\x8e\xe389\x06I\xa4\xd2Md\xb2\xc9T\xa6\x19\
-e\x99Bi\xa82Q!K\x99\x99=\xc9(i\xe8\
-\x93'O\x86\x86\x86Z[[o\xde\xbcy\xe1\xc2\x85\
-\xd3\xa7O\x93\x89VWW\xbf\x84{\xa2\xc2\x93Q\xc7\
-q\x1c\xc7q\x9c\x5c\x82<RB\x94\x8e&\xdfp\xb7\
-*\x09\xa6A \x0d\x05r\xd0\xa7O\x9f\x92\x83\x8e\x8d\
-\x8d\x0d\x0e\x0e>z\xf4\xa8\xa1\xa1\x814\xf4\x8f\x7f\xfc\
-\xe3\xa7\x9f~J2z\xe7\xce\x9d\x9e\x9e\x9e\x05\xfd\x9c\
-hH\xfcB\x1d\xc7q\x1c\xc7q\x9cE\x0e)fY\
-Y\xd9\xcf~\xf6\xb3\x7f\xfd\xd7\x7f=y\xf2dEE\
-\xc5\xb2e\xcb\xc2\x04\xd4\x90\xc6\xaa@\x99(\x8c\x8f\x8f\
-wuu\xf5\xf5\xf5\x8d\x8e\x8e*%mkk\xbb~\
-\xfd:9hoo\xef\xc4\xc4\x04\xa9\xea\xb3g\xcf\xe2\
-f\x0b\x8f'\xa3\x8e\xe38\x8e\xe38\xb9\x01Y\xe6\xea\
-\xd5\xab\xdf~\xfb\xed\xdf\xfd\xeewo\xbd\xf5Vee\
-%\xc9h\x5c\x17$\xa3*\x86\x99(J\xcbD\x9b\x9a\
-\x9a\xae^\xbdZSS\xa3\xd4\x93|T\x9f\x16}\xf4\
-\xe8\x91\x9el\x1f6|\x09\xbc\x16\xff\xeb8\x8e\xe38\
-\x8e\xe3,zH+\x8b\x8b\x8b\xd7\xaf__QQQ\
-XXH2j\x9f\x0dU\x1aJ*\xf9\xfd\xf7\xdf+\
-\xf5D\x10\xc8O\x9f>\x1d\x19\x19!\x13\xbdt\xe9\xd2\
-\xa9S\xa7\xbe\xfd\xf6\xdb\xda\xdaZ\x8ammm]]\
-]CCCd\xa5/9\x0d\x15\x9e\x8c:\x8e\xe38\
-\x8e\xe3\xe4\x0cd\x96\xa4\x8c\xe4\xa0\x05\x05\x05EEE\
-+V\xacx\xed\xb5\xd7\xecn\xa8\x92N\xd2JC\xc5\
-\xc7\x8f\x1f\xeb\xe9\xa1\xfa\x8a\xd2\xf5\xeb\xd7;::\xd0\
-\xa0\x97\x0d\xa7\xd5\x19^>\xfe6\xbd\xe38\x8e\xe38\
-N.\x91\x9f\x9f\xbfi\xd3\xa67\xdex\xe3\xe4\xc9\x93\
-\xbb\xf7\xec\xa9\xaa\xaaZ\xb5re^^\x1eI\xea\xe8\
-\xe8h\x7f\x7f\xff\xc0\xc0\x00Y\xe6w\xdf}GnJ\
-\x9e\x8a\x1eabb\xa2\xa9\xa9\xe9\xe2\xc5\x8b7o\xde\
-|\xf4\xe8\x11\x09h|\xba\x1f\x1bOF\x1d\xc7q\x1c\
-\xc7qr\x09\xf2\xcb\x82\x82\x82u\xeb\xd6\xed\xdc\xb9s\
-\xf7n\xd2\xd1=\xbbv\xedZ\xb3f\xcd\xb3g\xcfZ\
-ZZjjj\x1a\x1b\x1b\x87\x86\x86(\x92\x83\xaa\x09\
-\x02\xb9iOO\x8f>\x1b\xbax2Q\xf0d\xd4q\
-\x1c\xc7q\x1c'\xc7 \x1f]\xb1bEII\x099\
-(\xf9\xe8\xfe\xfd\xfb7l\xd8@\xf6YWWw\xf3\
-\xe6MR\xd2\xb1\xb1\xb1\xef\xbf\xff\xde>E\xaa\x9b\xa3\
-\xba]\xfa2\xbf)?\x13<\x19u\x1c\xc7q\x1c\xc7\
-\xc9I~\xf2\x93\x9f\xe4\xe7\xe7\x97\x95\x95\xa5\xde\xa9_\
-\xb5\x8at\xb3\xa7\xa7\xa7\xa3\xa3cpp0k\xc6i\
-7J\x17\x15\x9e\x8c:\x8e\xe38\x8e\xe3\xe4*\xff\xf8\
-\x8f\xff\xb8|\xf9rRR=\xe3ibb\xe2\xf1\xe3\
-\xc7\x8b\xed\xde\xe7\xf4x2\xea8\x8e\xe38\x8e\x93\xdb\
-\xd8\xd3\x9d\xf4\x8e\xbcd\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\
-\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7\
-q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\x1c\xc7q\
-f\xca?\xfc\xc3\xff\x0f\xc5\x5cf\xbc\x81\x90\xc4\xaf\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x08\
-\x0aaZ\xa7\
-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x90\x10\xd5\x7f\x06\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
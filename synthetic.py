@@ -0,0 +1,117 @@
+"""Seeded gacha histories shaped like the record query API answers.
+
+Records stream newest first, like the API, without materializing the
+history. The pulls between two 5★ are independent once the earlier 5★
+reset both pity counters, so each stretch is simulated forwards into a
+small buffer and emitted reversed. The 50/50 guarantee is a two state
+Markov chain that is reversible, so it can be drawn newest first with
+the same odds it has forwards.
+"""
+
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from itertools import islice
+
+from wuthering import POOLTYPE, STANDARD_POOL, TIME_FORMAT
+
+FIVE_RATE = 0.008
+FIVE_SOFT_PITY = 66  # odds climb linearly from here to certainty
+FIVE_HARD_PITY = 80
+FOUR_RATE = 0.06
+FOUR_HARD_PITY = 10
+MULTI_RATE = 0.8  # share of pulls made as part of a 10-pull
+START = datetime(2024, 5, 23, 12)
+
+FEATURED = {1: "今汐", 2: "時和歲稔"}
+GUARANTEED = {2}  # featured weapons have no 50/50
+STANDARD_WEAPONS = ["蒼鱗千嶂", "停駐之煙", "千古洑流", "浩境粼光", "漪瀾浮錄"]
+FOUR_CHARACTERS = ["秧秧", "熾霞", "白芷", "散華", "桃祈", "丹瑾", "淵武", "秋水"]
+FOUR_WEAPONS = ["異響空聲", "奇幻變奏", "永夜長明", "華彩樂段", "呼嘯重音"]
+THREE_WEAPONS = ["源能長刃·測壹", "遠行者長刃·辟路", "暗夜長刃·玄明", "戍關迅刀·鎮海"]
+
+
+def _five_odds(pity: int) -> float:
+    if pity < FIVE_SOFT_PITY:
+        return FIVE_RATE
+    return FIVE_RATE + (1 - FIVE_RATE) * (pity - FIVE_SOFT_PITY + 1) / (
+        FIVE_HARD_PITY - FIVE_SOFT_PITY + 1
+    )
+
+
+def _stretch(rng: random.Random) -> list[int]:
+    # qualities from just after a 5★ up to and including the next one
+    qualities = []
+    four = 0
+    while True:
+        four += 1
+        if rng.random() < _five_odds(len(qualities) + 1):
+            qualities.append(5)
+            return qualities
+        if four >= FOUR_HARD_PITY or rng.random() < FOUR_RATE:
+            qualities.append(4)
+            four = 0
+        else:
+            qualities.append(3)
+
+
+def _item(rng: random.Random, pool: int, quality: int, won: bool) -> tuple:
+    if quality == 3:
+        return rng.choice(THREE_WEAPONS), "武器"
+    if quality == 4:
+        if rng.random() < 0.5:
+            return rng.choice(FOUR_CHARACTERS), "角色"
+        return rng.choice(FOUR_WEAPONS), "武器"
+    if pool in FEATURED and (won or pool in GUARANTEED):
+        return FEATURED[pool], "角色" if pool == 1 else "武器"
+    if pool in (1, 3):
+        return rng.choice(STANDARD_POOL), "角色"
+    return rng.choice(STANDARD_WEAPONS), "武器"
+
+
+def _qualities(rng: random.Random) -> Iterator[tuple[int, bool]]:
+    # newest first, paired with whether a 5★ was the featured one
+    stretch = _stretch(rng)
+    for quality in stretch[: rng.randrange(len(stretch))][::-1]:
+        yield quality, False
+    # the newest 5★ lost its 50/50 with the stationary odds of 1/3
+    won = rng.random() >= 1 / 3
+    while True:
+        for quality in _stretch(rng)[::-1]:
+            yield quality, won if quality == 5 else False
+        # a loss is always preceded by a win, a win by either at even odds
+        won = not won or rng.random() < 0.5
+
+
+def generate(
+    pool: int = 1,
+    count: int | None = None,
+    seed: int = 0,
+    start: datetime = START,
+) -> Iterator[dict]:
+    """Records of one pool newest first, endless when count is None."""
+    if pool not in POOLTYPE:
+        raise KeyError(f"Unknown pool {pool}.")
+    rng = random.Random(f"{seed}:{pool}")
+    stamp = start
+    group = 0
+    for quality, won in islice(_qualities(rng), count):
+        if group == 0:
+            stamp -= timedelta(seconds=rng.randint(30, 21_600))
+            time = stamp.strftime(TIME_FORMAT)
+            group = 10 if rng.random() < MULTI_RATE else 1
+        group -= 1
+        name, resourcetype = _item(rng, pool, quality, won)
+        yield {
+            "name": name,
+            "resourceType": resourcetype,
+            "qualityLevel": quality,
+            "cardPoolType": pool,
+            "time": time,
+        }
+
+
+def generate_all(
+    count: int | None = None, seed: int = 0, start: datetime = START
+) -> dict[int, Iterator[dict]]:
+    return {pool: generate(pool, count, seed, start) for pool in POOLTYPE}
@@ -0,0 +1,96 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import wuthering
+from synthetic import generate
+from wuthering import POOLTYPE, TokenBucket
+
+PAYLOAD = {
+    "serverId": "server",
+    "playerId": "100000001",
+    "languageCode": "zh-Hant",
+    "recordId": "record",
+    "cardPoolId": "pool",
+}
+
+
+class StandIn(ThreadingHTTPServer):
+    """Local stand-in for API_URL, answering like the record query API."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.delay = 0.0  # seconds before every answer
+        self.fail: set[int] = set()  # pools answered with a 500
+        # served in order to the next calls, before delay and fail apply
+        self.delays: list[float] = []
+        self.statuses: list[int] = []
+        self.calls: list[int] = []
+        self.records = {
+            pool: list(generate(pool, 300)) for pool in POOLTYPE
+        }
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/gacha/record"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandIn
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        pool = int(json.loads(self.rfile.read(length))["cardPoolType"])
+        server = self.server
+        server.calls.append(pool)
+        time.sleep(server.delays.pop(0) if server.delays else server.delay)
+        if server.statuses:
+            status = server.statuses.pop(0)
+        else:
+            status = 500 if pool in server.fail else 200
+        if status != 200:
+            body = {"code": -1, "message": "error"}
+        else:
+            body = {
+                "code": 0,
+                "message": "success",
+                "data": server.records[pool],
+            }
+        content = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    server = StandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(wuthering, "API_URL", server.url)
+    # the shared limiter would throttle tests against each other
+    monkeypatch.setattr(
+        wuthering.WutheringData, "limiter", TokenBucket(1000.0, 1000)
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def backend(api):
+    data = wuthering.WutheringData(retries=0)
+    data.payload = PAYLOAD.copy()
+    yield data
+    data.close()
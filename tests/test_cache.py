@@ -0,0 +1,64 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cache
+from cache import ResponseCache
+
+BODY = b'{"code":0,"message":"success","data":[]}'
+
+
+def payload(pool: int) -> dict:
+    return {"playerId": "100000001", "cardPoolType": pool}
+
+
+def test_round_trip(tmp_path):
+    store = ResponseCache(str(tmp_path))
+    assert store.get(payload(1)) is None
+    store.put(payload(1), BODY)
+    assert store.get(payload(1)) == BODY
+
+
+def test_evict_skips_entries_removed_meanwhile(tmp_path, monkeypatch):
+    store = ResponseCache(str(tmp_path), max_bytes=len(BODY))
+    for pool in range(4):
+        store.put(payload(pool), BODY)
+    scandir = os.scandir
+
+    def racing(path):
+        # another thread evicts right after this one listed the entries
+        entries = list(scandir(path))
+        os.remove(entries[0].path)
+        return scandir_context(entries)
+
+    class scandir_context(list):
+        def __enter__(self):
+            return iter(self)
+
+        def __exit__(self, *exc):
+            pass
+
+    monkeypatch.setattr(cache.os, "scandir", racing)
+    store.put(payload(9), BODY)
+    monkeypatch.setattr(cache.os, "scandir", scandir)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_get_survives_failing_touch(tmp_path, monkeypatch):
+    store = ResponseCache(str(tmp_path))
+    store.put(payload(1), BODY)
+
+    def denied(*args):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(cache.os, "utime", denied)
+    assert store.get(payload(1)) == BODY
+
+
+def test_concurrent_puts(tmp_path):
+    store = ResponseCache(str(tmp_path), max_bytes=len(BODY) * 3)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [
+            executor.submit(store.put, payload(_), BODY) for _ in range(400)
+        ]:
+            future.result()
+    assert len(os.listdir(tmp_path)) <= 3
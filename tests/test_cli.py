@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+from conftest import PAYLOAD
+from synthetic import generate
+from wuthering import FETCH_URL, TEMP_PAYLOAD, PoolData
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def restore_logger():
+    yield
+    # main points loguru at the captured stderr, which closes with the test
+    cli.log.setup(sys.stderr, "DEBUG")
+
+
+@pytest.fixture
+def client_log(tmp_path):
+    query = "&".join(f"{TEMP_PAYLOAD[k]}={v}" for k, v in PAYLOAD.items())
+    path = tmp_path / "Client.log"
+    path.write_text(f'[Info] open url "{FETCH_URL}{query}"\n', "utf-8")
+    return str(path)
+
+
+def run(capsys, *argv: str) -> tuple[int, str]:
+    code = cli.main(list(argv))
+    return code, capsys.readouterr().out
+
+
+def test_json(api, client_log, capsys):
+    code, out = run(capsys, "--log", client_log, "--json", "--no-store")
+    assert code == 0
+    result = json.loads(out)
+    assert result["player"] == PAYLOAD["playerId"]
+    for pool in result["pools"]:
+        assert pool["attempt"] == len(api.records[pool["pool"]])
+
+
+def test_plain(api, client_log, capsys):
+    code, out = run(capsys, "--log", client_log, "--pool", "1", "--no-store")
+    assert code == 0
+    assert out.startswith("角色活動  抽取次數 300")
+
+
+def test_missing_log(tmp_path, capsys):
+    missing = str(tmp_path / "missing.log")
+    code, out = run(capsys, "--log", missing, "--no-store")
+    assert code == 1
+    assert out == ""
+
+
+def test_rich(capsys):
+    summary = cli.summary(1, PoolData().load(list(generate(1, 2000))), -1)
+    assert summary["history"]
+    summary["history"][0]["standard"] = True
+    summary["history"][-1]["standard"] = False
+    cli.render_rich([summary])
+    out = capsys.readouterr().out
+    assert summary["name"] in out
+    assert summary["history"][0]["name"] in out
+
+
+def test_quiet_run_skips_loguru(api, client_log):
+    # loguru alone takes longer to import than the rest of the command line
+    script = (
+        "import sys, wuthering, cli;"
+        f"wuthering.API_URL = {api.url!r};"
+        f"code = cli.main(['--log', {client_log!r}, '--json', '--no-store']);"
+        "sys.exit(code or 'loguru' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, cwd=ROOT
+    )
+    assert result.returncode == 0, result.stderr
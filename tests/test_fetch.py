@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from time import perf_counter, sleep
+
+import pytest
+
+import wuthering
+from conftest import PAYLOAD
+from history import HistoryStore
+from wuthering import (
+    POOLTYPE,
+    AsyncWutheringData,
+    PoolData,
+    TokenBucket,
+    WutheringData,
+)
+
+DELAY = 0.1
+
+
+def timed(func) -> float:
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(wuthering, "backoff", lambda attempt: 0.0)
+
+
+def client(**kwargs) -> WutheringData:
+    backend = WutheringData(**kwargs)
+    backend.payload = PAYLOAD.copy()
+    return backend
+
+
+def test_retry_recovers_from_server_errors(api, no_backoff):
+    api.statuses = [503, 503]
+    data = client(retries=2).fetch_data(1)
+    assert data.attempt == len(api.records[1])
+    assert api.calls == [1, 1, 1]
+
+
+def test_exhausted_retries_raise(api, no_backoff):
+    api.statuses = [503, 503, 503]
+    with pytest.raises(KeyError):
+        client(retries=2).fetch_data(1)
+    assert api.calls == [1, 1, 1]
+
+
+def test_read_timeout_is_retried(api, no_backoff):
+    api.delays = [1.0]
+    data = client(read_timeout=0.2, retries=1).fetch_data(1)
+    assert data.attempt == len(api.records[1])
+    assert api.calls == [1, 1]
+
+
+def test_rate_limiter_paces_requests(api, backend, monkeypatch):
+    # a burst of 2 goes out at once, the other 4 wait 0.1s each
+    monkeypatch.setattr(WutheringData, "limiter", TokenBucket(10.0, 2))
+    elapsed = timed(lambda: [backend.fetch_data(1) for _ in range(6)])
+    assert 0.39 <= elapsed < 1.0
+    assert len(api.calls) == 6
+
+
+def test_token_bucket_is_shared_by_threads():
+    bucket = TokenBucket(10.0, 2)
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert perf_counter() - start >= 0.39
+
+
+def test_concurrent_fetch_is_faster(api, backend):
+    api.delay = DELAY
+    sequential = timed(backend.populate_data)
+    concurrent = timed(lambda: backend.populate_data(concurrent=True))
+    assert sequential >= DELAY * len(POOLTYPE)
+    assert concurrent < sequential / 2
+    assert sorted(api.calls) == sorted(list(POOLTYPE) * 2)
+
+
+def test_concurrent_fetch_shares_one_session(api, backend, monkeypatch):
+    import requests
+
+    sessions = []
+
+    class SlowSession(requests.Session):
+        def __init__(self):
+            sleep(0.05)  # widens the window in which the fetches race
+            super().__init__()
+            sessions.append(self)
+
+    monkeypatch.setattr(requests, "Session", SlowSession)
+    backend.populate_data(concurrent=True)
+    assert len(sessions) == 1
+    assert backend.session is sessions[0]
+
+
+def test_concurrent_fetch_isolates_failing_pool(api, backend):
+    api.delay = DELAY
+    api.fail = {2}
+    backend.populate_data(concurrent=True)
+    assert list(backend.data) == list(POOLTYPE.values())
+    assert backend.data[POOLTYPE[2]] is None
+    for pool, records in api.records.items():
+        if pool == 2:
+            continue
+        expected = PoolData().load(records)
+        data = backend.data[POOLTYPE[pool]]
+        assert data.attempt == expected.attempt
+        assert data.columns.pity == expected.columns.pity
+
+
+def test_failing_pool_keeps_previous_data(api, backend):
+    backend.populate_data(concurrent=True)
+    previous = backend.data[POOLTYPE[2]]
+    api.fail = {2}
+    backend.populate_data(concurrent=True)
+    assert backend.data[POOLTYPE[2]] is previous
+
+
+def test_async_fetch_isolates_failing_pool(api):
+    api.delay = DELAY
+    api.fail = {2}
+
+    async def populate() -> AsyncWutheringData:
+        async with AsyncWutheringData(retries=0) as backend:
+            backend.payload = PAYLOAD.copy()
+            await backend.populate_data()
+        return backend
+
+    backend = asyncio.run(populate())
+    assert sorted(api.calls) == sorted(POOLTYPE)
+    assert backend.data[POOLTYPE[2]] is None
+    for pool, records in api.records.items():
+        if pool != 2:
+            expected = PoolData().load(records)
+            data = backend.data[POOLTYPE[pool]]
+            assert data.attempt == expected.attempt
+            assert data.columns.pity == expected.columns.pity
+
+
+def test_async_store_work_runs_off_the_loop(api, monkeypatch):
+    threads = set()
+    merge = HistoryStore.merge
+
+    def tracked(self, *args):
+        threads.add(threading.current_thread())
+        return merge(self, *args)
+
+    monkeypatch.setattr(HistoryStore, "merge", tracked)
+
+    async def populate() -> None:
+        store = HistoryStore(":memory:")
+        async with AsyncWutheringData(retries=0, store=store) as backend:
+            backend.payload = PAYLOAD.copy()
+            await backend.populate_data()
+        store.close()
+
+    asyncio.run(populate())
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,123 @@
+import pytest
+
+from cache import ResponseCache
+from history import HistoryStore
+from synthetic import generate
+from wuthering import POOLTYPE, RecordBuilder, WutheringData
+
+PLAYER = "100000001"
+
+
+@pytest.fixture
+def store():
+    store = HistoryStore(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def full():
+    # newest first like an API response
+    return list(generate(1, 500, seed=7))
+
+
+def test_merge_adds_only_newer_pulls(store, full):
+    assert store.merge(PLAYER, 1, full[100:400]) == full[100:400]
+    assert store.merge(PLAYER, 1, full[0:300]) == full[0:100]
+    assert store.records(PLAYER, 1) == full[0:400]
+
+
+@pytest.mark.parametrize(
+    "window",
+    [(100, 400), (0, 300), (50, 350), (0, 400), (399, 400), (300, 400)],
+)
+def test_merge_ignores_replayed_window(store, full, window):
+    store.merge(PLAYER, 1, full[100:400])
+    store.merge(PLAYER, 1, full[0:300])
+    start, end = window
+    assert store.merge(PLAYER, 1, full[start:end]) == []
+    assert store.count(PLAYER, 1) == 400
+    assert store.records(PLAYER, 1) == full[0:400]
+
+
+@pytest.mark.parametrize("cut", [1, 5, 9, 13])
+def test_merge_overlap_inside_multi_pull(store, full, cut):
+    # windows cut inside a 10-pull whose records share every field
+    store.merge(PLAYER, 1, full[100 + cut : 400])
+    store.merge(PLAYER, 1, full[cut : 100 + cut + 10])
+    assert store.records(PLAYER, 1) == full[cut:400]
+
+
+@pytest.mark.parametrize(
+    "stored, imported, added",
+    [
+        ((0, 400), (0, 100), 0),  # export inside the store
+        ((0, 400), (100, 300), 0),
+        ((0, 400), (0, 400), 0),
+        ((100, 300), (0, 400), 200),  # store inside the export
+        ((100, 400), (0, 300), 100),  # export is newer
+        ((0, 300), (100, 400), 100),  # export is older
+        ((200, 400), (0, 200), 200),  # adjacent, no overlap
+        ((0, 200), (200, 400), 200),
+    ],
+)
+def test_import_records_never_drops_pulls(
+    store, full, stored, imported, added
+):
+    store.merge(PLAYER, 1, full[slice(*stored)])
+    assert store.import_records(PLAYER, 1, full[slice(*imported)]) == added
+    start = min(stored[0], imported[0])
+    end = max(stored[1], imported[1])
+    assert store.records(PLAYER, 1) == full[start:end]
+
+
+def test_import_records_refuses_conflicting_export(store, full):
+    store.merge(PLAYER, 1, full[0:100])
+    # same times as stored pulls, but different ones
+    other = [{**item, "name": "散華"} for item in full[50:150]]
+    with pytest.raises(ValueError):
+        store.import_records(PLAYER, 1, other)
+    assert store.records(PLAYER, 1) == full[0:100]
+
+
+def builder(records: list) -> RecordBuilder:
+    result = RecordBuilder()
+    for item in records:
+        result.add(item)
+    return result
+
+
+def test_merge_reads_builder_arrays(store, full, monkeypatch):
+    def as_dicts(self):
+        raise AssertionError("merge turned the builder into dicts")
+
+    monkeypatch.setattr(RecordBuilder, "__iter__", as_dicts)
+    assert store.merge(PLAYER, 1, builder(full[100:400])) == full[100:400]
+    assert store.merge(PLAYER, 1, builder(full[0:300])) == full[0:100]
+    assert store.merge(PLAYER, 1, builder(full[50:350])) == []
+    assert store.merge(PLAYER, 1, RecordBuilder()) == []
+    assert store.records(PLAYER, 1) == full[0:400]
+
+
+def test_offline_replay_adds_nothing(api, tmp_path):
+    pool = 1
+    records = api.records[pool]
+    store = HistoryStore(":memory:")
+
+    def fetch(cache: ResponseCache | None = None) -> WutheringData:
+        backend = WutheringData(retries=0, store=store, cache=cache)
+        backend.payload = {"playerId": PLAYER}
+        backend.populate_data(concurrent=True)
+        backend.close()
+        return backend
+
+    api.records[pool] = records[100:]
+    fetch(ResponseCache(str(tmp_path)))  # cached, then pulls go on
+    api.records[pool] = records
+    fetch()
+    assert store.count(PLAYER, pool) == len(records)
+
+    backend = fetch(ResponseCache(str(tmp_path), offline=True))
+    assert store.count(PLAYER, pool) == len(records)
+    assert backend.data[POOLTYPE[pool]].attempt == len(records)
+    store.close()
@@ -0,0 +1,56 @@
+import pytest
+
+from synthetic import generate
+from wuthering import POOLTYPE, PoolData
+
+SIZE = 5000
+
+
+def reference(data: list) -> tuple[int, dict[int, list[tuple]]]:
+    # the original PoolData.load, re-sorting every earlier 4★/5★ per pull
+    attempt = 0
+    entry = {4: [], 5: []}
+    for item in data[::-1]:
+        attempt += 1
+        quality = item["qualityLevel"]
+        if quality < 4:
+            continue
+        _entry = entry[quality].copy()
+        if quality == 4:
+            _entry.extend(entry[5])
+            _entry = sorted(_entry, key=lambda x: x[0])
+        pity = attempt - (0 if not _entry else _entry[-1][0])
+        entry[quality].append((attempt, pity, item["name"]))
+    return attempt, entry
+
+
+def pulls(data: PoolData, quality: int) -> list[tuple]:
+    columns = data.columns
+    return [
+        (columns.attempt[_], columns.pity[_], columns.names[columns.name[_]])
+        for _ in columns.index[quality]
+    ]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("pool", list(POOLTYPE))
+def test_load_matches_reference(pool, seed):
+    records = list(generate(pool, SIZE, seed=seed))
+    attempt, entry = reference(records)
+    data = PoolData().load(records)
+    assert data.attempt == attempt == SIZE
+    for quality in (4, 5):
+        assert pulls(data, quality) == entry[quality]
+
+
+@pytest.mark.parametrize("split", [1, 10, 999, SIZE - 1])
+def test_append_matches_load(split):
+    records = list(generate(1, SIZE, seed=3))
+    data = PoolData().load(records[split:])
+    data.append(records[:split])
+    full = PoolData().load(records)
+    assert data.attempt == full.attempt
+    assert data.columns.pity == full.columns.pity
+    assert data.columns.time == full.columns.time
+    for quality in (4, 5):
+        assert pulls(data, quality) == pulls(full, quality)
@@ -14,6 +14,8 @@ API_URL = "https://gmserver-api.aki-game2.net/gacha/record/query"
 
 EXE_NAME = "Client-Win64-Shipping.exe"
 LOG_PATH_EXTEND = ["Saved", "Logs", "Client.log"]
+CONFIG_DIR = "wutheringacha"
+CONFIG_FILE = "config.json"
 
 TEMP_PAYLOAD = {
     "serverId": "svr_id",
@@ -34,15 +36,421 @@ POOLTYPE = {
 
 STANDARD_POOL = ["安可", "鑒心", "維里奈", "卡卡羅", "凌陽"]
 
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 8.0
+RATE_LIMIT = 4.0  # requests per second, shared by the whole process
+RATE_BURST = 8
+CHUNK_SIZE = 64 * 1024  # bytes of response body decoded at a time
+
+DISCOVERY_DEPTH = 6
+DISCOVERY_BUDGET = 5.0  # seconds
+DISCOVERY_WORKERS = 8
+DISCOVERY_SKIP = {
+    "windows",
+    "programdata",
+    "system volume information",
+    "node_modules",
+    "proc",
+    "sys",
+    "dev",
+    "run",
+    "tmp",
+    "dosdevices",
+}
+
+
+import codecs
+import json
+import mmap
+import ntpath
 import os
+import random
 import re
+import string
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from subprocess import CalledProcessError, check_output
+from queue import Queue
+from threading import Lock, Thread
+from time import monotonic, perf_counter, sleep
+from typing import TYPE_CHECKING
+
+# requests, psutil and asyncio load on first use, which keeps the import
+# cheap for the command line and for pure data work
+if TYPE_CHECKING:
+    import requests
+    from psutil import Process
+
+    from cache import ResponseCache
+    from history import HistoryStore
+
+
+class LazyLogger:
+    """Stands in for loguru's logger, importing it on the first message.
+
+    loguru takes longer to import than the whole backend. Messages below
+    the level given to setup are dropped without it, so the command line
+    only pays for loguru once it has something to report.
+    """
+
+    LEVELS = {
+        "TRACE": 5,
+        "DEBUG": 10,
+        "INFO": 20,
+        "SUCCESS": 25,
+        "WARNING": 30,
+        "ERROR": 40,
+        "CRITICAL": 50,
+    }
+
+    def __init__(self):
+        self.threshold = 0
+        self._sink: tuple | None = None
+        self._lock = Lock()
+
+    def setup(self, sink, level: str) -> None:
+        # replaces every handler with sink, deferred until loguru loads
+        self.threshold = self.LEVELS[level]
+        with self._lock:
+            self._sink = (sink, level)
+        if "loguru" in sys.modules:
+            self._logger()
+
+    def _logger(self):
+        from loguru import logger
+
+        with self._lock:
+            if self._sink is not None:
+                sink, level = self._sink
+                self._sink = None
+                logger.remove()
+                logger.add(sink, level=level)
+        return logger
+
+    def _log(self, level: str, message: str, *args, **kwargs) -> None:
+        if self.LEVELS[level] >= self.threshold:
+            # depth 2 reports the caller of debug, info, ... as the origin
+            self._logger().opt(depth=2).log(level, message, *args, **kwargs)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        self._log("DEBUG", message, *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        self._log("INFO", message, *args, **kwargs)
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        self._log("WARNING", message, *args, **kwargs)
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        self._log("ERROR", message, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # add, remove, exception and the rest are loguru's own
+        return getattr(self._logger(), name)
+
+
+log = LazyLogger()
+
+
+def parse_time(value: str) -> int:
+    # fixed-width fields are sliced by hand, strptime is only the fallback
+    fields = "".join(
+        value[i : i + 2] for i in (0, 2, 5, 8, 11, 14, 17)
+    )
+    if (
+        len(value) == 19
+        and value[4] + value[7] + value[10] + value[13] + value[16]
+        == "-- ::"
+        and fields.isascii()
+        and fields.isdigit()
+    ):
+        try:
+            return int(
+                datetime(
+                    int(fields[0:4]),
+                    int(fields[4:6]),
+                    int(fields[6:8]),
+                    int(fields[8:10]),
+                    int(fields[10:12]),
+                    int(fields[12:14]),
+                ).timestamp()
+            )
+        except ValueError:
+            pass
+    return int(datetime.strptime(value, TIME_FORMAT).timestamp())
+
+
+def parse_times(values: Iterable[str]) -> list[int]:
+    # a 10-pull shares one timestamp, parse each distinct value once
+    cache: dict[str, int] = {}
+    stamps = []
+    for value in values:
+        if (stamp := cache.get(value)) is None:
+            stamp = cache[value] = parse_time(value)
+        stamps.append(stamp)
+    return stamps
+
+
+def config_path() -> str:
+    base = (
+        os.environ.get("APPDATA")
+        or os.environ.get("XDG_CONFIG_HOME")
+        or os.path.join(os.path.expanduser("~"), ".config")
+    )
+    return os.path.join(base, CONFIG_DIR, CONFIG_FILE)
+
+
+def load_config() -> dict:
+    try:
+        with open(config_path(), "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_config(**values) -> None:
+    path = config_path()
+    config = load_config() | values
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(config, file, ensure_ascii=False, indent=2)
+        os.replace(f"{path}.tmp", path)
+    except OSError as e:
+        log.warning("Unable to save config: {error!r}", error=e)
+
+
+def _is_client(name: str) -> bool:
+    # linux truncates process names to 15 chars, e.g. under Wine/Proton
+    return name == EXE_NAME or (len(name) == 15 and EXE_NAME.startswith(name))
+
+
+def _wine_path(path: str, environ: dict[str, str]) -> str:
+    # map a Windows path reported under Wine through the prefix drives
+    if not (prefix := environ.get("WINEPREFIX")):
+        prefix = (
+            os.path.join(environ["STEAM_COMPAT_DATA_PATH"], "pfx")
+            if "STEAM_COMPAT_DATA_PATH" in environ
+            else os.path.expanduser("~/.wine")
+        )
+    drive, rest = ntpath.splitdrive(path)
+    parts = rest.replace("\\", "/").split("/")
+    return os.path.join(prefix, "dosdevices", drive.lower(), *parts)
+
+
+def _steam_libraries(steam: str) -> list[str]:
+    vdf = os.path.join(steam, "steamapps", "libraryfolders.vdf")
+    try:
+        with open(vdf, "r", encoding="utf-8") as file:
+            found = re.findall(r'"path"\s+"([^"]+)"', file.read())
+    except OSError:
+        found = []
+    return [steam, *(_.replace("\\\\", "\\") for _ in found)]
+
+
+def discovery_roots() -> list[str]:
+    home = os.path.expanduser("~")
+    roots: list[str] = []
+    prefixes = [os.environ.get("WINEPREFIX", ""), os.path.join(home, ".wine")]
+    if os.name == "nt":
+        roots += [f"{_}:\\" for _ in string.ascii_uppercase]
+        programs = os.environ.get(
+            "ProgramFiles(x86)", r"C:\Program Files (x86)"
+        )
+        steams = [os.path.join(programs, "Steam")]
+    else:
+        steams = [
+            os.path.join(home, ".steam", "steam"),
+            os.path.join(home, ".local", "share", "Steam"),
+            os.path.join(
+                home, ".var", "app", "com.valvesoftware.Steam", "data", "Steam"
+            ),
+        ]
+        prefixes.append(os.path.join(home, "Games"))  # Lutris default
+        roots += ["/mnt", "/media", f"/run/media/{os.path.basename(home)}"]
+    for steam in steams:
+        for library in _steam_libraries(steam):
+            roots.append(os.path.join(library, "steamapps", "common"))
+            compat = os.path.join(library, "steamapps", "compatdata")
+            if os.path.isdir(compat):
+                prefixes += [
+                    os.path.join(compat, _, "pfx") for _ in os.listdir(compat)
+                ]
+    roots += [os.path.join(_, "drive_c") for _ in prefixes if _]
+    if os.name != "nt":
+        roots.append(home)
+    return [_ for _ in dict.fromkeys(roots) if os.path.isdir(_)]
+
+
+def discover_logs(
+    roots: list[str] | None = None,
+    max_depth: int = DISCOVERY_DEPTH,
+    budget: float = DISCOVERY_BUDGET,
+    workers: int = DISCOVERY_WORKERS,
+) -> list[str]:
+    """Every Client.log below the PATH chain, newest modified first.
+
+    Directories are walked breadth first by a pool of threads sharing one
+    queue, so a single large drive is still searched in parallel.
+    """
+    deadline = monotonic() + budget
+    # a directory named like a PATH entry before "Client" pins the layout
+    chain = {
+        name.casefold(): index
+        for index, name in enumerate(PATH[: PATH.index("Client")])
+    }
+    found: dict[str, float] = {}
+    lock = Lock()
+    pending: Queue[tuple[str, int] | None] = Queue()
+
+    def check(directory: str, index: int) -> None:
+        logfile = os.path.join(
+            directory, *PATH[index + 1 :], LOG_PATH_EXTEND[-1]
+        )
+        try:
+            mtime = os.stat(logfile).st_mtime
+        except OSError:
+            return
+        log.debug("Discovered {path}", path=logfile)
+        with lock:
+            found[os.path.realpath(logfile)] = mtime
+
+    def scan(directory: str, depth: int) -> None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                name = entry.name.casefold()
+                if name in chain:
+                    check(entry.path, chain[name])
+                elif (
+                    depth < max_depth
+                    and name not in DISCOVERY_SKIP
+                    and entry.name[0] not in ".$"
+                ):
+                    pending.put((entry.path, depth + 1))
+
+    def worker() -> None:
+        while (task := pending.get()) is not None:
+            try:
+                if monotonic() < deadline:
+                    scan(*task)
+            except OSError:
+                pass
+            finally:
+                pending.task_done()
+
+    roots = discovery_roots() if roots is None else roots
+    log.info("Searching {count} roots for Client.log", count=len(roots))
+    for root in roots:
+        pending.put((root, 0))
+    threads = [Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    pending.join()
+    for thread in threads:
+        pending.put(None)
+    if monotonic() >= deadline:
+        log.warning("Log discovery ran out of time budget")
+    return sorted(found, key=found.__getitem__, reverse=True)
+
+
+def _scan_forward(logfile: str) -> str:
+    with open(logfile, "r", encoding="utf-8") as file:
+        for line in file:
+            if FETCH_URL in line:
+                return line
+    return ""
+
+
+def _last_url(buffer, end: int | None = None) -> str:
+    # newest line holding FETCH_URL within buffer[:end], searched backwards
+    end = len(buffer) if end is None else end
+    if (index := buffer.rfind(FETCH_URL.encode(), 0, end)) == -1:
+        return ""
+    start = buffer.rfind(b"\n", 0, index) + 1
+    stop = buffer.find(b"\n", index, end)
+    return bytes(buffer[start : end if stop == -1 else stop]).decode(
+        "utf-8", errors="replace"
+    )
+
 
-import requests
-from loguru import logger as log
-from psutil import NoSuchProcess, Process
+def find_fetch_url(logfile: str) -> str:
+    # the newest url sits near the end, search the mapped log backwards
+    try:
+        with open(logfile, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            return _last_url(mm)
+    except (OSError, ValueError) as e:
+        # empty files cannot be mapped, nor can some special filesystems
+        log.debug("Falling back to forward log scan: {error!r}", error=e)
+        return _scan_forward(logfile)
+
+
+class LogTailer:
+    """Follows a log file, reading only the bytes appended since last poll.
+
+    Callbacks receive every new FETCH_URL line as soon as a poll sees it.
+    A changed inode or a shrinking file restarts the scan from the top.
+    """
+
+    def __init__(
+        self, logfile: str, callback: Callable[[str], None] | None = None
+    ):
+        self.logfile = logfile
+        self.offset = 0  # end of the last complete line already scanned
+        self.inode: tuple[int, int] | None = None
+        self._callbacks: list[Callable[[str], None]] = []
+        if callback:
+            self.subscribe(callback)
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        self._callbacks.append(callback)
+
+    def _read(self, file, size: int) -> tuple[str, int]:
+        if self.offset == 0:
+            try:
+                with mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    end = mm.rfind(b"\n") + 1
+                    return _last_url(mm, end), end
+            except (OSError, ValueError):
+                pass
+        file.seek(self.offset)
+        chunk = file.read(size - self.offset)
+        end = chunk.rfind(b"\n") + 1
+        return _last_url(chunk, end), self.offset + end
+
+    def poll(self) -> str:
+        try:
+            stat = os.stat(self.logfile)
+        except OSError:
+            return ""
+        inode = (stat.st_dev, stat.st_ino)
+        if inode != self.inode or stat.st_size < self.offset:
+            if self.inode is not None:
+                log.info("{path} rotated, rescanning", path=self.logfile)
+            self.inode = inode
+            self.offset = 0
+        if stat.st_size == self.offset:
+            return ""
+
+        with open(self.logfile, "rb") as file:
+            url, self.offset = self._read(file, stat.st_size)
+        if url:
+            log.debug("Tailer found url: {}", url)
+            for callback in self._callbacks:
+                callback(url)
+        return url
 
 
 class PoolNode:
@@ -74,135 +482,655 @@ class PoolNode:
         return "yellow" if self.qualityLevel == 5 else "purple"
 
 
+class RecordBuilder:
+    """Records of one response as typed arrays, newest first like the API.
+
+    Filled one decoded record at a time, with the strings interned, so a
+    large response is never held as a list of dicts.
+    """
+
+    def __init__(self):
+        self.quality = array("B")
+        self.pooltype = array("B")
+        self.time = array("I")
+        self.name = array("H")
+        self.resourcetype = array("B")
+        self.names: list[str] = []
+        self.resourcetypes: list[str] = []
+        self.pooltypes: list[int] = []
+        # a 10-pull shares one time, each distinct one is parsed once
+        self.times: list[str] = []
+        self.timestamps: list[int] = []
+        self._name_ids: dict[str, int] = {}
+        self._resourcetype_ids: dict[str, int] = {}
+        self._pooltype_ids: dict[int, int] = {}
+        self._time_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.quality)
+
+    def add(self, item: dict) -> None:
+        # called per record, the lookups that hit are kept inline
+        if (time := self._time_ids.get(value := item["time"])) is None:
+            time = PoolColumns._intern(self.times, self._time_ids, value)
+            self.timestamps.append(parse_time(value))
+        if (name := self._name_ids.get(value := item["name"])) is None:
+            name = PoolColumns._intern(self.names, self._name_ids, value)
+        if (
+            resourcetype := self._resourcetype_ids.get(
+                value := item["resourceType"]
+            )
+        ) is None:
+            resourcetype = PoolColumns._intern(
+                self.resourcetypes, self._resourcetype_ids, value
+            )
+        if (
+            pooltype := self._pooltype_ids.get(value := item["cardPoolType"])
+        ) is None:
+            pooltype = PoolColumns._intern(
+                self.pooltypes, self._pooltype_ids, value
+            )
+        self.quality.append(item["qualityLevel"])
+        self.pooltype.append(pooltype)
+        self.time.append(time)
+        self.name.append(name)
+        self.resourcetype.append(resourcetype)
+
+    def record_keys(self) -> Iterator[tuple]:
+        # newest first, as the history store aligns and stores them
+        names, times = self.names, self.times
+        for i in range(len(self)):
+            yield (
+                names[self.name[i]],
+                self.resourcetypes[self.resourcetype[i]],
+                self.quality[i],
+                times[self.time[i]],
+            )
+
+    def rows(self) -> Iterator[tuple]:
+        # oldest first, the order PoolData ingests in
+        for i in range(len(self) - 1, -1, -1):
+            yield (
+                self.names[self.name[i]],
+                self.resourcetypes[self.resourcetype[i]],
+                self.pooltypes[self.pooltype[i]],
+                self.quality[i],
+                self.timestamps[self.time[i]],
+            )
+
+    def __iter__(self) -> Iterator[dict]:
+        # records in the shape the API answers with
+        for i in range(len(self)):
+            yield {
+                "name": self.names[self.name[i]],
+                "resourceType": self.resourcetypes[self.resourcetype[i]],
+                "qualityLevel": self.quality[i],
+                "cardPoolType": self.pooltypes[self.pooltype[i]],
+                "time": self.times[self.time[i]],
+            }
+
+
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+
+
+class ResponseDecoder:
+    """Push parser for a record query response, fed body chunks as they
+    arrive, in any size.
+
+    Each record of the top-level "data" array is decoded on its own and
+    handed to a RecordBuilder. Other top-level values are small, they
+    are decoded whole.
+    """
+
+    _decoder = json.JSONDecoder()
+    _whitespace = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, keep: bool = False):
+        self.builder = RecordBuilder()
+        self.fields: dict = {}  # top-level values, data is the builder
+        # the raw chunks too, when the body is going to the cache
+        self.chunks: list[bytes] | None = [] if keep else None
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._state = "start"
+        self._key = ""
+        self._separated = True  # a value may follow without a comma
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self.chunks or [])
+
+    def feed(self, chunk: bytes) -> None:
+        if self.chunks is not None:
+            self.chunks.append(chunk)
+        self._text += self._utf8.decode(chunk)
+        self._parse(final=False)
+
+    def close(self) -> "RecordBuilder | None":
+        self._text += self._utf8.decode(b"", final=True)
+        self._parse(final=True)
+        if self._state != "end":
+            raise ValueError("Truncated or malformed response.")
+        # the builder, or whatever else data held, null without history
+        return self.fields["data"]
+
+    def _value(self, text: str, pos: int, final: bool) -> tuple | None:
+        # None until the value is complete, like 1.5 that may be 1.5e3
+        try:
+            value, end = self._decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if not final and (end == len(text) or text[end] not in _DELIMITERS):
+            return None
+        return value, end
+
+    def _separator(self, char: str, close: str) -> bool:
+        if self._separated:
+            if char == ",":
+                raise ValueError("Unexpected comma in response.")
+            return False
+        if char not in (",", close):
+            raise ValueError(f"Expected ',' or {close!r} in response.")
+        return char == ","
+
+    def _items(self, text: str, pos: int, final: bool) -> tuple[int, bool]:
+        # the hot loop, records and the commas between them, anything
+        # else goes back to _parse. False when a record is incomplete
+        scan = self._decoder.scan_once
+        skip = self._whitespace.match
+        add = self.builder.add
+        length = len(text)
+        while True:
+            try:
+                item, end = scan(text, pos)
+            except (StopIteration, json.JSONDecodeError):
+                if final:
+                    raise ValueError("Malformed record in response.")
+                return pos, False
+            if not final and (end == length or text[end] not in _DELIMITERS):
+                return pos, False
+            add(item)
+            pos = skip(text, end).end()
+            if pos == length or text[pos] != ",":
+                self._separated = False
+                return pos, True
+            pos = skip(text, pos + 1).end()
+            self._separated = True
+            if pos == length or text[pos] == "]":
+                return pos, True
+
+    def _parse(self, final: bool) -> None:
+        text = self._text
+        pos = 0
+        while True:
+            pos = self._whitespace.match(text, pos).end()
+            if pos == len(text):
+                break
+            char = text[pos]
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("Response is not a JSON object.")
+                self._state = "key"
+                pos += 1
+            elif self._state in ("key", "items"):
+                close = "}" if self._state == "key" else "]"
+                if char == close:
+                    self._state = "end" if close == "}" else "key"
+                    self._separated = False
+                    pos += 1
+                elif self._separator(char, close):
+                    self._separated = True
+                    pos += 1
+                elif self._state == "items":
+                    pos, complete = self._items(text, pos, final)
+                    if not complete:
+                        break
+                else:
+                    if (found := self._value(text, pos, final)) is None:
+                        break
+                    key, end = found
+                    end = self._whitespace.match(text, end).end()
+                    if end == len(text):
+                        break
+                    if not isinstance(key, str) or text[end] != ":":
+                        raise ValueError("Malformed key in response.")
+                    self._key = key
+                    self._state = "value"
+                    pos = end + 1
+            elif self._state == "value":
+                if self._key == "data" and char == "[":
+                    self.fields["data"] = self.builder
+                    self._state = "items"
+                    self._separated = True
+                    pos += 1
+                    continue
+                if (found := self._value(text, pos, final)) is None:
+                    break
+                self.fields[self._key], pos = found
+                self._state = "key"
+                self._separated = False
+            else:
+                raise ValueError("Trailing data after response.")
+        self._text = text[pos:]
+
+
+def decode_records(body: bytes) -> "RecordBuilder | None":
+    # a whole body, e.g. from the cache, still decoded a chunk at a time
+    decoder = ResponseDecoder()
+    view = memoryview(body)
+    for start in range(0, len(view), CHUNK_SIZE):
+        decoder.feed(view[start : start + CHUNK_SIZE])
+    return decoder.close()
+
+
+class PoolColumns:
+    """Every pull of a pool as parallel typed arrays, oldest first.
+
+    Names, resource types and pool types are interned, each row stores
+    small integer ids into the matching lookup table instead.
+    """
+
+    def __init__(self):
+        self.attempt = array("I")
+        self.pity = array("H")
+        self.quality = array("B")
+        self.pooltype = array("B")
+        self.time = array("q")
+        self.name = array("H")
+        self.resourcetype = array("B")
+        self.names: list[str] = []
+        self.resourcetypes: list[str] = []
+        self.pooltypes: list[int] = []
+        self._name_ids: dict[str, int] = {}
+        self._resourcetype_ids: dict[str, int] = {}
+        self._pooltype_ids: dict[int, int] = {}
+        # rows of every 4★ and 5★ pull, in attempt order
+        self.index: dict[int, array] = {4: array("I"), 5: array("I")}
+
+    def __len__(self) -> int:
+        return len(self.attempt)
+
+    @staticmethod
+    def _intern(table: list, ids: dict, value) -> int:
+        if (key := ids.get(value)) is None:
+            key = ids[value] = len(table)
+            table.append(value)
+        return key
+
+    def append(
+        self,
+        name: str,
+        resourcetype: str,
+        pooltype: int,
+        qualityLevel: int,
+        time: int,
+        attempt: int,
+        pity: int,
+    ) -> int:
+        row = len(self.attempt)
+        self.attempt.append(attempt)
+        self.pity.append(pity)
+        self.quality.append(qualityLevel)
+        self.pooltype.append(
+            self._intern(self.pooltypes, self._pooltype_ids, pooltype)
+        )
+        self.time.append(time)
+        self.name.append(self._intern(self.names, self._name_ids, name))
+        self.resourcetype.append(
+            self._intern(
+                self.resourcetypes, self._resourcetype_ids, resourcetype
+            )
+        )
+        if qualityLevel in self.index:
+            self.index[qualityLevel].append(row)
+        return row
+
+    def rows(self, quality: int) -> array:
+        if quality in self.index:
+            return self.index[quality]
+        return array(
+            "I", (i for i, q in enumerate(self.quality) if q == quality)
+        )
+
+    def node(self, row: int) -> PoolNode:
+        return PoolNode(
+            name=self.names[self.name[row]],
+            resourcetype=self.resourcetypes[self.resourcetype[row]],
+            pooltype=self.pooltypes[self.pooltype[row]],
+            qualityLevel=self.quality[row],
+            time=self.time[row],
+            attempt=self.attempt[row],
+            pity=self.pity[row],
+        )
+
+
 class PoolData:
     def __init__(self):
-        self.entry: dict[int, list[PoolNode]] = {}
+        self.columns = PoolColumns()
         self.attempt = 0
+        # attempt of the latest 4★-or-better / 5★ pull, pity counts from here
+        self._last_four = 0
+        self._last_five = 0
+        self._entry: dict[int, list[PoolNode]] | None = None
+        self.revision = 0  # bumped whenever the pulls change
 
-    def load(self, data: list) -> None:
-        log.info("Loading PoolData...")
-        self.attempt = 0
-        self.entry[4] = []
-        self.entry[5] = []
+    @property
+    def entry(self) -> dict[int, list[PoolNode]]:
+        # PoolNode view of the 4★ and 5★ pulls, built on first access
+        if self._entry is None:
+            self._entry = {
+                quality: [self.columns.node(row) for row in rows]
+                for quality, rows in self.columns.index.items()
+            }
+        return self._entry
 
-        for item in data[::-1]:
-            self.attempt += 1
-            log.debug(
-                "{attempt} Item: {item}, Quality: {qualityLevel}",
-                attempt=self.attempt,
-                item=item["name"],
-                qualityLevel=item["qualityLevel"],
+    @staticmethod
+    def _rows(data: "list | RecordBuilder") -> Iterator[tuple]:
+        # oldest first as name, resource type, pool type, quality, time
+        if isinstance(data, RecordBuilder):
+            return data.rows()
+        times = parse_times(item["time"] for item in data)
+        return (
+            (
+                item["name"],
+                item["resourceType"],
+                item["cardPoolType"],
+                item["qualityLevel"],
+                time,
             )
-            if item["qualityLevel"] < 4:
-                continue
-            _entry = self.entry.get(item["qualityLevel"], []).copy()
-            if item["qualityLevel"] == 4:
-                _entry.extend(self.entry.get(5, []))
-                _entry = sorted(_entry, key=lambda x: x.attempt)
-
-            node = PoolNode(
-                name=item["name"],
-                resourcetype=item["resourceType"],
-                pooltype=item["cardPoolType"],
-                qualityLevel=item["qualityLevel"],
-                time=int(
-                    datetime.strptime(
-                        item["time"], "%Y-%m-%d %H:%M:%S"
-                    ).timestamp()
-                ),
+            for item, time in zip(reversed(data), reversed(times))
+        )
+
+    def _ingest(self, data: "list | RecordBuilder") -> range:
+        columns = self.columns
+        first = len(columns)
+        for name, resourcetype, pooltype, quality, time in self._rows(data):
+            self.attempt += 1
+            columns.append(
+                name=name,
+                resourcetype=resourcetype,
+                pooltype=pooltype,
+                qualityLevel=quality,
+                time=time,
                 attempt=self.attempt,
                 pity=self.attempt
-                - (0 if not _entry else _entry[-1].attempt),
-            )
-            log.debug(
-                "Found {name} {qualityLevel} {resourceType}", **item
+                - (self._last_five if quality == 5 else self._last_four),
             )
-            log.debug("Node: {node}", node=node)
-            self.entry[item["qualityLevel"]].append(node)
+            if quality < 4:
+                continue
+            self._last_four = self.attempt
+            if quality == 5:
+                self._last_five = self.attempt
+        return range(first, len(columns))
+
+    def load(self, data: "list | RecordBuilder") -> None:
+        log.info("Loading PoolData...")
+        self.columns = PoolColumns()
+        self.attempt = self._last_four = self._last_five = 0
+        self._entry = None
+        self.revision += 1
+
+        self._ingest(data)
         log.info("Loaded {attempt} entries", attempt=self.attempt)
-        log.info("4 Star: {count}", count=len(self.entry.get(4, [])))
-        log.info("5 Star: {count}", count=len(self.entry.get(5, [])))
-        log.debug("Entry: {entry}", entry=self.entry)
+        log.info("4 Star: {count}", count=len(self.columns.index[4]))
+        log.info("5 Star: {count}", count=len(self.columns.index[5]))
 
         return self  # for chaining
 
+    def append(self, data: "list | RecordBuilder") -> list[PoolNode]:
+        # data holds only the pulls newer than what is loaded, newest first
+        log.info("Appending {count} entries to PoolData", count=len(data))
+        added = [self.columns.node(row) for row in self._ingest(data)]
+        if added:
+            self.revision += 1
+        if self._entry is not None:
+            for node in added:
+                if node.qualityLevel in self._entry:
+                    self._entry[node.qualityLevel].append(node)
+        log.debug("Added: {added}", added=added)
+        return added
+
     def get_ratio(self, quality: int) -> float:
-        if not self.entry.get(quality):
+        if not (rows := self.columns.rows(quality)):
             return 0.0
-        return round(len(self.entry[quality]) / self.attempt, 6)
+        return round(len(rows) / self.attempt, 6)
 
     def get_average(self, quality: int) -> float:
-        if not self.entry.get(quality):
+        if not (rows := self.columns.rows(quality)):
             return 0.0
-        return round(
-            sum([_.pity for _ in self.entry[quality]])
-            / len(self.entry[quality]),
-            2,
-        )
+        pity = self.columns.pity
+        return round(sum([pity[_] for _ in rows]) / len(rows), 2)
 
-    def get_history(self, quality: int) -> list[PoolNode]:
-        if not self.entry.get(quality, False):
-            return []
-        return [
-            _
-            for _ in self.entry[quality][
-                : min(20, len(self.entry[quality]))
-            ][::-1]
-        ]
+    def get_history(
+        self, quality: int, limit: int | None = 20
+    ) -> list[PoolNode]:
+        # the most recent pulls of quality, newest first
+        rows = self.columns.rows(quality)
+        if limit is not None:
+            rows = rows[-limit:] if limit else rows[:0]
+        return [self.columns.node(_) for _ in reversed(rows)]
 
     @property
     def get_pity(self) -> int:
         return (
-            self.attempt - _[-1].attempt
-            if (_ := self.entry.get(5, None))
+            self.attempt - self.columns.attempt[_[-1]]
+            if (_ := self.columns.index[5])
             else 0
         )
 
 
-class WutheringData:
+def backoff(attempt: int) -> float:
+    # full jitter, the ceiling doubles with every failed attempt
+    return random.uniform(
+        0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt)
+    )
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = monotonic()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        # takes a token now, returns how long to wait before using it
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        if wait := self.reserve():
+            log.debug("Rate limited for {wait:.2f}s", wait=wait)
+            sleep(wait)
+
+
+RATE_LIMITER = TokenBucket(RATE_LIMIT, RATE_BURST)
+
+
+class FetchStats:
     def __init__(self):
+        self.requests = 0
+        self.latency: dict[int, float] = {}  # seconds of the last request
+        self._lock = Lock()
+
+    def record(self, pool: int, elapsed: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.latency[pool] = elapsed
+
+    def __repr__(self) -> str:
+        return f"{self.requests} requests, latency {self.latency}"
+
+
+class WutheringData:
+    limiter = RATE_LIMITER
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        retries: int = RETRY_ATTEMPTS,
+        store: "HistoryStore | None" = None,
+        cache: "ResponseCache | None" = None,
+    ):
         log.info("Initialize WutheringData...")
         self.payload: dict[str, str] = {}
         self.data: dict[str, PoolData | None] = {}
         self._logfile = ""
+        self._tailer: LogTailer | None = None
+        self._process: "Process | None" = None
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.stats = FetchStats()
+        self.store = store
+        self.cache = cache
+        self._session: "requests.Session | None" = None
+        self._session_lock = Lock()
+
+    @property
+    def logfile(self) -> str:
+        return self._logfile
+
+    @logfile.setter
+    def logfile(self, path: str) -> None:
+        self._logfile = path
+
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is not None:
+            return self._session
+        # the concurrent fetches all ask at once, only one may create it
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                # one keep-alive connection per concurrently fetched pool
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=len(POOLTYPE)
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+        return self._session
+
+    @property
+    def connections_reused(self) -> int:
+        if self._session is None:
+            return 0
+        reused = 0
+        for adapter in set(self._session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                if (pool := pools.get(key)) is not None:
+                    reused += pool.num_requests - pool.num_connections
+        return reused
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    def _find_process(self) -> "Process | None":
+        from psutil import AccessDenied, NoSuchProcess, process_iter
+
+        # revalidating the cached process is far cheaper than a rescan
+        if self._process is not None:
+            if self._process.is_running():
+                return self._process
+            log.debug("Cached pid {pid} is gone", pid=self._process.pid)
+            self._process = None
+        for process in process_iter(["name"]):
+            if not _is_client(process.info["name"] or ""):
+                continue
+            try:
+                if process.info["name"] != EXE_NAME and (
+                    ntpath.basename(process.cmdline()[0]) != EXE_NAME
+                ):
+                    continue
+            except (NoSuchProcess, AccessDenied, IndexError):
+                continue
+            log.debug("pid found: {}", process.pid)
+            self._process = process
+            return process
+        return None
+
+    def _executable(self, process: "Process") -> str:
+        executable = process.exe()
+        if os.path.basename(executable) == EXE_NAME:
+            return executable
+        # under Wine exe() is the loader, the client path is in argv
+        executable = process.cmdline()[0]
+        if os.name != "nt" and ntpath.splitdrive(executable)[0]:
+            return _wine_path(executable, process.environ())
+        return executable
 
     def locate_executable(self) -> bool:
+        from psutil import AccessDenied, NoSuchProcess
+
         try:
-            id = check_output(f'tasklist | find "{EXE_NAME}"', shell=True)
-            log.debug("id found: {}", id)
-            if not id:
+            if (process := self._find_process()) is None:
                 return False
-            id = int(id.split()[1])
-            log.debug("id found: {}", id)
-            if Process(id).name() == EXE_NAME:
-                executable = Process(id).exe()
-                log.debug("Caught executable {exe}", exe=executable)
-                paths = os.path.normpath(executable).split(os.path.sep)
-                paths.insert(1, os.path.sep)
-                log.debug("Executable path: {path}", path=paths)
-                self._logfile = os.path.join(
-                    *paths[: paths.index("Client") + 1], *LOG_PATH_EXTEND
-                )
-                log.debug("Log file path: {path}", path=self._logfile)
-                return True
-        except NoSuchProcess:
-            pass
-        except CalledProcessError as e:
-            pass
+            executable = self._executable(process)
+            log.debug("Caught executable {exe}", exe=executable)
+            paths = os.path.normpath(executable).split(os.path.sep)
+            paths.insert(1, os.path.sep)
+            log.debug("Executable path: {path}", path=paths)
+            self._logfile = os.path.join(
+                *paths[: paths.index("Client") + 1], *LOG_PATH_EXTEND
+            )
+            log.debug("Log file path: {path}", path=self._logfile)
+            if load_config().get("logfile") != self._logfile:
+                save_config(logfile=self._logfile)
+            return True
+        except (NoSuchProcess, AccessDenied):
+            self._process = None
         return False
 
-    def fetch_payload(self) -> bool:
-        url = ""
-        with open(self._logfile, "r", encoding="utf-8") as file:
-            for line in file:
-                if FETCH_URL in line:
-                    url = line
-                    break
+    def discover_logfile(self) -> bool:
+        # offline search of the disks, the game does not need to run
+        if not (logs := discover_logs()):
+            return False
+        self._logfile = logs[0]
+        save_config(logfile=self._logfile)
+        return True
+
+    def restore_logfile(self) -> bool:
+        # the log path saved by an earlier run, if the file is still there
+        if not (logfile := load_config().get("logfile")):
+            return False
+        if not os.path.isfile(logfile):
+            log.info("Saved log path {path} is gone", path=logfile)
+            return False
+        log.debug("Restored log file path: {path}", path=logfile)
+        self._logfile = logfile
+        return True
 
+    def fetch_payload(self) -> bool:
+        url = find_fetch_url(self._logfile)
         if url == "":
             return False
         # url = TESTING_ONLY_URL
+        self._load_payload(url)
+        return True
+
+    def poll_payload(self) -> bool:
+        # like fetch_payload, but later calls only read appended log lines
+        if self._tailer is None or self._tailer.logfile != self._logfile:
+            self._tailer = LogTailer(self._logfile, self._load_payload)
+        self._tailer.poll()
+        return self.payload != {}
 
+    def _load_payload(self, url: str) -> None:
         log.debug("Found url: {}", url)
 
         regex = re.search(f'{FETCH_URL[-9:]}[^"]*', url)
@@ -217,25 +1145,253 @@ class WutheringData:
         for k, v in payload.items():
             payload[k] = partial.get(v, None)
         log.debug("^ {payload}", payload=payload)
+        if self.payload.get("playerId") not in (None, payload["playerId"]):
+            log.info("Player changed, dropping loaded PoolData")
+            self.data = {}
         self.payload = payload
-        return True
 
-    def fetch_data(self, pool: int = 1) -> PoolData | None:
+    def _pool_payload(self, pool: int) -> dict:
         if self.payload == {}:
             raise ValueError("Payload empty")
         payload = self.payload.copy()
         payload["cardPoolType"] = pool
-        resp = requests.post(API_URL, json=payload)
-        if resp.status_code != 200:
+        return payload
+
+    def _cached_body(self, pool: int, payload: dict) -> bytes | None:
+        if self.cache is None:
+            return None
+        if (body := self.cache.get(payload)) is None and self.cache.offline:
+            log.warning("No cached response for {pool}.", pool=POOLTYPE[pool])
+            raise KeyError("No cached response in offline mode.")
+        return body
+
+    def _retry_delay(self, pool: int, attempt: int, reason) -> float | None:
+        if attempt >= self.retries:
+            return None
+        delay = backoff(attempt)
+        log.warning(
+            "Retrying {pool} in {delay:.2f}s after {reason!r}",
+            pool=POOLTYPE[pool],
+            delay=delay,
+            reason=reason,
+        )
+        return delay
+
+    def _check_response(
+        self, pool: int, status: int, elapsed: float
+    ) -> None:
+        self.stats.record(pool, elapsed)
+        log.debug(
+            "{pool} answered {status} in {elapsed:.3f}s",
+            pool=POOLTYPE[pool],
+            status=status,
+            elapsed=elapsed,
+        )
+        if status != 200:
             log.warning("Request Failed, Please refresh game log.")
             raise KeyError("Server not responding to info.")
-        data = resp.json()["data"]
+
+    def _pool_data(
+        self, pool: int, data: "list | RecordBuilder | None"
+    ) -> PoolData | None:
+        if self.store is not None:
+            return self._stored_pool_data(pool, data)
         if not data:
             log.warning("No data found for {pool}.", pool=POOLTYPE[pool])
             return None
         return PoolData().load(data)
 
-    def populate_data(self) -> None:
-        for key, name in POOLTYPE.items():
-            log.info("Fetching {name} PoolData", name=name)
-            self.data[name] = self.fetch_data(key)
+    def _stored_pool_data(
+        self, pool: int, data: "list | RecordBuilder | None"
+    ) -> PoolData | None:
+        # merge the response into the store, then extend what is loaded
+        player = self.payload["playerId"]
+        added = self.store.merge(player, pool, data)
+        if (current := self.data.get(POOLTYPE[pool])) is not None:
+            if added:
+                current.append(added)
+            return current
+        if not (history := self.store.records(player, pool)):
+            log.warning("No data found for {pool}.", pool=POOLTYPE[pool])
+            return None
+        return PoolData().load(history)
+
+    def fetch_data(self, pool: int = 1) -> PoolData | None:
+        import requests
+
+        payload = self._pool_payload(pool)
+        if (body := self._cached_body(pool, payload)) is not None:
+            return self._pool_data(pool, decode_records(body))
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            start = perf_counter()
+            decoder = ResponseDecoder(keep=self.cache is not None)
+            try:
+                # streamed, records are decoded as the body arrives
+                with self.session.post(
+                    API_URL, json=payload, timeout=self.timeout, stream=True
+                ) as resp:
+                    elapsed = perf_counter() - start
+                    status = resp.status_code
+                    if status < 500 or (
+                        delay := self._retry_delay(pool, attempt, status)
+                    ) is None:
+                        self._check_response(pool, status, elapsed)
+                        for chunk in resp.iter_content(CHUNK_SIZE):
+                            decoder.feed(chunk)
+                        break
+                    self.stats.record(pool, elapsed)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                if (delay := self._retry_delay(pool, attempt, e)) is None:
+                    raise
+            sleep(delay)
+            attempt += 1
+        return self._decoded(pool, payload, decoder)
+
+    def _decoded(
+        self, pool: int, payload: dict, decoder: ResponseDecoder
+    ) -> PoolData | None:
+        data = decoder.close()
+        if self.cache is not None:
+            self.cache.put(payload, decoder.body)
+        return self._pool_data(pool, data)
+
+    def populate_data(
+        self, concurrent: bool = False, workers: int = 4
+    ) -> None:
+        if not concurrent:
+            for key, name in POOLTYPE.items():
+                log.info("Fetching {name} PoolData", name=name)
+                self.data[name] = self.fetch_data(key)
+            return
+
+        if self.payload == {}:
+            raise ValueError("Payload empty")
+        for name in POOLTYPE.values():
+            self.data.setdefault(name, None)  # keep pool order for the UI
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(POOLTYPE)))
+        ) as executor:
+            futures = {
+                executor.submit(self.fetch_data, key): name
+                for key, name in POOLTYPE.items()
+            }
+            log.info("Fetching {count} pools concurrently", count=len(futures))
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    self.data[name] = future.result()
+                except Exception as e:
+                    # one failing pool keeps its previous data
+                    log.warning(
+                        "Failed fetching {name} PoolData: {error!r}",
+                        name=name,
+                        error=e,
+                    )
+
+
+class AsyncWutheringData(WutheringData):
+    """asyncio counterpart of WutheringData, requires the `async` extra."""
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        retries: int = RETRY_ATTEMPTS,
+        store: "HistoryStore | None" = None,
+        cache: "ResponseCache | None" = None,
+    ):
+        super().__init__(connect_timeout, read_timeout, retries, store, cache)
+        self._client = None
+
+    async def __aenter__(self) -> "AsyncWutheringData":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    def _get_client(self):
+        import aiohttp
+
+        if self._client is None or self._client.closed:
+            self._client = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.timeout[0], sock_read=self.timeout[1]
+                ),
+                connector=aiohttp.TCPConnector(limit_per_host=len(POOLTYPE)),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        self.close()
+
+    async def fetch_payload(self) -> bool:
+        import asyncio
+
+        return await asyncio.to_thread(super().fetch_payload)
+
+    async def fetch_data(self, pool: int = 1) -> PoolData | None:
+        import asyncio
+
+        import aiohttp
+
+        payload = self._pool_payload(pool)
+        # the cache, whole-body decoding and the store block, they run in
+        # threads so that one pool never stalls the others on the loop
+        body = await asyncio.to_thread(self._cached_body, pool, payload)
+        if body is not None:
+            data = await asyncio.to_thread(decode_records, body)
+            return await asyncio.to_thread(self._pool_data, pool, data)
+        client = self._get_client()
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.limiter.reserve())
+            start = perf_counter()
+            decoder = ResponseDecoder(keep=self.cache is not None)
+            try:
+                async with client.post(API_URL, json=payload) as resp:
+                    elapsed = perf_counter() - start
+                    if resp.status < 500 or (
+                        delay := self._retry_delay(pool, attempt, resp.status)
+                    ) is None:
+                        self._check_response(pool, resp.status, elapsed)
+                        async for chunk in resp.content.iter_chunked(
+                            CHUNK_SIZE
+                        ):
+                            decoder.feed(chunk)
+                        break
+                    self.stats.record(pool, elapsed)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if (delay := self._retry_delay(pool, attempt, e)) is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+        return await asyncio.to_thread(self._decoded, pool, payload, decoder)
+
+    async def populate_data(self, workers: int = 4) -> None:
+        import asyncio
+
+        self._pool_payload(1)  # fail early on a missing payload
+        for name in POOLTYPE.values():
+            self.data.setdefault(name, None)  # keep pool order for the UI
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def fetch(key: int, name: str) -> None:
+            async with semaphore:
+                log.info("Fetching {name} PoolData", name=name)
+                try:
+                    self.data[name] = await self.fetch_data(key)
+                except Exception as e:
+                    # one failing pool keeps its previous data
+                    log.warning(
+                        "Failed fetching {name} PoolData: {error!r}",
+                        name=name,
+                        error=e,
+                    )
+
+        await asyncio.gather(
+            *(fetch(key, name) for key, name in POOLTYPE.items())
+        )